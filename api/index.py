@@ -9,7 +9,7 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel, validator
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta
 import sys
 import os
 import re
@@ -162,7 +162,6 @@ async def login(credentials: LoginRequest, _=Depends(rate_limit)):
     )
 
     if username_match and password_match:
-        from datetime import timedelta
         expires = timedelta(days=30) if credentials.remember_me else timedelta(hours=24)
         token = create_access_token(data={"sub": credentials.username}, expires_delta=expires)
         return {"access_token": token, "token_type": "bearer"}
@@ -0,0 +1,40 @@
+"""
+Gera core/_logo_const.py com a logo pré-codificada em base64
+
+Rodar este script sempre que assets/extracted_images/image1.png mudar.
+Com o módulo gerado presente, get_logo_base64 não faz I/O nem encode em
+tempo de execução — a data URI vira uma constante carregada com o módulo.
+"""
+
+from pathlib import Path
+
+from core.html_generator import _encode_file_b64
+
+LOGO_PATH = Path(__file__).parent / 'assets' / 'extracted_images' / 'image1.png'
+OUTPUT_PATH = Path(__file__).parent / 'core' / '_logo_const.py'
+
+HEADER = '''"""
+Logo pré-codificada em base64 (gerado por build_logo_constant.py - não editar)
+"""
+
+LOGO_DATA_URI = (
+'''
+
+
+def build() -> None:
+    """Codifica a logo e grava o módulo de constante"""
+    if not LOGO_PATH.exists():
+        raise FileNotFoundError(f"Logo não encontrada: {LOGO_PATH}")
+
+    data_uri = f'data:image/png;base64,{_encode_file_b64(LOGO_PATH)}'
+
+    # Quebrar a string em linhas de 76 colunas para manter o arquivo legível
+    parts = [data_uri[i:i + 76] for i in range(0, len(data_uri), 76)]
+    body = ''.join(f'    "{part}"\n' for part in parts)
+
+    OUTPUT_PATH.write_text(HEADER + body + ')\n', encoding='utf-8')
+    print(f"✅ Constante gerada em: {OUTPUT_PATH} ({len(data_uri):,} caracteres)")
+
+
+if __name__ == "__main__":
+    build()
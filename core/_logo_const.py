@@ -0,0 +1,10547 @@
+"""
+Logo pré-codificada em base64 (gerado por build_logo_constant.py - não editar)
+"""
+
+LOGO_DATA_URI = (
+    "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAA3QAAANICAYAAACPKK1tAAAgAElEQV"
+    "R4Aey96ZNm13HeWe9WVV29NxqNfWksxA6BICiBC0jRNClZDttSODwezRLhiJkvMzF/03yZ8YTH8o"
+    "RmbMmiJBIUKVKEKIAAsRAEiIUAsTbQ3ei9a3mr5vk9mXnvrQYUIkWRAljnVL33npPLk3ny3urOfM"
+    "9dRltbGwsLC6OFrYXxgjZuo1Hs27ZFoEWgRaBFoEWgRaBFoEWgRaBFoEWgReDDG4HR1tbWAp9Rq+"
+    "I+vEepedYi0CLQItAi0CLQItAi0CLQItAi0CLwARHQspxaW5H7gNA0UotAi0CLQItAi0CLQItAi0"
+    "CLQItAi8CHOwIu6EatovtwH6XmXYtAi0CLQItAi0CLQItAi0CLQItAi8AHRCBW6D6A0UgtAi0CLQ"
+    "ItAi0CLQItAi0CLQItAi0CLQIf7ghMP9zuNe9aBFoEWgRaBHZyBHhWV90VkP3JIB7FMimf61XP99"
+    "pGK52hgvpbw3HJaD+nD96m7jGnh1xdzdLuOVcwWmsRaBFoEWgR+NBEoBV0H5pD0RxpEWgRaBH4FY"
+    "mAaiDXQaqC/LwtD6JA4iFcY4jbH8Q1lsp0fWM+Fnuysbk1WduYT9fW16Zbm1uir09XV9c03piurq"
+    "/uvbi2OllbW5/MN+aT+XwuuNFoc2tztLm5qQd9LWg/52FftkJEx2PVgFG5bU3Gk7m6rtXG4/GWPn"
+    "PxN6fj8ebibDafTMbzpcXF88vLS+uL09n64uJsYzabbYg2n07GG9PJZFP6MuqiT4+JBkotd+7ihO"
+    "cXRm17wE9frNY2LQItAi0CLQItAj9vBFpB9/NGsOm3CLQItAi0CHQRUC2TT07OFa3NrYX5+saCiq"
+    "zxxbWNlQtra4vnL64unzl7Zvc7x0/uv3Dx4n6tgu0/f2HtsosXLxxY31jbd+Hi2l4VcbtXV9eX55"
+    "vzZRVdixvzOZ89Ktpmqgj1Mx6riFIBuDlSX+XTaCTT1Ha1kIYj9gWfosBy2bUlacorVudU9Y02oz"
+    "/aFOSmBC9MRqM1FXirs+l4VQXequTPL82Wzi8tLZ2ZTaenD+zbe2plZdcJFX0nV3btOr04nZzZvb"
+    "Jyfvfy4vnF2eLa4mx6cTKZrY8mvBKI1T1Vf3Mv+gleBeYo73ZgkDVfF8DWaRFoEWgRaBFoEfgZI+"
+    "DXFvyMOk28RaBFoEWgRaBFwBHYUp2ytr65oGJr78bGxvK58xd3q0jbferM+d2nzp3Ze+r0hf2nzp"
+    "09fPbc+cNrq+ePbGysHVpdv3BgbT7fvzHf3Dvf2FyZTCa7J+PxXhV2qqVGExVgrNhR9YxU0IlE7e"
+    "ZijVIuIp91G5UZVVFXtFEkva9FWWWyBLO401DaAWCaNbdUe26prtucu+BTrbiwpSoyK8P5fFNXYW"
+    "6ur0nqlDgXR5PJuenC5Ox0Nj21d8++44uLS8emC7NjB/bve+uKwweP7d+757g+p3fvWjy/smtpdd"
+    "fy4oZkzy1MXTy+z1P780FTeL9ko7QItAi0CLQItAg4Aq2gaydCi0CLQItAi8BPEwHKjNG586vjU+"
+    "fOTc+dXbvs3XdPHH7r2DvXvXf21I1aebv53LnzN19YvXjVxY2N/Rtbmyu6AHJJq1uz8cJ0v1bSVB"
+    "hRWKlY0uKal9EoyqjEVDrBoSqj2HJN5gU4qri4XLL4xpEnoU811j/bC1wVX8bC2VgbA76vkNBHl8"
+    "IQf8yhYLQfYZ8VNC7bxB9XlRkdcCgux1ptq3vr7Da20EcYl+abF2XnLCt7k/HolFb63lleXHlrZX"
+    "n5DRV3b+xdWXlzZWn5rf379r575PLDpw4c2Ht69+6V87OZVgu5DNSWmQZgxKD334S2aRFoEWgRaB"
+    "FoERhEoBV0g2C0botAi0CLQIuAI8CDR2br6/PFCxcurpx4773dr7557PCPf/zykWPvHL/i9Plz12"
+    "yOR9dpqeomFVFX66rHAwvjiQq4hb26ntA1DSWXlrlck2zprjVKODd2UacgKhmVLyqsNrX0pXrMzX"
+    "UMV0JKrgq64ECizlGhNUlEikGNXQhS0FE41tgmtcmCMcyGLHiWq+JOTMZYcMHnPrPIYlN7Vu60cy"
+    "HoyyaNz5IeV20yFeZCwYjf2pqvgZyS1+dFXNuazy+KfHY2Hr2ne/KOKQZv6l6913av7Dp22Z797x"
+    "4+fNnxI0eOvHvZ4UPv7tuz5/yelaVV4awJJYzYrwQufDFbaxFoEWgRaBHYuRFoBd3OPfZt5i0CLQ"
+    "ItAo6AaoTxxvr6rnNnLi6fPH1m/6tvvXnNq6+9cfTY8WPXv3f6vWvXNjavVnVytSquwyqX9i5MJ0"
+    "vT6WxR1ybOKIImqjhcCqmI4RJFFS6ijPXUEF2fON9amFG0VfHRFUpcRklxJklWw6Tnh5fII+FGcU"
+    "Rxph8XVTgJjtqG5KcTbgFXMUWRJR72vbKmvk15VQsqI+z0LoR/IqNlOfquK71yR1EGL27Kw2bg4x"
+    "cFo/WZZliKgk5jpOy7TYa/vkRUZlg5RM9lKM7gZ8RqrhheWNdTX7Y25+dk7dR0PHp11/LST7SC9+"
+    "pl+w+/cvDAvleuuOyyt2+4/ur39uzZe0EPaVkdTRfW08xwCkyjtRaBFoEWgRaBHRaBVtDtsAPept"
+    "si0CKwsyNALXH+wuri2uraii6dXDn27snDr7/19rWvvXH8lhNn3j16cfX8jePZ+CrdQXbd5ny+Mp"
+    "5MllTHUD1NVTmohqE4o/jSnrpEjCpSJKdGWRNFFetSExVeujFO9YuZLmTQB4qVrbEuqaSuobEzPY"
+    "smg5vDRqgYkBBQ3b10wemk0MGW4AGzbDHTTA1BdFHmyy+lg4cUhbXKhyA6XGppmsfiV8EnOnZi3u"
+    "xjdY4xMjOvGAoXbE3S9lTAUii6jzKNvWjzwp1vrm9ubqxvzTdXxT2pqvjYdDp+e2XXnp8sTldeuv"
+    "zggZduOnrty7fccOO7+/ftOr931/Kp8dIU91trEWgRaBFoEdiBEWgF3Q486G3KLQItAjsrAnpgiY"
+    "q4tfGbbx478IPnf3jwjXffufbE6fO3nj579q61jfU79HjH6/WgjitUaeyP6mJhpIeUUK44UKyc+e"
+    "EgKkxiBUrFXBZ0sWpGhaIVKV4PoKLGBYz2IExVsA0rDRD1oBNtoxiqPba4Ly1rG9uF5sJHo8BgK9"
+    "umpqeMREYvhEKHAeth8ti94ntO1E8UjZJALsq6GFJQUoyVbfc1V4pP17PwMehf/EkECt0YGpGnWu"
+    "o/WBW0mr8qOOOlScSII/KKswvBzQ29akHucNkmT4TBnl+/gI4MzlXN8lIGzeed+drqcS2RvrR7Zf"
+    "mpleWVp4/s3//cLddfc+zmG687deTKq84sLy9Libm11iLQItAi0CKwEyLQCrqdcJTbHFsEWgR2Ug"
+    "S4/228urYxu3j+wv4nnn3m6h889+JNq6sXbj956tTtq/PNmxem0yvno/E+FRD79Wh9PeNDrxbY2F"
+    "RxMXKBQcER1QklkdbfVBt4FS7qH1dPXRlE0aIfCj4XQ9K0mFerrKgKLhDNEcn1EEWOiiDeIMBll7"
+    "ZYRZaGo6SZk9WYCynwKapQMF17A4oSMB7CpqC0HPxsxhC9cF1EqbgyhKS7og0B+xOKzDfAciwF0z"
+    "QMtNiWJXh6OZ5X/FiSq9W3uKw0HK35YLvjuwhlSn6cpkKH3a0FPWRGdigM1Xrbuh9v6+zWfOPdpd"
+    "n0JyvLiz8+sLisFbzDL1177TWvXHvtdW8dOnTg3YN7967rEFEaUkmXiyC11iLQItAi0CLwKxCBVt"
+    "D9ChzENoUWgRaBHR0BHvM/W7u4uuv4iTN7X3ntzat+/MYbV75x7LUbT585ffuFi6t3jWez6/Q5oJ"
+    "W6XaoxlrhskksmteLjQkwXRXoViQIjSx0VGBREGktu4poiixOFmooAWQomBl0RlIcBDN/bpnFcwh"
+    "iFCHrI0qzPtZYUdHqaSl/c4BOrcGEnpKMfhUyPAc/FHQWOPlQ77NzwTzj4QnHV4cMUz34kePgbMs"
+    "bEL+FETRmA6AdGGQiZbj5SKF+sjGXFEGmKXT84BecoMr0XD0w7K7L68XqGwLG8eKxa8olVTRGIH0"
+    "4iL+W6RFR1OYrnR3royoUL50/rPXqvHdi35/n9u/e/cGDPnp8cve6q12+++ejrhy87fEIvS7+guv"
+    "F8+Z4utF2LQItAi0CLwEc0Aq2g+4geuOZ2i0CLwM6NgK7OW1hfWx+fu3hx79vvHL/s5Z/85OiPXn"
+    "z9ruOn3rlrdX31xtmu2dVa9TqiS/Z2K8vfpQpAeT9FUlzWSDHgSyhVHLgo0BMjo/SgXqBaoFjR6h"
+    "wFXcpQeZijsdSjQEESfn664kR0Xz6ZqOiFNhLIa6cu5Qw/oiRfuw9skpK8cbShTzNOUDUKYvF6Pr"
+    "1LdfoxPHCsjY3Ep9hyX2NiFOjoic5A9I5oEDbBj55H2sTs7Jd1wkhX1Amkj5ViLkEXktjkKk6tbv"
+    "JTBTJFX1yuGThly8dAtiiyde8jnw2913xNR+vixtrqe7PJ6NXdK7tf3L1r77M3XH3Vs3feeusPr7"
+    "7qipN7dy+fHy/NuFevtRaBFoEWgRaBj2gEWkH3ET1wze0WgRaBX+EIVMEwmCIFwekz5/e88eZblz"
+    "37wo+ufvv48dvefvfk3ecvrn5sfbR1nR5ecq3S/90q3KaqOpTLq4hTcs+HFvvRgt4g4FqExD9qEt"
+    "3nxgoSl/T5nW9UEghxuSVX6WkVCEnIPLQDJZrGxjROEL3iRMEjGv14cIoFg2b9XpaFMN+txuQ6YK"
+    "AZQyljQWMEx8UQfNl5X0v7YlqukwXLv6ETDz4Bw0BpiXhFsWqX0o+wETzwOrvq29PapzO2gH390C"
+    "+fTc+xMRQAZLBVe+z7JQcupnWdpO43dAFnRzkWzJ/761ACXz/g5GoguH5+qGJtX9O4dHgn+rpmd2"
+    "q8tfnOrqWlV644ePkz11555RPXXXXFD6+/5uo3Dxza9+50aZnLMltrEWgRaBFoEfgIRaAVdB+hg9"
+    "VcbRFoEdgZEeByO62wUZGMTp86s/jC669f8ZPXXj368suvPHDy9OkH1za3bl/avecqXUJ5aFOlG/"
+    "dfUQSQ7POQja5AULLPmFZPiKSqcTGnlR6ePqlqQDK6uUrpPkWF2GpRaHTPTUQMd2QDFfMpJhigQm"
+    "WmRgHRFVDisZrUtyhA8K2aVw1TJxAMV2zvbbdkwnjYyD56ZRc/+HEhM5RNxPAXh0NGgu6XwVQJMr"
+    "hmRMEFz9iiET9a2SVu8NxSjqFj7gAxyImnbUY8LIU9l01SOkfUweFY0OKJmqzg2VVRkPE2CV5pjb"
+    "pb9qzh8wDtOI9UxqlPEehmLM4XjTd15+R8/vryZPrqnt27n7jqskOP3HTjjT+49ZZb3jh46MCJxa"
+    "XFTb0rD0sq8T2xwGjbFoEWgRaBFoEPVQRaQfehOhzNmRaBFoEWgYXJubMXF197440j33386Rt++O"
+    "OX7t3Y3Lh/aXn5bqXh163P50fmm1vjyVQLcUqySeijwFDS76KOgoCnX0SJQdHkIkBpuQsaEnNpkq"
+    "Xrvitqg7iEUDRSfrjoUAxEwSccZPTTFWuSiaIoNKxDoSKyZaLmSL+sbN+CJ2biGRgt5GkAZT9Knb"
+    "CNrzSzNejEu8Iqi5UEsK/WKEkPxMVH0SADRrOINokVNGLVF6NRDIVCLxbOVlEHNr/d/X/4OfDVuN"
+    "qEFnZ1XxzGfQgidsiUOxaUMVbiHDd4Oibody3d7o872lFccqw5ht57RU8xkrLMGs84HuTq7ObmWV"
+    "2lycNVXtuzvOupyw/sf/Jjtxx9/vrrb3ztiiOXv7W4vHxhOh353Xed/dZpEWgRaBFoEfhQRKAVdB"
+    "+Kw9CcaBFoEdjJEVhbnY8uXFjbc+zUeweff/6FG55++YXb33n3vXtGk827RtPprUrFD6jI2qUkXO"
+    "+DU/JP4cayGkUHfbpKzp2kZ8WxqTUVLd45oXferkR/eJklRUKsWFHYRfQpBwJDsMLhaSvDwsbVQB"
+    "4odDsM9BjDk47pgRTgfsqluJKJVaPwhbELIWnio4bea5tjccu3jh88TFE8DW1CK7Op5ktJiYxCZG"
+    "Zvg6Gw9BM2MC6aPjUvx0ekKozU/cDmQksglk+HweBTzZi5gggNTBvj4DHGE8njN2q+jy778GFw3I"
+    "OfuNoxdpMSx5f33YGLhAv9fMLo5jiemjnaiNVAitREsV1scu+d57K5eXq+uaYXnE9eXVpcfHZlae"
+    "8z991z5zP33HXXC4f2rZzcvbx4brI41eWbNjVwwpS2aRFoEWgRaBH4JUegFXS/5IA3cy0CLQI7LA"
+    "KVNXeZdz//ixfXlo+feG/f9555+tann3vhN947e/a+jYWFW7am4xuktl+Z9tJ0rFdKq3iL+9EW9P"
+    "h6cfThhd3k7iTtlAS894zMmhU7Z9jaUeQh60KBgiPKAfP9kA3RWIXjp4qPKmIk5ELHY88BHKh985"
+    "SkXw1Z4yAInb380QuyNWQOwWfVKezE/oMKJuOAwW/atZ9ZhtSczPIcw4uywQger0XwBYPlW4jF1i"
+    "6ychWrnOE7xGBHWWQ2SDEf9crmtlgRdzG4PJLWxcIjNhRcUYDW5Y8xhyzoKPCEwXpq90TLwXExAv"
+    "OUmeqz9/2N6TDx2RQcIi7X5IrFcU2KvsxSsuy5ow5X7aekfNkuBGzoEwXnwlzxXJ1vrJ+bzaYvX7"
+    "b/4I+OHL78+zddd/VjN19z9QtHLt//1sqefWvEL7DwqLUWgRaBFoEWgV92BFpB98uOeLPXItAisK"
+    "MjoMR3eub82r5nn3/+6u8//f2733r32KdPnVv99fHSrqNK6Q+N9bx5JdOq00jAJaxnnNDXr5N0kZ"
+    "zEQ5uKpjfAxUKdknSxJM8Lx7JgcuFEuNGP1TFGXtlihUYKfvE1HT60vgIg9e/uyYuMPUS8RVyy5S"
+    "c09xOHPo0CZFtBJ5/46fjqs8ooAr9pRr5mFWcYP+kx8I1pfyUbtZBdtriEKXDjnW5gCVcy8S69KC"
+    "ZrnrhvLL1bgEIofJeOYxa+szWG9sTJRbAUi2YAbWIuzEpNNjU7+8SGXidvQImkRGoYpmQofOuJlg"
+    "FXnloMeMfJRTEkB0hIYtiWCzrFz1ZCN+YRfmirc0Z8ybv41EnHMYoCTlyN9RJzSXFY9CWB5CgwVd"
+    "QhOR/pgSpL09lr+3avPHW17rm7+cajj99y082vXXHF5Wd2LS6d563o9gSjrbUItAi0CLQI/FIi0A"
+    "q6X0qYm5EWgRaBHRwB59BrF9dnr73+zhXffvyJW15+48efvLB64SGttt2hLPmw0uY9s8VFZ9Y8xI"
+    "SCyw/KYNWGAiNXf5SHO9GmaCEBnyr5p5hwwp4BdoGWxV3l1JZJHcRqDBoFhFeMsm5wYWDFQI1iRZ"
+    "IUEtJ1EUKfQiJ+zUvz6gdQ2ejGYTgQ0lbpbNvbUD8nbNJq5aszhn01ihFe4O0HrJiCr2mg9qLjD9"
+    "RufhpEPyeBLjTLMlBjwE44XiHNvonBiC7YkgmXoo+ysRy1Tkxywal5pQlLuahKLDT62KcUPBec4R"
+    "My5oBJJaZWOjhTHgBO/JCZOGDgcAmmfNYPGDwUpxrnGzwKS/ylwFMtF2zp44POmgsycXxxOv3x/t"
+    "27/+bQnn3fveNjR5+942O3v3bo4IEzW9OF9dmYNxi21iLQItAi0CLwi45AK+h+0RFu+C0CLQI7NQ"
+    "KT9bWFlRMnT1/x8k9eufF7Tz9/11sn3rr/wvrF+0az6dVKkQ+oCJj2T5qckJVHhp4FXFw+qRUmkn"
+    "C1KgKiOKGAiEv0SNxRZUxBGMl73FOFXl+MRIKOkUr8o3RCitwbC+lDdgWZrTpdmVAM7fsCjMKGVn"
+    "qsJMU8St9sb0o2nC+Uns88KF6HbqVi+A9kumuMUk1TDqc2zDVFJS8FQ0bBU/P3rHC9BFMmICO+BV"
+    "+xqjkaUvL9paSC0bjmB58WMQcrCeFI+CS+6aEYxRY+uOAu+ZCxzwN8sAuTfR1b6NXwTVLmEVcp+I"
+    "h7I5vmew5asdT5FzbiiwNW6HhkDiUfL4FH13FyYccK6NYZXRf77uJs+vyuxd2PXnno8BOff/CB71"
+    "97zZVvrexeVuE38pXCFa/yqe1bBFoEWgRaBP5hItAKun+YODaUFoEWgR0agUrClea6bc63Vs6cO7"
+    "fvJ68fu+HRx576+GvvvH7/ybULd+kiylsksE+J8jIFFk+pJPH2aocS49E0VubUI+82fTalyFMarV"
+    "+S7EraKXLclxz319EHB1VW9mik6/EKAwqqvDYRuuQylUfIzXgaOImHkpNBNpL7IEIOFSGQ1Jdg6e"
+    "J6YoZkaSRgGRzogUzDNn55nwVDzbf4KVhOeDiE2iaf1UPRCjuUZA9+uherWzEo/4sfMan5hjaY5h"
+    "dAgpatcixdyFiV5cLAh562XZc4KpDmp5DH4WOF8VIdAKEVbB0KaKzIMeZcYCWweOGBCjefZFHAmS"
+    "ks/EOOAnDOZa9WAj/xbEty2mdBuKE7Ps9sbqy/evDAwcdvvPLqR26/+eYnbrz2qlcPHjxwcjobX+"
+    "RtHPYPrHI0nGjbFoEWgRaBFoG/ZwRaQff3DFxTaxFoEWgRqAh4RWy+sHTi5HuHHnni0buee/6lz5"
+    "86e/aT61sLd2xMxoc3RpuLfs+ACiReFUAB5VxWe69CacQqVhVjXpURbaIbw1idc+4rWQoPNLsiTo"
+    "n0VPd2OWF3ss0qEesoUSyQvFfSz77wlY4bR5DmV149zLGjYIFfs6wO0lXQFC9xAKSlKLsqFvELTD"
+    "7lE3MpX9jbWGFIt/hmaWP0AR8cZLqmrrExrL7nUL54Ihqg7z56yQTA9NAbkmHZDuK21evUPOC4wU"
+    "q7ETfNCh+FzThM97Er/c6lhKldxCRH5W7t7WQfy9IZ7gsfWte3LzGHOhaMdHOcXOd4IMxHRZ9kfW"
+    "7zZYEb5yQ8yWvVzvp83+BLMrl3UY/0EVNPy5yPJ6PV0ebmm7sWF1/Ys7T/8Zuuu+o79951+1NHr7"
+    "vmtV17Vta5P09o+sIgkNu2RaBFoEWgReDvH4FW0P39Y9c0WwRaBHZwBDJBH+mVAys/fOml677z6O"
+    "Mff+fdt750bnX1U/PJ6FpVXXu4zowSTPcZ+aEaJMI8vCOKEKfrzp3JaSl8nPGr7/vBlChDZ4XMek"
+    "7EKdai+KtihUJweDkdiTu+oTQs6CCiU0m8DZOcqxUthvghIjjs1NdzLroGdrgaxUQVChShdjQloz"
+    "joFS8dFyD6LvoQDQfKfOLZmfQxZMpm7SOe4Rf+AQDPNtnb4W1wHiAT4pJM22Kohc2eH9TisC87xS"
+    "n1mvHQt7JS97kZvhRrX4rDA2NeaJvMBkc74+G951rkxAtaeGVfBg6WP4iWnzwdsy675EsECvD4ai"
+    "CiUQ9qqct/sYxunGOs+OlHhd/cvhF7BPQRiOa9qs4re5ZXHjty6PDXb73h+sceuO/eV/YcWDkxnU"
+    "63fNkx8q21CLQItAi0CPy9ItAKur9X2JpSi0CLwE6NgBYjJhfXNmenz57d86OXX77jse8/89AbJ9"
+    "78zdXVtduX96xcw0u/XXb5MkeltfqNgk0rc7o8kiKDHxJmP3KeBJ0+75UTnU/UH0qKBTTxZZcZbd"
+    "gkybExjlVEI6EGN3gUW8LsLrWM4quKlpIjIfcKoRguetAWFnLsKeZYs0F+uMKGB7jAkyiN5SQePU"
+    "Zo2CHl8uKbBh6yahr78lC6FKPycyRDLlzhJ5a7ORZa2AGXPhg2oQ0+0reeHX4fhu1a09raoCfq0J"
+    "ZINHx3kaJjQnNxHcbMo+t7AlPeWNYDEr86RmfDNPEwSRzts6OBbMaLfdnEYYIvi2DS8CtiiDyEsF"
+    "OxQMItdz18+IQufpd74VOqSMe3xnGJbZBsyzKMWemVb0B3fHXcJ0w6dX3M1eXZKRR19pVT2jRW7a"
+    "S/tXlRHpzcXJ+/vG/Pyrfuu/Oeb3zs1hufve7KK94+sG/3RdnZbiTU27ZFoEWgRaBF4O+IQCvo/o"
+    "4ANXaLQIvADozAMHOt6etqyTOnL+x58dVXrnvk8cfufPWtd35tdT7/hPLZe3Sz2mEVAYsTCjYScP"
+    "SVPMeTF6PEYRVqrFcKOKN2ss4rByKB3qBK9OWRJOtKvK0eOC4epOvkWbiViDPGDI1LKZ1QJ8EuqF"
+    "+uWNa8vkAwngRcqAmjChf2VVikmy484ymICoIv8cQqxSCXUWLHGT3Ebv5bqrKqILAf1DHqhC/pXK"
+    "Cg5aIMfQBLz7Gyci9vvyXGdDxn7AvbhQr95GlnogsLMLDBTs2hcCdwrVOVjuj4GStSXAYbSuD0WI"
+    "D0PgHFuMPV0JjWheoRwBnbHKOmD82UoQ+ihL3gI0eRLo9M8DFK39gRWeS1i30CR8EXvnklNLQlk3"
+    "IYVvO9lR1eEF18BjuKNHkbK3LYYS46n3SeY7SKdCz5nYhckokzkuOHV0kYz3Y313RZ5qnJdPzc3j"
+    "17Hr/qskOP3nfbbd+7+2M3vr7nwMGTsdqbhtuuRaBFoEWgReDvjEAr6P7OEDWBFoEWgR0TAZJNTT"
+    "bz2pr2+MzZtf1P//DZGx9/6vEHX3/r2GcubC3cNVpcul4J9G5dMrZEdkwxF0kySXf8UIyRAHPfnJ"
+    "NtCTjBFnIUCrqLSHqV6JIcO4lH3zk1iXKs3jHEN8a+x061oaqOtKS+GvaHvuMF72oj2a7CJOT6sf"
+    "0S0YVcTEADpAKPvUsIAdu3NEDfK3Di13ylgXhsL3Gm/Ic/7Nu+ZCsuNi0blhHdfNsUNvDFUzcuCv"
+    "SdWMCGrHspeknf6gO5Kna27VOHYA7nW+Ruz/xoGQ/kaUmNEGoSrIB2K4gly+ToYyO1fKwY6Rd5Gt"
+    "wolkXg3IBZfDBoKRvd4NM3fBDVD10XXalX7iNSDSjORc5ZGr57XtKnD2/ElxY2U75zfiQoPupcc2"
+    "Nufo8dvCiQeTOCj6ec3tDTg+Z6uZ00Lgj49ZXlpaeuPXzwkbtvu/2b991z78sHDuw/WfP1lxqB2r"
+    "YtAi0CLQItAh8QgVbQfUBQGqlFoEWgRUCLIQtnT68feuzZJ2761ncf+9fjVQsAACAASURBVOKZc2"
+    "e+sDCd3r45Gl2hq8p0W5zeAK5Cjft/SJhpJLzxGgKlqUpoSUSdzrKCla1kScSr4KNvXa9+ybC0DE"
+    "niLBz6TpNzYwwTIVA0hr3tBUiPwWoTK4A0NCznEYl/+A6ND81+y2d8YlUo/Ak5CwilCg0XLCKGJp"
+    "IlEdiFaTvYSH4nl3bLD9jVL5+6sXixSiVtABLMq0QFDIDa0K4LkZpnKRE30bbxcv6dvRwHIn6BW6"
+    "PcF8ET8iZtIxjHBTz8sb6ocamtOhLxNYbmcXzqGAwmJ+q2FrDW7aOJpYHt6IZah02BxrGM1snbZs"
+    "wNlJKJ+IXfaAzMJgK+iq5NFYD0+TF2zq2KPb+s3HzP0nJR/Gn1bmOD5Tvdejp+e3lp/PyhPQf+4m"
+    "NHb/j6x+/7teevPHLkxHi6sFE4abztWgRaBFoEWgQGEWgF3SAYrdsi0CKw4yMwWl9fGJ87e+HgD1"
+    "947qZHn3zqs2+dOPGl9YWFT8wn48u9WpbFGa8dYJGsUm8KDYomX5IGVeNImqv4iaR5rKLN+bYS3r"
+    "pvzJfCKdl14p8rHF6tc58EGUPeWsZHSfLQnHgnVkpEspx4zrpTF1m6fTIvJHCypViqgE1BF6bZR+"
+    "G4PYlHwAiJU3Mqv4CG388hCoEYEyb55MK3Lx6sk3hdgQBRzTESYs0Bmj2wE4z6Zh9yGEVa2C6JKr"
+    "RqXPIhG/O8NCbIllzpRZAYaVb4LaVhoeiYa8NcHQv6koOe0wR1O5wDNLBV7KT3wmgSDxrbEozeUJ"
+    "yHnkSsh1Lq2y/8qaLSYN0GfHR9WTDWZGJbDLabNQ8vkGHP34QfuKKn61QRF/rhHcXe5nxDPP3NSH"
+    "AyHr29vr727JFDl33thutv+Mb9d975lJ6SeW5xZdeGKmDHLSfc+dg6LQItAi0COzkCraDbyUe/zb"
+    "1FYKdGgCyzy3RjoKvDFt9999ShR5964vbvP/fcg++dPffQ1nh8r9Lcy5TJ7qLoItHngQ9ccjaioI"
+    "v8Ny+RY3Uu1hF43HtcZhkrIlUgEG5W9TyWfYoSF4lePcMPkuBMWD1KAv2035NJwPsiaHhJJbKVcL"
+    "PXMGXRDjtVEFXhAVb5WbphK+RRIz0Pm+Wj7EAzL6SNE11xpKMknVbYXdzRIeHXZ7jCY2Ftwu+YR9"
+    "iUQsXMc+oOYM4Va9BqDxL4UVB4pMIh9t7lXJD/4FZoQ67nIVCvTBJYtS5eGFOjaHLx5IFJXdw8L5"
+    "GIG/7WLBinurmOYx5HdCoegRbb0A6bgYYv8LpRivd+YsdfICQH0bCt44g35VDXCb8utW8zwkCcWN"
+    "hHIXXH2bj4o5jr/MavWs3lrKnzzghico8mfigpMdb6xsaa/HxncTZ5ds/evd+57dprH/nkPXd875"
+    "prrzs5W1pcBc+udv7WhNq+RaBFoEVg50WgFXQ775i3GbcI7OwIkIkOkkDlm8vHT545+DdPfO/e53"
+    "/0AityD24uzu7cGI0PqV5b9hMYlVi7YCLB9iqHclSttLloUxIaBYmSUb18ubAnE704XKa8OiEjlX"
+    "xXYlyJLzLQqhWdsZP6YmhvqcxkI/mWtseDPXrIplzuOr/QCx9CNVFTC5vqqqHXtxiEn0JIIXbdql"
+    "MJ23igEjMSd7Qdv5LRnuQ9frOQSJ4xbZy0Hx4tnUJBrfeNcfGgSz6HyOBn0ILoPvqA/BQNLWQ7Pf"
+    "BVrNF6HzwcbALdcTaVcSFpL0XPyxPt1Xqf+l7538GoUzHppUzsw2DHwsdAD8k6ZswFis8fo/XewQ"
+    "hu8KtvBelQkPVNXA3jePVU99K8y2f3o8C1tsb5tUd8EcDqID5R+CErIb4DYKxVuoWN+XxdC3tnxu"
+    "OtFw/u2fNXt9104zd/4/4Hnrj+umuOjaaj83p65iYP6mmtRaBFoEVgJ0egFXQ7+ei3ubcI7OAI6J"
+    "kMC6dPnL/skWeeuO+R7z3xxXPnz31uNJvdOh+NDqhYm6lpLU2pp5JNktZI0LWykNktK22R26vY40"
+    "ERddmaJF0ASIliru5vc0LtxJUkODNX4p9JsbNZyGq5c8+i2NcjJ0mwC9uCg42T5W26weSeqHgKps"
+    "aeS6CDq6HxBjC9b/Bwzg2d6EeRAbF4+Bu+WXTAQr/jSbyKCsthXzGjlS/VZ28Om850yUIQX86zCk"
+    "Z8Y+xdbkoxhoEf+iXF3GmOb4nnvnghwZa496POJZEiHswzGn51zcSOE5OqYU1M4qXxfj+76HXHCX"
+    "XLa2Pf0xg08y6lpz8g8RvDTjr9ByRo4X8c+bJVuOYZI+ZrLI292iZwil1ojknFjOMjRysu7L2iq3"
+    "2t0lHsQ/fxZFISoA9frwHRPXZzLsncmE5G53W8Xzywsvevb7jmqq8++MAn/ub6G657bTIdbfLlSm"
+    "stAi0CLQI7NQKtoNupR77Nu0Vgh0aAb//PnLmw++kfPnPL40/+4J+8+d57/3JjNLpzczw+ogqDtN"
+    "QJKStwJJr8UDTwHq2REs1IVll5Ex0el1Aqlk5URePHfRG9OieD6NAfXn5oOZJoElyS2EGzDdGHrZ"
+    "6iSeLdsVKv7JcPhtWmbHR4CTk0F1jlQ594dytRSqiRtyrCHkTCj3/Yxg4NKvGoB2ugRAF86eocdG"
+    "QLzvOH1k0s+B3dGPGk0DQf+toiw2sLsMk9YDFXEdTcj5499CpQjsu+5YyjgkD2i27bls2NeTF9U/"
+    "A3Ap8C8gPnQEicOEOgQAZZLURsx+ID/6PwDn3OFxTqCwRkBeFNzRF5WpxvcewsIxrydfxtGLtq9k"
+    "1CfoUGXpRCsLUFJ+IHKeak81+0/vztiydm1RXmnP8yzNjyRsMR0fwTq3OxaoueWZgRgwny6W0jja"
+    "yeiBmvQhBPrzsQdevs5tb8+b0rux++6cab/uizD3ziB0evu/Kd6eJiqIfJwG3bFoEWgRaBHRCBVt"
+    "DtgIPcptgisLMjQBZMorgwO3Xy3J7Hn/3+XY888dRDx0+d/eJoNr1LJcGRkZbYxpNIv+cSZLWNF3"
+    "rXO9dYUQDAD0FRcjqnsAOTYgd00WI1jqIjCjg0kHGhwYARwvSQ16eSaSfBSqzZF794jOnXSlTIBs"
+    "3GbcVqTpldFAySdAoCUDMKtsF8PKXcDle6IMEjAS9bciB9gxN+29MExr9YncEW84x52yt80bjmZl"
+    "kw+LGeijDbjDG2Sh5rti15fumjYx+kbzl2sIxnUsqIKE6GFGnrm5pEsAwnIvE1tuEHxyYUOl2GBk"
+    "XXg9h4LoVrTsQC/AxTYDCQHOeJeepHnCVv2zqtVMT4C4ByTjrVjVJK8dUPK8jieDUr4jv0aODcoB"
+    "tzjsIbxzxndWIfUwuP4VFcRQyxX+cyhXPHswdhly3ndd1TZ7PERAyiFQ9dKRzJ8e2KmrUdE3r8HR"
+    "IDvccOXTUKRF16aftieLyuVTt9yXF6Op38eO/ePQ/fc9Mtf/6p++958sgVR94ZTydrqFm5bVoEWg"
+    "RaBHZABFpBtwMOcptii8COikDkhDllD2bnzq7t+/4Pnrnj8aee/MLrbx/7/Pp0ctfmZHaZ0tIZL2"
+    "rjVQMk9JVY8zQ/PiJEEsvKjxB1L48vr+yTX2fEljNfl16yigFOl4ziibJh+Mb3nrRVlExY4dPArU"
+    "TeGBBtgmQYBEMFjmSdJBsHhtne2E5hhlpg45d+yv9SQtSraANZZCxrK/A1N6Nrq1+7QzftlM1I3H"
+    "F66A9JfOD1VCSFKyt1bxaY0Dq7YOu35j4EDbuSRAcl6yGRA6HQPA/LbI9hYKVyglQ8XZyqiAApUA"
+    "zVjctCj4/HgVj2EO7l3o8UPvc+geUYym7X0u9aCcRKbymkhvEPb1NfBuiFPzGLoY9oB1bvd/REzY"
+    "NbcYVOH33z0q+YY85BfBd81g27HJyhTXT58gC/ooCWXGLFHNGjoONcCXsIu0DU35V/pK9aD8GF9Y"
+    "11FXobfNHy3niy8OLVlx352v333Pn1B++//8mV/SvHVQiueqVT4q21CLQItAj8KkegFXS/yke3za"
+    "1FYIdHYOPiwsozLz13y1f/8pHPHXv37S/pPXKfWt9a2D+aThank5mLFBdzlXUqXuSjTgIrmxUhLm"
+    "0jDV3IVbvou/iigKP4c3YbdOQiKaYXjTHYbhILPvJRYJU8Mk6euQQNboh4VcLd5JupDemxHycvZi"
+    "T3kTBXsu7MGGGU1Tp89ZGMQo0EOvzoEuwsLKLQC9+74kGysVojZ3DTDoMQ9LCDo/SqyRo+JhHZ97"
+    "fiimPdAijZGodJ9H1pqIDB9tj+DE1fwpPdbh4pW66wElQWfKxywK48CCuBHzR0sucJSlrK3fEdKJ"
+    "eP1k7scNqeayMi6qwW2pcoluwvc5SEo7zNGWyxohWrXY6rxpZNHdsAXWOfh2HJZHwquMHsU0UUMB"
+    "DCsgQ9Lw2RxRbnQaw2Z0GX2IGpefBjfXTzS4HOqPR9goe/ErVsfH2ivucUdlGZs2rHCSqduMeOSz"
+    "u5x26Dz3w2Hb+re1+fuvLgoW986v5PPHznPbf9YO/uXe/lZNquRaBFoEXgVzYCraD7lT20bWItAj"
+    "s3AvrifvLKa69c/9ffffyfPv/GG//64sb6J+bj8X4lvTMXZ8pMvQqnBJPruyZKErmEjMSU4iySVm"
+    "WQKedLxbj8TOMq9pwYa0wirZ3pJJlOdbPIKxmB+2AY9285LGDAr+TXYlJDE15AeNTJ/W14lWynth"
+    "DCvpCyn/sEd+KcRqxLXMKybWtgv0jg4bsNIUPAjtp/8eoSTMTRcdJvuVCvbe9rUUK+zAR1YBPXs2"
+    "HLxbTZQkoxpkKLY8NcaMl0XwIIe1d0ZhfNlI6fUcNWAUusjhWy9mOg24mJCR9cY6ZMPx5SB0ISQI"
+    "bzyVgFaPFLdIy5HdHHSGLUSt1xkJwxodH5W9q28++DZKRvfPFsNfHQU5dgdAbKqypO/bcj44xjVT"
+    "ZlJYgamzjHAGJoRHX0Wz6HYBa8E+/nW3o9nS7JnM/1UhEenjIevSf552+94egf3XfvPX907+23vr"
+    "R7967zgQqwPoXXEVunRaBFoEXgoxuBVtB9dI9d87xFoEVAEXAyHRnqaK5C7rU337j6q3/17Qefe/"
+    "En/2pjvPXQdLZ4lUqxKQVcraiR0HF/3GRaKwbK75QouqAbRJWkvT7oVg4YtLBdyWGtdDkpJWklOR"
+    "3odLACMQ4+k6iqUASPNkxmYV46tkzKWsFIfSHT88lYDY8BAQsJEiaDZX74AS2Zsll9YkFzmp46XT"
+    "9Y6V/5KSH9omZxhmksVtEEhp6ZINP6wdCv4CWWRMDsVqA0CFl04/iUX9jr7oUDXSLwOHKWsQOBnl"
+    "MIH9OvQAw+fZrlsKki3XxPMLn2hfnHTIpVYwNYK3yxlFQdj2B2McphnAuSwV/mU/aBAZ9m6w7Cdk"
+    "tmWkgSOunB4Nyq41DK24q8AR/IsCddDWxffH6qbcPqzIdzsaImSXwIkjBCE1+ixbEwTk+KSaGnZp"
+    "4xSkCrc+gbTEdT+7h0M+MjVnePnf6eeKfdhlbtlhanx/bt2/vda6+86g8+9/GPP3zj0Wvemiwubd"
+    "gKWGkv/GrbFoEWgRaBj24EWkH30T12zfMWgRaBjIBys9nxYyeveuS7j9z3N8+/8K/OXrj4ha2lxS"
+    "uVzO6a6OYaihnfIyd5kkWKM54aWUVYFF5afROviqsuuNBcDPaJLQ9scHEIllezkE7dTBIjNQ2USq"
+    "orR0U3WiTNmUZ3GPjoJFoK4AyT4cCIOUSRIwnJI+idDYdWGnnfDjn7K6XAlnz8ZuEkuwmBaPWtlb"
+    "bCM5j+9YqLY8tldWHAqyrMnfjHQzRAADgato0jEqs2NPtDl3saTUn8weV3SbadeNCGtKTf+SrN8o"
+    "ELEbmsth7igYX8NYz9U49LB3NqMhiWyz6O9PgMZAumofDTltPfWH2KFUnJiZWipeDzKVZFg6RtF5"
+    "aSLf9h+TzNmOJa8SANC1hkaXW+xSjkL6XBS0hPN2bBPPqGHT71d9JxLJZzw2G3YYy7EBbTtqTRjW"
+    "P1NJTxre6jLIE0EXPN44H+lvr2Fef5cIC1j+NnCR0rFYC6t4732Kmt63lHLx4+dPDP7jh69E8eev"
+    "A3vnf5FYdP6m94fTzS3Xed/2W57VsEWgRaBD56EWgF3UfvmDWPWwRaBCoCqqtOnD572Xe+9+T9jz"
+    "355JcurJ3/wnw0vkVfwe+bzRadiLI6Q/nkVQmKBlUXsdqmtJDkmPSQ4kGseDhKFlski5nssdNIeE"
+    "EgGa2+C4oUgE1yOmxOiFXAOZkFZNAuETXHyWonUwr4GrjsIpcNHvjB6u3WGF54XjzG9BO3hp09sL"
+    "PIgjYQZeg5sDcunqoldOkVpGXEs98i1vwZh74oopsvOevn5EjuEx0Lnp9Npt/YcEPOeIw6auKCGW"
+    "K2gYRxkQzbFtCx5xy5tKDIacX8hHMpv6xJXYBMNGx5KzvBz612OTXvB5LqGgCn7FcqmlyQgSJRJm"
+    "QgECp+9PvWzxUamomfIl2c4XYBSlHTwkSK9yaRTTifo9YNfyqu2yaZ2EMPuiJOPOi03t+gWE0uh2"
+    "8VgTCNvJ5hhJaKtnjapfWR3xRNRVycO8jrhyJfH63WcU3midls+oMDe/d96+N33vX1Tz3460/u3j"
+    "M9NZvM1kFsrUWgRaBF4KMcgVbQfZSPXvO9RWAHR0C3zOx9+YWXb/7zxx777Vdff/2fb44nd21sbh"
+    "zgheDUbS7kWFlTjHyfFbGialMyyKoGrVtdUxZpeSXLJIh8SgbJuIfOKaIyRcAlTVKqLvn1MCmlX0"
+    "lz0bFlGoUjfJJRlOWLPclN3SdUMmHbTCDU6KNHC3rgBNZwtaZ8sxnp1Ipi2e0RCpH5FHY/J5sKeH"
+    "dtN+WISPxGAYbfVfholp2PVrTrPc22RDNFG+JI3/QcY4uxeR0NGRD7+MdwIGB28GPeLOP08fJxEQ"
+    "h6bIODUhyfKDwYhz9xPMAP2zFPXhsgAs5VwzGG2gV68CKuWOO84t1qg0fye34xT2DCN3pqCd3FRO"
+    "cP5479iSCEXBq1rihhL1l/6267b8DxJYULopxD2TcE7qsZO/2KHUe6YhjzQKa7rNR+Fh3f+YtEw0"
+    "FiwsYdbnwOpb3CmWveqHiO0tHdcsawtqHyb0l0VuviktOIl95Z50swt/R2cpk/p8s1n7ru6qv/5K"
+    "Ff/9Sf3Xv7TT/ctWvp7NB+67cItAi0CHzUItAKuo/aEWv+tgjs8AiQq73x1vGr/utf/MUXX3rttf"
+    "9WKeIn1xY2L6eQmypZpvGtPIlzvHrAeaByUz0IheyPRFF7ijlySeebIpHMVqIM3ZdqIo+m9+o6iQ"
+    "xZOE5cOybQYTdeQh5KwyRbr7uzH+g5MQZdYvhgGBJTTYGk13wxIk3F6Wjg1UpH9AOLftiSjsFCPm"
+    "yBGUk1XmqUaGHX9kWxlRpYpsfuFHpXSiP9D8xuXhTNkrV9deACTbMvYc0OWDNlUbKYNk7mkz6Ykj"
+    "FiXtvnakbnNyOQYt7WB8uU2HRT1dANl9MekhEzENQ8gRATQx35yTcH9KTUxVcsjlkURtZM1TCOHA"
+    "VHYfd2go+wj3moGttGtIFUtqD18WSkhjsSQuana8QmfCn5D9Qd4Not5p+08Elm1YlCLG07RkK1L8"
+    "iLXjufG3FpKvow4qgzinPOwhhJnPIrzCqGEiVOFHZhA1X+BgyhBTktykmfvziweW+dL7uVvB6gou"
+    "782J7dux8/esNN/+mhB37ta7cePfqarsDckHZrLQItAi0CH7kItILuI3fImsMtAjs2AuP1cxsHnn"
+    "z+2Tu+8pff/p1jJ977V9Pdu24cT6e7t5Ss6XIqJ3h1f9t0onFldySQamMVgxRuJHgu2LLoQM4rOa"
+    "yc6Qfp0M19JqN9ou2ek81ANny3iWSd1DOa3VC3kvy4J2p7Ik16GgmnBOWXFxPVtT8AkLfqB10nzu"
+    "LZR/nGT7TypsZQM8lVr5JiqEyJhoZt0Ct1c0omBJlxbwcl0eUL2tuah2wCbGhzm1yiVZxj1VJazB"
+    "VVz4s9WtsLt/L9fbYRlbLV3ZfHCMdvcMXsfSI2SEPTyeG9DarX44REWHM/N3W80OhlSh80WuFslw"
+    "reJducs89RwwwirrFDo008TTV0030PmJet9c44ykWDb5k8bhEHcQ0Cb7s/SbZOeQ+Nfuj280az0x"
+    "/Yd2A6xnZ8mytg7T1bZGWk8EMjAdM2DvhvADl+0LEa44y3xizT8XeELEW093pgCufahh6FqwRoVd"
+    "+xvLiycuhPP37b0T/551/+4t/Mdk3Pal2/FXbbD1UbtQi0CHzII9AKug/5AWrutQi0CCyM1jYWll"
+    "95+eWjX/3GX/72y2+9/bsbk8mdC7PpZRRlMxVu3PtGornBpWwKWD3RMpI8EbRa51U7eHq6JQkgch"
+    "RxJLP0WQ0i0asWdPFc9Dk7NAv6cIVsKF9JaFxW1xcIxpIeySf9YcKOfuSwMQcwYgxHOgzo4SRdde"
+    "gHufwKOct4NvAj0S0adgvLeIYzoDUCKfG0Qx6GdTpypcsgRGNObqWjAbSyZRz7EnOwdKpggnnUvo"
+    "Bgi9VhBL1kzbFEFGE1Rkd9/VZsYo92GiygQA8yxpGQcI8k+XLCzOCbJPlt/noCCIVhx0OCjjfUgD"
+    "deF6uhrGVKyCjGqgJTg5wPvcCr2MY4dMN/9Rna/ZpA7ZGmD8b2c8FEbSpuNa54dnihbnbNxccX3c"
+    "HfTvhXcwpJzvm+5fnqvzmB2udEtA02kkl/t+lBFRse/sXfbS+51f0dx98pq/b4uDFXUbe5IV0ud2"
+    "au2shnveqAhyGdWhhPn7n2yOH/+sWHPvsnt9920w9n02n/moPegdZrEWgRaBH4UEagFXQfysPSnG"
+    "oRaBGoCJx878LVj3z/e5984slnfvfE6dOfHy0vXTfXawhGKua4nGqmhI2ay43LFfXDL++WI9nrEm"
+    "vlbxRalVhCd45ZySEDJXmVoAIZMvSiVSLtIg+SdEs+RZwwBg09CcgZJ9s29n559KowCXtQqg0T70"
+    "hgQexb4MdYfQ9zzpG1Yp5p2U/84FMxgNfpuBsYwJhhPPTDdi9vWK14xB6/fRmhBdAMHIbyph+njc"
+    "ATT8fDzmHO8aeDjwMMs0BhpaUKbkaocrzczXHC4HdQul2k/AjD1B4j1i1asEJuOzuso5nHQLqJYn"
+    "z8GLaSM8026HEsw/8ODxx94riHH0bqNknT2OHZbia/GEhfJAqOLwNV3z4hD8QlDTla73YK4o9nhh"
+    "qAqTiwa77G9scgKTPYhUwoYSPNpVLR8/JkX7YKLc4TTFoiSEZ1jNIf+p3fuMicJWs6uiwaZ6PGVJ"
+    "IjTbARlqCIrMNvbtiKJKOo0xMx1xYXF09OJ6Ov3n3rbf/Plz/76UcPHTn0tv6V8aMyUW+tRaBFoE"
+    "XgwxqBVtB9WI9M86tFYIdHYGt9Yddzz//4hj/+5tf/zZvH3/2XKuTuVu63OJvOXMGRX/nSRYo4MU"
+    "jsJrpJrvJAir18Bgo952OsztF4eEgkgpHUxT13PY3Cr7LGSn4zzZQ2iSG/fYZHAsu4MJ3AVr6Y2W"
+    "wVbfGwlT55BakS/Q7V0GEBGCfnWHbymsCV1SYtVv0iDhK0/6Ubc2DU+6xBtMJhlL56rhJ3Yg4ZPU"
+    "PGPBEtn/yAx4E94h7JdfiJbskWfF0ySJyLF0UALuDjIGnvjqitCi1i17lNws6qTEwWoc7XXhW+Lr"
+    "/TD7/Qw7sYQrMfRbRICIU/4Vfna2ccPaoGAMJu7W1mgCdu2BDDfqQNMMsGMp1jHgw3ZaBoNY5Y4c"
+    "Iw1r1UOWGPbAv3Y4SUBgVVVI9TwuwSyOPfsaAXRPRrbsEAOmU6QozxYdtDfAY4nof0MIOn2zE4lo"
+    "Wpve831TFQF+qm/ui5B5WYcoklf9seixeHSqhaqZtrNZ8HrZS/yHo8Wjini5q/d/2VV37loU98Qq"
+    "t1t/5gadfSqsHZ+PzEr9ZaBFoEWgQ+PBFoBd2H51g0T1oEWgQUAeVVo7NnVg8++sTjn/mrRx/9n4"
+    "+fOfeZ0crSZdPZkhM5kjwKOS6rdNKmJIvCgKSe98g52VPS5UutWBCRAjrxrjl1stUqFRjO0aRbyd"
+    "q24gh5AJJN4od9WiWW6JNMBiaDHqtP1vENOW/sOyP40KNFp3QCJhPalAleYIVur+PiYBsSUwrnOy"
+    "x1oHiu6vemu17MFxH9lL8Vg24vjhdXFHc3DKhVEU0//Ek+BLXOosRrnlBd5Ek0pNkGXsAy34iVMc"
+    "wKPuPQGo5F0hBbTth9gPCXEwLpsNLxTe03Qx+L6mNt/wYFRe9mioXmtrgVwCWyvmyXLxbSl/BWwo"
+    "NpgNadU8wGnnGyI0KRbEa88LNHNb0TL2nt6aq5IA/QJMAKuTx1urEdkA0/qdK2Awd5W6w51j41ga"
+    "tz1YcCu0yG38GKGl8GYANWyVso/RPZdsI/ROOcYA+PZlxJmYYfngS4cAOfXnyJQiHIpZmcG9iNom"
+    "5rY31DD0g5tm95z199/M6P/cfPfvLXv3Pg8v1vjLZGm93qPCCttQi0CLQIfEgi0Aq6D8mBaG60CL"
+    "QIbI3mF0bLL7/xyk1f+/Zff/mFV176/a3p7BNb0+l4wn1yWl1TQuUXgnPPXDy+RCmaizlWejZ1mW"
+    "UUVSSpJId8nM8puCRi5Hdd5qeOV+JEcgEHTw15JLsUUZiF4Y6TyFhZgq6hmjdoSySSydKJ1YKUSL"
+    "Htj8WXfc2hMDI1BtQJZhU9kahu9xUZ5gRs7RnZJ/vJZOAUPx2oXbC0YiGC5QKpyAVqceGVD9ArRo"
+    "6qxgkZHRwgDvqB714nYHdybiWOXHmZzjL0RCKeZSF86Dys6SHtZpUapFd4QMJujEv9SB8NlMrlNz"
+    "DY80f93iqcvg2PEWEMGPRCv/ho1PnR25CQlQIPWz4UGgZO6MCtVcaagsepCw3/okCjH95iZ9hqLj"
+    "1Nkjkx66d4FDzJkLDNeLVLNA9ALuFEEwt8+IEVfEaWNU+n2/B8S+PI8/da/vX69GhCAE7DoCAbBX"
+    "rBEds4zhb3vxH647ZSR9fIblPLSd+r9ULc0MNSLIM/6vPQFF3OZ2+cRQAAIABJREFUfW4ymT1z9e"
+    "HDX/nsAw985fa7b3l6aTY5L/24WRes1loEWgRaBD4EEWgF3YfgIDQXWgRaBBYWVi9sHnz6ye9/8i"
+    "++/+TvHTv+7hcXlpeP6rIolXMzh0dVnQuvuHwqV1pyla4S36lysbHurdvSMpHKPyd+kWBm0SQ+SZ"
+    "tXPZxcUvSpZVIZGSNFk9cK4rCQDw4SyUgeIVZiGWzGkb4Kn0Gmne4yQiU2QZL98g1PK9G3jIB6ly"
+    "LBJwm2Vc9ZtmosNNsVXnfpYZlKH2wHWslqTwt6eB3cXsa2cAI/Qzy3GhVB7IgypKQPjECDj51+Pg"
+    "XG/NUfyMMJuUEBgAAyNHzplIJk1gAjXAs5RHMKASE5q+OteC7kg2D/y9dAjjltm5990EagLqY6xy"
+    "DFPEs3RGXE+DWBDiDkiZkaIjGP4UQyPpYIfDxyYzeE1JDzweSOnlgihhbHAB8Z86OZSaTmPFSjz9"
+    "9JySLTXR4pIji0bpVRYxdpohlZ48DlASTI5xcWovv4qepEDmkjqVvHwkUV4yzE4nhjjRZaVt3WD0"
+    "59QWO/VazFHMMWf7fWLt9A04NSyi7x2zSPuau408NS/NncWJ2NJyeW9+z51r033/b/feaBX/vLy6"
+    "84+NZ0Mol76+xX27QItAi0CPzjRqAVdP+48W/WWwR2ZARIuJzIacOX7G+8+c4NX/nGN//Z86++/L"
+    "uj0ez++Xjh0GSqlEnFGaUb6SCF2ph75KRLakYiFkljgNGnDJMS2aHxufwPOySgTu+cJIKH4UhMnZ"
+    "zaIbDjVQJGDhGMOQmNBNNqAJpeG4+MLb+crIZN8NJdY7DK6IJSc/HECyD3kfzih7U6biTiSkfxmY"
+    "JOP1FQSETGnUznHJAlNvZRtLBfuqJDgJ82tlnqaBYaJPGdK46l/UsI7QQp+QKq2HBgcS4EwvfiAY"
+    "c+WbZb2MuBduV39OJoDmTkp4tX9HMuqWEIxwcUjqd+4DG1OtYggRxOwBgOg4tEiKT1jI3puenj4N"
+    "LBdmCVvxQy+BAG8AfsgS9lFwniYdMxE1jVIHse6UPI9n7GvKIIc9+KYacwsFu8mopxEDChzilZtv"
+    "E8D+FJkGLJ/nscqBR0tK5gC0cxFe9TFK9smcgYeQwkY9sxSRp/I7hQ/qrrv5uKa5mBTp+GPP7VOG"
+    "ItDflOn/fWma+9/6WAHlVeyEhft9WJyeKbVuw2eCImMeQddusUd2dXlpafvubq6/70wXvv+LN77r"
+    "j92eWV2SnU9GmtRaBFoEXgHzUCraD7Rw1/M94isHMj4NRrY7TrxZd+fPv/+7Wv/q9vHHvny5Ndu6"
+    "6ZzGbjrfnmaDqN98iRdJFMdvfM8dCDSMmc1BPBYfJHAtclgkrG6FPgUFpRGA7vpbOsaC6ySPDUr2"
+    "/s4bkgSwwBiZt87bukUh3mgk+ISNw2Q59BCJMYmgYIsiT6UoAWCN7BVAOdNuBjBwzFIjjeGT5WSk"
+    "QX377kPX6WwCE1tp6B7IGDbNwPlE5bKuTguSXLeslnV/M0oKFS3swQ5LiVrx1e8s0LZ0IYrwd+xv"
+    "QzXgPoRNauYp16+JBIXTxJ1tVciLgn2aQRI+z5oTo1V8swN86D4Dti4hsTf7GjMT/V5El20Ul9ZD"
+    "wIVi+jc60rgirW6IQcOrZvnLJQ+zgf7ZNJYY9ut3rGANeEZxzNl5/SqeMWU4Gupp0lmLft4yOxMU"
+    "gIsLW4/NNPYAYNrIqZum7IsMqFSqx146sBgo+tEMXV6Bc/nWRIl4Zu+CY00UK0EEKGOcbfa+hdyr"
+    "WOdP3lB/Yh8Ks+54gPi78AYI6S02euOHC8eCWDi7qNjc3F6eTk4tK+v7r/9pv+73/6uc9+be+Blb"
+    "cmuuHOSuVK27cItAi0CPySI9AKul9ywJu5FoEWASVKC/Px6ePnLv/OI9956DtPPvPvVhc2P7M5nR"
+    "0Y6145Hmaiu+acJJJlkZhNpjEmB8sczx0ScpJZEsoqxEjUvJqGItmfEDodjUjekHczYPRTNAyIHj"
+    "KRvPYJOfRYdYHPB4jOpi2RfGI6k0bZt4xtg8f6gJ2zC9gtDPo0uGy6ceJBpgnRxYj7FIbwFYcqWK"
+    "woUHACI3wxvAiRHKfhNGIagGroeasOKJ6r/C49I4dQJ0uMit/PXfpMjobx7LrPUAnzpf6BjZgLCg"
+    "n6QSbCqFhbXgLghqSEs4X9LCGGdgf8zgfRQj+OrvsYzmNQcmGHOOYEhnPADwT1W/wyW/OulV1cgF"
+    "d0xtXC7/Ijij7wAhPsXi/wZdU2QUBOO7sR9CjwoOGdGMhoW3MD1/MKMBc58XdhFRcwgNqH1LPfti"
+    "GCcfErcSHZTuiHfXzBNrQ4fkiVE/bH3KD250JglCxzs6+pGb7DFWbq185yaTNomqdt5kh/+9jBi/"
+    "CMwi18so+IacisoLoopTDVAP6m7q2ba+VOKOdGem/dDddc+R9/88FP/fnttx3Ve+suuQQzYEFsrU"
+    "WgRaBF4BcegVbQ/cJD3Ay0CLQIDCOgGm3P8y++fOtf/NW3f/vV117/va3Z0n2bk/GMi+O4xDKKOS"
+    "VVunRxPCYrInFUkt4VYpFEkujV0yb7ZFTJmgx45UmqkUyTmIIRSWzgBY1EjaQQHi2SRPrqVUIWLg"
+    "SmOGE9+KEXfXygkfhVCyTwQQw73mvT+ROmLeCkUsIdL7QMVz7imC3Y+ZgT+MTC9x9hRx/LoJnyZc"
+    "arZgNaYdlmyrPD6bpkcTugud7gr73J+aQaJj0HvIgVqbAeNkjEw++KVTe3QO0NqGcbiec4Ak7Tru"
+    "JVPiQZ19W0SdmSg1oxAqAK4DpfOpwKVplKnPIf2++PibRTHjv44EsH7TQUWi9QssbUIOaGiGLmcZ"
+    "wHVsPXXtWkiF1f2NufUA/XpMBPnK9i1JwC0K7A71sJhC2PIpCyHXI5NJj/zoo/sBO+96juDc2IEH"
+    "4BU3+TEkAGowNZVtMwse38sGgI+TzqFMJvIfRY2e3919+o8BgXQvV5mAxE0z3QWMbloc5hfQW1Hi"
+    "vqHIj5fF0PUVm/uDRbfH1xafbwXTff9p9/63OfeuTAZQfe0z9ZfsNdhkYgrbUItAi0CPziI9AKul"
+    "98jJuFFoEWgYzAqeMXLv/WY3/5pe9+/+nfO7e6/hujxdlVs9nSlCSKos2XwCnnoo4jIZp4NUxJnY"
+    "qlWLEJIBI8r87pfrktJVs8BRN5X06lBCxW68AgKY69tkGPlE1Akez2yR4ZXdhFtugmFh28JESOa8"
+    "9NwQ56JHw22tkJH8yThFPJUgsQibNmJ+JwrH6HCXLhI2lR/AcvkF0YqF8YdGnFN0AN0k43lBwxq2"
+    "LHtsTc5qvRhoDRrzhV0h3jQk6MxE+zRuqwNYq5hesxDxu3AXRi6nVM8rh5ZhYJAAkOMfsDZXPe2D"
+    "eDha2KVdk0H9fV8Mn+VpBFC1YK5C6Eg4l+zQW6fTfO+4WNLZmKW5kpjChmoNLSsnYhr5kmpCVSzP"
+    "5bPtCMpUDU/IAhRpzFiSjp4JtjYgLDyb+/sm/owu8nB8S25kI5XAhp7i+VfMBrqyCVSpxzcJKiHf"
+    "e+Qhmu2pWBmmMghF4g06cVch8jqB1Xtus8rxjiT9xjRxGOcF8o2xfRNvPddSBhm+PDu+z0pZHuo9"
+    "t86qZrrv0vX/r0p/7rjUdveGE2m1zEZmstAi0CLQK/rAi0gu6XFelmp0VgB0dA+dHysTdPXPvwNx"
+    "/+re8+/cy/m+xZuXu6a9cSj5Xzg0so5vLSSZItPdrSyaQLOxI0EsD8eNWIvuJZNA0jeRZtzENRlI"
+    "DBcyflSARjxU4Ea9cWqUj3XFBmwmZq4gQ+MmDSSNwxqq7t9DSZ6VqwQsfJtQiRkIZQFXL2tNNLbK"
+    "OUvQ/GNyYs+yI9J87hltXlDH4amk0a6roWio1ZKQIl/AzeYNo533Q2d4VrAwLqVr5SvWK0DbN44Z"
+    "1GERtPhazaU+e4py8icQncMO6XriCGO30ibwghc3w7n4gRNAtrE0qm1ab8jHMoqNBsH8eASD2wfT"
+    "YmrdctNGwhPFAyK8bhR8gyV3CRrvM84sIdXRGLlOwE+XtBLTbBjSHHPZ0s8tANK2EnmBFn+iLEbx"
+    "220vaeuXo+0u/mmhzGHU7ib1MWv1xAsPRtkAnk+cuYfxdoJd/LBh3HOx7y+JWsS3eWLGbaZd49gs"
+    "4t/MV5NS6t7PDyIUfYG424n47zQLoaE/u5noa5pXccTGaTNw/vP/DHn77/3j/89CcfeHw6mxwXBo"
+    "611iLQItAi8AuPQCvofuEhbgZaBHZ2BDZWF1b++onHb//qt77935+5cPZfjhaXbhnPZiqueK8cOR"
+    "wPPFEyRjKlD0m0n1TJpZPwvTo3uO+N5E06keplDiY5J99AZLhJyMBz2uZkzJSQGxwSkjoXcikDC7"
+    "VITgutV+gTy/A1ZHv+sFcFQWCBmS51QtvxCws9/LL30qm5og+dB8TEaiTxi0QWXbHc6ooxxianmY"
+    "FICIpbhQ4Ei2ljP20paSnNLpLgnoDJuGsNvTBIpP2gFjsVWvaNsWTQKX/x1WM2al18waKlDs4lfN"
+    "C1dVw5dxAtebrJ085NqqKJ6l/On9CBTovjk1IoQ9NPnDExNgVeiFnHcrJbx9kGSlx7Q9mvVJJy4C"
+    "LE+aPigerATRx143iqA7mClBL9Dv+j6MCfipmtACI9+uyLV7oew08Zr1Zhyy3m7FhpXHHxvnxPzI"
+    "jhdvmwL0V13md/WxzKWuy7rZUYMX8NpFN2Opns9PMKHz5oriEacR3quwiu2HT/lihW4bQLugo//y"
+    "7ZdW5V5WoA3c+L7fngvXWbuq9uY31tYXE2PTWdLn73zhtv+D9++59+8U8PXbb7HX1V1UV36EPrtw"
+    "i0CLQI/ENGoBV0/5DRbFgtAi0CwwjowScXDn/jsUc+/a3vfe/3tybT35yPNo8szrQwpxSHl4PHpZ"
+    "RcThkJ4IiXh0MHRUkTrwBgxY2xH/kvxVq5kJjooUiCFZdZRu5kDASyMaZ1lI4nef0Wn0S2s99pRE"
+    "IYKoWAHZJiC3nDGoqty5fCw6BetuC54KMTSc1Hs3S/1w48j4eg2DBq+GB8+PkgFPCZNyJGiK5hZA"
+    "626JkUgwUfhvqUxOxjHPTwO/hme8PYszVgJ59GwY+CmIdHRB87faEwxFM/fjN2igOE9BR/+UBCH7"
+    "zyyZGw7wgMmoyh49hq76TcuhqIYX8xkQ1/acbNYop+PHwFus13eqzqzvlyIbS8ZVO+GT+phc0xsf"
+    "+iR4FmBVlmTmHDziWO1TEsO3gXM8pekEUjFpbMDRTJIKbm8wQBffCp/AtubBF1Ac/CkcEknw5xT1"
+    "zp+F2OHgc8spgO/8MP69t2+mDfsM1fQjbbCH7Yi/kHqmTsq3fpl2j4DouuPtu+LNB42OyPCJZJPf"
+    "jMg3MSBJ+HELMxXcCRcWNu+nSXuGY/5hqyAsMtv7cupqlLpK1PlRfnzny+oQemrGu8eWFhMnvx5m"
+    "uv+T//yac+85XbP3b9D3UOrIaxtm0RaBFoEfjFRKAVdL+YuDbUFoEdHYH5xnz8xuvvHn1YDz55/I"
+    "fP/jejleWPzxaX9uihJ0qXSKZU6OiySq/EqQ+xLzEYa5VOCRmykQgqadOqlJMoKUPj8sJIM0O/Al"
+    "6JWjwoRQgkYmzQYckPzK1I9hj1NiSFGNWlkzVUMpErmxonmm2XLYNYWfL6sWcklBJHQ1mlCw0XHa"
+    "K7CFPCHExsVIId/oVfKAeA/qEGopPvEn+LaCM+5sueu+iqgz+08KpkepvogW8pD4CJeRSop+0Npg"
+    "LPmNl3zOQgRRGrh8EL2Tp+9qRU0w5GKcAga+c2LIBq9ap4eBnHBMVUyB044TeEiAd63fwVb/ti1Y"
+    "gGx8P2tDd250Xo+bgQCxcpnD+ip93+mIUDERcxJVQ+loz9QC/tWKPiyUD0TobzWjy9usOxoTBxse"
+    "EJh3F88FzQjUkCwsjNvuBHMu2HOOFCyPmYiR9+x54YYI+YROxtKFEB0DiMJ1rPsi3HJyOOnFrnp/"
+    "rJCa9g4zsNWP2AEb4HOfzv+Ra0VPTCF2ACKOYinmwXdPzN1agQSl97WJ6WNsSdYfpOn+ZLox0T3T"
+    "OnH9O1CTvW0ENSdOml9PgbmK+vL4yn09evPnLln9x/x53/8VMP3PPI8vLimUBr2xaBFoEWgX/4CL"
+    "SC7h8+pg2xRWBHR2DtwtbCcz964c4/+eY3/u2rr/3kd2f79902nk2XZjy4RD9bKqpI+qcas/pRCR"
+    "dJpG5RiYJA/Uq0SQjpD1sN4Q0TxuqTWFlfSiEbiWJXBFbChlwWIEN8J2rGDmqKD0U6/JLtmHLV80"
+    "yloU8lWz6VTs2uEkhnmMXM1BRdJsMP/NiWUPCwvLUVL0a2nISsJ7HBuol9jxUJ9AMRPy078JuHPt"
+    "givLQYeKLagYHHqdfHM4rQQJe2fen9seeJkapBQk49PlEaYlv6IrBnhckxtW6PFzpso0W4EFJjkE"
+    "a6ecqh7gmcrFiJb+2EYK2MV2iEqi07FpYyVmJbK3wMgDCJt9HS0SLnHohhTCKeocW5q/LAPnF8aN"
+    "5qU8cTeI4psnwHwd+Rm/YddurV3xgYFjNYYG6pgHPBmoz44iRW67DheAWwt2w4phmtjuaOMZIkv+"
+    "qyW89N5CG79I2VjHArzq1uPsCJb7+yH7uYr88FCHgkUsWn6IzrmNe+Ap8Rs7b/HhTIOr+L1485n0"
+    "V1vPXeOYr8MBj66s8Z64sDnoq5ziWYk8mJ5ZW937zn5lv+/Zce+sw391+2+7hONf1R5QGwZtu0CL"
+    "QItAj8/BFoBd3PH8OG0CLQIqAIUEice29jz6PPPnbbw9/+7v9yYW3jt9Yno6uXl3bpqslYjatki+"
+    "SsHlBCQkd6Ex/R8xJLki9olZA5QTOBcEe6BU6XpIGROiRM1kN0mDxlQgaM6Rob18NIJLk3xjjWCz"
+    "upZjqJH4kqq4thO+0KNOQqKcQINJLjWGFkHO7YA7ihA0PN8RGLmUfCm7GRUiS4lZwWTug5HAkZ8w"
+    "594wzmWDY8K5xS6+ZPVSDSNh9SxnqWDj6mSi/J0qMECt87miiW1XboP1K2UxqYDnfc6ZJ9FRu0mJ"
+    "P21QcUZCkFjeQamprI/byTDA/xLAbLdt6FFr5ExYiYfUHGK8iDsbrZyljIYiX8D0N1jMuOlcTq54"
+    "UVWwrbjFAayojPag+4FevwLc+B4YStiA9pQXv+NtIEAHY0vLOxboxv4Sfi+pEsKEWDD52Gfm1jgJ"
+    "xIwa6dL6W2vpmdRmgnreaEnNUjaJZhM7SPkU5ePOQ907Td+ydCOLlNv9M1L5UKI22ZytzLZxFcRG"
+    "oMDT5neMjpbx+azqf64khdyamY04drC6yzqRJvPj8/Hc8evfaqa/7DP//i575yww1XvqoZDL9fEX"
+    "JrLQItAi0CP18EWkH388WvabcItAgoAuQ+J9957/DD3/yLzz/+/Ev/w8Zk9NDWdHaQRIpLuEjAJm"
+    "Ot0E1IjnJVQQUE95dVsuXiTHLDMcL8RL4YySbWkOHjBJ2cP7IsdaKFvPqSqVY9RKOYhKIRhABwpu"
+    "gkjeJGjUQRNslZ2OQLeCsYuny1MLJMTq1k6QcJevpcWPBAD5XeDpIk44klNTRDVrxh20ZPnOIzdZ"
+    "OMk/OpeEAjfmUjleyP+l1sU76Xu8QIzm1rPT9NmFv6cEvDkulbxDF0O5cMIAWRS7/iXX6ah4VOKQ"
+    "w4LqaFJDbDHsKFBy+Ob2xh6CNhy3OcuxhZG1W3IRYhCvPbZRAsuuNZStrbcmIjU19uMM+QxbM45j"
+    "V3wDgvLJM8/LMR8YC33/YQ1zvHPI90xnKIIFurYPyNgtDZMl8SCWjs7JsmPn8n9MvnYtsOtgcY3J"
+    "9HA+d98qJ1uvQzLqZJIWYmBo1gGTrwAxG6uds26BWGYyFufakAyCUI6VfGN30AtvwpE95nbHEn6M"
+    "ROmKKrDPe9drH6y78XG3rIyvziZDp68fJDh//w8w8++Ad333nrD5Zns41tDrdBi0CLQIvAzxGBVt"
+    "D9HMFrqi0COzUCTmJIMJXA6B27kx+/+uq1/+WrD//O68fe+rfT5ZWP63rKfcTGT6NUccS32TxoQb"
+    "fQOWS+TMw3r0QEKeZ46AncSIqCTvKHrJt2TsPYO3HKZIqsyrQoHMW0eH+5V4xjGzpggjFMYCvRtE"
+    "35HDxbNH45UXJGIhBpL/gkduFfWCqrqd3JSmigi5QT1yTHt/69jG0GRMxVE0bePkosLiVNDxhjJ3"
+    "7tT8wFvphEEV53qV3aRsF85DrJ1BDB7NAvOeYaLekdRMcoge3xTKoT7ARBowqbTkkdFw4QwI6NiD"
+    "n3spd7YpJHTD39uPimh6YB7IfvHxORU9CxTTzHDTPZcA0+P6ENI42VkPbGUFCH+2Ljg881NAsEXH"
+    "uVumDq99JzFpFOjqJIAD430nds4CNnA63g6ZsCs/rupUw64qJDMnG+RISsApBU+btkxYnhcEnJ8i"
+    "7SwmLcj4cvaS/3mKyY0HeDJ/sV69KpAggv7B4byRoxdTzZghGne9qthDq55He7nAuT0FTUkCwi3Y"
+    "Ed2G6i6beOByr201/05L8N0uP8jXNYsWI1WSfUWCu9PA1zQ0++NDY4ur9uTddg6imYbx08dPiPP3"
+    "HHHf/XZz75iSdWVmZny2Lbtwi0CLQI/DwRaAXdzxO9ptsisIMjsKlLLLc2JpOXXnrppj/88z//vb"
+    "ePn/z96cquj02ms5XKvwgPCZovT5xN/HTHoinPcVpF0uO+9rVKV0kgdGikdSSAlhTRfPTFq6QPWS"
+    "dQ7NU6jMSvNM4yOKi2PanMxFus9xcWNhr4g8lxiVX5ZXw7gXHAax8dq4nU0d2PudO1v7kyONR3Sr"
+    "sNr/cbOfQwGHNJo5qz4yJWFS/YQG7gvsaZnNogfPRpYKoJJ3sx9EAb9vCcIafN4cQq5jLW2evVUA"
+    "7/BBTHUmOTah42543nl/YMliwKDZSwThseS2LGeFjQIVNYYpnvS+iEzRcOwffW8yNu9s3zDD8t5A"
+    "1Wc27uQQwMerSA7Gn2J+3AB6GKAfztCjXNa6wvNyIuiSoYZAAdrtLhv+edq2XgutV8uqHk6OdxYQ"
+    "8W3jkm2mPfLfcuZtCC7GmoeFG34mxy2ulFwh/mFXwQpYxdEThaARU0eIaAKH750tmQErQ+FiE4tG"
+    "dg+9XrYzUBo1tbbGRlij9De/gcdvDRXqYWvqcfUDDOPOy4MJKHimctOv9i+XJZHRefgzqXXNStre"
+    "m7rvHx2fKer993883/6Xe+/IWvr+yendCF5huBC3ZrLQItAi0CP3sEWkH3s8esabQI7OgIRFq3tb"
+    "B+cWvhse899sCffuuR3z+3vvYvFhaXjs6msymJIbcj6YkS3pP/jNVXxrgwVjJFgVaNfpdIIkeWRS"
+    "NZAsefzKFErkTPImzU0HEC5oSqxj0vesLVL0lYyItqG8VNu6Rk5YNZ+BCiIZnyiQWoNbXJXicQxU"
+    "74XMmf4O1HCoWuBpDZhu00aGBsB3c7vhU6/XjASSp0vpCgBm5MAhMiEC9ltdhK6GCXrFEZ5GoQKw"
+    "4aEmMf1zBtvqkJUngxB4PFvEhqkU73OnXTMjEOc7KDrYpDzj15OBGoIAAmOfb6tQ5kNcfLc0vp9M"
+    "88S5R2yCLvc8LioRM0VqfwJZRqBanXtmF5kf5KtfpRSEovfUuzGfP0S0T7ihg2rE+/YoKcGB0v9J"
+    "iz7YSKRiFQ8xY5KBkvuDSjJVZQtJUt5jWcf2e/dCwcKN38HJekqe82tFdBg1f98KCbH/7yifMlII"
+    "Zb6FFUiqq+ZdVNaxatuTHw/LyvXlKHCpCyVdEZQyHp1zEsAekx3771MhGj5OjfMLD8BUNedinH7Z"
+    "BXgNXn7wYkXm3AS8slfH40nT1x+03X/cE/+8Jv/tHhIwdfmY0m6z5wvcHWaxFoEWgR+Kkj0Aq6nz"
+    "pUTbBFoEWACFDQvf32iT3ffuQ79z/5wx/9b2tb4y9szaaHSVi4T46XhLNyMBnpSXD6JZNhxYvXEJ"
+    "A4VsJI35dZaq9MCuiukQixakKyCptsqy7rgpaPP4xvvxkqqXIyNoAxjWSKAtIJF8kjsnFpZ5egi6"
+    "bfbNGLJLMHwz1ocG2nV9iuB188yxUHGOmWXqeamE4as49iFQPMl58uqexilFgBS3ilZBO5Cfuxja"
+    "QZEcYVy0hcgxdzzXmFoOca3cFMMIR/aQuMwDGyj0+NE2b7Tnr9XAKrBGqe6Nf5UVjwaDHGCVrQos"
+    "82naOLj1BUtHYhs6/B47yDAS9W+XROcGz1ifsjywZgiKZPg8IUXWPYksVkNo5V+W+/ZSqKEnX02z"
+    "XpB0TEkFN02IwPwa6EfYoGO42v+sF3X+Y3VBz4Q6xr4c6XJnZLU8AALBRCISH7bErxelBWoIBldr"
+    "SanyeU04IDZuCaY2n+9jztnFAgJF+0XCxLXEAw4KECx1AE5gt2kvsdUQi6XUwb5R9D6L2UNEWzj9"
+    "DFTBVD8vRdPaZSdB2M9GE4J/r1ZVQcC6nhmz6cN/zEfGoC/DPF/HnqZbyIPHynv7GwvrG2sWtp8Y"
+    "WDBw/8hy9/9vN/cPftNz2vfw/bfXURpLZtEWgR+Bkj0Aq6nzFgTbxFYKdFgETKKzParK7NJydOHD"
+    "/yn//s4Yd+8Nxz/9Nsz95fny0tHyAD8sNPKEKUxPkiSSU6Gjo3Mi+TH9KdSvRIkPr0R/SUcWqkyi"
+    "jeaWYPyJ26hLESqXrYgou3PDDgOfnKy9Ygo+tkXXNwoRlgTsJI+KKFnZJPonckvXB9KWYvJk3p6t"
+    "dJ4qU40EUjBjRk6KJjeQ3cB9mY4YlTQyfZ2OMdZEoTiYtR2GQa62wUqjSkHwVgQnWyYXfIRz90MB"
+    "qtkuAPHJdY74DFYs6gJUO7Ic3zYM7E+pLmojXJLigqSIkGTodlfdAGTYMhBVnDpa2hfmkRAxqmih"
+    "+08LFiUHZDup9THCPNt2zkOYEn72tJCjt5/KSHavlRdtjjO38TVYR6LqIBM+yjjBzNLwJ3L47BMB"
+    "7o2AXJG1+T5qc89d8N/iCXDnn+Gnf2sOW5xvnqS1A1594v+MNmAAAgAElEQVSr9E4KnT1x8bEmWv"
+    "Z6nQFfXfDrixX/DZe/ouOXfU8/gab1mANfzQi71rEccY059/4J03MQB6I+nn/u6/2U4T88vppCDG"
+    "F3vLOOemGBLwZCCjEXdXYS0JgjBSmXqPOCeuxzDvJnva4X1umShhdX9qz88efvu/8PP/3g/Y8tLi"
+    "1dtJG2aRFoEWgR+Bki0Aq6nyFYTbRFYCdHYH1jPnv7J6/f8J/+7OF/8cprr//bxX377h5NxrtJWi"
+    "jYKHZIkshlePUAq296qCUZjX7FoOthjEng3JTsePUtkx+KONKo7aVeJEapoERL48jMTSp8W5AR7N"
+    "h0KKDsHokY+Oz5oJeswEx5cdW7hGeIQBYnjEgKX1jhsYbIXpEBVARoXhHSflPF5EhFaiB06pYBpG"
+    "IQtgHWp4TVDZMiJM0mbINNCNdcEKfVHEuJMc0PRAnLMS5QjXods7wpvaLYhYAK6NQrXWbpeQxk+p"
+    "mnu4AJqCvuUtaFQ/rJvHJqEo2JF8u+lH43l7QLsxNMPdO08bAci/nC+tsac3r//GOFzDpACbObs4"
+    "bb5HMCcbwkrE7xw7O0XHbE93HsXYzZDXDQ8JAol5x9CCz7LJ5jBh7yZmkbv7ZhnxOAosTnqo2Hgc"
+    "IekLDYzRVc/oZCTsAIMkgF+6Gx/87Sh/IFXujGHvf40gXVokMrSPe1cew6/O33sCKD/aGPpnlTce"
+    "hjALn8ccfVGFQQBrxL+pZAQM2+at/PJ/qEwZgIqc+Kqm3JRsWFl5HrXY/rk60tva9u+Zufvvfuf/"
+    "9PPvfpbyzt2vUeaq21CLQItAj8tBFoBd1PG6km1yKwYyOwuXBxdT596aUXb/3jr33zv3vn5Ol/s7"
+    "W8eKMe3LDEWlxXzGV95qRQBd1YSQwplB+Ioth5ZcFZDklQ8EiGaOyjpwKoCj14yKdsJGkaZkFm+d"
+    "S3XAB1WJX4eS+ecQfJHuK0gsiRdrKpX7e0beeSFqle+FxC+BL2gjLUZwI1FYCZaWEg7XH65XEJa2"
+    "9ciIQBX9gwzLFdYtBLmj/cOOG0YFDxM3AGxKGC+uVjxS4wQq+jDWyGBzkvw/YJMY6XDmaYAXgUEO"
+    "WL+dILv5DqG6skoVW0PnqlR4AqJiEVcXLgROjt40vgZSgt3vHlQ4ee/eINY0B86nJNAErGYJdsYk"
+    "UoY1ey6Wx5iYrDxjY6RqnuUM4M5BH1XDTQZJCx7yjFQJ33x/R9vko2jreEAR207TENRtFCNIwRS2"
+    "smE/OxajUAu7Rbfore2ff8uyNgDWOnWzWtoiEJLY4HQiGIG/VFSoCIw8ocimqF4/kWmOho9zzGgR"
+    "daiV4BQD7Y6lXjbwB6aUIPbb7oYWW0/n3zZZrISWFTl2Bqc255cfLYLTdc/7//i9/+8lcPHtz/tp"
+    "TbJZiEsLUWgRaBvzMCraD7O0PUBFoEdnYE1tfno+8+/sQd33zk0d8/fe78/7i1uHidUmItyLEqp4"
+    "+LN1bUlLp4lU4rYBqQxnDf3ET3rJF41r1rlYQR1UpuyKmczCu56fgiDpMyJ0+dXBYlksEOySP7Yc"
+    "LGsBpJVmGBT994KYD98BjJbHRN3+4b8waj9MNvCRszVgw6xR6iUL0fQOc47eYOu2Fa81On5t4py3"
+    "40EkjmHtLEOYoixiEzjGuhFg/cD5x7og+T/7CAPLEDWxSbwYMw59U1riVLf2oHO93pOtYJ4xxAsQ"
+    "fzQFi/MRdxOgMyCCsIATvohz8ip18WwGLJ4DuJvVqZ7nhDOWxYCtslH/PGJ37wl2a+5WNsYm2ka3"
+    "5vrDjdHn7Ms2zCMqAtMBXmgxvIxrkbOlisgpEJWRb5S1r4ADGB1EN3mzwsr5D18/z/2Xuzb8uu6s"
+    "zz9hFShCTAxrTGJDYYg50J2C4wdmGDTWdswNiZJp3GTjLTznypPybHqId6qDHqpXJUZboGJKYTQg"
+    "iE6CxaAwaERSsaCwESqI+Ie6O+3/fNufY6N6R8TEK6e9179lprzm9+c6659zln7rNPg4UT1euIwN"
+    "tlU7EYAxxWsavvt3YSvP05xiV3C0dGc15b1/nxGiRs+mkpyfG0onld8zp7nzVUYbkRc/N3Px4vOn"
+    "YhOxaMyrTsFLkDA5PHo+ZJwFlzZH6kzFtN+/6q+8y5cw+QrwunDvY+/oTH//R/+5evftXbn/TUJ3"
+    "1Taznf8TrYdbNmYM3AmoGHyMB6QvcQSVlFawbWDKgqUWXy47vu37v+wx94wac+/+X/qK9ge83F3d"
+    "0n8FZKnbnlZI4iRvUJV+MogLqocUGlk7tdyTiRywld3kQJBrO0DNhGzqhKpebzlI10+Qfs+OKvCk"
+    "RB+oSi4wDHH5wto6hD5uJuuOqYgpVBFWqMcIc/D8yGjCkFWhd+yHxVQtDjbxdF1800msA5x1BhSt"
+    "OIWNRSZVDzQqT4bkwpZTqsCZmJmzxpjM/m6x6LXl/nBl9dkNKbHQO1kTuNG4PGvjTwGKBaWwTn1d"
+    "q+QZEI6DgdoMdDDknF7ThCmDxnQaVXp7lFOu76pM1+yyYBBget16w18XXy3heOoRzS0YaMIfzLcU"
+    "Qe+m10rNS+sJE/jwmm25Lslrhvm4FsG2JuoeM36fDvdUY0ARdqYiW+4639IYf+UkRZeF8L0TGAn9"
+    "ZeqEs6hw9pYfsqXR9fdtiOTd8ObGS+jtHxHwsQnV9Q4cqkYhz7pFYy4OgIxgFtLMM+sjvady2DqQ"
+    "hsoo1jLlV3HVvmAjfeghCw7eMP8eJFxwsfRr6YL2Uidl+Z6xh1Mn3IT8HopG778MKtP/fUp7zlNS"
+    "972f/zsz/3pC/rRbFzdrFu1gysGVgz8DAZWE/oHiYxq3jNwEnPwIP3HV75gZtufMnbb/jQX51+zN"
+    "mX7p46/dguqCiqKIo4geLkThfp/Btz6CmEuOUETyc39RZJeqGHrmowz131SNm88KQ8woKiqE+c8B"
+    "cO+yo+F1H4NtrCZVyYVtGnWBMrfhwz6yFu+dLcThzBYoXY/IDcsM2J7EC1zhyRwkv88UOZKnsocF"
+    "MtPpe4LE4wHoZuLjJD0G5mt/hCmzVuOuoYym1xZ70g3TQwbsyHhmLTYQ9JOwarYByPlOx7xsTihi"
+    "4jx0aivWbJ8+PQpWwLg9mUJzpNO08tjsPYoht6RMRGEOptXpzBLWoTQ08sIG1mcIh7i/+xiuBROc"
+    "+la//2V3bxHT62zLs1fvDCQxy6r+BtuOu1RBpzcMir2U7z5mw5vWWCJhPQJp7uHNQk6pj7vjty2a"
+    "T48ZXOJQZ8QIGPEW6FZz4H0gTp4zJWVvcVq+Ia/jWHlOOv37qNle29rvD5fClEFnRESyIL5wUfl0"
+    "ZnqYjNjd9qjDp/aCskSxtDv1gQGPsj33KJjhPci7wYhkpAcuj9Jt2hcIea89bMwwcfvLB7sPeNJz"
+    "/+8W951f/64v/6i7/0zH+Q8QPko0KHbm1rBtYMrBkYGVhP6EYq1sGagTUDZOCiXiW+43t3X3PdTT"
+    "f+1ue+eMt/2to/9Tvbpw7OUnxQQFJU+NseVZRkvCcrFVr6fSX0XMHrq1boBaP8ce+3ZGrkgt8ytN"
+    "Q9QVEA5WQAi65dFoxh2hi9VFRjDs+wAyxMuBMDSs/LHYbF5jh6Yx74zYyU+OFGRoOgtx5m7gBx2z"
+    "hhHFPm9uWwim+KLyxlV7EvzM0pBmLWpr9AYsZsjM2BhKIRGzjSz7iO1XlphcOoWGqty9obtPSdDW"
+    "MwqzWCQNdMzC+dxNq6sUnM8M3ajj8uUixj0vvLa9FCfbJhxxuevV96nePLa+xz4eqIya+PY/GYt6"
+    "h6je6xTTBm6Q0nHk64BPNxA0+vx3Sat3n3g8Nrr2NOysb3WsH1WshLJ9Y+2NnVksPMe2y49SEenM"
+    "NMg5HsBW0TcQPDj/My+VoWUzaFJRfGTlRZeYIc/jMd28iZxtAcmjUeKe4d0bFc2iqJsW9swIKWgE"
+    "GxhiPcHaf0ARsXsPadZB0DPS9GAINuXo99NL90faXSn5vbTf78dZg6TvIW7sSiL0iRqd7SLfn5Bx"
+    "+4sLu3941rzl71rt978Qv/y/Of/8ufO9jbvW8JaB2tGVgzsGZgycB6QrfkYh2tGTjxGdCryTvf+/"
+    "5dj3/79e9/xT9+5Rv/ZvvU/m9e3Nk9S0HCt0Nu7+mbK3mFWeULxU2/YkxBswNGeopgihSaC+LCcm"
+    "0HW1qKoHBUeeMaiLELIwqvrpQk80le8QAMS4ogn2jqJW/XakU+xpK2L4Xoyou4uy1jay1mLQ3pAm"
+    "7EZYTsBSBSbzGo1nim40qC9H4raOHIDScT3RIDxfHid1k7RBWvAKFI3jbwhi3rothEz4n3XIDis9"
+    "fcfbDhRK9lCeTRMj7ubCy5Bxi0YXrvR2iIRV0oa/9KMK8bGHOQLpSdXfJrc8mO5ytyAMGbgY0a3k"
+    "pvRo2V717vrDOwNiwxLTEwHjbSZRUVJ1dW+JPRiNF4bcASr4+RWi86/TWHprYFh7zn2NRk+MaH5R"
+    "WgfTpXQk4xY0e840TVgQVSrPbZOMcy7JHG3qJOBvH0WHp0cNmP5OViKIYfYdyKP8ta9j2+vW4Z8N"
+    "gCn/cRjAaXbPLtODoe8GUXP4VnIjlu+/cg/cKH5h2rfZF3PxYJax/l376zHKi8njJMKFnQnAdw0d"
+    "Hjm1j0CMlYN/zB5JiQaZp9nn0VRiTbW3rDpRJCbPo2lPPndLtwQe9Yv/3i1v6Nr/rNF/2fv/1bv3"
+    "Hzwf72vfhc25qBNQNrBuYM8NL62tYMrBlYM+CLbF//+nef+Jbrrn/DP33/jjfvnDr13O29vVMUGl"
+    "xn29P7Krf16jIVCZ2LEgoWzY8095ejqJDhh8UlVsvbh1zQoK8cey6AT/okdxPeJQ1z8bnoqUIoNZ"
+    "a1hra9fYDXrQunLtIMnDZt40qp5eUb/os4dMklP5azgKwDW/7syJgQmDNDm/ac3ids00kE8RV9GB"
+    "Z3ZnC6JIvXJlWfYOzdOsfmTU7WgOhm/qlPLCkom7TjyxUBe6z9JENaOw995tEkDptQruKzQIoP3z"
+    "4xcZ4wkMyoMh5yzYXF0m/VzdRL9L4EvgyC6/W7QMYwGJ8EaJIo4s9j6zv0rDHyIOMiBTdjWlxWXP"
+    "LXJxhRwtWJsSRX/zJU7BzV6MueiHgvHUe7hr1fcOJDrO2wEMwrmPNT+jDWhM7grKFX4r4m9i4Msb"
+    "sVJ7E3PvKoy7Nj8oslsotPbYuikaOHs+IAAq97yT1Sn6v4iw5b1MEnlrxpNzJ8o3fKGLg9TAAmks"
+    "42jS0TdT4O1Q+NTrqNRdY2rNM3qwYaG/+AesVgDq9VilppVGE3vsIENpoU7FPrtWq/k8Ez/OUREP"
+    "85fiXjsVLGfRTt6AKdkyHhzu7e1v72zp4eS56ydeHC79/0qc9crd+x+88vedGv/92VZ07dHZ9YJ6"
+    "bM1+2agTUDJzUD6wndSd3z67rXDGxmYPc737n9qW+79p2v/8o3b/+rM4+75pnbu3sHvLq9y1uEqB"
+    "l048SOk7eccUlUhdI+n+1ArFe+9R0TuTKHjrdnupfRKHw08FQF3lzlmgHODFzkaTgwJTcNFDXXzy"
+    "fYwG9z06iL6D6psbNQetsnNq6DxLNRkIXJ62JoHRh/4EWC8hlFnbg4IKlUnLFG/M8+Ut5Ntk6EsO"
+    "JsuvkkC79utUAw5aIVFQfMKVBRZB1BOwcY4Ya4qiFP6V54jMB0Mq0PGHbE9l1c8SE9lGCtXOybu9"
+    "zBMPwhm7kcVTtQLjh24EsoS24N0XGyDcbEicsTKdF790g5r7uIIgupA/BaWRdX2ewPjvjDg/Vw4c"
+    "vEXmwEDrp0jgVU7FvqnBCT7cVbSaJPGPiyWUwShAzEI3FwhSkOuodr5nIYuZLNouzTa6o4ZFyRmi"
+    "aZtKVefMiaszT5zSDuKvYKfCOE5Ckc9lLYxM8jhbzAxbqmmJzrwvbVM7No08cqaq8hGRk58ZUvVg"
+    "KW9anXjvTaCM4xaebdhkANmZdUPiOzCidlI1ycYiC8LPSfE2RhCj46Y3BO6z6Pjz3zt/uis4AXCn"
+    "I1Fi4eE82Nf90/7U/7gYfRi3qAtUw6fV2P0MLuXHzMPffe81sf/sTfH507d//ZV770d248OL13l5"
+    "DtjkDWtmZgzcAJzsD6lssTvPPXpa8ZcAYOt/Y//fkvPP0dN9z0x9+/684/Pbjyyufs7u8f9A9w0/"
+    "NKM4URb7GkfNqujwjxeTkXTKo7KEr6LX4ugFz0uD6yjkKJQkaTFDnVY58CM4WOizaKq1RCJogPs7"
+    "oQhwMZkOoWTlkaaUUAsRSEAkrySeUUwIPHuYUjEtbmpo7QzCOBY1DveZ3QgUOOjFvH2hz4ga3X7H"
+    "ELrVu0Qyc5FrQNnyxkavYndosFH3FNGOLAt7GhTECNsSx5MlHN6TbjaYOH73uNhO6reFSsah2Dly"
+    "RSTsbtpqi8xhL0vur1k1Ja5Kwj8+gd4QaXtQXy7qiURVTG6npfDTZUNogkuS0tug0eoMvbJ4nFzI"
+    "VLrjVZFrM5titbhFfDmiUG3LYtvbUJYLyQAcSwCgxUrxu8/vvYkWo0/LSFffbG/oDZcOB7gA38gQ"
+    "cTmfimFxGMB2eg2bC0eLnC6enA1Cxdbfs+xbSPD7wTw0b8AKCvYHrN5d74BhhiaEZ95cy5hofWgW"
+    "c2tou4mXO/W+SJ05zK5chVUfac+Lj5qr6oiIQ5q+IzdebT5sL587qIuP1DPfR+5Fef8+z/+zUvf9"
+    "kNV509/QPoRlDrYM3AmoETm4H1Ct2J3fXrwtcM6JvVHjw8+PxX/vHZ73j/jW++854HXrt/5szP7u"
+    "3v7zs3Kir8liH1FDguMlRY8No77xHi5Ky/9MR4Kg+9JO/P1bkKkZTqhGZ7Kg/KFP31yQ/1PUUMeg"
+    "Nrw4SrMsalaEOTt2lW/eKOTdmKw2RINCYE+odqtjLGJPY9kE3TPQSMaw4lHlmLVfDwV1c6kLlYUw"
+    "DtH53tbaGNbByj5C74pgJ48MITaFkRQBq2SwwVGC4ITi1rT5yxyLZt6B1PURJvnDk0DdEbZTFxeO"
+    "A4PTMhdvbZIvjgMjnbcqALCdvbuZJqw960mrej2S7+rS5dxO0g1F6HTqBoLDmYQZYrQiiLk6GjmS"
+    "9oAO/LURpX6iTj3xmw2r6YG8BxVSef4u7j0XlwzuDElayk94sfHMeaTysYzlreeaQnZOQOT5PGiD"
+    "UtAI+9Yl/WSbwN6T5X38TnE+mNCBKmgOZoA/cLLnEtmEWjZdbEcYrFPIo7d1kpWTP3iT62y9F89Y"
+    "xkYZljnjyx/hB73R4Wpv3BS17w2EEMjooVX+BYj/oFxxR7LzR6DfHvx7PmASBcx/ZQ+wAXiRuumr"
+    "Gvh7xO0kqNfDRN5jiQ5+qjvhGT+OoFs62dPX17cHKye3S0rZM6fdPw0Us/9rkvXH3ucGvn9a9++f"
+    "VXn9n//uBdB2sG1gyc2AysJ3QndtevCz/pGbh4fuv0Z7/wpV/8r++87j8d7m792f6VB2f1m3H64w"
+    "P9OnlSIUYxRiFC8ZFRSheqNorE6FTYdOG2UbWA1Z9saWD4nF3PbYxCahDUWC5yqrii1rZPChyKaA"
+    "Xltz5ioxbacOeqHl8mALaqtagKG3n7bpU54tg487JxEUq5Fi768dZP4+VfAVquKB/qLZP21Wto9n"
+    "asuU/y4LWvACgq7bHWMMGLgXw22dKTJ3LjHs5WCczYuYO5Feqjic7i2tdeHv51yylTk6X3uhKkBC"
+    "F03uG3HBmD6OiUIcetzwB5Hxmh48FCfDnOBY9vrJxfiTNlEGk5MpeL+zJF60ZXvGEqC0/gYWC37j"
+    "0tYO9zU+Ug1FCx2ES59Q4QSvPGjvWb1JTJgLCOzwwOijtWySomxxFc8iAB5ORk2CN6CBmuEpjxyc"
+    "Wyz/uKObBuiV+ztvOQxeGPjrxb6McAj5mWLCBNvJysqe2AWGFxLP3YwDwa82c2bYEWpogrPCn4H/"
+    "YZZIXYjJEzPDFuDhunNccVa8y+hJEXVZDTYGx/lnY+ok4ivOAODJ5YFnk9NhBeBd621fcqes2OSU"
+    "I+x+f7Cj/sSSTqtnls5aUBHTf7Bwc7R0eHZy8+eO7Fn//KV7a3r93ef83LXnLt4x575o5jLtbpmo"
+    "E1AycsA+sJ3Qnb4ety1wxUBk7dcus/Puet733Pv7v7/gdfd/axV1+l8kF1g0oYvZ+SQoRbCkIVGt"
+    "QXKvi5oEbJAZQ/rkDs+NXkUaKgBWS9ewRl76IUPYWK+LoADV/hhAe+6IRVheUTH+zkmwbGYw1G4T"
+    "UVqUGBnPwwHS0FXUo52Giy8to2+Vvl+AX1iRfQrvyw7LgUQ49tVzr8OHclBLN4rTVJAA3IRAB4Ho"
+    "uljLoPPtzDR+jsyevT3Dk0l8Wmt84+2bOIlog6igQkOSeeVjdGBvCWpbua+0tmorAYUN5SFg9mYP"
+    "2VK0O1Ye51CcDVGvIcXpT6p8JVzr0fpGh7MHm7nJkxdlxwdZaRWAsFBvSijQfiSg69X6SLa5Ag6L"
+    "ktrfdl8Ju6BQWPkITvhS19MFlvYogk2GIQLfY0R0F+WuWBAZAuN+kbA7S/iRaG5DdatsmJ1l0+wE"
+    "fqrjaJkQCy1ogdle0cWYUgVvaRGlui9VVMjY1HoRaexsGfMXTcOH66j18ZCeLVq+9486JKbOAdPD"
+    "Iy1sLehNyHkLS9//xlKAUZNqVtf3butQrIQhQvMYwYCQ4FOo8TE8sKht6GxiXOiqEAToHG/u4UPk"
+    "cHD/8268di/Gxt6U0U+4f33fOrn//SrQfbR+e2/uhVr3zPmatOc1IXgFHrZs3AmoGTlIH1M3QnaW"
+    "+va10zoAzoZ+ZO3/yZz/zK29970188cOHc63ZOHTx5V783wJU5ChV9C4p/KJxCxwV1FRwUZnt1VY"
+    "7insqBa3QuvCk/KHLIMEWJb13EqEcjmT9nhC5IROaJnuAg1azLEsxsC7FaV0iZmYUrhf7Kc5GNt5"
+    "hBrIZtF2ldBJZp9PjnFfDCtxDrLuboHcNk6JNRrjCpDdviIqj2S4++C03naPY1cWa4cLZNQ2YePC"
+    "ytbFqW4K127OXvEr7CN6b1zWxWNi1YHGY0A4Rpe+9DEG2X8Dx3XrwPpZ/tk23zbpjV/s7nxOoYa4"
+    "AcZN/YrDaREQuwcbiwD7y/Egz64X4297gDjn0F6vURP40vuLikyex4LgkAtnnfLXmqGNAXmeMmVu"
+    "bLBoIKJuvzwoZN1GDa3ip86+a3W9YYecfiuDRvm+4TjZ2bhrnX5Vn5L427QVTrZzW1oIUzfsDjv+"
+    "06AzOu4wOjsN1sorFdVSpgiX3xGVkGMTPBhsQErTRBTpgQlTMfo4YIrH/i8ReaqM/+b8YpFy0yTU"
+    "/yuLKsIXH2Z+rgdvzi5djkxM0nlywWna5m0+elFoj1mbp6p8K2+gsXLiieo/subO1++Zf+2TP+jz"
+    "e8+uVvf8xjz9wuJN+VubY1A2sGTlgG1hO6E7bD1+We7AzoM3OnPn3LF5/zjus+8O/veeD8a3dP7f"
+    "tkzqWGNjt7vDWO35JTJaG5RlQ0+VkCCXi132/FlJoihxM+fqbA4FEQpQhyYaaKJFdZhNF/3haYt9"
+    "/ZimIGOybq8HVJ2SQZzTggjskSm8VPKJCmpdhCx0kntvwxp3nL2HIkpXMMzNUqngyACgOXzFLYgV"
+    "k4MfEVS/EaJx2t1zdsylfUsS8oaNu0Xcc7hBpsyAQfYdpoQmapiVsxjfgNacNpLeAViPm0ApidNw"
+    "nmt4WCYT91Cy+z5Py4PkxoF8xGfuTHuWlK03NyzklTfPUJXa3WcmlGW3KLKHFHmZgcgw3YVJwBCA"
+    "6+J/TLPIeIlDErXMBed+WVMc3r8ggb8SCbchWVpArIRbwF2gibK4w2iL9pOOLXwGObiJ8XI3zlNP"
+    "5HHMd8El6L5rhFM1rLEcDG/Ra7cTIDQa8JTFwmoDaybfYnqx/7haBp2JimjSceVA5yyX8MWg6BWp"
+    "kmu9Ad259BKT75t984d27aLTE0rkZ+caq5UGKmnvs0DX1a5g0JEI324XjRQFEVvPPkeMuIt4ijD1"
+    "6WkvtKHMLQi0/r4suCJNq+qBet/IcR52vydahvFNZJ3eHhhaOjnb2bn/MLz/y//uQ1r7z2MVef+r"
+    "YA60mdkrC2NQMnKQPjxZ+TtOh1rWsGTmIGDs9vbX3+li///FvfecOb7r9w+Nr9K7gyx4U5FQl6JP"
+    "CPgnOVzidzOXmjWJJWxZ3EKjZGwaWComUUHjR0/pIUihILsMsJoasXMPzBpTEFlossZqlmokdX2O"
+    "jbLrwUsB1L4jFZcXUcFWs7w2fHVfz2IlkgC6fUaYTVV2IUkO0l84Omq7RReZkDI7F463H5nP12CD"
+    "YvPVjMHEc2FvitcsUHh29Jegyko8jDoxNGz8QCJmrEXQL3ww8FJRIEgXprmUaWBex8lwjxvB5sPH"
+    "fc7O/YQGD+mseGE4Qu8pM75lknTAq3CmLv9zizPAVwcbsrfmnHGiRP0buko9c27Sm8hNPbbAhzaX"
+    "AvM49qflw+jk8r2B/KAfuIVh2YjVu0BnSO6MmdP5dKL1vy7uNEpO4r7mGOs/IRA4ywTZ9VNloz5G"
+    "7H+rLpWAypmBk32vJpM+hmRwIvb7HUhH8Bx/rZQwMPc9bajxtLPrGLLZjg0hPCoJAu41o3SnN2Hj"
+    "JvGVS9Tk7QuPHXvY8fBchJrGMBH0bbwYbEa6gcjccImJyU7oP11jx2DkqiHBPoaJgt8UggblA+Bj"
+    "RSRIm75bDIaGd/b2vv4NTOztHhr9zyjW/+xdvec/3v33nnvU+UqR+m1K9tzcCagROSgfUzdCdkR6"
+    "/LXDNw2223/cJ/v/66/3j3fff/8ZnHXPVkygiKlkO9B9NFtSsI1RK8/Ufp4lVhqgoXDioefM5FaS"
+    "H9HidVqhmMFNiv5pNiihz9pbCpnEs/CpLCqFIpZQoT4sCGG1cqZGBIF4eJKLFIRVhujFNdKQZORq"
+    "u5GIMTNbIyclyOsc3qCmIBsetYeu2Yb6zHc+z94UHUDsE+PSt3FWR8lmJEzhrilOViQbRafkmDZ5"
+    "4FZK66TlOuXNHioCwdg/GLyqh547VhV+9pdV7l30nNYoYAACAASURBVLE4DmgXXlNp3jnpNRoBTj"
+    "adhz5uEhZkfPmHA07+MLIPciw3HEM6qHIS17qC9KLZHzpWcpKkDPkgxN5EjtVjpsSj/7ztliLYU/"
+    "WsDof48Iqj4xj0CTtaoWrdROD4hB9+ZDrYBs5Cc2FQ6bANXJdwlMA4heNICFINfGyGIAptE3FNm0"
+    "NTjoK+f6D1GhjQHA8LpsGpeLjao9E46a6TFqeFoNSgZyGZ1VZ5gptcRMO4/JUdto6/cCGQvYCcHL"
+    "W+iOPH0bTfYPI4En748JK+96upFr6eEo98OUa7ZZMc8W2j5iF6cXqf1nHkEKz1sr0+sWzw2z9ctY"
+    "64DAZqjmNa7HIc9Cy+sS3OkYDkq6e2NyQ5nk/mOUx93Gv/xVUdr3q8g39bX6Cyt7d/5vyD97zgi7"
+    "d+7WBXn4F+w6tf8Vb9+Dhvv1zbmoE1AyckAy7oTsha12WuGTiZGdD5mq7M/cJ/v+4Df/2je+7+c3"
+    "1m7gl7e3sqbvSbcipS9M2W+vZJih2lpws0FRf6hTm9nVJFA7fOnAa7wswyCqScTKUYAUpxQyEUyj"
+    "rxg76KH/PJBzUMRSn9cE2RokmfoLkAs76ioDgqbok3mouvkoAG6lamkUVorASJskowqRz7smLH4u"
+    "nM1eOi39C3S8XYsTeMvteJZwdYsaEDDzUixzXpIpXei0rUnWdsMWRNYcjccg+TU5NrTgwbS2inGG"
+    "jcHHgZWBssVvPa2rx7jq1QVbyl8HKIsXYM8fLWyqym/A4saCa0HpetiSSWuk8o57h9YiAfnCY4R8"
+    "ItDNjoJt/OVsUSLvKEv7SoEkPHvOgiZ+5R8xRgxs/j5h8nwE14rG+b7q3GhwhYX96imWBZIzjPcH"
+    "AsFmzRd8S9X+HISRQAo9i4MW1cx9D2E5ExznG8E0kxiNIvDhGX/girOBeElzOFK03+az/UWmTM2r"
+    "BLLBugeB7LBkWLYI4n8tKBKBuOoX684XjEh0+WcdrNLtmIUR22FWQj0qOsaD0c2pYPwYZ9m2V9Oc"
+    "7tR98MTPNbkJXPfowjq2D5XB0ndvpJA8J58PDizuef9+xn/ec3vPr33nPllaf4SYOcLZtl3awZWD"
+    "PwaM3AeoXu0bpn13WtGVAGji4c7X31W9/6uXe9/4P/+sf33vfHu6dPP8GFi2sLXtnVb4NxQudXn3"
+    "UCV+/UOUKsorw+SiemFBIUfykoIEjj6slcEKHnFHAgVPikHEtBhsIndvRQWJ9CDRz2o2hRocKYwi"
+    "WFjuDoy7cmLrAa32L35tGIQAyr0q7s28Zxth8t2DEMD9YODgWRMXqCKDVDYkk4CBMzYtrwhX3p+D"
+    "IZt4gGL1zwXNoCHDpNnQsJfJXroWxK1hkDTxbK81hCczq8cuyYBWxsxLH3uI008XGi+aS1l7iX1H"
+    "nFShLiLiT71LEBRA5njYmSIcmgVy2rZmMGbglhOXn0iwPi7BOVvkLilySKd6xIxzweapfYB3zJAc"
+    "7KQMPOGPH156QyrrfCCe3wElZth8OsS8TB4FOjWpeFQNX6GM9s2aLGnzNS2GQlsQ274vSXa2QhJs"
+    "Gvc0tvCRsxDK4o/O2kI0op9Q/3Ei8xEHtIOgbHVv6QjZXiwM7Lnycxb8wgk862dotPHoNk7iBB4x"
+    "QyWsamJz5EuuqGFJ3R2DLjalzg1s7jCtnAXNkNhG1sNYBHQNhHfM0nUC8xQbS9I+pJ9bI215iKt1"
+    "7MkKJ19iFI9pf8en0yJBn6P9J6Erd6jNR46YK3zB+ev3Bq++j8cz75xS/8u4OD00evfdXvXnd6f2"
+    "v9SQNnad2sGXh0Z2A9oXt07991dSc5A4dbu9/69vee9jdve8+f3HXffX+6c2r/Z3f0DZaclFEC6O"
+    "NzXG5zsUKx0CdzFBJchfPVOapo1wyUGWqpH1ztpIwKVziTbJBVZ/hEo8cIXWjJl6/g+LeWoAyHyT"
+    "Vk5mKmaiIXU7JFTtsolUZFFl2KIEBBmbk4QaBHNWKK2RAsXhZsPHaUHQU+MGazyLrQQkOzn4RS82"
+    "CH/8XUYDIUuyiW5SlzmrQd0fgr/AE7hIocs/ancViyNdSLZ5RmUw3bxAaatAX+HAMCbug6CCg07+"
+    "KZKaDYhtEnPxJgE03WYS2b4s1+iY1pxDpfOfJb1kJsNUPQsQhRYiVH8UVcbuqCYIb/iB2PiDzVJv"
+    "Ywc0FDfTvxkImwYx9k7riDtl/0NOSzrxKKMus3xghtQhVIENpKOMkZc0rRW+ejTR3TDDZVNorDMT"
+    "MjL8SXhbrz4mteEIDOEWJaThri2/4nfBCS1rqNT0Zb5XUkH4jEoxDYN73GNnUvdXvqfiGKvePqdR"
+    "i9IMg+dubOrtAEiYWj86m8xOCyTz1xbB1XWdlm3rTeYOxZEG24Sf7Qd6o6hF5rDMp/m1bwwy9zHi"
+    "sXYvHpxQtfb8Or+DmJlQEvaRwKt6fP1B0eHl2xe+7c//KpL33p4tVXnz3/0t/4tetOHeze1T7Xfs"
+    "3AmoFHZwbWE7pH535dV7VmYPvOu+5+4tuvf/frv3377f/2qsc97pkqDnb5HM0hJ2+6uSChaHAhka"
+    "scFAdofIXNl0RSeHFVr4sS9LR+Wx32pohYBVKufDBNsYOFbqpmPGJTlQ3FShdEudKHjSqW1sfM84"
+    "SpOOBRMMzNSWDg1fvte+pdBEnm0ryx3ePRcALJej04tlmK1IqRV/qriUotc7g2YhmYwi9mibuuhh"
+    "qGLpeeNNC6tF/MF0IT91qTbyviuoYu7DqPJYN7FNHIRigZeG0jLmfL/gH2b72xqLHk5pUNZk3Z/X"
+    "CAhuTQCeexO2S1p6XPiUV4TKaNzYZ58gAJ6yhKUeQYwq9bcXI4kzfaKNA1dgzaJhcANOZQb7CI/b"
+    "pCDn9pOTbiTyg1Aghn5prKZjk2rF5kDhSOBNPY+I9bX5mV2tGAt8/4AEeR3vb49uID83TEUbH1iS"
+    "82ww6QuROvFHZOxxrR4T9hRoemG3sqWMn49+OF8ByrMQp0jMOp6LFsmthO01lFrMkL+zR+RK4/jc"
+    "tGI3P0XcY2LQMz/As25ZKhVWD6Sjh2aqGu9dmBID6A0EXreACjj2jYIQzlprLSHVyrJOyMICJG+4"
+    "BTN6+Wd0Joyib3N/gTSa58o5TaJ3L5ZuFI2JpE27wAx4k+j+07+/tXHj5w34s/+JGPHp3Z3z3/4t"
+    "94wXvl5Z7kaLFeR2sG1gw8ejKwntA9evblupI1A84ARdc3b/vuNW+7/v2v/Oa3vvems495zD/b2d"
+    "X7KtWoI/yZuT2qB01UYKSW8URlgf4oQqgwJGLskzlNqZCiQxlMwdAiWmonbEWM3oqQuVDZeAuUCm"
+    "mjKhacymPZlS4kQzYGrtgIK3HZE4EXniLQBQzcaqjipksshLqVHkw3r18TXIRSNh4XOUAPs8YU0i"
+    "rCist+BzG2iTG4iQN8OWufDsjy6Nq2/YWDANLii3DkR/s+RSJrHCEa+JB2AqV0LK6yGSdyiKdwmX"
+    "ZOGLt14F68wA3wmgtjncaWCSObiBTA4NcKqoJF5HVYyUow5dgIuFfnNVoUuV53MC4GbDl+PbM/Qj"
+    "Ub/uEiCMcfH8fxfUCT4wEN3bSNb2wdl7HNB307zdjrlshWmoDsfTP61ksXXMWNV/G1LdrZHlexWP"
+    "w78GE3ySdopIsuNNo6vvjz+vGMUlBizT6CCLGt3HsdmUrRg+CA+aR1PtECYvebWIsqR8RirfOZcU"
+    "ccF5k1Q8ESa8gdW0UxddgljyO3MvZn1lh0vKpfjr82bv9AxtgjoqhIxOUTNFNpswB9bODZKuE4VP"
+    "0THQRfQEIA4cN42MrKeZFAUOe+/Siv29t7WzsXzp/Sj47+5rU33XT3/qmDH//a85/7sb3t3Xs79r"
+    "VfM7Bm4NGVgfWE7tG1P9fVnPQM6En++3f+6Mp3feADL/nmt77z5r0rz/zi7t7eKUoCnvS393WypA"
+    "rXxYE2PnVSIeA6gYKAv6pD/Lk4X84gqRQJKFJIMPeXBjB3YVbFDlfyKDQE5cqBX1SGXTxH+oMDGr"
+    "vQhqKkZXgZxa91SI41FzFF4HiKS7CudVgD/jdOKOED4RMeYsjNhaddYJ3YFkYUfEFCsPHQXkC5/D"
+    "JvQpETmiHyVlCuPOKvfc1rZgwOe/eOQViTwIeSrXqfZTESnzQjV/hUQ+p9wSv+uoWb/JrFTswoR4"
+    "5HuUA3YsNF7TGzEbP9SmGP6TrWBCFZL6AxErVZ+LXv9dtZzZI8EEl8LwpLwhetAFkHhInGQSZmDI"
+    "nfWLhi77xIR1gOpPZT1hnwUNmamdh5BUBGmQXX215iOFuKz/YemX1o6D0kPvvR3HvNiVtsPbKsUd"
+    "jVO+rUN7fz1Y6FH/PyvexnrBOPjwU78JIstqb8MR5eJeNxwN/iWAu1zseHmEJpZt+vHBvkUWR/cn"
+    "+PL2ewHAy8sL5yL2Kvq/XyF5fx02tp7rzYJDD4Y40jQmc/zgf30XypCd7lpB3nLurHKn/ZiXWl9s"
+    "IqLnF5SjzyE3cZCz32RYeQNSPX8ak8ceJPFtsCm4RQgYscfr/gIh/kwHM7A0PM2vd8QVC9AuE8WQ"
+    "w3QWmr2+I7ZkfwCkEeeXusfn6cV+22tvWWev1O3emdo6Pf+f+ufc+P9Rb6B37t+b/8ccHPQbe2NQ"
+    "NrBh5dGVhP6B5d+3NdzQnOAK/s3nHHXVf/t7e/83dvu/2Ov949fer5+qD8FdQBlCgUPLpSlw/Vq3"
+    "Df1c8ScNJDMXdIrUARIDBvQfO3X/rEgGpBAhcS7pxhygY43aHXwEVKFSsprqK2fdDQpGBx9aFxUY"
+    "CEhVgohLAZOs8hiNfwVaXWMqld1kBCI+SMMmi58PPn/RqC2nicFjaFU1gyBt0FlUYq4pCzFGuIBX"
+    "iIQPov2mytD6DE2MQ7OlaIlYs5U6VIxM9D2XIClwgJWzwC8ef8Ya+5+fDWcYJoI+Rq7a9moyO0FI"
+    "kYLHEOMkvxp4E6o6qYdhxhwoFP9OOnuUrJlOagQuTPiJFY56Z4xZ4Cv+DxhqFu2NG0Wg+Tr3zJR2"
+    "lqRxHXsm80lvnYv8QJC64rrv4SlD6xn3VmFjb7LHbMLm3yCOcxRXmTLyJK4/7nfanpiEvjTdtjsw"
+    "oWqblqrTCiam7mCJj7mBIrL7rYHKEG/sOmXPgYyOXuxEB85gyr1wAWXnCjcWyGBP4cqRgHa58ZJh"
+    "Z8Bx47j2HAJlydFzmzjD5v1YaUG2GExCnQsOfdY9p8A2+T2COjdR79eGEbb6IMImPbJvakPbheO7"
+    "4Cl4QDmBNAmuOsmB0UMkLj2DWpBBn3vko/Vho++HXjnRfoQ5ITw+3dPV5MuWr7/PmXXXfTh3589u"
+    "qr7nr2zz/tC7pCmt0h9NrWDKwZeHRkgKpobWsG1gw8CjJw7oGLV33wox/67S/c8o9/vb2//5Id/T"
+    "YRxSjFsf9UbLlQdpGcAoRlo9OPGLi+oCCj6PAXolRN4bdcakzhxA1d6o8UEhQuPJDQmw9/3HSCKW"
+    "opkOeKngsV6ZAgHjYAhfer+JDYpvmYIwwvI4o8c4jLjd6+NCtZacYc30uhhDjFUss7thBNvoiTG8"
+    "XY1Fzoy4l1jjce4172jjd+GNPQBT+PExe6FGSLk5533J7HAWzJAdu25aqKfeEvMZiNKeF7CYkmCG"
+    "sjxs7BBYcvMGkaa2IZQq+XAh4teSxqgwFG7i3HlAa9BkPKY8bhxSj8WRfjo8MLOo64uocPnOQYxJ"
+    "z9AaacVSyG4M3UDjPBWNbxWulNfDKEv2++qjpxRN5xLta5f22exKBNXB1F8I6FuIvXOK+s9OoSde"
+    "YsaJljmFnyIIxzjJic8FJI/OY+XliovC4GS1wdHy/ccLz0Z085eSk3w3cePzCuWxxBZ9/sB2Lg/h"
+    "6vkqPjcYJeN8fU6zGogjeCDfthySP72zHKhhwz5i8NghxzJbB/xoJNTRa2RY4icQJwDs2X4yq+Iv"
+    "da8CeT8eJPXmUyd7g8JAxzkX/kCx5v7XeJi30Pvx9LHFMwrM37Ah3UpUsO69j3mmPv/VQ4ve7mF+"
+    "p4YWhX8fDeeh6j/S3F9Pr2K/1O3ZPuvufuP7z2+uve9O3bvvvUOIFgbWsG1gw8WjKgd0fxQLe2NQ"
+    "NrBh6RGaAI0hP53T8+d/qGj970Gx/52Cf/t51TZ1+lb7S8ou/bLvb4GQKKCX6mgEbxoSJlOVmTlo"
+    "cCVRPI0LvwcHVRRYbGjFxIU7ypkvCr4zFzeQQcv6aiONGNFq6MLZged8qtxY11DIIbxqZMHQlyTl"
+    "wm/hhLpj/4slkGvvoYkONLQZVYEXechgx+ayyCkDBYb7dpCQPjDGHfSi+OPLTV/6AvbHx1EbeJH+"
+    "tbFhhfXnTlmRg1z15Y7EdMEo312k6bYwF2uFlG6TVh3tA2XTwwQhrrxrWUfoQNpHM0DROjmUG7Jd"
+    "bksOPpOOhzItARd3w9J+aFbxk7gIQjPT6GDs52rtGQI0NR1Mhb1/2i73iLyZzeDHvTdWzVN72tvA"
+    "GF22WSyC2MvI0M1GQj8VhOgPYHVjhzeR2a+riZPQFSa9ftuNdf98GNpJROiYmZeucWGsbwTfHleB"
+    "a2cBjZneaAe7/khJOTlHYArsATDvreF22LzGQZ1NZehiQ22WdgmScm+IgDKY8t8enerFaEB5tm1z"
+    "g/ocHjszClIyYaXDmZjgE+aFZrw0ksyPE4ZW02weIrcRrDGO+HOakkX5Ad1otk+D+6cF6P+Edf+5"
+    "nH/fT//sY/ef3/+8TH/9R3J9p1uGZgzcAjPAN5Ce0Rvog1/DUDJzYDOqk6f+7iFR/6xM3P/+jHPv"
+    "Om3dNnf3f3YP8KF0BKCj9NsKOTOL4ThZMkXsFNoaAxr96qiKPwcKEkRb/yS+GRMehUGy5GaprCRC"
+    "UE1YVuXQBRRORETyeIHoeH/WOsB2zS2k/s+gQTJ8JXUeOACcFhUMY0zig2bil0en3EQU1Dr8EcI+"
+    "gsKTpPsw4rhMUkTMNxyZBDF4L4iKwU7tpvv40VrpikT74gmm72mVyyxtEKgz1Fm32iTwiGeY0Spb"
+    "gblmZpLmOkGj0wuynEiAUv3Ygn46yp5S2DL7fBlQA3gSJhf46mYcdBEM3hK2OaoMuLDTmOsOucN0"
+    "fPw1N5gcgNX/G3+CnNCIN1xxeaxkVd9up6/bYW/fBrW+LjflRxOhdwCj38QO5/U2TfL0r8wtEINM"
+    "Tl5m7BEoxnG0FJMkEcMPqBDZVBResAJzPidVz2rY107RqP9mqf3P/SONY63Y3ptTlHU4ysx/kdBh"
+    "1wBcGUm8iBZF9oUDAev9ovA8dDGIzlh8e79o2Y5hjUJ7+WIPWtdW0Tf2K1vziNXfYEcq9xWhOMbp"
+    "I1X4uaz+tBqEWN+IXnZI6WaKz2WsCFS5paW9aamIYf53F5LOCxmhfo9KAtbvEqX75eyotzddNbp7"
+    "cPj7ae8YO7f/Qf3vrOd7/+rrt++AQicyDrZs3AmoFHfAbWE7pH/C5cF3ASM9BP+nf/6L7T73rfe5"
+    "9344dv/sutg1Mv39nfO0MBwMkaJ3O7+syciws/12e8y5U5Cow9zf18noKIagZebq4XKCj0B4becv"
+    "AuAei7+NAegE+d47IKH3p4EdfxmgFxCh7ZYNcFMYVHNfNo7J7aBk4XkHiJfRfB6CzThjj99i6Nwy"
+    "1+8cafZA2kFzY35OCKiIKofNpigVme2MAmJzD1ehxo2DRkPRjTKqeZWOe4vTBxqYfDfhNlIdXhSj"
+    "f2GQ3//DWM2P1f+uHSWEdpOzbOyZgNCnNG3PEWCM64xdq5JFaPC0Ln3XzMdMiNwwZAbqHNSZvVbM"
+    "reMdZaGpepOFi7cB1BwZYTqiaBTjjnSoPsn0Sdk0aNRcIt+Qw+sRAIHtIFAzay7gOxk2CBCzP0LY"
+    "WuWut7X7LveKui96e2eLC9B21VvRfuve1VYlMROVyPK0YsJrdFsEk6QZ0rQOEjhpjQE0/H2whyBs"
+    "Q+Csy8zDYJkBfPBmbYi4X7fhl7he0TOxQmkEG1ZCGTzmn3fmwTvudt073XU4813EehZhN8ozb3BZ"
+    "isuXFE4OCWPBdH+4cJjHPkfYdEM+PQMTSLkajwQbMUqFESII47zC3Fjx9jpfIVOYG8n3gcY/8A5C"
+    "Sv8Lt7+1u7+/tb5x+88Jxbv/q1v3zP+z78qgfPnX+czNe2ZmDNwKMgA0sF9ShYzLqENQMnJQN+st"
+    "Yz9de/+Y1nfuTvPvevtvYOXrV76uCJhxcv+qXs6PN87h8G5oldT/iuK/REz2fm5gIiV+typc4nNh"
+    "QXeqk3BcZSZIyCo4oEFyTig90nXNMOoOAc9i5OxEkAoXNh0npH57ePLgSDm8KEZjv50hQ7v9UOPj"
+    "f1BTMcPSb0vP1IDT6jJxOM/PZOY8GowPOJo03sy/lwgOjDM/p2WvyWx9TxJTxijTDrxSu3Ik2kjt"
+    "UFWZSlbzKWDwnrB1Bx1NxcUvc+s5/AjZ03izg8DkOA8C+82CSU4DrfyX2jw5x8ZAwTFr1mpNEvTz"
+    "dwcOLtzyG2WYXT0+7xNPJW+4Y1dEsee7b4dZoqV2jBeV8WlPhSCMvGVw/DmuOu8iB7jg9OArPuGH"
+    "ee2SWbmcD/Eq/RvS5xDWzFNeYAkXEjMN16nyLzuGwMjaRs1EmY6KNFshwnvHATDL19VCSel8jHHn"
+    "q1XqtzgWD4TsT21+uU48ErXE40Zv9cNZJd3Q8HV61z0HudrEN/eixI763nElhGbvjrlv3VK1ny0P"
+    "vBXPiq1vLkB7lsJ33juIrW4uEDaPsul6x38Z7PC9pHEzV+CSGazql6OJnOPID6bZmOlffE20Z9By"
+    "YMNm2HX77VivPVXWH3ddzuScQ4+1e9Tur0SejnfvILX3zjRz/+iRdduHD+Cnytbc3AmoFHdgbWb7"
+    "l8ZO+/NfoTmoELeu/MV2792lPeccP73rh3cPp126cOnqqiaXeXq1168h4nIXqm91wyCiq/EE5RzE"
+    "BFLDj0es5PUcATP6OqEChVKCaCmYpM2S1GvRPARmwJxQUCboDpOUlEZEDw8KegkZRA1FzAeKCNeJ"
+    "gbJ72LFjG4CIfTxY304Kst9pKiMG+RF4bZYhMfABN2NPFV8UjUS4Kix+ljzzchshaYse2YwdMIl+"
+    "b12vtm3LFdMEXlQMeaRB/erAcGfNnWOuyXldnO+lmaGLyIuDMnVr2esBdV2ZNzrwHgyP0yPn7iYy"
+    "/KSdY9GGVAOz7vmDflvQ9sQXBqncdMmNfxoHXPOq9HoJjJdoO690/62Q7e2a/9eAOBfNTxz5cF5r"
+    "NS4Rj7C2z7SkI9d5woah3A+kpuw5Hhg38fQzXGLBlCB4cBXjt80cW0uSLDsLSFs3vM7SubS9YrPS"
+    "diWHIzVjyhyklaWQ7+gcOGHHF/t7N4Ypw1LaTWCIeTPlbhHdiOHaGa8dpwvBsf8cNsg3EID4Nose"
+    "OafIXb3gzRyuOTmXDgtfG455O5bXyfNN7T2iycQzX4All48IMMX0QQl0h8LNXC7AecADtHvHBCnv"
+    "XzBfpNA96p4c/k6ZiJ/cWt02fOnLlw/vwL33fTh753zdmrfvC8f/HLn5Ju/TkDEru2NQOP0AysJ3"
+    "SP0B23hn2yM/D1r9/25L+97rp/9eN7HvizvSvOPt2FF0/meoulKkw9medLSygBeBKn+eSNqw2qFq"
+    "o0qIKIEzYKHwoBlwJsXBwwb/vUFFLYXnhOCqugAKczLH12I1cDTGBDChEKCRWAEJTMERSxCzfpWg"
+    "ZlF0L+EXKoTRP7jp0rJ5KEPzVMThYLuxR7FGJ9lQ7uIqTPLCPoXUktr8wb4TUSrC3VV+DMKaqrd4"
+    "HXKvVzoY+YfUQbxZqErsstrfWLu9duPnTtFlv98aq99qJnKI2HS39zix+OheZG2+yFBFRxJX6x2J"
+    "C14djE7jluCDjw1ksURwxCqp5VIAebdZSOKHuITuPEhyncsTNR+Td/heJ4mrN5sBx2KM1kCjbDn3"
+    "MWH5FXbhpQdolbk2qJT3H7fhU5sqSGBeAjwZS2TdVLXnE68wFg4jbs4EAiHv9MhOa+IhpYdPjnxK"
+    "d8l4H9FywkkHMbfpnn7XiIaV4jA8ktc5/jBDHGZe6ZMcSmAWMfCxbmcaYff1pvo95AxMmIekz4nU"
+    "qaXxzgpK/2S8vtt/KJAceIo8G+HJjLLy4YbXkfA0i8EvC+20fiBcW18Cj0WOU1OSoCM08Ypa6G74"
+    "RccUtujIS2NP1y3G77dyfgIg4iEb7XA5et7M6jPDKVvcC+auzHFeziDC6GG01CZNFpVFhjwPP4KJ"
+    "le+7Mfo/046Svj/HLBYx84d/jqt77vfXdfcfbsfc/++ad/XrYJZ8PROlkzsGbgkZAB7t5rWzOwZu"
+    "ARkYGLW4eHRzvf+94Pn/S3177ntd+746437Rycfrp/sHuXV2JVoKineOgCgi9B2eGJX0/snOy5EN"
+    "NaU9BUQaDncAqyFERVF8iAE5L+MhVO9vzFD6oa/MPh4qXRuchigl93+M8JR048KC4UHwUUvXQupL"
+    "BRc4EjIvNU7H3SSdywutcmcqxQLP6QWEQHuBqcXJk0R9k4B9jWrbG1mppGz8TrtrtFFlD7QSmJOz"
+    "Z4U6scGRsxKjUKxOTbaxcQC7/Fq8AdGz37wfOwehwWmOrPPjWmV47bj4Mgtw4m29hi55Bjw/41Rw"
+    "npmBM3SMedBS3cFo79ryW5RSqfEoQjBTHjbh5riqTl+BlrxTcvGLSNTTft286crLECQO6YvY1N53"
+    "v2bxz84Lkpb/ivqCRT3svAmZOP+Ay+/QIKP5LOUSxDz7h8lC+Q4ao8laVzZj/NBDJjTv5tM4JSVF"
+    "wBK59BSmmnmXmsISaJrHownS/0rJ0vHhnxFRoctmCh5tgyG+vRfcP5ktywWmMsmt4Oi8YagyWAC1"
+    "pelrFeG+cxKMeHnL1AP2LzYaF4ebwDW+vw/Zqp7TkvKV6NsPXxXT4M2djUepEJM3xpmnOrRW8dng"
+    "kKvVUZW2QD9FYXV46rcZzIBjMgBYPJ48Q56IMQyCfztTr8eJ+g1XjcxAAfMWZQAHXj/q2A+YkD/a"
+    "wNt8c/cO+51/7N26/9k2/e9r2nC7a2NQNrckdXywAAIABJREFUBh6hGeBRZm1rBtYMPCIysL11/v"
+    "7zj732hutf/p3b73jjwdmzz9JZXJ7NFX9KGA14LudbLbvYkig/VrCcSPCknxOVFLEppCWsQkMjDS"
+    "k5tKWjychfKNFX4SRP8VEnHFVVGM/GAwrFPMzA529iC9soPPDdseCS2NJwnMIvZUpigcefx4G/wO"
+    "i70EJPKHMROvigpEkfTIXZAhOWN+gBGb7krgupLhBnHp+U+SqKMzeKroRawcLnfeOoidzxJE8E2E"
+    "HiOY04Wppxzxox9ZX3sjR3a4kgq2tJe5v4ZG+KAZFuCHoN4Mlz5skJdpu2nauCOefQBlfY5haVJE"
+    "MHjuPNbQqvdhHgzbVgT6j684kHpmVupMdaPbkUsD+/x4nSiAdS7NlyxVm9j01J4M23KdYLBCxK/7"
+    "1G7LqZD4tam6GdBIGct9a10ehjRwzgfNPY7NowH8ceJ1iF0SDr8AsYZQB+8GbgOb7tQDLs/RduUO"
+    "TPrWIUMQv1izmcDPgFIc0ldcOe5vlD8A2dEMOtRqzDLHDhQ/O0hdtzTly5quYY8EMshcQO+7J0FE"
+    "y4wZf/8FtEznjMwqCs4OVv+EdHkx5u9NIlusRiWUDeYiqYbdxrnFPOsgoVl+rLipiXfHQoFVhhiA"
+    "DDJTU5tol1QCouXIfbuXTOMMzVWR6F+ey0b9t+eY0V64R1+wnfv/PON7zl3e993b333v+YhXUdrR"
+    "lYM/BIysB6QvdI2ltrrCc4A3paP9y64kMf/9iL/v7zt/zZ/pmrXnC0vX0lT9xc8epvtKRAcgFKQc"
+    "Y/RUg983NndyFoRXSuFCQH4nJFff+cgYZdH+TqEV9qAJ/xNvC8i240FFltF79T0VJxyHw0Fx6ULF"
+    "WIEA9//OekB92IMnbWlX8kOKRJzrgiTFGPALlbCt4gYrQRkmOgcBNYt5ErTYnJJ54+EdN8FGVhSw"
+    "5S9GHnEzvHuRSODk86+M2t3quVX6/f+HLuEBh7kK5UYLPGRTfWaIw2+oebLdjgkQPoxri0jitztM"
+    "Cy/xrfOjiXlv0mDtvrCDP/JmZBa1Sq4OGMIL7ic/abEyhhHEZhibnjncMT2xJ3vM7HVUncRZ79Bb"
+    "f57CT5iD9B5dIxTHGCTW6XeBOz4LUvR3yiIKYNeQLx1uEnaMfAwc4qvVLJE1cZIKz1NqammLlBZY"
+    "fYTo8BlklVsICLrDkQWo+AwaRwVMOYuECrtWMPBdAc1cgHGFrZkt0AZnFkpoTPt3LPOgRNHnqsOT"
+    "DJ/c6CUE20xAdn4dGbHOrxsteIyeZjQfFVlDYMVbjgHGvRuJYVfz2RM8drQx5187gTnuaHL396ME"
+    "Bol31ctX9SUaEvqUaoljUyYq6b5VOPqnXmF7set/rx2s8TXOXc2Tm44uD0s77+3e+86Z3v+8Crz1"
+    "248Fibrps1A2sGHlEZWE/oHlG7aw32xGbg4vbexz/1iV+54SMf+ZcHZ6954c7+wVl+V8hvk9KTMo"
+    "3XXPmKy22fbORJnxMHn+xxVQ2R5jyh80fr3s/71BWWZkPB4LdpCu8nf4qCKiaMYFxzqF200utmKK"
+    "AaIFtOYlBMTcr2C51jskATDO2D4rtwGriYsS74UQghq9ZFe89tr03kLZV9O5fnLCkkg3NEF5supL"
+    "JeUMLL0PKiZWx/zEdMxStsf57OOvnH7zgJLI641cmhTqQ75u5HSFASv9cwHNln8tiLQ6db4ycfvf"
+    "7BXYReH4GpBZOMIPf6LM86A0sxDzjrb98hcH5KtPgi9AkHtPzN/iWqRhGtPxwK2Dzmboj6lgNinB"
+    "cHFoCPxRAsQvF5nfT8aZIVI790TfAOP2XYOEgZc79JbhY3yWh2xZAC4mae8geHbvjIiUvlF6Miba"
+    "7BBkXZGFM4ZItNrwrhskZmjfF42vhqf8UGxvnhcaRlwtqHKZbjOydQIWq9j8EOXFybOZyIyoBoHT"
+    "FrsT8p1KPOY0riKNSIA733kazH1di2R8cfazEdHBIixw+3bnab42jIJ//A2g+sRWNrc0nGPxla8p"
+    "hoEccfalniK9CsEZFtEY4Bk9jVC0u54pg89DrAkKU+sdcLgP6M80VdnTvSC1PceIfH9r7muxf1hZ"
+    "gX/vmnv/iFv/rw3/39b+oR5wz2a1szsGbgkZOB9YTukbOv1khPcAa+8tXbnvbu93/wdRe2Dn5va2"
+    "/3MSoHtvf39vR8rLswz+CuBSgS0nZyMS06pK1wdVCTqhRszkbzLtBSmOYNQzBKW9uMxgmepylcNx"
+    "FtQwiUFQmhx+FPAUL8fF6K4qxfPR5FDIblI8tIwdT2+KzgUuB4oVqfbGxmQDZeNXLW6kbf45LMeh"
+    "k4ox3MBKcwax7EcGeVsWHc+uyV8uMgiCFGfvuUsRSnyTd4uxQW2Mg1PmwoafFItLSxruIvHwEw0W"
+    "3IIMBPfFHwhjLydjD82TDmw6H89ZrBhUv2Iar9QSyNqnHF2Wltz/AODo2x28hz8TQbVxtmbuxZHg"
+    "15+vaJrrUGBFw4g4/FzTr6hCFcYnAMzZ0++4pY2u/kx8TTphYNwigbacJVmjm+MqmQcgyULN3ig3"
+    "W5oJ/0xIlt962a48+OEqqdFMgnGMPAJLXuFmKivzqZaDzcJIGevNGI7eGa3WJSuEuQFVc4Zi0xR5"
+    "n1iIMXrGCSHI3jY4SZPtPmcDxNbI7VFhy3mPUXIWU/xqAiF4dpiBMi3Zi7x2/pO078E4HdL4aRyl"
+    "nwZrCs19IGnU+UidOuMg557LTNasd04Fvi4xcbrkzyVKHPWJtC7vux1ljme/u75x48//y/veFD/+"
+    "aTn731X0h+utLcdGu/ZmDNwGWcgfVbLi/jnbOGtmaADNxz131XX/fB973m3vsv/NHu2TM/06/G8s"
+    "TMVR1fl1NhwYfoKAa6CM3pwSKDK2XEUnAh6KJhR6/cpqlMcOHB1aHlLTpgWx4mRUAQufTnoirzaO"
+    "HdKAg0cTGBiXWZUeCg6Tj4ToEqRyUTuNzgv79khThH4VNOwhPf6G3s+JBBlOYoJMdf6NV7DY0oPC"
+    "934bt0vXZbyXD4LxavwRRShhhzDZmYyr3XCW8JE0cMWErjm6PJkCdPRRbaEJW/ciWABH57mV163v"
+    "mJRGyTDceMfWO2BDboKsVNNnrn0rNl/zHtXA3gNLAOTDIwNGP/yxmhWa0B6+5QB9gx1swL2RwP/+"
+    "BqTb1e/HQMWHnuE1r82nNi87B8KyafwMBFYMzLtt3Dye14G/7ab/U+zjH2l2hgpa+ZV8Ntx5cQ2L"
+    "Lvs4/AAOpvgLWBRIlPCmLQv6np0dmmVieFZRZKp+N7xD3xgmKVYGOekddZJ3OlcGc5eK78VMNF28"
+    "9j1MTHPTqZJEYhGoyKxloE5PjMJxqR+d9QOGk+IUPhtgBiDinsy/5lnv3CWzCtLt/CNo3EwQBINh"
+    "gBYPm9XwceN1EYRYAV/sgvNhYKkbEHLSo7iJbGide8f9A415Crmcfr8ZRQldXiUMfIu0sb55B8Er"
+    "9tcwVZv26wdUHHweHO7jW724e//TfvvPaH11xx5sfPeuaTvyhYDsyiX7s1A2sGLs8MLI+8l2d8a1"
+    "RrBk50Bu67+/yZd7z/vX/w9W//01/sXnHlM1Qs7fME75M23vLEZyDGF6OkSPEVHXTKHNiMNOP5n4"
+    "KCRqcbxQB/LuirMumCrN8u1cWDLcs8BYYs4SvOUoVTMmNK2J91iZ0jmDaJYQi6UEHgmIcLTzuexv"
+    "sEtxdkYfhw3etrv+4pZhxXirzwzDGkkDXWuFqEgPZNFMRFY6h4bd25WODBGBYDe5zWt0DD6bha2D"
+    "7KmadsuIE5PpZIwUTOuHPiuGqOzdSGSjL7ti6gzTAi81oX4MQ0D5WNYxjnTbHR09h63wiX3uJEjC"
+    "zTsfWysK+/XhqARvs+UX7bf+e7w7G8YmDBiSeszbMZV0uJWX9l6ytCjjORZlVZE/c/Wq/ZE206Br"
+    "AusDmZqTVxxAGw77raBC56ei65F8ecHGRw6zYcYOe/GYgw0o4VE5pzAk8F2HP7C7Nx83oYo3Jvra"
+    "YVd03TFY5JYiyxusEHRq0zTd8xdA78+GFc/LKWEMbW9sRvJ5AxaEa0iOp+Ta49b0QbMSd3bIIZj4"
+    "FIGxbVEj/40vntjZ4i0ONqPf7i2yGZRzrUxdO27aKoHMPIb4xlJNMa54p+0BWuSZE0hnUMDozxKY"
+    "D1LIkLdzpc87lpvWlfAW9fPPwZ/dbBK/7mXe9+zQ9/dM+TZbHWieRubWsGLvMMrHfUy3wHreGd3A"
+    "wcnd+64oM3f/gFn/7cLW/ePXXmn+8c7J+iKui3oe0ypojSEzSvyFLQuoAoDJ+do6SJTHnkJw3qRM"
+    "8FAE/uuvGEz+e0XFCIy6/i6pGhPz+XYiQPFaNEclGQ+oBvnOzijFhSRGzuN2JGHq4upBcMdphuNA"
+    "S6dUGy+KA4CpoS1bF7yonVbBMMUQYe/5c6IhGgUvx0EWehNuWKUYuWHtEk7hgNkBxbeBtE/hx72Q"
+    "zP3iGh7fWad+KG6RKZfcycCOAJFv/4ZArvspZEZWSCYPf4FtDy2T3ThTSxJ8yN8YgZz3VlsPcR8N"
+    "7vZXpJh+/kpdYixBLh5tjrmRgWXNbZqqx34pMTZLVcwxJj3Y+4bywJahrjO373lQsAg028tpU9/D"
+    "MeHPNeI30oGMjOAlDVzLXkIztFOsk7z+wTQqX3mkRlGdtSNLZYq7PF4CECB6yOq/3k1utALCXrO5"
+    "4zTPy4U1jc0cBxUuext8um89G+0NiX+uEDh3Obg4Nbf26Sx4/mYErM2Bhkwi8nwZNtGLzN24wFxq"
+    "8WwTow7W36PFY5RgFyhQu4wPm3ra24AqZb58thmVD+PfFm8Icz7nsN8Q8kMWHo/fgQ9ynssbO+I2"
+    "fdfrWg4oBnocoLgdjoxu+PX9Qxf3SRq6TZpzt6Gz+/VXO0c/7pd9x39xve+b6bfke/Y7d+8yU7eG"
+    "1rBi7zDOTR9zIPcg1vzcCJy4DOrz79D597+gdv/vibt/ZP/+r27v4BT/K+CuHCMxnhrTP8cixP7j"
+    "m5ozBJEUCB5i/a6ORRT0iXV5F5lmcaPBMXCOr73YcuFGYMJ2W25/QxdvQmah+eMyGw0toHprGBo1"
+    "sXI1V3tNj1jCfQVHMRBW/F1H2fpJp3cLMa/ZEDnXBSaHGjsb5wdexLPL7aZ47ESnzElsYgWLhZXa"
+    "+JOQ0ZzeuSKLbgohtvsyvc5NnxYgtH89nf8I92ahij49bjIrTfY3ZZ82Q/9L3GJgsf+IaMtOKo8t"
+    "O6iXEMiT/7lvAaSWGbnAHscYXs/YSNvwSm9cXYsdumTry4L8zNPoev8M/65kA2j2dMj3v/NZ1X0L"
+    "HLba+t8fSxEbIPGOKrGPuqNzjOefziC3z8qceW1XRc9neMB13f4AHTcWTtyGxpXjCdoe4dWyBGEl"
+    "5sKg5m7Vd9D+HaaINQUvH12v1zIhJZDXkc2EfH1r35DGFT7MW1YErRXAWzUxzT2qaDxQTK+a2f6B"
+    "reuBYYGyO2tIJ6TM79gpmE7K8O1lht2oa1JsxCMVGDa8npxDEMS4a9/hbfOSZMUtJwRRIrfE5Ew1"
+    "8w0YWxX/BDQzy20n2JA9LHVffKmx5T97bPP/Dcz375i39+w4dvft5mRsK9btcMrBm4vDKwntBdXv"
+    "tjjWbNABnY+f4ddz3tuhtvfOMD545epitz+hKUNE5QDo8OfVLWJzJcqeO3hWg8UVMQM+OWV9I15k"
+    "nf1UDKgLxdBws1qeAC6yd65sIXvHoKAN0gHRJw+JCtBi4KsOXPc7CJid4xRMDWzTIvLiuEL7YUuX"
+    "jKSazBmsONe+QaDU6sW2esZ8RBscLv3DEuvAY5uct6kC8NJnDaZDgP4rO4wZEv4iR3iSs+xlqJs/"
+    "yaDjwnlhjhw74rtkwWtzhgZown9pdRbaUjFzYCB1wOcysbC4OTuvwKbN7kqMe2KA4ARVl+Y4PMaz"
+    "I4G1+BrbnXbkfeFAtKOzRqyU9CJx1eg7q8MGFYlsV6kONUjZy71To9blk0G1vnYpIkN8kR4rBrII"
+    "7BHUU+3kbRWwsuz2id415TcxpnbW0G52SpYa+lodiD8PFUPVwjNoCOQbHUWskGdpf4FJN12KiZV7"
+    "1jrKIdORiU8YGNJUgzLuqsDSGC8BmkDdzdOpasIZqEp7XpmM+Vo8Wf7QTLsRPu+Kp1S+Q8qV9W0d"
+    "7S+9i3qWwqPltrjBnb9ovAMnCs25iyk8D7HgxyY5vjmHfnXwQssbvmM6cdw5i/wjli6S2FA3m1+b"
+    "izVwIldndMCAgb4tSrfZEsXAiKz7ELzmMerXNqH7Ln5BRMPropo7zC5Vzv6fjY12+Y7unz1Pv7e2"
+    "fOPfjgr3/oM5/6yy/eehtfktIfsjbvulkzsGbg8srAekJ3ee2PNZqTngE9v95/7/lr3n7Dta+686"
+    "77XnfF2auf4o/J6Z7KN1ru+pstdfpGYaZc+Tk8z9vOHMUAT9Z+/vezNgVAblzN8x1+6DWbbF34aO"
+    "5XtvUpeb50wTKKD5r4DK85xVarULcfChZaoT3uzVy4YJyCrQLCTv+EjZye1j446ZzjNQBXcacO42"
+    "XeCgqa5mj/KXYiRxdX5VAzZFkHstaWXh0ul3VqjECtYzZAuM4BftH1POjexhg+4+Apn0HEL7I+cb"
+    "K/8mlf2MRBk5a4gkWaoK2Hi7+sIUQ214Z+xMtErYtcxhNNfFrWwYCoWMTPSmidn55bWJvBHah9g/"
+    "N6Gqg44Oj9h9hX8iS0rOI0SDrWNreOrk+80cWvcBN0w6eMfMip522R3B+AznbtFj7HUQu1P2IrPH"
+    "raHD/z2d/gRVHNx3xPusep/uGOn1Z0j77yVwG23+6Hr8LN+UrUuMif5+XIEpJAAO6JwcpaG8e5UN"
+    "PVMaOP33cltB0c3DhJmRYzODGWvGNh2n4TC8dF/FvHsOLynOlYo6jQN6bM4KE5DACWTyQawtEYD8"
+    "rWYxlEi7Bx6mtqW4slqFiZjjVJnDlsGIGjY1ONNTR3xTL2S5uM2IeR4mYMX8WIQOOc1GnMP9y8IO"
+    "V9pnM2vzU/8ytOn37sj+6679X/5a1ve+N3br/zic289msG1gxcfhlwfXf5hbVGtGbgZGbgwQfO7b"
+    "/rfdc+/8u3fv2P9q8880wVdHu5ypSnc050XJTqmdhv31OaeELOVQ164XxVys/k9YTtzk/aXQR0kV"
+    "EoFwtL8agCAIVuvpLHE74F2ScuACSjoKZYmAsqxuaOJgaMKTbUWmcOxYq0YxgjCbtYn/1ycuk5Bs"
+    "LklXcNam4dU8VGw2X8aqAWeRdfxVxxScn/wODAMdoSe2J19ixprDntH8dWGcvYvocsOnJsXgpcGy"
+    "yA+NO8VBWhcCyk+EITWY0dA7F5wcF1pPTLfo0BuP4LLy47nvIjTP9WniP0ZoQ2ouhB8tyzuSd3sp"
+    "N9xzlre+y1A3qYBj/r8AsAoUweZdMnuezwUvmtxjNVfNfa5Aac8yAbmvXHTkKQo17W1uxo1Gra3J"
+    "esgfUUP5lr/YwP0eZ2ZIH16NZ4UD1u2uhjP+w07as40cTO4Ran1147v48F9Msxx/Li3zA20iKbMY"
+    "OffeMXmeYopJVZ2xC7ORF2YyGmbrvuY+uZNtgdb15DPSY4L5Npw5OH8mo/5IKVLA0eWt83o4lNxm"
+    "wn/xjXLS+sQai1CdJc3WMWX9GbDyoJm3HzRS0Q4XOgIo294skltejZHl9IgCbmsZG15zGyFTIyn+"
+    "b0wvhlwUwVj+7z3PzEot8v1f2B8+ydixce/6N77/2Dt1z7/pfdd25r/dFxpXFtawYuxwysJ3SX41"
+    "5ZYzqZGdBz7JduveUZn/z7L71+5/RVv76zt3sFz8484fMtZDwt8xzuZ2y/TUYy5K4MZCylb4akXE"
+    "jxZSM9OesnDihaQ8Jzuot2awORD4quFAs+cZScuQsUDBjXjfHiM75zsolmaWBctEgET2ywzZoauR"
+    "EHa2HF/HtM30j1yOukyGJvwk1h0j5ikdhsJAF64ug/r6jWBt6e5cwi/Piv5WFk67UmJabGZ1qEPU"
+    "+PDs54Nc4OmqBMi6LXXtJ00jl/muVEe9PGM+xFmZi1JSbm6j3W1GMQJSOPjqrfyuVX6yGa2kOHOQ"
+    "DmHrPE2VNiWdo8TiyLboqzhDOveVhPU9S6mPuFDMXtk4pe60RM3ubWFMi8T6SPLHnpYz82pSleM0"
+    "nUnN03lpg53rHKlSpGi/9NfKzmLUjvG45vTcDDQOux9ZrTW6ZeE2OQaWIbdNxolkoXfbgG8axHGC"
+    "rbZboIwpZtAHU8Em/DKuacg5RcJqgde8WKpOMfIkihF5jjkv+sxqIxBgamW624p9UH0LCeOSUtBI"
+    "k/tfbTM/foiKHwjh/Htun7cz3mYACwsEA4SULkY0KD8bjFGDytuDJJHK2zysgaWZG8NX4QtRF94A"
+    "PSA+e0YlpCzTFGjPqFcd302Ex8zPXx7YPd/V+89Vvf/rMbP/qJF4n2yofjbh9rv2ZgzcD//AysJ3"
+    "T/83O+elwz8JAZuPfuBx73wY9+7JXnjrZ/X9829lO8+EzhcXTxMEWPCyY9U+ufU6E84YpK8i7aIP"
+    "aTdD0Z87wOzkKN+ZIUgeuVW6iMwKzGHnqTK3CZQ9EcDOEYcykpEvpkrmOx35j7+Z/5goEipYUhHo"
+    "tT/7S8Wk5MaRHXDNdgvC0OTLnpzzpDk6NBKhswmy25Q4wuuQrCa0YRZ+aebQ/ry2ha5vXYQe8bB1"
+    "Fqe/DYcWqTwq6ts56sSbLZFEjNbaPAHBubCpyOBiy8ZEJS/6dHCb99ABy66PvKLqouPjUE5pvHRd"
+    "UyenLW+/qSPk5BeX8vTLBp5nxl/D/awlt72rAcO5LoTuJ1EMjUEgcrSWPesSFpvy23znDtF/Kq1n"
+    "2uetdxUvE6h0Ytm4Qwb+HIjfW7FXd/Db/Rx2IbjCjLDCKGWXchLBCkim+kHTN9IonMcuHbnwMzYx"
+    "y03o8PEUlbA/zaMoyLFG5uO35h6Ij7gyCgHKcnWGY/0eOn/4gXtH2H2tjIp+1wKAbzL/tIBra3D+"
+    "8bgYurB5nKK4+fXlNLEj+e2r6Pi40XTOZQWHDxe411/Bli/wUuzFgrcydLvca9pGV/EkG3ZRSJjZ"
+    "Onhqh33pibLJ6sZh4T+xy4glL09X4ADzz7kRci8tyCvb7sUnOjt07t7+/vHp17wUc+9sE3fP1r33"
+    "6WjPaxXduagTUDl08G1hO6y2dfrJGc4Ayce/Di6WtvvP5F373jrj8+febKp/CMTFHNF55s6wPqLk"
+    "Z85YQkqVjTE2+uzIFMMcATMxVPFyVGuojJEzYnU10q5AkdeRV+VQCMsqKKk36ib3zbw+3qyoPwNH"
+    "ljmTOecTGToosf4tVfbFiUVAZpE+fpahpt1jjWaT8FT3kCw2iOYczmQa6k7Khwce6IpOMCRiBT+M"
+    "1jzAiSpXhiYsqqWkEtMcxWChZs8G02ij5bKhcVDf7bp+3ZlCu69lsiQ8ZYues1xUwalBVO24ZfQs"
+    "vzNkt03BCZj0CRTR4CL7m65gHKuG+QxFesTfFQm1A9lCZe8c/Nb/Mdy8hAPoa/ZrC7S30mzuCBzn"
+    "bETsvavcLMO+mexSVDf+6IvtbL/VWToJqs5i0e/oNyjrGYI20+uLBrGzA9jjnKIkK3DMcI2fAthD"
+    "GKLfJYZBYTEB06exx/KerR20pSRzLmNpAR0n6Lo+MMvaw04N+BlNDWFibfiDtQM7U3epTh99B+lo"
+    "xZ0yGVrSBq8TWoByZsvU5g9tF6zctbUzhGH39lhL5fnIonMYz47XxsEoWm5GgJ2/p2aTF6S3lM1m"
+    "jwRYqqfaDK/cpSr7RRyZfkJch9prUmGTxYz74Yg7woBxzfepeIn2sO9aLi3s7WTz3wwOFvv/Wd17"
+    "767nvufzxM2K9tzcCagcsjA+sJ3eWxH9YoTnYG9j/+qU887+Of+ux/2N4//YK9/b3TpIMnbX5Ljt"
+    "8GSvHI82edhPitkwHxJJ+rCMsTPva08VX9suM3h+Dkm1Eu+i2beurWeFvflgLdRrHME7qgFCDu4W"
+    "JC0ZEwJKmGzLd8uyYVgf5tuFHkFpx4+2ZyoJK5lLAhbsbAMUCGBJzHmnSB5c+KFLw828bQDZ+aKA"
+    "fmMZeYfMIriWjDHQZeeOcTguWc0WjGFZ6x55A2cSHxz404FxveypSHXRe/svE6snrjkgcpZOsGrx"
+    "p7BJ1zU7JoHm4bgoUmtomLuBdOx45D4ik6+hE7MvaJjHotJmis12hQSZaOuMcfTquN3DEnFquiB+"
+    "9Wx4HXLEHH1HFMdMlLrHw8O86atz3TlnePDl48Dpkk9oUBg4dojd9Qe8L9MfvYOZNtllFZ4AUE33"
+    "/BSMYiiKHWiqt4Z7S0jo1+Hjei45hoWJDU4fdVwWZGjKbUI98lH7EIQCzR4yHHsu1wpJtjkQDZ4A"
+    "m7dVD6ipe0zWtO42Hkcao/75W5Qy4OsF6bN/FhP9hDLnn7Tm5K3nr7NVltsC7n9HODq2UaO17I64"
+    "WxzGPgqOxYFg6k8JUTwi1x4j/mChb0nZN2a7kmw7dJRhZQq0EWv+ZgZv4lx41C4WPCG0npa2wfGi"
+    "eG7EtO5tjjh8DU7+qkjucfTblk93M/uO+eP3z7de9/0YXDw7P4WNuagTUDl0cG6lnn8ghmjWLNwM"
+    "nKgJ5IdeZw+z/98PHX33TTn17cOXj57v7+Wf8sgZ6c862Weg6tYiJPsz4Hs2y3TkY4N5s/jUYxmc"
+    "JmKTTI67bOUPKk71Igz+mctfDDsuJwFQywG+B64qdW8MmZergp0NrPQkqEtBQGFEamLRvHxLjm5h"
+    "YAHM1Fn4Y5CbTImy42+gP+hOXPFGpAYewrbAiLpy0TOsUKy0hfJXRB6ucLSt92I3cI7GNoeuActD"
+    "/wWZTUrEfzStvonQiv1ZTmMU4j20sHOGs1jcc9j0Gw7Y/ert0zJpPkQY01JZjFocTocRV9YTy1dI"
+    "kF4m7wzicoTihcHU+AMDi2smMeqEYGR5G4wz+vL7aJw7EDrzh8giQVx4aPO6nolzznmMOk9zXjjq"
+    "d7ZN2Cy3Fhnl4y6+UmoN3XwBwWhKEpE76jAAAgAElEQVTt2wxp4tZWQucMvG/ocrN18ViWJVesYY"
+    "t31sKtADbMpn379xVL37AO0RwVx7J+1hYOd0XtuDVu3OKTAPgPEM7EJA4RILfGwuyTjj1+CIAXg3"
+    "g7ppDYqOe+zDTBIJdi+DBMUI5V6cAZrH5qbUHMqPPCTng34ADdIOrGqUoU3jZGveMcULjBVmMgXW"
+    "wNtmKBEzMQjseyYe4Aa5klRm0eDVhD5lF63dYXuDpziytXQsueeOyLx2XxMInAsWBq/zOHxtknft"
+    "nKcOx8NRZbcfpt/dryNLPH2y+57e4enHvgwnM+/rnP/uFHP/75Z4nGnot67dYMrBn4CWZgPaH7CS"
+    "Z/dX3SM7C9de7+81dd+/73vPSe+x985f6VV57xE7mfj/M86WJCxVA/8e+oEGK8rZdPecL1EzAFh5"
+    "6E+9ZP3n6C1rMxz8/5xkLKgTRzyH6RRJ6TKRlQgNAwrmYJfjRg3H66BxafOaEUvTHofeNVeP+VvL"
+    "xjs9myRmIgjFnfV+PwjzymjsYU4BNPZMxp4NoNfcS9pU/hZltyLMOOyv4FaXv4+hs+GccfIzW47V"
+    "RvXxSPF1By646t2ZzExn7yvmJN021EIZIsLvweSwS3xiOGCtryJhcEsVVspBwFdvFIag72z+zSxw"
+    "NKtY6LMf7sg0m1ct1T+0nOpGmw+hHrgvTI8sJl3EYBJj/1lCXimcf7aPBtRqJsDs0lNnpBoPMOqK"
+    "9CM7Z3NrrB4PV3732U47zzAhSc7QoX80h8b/NnWDm58SspNkiOwj+sF6H9NqdoN9bNiz3sI/T9wg"
+    "8YGnuI9frKe/NFpa0i1X/igzOiVveaDJLQemGADStNkvdIvXjUThYDNRlyP3De7RJlWse35LUfN0"
+    "KA3s1TG3tqO9amGft22afNXXbuWhaqeevcEB8Blwl91oRoeQxIfojh0pIJD3DlMTbLzza8UJuTfa"
+    "AJc/jif4ko3mBLy3GLTWSdp/bQOK8fUjXfr+1EAvuzIx8j6BcOTth8yc3PITvywVGEPT2v3+hXcv"
+    "T7ptzy1n9+o45I9L3L11y8sPWy6z704Vd85/Yf/LREa1szsGbgMsjApY9Ol0FQawhrBk5IBnY/8d"
+    "lP/dJnv/DVNxxcedXP87zNE/3ezt7Wnt5q2YUFT7Wq23i/Sz23V0kjsO/A0i0nGCoLeNbVk3Kf/P"
+    "hJXEKe87tEcTHBHIc8gXOlC0PdzKWeKyAuFo2RSkhuKSCwy3jwg9MtlPS5gQNjT3WSEw40x5uDlz"
+    "A8hNRjIyMwN8NR9CSyWrvDMLzfiurIE7JjMY3nEY5cwYPPvpkl847ZfcvdE8Xy56jkwPsPHjVy0n"
+    "mKxKjSVWAGAuamTYsdEptwmjeWDrPlIy7ZJTdNodxbII7i9NVQWTONCm7GFbflEtCz8U5lEArjMq"
+    "1wQ+ywy0epzTtE5cM8Qxgk8fPXvlqtiJoq+pqB73htWzGyDtqIZfIZzbIlA8C5f9HwhV9zM09SUL"
+    "k5JrCWl0yO+uTdejacxPQJffeBl1Hymifgznn3gtRa2qTCs19OQPHfaweDnpg9nnSsR5oU6oMEFN"
+    "jiYFQ6rwM1dr0Y80VklTfS+x/DjBF3DIawQe1Og+LDV+6XURIja7GtMJmnj3XJmsw8rTnew6lbdf"
+    "QzvOPzfkUDbm41H7EoLh4DueVd6mG7hFO5z/6YyeLbociefcouSgz4lgylH/g37Zj5vqCefBgIrm"
+    "zQaa9qvzYqVNh51P7ACQPOWAKQDMbm8jdvWc5+aL8egPK7ITzghE7PS1hfcfaKn7n73vv/8B3XXf"
+    "/Cc+cP1y9IcYLWzZqBn2wG1hO6n2z+V+8nNwM7t3/3jqfd+LGb/2j3irMv3D7Y3+OJkh8O99vLlB"
+    "eeXGl+DudKggb9VkOffEUtWd6WmYLC5ZCw3LUhyBO6ocUHIVgXKioO+XN5oCd1nvz7ql8KD/y3IZ"
+    "QZW2YeMw++FDopHqheXAiBw9Tm8d2x9lrbV9gUtYm0Sf1hty4CzZEw/Mp/A2zQsU0xm0dy9FF72P"
+    "7mOIiVPJiyA1Hf2EkkKq+mRFjlD4Hd4K78hc+BmNt8NTWa8ZjD4CjGtiXY9TLYv2Mfy7Zdua9J4s"
+    "5VUQwRw+y4CuN93/YoCofPbvGL7wRZpq2Ob+eu15z4i8529jksHnrQ+4IAPe5VlcP239ZglthKOh"
+    "zBkXjabvAXby2n6dxjk/sWTkPAiNa7aJyoRaytfOl+xLHM/bNPVvA7jn8R49/YHte84+v9br+De3"
+    "PgWHp/SdW2c99xYmmfHCte8xLDzOq8THrCcmgDBGNiH6KRDSTSAymYfTGmqc8yHbnilci6zG1jYM"
+    "fmSXBSJu7IxrZMY9a8cdj7eI6h4fi13AL86TEyZs5T5wFR8hZ1QWohiaI5l5gSafilzSKdNezZP9"
+    "zIxTi+2rdP0AdTfDMtve9NttdV3eZNUsMne/vw9nhkmgvLeuI3FL6aCFfHQFwOoR8f5BVefb76UC"
+    "eSR7JnzjejcDu8eHR66+KDv/zl27725zfd/MlfkSkX89a2ZmDNwE8wA7kP/wQDWF2vGTiJGTh3/8"
+    "Wzf/ved7/ih/c+8Afb+3tP0HPrzn6dzPkFWz8PpzikDHFBUM++FA0pPnhyrmfkkUQMMwHTaotKjr"
+    "bfZjYKFwOrgAInW9rwq7ltrIqOAqH5DQZTdl3IwtMy+h6D95UG8+EunO6MKxkCz2XbC7Oz6CMDg/"
+    "BYgaKCzdkhyNCXJUXLLKi4oLG/wDyGAHsTSa+ihsIdXaBEkD9bicMFGD1XZtQ616133iC0v+g7vg"
+    "7LjHagkX0hgcws8aFtx4EnVBWmB8y3fTD1ehOnMbW/u8i0de1MH1Ma274C6hjsvWLIOBNjEVSsDK"
+    "GL+WwwxQhIzbG3H3kd6Br0MU4Mx1vH1SdRywE5MuEctV1OhDPr2ED6OG8TKdD18dm2cDuGjsP4YB"
+    "vTFOSzYR1j+kLC30aM7RMbpLBEO8uR+qZN52RQYFccyMCN5v0aSfM1vzHSb+DbEMqOo2REdSmHgY"
+    "PSXAA14PCjuasx8xxjjBKr84+BMNkXGEdn0LAlIiYRtJj7JDdWMrhsuHAQt1cq3jIPokhGFtCrbX"
+    "gC4zxaRWghrrz3413k2iKf8OYqrHXls7pakWYtgL8x9HWr0EzBaXpciH3C9hihzbRh7Z7IwNARW+"
+    "Yj5/il2VA9OdWY3Hi/l4q3Zu6dOrjq4rmj33rH9R/+g1u+9k8/hdna1gysGfjJZWA9ofvJ5X71fH"
+    "IzsPPZf/jMc2/56jdff3D6zDP2Dnb3+knYvzlHuaAPMOi7SuoJmyfTvLKbwiGJWwqrPM3zpFwadS"
+    "lsmPtpXfb+8hRerdczdL6UAHyKAjAURH4i50lfDlMYmUpjXempExQwmwWAfPH5ONm555VcbgQtFx"
+    "0VscytY2iu9ELUOrK+0GBHUXG8IZOX0VJ0RDLr4HabKMDWgh079CmBBl2KmM7LIo5ZzyuAjgMOrw"
+    "XCXouZJ0Tnd4oLG79yDm9BN+LufP7/7J17l2xXdd37Ud1979UDgWQ9MCbENsZ2zMN4OE5igx0TGw"
+    "HB2ElGEvIB8tmSMTLyGoltLExAAsJDSOgFCCzMS8jICPRC6Eq3uzN/c661z66+wpGCpPxxz+6uc/"
+    "Zea6651l7nVO2965yqcpyhpo+maB5s3ceSq+FzBjmKEYIq4nMO4LW8lQaHRtUFU3q6BZt8LucEHK"
+    "WH13YVitAOKbThKz3cxEdhUQbyLBZMMRvneFy7fHNWZ1vsy0dHlA4jFwf9kNMBgZaGhO13OQ7Jp/"
+    "WtFDY08IQr+ADgzmPpmfEOn/7mL83CCNAxh3M+jkYWfOE0Djs0OKxdeCwtGbr2qbr+013JJjvbow"
+    "Rd8dgKk8LlfAUDf15L2nfnKAxo5+MAa4rvSFU1WXQ4RQdnuPPdTY3AjiDYq1TXtr4pU6TEmNsMAw"
+    "s0z83ZnHhNBaX7lTYy2kNnmvTTW4eXc6Sxw5N52qP2jlGbIQ9ym1syCcpjAN6SN1XMwY4+qGFhYg"
+    "QGdR5mtWUbuh/mbnHIxvPD9jrHxOvP0yl/uz4w+aznRuMGn6U70ONQdQ1Zwumy3MHhzaenF9//H/"
+    "7r//jtH/zwmWvDvm7XDKwZ+P+RgXVB9/8j66vPKzoDj37vsVv+/I5P3Lo5vPo39ZMEFxhaPand11"
+    "CtxQOfU2Ag5lYXhvcedBmUqWe/DOStZ2+8+fKOtXmRM8Z7T4UHWyYjNVEUJPZSFA42LwbU5o9/lx"
+    "GHPkCPrLhdB+tZRWEns5K8wM7s5V9kDo9+vgB0FpWfngA5/o5RuKhD0n1zq3jbDkr0PGYZeXaWKp"
+    "DmAE+JvupYkoDGKlm+ksdiECx/0vmhOv9dzEOesJ+L8M4MWPRsVMLhqv21maPFPzAJc9WKRXrbtY"
+    "1J3Jh9GtZkwyYx0695AR7GoqaB3/lRrhJKRx6IcaWfdw5dfueYRs5QVnG+ulH72cb1F+Bpk6aii6"
+    "6rMq7wkTyEerDLZ1PpJz1Rqb37VcfDdU1yh04Y8ECJuuuqxV8OUClNalxjwbX/uISrh+rm7n3L81"
+    "zdH7jQt73frFFjyV2Cc1fjLnFqUZ14Jew4vYeJgj779gAHZXAXn/UsEBST8xfDXPmkXg/vIFAlfz"
+    "RSuu1oyo817ZOG6jpa9hE/vDkQn7Z3vMKZRBIcjma1KxaDiKMwuIF73KJYhpHToIiP84Vq7V2n7R"
+    "J/IJwrKYmrzISIfHDaODbtt+2KkFSFGRrXibnrjVr20cUocSwRuj2gvObA4whdt8ptyWTGtyv7Wy"
+    "/1+6ha7vFu5Dt+8IPvffgjn/jk24Q9GlRrZc3AmoFXNQPLaPCqul2drRm4MjPw1BPPHP3H//aff+"
+    "8Hjz/5ob1zh9czmPaEhydjJiKqaOBkeSGlH7u6YscgC57C5JpB2kB2FKk8AaZiM20Ks8dXlpW1bw"
+    "GsiZvZwOiBbSYy9pwFCrwqTCh6EqIpWtqePDKRiB/e0M1taiazHdQEip+8W564E7sh2ZQgfZQ/G6"
+    "q3nskUJJ1xA3EmIhMGP34I4nhjN8ywwQ85pRBUNvFTYqRtYwhNeHUV0hMstR1XKX0skh2zzTGTKO"
+    "cNrPjNIxl/FOuoqNn5B2M5sRJTxcVtThQvPqgUn6vY2K5jq+BCDITDULzVsM9cWSVOLOwOoBPcHF"
+    "iroJwK/iAFStkysXw5NtEJOHHQ361cheYFZfETR1u3sE42jkcOzHmGO7oCq6f+E90SA/nLcNj96l"
+    "irezKuvNA3teCwqOrYeeHkPsYKmf710F7nHccuvLGNkrh4Ayf5iE3wChBl4gXV9iG1ufWNg4M/2n"
+    "rQJRiQxa92jqnjwHq7FFVCEwxbJvIUbCHqvXkl4Qp+hTT08CSjFYMEyXdCMZWdhXw5FqJoH0Uqj7"
+    "G1Cv/cXqmCPSFp189NBNZhK71eOUEa6ry4nsjBQdH9ANdl+DQZ0nJEzcG7gsL+wJOE1vnTq5hU8q"
+    "w3uvG8FNGvMBO1I4cGM/3xfpBfC9Xfvl2YWJMrnrsQgg5+WEZkOaDg4BefbMYbGGqcHOt1RXvHZ7"
+    "7g8jwTo88hfZZOfvksHa9CJyLym48snA/1y6lHh7/5ha89eOv9Dz18s9R92ON/3a4ZWDPwqmRgfe"
+    "K9KmlenawZcAYO77r3C29/6BsP/5ujq1/75j2uyGmwZ3DNhRwNpB782c+Drmy1WvLVMlU9abRNrs"
+    "KN3Mqo35lmYO/JSwZ5UJlSZEtzGfUZxz2WW0xcoBi1q75ANcFIfJg3BWHzYgIMWXP1JI3Y+2qfdW"
+    "oP26p0O/0E34xwMtXBMoGYT0kDM3DMVJiYGEZwgmvjP8iVs1hHTmNIsNEjvlMHRcHGOHHATd35wZ"
+    "4Hk+wzxbFWHK5PkNiGAzP4cJ5+JHfpK7qlYLclWFRLZohRf+6OcuH8D1ydE0NOZ+LdEPJXJb7wJ7"
+    "39BudJHG0Vy8l31QtmnY/DJEi1fKmR1IR78RpTtuamJ8IujwxXuVK4YLuW8z1ssW9Ncrq0xO8G53"
+    "HFlIypHZT7pOro74hDMVSeDKXuh8C49iMxsA1dkUoQDYrya5DqPJ8N00b/iJfnrxsL/dBxfNWgrU"
+    "fnCYJRD1FujVW94Lbpnm/lqgD4zpcOAc3xspE3Oa+iSbzhoAM86rwTR+hwXDK0JdeOoBNUJR5RbA"
+    "pXdhKPEns4EWGvR+cTEcQmp0E1jERG8RtL2iN2DowPzsgyp2499PjRv6HasKfEFIPYOybVw6ut4s"
+    "ozBEgZxXLIabr7jQXWwdK3dgYwq7tlXzjsMeu+2pPt4tXHp3ip580LoxZfjrD7ZjY8mhgWv86xgL"
+    "OztPlCLrHp5+n2X//8xYt/+Gcf/YvfefpHz52P4bpdM7Bm4NXMQEbIV9Pj6mvNwBWagWeevnjLZ+"
+    "+689/uHp7/rc3hwQVGYAb+05NjD6peTOjtT34AnM8n8M4ye4/ZGpw9OWCcZXB1DmvLAKvicZYrd/"
+    "xJxCCcAT6DtAdi4UwBvh7aaaGCgXC+zIYgHJbVlSFwNhaBJ1VMGCayjo+JYCKChmiCt/0Wh92YtG"
+    "2bkmkQf+0AeQoVMdJBCrtqegKqd5vbbslDxVt9i6V4BpWQzKb1736ZWJt2Kl/mpA1Gf+6V5QNsvI"
+    "+hqcLXWvtSQ1IIJu4SwuXOE5c8uB6obbCjRD1CgwpWMNSN1abj83EE4qK4AWjjBbH2aWofRSbx+A"
+    "df8bCj7sUNcmPLHxzVttfWJTD7GfKhKyVcVexC9WjINyV5cC7c7g1yrhNQ3APXfOwItvzknOpcht"
+    "EW6PVAkmquOPv8kT0UPIzNzgJp1AqfnyetK3/dLFIfA1so1iwiyrYc2IXqezzn1eBomEqyJaeD1b"
+    "79+4jSOxYTRE8WOk/Uf1IxTkrbF4jXmVGo6sHzIflz0+rFXfDcjrrEOZ8HYfPVSKoyXGzFp04udm"
+    "nHorfRzxhSdrZY73gTj0ghGw/nwwktWRH4Ta/KNXloP+wDr73wXmgLO9yXq/RowcUvBktueY5xIv"
+    "kNJhEIPXwZKDi8/aACvdtsaDigehNBMsQujtUAN8/mx75q8dX9q84VvhzAM8XlHAjh55KOr2Mabt"
+    "QXCegPbz5xe2++1VVn0OnpwbnTk7c8+tijH/ji/ff9vCjWuaUzvW7WDLx6GVifdK9erldPV3IGTn"
+    "eu+vP/ddt7fvDks//8qmuu/hlGSk+qGbVr8pQJBcMrA6fEHnOpdZGN38YXRgPxMqnNAGt76RmMuY"
+    "2mJ3ixFieDN/bT6E/VgzcTZBq4075jcFt2XaguzcTRcXtyJKAnMsUTbjqS0lha1HGIdo418g6nfR"
+    "eHd9o48NhhS9Y8ufCtpckBUORCjRoveJ6MS2Q/qPToOBckJu1bdZr97rTq84QYH3CZirhcIDUw+w"
+    "qjteC32cuspLO2bUA45skw1SDKhRk69JZ1KP5MGPkCYBAIHtllYZu2YyROQ7SRXXfP9m7Hdz5rhj"
+    "6YsSCA1qbCSWfOuMKji+lVG3sqtEd8lULLiaeuTHdsTjT4unoQ82zhmB/Fyzk65xhIvPSefiWQsU"
+    "1XHZfzJL2vlmMS0NZ50TL8t6/OKSYpxV72yDq37Re3vgg1CIUZsQTfcfSiFJ7xnBJRHw/kKe03zx"
+    "X7BFd/lVJIzMPbJK7TQ8koOT557aGPxywAXMSidsEAut05ADJ0rsMXDHvKoieoszJDGgo6gtq5of"
+    "rwJ3Ofl2Xm+C0rM1xQnWzaf1PSn/QXZD9i3+dd58N7QZQpczaH0ZZTQ1oauOGkn8OPtK1uQ+2FGI"
+    "V+zO2hKCH+wyEiZEUYNwGZY/JZUucLPoYLXjN70U9Iuh7n835Pn6GjThQc+ZO9vWv2Tzfvuu32T/"
+    "/+3z725PqD48rJWtYMvJoZWBd0r2a2V19Xagb27rv/y7/w+S/e88GD89f+fV2d87jJpHKj3/Tht+"
+    "eYBPjzXWRIdU84NZrWUB+9x+UMueB7AoFJBu+aMGPnxUcmvn0rH7dtni2iMY8nJdgIEA+M/wzV9Q"
+    "ewJyCS9bvvfeWhVZ7ECIpt1923AiCHJ/FXNBYlNtwYo6ZddjAFHX2e5cL258uItn+rT0SJQbYDjh"
+    "saQ1DEyHlUcXxVT8xtthh2nO0F3y4OHLqJ0Aq1q//s0HYo3ndD0rnvOQIdMscEGrFfdjxHBIMbt+"
+    "BdZNOTT9vDUQ9Qw73AbTN60JU4TzcGbXoiKsuJPbDECizHLYsH561se5fzIXqMu//mYuM4S15G+K"
+    "BctlghkCrBJI7Gjz6bFix5IedZELL3AqkM3DvVjdFzhOCCx0nq5W7ZyQjz7pf7ZElB4KBqUCqRRN"
+    "B2dB05f36jBBMJfZWp4sC6i/FsVMA514olx6aC6gPVRrWP/9GIbfG075zSQk6++3iCcW4FuvzcJ8"
+    "uJKR7cctU3B5RFhR65jyPBY4htWdJGUI/RHYlsUurEoqujars+lGnbPBuTQ7t8Dg8SFfvarnYcUa"
+    "rP/HEVludj47UnR9Bn74qIyB3++6E36QLqSLzvY0HczrUs+1ZRmY9zIZHhNn8mF0O/cYO9g/AOS0"
+    "piLkfOTeqtd5QSwSNePbgy3GMSVMf6CuZL6oiu0Was0bdeEqqgb3jm4sV/9V//7CO/9fylS+tv0z"
+    "nf62bNwKuTgXVB9+rkefVyJWZAI5wG1F395twtf/7xj33w0snmnXuHm/3j02MNgxrGNTnc82cQMr"
+    "iTIgZvSfPWqO31UXTtPVoy3nrMZUgN1pMFtxaOxvLuqicG037YlY3b2vhzfPI9+OIivjVZYBISNj"
+    "Dx7QEeqQRMJ/DlOiO7/lhIsqek7qo2NfGjX7JzwTetaqYRVW+ba7TVQfPWwremNJnMNEj7tnPfiN"
+    "3k+Fr8Z1GQvjgm6dCOfKie0DrA5lnaRpAci/CSvvcOi7Olrdm7zuYyWAtRRMnxwtVcEnEkqMxXgE"
+    "C3bRZzWdLfSv4ib2+QLGzJSdqdn46HmFpGgFBucUtmvYELtn3bE9SLO0S2wUfjZk7OtsCzbf/tp4"
+    "+DaSde95M4qqRKu3JhLNbuVJ6TDTaKuPRQvX0OtYTD1ahEC9Z/7KseDcB+TFh80HccnSmdjyEmIB"
+    "XHIypeY9z2Vm3+CuPzperuhDCWaT9wQ08Q/Zj6NnhTGf1xnwsPr04EU2UzcgPMt3sXj0/BdCH+ls"
+    "ByLoEfMYlXlyrdbht8NZdyhtOcHQAmkOVo6s4EGdF34mQx5Lq2FMfkmltudwz8tIyl2AsYC/xKKh"
+    "99zHycTASC160ch8SOLJZwUQaTcNslOFOVzpIyt1sZcL4kiMV6xIwxeD240lvVLbipRREWthWT+4"
+    "jhSfWBb73c2znQgo6rdc73ye5b7/3qV//1nXd9mR8cP7DxulkzsGbgFc/AuqB7xVO8OrhiM5BB+9"
+    "xtH//oP/zuo9+/9ejqq2/W9EFSFnIM6LmyxNuaDLa0GV09meCbx1Ry1SCDrgWW5R1YTzx6cLZcuI"
+    "z03vPuqq9cMWKj1+P02A6WNrLp0YN+AxxT6RMvnJqoyAhuTzyKYK7bmezwucWJBZMC3+KJl/QbDD"
+    "SdFzcwVhFii4M2et45hsvtQMNbdS/SpHVckrFv321DP1rvYwB3dZpJF6XCcJ0YRyVhDP/dT8z6Ye"
+    "M4sZl9SFnUg0pBLH7Aq+A3cSaCxBmdj/NMUni0QcTerksAvHWD3U4Sj4+BAAtGZBVVdChL6z4kru"
+    "5M99+xCda3BcJiWTNPcffkuTHmaB9wTH581WFwYRHevoU2PpAqLtkljsTrKy/inVwDTO9q4h+3OU"
+    "es7I064j8B+oo0WB7HnINisS2xhtHbzhkIF4dVcTl1yd+iT7vdEr8fiLs/pfRz274bXTl2IJHxzb"
+    "YxDe84PmXCa8v8PHTfzFkRyQxLFiV+LjQ3+6q7Z1Ns7aMsjWszJ9+mbBLEkq/KIWJ0faAIQA8i8r"
+    "ngiACpNJf08PgYl5z8zOefbf2aC2HwuEir+GGRsP34zSJAssu5lNCo57VXRHQOHuH6qimxIna/6Y"
+    "tLcjpsJcM3dkDAdvzDxPLYCWgsVsZ7m3gEg8gN+7aAZpjO7v3mgIOLXb8xV2bekU//1ThloXJKwR"
+    "6bfSWYr0ThMpyWcjsHfnNSVvu7rzncPfeuj9zxyQ/98PEn+dbLtawZWDPwKmRgXdC9CkleXVyxGd"
+    "h7+FuP/MKd991761XXvu5Xdzd7Bxq1x4fJx6DJLV4Mn5o5MS4zyKvp0pMEFjqMz9ZJw54/TzTAoi"
+    "s5FfSe0IFjUNaDiSf/86CPTYq14VtEqoHAUzijkrOaEDiGch5UcF3PFCDb2LKlLUZig5im+Ki7P2"
+    "paHa+JV/qemKDeqhOL6eCjn3AlN6Mumf89KQnGNuQmjlGbma1l9l/16i9xjlsdVU8/kzsHgbHt8J"
+    "ESruZ0GElfwjaIECiz30jS1/68JPkhlMTciDLG3o9srVW1utfNpZ9t1oFiiwwHVciffbagA+229k"
+    "2DqPtqO3sK1yIPPnnr3BPkQsi52qX9uz35bj7kzjQUpWcHw9KLLXpTbW10TtDHmJsIshhp55/CEB"
+    "l8Pj9NPLOnjv+e7Lou/NZkuUzSdyKQgFx7V8pIUY7+9HVu+tTFrwezQAr7dCeimA6j+4OHxQsNWo"
+    "0tTZJgpBd8qnWYVJeCXfVEPO3L+YHTtPUcMNQCm/s4qTmObeV6QRDa8hng8XyTNTYUtjkW8mH//R"
+    "ycMZJxCY03oPjTcfYthKZQ23bYF6F2IzYJ84ZVdGD7tm73TcEaywU+3iSbSvfDvZcqMSMNzt1V02"
+    "5xrodjAVl16GKHOvLJxVLF/rICZwnlrM+3fkPEx62CHNzCswCGzueRn4Py69fLcHEu+7xL5AFLlb"
+    "cNtNfvp/LxAY7E+QvnfvZ7P3jy/bd/7u7fFGT91ss6HOtuzcArmYF1QfdKZnflvqIzcOni6fk//V"
+    "+3/eGzl/Zu3T86ep0GVr7f2YMig2NKJiIevBnk9WDQ7EHSGA+0+gyD3nFnAGY8ZZ/J455uGpJANr"
+    "mmN2hdYTD3oO2BWV7wKyzee/FrjgMAACAASURBVC4w18vacRBLHuJX4R1kmxcIFg/+avdEyMQe8E"
+    "smnf2wkbGvOPJOrmLIZAJjYczByxFXH/sd8PiTEE9bPmg7ZygpIsiEhUnH9LKG28l2xCkT5HaMc9"
+    "fDyCQGUeJTXbF321bE7j/sbBz7aoJHbr/aBrFMCMm380YFvyqxcY0WFUDZudpnBDK44sO7xhvNJj"
+    "pqYRhUiIaM39Wj5Zyo1lYcI+SOwg6cqcQsDaV509hqWdSb9DPHxMdFpMmn2c1k/zrROo4tWzcKq1"
+    "iarzHsLet95Qy5n2OdQ/b1aM9gWua6m1McwmdxGdv27ecQIp5HVtW+SbQnbfTTtzwKlKs9BZCNi4"
+    "0TgtvVv35t8FkHRiVXm+wsbXPKr1vZ9HmPCX2c3wQgIHjB26Z5MW0DVxuRuwBazd64VJKXEA0Vfe"
+    "a83F74VLYTkJ3n2WTCCqZsiM85JU6df2W6fV7kueceyn91o3iJEZmsebgRWZ3MpU9+HHipXZdtx5"
+    "bjnhzSzeZzHV5K7dLI1uc2cTdkXCaM0K9/vjK64Dm49MPxNpkEfTs5tzcqQwJUQmoHlNdnineQUK"
+    "S3N3IQYotHPpxYsP18stqbXkj79ajdCQ/aXFVHcKpjxf5Yr7f8Ph1tfTHKzql+jufiyXObcwe77/"
+    "jM3Xe9/1vf/f56lW5J8VpbM/CKZWCa+bxiPlbiNQNXXgZ0Ie6Oz3z6HV/95rc/tHd4dBMDJL/Zs8"
+    "8gq4GPN46ZYPUkzHIGRQ2il8a3xSltCCQ/W7DrAdq/BCRATwQZeL3g4LMg9U53JiTCMGHiT5MKaC"
+    "1XBQ+egJavsEvOAF6zBjC2rYG8/UAUBkjg7JeVmhFEPPEHH9/FWf7pL31zXuTQEwuxe6LVdOwdu/"
+    "yAUdNtNmlBk2J9NwpXfYytM2U/jSIu02jnfqmdyXDFAU3J7Nh+MREDNtK1f8uIRLKRIzXtFYf2Aa"
+    "Ajz36ZUHVUwYhm+E7+LHC428jgy2pqCO94FQ1kicT61lQEkRE3iio5Hmks/qipR9Xp8LaFNJKz2M"
+    "6CW9jmWwgkq0ZCyvEwnwQdQNsV9Vk/iPHlR9Xdl7LH3A/aetheePbIqxcjPB9twg08tjr3ffr7+S"
+    "MFMfKPX3G4QKaHFzc8l60rooKAb1v7tw0ezxRs6zFrtvzNCtXhgO5smbnP6tPHkjq0BZ1QM6k3p2"
+    "COnwZ17Xg0Rx8Xstr1xgFMtjG2lbeDRSKk4OErZfFwrLbetpLeaCyMwcT8jiu5s0ybPs69Tx/KHh"
+    "Bl5ouk+iqcMQHaByLz2rBswwcqVCD1V6+3khZrdtif6le6F/0SJ8jBYWCdHwkhcTWd9CWe+FvC61"
+    "HO83QiRktXGxffg0DiPquxz0K9HcIkgJ4MOTPgxx5rLeyOL+kLv3b3n3zyyd/5z3/6Fx94/tIxiz"
+    "prB/9aWTOwZuBlzUDPvF5W0pVszcCVnoGnnnj6ps988c73HZ67+u0HRwdHGckY+jIweljs4U17Tz"
+    "I0aPKE7J8r4MPmGTOz8BuDctktg23ZazT1ok7k5mOQ10SCd3rhYQA3B3v9IQTnYizRYYzE4MFTQu"
+    "uZmJtLLezhBM8AD123/TkWaRIL+7qKxiKTia4LPlN8RWGEUxWrgnBshIVFGbXPorI8twkVoHbojU"
+    "3nXLes+u0FMgFaqE277z0C/sEH5RBiQkSTo+aQDKwfBp5BoZBZ8lML9OaWnDw2K7lhgZA2eV6icH"
+    "/hKdtl15JmmdstSwzd8qGsqBu9xSy/W3EporZZYkqfljiqLwCLlJ64N9UPxD5vBIk81i2jtcQTHa"
+    "b4dDzkJoG0ofcWTXL6OXxRb3vQxRGf8EWWCmD9uwsVCXgg3mLO8wJJysKtGLlCLl11N31xBxAn9t"
+    "Y1g880XOmBrKpNHg7kZRgeCQwWWnKqhOQHV56pF8TBVAwSpRCLEWni00bsO0DqXQZhrObnGBDUXd"
+    "DN+bG87O1HV6F85ZkYyi7R0A6/Ulxl9EK6LJpRJAd5I0tJdwD2GQfu21YMkhezec1q56qVDYgo22"
+    "f2sYvKEOE5FqQp8QtHZfAU1mA4wOfz1PQB29zSGJzNQjQomqqPuaMHo0cxJhS/QRJJOdKOdvV2xB"
+    "VM8lYM03H2OSir8UYgV9KVVn470T6JW8dto37oa1F2jjRm+bE5lPp078LR+Td+/eGH3/fpO+//dV"
+    "mc02MtawbWDLxCGVgXdK9QYlfaKzoD5//043/xD3/4+DPv2xyeew0TC9ZmXqDpdpS8G6tbU5QiBl"
+    "IGaRY4DJ6+3bIHVO35mwvjMKUnJT2BiHCSIzCPBnD5tx+uLmA/USI3JXvIaVjAIJ6XhyUcYi/jxu"
+    "PHeHS4nDClav/QB6O9YglT+m8FeEAdgGpzlSZGHUOHAlNFNemRSM7llC5TdRjYXb/7HKAt6UfbTf"
+    "tIa2Iq25j3wq0t6pjKzinNZmJxmMVP3qWSaR0JnyeeQEkGo9VTXuk3slEA8bisBNXucxy2Fx3hXs"
+    "yTW6TWaN8RTD4lQporwqq5A5c5tyDHc9GRP/44s3LVU7mCDCl7PRpjKW0pkhsDjQHXeaPuYhzy9D"
+    "v2k40EDcV3bg8UtuGS+U972xbeizhheO7kOeKKA3AfsOvzDBWTXdtKXlx27DoeUJYP7WWCwNtRQ+"
+    "9/R2Rd98uc+BkW0DWPhFBVDqg6NipYwCnsiAuSiSuvTQbn+DqOJQZYKB1LzPvMhSp/xkA89atRvY"
+    "8XEOB8RiiuMMKUkNmXTH2qtECfuwdGf5CcsQXTMvKBPTDJsoBaZMjBZg8ErsmeeowtP6vDsFIlFX"
+    "GWL61+WPAgM2fFQTPxEEt8sU8NdNfabHGOH/Txl2NpurJJnOk5SKPF7TeEODmLGsZU4Vr4HQ+xOK"
+    "4CC+v4tTNSm9y9IQGv5RorzCF6xrl9f7Rgs6Of6Dk62tl/x8c+9anf//YjP/g50HqsZc3AmoFXIA"
+    "Prk+sVSOpKeQVnQOPf3fc+8KYvfPG+D28uXP2L+u1VD3QZMDPIj8VMLWr8Lq0GQDDGeXAVEQNqj7"
+    "NUkSPTI5Np5Zm6BlAPvqgR+c8VjGKnZvND2XXr57bqw2cN932lDYX/4FTsvvInh/aPT8XCw+GDTM"
+    "WEsZvJS093EKuMmFTP7XmSkaPqQ/PBRcln3dJbuR0lVbaJZzgAUTFlskLbQgdhmcxsWYTDF23L4g"
+    "9Qc3RcxWQfcBifZAeLb+zQqfSeWnNZPndGgsTANn8Jo61bi2VKa7qd/BGWsPUYOicg+ZytiYdJb0"
+    "cJp1E4Lwcdc/efzMzF8qKm3m8QBLPts21nKTi70yafQStt+8df1e1LOBDUeVgFAW3+tKfej1SRTx"
+    "F1XULjozIvMRprioXPchAoNaJyh7Lzpz3F8dSbI7QrZGPEory0rxhgW6bAXfx8F79traSWvhVENv"
+    "BEPHyU0gvPnnQDIS/szag67ZIhJ2ZfLaNBEW9zzoL47PijmbdEHF+xdnwFQMLNA+ksfeZ8S9s4+W"
+    "TPg7e/crslmGMFU+cmuVId2z32XVdb753Zbk+YfT3QUwfjffnyLeu6eomMb2xk7wcyt4tHMfCJZW"
+    "LJvvnll4Wo7PKcgZi46WHJ5FOvahJKxmKvHjMe9HwMfGzofxJkrgExeMm7zzHjrJDXcPVxTh51ND"
+    "g5+dejSyzSot6P5fzPMSQe84VCHBkD9nX+6q5Rjoo/S3fCZ6Sl29dnvi9dOtHq7vjmp5/50fs/+q"
+    "nPvFvch+133a8ZWDPw8mZgXdC9vPlc2a7wDDz33PM3feSjH/2Xe0fX/vbmcHMtg+C46uaBlEHYw7"
+    "wz1YOmRB5oWTyl1IRKTS9qNGiygAHfV/ja1gsuSNsSjOqIqMVGDVPXpJCJzWJiy8aVtWWCLcUTFg"
+    "n0v0yww9NU4FmMddsxqJGF2fRyU8Smd736hqWEiWFxTc3xSUNODSsOo8qh+wuWP+eh8DIJ3B6tsx"
+    "1N2bLY6EVyT4JQ2VdhkrA46mNSraJKH3DUcvaJZek7MkehDTHxCN40L7AhivyV5RJ/mOylDReueG"
+    "/5C+9z/BZdrMldSrU7QnI6dImbvvCgn507bJFRfBxsoz7kILg30WaLF/OEyKnGJI+OpRkLjCkY/i"
+    "qmxVdsgVDM7UrFUHHYTrZlHuxPOCD2g0M/us/xjyi+daWChVMtnrbPE9mUXxx1r1xzI/3rmBx0Be"
+    "a0jCDbMhFhH0vOEeLg0Rg8TWXyH6PY9pe3hGHBAydmHjOj6S2I5y3dMEen1wJf2lQVHu3isRZBLH"
+    "LqoWtIWuvoNzq5qjWubLF402uoHPiBvUi8wFOdr87nmcXVIhZ5cOMOjK8goSsb56Wx2oPb12vq6c"
+    "mx+QjOMThK7NRnyZB6z2uz/i23uPWSWcfvixIPcbC8Sc7s332iTV+0V9Cnkg1/lUC7U72aeLms5P"
+    "guYh8Ljs9k5KoEfR7k3GQBJu4JZ5bqYxgTc7O3Pem97POLAsHl1NNnkfPABx3IG5V6Xd3f7G329v"
+    "7eVx76+j+/5yvffIu0y4thO1r3awbWDPzUGVifWD91CleCNQMjAwdf+vID7/j+E0+9d3N09HoGtH"
+    "wNGQN4RtG+zYtWJkoMfBr++UyZBs2+1Q5GBkvfJsOkwwM204EM3LRTMoi6XZiWQ8A7wM1tByiFi+"
+    "8avHFkcXO6qQ2DM5MCLBnR9c+gPfDcvme6sfdMBL3+3ZcITJg+FB5/1RdDaJf7nhg4fyXH1p/dIw"
+    "4VRTFyWqFZPtzJP3L7QMi/Hs5TkAveUHgbB7vil0EmQtaYDw7LheDPMQNWYeerGoDQagdrfJJrCU"
+    "oGgjoI8kSJnno/LM6mkpPe5/hNWlVnWezx71AcBWjkl5fOSfd1IGRse2/ieRykAYoPmHM8Fx/U3K"
+    "eBja79gU9pZPwtDORugcx1vMFtbBn0cwyhY4l2ISkC4NBi7VgmErpqngDq+BOXQQ7G9iMYeLpgxI"
+    "RessqZ5/lgGz/AkgkzroLR5K/8ENfoD3y4QOZdbAfWvak+Ya8HutbbZrKDygVoV2pPDF3CAV1kfd"
+    "yGXhVFEgv8dd0ANCzMkFMnZv5ZwKkf1FnY8Ge59EDAVz9t57zx2hh9bGOvNXMVdCyUyt5yydqviY"
+    "PpK3t5ykmmGKjnfFG8+CYuy3g+Z2HmhZexxAz1wj8Wk9C1z9LTP0r2qbuNH10t8ydnh3jhxIwYXO"
+    "SXOC1oWalw44faHJ/5GC3QpQYH+CZH474iU+xBumFin4eS8pqnj8RZ32z2JTKtS2HJfyuF502CPV"
+    "2tIyWb/c1Vx89ffOftn7r9Xc888+zrsFjLmoE1Ay9vBsZL4stLu7KtGbjiMrB/8eln3/CxT97xvq"
+    "MLr/mV/YONxvlM7jSyZdTUzIE7Xjzma8DjVp8MsBrxhPXvHmm/DMo1kMbACWXCw3DriY8HzYygtO"
+    "GiFV38+F1SZj5SeJgOwFjwLvJJMYdr2bQ68mCJzQ/Y8FcU8Zl4fSumKAbOdThlywzXkcCDjNDgSe"
+    "yRZNt5GAsr4Wwz2dnes7PuS/ziQh5MxL7jbn57K56WkSOz2HbhQQqUvoYn3ONb38iJ9KbrTpm0+l"
+    "WhFcJ9RY2Y49P97FxObGbxppVq2E/t2xZMH6eGnu1zLDuYjq3b0oq4+dijcXvqU3zgbSoV0NC5Y9"
+    "IrEMfQEUvu46zj1X9hgaB71caxT18cWKC9RQE0G/sx5+h8A8snyGHTVoVp12ZLZIk9+laz97lUZu"
+    "wimyoSjJyp7sk+qIoL9hTtK8dulzgxCiX8SDv1suq9cciajmr5QJzjt/QFWesdHwKKbHwFTURQ5d"
+    "yzZss/uLOFWBYb+tiIRGl/VFH1YkgYw9Q53zLNrYjVUSYj0anSb2Jh7tsVOR9FhJ3bfIHKcS24xM"
+    "GqwoueyPrqF4tKbgY85YoZV8QalxsExRcZCza99RUOZyGc5tmNLfzgmos+mV+c5DB5LAw6uBVvnw"
+    "M5ithIpcdIl/qaW0W17wQ4J8XfWGSWw0BBPz/E+QLHKRgbeGMIPIWFgWByBhDAiMw1esRf+3bLRm"
+    "Un+IalKbL2rz2fo9ts+MzB3s6xcrG/c3rTNx95+EN3P/CVtwu5fkGKkrCWNQMvZwa4ZXwtawbWDP"
+    "y0GTjZufqjn/jY7/7NY0/8weG1N7wWOq688FMFfgvY/FrweNCLMxY+Y1zkFq0xkEqqQdITr7FYia"
+    "G3GiyZ1BiveoZfZNLWWzQer1W3j55YgBWfb90kBIHMx4KPuh7EjK1Ja+9JiQNK3GPSUPbE0osu21"
+    "av5M7FO8dMk0lLxQq4QcOXRO0/5rUVC/9xYFmiN6XbYwI5LGJTzezg1gNbx0EDEbz6N4cnYxI6cK"
+    "u9AelcTPLub/cpV2VBTiDXkUWafLqpTeS0uFqDFVzs++qNZQBc1EJQ2JG/0oZP9sIQW8c11MMfx3"
+    "uRphaBc3FW9RPaWBCOixrOqyT8dY5bjWvH44qkcafKYCgolpJav+gygaZf1tosx0O+Ai5d+9F+Or"
+    "eTK/EVZfcTNj9tOC9HNDkWFZB5F3xfeZrxQi7GxtNXF+3yRkazJT5ig9N9qHyp4Rw10t8Gy/lQsa"
+    "GnA2zpT3iX400QhkidLAL8u4qZRk5CHDzhd59dL5rIeW1heSNTURARTJEUp6RgUWQRVm9QjXwUrg"
+    "kbXEzJC35wXOzczm0cnJJJ5+cJVXiBToW2b8HUftZ13Rz1Lhu8viInXvThV8/8ubPk1T5s3AxLH2"
+    "cHFaL5Er63idF8xAu3eDQOECO/b8ifhEufFIe5pPcbSFIbg1wOHUU7k4xe9plrvQEtJYbEUZfV3I"
+    "zExDqWxGSiYi88lsSnZvSAoqMPyBkDOB98wPShOkenvu1rUXesH1/X79QdHuwcvv3jn7/zX73pDa"
+    "//xs/ecuNDwNeyZmDNwMuTgZr+vTxkK8uagSs0A5tHHnn0l+68/4H3nbvm+jfqIwOeg/ibvvTBcI"
+    "a9DH91BUsSX8XKeFgDJ5nLSMrAmQVSBknqGXkzlMcst2sxmGbiL1sroiUCarnqh3nkuAiMLQN0yd"
+    "VCQQSeZKjCgNx1dANLHYG3idXGcKiEEqZg2JkHCZkRgFtxcktZBv74ikUROAfwocssQvuK1zKUc8"
+    "GlC35V7Leri8z9QKe/9AMo+kHQgVhG7Gj9kP/81bFRf/ixeBfpctUu3MldOCdmQ9EtMjEXb5Tpbv"
+    "t0n6vf2zGCuLzM3I5hhgyeCMnFOK6Fa1nLlzgHoPIzpalDAVwGzqnkEWnruvbWq0Es+qcs2UjNtl"
+    "FlaxybJV4wHeMMHf7quOGnF3bgOgVt24Og+y297UeY+JCNFl/9Oct9TVLbdyKavLtvS9ucTNjtNP"
+    "FG5g4tQNXg7OJjuHWOoGn7QtnXGYdNYDiBR9B9dYt81MNtFhj40oPeT1HEvhbLuQpWV7t0NSu3I/"
+    "bVK97U4TNkvNEkDr3Jo3uks+fNJ3H77SvLL1neX2Dir9PgKpevmonv9JIWqmDiiytifTWur4rleR"
+    "YfAjtux0+dvsi3vzmYuv64/pZFZackfaX/kVf/K53kgGPGueHzQzz0C278jVxx1c99WvqujgcnPH"
+    "12PrgyqO/6540HrgSecnVRfaRf9JUceDmkz/O1DD04/MHpl07V/KYWMRAP/I6p4kMvHz6GHNd4F4"
+    "xeqM1xj1btiKqH3dA+vKhTT23ZoqcoAt9TXCjoo/B2+PG5pueMXvP3N5ufefLxp97z3//i4+9+7u"
+    "LJayb4Wl0zsGbgp8xAj2U/Jc1qvmbgis7AtR/XZwOe/PGlf7x3cHC1x02uDKjkc18a8DSoed5kqY"
+    "a96ZaiDLEZCgXzZAuYJ2EaO633oGjjtFmwIYuottViEjM9GG6tgZzBn/1cJAsX+sV/efbCC09Moh"
+    "rnCY3gjnFEQUwhBk89evbIe9KUvTGGlxHOQRFjFfsLkUNP/OHtWBrrPT5VaQb7VUMet3jBtp/ESr"
+    "w6ZrZPPNgQePfRqcMQdcekan8jJ7HBNV8xKMJM6AcXJCmJkwAdYYR2H40FVJ0TgtPD9UC9fQFeU0"
+    "jZ+R/oiRZZ58D6Mzyt2+LCf8DhrnZjUTnczrcaxJBvuCT28kl/mZSe7TcxOMFAO1iwVbd7IXp2a3"
+    "/JuzHSA8kbJgb7eWdhx+pJaJ3zyOrR3vCMZcFVo4AXr57XPu/USExLlDEK2hbdN+/D0f3w6wLy7p"
+    "c9xBZZPzoIYks8jmyJbztI2RUOuRqXHX944sbb1g9/zjmLKzySh8oFe7j9h4pFC/nIcsCLCt86GB"
+    "te/cxBDDwA1+KEhUt/W2S+cVL+tJA51UJux4ub8s/rjbBe+NlWixvaZR/eLHT8RSNTrPjfVw6yV1"
+    "01Ho5L8fiqHfELtxGO31HjFvgsOok3efJeeN6yGf2Rn3zxCX3Kos1vwBXGOWNRVfH3gtWLO/Ujct"
+    "myyGMRq36f7LB4y35HdX8BSemR+zbPXvQJ7WPrvIrC/Rafio8tYSGtA+0+aOPz1qhgbaeq9dr286"
+    "7P7+DRNt7GAxk7eIFoocrzioKA56ceZJzjwE8ZwM95r/7/wte++a1/ced9X/lloTkEa1kzsGbgZc"
+    "jAesvly5DEleKKzsDul770td/84oMPfvD8VdfdqDHLk8kxwDPYaUBjqGOiv88o6yGMSUPkDJgnx/"
+    "qMga7mpWCU4kUUpH5ExhRyGX6jETWzFg2Wy/C73P4XmSddHn3LRrQ9oYOZSV0P5tQtK1/UPUnWfp"
+    "rCugVbaMtGOyI2R/GomUm4I6elYhCV2FGjwNX+LSg1cAp9H2WqIpvtcO3+iRBO6ujPxj+8Dz/Jrn"
+    "GOHyfKDZMUCriqOhar7cziji8wsTDRwfdsykzYscAVMo4+mJaPY+MYUFQBbzKjLVxqwTgP5ZNgy0"
+    "WFHn9gho/qg3mixkp4Sfy/fc4hRzJipW67xZcjKcfOu3iADJ8xWGLreAA5EMBL3R4ttyMpfkKR2n"
+    "FLvdjg1+EulfLnXE05HlXitascUXBc6XFQHV/1wRwVzqjLNpaYmMgBpP+0i0S63DqZNnpqIKj3Gw"
+    "SeJKOpAI2BV/9tTxOBj1wagufctXTuHFCM+4oOfbO9xNjYHn/80w5z4pEQLGssdOwA8vCODaUIWQ"
+    "AWzsfGcSTOvMahDk9b1stk4q++6IVSi0h9Ggs+FpB6HsUdtvIlDt/mDj8Y7HCtnfNqv+WhOSVzjs"
+    "SEmsUH+cx9FkTN1TCHr1TJD3ddQK9N7ODHgYTyRdzOkcV2LPcYSKCN3cLjloR1Hz4YZBQPE8bHzL"
+    "dCVrxGdezCmkftnDUYIyvj0uOUfrgQUlcM8xGJRApy0PTpn7h9MFDqP50XRpyAKbYRbsRRcql8dV"
+    "qvnSe6DfPkmCuQp7sHe/vv/MtPf/oPfuVXfv6h11517vvmWDdrBtYM/FQZ8NP0p2JYjdcMXMEZeO"
+    "qJH73uf9z2px+4dLL7tsML544YDXlSefGkUc6DnkdHRlEeUjIo8qBC0a7f+W9BbgMSnIm/C8N4X+"
+    "nQhIFbimrk9SBavMHSwAf+4cCSwVYTFTuOX5vQrpIYaLSMfXE5WrVtFDGcA1mVCsnyMdgzyPdiCH"
+    "px0HeHUgyOD0XcgXKBw3lC7sdZQPoZMBD94a/2yG1BfB2sZcEhAutSu3isYydFRRD7iSNGEjiHzc"
+    "E+9fBqW5NO490fSGXHwaGqY0n7BY+NuQ0D2ZXtOpjCjZyDHPLYOY+SDYzcd92xJhy7qciSGzV8Hm"
+    "NrzxVH+cQg3KNLeK80FLabPiEh3MbCzxsGZ49F4tKWY+p8xbYCKTeSUaxKndAMt3tYJEcGDC6dj6"
+    "PvMTEFRtYbhwiC9NvG2thOk9rEI62c2cYOi988ee42n9/kGc9nuOfiQAenIzZfxaN6Fm2xCbrqPi"
+    "5I1BFwFS/d6thUCVi67i46vrJfG8n0kCIRN0Ow4Plafr+mgRUVOB4gI1cNH30uW1dfNMJVN66waf"
+    "Xnq011xel0t648qY1+F1vioO7FR8UGrxdwiZPbEH11F4zl4BSlcOkbSxduaZxuaxTuBL/YmpvXz8"
+    "SDPFcP5bc/cKerY74l8vh5XTR83npflZM8GZY98bq/8nOsq2tarNDH+KEvhFQY4+gbD+LMg+VoX/"
+    "3jVkleJv2QnKuOe/KH3z5Gzo9t4Y+cY4Ce/LOQJHccm/ZBHD6GVKTn0cdQDYS2cc7Rq+1zQ3Vabl"
+    "PzP7pIcturAd5w/ri/5pBIAo89rAb18PjCYhzxwd4Njz39o3d/5q773ibk0cKy1tYMrBn4f83Aeo"
+    "Xu/zVzq92aAWXgnvvuftt3vvvYe15z4836IhTeHWbgYjqWQa8qzpWljLQSnuqKHG2PdWxcYpXhl6"
+    "GUkVMYRkqKR0z2DPp5F9ny2thaJg13BLJngjBPYD3QCpRx16OzORnE44uJRPmEm1BUFlHiIg73Ke"
+    "qtLTmYxvXSNWf61LcqDl5VRh0L+hInqdORkqeSrTHE2PTYQaR/TzKlQk0hprM+4oLpT6MwxTg2bE"
+    "MdAdttPVomRV0mwxIZT33QBm25AyruOgYdt4NFX8nEyrqSjXMDOfQTVk0XM4+OqxXX7gN97uNOLL"
+    "z7PmIte8srLkTwmY6GuLh64D32aAE40NqDC8A1AMSZkABXaZtuD/HEi8z8ATv24h5xOJ70w1cTZO"
+    "Jbvfy8hKuKY6gWeWsxe3RuN7r3qBbsdr+im48PFPQT69kqEvBM6aUVJ885e8EAu2m7ZSwcE3Lscm"
+    "y47ZDXkDqWZZs4wCDXlsWFFgiWYwmJgkJOn8yAUwdMBfaQOUZELrEDx6LDCySuQuNHPCw07EN6fK"
+    "vlfcdsfnig6aSwJwYE+s/CRHbmUNt5wsg//W1jv9kFnm7t5nOseGKpQ4J2D+DiapokexvnzA7hQg"
+    "ZMQdinYmGBl6t/amhhh85BKgbfMo8BIhU4/brqW0XFsa9+ekGaBRn9r5sMQdsGj6wXyZhPUWIvvo"
+    "wA8UeeKLEK3s6Iw1El9oGQfEmk6vx74ak9usFEW7Zy7uffrLEz+NHjPRElhsSJrVXDDp748LlLfD"
+    "aIFQl3PyXnOPqKpwQsGmHfIAAAIABJREFUYbXYPtw7Pn37Pffedeuvv+XN37r5xuu+LtruGAGsZc"
+    "3AmoGXmIF1QfcSE7bC1wxUBnZ//PSPf/7ue+/98P7B+b937vx5vYnNO7SMpnpopOtJa25RkVgyq4"
+    "Tqdy7n8c+2MAAahXoGV/SZ6GQgZZCvoTNom7GJtCee8HmCUVeK0M4+GMb5zyJMFcfOdAQuVNlTt6"
+    "22zW2Z3bUmKCLbWkRKjE8mANBh7zpwWC2Pb0tqgkrddsyeCAMcD+8UYc9+IpJKykoXdkklvAEk7m"
+    "rX9IH+Od4GTf21FTzEWz4i09YCbYirC9iuU3MAsY3vhYX+G1s2TIo6r+x9jAxaGE1dsoGRsO2G66"
+    "nSOjxf1o8J13mYRK6OHpkAEh7acP4RZ3qRPbruIv0DpuPhNBQOQNrQB+y+TrY+5sYh3C6GFQGZHX"
+    "G3X8GTceyqVkFkcZEuLKnlvOw4MEmdSShnRqEhU1niIQRDHZBwxgvSxJJb1SxlgCyY2nH1CxnbWm"
+    "gMt5FOXg00lAUsrrjyET9hSe6KGxFK8ZKpxEh/TaHXk+B4yuQzUB0LNjmy2GXZmVw64/RF82+vYX"
+    "gOsp4SmReHqpI7Ctj4dbPkcl56+gmr+0J8Cow/PtOmFVmdY7wWbfzaR1/3Nkfqs9qS5uSqPW3ZeX"
+    "GrajopHuJCpV70HQ+Jjph4EVCEHAPFlCVL6lmABMnrLhhanCt+2WHDIocrfE6EuNwvydXO1c9cTX"
+    "QbduS2cfQFp+6spu0cEJvo9ODKJbEExVVPhPpcmnhOaiFLdzl+fpm00XIc/dySnud+CgA9lJTqfX"
+    "IjdT/vrJeUf3qNKW8KaGfffY5Vk51xdIAvP3E+7Y84EhdkfIEUaeMq5t7e8XWP//Cp37vr3nvuuv"
+    "U97/qu4nnGOTfbulkzsGbgpWZgXdC91Iyt+DUDycB1n/zfn/6DRx57/D2ve90NV3kgOma402jFQF"
+    "YLECYSFD4fx1jPrUse+mjo7dpMNAKyXrY9uYQKLg/IRQ2XB3TAFOn7Xe2+JSs8UQcCBwMy8ArIan"
+    "ypUgZtZ6z7YXoNw7FZQnBgGOqBNJqZH415rc1kJSKCoJZi7gRhgfvatOYXvHIJYJlwqK6ZAfb2pW"
+    "3HOWO2umveoDv0tjE3HBgYkskb8nEVxYGXfQzcF0941Kb/Ni6n7uYUQI5j84OtIoznhvMBaDvJwp"
+    "+kNQdx2l2chCgBuA/oWmVxcYeFKJOv8KRPzgWANI3pOg7sm4oKdvyZFk9FXKYBVTyxAyAL7SqUyl"
+    "egY1sEI5ahWCp5q2EEaUU48SF5xbJYmM1d8ZnYpkAdDxv/LybU6KOIyVT33eeHVJE2PPzjeQmpSv"
+    "eVgMBbUCZG9OwbP5Y3Zgmm/ZEsYlh6UvECpfMqfi3hRMIXeJ4fruZqkp0IZHjZuKG6lhl+yTKPKY"
+    "gYf5Z4Sy/CzQ6LLPRY7KDy65CYTghE+txCqNcn6U6cS8n8+TfTSa/ejL7rK0v4tlgt1PY2h8IdGO"
+    "sra7uaptBmkacF3a7auyzocCt78uvXiIrWYUrK8ehuOhHWg5fhVNKKfG8YJHeYoOklc5vZRlhy4r"
+    "xgp6tizgMg8sNCTDJux+xbOlnMcSvoqW7l5Iqg3wQsPQtAbMgnGEektlfLovfPRJiTY5jlnb9AhZ"
+    "zwxxqYEOxbe3Lj/KYTOX7pD3HmjcblKMORYygdALZ0y3s44gf+sIBR0e6EK5qcz+VfNcnRx3ffUW"
+    "JbnZQszPWp8UN19s133Xf/H/zaW37pS2/8uVvuCxvGa1kzsGbgpWZgXdC91Iyt+DUDOzuHX3rgwV"
+    "+7/bOf++DRuat/9vDCkcalk52NFm3s9Xs7Gsc0DGrgWt6pZFKQwY0EMqBRPB9hb50GxRIwZPa7lT"
+    "2RYwoFDs698QUqjJsaOPlveg+kLCDDRzO8GWAzWGvwdgiJFb0nFJkVEpoH5MXWLsw54hIkg30Y3T"
+    "8HEqyYaQEa/aLNVGXfMaKcCgZVYJzz1XL2Hb/5Jx5PUCZ753Q2lEFsI+xcO0hipDfFF1tHP2ywRT"
+    "7Wl6j1MNb2CEjqlpetNjHLwAU01fbJyTDqTOSkJJxlkhX84ICgyajVudMc5pcseG8xqLK0C5GoZU"
+    "TbVHVCmaes6FnzQgwL/rBpvyMO6RYvYfGbDhL6t706EoO0YT85M1+cGZmYAjGY5HT/ylcdPssdaw"
+    "mgthu2PC/hpS/qo+MdhpF3HIapAWarf1LkM0Syr4WZc4A5hWDFaW5iFH7YS21eViQEBc5PRnxksq"
+    "yabb1Ygo82O8InFtm6jcxsOMgiKxLa1IhKBR/VwoOPg9uqS0FshGOc2r4dEwrfdQCLGiYSxsRarB"
+    "ieRZ11EEnnWxyNYRmk2+u0BaVvE9nZHJ5TX7mcp28/1H6z4Uqbnuma2/M43TvUa5umJVq0sWTxLZ"
+    "asVGxPYPqRagfqDEmuUnHVziLy5pi1rUNhHBipHF30EnN8yKkUPkY+WMFgRFrMLd/G0B+EpITVqk"
+    "vlWXV85ziiULY3xJLewLPHcSKvukrlz9Rp8UZdPdu5xOf1tMA71oIP3Yn2ODs5ZS8OZNjr9SGxiN"
+    "/BwOHeub+OmPgcOTFGl9eukkrkVNIROOCnj6D7HIuZ2pKyWhQPRxOxgbQLc6ovPUG/y08kOKfBIP"
+    "bVX3Nw3PWdnfq8IX0Q+uof//iZd33k45+458N/8sGvX331VU9DvZY1A2sGXnoG1gXdS8/ZanGlZo"
+    "BBTwOVxtybb7v99g9dvHjyjy5cd/7In73wCMciiQGOodnDInAGrYx9PRAqf544aO+hVZhCj8zyW1"
+    "ceOD0wQh4W7PbxgQRytWOrtioeiCVBhQ0Px0TsKtizQPBtWhrNeW8esOG1ZdAnojHJod4IYYc/pH"
+    "YkyRAWk3eJuZVAkYQeW1xrU+Z4BUFHehGDhNDtxo2yoW4m+jDFJ9nIiB0ZOPLtlvg0LdIEKjk2E7"
+    "MS/2OEw2Vn55VnsMQTn2oosIKiUkmwHAvX1e48IkEdAwN0rkznRkwLA2uwtqeKYxVvMxMzt4Xzxj"
+    "kNFnDV7LZhxT76OXJWaGwsoyJwdqnY1vkYLCO/8/F0vR32vg5kdcWpbdWQlWD0e3Ez+sJBICYvKv"
+    "oYOMgGK++0Cd4i5bkdSKCnlzrV2MAW8raRqaqYvVBfHJ85wcO1nIdqmB4pxaF0ZZBaZdtcadJbHZ"
+    "oMu2ft17aSEIOfmGg1ma/JtRXzc1g4+snEH58+O+0cBRN4uJiY06w/VO5HnneWGiMFScSmcuz+aA"
+    "OvbqyTXImUPss7WBU/r0+S7e7rqpoWaf5BgM2B7lI41IIut0vymTdumzQTHKqfqu+wel2gGtkceq"
+    "ir+PVMWvx68UCdUnklfl4/3HdzCOfA0chVGhioHVufKzof4lF9yMkjH4b1xueBP48ovWl8IkldQM"
+    "Mh8e++RY4XF8ldq6bjt4R+6Cqe9HtcudPfIVfvtOjZeOHH4k1f6MLv0umB/JhFoOp7J89p/cdikC"
+    "98gSLHlobdOJbEkSCIgdh5AujanzrBmTLOCR/3HD/y1G8owK2kyAGxaucxiAqdKp9AOCbTc0st55"
+    "QzxEdEeHz5VOaK7Onp5vjS8Zse+uY3/uTu+77yqXf949/4AnGtZc3AmoGXnoF1QffSc7ZaXKkZYP"
+    "Da2Tn3iU/e8Vvf+/7f/v5Vr3vta/YOdIsQg5Qm2CwSGLR455ERizFwDGKqMygy4PWEYlylk87vKH"
+    "uwwyqFgZbB80AD37EGQQ+WUtlOPLQpTCyJzBzVZqB1tIL4CyHU3irYE6H+GVzN3TYIVeKv7NjZJ3"
+    "hxDzqwU1tNdITGu7rzRDjxxdD2wmC9XZAw6EfjvrUvi6Jz7yRP37cARAOFy+ApmWlJqv8XH+By1S"
+    "O2mJsHlvKLrPmgsziE6XN3HBu0lSRw4bIFJEaM3AhXIu/t2zKmQyn23Y0Gq20mtRcu4Vnsle9Yqw"
+    "2wZOxip30tDI2rvLBK2sqh0LQ5X3I1arAWZQWGm4otO1m1Sjr7rX3idRSj76Pzo9flp3gXe5GqkY"
+    "jgSP7aNy4ttYGeizURRUpc9g1glDr2vkoWzFCp0rlt/t4HI28iha7lzh12+stVPJQTjxozp18/eH"
+    "4bRLyFz46u6jnP8xgFer2GiJv/PtSqGg0HeelC2/NrZLKbcYYhE2AfLpEx2TZGe/T+0hO7ldz5TD"
+    "/yBTQw6yGCPd0SyaKMRduprrztq757oMXb/rlg1ObKG7dL8lpG4YtO9NaSaonYiwxeM6xFWjXOSw"
+    "pd0M6vKxbQyOsi0D4j2j65WFqJH2nxYd482o87D0aeAASb40V+JKrXdtc7NvOE2XErVxz72MmLwb"
+    "XDqfRZRNF/kyYu5Ynz1VHqyp6eoGZm8ca3f/JWIdc3D3yshDp+VsftuZ2d57XA23lu5+T552TCoi"
+    "+3efr2Tvjlnz+7ZstC0SVZriickF7EcUYC3cMX/fG5h5GEksGVPmRM8/kvEwVkDMeWuz7w0EeZNz"
+    "/Jyb5OOMYdfq5Hn1Q40Pn01s988Ysf/NVffvPfXP/aax8WwVrWDKwZeIkZWBd0LzFhK/yKzsDe33"
+    "z30dd/6nOf/6cHF675xYPDQ8ZWL3Dyji4DsUYpBnnGQgY3FQYwT5w1qDIIpqAMjsG9r6KBS128Rn"
+    "CLjSY+8JmbQVQDrB69MPRgjdtiZudFpXg9obAtY3AGdb1trjE3E4VwMSGTN/DYCjdKd8Ii+NDMnm"
+    "irX1LErvbgmSlq74mEuWPnmGxFPiZfULkgR2PjxZ3Mi2HgHGrJw8RWAjdST8wSqznsU0l8IiGmjq"
+    "vIt3fgjQt1ZSqY5qI1nElYeXRuWlcymnOex7FEoeLw4arYPMmyMHp3xN1L7LYxdwVTfgaPjqOPgw"
+    "w7hJkOvjnnnM8wZS1UnJYs/hdpHStz5Kwt1Ni5K2p1euh716u3i9JW9m6Mu1m+fetXsjP64SuXIh"
+    "vHT6aOIp0Xm3pOR9Ijs/fGcbmTkXRuWj/vfVW786q943InyFX8068lr0tt5ul6H3+/0TGSgT1/MF"
+    "LgUFu87ntTOo5MlH2QwIFBLkOrYTFJdOEKZ672stjTG1F6KYAWLHnjtYGlFpNxXovCWa9BLNT4Ig"
+    "5/MUmuwJ1qEbevtq/IsSDx1TcWeLDzIAg9eC1Rrv2imQAJxrEawcZYbVV3LlkUtb21sHEOkxPwKT"
+    "Z1L+hzWnxe2VeGeB1qXRvU3ue5YjJVbdISB88ZyUbbNiwgw48SE8cnUR9PR+gOZGFjjNqJy05kFV"
+    "sojZeYPdq+ap+rtoUjryD8vMRZsrKnxRs3tfrWTV3FYyF3yuNEt2jyOOYKnhZ8qh+rfnpJV/64ui"
+    "cu/5FfpceLeUm59Zc4fajUptBdjyfULaH/lTPtZVDy9CC3MYvUx0477cfrG8TYSua+skjVOaZvh7"
+    "7+ke89+sE777333vf+7u/cJtBTdrVu1gysGXjRGVgXdC86VSvwCs/A7qWLp9ffdscn3v+ji8fvvu"
+    "bqa87v+l3GeqeRMS6jnQc4mpQx6VCFgdKTQiZMehebNhMOD3Ha9MQAu2D1rqgmJYO4SUufSZ6seM"
+    "d4Wgi2fQbO+B2hMQCXvfc1gHsyQrAs7FQY7IkHEbF0SRW2kqlKC6DjaLzVNRkxz2xj0BavWQriPO"
+    "Bh8hsnOFJZwnGc0Uk45CIaXMK7iaAg4uUKg6ObbGIy8ajqHGPIBEp2Ph7DJpXRjAvA7Z5O1DngIC"
+    "qfEDqshAxmEjSfjwk+OQh68EcMnR+3q9PGikPq8kc9vOZD0T5SC3AycNTDudTUq0/s3KxAk79BVL"
+    "5QikW7iXa0zdX8xo2GMXXqFakduW6UNvBWFJFXn2ZfVgjn2EFL2ccNnD8jFCJpiTV62xWeeuez5d"
+    "2n9s/z2MfF4EbFX2xzrKy28eWcPj7SOS4nJ2TYW0Yn6Dd/es1ABoxnKMscm9BX+LGxIBgWKp40I+"
+    "/XEBZnUud2TBYBasiGLwLh1kl4vACT3P71GsVVtXymTbdMatF2eHReARzo/7yusDF90BU5FnjUHa"
+    "CikxNc4ouSuHEGP3L8oaF0/tFQpFOVB/UEIgwyRCp9VXmhiCY2RgwwOSZb+AlpWQlMNlgSO3/kyx"
+    "7gAoPD1I3UAqSPt3Ojjb0K477QiEC72HEJCs9+RQXHQ21Krn7Vay3noDR4dXT4NT/4WPRn2yzXsR"
+    "oWuq0Vx35TAHtsWUjpwVU4buXc8yLvuZ2NFnVcwTu+dFEQvpRFn9V7nit8WlTt8gUtLO7xp1gUiM"
+    "8P7d1/AiMs76KnDTpyFro0guGzhTSTY2pREp//5Md/NXZdUoxH+6dvvv/Br/zRP/ilX3roDbfc+C"
+    "UZaUW6ljUDawZebAbWBd2LzdSKu7IzoDXYp+787K/f/7W//pPD8+d/cbPZ3/CuI59n8yKN4elYgx"
+    "YDIRtVGbAyoUjqPIHTQMY+coNkADJ2ficTTkZUld6bC2bJmRhYXnWMiYFSZqPOIJtBuLgAIONLVa"
+    "RMHDXBIAgmA/X3QnxhM3024ss7+Gn21cW29WTJKmKXH8/06F/wc3wE2vHYXhtCcgFPo+yI8aw8Ek"
+    "8XjetcdX86y4OHPNhpUbWz3ttd+ZERsbqw79lOkUWlrTrZE07qWA+/qpGDLl01ZpDn+GLjb4arBD"
+    "kv7b8YOwXmEwneTFN+kbcPjkOiifemsr43BWZnngIRS9sSv69QaF9wtZsNw0XuxkAtfs21ZS+J8x"
+    "kMWxibf5FKJuEUjZHwOUZ0HYr3YfF0vhKfXTPHwLlRlXOzz7/ed9/S744kee6cjAm96RaO2OJrkk"
+    "GxHaQ6peglA0nhueFbNeXUMuOFUXx5PfAyxBNw+9BzNgs4rNVn8H6wbOBP3ycornGVhbTogR8+t+"
+    "ZvT/QCleOgxZq+qIQvLtnXt01udPWNK2/8VMD+5oJeZw78pUZiFAHX2vTGFFHyj1tCUOGItMB9c0"
+    "dKHkiwvN5oQeguevkjDFgJ4IKbV7bkowxxJm1/DoyFCIvXbnfe3T8jsYMNHHH5P46wnc899JSKwX"
+    "ttiCZxEVowQBB2myaamKaGjfU07dtWxchrbWyyIKvXfTuCB6+LXc5JE+oYRN9s8SqhOt2LJow59v"
+    "oGKlW49VGfv+aKmL9oRQyn3KJ5UVf1uJqnT30//2PdualFH5/jU9v+PR6InXO04nJMaBOKWO3I+U"
+    "Hn9GhDvMl3coccLMeKeHsM67P04ODgmke/971/8qnP3fnAH9/6nkePjo4eEXAtawbWDLzIDKwLuh"
+    "eZqBV2ZWfg0b99/E13fPbzf3R4ePi2cxeOjg60IGI6MwZsVRjAWK9kgpChlqwh92BcAxojoW95rE"
+    "GvdXC5SF7rnmpnh5oHgybFAyl7gU/52mgpGTTh60lGBlQUAjLDURl6wCrhUYxMBiYHjsuIbMItP4"
+    "4CWYG1a2z8Rj5uTbK5fKnfPYh3fOEI/4vZLr4Tt9u4m8ryI8sR0j8gFZWFvMe95TupkIzKNmHyWr"
+    "mxdW+EJdc0kxyb+xsLR24nrKvhiXo4NY/VZdf95JhEDqTjkl2bjm6k4sV1LMqsgDbhHGm+qV79nd"
+    "gnhvLbNIpvcFRGE2tZj8kx7Q6y6BC1/86xIWw6j4Vl1wG1SO0gWxD+8TxQk/PKbyr4CZR20Iln+5"
+    "zsCLkyERT2S//S975qcXlA2CcGW09V2vD4PCfu4qWX8hC59vNCNhEuW2Ppj3irOxA5U2MRI7YT5X"
+    "wcd+nx5QUOMRCf+sbEvo9Tzn0Wcqrp87kwbvwFJlq0HZzTa4kWcHrs8wUmepW7pG8p4WcCtKJbPv"
+    "em53Ly1BkQi0InerzxsMaywiiuLsTl/lnPFaK2wlQ4tVnIhSXcbdtfCBNWFnICq7iv2lsuDn5FBg"
+    "39rggioO3zFD/EpDYngHjAg3UttJY4ptS0TaU5u1sdB8eDYnMpOR75kiv5ASyFdT5uelMwjViYrO"
+    "wVT+fFBtYRJrkXr09a6hDCjdfmV9v90BVIqelRbqRVnQUet13qCt3uRrdscnLxNV5a3O3rM3mnfN"
+    "GK6sd1Nc+LPS/shJniszsdJS+k/X4ijiKlh8GKmvGJGIkNPeOAO0Ts3O7PeaXP0unLXo4Ozr/xGw"
+    "8//N77H/yr+9/51l/9ofr2rAzXsmZgzcCLyMC6oHsRSVohV3YGNM5c97HP3v7+R7//xAduuuX6Gw"
+    "43+zuHGoV58jznMaoHMeZODOBMRhjAKLQzQWASwa1qHtuk6YGYcQ4Zdux9ZQZhY6hKziTO4yZ8XJ"
+    "EreXBsY88+7+RPAsLBrgbW7atIUkoOpNxSS9ws8tyqjXwyQTBXicKZRvowBSax7cWPjtKTT6OYmB"
+    "R8iwdg4SGwSxMJD0f9WQG2i5RBLHuwyOCXO9dNbVIZuqH9cDIJJOu407cFXjOlhaCBc1CSbfVri9"
+    "od6shj5eMzRKmUzZggEXDhUNEnN4f/xb6Pns+9jktuWz6Q9HM0IO1+K34OuP7ttjiGvRw7t1aLwQ"
+    "GFaPQbWzx6H6px0ENarIbZuGPpPabDp50YNtzB3d13nsZMWAwYmyiTzI6r86keCsOWvswleCTYwJ"
+    "/9whkbMjBbquVmyYaqK6wes/BksejbKVEp5ixi4pfnu5R+TSEysHTLrzKqM6nn2PM1+K4ILzEm8q"
+    "+KsFyZY8GwpyttmVjrNkp94+TuPlfczunWyQNh1ZZsTzJur+SnBgTwawxZOdDx7/7lGCRf+SxWck"
+    "J/eOB3Oc5YIXco0bvVUtjFRdwDAwwOfKb0cRJSJbmx1scEDh4U/GPePonTUmvHpvRZ1MUu/rBTRJ"
+    "A1hoWMku6IrR6eQidZ9xdPaPkC0hO/UOfaU58zOSYOyHFx7GLTPejjCEn8+Koxty/mqz9tlyvkiS"
+    "kowsV3typ88Y8++hjGmzNmfhb1GsUYStxP/aTE6VU6+rr+qlsgd/nMHVfs+hZNfRbv5FhX9PS5vW"
+    "P0nJnkySelWuL0xUCJOJ45DsSkh3SMiXRjVwmi1W1/OQ48WtwdHGyOfvTU0+/87J13v/eWG2/669"
+    "fffMNfiUDf8LKWNQNrBv5vGVgXdP+3DK36KzgDpzvP/vj5w8/cc887777vq//u/DXn36QBZ+dQA+"
+    "ABAyLvcqrwebhjDZh6jzFjF0OV9EysUjRYUSTzVbBuRqp5FjMAeJhM8CUCTPamz+h4ENRGxabCXN"
+    "K3gxECeDiZyLldnOD0QXN9vTWTCnQCa9D0wO84GE4pkIDwlEWtmrww4CIXMe+u2lwoFopGmzSTCF"
+    "u6rcSYVA0P0OGPviYgELnEU1UdX8fmiQB5kP9GQ0/xrUnEUPy92HBb+rgvX7QQlDGLWPLgXEDWpN"
+    "QpZ9sIWMyUwseGHOrPfqov7onlZlE6t4mWZuRu0wf7rJhietl2WXgTRezxZ59uS0Yc2qF1XJexII"
+    "/G0NBUbsqqdqASX2gNajw6OxLKx2bx1rEZqo2vIBTnCKd4apewaejBLul0BKMfiUfsUjJv5Dh3fP"
+    "AGnT0sft4JkDNAAJ5TwyE4WRQP9hQ4euvz2/GEo/PlKwzYCYl/OKnHlr1q6Cu47n/6RHb4i3Gfq0"
+    "A979fz1MdZApsLCa/PI2G86MMhV+GZfHMe+8ZHXja47pLFnvmxFJ+f3Tp3ubLGLZP8hjPfMHmg34"
+    "Hj82/8nACfe9vV7775M3As4ogjAdcCQozpFk4dU7JCnOiiREas3lcfl+wkKvd+HAjJQk1C/BTrfG"
+    "JuRwAoSUhEkeQ8GfYtBFshdR8Gh3Qk1Po6M2gjdNxR1zNS0nH2yES9qlAgwCznGKZqy5cx+BTOUF"
+    "Vtow34SFNj24usrdeu6mciiUlyhr1KBTFCqbGFpXCuOieOhUbHss99Hzs9f2pAIiq/rDm6fs3mZy"
+    "MgPeRaXc61fbVtq8WbFnG6ZLezp8XdycmzO/pAufb6ohXva2Ena/sUrz+XSdwUglJ+iDB3+nN2xu"
+    "+ebvn1YlIYfliefB4e7Fzz2BM/fM/n7rnnoT+87vceu3Bu/29DtG7XDKwZ+LsysC7o/q7srLorOg"
+    "OXjp/fPPLY99/yl3d87sMa0n7tmvNH/gmBIw08BxqP+PZJ3v0+0eiYwZAhS2OhBiWWUTwYoLYnCJ"
+    "VSDWD8+bYnYXoi2AnnlkwP3sxiXTI5sEyiXlihymSqpwLBszi0ThtPPNzSBrFjQqBGZh4edB2rdB"
+    "T7IXL1MyW96Bb+zYVA4LyLjQhLYUOjaleohmxInDeMw4p/ivdMLtQe2EDCIaEnO5bJ3hTbyC1Lqd"
+    "xNckJ4FO/ZlN1sntmOYb0Jkq0eL2CWmEHnmAPpAvWY/HnGRRxCVH+HzgbFr/r28ci5YkiHfCbOuQ"
+    "vGTRtcEROProPvCXwrTSlFjjZolW57goqGo1xHwBAzBVp94nzgzYDyaN2yka3twl8mUotZZjnT7d"
+    "Z564DTXTCxyzYuXJcxf/U/3JkTQBtoT27ddD1QYuq4lh5JF0qD8jyNzAQNHHsq3JoWTF4X0hcCQG"
+    "4ot8tpAeWgJHQ2OedbbxnLNV4HdEuikOh8l12T4MJ4bbyEY0HGjeCaMGsRd3B4XrdS6qqbPgvHws"
+    "1X5HQljtcrML4Kx5U4cgFFFbS+zCTfzPzdtgxQFnY0KeQW43q1Mq1XC44/pO6b0XRBMv3bDr/qUF"
+    "4Xgg0dqPhVBOaPtuyQOSikpdFusQJQEO1bzp6/HIBwRWe4N44LDEjvgnc09fqxnAPhsw6wYuJ4YO"
+    "Z+UEPMm1NeLFEHrfHBr+8FVttxxPkSjJGicCDBwOwvuZEDX+1SO0UMfr7hHJkyR/JUzVlWx83+iT"
+    "A61xy7zjTp0g2MVOcUMZDzQEeYPmgRt6cfOWeBx62Zm0vP+tbMS7p6d6pbWfImp46eT1gb25H7ED"
+    "LlCK/qh85/Fnak1SrJ/YPjOye6B/P4F//629/54Je/+uCDv/G2X/1LGeTd06Zc92sG1gxcloF1QX"
+    "dZSlbBmgEycLLzo2eef+0dn//ird999PHfv+mW667W5+d2Nhr0+GA5N1zua2G3r0HO76DX2Fxjlg"
+    "dhj6sS1PApTg0y81vLAAAgAElEQVRiNXh54FSDtj/zxQDqQTODG3UGPL8bD6lIanz2lTciDHMNjv"
+    "YSoFhtxySBgpSJxChxrmZPmwyw2oM2cdESzuwVJ2ZIGJx9y2dQIucKQU3MZDg8UcGInf4Yvmn5Kh"
+    "tC9OA7NjuTLCbeM/esaKxwREqEJ0bSGaqN5dp7IYEQbhXHqj14Y0uGzhxUqlSoaWHfBqq6qbapzZ"
+    "2ozN/xl0EmL6UvGvex8hgYx7sclH1C1lb/6FqfOKN1cGXmPhNbVjpWedNQBxuxTYYdfV/g1GiX2g"
+    "p/xhM5sy2V9rVdbwezpeF0oCqX75YJfOxzzOhv+i2vNupFgltsijNWoIJj8uhcYa+/9M0GCLy+GF"
+    "HExE1XtfGtzDLqHODGOccRpYFw09D53vsAaotKmMyrMcaQB0GohoMx41edCTJaHPKlFHqGOwZMrf"
+    "PNj55ce1IuXK7OYaNnEwuFot+waNMtlHwGTpc6vKA7PLogjObGp9w+ya11sCjyOl+WLzBKzuIb58"
+    "SqvfOtPT7ogEom4xGxAEib53aOn0HaxIUNLcpPCGAPrbBS8S3B5MTM9hU75wNTMOyE8flIgKCNlZ"
+    "26k3RWbPZEHGnnalE4bGd92r4rIh2LlDiw08PHSVLccW7aq3WBysNMZ0J75MBjZHXq2BIjJKGgkX"
+    "YqbDHgUfLaJx5UeMyrP09Hq7Vx7t1IjOEjnwh56JBrBzWFnVPoVmyIr4WcHiz2LbNNzs+Cy17Hga"
+    "u9ukWXcc9rrOML+gWLSzuHLPB0tc6fvfOtmXyLZuKGMTnVXh1gvKTkx+U5h9W2SB6o6svFNCae+9"
+    "HTj7/9ga/c9943v+kNX7n22mu/ZaN1s2ZgzcBPzMC6oPuJqVkVV3IGLl48uerLD33nt+9+4BsfOj"
+    "y/eeOFC+d3jvRs8edRNPD5W+M08u3qC8I8cHnU1ADmmQyjE8Ni9ugzoKmtcdBSj5pkuCuS6n8PBx"
+    "RP2GpwVdMD8cSDOzjnATqLPw3onkHAwRxOwU4FG+Jx0Y6JTXg6DnzGb67e0Cfw6NtfIRBZNbVNXJ"
+    "tygykI50kG1PkfccCcDpaOSclSmBbYhi2mtiX2lre9bNqw9rGrRvVD5ikSWwOnJA5Be8PglsB1a8"
+    "PhK5ONMUvYwhNvFtemfbmvIZvV9jFo4iLNmrlNoi27NMofTv4uIDp3sHCqz/AXNC8hIY8+ywqPse"
+    "W8IAptCtv5W84xACin4qZ41L9az3iRMmBNIvI+djk3OBZ68kjfE2SzysU4j4arURmxGdtix73EFD"
+    "HbVqgOr9tEUX22LHbo8JvYFhnBtRszQunVC8botJcC3SW9CeJnZ0+OpXPfSKxknALgKIh0wvv1h2"
+    "+i1MpNV9yO/HtwfB5uV/U9XYXzN1TqjSZeP/qnUfhSk1FwT4w+t7NkJgbo402vB6Nt8GgliMYKra"
+    "Bs13sblgw6aZ0j19MeHaLp28ZlpL62Vd+GaF+4r+dB9kGNnONc5uSsquaJHiH55ryhv8L1uSUzfz"
+    "Ox5I6HfajcBs8DHTevdr2UNmFjM/Z4x2bikNjHyzjq1tYOpY3FWP0DYYzHj7Rom9NkdmQJfULnvU"
+    "+YxrOXnNDFw4LXp5btHb0E9A2/VGGfis4TctSU8S59x6pq7gwRoc8fkSj+XX2BDueC31DYcKWO37"
+    "079u/fceWOMYYfFLc3+DXG+WoiHNCXC3zv6Z5M/+4q9ePTn9Fv033gC3ffff/v/e67/5Ms19+mU6"
+    "7WsmbgJ2VgXdD9pMys8is2A5pnHd71te+8489uv/vDGobe8drrb9gcaJJ0pNXY4Z4mPFok8fm053"
+    "SLSa5k6F1HZ4t3zTNwMoYi82SpZJ1QD5gCgvHkAYUGxJ5kIOfhgRRCBlQGuFqc1fhqW5AehMEPQ+"
+    "BmQOpydvC23/IJlnbbuM5AbUv2DLwMuyWBW/+JQ3L9z1/kYhhwSky0Cwc2TCYSc3hMDdRxYETmYp"
+    "hudHwSa6LC9A9tR0gA4ZeQ+uAxyJvEWsHYmgAJJiy0WqvqKPEvZE20wjPUmLuwc05bUMDO6WKhGp"
+    "jSd97HYrz6QmgpNQFrXoSTzwJF5u7UsWr7s/sy6ONBsyHNhc4hyo/jL0AyNYXvTodg9NOxNSM8Ab"
+    "H4xpHPE9WJ8gXLEJtIkEL2zLT1te9J5xxneHNOkKvGWI5dxVSHwM9ndN2OhbMwTHKcACUn47gNI4"
+    "h13tbVBxtqk/5zFV86QYgFWzeE51zWFFYT4nwWDjt//o7Py4H3ZJhcaGHhb548r4/DXaXPwenq27"
+    "4+D6ercnwWLr8F168RXAXRa5N5Wdjx/OE5RcE3W7VF6yzrCZnfpiNnKsgVI385mySodtR9TMRlg+"
+    "zAxxb++Ik/QBN3sQJJLtoeduoEQC0cjrXo4q7lDYG7bKTK4VWMSqBzaB4si0S1Pl+R+FxHZ0ME/l"
+    "eli3QG0i4cOxZFOt7m4vWyYG3V/vpcMX1zEw6O4KXQ7vMiAZk3x03cNg7YalfLGMdQsCtbiPd4rZ"
+    "SQ3KBKHCBV5zwtorwBqHPHpyjnhYODQvWyw0h1L9xG0GA9winXOtv4cp0DfWuq3lzw7Zf6Bs29S/"
+    "wkgj5rp4eEOd48Fwg2AUtuYjzoNNf5yhsS8qEwdGfn8c/d/41vfPiG62/48lt/7R/cKcX6BSnkaS"
+    "1rBl4gA+uC7gWSsoqu1AxoenXx0t6Df/P4z/2Xj37+Tx559Hu/ff31V+kHxPXtWxpd+GZLFnJ7/p"
+    "yKcqQxyRNVVXsM7LGOIbEnDdwaRZuSMYzBTA0P4OwzYDPg5h1QkMIUDHImSL41ExWKwUg9Eg+42g"
+    "ysfPRkgv0wKWt/hqEC92fuBIENbEJzkOajL4YCoBOOWXVIkU2FyeuI1fhSCuqrPYWHD16aPQFEti"
+    "yeYsyErvMitTximL37pUbixU/qjhVeK4IPCAbx2pFpMHJxWN5Ue6onrpq8SZ0cVU5EiZs+3raWQf"
+    "cpMYSz+ztjt/TErz/3MSYJssKWwuF7X3r77jp9I+7GIac+yqyIEF+Oteza/9k+Ny/xOv72YwUNXJ"
+    "GT+IhkCWeOg5jbT6KQbdnRtq02iSE6ZCPWMurbB2PQQvaKAQM49Ne+mDu6WN5+aLSCqvAS6b8KNR"
+    "70TTWUVXIrHMcLrbPoek4I4fj3Yio2XqCxmJIsHrl6oee2FgRxKA4FmQUwdd792OxstIg7OP+anc"
+    "3BVbo6pytzuhrnLzzRaxHM9JFCaMTo54spWSzy+sPEW778AmQkm7JTPHHuuTV1/uBhwWlmbdgnL+"
+    "lLKKtfWOC7mOZ9Xi+kEAYE3GnV6x2GXXqSH0A7jHaLVEyhk04KcwCooqrPJ+33dOUJqI8bcmIwvu"
+    "Mwg+OCoaOh/261cIrTuVHbeQJW/QKCLr5VkcBX4WACD8CFGPS6prHFiysx+byTzu7YVCTDhxVwmM"
+    "Ab68ZJHX9D3UAvNpHy6HOYmtqcdwSsauckZmBV2PEItWNjE5PmInauCsOh85HFor7ucnej/rGo05"
+    "sLe3ypihZ0+spMXbzT41K1cVZxOmdyxc8bekGo837vYP/CE48//Rsf/+yd//amG37myRtvvvGrgq"
+    "yLOiVhLWsGzmZgXdCdzcjavqIz8NTTz91w2+cf+tC3Hn/s/RpMbtLb4ZoJHe+c17uGB3wgQaNWL1"
+    "Y8ADIeaXTjh1gz6rHTiNdFgxUtJmjcpunBUe0g2DIYYhIJHlzjnU+rY0/jmIGRxaEBA2lOBnYX6c"
+    "D4MyLEJr9MGuI4E5kx2UBag2l5HXGYzn6k6djEN+o4K9ueIDkGfNZfY7e4MBNvsEwpbGD30CW2kt"
+    "kwMkmUARn6n8CQyFpG2JhHEmLKZ7RclQBsFfpRMbfIPpnU1JWV6qrU5AqUN1VP/hxJAdu3IzJZ+W"
+    "s/NIUtKYRLsVE1F8fCLuilz4qkxVt2Uw8n+RwKHuBJjqo/1S90SPpYgWmfKGxnE6MMtt46E5dFnA"
+    "/oxJn1v/SVkyVnMHVc2FM6x646NolsajsWR85n7BwvubNjEwi73Qef44YI7RjktfLdXrGsHhY/WF"
+    "cTCEG44JHCeaaHfakJP/jWac8bG76ezPqN73SQ0nom8lToi23U8BU8+g4XV8zy7ZTnLlyjyfE5L+"
+    "hYyPHzA3yyTs9qe4IxfekFYkWnKyZGiDC/2wZcOvzZN37UJH6Lo6N38Pm4iIAQExT2KSxE7BMiuF"
+    "TAm5xGOlFt8UrXWaPWBXO32NsGjRval4XDio1vI5R83JZZKDzbfXFnAd0+0ZY91JMNddtq3yVItc"
+    "A6ppIoWLfVJG4AY9GMjLgkR4WF80qjVp3dP+dNvM6zToIT33YqCz253WM4eO03S3aVCXGDoWQbLp"
+    "xUKV+5upoxB82pfFCaN7HQH5Rhn1gQxkULtTdUWz6X2IWFqrmIVwCfN8bmbQDemHBXtOG35nb1u3"
+    "cnJ/rZDBZqfFZB4xm3YubqdcfIU8FkHsN4w0Q8r3v8yWfee+c9933nn133T354eO78+oPjfRDW/Z"
+    "qBKQPrgm5Kxlq9cjNwrIHt6R9euvqjX3jwd29/4IF/t7u3/+b9zd6GLz45v9nL5+c00Pgb4hgENe"
+    "ZcusRtTRrLqj2GRtoa3XlfnOEPrIdoVTwIO80SohfOD3DIsdVu+cIChCmwzRMDJhBwY7kMswzkTO"
+    "70x+CbcZLRtlimHfEIY16LRaZ/Q5u37MCkWGEcIvtnYiucMZIx4Vr6KStwFWNZ2z49RR2iuNQWLo"
+    "k8saVCnNq3becA+5nDUILElqI9VcfYxlYgpBLe8EdkrDT2b1DFAlwlVw8xjpOOxcoARrVIRjhWEF"
+    "OZ4wuWuW+LcdXiJn2oOmGZQu05XvLYV2A49+bcwOY8F22F4JazOFaLcJcDaR1j+fEXZSDTYzm+BC"
+    "ULOoXCPaqqni/84df5HBNV2pCCT1z2KVz2Fi4+7NBQm9iVk7jdJ1x3HzkuXgBoj3nyIb38EjEB2T"
+    "367mRc5ApDtIoxOLPwA2OYosPGBDFCFT6/ImRS2l/MJyy/vZXnIvlQ8UqJmhZ6ntRrkquF2rFytH"
+    "t4Td1WebhzeP4aXeXQZ+Qk5zWKeHDk9PmY4Y98oiMCHlOMU5DOCQhD6LdwelQTTcVmib/oMrfmwZ"
+    "gSv3BoSVlXviAKh7bkt0DuJ7eJS4+sUEBc8D98ulYb6+kngIqpjHoxB2TpvloW4B4b+cIWn/qCDX"
+    "SoKb23LFBVE1udUgFJ51TrHPbrqPhylwBGRJW9z6ZhWA7SMRPwvIC9+4wlvl0co2pQIVN7xAIAIw"
+    "YOYkC9xYMeYeJQzbZGSV5pWNQOQFgnDXQXcSOuIBInBKUnJi/clnbiIMcOIJaYVCeTr+ZXBwyTEy"
+    "3meAngXD7VeXGqK3X6Wku1eQ7whqh8CctHC/gJIB9r+djwu4kn+z9//199/Y9vuenGb7/trb/yZ/"
+    "v7myfbw7pfM7BmIBlYF3TrmbBmQBl44onT3c/c++13/s+7v/bvnz7Z++Wjc/ubje7sOND9H9ccnO"
+    "o7LfV1zV7QaUDSs+Z5DUBMsBjUGNeWiaImZMIxijGOsfHeoP/D3ps/XXKd93333WefwWCwgyAJgC"
+    "ABiptIySptkWPJtOySFKlUVkVJVVxJVaryD6UqUaqSH5Q4tBUtjmRq427JXMDVFEhwAzeAIAFiH8"
+    "y8e76f7/d5TvcdgOVUmaYIzD3ve7vPeZbvs/Ryzunu2zdyRZZu5Finns6MDjOP4SAZHWjuOUORvC"
+    "osBE41d+VyF9BkekbY1ckyGOm3iwGBPWgAcPfQNdr62BetE4FA9M81V8tjDGEK+KktLQ0rCuu5L4"
+    "5TSkZG0QItJ2qBOfaaaAa4fHJj2eLIu3jYskflY0u2H1a3xxaMYTQkgG/Is5mIi2J6qiHZAH42Mk"
+    "L6SL5l3YwjcahkjW9HJsCBosp8TOhtbWgxhE3bNsuvQohdGgXU+TVhBth4Fq1YqXtLYHsAgBUwsM"
+    "wpnI65Q4Ad0fgW11hONV+U4FhwGOCGx7onWG16DNQlYikWcUWVFOJgP+948DsDZt8Hi3iZ6bsRyH"
+    "jb9DYRlPMJnboDyrYnoJicjDsPyoHv+ogM3zLocQdOtAoxTorLq/iZsHlfEnVDkzn7bEUpyBcorL"
+    "F4pMcnt/QoJb8Pt33igiZw+rkBva3Sd/75WQG+UyRxvUZQH2HLNnj89XaxcfCRY+F4bVA+ciEq9I"
+    "rUbIvjQ+EhgS6i4VEZLZgq5FMrm8CX0jC+BbKAjg/2o+gFNbDVNhZsVfATNA/48YsWAlW3LdeJHy"
+    "YArmhRfoUAMeDedmXIspa0Xu/jjlgitMkFf96v2IBcFDNW8p2G6jjAgomJGxNu9jex4+Xg0/RkJx"
+    "a8f5BeJjkUYNDBYvYpESiVJKcimz+yPMIoH/24rrXAKB3U+Hgy1jT8Fn77TJ3jSfuno2wxvDBPVP"
+    "0bU8ZJBSKZ5KOhvVhy+eMCppzrUj47uPbZcUrPwWmf1l274zV+/kBxaFK3Rjwu4OQ4WtdTMVv6sX"
+    "v9Jur2/t7ROz738Bd+59zpE4/f84Y3fFRCu5FfLVcZWGWADKwmdKv94PrNAB2LBl/Pvni0828+9s"
+    "Wf/OsHP/8/PXN89K6jzY3TRwfibW/q7tza4uz20WJDsnTUPL1IJ8YPdtMNMqnj/V35Lp06K8kc+4"
+    "UGdHMMUpRe+j6vxKOjhKD/8ZITYZmujhb9Ek/vqUaQAJC+/oLlVRaQrJrBRe7uSTKixvErvKUf04"
+    "AWEv5AV2k7tDyQMjULRByKRbVQYB74iBqPrbUkbPMmq1Y2kM1Ekn69MOyoBNsX4EHSwo+tSTc2Qs"
+    "OR+BpBy4rVMMhWdHY68REnoMhdq2dPgbXdtCzqNjWrCsA8GiVkmzT0X/AeRFm7ZFy3SsmVI97m1F"
+    "uuAPrOkq/ON6/XLTOBRh86nx7gtbztiswkw3bDGINONeOOYqttCnS5SI2mSq9re3vHDsexFxt0Pm"
+    "4au7adCGgSc0/mvI0ydhMzWt7OjZ3kjvTYmnCcHxtlt+8BtfQVO/jZN8qJ8ouVLbg96UDjw7L3Mc"
+    "tBsqzQPHCOzEhM+6Y1E5FDBqRGKfvOJRNQwSiZfgwO3zjWRWNetq6XnGxun1qsexJ3xr8Tt6WXnP"
+    "illBpokwbQDnUnw77Zpohg2t+5j+VuYeNtOSRJVUW3ljG6DY2CBJaiAsWFGCDCaz1LiYQd0cJPGx"
+    "9BaVk0LW7bkTGt29I3rNrWtZPxxXK9wBbqWvS5KhQE5AOTEoCkn3UU/VMJhd169g+0/AtTlZeUOa"
+    "0FJaSqjxvL6+xf/prG8dUTFvEdYieHBvumiSgH32TVFYFIRQOTutvkE6xIukb/U30RU6hcGkjmQR"
+    "Y3K+m4ph2t/SxIQctXMe2+KtEWreKxYvmDaT8SKdTgYAId+a1+bhzL4JVO4owf9t2Tyugf6y4dv6"
+    "WgnpRAdHzo8WF8JH8+zlSHrh8158U+0DiGNpXLUzvbp154+rlf+NuPPvitk1tbz9/+utc9JG+uVs"
+    "Cr1SoD130GVhO6634XuE4TUL3b5WcPTv7pR//up9772S//i6eOj3/5aGvrwuLqId3N4oatrcX5TV"
+    "0h5EqkvszNwIEO6kCPSO1rkHXICwuYhNGZ6c89j/SApjujf9S/21TSX5qSTlm67iRZS8MY1pTO6L"
+    "ShopPSk6FuswY3g6h0ovSNTa+aUBlcghP7oaM7YdtvLSKVtd1pEfFCVaeLFOF7UFGyoiGBL/C9Hj"
+    "bb4jSRM4axY4ABysydmX50+7sx+MygPr5jr7CBUT1T7WDi5nyQZ9mSY+BRUpNzqrUP3oaBXJLrbR"
+    "OzkSJu/lH2OG4ObDtFmNHnubcB6WMbGErnccpT0ycf544Rm+EbgIYxhcB+SpGBHtDBBNv5KatRFd"
+    "1JKFnUrItPVKYdzHTpxrY9pRXcwkTDRUKdm46NfSglSBjy3TqjYBd6B1RVZEyHg+2JT5vitfeRtB"
+    "A3ktgOLRKWzXFhJLdtz0Jg5bhhsjtG5LZHmzg1pBaPNfjkxpO48smDXIviMfu37kowkdMduK0TZx"
+    "fbp84Jlu/FbWkQu+GbF/E9tu2LsWWBxzaJQ/Zyl0T1GpwjFy/kggO1M1rET9ASP7WqG4s627n9Dw"
+    "895LOgojJA0pzMhGG/0RuKotAgd3r00dvJTAv4wofTRDxUgFEBxz6pXpKmTR7GHkz4vf098YCWGQ"
+    "VQ8iUILRMFs7QoS+yD3qVpg9d88GMkvkfDVPcFkhMbeewgY2uOGdl8CN9uiD/Htnzh2HxctfBUrZ"
+    "ow7AM2BAZe4rWHdtjRiIFdDEUz/FxwpIsKP5EikZqVcJQisjlMtOSfSRiUUNp2xo/kmoaA+qs+nx"
+    "pmYEhW9djl7dC06e+kqSsX+TFz2dAFEf8GnjuvXODc0NMxx3o7pid72kD++sPZ8xeuvPDcr372P/"
+    "yHF8+e2nnP2Ztv+oKme6s7dWyDVbnuM7Ca0F33u8D1m4D9Z/ZPvv/jX/zpP/zk5/+75za2/9nVrY"
+    "0buRO3w2NOetzyRr0R/NyWhmF61Mn9mXqhI10xPNDg5OiIq6PVeZJCeqh0U166G3X/CINXOpeIWn"
+    "1nDg3u9NHZ9fcOxkBtRkOuy3xAAG3oDgF1lAzyyot+HIduG13PP6vndacKUR9cJUZPWrV2B1zGHA"
+    "vCKpYTtteo9iBgiWdrkpISMvqj7sEVilXmg614AANDyKbGICYqPZhoZeHiH3JWkU+V5J4QWLLsYb"
+    "/CCQA68Fi/TGnflpVK0AZbtQGE71wEtOHR6Amg63JiYM+FCroff8UvtsFLi2iyk8GgszqJ9LYo3J"
+    "ZxDKI5X5WjZJXtmASNbZNkChM/tWJAN0tcXCKX0pvlD086lz2g7jhb1jKMD6XXvOG8fW5MnPUWix"
+    "3cgFTC6JJT+14qGH8J5gCnYgOmcHyABQUdcp489LZpS1njCan1i4bQqXxkkCwdzwa4yBEe6xR4+i"
+    "iWfd2Z2NQEbuvUeQnt6G6cHqvc3tZG1iROseSSDv7IkPGxHX/sOYNrQGvbOxsRiSmWLQOElaSjiv"
+    "OfDZc8Gp+YJGg6a/QBnBfathp2qkNFO6h1+rtUaDYEcZC3qGvt7Q4AmJMdb0vEylQ4tT1KfJwbxY"
+    "TEsuWw4btUIZiLkOk403TRej+0kOjeXzr+aFqPavaHEC3CorFKlqb9bnkRcpcbATwlx9TLdqpjOd"
+    "9fc76NFiqxj34BCK73EQCIxbkbdStN9uWv4zUS2QCz/ShMte2DsNhfLNP2zAuNNzv3S7YICDTbdj"
+    "8TwZEeJ0u0UWQLfK3Ckl8cuzIWm7Ut6ZjUbalbFXomfDzCycsx1/ipIPWTu3v7ixOnT25evHTL66"
+    "68sPtrD33+81fe/Jb7r565dPMj+uLpalI3cr6qXK8ZWE3ortctf13Hfbx4/ukr25/+7Hf+wV984V"
+    "v/45NbO/94b3Nxkfdv+bd41Pmc2jpa3LSzrp8q0BXCA3UoGrzwCAjf3d5nQqdOh6uLjI89fVK9v5"
+    "tAJ05nRQ+KJMVvuHRNNHq36uFGJyoF6uko1WkyWKq2gWadaDphs91dYwcaGgxV+6pqJMJDJkVSNa"
+    "BFAVlYdKvGrdaQRxye0ZEPSrpcwmg9MMoCQmWv5ZHz95+cHBss3dQbvxVJD8YMw6LyYUJhi2rxDA"
+    "xULwfInfVLzu6o3uvW87oWlhf4eNQ0BHM7LvB7gNa6mDAfHrUizNQrr2KJ6O0roRFv6ZFjSujhG8"
+    "N8bdfSxcDQlUoPIKPd+iA1xrQONQNDu1pKA683Vvky+Us+wQFVNiTXg2wwzWA9d5g2pW0MbNEAUm"
+    "n8lpliEHMYsyhGk3vRbabIkZNv4JdOcD0yHMKd38gQsaxJxzb5DlHvRCJ47iGOuTJmGQ50KwPJHQ"
+    "Qd1x7cliPoyX4meYb2RZ/NbX4r7pR+B1wvOmG9fVJMfSfId0w5p3B+AItV7kxQb2v44OlnHzf2By"
+    "4fjl3WlF6rKv34HnqOa+opvb3JI3JoYn6GEEER4PamYx0drVFQCXYjQJlQ0G15OClRZBulZL/CgY"
+    "lWLFZsI3IvPpr2R7XUWVLUphqiKY0ef8QAQkItAj8yWeb0MssnZIRVfOzRaGXRrO/9gHr2v5z/2Y"
+    "aIBjeNAjKa5CVgX4hN9U5F6H1mbWPEVnLsCWDjLPCi974aaBHzD8sf59QGKkf47r4GgPiC/ykzGR"
+    "HIVuc7IvF1bHP80raJLXnCMaFim7OQy5IYhW+97PN2zQeO9L3GJr4Ts2T8eKbuzumrD/u7x4sDPR"
+    "Wzsbm9dfLEzpt2D45/5xvf+PrijoP9//vCLbd9S88uX7EDq8UqA9dpBlYTuut0w7/6wx7diPoZTb"
+    "88gFLUu3sbTz5z+ZaPfPF7P/u+z33jd7++u/ily4u1GzSZ01Mf0tHkbVvPW146sb64oJ972qDH4Y"
+    "dx1Jke6c7dYT32RCfvMV6NbNwpinZtB+oJk3stwXClkwFctekI1Tun40KXjeKOOL0hHaqEoboYm0"
+    "5WsiOeZmptWONMfGTpGNMJIxM7bqOggaLvBNkZQPLxmzLpVCFAU38bHdUp9h11vCw5k8VAXqt0yj"
+    "V4ESn+l65WFFzo0j4OAHjma0GesRmCVex++Q222Uh0XYQBT70almvhJcQodCps5JpFx9TGepzN2k"
+    "UQc/wai4YFMP+1z0Cc585CtZj7AHT2hV6LYiMRbtNuQU9iZsxsgxDICbnSn2VnQC3AWqC1p1iu40"
+    "baelEeOV1SJf8dgBT6LhG0xkG+LdsfeGMbFxq0OXA3HB/6HAvaNctW9i+EyIgD0BqZ7P9j/4OaEb"
+    "zPDYwbc2fM0omP6AVuHdaFCbLuq1uGbZ47UckVr6D3pEwvcdjQS062d875B8CP9dKTjY2TOmY3dR"
+    "aRf/I3+wWGBcJ3hUwnb2oSggTYSsSXWkRMsPIUZ9cSt+RmxbqAOgYYiQBzxnKlFbJfhDckJdbbM5"
+    "YKwfTWzDp8b5eyA4VCHEEMJZusufBjO3lGtosUJWZM5cp7RDsgEcvDd4zVHrbAmOy1mjGiWWxkwh"
+    "04bBdyFll1Q6EAACAASURBVEctF4nORfmCCTHQYz/09i3ahAkhfjgRhdl5Bbe4qlXLLoXqiU3HAV"
+    "TZG49cCg8t22dnVoO8kHNosSOBquc71pLxRmm/xPbjkGqDjx0KOVBUEJK3ZZ6FLY0SulpTpGKy4a"
+    "CVHyaqqb4wFztFr5Ok+0r1h3D450LG+oYeRSYmfXl9fZOfOFgs9vYP9dbprY2DtY0HHv/us//9iy"
+    "/u3XrHld0/vXjjxU+dOH32ycXmydXv1CnFq3L9ZUB39OsAvP5iX0X8Ks1AOrN0vOmY1NEeHmxeef"
+    "bKuc9887EH/urBr/3Kp77z/K8+eeXwTbs7W2cPeaySjufKlcWFzY3FrVuHi3foyajbzumtkepMNn"
+    "gbl9ZX9WOoe/qpgn0NPPfUMdF587gUXTv9F50UhbGA1+rg0seF4MEsV+HF3PDbVVRBxsJazA9FEb"
+    "mj1cQ+TMEDxwMP9KqAEk+MZrt0okzMeGSmCzitH9/Shk/bpfyYrgSHXJ4CawyfOwrPNItN9tvn8F"
+    "CSQMfo5uQzvlNahLXzBbF1qKvEz0iS/5ELY0rcPmUdjdaxduWpOVm3r8Y2Dr6pNKPFMUu5xqcQs5"
+    "xiaeHiDlwpl4+JmGYAp+1Ypuc6AwbcyGdZuZKvzoWJjRilzpHxS723f2MVvFaSkkznEXpBVu7Tnr"
+    "xANp5AG0LU/2OljUjdNiU/9rPOSqBhuGCr45nDD6iWB8txTATr6mC371KITtY0LM8A07a1ruPVPz"
+    "sgpi90sM8hi3Hr5DwA6uaO7sBpMre5rZec6K2VvB+XizZ6VaWdqRDQtAVwMr/vEXC2m8gq9lJL0X"
+    "whKCTfBZQvPjt4/w+WxPh3GfGJgl/EzZ8jD6xpM+GhaR+18DY1JqiVM6SMVeJVJ28uMx+KMpxKZD"
+    "HO9jO+cIMXG0N4KKfiGGYGrBuoEmj/4sCcv7SvzHSGP0l2G4qVGc22+6SOm5Fwrvse2ZJ/lW/npO"
+    "XbLsSl/AmM/dFkehQu8PW2sujL7OvJFXLOY29XQY248TGpIMMpdigyVcUVl1z0YI+KL34j8lCMDM"
+    "u26Xjx0wDRgT/uUDcOcdXsbuiI5vuQ6KqeCxja/50EUKTDcdc/ZSCEbX2/dOOY79Pxm7Dri5NbPD"
+    "0j/YNdie0/cfLE1ucuXDj317fccusHb7nt1odPnTn7jI+5KfoAr5arDLyKM7Ca0L2KN+71GlqmTO"
+    "k0dvd2N77zve9d/NgXvnL/l7+7+/OfefSFX/jqM8/95LNHx+ePN7Z3tvU9lk3dgdvcP9CbLA8Xt+"
+    "jO3H1nFou3Xlwszmhid3SonyvQSwz4Ue8rewf6LoxeiKIeiPfO+TKgRmO5iqs1kzSVXNytnrI6xe"
+    "lKKT1cd8RceGSwJ10PHLlbpq6OdvfG4HXvC63aoQWr+yw6TOjhxUZPeMDrDnWSCbblq3O1AcwIOh"
+    "PK1N2RQ7TJYDHh6w7erolHbHIgPhQOdrt4AAAMMQ1+VyMHq/2mzpXb/Kg69kCq/LmeNo4ZcvDJa1"
+    "ktn8aVYMgI24GsRhzwqtg9iV2bGtgN3bJL6yXo5Mp80adcMBiaAVUsdmsJbGqUSEEZLM5NIqk5Ea"
+    "rO/IjDTcg6+0lUvF1cTR7x0/ugaHO7kS5oMZI3UTv5Ws91kW87k41GyXryarJ5LUZtwpkiWhS8Q7"
+    "r9jLehwu9BprYDA2cxPOi0WG0bKWOZN9bm7oDuxjOBohhYdW8sdHnYWgV9ydgLXmqycVovOTm92N"
+    "FLTjb0u3Eo+nfjkAZfefH+h66V7ICqNmC43InBlDJvsrhyOHc4+6wWPv6MvIJZ/qUa7IKGZEwtVb"
+    "Nx09KeUUvN5wr8LRvebuJ5XeqY603eOGDPdRzzy/g1/La9Og7wDcw6p4B1Lf4Myv4ncw5uOReFhR"
+    "Db2i5rkVxrXbFhgJwHt+xD019kQOh6TTgMqkXlIRUCaW+0LkehUqY4aIXasVgLASoqTHScZxpmAj"
+    "dt6/jFvllyJYP4vBCDH3FfMoT19rX9AptJJD/yDc17d3kpxNZvB8velENk/N8SsVBBJ9p4thxX5x"
+    "WjpV/b3nKy22t84OeDtvXY5ZZwt/ldWPrag93F/v7+4srVq8dXr+6+eHC4+6jehPmJ22++8X33vv"
+    "6uD971+rse39lZPYY53y9W9Vd3BlYTulf39r0uo+MBphf1psrvff+5Gx78wpfu/7NPP/RPHnl2/x"
+    "d3N0/e//Tx2oXn9w+3+VUCPYq/0EvDF5saPfGQxunjvcVdpxaLd17aXtx25lDvndN9OHc2x7ozd7"
+    "y4oscxeTn5nvpT351TXd2SOzCv6excUEpXls64qAKjI6Sw7A7ObyBEvvgt427O5OgxyIQHhGVKJz"
+    "0omIXtVeRiySa9wCsml13aVvzU9WF1qims0+mCn4FA2SgRdHuS5MED8vpDljWPhXaMYLaN4M8wyx"
+    "/7L+we+K6r06betlWxf5Vah2adkiA2X0iP65Etu9i02/jcAFLw+AVFFcj9kw9pG9H5tkDhGigsgi"
+    "hgSywvmqe1c9V2UcEP/RkSOYod1LrkAz4xLF+5wtm5GvXelg6k5VD/AaXljTPzzQGLmDtHU4iWl9"
+    "zMTTHjR3gyJGbvA71PzLd7577XuOaLHe2jA6lY7Bj2q2Lkbmc7Eiaud7gvsSUGdwjwzzzsSB4dLq"
+    "JAZx+wPwzuweMRSHh1LIBgBVR114ALODx5vVjbyg9/71zQHXe+K6fvxukRMd9lkY4naKhyh0IGhZ"
+    "g/7aQiiya6/XMjPqQaPrn03ULUrQFXBezEHJzQRDG3F8lFWnP9JSix8YY7hfZlxox+fGYim1I2JG"
+    "fbNF2JjwrHTbTQz4uC1Boy8RssTNkGj/qRIhvoGLolnM6X+dGLFAAtX0xWAOOIQMtL2c9ExVJiIa"
+    "JltqWNx9/kcLJNSsEYuZA9YyIyTFPJOQ85ipd8N5Pt651KNPHsFnwJ+JhhEoO07/qKYQHshd/7LT"
+    "nwBTYxfPesRQvQ2OQcrNL1z21YzpcpVFMRb/gd0dH2XbpcrihfE6Bj4rtsTPzYZYEBp8Dg8+c9BX"
+    "+SDmNkw3ORkkMKpXIAGQq6+jgXpReyLqooNzzGzPfPN1TnPHFya3NxQsfZFm+EPdhfXL2yu3jh6v"
+    "5i92BvcXV3V+8Y29/dWD/61omNjY+++Q13/dFPvuWBv7nx4rknbWu1WGXgVZ6B1XfoXuUb+NUdnr"
+    "svdzIee+mEv//c/uJLTzy9+MDnH37jX3zsod/+2tO7v/ns3u59z22f0KOV6hw26PQ0iVPHsKa7cn"
+    "seEGzqufy9xS0n1xd3nNxYXDxxqEmeHu9wJ6or7eqIDvQ5VG+WX5ticKDORsvRkdJhqa/ql58YVm"
+    "0GhZlA0TnpN3V0dbE7aXdi6RlDMyrDEO4C8L29ECyH19XBjR8appdUcWdaA41c4YYGRvWQkuOPgo"
+    "rtS8L/3ZmCQ+dKUMalIhpBlY4JtYjvahg7RGzYl1qPQWDlwfzC8gBSPie26Hcc7R/+jEJVunOSYx"
+    "LNDFZm1sCDWPoDTwWIMZm1LIChW9dxS8iYrFShXrbHWiQX6FUcmwWKIB5wbQZqt2OmlWOg89ZyGJ"
+    "3MRnaeK+fd5OKV2RjsRtbJZ0KBgoYf4QvbeZqwHbWF2wM8pNjv3rFHYqCjIylG7Q4y8s5/56R8bV"
+    "kP0pUcsHNXINvLMMJA135brz2I70GPKer2q4jRKV2rcQcGOwLKLq1jkgsNajBREM8/f7XYN4K/x1"
+    "c8h1P+I3/Id+QEs7G1o6/pnPNjlVs7up2vl5zk8S6xOQ5RFC7Fk7kEOaXHLC1w3PlKpruOLsexYW"
+    "wfgOAZVAviNE1C5B5zyRnrwMKfv4Gyda3nRmFIAXRaxrJe7Pn4r7lQtnHsFNcaaMOLTyLZAa0pHO"
+    "OpmWxSG8OqmTKgtbeRCRHwthkYsUhz4I2ahcJxLPiDHI6zzUpDKzAxy8oFedHjZRMjTyv7AG1JoI"
+    "cypfOvZi4IGBYxnzOzH0bPYQYSxaHe+cIX35lDtxxrO529QnIfA4C3dWG5ju7wresG5KSXzgk9ZP"
+    "BZ/g95tpHjwUpK/FAeCQ4ySUJv8PO9dJFCGxVk+W9htgEEbKDcCCL1RoCEP+58kBBBbb7TnguMHK"
+    "/65qr6zz3ReaKGmA6PNhdX9Qbqff200JG+FrFY17ffD/dPHRwevPGZvatvfPDhb73zqWd2//Vb33"
+    "jPn7zujktfOnl2dbeOLbAqr94MrCZ0r95te11ExsmfPudQv1dz+Ozxxlcfe/Km3/vw3/7MBz739d"
+    "/59vMH/3BvfeOWQ02i9vT9NwnlEUe1ebnJwaHW6miO1w8WO5rQXTx7YnGzJnQ7a/v+IVNfEdWV+o"
+    "PDPX3ogPidKHUe6lT6uwLqZ9LpkW16HXdMUFXol7pzUpM7Ttxl4zFL+jAwPMGQDrpZRZdBIV0ucp"
+    "RAa4gijAwWmLCls7WNiJlnk4JJR48t/QnIjx8RLx3sTN42EKB4Hb47+TDDaz2wTcG/0iuJtGf0yV"
+    "QkiLNlh00RJGfddgMpgjZVddMnMFQ9IIhI2OCKYTr8avfdB0MYMXKwkYffLz9At620e5YrO7g0cL"
+    "BV0r22rHF70Wgl0cpDEBdCbJZtqNFti5b9mVoJVMZR6iJF50DtfnnOEpbovivMunW0RofvdrYufh"
+    "W6JRnQ9iQdl9l3szWxPTlIpOB2Thyf2dk2maxIIkKWGzbLo7aNHX7ao3MkWBUUq9jHbiSGeMNSxf"
+    "zUGdfaTX6smKrIHkTq7gMXYvKYJcek/Pfkr+JAXe3Ndf12nCZy6/p+3Ka+H7eu36k84s5PDVbjFc"
+    "L6kCyt2+9M7CThjZuVBBQJ9+0QRT7F+Zua8bGZYx0BPHRYQ5+2EIb+qJRtpG1R6/CGj1JyXeSmtS"
+    "htY6JiPnDCoW4hGMGd63qiIkV0BTEK0nxcDJw2vlMG75qWcaAJixRnH5uA2bc8+TDGhIVE9rHI4o"
+    "tpYFHsgyIJeyJRs2AsmREuxuOn1pV1c+yDKZFuzJEXkeMZZpVz41ybI3yJM6yQT58TzdBm+xfkme"
+    "+2LKG4Hh1ojTkcMA3OJEMr542yBcGlZeJbm/OhIr6xa1sC17asZUcKRitvC9HsIbLQWEqf3cp0bU"
+    "v/Bp2vbbJn6GsO6oiv6DfrTupY1NXRxZG+R4dJbLk/1GTvaONgsS3e1auX73/4m4/+D089/+yb7n"
+    "/irj9525vu/tC5G898X+et/fZt8mhVW2XglZ+B1YTulb8Nr+MI6AbUB2ii9sKTV7Y+8eVv3Puej/"
+    "7dr37ki1/9r763tvG257c3znGap0Ph5wgWuprnq/Q7WyLobVm6+7SuN9Id65GNMzoSbtk6Xlw8qd"
+    "+h0wBPj+tbj8dWuDBPB0OHwvCLjpUbV/3dOfUmogoSWnVodBgMAfyHnfquHHLpmFXpQiemv7zlTx"
+    "4jVDhgpyoJVfwYowa4GESH/6UiFnTbK559QXdgoQFeOsKIsQQUYiPaEVxwcS4Hv7Xk9yRQ/igfQM"
+    "1guNKPXDJFTNiZfHIskh9vOkTZIK40ktboVU7aL+QoYKrERhDhjMmaeSxKnhywIV2CSxV2MICELq"
+    "JXoqoOrenIUTfdONPCclLsmCyLTWwMsbTKhHDY/sJEasSj6qQwNLsCQjmWdTUh+06c8MY2gqgSe+"
+    "ULzldJLJF3jKKXG/YJnG6j0rjQQMs76iqmCbbQsZt8Ed4sCcaxvThmed/pso3YYTKJvkvJBW+a8O"
+    "EP2UMMEziLaLQq3jgrvnie2XEXjwskiGd7eQto3zjijQ16nHLtxJnFll54sqPfkdNr03384w/bCn"
+    "Dwjc5dhsonK8eEPRceAVTpJhWJu1gmKJ3TFowJe0Q4KsSEbM45rK0z7EAJrbchbVSjNRyAnNxzTl"
+    "GJv1pLENn2xXmJcrlPQ37IudhIuy2ARUnGwem2iW50DEihFwTViaMVylq0s4x0YxdwRwZzVl4eSl"
+    "4VSO0tdtsTq7lp4WSbAihJmepY7asUOgbDORdtfHIkPlR0bRjszOSoOY+sKSx7O/TkEKJ9cbjIq8"
+    "25fpy/HIL1vbAvkw9ou3glZf7rpJKYHGFLTTgBc3aDwDI1782q2iXZY+1zrWLMfpOtb77jRgAFUw"
+    "Kjg8566IjtvXDoi0AcqMFRx8j3UtfUIe/pbh13D/UAdLyRMhej1vQEzga/Ebupr1NsbW8c7V2565"
+    "kXDy89+NAjb/z2o99920+9/U3vveu1t372xMmd58oLoa/KKgOvjgzo4nQOzldHOKsorrcMHLy4u/"
+    "jqI1+7+Oef/vI73/f5x37rm89c+eVv7F+58/LG2s7B8bZmXzptax/f1pU9uhyd7vXVFz3QyNMZ+t"
+    "XSbfEvaSb2gO7OveuOk4vX6gcMzmwc6Wo8HcXxYl939i7rZSi7elvdFXUUB+pF1/SI1QHHDT2CJ2"
+    "qZNHJVv7oXkRnoiI8MotV79ACJ7WQSDAny14MDZIqstfj5N54ndO7JA2Ad87VQ4XhuG5HN8W1MZo"
+    "rDKfrHDBLxrx3EXJd+FI62MQNV4hFk2fZar9fL9FkSWqDXYhG/74gCSD5a3IlAEONixqybI2dNJh"
+    "4mjp4RS4S6eGh2cXxFGOc+EaGTSzD5x/fBb+XZeuQZf8ArH2bptb63D+zyA/GUKJZqQ4gVX6A7CR"
+    "aOlnPE/maWJVyfkpXmtculWHDEZdrf2gdisCNa9bbvHCxvyyCwbC+I0xOuzJAmgRZqbK0bs2NFxP"
+    "jlCHznsdDbF+SjK8GKYwZrXvYJ/NKfmPAN08cMbU1e7Leu9MPnMg2jY+q5S0c05HlnsXP6gt5aeV"
+    "Z35PQdOV399+POmfrJXs4pTAY7Dww8ne8eaGvQ7n1ZAvhE8QUd+T8uAHnnaK5FtLBCAkBNzjn2eR"
+    "0ptR3jWGCvhLBI9WVKZCZGY3PszHkDqSuoCBSZ7FdqY/saO0TjfeIld1cBqFgUt1ULa9AtUZDzAL"
+    "zNZehaW2pXCkG23Ygk/rgXSu/HeekShuSDc1c+2SPoheAVixKCNUrnILKdiHn+EHWU7bt1c55Zjj"
+    "15b1+8jwjW/kqwJ27mawFC5uBkOufyQCMcWuMnOXATR7iFbaVahN2hSxpC/Hc9TftEe4ozOZxvqk"
+    "IcK+TtdQlZlzg64FmMzcO8jy32Sf1t6PjzOV1IXFThDjFfT+C8w+GWfHCRRf2xGv4ZEX0v/thP5x"
+    "werK0fPnfu5MkH77nz5j96632v/YtLl849ur62sTecXFVWGXiFZ2B1h+4VvgGvD/fpSeie5uV4cf"
+    "mpw8UXHvrKPf/zX3/gnz701OFvf/fq3lueOzg+/6KG9Ie7aBzkDhzPS+p5/C29BIVO5UD1Yz1iuX"
+    "6oRy3Vwdx0ekePWuru3InjxQkmczyiL1N0Cv7+nDqOfToMuhXV+84BVyN5dI3OF7rfSMclRrnad+"
+    "E8SQGLAaM6mgyC6NyqSBeaB63V2dHHUWXNh9Jt1dzuSQsNYhq4xooS/jtzPUiTb6MDBdNIAES+eb"
+    "Tg4TPFdANBbPH4rZZlgjV12h4YSnjyLboAjJfAiEtHbYgAuErnHJeEXXU/3oWlbqva/kJ2cZLo2D"
+    "OoBqNS2m5KLNGVuSWMDCQK6hq/2kdszuUcfS2IZfCx1Hm1MriO1gasYpK1IiviMn3WhlFOe3BXsi"
+    "bJztxuGyD3XZo/o5hFLO3nsmy2vfPXtkoWmkPDruodlQdS5WTba8xEEltzv0bOagIUX7hLKU3hO9"
+    "cdeIERcz9GC0mH3pDobcPx50dpOS4thAwxYZH9Ixjsgd4Lta/nO3L89MCJxeaJG/REF3flTgtfv1"
+    "LJ93acDMB0XMlf5tYcIxxlnmaDqT9CyTmCFn94HB72fW4BCwB++3LgWkwLaJC16EJ11gxqiERAjM"
+    "jzGbkX0fk1V/Y7nxZuYK1JBnpOOvQItPlhtgisejt5BygoaH0XdfgH9suU9gXfKYm1ZWPfy1TLHv"
+    "EUwTpW9SI+geOtKRpyI7SK3SSoapMr+Kylo0ZcZZ1t2NLTujPRPkTPOAhxMCwVyYnJvpAthHzOTd"
+    "DZR71feSu1Lr4FqvuZ+XYnrGC1PbVaVaS+I48bI6fw7bKVJ/3WE7n3G2yxH/gcaiXx+JOv2eZpg2"
+    "9PwHWhMp0z+oImsfhlKG1D+3z72Pnu+NxntJ32WT5wTZb+0Xf/atvwVI7z6j7VD/Yql1LSI9B4kj"
+    "6Gt1TrGNNTOGt+FOf44uW9w//yC998/PWPP/n8fT/zwN3/8q67bn5oe2frcmJYLVcZeGVnYHWH7p"
+    "W9/a4D7+n4ZlcgdfY/0i+Kfv1bT19838c++VN/9YnP/zefffL5X3xqY/3OfV1F50dH9/XZ0Imexz"
+    "E2NGDS+F6PY+i1x1t6VAp9OgW+J6cJ3SV1MPffcGLx5gvbi5+4fWdxw6kt3cPzDxKoE9OjnFePFs"
+    "/q7Za7+v5cJnXqLNRB8JIURp1rGux54iNMOjzeSsefH8WqDlECtZ20RkYtSN2BIetHJJEyE350jC"
+    "lad84Sdd13C8DRXxAnXWQAmt+hgwLGsANBZcIfpk0LD53kHjtIgJ2OveIwXaywI09e9EeJXtmhDZ"
+    "4HDKqANZeDJF5jGWC+gB9YUa3smCB1vhCwiNamYbCVVI/vBRrBOAXJbcDigu9gznQ611mXWumwkp"
+    "ogZiD4wH4yZFpKgirIU4ZPAUgbv1W8rHqAOB6yf6G3hCH6UtsI7Vc1eiVdezOwm5F1+wTeiKhlh6"
+    "543l6TXTtQCr1NwOLPWMXrto+dZdOzVoSl7v2GSIxZ9hHkeGZE60Gt6AwWsdR+k//YzWQuQJJnu+"
+    "j4ps12PuIij6ZafqTy5AVN5PS6W73FkqOLMt0lpIUuqOHyVl1j4ZdZ2kZ9DCDHCWhWOi8CNU7SGj"
+    "9brGWwjiXsed0CTS8eK+8PyElw2n5qzBRdjUGR5b/Okw6x8pS4QKMonoQvMrgGDguu2qTx2tKeZh"
+    "uTI22RsonsUCk8xyii9URzHAVa5ktfrRZunHIp8I1sIeNlqJ+2bZfNrsNx3YvYxkj8LV/KRkTahj"
+    "eJdVkkT2V3Lh8lCzgu7QuNQF5aF7dyh5ucsx+XlET6QgnHSvoVTW5Ud8wVgHUg+L908SsJawdtzw"
+    "6UXghaTiqqzhol4G34MvShX7Ggi+/zfCCTc1btazMfHYN08J+StqumMRnUgzGOt38P1lHxu452U4"
+    "vWtb7sC8Rxa02ecqEGG2rzqCZWjo6fPH9652P33HbzH7/l7js+cumWC9/Q4c/dupcGH3dWy1UGfu"
+    "wzsJrQ/dhvopWDIwN7x+vf+86TFz72za+/8V/91Wd+5aFHH/+Np9c279vd2DhzVVfQNe/ST9Poqp"
+    "xO2VuaqB3oLZa8KSt30rjKrrO1BjBH6gv0zbjFSZ3sX7OzsXjLxROLt964tbjn5hOLU3pj1rroDF"
+    "b29Xn2xcPF87pEeFWfA67S02ExieO8r3WGanSu6kI0iFuXjq8R0ikLJ50PnZU01DnRWzChcQcmWY"
+    "rrkkeqOzbLY8KdFXLp8HLlUzYcDNrIeGkRd6YeZLdu1r5jYVn5ZS8yUECTMkHAl3UtsIUfxS07hV"
+    "tkOs9xF7JwicQDfWnO1Gm5jb991RYSMboT1jpZMBGWCp2zltirkngDPTpvB9CeFqbkgws9NoCwz8"
+    "of6wSlNf/V9gBfA6/55Dc8lEFIsd/2L8bJa/uP/FIOrDIpU7NsB0fsBCa98MqfstXyY9ux/X9AIQ"
+    "wczb6jqm0sCw8ekvgq23P/J+m5cuotHxnRSgS6MYhFf3M8uyQFQqSYX7GG0hJp+Yq8j5+0WdrHBG"
+    "eiDjkVHXs+zIiBA5yjn5XwGMDpL7MO1eCJxrFtvn+eAIltveDkzGJbvyF36qzuzG1s61ySgTdY5T"
+    "KoI1fUva2EiR8+/ss3r6BxnHPMD3rludoCdGk+DWcBfu0LvTY94qUzpNMeTeKZfF7SU8PcGdGyBF"
+    "g0r661DzP/tjUWplVOTJy2OXayD8QX7xuS7+2fmCVBngCneDVzpklm1uJlc4cOJUjYdV2ytsd+QV"
+    "HbJsYi54SkunyYHKxtENVA4KwwJBqdnN8TYeRsxlbA48M+eS0PDWEZjnO5RNS/MKHzhC3gVsJWLs"
+    "xx2SA6rL3/IiEShXx23ObLqFnGEsV9wsi0efQJlPlxBUZLUe9JpgVni95n5+cR2PZDNuNPFPK9up"
+    "ly+ew+AL+RN7vqblDPORofnHC8Rtd8LljqEWi1CQOS/abSMmKYzrnAsdKiKnua2OmtmXt6rdFjmt"
+    "j9u7tvveXP3vLA3Q+eP7/zbT2hc9WCq8UqA6+wDKweuXyFbbDr0V1eKP7M03snHvryV+/8f//mwV"
+    "/+yEOPv/vJ/Rd/6vLG1q1XNzY3jnXHzN990YmbTsgneQ3IGLhxIqfD4GkMZl/52QLxxOfFJ6c0sb"
+    "tRX7W7oLdbbkmIKZqmfHoSSl+81g/O8Xt1vBOPu3pA0DFmsKi1Ow46DVW6rt7Z3TydiEq49oqnQT"
+    "KYxCeYwuw1fnriaR30EkdwLRW0wFb/pIZYhOn+Wobp/PM9IODlI7iKxYPdIDgOVc1j7U65cBgETw"
+    "JmIhkZhOkMZdSTVeIoG/ETeYRU8JO62wEnFymKjTyWvrMjnAwe0IGntfmBKkWIIreRwIOL224Vqy"
+    "ewUI01qVgO2y6sxesc4GLnr/0bWKUi9xyJ44FW2LU1gwtt8ErRhsJmiNlU4qWRCwDwFX9hugVfxf"
+    "7MMBxY8SxQi8AVAKthqOIUoWNDhdgdf3Zoo6Bi1doG9qly5gGm+BlUsjdI0v9oVKl2pVdE9pU8Dk"
+    "XenDuLxrnGgASlc9F+9nHn2LyQFN9hEyYDYh6NlkOOAx1yA47j4uDn3MAET8e9j0/xD4839R258/"
+    "pB8It+a+Wm3lrpizTKA4NFPxqGQzoDOEDpYFrgk/8hmG2DsKno39+pZTBKcua6rs9yhUTjiDff9g"
+    "YKgpYpjktVMj/yA8tmoIpePkDrKj4QAKbAsE+sS2jgli/dbn1DWbFUrMu5RwNv/XkbFt91xMo+Jq"
+    "iOmZiH+QAAIABJREFUUjZaANc4iLMfln/x0m6jZ7/nuZud1wau7RdOE4tmDBY+Wcob9PtAFLhzWT"
+    "pEQ7FNrQOhZRztlddTXEhNLSu5ae3EJn7HOPDFxk6fw1DxJKjQjrSfe6dAQDsHW7ePh2A0ZraCaW"
+    "DIVyaItq561gGl3vucj5eSx33HjCnbIUHswynG4FhzXPjiimWRYF/wpRCRnSqIVFAEmEo1c8EQGh"
+    "dlRDR/su/HPkXzBUP851hCRh988+9Fqt4+GMlGRRE9Xquu45/tiQ3yxgXbvEzleHv36Ph1T1x+8a"
+    "anHvnm277x1HMffvPrX/Pn99516cFzZ7a/r+u1+2CuyioDr5QMrCZ0r5QtdZ34SefCiZyTOJ3tc0"
+    "9cXTz4yCOX/vQTX3jXJx/+9q9/45nLv/TC8f7rjjY2d/iatB+D1J043VhTR6GTtd5ydaRbdT6Fcz"
+    "bmrpr7CgQ4xasT3+dunb5TpxP7pVM7i5tOLhbnhLaut2Dy+nIP+oS1J1/2NcXjay4M6hloub/Qwl"
+    "cP3U2ofxEfHmtPIrHLR0RiyGMykETMKzOtT6cTP1kjD4ClSh+i2unpY1MyuWJrjdJhQKWqIUIHty"
+    "SMoYWL/bQn8sVx4CgFO6nhpqvVxq0u7YvvFLp/xd8Iju98SJh85U4lmgJAxCtVwNOqB4JIULrtPH"
+    "phr+QmCigDUvooUETraUIItSwbbctU69O1p1ikGj2o6UFO5LE6yXcM8CxnAPYFbT8GGxIwDi4yQN"
+    "G2z5vkmg5WDLY9x0R8HZsNLy8wQ2mbAwM0+xD+0rIxW3mJKT0p4kPHm8ETg7dZkU/smUAwBqYYDn"
+    "rhz/cyQkODpcCN3WHxSCPH3uQOPiDZd0orPmzo+DeSYdDQR//Is/8ykUv+LICorfoOhwSsr9eZxx"
+    "cpCo/hHXcEeO05j0lv7JxbnD5xQT8Mrp8h0B25HM+2KgMygY7hdcfftlnoX8Se8COXbS+e69JL1b"
+    "JTI7qVMuNK0v/BRK8VBeRqtyu44jcreRcvwphXoU2RVKmTg2Od6/LCpuK1HAHOSlrXYs4EVHVO5i"
+    "RMeScsk9eoz8Nqs+3bHCZ5FAW/y/fEQwTsD7Q4oLQPCbTNxGezcUSVKMeu2p4EaDVzxFJlozWSCv"
+    "b2KjBUUHPM1zLgWWIguDW3E48BYM8vbAHalcIvJbkugj7ero5DHJGCpxxwaNaPoyNjdRblYOckdH"
+    "CkU9sFG+2+dWf48PocMKSaj1Y56wkkqGXPDsA2sq2WaM770A2Tg8dSCFjemBimj5evujtpX6WAn8"
+    "m3JCXni0DkRYz2k3OrJ6rgcR4Tnz8KyyPRTFHD9qBKlrHBsR+tztMXPE3D1SD9HNHpg4ODBx57+u"
+    "nXPnP5xbd/6dtP/PVb7r7tva+/49LnzpxZv2Lg1WKVgVdABnR8cgityioDf98Z8Km8nDhaXLlytH"
+    "ji8edOfuATn3zj733wE//1N5+6+usvbqzft6czub7Dpm5dJ2mdyPVQpToF/VC4NH0FTm0/M+8BmT"
+    "oMffct/Zo0NLBhIsI35I71/bmbtg4Wv3THhcU7b9lZ3HZ+Y3Fab7/c8oRwb3FFX6Z+Ro9vXpb+np"
+    "7R5C4h1+nTVaiizij9XjoTOhgP9OhRqvMRKXVGw6LRuUDKhMzuV0clYpXRadVxSTtXMqXvQzUegA"
+    "UOuPOCfB/TjdVr5BhSo2eaAPGHTjNAigVXodt5NKaCfU9OUZKmO1XHREccR8hGFzC6Q12CQ7TFVL"
+    "ct2oaQhmnIJLf4w5+xJWdRZBgMIIyolw0BLXkLV01jsBYHYRalO69HE3Z8n8cjrfKD2txi1yMBL/"
+    "62HK2UuWTsTjoDUiTkrIOP5AF/VMefzoVRYSsP9nMJnPCyHTtH9kAyxujYIRYtNiDMva36sD8UIo"
+    "Zu8eDMS/samgQrlsQhqkhZtL1I9nLyu/h1HDkDGqh7v3UcUBjoM1mTNrT62ITqTNAONZk7WtvWXb"
+    "mLfrSSHwjv35Hj9x3RmWIh1yKx0MfnFFdja8lvYZMybOOpz0PU8YG2V6lHDzm1R06FqXiQGDlTAz"
+    "3HA4Z5WdOwvmiUZfw5LXUviQMQih2dI4gmkGZ3BcqUD2uORWwOqDgxs9H+krv/mH/HnM1J9HCAKv"
+    "kn1ynLeKGSX5+P1LSNtt9rVD2hgzCV3i5NaWwwOt+DVzRnB0GXGPC5FL/1j258BgO/TTCDNsDYHR"
+    "BUgFHJeRTR5NtEAFVa3hhqNMJ8P+H4twOFh6r5nsXHrsFqMd+mkStXytjchn0sv8POkpD6MeNSc9"
+    "xzO1MORJ351lE4pvbJkU2+Ohfwqm/CT0pvO8cQ5+IHDlVhuyDP2r6J54khfAjaJ7i4Q9UXamnrEc"
+    "z9/X3JHR9vrq09v7154pP33X7Te956751/ccet57++vjXhA+MCwMuQi7tarTLwI8/A6g7djzzlK4"
+    "Mvn4HpzHj5mYPNBx/66o2//+G//cWPf+Hbv/vU/tHPPbexuOlIPwjOCCsdllB0oubxCX9rmtO3rr"
+    "4xMON+FSd+fiAYYaYraojKlX2pabGm1xmf29pY3HJm2xO5E8L2j5gKk+7gAGlhad6XF9HFnG0Clw"
+    "6WM3pIqamuP181NIpi6o6GagtZC9dCYOUafrnzQY18TDlpO02zHeT5w+fSRY6uyo+p0LimKEo/ft"
+    "rybQEfrKk1NDDiwwSQyRz2xLc8vMk2OnM9xydZ4w2F6EtwFOtIKgOTJotqHbjBiD9pI+UYWpy2Pv"
+    "E9Rv2oZDurdXiFJ2zwkCEYeBTEXaj46nKjFlmSQZh0SqNWAWgYiJhYwrVt76VxuK1jSgXZWFXFim"
+    "H09kgkqMYX8L1zad0yAcJ2dN1GDJ2iLcmajj462J00HEBhQzYii5JpvGiICD4rJFtOtNGGOBJCNU"
+    "AMsmZk1+H5gUf0dawvxe6LNhjSOcCXeLJNyAqXLjxYYyKnu+J6qe1i+8wNi/Nnb9KLT07rfLBpuv"
+    "dpX88AG9eZKIIpe3ZLa/zSn/0Hu2OJgvVEhOwStWqIkpjiVYRAy3awrHGiy7JtlRsQXAbitfIDBN"
+    "eQEoJONpZvpV4LtNW9Rj4OxgjLMNxe3rYRaXM2NXDF63pBtHRnLm17p8WUrxhsr+Za4bSeI5rbcI"
+    "KaW7KCQeQluas4O54la91gXaXNdGp6m8COH3X8Y6+wObdGD2kxvA2yHcIRtWxAdVUE57E0e/8wzn"
+    "DiWq/iBUvjCQBR2wyYWqE0rHElXOZRnQr6+uTC3owsZTSMhK4q1EMgPN4tYop0QbbkBAAlbFeQGe"
+    "d4GPpHDTrN+NY4Uka+UBFuKAxQR5drKYNnEHSCFKHEhgwXDeyP2P2mZWIgynVemqYLnYf6dQM9vn"
+    "3uyt7Vn/v0V75x9zcef/zn7r3ztj96y713furiLecf21n3tV2MtsOpr5arDPwYZED78/ww+THwaO"
+    "XCdZsBfhfumccun33vZz59///5oU//w69+7/JvPHd0+I5d/azvFa6ebW/rAUh1m9plPUnjhM6dMp"
+    "2oGR7D0O/KaACmyZ0GYfxuDe894PTOzSz9ToFkmQAeLnaO9hc/ffPZxS/cfePijlNHixvP6E6eBn"
+    "50OPjx3OHa4lk9z/mi7tQd6Ls2Pkp0947HtRgg0gmkF6J3yN057qSNxwbpberYcgfjprUkXp2kXE"
+    "pHOG3yPh59963IQBFFIHO89t05d0fgeTCMTHxh7c4zmkayXfkETrIy2TcN6KrgOtX23emNIkTbsc"
+    "yAAjS+XRsTIvNiTBGAs0kAR5lj0AGnPdijUnSBvFR7CLUB+zsahRnbHUvjSVfVjsH2p9BCx28wZn"
+    "Izi1Ke+KaXg8PTarf+8lBlQkI+w40oYLO36SSV2hx7njNvcwy9xFdptB+CEBunl+KGZtyWA8N3A5"
+    "C3BlpV4kGotUReRub+INx2mzet7YKxGy12ggeNP2gcxpnE4ZwaJmQyxiBNLzzQo9f7Oh4lv3VOb6"
+    "28YXH6zHnN43YIYuaTsJjE4VjFhD98h5ZNDAP/PecTn5seHsSKjpyFJIdPHQe0eGzQpcWgIzP0go"
+    "6g+aaDL1s6rruo6WsMkaIFr9dqlXKoRSf+GDLMkgZ0jHBCJZ+Uigk5yrXbLtQsLTPzz9TJHXkXlN"
+    "5mc13XxUaCC2DrmT1HI4FE3P4gxzmXaLP9YeI2ZcnHIa/tUbyxXSydRZtAnJhbFq5hLSAqDEorpB"
+    "UZ1Qc2fOOUf3ZWC8iA6B8/IVMa1tzmNYZjmGSNwXFHAQNMdNSE6vghdJkbqXqjzfPX4vQl9q36EG"
+    "RpE1vi4/iSNO1SYnPlcfJpUtd4P2htP+NxRByE7GA/M7NBdx+uFvYpwy7Bq9X0Q+m5LrnJZ48O7L"
+    "JfkSaVeB4Zp4RYjK3+UucKYuap8DUf94pJtAONA3RN97K+Ffitk+ubf/5f/OT97733tXd86uSpja"
+    "e17x2Wa/ZvtVhl4MchA6s7dD8OW+G68yEn5XQSCf5g/3j74a88fenf/u2D7/79j3z8nz2xd/STV9"
+    "fX7jha29je43fk1IOs6btxG75L51OyT/K8xORIz+D7SjsUZnA66TOZ44TreRyVDb/VSt+RE00d10"
+    "mNzG4/u724sM1vz4mmEzk8Tup8zW1PtvZlE2x3RNWh5sUdTB85+6fjoLfDRDoNrdVQ0+Hhy+j8Km"
+    "yEGYygQ+nOqeseuhjPoVRHlTrIfuuXhbUA01gBmzo1teHBlrGZR7gkmzDRqXU3oSYYc63XUDEhCQ"
+    "aaU0eKjPNh3OTLdwhn8FYS33JuTHFbDPujxFAGAIO4VOmcVf8envMqC/ZDJLWxN7mtmhVKnFUxB5"
+    "5ZYGSgAXv43LJDycJZRDB1dPVnPdFHfSbeVcdYuFIYuTefdldA6R2mlbWe04xVeZzTjWFdahFoqE"
+    "4H7eJYxvrEYcFw2I8RSj7wR3UDEGGKJ1C0oJvYGPgamdgMJpRgsE+VrOTij3AR5l/raLCUgC7O2E"
+    "ZaqjMBY1aSydjBnn6DcvPkYufcJU3mzi62tk7pKrzuynngGKQAo6d2+cZaZxT9VTFLfnH+0R9eWN"
+    "QQwWnP8Cd+SxdW+dw5nKkkFgHhco7FqMAwntftVDsTN40TKRtK9qHyiZfWkDPDNxMQYWo0hQs54V"
+    "dsNFSwHDTlQzSfX8ErvoWiWAAzX0mCtH1HpDyIj1CFGhOGiJaWpc5pqV8IYseQgs3OV/aMVX4Yyv"
+    "YGRM63KImZJ/akUT7ZKJCGQ7s9a05wjCsAuKnDB2e4EQWY9gvJyiEkydk+61nJcTWzP+N7YgOWPp"
+    "NNlKGxLuHlVYFppe6oXJn0kZVu2wUCPyMAqHxmUi6SvxdtSrbztK0rbvFcOpfGVt9bfeMkjx/CDH"
+    "ypIKxiWuPnu/Kth4+wHQTra0rLkR3HYJ91gdf+BBqzHMHeUKqx37qrg4wL3S5bPmdo1oaMRgzq/P"
+    "c1BtD+rlddbmojamJ5WqOJN71wcHDrBz/75Z/95nee+bdvv//1f3bLjWe+tL299hywq7LKwI9LBl"
+    "YTuh+XLXEd+UH/4T6gJhXPfn/37Ps//dD9f/DBj//Gpz/3yG8+trm45/DklqZum+vcDWNQt6neio"
+    "++BucvPXPmd0cEliZv/O6c5l4eivHoi8/xnNedV4TVDWj0xERjU5O+i3qr5W1ndhYn9WK7Lb3ukq"
+    "nZGm8TW9/Sy1AWi6uyy505rt1nLCF9Znog4rxkvMAQPgg3xrDFpAsBOp72QWs10rFaeXDoqKZOib"
+    "sBdCSSkXzu+AkpTREgx+a13T7k+KW1ijtIsM0oDGSgACGevwdhOBmQ335UC/c6Hup8vMCzlPmdop"
+    "d0tEjjsHGiGrN4wl/KuPvgjYUvopuJbqTMAgKeSvxOPcuhZKEJQ9xSskQDlGrnpn3sGLwdrjU6My"
+    "FQw/b2ak+i34Ltu9auTjG3PBQm2raPGkWybNMMQCZdyxgnYiUaVcVlX4Txcj5B60ep4l2AbLLtCr"
+    "DTY/u09bEe4pYDB7koGWWub3nFJL4xtP/4MNF29NX3yinqHjjOdPERvb5T4Lbw7JT3SVV7sgddF2"
+    "M4XttXMfWfiz689OR4bXNx4uyNixOn+D05vfFId9U5cHwRwklGU2SWchIsjlf+qEN2fAnAbcijYi"
+    "ZNBEcDNY8lvVbVuUcMuhCRjBUTvGh1oFJKmpyIAL955qidOyNiytneHjHCNoqe2/YvfjhiASz7VC"
+    "ZZxbnAzMg4UKzJkeKb0/4tOWtDxrRMBWAfZrYcnLEkn3+vYxBAlQ5eVXw3CWHiFC8Uk6cFqmJEfD"
+    "mP1imcxgtmTJll0LZVsDDKJVddHxG91LYciHgtKw5QfcEOcvnhbah6n/MnsKqVXPIimnSx7McGgX"
+    "ErdDRi0Yw0ZBS7dUpFxKVd8D4j/zgGepvOc4MuxTTi4J+1QeUJVfnoJnLU9N/ZafyAeBn5jhkS8o"
+    "3pdvAK3DHNfTK27FKsB4BL+UO9j9/mga+CfK79lA4XeXiEhzzr4/MQ6tLL262xtn7h+StX3vXQt7"
+    "7zuu889dQ/eOA1t//JT7zhtX955sLOI5jhsyqrDPx9Z2D1yOXf9xa4Tu1zat3X84wPffGRm37/Qx"
+    "//Rx/6zMO//cTu/s8+dXh4y4LHonQy9SOTGsgxEWPCtqEraej5wyBOFSYWDDx5Bp67axq1paNT3V"
+    "eVda6mmzpaY6C3v9hRr3b6cG/xFr3a8t33XFrccnZtod8S1/Pz2Fssrug7c8/u6WUoB2uLF/RWsT"
+    "09eknHSWfHdXt+g47HOvHPyHRKtOgLoIVsnhaii2CB+OOJnrC6c2LNh05mvmbw6auLdDQOFDTw1D"
+    "Zg2TM1dtKxhdC4tOyCfGjXaKcVHi2bEN0xQOB2ZekMGvQu+K06XV3gaLtmCdsow4RPabm4j+bMnp"
+    "iTfjjWKUj8S1nOU1Pn69bufNrw0J9LyqZ87NwvcxqF/a845UtWWTrnRW99mkuToeYXjiNXvR9fbP"
+    "86l7ZcfoFpdSd02k6hi9PYEF62RKDUHWt2CIQ7sPK3tkhgcFC6Cp5Yet/KHerCbOPlK7lEvv1vd9"
+    "DtOzy5swtHssBYXhpWioarths7MPndKPuj2a6POB//HNxqq36gY1Z3+RcbJ84vzpzXZE6PV67p4s"
+    "yB7rQzgQyScOa4EIWHTzjTdsHk4pAAhN821BYdGQrs3vbGhKJ/6vo33/4ODasTifkGmS3QocSC/D"
+    "VWaKY2H+zi+aWHVpS86IkNaQMFC7eYVOuPLLTPCFmubOYiQtmr7VmtpZX1m9Lbu4BkamAikgsWlf"
+    "sKsONLktBApwBYdSLMeekCkWghWnqoFT05IM5BmGuofm1JblBoncZHcrKQBiFTYhodSfQGqbyxrz"
+    "cfZysDL5G1ELK+WBHcyNcTIDaEDxyDAhLo3B9ccZhVmfOM5o0Ks3woX0ferGx2fEt1+Isvnc8YXr"
+    "ZvXsBtgWrk7ap9bn3WP6gENVmaS3V81pW+c0AeVJrmhmj8Td5FJv63L1m3PHYmnyJ/pPMEj1ryLf"
+    "x+CsYXevC9PscH+VK9XpzynUvnTr//7fe99v94w923ffrUma2ndbbgRLIqqwz8vWVgNaH7e0v99W"
+    "uYN0Y+8eSV8x/4+Cff8q//8mO//KlvfvefPr92fN/xzslzeneBuqF1/dSvJkAasWSoxW/G6WayOE"
+    "yruNR4wIlX9/C4msaEi8Gxf4tKZ3EPHqXvOwPC4MfED/WI1oZu753Y3VvcKvCffc0Ni3fdemJxkx"
+    "6o2NlGBr31xRU58LTebskPib+gN1xqPKgL/Fr7t4Co6/t0stXneO5o0W/Sz9DhuFuqzoc2ncboOK"
+    "RHx+hJKOuqa0Xfk4ElGPXBCHTzqagMG6p3B2aWdIzNCgUVckMxq2iRNdU8Fh6AUCm/MYodiuNxbV"
+    "p0XKYgJuxMrNVoO6U/tEouwpGLjUQx7IiFKIU45jC0kTbU4JGvyLMcvllookdpag9sKUc0jjcU/C"
+    "7E5qvnEErAOsioElIGFK4bM9u+47UVKyUGQ+G4MBxT+QF9ZppmCKVL0zE6DyJCV+l9rONPbouJLL"
+    "Zepsz1zG45JcATObypOM0v56Z9j/znjrQtzPQTF5NBHs/Nvoi/2Bz5UHtMEkU3TxjOt/S4+y6i6f"
+    "nOHF5wDtAFGu5i63suezpej/X2yrPnb1ucPndxsdjkO6+yq2PYcTMpsw4e1f5TxyK+5bXn5Zds2R"
+    "58itu1NkEk/S0VmiUOqweD2EZ9XuyBaM4ZF58qXzELA2lnZ8nOS3Ak2hO6vmM3/Bo2BwWnjZ3JQ5"
+    "wl1yaPXNR+0vTeDnGJpUvr0eAcVtDBp1HO9h2hJRnY/rCUinNUfpZevCN3nHyVC4lGGkXVoLk6qM"
+    "MHQ4g5OIWJrVDFjIFgmd7H6sTChvcvZMETjrcVa/3FY1kZhgw0NaWfBgA858FaBfmuqk7V+SwaIr"
+    "OqGmrJZh6bR7i5WpuV/dlyhRUM+ajE2W8TSo98WLVjBoR/jhGbcpyRFkN9CBhzv2nYLY4/HWe1Na"
+    "KvJXcgy1r0LI89i0wBqs154Uh3170fiO1zhbQjynJkrpSzsk9F8XaRQ9i0DULqCjR9zKt6P/XiCz"
+    "nSa1H6dT+SLQWfE7gQImZiUS415qDNmonf2vrR86e2d75428UL/+Yd99z1F3e/5uIX13c2L0s+yZ"
+    "S9VVll4EeZgdUjlz/KbF+HtnT6U8eYu2accp9+/PKJv/nKl275gw995t3//rNf+bWn9g9+6urmxo"
+    "1r65ub9N8M4A7VEa1zZV0Ttg2dZI/0swEeeOUWnLLINTShcdrU2dMnXJ2EGTLS0fgUTkX/unavkz"
+    "N31PQt5n0eyzpaXNjhccvtxSl9eW7nBG+y3F1sbmwtdvXilb1DTd6EdOCOhiv1mugJe42BJcUdAF"
+    "FRJSLsuCVs0W1WC5XuDNzhSM6dDHjy25MEofiORU280BHbvACBow4FXH16gubvmJAs+yUZ1pbEJh"
+    "jdol2+AT6KvbYSbD9qQyw1sLNY40xQMkNHDqF9dNWJD7XaWsVu2nFHEhbSIk5qlYH+cBe+7OJxMk"
+    "xFfrUe9gPCOGOpAJlH+aLpTTKXALTKPD82KWX8dfwjkxHGtnlxourxsf0Cz7nxYCs+xouZLyO2yR"
+    "HjOiIH6Ljbx6W12I4bX5CaY5GfJWGx5U9vJ/KCQltt2Qyk2BGjnxjmQJHs7Tju8ui4CEdLwB07es"
+    "6AaSIVbvsRDUvV3TDmd2C3X2B1npPNYFP3AFF32JExtvYbZA/10pND3ZnbOnlxce6G2xbbJ/R4JW"
+    "+vRBUvcdGDxQyouQLPxQuOOceFcTuitujOmXDbT18YUtOypmaRjInuP4dq32yQUGs/mKksVS2CHY"
+    "JxozDUsC1oprOgxKfUX2458VsNH6GytXzuNEMEJ5A1OFrID+Ro9j5jGejORXFbyGoNpgZ0yow0bD"
+    "ST3Ha8iFI3HvatXe4AoiJaUqPJhJrtchqWmBFVRYXJBRV9Oo7ksjCl3DkBAV62Y/SMgbEus9hzLi"
+    "EGXEtejWWZ2ANvqPsYURtfRPWp2nXp1xoziSteWE48IMFRNaVspBFl+14nuGiL2760mvkg6WN/Ao"
+    "7/lNggv9RSgHDeK+FuN1t4ky3VhKlfdZRiKRGpFJJXkXE1JrVOzspMjNOAX/rDDMSwxK/JJO3GwI"
+    "YFkFMt/6UFA0IwXBfF+4PITYWeWOOzvy7BOEMCfgpI+nwVgTMPT+PYEucMvW/XGLrAS19zdHh09s"
+    "X9w3d+9Ymn7vz2E0+96+2P3/nHb3/TXR+84eKZb8p1RierssrAjzQDqwndjzTd158xOgHuoF158W"
+    "jx7UefOv+nH/rQ237/I5/5re+9cPyPnl87vPdge/2Ef3agTrj82OeGPn5Mip5QjzzSdRxqlMaajs"
+    "QdBYMznVh9eufsDM9/Pl2nc7G8Tsxc5BfUpvinNZC89dSJxQV9f25jg4kmkwrJ6MTNKXtXUEzmDn"
+    "x3UCd0NpnO4ligg8HmOt/TgSK6OwvsCoMuIKdxpONN/LOqKfQkxvIi+kx4q1lasieHPaB0D+JFBi"
+    "32ozoWJwIC8u0LdfJkKm6MMkEh7BE1msOmnZBQYoIjnjs35ANDVC44jKwbvUwnWKwIaBnfhOb5Q3"
+    "IVH1svoshhlQLHAwTqDgb6hNzGW86pEAA6LknAaDNZG74Tl/jGL3nbGPD4mO1ktt1Mu3PjbR0vhR"
+    "OTZXiySY5V7OOIy2ARnZiTjmmSaUxV7XdAXO8Y2xereACimuJasmB9JKaC3riLBKJzJYO2yUI05Q"
+    "s7sR3MzhfyVtEivsDHUJwkH64KyVlTwxzTIxc6Pum4Fgkc1vZFctTZYZBbz6sl3ZagbR3ortyB3k"
+    "B7VhO5Mxdu0cuS9HilzhGMY8uasdfQZfbPzgfF+qpgU4vYge2dMzLi+a2LwkJqqdiv7AsdL2DJg2"
+    "SxD3YfNzOE+CUmTuYfN1zIGSUXFdAvgmizqmUsV4pgljeqDbRBkxv2BYO1eYLR9tg2VWfVdtkOrj"
+    "sYVGRlckl+1mBb+HjgQl1VtxBW2tsjS41tAFz84eyOkCdkpgXNthpPDTCNZX/aSMziJ2SKV7TTDL"
+    "babE9QoAdLNf2znSCQOz9toTV4HXvL468vpBUuGGj1ujZ6qJI1uIGD0HjgINttENjLkfL2s/gUr5"
+    "Ek336wpgEdjL68kgRITxPbWLck0rGVSniVC3BAzg/PCymnq6EDQvyExDFkllbY4W5VbDj3xKXPOJ"
+    "cYWfLaIaxmdgEAY3BbTzxidTZhRyfyLD25kg++U1l20ejzFLYtZx/EwamoJwYbBBk3ez+QPnK106"
+    "517tT2/iK5xbF+6dYyEuMrH5Lx1ybkCxec9TMH60f7R7dK6h9/4muP3v3Es5cf+Il7bv/DN77+jo"
+    "f0zZHVS1OS8tXyR5SB1YTuR5To69nMc/pdufd/8vO3/q9/+te/+PCjT/7zy8frP3Nlc3Gz3mCpU6"
+    "UmSPq+FnfBKEy6eJTI53ufUNNJbGrkxWSOkzSiXFXzVbK6MptHUuoEDZB0OfH6C86sJb+pE/XWbp"
+    "LbAAAgAElEQVS57a3FjWd3Fmf0mOWGHsNkktiPphxoULevy3S84fJAOu4u5aGqKnQ3wuSKv71LPw"
+    "DHAjjMp4o7VjoKlZCbiY+ohNdrPzoqRseENPZqDJSBZ0OAOe99JYcVd1TkCV2RsAMLHDolW9QCG6"
+    "GipTpNlSGT5vAxIJNcsaPrhpFtM7XCqob9KHzq8Q2jMTx8tYeh2ebgA0TewsvVYdGkONkLLu50HL"
+    "bgWKHCb2m3TPvBi+SxXLCYMyhQOAOqgzOk8B2gGpJr72I1eLC9y+JcFzBrkMVQw6xr+BYtWkm0tu"
+    "MiZl8AGFTsx9fhSbmHiK9Ka/8kjvbTgyPNa9xm/oNfFR+0sc/hR4IafOLunJSKcXKHqLG0FihXwl"
+    "1Kwdul8NjhXfWagRU+yrYfedY9gf0D/zbk+vb5xfkbbtRk7gbxdQGmkpptDAKZVNH2x3cotJnfpR"
+    "4ZLsBQc8GWK8qwhOf7S9piloy3geop5Ib4u03e4GA7duGFq3WJefysupuWD9pEmGSLs7yqbWW7Mp"
+    "hIIzJ8qfOj/bWNMjgCWo5/7sYwBrF8bprvsrmxzJi3+lHQETAwErCNJMjAdZpM0sqWZSQbvGyPtt"
+    "3r4VZjGVzUSnBjAEL2s416q4AiCR8DWEHaGjBcTKk8+Q6uqL0d+7hoW2zwl+wDyNfFuoEsOVtrny"
+    "VjXi/qhN/yXk9JA1H/ovLPOYM1tu0bYKmrRmPQuUBIwbZ1tch+00SOl/gWkdhwfFKyuyIFB2u2mG"
+    "Xl27YRxEVAjKea9sG0TbS/qVWbldS8v6BuPDTkkfD8hI8FRCJgirebhUteJGK3o2giEz/Yv2xfuM"
+    "YTq48PX0CJKTTqfEOtlai1gAD1z3l27Af6nu6RZn9Hh8cn9w8Pf+LrTzx9+3e+//23Pvy1b//vP/"
+    "vOt77/0i0nn1gNssnnqvwoMrDa134UWb5ObezvH6w/+djzp/6vf/+37/jf/uzf/fOnrhz9yu7m5t"
+    "36TtoWLyvg7KgvF+scnZM2J34P9nT+5CTsk7KkNnyFXW3J5QUG8DjhcqItWZ+8g4n8oSZeHjBJjo"
+    "7CjxXqzto5vQHl0slNvwiFO4F0Fkzq9tXh7esKP49b8pglVHdwTAikjy+2JhNimwaFaq4SRoATPf"
+    "ymwUfI9IgYqDue8RhlxcKbH92B+Qo4yomRq6GtY7vGDG4maKmXOIqdHvvohhxLR4ZXjs6+VW0o4A"
+    "q2+Mt/ySdwm4CSWKl1qXxYLjTjzEUA5Jq04yG2MCv8wkRX1md687oszwYJ2PTegFL8Lj8RCwR8tg"
+    "st1Rxfwp3T0H+5mDofRlODv+FcOQ5OD/rgWcZiFR/gKiJZtbeDuSz0cb4RmhXjyob9bGWjTEKJIf"
+    "GYGpNj4GFa+RK83JWG7pSQv4oLfvKJseTDFejgQrYfpmax1C7jEvLARxKx0aIS7pw5aMWmfUH/or"
+    "NfTHlIFtm+0HWMXrmiwdOJxYnzNy/Onb9psbm1reNaiqXDYBMdYNtHpodgci7wo8vmYbP8KV96u8"
+    "MuzsAZ/heut5PqpdoK3kaGNSPeJ9+CsnwZRcOGvLBfCHifmIkg1HeKW2VucwxGJw8cPxD2kdjhab"
+    "F8ZwNaDOFBaqp0oHMjIruIZ28RjtvO4dBtsVqPY0Ft6tjLvlX6L6dYtLgRHcOpikmzy7eKzOyxKD"
+    "uIcL2rPB5s02lJzjBaWAZ8ndfBbLfwleJtAr8ZqNsbKqqVTSsih44+LMcFFuxgU9TmNxzt5tlWt+"
+    "0g9m2GQ0Nl5h9N+ygBCYHXmGaxcMGCilf421XVoxq+ljZZ4kYsQJOoW5dFCcli5yKi0iodYul4kJ"
+    "9dV7M95CyqSufQaIbHtzoeMGt7yR/KtN2fG+kHL+xD+WiPpUdc7T0e5CJVex9s+IOSSoyUou/QCY"
+    "svYXDG4RsdGxt6ikiNg4ODG/U9vHd/9fvP3H35wc++/a2vf90fvumeW7+4s7N4YcAGbbVcZeCHno"
+    "HVhO6HntLrETAn8px4E//l53d3PvPQt+78f973Nz/3B5966DefOz76+f3NzRv0HbmN43o0ijdX8l"
+    "MEeqGkT7Lr+vmAfL8iJ9p0DjqjcpVZpb/7kslS0bVa2+LUii4nYmR9b00kTc4YJFpZd/8kcMPpbf"
+    "1kwfZiR8/Db6FARy65/f2jxa7qenTCJ2mU+k6C+xM85N8jT0Orky3HsR3jnsihSy480SIIALR2B8"
+    "caXkDxbKk4h0xgq3AnhZhkoUlad2eHXeoxAb15S/BWnelLHtGxvWCJVmQ1KPNWBEJR3TEAEdtIt7"
+    "34U5KozXDw0wlnNaO7WYvGMV/y9tE4cynRNUJocnDbB/nE/iJmYznvLYzXbKtRqEMLYQxC5F/nNb"
+    "xJxxpRcxRooj5MVB0Rtl2XqEhKlZH7YqPb/NZpvCFroFYITrA5XoZ0SeUOdbIUncbF046zJwW+ky"
+    "0P7IfEjReHYoLlvK36aJbpuAC2DiQa+ngSpUS2f/gTP6RtYwVvGTBBlbza/n4pFG3PPb3MaG3j7O"
+    "LCpTv1cwRndFd/yy9Bwox1St9ogshRjwEs0sIu0FrqU4ex3TRDQOQEvOUiAjT0VIgjOG6+dGG51m"
+    "lz0Q0QGJMavsPNeU/yaVmmTEJs1UmxSEYG0JVoW8g2WBB5G7TQwGjqIPz/qZQSvi3pA90ErV1tWq"
+    "297XXsZY0x+dtBIkPpteS6GkaWnX/nqxgth81MJKH0dmouwoXpjT+jkz/8gq7/7Ae9PyyvEXC6ra"
+    "6FdVEyvO0y+8ojqdgsTGq1nURpTyr+UHKMUC9Zr9sfk6dFYIWjinIYd8qfkjKNuiFrL8AHFcdIJU"
+    "0da0JSvXMQFoRr7EuoVMRTPxXDiIuenJsvOS5MAmrckh0vQIrnvoNuDOTAGk6j2vZBLwb+0ISlCn"
+    "XEILCKFPsVtHlZJiTX4memTKXAwDOgEWv0YBv0xUzmjFQLniDo/ENa0wuZaO8f7N/72FPP/IsXLj"
+    "987ze/+9Qf/fSbX/uRm28+/aiQlZRVWWXgP08GVhO6/zx5vY5QGThyOk3h1f5PPv78yT/50Cfe/J"
+    "73f+K3/u7Lj777mTM7b1qc3Dy1xRsiS5bTr+Zvauv8pgkeZ1N4fgGJT6U5sSLn87oW1tVJlbtv0J"
+    "kUeaiGOo9W0SnrT19WLm/S5gR9rEe2TsngxRN53HJbj3nywCf2weGRrX09ugUyj3AZF//sWcGxss"
+    "8VL0EjILt0iH2nrDuEvpvI9KwHLubZLh2DlPUPTf8uyPWAwnfv1CYm/sWwbCRZpk1egh+HjFV+RT"
+    "bgbcM0KfWVxnAjiSNtz2scdJEUdqodHRsp34uCMyC4ySK5GbbDtgyi43srbcPrWkgd8TJpTOcvih"
+    "ZKVducwYPsen9SzY8UStHuICmgDOtVFbG3VfQjl+2QOFDpGIh5btcDD4c23x6THrpWFnhyaAreJB"
+    "ZErZ+1sYuEJDrenpW03rY0kbXPEWSp4j0MdDTLVxpSMDHGhh0wkNPfUqkcQfMVcpT1bz2wXABUUd"
+    "u2vEz+gBv2zY95xLHHcYY23npzaR0fsAPH17tdP9LbK8kzx/Lu7oF+huDGxYWLty02tk/4zbOetK"
+    "NmHaliAfs96MqGFQa4sFmTGy9dx7r1tGyeq7RaL6ypbQCiqXJt25jhEZuPMUtjayrRF47OG/Fs4g"
+    "G5VKrdNr2Wf+1j060DXRVvM9VzDlEeOc+aAbPRVXGcxaCO8XIg+1r2p7Y103Q1ewF6xWENXK+qnj"
+    "aNzklUrN8+I1Qu+RhL03EaRn7ZXcshSAWVKYc23wmc21a945kSwTFAS8zhAxSaUfZFBeH12sxaID"
+    "H2L9Oi6/xFXdRghxYi2N4+4XrZ9gwzWyBnv6FZvTB8umMfEL3M2gZN4i//m4WYSVr4T2tfVCxZVh"
+    "gIXGyikO2Lbvls/ZZEhxIr5dlo+2JR83riZNciadVaTOfUoe5jA/ujlJrPInJ4QpnsU5v8wLOZPi"
+    "01k2uk2J8SY2yERt1aEubXe/x7qcRdsYPBhJ2Bj7cNtx950kfnHhB4eYquW68d6ieYXrj64j/50q"
+    "OP3f39p5++751veN0f33fvrV/aOrHx4rV3LGN/tVxl4D8tA6sJ3X9a/q57bZ8OdTb2iV+v/P/C3z"
+    "1yw++9/8O/+L5PPfy7T+4vfv6ZCzs3axC2yZeMuRvHSZCBF+dDBnbuXPS8C50LDzmy7k5MYj4Bk2"
+    "RPvOrOVXdEDFbcoXKG1ZmUwZxelunOlx8kpxPe2NTdO00AebzylH6u4KIeuTy5vaG3WupkrlcP69"
+    "15HhIe8FIU0Q50u5Abb5y8eZwrnalkbUNTAvHcYeIbfukPz/sEzQBt3EEUn8JJnmK6+AJX8MIGny"
+    "QYiTXYWiBCozpB5wMZMT1hsS+WQANJF9cgIwq+/rrDmqRDQ8G+i5GtFz3bZnvKN/PbIRTKlkluZ0"
+    "E4uetVNotn23E7Aale7lnC/qqGHQraNmGfTEo+VHVnik89MMDorIxtcq1zkvE2lDz24hOxpSDeut"
+    "mWFbelkYmeFEtDq3Zcysa0VMlRl6hFWLSA1pEGUfUZnJomTvkW3ztGhNp/cNv/AFszyvhi8cpm56"
+    "Hs0rzWJBQwPRDp+Fqo/dU6wfQKgjWX1m3OG0xYSAHF92HbcB6nFlX/RkHATpMZ+aJBql9ioosv/L"
+    "bc3pXdxd7Rlr4rd7tefnJJd+i29eITnSvqPGBd2aJN1MDlZS8Glh3WbV4+1bnHgnawtSw2FlOOgQ"
+    "hGtkFjdXSOAqflSuwTmFW0QMeRlTvY7ar9MjQSjdvcpqRdVuKf8UO3RYzZTmGoznmUFues+B8/7J"
+    "tRpAMEC4uKL9mieN2L3vccR5TCmvnRsmMdqLIREywxGTMlUL6TsDJvCM7vxMaugQ4fSk+e7JMpg6"
+    "OW5BOMOdkIqbKc43dM8UmWOCdX6W3f2x2y7yrN/Zf7jgC1BnZdba0TXRNACK0xO9fhAFEaUuFCU7"
+    "brDJo8gUFewI945UXS5A+rYky21WwD6OpD30VBas4r9DBnS9uzfLZBXtXfmkaM9DVOtZ1lD4QRQz"
+    "MLotFfOi6Y8svwWhCTGlwQgTZiRFvt7ButW5YGzmRiwpaMsVlnX/QdRImS74SAgOo6x/gOa2UYeY"
+    "p9kGCPBWDba9iMRbhKBRBHoNp6GkmkozN6E+/bnjjYu/VDn/vKO779xPf/5Tve/PoPXLp09rsMTV"
+    "ZllYEfZgZWE7ofZjavQyzOZVxXf/Hq8eYnP/nJO/+XP/qrX/2brz353z6/sfauo52T2+t6eJzTLT"
+    "9DwEPmPnnSgepnADwx4/zHidyDOciZ1EF18RnTEpzHczLWCXadXwHPebYEc8LlpSVM5mBt6ozJ78"
+    "qsy96mBok3nzi9uOHE5mJLqvoaszoL7G1p0KjBozD9HTr5YS8F4Ls4yPokbeM4UKd5OhMxAYGljt"
+    "hXcbWWBhEt+6cmMA5HGEgZSwNXOgw+6KNkexLogTadHnkJH4lgD7/KI8jpdJb55Lwsxic7wW+Hp0"
+    "fxINg+xQ/ky9PZWlVadGhi9x0u5DL5KH7J2EvHNdHlVezP/A13WSb2m2Mt+z+PIzLw8AcfkrfOZW"
+    "s3MvSlUjE4UhYqSFhfa2I0NjT9xXYYsFq2VN023XmMhLXwzVwpVcGVMWEWb9qOLcG6rcSntItOrD"
+    "PR5chmrZkdxDtH8zwi7TaYlUfcdcwkYVbP42ztGZop6EdQ6xmG4zKGZKEXD2kPonU7fo0Zn0Znfn"
+    "qZYwGe5K6+eEU76OnFTTfftTh9/rzfOnt4IHn/fIgsSpZDjUMQ+7kIAwEefuFL1p0txw+RDSAh/l"
+    "6uvGRfkTx+ZRF7UBhsMnnC3kAa8KEPfATi3pAFk8Gv7ekYZ09JGWhu2k/jEomk8EeiyJMr59m64Y"
+    "mhYnQto0MzcrEwcoCsczHCK4FalSttd47RecrbDvEjOo5Ci/iIn8H2IFwN80WzOEpNKJOs7LcUwt"
+    "IywubMfUDWvlGpgl/kdeA3AwJOAepZB7aTS3+HrgOwGEIp+ELBro8BA4eHEccpEfqzPAXABQZq2p"
+    "9lh/MjPtoWalYISF+4SS7J4Rx87kPsN8Xyzp0oqIDZZQZhFnTxdagEH1nU6Lv0zx5igmvqg6A1Xt"
+    "noC3aBSkb6LZdO5cBAovCsSx3L9OsMAdLfWQo7mvjwVE9sijDbLuxQWEruDIGaJlwoltfAUxx+9v"
+    "95DlNHiICNZHHaXAjyHXT7OfVp/B4dpXGSCtFMlh7m9ZeXqRnW8vzkgUMXHucjzle8FVuDm43Dw/"
+    "3bn90/+PUvfm//gcdfeOE9D7zmtve89Q23f+XkmR2d6FZllYEfTgZWE7ofTh6vIxQ6nYTLSf7wys"
+    "HisReunPhXf/nh+9/z3o/+1uNXrv7ala3tN65vbm8zPdnwV4f1UwRMSjwC64mJcJjACMxvsuNkCT"
+    "BKOtGOIpo7F51VuULIiZz29HiDdPCH863onLJ93q2aSDqfHuru4NHiZr8Q5XixrS8wy7jl6Hb7zZ"
+    "b76nig5qpgdSSWSgeGbRuTuu8SYNf8OGA/5a9b1Skgn44Bv0sPtaLDY3DKi1ysD6J1E4UtK8/ueK"
+    "wXvxg88BdreDGXF3rnzTq25sEFYp0nJnLksSeOgdD2EHYeIUW5cEWbd3CCTzqKHzNOyLDYui3LOn"
+    "41p71mXsx2JhexN/efuvPNvhG2VvhDk4Bikrj070JeqipsiXhwGL69tC+IuuUl8rkDGE042aZlB3"
+    "FwMSLjwdGyjFoLp9qnAHiMEl6s5Y2u+CcqDMnN48WKi5WoxUaJLrEwYfu2a5bES9H2MTG1XZuSVA"
+    "pYMFK5Tp4kWWqpwI8UeCWd0NUIpOg6dDOoxS+raL+b9l9vS/RJAv/1+3L6Yq2evK63WOpNllunLi"
+    "1uvPGOxYZ+W+4QUAwaD3Ryp6Vprjl/NCFC4Z8yvYq8IOQoPgwBZBB0CVa3CsKYqUtS/6h3eoKkpf"
+    "/DAA8+PAu/BLAJyCGtwirqblq3PEOGmPnjnwWr3szZHwsrigPPWo7XaqF3xHZSCqzxV1XUyyPVqt"
+    "GYNPFFgqz9vSsLZQHMVNLA8y5TLXZsFyZ4M6v4PLXZF0vTBsDVRzqmlm50oLQTtZfib09cmgW69j"
+    "+d/ma2E1P2DdGrOLeqGx/7MjGsqA0kbfQGnRo8CFXiTclINqW1W2p53Xm22VLxSouRE6vED6rXIq"
+    "PbxKXYjFFbRzsSesiqZyWYVgGyimzAN16BqsH50ta5stLFQjE75KVi2eIxkUXFMUov9fKHdvsgPS"
+    "6aYNhW5Sj7PduF/PZ2CQ4MnLAkYagvQ6Yp8KYW/PjOctr+uBhd4kOekrXh1ULGWpYNpvWQlFH1qr"
+    "qirB8gPzjw+XBdF5eP9RNM/x97bxpsy3We5+0znzsDuAAuJhIESImj6EGk4qikijwokR3LllMeNH"
+    "piVSquVH7mb6ryJym7KlUp2VKikm3JlmyrxBTlkihTFCWFBElwVigGpEABlGDYpICABCACF/fMJ+"
+    "/zvt+3uvfFpTz9Au5e5+xea33D+w2r9+pe3b33vrZ/9IbD472/9ZEvfOm1z3/9xXf/8Te+9uO333"
+    "npa4qfvXFVVhn4T8rAakH3n5S+m1FZ0xiT2OJwsf/1o61HHn38tn/8gY/+id/4zGPf9/xi7bv3t7"
+    "bu1I+Eb3GwRG5LB84sxJgwoaGfgwazpki+28bk6H8IY/IU1QsdUZh8zcuiqO+GoceVssH03Iqgpn"
+    "ot5FgI8EPe53Sh7N4LZ/24JXe7OBpwYDjWpTTu0FHrxl6d/IMpJlhMs8CVcR/w6MPTxmS3ERODfx"
+    "H7QOB4rR4ap6NZQKFebSPZcbUKR7XvyInshfD8wOIDcIyCjy8+sMm46xzx7A99n9CAWwtFaPzjq9"
+    "s0wQnU8L2vXnI3dB6PxCNvEGHUOEIvWCTc87dZ0oKhwmKRJnYjoazZdHoWEsdhtZIdQwMd5FJyl1"
+    "DUwiaG3MVkXAxqQTSCLkH9w8oGRTq9paX9dXYV2QpYtViNaxkMKfoWsB/x03duULKs6hKLBbZFsj"
+    "9h9tV6eFNOky/0DW9mKYOvk9XkBUaXkhQf3ijyhfcTxXnkPTCY4Ce/1COn4nuRaxfZmGstcmw/8a"
+    "M4Ylc7taPkwgFd8/QOkHjgajyZLGTwUHflDnRV+4I+K3fLbVf0BQP66iJOxq2KLG2dQNZ+zHuJe8"
+    "ws2qCNxbjEfDcQDWyhRuzlp3oq0z4GG1bv42ZbQrSOzQmJv5ZtIZRVyArFcbmfjU0XD76b7YfGwn"
+    "qF0WSj1ABkPwhqXKg4hnArt73qq+qxGXG3c3YEfho9HsOXgR0++0rzOkf0Pe8WRkG6WpIvxoDEKJ"
+    "02Lr73xZIDbvTVwY51G8D6JUxVdMY4vmWMPBCYkkibRNxm2d/MMdfEjqtz1ft209Ht0mnsWi4aLf"
+    "MlLoUjcrmBTyozR+CJ4K1rMDrGolrCDk8E41hOCqiLwOHUjetkrdVi4l0fC1i8yAaFNpCU8V5Sm/"
+    "dSbPEeMxsqQtrqT/6AHVZkoTkedf0ESOtJDR1L13ubft6kRh0bpOrfbPtv3PKB9mjSSq/tWhmSYX"
+    "q/yLlHuwOTP/vEXEqADQqi20gnRs4n2g9qsxEift5Iszz4IqTu0LFvckzhOMo1bH1hyl0Hi63vfe"
+    "TfPvPaP7i6/wt/5A33/qtvfvDuf7O2udiToVVZZeA/OgOrBd1/dOpuZsXTxfNPvbjziw9/4k0/+y"
+    "sf/2+e/NrV73lha+uthxsb5071K96cBG0yL+pIw+fmDvXdkVy16oWc7y5JhoUGJ+WZ/DnZzwnOmC"
+    "iVYg4szPtMuPCZQTPJRs+jEIIOTNwJQAkhOOpInychLu6uLS6fXVuc39GjnvKHxzI5Eh5J6gh5Jm"
+    "q+blPFfoLpM0EROAkGCh4blf4CFndMDKMPZPMYfIABWiK+2mik4G3wSIb6vRCRBecDXPSg+xiDPj"
+    "5xEKHtAHMAcm7qQEO7Y0fPbeTVtk/WFZm86w8aMhzU+LevwFPUp/DFFD44uQcxIMjGtzIAf2JbLr"
+    "5Cx++Wp1+OSMF+WgTlyKkheeXdNRv+53Yr9oaRSOKbEaybGIefYs/z4PhLV5V9dG7ka9uDTn6EpL"
+    "xpP2FMIKrMrTmHRUtehdAJkAKylp/RQCYXluNEs3kDufMRi94Sg7DIDj92SwLbnkjX2UBSCjaOov"
+    "qy0b4iT5nH6jbypdp8ul1aPvHNOKXXYXhs6dhurPoEETm/saUr3ksvvKSfJNha3HrHff5tOT4vx2"
+    "Ku8b1AI2Dlil0nFynioK1rTGzG+WSsyhFhm29H2nvVZiNH21s1kJwyM2IsGXLc+0uhG4fH6gIEFL"
+    "lVrQ1kYmscYJCzP7BoWxgywhCLa131LR9acgEtTE878BuwdYyDGIQ/rJBf8aUfSW3516sxoSc8Ws"
+    "ulf6w7Ac/sGS/j5Gyon7wVOJX+cNv4M1jGuUfgZf7jlN1AF1AUS3o4jEBnM7xOQ/BiNVv8ivHrbf"
+    "U4DwfLZ1tsJayrPWSxjLH8i4kvtY81zxRtqiAxKRRRFZhLPslPpkNMTzrlvKuKdYLA9NgHs2hDML"
+    "mJZxEOnll5T0IuzOGD4prrRMRCpRi/QtE2/4g5jpEjBIxV42YJNjwpglohOH5k9WKegElnSoD6Bp"
+    "vR1C+SbaCCFDQY6juKjiWM0CzH/BtRNLqg3n7FAJyiAusx1z4pPy2nPuctnhdAx24db7kgrPa67t"
+    "bd8tLB8bc/8dWv3/f7zz73lseffOqff+e3vf03L1zceKHcbvOrepWBf+8MrBZ0/96pWgk6A5rA/v"
+    "WTT5z7h+/76B9/38OP/fXn9o/+q6vbO/ce6uybhZE+CCwxTWucnGohcKRHqTiksZDxZNoTtaQ4QP"
+    "WCzifJtTDqQz2LCC900PGEjgdMd5nymI+ZVtn45Ig2oEzYTKIS2BRDvyG+uLK768/PbW5w146Fkl"
+    "7i69cK9K15tFHQy4AAqWlcaEWk7zaLS0skJrYWI+7IMsn7oKy+r/KPk1NhqM2iltKPkdpuSNZDl/"
+    "idtZIVwz5SieVuvNAWInlRDvsgjJ0lfTspUSTLX/QxC82lcIb/CCLwDQsxg1c5V+24kRcDD6rpVt"
+    "vNYi0+D/jRQDWL/ehGbmob0jLXOzdix7b9YiN5VfarDqzBit9Bq61knTNUDFB08IgxoK7bXXsHXa"
+    "VMuS7N0LAPNgnoMhO2b4OXXOL09fK8RZZo+AVe6c55tPMo6+RXy7UL83p6jxlQSjjNuRQXWsBITu"
+    "FilTwlOFXYxxfOiUoPvvdzKdsP3a2HFl2Nr1o8knTt6jX99Mi5xZU7X7fYPndBF2b0vscgxXlFrw"
+    "i20wvqYNnJCEtOxa5MuYPWubDYfGMFYbc9KUPCx5Di7VxltOULMrjkuIAxoSUq3rZhcuFLkDuLlG"
+    "zdNJj3u+qC3BIO3f0wrVfK5qmd/Io/bE76aLUO8inS0FxCwgfJrQAXfAu7Jpf93kg0IpeZzhqCc1"
+    "9ycmv1Dqc6VLKCoXJq6EEKV9tZIXfqtm/227puzQRLH5505nmd61vKhEZsCDxRrMyp2PPgNs+Qo8"
+    "N8VmYsO2OULpTgD9v4JCX6I6dDcWbPuZkY+OH320RyC5wucbUU24YsNZQ9mcXjcdN7t4v9Qbp0oe"
+    "cOZNk2HTzyimLF4Wjie8dkm5Kf/LZ1QfM+17sdXuGrWUjgYlUFoqvIpY2NirgDl7xVtEGyY4g6O3"
+    "n55da06XEdOS0858TeNHD5MamCOM2PfoxceUAcozhDxXhxIZCO/jcUM0+R60mhrcPDgwdFv/zI7z"
+    "/z4Euf+NxPvvOND/7G6+679FVNgauyysB/cAZWC7r/4JTdfAo8usiEdO3Fk42HP/bpyz/6vof+y9"
+    "/+/ed+cG9t49v29NtyJ75NoAlKJwUsQbglxoTq+UyTLj8PwEzG4iWnhu5GNs0cLOoqezKcAwWTLA"
+    "uwntyPNRn62zIlBL6LZCKnxxnqJxC4cYGA7hcudvU5nTvPbS4u6aXfTtBvzulzyNI5PFiZuLcAAC"
+    "AASURBVJSI4uKbLn3DjjMbyXK6CHYm4BxEOFwRRtdM0ryyILUX9oGWDww4jIKKT2rVtk4I2oJUpY"
+    "IzNhO/8gAuBU/ckj7LYgclgk+QzSm+pUPnuOKT87JvVhkjLqPmGCwXGZFQI8I2FOIIREbT/tWJi7"
+    "/KGckpzBqjPiuQNDGIH/TU5YZtaOO6rYM/fGnfS9kHRfuTPKLpPLumhy9tqf0OfThgod7MZZTDsh"
+    "f72hpKtjjRtdPEInrJtTzMXuSVUsYbf+bmwZgli1j5b5mBV3TEEei43YVHhgrHOnG0OJHqrT+jik"
+    "bLm5G4m2Z8ZPSXL3CIXzgW3+B0QRefuBvWHmqfU9P6EoNM2241FAD+1gki4so14Cd69OhocaQfC9"
+    "/YuWVxx90PLDZ3dvN5OXJqq8gJS7t9Lk40dnlkY2njDSYoxXXcdnMm3kx8dNKycbtlnZtAaZsxcH"
+    "fYmwIDGtvBTdz0HaKIwUrOIxmZuQ3r2/hQtCg+JhNsU4xtY2kV2fa63VDaWU3qfKQTj9uvITCCh4"
+    "LdKY+meEDl1gCHSpGkhWMl+yS6+YuEcshZrqWTz/apqQOj8L2PWCPwUc5e4TNmKaQXPOzy6nmJhB"
+    "gbv8HkVTEUbEyyxX8V9CcRtOMdvKlFLyWQOT45bgPp6FEmLaV2PMFIGRIl3ifPyGU+t4Y3wcPl5N"
+    "HyMyf8+cWGK7X4HyH7pg1pH3TJe7GBfAeKoEqGhxy6G5pBptiN05mY+WX9UrR18SILsABti2Oljj"
+    "VtVxlgHumncmZWo4Nq2eK9717tQ8gGpvOI0wTKf7XRRkj224XkIQe+aUwskk2cNzaywcJaMKgpEa"
+    "uxk1zsWCrnKgjZjcSY4zZ6wpF5XcaSgD7moc7mln5L6fTkFo3nn/nS08/eee3a4WtfuHrfL3zT6+"
+    "96cnd7nQeIbA7IVVll4N+VgdWC7t+VoRVfJ+Ybi689c+3M+z/00Jt++pc+9Fc+9fsvfO/6pXNvWN"
+    "/d3uUOF1/Xy+THR9M2dBLPN1llHuKqZSY+XYur84tMjpkwEdPUKhm+IYqJ1zNhTcTcnevJmIavgo"
+    "rGDJeFSOlbHou54hce/mjC1MHg1q2txR1nz9rGxvrB4pibiCwtdYDhC1GOhEkcOXjG87aHLR9QFJ"
+    "fvmDk27OdAbh1yUAsw+x+3ujlwa46P7zqYETs42HIeiKPiwz8mffIK2V4hSlMFOrRxMPHJW3Ltg5"
+    "X6wHbBDrLGaxQn0uCGt4JhS1btaMSefRWgr9RmFOy/6cI2vvIQufjdLsQXZEKx3zI95Q2vW1d2y6"
+    "0Ks8NwbXxgONA7rmZPuerYl3Ashg9Wq1pWWdSKmDgaKw4kFtGwR06pSsQxdB6k33ddYSPjK88zY7"
+    "0YtHrSEEeQbtDCs4w22G8fYs9E+9FJGlAoYQ9uE6GpLHVvkJzmMwrDF0PF/oi14BvQ+wJ4zl9sZd"
+    "9VPoEyPW2As5jTl58cHC0O9/Z0R+7y4vJdDy42t3e0wNP+rv0HHS8acURvgzqfs1vo46vvbDQ+Pq"
+    "mQJ5rI8MdojZyVTPuNoMSkYw1pYROUeVmm2a7ZrYM+BOww57WEas97Zlojm8lAj2kzzbnOgZZxHh"
+    "GMkFVGXA0Au/Szl5Z4lAYv4pMfU798rRCul5iZcdM2JJuxmkmrid/jMVT1GQsX2s739Wjpe/wUg+"
+    "tv5EfnCH7JMAiQ52NQFpcMdT7nPPaYQA4vDTzv2RBCDHbZb6wRnekTco8FFNxEzsUYyo+J0/454Z"
+    "Wk8JBpetc+FpkeuLGVcNtsGiawOnTahaKXExYHv9hTrTde2x1xVzTW9fwr9ZkuYMbCf7XB7H5Fho"
+    "iKONaLVY8DVB3/8jlf0a0c/Qa7PkbogpGelGm4JL/2gHExvd+fgY0cElgGpDQ5PtU+2n5jk2MEms"
+    "BNBW0KvqZlXyApN57DYEk1kihPdyQ3hMkXQdkL2Tw5Pnjb0y+88D98+JHf+eZrL+295+1vuf+TO2"
+    "c2nhPyklXgV2WVgRtlYLWgu1FWVrRZBo4XT/6br93yoz/33ne+50Of+ZGrm7vfc3zu7K2Lja1Nf8"
+    "ZF8yQf9t2cZsRMZuqzxlnTrS8maC+GODljwhY6J2454c1E6xN7T5zT7GV+yTIlgkHp2c2TpGbQ/p"
+    "yZ72xxci7ZnoS3dQHswtbh4vKFrcW5nS1dEdOdxr2v6/M66OnOnKRZCILK1yfnkdFM8sMOcRhVte"
+    "wFmygiMdGCA3lM7JKC30cCxy4a9zD9MKp4ExKpk1PACsr566uaFipgLEvOuG5rA18F/3Nikz4H8+"
+    "QWEaLg4CThuG4h0/tEq+iJCXbk0UsMZQg04ZALDnJApoSWtq2Zh0zT4nf5ZcebGSx7ioveH2IH3e"
+    "67XScbpomQhQAcfMGZCRM8CrKU9tud4qUNU69WpVt+NMYkR9aqSGi0IdGXrSx81cXuTMYm2Pmg6V"
+    "VuuT0gC4dqHrdjK6zEI7Ql44Vgk2EssdXxPkG9hAOMfOn9pWDaPnVsqxY25y+2b/AkzHG4XzK+II"
+    "Ew2OzXGl/hH1zb0+JtbXHulnsXt9xxt+aPHf2+HPuZ3rvMDzIg11y4+wdAP7KXLvuVQfUNufKZNl"
+    "KVSPpRD5328BeSXlRtw8IREB1dNKwlmUIag1T69PVf3Mir4xwaXSRT8Y9ii8PHjHs8Hxiy1TEYWx"
+    "MAfWtKyO2AGbE3cS2M+N6cqZ4uWgRn4qiP31LvEJd4dGDIt/hZ3PJnLjuPvfMY72d5wU2AbKwQjS"
+    "8S2WPScyiq2Q/wy0aqYV3Ue4zjQYapck1ApRVV6Tq36pkVxGiyLQtgGsiemN3+j/hjaI6+lBeQHH"
+    "vJYW5KrHoVtyuxvB9YJD7SJ+YJVH2DoCpGDoESqNKy5btl5jzaFTOiUynQiZCWyCVetd63s8IYu5"
+    "Q9O6f2cENMj00dt3o/7xr0PHGT8UO2/XLsHazkxr6ghMykRj7aLUEIdnjmtn2Qq5pukk/hJTeR67"
+    "0nqhJUw8dNzUFI2K9xkQZL8aF57YQxKyX2B3vou5ONn8T0/BcU7kqe+EkiSVqXzw/6fGhd51T3Pf"
+    "vi4V/98CO/+4ann3vx577jW9/43ltv3fnKDG7VXGXgG2ZgtaD7hqlZMfR89+J3Pv97d/xvv/TBP/"
+    "e+j332h4/O3vLtLy1Oz25u7TA9+fdY/HjlOss5HlzUpKfZdZ0JOOerXoT1iRq/ycLEJWEvVnrhUS"
+    "RPxCzO+tEMJnTPd0yAovPyDMjky5QJlHj+SmBZZ/KGwx1FfjKcz89tnBwtbj2zvbj9wjn/mDi+bW"
+    "oBek0T6iFeC/LYX5nOCkqTOQdM0TIhY0gTbUzpwJD4sKJA64CjWgEg788DwIKv0gcxTuyJidoHax"
+    "lQ0/wSVNuQjnfS586RnEkWUDC2cyIqGNAqS8YY1mNgHBR9joMx69BQIX/6a3uMnQ+iYZkfnrb8Wx"
+    "5F8qB4cc2FBomLZx13eJENrSWC2nxqHxhVM542hmfEi08kp8r1/Ymu1hADvzqjGg37PoNUP3d9Ry"
+    "LQxrZqe6o22t7nyi91EcJx+0g7MgjKZ7PDR9SFpBUufceSRugVK7rGA39WRh4k16mPyCzelg+I/I"
+    "hNfBJocclr3ekuWmO7RqzE5/lOW6yGAa18BqYvqKCbfR4QWUVGL/0W0+Jgb39xvH5mcfH2exaXbr"
+    "tdV6/5rUhLAaCGXm0bsnWdjmpnFPipk+y7Ei5/4UDzSHQMDQav8tly1rMNNirSsa63jCsglOgSPy"
+    "U48YN+00kMJkoMljQrmLncrN0WEgQaUwkuEvgCPW23ZnYS1oQEH/llX4gBTvwfPpoWRvPbZWOgUI"
+    "usjrPzCIviflKT/GEbX4sWqcohxOZbWV0ZZl5EfNgsOZz2vNt2kBF03p34HcWO1xT4EnLu0ZeUix"
+    "rEgL8dC/Rp4WCBkqVdcdAwSo9D9SUSLFSgRcpbi8iWPZXgKLQbr+nqgwUdVlpqT2NmqubGPmYiH1"
+    "oaxDqPiXwMGTX9dICxvbEutuy/nmTxsRNW0SxQ45J2eK3dng85GvhLRX4FyG+9+vaUhYglT+HYt0"
+    "ia5ve9Y3UGLM0mF3eaZmSNFYwh4pi9/83JjVU10rO9wMpGu05OXRXmoI5OWoqly8AoGhznTzX5t5"
+    "5AWLDmXEQUtcE1Chvtl54bdQ7CeOk7MF177GRa1PXNzdNLemLoO77w9DNXrn7i+J53vvm1P3P/fZ"
+    "e/tPohcuVvVf7QDKwWdH9oem5e5tVrB1sf+eTnXvczv/gbP/ChLz39Qy9tnX2DPiq3vr255Slv/e"
+    "h4saX2mp6zPNJn7PREuCYnTdh1PnaiI3RPhcx/nD7yl7mQyS8z8zRhiusZ1bOqE+++FJjYvRgSip"
+    "ZXmiSzePCBQzquo+GtP0chvYODA33Zwsni1nPnFxfPbC625dyaThoPhZcvQ9GiTr8Nwxei4Ae4WM"
+    "eWi44efP6v7YSYraPRrN3+s1C1jxx0QQECTPTxMV35r2So33pewCLH4rUmfOpotMXCQ1f/xJfP2K"
+    "FgM0C6JIdlvmj2I2yOJyqx5RjsWWjWko79EKnVjR1TMyo6XcLEdsdgR5td9bjjKnHnhPzVAW8Sba"
+    "uRgd4xOWfF7jxarxweLiq+MQYImNE5F2cIVh7A5CV6ch8lULqY7f2uKVWjM4nFlFjYt4/DlojVzt"
+    "jTqUVV7TPQLVLxdNxdex+RBP0BK9u9L+GR/XQQxEufTRxsn3JSZKbzbyXcm9ml3Xapc5ElJzv+ko"
+    "iKGZW+0GF96JZnIpAefBk41AdWD/avLU43Li5uu3zP4uyFWzR3bPpcDi9p9OOPvN8phlINfkrV7i"
+    "uaJmPDwTahlEdg3S+YeQXILFZYHXeLxU6wO0dEhb9Qa9Qyb7BzhZia/FcZLkKSTBDRz2tut8cqUi"
+    "0pOUCqGK+A0IXXdWxNemWhLU1dUZbOkcuvxBR97982O9mG0/bsjljocFFrycfpzTbZLNnOXr+BjF"
+    "72R3I8PlJtHAWGXOeq2MaOt/ZGPlB7g3CIUCpHFhh0YQZUZtXIf+aJBFqDBSP7Hft0/QNqE0BQYt"
+    "utEUYY2sqmIWsLSOQZheIrh5EJadqKihGYNLHrDrAQVUQDj9dEipIlSmykRvrk1hJsVCKn7RyILm"
+    "9mmALuPHp/Myk0jz0xSpRjdRfa+No+AVPmyg6SUMRBn5f+dLnWtuBGRzFrDPC4Y7YP+DorzZuRlp"
+    "uAXVfsu2it2zm8Hn9uKWZFmeH1/DVcsgIyERpPHXDs41iOoF589IOav5O1ky09lv6WJ7/67H//7K"
+    "f33vCOZ+/7P77lTa/5f86cWbx0ndur7ioDIwOrBd1IxaqRDBwvnv3aS+fe/Ssf/qM/84GP/9BjTz"
+    "z95/fOX7jneJuH+TTR8DkXTaj+IWyfkNbBQHMV8xaTMCcA/HZ3n/9yQqZpWXQm6hzw+aIVvrLfk2"
+    "UfKJjMPPmhqwOAJ3XmQenwB7P4mRplUDRsal6UXI2hbqkd6wsXdiR7cWdzcad+f+687tJtrO1rMa"
+    "SfUEBecyePeZ3YYBaIAIyriBgC0PZ0OMKO+dQ54bS1mUwOCDmwkQn+KeWy2yzgbLKoIyZkYZA82n"
+    "od+4fU0Q+CT3g5+JZP1M7RjEa/Sy9MvSg1kfyDp1rKxkUcs6pa0zImhOKDc9nogx5wtCd7GmMOUE"
+    "MZiYDjJ3lN3gCuMmtCmWMHt5yb81rHdWcG3cJ0Jb247h4sdz1uU/5CzUkHuY19ckQbVWdqwhLNWA"
+    "MwMiyQCHvuBMNoYuEgOU9N8HlXqKjDX+du2BdGYORPv5ksbi37C39evPix//iu0gIYFN3YpeB4xV"
+    "8ax5KPD7Fj8YEpXyQjJL2no2tonaX4cWHRy1T4eo8deTHHj4XfsbhVd+a2d89JVnfHc2tOYLy/AW"
+    "NxITr7kf4g0LI97OsPy/OLGc6ZqeW49USo0hF03VKBGr0lafx3hHHBoviCT+0XfDssvyLtXvFNMq"
+    "HtWt+ikbdEM0UyVYYhYWMsYETpfMYv8WcQURR6MbuOB5OuUVGUgTYb3ERUHs/4iRWPbG5uU8KNEe"
+    "ei3UjZd/K+8uAVeI9VohRxDqw2XXB5Mee4tRSs6LyHJTjiLDlX6HEgoB4Eer0/wYiX00UCSKK1nc"
+    "pjUKwKQBX2QZX5QKjdpiYpLEIVinHVdlf6c905FtJ1IcNkNi7Baf+sL1LnOsDaVrqdRJzHJHK4ME"
+    "PyQbljFR2esVu4/bPDhS5actRA+AR+DNgcDtBtEdXL7alnE90FR3/pZpsYRZWfpuBv+UW/Mz5yWT"
+    "ap8BN+LhSiB3EmUE3jFGbjGDehLSk039il0wJOpSf7ydTIp4XKH+nlrEHnTmDIAfbVJXOmQ+MjKs"
+    "nJ4cH+7c8dnvyFj37+8bv29/Z+4h1/5MHf2D27rs/Vcel8VVYZWM7AakG3nI+btOfpzbF/5bGnLv"
+    "3k//3B73r3r/3W93917/hPXr14/vbTra0NPsDLs98s1Jj4+HFuZhQm3TotzWSqSYl5CRkmwkxYkp"
+    "Fu5qss1DzhalbzlO1jtFpgW2Ga5sBgcccRy3feZLOmefvLF5tYSZOj73Z5cajHNsXd0px3UZe0bj"
+    "23tTirPX1di8hTLeg4mcR3Xhz4PSkP24Hz5A0T+3HK8Y2DLix7wCYtosU3bIMtY1JPHuhyvM5BQT"
+    "lQx1k3dvQg0O2Y+XKZyQYI0R+L3RxNrMMmJzM5gHSO8Ckn2uBmDBo0Bx68L/syZhp29JqiIobQkq"
+    "wZFtqOIeNnl6RtUiGEllyAPz3KJrsYsjXq5QIPHPCTt3jU7SW7UoUbvOCga3h8hGQcRqbiETNY1N"
+    "goniSgo2RMKwNQJaDuWC7oKFmh/Uag24kj+77p1ha/hBJL7NocDCnRbp6FRej4C2IYsTQnAr1vSY"
+    "BdOFHMcJwH9hP8tYDfYx2zyQU+2fYeHX9BtH9qKED00q39Vf312nf39YjlkT4vt3vxbj1ieYe+/G"
+    "RXV6Kzf+TkXLK8Z4HSizv7SzltZ2CSTPUZK9yOnEgqIBAR22JWbOioVMxpxl5o5kqTbCArnv6tRZ"
+    "P9IiIlQyc+LtkHP9qxNbSi3Hjt2zQuwsIdCcz18cHxUtuh7JukILFHHu5SaRBqITplJcBYZqzIn4"
+    "GNFUmLL+mQkxKzMUNLrTGHLxUr8vF7IKqBHTsDGgy8apLZvS+ZG1HLVjOyZgoBYmCMBSZ47RM8Ym"
+    "xbFhJ/9FvXzsMFU6AVqG22jVF3I7aAsJx03LbxAZzcWgBYct4+pY5PbONX9iNhtQ9SaMhGZe4uq1"
+    "bH8tj/JBRPkCjDVMLz4dBgVsMBN6xb9pCzHdVt1ziFgdjAb31QSh+/28+yHl7Np9A8JiUfCIMDbF"
+    "30ay0OMBojH+1zcim9gROZkQc08aX46gopY0ab0n7MRAY9jY7EvbGZcMrvCNuWMdWHk6LsEczwpc"
+    "azJByr2vMcoxe/p9jpn3Dec7R2Ye9g/TsffvSJ3WsHe5fe8S0P/sott537ivaITMpldVWtMrBa0K"
+    "32AWUgn4B74guP3/2j/+IX/sIvPvLUD399sfhjR7s75/g8GtfNdTndCzc+f8ZPB/hQpLknVzrVq3"
+    "mWxYavrGnWHpOm25kooTFR5Y6XTbvvEycfrTPp1nEjAtp2MWY2ms04AOmze/oaKQ54fD7OVnQyid"
+    "fb6tyi35+7RT8mvqWfEF9jQWcd3cGTv0zAxzqbym/Q4ZdOuEXrhU/7AA1pY3PCTDyWM8U8n5XR1U"
+    "RuDDUFxCbHIzXpBjsd8tQHn9iin5N+bPRCEihKH4xyl68whG8zMuoDACfLPopjWUVM6nilkVTfOJ"
+    "wfwLEQbZri4X0URxzg9mLHsZmfu5zRTMT4Mfc//cRvDAkTJ2vwXtQhA63z0HhNi23ybaNhGweb6L"
+    "kiwPJ7RhukyFqyFMBHIfajPPlAcpQJkftk22rdN1A26MxdcPpEy1jhS9oYajk0aduFwHhr+wl8Rg"
+    "1GEyYfQzFmEhpQyLJFSVRlR7jRDW/glBD+WmfItXdzPbWbjw3mASUofzm3AN3vf1nn9+UW+n25S3"
+    "fetTinRyz783LIs+jU1ncW0MGa7yi3WSjYYn+Oy1Unn+Vu5TkCkZvyjX7ghEFwVUIVBZAGNw8p7J"
+    "ageOTFXbFqehJTEVgvPLadP/AmucKpqr3IPhXb3k/Ej8myZfl43HxIdrdq+uWtbdufqATM/k4Xc+"
+    "wXOiPeDhIkFXVtC/8VALZSBFR5MnwxOt4+cUW2VbAxRVJUV2wY/eKXv3FprjMsD8w02kL4w8aMDG"
+    "TsR2YkaeZRccphKXdOFJtdKr/oTHmYjLiFLHGWABCR6EZ5V2rEnAKBdurOeeM4P7DHGBRAobe2sd"
+    "q+RbTBCTtSOvKtWhan3ZbTEoE46ngxXESuA5oDGCU8kyt2MHjiw6VoiadoAvZFGykFji37mc2Ltu"
+    "xnmZnl1gcrkaXXdiqSzhtmB2vWaX5jOq7uvKxOduyN8dp/Cao5jeGkOMe3NqGpcJxd2g8r8nDDZ8"
+    "ac63PuxMVXLgnzGWHWhBt6LH1dF6aPjva290+O3vm5Lz914fmD/SvveMMDP//A6y4/NmJu4FV9U2"
+    "dgtaC7CYc/06cmHK6gaQGh7z5ZfPBTn3vgx3/ufX/9kX/7zA9dXd9+cKG7chxUNLU4Q5uaOZiUJa"
+    "6TrGlq6x/H5aDAiQwnc5m2ZYUZqSay/qwYtq2t2S8TZ3nDBKg/qyOjPtolFWwt4db1BSxMrb4XYG"
+    "EDeWLEVyZI+6c7cVti3XZ+Z3Fhd1vfwpkTyD37xKJUv1kHjvpMoXjFt1zGO3kymylZzNhnLOOnfc"
+    "U3eReHY1dSobFoSd7sDy7iFzGp5sUdSxEIBWba9iP5mBZzZGHZn+FbWFGXLnhAjjuVQ0+2a2Xi8N"
+    "vJINsv1Cn2kSzgV/UZAxNKBndNM350TBHDIUk3Mi+vJ7nKxfARjrD0FzNlLGTRhK2/eSGP7Wj7Pe"
+    "dP7Q5G4sDSVe1ML5sRXGRzFyhjZVrRS9XQluxEGbbBNL56P3QOel9Afjw66VwlB/a9+v05znhB/h"
+    "qz3J717QQbi0hDvJa2z8jinwadhTal3W25KMcathJ/avrebYSKBCcgjWucTAZ5zyOrRRrl6Fi/L3"
+    "dwqN+Xu7S4pEcsd86cFY7et0w34ufiAO8BjajyxGdwM5b4GFv2hbZkzFMbn+nHx+zn3RbLZWSA2K"
+    "s4OhyGpmrcdYOmEtxqdJ+63iyWshDqpVP49KANu+pHRJyZDzFSPlUF3/4PueCAB64fi57xRggDWk"
+    "BqW37EEhpuwPOcaOPqlgzd9jfwcajZ1h0b8PBGRcKRDJbHSPMcGJbQZrgbjbFF01EhOCATL5i0DF"
+    "6m3IYu29k3KicvMxBAYxQ2RmdNuiqhBIVubMdo2xaN94r2yQ6Edsfnz0gbJ3DYTCkf1bEfTW4BwZ"
+    "X3wsIPSvyhbjHqNt3yFtUmn8+ObsvDazTLVW7M702NHXK2KBnvB+oEZ4qvHYkciJLo/KMNQxv0LA"
+    "P26BQxHARdiMN7jeKOvdjH1byvEQMnc0fvo9azEUyw76R0nTlEmuVfwpRWCRgbG+g2sTA8ng0EDX"
+    "6cs4TOdNSNP6Uy87Upy7XfC8KxKcYYfF7ChdbHXfNDlhWdcww5NdzWO3ZN30ZgJ/XdBHosnRg2+E"
+    "aU48X2weHx2x5/6g9u/erzn7/7u156/Y9/85vu/cLqy1KWx+Jm7q0WdDfh6DN38c2N3K86enF//S"
+    "O/9YUH/94/fe/f/vwTX/1r+ztbD55yEPOBLXfbWKR5MacJh4mr1io+OfYdJ+H5RJmph5M6yeUKFZ"
+    "OZTtI8OSXRTNSUnsy77kmXk1/EAWEy80JRbSY1yHyujC9iQc/TvO7OUTNh+soyfkPRgu789vrijj"
+    "M7+iFyfbOlYuKrWw4P2a7rfp18kG/olTnb1EZ9MJicY9dzu9x2XwocTPCzfUbHWvZhHh+y0ZtkM+"
+    "ljI4aJFHVkReOI7q7aVXJSIZ/wRzIT1uykVrwsppN7UHPwKBx0uSuS83r7Fcvwsana/znRpm19/I"
+    "IftwozecnJxxQjQoQQu6XQQQCoEh7hpj9TMD/Wgm+vWs7cbJbyYJjChk2c1iFPFexM180yPcg4JR"
+    "1Otrx4p29aj5W65ce4El3KGQ+rW0UaEu74Wp8MElNwXA8/A9Rjat/HPjA8dGPZbRlRmWJNf4ybuT"
+    "iSUPCJ0raJJ3j4mJy1Dw4A4daxoPcCy0L2YocvGUJOhbzxudgjfVnS4cHJYvfCbYtb9OUnG5vbus"
+    "AgG16r4QzjknyciEao/hpvJhByrumDkyn8I2f0IOMMsSZeqNKriciR2EfkqkQ1/nlHBT4YBqzxRN"
+    "rnX2UeOzIiagHAt7US7La6o5R/+Ilm/AzCkBGHEBsZOnZds1EbfpfGaTcQHS5broS7GsxGiB8e03"
+    "IsaqUw8NQ3v2rU5ZjHqybHnNyWs7MIen9BfV5ysk1AobZcCG2f90Pac9fTrrEfENVoVcF6P2i+HC"
+    "hTxkSs+9T9ns1FLXwKkHkliS9+j5tYnsmZxglmfJ6sgaUSI657niCnzosDSttoI9jyQUKdB9zqtv"
+    "ehgm4T9lsync9+L9iWhIJokPgyvAchpXWnfuupDsDYLy1T9opl3OQ+7yXwOvzGRIjYOwboHZfbuD"
+    "gWcBxHoXqCQHPIpu0JgaAlY8EaewygBwsdFXBdsxXf/+go8zFiXZodq2XUKXb0wGC5FdVgmsbGFk"
+    "YPH/sjDSESe+8/iLMgy3mUL9BIHi56GOhjKF18ih/YiAx+b+jP70F954DOf3Q1+vg1z13b+IEPP/"
+    "rErfodu5948zff/dnN7Y0XrBQnVtubNAOrBd1NNvCe6jTJ8GUgx8+d7P7Kx37zDf/ru9//I19+/s"
+    "W/fO3czv1rOgHTkkl3t5iY9NIsw4kHvzXnExAmHb2Ypph0NvRIZu4mGVmTEhNwJlCpu+SuhHCKjq"
+    "p5qjf0o9+Z+NUBQgV5FnNMcuPxQjGhc/WMyRZffAIETSceWQjqsVDNkLjAF67cIZONtwAAIABJRE"
+    "FUcmZrcds5fbulv4lT37Snb7081Vkk5ykS8fPpTJt83Qt9JlpPvhimYCMbt5EAX+hmE6eLq9JpXc"
+    "miVOecFkWClw+IVix82pVvBKcDVNpWFr3NdB7JYeLGe7xLLLlTEvt9xdn5np/YGk0ySmSQ0c6Yx0"
+    "v8NKy64nnw02/79Oxry5kdu9DxKC/awTPZvdCmvone4E9yEJ8gGqkcimZT5z7HHph9JTy+Gtb7BQ"
+    "PQ+h5bkGc5h4aZlkEzsRRGybo3sKwlHQjo4z/7aQoZ7tItZLpMPgrB+nKpsW+UICk2ue3Qt985Lw"
+    "q0aBT7VS1ya3vumxlFmiWPbd4jU7FWcDhBES+P5en9YFldGtJPEvB5ueOjzcXZS3doMXfnYmP7jM"
+    "49cvEjSoxnjS0gMuRHjJwLjGMUmfhMHT/iTPIEFX7KPI9FmpiVFOYJ5IKS9pBVg4tbS6X1VMdmje"
+    "UNMFD1PKTaYbiPdxNo+xi+6ML1mECwWGrPkzRFH/uc+4hNtODERrkqeyltC/0e9/YPW/of+OgmWW"
+    "q4DQ9aBD3Hq2kb2NcfbER5WVR1l7ZtbuFZJ6ASi0b28cIjVgAKMG1tC9z2qjuNoMRxKsKSnXlC3N"
+    "U3u53DxCCkEX+lq//BKnn6jTp43tkBQqjsCLTloGLEuvahNT16ARwkNdxGGwecKUMEpgWLVLjRmX"
+    "wb9iwWTyQ62RJpuAIbs8V3FZURA7zkRf5YMPYjW/jlBDTTq25gS2mTcebYNJ+UwCujpY1/sVWIIi"
+    "BBr7dTH9miq46/JRUF6fJekQw4FqgxarNCHosuLDFXO0ltr/QnMxMbWvnd+cmImxGubJb5yHJCAs"
+    "WBRm7se3DqWJFzJ4npQlmr2IYnsNxrX9Pv6nIOc3x8etszLxz8uY998UsX9w72/+lb3/jah86e23"
+    "pGcDkZiJnV9ibLwGpBd5MNOBPNgSaI55556fwv/tpD3/aPf/nj3//E1cM/e3Vj4+41/aAbkwt3wN"
+    "b4NksmRJ/LsBFNffRZRJjMxOn8SU4zEN98yQkY8yYTFrzMoZz4qedZVkQYnvTQm145AKgPiPh8EQ"
+    "uPmoDNxMyjCChbp7HhQ9OLReeJHvfCqr4QfXH57LZ+VBw94cnhY+xr8aabCGpr3tM/Uy92WT/aW4"
+    "nwGASiMpQcqOmTIsVHPCwr+epkFoL+JkphkzcWn/i7oQM/fy6qiEfkyiV0+aStJ3X8t7ESV9v2nY"
+    "L4lnhlz6jEihd2z3UfEETJArh4fTBwPssnTtLsATbLBmj2VyR04NuC+ZiAkkIcXfBrxBkNszJ+Eb"
+    "QPoqI3C7Mhbkg3Ln5woCM/Qzr+QQvWZL08liT7h6JEqeIJDzyAijFQE1tsMirYwNmI4n9rFNMst8"
+    "cGCRYfU26xZR+kPc/BUFGjY8A2Bp17iPyLROSti17ne8pIx5SokCEj7JsuhdtrcUJyPKLbIrF1Gw"
+    "VsJgWg2P/WsYI2LOyTERS0v7OzCuNg/1B3vbcXt9x+nxZzt+uikE86ZM97ukQ0nxAXZsomCF2cc5"
+    "wSr22hEPnMOclTa9ygBl/+ARMQtURzH+Ngz4qxZ33jI6eCpJHSNW1pI3p5Z0nPlUMg49b+9hgOF8"
+    "qGxxgcBsi7OpMQ81Vi6LECNrZiAJemSMSBAE3x2ZZzKIm2Yx464uuPf0rkNauon9TAiA/gaEYbsj"
+    "EY/WHDKNPGdLoz/JhTPPimP/y27yVjGu04EF/AmJViiSJp5ymxGXNiii2g7hd+nJG8jcKOrtmWN2"
+    "ysiQepZfPoZVjeWrf6BTk306o2ZaAJC79smxgQ1KtcUk0W0neLjoqzVXYcV2PCqzaYjWOl5oGPv+"
+    "67SipC0XbiTfNFDE/Y2ClJWO6UXiF0Pk31cdsGLJvfoaPJPsXAtVWw/J+GttafNqKkJEwykb+ZYA"
+    "B6cmsFail17JFHNAYxQdumkHWO1PObUcf3yhkedR4Q6zxYF3HbMACbWeEYHHkTyVsZexmebdkziU"
+    "TIU3feglY3lQ3u1/GQb6bbkODx0cEtX3tp47/4yBd/9+JXX9i7/B1vf/2/unDr7pclzY8Cr8pNmI"
+    "HVgu4mGHRO4jk2c4A+2j9YPPnsi+f/wc9/4E/+8kP/73/7/PHRnzjY3r5tc2PTqzSmF+Ygb3Tp2o"
+    "81Sd20PkCo9gQkev8mDBNjT4ZZvCWxns/EyxwlbANJT5O/D5iVf+Ysz2maqPhjYsNv3z3zggiEqT"
+    "A5csrRfuiTO55ILaHV2en6sX5M/Mziwg4T8/HiQD88x6ItX4KClhZjTMqemLGeCRyf9BiD85UJ2B"
+    "FkoSY6tGM9WkZexqMWEhfZhYu4eJYDHTnvgwcPenJnUQKYy8aK84kePfq564lY+og3JjQgWo/aem"
+    "ULHn1OovGGf+zZbLX6jptpkkUSXykcI2mhIeuAmY4d3J9KxxaR5kWLE/mmo4+P2g59SY1+iI7PWt"
+    "lc37dUKbmtTeKuAzFE+xo/0638VfSdqzaDP4GUvyi4dD7Fs9+N0XziiHAyI3qMRUCA0IMLo4GDY5"
+    "+nRBgruZ3ymTgCt7QVFPt97FW4LWAzeDyjW544qjg/3RGM/HCerQtdjZLh/MEnGIyTVQBjTxGBkz"
+    "cuYOgR6H3NKYuNs4s7L9+7OHPxkvYfXXjxrodVNYTnPGMLIOnBydipoV67xd2yZE91nSB2ri0JFo"
+    "322202U4FfUmoIUATHOImkJYzIFsNOFctVcyf/SlJ68ICexqylHWwJhg8wLkeHdsdL26VtSyTxT7"
+    "JR6/7ITkJrsrRGQWHWTZMYMg4tF3+glzyDPXxsAAygFxmoN8xlg1IjJPERr5VEZm73+MFELrH0Ba"
+    "nqhQUIeojpb4yUdyCUVeSTLxSIa915Ukt3gEg8pOg6BsdqRwxnw8Yt4XahcImn3I7A8H/aBwIEez"
+    "gwSDQ8J+uN5UU7xzWIBVqetaPJX/EazfXAzrgsjQc50V88BXy5oN93MM2pmPAh2JG3XNHsl5nICB"
+    "l69eM8/SFQtqtv5fKBdpEdv9vJQR+PSjIGrBulsf+xjxYGTnQTPfxqf6h9kUg1vsW/SM+3mZAyfm"
+    "zB4MKcsVVnHzawsMvXGHIfiy8rLQ5j+DgbE/DlFzlgijNq2WroSAhIE6LPsbzfS1bnHsdSQo7fAd"
+    "ZF5PN7R+v/2eeefPo20S/852973c9fvuP8k1jG/KrcXBlYLehugvH2ifq6FjQ6+frSE09d+gfv/e"
+    "B3veeDn/0fr23sfPvB5qbu4uvMTeVU3xSiKcYTiFYsWhRp0mHy0J/nB00RTCRMjtR+DNOTE30zLD"
+    "lfqIHrxUnpoojsqXzxZAq0ClWu4nPFGIuZiC1rbk7a/YihNSKfR+uszdxpPeI9q5Bu1Y+J726tLz"
+    "Y38pt3B5oAjw/1JTCn+i26klVVi0speDW24bt7OQAIV2Sf1Mon29YiKYvcTO7lCs7492WcjppLE5"
+    "PkRHQctolFlbJP0/mVMHf47JhPhuFUSXhTR33j+cQ4i276QSp76sUX7owwvuJDsC/JcQECBncqkm"
+    "HUhw4eWgBsxJekJYc042WNwX+ZGJK2X2NrG5NZWnPslh20GLeCTHHklWVaxFj27drcP0taB+8yru"
+    "kGF37JUOG06oEgm+Pko4gWKy1jzPyaMAMVS9lm/6n3SjHid+x7/GdJC1ZOMDCd/swJY7Q38TlIbb"
+    "uj6PFDocYan1VGjtVmmYWGOd5EnznBRL0RoPA60YnFiW5171+7tjjZPLe4887XLHbPXfCXDfUJI3"
+    "tdkhlUxspzEWMlUr5QqTxW5XnCPsBEs3i2x5tCZOiQtaHNlxp53xuyIo4iQeczOJ3PAAQjUMtyNm"
+    "5DtOSrRPsOYpDKt+4ANWymMd/PmuXxrU6l3z3j06rggpXttH9cbyHisZyYS92Y5b7zZFwRkFpCoS"
+    "N6aNrO5p2MNFClgcMCmM6noc9zjWwVG5qPnuhlfIwBovgEjMZwXtybQU93XfFVXP07GstMgokQ3K"
+    "DdaAzICyUWDaQexOxHxVAVCXNQUvzBKwC0DBZddaMhNXQnKTgpLW8N7wDDi/KgMTE3G4zSj0+FjD"
+    "/Q1fU+QhtMvdw3PsRZQZZuzIYBDkRovM0t0KyyYSOhzXWX7Iq9ZNe2vIGjYyyuxTeM4R4mPWZ0tC"
+    "O4GvalA5lJBKfoWJ5uRjojFgU8jUS2yLpVeczYQUE+fnjPt7ro+UctPpXJaLRe2bIv1g5a+WZNiU"
+    "RKkO2z95+yLNqUJySJAqPamqfzHPpqo++oHC85zD6RfZ/LeuLSOT3ZOThavO3zX37q75wcnW59+9"
+    "tf+9O3X7n0FWBW5ebKwGpBd1OMtx6JOjpa/9JjX7ny93/uff/1v/zMo//dte3dbz3a2NIiRA8nat"
+    "L078tp4mAC0ZOXY4JRd8xQLNQ46WLu6cIaiJMqTlahexLSRJSTM2BE1Kvv0bUeoJ6sPHsxrXkO88"
+    "HdJqXmhZPVWUzpc26anH31jFUWRYI+F5AMHdqcIOgx88WZHX0hygU9cnlWi7hre4trWkBy501LOw"
+    "lpKpwUlw5ifnTKE2k8ZEshjj4hc8yyl8MKfmO45SytjaITuct8Ene79aVGHuKPpAsHVRDBxk7r+4"
+    "tNRE8eECcXyqVtMQ5pM1bRF5tSPnpcsFl9WGXSPtgeASrX2IwXlmIzZN2R3ymM5SQJDV3bt0DLuR"
+    "PbcBGYldibCN3vhf7ceFxT7A58wnfLsQnHPPLhDGufBJtcTjbSDwGpLEZaYJKNvaIbLxjOI03RWu"
+    "v6wIjDPiCzbNwgTbNcKABahy64I7/qTHbCFewo86yPOx8lsOxH4YCnl+NwPbOHns+4oeGPLmZImM"
+    "Xc8dGhHrPUb8ytn1/cfdf9i53zF/Uocy522Jz3n/jHb8tJWR32VbJM5W1ioUlQohUXsRTZgxWChc"
+    "rfZve+lzrU2jqwklPVMY48lw8AwrOlGBsw7caUlcIZEtc1HEOkK2vXCYiKX0Ra4G3S1BFv1Oyzm9"
+    "GZmrP+SBbYhp4o4EFzqUblO7mOEyMnc1GdLWI/8zD+zrOxnO+5NzHV41aAqPrt2hil0Yqqs3Arfy"
+    "TuVovTo418B9R91ezrXgSZVraRRVy0mWjtT2Kg5x7c5TLPh+eEtikxp4H+UOtYlSPiaAuzfNm+dO"
+    "ZZwwbHlLgJD8yeI9L2foke9niJb7N01VClfjmSztTvkIpuMdpVSmvkp8AGFz7vd2pM0yA+F/ywP9"
+    "VXNfaPljFLnTY0Gg2G54BKUFi2YRz6IusYPd25Kx1jskkf/WQOP+s9LG4/RjrwMYKN0rev6rhvep"
+    "xk65yr7mNpqcCZmrYV2Xa8sVvIYzZ1pIEPwGSM2466EO3f5G9oHuNa21tMvvrCIGwVvzdV8xETfb"
+    "HwA489/fTfufab1859x9vf+FP33HvpCZnjMyircpNkYLWge9UP9Mni2tH+xmcfefI1//A9H/5L7/"
+    "/Eb//wtTNn3n6gLw3xF3xwlqvXur790QcxPXmZgyPTRybZDX02rafCTLrwNPVwgqeFHC/oPYExZx"
+    "lLNQuPcRCDocIE1nfx+iDgA4f86D54nug8i0mJviY2yxknYOMAqgO6bkLqAKATEAme19nDJT4/p7"
+    "txWaBu6qvUdQKqg4Q+UBxAnGGC1B9zZq5Qe0rFHCHabjr4w8HX9ytcm04swpj8RpMJG3nDgzT4js"
+    "nASEkAG1U8OUugF2uQO6fdth2BY6V5sRgbA7+hzZwcsU0FS81nEmHbBwNWG12/EkcObDkIIR55Cb"
+    "jEF/CgtE/xEwHxSUaV4CKHAfFqzI0iMSSNnEAQFCX5nXBky2cW1FnEIgPm5BU40FSLGF367I3mWJ"
+    "e+ZbDSygMluna9fPOCBtkCRgUPKaM9J0DvWKpNP3ZbEIxqU+GT++1Qc/E7Pvm9W3i4AkKij4yDgm"
+    "zqFC/JsO/mZWN/1DS25EEabd5TPqsQTe8d3gPH3JnbO1hs7N66uO+uBxZbu2fyY+F8Gxux8kYtvP"
+    "6h8ESEfl4YsNvgS7Yjbb9NKyy8cQYUqEn4Z2X1VbttgGTAQhEoI7GAbgypAVZ1fcW/+n1BRyyV0r"
+    "Ot6odkHJvElzSs0c3mmYgvIrhy/LQD6nyA4X6Nsx2Nq0NOQPE/MUaynQmWbdmQ8GXPPpS98IiZbC"
+    "5jmSf7w5Z0jFjwnveKD2YyFw/Aix0wE0fXOGweOtKHPhW1/Y+tyf+Wm0vCtswkVsEJrQWNjSCgZR"
+    "f54ju9ajfJdnBmySfE4097HrvJ2xzrOjWQwoZBrui3MbXdnCnRp3TOfTyM69flafIpGihZU3WCw1"
+    "r7Da99b/k8uiwpO1H6nYu5v7Csr0bxwbMZTLW+mksxilGuwJmKdLiQu6YrxrbNin4UwCjKN+cgYD"
+    "TJdFG4AIAjZXuwTYKo1ywo8nB9STy9j8FvMOoU769q9vCAk3yGbxNSzX7dF4Mj7/RpMz+f6TFF21"
+    "YaWH0uSnMMievYUQjit4eOV3x7Wq4WCnDZN8Q3Luc8wuOC+gZXsdeOdOH65L7ffeb5dz3/sd/a/e"
+    "5vfes/eeD+y49KTN8GhyFDrDav4gysFnSvwsHNJMgdlsXiheevrT38+OOv+Xv/6Nf/8m8/8eW/cW"
+    "13942nW9ubm3p3r7Gok4wXEMy1enky44SMk23xmHyYoHwA5BE/TR7M3swNvHKQlkXI/EkWWuhJ7m"
+    "w+Mx8qcr1w8eRkYjCiL9tM6FKOfRycPnsj4jhgakpDW7L6YhaBcbXqNv323AU9cnl2e2fx4oEeCx"
+    "P/8PBQOpx0xs+aFTMZSw8/HIewyUViSKzgT37EJ2hOAnUF0XH3lTMYfC27x8TyuSrLEtm66NHEZm"
+    "FYrCBFnYplJKR/DiDwUJmp1fhMKrSQdVyWJPZSEtEnHch0TsQDGX869+imMK6h+6BkOTjlS8lFt1"
+    "RkM/lO33GaprzwJTban/AnC3+gcG5W086g0KpSMsJpW6hh3pxul1gvSGGyjyCV8YjD7NLE45FGR/"
+    "12o01HMq7gRI8z9m2m9OClkMNqgV1AkOJzIw7xVvNVe307EZLGmHTxMQUabZvlwA5ZBKi+IGOuSb"
+    "YHG0jHKN0+AUHMSO1s4ZSkEsNcIF2993Nn7sg//bFz9vbFHXe9ZrGub7JM/rgowu/J8R252NJnTQ"
+    "POdCFC+Ytt+mBiC5+g6c9x+uROdEBVxCq/qyPFZFx4ZgIlCm0V1OmD7yI/mDX8fjNRvPynh1wctG"
+    "6IEqjifbew+r0yAZQvhdc6bcZ96drPZmYQHNcg4RAxaDveB83sWjh201L2wGZoOX/lcqWhtcQuBp"
+    "TBhAZgbE7COFvYkmUMMZf91eIW7X7nvy1YXhJdI+x22xW28SqG8flrkxUHAWK/coR+32mxpzK0lE"
+    "twLZva+4DeC4DwN3QAArgK/o5e5QDc1qF2UcWYO76J1N5LZAlp6pVfXCpk0Npn4wR5bEeusNV5Gl"
+    "zCm9ko/jRqQbS/6Otv4HVe8NIYeMv8kUDYot08TLZ/rqVjfyIOW/3ItK7rlpMSWP1YoOWx5ulWfv"
+    "n4AggclZaHvtQnhthCCI/7+GU9VOv96nTEiWbdoBYGBmwfNLCFSW3pKSuT3bJcvibt6gijSNIEF1"
+    "898xZa2aJnpfSx1thqGaPz3n6EXx4RvzByTEobec6HmBZP1eBSrM+fjkWXH543oKN7vLjyzB/s/e"
+    "CHPvc726enr/+p191/5yM61dMHnVfl1Z6B1YLuVTjCTBr8H750uPjNRx69/3/6qff/zce/8v/90P"
+    "HOzgPH67rfxmSjNz+fY2Pi8MkdMwH/mjE4+Tn1U5dC0iTmopnZrdowAfFKySKFg69PLYvek9Z0oO"
+    "rDiSYdDLMBx8jaqu3HN6F5EURfduWrIakRkhqYhgAGBNGh8Zst5zR7Xbl4QQu7tcXh8TXxUJCezv"
+    "aOdHeOY4xgU8SLL+qKP+bn4uNb/LcV60CLUmEMGfy2p6WDrmSw30WEuBO8HKzwgXhEK/0+sZtp2q"
+    "Ztx4TjD6yNpCl92KZUY45bnOQLe+Sl8FCyefeDg3yj953b5Dqyjs8SpSthH2jkQ8eCY8Tnvm1gIL"
+    "nJQYtc3KCgozGn4APJdK1mpQlqtcXxf+zM8TJ+oog/+ST71saTjHHHhTPwwGg7nY0YMVBpl2yB2a"
+    "7a9rSUjVVt+BZVv1R84MYaOtCyWB7wccKxG90+GRMsNzigI4aXw0IAKoecaJFlctH47WP7HHSpqe"
+    "FdlrrcQP9EH9TY113urbOXs5jb2s3dbsfCBSQsyIb6WMtsgIMqAOFLGvaDQLLfw4YnEQeSHIltxY"
+    "xLcIg3dHhA1nyVbvDLaY974RW7vMp8ZSDJ+v0oDv8u1Ham+k3sOQNBOZEFhJioEls5RmUo6GkFQT"
+    "LQnSO1qFuH90x40bWMz4atmk3FNfEmJ6VuLNu2L/g0062mISY1U51f7x/xjdi9GMFHAXqMCgvMxn"
+    "XM0CvuYQ0BaHGm5AvLUQ7JgGGj6XYw/EFT1+ZtfNZGTLTOoR8BhCY877+w6VOqMfqhmu5DHDoEDh"
+    "61VZCWF6potWvGcGxIpTR/+GKNUpTIoAOm0vJum9QUdrK2FL1SQdTHR0y7UAfOVb+vh/8WjEAwpn"
+    "1sSb9w/H4hD8bXZma4zAy/3dfGiHQsHinj2ED8d+ywwp7CUx9bltcgRA8hHOgaeoFBpSM2e4xL66"
+    "uDHfxJ/GBQ0meM+2IeHGNaJDjxkX3JSt4gM/DKnAi2gwAXe+IqTKPCtn37ovfv/GImIj02INPrXN"
+    "msNulHquHp+Zg6EiFdtf0FUr5mkPMjzyH6SYNTXYQ7XTu68pXnXvyBD3/u8Uv67oQff/2Dd39GJ3"
+    "6HSwHKg1V5dWVgtaB7dY2nomGiWCz2rh7oB8MfefB/+Se//Dd/76nnf+T47NnX8l22HKi5Y+TJ3w"
+    "uYWixJzxOe1JnUmES4CpR2MDPZZdLERiYtJkGuHmWx1TLwR/FsFduC5N9eMnn1Fa45liUElKt99D"
+    "LxcWqPHABe+KnRMeEhU/emPv93RoJXzm0sdnf0BScbm4v946viEQ2znxZ5dkx36jjqe+GINl5lMY"
+    "I9d0XOBJsYLSCfkU4E0bFl4bZeT9LkE39HbJLgGzKbZhhtyF1/Pg9wULHBqy04bgjcghCnvUCIlF"
+    "AsIwLnsP1IHgD2S7T2y7TyC31e5AI5y6jPwhZcH5AsVDyUqy9mhLANFSyVSLA/wW55+AhoFGw7fU"
+    "jE0rYTp/qOk8dbKofS5IAVvLZCPRWbsvXJZrhCB0/65YKkbDiRIB5KycXvnAA0fula1Aq2FM2WIZ"
+    "aK2YYahwhT+qTTHooYn+EpNvfla1y1Ajkj5uj3FgH9q0LWuWP83Oa9IVXajlk5LAzT2OjiTbkXh7"
+    "GOjOWlLGAssk8yVnyz2uHBnl6Hi80zdyyu3H3/Yk13vo+Osjh0dN7XUQWbXOErTqhW1TS6JuMsMi"
+    "VicbGgxTodFfHnJWqAqIi3ThIqO+apbdjWU03T+45aDtG6LQCOLEqpUFO7EyzEUyDinXTV9FiWsU"
+    "ajbhzEupN8xBfojpFY4/QQRbdzZaL6UwkgKoxR7AiJ/mRoElcrGlVH0KLep/BdxYtoZIuP/fChIR"
+    "GUiHd02G30SCDsOAvHAyFdFvplCTCXppRmk+XMxIHoPFl7QohLHX/J41zbjWLMF16H4f1PfNCahj"
+    "glFtJm6xy4oXwU0zolkl1PFP4LEL5dKRl4jdv7gCGRo4HwKAHpcWhy/BBP/9eFOLCzX+e9Ez080d"
+    "zpjr2aOWKXw2HMBkro8X/yy/ujpBmLuX0DeBO/AxOZeay00eW/S/gi2Ez518zhT+G6H+XYj7zz0v"
+    "mDVDDxPNs2iv3Eqa1YI6cANkbbFw0oO9cwBT6Jw0AXuTKsOlaIFyPhIGETiLWoG8WHViwSPHLXsq"
+    "o5Ftlv6fW+iOnEQkNYnMtolcexe2Nte02/AXr5mReu/cWHHnl8Y+/w+O+/+Zvu/Yx+9jenPxhclV"
+    "ddBlYLulfZkPL44f7R4da//Oinv+kn3v3wux79ynPfv7+5e49/mETvdL5cZE2fk2MG8O+6aQLgR7"
+    "w9hYmvm1tZDGhi2fBJQ84OmVtyki1Nvv+fmQ1a1+7p82laTTTNJAtJx1fKmehYKYTDBIS65ip5Ez"
+    "0vbLCt1ykzEzOVCovQQz1LIPeM7xNNtOQLP05+pJmN2E71ZQ2Xzm8ubj9/1idvG7pataYYD/aP/O"
+    "ngQ/1uFnco696ksb045E6QfOF5f+4u2MXyE9s4yiNn1IkPJi/5Jzy89O/d4Xdx0POVNfXlnNs5oQ"
+    "9wf2bOE7j0WFrT5ttFOWEDm34WQOAmF135oNSzOzaQEA4+0m65BCMyuJSCcY24icVDF1WPFwzo4c"
+    "kVFfLc/dgoFZgjN5GQtETML91u90GL/S77HlakRfy82O1kCxziZl8hDykGG7hto5jWSFuIQwVc4F"
+    "s3DHLYMnExfIs1A7DSo/ny/TvjNqffqG3bjSNs57H7mNAf+4DzUOPqq8AxisDwlcRgI36qzXvVYz"
+    "bF1RcJHAZh8RIbP5AauVC7H0vN511Ivi6BAC7Mw4MDPWZ5tNi9eGVx+5336zFL7sx5gGqhxMKP00"
+    "cKRngv0BIFDP9XbKaHZsGIJy61xx1Z6aFKIS8GcY/xCiV5MpEEWJ5YebUu3BG/kcSEpj+jmFlCpR"
+    "T94FnY7DkwuiqsnG+gDzMetjZi2OU141gOktGKG9mZlPVe5lOgxFsuIEU2dPoe5/azxZcSBBHAlO"
+    "xX1pQu+W6OaualmQH2pDl70pVsKXpvk71EmQxM+QcT2aqr0fzWEddl2RdIZX2JEbpHaU7vmAkBkQ"
+    "IfNkYDZsqSW2gVhkVbvutWukE9RT8x7YP8C1ZAnD+JmFeixTHR4fBe9/4+Gcat7GONz3uvU8v8Kb"
+    "rFLZg2/DKUWrgdHwo6bloFSBtQrXkYakYdAGi1D0iFYyegNicdLzKglR2gSto01NvKTAQx+4IbcY"
+    "kLe5wPNCGaoYk6lNXgX4Q+rzCYfYhuy6LCC6TJC/VskHHJH/KRK09rbrZgX751AAAgAElEQVSmxL"
+    "GFDPMdNlvWcboDX7oYok+hM9rqq+3xE53jNHO55UvW5wbI25B4ZRPn+SnQFB1TRGdu5pdjNoVzdH"
+    "x88ZkX9v/8r3/2ixv7h8c/9vY3vuaTO7vr+62xql9dGVgt6F4t46nFDtPp88/u7fzkr/76t/z0ez"
+    "79g1/f3/+r1zZ37tEPlvhHv1lA8AUnmnN0/sPUqwWSFjDQmdD7OXd/CQoTBydtTEKeZJhSUph4mD"
+    "i8gAKHuYm5VsIb/Ni2JiPU54UfK/eJpOnaSMl/OCNkyObnTNBt4tnQN3EiZwHU9DefKPkxc1yksD"
+    "A9PTnSj4lva1G3obBj85q+je9ED2AeHGqyY2It5zh5RHdTq1i+AdOTMVe4RMQXftgcPy1uF+y8Y/"
+    "edI+mSCy/aPGEnrp6Y7bdksEF68BxMx5koOF9WKzGxGGcsbAUomOjJBxccsT9ohG5b6MNCEzxVw+"
+    "loWh6yy2ioJ3mwrAOz8VVzvsqJfpl1Te4nd2IPtS6OTeT4haz3NsfUPrespGQb3+NQxwIdp8YCVA"
+    "rJgT21T/gQGrpC8Q7sZvwszJaha5I2odGP3cQDtpCKhmf4EQma3RZFCoNbAmA1nnE6SWCqfT1/yB"
+    "pXIODEBaIBAjNs9cr7bVgtm/bPesQvOWEho2oU2ykeNgLJez9C3oo4xonPzHFnTuPGz5wc6XOnh/"
+    "rCpLMX7tJi7l7fmfNazm94fYEa46udG0Rj4kYcx70YFE1vKxixH9OOD1/NkrDvmJfnpsO4YamxaH"
+    "zLkH/yoE7hz1VHvkU0bOnOIYIaH3OimFx2+gBul1rP9bCpHgRJlYfxR5QeE2PNfLD+nIm6ytxf+i"
+    "Ollm0vyhwCM99CjUzv6xbpjYw2XjSnbe5kzgTVXLJGiOiXCHMlBNsRaO/rSwhL8TniJVRyZiobyg"
+    "DXft9xiVZ7jwQaw9Jj8zKqHe09HbVp/KJUhubJaLTSpet9oWTG/OC4J4+sJplptmugruNdj+t8XJ"
+    "Ke+Dbo+IpNmFa1QbwxyUQrVgxlpvPfIaGauFvOFJFSQ21k1zM6b+zoAxF5SxvKm7I6DVn80lbsnr"
+    "/tS8WSmPApqsFPp333zil5X0hFzDtZ5M2rplnyy5hJkvcRX9wSk9EJMrmVQ8LEa783Y3jA2Udzxe"
+    "9Ys8qNNdGsp/kusgKQXxZVM9lgbGSDBS34JqYRfqDK1fARBFCvnEfIV82/9sGGxOfflcZDDS7UqS"
+    "t4bXVe5T8I4vkCt87x2BH5TLMvGp+cXtw/XPzZjz36xLbO/v7Pt37TfR/ZPbv1Unmzql5FGVgt6F"
+    "4tg6k3tD4utvOrD338j/3YP//o39hbnHzf4db2FdYErJH8fmeC0GRwqh8HZjLgN+b4EgMv9JgxvO"
+    "qIDBqZRKJMG5BeZNAOTVPEkX7U23Y02Tif4MKPEAvEI30zngG0ZVqFxYQtsRQR/IilCPDR94QlOT"
+    "msvnqmlbjJXI060h1H3ZnTZ+M2hbEroYtndvRzBbtaXPIlDUdexB6fbOgunr5u3dg8+ogVeYvdmp"
+    "j92FVN4ptKRp/c5HN92MdvOUQdN+yXFz2isCjER/OVdB9o6CvnuYomLf37zozJFpYfkNki2pO1Os"
+    "Kj6GOPrun3QQ/74UY7nVDcrqYTHe34ozYxVBiiZcRYkXNgsINDhv5wwwZ90i1sY+C1A7aY8bMgrd"
+    "hxBD8CYyHnzyQijpMdkwAAtm8oWk1953HokKOJZ1BLQpNG2WqdggyGg47vtiPlyKEXxeQgeQYbD3"
+    "OHtmTJV8uWrWG3Ym3b1q8xhJa8Ix3FET9W2O9msaIrgnWokyr08K3pyRe6dqn1q8Ye+5MP6gVhP2"
+    "w/+WIU0gUDP4hXlVZtRzoL2Nu7tjh76e7F5TvvWazpM3N8BlUO4EXmFQnzznbMsoeH8NOgQ4k8XF"
+    "p525XPokkt+pL0SU3pNEj4Rm4SkH613RCQwT9VJe62OxCruJm+9Zuuekh5vMIgj5GDqwiGkHrdMS"
+    "1GR5wzXO+zYke+8iAd56Py5sUCdvVn+kx/KQfEU3bjSnzqkEF1EQGsyf8J0Da0L5snsi12LOUP0n"
+    "jTJT606aZju+xJEDwXaGrD4TXR3VnSIZbEDo//il9zEvM0NPbJWVj2aylLxpAMwtcV+2e/7Elxr8"
+    "+wyO37kEhjXKBAxCRZ1nslIYpCQ4UYfAyZeYf88Ih8SNa5GEQUR2jxgVgKE2yaES87GBMFd0Npbm"
+    "EDKVKobMkospGmyhmAiJQIuso4SQDREh8yRbZPSPPv1zQSnB+AgWqsBj59Izk222l8YThe+o5bhC"
+    "pJA7Hm1SIZ08g7D85TLbZy9dRYHhO8sa3yCHj3Y2TkBY8NBj0CfioEWvXn74ckoFiWkVSbYk42zA"
+    "xdMvQ6P4l1QkYcM9Fjn08eTYfqf827PrfAloSV7z7/4DxD4PHBsly8l0Wd7+lIcPHFvYPv+cSjv3"
+    "dWc+zGH33zAw9t7axdDfZq+2rJwGpB94ofSaaI08X+1YON937k4bf83X/xq+86Wlv7vsPt3ds5GH"
+    "Iyx6k6d6GYLTxhcfKuN/46J2ea/DIhaC6gK/kUTtgyITBDHLPQ8ExTk56EuILvE3gYTC6eTFSrZM"
+    "LlCisdsyziRVKAIGsOmhZ66DcUapQsOGrhN9MDn68AztVTJNcW+g3xxRkt7m47t7M4v82S7FA/JH"
+    "7N36Z4zIrK8eAOky3LOTwINufpnrxF8qSNuP2u2NCxf0yYHDjIJXGRXYfoWEG0b76NAR+hqsVzx3"
+    "VayLuALUx0ORjDRZcT8r5iF5uyDw0JyeXknj0ApcLIGfPwLWjxURJ0bSc2GCGh+T8xyQXrtkbHik"
+    "G3C4P8U4wpWC98pMudRscdZOcR3Vi2Ckqis9F/AqGBYxqmLKax1XujtSJui/RbDT9Bj9+GMK9lzN"
+    "c4UZshnI5XhOCI5AMoIJTh7xRzH9xLIlgSJfscWE3Xhnh6rAJVseNwFfgdezXNAWNkyvJQMr7ltv"
+    "ERjquJ3WDo3sB2BQuzYqz9xx4L3ycf2ad51PlE7+t9LeT4zNz2hSuLK/fcvzjd3NZiLr75BEHG7R"
+    "6O1Dtpik4kh4fvKfiVcYZlpu1akER8wyLpvCGGBPnpCwuoOpfm4lOwOv9WTaK8WDQXmTAGJp5a52"
+    "W+2EDQvb/LNj0P2mQL0pQP9xDyy+YnGJKo/xmOpHLxaMoRCJTEhh1hAWecajQBso2zL6DT/bk8DL"
+    "1KJ2OgsZbwOHF0XhobWcyR/2XaiN30yF2/HeMAYy5XobR8ct4yMFVUkZ+6vjDUp/0HIYL0f/jLyU"
+    "fAdjtOuiPn0qXNv+1fp+s0lXzsKAvE0HGUXTCTG1rlS9WGbyDRaEpNG2+7Zxo+NnXCk4ciDrvqEH"
+    "/zB4yQfGESbFykajA7YRC4S6VFktM42mNmTzv50jJX85tLGXYFiMjtE3zntURdVc5sT21fEFYHW2"
+    "Ago/VGYgNAFGMrCFTbv7Qt4E18jQM9P/RddS8qfQWgDYCDn5N+JV4M0XxuULZaBP9aXnU3iS9txq"
+    "yP/TOB1q965EZ4tBNPzE6Yjrr4kx/wHaHhsZeRJg6whj4/JFyhBgnJ5BEPT3jqhwScnJ65enD6pz"
+    "7xxSfW9NDFyTve9sBD2ztr165zedV9BWdgtaB7BQ8eruuhKF1NX2z+7Ac+8sYf/dmHfvDpqwffe7"
+    "h99nY/R63Pym3qEUht9Gbmcy5MDzpx1eSsL0Ny4UtD/NhinZyHmqmifzOlP9cCDwhPKEwnarDggM"
+    "iEYXRvNIFkjvEJAz9CDNeTimVxhwlKvngBmckOqz1JYYuSvqanYmQByWOL4nlBqQlLciwm1nS37o"
+    "x+kOGOc9uLbT77q8fFNrYzueEnX6jOCYxxCYQX9qHZb7NMtq/qdg2/RaCh4jt3fEZPtvuRNRDg98"
+    "Gl+9SZ3DmoEVcWzMlafEJGisOOY23/zAw20val/HbV/ulA1o+c4KSRCxPkcVAxQh1gig5qYkOLsU"
+    "3dj7WSQ+eD+EHWP33vJyyM6whoGfyFTyU/JJb4yxfTkCnbbRd571PmlU7EpB//3DWeWp0DjLlMMm"
+    "W86Krwu05MyAV97KHZdQv3SW77lUwiX4atoLg8PsJQv6/kj/iNiyCN1ssYABPs2LYDiFWDGpvdH/"
+    "bBKY/9SBPx0yc28qxeF7eLgFr3jd16cpxLGowdP/nBF6DwmOXR0cli58KdWsw9WHfmeJdpn9DOi2"
+    "cOR4C8n4ByvoypeUYSkUsM7Y9jwA/H0FTDuuNYxe99lNqG0PEJHrZEm5Xkx8gzaprIMi5TUvBHvu"
+    "plekPJn9gWAdrcBhgiUXjEvPdNX3QQZ/iDj5IZfaAg+P2INtAgiQi+bdLNuHluVrvxkad4H6EBGF"
+    "MVzaZXJzlAKFi02g9BunRtGVGsYzekg0zF7LFxzLYS5VnzOjCAfOKLCAW7w2f1y7zrlkGOeHsxSd"
+    "/+2g96Kmo3zRgo6xWMGZKabcN6ERtbuB1T+NN7in6bTH6Ui5ofLGtgbcqGrSJIfjqhEC3XvjXqvE"
+    "bE2sOe8W+wsa8zOvsMNOc0EOaSG+dnJmvX1Of91271umzI4usMh06FNOFdL1Njiik1k0+12YfGhZ"
+    "XiIWMD+JxWU1z7eD/LF35FEnZitaA3MtaBSI5TjRCoC4TmEJp8w9Eply2L81aYVArfsrQpLaPaeW"
+    "sfxCL+FHKsTvX7vKIFeswAsxxKjafm0C1A22cgurQhaJDdByACxi9HlRnRK9+Ss4gXtJkw1vUxFG"
+    "dZ5yqaX7au7q1958Of/+Iewb3z7a//qD6hsrpT13l/hderBd0rdgD15tRK7sWvH23/7//XL735p9"
+    "/zqb91sL721452zlw51XPVnIRv6K4cryOdhPmuElO9J1rdseMo7ueva75QHrIoST+TiNqcsFbxfM"
+    "MGPE7uxWOuoTCJMKkxrXgOsrDPQcQrDAl74mJ6KUXf4VLHJ4A9ORoRnDowqe42LGRzFoI13JGiaN"
+    "xZOLO7s7i4rbiPDhbbmsDg8VUq+rQP940Qk3XkyQXfdAmA/pkw26lq+8PJxGS6tCSCMF3UoHsxB4"
+    "ApoSEVXUnjG8Kzgs3cuzSgOBFwjMMeZOGrj5T9m2F0PuJLGXDFxhp4Wsj4oNgTQNhefJXeDBcZ+8"
+    "yJaLNVRxwCL+EB6cVMLUxLON5OgPTxwp4Yr/QRwSeO0ujisvmjqkbk8avHAdk+7woNsOZP7Q43uS"
+    "o/fKBDPH2kjYF9XhT8ssci6H/ww7Vfw27pEJ/HtfLAiYtzWXbsfwU413XoONp22kZ5QNc5LNwpjy"
+    "WIr9fpkzGnUhviINZQyg62TFPN5XEVFnN8A6u/AOVA76NzdyzuuPs1epxZ32bpIarFhuac5Gc2Bs"
+    "OGgDQwWGPTC3y6LjASsBqWguB/yxcNEXJkCdXqDvl5z3SEJdl0i7IxPdAGsO3JZjAnL4IRvWkfll"
+    "SfEYvV+2Dr8rlA5pRyoYxhHLS8Lzw0A6N8lYLHpYGQr/Hohc6wBTi8YYQmNJtxlf1JFi2W/aHVcC"
+    "rtUoiat/iIbryaGFP8MWtfY2kZS4poZz5LDI03oSEz3HUs8QS/4KTEC7WVK/MrH9FGBurLfW3wcC"
+    "2Sucp+yfMYK+1GaH+KCXwBtUsZD/k3/JCEmNZAqOhuljYoecSP1o1shN5RY8MLQwgCBj/H0LIlfu"
+    "cl5uJv7xugxadJrrG75mS/XJWsNaSEuYyqO4kq9jmu82eZya9prKacTY8Rg0sRphR9xwwx7MWom0"
+    "hQjE286cUX7US20XrIIRGhwo1t063LhjGpWCRLrPEVxQbLPjXFII5xLWwTYGZxKlrv0EaXILJDXm"
+    "0XYUpu7CeiWWTpSRBiEqPnRPTUn4/faEuQSIISfxF3UVA9L9Dviz/IWiPBuA2fG46RFyYJ4VjE9w"
+    "tILudbp2eODtf+1Kd+5/eOd7Y3jr/lTfd/bHt7bfWZOpL3Ci+rBd0rdgD1Jj9e3/7Ahx5+8z96zy"
+    "ffdbix/hcPNjbuYuGyoZNW3uhc7eVrbCm+26OaE2je7J4UxGJxxDmuJx6/95mBUmjxSGTfbfJhQx"
+    "MEiPPJEeloAUSPyY4qE3wxYZgGi8Jk5kUkk6CIIDOtgR0ZiOqzHsRBnVhywMvVMB7LY1HJ0gj908"
+    "WOHre8qEctL+iu3K727C3dmTzQ7MajYsdawHGHjm/OZFHnpyzaV3xR2znBsSosbMDny1YozhENhC"
+    "thnpChqRiOWo2+0u5sEQyv0lFLxiDhe7T8GKX4/Fmc3GmBSpnnGnuUrhHuE2frEpyLekCLD73rlo"
+    "VKGTjVh0bMKGBq2AbM/eAR1zx2+tjhL3S17EAseazKIfMHnu8PWcgexbR1I4ePsWkHhO9/0agnP2"
+    "lPBd15wS8DQZRtuF64qs5nGokAInGoeHNdLQFLwUMYyGpAIt5mqav9SbH1GSUEinOQZm+ds+o4Z9"
+    "f7bh3yGaFm07cbajSNuB2PedKBYUU772Y+KycB+QYkLw74x/rM3P7e/mL3/B2Ly1f0BSib+jZLTk"
+    "aEwYkheizisXnMfub3rWi2ETPJAH7aM1XUKjaiumS9m0JDTv/JQWSjgk2wGwKeFQoLpbzvmz6ZgF"
+    "eygKFaxfuFWGP/qCRmHuocl6511LYTk07v19jNniRBVDBrCnnN+8Cx2IX4MXQT5OSa/VDEqv2n2h"
+    "mQHKLkPnfMacc/tmkx38hm09GVEn0wJiMOaGwsL3aDYNelKo87c50ABg95y0XRXSulZVX8wG/TB3"
+    "z11C//mmDssolSx+ExAgQemJQGTc99LC37F2bjht8Ks7qwxxxcLJtoe9C6TU5nMlYXzzQGiVKY6W"
+    "Tb+1rHNcSki29Wbf2CCHEJZXQaZ9QcTGw4Ij320IDtPm32o9Rz2chAaUy1EpeCQ79jQKbbXUNDfh"
+    "Q16TkjGOte5cqk5iPbIg1QAiFLwEDNpFv7tulhptmCWKfEi8BJC1v6s9/dRkwC1vQ40+IlgYKzPb"
+    "Xd1QYxL1pbwNJCFp2NjyvI1ySHnmnY1JxlOYuiMBX8ZI/oRb2xROwx4fwELKTwuVqxaSPytOTJqX"
+    "9v2BryTd9jAA7YfG+CvqTu/NX94+/+1BceO9L178O3vuV1n9Rhf8+gq80rNgOrBd0raOh4z/KW5o"
+    "9vnvu1j33ynr/7z97/wyfra3/pcHvnniN9OYkXbpq5NrSY8dffe85gJtE/52DcvetJhTe9T96ThJ"
+    "zIq92TQs88steTChMibXyQYBStEpmW85xT3lrMfkQjsCF4gisk4+rERAYy+dSCKnNX6D5JZlIyCL"
+    "87t60fPNYzp5qw1jePFxcvnFmc5Q6dbjkcHx968aZP+vkOnZdHjjf3x3yCxF2mikPLX02Cik2zoS"
+    "dPmfSizrboSLTiUCsF54TJnydZVZmQmTx7cRVVTI8TWQeVPDpnScqET4xto+rktvyAVjrYRhZIw6"
+    "rtMAsgBzByCnz+4hEgoSHq/AvAcsaWD3JYn6EuCxKSIHkKWx01rNfeYkM59AJOWv5cHfL6e3kpfY"
+    "wTL1g2IUL+TYdIXOEGh3P55YKviQHlpbYEjSti9rdg9GKrF5umGlhALqIAhGUlNCcw6ufMoGSCbQ"
+    "OitCZMeWGZILg5NvHPyAU30yS5thvxNMUvEeNJxnUiKydSWaxk4wCeZJ82iBW1QFPNfsKdbX5n7k"
+    "A/T7B59vbFnfrM3Jqew+ELULJvqpYTvf+RL/sEbTglsPzLpA3EtLbOq7YOq+R7X0MI6SwYybHkEV"
+    "TxO3NAMfpYEwEZ2vKD+mVlTjJW6RQu8m3ftQAzIwja2PEpW4GJNtdJDwxTpQN+hEByQW3oiTLbZ0"
+    "wufkm3iWAFwfrY4IWOaysXMLY0iH0SV2quOr52p3mOr41CpC24eR47z8EozdJx/k0qxQYYNXjtX3"
+    "TptXQlTVUswrP/5MeFcSWL+iNgFWwOffXbv+YFnZ5Kwyy5IKIBQux8ZUiiAA0Z2yz/TYNotdKNFZ"
+    "PQ5NW69HrBZDHtwGvTlUMkW2PoNUWKVsnWzRtusOXHFosbV+PbyxWYf5VP3uguqWMqeYbcd9ois7"
+    "ydxrvidJ7KVwHx52BarbttMpFKRgzp5rg9qQCHaFxUy3LyTX8eZwnYhqVKLwGU2T7WlAN2zYjtke"
+    "vsy+BjIviODdFCwr8IqGoIqxg0/hcj4QAWbasChb/Gd1MbTroUARDUBR0tSPiSMnwsGc+5ftKDi2"
+    "k54EVfnuNXjSv7xLjYIwv9x5zaYdDwE1WckuhTOD7XOz49//W94z/94Uce0061dfUtb7xXPz5ezq"
+    "yqV2QGVsP3Chq2fjPre+XWfunDn77/f/6xX3vXl/9g/6/srW/de3h0tL6ubwXZ0F0qFnPMHHzBAS"
+    "/NKjW75Cv6eQzTC78660cEKR7TdKFvvXT923VME5pUmARz5cnToQV8MiZVHgGdHwQbw/hMdHIjPw"
+    "UgNeY53FKDyShoccQYkucbKikclPhjccXx0WehVPL3RLffCAMbO9rcem5XdPE2diR/sjj0Y5X5KQ"
+    "W+2CV3zoRtp0iLnFBhy6GDx1U50OcuoOxJJ3HECPMhchjsWh0g0lftnjb+XB92VIiB6RX/+9yFK8"
+    "PYbx/UsC00PPlKBz2KJ3vpGz2k8KpNBQ7yvUhPTtFWARvPyLna5SXARrWMW/iTHjY95iLMNBzf8B"
+    "lo/ZUbwbe0mvNxDaRtW9d+zH1pBOr2SUJ0qwo4nqRMPjSNGv9T03YMFk8bPEurTnzZtzCDMR/oiB"
+    "vBkil1y0tA9Nyl6jjgd84sa8JoDZzJF5MskMy2/yJVMxGkI3fKthvld+MHwe8RsbUDNEPuZ1yghK"
+    "q+dr4WQ5T38rEuBO3v6UfDz11e3H3fA/qduTO6MxdtX5TwSQlvWT6HGnvkiROKxjbqSIKoMNSn6u"
+    "JovAnfGMYB62WSUoPuLa2ybLKIULKfdA6TrVjL2BSlK/wZdmJv2ofaS4YAhdpKZy6DPv3/n713Df"
+    "Ytu6r7/vfec8/tvt2tbr0bgQQY86wQQqGQxBVMxdg4NmATSIGJwY8i2HE+5Gv8LZUPSVyVVIqiHC"
+    "rlSkglpAgxdoLLjgxCyAQUIZdB6AFIQUIWQuEhCTWtVt/3I+M3xhxr7/+57eSL1OquPuucvddac4"
+    "455pxr773++/F/sHiOEJQ4iEeiKeHGFQtyaopZEdiuMnU1zyxzcNOpDHPvP96+7i3joU7/7LoEko"
+    "eT2I9B7oqEmvgcIzlJEE9bzpWEAe3widRj66Qllgpty34MN1lbrRNYxlPM2u+IxduZoFEnIMuwyv"
+    "ZszBKEApWbzsW2O8UElv0nco+tWI1fOQhBHrtE0pz9eq8Yejg9ZwOULGLWLCNUKwV0c6jswT4BJM"
+    "/oOpbUiS9RbQy7lh20f9SRb/UdYOWJdj+m1rBS8Rj1HCEiCdOwTsEwVaxUi1EdHq3lgjaxNw9g+e"
+    "ZtK45yMjZB1lX4gVbuQZBA4Iyo2tZykqF/SNR3jCD2uNoOvpzY2UbnA76zRN9TvxXx7G+PBPdgAd"
+    "Uxqdau4HBAy1NcCbQfD9sIl20MW7ZNx81c5gl7XvfzE1RBJ1/sfL4hvySed28Ioe3IzX09DHjF09"
+    "fv/+k3/9J7/+a73vvhr9PH7UCelxfpCJw/oXsRbDgf+jqe+TTYrVt3L/70L//qG/6TH/pH3/PUjR"
+    "vfeeuhq1+gLzi50Is0fiIAPCcIOuPwCeqJmv4iJB3APvGTfl3YKP9ODp481GfqgC8XbjOZqNomnE"
+    "yKEnj0Ll48CYfmgn6uSp4zGTFdeeJhpqfoyxcUIz1iVETS0yZqpO7Y5iJP3XTy7Fh9Im1zQ1gRHx"
+    "O4T0z11lDuPD2qp3Mn5Hnpnt5uqREThid095wk3vl5AeKXPaExNkqDiU7djBkKT2vJsxMzcfAOVk"
+    "Ihc+OxmXGgGak0Bahm3MjlguLByJ6wmRPijqv5JPd2yEYZvGiBI7Mvk9gbAEYu0QtEXxj6lpk0UH"
+    "ASbhx0hg/qlrZRWTyC+jEPNMvv0KjPOMZOloyT+cUjjqM2saisGFdoakxMBnR1FIM20+xOiD0uxc"
+    "G5fCUWVGO+qJ2X/Hh/bSxjZx0y/u0AAi3E6P2QqJW9jy/Yt7LPJ/Ymif0Ge6BvOztARVIC4887t5"
+    "vLurmQjLd0AhZYlrJJkaYcElgMn0mzH3P83NFTuZvXbx6u6GLuydd9kd6nzNssYZAxn5cTnif9bD"
+    "s4Ohzelsi05IzBHozXyiX4BmfGjGe5BpcwZ2342FjkkfZwDHyrpE++wXe752524xF8Bswo+e7+4r"
+    "FjRMhhytJJFM+Yh7+YI77aeTJRR9DQYcP4LPdFWj6dcAPSCdZxHEVQJ0bicEyhXnikyClZH8ecLe"
+    "fQzGWcfDYvpzeGR/GOYh8XHjy+BpKrfDtnESCbEm5GeGISCB7nMG0rB98YyxF7iPXvjezMnSk6c2"
+    "3OLF8cjcG1sHNQzOj5psYy3QeB0CkkD2KnbFmpI9+aySWLdOkM5iJ/G3swzn8GFaujQlz878YN/e"
+    "IeOBwZj+fCdruW+dgHx3jfMVKOZbHGBX7ssw9mO6lLbJbXf7kj7HZgm+UGaGIga8bIBKroL0v3pc"
+    "Lh5M12WTENEglibN0ehHlkZ6k4oitCoHFUzm1L+QV9uekYL/tdPIDo+qkXGxQv+DzCINYJh3OQXm"
+    "OZcVYTHMWm4qLuPK42vhljX/hvMLWwG39q7YvdWBeUkQj1b3esxq8ZtOo2yenM5G+/ef1kFP2098"
+    "Lh8bt3L/4pPam7cXJy8W//S1/xhl/R6d+tvf/z9otjBGYrvziCfalGyeTEJMEE8P73f/i1/8UPv+"
+    "k7n7p5/btvnp5+yW2+nI7JQphOFJ6QubNE0YHNxcSJTkT5zWDuxuenAjjsOY/Q1CveQS9ZPjtX6f"
+    "iXH17MPQnYX6YfJrVMODKnsfgckTmxwyPnikA4GSZmGARPHOp7kkOATleh5AKS9X6ipA8XNGbSye"
+    "cjuph7XJ+h4+2XfFaOCzduOHHyr+kTJ46NnsfT7z1QTsqLJ4d5e2zrBLoAACAASURBVKD85l/swI"
+    "lDvuYKon1kxMqS+AyfYDBRhFrK4W0yeBtIEc5Mqs1t5Vv7IV9+PS4SLn18ZJRwzzStmO1Yq9pL5o"
+    "tmj3twG8h0UDpf6rSD4KQguSRXYvHTR/sBHJxZ4ah/xBBR7eLCvgv6cO9OCqSHwhczGE86O0eyl5"
+    "jVrowrS6LDd/av+FAXu1SxByKeILNfpC05RZ164eIuPPM0xcddYKzB+YnWdJoz8vrfxwhsX6zDuY"
+    "rjlyEyi9RIztHDVwwS+t6+4DGyzKl5HImBL0DhqRo3JbiZcuemLuY+fV1vr3zMP01w8E8T5Cm2b5"
+    "bIyDc64OZv4skuhCQ5d/TwicTbv/FFSFA5wVixDef0sykdpSykQ+7/qXF2tNCJ581FYsIXBbZVzB"
+    "e9x2rPD2gGN2NXy+yni2MayU8duSlXPAaw7XvQss+AA65tVjLJOeHyMygw+OcbiTUPxR7gjCzGu7"
+    "I4RsYFC4g9Kv6C9HqvlK/6KHXVkceO3OifXZwz/mQU7ljTNta62RbYq0+pbh9pxnunB3/muIox9l"
+    "wmMJ4TrbASDn/G1rGtwMJ7PDAjoxr7ShwxfMhV6qfxG4/cWmpa7QnlrqQzx4L3nDEEQbJNszif+l"
+    "qcGyUqxoJ4Vl7grNhI0TXmcrbf6DDbc8RmO/3LkE6EpsYvRrNA4BJ5+RFtPpQ7RFpcxyDbp3LJTI"
+    "+R8xiBA5CQXCXqkgY9aFM/4Hu4DRI5em8byccEay/uD7nPNSINHgLZNj6fs+y5sXPMjEH2RQkcFz"
+    "brvAi/cKmYi5ho6X/TpF3cFifc22KUQUHGvVkTyuwfyJ2siGgaN/75wIRl2i8ZGfL2l+Zx7secg1"
+    "4XdTfuXvzmt737/T/wmx/6na+R8FTLeXmRjcB2RL/IAn+phXvj3u3DP//wx5/4r3/sTX/mgx/96F"
+    "+8eeWhr9TvzZ36yY8OSC5i+pZJn4TpQOUErAcwB7HmID9564SRpymcwOkHt7XwleWUTAhMVEwM9J"
+    "gYs2yA6DopIgfPtGOsWkx6ZmOSmRdpdLlzlAkKA+xww4K+E3LfipkYtonTJz9MQvx5QuNc6MLhtU"
+    "88cnjZFb2dlHi5eNUA6FmEaj2p02TG66y9ylHi8OUloafv/I1wTL7YRTd6P/WcPqOyL/SJh+ITa2"
+    "IIlTVo3ZfMuRoLnlhZetEEMiV5p0281Thn7uhLIssdryzNv8Vha7qz4JsAqMJpBD03tpjhNbu3R1"
+    "DjceThVF5jixPbQCIH9oKv+hOuOdW3dQ6KsGSE7SxULQmb9a4IUDhSm6ve2xVdv1ESnxlBTxrxnY"
+    "vsicGaBOF42am0R3HHlaxZ+Kf4OBAnfhCBzyirM3JwdkvNXzso4JtjZLqDGZsjLLKMRUeEY10G5q"
+    "+Mg2BdjHMxp8A84Wtf4zNzN29cO9w7ecRP5i6e8qPhphBHcqtLX3QQ3+SKPO4i27Z/8mh/xeGEYs"
+    "O4+E62lN5OQ2ZqeG3E2GQMGczymQa9bWhMQMNPdSQVjr6L2kVTxzcN/QtUH7a3MmbE6yXdrIcUm+"
+    "gRi2g5qyf53HEZRX9wVB5Tyfx5GXF4FwBC7AIYMw0/bWGuWDHFT+MbWtsSDxknRhw5whAexdRYqb"
+    "vgn4X4iZriSKamH4XzG6yNUE0fi5a2bbU4o2UrVW/J6H08wDV/+OTPBQOajMUSMGYPsC1ZxjSeah"
+    "X7Mkg3Y7vHEhz9FlrEtm5qIRg7MEA53Z9Xv2XryKRju2TBTG3LsESXMlkKEIx1jUE2+As6SG8HSb"
+    "o9IgVxPB7w77GlhN+UUwcj2wko49XoQFMktVG9yZ8g+7EySpiOp/2PbR3Ghw2h3Irsup2wM8emTW"
+    "uPrw5/jGT+K10jASc+Hbq0a4wmWXLa07pHAGfKklcHIW3xWKSVeWZlFRrD0gsl8RKPgcvLtg3Gki"
+    "rMjj9x23BsFBFzvuZ3fiO4fDYbUzzVC+k6ZSadE59DvurGnUt/9mf+2Xv+0kd++6mvkMn5O/hmZF"
+    "8slV/fXyzBvlTj1H30w0c/+geP/qc//L/98Z/9p+/76/cfffxr9OmyU35Jm28v4qLOJ0kaIB+gvU"
+    "DQ2QIXJb5w62HMGcQcyMh5+yNvr+SHxy/pN+nyIsoLeSYHxrwTtC+wfJKYCcgXiVy02alexMQHlp"
+    "Pi3qWkz8QHny+Q1F924s7kwhq7nuytKXbxZBbM1IQ728kfNXZcxj2qXK/oxPVEco8Jscivv93SEx"
+    "l4YuTJH87jNy8U4UZGrM2DsfLTCsHJEzkXztSUjjvxB+ts17ib21A4ZSCXa6JFoAULanNO7faKET"
+    "s6KW5On5Eyqda0setTInNI7osNu3AgxmGek/2eroc725B2sG45ponbdqyCZzv7yabgziNi+6it9y"
+    "V1HKscr33DPjAcS4I6GochG5+x03gJZy5h48MUGSJ0W+hDYNTWntgZHxbcuqjtfdNxIUk8tKDEp/"
+    "Er+VHU3r6F5B9u7YcU1ssHfXyWA8C+xMRG0HpfIYwdZtt/wiW6dfKII/pbrTiQ6aol4tzA4dss75"
+    "88evj8L/zyw5VHX6afJpCWuLho1QIHe4Z+f9aR5uZM45FsYiKPxuMQ7VwtuByG1o4pY5fPhoLUWH"
+    "u+kNo9JNN2KLInBoTlHL0qF9+OGb3He4cDQFy9WMOHNq76JufDvIkPe3t2I01EKt1GbEf4nZMq5w"
+    "xcMt/hZjurbW47stK+8YkOF9kCJiY4iaNzjUPmbWIGopVreN2CJnO5mWyKz+BUAWBtDjfOrKwVaf"
+    "1GPbkRnewbS/wTQfiDdUQLB58RgS1b4nOZeKRYsR3J1UksSMcGRhOHlDFb+VtR3HG9x/S4Ax7XwX"
+    "Y/3fKsD0eV1dAW67r5TZTeRrOtagRnXmvz2kA8nq/YzpMSsYRXOsl988iynf9psttQ7EvY1pEyJs"
+    "mNwcoYjoGNsOvNyslRavyzSv6NhX505okDr+MzAkwbA/uGev4P18TgWHJKaV8xtT9MbK8aLjulZn"
+    "xsR4cC7ywi8WtXFM65MVGHR8pJoPEFHj1+W9gmLXHBPBZZ+cwJqDEkOq/tZyj2XBkbTKIkH7DlIj"
+    "w0o1ZbsSFcBTwme1n72fbRabubBFn8ZTvb3PbdHpyjZOoZzjrHt53JXv54J5O5OSfSJ+pu37/75D"
+    "O3T/7df/i2X/6+3/7tp16/QjxvvChG4PyC7gW4mTjguVDg62Wv33z28LGP37r8n/23//Drf+rt7/"
+    "n3bz36+Ffxffz+tkpfjPXiIge5J0cOWR3wmg59UskBmxNVnTPoYssXXPKRaSAn/PkM3lysSIOWko"
+    "u4YDPfaILo5GBBkZyPEMNcuGlCScnkxUm/F8nNJppO1tAxMflkDyP1ifmSfiScuSeT2ExMJk2WYl"
+    "SPCxhx6Ytgrurp3FWZXNLJ2p3bd3KyxUTFyazGyu95h95xYpoY6d9jwBAxVo49/QyEfPM/sTieCY"
+    "eT0lWcO2OdbUKUYD1hQqeFbZsLk52/8dnPH8LnGOM89MLAQwwuqldzhHBTfIHl1i5X9YmHtS9CsT"
+    "efYrUUA04y2IZpswbjE49pWyaLeKJHmZ4qj40lka2xGp2lcojc35YoW/6IgeJUmg9g2hNg8htebG"
+    "xEvGmPmXlQJj/s2Q6c4KjEnADcwTb+TWYsdr35YJtZwQ/KyLF3WyvnWZyo65v6gUK8sEwsbheHDB"
+    "PrBjDd5LnLy8TCTGCY+ZvPfEHGmORpNXx+cdfFGY/hbly7oZ8keOTwefrR8JOHHjrc1g/NEUOeEm"
+    "ecfCzDTwiO1w11dBKkfeSC5hHoCHbLkZy2mG3noKDhL6Fi0/GaYXQfn4DAGauaI5Q91D7EZTpWQv"
+    "iQFZDuilcdc08c5CVjYzxRCDvDNQ304cMuZtQJJLkZYJ+OzwGO3nFMG3sALSZTH/Od2GoFYZH9qD"
+    "W2iSEnmrRnWhr7kDQmskKfI3jyJgK4hi/5E0JzCK49xoJjnlomRwUM+RSLEsw6ltTH7giQrIAWTM"
+    "NLeYiN0v5Rx4TR7nPYxpUA0IcDEo9DGqbaqcbzYKPdMEvcSMhVf4phCyM6oIkn5tkGK4oKZ0AA04"
+    "xt64BYb/L42zRtdVvsbY/aA1xx2qB57MZkfAW++XXfNuwry+vKG97FLTWYvf+6CyZj1hs0sG2c4c"
+    "Yz9luEkRNpzkd2/Dvn3QdAT/RHce351s24Cbz7mW3tW2j+aRuT2vv42CzsYMrf/W/VJMiYxGCdZw"
+    "WPrkgCHxZV0uT1eUSYU0y3GzTnrX5vpE3yiRsSMZ2hMAky3LH4BoN9w5OxZ+3vU+j5mPoZC16PZa"
+    "PfvNJ7u5586lM3v+tnf+nXv+MTf/Dsa/F2Xl4cI5Az2hdHrC+hKHPw3dHTppvP3n3ov/mf/9Eff8"
+    "sv/sp/eP+xR79B32X5KHfNdbT699H4ynGmDp5IcZBzUsYB6s/MScRbKX1C7gM8F2y5exM8ujvi4B"
+    "F9vwXSJ/w60OnDybSFD08KniByMtIXOGp40O8nUTZYJypO3vvkyHh984JOW2QDe3DUvqhRA3+O2+"
+    "7Da3/qI/cJXMj10wWX9btzl/SFKCeHKzxt1MWdviXGd5/u3O3TOF44GA8RcCGn//XZEyn8u1rrIj"
+    "TxED858ULVC1JkLqIhRi4WCZGSKZYJUm354Y/s3CZW96Qk0RlT54iBSsfO4y+Zx7Ny2UffCTg2OP"
+    "Pf1PE667mIWbzK0xfO4x9+ok5AtIeTyO1PIpVcIEq3h6JIShrX4OFbTzOsLo+AQ10v9i1xc4KOAp"
+    "fHROSN5sH4YoetfTqP2Cen5S55iHPJN9LxLeyMA+Mo4ZLDuIM33QlHGuzIefx7OGS/Spuqn4tHng"
+    "I1zcZj7F7mNq624wtbrHk7scdQHY2cMZwEXNCr9gW+1ES2voWieeCubnJcf/YZPY27dHjVa9+gi7"
+    "mrOvbZJ7gg4vcmuRmDd/bp8GPv/ARCyufv+EwGJWkTxWCkb7Euq9ijmFgR4we/LqFz034Ht1ca6l"
+    "XsalvT1sTueBOcfOigBzwGeVopZk9tE8BU2GXR2E07qrFXhVza+BBN9l8iZTtQZ+xoUeI6LBYML2"
+    "01PWIxq+9dbYPtOMCX+bCy7Y7X2Kwau5gsoN7iDCaxFr/VS25TLGmw4Ct8Dlxtng5GFj3HbeyJky"
+    "0ZKxrI6VNAE2P7Fs7KcQIWyHmMT+dgogIh2VuqbR8bq1usNpFt6MLtQr3jIer8BYOKmKj3NuWoqW"
+    "14gXHecVgMfpwveU1ZXBWobkg7kWVgF97tpOQxxt/iFb/zSVSNYs8bG3Z+cfr1Dm6Hvdy6v3r7xh"
+    "Y/Utwu1xbssf/iNrn4Zq4DgzMBcO6yyrhy7vsN5K2DyT7HWNkEcYMSJihk/s9KbczXmKKrTaBrH3"
+    "BoGLcMNrbI8VEvqde4jNmeO3lDNmNAc3w7133M6OTbvoThz2nLDSacJ9i/3UqnOXWfE9b7PEETiy"
+    "OWDWZ5e31e431BrNcO3hVxenr5Db/7qWf/yjve/YE/9+mnrz0O13l54Y8AZ/Xn5QU2ArzU3eVou3"
+    "7xyt/7mV/4V//HN739B24/+ug33T49eUJXbr5Y4ecITnQRc4GLFz7YqskZE1YcxJwwXdapx4k/9J"
+    "pJYXvqwItAJk+ezLFg58keDh30XHwZL941CajNhSNLJzHPKTIBC841HFMySeWiCn1e9DW1EKQq7P"
+    "22UeJnQX5kq4lPct4a2rtV+PZFhk9A9ZMEEGkieuIRXdg9pL4uTm/evqWTVcmFZQq7x4WXz0Bml+"
+    "eiDh4txKJrZ5XET6uFSZR/4s6FBjHzmTy85qTEMYcmZpNDLuS4bCW+5JVJWf7U3z9J80CMU5D4YK"
+    "HYsvaVjw47UAuvDm1sfGK/s4PLxbThDrsZpEqdbTDxmn/0CWRPYnNcBB0Kx10TKfmjgKsnfKy3Rj"
+    "WHwRgNUGXlpTb2KRk/2svXaFwJaDt12HdykRLf6MuT7RbSuBunBRgrPX0W4tRyVOiPLExZk6i3PD"
+    "YYjHiz7Tbaxsc6X1BtqH1rF9bROJrb/Ny0IB7tzBf4DAWfIOXpm/bdu3yb5acON+/qYu7JL9SPhz"
+    "9+uK1XbvYRcL0RRKBcGBJ1Ukt+TlErou0APjAWK9jjcQoOO4bKozEc08bF2GY0iCuLNXs72S8O2W"
+    "RfpTEExGhb+mHlKVb5LXV/xh8BtrIBk7zVKh/6dmYDgAkhFsSZuaQxxzRjZWpQY0s/9rFV97jg2v"
+    "HHMnb4AOZV8OCmP9TBtHPMuuM8ozjblYtjCo/IoGZs3Ut+NJ8ztl2oDRscYjI/W5B7MYiWCvuKmh"
+    "6vSAakDpC1L6VfXGtMGD/8LZ9QDr05AK3CiGZepu5+tuapwWFu9+Y5JsNmbZfBrzDluPvBcqmG0x"
+    "yaFdsZW7qOR+DUA3AkuzZkzjG+6nvZD3Q/RmSz9+t4zPugvJ7O1o5JOez9ncW0D5Ylw8d6bZ1t48"
+    "x4VANvuKMYdTishGbGJtJxpxz0l3y7LlchYUNrhB1tHrzNGFPBe47iC7OdH3th7p5tjM1adrjkIx"
+    "yxwgdOr1ESzDaoPDqtG6Ra7JOJvdL12gZZCANwp0J0vA44vO2pP2JBnJ/aeqEkCr3bSeeVujmuD7"
+    "J86Yd+7+N/7e3v+sC3ffpTN84v6hijF3g5/9DjC2gD+XhUPFwq3Ltz4fLff/M/+aof+omf+4u3Th"
+    "/6k3dOLj3OV+9zAJ/owOPgzMWI8HzhARck0vszcapz92Z3sHLkyha7HMQcvz7ELeM8UE/bYwcPEw"
+    "JqytR5IUHOxVVe8FStSUYttWeixgyl67mbJFMKfrk4Qn9JF5w+CZW8E70dDj85wQJr/PNbeid6yg"
+    "ATsvyY+lX9kPhVoU704d6LPJ3gAvDinYO+1NO+uKArF5b+pj/sYZaPOSVTT4UcJEs+dO3MWPRExM"
+    "UYd/v91JETOsMZG5stXvVcoGOMKUBc1HB2Jk2ebLe8WOB3iwO8Q5JF4iH2yMwXpWn3K8SiGVs08t"
+    "MArIysuVK3ZAwgqLTxCIFMZ8p8NstD66ywnTF1v0zFb32/bc/73yYjLEbB192YEDil8aa3xd+4Jo"
+    "6FW+O2cZgJuV88Q1SZHSTNRRGEYpnBIwQ+c5AxoSNr9RcHY4k+hqXcMCO3Hiz2U/wSTheZX1Rpbv"
+    "r6HJe2gseHvGr2XvrcbfX+bIRy9Z/2UT2Fu3Ht1uGGLuZe83lfcnjs5a8+3PLNjhyXXPDlpFVYc8"
+    "jS7uXBcajvndeRil3KXQ5pbvHint6Mjin8VlAUAhs5vIk3kaJ2meGB1yx254765JXSIXLW6iDfuN"
+    "2SRNL8z5jGGo9GkFdEYwy3GD24UuDkKOY4yUhgqJaJvCrc3KaNGBTE/99FEON8AIBnfml4iphtE7"
+    "F1NNk3sMlYDX3Cms5W7fcp2rWZFAMUKbwU9Mkt/URir/aJMhzEFgy8QdSGetPDXmwRRzZ75bSd43"
+    "EgMd1j42UfosJLJsynbWPobc8OviYaC1fiCzs5YbPfR2DtdmL04fP/+Fn2NpRqx2OdBIj2uKZHrm"
+    "s7j32rbRxsXXEcmCD54q/c8Z0A0sZsYt4Y1AonNPhxhqGb+M/KMqbBQpR9M743/xjHOxhQ8WRSOb"
+    "NuAht3xhnICnteJ9S0ngDzgqMcrc6crs7KykD8yA7T8ROxUA5y+OLNa/DerhNPYpNK/nDZMQVsLu"
+    "EWJ7aOTUoMJ4ZVY6SyVOPDQrB2plptxyu9RYOr79YlWj5L5HFIjt5fZt5GDZVv4OGm8cWJx8T567"
+    "i4d1cfV1F94cLtK8/cvvA17/nox77/1v1Lf/gnvu7L3nr1sdNrdnW+ekGOwPkF3Qtks3BPnIsKyr"
+    "27Fy/+xM/8wh/5Wz/ylu/52O0733739MordXQdTi7nzU6ZkLDgDryewunkQ++icts/JO7JgDOSTA"
+    "69QOCA9fzgp10zAYFhFrGOC5VNjj3HOxPlIGZS4y2PaOGXH9kw5/qLF1SjstqTBSjpBeAnEyj+3T"
+    "r1uR9kdtnn7Z1QcbEXOX6BcJGTiUvx64QXHp5KouePi7pTXVQ99tCJPkd3erh/645kcAnLkzUwLE"
+    "xWDAsrn9jnRUAq+yW2PoUj9E56POWpzhdyHSPVehwIUieAxEzBUvRg6M2LD3HySxK+0HZOOYkO2s"
+    "jlkFy9jWXvNoQCJp746TazX+k8eU/AtcXMzHGy8skYc0GNHahy0yfXxAMdWZDCKo1tYI4jIQFWyV"
+    "ah7W2DfWXwMS7mADqGkvHHv7fzcjb40FraF3ewlBU/bUuyMnNjRbTaoMbv+C+HLR2LWlP7qS64yk"
+    "3VPc8WK4gyd/xXv7CpXe34GrnHqb6kP1sq8RhK6c+xSegnbMqJmyMZU8XrkDVHaPe8cf3aQYfE4Z"
+    "Wv/sLDI4+/YrsZwtcFjT/wfleA6nA0Kjno8Sgdh4JNgBGD46SVQvcBPQJvneC6X9SG/at7nbe/Yd"
+    "lPnIecbvuZwPSEKasx4g97WanBni1BeW0CYfhX2z4MV4SS7fdFmAyfOqyRgPW8Yp1YMvWar/s7+O"
+    "z3MGmhoiXj+CH+MbSn6EmUvW0CrDCIiRn/JaS5j3sMLPN2WX738RRFPGmTmTebfI/ILjrfGCUFOK"
+    "/TWPZIz+4bKy5jY2DuOsXoTFk2K4pxNLijfWnFLkxhyGiPjna3c1WmWvjki99mbnz1gM2l1ZKZdH"
+    "W7TVsbXyy5dpva8dlVgYxfdNkOaWdMac/+jlIHUPYSGdQocOO2ZnzbFjv4627Xdu70pxjqvkZE9b"
+    "ZN0k6eATfWLc6ybK5sj/vxQQg7d/W6SQUIb4PFNjnbVspNg/mup+Z+H9li3zy6NcEsrOx8A29HtQ"
+    "9yEwPU8e+zjI3TSdAtkFr9+p8uiQiifY3X3RHabAbdjDOoDtEYS01uGM48BtljWbtlu+Up4csUHW"
+    "eP/HM+E4SkXMRxioYj2V7UjXNNZpdv3rn4x9774d/7pB4k/MG/9cYve+eVqyc3cXleXngjcH5B9w"
+    "LYJn3B8EWdDrB/9iu//kU/+D/94+///es3vvf2Q1dey8s8b3P0Uw0dfvzu3EW9TZKTMSYILh5O9P"
+    "ap+3rsxLkXF1cX5+TOT+F8fHIxw9uwhF8nSEwkGQDkeQKhvs/giSr8nh4Agq0BMcEDFlmfYomHC6"
+    "hANXFIDjdPDmvL3HVB8TpW8fhpHdScLcryovPgBZWu8hKQScdttTyZS3lXX/DAt3OeSvnE6WV9IQ"
+    "qfK7x1OL2stwvIL08m7vFbdmLyZ43ghk81fOaE10UyxWmf6vv9/HQAkZ8WvzUVEWOlRSvH4mwFQd"
+    "TiNjL9ZTQ4L54TNvPCAZoO6/TTQxAr+wJgXzRMSsNheWOP3wdeRO2HGMCKz+TsB8Qx/tgYRiSXQU"
+    "s2/G5pJZL9W48yVnBm3Jyn9gX7kB+iR2YcGPNsfboTtjXuJVA1ceZgR7dVR6qBPJC34FbtOLxvec"
+    "CPvW5+Oj57X4Mtz9T151oyfJlaGdmv80h+1k08I7YDW22GDphbHBBkbDEym6vwZx/CNn8h5mJER2"
+    "PmB9o6fk4QajNfu/7s4ebNu4eXvfx1Wl6jCHWMiAw+6O1BK7/Asy+wj4ZQbbywFVO6rVsjJdaU1H"
+    "lbM5LY4ihpbDzVxg9ByAuTgePxKj6hRHfkgz5iakcN3bLdsOJpMT95jcyhelWE7e0UiP0iko8iCM"
+    "tz3dBIEV8ZS4x6UsaNo80QfHJwXb5dXbn9rVzVWykQhziJwXZ5Irsf0S3vHfE0yQEf5TvCIl+42X"
+    "/Ba8FupzzKKUpiwn7iM16WFo9MY+Y4TQYgsexj8LGpOWkHCTDgFQLd7F8bco2Bx02++SdRQdDt/Z"
+    "hUqpbFcmYMLDfHIKiwWwbpuj84fHUkDUeORJVv4g2F4YP0aAtsqPSJeLjpHemC6+5BXtlvGN++4s"
+    "YoYcrxipn5Xp0Sjq2Esi0afNqs6wdMXjMZS3qJI3UcJBarvFpuGoDsKgNA3r4RrLmI3MMSe9oUzk"
+    "Va7NbdkUnQMYXYI7/Bcx4DBwTbSh22B0CELDsj9Vwk2t51UmFjnC0sTMfCGo2b5wbg2GclD/KBi3"
+    "GF3HMDOMkaARB3qKeMp/SImTxtII0N4gdRlxxpR5a2NxwK/aHFnhmEIy5vteccSTrNwRe9Dwigr0"
+    "bxTXYdv5cu3D/V2/P/xPt+5+OfePn7rtx+47/yxe/W+dztCfW8egGNwPkF3QtgY/Qg4xB993s//K"
+    "q/+Xf+3l/4yKee/e47D1/9vPtcmOnthPnh65kQuPDR4557elLFgZlJyudxutCDjaIDdH8QI5IZb0"
+    "dkAmaS1hk6UhWmBE2SelH10yjsPHnkiSA6I7TqZJK3azLJSGgwKHD1rw4u9MdkwQS82py8jZ2lIs"
+    "2LE2LQ9rZk8NpWYr7UxE8iEOrKFXu9y/Lw2JWTw6OXLxxOL13Wlz9c9zjc0QUfJ1n8vhYnAvUVfh"
+    "lRdjGOJN6bqISOSGNDDB5r54J8y89EQZrWF99cWQdkmXNGFiajR2GV5fXLOOCn/RJJJiEJRU8CKs"
+    "ToMQKHT8rUxxxRJV5oANUP+VWPjiHe+EMtoUT4ioOthaVdOkbs3TNh0e5UIj0XiXudnxhZjy0arV"
+    "UNpXrkPf6jNgZfucGw+bRiv5pcOh4e3/FhXrV3lLFEIMo5l19sOclRHPLLyUfGX2q1x2RxtV8bSD"
+    "ih8QVAkwNtYLdFXBHrfhw5Zu0LOPu/blp0gPwDHZJrxpCDe4dr1z7tt1o+/PiTh8df9aSewFljPi"
+    "KOv7yw2xt5YqoVM4PHJ4MtqCSOj5Op7VjYYovSNjTNRE2JbhtdvDgCrbmxQ84GGorL2Mcu9mXM+J"
+    "jBYzN2y2b6R9Vms8IyPjlm2yYezFb44u/+KIaJLYbdh8A73hoZ5g6qrUjkoZx6G7cN0pyQ0J4Qjw"
+    "CWnblgLMD26qx9hjDOkLDvOMEQJaiBJeoYVW04MdsJtkFlkNJuLvY7/PZjm+debTFCDm+CWPIxG2"
+    "87kkSyE2zI4XC03nbH1isHGlI5FbXpjkhi9oNKkKtdGmxGdHTsuQAAIABJREFURWWrNMTFDRWO6d"
+    "1eruNk2QrHfla6HCcQSjQcdIBQ+rbLTbfhsgkU5yg3K1tqNYTLuKxw5NgFSXG8IgwXOAK1yjJvD3"
+    "flxclHt61js1yNIv0ed8zNiQFqx38v5x7uI7Ndx35IqAYQPfHvdDQhk9DH5xnV6g4GMsYqWIhCvt"
+    "TL4LhhlNz0sKNuPCAdkwWsFIsEjNtCqemhk2xx2HeNVbuJpynYmCP9MG9K+j7/8TuEwCLY7QkeE2"
+    "SOyLUhcsH83Y+5WKHV4leDp3a+ya7zTF5tYL1y8cJj127e+7ff9aHfevqxhy8//aVf+YYP6nRrF3"
+    "CZzuvP5QicX9B9Lkd/51vfQXf43d/65Mv/yx/9ie/4lQ8/9b2Hq1dfd0Ff28+BypOh3D3RwamJ8R"
+    "4fAOOmm9p8MTlfjsIk4rvczC5zdPpzZEwi+runL0mgZAJ3yzhDMRHOHLLvkzd0+0kF6ixMWHDYMO"
+    "6kUG/kmVjyIrFxA/SdIb3wQdSLR5goa5IROS8A8OWEtRee4fc3UurV0THrAk/pH65qErqsCeiefo"
+    "A9T/pkzIWvn9DxwrqdkHo8Gi9BebZ1No6LJHzyLYxPmuUDm0zU4k3yG8av1MhjrpZzA+b7zoyb/v"
+    "yij9IFzhZywZYXA+jjq1qsTb4EBi374rMFgE4gqoib0m1BGzUFX1mNB40DmyYXHsRrAk/u4OHqmP"
+    "dOo6kmvMULGJnK8p9u1tJhv8dnbPE3wUHAeCBiW4dsWLJvIGvu2O1zXG34xNOLqQlr+GBAYqatiZ"
+    "dsiOC6Lw4y6hmfYql3xWPnAY6wsbpHXmo4Z2qEktkmHpG4FOM8hdxlbqR/R2iwYHhbrx5NH27dvH"
+    "G4fv3m4eHHXnV4zeu+UIfBZblAyZjJo52qUts+OCHlT/KgUgPLWOI7Y7y26T4/G0VvMePOIYerhR"
+    "sORxG/dTbhWGMZdqIIl+wce7cxke6KcI4Jm51m0rWEOLwrmHOs1abgI3Y0MsJI1jAJMBaIB6t65K"
+    "axPDLiX2MEP33maywnqGzr4UAve/NMPHS8XdTo+BtRuZKpfxLDXgJBhoUKmQsNYbDRXFaYoYP3jQ"
+    "mjkuvefNE4QvVKoDpzWhCOEx9cNLgeS0z05zGZ+BMXVFJKho5QmhP+V6EzVANaqq2RvFYf3l3xeJ"
+    "+RwdmYNxfYbT3iyohsZHtm5zkq+5i2MUPjyivGK9sNmH0PPlVyYBxayrnHHqWRQStcdaNrvamch8"
+    "RH+ciXt8su581Cun0wVjT+jf8oBOe5MfCaHv2G37QZafreDbQTJ/WQOM8IhFDD/7voycX7GmcVKf"
+    "VSW9B+/VAQHcPEU4v4HnMGZzeCw+Zqh19gGrNNLRu8oGnJ+4jSUIc+AbTs2h5rQ2JEvPv9pSbIja"
+    "DGgei44VbWWMcNasDw+FzGfc6vJB451uERRjJ/MIbzJeYqnWvev+fP1OlB3a3XffLahW9/66/9xh"
+    "/cOVz6H776qz7/Y/XZ2M7rz+0IaKudl8/tCOi++v3bh9///Wsv+89/7Ce/5Z/8+u/+jZOHHv7ySy"
+    "en+oJKHaRa2Eg65PzHgXnRZwg5SDlRXWV3VoDYGg56JkqdlHrCgIuDG6UOXh/IQnJxdXwXLbw+/o"
+    "3DjguV2Np+HGeyYELBZvyo6YkH/1q460Os+AHnpxPY42BKOeNZQnQSOu4RLnupeMul49ekfkVXdV"
+    "zY8oUpQG/76Vy+8RJffKEMhRcAcBTHIHHcEBX5JU78IvBFsuQZp7FRPmD9tky1XYbfORKzbaAgfh"
+    "BsB1XqYEE7lkza6FFNY1Ee9wcE0vzgG5d1rOCdEyrG3GVo6tGgxoXP0TdWu3eQcE0wqmgHEwNHgX"
+    "7xg5FHsJMdOtskkrEfDFgKvMOBjyymkdIERz5sgwfZ5+2jz6EGJFJoO67pBeu8HGxiTbwNKB4cUg"
+    "Nz5Du5mqBr4W0RdWTDXYsthpH4BTPW6Kp3wMMzQzJ+xpMqtm/fykw2OmcSJjdJuCLnYu7aszcOl0"
+    "9fdnjFa1+vb8LVxZyJAQZHvlxjDKtqE0OehSd/k4PnmBkH5hEdyI63tlAHKvlunkEYzOzzUI/E4z"
+    "95jqi91PbHfiHOcYSIMakPj5kFrDZud7SSZZq2D8mRX2OGL8xZ23dsh6GUE0DymY6qjAfGa1tK1l"
+    "wx9rEvQPkmJfNu0rixewEsH077Uns2CcnGFt9qZSzCvvcbVNY2Md9eOu3hoQcLWLO1g0LS5Nd5xY"
+    "gBxsBzIkgFSmT+0z7BXERe7uNrFgksA9+30cWlsmiykysR2KOJ3EIUHDKV8rvTvqSLK6AkiJ44Bh"
+    "yKjSfiODcvSKvX0ZTNQJyNtVyukydNm8mB48BRnA26VfGg2ybU3QBIQ2/ls/xu+LKdrYVwvsg7/s"
+    "jCVR9gYgkmeW06sLHdMA0h+MjPrsFgm2W0pae7aztf+fZxjs7uTUAv/i2WjBixdT8+wLigRql/AM"
+    "51VDZD/hxlE2Mx9oNDd7xs42es9UI44R0Wh+Ya3fCB87iZlTDp54wPebaNwIp/tWEyn2quzJZtSE"
+    "flEJCsPi8U9GeOhqO59LyFuZ2P83jRR1h8tgZIRb8LrI/RXfiSp5+9/5d/9l2/8W0f/M1PPBHN+f"
+    "qFMgIzM79QwnnpxJFDi3wvHK5fu/vw//pTb/3Gf/Bzv/4f3Lpw8tV+9fOJl7RctOiO+wV9Icp93X"
+    "73W/mYBDgUOfB9UGaS4ADlwPQB6wM944kvXiypcxqnk8A5uIPIibFPDIXjt+3WbLACZTIGh2COcP"
+    "jU573WnmzkGxAn2WB70YbOJ6DC39WJIjBHInknqVUTZQCA1Mykti6sOAsdPZ/LO9HykJ5kPqzP0L"
+    "Xc1bc04YdRKpyYaLtWO0W+CFRlKtdIuFhMKDPpyScXe8SJfr/QI6TmS8d6tqFb5KBWVpIN1nnYML"
+    "rVT96dtJMvjCkePnyIz+NjH6MUDBlLtgOOI9N6dMTikZk+J1uJecshkYeaGNN39g45NjK0Y0YpYw"
+    "MisXrk7H6TAV4nbmMbDnhiZ8LVlu0Sw7jhMGebPGeRciHHj+MSmbcDTCMv63PyzDZjdOBbxfzDMT"
+    "zowBzhlgFvF85xsqWTMe9+0e1WDsfrcUjM3mbcnBkfftqj4w8WvQ7rrcj3D3f0cx03rl3XRdxD+q"
+    "251+ui7mF90yv2BML+ooawfjInCaPHA3+e0OBfh9PuXi82wqJL08e7NqCYJMMYxSSUPCJjSEZsDL"
+    "AOU+QZO8c15Nhbx8qNbBnWCMBaZSOJLJ16J4vEFm6aXs6BdJujiInYQ4pkw1uf2XIFbu3xCovOJs"
+    "TpHMpnuhm7UGe8oJBzj9cx3URgwMIyd7Z4H8FPBdOgmmGcNNRbguD326e6yLAOUVsrD/zAYy6tAk"
+    "OqAq8EO9n+ZNG62sXgOXMe1dEwe5uzw9geFxmv+MPnzukQeNsOnnmMpu32AZ7FAqoPb5PM2fYj/+"
+    "bxjh5DfPRGWfel+BUJ8arsI/M4xjRuwBB7QWOzghhsquS8sDue+I7PxrEfktJvdMSW+Db8Mcr7Qn"
+    "00LtexK9d+36Bdvur39Z4GXJYZKtsGne2dYbE3QiMhCOpebcTrdU1t84XCMPNMf9nRhwOqcql7nC"
+    "+ggYGbdmQ7IwS74hFErYbbo2uuiR/CRJY893zKyRuu1iHD3uL6YpLufAtk7nKB8w03RFpgOaJTP0"
+    "UaA1QDANgiuY8T5Nr9fUNYkguad/RYzr87uj7yw6dyLhy+8vqte//RL7z3g9/ysU9ce3lpzuvP/Q"
+    "iwi5yX53kEOJYyNenx9rO3L7/5l9791T/8D37xe29fOvnae5dPL13Qh8Iu6+LtVEeOf4ZAd9jV8F"
+    "MmDjxeZNhwl3QAcnTlxSdJZLLNRRm/x0bfF3mcpjGpeOHkb9qKxLEIx/HOxOPPqIFzN0d+bTn07X"
+    "MmhEwoefFEjlGxnTDpm1pKN+HWiTgeas/TyIVxy6E4fjC87dQn70w69rHh+amCK/oilBPeb6ZJiC"
+    "9DwSMnQnjhIpTsfB0nLl4QHBNxaCyh9Ne1MyayY00u7tmfWsKSjyrXzc01wineFvJGwTSLZskQL5"
+    "S7gQkUsT+DUYQMexFrERjIqLwaT3bAWImRGKVz3NTqd8GEGBL37uJ0LjIaBJN5FsPDZ+qMiXkcSy"
+    "5OQgsgDMufMIlwHNtQq+FC5z/ynLziEWD2cUFddsMrDSUap66Vc7f8eOWx2BljteKzdwtitMMJZN"
+    "kWVyCsrVn6OdF2IOikPcOTi9dEjb1viICPC1e5CaP9GflkGKqAWLOw/+cEUz37ZL/ynq0XXu33/u"
+    "Hwa4c79y/ppwmePJxefVRv5MYQ69xIobXFKH91yTHCj4uTkuMzErRK2kfjgV3ThwSIlm5TRLyTYL"
+    "tYgofCKAloytYSQ6GxM948A0FBsT4Yp+6x4hxHYMW+ym78zSWF/S0ADfxKqso9cfEErbiyufa4RN"
+    "L9DLMx9TzctyuaC1L4zKwVjdWxKprlvEw12EwYb+Yql8Imb8y9L0hJnvttY5fgxm+wk506aZnA1M"
+    "HHTdfOtT4RDteWmZSaK1zsYGIw2Yg7SsRiLnkWllj7FyS5JK5xE1rWe8G+j08Kdm27b6lW+NwnUH"
+    "lC2fIYuaCOABt8Yp5K7S2Ixo6y9IYzFpMXdo7LFfHRCC0q62yPx5bNRyTT3wAFbo6R4NPxCT9YLB"
+    "80Qzqc2K0S2X48oNvvT4biZ3csLHM1im1tnQI42i57gw6cosSm/oh5i5u41FshBwtNLmC27Y79Ki"
+    "VQbf/00WsxbrVjFP+JwRyKDVxD9H7ZDjQ7Z9ZJ1v0GV/stGj6vnVfjsR03IuH1P7mAYy6fIj87t0"
+    "6h9k4h4SceAaNLbf5FVMKdwLZmkf3st8yh8pmLueTpeUWe/U4xB6OP/ug7CviW8ssnV/7l33vm+l"
+    "9/2zvf/w3PPnv74Xo5rz+3I5Cz4s9tDC857zm0dGFx8+bFn3/3+7/sP/7bP/1XPnnnzjfeuvrQQ/"
+    "d0YXNJFycclFyfcEHHt1fq9r5PoJjMeMvgZT2V4mQmE0wOfl+EzIUIF0B6Qu5Jw3ffOWD9+tsDm6"
+    "kHO/pMBLDhc/Qc30FIrwPdfzz14mnb2AmLvXWScbIKB0zesTgZsczzli+wRBufwsOrjnMYi8jwi1"
+    "p1i9H4sFh6zTZoL0p2Wa2reoLJ2CDnYpj3fUPvHIRhcnJ++pIZ57yL20DGR7/N5bdCipi3unoD+G"
+    "QYoix39AN4QBPG5C9d1FzkSKOFO9W+SBWNvtBTArCMSmLxuDg9bBnXxIddC+MKobex7M1hXBGIgi"
+    "/WPXJzINHTdh8nKrS9rYZTAv7RsPI4wQOna5SoqJy8GuMXfLm9LxSbsMwR4/CCX1xxGpHbOMBR4q"
+    "dF1xdBQSGZxYJI9zwVS+bYibd6xbxiFG5C3FLxuA1BleCwU41nwLSr7lvMRpWxoEORgS/WZINF33"
+    "ZmnSVtEaLZE6rJtzEwahx2P85nyshRL7haeKr+7KefOdy6devwxCufPDz2xCt1rOitxXwRirkzDt"
+    "7TGBvF5GMUnbjd187PNicSu0tIpLzis2JiafTHIxJpeMIVScaedqWtbV/OqeNz4yKIGSLHGg1c+0"
+    "KgtZmm+o5Fxqn3+LaJQLY4pTA+qrzd98djAwACziAqGmJHLw4/pbKe8UTlNa1VxtPqtzGUK0fH0L"
+    "gKUm1KrfoHzvHj3+RbPGB94ia7Y6qJ68HwnJHdoaseF/rDp10MmeevyRHdKgZNr2I4GsTIGDcve9"
+    "udW2D4XTkO5eJBL073BV5tcPiqv7Fb/cbUemIzD7GzOFuyKqgkjGlkhgl8jDhjIWVwW232cpyN0W"
+    "hn7Xw2r4Q0fh2jVrWtXBDncGSUzj7G5KlZQPaeV1SvnExrBzEEo2OhvNT6d0l700U641PQCGvPKK"
+    "Cin9FNZCs+2zFPGSnrzFnZT9TF9wKnTdfxq2HeGQ+JjTcldoszuC1+gOOHpor97Xga/57ffgN/cD"
+    "0xFlO+/c3agcSW+BzgNp6+2bQL3tvqyGjcKs7yj8SVmDweGTIwuaF9yTcI7dB6BhvZRZ1kccrpMV"
+    "bFT5be5wKUcye+pI+bh4fr+lK+m1/74aee+avveO+H/rVnbx6u7H2etz83I3D+pSifk3HX2xR1gf"
+    "aBjzz9ur/1oz/1Xb/39B9+66XHHnv1BX0FpS9KdBLal00/9WJC0WTKxrqoq4McoExGBJ8je6Q+WJ"
+    "Fe4jdEVO77KR0oOGUguM/Jc3SLQwKItHgyiNWavH1XTjJs/QTJPi3whZu9a5U6XFy3wEXxi4BPim"
+    "TYi4E1QcYnk2M+E4QBv0nHcwUcxRlcjAdXW5wU9y171mtyekiTzUNc0DHnyNdt4bHAhLe55amG7+"
+    "XLlrewSqv3h5M6BU4sHBYrN+RxQog9jMJpPJn0KJ3ckyt62fj9a4nbIKTiY4gpUBOJI5Rftnfvwi"
+    "Pzv/HCAJYeexuqrdZw4U1i8lM8blsbGb5cdqE03qqoHRf5y0fchekI43iRkEdiB+wIHBCa6Ru102"
+    "G2i4Gu85QsGSAZyJZchF7zRJgdqiA11SbuLBkToECqdJwDTMzCq28MuJbhddbDC5NjY7+Fo2Ww3h"
+    "/lvLyoicV1qlmLR2PrUgcMRts1WuhpALBf7XE+dtTVPrtOyrkUA6Jtz30H6pv6rbk7N+8crupLUF"
+    "6uC7p7F/V7jOSjXJy1OnfhIh7uysLB7ZHJz1nagLwQE7tqoZy2Oq7dV6sYHyQbXmoVKV2woBdb6I"
+    "klWsnsTzIEhGSFVpI7ZonyJSKxQO9jl8A2keMSdEqibLRmwo8NJqeEVYPxBXkU8T0OBuVtzfxVsb"
+    "DIEGyxhh+TujCkneH6/6sK77htbLIc/5671ObCvk+BrdJq0lhYbJARJ5wp9SJYRTQC9DaJ/w3n7d"
+    "XgBcW3OUtgH1uMhdpl/RcztI5nJmJcNxQaiIF1DN2GVALaPQ7bxoY2OWTb7PlkgwOrUzeuVaMkAB"
+    "b2x11xbMhV6rfssGXoZnwHRwW2ehqjgiYlhok7yGqO6ubTHKq0j3ZU29fOi/dbhOPhrH+PMULG1O"
+    "NGzFnyrZbHFo0DRrJp3ulv6wf2naogdylvOKqulOO8Me/x8IJBm9wY33DmJlfQHqe6ishGx6Jwbc"
+    "O1jcFQttogw+Wb2tNuzDMYsbGjeDv2GSPOi7ZtmQwYGsYzRbIxZBv5dWTGBPGoDM12k+HsSwi9DY"
+    "XyGIG2QWq89bVwucNcdpxL5LWGDudT+i1f8PrjG9Tv66Mo/r1S9fW7yI9cu37zG9/xG//P07fvnj"
+    "77TV//xe/Sm8luL04COS/P6wjwqn5envcRuHD45FM3H/2hv/uTf+6XfvX933e4fOX1usfuUzcuGP"
+    "imRp/Izckcp+uX9AJzSd/YmAk1d+Qlnn5qDlR+f84HoXh4y2XLOrHEqMWTeDqdFDrJZOLUWjGsP5"
+    "+cEo0ObJ9gligHPrHlBFR6VMTviwW1JfBv5wmTJy5iQS1VJ2b66ycJsKdwtmey4O7w5G3suBhiB9"
+    "ZX6h4eOp0nbzpZ5acNIOc1mYm3JzxqOXa+OCWzZYjIkaeZjkerToKe9PxZOo0s+XICrTNocJT9e/"
+    "kd48ij1ZowyBuvqj2RoizOMrr8pTD+XSxR3x98rlP0HnsZz8B0m7UeKufhGJqTbCnB4Tz91nWRgQ"
+    "CZ7bh4MRmfjpeVlhV9+RAPWWvY4NmPWbmgdCQTZ8eC7esYqodEJZyKbeTFU+dtiSOBT7IVf4xt7+"
+    "PB/DPe8LK/auGbI8cQC9vjCzhcXdDFU9aOx4mgacFQbZQqcDj+ic3CWVlH21js5It9Wf34JmcWvT"
+    "VSI0a4DNxtPZW7ef3W4fLDj/pzc4dLp97TPa6y5RDiW8J5WbYBPlCyRtQSJ3ZfJLG2bQXYhKQGUe"
+    "QPYcZ5I8x2Qm9t9MQTCszNdeRQIsuJxQ0EKuqaX3U+U8Y44DPqrMMdb5s8cdCPzdLYh3oOaIjq95"
+    "g4JoS0ClwT08jsx1zytLCrYdQWYYysHddTKcrN5rlaWBZLG4xxOJWCCo4t76JUL8NYrTinYSkr4T"
+    "y+JoyDcja+RQU9EYgDU5cqW0sYbRA+1nbQHcxSsMiMViP71hhULn97eY8VUI19rz8ej+FqwOPIdt"
+    "qwZ7Geiwa71zFsG0Vau1HYxuTBBLdNkYC1LtPEtir28yGY7bRUtRp5GOqs40N/z721vT+aO3MMOP"
+    "Lbcozv5X8ct+8aug7EPj7aE7c9NoeBh0qxNdzFTQO/ef2mTpwSQxn1cUrIpHPcdpZ+oCYIBwIVhw"
+    "uuWPszs4SqJadXdTUSpUjwoCxjBcDxDtSJHOUeVmJl/DyGvoGwebOcuV/F28P+6G+2lovjiEeItU"
+    "3c1sqlXOGrtHU9r6R47WlsBfnJ3kE/E6V3kXm5cOHyxQsvv3v77rf92kd++y+/6//+2B8V9Pyaou"
+    "P1OajPB/95GvQcTji7f7h+43D63//0P/7Gn3jru37g0itf88WnD+ntkdoSvN3xRIufrumJE2+Puq"
+    "fn3RywOYnRSRxvwZyjjoNwHcyS+cPaElZG3eKWDlB/rs6XOkwNTAa63OAJiApzTm38Nho8zUGdSQ"
+    "KWxGMfo7ex7XPCHo7hdgx5cQ4nPgTWgj9Kx8bxKBY/MbNSvjjBBqMVY9Af9/ZFGhe5eksZPy6urw"
+    "T1+EHO+fgdXczy9kvOej2Omhxx66c9yzcyJlU9yQMvTJ+W+cJDnnOBIMMZy8YsiW3hJECPD+589l"
+    "weCaJ2vvnqcouMZzz4vB/bM+McHScP5N1t4QBxzCJdt79PYMBaFttls5Oh2W9Hx4pMCxfX1M5j1t"
+    "FIiGZ8Rh8RGiw2HhgojOYgS6ruWd/lKlah2io4vynQbPSdj+pyWOGIZYNhXUcRO60dtmowR7jiCU"
+    "LtfdfxWLBTmJFVkJixT/TC0dyDcR4AnrNkPz6KRbjCXdst20N/kKFXhWdq5ofcNWe/1bEg2T3dcL"
+    "ipnyc46GcJXvHqzz+cPvLoQe8KHiP4ZW0ugeGyD/SwSjT9xBWZnwTiC8DgWufmCJTEAqVR4Y153G"
+    "GrgohDwjigMjJleSUzBrCp6MHtzsgkkjgy3cThAF+Fsdp0Y2UtTJQVq5U7xAIkBoMVl/3Uv4U7fQ"
+    "hXXJ5bFFzHgRygbXo297EcInDsywDw4xAmrnBEtvhiBuO0Er/DQ6Sun9DLByUohPRZBuReMDuUEP"
+    "qb+V8Qo80xUMcY0owLoNLQnk5EAlb3QC3ByDy+Dotc+VMZH8UgJYWmgY3bYKdAZ64qjK9RdNbXAH"
+    "xtRpbZVx1vsDOjDhV/8LNMjEXBtZXBSODU8CSb2A5qDI5SRdb462Dg3k/chifCwKczOKolH5/xUU"
+    "8gzrbPcpjBOM+1wsciOWzjOFL5yTZiNGTrfRrz3X7tMcV3y+az0QBxbiMIjV4/rdC0Nonby+RWNg"
+    "J0DM5eUjjgax9gXbpux2Fmk2MyvoFT3DdP+lhtliM7K4h4IR3DxG7Vrr33x7h2Hynl0o+g24Nut8"
+    "q2byzHbhgLAfGbm3xkFdEGJp5x1HM9lG6D57zAdtqevetnPO8ISsz3kOtFSDfTX3H3zsU///Pved"
+    "93feR3n3n95uS89XyPwP6V8fn2/ZLxp2PJEwL1ret3Tn/kzW/9uv/u77/tb9x/7ImvuMu3M/L2Px"
+    "0kvCZf0ufjLvK0SH8+aUSuCxbkPpCGq2/FYhA7KfD0iIOUA3F/wtkDmnsnF/UFIhfEB7+QmGMytQ"
+    "5e/jwRdNdQn8BUmAOcier6pLZMa3yWCyQF37Gbi4fdBcR6mgfG8ejCSj+W7vh90la/OcmRqU/eiB"
+    "t8+S/ridtl5SStJqI+lcTGgQatZi54JRcPMU3aBOkLG+AZK32zE2PExa6A4M3NmoswAqEID1EnOE"
+    "RoPK4xsh/7Go6OlbHiQYcs40k7HFtwjJtv3xmDnjxi5rVjxqpP8hyzbRInOVGyrSqzaFbZE3gCOd"
+    "5Br6bttq7laxuEzjz2I9zyIx2c9LPMNiBfZyAWxUZ4LMkGR0MawfH4Huk2+yQy22owicPhyn8QOD"
+    "G7MHmbL70o2ba0/PkBtWyP4cS/amGca8OMuR04H7dYDe/sL42HCGwvxFDYRyyGTPFljKRSm99jVM"
+    "Q6hHVsC8iJjt9qeeNZf1nSE6963eGRJ16lGxmSy5JcBIDSvvCTYVGLhv7Lb4y2k3/rl7fVcLzjc2"
+    "frAfRYSEU9OlL0tsUm4tDL3t7BwsWVI0V9Dm292cD6kdZ02bqhCHLTAoppq94XzimQ5MRcPqcPhp"
+    "NC66jVsCkxzoLWN8qaD0Yody5sB14FXzlCwksO3aaOo6auQ0LczBfeBZCPL+yQZT9gm8Wta2wkcV"
+    "s2Hvs1QkRiIQ2Pz9GchGzYLHfSiRO+PRexMEa9SM8AAcKDYiJe6Sfk4UWWhShSEn/2J9a7+ITtmE"
+    "HU7WU79gnJPIbzGkPoxO9xwVYLMlPG2Vpb5WAiil+1kVGmSkdrEnEy5JToa+PtYhESGokhY0nXUZ"
+    "lqyejJx3Kz/AZBDj4OA1vAcW0ujFdYZxQegyXT2A1/5GOOf8dGvYvHQSXHIPdtJAZEdbRW9vJptC"
+    "FncRkb24+qcUGDrePxhjv20lQy9jFGVg/ETx/veY1zFDqvSO1jFQx/+NHfqiXjn6XxOA5Ix8Hmf0"
+    "vYYzZd+46rDbBr4asL4rNQu0HoRBJHcjpjZ8zE2djE5ub0w7+3k1ETQKnS/JovMuLjPGwfHDLrvB"
+    "7VJB5NFOviWULG3LmKqxjOh3htyU9AcVOTc6QTvW5oS1y8+ZpP3771nT//rg9+66c+fe/xcXVePc"
+    "8joC1/Xj6bI+BJZxzcv3n38tve/YEv/aEfe+u/96kLj3zD/Sv6bnEOHC186yQH4kU9meOEhxdZDi"
+    "V/cFX2/QDrPV2wbCf4IeaAY+HA9sGrA5i2cWrnRH872HXJaENpXG8TAtHqj0lljuJwa01Dck8Wqj"
+    "PvBJR1+PHvOKDATAt8a1KZicI+ROqJY5xlQsl49CKC5TYyAAAgAElEQVTJJ3Sj58WRmC9qEqEkR/"
+    "2wuL8gBoEWjQ8TDZ9RdP5y5DjkFxq+PGLFZBOCS17494UcXgB5LKQXh3OQpAXtUUFgHiIkxlwMEp"
+    "Ntx8C0glrPZCkBC+PqdmhihAMMZiG9xIVChdxUmRolxbHOfoDvSHfr+LMvbwtUZ4JTn7G1Lb6Hhe"
+    "ZIK1q85Mx/tz05u8jIMmoJsMe3T3RUrxcf3KgvhWu65RjR5G6gXDUP7OIXdtoU/LD9HcYQlc/cwp"
+    "hJPn3DAt/YCcRiBuou4IzYVviwWqJqyY3j1hJV6KEm3/DSz3GNAuQ+RrDd99Fso6bTYl+kMX4y0n"
+    "5868Z1f6bhsZe98vD4K16tD6+DXow+efbnHQhiuPzQms/hItMx0rLFHYljokmMolyxS1EPjs5A8k"
+    "CqhWqKr+FGjILxIg5/Lg4eLR4fS9MOBoLmEuV6CuXk0asQG3/UXCmskjZyeOx2b7dwW8NIMDR2Ja"
+    "LI62uByGFnUH/Gjdyy0jpntl+cpBplRJtnYSkVj0WEHsOMlPddohBgbaNliVAcUq7R1ICDM1Z1Yl"
+    "FfJ+Drwm68wNlYLRKXt5eDgXjTJ5cYJvSszRGotzema7+Q3HEQH/Dhc7w2hD+c3oahHMGu2sVhAx"
+    "lldHYYmgTvUtKti8TSpepWrCBHlqUEReyyKWNoJV8BI4k2NupWV0PgCzb+iolGIW/zhqHNoY5NgK"
+    "sKWi9iGmfK5osWpfvORCRJickiAa/9Zq9bfk1jnmy/9DcWKHe+GqZkSFE1dWrOC3oht/zKxm0iGr"
+    "/OxMZEHP6tkmR0jqY+8WdB6vhF0iXKHTw8Eq9Yxn5fLWsRuk2txnPxYLfiHcC6oNrr9g6mjd3RcX"
+    "kGs/necMkxsTB0Z48PODumpcOGmKjDKQ3vENO5jc9Vdc7Soo8BnJ5euPflH/34x77vZ97xnm++du"
+    "P+y6o7r5+/Edi2yPPn8yXliQOl5RNPffrJH/nf3/Rdv/WxT/2ZWxcuPMZnve7zzYq6h+mnQXpSx5"
+    "1Cjm+fwMxFQSd1Diz9uGNOgsFIwAHHEzxs7vB0q84kN8f0aXMgc+OMLx3hxdsH9QqPCTRPpS7q1d"
+    "VY4guKKUQ2OQHMSYSI4RiHTAY+gVYfEcj9Z+XQ25WUcJFL8srkknjIG1SWTlpgnSdyfM5Tn3yT50"
+    "X/Bh2/mcI3XnIxzNst/VZCvR0TH9i7SJ+SF3y6nsSWuIcDeW254RYK4slf7UwQSjjKZ7BDndELF/"
+    "aOCyycK9f4c74rWMYIouRO3hRyd8xqo7d0cMjDH2ztsaN9tj/GqKc07568LLFzI3e/6CSs5DZtDx"
+    "Bwue6+JbYV64rZEIGIWVXl4ylydXJy2XiSc/an2uQE1Jl6bJKfcyTXRajGjI9dzjhabxxxEMgYDD"
+    "Y96doXhli7FM/+hX2PDduN2X7M3ZbSrobHMUjmuETo+shHggJ3lJH2AT43d/f27cPJQy87vOo1n6"
+    "+n/Kf5NjLmEoLjGPYLLsHEHnm/s4c4XKKWRgKEOubBeLsMiIoYWqqTGCtjyd+Y2hbMHII9QIZKCz"
+    "j6jAmHgN2gHyeMQ7Z/MLlWCw/g+BceQ3hmnpLEfVbh3Dmc7WRbObJete8645sy3LKebn2pLx8pBD"
+    "lt50beDtgXRX6aWh7qsaLCd/tuq28uai0we2FlJP5pnrWr3qoZN3KRIYtZwKjlAWYc0rdMGGNHSP"
+    "zgIgsOjwzZhJE41DX9cCVsByg9sbLgq84SS23CWRw1/Fr5xkvyB+N4mkOpHAra45J9KPOg44dPCx"
+    "wudp7mFuMWA5rcgEmqsdFa5nhb/uDRYhk+0s18aKOs8NpxbB5w+PV9h3PTiggbWyH0M9ip3K9Sdd"
+    "PCn4sElXlMl6IAnGE3OOnPcqYfHFhC6KjQbF4emQ22k4NPMfZMDHR3ZgHGicinm8qx9bWykFG5ai"
+    "xsj7rx1sJBnYyiWG+zkkjn8VK9zxM1cmwwry1j0wUMNl7oqNQlbez2xUxjvwc69jjbw9O2XE37gX"
+    "3zgF23nWOUtnG6lm1jLY5YKckpbfOIq7b42OuLKud+CtQrsv/A834y/eI4bzTjm7i+7kOf/MO/9s"
+    "5f/+1/Q58GuBqO8/XzNQI9g32+/L2k/OQYyvrjTz39xA/+5Ju+7e2/8Tvf/ehjj34Rr5+81l7SC6"
+    "Du16uhb3dU+45fRXVA6qDUMyaPVw4oHW46KjnOe+eKpzwcVnl7IBdkfWnKAY6dJx2vRKW+/+ZCMR"
+    "tDEkijnjb9HOi8EPXpEX4o4eSQNuU6GYAnFym5CGnbRlqZhxi1ZFTGr6LKnaDUnozmwmXjID99rl"
+    "ByHj04Zu29vMv09MpF/1QBI0Z+FPScZPqtNMj69EJyxsx3mIiXfhIaSzInx0xuAiw+t6dvIav2DU"
+    "tWk1zgROTxNnjMilON70pXGzJFOTE4voLwp8X5SwbSCzJjxDcYupElH8uNmf4eABY7l0zWwR/HR4"
+    "94+NsXLjQtEoVZRg1nIwNfK2R7Djh5epqbAvYy9LSFFo+f5sKvtodKqnCHy+OEQosxdjjbUUhK14"
+    "nLgIkJP6M3P/3Ygj1bHDv+pYt+mHfYbDchFU8WWOANNh5HJJlzgo8/1Y6AfRgzXxFhqVlBT9Zu3b"
+    "gp+aXD43qr5X19tZhvDgmY7ZD8OSMnTvOw9gVIYokzhmr6+HAAiW5ljAyM1amBUsAsnCWzktDx2z"
+    "Yy/HickE1M0WwMk7nDWFLGIyaLnC4cKa2Jhb+UbAZ6kdntjG3ylJ2FuxxiJDFjMkQwWC4uyfxkU7"
+    "v6bI7FL5B9Ywa+C0R5C295Enn14ZZucxc/S2JGxwTkrJ3N9rEuntl3xUMu5LTKasdrfXcOXjg1bO"
+    "V81DFQq+a3A5rSqugDZpvTqmw41KVM5fjGkbHsZd7TiHv3t1kkrtr74l8BNNawT+zjaO1/VeKfPF"
+    "SvsZkhaj9jvTOoDUmpgOuNDCSNBxq3Bwc2SUYxbizO2CQWBgtO+xcB5wfweGxBm9RmmwzxyiOg9o"
+    "Pcr8vfnDPH7BFpJ8KET4QZJ1lNDOrvcut4PcCzT1RKcLsUCNw8fY0mz+hZazkCAw8+4tm/J44Vz5"
+    "g2FvvcxXrEKX8d29QNGJK0z+ZWP1B6GUeOyX7csrSjy3ZchTbUqhfXKNmDLTNPY1lKB1sbpKZtIP"
+    "TVPhsveWUMhmcGgC3K39qkky+CvCtqv62IBSJe46c9/pMy20UnYrqBfnp6cnLr2Ttv/MVffd9ffd"
+    "8HP/Hlgp1fY3Ton4f6fLA/S4PMbt9j9/bt26c//jNv/9d//P/45e+8cfLwF59cvcKXBOliRCepV/"
+    "TEjc/HAfYFmQ4OyX2nV0I/mQJHnDqYOJnjpDcXRzmA7+pWSCcudBzY/PngzlGPcU5GMnMFQxCmzU"
+    "SCqjEjJyYmJT9Jm5qv/TcXtjLAJpOIHdkHNhRfcArAnTa0d/3bcPGVp4GxsRJfcti7ciScF0swyg"
+    "a9x0V3gi7rxy11JYcfxvBU43aqMSSOi/o8HX49tuTDB4O4taR/X3O4HU4+AwMxTwDu6htLdDnhC0"
+    "BfRIp3vaIKRox58iQq+eN95IzEXflk0VRnOZn7NFoyGxG4y9R8RokmasroM4Z0payJOJBXhxEq9o"
+    "nKjDfR2NLGt/2PYiqf7E/b+4jjYHtEGJN09rwN1XU7mNCevl1OZ0HasJ9gy6usYNjyUGaOqbKx9Q"
+    "0FB5i4klpiLpcHZfAdF+qdW/lhC2VY0MFDqU9zjR/sFrdRXSUGerZjf5RNFgmHs+j4IVYzqpYdxz"
+    "g1qwYBn405QRQJPMPF2xP5IhSt/QSaL0m6feumd+mXvfoLDg8/9oSeSOstxnobZXI3eXf5hCIuSX"
+    "1cIDA17mmNH/QObOmRaHHssS84+WQ/HLX3SSigI1Zzm7S2UEmj/AGh8vi0I0HiN4FWKZVNmDa0rd"
+    "SbDI/js4aqHadjwG+tUPBvhXzmJAWu+nKcYIi3CRq+PMZLKACardjyAKJdK/NFaPuap5P4bYtifM"
+    "PcODZ8GW354AqfghRVe4DlyDwLbouveOPs32GoGw2caR/zw5rcHDggF8cgGzzYj9obTm3tC/sbax"
+    "g5GvzYl2m08igwJEdlwRJYcps2QMMdBJ0eH0uTWGackcYAaBw15qVoTFN3XJ2fzFc8tJv80EbHml"
+    "y29JrvHr/F0RufOxKaZwbCcUoeO8Y6/MYZux+4thNF58XmAk3zPfbDNuY1t8cZuRyXY3zidMbE0D"
+    "HdmyjQslD7ddFJzIhWuZlPaMROHBixUiWuLQf0KR7tDoidIB/C3Tjim1cI5t+8zoORAecIXaD1OQ"
+    "OxEiOv9FgxNigJZwJyL3JLpDeCWAJN7BGOXW2pUcTep2l8Tm3shik2IY83fDiO1p2j2fcZI8NWrA"
+    "kgMtbYej+EecANlbTMLYzf5YGB5lS/ynJXXRdzxMV0enr5/uN3Ll7+N9/xgd/8Cx/9/et/BCTw8/"
+    "LZH4Hzgf4sjDEHdSbZu4drz14/vOmfvucNP/y//MK33rhw6WvvnVw+vTs/S3BZX4hyRQu/78Ekwm"
+    "fbOCxOmCO0ZXzRdlmTKAcMIh1AXQTTRUt+ooA2nyPjeOVCqYUD0CfES8ThOSeYahLn6qvFXBAOXk"
+    "g4WNVH6JI6Pyw5sqUTQCI/eZOstphlglFcfMmIQdLP7MIFG07prgs5cyoyxkByxyBAT0A8ual/l7"
+    "eqSkmkV0/1pSh8sYwmWZ7y8KSzcTPl+iSSFyNxX9AFXy9KsY8Hrf30gjQkJBd0XPzNxaADAS6dL7"
+    "LFRc1nG/n2wWwhMicmxp2WeEkkjmIrSr4JM2NvyMKmN+uxp2cu9XMXLOPXCZcwoaf2xUDxqvcl+y"
+    "OoraSXi2jcbS6zTUCyzciBeMmocScmEHHui226Kti4z0k0agVYuyAGY25ppI9/7GY7ceJfPdbE4I"
+    "BZxcbkEI79NKkyZo4ElvatOsozksToNmCKx7udEZHMFOeoNrXjR34MH2SqPF2cbSeRnzTv8R58sS"
+    "HTwnj1pgd5y1IK7fe3buutlvcPj/C5uZe/SjcVcnPB+/bE7C8GMXccwEWMbMV9QZaYqYM1T0KIDg"
+    "zF3GybdqeR7mwbdYo3sTCGUQef7tbHvGNpKgByOV7HPLbmNj/jFJlxDTFo0+xXIPExweRYl4fkKo"
+    "320/GwN9u1pZWP+nQtEVa1W/F2gMban5WVbG/LcbyGCRzGCEpi260PpWm9AsR+ZJBXyQPpg2XJbB"
+    "sXuZBKTNbvuGBorGFbDIlhXNRn8ON7fAxkx3PGlynLq1p2RyGg6tImMP6Qt2gQDEOof+/P1bUeg4"
+    "Ubji1Ha4o2x8Yz/oBQXGslzthvirYCBHssoef4B3CsHfwSqjFt28ClASpl5/mhsqKm3i50hN/GtC"
+    "3qB9uVhK+91svLNjZSPaiVjJ2ygUyj3bO1k5m88MAe4NfQAnGg9tGxqT4+vEwEvsgRD38W7ULI2E"
+    "2s8M5ie17XZdD9wK/pYTFMTsZA1b6YH2bmQl7pMycC5xwCFxSPBVjHFlkS2uIM0FFgoSXHQbehub"
+    "RybmgtmHlLbeaW5RAGx6zGjI1zsw2yFDCcS1G8lt6eqbGPk4Ct6TEmkebJE52L8jQCbo+Zz7u4MU"
+    "NAmtfIV52TC/ef/L2nbnzL23/lV//k08/cfaWsz0QyLs6rz+gI5Dz0M0p5Tsa+y85O+Z3f/firf/"
+    "BHf/bfeebunW++d+XK43y+K0/kOJHOUyFfYAjPExRkvri7wwSnyUtP5JDnhJAJhGNOm03HHidqXP"
+    "RR+HbIFsvg88HL1/GnzQTAgh08vmAkTpPmgqD+mVp8MgKpMBzA+ZFf+Z0JITHFa3wpTnxwUi5xJg"
+    "qNhfrw4tU1cekE3XmYPhg4PKmE0uvVFyHzDXZ37uukVk/7eFqJkBR4Ylc/AmX8GRvHTSTypy5P7i"
+    "5dzJeqcNHmqVkKLo79g+GQIVXFiwmWXZR4Pq+jXJTIPI10mAb5ItCZj5EtUcGgoricD/HOdrNWOW"
+    "z9QJM3sagoGFrsB14YCPpeJX+Pg/rwdCLHb8cPmf+cH4bwRV/R0KJZy0RuHviGBXPDqnd/+XCvAQ"
+    "YncrBsfxr0zIdz6fYnKcl6Yyau5LHJ8FBZ46bfXNB7HBRxrTwGewARwA2YQpsxjsPhL09wi4OwbR"
+    "LrciQm6RwUmXDckCkl29EtxdHxt8r4YVHlI0g1+xRHOEx8Zu6WfkD88unDh5e94jWHO7r946+Ohl"
+    "9A32XmTq6wrNlacu5AkdGmZgjII8c3zN0u0rNPqL/yoL3rT8dSMN1uxkhKCUNaidxiy6srP3yZE+"
+    "LH/IFb4PBZURgzVeXI9k0fmXVaFW4f6hPj8mea2SYDbM64aEGFzdEiZft2Rp9l9pmhy36HgsLwHn"
+    "FZamHxkbBR2pqGUfDv40BY8uAdU5pZa5y6pzVeakr7AWoNlnE9inE/XpuvYGopDOZaLHdduy3eol"
+    "3Lz8pRzdykAZtjrp4SfdbeR5mHJ76O+543cWxjttedxRPCvsQ3r00pPb7xR3HtVQ0br7UCTEpV26"
+    "qyTVh+Wc+fTWcVfPfnWGUfBbBtO+GUQM8t4GSpl9aE4DwNwJ9wTQilJdTZ9nu752YDm9LxYetQ2m"
+    "8bameobeoy5Mf+pQGnmCqHjzglcPD7CzlE1a1YEXhBaY8WlNP4gTRWdVXIOS147Y/uei1sXuiQp+"
+    "ZLl3y+YGLPrDBJme0EZ7ef452Y3JZyXMafOs57E0qQDuvYExKv93JoHa8IvBL0/E3ISYR9eF/WGG"
+    "A6y4pvfIKZpuvaIOO8jH1sF7VdsYX65VPGE5sWbNQaO94ppTanWvdvffFH/+AP//x73v+hN0p0uo"
+    "/xvP3ZGQH2kPPyGRwB79ji4xC78al7j/z4W37hm37tIx/9S7cfvvpHb+tNeTkI9bZBvtxEbxP0V8"
+    "BypcEBpKOAhZ8fuKQ7H5dE5pO5HuzSwU9R07+d5hNkC4SUkqkNmU+SPElFhgU0PgHzERcy7tbkwk"
+    "i+OJC50HASeDBx+mquiwW17Uc8UDUmTxIyY2LLAZ+LU9NodTz5k5ni0Re0gKXA6UkRewQMxqrT5n"
+    "N8fjLJ789pDDuhoC2cwblzVxd8nGhpS5Bz864/T5RwT/DY++KZC2ie8s1bW4GEOyfA9JcRYzqxA1"
+    "rtgAzbT4omqm5oPE7Eh1/V5lDNWPuCmQu0vQ1JTqKWt626LyjA7XdyY1xDMvzq50VgAOUfR+VpLN"
+    "1u5gQzOOo0xWMX01P8lTsnKc0xcTmecY3c+5x0EZloIhqQe2F0Zs15vNBtjGOYChN0O2FMkeBnas"
+    "Wb0jq9o203iLBpu8+xNUEv7dqGkkyYqrOv12fjIWZtCCFZsv1yUyDbhx8QZ//laLh/5/bh+qefYX"
+    "I4vOrJLzhcuvKo9mmOVelMw6jqb6UwuTV7yTka8LXu0A6Y+BqTTyIk9/EiLDF6P8ASXxMtppav2g"
+    "1pKc2rtUTYYkw2w0NvcdP5F5Qcq4mQbcJf7dLGcGSTiLdPBnN843+LHzsKIYXLwVnGqttu8Uq25l"
+    "q19+i2YbePXX7YZywdxubLDmRZY5xOORaZ1bj6Zxybv03GAPkqHQcJil1z3gKhZAplO1dIY3UsjL"
+    "/okyOcGaO6dN6ab7O/BFvO+BdyBXgUXLhkYo4hdDUEjRvflObToFe04LusHGpl07FPe/GouzgGtm"
+    "imv1VFipeUpEhUxxyV1Q6rTZa9D5nngIIATM5r191jxnV5bC99+6XZam8t57Y/jo98buDV2o/LEi"
+    "4vm7ezPNh53ORx6QR/Tj4Fn/xVz36x2WA0eZmzR+tEgy3GlAkHBPaWS7fNaIHZFxh3a6yOmrUJp3"
+    "IYzLphjQ9ilKJNQ7yaAKadXubNYCSRreUQx0m4htN5E8d4xi5Qze/jkz7wrAAw38UGO8Z4P84dC9"
+    "zVJdFXfsTr6PBAyTZse9Xi72uTOXki5yhlYVMcSYRcryfI9DTv6t37J1//zt/8yLd/8J9/8kvDdb"
+    "7+bI5AHlV8Nj28hLg53tinKXptu/R33/JzX/mjb/7l77/3yONfwqUcR5Y/4zV3HMH5h6g5QnSXhR"
+    "MrHmlzTZUZwEew5NS5oOJEnIPSBy9XjTLlQoxaPn0RQAdKTs78YT3B/DtQngGkoM8Jqf44mQ47J3"
+    "r5bB56+xgNfb4ZE5mis9Q+DQRMA/85ZWSm6QVU3t5DfIpZF0pwtNi3jnzswGG3v9uE3m+1lEGiVY"
+    "PJgslFNH4qyYWvTnLBemLjUloJkapPTiXlrWv9YgLkAJzfhJKQFB/jDEACZFa7Zrwz7lijYbJ3vo"
+    "aDFxDuODCKmJHzF14sg0ue8CQfG0i1Lz0RhBrujt1+4oYXt6vYX0JZMhrgDMzY1QbqXHBIYgC5xl"
+    "dPih1zyXaGjYdxwOPaJ/BVvINPJ9KwsW38oit9sclLeo9DBwMtsvYJM+MaYKwTc51OPXGYQfbmUI"
+    "c4epd7nFm3jat8jT9ky59pZ5vOfpj9QpkI3xNPYPSzJBbzIBs+xkpHSV4MJeOOdIowHhH2izyZ19"
+    "X+4eaNG/7M5qtf8/rDycOPHm759+awUEL6/CfWYvE6IxLVtiXQiZl93Pt5xsG5YTf5JgywHM/kKt"
+    "Ucm8iOxsJKD6g0sREAEFDFgy83XXN3t/bUutXivAOPTfAyQjgxhUH9/LtrNBB6wLUw3uyJOfPAl3"
+    "JgVDw9xndJsDMHDdkxJD3eoDBpGtyGM9jb2EZRLPyQZcuxv6BP7ScNvOVdMtIhb78tSSJvNecZPT"
+    "oKPKwzfrRTus8iN4agi4Nff/hxNVyWQjF+joYUD6bHl5A7Zd+NAWHkIFRi4FzoekyciYhmHzYlUP"
+    "QGpU0TYdwoWqZ87WPklZyM8HYA4xRUZzxSr/0nUPtYfpxjDQfgCMQ+fo11UMQxG5awBCjPvsa8/h"
+    "n1xI8dJa9zzcdKSaGHg5LxUUP88Ozz7Hifzck2K2As2AZmc5y0EGz7iyWbz3Tte8WO/5AQisvyu9"
+    "OhWDj8ql88WQ2F7Vk1hgrW2G1GUmVEEC17dRzGGZmxzlUtA/A6sWMzeKuECzTrxtKcHe8gcqyWp3"
+    "aJeo03+Wh/JEhvKc9Xk5lki3+SaB8E/NhGJXuHxCpJuNXYqePBnPh3f5KrVep9b8ZC9kDdw1EhSK"
+    "To9jMiQDUHtPo27+EcQulkLYVmTcdKeyu4Wjnjf15HZhpSX0/n9FEYU0itxxWK5f4rbt258Kfe8s"
+    "53f+CRh9/4sdc9+djHNsbz1md6BDozfaZ5X5J83f3v3L136f98x3u+8L/6sbd8zzMXH3qjztofZq"
+    "c/0bfRXdYXevDTAxw6vFWHr9zmSZxtdRR5IlCfk7neLb8rXC4eONw4qsDrTy+gPngx5gj0Mm1V6w"
+    "RbbfBC+AKCE2n8U+DInahcXEQ4+OEDw1MxT3yy8+N4TvIcCjyO3nr8MLn5AkuYnoQQG7IkSJUYmC"
+    "D87Zmiyef/Nq7yEtPRRELsDl/edDHHmQETCT9dgP8TyagnxVaevMjbJ9PkRhkYPeScvBLbGlcALl"
+    "ML6ImtUrBqOz41GCsK9s43PftZgUiGP/toPfSB58XDnIqTF4qJdtmtGG2QFfgVyy6/REhwwfmzWe"
+    "qkK26NW+GOzJ2MQVFYNgazqOMXP3XANJeFcyzDMeOZmMmbmxbZF4i5S/W4n1DNXr397lZ7OduEQo"
+    "yOZQS0vb+ic14EnjZYivHOIdvex8PIvR+X3Ois2CL5U3+I4gsOptUZXfscQ+fa+JBpfHQDR4Ph8f"
+    "dJARhs9e8LOm2b2zdv6otQbh8evvrE4epjr9DFnBCMH46lB+wLmgaCT/vNzQ0iyRercIyMmb14y0"
+    "3+ktce94yb5xfaWtzudjajMR47AZwyFAabwM2IOkCjtzA+tCbVYLF1bwBUKvZBPgoeP0V1/NGTl8"
+    "cA5eRoW9szVsMz/P6M7cSKvS+y4NltO7aL50fZ2Edr44h7/ty3g8Rqb/VHYPYeqbD0vXm8Ih/9Se"
+    "yl42w6kgmP/QOg73VasZ1txdwzyuCJP/bORfbJIyTkuve9jFHDw6BC6aUN+laGxFh0/levpRjk4x"
+    "f/xLgKRlkcy/Bm3izOg5dNqvFKL2bQgPLWHYWtdvEl3/GL/71vs/E6tJU1Po5a8lFuGLWy8eIbzu"
+    "F1je86qVHrzU1ag8POcxO83SfgURtIoiZO9ZGrZC6Lq9IPnUNG1sUGsMg2y0iGK72ytK7faLtOeI"
+    "rEDeIRbvGqI/PGVpsNU4nqZQM+CzzewhUMvHk5IncyIk5wURLTcE3mDlF6j9uMpFVwaMEfpa9jbm"
+    "sVqdYlsCK50jTj6MwhKPtgz6OG1jijV3708Msq/n1+NFzrfMG6YMC7iAO/Y+icLJ/V/nWK8e+yYU"
+    "ywug5BgcxIrrFAvqXN/seyFdu5G/l6beVCGEMBGAd+xgCEb9bfv/+6Z67d+47/61d/8489e/3+Qx"
+    "vbeeszPQJ5pftMs74E+faHyyc++fQTf+cn3/ynP3Hz3p+9fen0Ce6K80LGQXZHb53i9+Iu6qKOkz"
+    "nsOEhO/C1BujcyF28MIZMFB4cvNNT2QcqhzAHLHyf6tF2HKE+ldOdQPDlRHwwHm4r5ZeuJSLK7em"
+    "qmbg48ZhqCAecTxaknyBz+YBSL+TmGN/7/l713/dEsO6/7qquruqd7pmeGV5GWZVkybSmQA4lwBD"
+    "mIbEEKLdGKYUQmEMdwvvlfyYcgX5LAgIEkQCznixPYsQUlEiMIDpyIutmiKFA0TYoiqZFIiiJFck"
+    "ROz3RX1yXrt9az9jlvzTC8BkHA2m+ds/d+Luu5nL3POfu8l6KNHu9CgG8bwpIEJrzQi1/xzx/1FJ"
+    "x9GnuHJ6Z8XNLaAgAvSOSFj6VqMaccYpN3EM+5f1WbPh+tJOecZ2SBnUNjYeoGsYqHzxaSIBirNA"
+    "YRkHFajKU++Vb8JqJPaUXf0JJR2/hmiohNgKayXGWKY7DsfLJER6Xf0ymtuTUmfEtlt3jq+oQdCL"
+    "edQ+WH3OxvXuPnHDPbTKaz77Gkl/jACVYsqwMP6yoAACAASURBVCcnpm0eY1uvHADX9avjEm9xjc"
+    "0XM+cCKvGAVTyTdjvmAl12QaDvjWPTjkWCQZMCj/Dsi9oee55zOfb1sbLJi1Wjk+bYCM5eJ2nA5v"
+    "hByy40twDIARH9ZkeGZnxyLPApl/xfH83P86NH+hcFvHP/+jf9KX1Emwcr+WCFDqHyJlGdXxgfgV"
+    "J8ssfGu//+RTL6DNfJDTznAQDKVBoU6Y9PvEuD7xnvaqwiexNfYhNjdJYIDfT18hCwug3bNvJ5F2"
+    "gFYdWKFaf44OBoxpOllttmocB3av1gR5ISyc2G8o4Ds/ncBBIQgIsOyx+3HmMe/uBxjhMTUcvRx0"
+    "axoMt9cokqaXTtfJI78JERwUYQQM6zJfsx5lwwILyBlw15+7D68YcxlxiESS61BVVtdCyPr+lDhG"
+    "+eanB7jneA6kOEf1CMFQznnr4VoCGsnu2PrvWdAKxYsvKmmh/b6HfuxF8sgyNA1UUZFefR8s5Zo0"
+    "VHxcLVaN9o9tO+jm/OgXbFDRL7OWZS3/xJWwTAQscepQGJx8OY9UCmx1p82yUmK+QYHMZcLwgv/l"
+    "t07Taa/RukmC6uXQtHcPD2Wy0QAiX1DnfyuXgVtLSsShTfvJlWX2tliK+qyt/yikj9sSPGDZVcbV"
+    "4NmH1DiXERTaKui9SlWxQA00I3bwzCb46pF090fxJIcuUbRDLWwRXL06i9GMkRMPBON3IHsvg8ZG"
+    "rcpCQO+aJX5uMWWyQikxgZASnxH5wcl8pCx+evWFZgkpRDjN0FbuW9H/UcRuYs51acN4yuI7kv4Z"
+    "yrTUBo9AG5TlR3dS37gd///Et/7wMfeeEvinXzfTpS+f9CuVnQfROSyuDtHHr44isP/v7P/vyP/O"
+    "pHP/muy7v3/yw3zbwjx0cf/c6RZoAno67G+t0TXQx5V4l1ySxSxPdkEY3JwURm0nhhxxNjbrrUZy"
+    "KbMcZzg6530nh3SjKZaFOPzXWykk5ueHgHDXns6+3ymaw5KYiID9wx0kRHDmGOEtlp6wKMn0xgik"
+    "8O6vOUxv9eAPui92RTP3ITDy5+coIVjl5Imzc6tIuDA4JeeNzGsrDz0zHfPSmvuunyL10iJ8Ng86"
+    "knFPG/Oa0f0ACMl3RU7E/kifsrFkQMtJfkWHaK2fLGBF8X/vpgRzfuBBm7yHTLiT0xuO2YyFnixO"
+    "PEt+UQv9BPNGk7F9KN/caHLk5oNzqSti+1axfNtuDYNVW74CDL4tg6hTZMdCoN3zdBIvgmTj624E"
+    "d8AXXDrUhr5BszrRENDEI7wd6c2y435zWABcvFP9MXrx5tdfV8TDA4bsePyFUd2foHOqLEyi0r7t"
+    "p7hPUXd5kHLC5zbM4fn+vHUC6P7jz7Zv0T8Xui5yGQ76KtBAa6QrZRHXf6s8GjxA+3YlYSjsNq2M"
+    "8WV+SxsfA8pTXIWxsdwFNV0rasL2ktULzwQAzZzU3RUVScuX/nxOE2ZMYFWw4fI4CIUkR1AzlsdV"
+    "HePmYsosamBU29AFofnpGxozm+HwNNp8W5QR9Z6vQgSMcLMKjQywHLoWHAccHBv4jQiC9rUSYKxf"
+    "FYML6Fmj1QlPjplmFq18dM0MgR1yrGw96ipCFZWPutEnEhSNBsQ108t7xa8SPjYfNpEEgA+Yny6E"
+    "QfEhz7u8TJ2WYPCWyhuJeLuDnGt4h21rSxzYaJ8Di2CHqXMWVbxB4ru5wiWGhHG8LBfuwLsA/Fir"
+    "eJGTy45GEfG233CW/iE6lxFr0yYC45OqMLJiG5BpK2LzfJ3cKhAVMlxxXCjmjObjeyGyUE+ze2o7"
+    "9JvKolFbyIeMdKpIwWR+wQTbyhtI7i3pH6MKHQ3bGNgfICiE3nXXLJFY20N7nobLks7gZuyPE3Dx"
+    "vGTo+DujG8xblpjz2LZLTtedGUHg2V+lH/MNGUJ/+RE9V/S7G6EvbLdWWv19LdJaw2sihbnuyhBZ"
+    "DEhps292X0vWmXc5liVHvS5Xh46K5fOb93/vjJX3v/R3//73ziUy++9bpHN/1vTgZ6t/nNQfsWRW"
+    "FAuzx6fOef/ctffvs//Nn3/91Xju//0PnpyVP50RNO6Bn4/ODJlVYXfiLEDUwGuwe+1w3IqcHkQo"
+    "bCRM40pb3/nlsWXF5AWTIXyUxQHVqrh2YH1PcU1Fk/yHg+l7QJwicNMbHXdwbtAxpRkg/5Lpxl8F"
+    "UTm1+IZBLHz7mgyJE1sQmOd8DAEN0LNt1U448XbLPwwT7LOpFrLrkxPsp8RFM6ytulfunyWPJZrA"
+    "WXHh8pPD29o5qFnBasUrMfOtPsn8T5uzEEJ0wvJS2IbO8ww3NOkAIkyVXNO4MKydraDb3xowkJj1"
+    "ex/upJIJg+iSOs4vjHDhQWu5tdMOd4jqx5jm+7mIBLMS/NtO1Mb4Dp5GYCOfu6c3ZGxcQQBrZbcB"
+    "E9OBmmaokdLB0f5WflIuriRRv6vsTPxFVfkhOk6kk0DIEdd4NjOzrW6PhhyPhpLCOMvMSNq5xaVr"
+    "XHHrp6xY/ITOAEFMPsd810RcAF8qANTISo4kJ8MnpYqHl+bzKBKAb6TBU2/t/co0cvHz314Nmj51"
+    "/3Ji2S9dBl904+7njDxxj0QwJ8YfHa8wc8x+06p3zEGy8+bQvMyIJLwW0KdRbf5ZRKvS/R31Patl"
+    "+oL9A0eoTJk//wcxOSXS2ApbfOc1ZDNvq+YZ9juhZm2GlewCOhLepj0yLeYzb8qlGTs9ps/hgvtC"
+    "NXFHTnfI3NYiJHVyX6NOJWch8meyNIHjnKq3MNqnjDdy6xoz/7btzgod+Woxy1+BJ8ZPrgL9JoRG"
+    "vtB8S+qo0d3/ShrH6it1dQlm80o5Mc4/NmFS6iidVxyLF+cmO4qsa4ZSMfHtjBTw4qOscEIVSb+M"
+    "KQN7fxZLyhGiy17BN1+GJKpzlzPAbA78yh+r40OI9gh81l4lc79JKbs8qJjm87XbvaGKqPOowdHV"
+    "IS4pb5topM5cbMcqvxG2z0aFf+gG+DGLFg8kBToCO/0SZO2MCNQY8TyXZsw15FMvULOFz12ECAzt"
+    "hAJnPbAmLx2mjmI2NiZLQPhoiLDo1QBi/dxLYcMbK8tu29LjFw7EXjfGJ7GFQh3h0MzX1erCMnfF"
+    "W0M1YPRtRtFZDN17SdN5mdYWdc7lGg1yYuULA5bri/z3nmO/5WYjdnTC3d3o+DE4dIEymEbNLxfR"
+    "w24UvAbzwM/RbXKj4RpcID3uPjs7tfenz2H/1fv/3hn/jci2evN+Nm903NQM5M31TIb1Wwq1sf/P"
+    "gff/d/87/8n+965fLWj1wc62fo9DMG/kETzyHeEcjHum7r7smDf1Jltiaop+JMFvjZOKGk48nKXF"
+    "PpjQZtSVhG9xqeq0C0cDOEvm90RWRSr5sSP1LJhDW27ppyQmB26l07LZp6QogPmbD9wjz+9mNZnG"
+    "3sJjbmwsZJp7heSIkX14LP/8vy2wmq8DPxCVMLPd+M3rrwO47843Q+pgrf70AiL18vtPXHTljg8W"
+    "SIj1r6owty5ko+sVSTIoHHL/kWvwWi4txpn4UA8niYfCb2SFgYzsTmdwTBFA3dTCTykdgai1hzTM"
+    "YHa+BObOAbsu27rjHV3Oi4IMddLUWY9hLwwfGJdWzBXO9aWDJ6iScAacd/Y66dkTefMecg1BCLNj"
+    "kyCXsqtNFy7KZAzIasX+TFetFfYlLueKwdv5Nm+TFg9ODlaGR/YM+AI2/duIBVckxZaOrXFnQfK7"
+    "wUfY+J3wSHbHWRv16CHmov+MsayRn/3ZyeXZJixk7HJMeaTaNWH80+e+WRHlycHr3pTW89unVyV8"
+    "K6QJorz9TgNzD5Dvre/t5R/HdMPDjxyUHKKvVj+Th+gAMPncwH/EppvQhD/2qq5rp53PfRd78GVO"
+    "cY6BgZXL6otfe5RyN8I1g2Mc7xQmFiESB/q9gP8esHDHJFATvv9icXltkMjYyrV+3sI2Zte3BKND"
+    "4OlS/1+mR8K1qXOHq8Nh8bNWZp62U77m5YdEUPK3Jo7OOnDwelSCDfDd5gwLdb4cFADt9s25KgTS"
+    "HP0wSjVtwGyBRX2670uUG2jGiZR+5ZljFhm62hYqwG8XVohmQnnj1aMgikhL4xPE+cJFBCp9VFRG"
+    "+GE7cklipIRlt6toB9O4JsF6xc4wEFOcV46lNDtk2zl4GFHtlqpkaq2yEnNoyCs/zZ6Urb0lIxa/"
+    "xYRLCtB2Xz0bIj1OMS7J3cfmxgUqWy6WWfeDWmJv7KWWUZ0nmobkdgS6EZifUQd2jiY9f3H9zfzD"
+    "UUmv2Z6zm65N/FmO3XefrKwch5PIxP0EbKmKhHLjkDs9iMFNseHZsUM/Grp3axQBlX1JoXPiC/5m"
+    "CkE+N2D1VcbK9iYnrxYebMEqABLS+T64wdoRP/U3OflvsTpm8LUnQ5jxpveMf8u6iro+9+4bNf+s"
+    "/+xW986Mf0TYIHha/uTf2NZeBmQfeN5W9pv/j5R8//1//0Z97xwh/+8Tv19tDzuTHTwNaAZyHn/z"
+    "3HTRUTQKOYmxQWTL5x0mRZU2hNjHx8kolbOU4GzHDmVi/4zJzVVicTJHt44PKHLi8td/xiQrvA5i"
+    "TBqyc3seDzYyye+MiOODoSt86mT4ulk+TFa/GiTHTeZcrk5kQUW7XPwpR/Bk4/cvl3BNjg3Aud+L"
+    "zxAyjYEZ1/zs67gr7IqW++uNaT387rOIL7lFiO745BDF7lcbuM+8U0o8ruaMdFAR/4xU58ExAIbA"
+    "ldXNNniYe+GMYsBvKiN2Z4fkItFNo9nl60W98AxkGHEltTEwwlLFU7HNPCB3vvh9WqOroB0r4Gii"
+    "s+ImN+idk9CftVPxY3ce66bu796MITRtU1iiyXWHGkToIHN6/GQo+SnKpebXHkoMc1AgODr5GNHi"
+    "xK8cQEzP1Fg88FCt6uxMdD3fUOL/YQ3yXa3hsD33IxxC9GkR/+YFf0iydn+hXXJ0cP9A/ET5/Svy"
+    "jwIwPeMdIs08ZcQYu3n+ujj8FA4qI/7ivb8D2+xq71HAY+BAZ5iuORfESFjWfIWN4iaZumnZjNwX"
+    "BXf8MaZedhbIytdSxqgJy5xK7PAeTduqnB7Sv0+NCbC/PtV5D8bhdBjK++qRs72HcJ274jSlnzDx"
+    "6v6os3WpaDy+bjQO6gauebSHR4DUZYlqBp2XwwYIdfO1GyHJILB3qp4Bq7lEhe93DjpgWC/VNtNG"
+    "O6tUTplYJt/0mueahh+q9doDcfkWHvrTqrPkQ4xGQs6JzL9Qj90fF8ZFzor7gcA9ousNof4mRxYq"
+    "ng0shwMtkRVyCUTUx9OpHZxgItxoHFs7NOZBlrexYC+GctxURY9s86gyFm57HlwUBnjBjPivFlmc"
+    "M/ZA6wqkcN2sYs3lid6tBWeUtWGG23LibeYGJ/PxAZG7Zl+niQYzu+iAY9UuEVc9V23salXUnq0L"
+    "o4Mj6wc83uuDGO6GiYNm11U8xoR/W45mFn2/AUH+cl1T5PQFKB7TiJAbbKZpf29A0WvmWQ27rWQa"
+    "9i0YvAlp30E0POP9w7xP4G5nzy9h62h2yZAXcbuh0mANpTUSeo5ctAWKyItjGUVsqMm7f1Tp1/VA"
+    "/Fq6PT25dXb/+Dz37+Xe/70Ce/V/A3v7TfhH4T6tx1fhOAvnUhtPA5O3rqH7373W9/969+6G+dvu"
+    "7N33WqXzg50VX6jibXqRZtJ7f1Ayj6VignN+aQKjdYQPgdJhF9AtTE8QJBN2zc7LFoaOFixkTOR/"
+    "Dgd7LPImnOHlTwfPHzBVBy3BWpeKGgdn60JBOViYj8+s7TyHWSY9N6wgUz/5+N76nNd6SAFgbyXH"
+    "jsJ06YTA2+YpGuaepT+i4MdU+I+eEPfuAk8WkpmxOQVKy1YiaW/KsC8lV9ZBq7/Zu4c7JxypHAvO"
+    "TSJL5xycfATFq2Vdn0LSdxFuNLZycHsXmTRqCu7yHLZ/Ar4jZkZAfPPjuPpppXbPQW/uaKMRNr/H"
+    "AMYwQo2zEmTjRGjMZ2L4TwKBy3uLmsQTWvO+OCtaPbruOQlO1FmlwzDjhejbkXoOhwXJGamF3VXn"
+    "3GL7WH3HhtAXltVpPd5qvi1OHFH/b1Y1EkZP9KQIkiPPuoZu3b9sS3xrMd6/EdXezKML34VEzuNT"
+    "LXMQGu31PW225nj870XOju0TP6qOUTv5WduSBkg+VdaHTAGJ+FBb/zAUzHS8PWI+v5KB28yJxjbu"
+    "cY2jPvorGoAvJxAXBArQ+0yj6PzXvpB3kTcfMJG3rZniNzO3md85X5GYdWlDI6e5T4JcYcC0CWhB"
+    "r1x2bwFS5/lhsqTg0EfPtkmcghv8qu3XMrPOdgePFgbJSWQEVcSAeNpS8+MeH3fq5gKyEGPXCiDQ"
+    "qw3rRbOTfv2ng0LTeAlqtfQmo/9YaDSvJCbuygUbLLsaNdX0y3s3iUchDL0OxvBegMwDpm41sPLa"
+    "IZHxMTEdtEFPHR40E015ZHK/5HNv2DXMIQRMyB5SOwMOC1+IEKN8gibudM9Qw4umq7r67fzQFgH8"
+    "SANZeWbazwcGfwLDM8s9TmZZ9sbmwNpivpFtt2kZOK/nYF4vVyKLFxK7vLux8ybRJpRT++y8WBq7"
+    "b9lmD7rdFtDvCbjX5xlgKCxpxxb4D6rNq5QQRa6KQRsWJJZBUf5RFwvuAAM7oWtPL4XOXCq7Y6vo"
+    "6uBxF+jB3TDRTZada9xLkPsNgSBJsyLi6dUKFvAm2n3uiRxZ+8mUAfE8hZ1h31VRM3mmyb/4xz5E"
+    "VcRcLVFy25Ayg4C3d4cPxpLiHrfyzfP7k6/eFf+Tcfeefv/dHDN6Oi7aZ8EzJws6D7BpN4dXV+9L"
+    "/9+q9/1z/857/89y6eeu7tl6e3T4+1eGNAewIx6DUb+HU0aL4AcNM6dN5lovTCwCTiJtffQWIWqX"
+    "AT7KmCjjbGPze+/UgkfBZa6OajIdLn45KDA54nnPnSt22WJWobeGcTfEwMncq+2u60sQ22NpNlmB"
+    "vCyq0TIzhTsEUeuBh2cXdbC11+0AQxsABLDFCIUX6zAPAiICcNsKHhPR/F9JrNND6ApiJ8cuOc6O"
+    "OX5CWu15nWCKuoa7/Tc84au2vzwyQG2xcjx2GU1Ifu4wwkBgmEbV8gASq6cyc/natxySojbzvWJ7"
+    "ccWysvNB87eoYDNT5ZDrLk8cNPd91HWHQnbNrSbaFp30pQnbE0+SEPpvlIGt/uDQ219mlTkve2Fe"
+    "v4GJzQ9/vEHHuNI1aRkt0Cjt9Os1FDMG4BRQq1eUjGutgBq5vlRtlPlAGGP1jxa2zAU/GxnoAtWe"
+    "HRInfRMJRzs4394MszO8mFFPUTY986OnvyWA81jo8evP7b9Q/En9YvW57qWafKsqdMSifdjCF84G"
+    "UaPF7ACxM/RtV2PC6Yu7z8UeU44Hxgx9osDlW0G7eEFTlj5352OybIqthWmtNjbssOvmhuajQPTo"
+    "4LBvKxdLBB1nznJYc7hgnEvgC+xm/1wRWjAS7bEgVNv7jiXxkOwnAnT8B5Yx8bmHAQ1DhN/hRrvm"
+    "+bXFbEZuE5L8QBH1+QmCLaLZ7aTb6cO8cmMdXWcXCYCr5lrA5/A/MaQuDItdgH29/J7WO1qI4l9v"
+    "E1WVEtHPWBMtwOUxTDYyevWKPtvyjUBdVzjkUtqublXBMEWdtsTQx4bHEHMXGJ6ONphD0c+tkCHg"
+    "HQ5w8LwxKImo5xaFTW11h0cX8SgCNR2fSnZYaUoxVBeviYDX/HTxpFWPzIEfyKaydnYNTGP9SRw1"
+    "fLI+t8G9i7HpdQxjdyI0L8HM7Q6Jm3Yy4XIjoSlVzEXWOLDXeiX1rEGh91NyOiwEbZxXMok7j3fh"
+    "UPNWsXw/Ynr1IgHy32aNmHCkW5GZmKUm/eb60RN9zePxM2M4lPwrFn7jiZdqyWbod935Lw4499WK"
+    "bV0N8czVFsNYapuqHXbcT2/jp3yMbgSJjgNi0KbIB0N2e40qEe5ghKi5VyTASAHHprXKrj66zBFB"
+    "Hfo7MQ843vgd86Pj8+//ZXLo5+6l994GM/pI9einFTvhkZuEnkN5TFi6OPvPBHb/zP/7uf/9ufP3"
+    "r6Hcd37+qjlhqzulnqwi2/zmii/t8cAzoG9Z6d3ynrk3YmFTc8XG8QueRjmrriepJMndmXCQSKF0"
+    "GGywki2J1soflENjaDNR2JMeltXxj+blovdvCMy04yWlDglfW5OeO1FmCR9KnNk3bwo2od4kgewJ"
+    "iFoHHig4hIZ5Gj9lrskJNFj0+KXuL5oi05pnBSYkHZmz0Wir5dBYuF7chhJ4uUbdiDkDxIP2c3hU"
+    "p84vgPneI4C5C92c9iikaekM2TdI61dPXqYt1Kkrte6qvErQ/fuUabsTS5th7GrxdoJGpXrA+gik"
+    "/u1Lx8AiamLS+xawGnAN1EqGoKetWndmQ7X2Jv/K9ddK1XlM0XvyM0+UYczK0wxrmhgRJ6fJq8DL"
+    "6Edio7BNF9/MwFfOOh0XzAZtGDbMbzXNSgwdRu71VIHE8fMfsI7RB9KJrLEwAEYRETOZ+8C9jjlz"
+    "jNi6VLfVf04uzi6P4zzx7df+4NulX2BTD+CIbMMxtX7IrN9/N8mU5zwCg4j+/wkKV2LHCHqco0y9"
+    "BBd3tZDbT8GQvtjINgIvNaxTLCtX3bxRZjrsdUWuCSI9vsXl3kvICTLC/haBepwYQkQchbIRgVy7"
+    "tNTMAx1zvfkQndFs0He28LlGsFNRUv6tRGIwVNmCbuqOWbgxOWWcd/zn2hi80gnJIw2lctArTSc0"
+    "SXVdGTLw/kwUhEg4ErCw4s8rbLHTxtzrBkm9NG4HwalxypaOebtQqi7hxnjOEZcl6QuxWkuKA9/n"
+    "pzc9o5VwIPn4IWtqkjPwjmF218Gps9LnZNijsXgVwFPKH2L/NfXeSxGfSI2w95YazqoY26+9EhXs"
+    "es2rJjbY+1rlfg6UWurhfTBneMvCoQdCnILoQvY9Rk+4RfTYpqKwbHWAvI0Nd2MK9viXsbHxz/3b"
+    "i6hkDXuZWMTdUesbaNFa6718oKbRqRGLmVK5REm5DgllX8Hi/7iTjp8IvOlAW7y+6WJks7AuR29G"
+    "jPeBTvOhubXGOWT6PufuNKx3lMHsaZGtrbg9VNjcaGH+uYIA+m9bC/FBAbVDHHbvUQt4pqNOi5P0"
+    "THPxxz5b9fjiPzB8jErJwYPz4Gm3FyrseUT/78C5/61Lt++yOf+D7h9CQN5E35OjNwk8SvM3FRu3"
+    "33f/7f3/ODH/vMSz95cXr3zeciMqaZBCwk9FOt3pgNvA/FE+OZE26RfGT5lwVrMjE5PDEyqfiRD0"
+    "C5+fGJaPjcEOdduaCCnMmXvS3JGFhZkIEX69BsQ6KZnJGrbOTqaSZmbr4kJ7ucGMBcuBUVLoU9J6"
+    "/g8c7Z5oOIuvD5ltRytdkfPYFnW/hotMMd54b8awZq5dhnDiQlr3ZuLib/sxgat5I/p0eytrOzgV"
+    "9euE4Mo4R/bHEG/DRNGhlisgxeQCOvypFPsiN/GEXkls7oFXOdnMdX+r35xw97aF6ODcfQfo0/yL"
+    "P1+GCbSJFzK4asMzDja8Zh9YxjnUjV3+JR7wt8fCsmeaG4v4iJ3TH5AkMfmQqQS7SS0wOboqdvBY"
+    "9FvwswdjC+mjSmY7/UFoWEOdbSrMNCSMeejcURmPD9kAAV9CjGMAreWSb+hM0xyBYNYpQSJsKQvj"
+    "kQwMKeuNAsqf85d/b4ZY3rO0fPve7b/D/n+OEf67Dzwl61CnowGBd+j9tCMWO7dkSC2ByAgxw7Ri"
+    "BGcXzKMceA6LC0mQUUOpCGIOiVI5FdRsU5RhkZxJNLMAFk4RxJ842XPosbusjZN3ekMrVZ7PbFCw"
+    "pkIrTJ6gaKc4DIa82EGYvFHj56MQ8ZOb928qJr9mWRqdPWytfAePzldDb2ixszxpPxjqsViPOATU"
+    "l4E+AqOAjdlZ3hlLn69RF5dKl3hWN4SJ0rjZOgfEiWOPzjVtC6QR/3w9+Qt6gwFPqea3l9NLjHgH"
+    "4WMGjijV4EQK5Q9AZvig23o9rBpr/PzzpH10/VUd15M7DQN+oOW02LmClPJeg5M9J2Te3qIht+FF"
+    "d76NGPDDbTJwNpJw+ElDyI7EIPKcu7Dh0958o5kBcBig60cSx5gY/AkCeWYC7WLhqLGjLA6Tfd8X"
+    "AMhDXI0MQlBm02KbNjWrz4sFSm4TjQHAPgU5Kd0Rpzm88Tz9B5hz8l46tYNo4/MI3fcx0EdMjtPE"
+    "CDNLa32sRX7XxMoAoCn64X28eo+eWKQF7ompcI6b8aYXSiYnFUEkmklw+WIeej02p06dZF+/oqOR"
+    "HqAP6p3Zwcxtb5OuLgjy3LcxIFByIYrsB77TgtOnN9w8GGrlnoypfT20fPnF/e+g9+83c/+tc/9+"
+    "JjPnp5U77BDJDbm/J1ZODs6PzkF3/1N//8z/zK+9/1zLOv+15fE3W1yq2KBi43Xyp8H4zCsovZ4I"
+    "E+s5MTgxdHnmiaGJocHvyq+1E5K0sJFSY83x1jQdN31LqAQdEyxfKsC2a+kIplZGwhM1Iy2K+vSG"
+    "zvOkU+Nzvjl/heqFDPS831LlhOdIkRuie7YskCTB+R1Pfu/HRXushyccadLZ78+wOj60SMDBfD6g"
+    "QvOe2CjDR7QYxBFmnCRv7Jk/P1y5iwKOBxA8aisb4Nwzd1zgPpwSnKVPiTDroigsOLurLyk8Ie7O"
+    "ulcgc6I1TepjM2jI85rO0KfW70ZSe6cHOsa7uY1NC28WQPcVK6W4iVx/VggIldhIJR7HqCTrZSUA"
+    "kNiuUBVLG/Gmt7DNtntyvtUkd19LmjVTFNu+LURvVyqDYfqhQU6VsgQOgOuuM4PBkmZvTxsPrtN1"
+    "+dO6VHsnMqOe5HCJEhPyD2oQVjVlIkSGP2kf/n3IPnXn90++kHOndgdTwcvZxHBoZzyyyyfBzAV8"
+    "kTUezkvIOqH5TYLrbtQXwQfCzQsCe555YQizDGu5G0062RFybNubNn5SAgi871MdEsA9Q2NX5QaP"
+    "cFKWg04lMOevpWgb4rdHs8IOOxvcYXfeQ6I2cUBDBcGvbhWALGtUiw8Q0amxdj7e/qQfQ5MU7bkW"
+    "vxM/dE19a8GZtdxMMbsOQEH9hU7AD6xasepwAAIABJREFUFnMqLBOQYSd7UZBKQFa9AoE+4yXYyo"
+    "Rodk8E+2enipR65WtksLZKle3guAtTImBn3KnvcMnBaLqB/YlryCa0fVCTiBR0KODTbj9U9rKzFg"
+    "ERTmybREMIRmVy899s4ipbbChPqCPqhndQtryl5313iAddDcWMH/vXJpdY6JPvFNWrOY3NbLCaUO"
+    "OijE5k2ad1GBE+ELe51T+Q3BmxFB7hX8aKSCpgpg6WO6Hgy2wQ9vwiY33zw2prdyA/viYkjgEIg2"
+    "Ki2gIDK3TVbqdrv31Oih+oZMODQaKZrmnoFMO44IkUHywyikOvcroRkHAhqdnEPix7wgjbX0nHhy"
+    "g10wfK0sWt6zzfn4lxkI9xfKOBNDJLNuj2Fd91PfJxEN+1bnDR15/joK5GcNvHL5gRjGnGTRSEIF"
+    "6yocNydPf0+E/9yStH7/ql3/zwDz/RB1M2lJvW15OBw3uYrwfhW1Tnox//9Ov/i5/++b/+uUfHP3"
+    "751Mkz3DbwjtyJ/om4Bz03r72oiNDvnHEDeMz/UfPNbQZ/hjonjCxg3JcO785lwRb5LLZyYuFC6X"
+    "mhnRdsY8vvjHE6mEncCcphYlLx/T4UaduOBXSd5+YQ2jztRh4IbsTB8jREdujUxlA8/sVH6Q4bCd"
+    "gbf3xhUZE8EI/yIJ+pWeiBxTsWaizfcaBPz+0zoKId+2kR+lr0SYcbJnKQQlx4q734/jiTuuDbL/"
+    "S5NXU/GuBQejKk3fw5RqkSEWGAgo+2sejJjzHhaau+xSVtG9g0X/bxbfrIxILZaiNnonc0092OKw"
+    "Rs+LUlflNCx7aiefCuG3ZVOgaDHtrWJobEHPjDmAzgHXrxC3lKay9+6WtzrMaLz8i52CwS3YZ+UM"
+    "Gbgu87UXA5/nmKGznsvyoaySTfUtcwW06qybj0gndkLLcQarg1OOQux6+euZ7AezH0os2rgc2fyI"
+    "GFh4wb4tGN78WTo8dn50d3nn7d0TNveOvRub5D148WG8fSG4592PlIn8KDJXBthysm83fsYIsxPl"
+    "yBRcmyUUN1K/DVz8NZtS2ecYEQbHLVOroAIKgaxvSae8get4oZyf08abv09AdDxyi20rcM+tq86F"
+    "SD9OcQSAbG2IcYemg5vmrT1QtR+zzy6aNObNjTZkh8Dnevs9nFLPJbKW/FPOBL36JbLpqDBJD9Xj"
+    "d49eLQVq1Wnj5tpKg5B3iBBYiK4zPPHctAb1l5Qlw6xjUzdr0Hi7+ROfRo6+XcalEhiC755DfWoh"
+    "4bUOz3yn9kofvdAtRRSGQ03B9X6Fl/T8eeS2t1FsS0m9XU9b3juzZV95poP0B59dZcefjYsTE8Fb"
+    "7EDnsRd3TGpEPL7jV5FY/u9GxsxJMgdeCNDRtRGxKybJXDodpzO7uMEc09XpKPbhCRJ87r5Totx1"
+    "m2XJhvMyapx+eazgMhXEveg4WunR6MVmN/wqiORdnJt/idUG1r3KjdQ/frI6qJi2Nt22LhajHAdT"
+    "JKq0uRluBGaNMROC4oRggervpjDzsdznfzAstpQm3cqaSPLPrdhhH3EaZE0TIC4GUgVYmDHjT17B"
+    "/3Vvp0mXxYebBKZEAMpvSYCzqvRM5CdgZ/uSX1vJc0HNzg7ss2hS0JPbS8unPr7PH3f/hTf/h33/"
+    "uBF/4dEe8gelO+vgzcLOi+xrzxAUKtPx78g3/87p/4t5/6/E9d3L3/5gt9HphF2ol+4OP0zql+6O"
+    "NE/x9KQ1h3V77Z9GjGECcwTxtPACYBF9meXHinqgOfL8Of8JFCHaHwWeDxxFMTKDNTkyHveHGR9g"
+    "2mF3UxZp2R9Y21zwi4IB9mAYNetujgS28e8ZaPjXoSGgc/ot84yjNDELBZ1HIaXScCfAYXQAFMCz"
+    "dMS2w5nSDSi2V8wd2clIPOSYKbb5IYLP9zcec0+OD5o5fynTYnlBRyT5v4VeMvffxwfLFTv+FlEQ"
+    "a/1q1kOGMrTnxpPmvJClga3EYH3zaXoKHiJydw+7fphZu9LMta4rFvPiGGVonaq15jcX9ns3K9eM"
+    "ri8rVY0LLhM9Tlgf2A4hzscMd9yztn5AZBFdtUbR2oMIaJbAnBrJb03YxwjxvSKfGxc6LYOeboBs"
+    "dSGNF8rF/YtlkB9fiAicqhD5ulfcu5RTjOm1W82jXRgMVUbT/y4Aa+55vmx9njJ+qcHt1//k36qC"
+    "UPhU5yBDrHPXNk4cBv9HPswKrvbo9fzUn1pO74DISgSo4ND1PAzzxBr3Ntnw9sSMN/tFKaV7A77z"
+    "qexZNQ3JGyAJof4+pcZL6BNt4Au0IXu9RLlkYL7Tj2qtp2x6Z1tWOmUwoR3wZDsp73kun8YJEcmc"
+    "QpIysG25WOsQEF2r6MDVW80Vp9RODz8rizLrgcR3Nnt9kI2cAHvP24xa5Rhcdx6zGjRh+ez1Xm01"
+    "PBJjxkxvi+DW2Pg0p0rvkaMGNhaTxxE30XB6G2a3ZuWDY6SDX3as35DSol/k3O1Des4CKHnxCRbN"
+    "kI8HwNFIuID/JcV6ZuvMkMWGmhk2MUvxNWDBYv9WbXuohL2LjARZHWobvqB9ks8UZnycMd2+bGn0"
+    "jDEk9bjyOS9sT6RjPFxwNGnVZz8yT4JmlH5KFs9MRRPMKJn9V5Vb38j6zHlDyzn4LdIVs14twzhG"
+    "N/96C2B9aOuIGIuDFC1t7CmQc7Lfte8diRLH+zWbZwoqWE4MyAO3Snc8nsJEe//jIOOxZXEJJJRk"
+    "fY9nvPVKzJOUCI7WwFe+aAdbUzVAV3wlLdqKE7FlTqpHXhzZlSfZPsSnQiGkb0td8nzm3p6V7LY8"
+    "R21ea+jN84EIAtsDu+defk6vZf/vXf+YOf+sQfv/xGm7nZfV0ZuFnQfY1p0/dVbv/Ce37jB37+19"
+    "73nx7ff/77L24d3dWDBmaD32k60/+POufmSwP5UjdHvNa7BxrkHfQMaH7hkUVcZwuLGCaRZdRiUc"
+    "h5rROt72j13QG/2zUXb+t6rjGBvAq0T3zPrL+GyRzLySQnVHCDFRtZmDBJZ/pim5diwc/e6IQ/GO"
+    "JD95NfpwH7aqz2htW48MN86UJjEUhpXO7YjWCZLh+STf7Fghai893C6pFLvPUJU0ljYXjJx614l9"
+    "OA2vldTR2byXPI5DstdOsjucFeS2UqvJcrPrRs0tpUQxufqk9tDNXoF48YXKRPHn0yVMMyBh2+hB"
+    "YPXy1PvsLHfNvggWCXzN7ihLfp0kuBNi3zjSBdx7cPrlJVGPsegsNbHktmxSl8q9jREVRVvn23Ym"
+    "OSLjnUMYwJ2hrPk9e9+VGzlz2mwdWxZwy0jFIfIiADnsdyASureqVkaPW1Ithd+DipMZvC4oCxKH"
+    "9FyHGZBIj45MmTo3Mt6O7ee3B0//6z+pcgsWUsYSCPbUaK3MOI/uJNjzFd0xAwS3o+DcgHO4YnOZ"
+    "9EN/oLh5MYJK9eVAUQpZC1hxYtaGCVRg/OxOsqY9L6YtVO8eYg0lWJns27S78bzcRtPjt45GTark"
+    "zeaHRjs7m7Hkdt7vgC4vjnu8nqjA2fNsCrjV0bX/qlf/slIafOMh27iaX61gFLuryww3H0sVR9WN"
+    "qHjwrnWzeWmO1hlxfHxDV+cJNHTmw5drDnLViALL7obadObpCJzvgycFRuehcetluIbY3PHX35K1"
+    "HsVCeh1z9w1A5RcqAGm31aEUHG+cMeOi4j1W6pSxGC8sP8mjnmXOGNjAVnfLFOcmk7u/y7PzZo1z"
+    "Nrjl9j+qBy1MaNz8UxxOAlM4kjbg+jSAiLEYmxjM3yW4tQfEivxa9obVIHOJbhmzaCHSdLz8exvf"
+    "FF3eu2kqP402Pr4zeq8VMxXFfcoDNmfCLcx5Xzdu5D4vM6hvjGANIfsPXhegyWJ38Ssn1gDFUCTk"
+    "BQ33TtANwVust3xCpu+YgvFTOh5QVMfBi94VtrKalnByPNfoktklHGj8xhZLbjV4sbaHMCGHk5wA"
+    "T3WnFYM2963wbawlGb6xcbzwmRtw8+mconxXCLe0ot7rhQXd06fvNLjx6/81+//2N/Re/aPXPN3E"
+    "33q8wAS5Gb8jVk4HOf+eIb/qt/+u4fu3r2TX/p1p3T+9yoHetXF0/1rtzpqZ6q6506ZhKTR8PZN6"
+    "Ei2AKD3YurXkBEZfLwRJV32xDr5PAlRQslNDMxcgPlmSGa5zSTgsbgt5rpI3oKE4kTnfmy1Se4Jk"
+    "h/TTbuONUzonGJYmaj6iw44/N205uLXyfy9jHR+Ft6/7ecTyWOX6ZkCMz9ibXvdtUWEeQEkzx5sS"
+    "qXiIHCPjc47iJMCNaBHvsmWID8ttQuobLAtq6Dl4RUuiUL2ouGfYtIvrEFL3mEV3nohaOBvDeA4E"
+    "2fXrCGvvrClKwXqT4RCtvHSPVggPPlStA2bmKkX9+5Sdn40FPKn57ItefxsFepBkCoyy9iwb0vJ1"
+    "t1W/NOFOq2LSBtXbSxW9sgUryQUG2T2jl3o2vZ0iw/DHySDuPGMpMc2jkOADKWND6GJ4qa6cjKyO"
+    "WYEB+scpFtAdO4ImA9G/so8O67F2vzwOfs0RNd0+4eve713yYH+D+rktXxXuMaVdGwyWwr4v7mBQ"
+    "lKYoudyMdDx+Fm+pGOvPNnn0NFAt2Mu8TSWH1MENvBxCakjFXHXwG52+O14cXOFhP9HB/HJmz7cG"
+    "Ami2IkzdOOuWhbECYvjgUZ0RpD2wvUsuiAZeVN1rTYyOIeCb0Ekrjg5Rh47Ywd/cJoY/MZFFpxaD"
+    "COVcnh0NXxeYyYgYIpHhsv41t2ywkipquBrZT4Yf/EdZzDaYXPFOsTg1u7PrTdVj054+bB3uaYB7"
+    "iKpylBlQX9QbctW1Je5sYbNzpeLT++tI0Set3byHRNlzHHEiFLWmedI0LK3o5uMsNC1eNjHO9YgZ"
+    "0YaBGfBLA3cg6UeOmb5Z3b5kUAZZVRmgpk64nT+OyH5Db7W1BuRWCwACLXC1D9L1+QWuoH7UP9ZV"
+    "vk+Be+HhcYfNmr86JmzJpt37HTOQEeCK6t40igrNxWduNIZ/SCCl5bwaJXzLrivq7tLR4Xkx/7EE"
+    "/KBsF/EOzzHImQw+P4r9Kmwdh1xtPGn7UThDqVN3e/I77DmDZulVQHNvW0qeyTxSJbjc3eokh6FE"
+    "VqnmoLH5NnyexVEBAJPuTmcZDCREbM/XGJBljDUJ2cRJhrG1+jAZPFHADGxJb6/sQCOz/dZDEnD7"
+    "gtvbz63o996hN/8/f+4AvfI6WbfzhO6r7Gst3dfo2K35LiGoz/7c/83Nv/9ce/8M5XLu+84fyW/r"
+    "WAFwi6cDGAdXHxDaMXEvOxF7XXjdnMCt9YM569mPGyb1tQaOjzblgmZS6I+V9qnhK5KAoHKC7s+Y"
+    "fgzIxXT7rSPFGZWGy+uZjTFxNMJCZ7f96ftkVtQy3V+F91MOnEm0LmY6PJxXAIAAy9wOx3CHkair"
+    "4v9OBYzqgSjxX7oxmODrQuHonXMoIghxf6ifeD/FtfdC2OTQd7Cs1sXZC1n5MdYvZlKUBIx5Wx09"
+    "81TUAv2KMgAVrQich8USyjPjRyYxnaKrEBOQtcZ25kiJVXsaKBbPJBfeC7BLzwE72lvlhHxMgLUy"
+    "LmgWUL6IAHPWMYjOK3FgWyS80w/in2xw2QNh/cNi52R3ZuyJZpI2gnB7IgH6CJ346ha3+R0x/zbf"
+    "RAXQ8D8J/56Tg0lnSzEhczX1BpPOgFhfGeuL3oiptxTzaZrUhStuOZYzmiZiDhxY8NiuO/5NUPb4"
+    "R0iwsf785pQfC0/kXByb37GrsWRTu2BGRc5kJamN7ypzY++dMAk1P4+Ib4pCpxmhgm05ACyWPC/Z"
+    "0F6SY3FcxieCXaACiPDWHhJ1tyLJ7A6TfHatLz3rJzDE2RLHIZn1A2Odp45v9ntBzAjpJFAGMHlu"
+    "cPVrlzgMUXACmWYyzgIx81z6/vqmtWRDIC7K/kqdPmMokPKOPjFmN+t8YopjvfgKkYrXmCIL3yey"
+    "7z2d93PYMrITxGzgXTxKBaZ3u/cry153/sLR46GNjp4i9+S+7IWyCdS/LhsouTvu2Wl66PibDNQs"
+    "a5dIOdi2NVCxfQjv+TP/Vvyb6mYVQVb9qZD74+jkmscHwY1fn/hICBCVbmpY+JyDa0jCE0IAsLIZ"
+    "XluNrihZ18x09LWbC8jRJl7LulnfOMwLR9nhiF5YIavFbZN6edWJGo1dFZsh5xiavACzBaHqODgB"
+    "o+tq4oMea6Et+RYctBSh7Id46wOVuMBVnyJSS6HIu9ZviN3RxB4pNl5Yz9U53za+wZ3jLRX8fS3U"
+    "0Gz3vMmpKOB3BTDuXRsT8jUN8qTd8YBbCD5e6xBt0OhO74JG9f0CuGmoyTPtAAf78FaYSdC+ISpv"
+    "7snzG9G6NjA9xQnAe7on5ygY1hIgdcBUqWAD4XgwYyqMU/6l73l5R5haA2hvR8HhsGfvs1vhezen"
+    "XN9zO6x73yv5/iGq2HdUI8uX157/Lq+Id/9YO/886HZ0fPbdaLcFN/pQxwubgpX2UGPvyhT771f/"
+    "zF977z9O6z+lXLfMnltiaIBygX7vwd+VfTmCTMLr6HxqSaviccI1skbjwto3YWccOwP2rrboGLnX"
+    "mq1ztriGmjz0bncBLSlwBycNX2TS8+siFvHWS04Rsv3/zSio7lhM/EYtL7h0fEzA3vtYurZFyA0y"
+    "t4IKXggxdZTsXkRiz8Mt7IdVFgJ8bX8IPFCYQfi8CfE50U8GnpDAZ0vtTrG2rJOYBE5VgdczwcjV"
+    "TEGdkhY0s+OH/OM+qWWjWSvrFUjYfJNbnZ5Uex9yRq/1Ei71NWSzS/qL0FryfPJVe9HUbxi5tjdE"
+    "1Dvsf7Wq4b5FTtITtlkwziTcjXNbc+us3LhpwW8QCOtNtqIEt8Nqja7SqOE7W7+RJ9z7XmdjweFS"
+    "PQZos/WNVmoq3DOLCXvOFUdNDYyt636AVlMDdB2Rh808hZkBwmTd3Q+oPF3LxPUDzFPNcPody/f/"
+    "/omde/+ei8/+hMlzcucIwVvW8fn+132jmKwYdN/siL5xcElTFPK33v2clPLYSy6Nowmlck6jsY+F"
+    "8aPoUwRBjM0eZXwj2WPn5ig2ErPo9kHLjP2x8Dzu07pbLwox879sdKwdpiA2+Hw8MQ5dcLHftqj2"
+    "M/FmxDAuplgZ9FvnCEb1zHAyoLEFYgkhMjH6uMfUN1p0RuNzXg1p/xTcFxU+eY0Bk7toe0zvFXbG"
+    "aN/rTzDpF0R0ceoeG/hWcapLFrEXbNFcr6Q2FXHBM0x5vj5gd3UbUNeBxPvHcEkredsdnKsAd2a4"
+    "w5Ix3GPA3II8d5dSugtp/a/krHvbKkUOSMMzEMPQITpMeLSEZ1fLFbG2A0JtcGBSOx1gputzh+Oh"
+    "Ybe2WaGOHkVdLyZelI7jD/8sSx1aMFFJ04aOKgXgdYCo5Vvc675PsQFxr5b72cOQhj66Bt/1DYOX"
+    "4Y0y45yGOiXtlQO6mblwotfLEbA5KgJjehb7ygxxL5zbyKi+qYXQ9U80c3O9uILlauFeQEwf3Cct"
+    "0QMLayjidOutAYmaElXZtej8soHMSaaOGQ70jURjO6f1gAdpHhg815e8OpYyOlatmHRD/WFg5WY5"
+    "ucTjyjxz1MNJCioE3xWdet+OlmdrbBtUgc5l4SsgSwhR1mmmXUCgbyeoR/fPxtL3zmi+/85fd97O"
+    "0SvXmXbmXuq2twxG7KV5EB3Xw999//3M/96MNHV3/t9unp85dX5z4BnJ+f6e1lfWtOo49nvly89d"
+    "axJxITQrf1vuDHhPh9BK9B7cWY6iwINMRpa5HH/2RjIjD4PSGn9mQXHTnLzhPqPH3L4lCs8H2GGt"
+    "mJjxMWNn2SEKYajgHRftcMSCZuf2GPHu8+uuafnfPuhRap0hw7ZgElLG6TNKRUw18nAPDF7GYN2U"
+    "eGHCGZhRp2kwf8JJfkiwlPvJT9ScbvTko773QKTfKIRT4/FCMF7slSiHdwmsPhuCIlvikeDN/QxS"
+    "wwyzeE6RuDKGy32FinSJG/sWkZPi7pvgVgpxBzlEpJDKJzOPT5chyzUZ/EOQY4oLLGhzUQrsNmj4"
+    "9ps/eNP/Y2klo1Tp4TG2xk6Ddn0Pay6W66PnYmZlcf909ioVWuuM4YMGy11xqyY01+88RTTGhjmr"
+    "FD8Y01TcuboI/D6TuU8P2RZi4i4QtNDRVV2F9++ViS9VeXdSydFKsGBShotbtXNb5YyOCv8B2v+p"
+    "f6shwPH559w1uObp2cCktzQYJZIAyecFGlTLjLZ+aI75UlQ41kc7oJM3SkaZCcU/CALjWoxC63bB"
+    "c7jsPGxrb4Ufc+jqi52ZMwJobtOSQdv3Y5cXP60R1bqlbM0nKe8SNWvQc677zS0ga+tnVMTMUPDj"
+    "Dzg/mStggL0wsz8mYeSFuMYPp/s3EctDUn1JmgHjy2nRwiL1amtelgqCHdnPetCy4JYlM743l8tT"
+    "zxi+1SWTr4QF924dtOjhX++B+EQ+Pio1Jcj4GxY1hsEK9PMvEBX5DzuCQGNkC8o6EyB7T0lWvO5X"
+    "LYdoTDy/qWD8CE5WNGbMFHR/a1cSq8ZCHrODZzMYmP6DAXhifHcqTAqGulHcrEn0MeEqbgd30He/"
+    "Drrw03nsBaZrMZJLMmx+Q94wkw2vFv00k8Maa2ypiNT6Zkh+/8ectuE7beNYdHNsfCAs5b0AamcC"
+    "VSy7n6YAhiqL2Ry3jalK73y4keKHF1+9XDkdjlyTJj2+MJL6IaYXgkTiV5nQDDTb7MZpcY7NfQoq"
+    "k9f3Syy9yondZgql179iMA1uectHx4jfxgw4Io8uc4SzOJzqtK4q5dZQ9/vENHc2LiAps+r31pjx"
+    "oXsDspG7EEsWDVqA4CcFfMECwIDh2VqKfNHv3yTM25zSzRs6ikJ0U5kqMysOgCIDrn757DLaOTDw"
+    "974PuX2mnpuwfHl8d/8f0f+fg7/+DTj99qcze7rzoDXKFuylfMwNXJe37tvd/3s7/y4b9z8uwbv1"
+    "Mf9j3iq3K+OdZ3Xm7xgxzKZD72xFNhDVIN4GNtEtO1VMscFkGaFfQplqEvHpMr3z0LtycRLhK+gR"
+    "Xfn0nmQiRd+APsCeL/Tcc7UrrQVlcqzCH146cvOOr4ZAJvrpTWkW98nMnfc+PJtHQ64f0OVe6CZV"
+    "K+omdw4RLXwhRdN4650BMhkzP26pOp0HgJxwta2sJzTBKA13crefezT3L9kVAAwJ37G9/Qqp+YZF"
+    "+66rKf+CRrQuocDfHwX2XvF/1QE5f7kmMRGnFhkHZ8Up2FBVKhoesYRkY94RWxembCcol8Ormx2j"
+    "SMV8zl78Q2/aAAlxzQr0VoFPurOg8NTJpdcg5UrCKvjtWiS+BewCvgmNxhVkQn6eRTKKO+jyvGJA"
+    "xGLRuM3oBAp1uB8cM48Nwn75v8OuZgaSskdF849CAgfiUTtmahzY5z49g247GRfO7t4f8qSyf5XT"
+    "mzH/gTOhpZoOGiiJ5z8OWj/OPBzfFTzx6dPvWMWCwiUPA08nnBNmsXbH0005/JFI7xqoCa+ETa+W"
+    "IwHKg+2Cq5oKaNDhs3Lik9zupVr7jCxoLtIux0DI0+N+ZUlos/XqRhA74KvJTKQtuX8kOLW0Njgu"
+    "i8K2+n5vGZH6F5bNsvidqaakkpVZIQiH4L2PR4AgIUHjCp7VwyVqJrmto8RuKczEczpTy4Ey99ZK"
+    "TrtZRylRv6LFQaJzIkCh6bdYyV+D1ORwZJmoJ0jvE/uc4lunk13iyCON5WH13aqw+O+h7jXKNGFs"
+    "xuIi15ido/dFZeyI02HwF2ryFvXli2peZhITdGQLK3G4dAHJf4ir/js3SgUchbcklPaCNjhwa7sk"
+    "iY5AZ64XQue34AgJiBaEjOlO4U88iYYnvIlz+1HdtoucbSx8f6SZ8AqFvoaAPXr9BDJd8xxH6ZdG"
+    "cn3YQMFAi7pgHp74v71ROj2Euv+RilV18z4m8xi+85uQvwIHfOUY/wxEtusI+9MV7fkrft2MeW9I"
+    "WTTXq6z4ht9KEjxa75AV19Kgp21Ee/uTVdIr6OqxbXpOhIPn8oW892JGMLxlsCxobesRbD4stP7V"
+    "3q/3RdNU/Ws7uRto0RxC9ezEl8GMXEtMujH9rZWi0OQDxW5xB1P5gLG7+rh7mxtzNtHJng6zAtls"
+    "OXycuBJWOAk3sJ66iLlxxFXlaTHOca7nNPTq6ev7o4/vFf+e0P/SW9tXG3dm7qr5yB7ah8ZdlvWY"
+    "lXHp+9/u//k1/8iYdH9//9i+PjZxjLDF7//onaXNQZt34/Drqeup/qAq5vwnlhd4ubXm0sfljAbS"
+    "etLGq6KOLkclu/+oM+hcUWk6XyPcFCYzHDvzVgovDnWcG9jl7gdcLhF8ULtzTc71P0qDK99ie76X"
+    "PiBEB/ULJTl4u8bFDAiQ2QOLXbCTXpU/hOG4vELAZXPMLuItW+SBI55NdNp2R4ckMfa7nR4Fcr8U"
+    "uLauXpQjV0L4yRsq/xzW31/RTYyKIPS90U83UyAUMx4XUWcclHcg8Gpx4Vm8hHCpobct98IOSLhE"
+    "U3e74IIecXQOMKuNpKMM7kVo4kj/C9be7bn9GNjwmMPf2FCfDYtQ3t6jf18jvqYlaKGiIyoZEBt+"
+    "vO2A/XZtwMfuIynH0nnzt4MWp7MjswaNSZkIwBlQukNvjeExcOeYtaujk+jA9+hIiCPDjBwhco6u"
+    "ObCscsbfXDMn3tLLcx7IdEm0PqIKHR2FUzVzQnOBdQvHBHAjPHd47uPXi9fkjpjg41xwy65rxEbS"
+    "4Ea6JHJM1ZggFk88n+g9GX9KFlPqWNDxS0gtVMDNQGF4LwV2xRimkQxKs/+JxzysxT7HqzuYMdsi"
+    "l2Nk3HoX7LyDgmaE6Kzp3OQupL/a++vONDvqTL6UMn40s+4MA6zP3Qc3wBUjy8MySe46qfOscAQf"
+    "H8Rc0yktULmn/9kp540JwC+eUbeXVYQAZCOuQNW5alHfdsY+UtdHiWNaA66I6eejBN04BxXXv0ew"
+    "xxBjFq66tFfPjthSO1+rZl7Mg2B3CcQ9U+FKPPOXmfu3Em1zKZWpgjv8ZDnJE3HEj2eWGVghxbMx"
+    "aaRzhcb2i0VB6Sc+hI4AahdiuNndk+AAAgAElEQVRfDEsQ7/hDn/iK7Rre4rfROn6+Gh+kFOfQfn"
+    "AUwUenvNiO/hDFwh/75BxgHnsQoade4aNmNrvDYtyBXTZHxGTtogrmpp852CyMQu1aQ7RN/NDoHl"
+    "/tPcq4kmM79uzjYGWMvRoOveQovOKAHlXGZfLqXKmdRQzyA76U1CcZsm+Odg0dyvJBItwrkWdi4B"
+    "UeWiJSpGh6esYb1LJVR2/zH/0xis9IUGNriu3CMWnoVNPE/9G0hlXLW8E4mqW0gx8/YyxSW9zGLQ"
+    "Z2jEsMhIvvWx0E7fUwre5WLjUSAojaYE1HHPDyQ27Y4V978S8LYKClBn/cE/varvmvts7ER7fuHr"
+    "/tdz/zhb/xwY9/4TuwcFO+ugxwBr0pXyYDPJ19fPH43v/wT37hB9/7sS+84/bpU6/jhkurDA9Ivv"
+    "LCO0eZnB6banOzwSBlr1qVB7VHv0nhi9FFVxZ5+fcC4HMB7mRB1wsWyRtbNROjMm5LBz3afPzT77"
+    "RJjz4O+KI7NxvQuC+oJ1mQ5aLviS+5fpQRGU861fYDv/RiwWNMTUreZUh8QTQes3V04OGGi93hJg"
+    "QH8EM1/uCjbxwSO9hsXvANFn0vYucfoyvz9gUZCn6RcyzrCLm2WU4UY586tqkhQpjjox7F/ooIDp"
+    "gp8TFdtUUEh1iNI984aTknaKlvIeRo0NefR0aUDWt587CELZjZWwzfF9Us79DbF9vbEbrwLymo7a"
+    "VGp5v5gvTYaLIk1mbNIWcd+xp/q5N87mzY8VzooJovwJC1V9tzqSoj78FJWyU5SZscrjjFdwagWV"
+    "DHXvWygR3Glgr8boYdHGTBo+5mBSHZS/joSgZfU9Sma2ui4Ad8yojYB3fwScTKaEW2XtLhHbo7d5"
+    "4+unPvGdHHV2TU7AOI6OpBh+f3xDqmNpfGvp3IDleycc7AB3kyNe7iM1rI2IYq+gdIQyjdvluAvK"
+    "GYEpKRPP4HVfZyHrSUhEZ1y1cB4EwwyByMbcHa06lp+9yjc9S5z0Veca0Ycl5iHuY8NdoKMfGD79"
+    "h35y/c4JMAvJPqfxMTizmHwlQhOs4p+MZ5qg+RwOJhXt4nTE5ZyOX8A+Zs0vXCEyTHqppzhx/cRQ"
+    "YrzpkeYGUOiO4X52/0UXUkok4brDmXFtcx2mMJqc7CMr5nrMaHyJGhxoY8RXz7ErnOjaFe423XPp"
+    "AcGhDVN5YJa0cE2DQLE/NCf3/eKlbtW37UaGcMgoRnqcGiJFduehcsW90RpYn9qCw6Ut3Kc9/qCG"
+    "82cnyyr1L8Am7AF74AhgR3X5YIRDrd2nf9ZZQtHl5yGXVUXOw3reTdsSiwlatINaHXVcpVeAtoZN"
+    "I/pMLCeYosTAIz7oZq2uZLqJPzASsmubRdJ1U6k1zOLLVSe/B4eBakPX8skKLRK7d1fXCNTcOwS1"
+    "k+iBS73QvBzciOe1IKn779MoxQNoEAI2bV6NOuTOudpfE+qsEFszrkJzzvaQ/PWHueQDk2JkmpD8"
+    "XmcNmH2D9Ucr7QBVp6yPsYQ2BTsV/G5PoXfhZr9ILXcUEXXu5XBwstAV+cn917fHbxI7/1bz/yjo"
+    "evHD0H9k35yhnIncRXlvuWkugw5t8RfOaTn/m2/+lfvO9vHD/93Pffunt6fD6z5pbenvNNvQYfDy"
+    "98ktHFFV1OAFlwccORfsY7nfAsiKwnBu/qCUH6638ggSLeegolVW5S/RRcg56TV26I8UPoGGYuzI"
+    "0s9qHnB0LA9nS0kFBUbwVZij+6yRMUMOwqRnVTyKJVNN49zII1NjELLj7ybggx0mehSm2XVBNXCu"
+    "1p7mLzYtT4/LrnYEnuUh8xSw6cXev6hkqLVnB0X7bixnffENlWfjDF/8TScfDuaHxDwS4kNOPjUW"
+    "jDGxcdAPpuRN9ymLXxCOKzbQsFvo+Z4rOe7Sj+Klo3cQnkgG7fJkHi0N1suxvMQmH3erHejmiN2s"
+    "FPFon2V7pW3zQQy3gMAG2/W+FufIZWp2OeC8mGwYGJX4Bz0q8dujsMtclWXQCDjf5QUy91Nca/yk"
+    "rcmIz55cHgiOM5iM0WWo3dGGQXm+Nz/MZMdOybdJBxaSwwoOmvOsYYWetLlsUZoiyqfLNhHHG1mE"
+    "P/3jPPa26dJMcJL5a1uPC/NpAus+hYj9Prk0i7dqjxb3yEi2vu0k4nffy126b7/gdAygi4QgXSkK"
+    "mtODTayPmBhM9Doy7aq+eFDJIECkA4sCvG5pmsHp45Gha1fLSSRZmMsDHnbUt62EUHWfPd2+ICGp"
+    "4XB7LleMG0IjhjZ5Zd/kgsLiKLPcXD96Mjl8XhE+FxBHh7laViNhZ2WQTySIlPw14xDoXDaan+Xq"
+    "ofOfE5N0nGpy0fUwzzPTl4+L3b8AUZeOApB+PF0HgIBkc8cZac9dQn6cSkjdN9bqr4asCOvg6M+G"
+    "6LNzV6fmClc3/+p6pNrV2PDYQcI/KmzeMBf+IbnvByETxtrPj6Nf7DcywS67XITltJRPQcFzXKQh"
+    "l8wovPsQLZJO3DM8jItJ3aUGru/SMPay4fiG/SkMG2nBrO8fQ3X5nj9SVA8cva0UFgs45lkNcrWp"
+    "E3GNwYtiYcEFJWFCWEJ3k/1FljIFaq44ROLgWOgdh3vaBM23pbqzHl+DRHUOOZ/ZU2xTJp0clGf2"
+    "xhvq5EG5nwIybffH0/jGEPhTiZYCxax7ZnzAXM/IVg17SLi6PjyjtnNVCLiJ84umX8UD9OOyyndC"
+    "muBvNaoGB4g7H563G1ZMe18c9Wd3r4Yn+W/DVnB9r2KoOIlAYyGRrMHK8IihQ5yRq1dol8zPh8T2"
+    "d4aOY+LBjYwLZtIePzmOTH+C1OfDqmA+dzjk+Gkrt7/ORtn/2TL/3tFz79ef6NwU35KjKgaX5Trm"
+    "dgxhpz7P7Pvee3fuhjn334l89PTp969OSxaPzIgn5+x09XeTeLy3MK35ljoFIx0H0jIhDwvBhjEj"
+    "H7mCASYhGCkSzOotuPiHkSSO5EP5bA1PNTZ9niwucFlL63h50u+ODjCfi+EKvGpk9sEmTBBSav2j"
+    "eAvYvPRNF3DUOWn44vGalP6KOLfYHZXvyQn7pZ7Y0GWviCHrmgXR741h+c+kyNiyxs8cULRWIBLD"
+    "vdBLN4ZLGq74ZwgveND/7gkDbsGTe3XshSEr9gsEEmJOOTp/o9kbU2jrWsiHR71iVuijGN415opr"
+    "s5YtEthm0Sy8RjKIuIJiz6ZhVydWCRi8MNsUWz2fhm+sibTBRzw1UeiJhsvOCkHw3607IN5CvQfF"
+    "cmMMmrdSAMWGSDZLk0cfwANyrMGfmxcl4fwMOD0cEVSIoJCUuNv11YFC/jWDeM8qe+gPNapflA16"
+    "UJGUL0N136C3PlS8Jzw2q+PLWPovEjQyen9/SPxO87PfZRTCJehebu3LLZiIzt1ZZdMYCUkhtYhl"
+    "i+jX0xmGM8mGHO5tihaxDpy7+9H6Xb7IBaSpJxJartEAVxw9OJkpi8UKofyNGel6Qsuz8WnF99Yf"
+    "JDE/S5OZ4NvdFXgvzKuZbvu7HAYnmVWHnvzN+BUx8aLxtbfSKVvD6jiV74Xh5Ffr6zd0s8vwtn18"
+    "HgTMvHwLOxGL2Qw+mplh8580iL7+FJ+kKnelvTMfU/H+B8LShoPodxU6NcS3Xy2mMyowL+juc2Hg"
+    "BOjU0Blo6X3fJFP2cU4TCk02OPfWRFSo1IbQmfY8NDQONp1zmEPdpW5ZzKWOl4mRpdXqZH1PKQes"
+    "7vIg6s7VwiYcvreiesRR97C6S82msMS04El53xkkSnCfao70Trd/V2SpIC3nNQtfWNBJ7kLMoO3Z"
+    "3vo4etbD0mkRM7qsihC5lCXoZjmyLZhJnLCoKhiJmxjOocIzssPYksXcT3gScoYwQJRwN5ICed5Y"
+    "8tAZo4e5xGa6pBs15Iyfl23UWCDXcw6U3jkr7jVx0U9afs3I2cZKK3+beXpd38ub0QhVxwAPZl6K"
+    "7KUydxhlDyHgTfXCyL3R0oCg6MnNGGt0PZCfc44t9qIyqZakR8M+A+TG32s0lFTdtSHIBqrmMn+R"
+    "wfCYwvZLRyQFCSyzG0A01MyG8avR4jlutDeGBwHeJeGFPWkQznpFM9TDo/u/x33/vBj/zkS4+P3h"
+    "irN/v/pwzc/Czol8/O8Uc/+kff8dO/+Js/cnbvwZ/Vk9bb/NuME+2OOSvqYpZ3BtT2AMwA5r0kPx"
+    "FTzdNfhnsHKZ8fPnt85guZhAThq7E9YALxf9Vu8w6ZtPwjKbpI7mUAAy+FSSAbLJSk65sBLr5zk8"
+    "ZEgcfFEuzrJzJ8YmJ1ccSZ3vKZjdLBVvSgM/2wbY+ZeZZblW8mQkpecpOAFjLxujWT2zcxYfpjoq"
+    "f6LxD+qCfYWJaOF6TYNkx8wT7/FoKPSZ2f6R8y382NROIEMDad9fHztt5NFUxyQFxs3ICMdLxzNz"
+    "sROAZbmfyZRHswJi7nWsTm2bWUmz9D7fni1UtsMAx83OhgQ0zzbQgi9vb+hFa79Gh7MYwsBORF44"
+    "UfAMYvUcaXWAlu7Tk32mHaOkoT7c18Ool1T8eoinVlc9kImfHuYuBYxl/Ggkk2jAT42NzySd8xDB"
+    "2pg+Mz0L0hpGt55gKIGOB4F9N8W0pO7ICIKvFJ8takCga80Qg23bHrAJyg5IYHDIThGDY1TZ7MR7"
+    "4v94zenTs6uSvRROKbWuOhONjyiyZ2uKWG4T4k/NK2LpRw8oeGXTMcfkHX5ib1CEALYhYEyLmAO0"
+    "03UNyVHhufDXageajDMgp72mPLWIxBLA0O4Gx0HWMHmYh+YuvTq5iIAMJygplPGwpjJu0T3u+8PD"
+    "/X6etSFzOEZtOzX5lk6jPBJC8Fm9TQ9H9vk3W9D6q3wfSv3DjIal/qVKpbC/UlrIODezn+FxIyoN"
+    "CZr/EDSPnOtcBxGDIx2BZei4aY0tEl460Lzt2oCVNgJ46vxwBw4DUuNH4ZF/5IlGnbcck5+UIPvU"
+    "S74sFgzDil2JRRp0itHIMIeI4MTZV51BSF4URI031njJDokncDEo8JIirpUULRMsiaSw1tCnRFYj"
+    "njwydvO5n9wg1R/RkEEWYJ+S+o8+e8kxNlWazMh7hif4gGBjCppp0DHvr4YP3Cj1MoDT14MwdFj9"
+    "8757GBsP5cYM1YXrRhZShaQBR8DMOq285qdn8EqoF0YkWYjRwYaZmMvyKaJy6+yG/kbHASYkzwpw"
+    "/bmBakHauRa596SuUQUNliix40fKUgamptjc5UkTFPFP/J38qOblAs6t3KneNbQmMoyLZbI67ZzR"
+    "io/wOZ+5IQJ1uxM3xoOSOMCSMNk8qqo19s1fEzcyjWI7zClcA+1iDGVm1iN21xez2N4O7wDfrY7j"
+    "1ovJ29eRFYTeclYG7aYVkbnH1coDTva85JKbLobGDERM+nCRrqc51Y5w3wxaS60gJOU1l8MLT5/w"
+    "lfve7TX3z4o7/x/o/+0l/9wT/3S5I4k+hN+TIZuFnQfZnEPH7l4t5/+Y//2Y994qWzHz0+efoBN2"
+    "P5yGGmM8+GO6o9fD0oO3hVm5iByaC/rQs07zr1qaSHMINW9jPOc0POhZpfnPSJpZNJMujxVB0NJo"
+    "MXcdJnwYesn3D4godNXOPiEz2cAYqPTuYmQm2wdB8ALjcNvpjKE76Thj/cTNg368qeqNj2BOVqus"
+    "rmJDzwUkRvfGDglArvQLZNXmI7NGLw9+Yk24sA/P5DYd/cSIeMccOIz32y05MsH0+zhHhg4PV6ku"
+    "y+3FpnF0Hhl3x2XOJv0YCSEn+3funU9XPCU1/xS3RJT8O4CPG3mMjpRcpkeysZRyzSv1yxT8Szk2"
+    "le0UETm87AOFd+VMSl4Wrs5O7BKQlD51flKjYigwr9bQwGZixJLb7jAwUf2Gf8uBM8yTHW7SgS6N"
+    "kxfIoW0iu+ulgFQw1R4uTUPXSNY4Hspl+s2unRrjX0aVMbK9qvwmMeWHB8ro5xtMMcY4wXONzIcs"
+    "Mv4nx37p6+O/dAPuddc/i+KWVOgoksmlYOxnJFDdsxYWsxr/dlH2PHGxL2SrIsSpjjKdhQNto1ke"
+    "wUc2mGQ4D+08AFa2xncQkIeNALKP38+cbb00+2zdXOiz9BMQ0QyFiIbea41mz6pPvlY528nuhd+z"
+    "NRHum897IG4UuC+ROdF17UiHwowFfEf1lzkI9SnOsYnCtGLZ9kXaklr8oLST8Vuq59VyeS0Zrw6u"
+    "Ty+PJUdu/J/NMalve1Pacx/oxWi/pnt0f3pHdXH528K69PFNfTeOtzpD9lwXkVA9qkaGNyhgd/nI"
+    "8udX55IieOJaNehqdzprazxXlccUtXh8U0/5y38yeL0k8e5LEc93BmDccPwDTHIuacP8dj5Mgic9"
+    "XF8ZMMlZLC0b6ebDyzJCfEJZWGZPOnbvU4nmo7rhFHDbaKMez4ENHnfGOaBVY71tDIuBwT8VmDxH"
+    "ak4geaxDQ5YMxn3NeNIFnDekPHLE5RpGM79UO9rYAXmZL3XNobjtr4oT/LNA/qOPaRjYhBJ1USwA"
+    "gVhsnJOqaheX4hIhYlfRGk11zUP6KhQB/xkVGeNI56niBPxkG4wLQpGsf4Yj48ZKGzC2MaZg0ZBq"
+    "VWW4eKYj3qMSpnQNN1TEHZI6z2+GOfJYs5eDSzU23a0ojLsO0BY4pSf92RSoCMM2zLyx61xRcu2J"
+    "M/YJCRojEMO7HWBdFwO55SD5x0RmtHLDPSwCVf9sLEjicr2ZX4uMytIBDXSwxIy0frSBs6IIw5te"
+    "D7fsv60YNNiQ9qIEpxTPZOPGTDoNIwm3gjhzjnr4xbn+VHn/Ofzpniw7NZ7fiqExeoJ6LpdXz74u"
+    "j7fuMjv/eT3/0db/34n37L/ReEwDPDm/IaGbhZ0L1GUhgvv/aBD73tX/7WC3/z+N7z33n7FksfBt"
+    "cseHQX0cVRRmFAMjnU9h1LaF3AeTHixRczQbxVMZG46OYCFbndBLGwxHWS9xNiBrn0/bRTMPhkHd"
+    "WcHCjgefLajjoqmXC0mVjR9xN1OmzoE1eU0QidGy9sG2PDxqYLtvTizyqqYhuNFGQPTxbEmxsbTM"
+    "Pjx1x4t1Ad/lSo42uv+80l9bEOiR+tW4ZFm55/8xGpcYWY7BdOiZYTBhRhTh8aXnKKwVbyoIrjJ6"
+    "JlLaG28jBN+5d84mewXccQexVyVh/CHbJx2zYHJ+yvqWsHDizq5EJ4E6+J+C9m4lxqjnXrHbaWTw"
+    "UXu7E4B9f6vrFElmhwRrUXc5y1TY++dcmhRSzomwdTtGuuR2LiMJxxoJsXIytu4FZ8kwz6PkTg6h"
+    "Xd+EM7bmrv/Bg1FxTARDPFSkFe8uTW43qh2LoDF4mHIChHBjDgckxiC5v1V/SJBTTofliii9WD59"
+    "94dOv01PnBf+dGQoyYpNAawcK56Q4MlX04VxJyzCJANOg31wYYJdN3fJPtuy6o+CmBmrHb6kBxWz"
+    "telDVGsM3gQ8tOj6wlyVNisT4X7YIjLmJv5ju3wbXI1dVjNR6K/lC3lV/UtHtR/v2xFmqfvn169E"
+    "d3T27/0d07J5+9c3L84p2T21+6e3ry0snJ8SOdy54I41znkCc6Tg/lmB2Qvu4I+Ig2RQssn/Q4/2"
+    "jxpgWdAmQVdktnj2N9FPZED91On5xf3Dm/uLx3cX7x4MnZk2fPnzx5/tHV0RtefuXxGx89evyms/"
+    "OLN2np9QYt8J47O7t6oHCe0aOqpxTkM/qlE50r9EvFWuhxynBuNKb4+LjtkxDni/GkrLLpunDBYk"
+    "8KyXm9RTRjLt6PvNiMxXzKgMXg5I4onWidW2VP8Xmuoott28W2mhzNaapDjxK7adOlj3DoFhvZXi"
+    "cs4UAHczCKXyz6psEXLnp8D90TedmJDHvLs1OLKekx7dxN7NVBhIPcGHhSwXhTnxd2KL1xjAXJw6"
+    "iOuNYHE8Yo2Ty6agQrfm++GVi7QNUlQ0McHCkD4AoyXYPSNo8bW+xqW3KWWi5yzg0udOSmBsuI5c"
+    "rTqJoTalxhMUefYhHZW3mD6ABgEu2uAFjejjwopjTXsT33BrK2qRWxHqBWWnzeZDcjSFhj74OJoo"
+    "rm81GFYjyoohmPHe1lK9grQnQpEgNrM0M7x8WxaVxUJ2bwmXzau8WLGRs0pvFiIb5e88NCaHvcgi"
+    "XdDM5gD4nxshbjtbkDbxjWt71iEVccODjWuDgMYOBRUyJHJ4qOczCGZLnI6p7LeqNs/WGLZBM6Vw"
+    "UjRwEozo/nuucjp9zPeY7rVOd/zYOSdI415nmX7uj2pX4U5eSv/PJvf/jX/5O3vP3TUn95LNxU1z"
+    "Jws6C7lhCNoKMvvXRx8g/++S/81Uend75fn4G8d+tSH+3jYquB52HLwFObRQj/koDB6Xee1OZ+wd"
+    "/H0Cj3Rc/4nHgY3DxW3QZ+JxQna3+0kos6F3CV8nrCYCIxcToxJOG55Y/cSD5PQJgqc5IzxliLIh"
+    "z7wc1FFmQ5STkuyXgiy9GgVDe++ObUs1PAKkzCFus5LHSD09ixc10W+cRBvMSk6arvCvJ9RPSUDp"
+    "UsntG1We3ql//ZOFdZFX7tzvlzdPgqPG28G+r/C4iW/rgB4vRMVLGtpmiOCwfMQ9/CqUVGA9DU8R"
+    "UqJ2C08HcdK7XjVeDGRRBSwAO/hTyoDc05KX1XW37k8CMfwcUfZ5pwcOegoGNMqMQGX1WsQcqFCF"
+    "fM5oYMHJfVwJz5yCAQ3JycI2uydvErNz5bPJjVwR/34nGdBdL4yMiATeA3XWzxQuB6kaCvd8gRB7"
+    "6/Zhm6A0x+nZPBTA7AityyVf7CxBcVLugKsMfUN9P4DX68jxw9Ls7Q4aNLRBqnjMk7Tz04Or57T1"
+    "icRIQne0k/x5PsDJ4guiAMiOiStS/4SEMkzGTR7YyZTquWsY5e5MFuXiMBJVSwaKkg36a6zgD2aI"
+    "9CbAzW+MKMsD9oJLwoaZ/8SlmyPnPolKdZCtqF7uu/IKTP6WPUnzy5fevjp7dv/+7d27c/8tTpnT"
+    "98+t7pi8/cv/PSvadOXrlz5/RM28MTfSgS+99g+RpuCuTsxfld/aLv3SdPzk/Pnjw5PT+/eEqLvf"
+    "sPX3743MOXX/62l1959B2PHj/6M2cXV297fH753aq//ezy6FkFrFPY6e1Tvu8rr48VLOd43ovzeN"
+    "LiT5810LmKa8spJxTfuPHuZvLOUoRMKVX+U9xq+6O6YvD9Qvg+LhIgoejx8nl0pQk91k9GdeqiQz"
+    "OYJrobJe/lB4rGVBPMUMxtJ7XlbEb+SANZxpIxZxfl0Pb+eMyJ4KLYicvjNvpWs+/pO9KKU7stqu"
+    "vcZNoH5ROStcS0HjYclxtuO74lCL2hSdPGQwPTYqLFViQ948SwnZG3fVF4ORmq0bbMtIOavdVGd0"
+    "+PBe2VD86m4KZgUArTdVXWJjH2RvQan+MDKT6N0tB2Ae6DXcixp3jwQcV9NYl3uTjSqQ6sLE7j8T"
+    "EoznCjwV7o+qu/ZtfPkU0uNn9WUDufgpRjYH+raws7XRlzHI5qy3mOHzkb2ThoWaCY0ylirCQIae"
+    "T2mQ4+1wr0rB0c2hD0lzE0/QDHNkzLiShw44Nj4giqrbOAXnONwTVkVYHbvNOHbra4qx6ZHN/koL"
+    "KNzf6hK3/tA1gudU4dzWWsgptrXexz3wythR8XJOz16RZ89W9FXJ2cHt/+nt/51Of/ww/9wYsf+L"
+    "7veP5D0pH0TbmegZsFnTKyn6Rn54+Pfvrd/8cPvPff/P5/fPnMW17Puz4ad5JhQGoMMeDYuGnT6N"
+    "Sj3fnhDnFZXDB0PZap02ZeM/C9BlIdehYqDGjsn+qJvd8Zom8Z6DzJ0MWevnGRTD8/niKfZHM/kY"
+    "LNBMsPtuAKN5/8uEgWcZoJ0iEOMG1fsiyc0Ilta0lTcvjOS7UXWyE4BnIANjj+cRj6ujHhJtuLM3"
+    "h1TnXf2egCL/9yIP+bpDnhqQ0B8fFWzNsveeJi/2RD9z38dDg/UKN7ZOect+n9kSfJ4D16t1hw5w"
+    "G8eTCIj0Jl1xx32tw05Xyc/BFXhCJvPZNsAZTgNUZjwyNp0uYmTYDruIpuTICQkR7SFOdJ+rz4i6"
+    "9DrxB8bb3RKdkAAVl47g7N/HFrtd2wC9OSWWHnOOAA46R9egCQl7Sbx3V8mRRy3D6Nj/CChE5ia5"
+    "zGkrDldQxcpLfkfSOmHgTyNPWygUJMWnW7YUJcDMeSueJ8RSq5Uzt2tvxjwzqWs1dpQR5dxyw55u"
+    "Nx59CI2j3vJOw76aUVAHdPjp56+nWa1JrryleOtRjGUJ2/8cAK5vm47H2gLZ08pNAEcFcEcFBzU7"
+    "tpy10ft9SZs4lXdPsaHe0tBwzKVle814819MWTsfKhkkadACxAhOmTZz0Vu7p6oh+OeiTuQ33y+r"
+    "M6pp++fXL8KS3cPv70vXu/+8xTd194+v7J556+99RLeuft0emp3m3TMxsh6iOU/18WFmKnj++w6d"
+    "/c6vOWFAbtU66vnnzo4vzx3cePXnn68aOHb3n06OHbXnr40l949MqX3vbo8St/+tHjJ9/58Pzq6f"
+    "Oro7s6I925uLp9m++98ZHbyyv96NWVYPQ/Cc/5VV/NhWMWeeYpy+RfRmZmqS8Zxg5jUFnNck8CHG"
+    "4J+rokHQ6rx40PgPiIjAztjD1aQ6eejutISAdb4eGDH6CI0Bu4Hnt8jDpGGJv4jRxUa7o2lpzjdJ"
+    "GhB7hwLZe4/IBCtqyrHX5TuIa11K778NE3VK5jfgfYEeVmtnLJV/1CJ34SIf76Xeexh7r9sm/A84"
+    "odavxKf3ycuBycdQfT2OgFaO2RMYgaZtcCfW2Sj2zkUC9l0UcGSy7kksbeVhMoGrylu8REkYzpow"
+    "dEAqy0KQvXbO+YBvHqANtOjM5USFWm9ZJwHhqdqPUZgRG2yFJQo76KwWt5gcs1MLWjcFuS1JTqqz"
+    "lZGxJ+RijHRwJcjwSScYpy7CG3nyM1HFNwsTwOidjzrXFNl4awMceY9pxlckzhHN+s2CdB0V80dF"
+    "2C4aMxMmAC7B/r42xRUajq2Bbnat9B2QXHCGRTYz/1nTYKcyqR6JpDzp0QGDoXdR5ZFExEYtBxSb"
+    "N9QHjnzfeOxMe1VMVazptQnwwAACAASURBVIWwNZfyyFyyusl+dHH2rEjveN8HP/5bf+Etb/+Ebp"
+    "e/aKWb3UEGbhZ0u3Qw/D7z2Ref+0f/63t+/PLBm/49LZru8g4QI80fj9FAPNb/QWP4MUi5oOaJqx"
+    "YY+u4Zwz2TToICywDOBUXrCs8Sf+eLEa3N94QM+ox7L0L8nTgRvFjSYN9/744bbF69sHmCMckwNz"
+    "hdtPGRUGieLBLAX4onMV7Wruhuasev73nxyEeU7FYmJjT8ybsKXIhZ5ObjkV2UGVxK6OEQF3Rs1B"
+    "/irQ/4T5vt5DRDMD+IovzqhsbvuO2+bwhGcLLQw8YtfkRFL3zDH/9fqtucAuizR4bvnigPtsVJKP"
+    "HYxxwg3MJhHwsfB8lyonGBpw15i9EVn44XmrJLuJQ9P/jxQdrOBYIci1KjNCc5MBOULxicz8ENDp"
+    "K1Qmva6LTYQcbe+Ff6a9QeE3hr9Q0X5fQ2XPqbD4DBg5oxAwUBLlJclHyxUt84VZSfvAtmmtQhG2"
+    "XqImY8Zry67fjUx4Q2j0ubg5a8NRfJaQCRrZ/NNXlnLOhA6PjhA5o0LKwduma4fR0fPLuDjkrHtj"
+    "vCip3wMpCgTN+Vxtf5hf/v3N37T4uTuZP5IAEfcJyRlnJJvVzbwWQcN/fctIdJPIwsbjZMgmwA7c"
+    "AbMEuvA2DvxYOJtxmbvpcgJjW2CzjAyCuHMkDEwKJjde3GxIDGR9HOpPFQQek7bkcv3D05/ujTd0"
+    "8+9uD+vU/cv3v66Xv37vzhM/ef+sLdO3ce3jm+9UjKT7SxgPv/Q+EykHf59ITptu4w7p8+fXT/wf"
+    "OfVNgfuHzy6P75k5ff9OTxF7/97JXP/5knL734XY9fefl7zs/Ovufx2eVb9Dsuz56d37p9qZ9yee"
+    "XivhZwD46+eHVP37W7p7OaMqzz4rn+cfqFFnl8YeRC45dDwPHl9MRR8FARjesQ9HxygY96KtsaDD"
+    "zM6vWEMcJRhtVx1za4HEDOuwDlo/gcf+jsYneatl2aOvxZ//9m702fNcuuMr9z5zHz5lRZlVWUSk"
+    "ilAQmBEEjCQQvE2HTjsNufOqL/Gv4Bf3aEHWGHhwgTbmxowKYBi9AMAgkNqJBUKqkG1Zw15XDzzv"
+    "f183uetc57bkqEu8PGhsrc977n7L2GZ629z9r7nH3GLEoeGqAOyuTHPiG6oa2pnDHwDZtw4kP8RH"
+    "ee0BxxImp969kRmTSGxt2E66hMG6mWZb3IwtBewoVST4VwSwRMsMhjB7S6FSxjP0al2KWIDpL511"
+    "pA1iMbjrGVnac4V9qNkfUoBDCg6GnfQ+o7DNhOPT4gQxvYl6kN2sW+WFVZSwRntK9iycXJyM6XOB"
+    "HQaCfv+qE6CjZ2+CYr6/Gl1i077h8c4zBHkPgCLj65FWFWDEz8NO6oFhkXjVURo3z7CY+8r6iN4q"
+    "JUm7htZNLy5ahdEKX+XZkxFqVnGAmxtbOdkVW+29a+xMnp/iwUyYpvlLLn9o/RtEnRp3WwM7YYXU"
+    "yMZpRB3bEYI16O/iDLMUzh5ng0+m5vdDUm0IVZUA23mctgq4+5rskD4/Gm8KopSwcl7IGTfE4Yc1"
+    "xW7S49VEuy8rELdXN56ZEXX37lXz753Kt/8cF3X/2aAe8vzrTAPT+howPNO8jx2r///Fd+6vm3Zr"
+    "+xdmHp/IleZ50eMZchYCkRlJy48IE9B4xqVgKctSc7WiNDZ8EGea62IeP7hHVwCU8Mv37fz4ChrX"
+    "9seCICn6R1vwESCz4LKzId0HkDieDOCYZk6Ijotk0J01GgscNunxCRCyOm/aM+7A2FAzSXwn3lzR"
+    "MiUKzgg3j7I4pxmeQJzB2V+kGvvWpKIijlWSJRxOMgJG0oTHxFi2fh9Ecb+MqfdHhDqP0EVInXkX"
+    "PJnpeAM5nzczLc0iohasdBjbeDjoaoA7tsPgKMeg5WkaIm2TYI8eKaY96s1PU3T74gCAgr/VxkG2"
+    "HJox10cbCNAAsJeeASzfLIAkCCpz8feFG2fMvFRtuLcYSS2D4tb0rpQgtCS2adGJR3cS8+nRUxDb"
+    "fjJ37HhDE7Xz4jZR+QR1BtVR57exoHOvW2rxjDs/htHehnkvi2k5iwz/AlN+JZ3k5EUwyjWmaCZz"
+    "oiiR+t4h509QnHWrxBJGx2VojZZ6taJ1SVleJy/KmCdKQlTGIAD7wUhmUBpFIk2kj59c1zem5I35"
+    "2zsbAQjhRo2U4VUjgktcKQuCUafCRLHxnT5QXKlOvIyWJeIIKXSYZtcZDLTssg6vrgOwXrFlDV1n"
+    "YEB2rHpdpQlme3dcb2TfXY762vLP2Nbpn8+s659afOb62/vLmx9vrG2tqhbq9knsLkrUGV/aeeaI"
+    "llTUz1TN/yyo3V5a1XV9YufHtr+8rKcHl3czi88c6jvVs/ebp34+NLezc+cnBr/9r+3u3ze7dvnr"
+    "9zeH04N1sd9vW+lYPlc8ON3ZVhZeP8cKAreHq1yzCsrApb4yUmlFgrmr2NvIkYjRj/mMRoW2U0YO"
+    "xisp+Eam9nxlZvUylX5ElXm4J4JnYUD4QEwzegTN4TU3MMtnmFmcOOSACNfyfBxJMUYxMaAjAdYa"
+    "NPSIHpExUdoFG1q5DsB7S20Xkqd1eyvHHmjDmswTA4Z1bO0IVP29gWZUT5Fc+aWowmlB/7LljFsD"
+    "h5K0TdbdfYBek+NNVpA4Yqo5ZtB2K89ebjwOiibeYkkbIT+4JRyniTrRCKl10hFCb+oO72sGZXR1"
+    "T/a6u23ghV0qPrHuFaMc1oXuQwR7zwX61kJLipWwOPgJK1cDOiJ1riruWQqVreJW45j7OYlXxEBa"
+    "uMZbUY26D8B9Y8VtLygB7a3M/oRxXhKBmXkhhnvBPGeNwHuP7hR052u54F1eVp2+AHf6m7lJ1QmC"
+    "f7J2DL0U7YaUdsEe2z29KIkoE+JillQgYGLTf30TYkaDp64jOMmG6DoQULdCWfbFXew0xoIiGoY0"
+    "SGJd3FtnS6dnS68pGvfes7P//ed159cmXp/rN0acP58p6f0E2DdP/G6ZXf+/zX/lM96PIBfxBWkb"
+    "Sss5y+vVHBxU6UnSNx5u/QHWdX6U7HXhWemHSQdBwFJpMUgpVANWO+A80VG/Ac9eEDg74s8XbHs9"
+    "hYTqKTBDc0y4lVJU8AmYThOwexJK72pfO5OB+IVLT7wmTSOZ8w6lyxMKgTa9zHQKrBhIaDAvoiUx"
+    "t2/pmg4Ts015fKKNEh2w8TamEZlDGiZAzJMlhgByoIXKGjLAH7Sj4TNhpMtuDreIYEFAOM2wQM+Q"
+    "KIbRnk7ICFFV91EbZafC5LXrzW88DkgUdki8FPis0q2AZ2U6fog5R28LbzkZAIyCKnH3xkWy88iP"
+    "qRCu8MvfSjWzJl3zpaeLDNkNokr+2XFVUs+0i3GYQ6D0b9i4pDGcinvpI3Jook+RFJ5amiiVm7Sl"
+    "oEf9oL53z6BRzLGqIQiDcrNgfgVISD0UyUs/1z8iKG7R9o9guHyKPauFkjR85nUZsXiPhCZ5nQLe"
+    "02/xFtJ9FTXWVZXt3QhI6b9VIfWsamXaaeimIPEhiK7+RIruvoswgdO+U2mKRGxLcz28F8rCXZVb"
+    "ImaQGej0TJz8klXkqil6L9QUUctxV0tYnuYnhNW+aFteXhiXPrK1+5eG7zG1cvn396e2P9TY2Xb7"
+    "bFM7hvuwKtooGIMUc3fS8srevM07nDYXa0O6xcu7GyfvTCcO7m354e3H7P+sVX3re4f/O9K/u33n"
+    "Xuzs1ruzdvXT06vL1+++jVYeNwbdjTlPhA71rZ15W/O8cbw7Gu3q2ubw5H2hHprk0NhRuyoc/c6I"
+    "CH28VPF3X7JgentCmx5Gt9yhIPbC3TYCqrsje5t2Jo2a7SpgpKbG+HOsOnYgRcZIxviRJU3pOw4j"
+    "gmSh+sUQeXoOvXKI2FLfqtvYfI0ZyZ9AXs86N/Qde6x2EJpf8hXnmMKHW89jrUOR0otObejBKmdQ"
+    "n+2bFCOujSJvYJzEgbs/IlFOYZRvQav/3zGqA4ppUbvtoWmADHtJYlCxXaqKfS2I6I0S7CbLesX+"
+    "KBnNgsnPZlqmMWi1TeOS8E4iGpgWMdw2P7WM71sqcpajleITPl7oVrAUjqhh2JZHQuz4TJnzkmVd"
+    "vKTOocuTO30mLX5LSLedDscHzomPJ2L5dHmkVSWdppbkcS8+rF7cZ1mwW7lxbFD8d6js3sBZgtLy"
+    "HytoHTyJdiVcFwmcwF2T6BqZRl0Sk7DgqnV2kM8yI5ka9+GEzRbTQr1BhvtBAh8ZXjxAg5hkqFts"
+    "U2iVjJlTzqxTgJUTr+Dx7924OPWOhxPHmiY0JJX3vh9f1/9d3vvfrpD7z3Ks/S3U+TFrjnJ3Tztp"
+    "gt/e6nv/hT33n+5ieHtYsPcAWIL8IxIfIZeAWUzz6ioFjzQSNBp39SrsrNgzZUsatjIZcAJ2r5oZ"
+    "tu24GfTsvBIngV6AJK0GdC5I4lPSFIDIwaUOgH+oOfq17cNim+afGGcmyoewGgFP+QI7X/nBXJVT"
+    "omWEyWMEXCRuM0FnrY5fYgHBvpGLEL0mmDwmByxkSXSXFP3GxH4rm1Eozu9OzUoMc3sPX2OW2XhU"
+    "EvJdBDs5lMesKntuaPyvngQBNyH8O4HWS4fMOpsc3RqKaOben7X8LaRn4Tm/CQpwr6n9dP+U7wU2"
+    "9klG+G1vaJsvyIKXF78wJK8ir5xnIjNB8RbCCrBeTkg14oYYxwoY72SxdbaRIjFBAugK+/wo8d6l"
+    "UTKNGJPNsu1bP50QvpVIxKACri0/VYwCcl8yZglhcx2hKA4FhEUnStRhuyRZ6NTRspVFSWuBbkSe"
+    "6viIhvWdG6PUcsZRw3WC18dKc6lPW1MruDS6Sss0RWEqYDoq+k2Ydz9d05ToOg0CdNIo+xUjMv6h"
+    "CphxNr8IAuWm4DU7FlLFIVRkzbDXwoeNzPtaLvPm0ZA4tUPogW91VWPX21Bm0ZsR3ElJH/PKR7uM"
+    "wLTWanT8nSE+c21r9x6cL2Ew9cPPeD8+c2b+iNlLeEdo9+N2iyUWhTHvxdWNFHSNdfHFa23lxcO3"
+    "l6mD36hY2jN3Y2jl+7dnr42vs2D9788Mne6+/f2d37sYPd/QcP946Wj4+GpVv6KvkNPa53+2RruL"
+    "2/rWnahWF58RyounK3phONjPV6MZf2BR5btc4fV/Sy9dm8+bQC8a+fyloKoPPpI+yWHO+OU6Ggnu"
+    "ggM5YrQzB4H0I8dY27f7k/oqOfr36ztlAkbcf2sNBX5iIv0fhZXSnl0tPY735jMCI3nYJifI+c92"
+    "10mBTLEa16UABU9XRbyUnDsUZBBV44Qxthwc3Akv7kHYa1Sidcw4379dJxGRSA43fySKOHc6Gbgm"
+    "nZcN+lXpQto3XpF9SoTZ19NwQASmV5lPeJVG9Ig7kOkdOy8Cc1gBXdsF329qaBsKU/5RBKFcrDNg"
+    "Foh10EA2Gd0evQ5pz2Op4g29u448lXnm2kvcV+60khBrRFa5ti64wo7YoQP7UtPOskM25p1OgjMA"
+    "t/bHupkNJ/JIjIaKRzBrUcyBEKDw4072eETYxautoW6ejENZ8owYzkRl+kQTPYpzhS9UJTcgYEKR"
+    "m3I0VS8cY2FZBPepZRVulDEcVO+9r7DLY7+x4fowqP/tTul8UyJDkRqAM486AIZmJc9Eqpo8S0af"
+    "TP4Zft0EJc3OAuNh0C6N6O2c98/pvf+s1rD164fmFn9fXYbJR7e31/QuftPxteu37z8n/7R5/5xP"
+    "Hm+Xfpw7KKKH3wVc9FeEKnYzBu6yM4HVwOUs5IoyzhRL15lOks4xUqR3ICGG13Hj2rZjktCWqA0+"
+    "no4IpY73AAV9kyWjgnHN7QInrOyOTZMgZsf8NNAU+n4FZEawg3z+DZUfvHgSQuBZ01z6X5upRvhe"
+    "wJFZhLecOQdxbUybebuvOikxmJTModAIVYdbXxomEHrMaFl8mqOOi4vVBtjLQVc8Pws+4rLSe6Kr"
+    "q0su6DF91s6RbK/pk2T33Aov3RkWkfUDe8FCTEohIuKKX9lamyiWE4y3by2Si3WMuxay4srZzDB0"
+    "YiB4cojEwq1n5deQqi8VN2rCMEyrVSrkSRH61EDZlquzkQGkq1HYCaYwOBQaXJKjJzmssSyEG8BH"
+    "G6nEIt/M6oBMENm4nDyIesX/uNS/jb29guip06BMaDvmiZUInm9gMk/HI71cPH4hiTAt0IWcCVoO"
+    "cHrf0xSwuinlVka2Vq27EB9IrQ/oOpw2c3DazanwbPNgHGguxrzCDuV1e3htWtC9Kp24YVFPZbdb"
+    "QnGDHY3G8A4x1D0fxgGezsQMsHO9iSgbF9VYo2db+RvuFdUQ5k0neNJUaeD6a9aMRuGwxlR208I7"
+    "hNj2YnJ3sLxyevry0NXz+/uf6lC+d2/uLKpfNPnT+3dVO3WDKJu5/+3hZgWy3taRDcG4bV14elLR"
+    "EeempxtvvXi0ev/emyrtit7jz9Mwt71z92uLf7E4cHdx6+cHiy/qhODOjNmsPtg4Ph9vH+cKhHDl"
+    "8/vaWHDrf13N2FYWHjkl4coMFY4/uRxki+4aTo0/ZnbOfstrYrR0qiEZtESn/Lk0gb47s6kriSia"
+    "Qyjgt0OLHWZUcd8RPCGG/5jIIYnvjA1NxfHQXzlq1wNZIWXiOFiuIP24g0vcRDo88Qx66LZAhn62"
+    "EHHmU0lTdJ4/YZIIRhENuRoX1iFTXxpY+IUQJiWgEmL75uG9ZyHOJNtynbjxnK45hW8vHPqoIURv"
+    "5N8EkafDCNcZVtBrSRnYeHc8BpD6eFCrCLTtb7+bGOFrSIAag3QnOKyVMKUGMytijWGc3M21WCxR"
+    "rXrqqItRVGqM64PnHLgLR42wTLeIAoQ954XkfKNMuhN269kre2uJNUpJbtdRnSaqJjv4RJHNBWcC"
+    "uvjEDL085q3ZOR4IgAj+Q6ICAcdI0XuuNYtLlo2QR/QkcicRBfjKtFtjGQ8cexYP8wrz/G/aqLXS"
+    "5DLQ8O+dSNkmJJ8dY0U0Y+Nib+0ZEbT33S21Nl9jT2hoV9oW+52rEz2a9PfQKM/ZxPPoiRE0DC9X"
+    "EXZfaZHIfzqM3C1bfuHP/nf/WtZ778z3/+vV8SPM9e309qgfsTOsJgdrL6v3/+yz/11PXd/2Th/A"
+    "MXFmY82qFJCIOpJzBMkBRUikyHp9YezDn7XgdbiI77L0ln8pPOYV13gFzFolu6U7FzBEuzjuMjfY"
+    "eN2YcSr1dhUufOWJ0VO6RFPefgzqN89af4gC6DgIhMxPKyEoREEJA4qI86PcnioI9PL+Tgb95Lsc"
+    "FksDVyJQ2M2IfVA4ORwSlfsdmDQs8JsE+9WYtduQwAfkNS6aCXjo2s2kIHMRyU+AwNByxqZH13Sj"
+    "J6X5xk8VGvEdfBzvFwrLZZ1p6KASQvqVFGCbf4uT0FmpZUGUfMz/Zgm/VEHJ79LRkfGEc8cWHN1p"
+    "c/1E+yiGfyGV7Xu44/qLjbwHbtqXIoyUHbxNFKNg1mleccEUyft2nrQO/tMK1f520SQH4AGnxqgT"
+    "qoLF7bo2hB+WZs2MV0hNAH8L8gYRrDOLSieo3li17Ic5+CO5bLLVTQxjZr76CglfG5vHzGh+o/Eh"
+    "llSjT+gGI4yWttbMrI6y8JHytCXO9gzW2VWLczOCUHRHZEkUkcLw9bO5f1xTM+y4Ed7bjGdsFmlE"
+    "0qaK/cmJMDaIhyvr2k2D6ha9sWkQRl/bxNvKZ99IOo/xoqIiTl1Dbjh4hJ1CXeqqy21dspNU68oS"
+    "9xP3duY/WJyzs7X7t44dzfahL35Mbq6nUJ/VN5mUlV8B/NSltkZW9YuLA3rJ67ubBy8MrC6dVvzd"
+    "Ze++ra1nMfW957/aOzg5vvO7mze/lw7/bW1urx4tX9vWF///XhQb1v887pynBntjW8/pbuJ9GLVX"
+    "ipyux0U/uUNe1HlPTsnb6v7psv9UE+xYxoDjaCkS1MRBGVIvMMHmvx6XH8J2bS/1yCJuG5ngoocz"
+    "CoTO3SrN99DwvucJYwbFQmZWwx8SGxJhc7BjedHH2tD/YQspz2CT22I+hJEXUInG31mOGTbUajn1"
+    "Nv1zQyRTeogdIuZCMVQNxMG1nBujgLHhIc3MP3vlWU6KY+doqKOcX+aM8VFAO/pjJjvtRqNfdchK"
+    "rrVMJqLKa8zrMWqz1Bz6TywXTrinpGJz6HRJ0nFpVPC0xoPyLbdQvGdMnWUCpQbzOxKZoU0TN5i3"
+    "dF4JdMSLXViA9YBkej0l3yI9kbWPIVj2OtRn2jWZz69m2j5X0aFeyWb58Kj/qbzXpCC2AJ24TQS2"
+    "Yu12AB71Js4UEZ1SpxmFrFz+TdgGPdQnP71p4A/7yN7GTxwS3obuPejoXKcKKkBWAGJI4zzoQTb6"
+    "lL23C8tIqPeatNpN+T5AVuMQfZ+3flJK8jwp/95rMv/tZPvvex7z98ae3FIGPl3k73J3Ta/rd3Ty"
+    "7+L3/+hV9Z3Nr5ELOHZb1dzEGjiRFnBAgnB6+jKgHjwUGB6UkYHYCQG3cQDlMHoPVyUU0YRG4deE"
+    "p8SS/64KDPZz016PhqneA5Y+4Jl2Tp+v50gSYzLY8peg8dKDrYhqgyOxN1DDoNkxM/ziEM/vDFOu"
+    "QNUd1ARL5n12dfmZBkAhkbBpaC8bzfDj5gPQm1fZWx4R2z8vjgdpKu7ctqDiwxrn9j4kPqCx7V0L"
+    "/l8ZLPF+CLBzZReavo8YnegJ4zNb419ECTOX9yQIB0+mwLlrSfHMa+sNtoLBbNdLHMhaPU8jii1A"
+    "MQ+t6eOK/U7ek1BGGp6bzGOnVx+/TBdBu2iArgz1eoV4qufRaRdpi3S0TA/w9Kjdnrsom6MQom7R"
+    "Nm/FB+qoMXo6wsIyRCi7CmHXzrz1QQHW0CYgsbtgNf+bRft+m8NpFBZI7eeqzjBsvELZo9BzNf+L"
+    "R73Ig0shM424bQFmgLuwUq/WZMrS9CZfHbiqqT1wLhRUdg5SBOWIrZE72nfkXPzS3ruafx488S8k"
+    "kDdBrQthSt4ClB73q032A74TMVSeWa6LX1lBv1PclNvx5bTWOQt4W8xSek3UdB6PYQGXleOKR+p+"
+    "/DzV5cX178+oWNjb9++Oqlb1/c2X5ufXXtNWnc0I95Q+aEytxP/09aQC+KWVi9MSxduzVsX35jOH"
+    "nHtxaXX/vUsPT0hxcWn/mFpZVXP3RwtPvg0ezgAieIzi+8Mlxc2hj2jxaGh9bXhsPT1WFPz9rtnW"
+    "4MdxY2h90TPXd3sD4cnG4N+/rG3enS6rC0xkRP9zZokjcbVtNf5TL959hxlUjhIDV/YlZcaHSrym"
+    "Vz0030TXZvfJ/orH2PhTpg3VfoZxI2Jlwhi94iRBt/jluzu6M5Og1HzolVKbIvIVEkhktC2BWOWr"
+    "E/9F/x03cDgJztVgdo/dQzPloe/O4bykeO/kMOYNbSov7Oj0KQnVg1i/akQJlshChYFMnOGK/7O9"
+    "RRR7JTcdquEz4g5ySh5hkHYvFaxGXLiTeCKivnRplRr7dbbS/LJz/VRfzvTRMbZ2USBTRK6nDGuk"
+    "RLsVapo2TSiIGyCova7pM60A5QO9maQMZ2Ka15I4sgqOhpbezSJmYE1W3b68buNdZs1Rkt+C9/76"
+    "4j+x3jTH2a1g3vweGnhD8tH8pkWTJeVR7ufJtSmbRza4F3xpwYjucCcX9BwA2hNXRgWIhusvK2YT"
+    "B4VtZS/GQhJkkGWm+TZR1v0wY+EVp41G9Gvzqh7hplfCyt47rT2bk7eye/8dVvPf2Fh3/h/eyL7t"
+    "Fb+7sxs74nJ3QESYJopttTDlb+pz/8s5/QBws/Pjv3kD4Eq9ehsO9RQPnyrm5H1MvxVU7ssnZwem"
+    "eg+RJ8TSiIVXRGHoJKebYOpvR9fyI46gDuCBwAslNJh+AbbEzatBcymwMvDqvYUTSOP8Ate3S0fH"
+    "uNg1edeeXgDceVzPPEBrMZJPCTjsLbMpm8kTJpxJGZrnBlJ5i3SXpPiMuW8VspXXI1IPoKGJgk7H"
+    "U7IAGibagNfKVQlya8Y1Xv1Rd2fdUNbE/U8NkH36qrcHIWRhjkJUTd3YurzKcVmOBy2ybPJ3myIJ"
+    "tcwUP39PSQkvxRzXk7nJxha0vdPuAbBbCha2V/scfggk/mmydCbUfUDIK0fO7tjJ6RJAcWMeCPAC"
+    "ufrUGm7CCKEElyjoMxD8sIlomYFNBRctm+hBbZMMa8ivEna3wZU+MUhotFm/oUe8XQCvEedKfYbg"
+    "sxkRytTOyN/pJxG018msi1f1NfbVPA2Gv6NA/f+1O1a3xSC1RMt48dW9GjQ8eNxqbNRt04W5Pxtt"
+    "ueRU9L17REpV1OiJ7jR04eYAbHo7Og74mtbe2oM+jAOeSqkwQRZiGH/KesT9/YQVgWcPtbkrZwfB"
+    "O1Sl6UmPORP1N/CyHfvknQYqK4ETOuMUa4+TIW6cbL2a6i+LWTw8Pvb21ufOHqpZ3PXbty8ds721"
+    "uvSO7+jpP2/wdJjBiemujwZf2NYWnjjYVzl54ath75ytLh+/5sOHrhw8t73//E6f5Lump3/Z1H+7"
+    "sXF07eWthe1fitcXFBcXZ6ujQcHc00idN37TSR2zvV5xAOt4abJ+d0u6au4B1e0Ni4qQt3K7otU9"
+    "HKrfMaO3V/yLCk7e9bI73/UaxkKMQnhU36IqHm26AYFEh2t8JKsUV4OcS0cB8hbiOYZanNC0K2Qu"
+    "SxQzn9HoZQpBOZCGYiJVYplnrZARkdKZWtucmSjAHJ0N6tDVzy+DBN7p/gQde/c1WM6NwCdhunxy"
+    "6wgP4h3FYrf7o+bbtxWBuL9chUpnxIm8Xntpl1aKNK4xSBetmnwmm5NnJWe+S6ymiSehm/Ru8ifB"
+    "eubaFQYql2E3rdPuFdUnNY8yMFWiUHBxTl+TdJ3AjAGGVpE7cpa/1ZRPIotjXTxXfbqD8Uu/bhLt"
+    "lm+NkuwTSMjXU9kR79BJHCJOWko6QlOMrVNhq3eenZBl6XbOrNHUXSpD4+uQEzRiyPA4S4UvR7PZ"
+    "eJXUu0KhZHHLqIj4lkW8OE7QNrBGfSBiCEGBvjM4hmlF0p4T+p45S86wpN+zdsw7NNrRlefPwkHr"
+    "eIU6F+/En7ovc/7DFr+AAAIABJREFU+cIrv/7zN9/35SvnF14W855P9+SELls9YXn7xp3z/90ffe"
+    "GjC+cefJ/OEKwcEzR0CkULkyQHky/5KnCJRmJKUZaJGEiiK+h9UKSgY8JEQPbg4bMamvjQ4TwJ0d"
+    "rB7OBmUpYJF0i5MhZ9jqLpNHR6Om1PEvJ5A2ziIz6pw3EropJtOodXYsDz0SYDmQYn/ZgMJVlCOi"
+    "llcIkMHWxZvRdd8p74qS3wIwfKXBnJmZTgzm03XtpBHVT4vJ1IFahJX9qXtjjVgQeVpC5c4cAWkz"
+    "TWZtC2OiXDdujbV/DBflAXPmVweKhJ+bEOYo6H0zX5hSZ1ZJKN8fwzavgHCXQzsOcsQiUbpm1A80"
+    "RZePEp24MpOIqepCLT/opMYtPIPZvAbmIh24C89eD/yCRgfABrup6QUHPdyFSyD66D7EArX8i27+"
+    "SDS3xSuMuAFYPdVTJJi7RUyxeQhNgWlqFeIFoxyGPdEZ+mguk6TNdjW4ITJ+d1Fc22YFUcR0z08Q"
+    "AzVcRcxyadhF1F2sReCkdxRNzZ3zmNXLzvftJulCz1hUU/tmzkcdXjhaichIG/sqZn5za4OoeMBO"
+    "QH/TWa+CyyF6wshKDrOy2T58et0SQkGW9oDf7sh3Gjy/NF0OWEfjibbaNGUxa6fvhiDkX1STXW8u"
+    "Lirp4ffnlzbfmJ7Y2tv7xy+fznrly68L21pUXeUHl/IqdG+IdP41aZm1rcuqUv0j8xrD/23LD9wa"
+    "8sHjz9z4bbz/3a4p2nfvZ099lrh4e7G4v6BvviwoGuuS3oe03a7oKZregKnS6iHuvD5Scn28Pu0a"
+    "XhzsGbw63Ti8OBvn1347Y+hbByXg+gLA/76k+HBLbOkh8qHpjsaYR15CSWCBH95BXRRHc7pg8Q+O"
+    "6nknIMU47rFWkOOUglVhnE9Of9X435FsAG+9dYAsm4KvY4gaadKXmcskzZbbnRXtyxvckwYR1ksR"
+    "f/vHTZKvjQNuwIvlUSD2m/qMNUcLpOwYxkaVg4lG4/1yEoqQ94Nil91z/yLMeycOyz+FOR0CLfJ3"
+    "a7nVI/FAGKTC/ti4hdzZHdmVEHAoUiSIFcnHCOkpBol2pTNXZrmcnCotHtbYEO/3lGHZHGi/a0NW"
+    "2vnS0fwIkOegCN1lQK9kgpXkOwX7DMKBCI+Cbhs40cqbhlO9Yts2bavAimTZDVJX1rpoR6+7Wj7c"
+    "sUZtwgIrLt80NZPzmHTmJXa3xs5fKX9uhbQeftaQ9pEWEkD9Coj06Ta80KOyiwzyFRq64Z2PyNmJ"
+    "L18c/YbuJ1voQo+xMrwuq2AA90jm+niWOlvujRVaSyvLRQ9xys7d7a//kvfv3vfvY/+8QHPyU9vm"
+    "V6T6d7ckJHACYdLf7ZF7/6wRdvLfzy0s7ClRPdysdEw4Gjg6dl3e5HsPsYSAp9UMiBW8sR60zWOI"
+    "jzQErwugOUCRX1EgEVEtj9MhEHNcHK1SvJp1MkqN156SI4Ih79wPzqGMC7k4nhCRsCyBQOetNOhH"
+    "w6ERkEU+7JWe8A0M/ZmOD6hSqiua7a8foKga4icmVQEPFBreKraDigNJ514iiWg0b0VU/WqRfmeT"
+    "4vHwVnQnCiZ+C4AulbOuHmCNgTH1/hEw19ND35s6XUgYkuZ6c5WG2f8KET7YY926960wY9IIkBkH"
+    "HVmFFjRCo667STMFUft6O0EbWYrcYXNk92Lu1g1hmQcBFbWots+5ijEEJhdxkiSevKdvsZBN1KDe"
+    "N6uJ1gUGulihnsuSXkuCcy8AAWf9RvO+bFrNWLXpTiRqt10y5iieB6tlTZ7+3v7TjiSXb0F1eyna"
+    "xa9Ka57sVvHWikrEq3HGp7iYX2EntosFD7SLEgIIpHObzWn8tX+6HjiVVVQmXadQTClNoY7DV9d0"
+    "7fI1NREogQNJ5U5QDWCKMDKEqGBnQ2+F3X+IyP7bfsKs7jMyqZ7LlqARJNdoHjoBlM/HDf6Ctzio"
+    "XZ6aFOguzqlsrnNtdX/+riztZXrl7e+db25sb39QbLt6R1oN/9h85p0//f08ItPWv37LD+M3qpyj"
+    "ufWlh/9MNLG9/6+Pr+9z+i5+seWjjZPT872VUk6FvuGhIXT3d10utQJ+f0nprVV4bt9evD8ebGcL"
+    "i3rNszl4b95QvDrb3NYW92frg12x5u7q3rGbxtjWvrittlnbvUSTd9CoF5HuOsTlE4yoj3hG3iym"
+    "FNfCfI1UqJd6KSeKcvZEQmph3cbkn0mm4qC3e4Grsslf5lMmVBpGe0bPDST5K3mhb4eEZWhPaA2r"
+    "ivlYQ1WdBhfkRK3xXDFR9R1VbKS8W9b2IwYxNjbeoPJO3WyW3otjhrb6wn0oG2VvCi3XmjsVC/Bs"
+    "Vdu+Cy0lJ8P1MoiV63D6xRN86UaGUW4rhOrPUrwbEeloOYlgQi9SI3T+0v+qMueeuXDmOvVKIfRm"
+    "RLqNtdjVJujAbmFMnGHfOMaNLdGrBLUCvbNH5BWhztst3qVez6FgLFwHkV4SaNV5MRGvWVlb3e1s"
+    "mjJ09GWxJ2AMiL8o2i47yFzvDNTAWQp8jCZrHVfdYsb872B7f6BHSgiScrBs9LYdk/6AYPD7JS+9"
+    "iYc1pasbcR6/RVocmY7QkSeh97oku/yR1q2NNPfAIGOd5fwUn1Bb0mfX1Yfu93nnnhV1//6fc+cf"
+    "n8ynMSrB0hKPdeuucmdBUajrvjW7Nzv/Pnf/WLs7XNnz5ZWFjj7AATuBm36+ngu68EEXS5kkZYKa"
+    "h0FtMH+RygO2XgNqg7U08CwMmEh1eG07kJ0p7gMFmhI/TOgmDFv0yggtEdhUkBNrkl0s/AlGkmY5"
+    "7kiGddOcvVsZbJACC/6QSyPe9E6Wi4Sx9g7TrLX/sUhn1mpwuPW0uZ5OJHD1TGE98wIInng2jJ2y"
+    "b10w8/fcup/Ghfchso7ZGH9Wnn+IcOmAxCOk/M7aIigM07BnW/mNbCUwfn6h93i8a+ALCHDwLjBT"
+    "JSpOvLs0mi2A4jryI7F2yHERw0muLYKN+pj3fk9s/a0sV0bLuAshI0l/Gn/PD2bjoy3i532Rcdfx"
+    "Brn9w2lExDAB64SbalbDwqYq0SW9n+I6R5zUk7Adnbtu3QNiMmFa16FHR45QuS7Qf8+Mz2KtsFar"
+    "qxgpK6znUpd3K7ln7aEmDaQV5Jzn8ux7P226WJX+BFhRbrGrGeppTHOlhMC5PDG/eG+Mi/YrTrR7"
+    "y5n+n2t7V1vaBCAv5JhoPifqMkFrtdccpmyo3UfU5xTrZGn0qOOM/kWRKup2wLy20rGSan7HtTZw"
+    "iIsb+TvdMTfdx7dmNjcfGpi9vrn3/4wUtf3Dm//cTGygq3rnA1jh+m76d/XC2gt2OevDCsXnxFr0"
+    "59Yli7/LmF3Yc/uLz8g587OXj248P+S48vLB5dWvA8nBspGY9VAb1EanZ6c1iZrQ2rmwoK7eOG2Y"
+    "5OKJ4b9o9XBr1Ic7hzuDHc2l8fbu5rgne8qReu7AyHSzu6fVNX7TSenwroVG9q5QQFbyHmZQXcug"
+    "tdBmzjVOM8u0V3Dcn1VZeOQdYOSAJT/+ouSviSlfe/KouSVHSvEDMA+C2h9Uh3xrY7crNXlIgA0s"
+    "ta94dt2CCGSIbHf+VlE3edyi7aiOKPWeBDsHxEKTC2N/ksbyJTdYIy+mjhthKfEbMtLVoO8BEfAA"
+    "sABJXVnDvqmJNFpOZqpraReeEuATFasTxJazYx695W4waBPPpn8HGRmuJhY2Bing9GxCdUE5ALrJ"
+    "aTtoxPowlBRMp+Kds2xzV86bfflhbtrB/CczDcRceMHBtlY+pMdYuEWOjOyHrLap0Tiqnh6Ad89S"
+    "sn6td1lCJ1inTYIw8ZgNG1ClIUOhVDzNif87oOo0YErNimXZBKo9CG/OMzevYDvVIwVYw+qW19xB"
+    "gAJON6ICsdVtqTRcRjiOoOlMYb1xZTPBigfaqa5fzJsP6Jb3zn+c/+8kd/nH3XPX2V7p6b0CkWnF"
+    "j//me/9I5vPP3mrx1vXLqmKYMnDuErojTJ8G2ODi5NI7TTqi4lOd3Hqw8ELeoZGeR7OCFo+8Ulnt"
+    "QktGNQy9zuSMBKg52gDsj4FptMOLAzMbPB9EUFdyYO0pUcCRnOtOWqj6xXZwMD/8DuSRWdBD/Gzi"
+    "JLlD1QjNipMTtk6OFjCZvpNBygerKHD5Lhcw7c5okdd8CqJ7qmSdd1rJ07O3nqHpohjN9l2zSFJs"
+    "GPFJakx6Qtk1mI+MqElXbT7a18j04y3FN9xPN0OthgsKW+bIcFbaNOaab54JUDh0B2G9usFgwUYz"
+    "tZJFs5/rJNMsBQbXslcLa9BzXJm4av+bc/+NH6kSudOAazNiD+p4gOaLBabHrAHj4SSTm4t4oJeI"
+    "1i/MGdxB5+2LcGpc1QK0O0nxNlksqmqBgs9EUxv2SRaPloSSQ8D+ZFm65sz/CSQ7TMTWXG2MUHbX"
+    "NkdDpBsY6OaGyLVlWsVBUklu3hybL6TNODHTmQksrPVM5909tKNtQ0Tqy0PxElbcE0mnv6iSP8MV"
+    "15Ykf/w8b2OT06t67b3dJUHFDiKtLOG1s+2maMpK7ph2K7PXty7TI+UJGqW8voAF+0+OYGktPUnl"
+    "uyCSpaSN0v4py0OtVnB05Pvn9hc+PTj167/AcPPXDp66vLS7ypMuDK3E//mFtgSW8U5VXMq3rXyW"
+    "OvDTuPfG1p67U/Xdp/+n0nt57617O97/zG4vJzj84WjlaJx5MZ4yD7JvYhihWdmDs93FdM3NGVuB"
+    "vDpu683FSUXODWzOP1YXd/Zdg91Nszj64M12/v6BbNy3rByqVh91hj7bJimkhi3NWPONNV3kzs9K"
+    "09nV5TjKo3KE6hMwQQyu419A880QIaBcos+VsibunTohDnTAwBgEcWPX7QfeCrzhN6UCQSeXS9v0"
+    "m/pC/Tj/3cKD5JjPHjlEcWKEnd/dAAYHRGa3Sr2GMR7KaZJQJeOoE16keStmjMoGEVXvGtgH6oiN"
+    "vCqBfAUQw2us33Wh5oDULbKClLI2/Y9rOoU5nw4xX0dgO75OMtnEomlM8jbrUpItZDM8i9PyhtUU"
+    "UvYHjjWBjxUW8sBrLVx1Jq1vX+e6RHX5Sx3zKNQcQhuXHJlx/Kuj0tjoKSVt3G87YPPSCqEduCNH"
+    "VDReM3D37ZYxWy/JdOl5GP/VoDWDoIEs92vzGb19jQkaM8po6PEKY2Yne+7dAMTXZKH1ro2ebhiF"
+    "I+jFQUrSzFdNbRg3aIcWlMtIEK9ke54GjJTksJfFeH/Th3HjDuiMV3j/WnI/Wjd3/5ye994vEfu/"
+    "rVH7u29VzBWfdeW9xzE7rewNev37jwX//ep/7F8faFD3pcV4Bxmwkv8/BBWQnScRKEBA9JV4X8Kn"
+    "1NXjSpYcdB7BJx8MfgNpGydna8NROefsS3z+CTZzInIlfk0M79w+nAXHnqq4I+QlSY+3ZNKXhwIO"
+    "xlA9NMgtIZ6GLaMQo3B7oC1/94UChZ0ugj2vwLZ1G31vDqf3hxHZrQ5HvXHGepA/XuCantQhQvVx"
+    "ZtQbqZgAYPr0LnQLhGblPiN9zUu1xKWUval5M49kVr6uKrfeKhpXeS+qDZh7RyPO2YwQI5f3sJwW"
+    "lyPSDSfrRgpaofPpF6nVrbc0unzqJKHgJ8D67Si06wvdULq9u8J7yN33QpxhcBNS1n6+yKF0FVFj"
+    "9x0YSqgfRbzybFo4w/rk3LS63r1aD2HznwKiFOK5a2qTm7NhUycvAnbdd+FJTbx7Fsf91kzXIVqI"
+    "hfJ04dFMsA4mN0qAMSc7t85iIOsRS9fK/NMbLu9rfbI/6pZj4g7YO/4HvJgp+3RWKq2ww/OAHAQR"
+    "ptQ5kc24QENic8Ns/lu3PEADQfoKo/EctoOWlVakg11WvHU1FGGWXod5aMQCSMKQjh45fRi6/77m"
+    "xKdHoynx743s7m+l89fPXiF69dvfI3a8sLP5DA6xa6v/gn1ALVBwichSU9UPLgy8PKpcOlzXfsDQ"
+    "ePff/k1tO/dLL3dx8cDl69trR8tLrIRwZ1NDTTYwW8QGpxWFO8EIC31dE14dN3zzWYatK3Mpzf0E"
+    "/RcjrcHB45PDccHLyhzyQ8ODy/+9pwQxO7G6dXdNVuTVf2FGt6ydWh+uyh+qRucvF47QgkaN1vWS"
+    "mjf2LfJRfVF5hcokd/Vp/yeEOMq18y+iDuvo+bpqOvAzmV2Y8m0FlVQQbo8+hh3kbJB95Y0qRbK4"
+    "+OfuSRoWSaMimJgEfCNBZyBWQREWUkdvBZdi3XNIQqGde1KzksJgUaLOyn1Dw75kLkPW6VTVNYtA"
+    "oQODBCF2MsN0uE1mmey00s6/K5J6JwWrS4MeyGTdZtVxDe/hakxaLZ6I3lshbItoyttCBq4JsPWP"
+    "LkSMHJ8gyvtiGY9qNFWgnNuNQglhvlkWtTLYeOfYFZyXYaqxXCa6xea8PyrzQCgujkbaYcx4ljTB"
+    "av45E1v5Y1nnU67hoNHKx0ufyChr7/5tWjAeKXOKWCDdsbfQ0vcuimDohXC3t/2BbZZ/tig+3FVv"
+    "vuvpkdIKZtJxcLNDS1A9RdJrDCc3LJpV6w7DDOcJyghC1dLLi4sLjyG1988vuf/9fXPvS8yD4ctM"
+    "A9trhHJ3Sz5X/35194/7deufmvFi5eu+KTndoR8CwWccIbwAgobonMpCtXjQjgE4JMQlxZS29QB+"
+    "BMAgHZP4K5OgaR252VoOeA3pOUCkh3egU5fz5YQ09/lEkc4PYthzzTRueYJsYZJLlS1YmrYbwxE5"
+    "wTDxTN4eSsJmPSMaawuYLB5GucFAqMyRPlUy5JKLGDpUzyWzKZMCqfs6BSkM/21nWmc+YsKLKkuG"
+    "wJdcCszaiFJ4j4j2CxwThWfZfr20jYh7WgB/gXVxS29R06dtCHkjvgpSgznnkEJreHts8xo3ZVY/"
+    "W4nDaeeiGK9LAbFyXvMtujUpdlhO071iSOqZxtBzYglOYDVYTAGvWU7+1pvGnbWDySMiu59iGDH+"
+    "X2wDbQbSFlR15b0+azrREnjtjL0ovJ1BsszmKDHRUMNqqwyp55dqb0qk651Sg0tzU47V9VhRX6za"
+    "cwykzr4KolJnv7otdtax8Ki5q7/Y1slztnbPBxvRO6fbXbbaFy6lx1x2d0jBtf3aT4Bw6+maC+Qd"
+    "9SeVMfEV9c21Tfwxf6vIUslQPR9rhsdVHyhgRYNnNgG3xzSg6XItiKigmRsqBvamMDwcHt7ETvej"
+    "090NWS59eWFr700IMX/v1jj1z7q+31lTekcVO/e3bnR5O9PVLHweqbw9LDTwybV55bWv7xzy1uPP"
+    "Kxo1tf+4WDO0//5MJw59HVxcPNpcUT7pknOAgs/chrNqf9hc7UKU846LFJ8Rf18fL1zTeH9fVXhn"
+    "Mb3xu2lreHWze5Yvfw8Mbx9vDGkZ67298SzIYuFvKBc6myb2Ci6I5ad59IIn01PQUxrsQtzsSv3Z"
+    "Zr0PEvfvocgslXcNtt7bS8HwmORP0nOXcuVI0WVdT5aeDPGiT3Fp3rwC+N9/Q1yaRDk1FijIcuUa"
+    "7kwO/xBu3Ow/CJIfdZbNkKEvoh55UW2BIX+Tkp8mVjLosAUrFLCZ9dLRa0k3TsG0ywWVqAUspo/c"
+    "g0OiCuRSLHiaqul9d2SMKYBP8MWOhtovVS/whanoWU57rxHQnXqTmSodyJuv2o9MNkKKC35eD76h"
+    "sAZZ+sLUi8Jbu9sNu4abuUqJNPCgLSAlo7HqqM5lg3ZUbsokY/1uNBL0ets20+F3Uu+yvqhEF0Yr"
+    "jbG6GuB/m5My6FVKYsh/+mgolul7OOaHhgze0HmvqqAYJgn5TtfgcVHf257WptlSy0pL3yh6RV0R"
+    "Fm/DKE843j41P6fGHbUzneb37nrhd9mvjHn3n1rX/+7PW9zzz2wAb7tnsy3ZMTuuvXb1/6H//087"
+    "+6uH3hQ9z/v6i9CoHNFTDf3qdAZfrAn85sKuwqKcMNTAt6/sCTOPF9sKYdJJMb3wrob2kkoHP2ga"
+    "twwgCEiPVBFitkVB7BYyNFrgJwkMZka37GA5750mWygg+5isazeEz2spP2gRxvkHRvwfb0almu4P"
+    "WA0Dq58iV04bRTkcFPaHF2ibO7roykZJ9KsMYfMPJpBrVPHNVaHU/8YCCOP2a6rd2eHDyAJTptgi"
+    "XLkVFi8qxD5ezEuZrJmeaur2Q4Y3ukBbdeMrHlTCffr9N9RamK6Gw58INe2Wr83JaHpYi3XLeR3S"
+    "if4VFP4oMBZ9SRUEqWdh1oS+/skWXbKFE/Ft0G3R7AN89AbDsT8LViRap9FrdtI4snTiXPgYgdMD"
+    "nbglgijXouhjbaETf+SN1tFttoJQUrUNLlH1b7WWs5aZWuo3WpAxnJTOln8tgpU66zNPCXvH/gg2"
+    "0Yo0miax/fXEJGshaftOPcfvpW19WOlWlksJnEunCK1PYcG9iwvKR0UuFEJxlW9F2w9W19qkDb23"
+    "ElX9xNpI80t6Nh3eMGulUfTHYspGZMBDOuzK1Ehnq5cvZUBTDsH7VP/+WgejY7PtQVuZdWFmdfvX"
+    "xu40/e/egjn7u0s/W0RO8I4X56+7UAwbCrPdnusPrwawurl7+9svrYp0/XvvWhk1tf+8WD42c/uX"
+    "S88M5VfXXcX5+oq7eJH03qPJmr8d/DFXd2Anmgg6eTYfucXqyyeWG4OrszPKy3ZN4+3hre2l0f3r"
+    "p9frh5dGF460Rvz9THzY9PdEJxSf1B38Kb6c4P8DnF57BlWTGfAzRtBMdubQyZP2UCZTHpqQ+wP+"
+    "OPfuDYb4UzfQdYgKRY/RJEbHohFv0r+pDgZOmr2qVrjLDQtFQ72LqmVgH5ZMtD6cYt6Dk5GK+yRL"
+    "brUuCGz1XKuX9gcFGVCffcrl2a11NF2gl3gw4/7dyeQyGNNlMEvHPmIt8Ur7sgYLA7tZ34J2oxjW"
+    "9MxqCpRmvGgsc48yWXhip59KZed2mKVTR8UzarxEVLY83bBK7/p/7IswkcNc72bo+DVcD2y/UyIf"
+    "6DPyYbZTs3TmSiEz9oZ/x0on3ccHOsttwid6/Bji469M156vZzY5iMrJzKvzdx8LFbeubhs0gKno"
+    "a3jmnVBi0HIroSTEtWfdUnbW3SoC6PgFVH65XtwLCUucIxtkhlYy7Zx+P4aMeGJZ0YZWxwKxRuP4"
+    "ah9ztsHQ0rv/D1p5770GMPvO8zU5x7KX9PTOg6FAmMg8PDjf/qf/vDn37mlVu/Mrt0YZsT1Bzzsd"
+    "Ng57Giqz+8tpmrEwkWgomQIAg1LdDRmfukz2amuzChATsTlw5WOoKu+uk2RiZdnlCkC0g2O80+84"
+    "B/DlqZWuH5NPnRVw1Yr+g2GK4egs9tjX77pNa5EqfJDd5hX8GOR7mymAmEJxTi5Xk4DhKRdoWM56"
+    "xIvt1T/uITWPiOH3zssa/quQ1EB9OfJRAS+lP52GMiEywwqP8xt+fIDnSuDuJjWi8Y1I0JceqpW3"
+    "8sM9+ZeZLKQTPf6hPegvhc2aM2fEOPbwZS8Lb2pI5DCNkrmxZUeZqQbR3W+DaerZV2DsjnGpaHbl"
+    "kiJPpSIxd9mOKwyXlmw/6oTIpvyVPueEn7oS8dsOuv7SFLsh34kkPHlix/l337gByCUrRM2WUFzY"
+    "ltqWLJl6BjZHoQ5Qpbvk40WEf+sx6Rkjd84TVu/IjkSCtlqOiwgOdt0P6YAW7iGhn8nacuwAjVq3"
+    "bKOGGQzdaQHEExSd0GrMeYxOZorL3UOnsTnC0EeQfZxaVhZWN7WNKHxI85y6CUreSMy1DsrHzotg"
+    "ij/aSNHVm2gUxMic55GQp1NnPmW8IYj9iOaSNc1mT8RHO51xaPjr5zaefcn//4j1379NUrO99eWR"
+    "j4AOv9K3Jp8Lfx0ifwNBvbuLGw/q4n1tcffmHY+tCT+7e+/oPTW9/4l/u7r7x/ZeHGhcWVQ91pz7"
+    "tvdMslfcKBRhwqr7FVzyCkkxNUXHWjzy7d1Emzw2F7YVW/9eHBnS09c6fv3O2uDTf2Hhhe3dsZbu"
+    "hbdwcn54ddvUzlQN/BOJXegk6wTd+2ig0mLEQ6t8UDHfuyQ2cyQSQHNOu4pWX1SwjuSV6nL6VPhV"
+    "NMQXXyvo860l8mdLJn0XAlAtidyopjNzNOUTIcCnHfQA1OgVN/yKimRc6KmtcBugixnzX8clNr9u"
+    "OFbSQVkUaoV6xHcLWn2m5+u37aZDQgPVEAcYrdlO/e37VXgS6DUbB/xjSTumT8CercgieqZYvVOK"
+    "Z6g04YASs3y8jU6TEPSDzDo7ml9jY0I1TsYKXlPL43fBgswxegayl+TvLSjqKU/Oh7wCUUD4gn/4"
+    "RjfNbioWudOt5rGdZAwB/9gqbfqGO+AWPHCoVu+0Ue85z4oD+JXqiNLVJXwbm5DaQnx1jUwxJZox"
+    "+LKocEuPNgdB4Z24JUcnRfywgzeZC1D2NFAhIsdNU+fZyaYyKRhc+xI3wguy520XaqrYSoo+Wydf"
+    "zos6+8+etv7s2+fnFjgTc033PpnpjQOXq0aekwb7554+r/+qkv/9byxWsf4G2WusnSG93DJkGoP+"
+    "2DvEPxZXvp0DnRJbDU0wWUsNTdTJ5YmO5Ik1rtiByE0mNiUhHpIHVnypGZJ20yx3/CVrpMdEgE9t"
+    "HhkV/ugU9MuKa3RiLjyZLs+oqRbLkDYQx/haVV0ZA2mUYwLRMt1cP2tTAdGa405MoAV7nA7Dr5Kp"
+    "5wPPkDXD6Cg0zkcnCZW0syycUAE1DEe8BCp/PUkx0tNE8SqU/xPXEVnxfQMLSQokeOOkpXk7lDTZ"
+    "rzgGzqRp2YSHuLadRg4PBBciC8CamvpBE1ppbx0e1WA4+bkvozUAYbDTY/5UYAo9sAGgYZoIyvuv"
+    "mgADqCLGgMcrV2AT7YrJyQqULEW630wBOjtnOruX3QNzY+z9u6TGCm6hwb/ayaGRKifmUyKg0u4p"
+    "ye9qCeo564I9/xRH2kzE/+kCcuEcI9wyoz6oSC905uS+V6bb3mgRVYUQBUwYARwJYP4NgW/MWYfU"
+    "Dc5drWxpcc8tm28KmfYKt6IzQZDQH2GoEyCnlRL+XZOH9JOPjACQ2JGkTYBUDRfQYRdEXgDx+wn+"
+    "dpEcYXjJOrFQmrAAAgAElEQVSQ0G6LoYd6mlyAjrWS4SjkdPamXk3x3a21tU89/I5rn3r04avf1q"
+    "2Wr0ji/kSOZronUsWG66pLZcPWG8PGgzfXN/7Z9dn6Y0+crH/jt45uPPmJ2d4Lj6+fzBYX1+mUen"
+    "mmn6lTcBGk3ILJb1lvTFnS83asFYV+KwGyS7otc+mO4vGOPodwQ1fvVoYHjnaHh/bWhtu7l4a9vc"
+    "vDyzd0BW/h8vDW7KKCb2nY0zdDF/ScusPefa39rH2F4N1X5QJr9zHFt8ix7U6bUpMYa9kl4zJofW"
+    "CIr43RtHEsMlwUkImmEQ1kCyJ7Mol12w1aZIVt15EcrSivsh1pzPYBiIwnsYJccrGPWhFC9rJpvb"
+    "YO0JLN/r39mCjh9wSr8+097eUqWcWVAFA/SXRbdx0g2y0vrOFF43vMDUbXI/J20i1j+TLTk7ts17"
+    "TcyLeJ6JXR8qq9qzhADjG1J1WBizvz4X/0BKbb3Znpwnowpee6Kg+G/hwj8LOBLYOqSZYRSWvY0F"
+    "g4LxzrQsi/mWkqHO6EVsqRl7iFWibHPy09r41yqXCzbJdCtUwmoQ0Tw6MsjYTldi55FWlHU0VJRR"
+    "Aaj005voBMAxtaC3L2uXZPILtcoI51pMtftQxKSl4A5rwPHSDXNA8M9o0ku6+F94ESzFV0s7QQDs"
+    "c1VQQfH9dms53d3d3f+OZTz//eJz706N8A0xr3yvqemND1hleYLn72r//2Pdf3F392dX3hgRM9DM"
+    "6bKrmyRfAleNj00lBg8b0LDqS4aneknVFe+sGky+/5kpj42jF1ZBHIvjqmAzECMtGkSZ0mcPigeY"
+    "1CVzn9w3eHdpFFOomvzBHAkvdEQpme2FAmsfbETzp96yZvoR6fi1PeB6fiY8N2jFhOscME15NE2U"
+    "JGf3RM2sD1pjMZB1lkZNhHlPMJF3rtkx1jAZZ+TCTcBphkjyt9Jg7hMcnT8aXlsBkdXZeTT20XOi"
+    "JS5KfkB27p/IWPr/h2oGeXuCJi2RrZPchQHwwrUTs7RL4O5KECLY7XPvhme+rftwNhGk1VhL9OwZ"
+    "xTPJgZI7aQ64EJYHkZ7apH+8Ftjak7rjU+PsVm7M3tGEQ8+1T+oNa3wFpSZXvBMRpMr4rICh8II+"
+    "X1L0cn7RxyIcO0RPDGEhkDKVN+YlA06mKeiq2bLDgIKQUyJeuJVus8q5L6Q6M+sM4ckAFA+5iHbE"
+    "wSK7QhsjGC5iTrohaT9qPbe9vWjidORQ0z8SsOO4YVW5wPxCYBki2jJTiK56XVTY0Vay5PY4yQJB"
+    "mSPD+USPgjnxMLGTeQTJ+hfyOiemlmSWvYX6k2DDj607WQ2cHp0eF3z22ufvodD139Px66cuHrW2"
+    "t+To5LMPfTPd8Cm5qdbT67cH7jteXNh/5uYeMnPndy+2u/frr7nZ89vv3aO1fXTtaGNd0ruairdb"
+    "p1OM/WcXhAx1KZiCPw6SsEH+cHuArNHZ7oKLuyfHO4eH5luLh2fTg60tW7rZ3htde3h5f2HxhePr"
+    "44HOmD5osLVzkfomuCnKBcFQQxrj7QnURADMGxgSEKJPp2zGesLLr0oJOyryDHyQ96C2MjfSontQ"
+    "xVkB6r0NEveMo476WwVG8zhS9S1GIz9qAk2V/6YfXp8JFt3yN3ZlxHaBwDwI8FJJscKv1bvNGcMK"
+    "WLDL85TAkUsdFabepJ0+yfnW0K20H2TLMnWsBrfuWwP6EaG7sTORWU7qIVTLa1teZiJT+hjmhpG9"
+    "DFbd+UpWVIIc19HOkjArpoT9GlSBHl9qsywYusq+U2taWxvb2tTY+ylyrPbUCRVa2MgbpT5LvE2n"
+    "GrNTH796cfzWtqY1DGQt9p1DFpH8r0VLabxCz7jweFEmLirBsJtui9TYxvORNLNyvi1rZGp1BWst"
+    "O0lBVD0zLHu/MJbe9DPZFVQ7KPTF/QiU/KrakxADT09fjU49/5/nOf/Ln3P/q03u10zz1L97af0H"
+    "UsedufLJ7//c/85c8N6xvv0vGR3hOgXQu36vmZOB0SKb767Dmh5itS2oFl8gGCwqZ6pzu9D8RkoW"
+    "LZwSuaMSATdHQSdoI6MhvLMsvtkiKInytioHMlDJmEuXZ0yFABpwQ6NPCZ+KkKmgCxewRKdCZOSp"
+    "lMFAp42GmgkG27s/iITHcoMKBlUmhRaweHcjTdfpU3j7bRD5zeiUJ3e2iwmunSZ18Nct3KVyZmPZ"
+    "h55652ONJLTnqCTbuMY51M45snr1rzd6qNeaCDi5bBDXkpP5WRfLnonRUVGY8dVMA//sCZDxIqoe"
+    "qdusEAPJsgly9uDRZRsn9pI7Up5IhqqSQZ10trI2vB4NvtFSFsQ4t/CFpW9bGZRhzLdqVVUcZQdN"
+    "CgqNI4QNIA/NdACLZbwEa0sH7FP6qULWSgwlW8BiRlWNS/0iTbFLGjb/hkMax/L4Qz1y/JhnN7uA"
+    "7lG4y2YZIKKdNm8LIOgJ3HipW8W5CQZUyiXXNgGXkslY7k0POJG6iQsQUfQ8S1TvCcnCwM57fPq1"
+    "G4ZdkOiFUyUjEK5fyzcrzBcb9tf1ibi031c8YEybYe4wiFllHpeGF28rKupX/5wSs7f/L4Ox/+9L"
+    "mNtWdEv6e/x0OT3U8/qgU2d3Uf/ZNLF7dfXNp49Im95ff+4sGNr/7q3v6TH146ePPBjdX95aVVTd"
+    "AWmdQpinRr//hdeV6eAo1gZEVijGTChxi3AM905W5DL93c2Bt2Nt4azp9bH64dvDm8sXdxeOXGpe"
+    "G1o+vDG/sbw+3F8+onl9VddLJTV7YT0fRJ/YRN38ROj8EeqzArnu9WkV2PZ+ojkeWEByos5Yz963"
+    "0Y+yOw2unGx4K1yFhnLicOJwmBrJ9WTiOOmMjHvqy6byLSWlqzD+LfP5CSVy0ih+hE3v60esnE7c"
+    "Ky7ChgXBCShF/bxyOaxO6uQfsKwjQ1Ih523rku3K0gudSmULBrwpQ6UZqSLdjAUZtITt2KN80c8U"
+    "PwdjiDG9UaMWUl26bLbhs2hNRHmlSKNNqdQyKlUh3PtH67Ax3vz+oXMkIAxZyx57guZlFEfK1NZz"
+    "WYY5ylEEejVcvyr0r44Y3n2qXuLQ4+x4us+ZsnYcgwlI6NKoz2Xb+qNLqekKvMPtHlGC3/U38fiQ"
+    "rUfPAnJsmmrkV0IfVtH9BL+GNIJRW7PdDi3Rd6Ptw+QOdIy7ZmJxffur3wq08/98ZnP/DuS7z0i7"
+    "NR90x620/oKg7ZoEvf+Pbz7/rSky9//Gjj8uUl7TkYf9kfOR4dN3SqHNh5wuRAIRhzsA8WB+Mc+B"
+    "NtzKV8zK8yMkxcAGUn5MEdsUqZZKXQPMMQivjglM7lbsCEjefEHLR63kxCOaiUZQxLz90BEGXcAe"
+    "qAGV5PmEa/JOfn73Q1q1N3EHfBwnCHApiyJwzZGaLT8p1Hlh9069kjoeErZ2+VMrlLHjaT424nJn"
+    "ftp3WEJTDJ5Iwq7RgbbVt1dXVll8GENheBj93e0UtgONsLH1ye2Rj4ViD1hixoD78qe7Cxd6ojrs"
+    "F0kiBOto6KPdEsgbRBi0NEJYv5SvpJ+Ni5WhfBbS5bsJGm/ghHPMu0d9rX2iJbwkqio4kyemUyLC"
+    "2LZT3LaAFTCYzYV6H0yLg1R9+hFAg+Qx/9UxEsNyiISiq3DylH54wthGyn9BG0W/HHk318k61IYp"
+    "LcDyfciavyMq65Hzle7LkwartSj+CgVFhVJ68wkeZPnbBvu/JFPLMVU9SfEn+mmke/XxhW9dzc+s"
+    "5lxZauMksp1+Q52IwGThrTqiyMYBp0b3+I1EWxTRtIg4JoNDS+Q8cPStI6Obm5dHLy1M7G2p88/q"
+    "5rf3rtys43xb0l4ftX5WjL++muFkjc6f5JBdDS7WFj5YmN1Z9+c2Xr0e/cvP7krxzf+ZtPnu6+8K"
+    "6NwxsXVtb39UJhnRPQ83LuYBwXEcwep/QYgeOS+OR5Pe1T3DcIXuJUE0Key1tWDC8eDpvre8Pm9q"
+    "vD5fMXhuu3zg2v3rwyvHrnweH1Qz37vHJZknrOXK+po+8o9BPjgsl9yhmtc5IkJA5N1RNskvG/+y"
+    "oy3W/A4YQT+2NOrPTJOmB/aPCSrESVUBIeee9vZdtXIfGJ/mgJBG3TVRVdXtmXNAFyGiHAdMIn9O"
+    "i72Z9YBSlkbHsUFtXaWhrVduOQBQNpJbJI9XiE68EMRvkotdgvVVSc5nbaJmTyYNq+BhM/pjvqxN"
+    "34bJBIz903sYuuMxQTghufo9v5Cbzwot0YUZbEGQyQGzdY8btx52u2m4Xd6I2aultqJE29gFPlXk"
+    "mfrGOjdbQByY6aFiiaBcvtkjGbvLASsypwcCKcKcZYlwJ3HSTaZpWtJFvoum7Sqv0dJ4e90aE7yG"
+    "IzCMiFjE28jS9YjRd9pwxGTBUZG33BAB0mdT7W1ZqysakzEJKlh9I3g2hSmzeqFkrR9FVhlbqecD"
+    "gWiHIQDEuflCm0GBX45biJ40XxdGKVuoj+0S9987u/8o6HP/r09sYiz43fM+ltP6Ebt+TpbP2/+X"
+    "d/9NHDte2PrK4sr3HbpNa+0sPLTzQkJ+CkQMCs6F7/TD7yMpLxgJsOpMDi9knkOmSZmBwd6Zk3v1"
+    "FSVEVgOsFchrJ1tHYAqtQ7G6IXHbqGu4M7onRFzKSHj2XX83iyvVz+uRM42tFKp2PCCN328Fd5Ap"
+    "0fGKzFnfgSvhiSVceoo1jkJBZ9+eXJpdb4w4/2wWf7QLshT5101bNpIjhP+W6a/cA3y7RcOi3Y1I"
+    "MXsmAL6GO9rEYllTmjiz3pKL+vW2ff2j3Qs3Qnw5qvAnIFE6ZsWlDCTIypm2tOg5FT0gKRtIeLUK"
+    "071l/c9hUJhoxMPhADILasFzCTjIwPZiDWTPD9D0BxobVstlVYtW0wY7VWRBxfoJYLzrVcFczUAj"
+    "MS7XrGl9DgOS6TSR7j/peNWlMmxW7yXla1mmfaWJe5j9Pt37L2H32N36aVD1NbprsxUtfwql1Kq2"
+    "uQGuKjGOx08MN+l/OWVzhoW3iyr9iqJiwOetX+ZPXLVlFOENlXYtvFOnGxMKz7u3Ppq2D78yboY5"
+    "Y9z4iUljYFEJIc9E6YN1NKlh1zrtjSKLSfElll+DYP2cWTk+c3Fhc+o4+C//673/XwFzdXll4VeX"
+    "62RoX76X4LnG0BgpFoIoKUZvouweLyM8s7Wy9tLa4/eXxz5y+O3/rGb+7efvLXNmbX37mykamTgk"
+    "2y0tNdE7wffFjgpDf7IuEx4TMk9KIVvBlLNbnTd+021vaHR9dvDZe37wzvuP2mrtjd1KcPbg6v6s"
+    "Plx7Nzw76+kTfT/ok51DH3vPtZc/oGfsdM+h12M1Gj7Imc+L0P90uzVEd6WsuTp+CxzHg4DQz9K/"
+    "uC6bjW+w2ksJ5xEwz+jVZLlYVBUxi8+VqbZm0VYMcZ5VKfeNyjS/ZMsHw1Ug7YJnjoOdXatkLxmN"
+    "psNDx2zHXiA1s89SwrIzYo7O/bhj0rJd7w7fZCJubGJfL2HH+t1DIqmCdRGCjCpw5dhmBa8yZrM8"
+    "KurJikBiJfyvjnUuHBmqapStHdXs7XuDqp2Zntg78kV24O5G1CcPi/tpEKbgurODdHrXoHG79pCg"
+    "s673ZxbtogYbmbUsepfLFYBTqY3STQu45Y6W1k+iiEDr2ldMc1UnMd94eybR8CGEw3gPTVPjSHZe"
+    "9uBxik0sNMrupFPrpWTmUsLjy3ufRK3nLK+0IGNDO0tJz2uYw7fvM5WJxMPbnw6q07v/StZ6//2U"
+    "ff/+D9CZ03wtts8b0fvHj5c3/39MeW1neuzDRR4Awex1kM+4QIV2IYvLgV0h8MZ5LHpIJbQsTndf"
+    "x9lo83MTKUEJzckZIzg5lk0WwEHrcBcsuUO5RlCMAKSlE5jsQuiStSef5NeL7FRVepuBWU53SIUQ"
+    "euLVolHpshO5lcIGg0kzV8y5YTHaA7pTtC4VlY9edMiBI2PAmioIaAjO9BDRgT2VNNhGk1vxgFWa"
+    "XG92SQI9LSx2x4GAMj7RzfoIWODG1JW+cWUn2cWXl7IGFjoMQG4oyW2oi2XealLWo7bY7h1v6hnq"
+    "Ubhgvrei7j+NC3bOrLdIIAp4Yut0MmdvFGrPKLlbdX24Ml+R5cvEbfLsi+8yhNWwhLkqFanVquyu"
+    "BQFVJ5ZSxIbg3bN7sIrMShKqo7cKSCSIFl2SFGO/kARwVjWy/KjslG6NjssoTDDwq20QfWuYl9tp"
+    "kTApWyvatgX9I+7Th16DRtK8eALdA+NqaS8JWNPyqp6PkXZg2DLGjlB+Iu0xyxy1qnAGyyeQVqGv"
+    "x5fUfg0aZ1Cn40gyP69w5GbbC8vDlsbHELGf1Wra4+4Amj6uq6yCcjSw86NHRxNX1GXHZ+TMfKf/"
+    "cxy9pNKiQMdlanx7q74KkL68u/+553XPufH7x64WnVTm+puJ/ut8B/SAt0gBFz9Atfg9lb237oqb"
+    "XNrRcO189//c4bm0/u7X/z35wevv6B9WF3ZWFpV0oagPyZA3T00/4ta7GApGxo4ergyh2R8boP6h"
+    "zcOtG3fDRsbeun2zEvbN8abrz1/PDA7pXhpd3zw2sHW8PRytXhRC9hmWncni2t69YqPpNTV+5kQO"
+    "j+ze+cwC51wa6YWjAsZQxhX6S8xxx6D+WMC6bPBwQVo+/9oWQoZj+mOlB2HUVzHalXZZELmFzI/t"
+    "IkyMLnb9yvugSDJIsSZDyzryGJJqL+M24w3oMpv6ep+Vq3H2SDmfoZx7TJGISQfpZwPSI7bqKS95"
+    "hI2/CTP8ZmYZ1aT8vWmy+ocwzNda1K3UZegTW416UHVG+bVhnLpVcyXSpLNps2qXpLLndq2EDq3p"
+    "heC8F1VCFZrcinFqFhRRZERsXLyuc4SRvRdTNz1J1vA9Hbf2fZrkGyUaHC7uPIsEZjBfrDq+lJvz"
+    "gmELua1ojX0hMg1rqNSkQ2oVLCvfZp1LKP7Sf8MU6NFj2wSY19Jl/wllCn7Ji2JnpUml8nssYLzS"
+    "J1zEOe4/ElXciAS5/iOJ4TFe7wonH8KCH199Ol1cXV933lu898/EOPP/jk+vJwu0283df3yhW65d"
+    "/9Pz/3oVf2Zh9ZP7+yqRs9dCVNV+d0NtCXkRVs7HuYLFDmO3P6roViK5MlH5wp8HwAJ7F8zkDBxJ"
+    "tIFFjEpA/Q1LvHwVAB6INrMd0ZJHuqK0i+TG0aoZVBQycvNbCDX4HKwR4BrG7C1Sn09SJymNLXS0"
+    "sUuKdcIhSdF6607bwl0iEuGn7pSgGgSmcuYQvKvUK+u77CcaoV3RPfOdgEm19flZvpFhv8oYMh1z"
+    "J0aK5OUg7fAm4P3pYJBu2Z9ql2shNpJ7d/2aWqaDN5zAGvvUt7ctZWfqa9uFohm0sreoZuUVfq7P"
+    "noK22oZrUV+68y2GeT6gBBdLZG2BncoE8HtCAhyh8llLINx+0OFok2TSMFgzYrMjzLqxyaLdm+0a"
+    "0XbIVGsLya24JsLyTG2m1uInr8c+ZKcQNWlVMXF8qwQayL6jTFI1HAp6CEjVjTUrhFtkwJmDb6Yq"
+    "LNo5yS8Ehn2kus1Kx41Aek/E/8Qxkc1p2PTpZuCUtQpv61CVSaHOiB3/5EEYecc79z3VLGTESVcV"
+    "44CqLxTKMaZ2Nzi++NqK2rFlKg71EybEF5J1R5jKmL5oSQgHtyTO1St6zZZUXl9GTp9OTW6uz0a4"
+    "9eOfcH733PO/54fWn5GfHuPyvnNru/+I9rgUSadQhSTnwt7eytXl5+YWlr4w9uvnLlzu0bf/2bs7"
+    "2XPrKxtPDgwqp2OtxKWf0knYIdF52Un5D8I1rJgFl0SD7zqTJv0uT8g67srW7eGR5Y3xguH94Zru"
+    "2tDK/f3BhevfXscGP/8nBjuDIcrF7TvcN6ZyuDoO7E8K6MK3f6Z0zyiOq+pgIivsKtvsQ+HKHaf9"
+    "HRcAWl9s7+WQuc6MNDYDo2WU3kTCAtISxpsK8RsyjVLCqJ1lfY2Ed7MokQdOkxQpWSfcqYjGHIQe"
+    "vljLrS3iEYI5IWroV8ceUkpnoiKq2zsiDX2IRE1xcxknXAkK0ghM7SWMh0BmLHAK6JbhZtYj+FAK"
+    "EUqsZoKTVIK4XasikVrytirLOqyNHGJPvbshBCzrrpWlPnuazyqoObrepcU4Nsk4KxOou0kNeBl7"
+    "4qmyOtOGjZZIMNhsq0Nsnbvtptus2DbZFxUZsCLf3sQPnbfp/FdD1KEp98xXj0WxkJGIk6w++6l8"
+    "WOnypqNbc7p+FJx474P0pEpnK1N1qxWaI4Oa+Y8/bDQBTjV6RjCxR15VHWx3CSYz+KvONNHdHjg/"
+    "oK8BoE5CUfjDp56OU3bn3sOy+99amffvTCU+LkQFiZt3Na+u3f/u23c/1ctzd39678l//DH/wXrx"
+    "1t/vLi+oqOvrRtCQxGZQ36xBQHf/x8lMVaiRVBrCmNJwkEUeSQR40giizBlomVZHyriPZhmsicMI"
+    "mTDJMdJlcrPNtlFdn3JEcDg/aVfm5MoLDAwniQY8e3W4pXYwLuRc60XNmznvwlMelDExoU3Bx9xE"
+    "750FZ6sHOnFdOdxnLIpt5cmSTfde41HZMJY5fPyAiDeuIPO1p2jEzGPCmtysRv4YpO8sFtHPSEtR"
+    "sCOxwEU7aq2pQPibOVtvS8/nse2BqubHIGp3boXIaXjD6B5zZggiwnteSXlDV1Ci7A8T+TTjSn9U"
+    "LLIwPyhpu3Bz7ZL7EcS6oP+MbT2o7XstS7apEbS8HsbYde+2AUnAWgk41k+2LfrDLQg6b1p2ql37"
+    "hVTEMJ1z5jp7DNrzw01w9LY8MFIcXkca/x29Xexi5L2PIthxo/6lCM0Y+SSVkF257KlnKZ9gp8Ys"
+    "qsMOJ3mamN1T4EMnJlwarOS8gnf6DQDkocJC3rde7nrzzkOHPUtd+Ss5hslHjFbHTlWWcAKplIjv"
+    "5Ixv7O9HGOw4Nn1xZnf/iTj1777x9/94/9yeri0kuSPph7G7j7y/st8B/dAmPAEU2rx4vL27fXts"
+    "5/f1g8/8zR4eL+8f7pleHwaGd5dUWTOmK0IjpHVCrWsZKDUQvWJWJfPEazP+qEjK7i8X0gTRIXVn"
+    "eHjfU3hx19XWFn4+awvbw7rMxuDUvad54sbghL+0xdHWRCx3F89+Gpodp1qCt5D+ZxxWNI1S37jY"
+    "yjjAnV9eMn/nZ/RP+M781DJ4zsh7IvQxhqTzBsjurxp0KPv6BM2wUo+2dGM1MwfeIDZXye/pWkV6"
+    "6zAJtv665TbEAnBVIlitgvurkQzYDezWJO6gcPgFop52TflIOV9mkd/EmKnSrNiVGyZgmysp14am"
+    "r5FIly4C6dM+0oEZfLTo+s7UP7GzvYCzKrKU67ae7EHdfRzLRj6lwYk/aDYjW2C3T94kNkf2g5rW"
+    "fhW6YxvYZx1/EI9PJvCuH6BcDHW43l3jERbJ8CMano2DB2RvGX6atxWAjDbYuK8SRXazTgAhFtjk"
+    "1iqbeHZa3CIrLAkgyptVvMHRtKMNADMxSTPSYA4Tm++OyndTy9pHcq6GrHwnd/4rEHvicYbi1726"
+    "e3+RU6fUhc9/3/6We+/MFnX9v7lfWNS5ePtbFzFSlzN+637+DooOjvzhE5TC44qchOhMu9XPbNx8"
+    "IzkSCGGZz7ubGUs4Prq1/wefqLSZk/he1OToBmspUJTGzJkPwLKH5lMpRJUU902laeM5tPpBhckH"
+    "dn0bp3XHQAKum6CNv9B9u6PE0ncBfBGIK4bgWtJym3kgUfG5mESQBf+4e8ij3IIccPtusqG6x74C"
+    "TfMpbT1T86vK8qyTHkuk5sM26HhebbWWknrk7qO3TqucNt3XK5f6htI3vL1JVJuOyqaPtsJLCoK1"
+    "uc7UmJaiMglkrx3yspM4RxIIBt0yygOoAlHYr8ur5YFdl4XUevkUfO/NiML6IVTiFJyurCNbK1UH"
+    "abiBQ8hPgXFhuTFAOxXyTIjdL1N42GIUkuZ9Twm9pCElEZ+0rWoiVvgdQl/gUD+ZIAdczjxrxtzB"
+    "oXjs00ruSljfD/TaLusV42SsdtSZ2qbF/GdhWo6WztMRuAqYx45jtGKIBHuxAb6PJrWgGJ7g+Jr+"
+    "g2X10pZpxwn4eNXunkyjRwwlAMg0u7p38SoPoXbex65Rfy2u4ni7OT75xbXfqdj33wPf/20s7GM4"
+    "LnpSfef2l9P91vgf+XW2D1YHHlgVe3r2589nBl+6lbL649c3Dz+N/M7tz6ufWNU50x02SM5+rcsR"
+    "S1vt1ScU2f0aips2zJMzbRx30LZg3EyPDrMcg4vHhFJyXXdcu83pC5s30wXL71hr5ndzBcv3lreP"
+    "7kkeHW4kN68ZVOyS3R1/QaFX2ow1cVbTN9Td3FNJOUPRVmxgsY/ZMIYuqH3p8iIZb7txSRcjdnLQ"
+    "Zl5NE3z3nJiRfT1MdEm4A+TeM4icyE5XFcBMbd6MyZFm35qkxoyCiHX9hR1visJ6NBVMShPhILsm"
+    "zpj1pY1TDhpCJzr4tqWStLNkqRse8ImX4Wv0tn6y3hM/UAL1gsG8oUnCuabbo0X6QG8zLKvQ90/a"
+    "iX/kb75eTEXCkjRbtRpCLS64YBAVw45bcFumza1EZ0DYXuxDr1Nt2AynEs0e1pm9hIZmK+zWExeY"
+    "QQOJOyRRFpDnUYt0/JQosPIVTJcmchy5bFggiFXNZdgihq/unxExmEGwdLtAYCHMNOeIDq18eoiI"
+    "DZ/sNGwNsxBVPUadMM2Jcd6hprOt5TzhaxM5st6g6Wdzz9g+c/+vKbj//FI5dWnjdgUN62y7f5hE"
+    "6vvz+4s/0nn/+bTx4ubbx/UWcYZ3rFMgHgMwba8L4DREHB7Yq8NIPwyL6mgskDLhFCjOTj17wtkm"
+    "Ds5Fs8JLfMhI1bIc2UFWJucqDZOtwmyQSpP13g78EpHAlG/rlVIx0BX+RTdRCwks/ZziKbRkfwpM"
+    "gHjOUZPoruoC8/3LnpDLLf9vwxY7kNHreb4kM6mjL+Z8FVwPlZVmx5UiclnzFFWTKNj034mcDBwr"
+    "8TtZFuobFc2hQ1BjmemYPuAwIfAGRHB41tYl+plm+5AUtqOgQmgPF1d/9Et11KW7df8kFcoNCl2n"
+    "4uUpVx4l0AACAASURBVAi0sOcQ0nRlwbUgwNiuMiVfjZT/JRq8lpMk4iL6wJ21fvPbWmPbOhL0zt"
+    "Y4PfiAk+T60Qj6Z9CzP2TxB4AwXJ7utJHjzzaBYlRVMp7rEU3Ux/iBbxloyvBjpYLtpRha5ZGPlu"
+    "RcIAaLgr78GGslhknWyWKsX9OqSki6bwBhrxBILHUbAGZenBjbxvbFG+0WNvRpcvMJoX1yPfFXgu"
+    "WG863T8lTQOlq4b6vEwV/juM4CYHtsbZ6j6F8aRh6Xfj/ng62xThJm0qcl+ya36fyApDyRgk6FiK"
+    "+bOGezr13aXP23P/Pex/7wwjlP5vRe+Pvpfgv8Q7eATost7hysXnz8xe3FlT++df380c0bf3mo/c"
+    "Mn1lbpEHosxZ8r4ABVozBX0fTpjnEgYjxiwPCjAcjMWc5rWsa4705AVRjQnW4PC+srw3m9YXN7c1"
+    "8vUnlpuHD7Nb0V85XhBwfnhjvLD/mqHRM79tfcdK9vT5Uuo4VHjPRVOiZ21ZdkqH7KiU4p/Zm+nr"
+    "JIY7KaFyPJY0V0NBZofxU2PVmYHueFKZ/c17GtxP4vliUVkuksLIKegErca4+LIpieHVYwpO/nnu"
+    "JE4SCnOginMUZsS8zr2g6AS4qv1e4oNyPsLEv2jOsqGLWIFindjJxx8KxOSlmGb3si4P/ZtilN0Y"
+    "1tT5SrAie/XGgm61Ih4y0KrvUi2yIRK1rrV8N1nSIbGSAYz0kt7oJKvotJvB7bOQ6qzVXuzG27rs"
+    "gWTmOy0brpMdP82NASgpJtI+DE+mzcNEiqglIjBT/2wcHfoPQS/70NILSNEmp6+sxEUVlbwBXpsE"
+    "0mXIgqh8IWCZwoaiDuSLNNSVFuORXtR+Kh0MpItvmc3xcY3PZ9AklGOB7y8Z5wVxZnFw5nS5949s"
+    "VX//iRS4+8KHjOQr2t09t8QjcML73y1kN/+fTznzjeeOCKz5Rrx8GHs4lDP0SpcMqBVwJwDG4FB7"
+    "FNcDHAkncwUlbQ5OqbQGCApYHbtxNqssdkx7I1ufIb73Twh2jwtANiByZcrvhZVm8P4wCxO06CWv"
+    "LCkKYHD3chBTgWecvlkZ/zU3eAZuw8X4cAE0sHu2TjPzua0LhKuChbPaEE38/8CASd+WSNmtFJZF"
+    "+5nqC5fpJzl3M7yWDpQfPVr6Lzkhdl5Y9eTc3OTT7YHnVn9FPiZSRiJo9wcsGhMvpn8ITDz/Uhby"
+    "zKi8OhHkTc1VtRgFrhyp0GjWPda0m7uE2l6ImnwBhgfH7Z7QFm2cSUFPi1G94OBqEFSBIiIVDYFJ"
+    "EjJsYJlmnIgYdE/DCKdH2lRjS8sXUJkZ/ix6ss4fLvpHW/6APt+KucDw4ipKwT/rRvEFwfbIqPZO"
+    "vHehFNRxqZMhrhEPG/KoUZsBC7e1CHHEOF4aKoLQ8G9bYg2ch5TVb0piHnVMbar5EvumHAKzvw0p"
+    "+iOl0arSCndPJBil89OesdjzYxFfWV4WV9SHx5Y0N9I1sRW362U45Yj/4MXhwrXPDph1or/rmKQP"
+    "3tq2RzUDA7nh0d69typ1/48cvnfucD73/sK+srK9fFvj+ZUyPcT/9ftEB1jsXzB2sX3/v86crOH9"
+    "4YFp/fvfWVm4unR7+0snq4OSyu6shMHYK+yfDtk23dqRTUHuxUhs9JUD/iICLnBdU3fHxlcWTEp5"
+    "/4DKtklg+UvTNcvKjv2W2fDpePbgyXbpwfXn7zRX3T7upwY+Wh4XD1qq7VaZ+i5+twgGdYbVIljA"
+    "PNaKAeliX7GPW5E3U+9zn2R+ww8A9Z+iRrZejLSenb6aPNZz/GKGFpV93SgSm1GodUYr8gB/wDh0"
+    "R/935W9QaHY4qgz2179LBh7KEeZftWtqDcPe5SH3tt8eSx+cMJu5JkPwzeWOdIdg1idSIi2T5JeQ"
+    "bTzkBJy5S7XgVLrPJ7zFTbG2fCc3bqT/G8qjYD2G1nB+G0p0YLLy2hfAAi1TVDhTaI6tzHzmXdyO"
+    "0qbmHXxzmYgiCm76IJlNtVIqazvYyBHP6oMMUc91OFI6Gk0WCKVkezlMElhtAfk7KxIt9Nlj0IlV"
+    "KjEBxHAmOfNcqMmShEJnl0u+w1BgxV27ssIx2PdOxBl6vjvHIoGNIrL+w/eJTbRuwIRfHv9ilE6m"
+    "v0iZ/e11IH2dEyx2BSPdYx8OrCyju//b0f/PyH3/fIlzdXBr5L97ZOb+sJ3dH+ndU/+OxXP/zKyc"
+    "rjelWX7hQ51sE+/W+mRwL08dPVlczma7LRIcYVNCYL6bAVeVp5Eqdw8ERCAaSMA5CJCimDC3TtXt"
+    "hZwJccZxAJ1jxHlk6IrCdzYpjegapOwhju4CRvOLQJbDuvnHSFnaBXeCNXAe2rffhPR5cP6EvcPi"
+    "snY5JVn2Aypxys+UDU9fEkDKVgI0PCXj7lUFfnRKOzeiCTHfygTqqQ64RsTyzh9WSHPI5pTqpPxe"
+    "kFNTXpS52wI7aw/y/23vRJ0+s873u63357nX0wGAADgCBAANwlSiQllRS7UpWq5IM/pOJyVT6m8i"
+    "H5U/IvuCpxOXKWih2rIseiJEsyJdniog00RZlauIIkCGBmMABm67071++67vt5nx5AS/JB4Qz7dL"
+    "/POefez332Z13WFU9ub/V4AE+F6OPqGaOFdFBX+gTFXXVg3my5igBJYA2x7wEP/2cRbRGShX+tR2"
+    "lv9BRTFv5Ck/J69JV8cBn4qIeyBTs7Ha5RptuP20XJo0Sw2baKDaIORMN/kVokB0Z+AV3PSrqdmT"
+    "SEI1/bjFichVzzw178wgEzD2n9Yo9gFheZgAljuUwoAHKMKTbSqLLMwJQxBTqBRwfyJz4rGR25bO"
+    "+DB96bUXFbtEAK2KGE/tNubET6i9t0JNfGKDbSVyfBYrAVgTVhQMFUQUlIW4sS9Gwv+lBIED3rM2"
+    "zaPHtRb+Gb+0U79D8aqmkh9aytstP+OqtU2+56Qia0KFGAThS7S/v739Rm7ldfvHr5lz7y4Wf/VJ"
+    "/zumeC08OpB/7OPUCrXN/ZOPPMa6sfXHn39g/O37n9zh//cHP3O//Z+mz3maWlHd0SwXkGdQqlfH"
+    "sl9024u4hXc4EnNI8NtHfRMUfQ2hFNH4SGK3w+zSYgMH4a//nA+fL87eHM0TvD+vracHZ1a3hHt2"
+    "H+cPvecGtvb7i7+pQ+d6DRnbP02imKy+okAOFSUfKIteFkXGH+oLuighWn+zp9V7AMYZkv6K0WI7"
+    "Ie20RiEKyNQ6avsmtsWEaH/kY6cNqkYgfwXMnzqFJjWuxsHvg8xsDndMYj7GJ8ss2WhnrJFaI3dN"
+    "jhcduMMHcQjfjh9RW+si55wSbzFDIIsX8hH4gtsoFFAGHrKnhnQS10vg/yBCHUCsCieJHpvO0qG6"
+    "AlCOeT4GZcCIznYISeY8cLc0dqjCQ4agMCANR0je48q6f21aSgYqh6Q6SYmqbrxnk1tAVV0Yh4nL"
+    "NQT+gKSs422g7yokeW15mFd77gKY9EhLSMIZ8SjHH51e1GtLbvRMFdiNKAmFgwja1DB2TCD4mOCE"
+    "sMt9MLftBp2ROYbYl9CClNGjLSDnMhQbLgBa9f6wTo5ZJPKmnY0Jji9eTS0cW37+/+vW9+58avf/"
+    "KlK6+MBXlEE4/0hu7d+8dXfun3vvpfHM42rq5r4Gbg8tVZKlPthgbBhsOboWqIXpjRTLQQ47Wobq"
+    "BV+XQ4NinegCHCbY9hlnQ6F/jIEFD0BPRmTZkG37TY4Fs/RcYLFgg+w78YudNorQi8jXZEY02Djh"
+    "oPWixO9ZezGJJV+i1a9JSny91nBNmAkYYUPsrG1R+uKppfiHTShVzyhHSq2BFfxjeBpzwmbFr5AR"
+    "0uiWJ7TvJjL5ZrULOj2DDmlpb4KhM1b6jMFRNsQmgmOQqFj9/d3tUGTmlV8nL7AiY9UM+zkodecF"
+    "MHqTNvCCl4/R68bcUWCU3dzLxgCCm6u4zeXFYhgZVrjMd2zCQIkxhdBMWkCho+0YPOhiG6IEKuCU"
+    "XcvkeypSNAaMpC3rTKOxBHwcgH3HTWjp+StxD4DRcRcApT/G2tY8uNYh9lH7S+LQJbT4TY5D5Rsk"
+    "6gS0GXazwRckJOWywBDbd9Jan8rCpPMaDRj3xftUzdxADaEIFjl9cb/Kyz1PaUoOwKo13i4YSON2"
+    "xqPvPVdX2qQLdbSgI/HCWsdbZkb+bMhyHC4WzaIFlosZG4+BXvHO8ffk13nP2rDz/99K9+6ANXvi"
+    "6O06tyronTw9+9B2jXBPqC5s75tbsXnp7/wZ3V+cHdWxt3d+9/6x+cnR89P1s7XBn0AXF/n85dQR"
+    "2EhRVnKqqvuU9wa6Tav5u7x/kSrWfj8tpI9DA2iw48t3L6G3iSreTKfGd4fOVwuLD1+nBJm7ob9/"
+    "aH67v3hzeOH1cnOTts6+QffYz+jSTmNY9LKNQ/fY6Y+S3jAboE0/hOL6RfMmYwVxhMn01SWGiE5A"
+    "ibQvdboF3Ong8ME631iNKKiRTc/5GtYtofijS6QG2k52PTwQ+RteoojR7kDCIXDMqURBcBO8dyGx"
+    "Jo8JQz1o0o0XewTGT5D5sU8OcDPK2berIu8ZQZMBgWqYFiGesQ2yBZXpMgm2DCUMNLiN+cDChiwA"
+    "RIfso3Ye8yBF8yJpFtqXzSzRyg3SjQAoo/k4+LVb6JPJIuF34iXT8y8bl4T/ivqSaxktRbSlcWTv"
+    "1e/HCgwXbEmPYIylC00Amp5RLDya81lK3JBj/KAxdN4XtvOWKr6JBrvrRV1lYBAZc6yXFUfcr1qj"
+    "GAOTYXH9K+oQTnda3ZxMd60cIACE9bEy/qylTJTs9pOxhifJFf9J7nl4bV2fH841/7zmuf/sgLV1"
+    "7Ra50e6fDIvuWS5vhbX/rqp/+3L7zy383mF57UK7PUCnRVToN5GiuNUUS0DMV99YXapu3l9jk3RT"
+    "dI84iWhkgj66sHaVxplH4WTcKyKJVoxOuPxsYGxVf4BOxO7saOMnT6qqC0iJZNFTZ5YHcMk8mqs9"
+    "ChLcj00LEp8kIUMslwxygeaPllQ4dAExV9ycLSojO25EEqjuhTjI7QQYUN+CtxEVo8HZu3fGbDWh"
+    "Or6MYNnbjTCW2ubyG1j6PMfLliFjWe/exHPZPPJKeei1qBpDZnYy6vHQ8/8cT5YU2T/9LhnjcYPG"
+    "PBJq+mbgvzwNAzCjYhRMH2OKUDwh2CI+8/w+VL/0Fgg0Na9PiHUJxOc8BPsRfxSEuA3MOeJmvDdI"
+    "gMcoaUPScl2h61n9ZX4swS6QhCdpeBbMlryRNb5VFTQgFPy53yoMO2qx28X1jwLMpv+oneloG/jZ"
+    "MN2ciHJ/4g3bbK/qIFZB0uEodYi41VFEO6DFMbu3698YQTWVDrvzw0kZFSewIBC43aEXQ84nn2/O"
+    "VhrufnjtQWqVMvxyiH5XWbSjsRq4NjLx4bUD4GsaS7hg8Ovnx2dfl//okXPvC5565d+qbAp5u5ct"
+    "Vp9P+nB7oFq5nOtg7Xzp67d7x88bXdA427+7evLR8enJ8tH2jHp1GWBVMeTCeRjgW7Oxhjxqp+nE"
+    "dWmk2f+pQ6f9GBrzT9yEwdu+cJtj/MVo+HzY3d4dz6/WFj6V29l3N7ONKnD3b39zTnbOn8HSdVZS"
+    "tzKj2SjOQxbtgMRAIhzyDgoJh/5U2v9GL8WdCY3wcE8B+5VuFcy0AoOAuPXEM8QpQe8CXMhEqP+l"
+    "tn+P3ZgZYlueNY1nyGtS4U2ThHQE0WdHzAeKq/IEqw1Pdc0TF4j9PQVvD4O1I29GS8mD8WfBMRJ4"
+    "nJ2d6iJZr4OMQCGt4IM8FodNvrk7Rh+CuOzR++EJHuX7PZGQYzvqc1iAYy8sQVnJT9E5Ax8VOIpu"
+    "n4vO0A30JJnkyTGyE9Bwrm+nce/ES3+UVAiOE2t0/OI8y2YG/9ijjwZKLUyjlQ5Py1JuJstgKJ/y"
+    "lTtSun4FyEmLaQN/pEbD5ZCik2j3ZFNhzxlvKNU+w1bq1Hu6wup2xjWU1v57eyOjuzvbe//cRjV/"
+    "7dhTNzPqr5yAZG1kcybO/cv/RPf/U3f362cfFFBtsDDfJzNkoKbjNKH2oZprekaFDPBi1XOTjDoA"
+    "cq/fIONklqONrcNKOfu3NejcUtVI1MjQqeHvi8EdGGxhOK4N0I05DqKF43fWK1VniR3Y0NmZ2msZ"
+    "NhomHuQ35v4Lg9FDPA0ehtgwBsCq1XsHFzJwJv+tisiT7lQj82IjfwmZ7nG29fEQI7kAWd7axOBD"
+    "04rkoSfOWScggf2fE1PjzUlTJ/2090eNO8gvvbddUKLUv8kSMidGPY6AnZoHp00FvO8IVeTavbbX"
+    "SDmpa+N25vD2/c3RkuX9GHaYU81j2XK7iO+mViFyMdHqszkUqegMDxUfvOg4fyxqCftLPQCKzf6A"
+    "9lAwws8GovKl+8B4l4oUWfE0kHCILWQMhxmmqMYfYH1BJSctCBfBkVdqehbpoojS9ZMlG/kWFtXc"
+    "aQGWe7Sz6bc9qX9UgmPNZnysWh5bdvwNiksnlBSaqEFzDyylugVIaR1/aVvVVhBaLkVhKbxOcCiV"
+    "Z9pGlQccJeEAYKTmW4ukJPg8C3pvCBOqe/JV7yFd/5sKqrc+N7kKln9KFnqlQAqkJHxzzInbCwzS"
+    "RHx2/t7+z88eUzq//ssx9/8d9cOLP2llUX9Wl06oEfDQ/QmNVhli69tXVl5Y4+a3Dv7s0ze8c7v/"
+    "dfbe0dflifNdBIzgtY1TMY0/UGYndC9Q8NsHSO5CkMp9IRB4xuAQ3zHD+GJ2WN4PkAMu5XipF7zK"
+    "cX94e1ze3hqbV3hsfO7wzXdm4N198+P9zYvzO8tb01bK+eG3aPtLnrj5Sj3j/GGMZ9lCu4vzO+0X"
+    "+xKXeO5Hl2ZUViU0wcM2xLjPfYYALGK1+VxFbkQpsxI+VGvsAeEJRWxhDoxvEYfGiMR3kLI1nBYN"
+    "LQ8mcA0tBgcLiMN0g0wgZtXBbjsQkdyADdY3jLdr3ZViuxsBNjacRHKelRRyUaP4Fj84kgHOgpNP"
+    "4pKhewBVQslHnKbgr3oF2jHgS78E6U0L9dxDySMi30LhyJPAUi2TheGQbWziZdau3jhr+PvZA6QF"
+    "MyW8773f3iuhLdWE4xjz5oPYK5vVcc+YKZzwwcjIV3rH8TLuRZhgsQhGlJUu6ixdbRS0q4i1EUEc"
+    "Sc1BE08CCDP7i8ZiAtwpYHT3jDxx0vrC2NF6JPAtNGF7qE9b8OVsq6c1dsqz/51W+++vIHn/gwz6"
+    "JbRJv9KMW1lH6UiuSyrPzr3/6Dl7/y/Xd+ZvncVd0tlyFzRTF1nI2L6pvTiT1h6JY6X8dhwSbMUd"
+    "1ySGNb4Xty2kjQAM2rRsU32XI2QPKUZhPi2y3RxeaKeYh2ozx8PAvGRomFoZuT6dDUurIJ4tk2LP"
+    "BLRLQhAd8yYKTB06h7EwWMzRJk2MOm8MHbPj1XIpSGr4zlqzzuHLCKl0DeHQoChXTaIJ0WYW/Uuq"
+    "zdnS1z4oeRXzzQWldtANms4i8/bydCNgvI7Y0nuqC3jxUj2x0fU/Cf5t1l+fLgSG+zFOzoUN8yWt"
+    "eHxSXzntYSB5Knt1aUP+RBwSTGJ455IYzE21++qkLaztNgoUVGNnbAjACjwLGYSBsoOSpbDyQm6w"
+    "NwuLCDNqOfJVSMw5GGHZSVWCC3jXGQAt/ykOU0bSWyzCDlaIKOeuuwOOsMonhxlLMBoBeM/Vq4qU"
+    "JfTUY6cm1vdFnIAwck21bJTB0W3wN0Xa9d5im6fYAzaB/Y3cGbSeVpI7TfhPjYmuMA8dgKo+0OHe"
+    "gTKWtxKQ/ONgjUUsC2D7HF5VfsEwAAFJhQ+Kj4+tkz3P8lGdiCsMjhBSd80qK7OGUBCR/J3Oob/V"
+    "5AAjs4uHF8cPg7V8+u/++f/cRLXzi7OX8LXafh1AM/eh6gvdOm6TXn9s5cnn9zZf6Z/+X+m7PX7+"
+    "598R+t7r7zcxvrdzaWlnV2jRNv7qtMhFpmeBKiROFXR5aY3IniS97et0l+z5vmpYP0WKDYSNFgBn"
+    "fccCVw+c6wurI9PLG+MpzbODuce+vMcHblA8O7+tTB27poeE8vy9o/2tMjejzrmhO6WMEbOXvYY0"
+    "Bw37dpEo5aythjh/o1+fRnyk6STSAywMlo/dP3QWYY6nHH1GKIvowBEUU6Y6IV26w+eOiIpgJJD2"
+    "QK1l2KzNl2Cqek6YrU9OHBzriueTLeIRdI8BC5XKYe2f/mBMV8MCCWcAJXwMaVVWM2HCd5KNQkkI"
+    "M+vwVn7J6yhs8+Mf9JORORJzwNnFqmfbQ/zbk4hBXVELjCFcuPkOBJnxAA3uYpjr/DyrHzJrGywg"
+    "XgDHWDTJetG4DyXk+hx9iogW4aEGMdXYgpEpx+4xoGHHQV0iYqY7B0WQ4waR37dtE4Elw0vtrmMq"
+    "iP+CRJ2Sc5ViFcTqAgeKJTE2e7gaLaj6KwLfih7CNiHW1OHcjjB+bfDu0q5MG/vHz81PduvP3339"
+    "0dvnZ+bXin6R61+NG75VJ1qvX95f/hn/yf/+Wrd5b+wcr6+gV9bGCJK3EsCNlIVAvQ1SGueGmioP"
+    "Y1uDJlcP88G7JuvDROFqkstHuz5UYgWDcw8sjhcwO0sixAlXCTNHX0aNRf0iTWi8z+PAGdHj22Q6"
+    "0TuTRSm4UUcArYjx5u7fTiVkQ0YS86hTMThAL2VS54KQ840pZB+SSHhk6+O2/0Ynfpwg533OSBu5"
+    "zoUuiriG1D07Zf6JAuowgahh2k7XfhRxuQpz/KDB6ZvsXNTiCngN3cxqk4Z8NMpfWC6kYP0C9r4n"
+    "7mzNrw5Fnd1nOgTZ7kcD2PE8VcHeGHzZiPLv6wJwMHta+gvDcUYMsO11fjQuQjtluG2UJvRB+wXc"
+    "EtodOSae2OU3fWWfl4v5hghhs9hYcWqckGZwWmzcGqRNC2AQ1/6Mf6NsLWhBGOMiA+qTIJFv6UFx"
+    "rIgBk+iWNc05dYaBfJE6nITbsiXTVtmsaZl4OQoVF/xAgH+qoS2EDET3VMAloG/u63U3mkLQOZ4i"
+    "FNjJLEJJO2v0RH+1nWcz0XrjypNreqPluUOJzmo8jt2RWArOTxpUkFtx4mHhrh0dGtpcOj33j8wu"
+    "b/+DM/8ZEvn1mf8RaudC5znx5OPfCj5gHavNqve8n8cGVtfm95fev67sH6Gwe7N68Nh3tXVpYO50"
+    "vH+yLR6Kt+ZXK/sER9DNYxIAt8yYPWoeZodxp1LND0F4eipb8xN7Gxm0nXXHfg6BbMs5u6FVP5s7"
+    "P7w5bmO75dfnwoeXoD16FewEWwGsTAz7/7ftIFUFR6TIwNwitkRFAatAPjRvLmMH3GEssNm3VkWB"
+    "gZo/cEvbWXVOzih4ASEgWGGySc8YLbCpFNhp7IKdamg8/WdYz0CQ10ntdGoMVYj3XA3ThbJmb0T2"
+    "BRbGQxJ7LPSldBFkSGM1K+jywDFxxOCRbqBTz2LfJ/Veo9JpwgjLJFcaq8AvhPzA/yw+E5wjjop3"
+    "NSUcM/KQf1NOqYwB/00YN+bVLDyRBQYcTEsrLXSsb+ZWof7LvmwRCznuSHED0pd2Jg8Np2+kQXSm"
+    "mbA0jlh8q8lYbvZJA81JXKNrFpopcc7THQlttM3owWw5Sf5TLWWL7wmb+P1vaOV4/PbG5+8drlje"
+    "vF9shFj94VOjWQV9+48eSff+/mZ5ZXLz6uRVjWdzRMnV3nrYrUtDd2OsPXm4N+UxQNyQ2AMwBunL"
+    "35EBubOjXc6cOctDVk9VWx6UYFAera3oDRCXShSkH39wNjYyG8Gy4TiwQhf9yoqVFCgw36RqIbHj"
+    "qwra9sNe2yJivk8IIXNp46KenNEEJp6LwFklsz285sCNNLrN92pBOiCJgZWRhXwBZ0YyO37JFmcY"
+    "oUfGcnK/aGURtOL5bpVn6eIr4U2rLh5fZLCmeZHgAjC41dFlSTzqZTeA8eLBL8bxwyXB/y0Z4+U/"
+    "DuDu+5zEtUjnmonvWxvpfkepBwBoVjzfLcqok9ffXEA5Nk9cRN0rQiyhlRiYLeNimmLEoT7K8kxy"
+    "M4ykYAj386j5Qpv4mKLunwkY5/WlPpRB44CGxzGxM6QK2DFMSRGDpqsCEl0TbaXJHYThgiznm3aw"
+    "mmLkDYLqWmwX6A5wFem9jCYCia9/Ob9VgEQmLL1Ac+8SE45/4IyEaOqa1IqfK7zRCMEzIOdjq0ao"
+    "/Uf0QIpXZrEsEhFA9X9XOSxZyWD898dUPP8Kz6JEEXyVd66ROmYp2Y9Hg1vtRjp06phO3o6K3D3b"
+    "1fe+ax8//kUx978cubqwP3kZ2GUw88BB4YO45s3dhd23ri+/qEwY17b83X9u/97sps++BTq2t7G2"
+    "rumhwZKxSzynIfydhVHSp9FUJ+HlpqzoGJ79wR81kCHlzNSk20gtkEGBTgBcc8N39nOH/xUM/Y6c"
+    "2Yq28NG7cuDFuHTw437l/RGHxh2Juf03whVVwdXOKkTI0F4uWqwSJ4spBMQURjjOdh5jLsbUobHR"
+    "MkA3M9wkAjLkq7GOdA1thLcpRRsmAek5VuELT6hSVjmEmFDwnHYHscQrftMbhwMbDK1MKjtMfZhb"
+    "3wlHTbVnmBLLtwqG2dkWTxnXR1lWkj7H0TckisLKxVc1hAywKDGI8J6I49C8pYbbS5PaeZXAf+RT"
+    "ClCSXHkllIck3nuA/EIXVh4zMBC+Y5pyu46RTbDtQ4UI8Vpv5tIaC6AhWPvMgtX3kNKHr0WxY4eC"
+    "wP/m4DwEiPGkcZQBbw+BLVBOAum0VOeIMWQfUTaQ+dpWFR8TM7EgovODLzw4Sic4VAmTz05lKfyt"
+    "oTW9TXKDckQrN2q8W9cbQH57W+Y7iAxmtU1pdkD/ZfevUHNz770x+69B0NS4/km6MfvQ3d3v7a53"
+    "77ix+5tTS8PF9dnR9qQ+HntHhLod6YdcxoTqPSHycQj/UGRG8+VPl0QsaIdA42Jzm7n07DxijNtB"
+    "edvuxLS1Fgs8QCkGaIPPPQ8vTfi1BoujG7YdZGDryfhRMxupHrjoQ92Co8mwvrqEbsW/Mkm6tYvq"
+    "VRfNkQygLbFBliVrYmSSPSoSChvJSlO5X9Ar1kzTijWbdKUj6CxdKnsFtxFvcqb238vLClzDiBqU"
+    "OrxwAAIABJREFU2BHxkm6f1C2ndKyA3fHiP9mGTsnIt+rkx/FsLH7limRg9FFPwKgQj+nElxfKoH"
+    "Y23Hz3/nB7+2B4fE23xMlG3wMvH1EmujUexQ58imc4y+Plt2KJdMBG0h5ARLM4MwQMv6Z4eS4hBQ"
+    "LeAQj6DEMYQXhSTWUwGehqkwRZKIoHC51MOwBLFlircxrEGNAjmVB6gQLHqNX8yTXcRsRW86ELvf"
+    "AjtOTJhwRkO45hxZc2j1Fu+zau6IvO8sSIT1qGBU0PEt1+HP1nZcVXsgBRN2ycKGkZCth2R7My7S"
+    "RjjBSM/h86s3KQ3BSVtJDio08C5W2vxtInxbq6dcYLQp8dlH6ziwK7YwkbQfVJ+qkA9qbymJ72oP"
+    "jw6O2lg4PPPff4+f/ppz7x4u+vzZZ48Og0nHrgIfNAWrw2dQdrG5fvHl389K/f1bmz2b3f/O9X9g"
+    "4+NVs51sPMui2ePsTmjFsvtZHi5Vw8c+rOlo7hfuTCMwET3A8zN2hyUJ40M4B+4Dy2uYMpI5zmCZ"
+    "/J5BGK5W29/GxnuDi/M2ys3xiu7t4bbty9pd9jw82jq8Odo3PDtj43cqATvEuzucV5VMAkBaKTo1"
+    "TbpLj6eRay6Jfe6vnY4VHA44lSlldCEVyB8STjAoDg7YbC9xiogaTGs4U18Hk8KtbkyWBbBDR+dO"
+    "3Ejh5XiTP/UrbogRubM1bDVAJBTELbDwj9JisXpXKQVwwtYkoGLGoTF+l7ItPEV12mKU37onERGf"
+    "9M1duEMsjwsiWy2pip5DavNQgnxtQndKXJgpOnzixbesYYPYLDpxnFa5z4ThJMFEnFYDd6ATrKRb"
+    "YCMhSlXgxZwLT+8foBgSh6ILgEMWjEuA2QQ65wtpj+FVDscO6kTvOVDpfDKlXu1luxdUqqb0cuk9"
+    "ymnQarv4JHd2x4r/XRb/Phad+OtimB/f5ZUoYF1vr0Rdb6EopcIEvHR0++eevWz7979/g3L51dOt"
+    "3QySc/8uHdO/fO/Pofff1jy5uXrvktKEf7brS8bmT/4FCPvqy4MeVh1zQsNwhKpgE0GwadidctfF"
+    "xdckd1o9BilUbKn+hy1oBpgE0KUAUdWAhyxYwNERsO80uBGzQ0CnQMcCu1UQGXBaQaoWRgjzcxrC"
+    "AFsK28er/eGhn6GrggVrB8aJVmw9LlkHkOYHxGQ+TowNjuoPCS7h84YGwyCS6TBg42Xd5EefZLOa"
+    "DjxwbTVz1GuWxCkZnn/bxpLluRmY0kvORUfvnDMDaLukfStgmTq474BRvhoyaVKHu9IWMyR47O5N"
+    "7WVbo7e0fDYxvi0bcGvY2DEUWK5AQdEqjNbDJVH6LhswaWYzR1xiAME2zxUYQYFHjZNUKwC3rDww"
+    "uu8yOkVPnqJvYpUOZMshQGOWlvTkNDGRSQlYCNoSyA81kTxbclutEu3mhDyRel+SjqRLT16yDgyI"
+    "6yCkmoSShgx8K2zA1NCDx4ykewzY02RG2MDRD49jdKmwa4/pEEOo+9Btn22r9CxgrIi6cJSs941R"
+    "VKVFiu6rYYTU69KxE/qk6UdjtQ+1rd1PNzWgwyGhC63CHGk2qz9Hu1l/6zDiG82T04fHv56ODXnr"
+    "964X/9xIef+8r8dDNnP54eHkYPpA+mZ/IZj6Vby8NPfuHewe7lw71/v7a2t/3xtbXb2jHt+Lq0uz"
+    "EdjXHWnVv8DCAekjkgTz+SdEQPLuSVZlBBAHhvDittYmDkQWfOGvR5Az5Xs65n7NbXvqtv2L05XF"
+    "i/PGze+uHw5vEzerbu2nBHPLt6gQsv0Jpps8kbkd1nBXe/tsiWiw5hbYPGg5pGfGJVajE3IzZjkP"
+    "4E4IQTAwvpnBy09ViZgGjkjf7AL6HxXDAOSoHGktA0oa9SyRh0wKOjjOEfnQu+Je6UGVmh0swo80"
+    "KTGFNcvAmv9Shv2fCjo5gWMDkDRssvJaYNNyYRKpokAu8j+OIOqGR4LC+iKX4KX8gYtTRI8cKYRa"
+    "rRocdfyCNenCZsnEwWo4s4MWCqCV+YYKLN9Y4aCMXXdZR0wO2U3lwjJgFbFN5TQcAiC7TvTqKdNR"
+    "3ASSjVJ/Bd1q5Luk7bRntuUbZfGZdNMsljr/1URIYJx9rQbdxGi9b9vMoIXjYyjwpDzq5quR3bBm"
+    "FHu6wv7Y01qDp0fGIaSaLZYZKcZr+J3ms2PR/Lus/P2Kpv9Ql5fXZ6+eD4+MPfvf72hy6dvfRDie"
+    "EM0SMVHrUrdMtf+dYPnv7z6+9+aunM42eocZ6t4ne0r40df25U6bi0DhoCMBZbvhqk6oWOhsvmoW"
+    "8N5DmccdEpmk7TmGiiMNAZ1IwsL41MQip4Q4PQAtHwbI+OK7X584JPecuMUKdZTHKbZGylgWfzk0"
+    "3gQgeq0iFVnupgacyiQR4/9306R/i8aVOSAYUykbc/zB8jPDGZfdG5sdGeku+ySCbbtmeCwdUzXf"
+    "6OTaGPPSJFHz4QjUWJnUBX7CuR3tTWbaaxt/XHLndeOvmodxju7hwOt+7pWbpz65rPOTvMpq3rSD"
+    "pVLnqxnl1yWXmfDCFzZ8sNzHD7CSNds2Vrl6XoSoZzVaD4B5e4NYkfnkWYsjQ05UjO/MiyRyJHxy"
+    "Z1bInINV2hRj2x0biG2baFFHw9trU4wHZ2souO5CpFWYNVC8jCbtpmbIZnlF1pYIQ2J7myp9yDbi"
+    "YYbOvg9AQfVOuRHZVEN32IrGmUhxdLscU+7bRI1BrKPQhvOea2kUxA/lM7PTpcHuZrW2rQq14AYm"
+    "SeoRM9LO5XiplAWBCqIPQp2r4bl2QdHhzdOd47+Pyzj5/7xU9+9IU/mC8P98VxGk498JB7oPvq2s"
+    "Hq1vlXj65+/F/fvr47P9r/w63jvf0X9RkZdT2+wKH3StMn6S/cDs9AwFRE8KJUfdTdzz0WoP/cwc"
+    "xDJzOx+5l3VV6NIoRb+AtHovvdTKO9Xpqytqa3Ym7tDht6K+ZlXUa8tbcz3Lz/2HB7+cpw92hjuE"
+    "9fl5hjbu/0plB5D0Q9bqA6di1pnmT2hgEez+3it35ssCDGAIEYC5BtpAshfMYj4h47XSxsrhD5kC"
+    "IXG6AFyQFpmffswwYrtgT8arboBm1jzOtcUqJhiXzsuS1wGKPHTDrEpoblxCYmLWwtEpM2FAtNgi"
+    "m2JfFEe4u2juYjlgUhm/AaUOBRX6gip3HAIqSxBVhkIX2QhJZGIG5RHQN3WoeRb1r+KuCIa3rLCy"
+    "+4UYcybhOWpwz/locWKBNI9VWp9vfYHoRjveaT4OKxfbDJlqYlS7BEHboOgVkOCYLtT0y9EVK8pK"
+    "FFJj/SXs+ZPFqxITxs2tQhwqY45YlP3SIkI+so6K3WtIs2Zw4hRvtIx5hRhziVVg+wfOZZ+n/KZB"
+    "uNDY1tUbI5Dvf3n3vlz7/zMx//4KU/WV0eHrkXkD1qG7r5l/7kLz++u7L1EVXW/EhX55Y1QHO2nc"
+    "8WrPSnCNRAuDrGs2VslrhyVdXvMw1qId7IpQEvGnc3aG/uaDRu4G5JajGaOHQFzWfmpY8m1g3dGy"
+    "JgdECeKaAxsrGoWxqBpyEKUxspt2FmBNGShhYaQmIWr+ocAvUtezPdPnKoMptHR6nkmA5IxuzaMK"
+    "FDfyw4+cuGjSuA2bRiG799bYLZXFmK+FuE9QkfO2ITnVylszwmGz7E3Z2yY/SwQfYtkp6g0smRjx"
+    "7KiL0ENrAOKvOiw4LljZlc/YSXEPuxTV4c7qpO37p3f9jb09UUAe1XxUe8JGW+KsvEIVrqn1tukI"
+    "0kvifmAReh0glNAuVWBt+7PhqR8ll+2dwcHY/lxt+SgWhiJNj2rk/lffYKmoI1b8sitn0FQMZ7N/"
+    "TWYErIooNUhRGQMvioQ1vkBYi4khePcfCGvqQ4AjK1sV1U5ltGykz7teKRHXj3DcsQflo2fwKgqn"
+    "8sNQonYrpeIztI0KOlSgRakPI7RlBC1yd2YbiCj8rajnHx1PKEUPuer2+JjZM8sl/tpxddFuP2aM"
+    "kSSe9flNuyj4/vakP3+09cPPOLn3j5uS9oM/dI3vJhZ54efmw9sDRs7G2cffLbh8ef/qV7Nw+Wl/"
+    "f+6L9ZOVp+cWVVvUV3FtPv1VU0eDHWK6g/uQ+7HzLy0AmZ1yBa5E0DoxeM4ODXTyftNHmYlj6XHg"
+    "udfsiBlI2Sb9e8O2yduzdsypazO7eHrZW3hjffeV1fQbgyHKw+PhzPz/hODfh4I6Z6edTJ5nGcQD"
+    "SziOxjxtMMYhXSohC9zH+MLz2O+uq+xwSz6RBqjk5iapme8bAxjEZWWPODNZjnmEuE8IkUSygqua"
+    "gRQsGbZ6dIKyGfZLzM2GQQvBLCfOpggywpcm0Y9kl2kUCXdABTeFsUGuEhMa8T1pW3A5sCJAmRRZ"
+    "Yzk4OxYR1pclVSRGUr+p3swwgQvMQSeT6SLZCVyDAqU2QTze+fbLpSHT5lXG/Ngs9kQ+uw79ApWP"
+    "zoGhM+f2N5WnjJaX6DKVOHkp2sdFWZsGmkOpEpxoaNRA0PgvnfXUX4Vtc2L9YarJngk+2ig5OASN"
+    "Jp68ZWWUWsPl7NvygX8gVIKIWxRCxKWD5ls2D1ccXUZ0jlQ6+rYC/tIiSVK6zlWzPBo/zRId3k4j"
+    "u37/zkG2/ee/zZJ7dON3Tx/o/m8Xh3WP/in3zjU7qF4nE/ICczvZljE6ENgq+A6Y0hNFzOoPdGi0"
+    "5GQ2bUO9TCfz7X/fW6PZOzCYzlhO6w8Pgsg1poOmefJeE1+9kgQs+midAdwk3OV79o4EwJ0smmRf"
+    "KgQS6bTmXMZ5uE922SksUr9YFl0wNb4SRnMUAKLpoesrwZQx7lVcRkSkxTJ8R+ldkbKTaNKQv2NK"
+    "ztMQMH4eCmfFKlwCbwUP6KfEBsDNnYxt+6AslGV/7qScOuli4kuZyShYy2B/+ONqKBynG5ZKMqzz"
+    "wCceYmMjCLDq7ztHLh3d39YUcGrYoPXfiQ6ZlBSX26/G5M+UpESKJgyHQCWCZFoQBXGBPKF0+jKr"
+    "YtC4bIK79Bgv1RFv5IxBcPCDJtwWQD5vVRUpQuTiF8lthyAVcZjG6h4UZC81mfwaKHbCy3M6UPcZ"
+    "EXb1rAeHiwrMh+LwzR0e+yW5XyZRpR67Bg6aOtpL2mjQCnTRFoD7ZF/Yg/ggd6YucEVYI02KlO47"
+    "vgZZPtNW9xwKS2YrQO4Ff0VsuNrWzoQGdOUwpbo8X9x4a0TQXXpw5u6+zIK49f2PrFT3/0A39wZm"
+    "N2upmTD0/Do+qBzYPNc1dfO9j7+V+5f2t5a+XwS//17GD3+SU917yk59iX9Dy1n6vzxoe+2v0ucx"
+    "w9V73efTC9WL3dHRoY44vmWb75RkfkuTzNJRrUQ8omj8HAgf5JQgfmEP8keXZ3OL++lxenrG8Mj9"
+    "3/wPD67s7wzt6V4fbaleGebtlf0gtT9GygdIlP4hln+IvAGpOEYhxiU+dNHBQMGtYPkwgE42gZxZ"
+    "7xqKR5rONUaELGokj1yWHAEWMCy5rkLUVy0WK5XXZ0MXbhW2wi6yOyF+mGj+OviLo6KBk80E83h/"
+    "AgwUUVMhINUia+iUqQ0AEzU5uSjCVHPsdoK9Q0Kl6XTwa1TU1S6CoUWCUTNYnj+P0EyDwt731YHi"
+    "COrVM6dMf3IU39Ka0CU6dNa/+SM+BkWT1/qK14Do+Y8hl0CIlPuw6sY5wDF3hIo4cUobUnNz3ia9"
+    "eb7PQJSOytSnLUpiKF/mZm5KXEjlW3rFtTv1UmkWADf5YLX5uhcpRWtwevBy2yeK1DnFJB/TmGWb"
+    "5hbWedLQs7qpJdZsHbfovRAdLYEhn0UwHX58trn/zG99746LNPvvBtkXDrwCMTHqnPFvzh17/34X"
+    "/2+S//tzsr6y/TALhK5KbiQY6UKphBvdqCr5ZxdUwYJgwWkEL5ahF0/qvGSZrGy69aWjUCSy0YGy"
+    "K9Vl9yaFw0WHFJp3jU+IAT/NyU0t7E6Oyib3uUmDRMNzqobAf0XEVa0W2jniAwn5bu/9hMh/Lm0D"
+    "pitwtLuWyHZGIJ+sUX22SrdFsWShRI90aUPHTA2u4erNDlTj7BKykYZSTBBIBOZOoguO3Ff0y8yv"
+    "KMoeWJHvmkQ49fMgkAR3/b6DND5EXqiQrZmtDhRC+1t6yrblvLB8OzF88Mmys8B6g3WmtDyZsJj7"
+    "SQWBKAH7fL+aqYlba8LM69UZTs8Wqpy4RSiOMnbMJkl8F2wBCcYw7wEVfZitn58GFxi439pqmDfT"
+    "cFlAH2CXAT4L+07ROkoC29oWg6CSv28m/8TBF72AXf9nUdlJBEIniwjkBMaSlny3sQZyEGjiknXD"
+    "7J7niKtWwZhZ2Ur9soNC4PFicxZXM5RrsolCEtp1hceDZy1XZFBYjzLGvrZ4eN85fqG4e0SyYzWa"
+    "B21FJ4gQpV3TZipprfnSVdmXvszOo//sxHPvA758+sv2n14joNpx54VD2wNKzur2+u7iwvX359d3"
+    "v38Ojg5gvLK7OzS0t76jR1eyT9h2Uvnaz6o/uu5ol+4yRjMf3J3Uw0Hve9VNY8Mqyq/80Vc5ukYo"
+    "nyVTsWbpZXPW0cf0XA/A2r1nGzlZ1ha213OLO2o6t294YtnkXb1cnJYU2yVv0sLDdXZnyVkUdi1H"
+    "N5DnomLUuB2E8RKA2BeSUqsR1E1gJGAtA/K4PpqO0ywuuTVs0/kWo5mA9fy5Uc1hj4Byfqn7TXKF"
+    "aWA7Dx1/Cyq7PE0HQgaV9jgkNs6RzxhJwc6gtW9kEk+IPhJN8DNKUm42ixtw3YZAR6Su4EZ1XQWK"
+    "GOJJrOsL/d4b0Wn+QzftSTEgLjt1Bpqmq3TSMY//4Fj+SxrGQUUr/B+wiDBAM3nnUcxRMjJ7/xBX"
+    "oJhim2fwQf/URaf16fVRpxwOClf3k1gip0gfNPB1OFv2oZDthD4/WHDXLbNyUwBElwt1kYkJkDUW"
+    "RbltPCQSQ+bLJ+Q5oOPJgHg3RAkgFAMTL4j43kmavtG3eXpZXb97dfe/6pp76yvr5836wPinxI84"
+    "/Mhk7D7Mo//he/9ve+ev3OP9QVuou6vOoGqknEGxdvGrx5U02pstnM0XCoTBoDz1mlCQDrBpI0DY"
+    "OBk2fxnNaCr+N0JuG4BYuGKBxXqBDsDZsatmazNGo3cllaShm8PVnIHt/6J/5+EQntCZu5UuardL"
+    "JvvGoGv21M96IclImdTs7qudW6w4DCDgJxN2zy3tyWnJReQBiU6UkBse07b9JkB2Xmj4DduC6dk/"
+    "LI5tJHGp8gy35SOjGbZq7CwRuc5UDvq5yRiyF9ldHznO1iUg1PruTJZGTgABqBbJof7Q4fuLClh+"
+    "B5gQq3z6r8+kYdL8RZ0oZSX7IQlBqEK+dXkdEwfESAO4NmyjuWk/KCc1yuB1J82fRLgPJsPg2PSB"
+    "ilEZz/QRZ+wQ8au6CADbtIJZcjNKYq+a0bKDz8CB0nF8gURppyUO1jKJke/EsCRYtFobL32naBPH"
+    "i3ANFiZcPaNuJOQ9rpadxmPEg7isaQCgsaKyx5Nr5JxhiuUY/SvGmPoqUPKB4VV9sTzj5xd53pVq"
+    "1LWjPqpX397I/V0H5EoJA2D1AZCfNLVY6Ptw/2Dl+5uDX/p5/56PO/dfHc+nXQp+HUAz8eHpjvzj"
+    "eW7xwcrf1gZ+/upaXjW8/oCt2mRmD1Yo0gdDA6HlfbGBuy07JreFGJBnp1QjpivJUoPcgjosZs+K"
+    "AZhwUeiobQOHZuwnMm0BOIELBDzEtC9HzdkjaXK/O9YWv9YNja1EtUju4O69ypIiGH+8w/fNpg1/"
+    "Mcb9H0JkdjR8YSSkGQPOQ6MO4t0qS8aS1c89lI2w5x5LUIs5cMj3EWgn8gbSrFoskCXWC/9GTiB5"
+    "OygK+TpeKLprgHUYQeo5HbkoEv0ouUoWNWCWyZ2OOySUlMHwlFkvJZrtKu9lZioxa0lifYKBZbGK"
+    "sJI23yHKPLWB+CMeFJIQuS903B17/iHvORuWCb5tOGJ76z4ZM8ciUw8zkmLXDtF2KfHJwWutSN9P"
+    "BJ8ZgXnrrFFmzIfFxMeAViO3pR78Yih0TJMp8RxdNpnMBPhIgykxkjGgz6g1Bk2qjEHuycBrSWZp"
+    "sFrsu98A3yjCj+VhwtLmXpsT1K2wcu01Sf0qU/61gR8q8xICdij2d76tTrG+t/+uyVs69LYyZxK3"
+    "+4D4/MM3Q3brx1+Xf//Bu/cLy0cWlFg1sW22rMteFQ1buRuFnRw1Tn3GLok3Wi4dttbKZoAFnI0j"
+    "hFp+CGW22NvBsscN+7D4TGojYhcmi9KalGlkZvCk0KbKzSrGlvbGrc8GNO+gSdUz/LQaZC9GRwTl"
+    "6DtFGxj8brjq64N0YIA5bORZnYHOrMqIJp2VyqgftKm3CUmTnBDV8HNmKLLhID4TOdNz8YQMcRre"
+    "xMOaOPdPSWDSIj7w2vaPHA3v6u7ICOTV02buRdbk3KvroquDe02KI0euQNz9WjndDOeZ5JulympW"
+    "FH5drWc05ynJ+dw050cz/mTA8vQcu8j/luKIocUkwPwNYHjwJ+gpa2waACW99T7nbmBYWg+o9PYy"
+    "+0KqBlRF5tYIFbCsJFxYRlstDCgA5CwJYkYKBN5ZY0EpbO0jfyWkofIO4SKEaQQGGhDSVdauRvZJ"
+    "baGBLLBbTuEjtRWRC1g1hu+ZS9A+3gwVBmyA6l+E3omxYZzUvsPDqaWYSGN0PF0KEd3KLkAlCnQF"
+    "w+U5iDNibpTssBSvEylA09P7epTVvKxaKO5291Adhy3bbEYa6yXZL31d2+dW595Vc+8cFrv3vp3N"
+    "ojd79+nHR6PPXAX+2BpeHsvc3HnvnLo+Vf+KWdt7efmO1/5z+dz3WlbtjWeKr5kL6kq17cQslzYf"
+    "S3fAmg5hfGRvcpdzZ1uJqI1XHpzw6ANDYzqOtJV6U1q3uCTB/3d+w8d3S/riuE0uUrbroNdPlIz9"
+    "TpcwerV84M59f0UfLbt4a1/ct6ecqVYXvpzLCzsjns66rdAY8+8HydxxO0Yyd6NXehE7uwl4EFGs"
+    "2PsVK6DGr6sh+6KgnzF3eFgAlTxrlkoDOpdZO0GpHaPWw2QVtZ+LDRwYRWX2JlE7gSybzbYRxnxR"
+    "PLIJNFLQvCRpT4BcCWWxT0yGrbkwYVJh8xoWwwkwUrdQJGmUQIg+As3YgbFL6wgOJHQIRJx0QBFt"
+    "FII9AJPlgcSs+YL3DrwAjPLyrECf8UHZF5dYg3gxj5ySqDD96ffyq3CCPCR3SzDjGvhSALjdZqwa"
+    "Ncw8M86kek/mij3GkCrTmxp/UIhq9B+ES35JBHXOsHEJKsD806CqBs8CNbf25rAPSDD4VUqk/qlH"
+    "4EANch68OsE9tXQYbXNtsWtWHkoUzGhT0x2gBwcedYY4TGmdW11fUP/9n33/jEp19+8iurep0CJI"
+    "9CWPTkh7o0x8Nvf/k/vPit67d/9nh5dsaVx+bMV9QoWDYG3O6XjYdAquW5rtikkUJBE1CDUmNgE+"
+    "FXj6txdIehoXixp9hXjWg09YPVjUYSfKbe+TQsSxZdB8uRDP0rBO6NjgDdQVquG2fZRMPGdg/62K"
+    "irfgc8+4YNwBVHZDom9vcVPfjYPPI2TXeoNkc8XHVUVIv3yMKyLGyxiX7SV9miJ74BLpuQUbdu9k"
+    "YYW0hTRm/QZAvykLUiO2Yr8PjVZ4LFGPCmsW5tvDyxYUk6qWVqMIC8afnAel8NxEYGBz0iN+wfzv"
+    "yB8V19tgDfclaGTTaNnWlvxsSJt4zDhbHBOoRJlnjyg4MCKVimJUj2SC9E0FhsOm+QSSFeP+spGa"
+    "UkcJFbZ/GXNaUv7cK2YTdyEKdDkTtBuu1zWvlFGCkpMoQLFNKUtW2W3OmQ2K+Qo7f8MWEebTTMhT"
+    "BpSODR36hNeQL5yEVx0Zfs7p8un+xsX3bZLACp0MNMsJjkR12Aq5zWpTwU4OFqnJnRox/tKkF5r8"
+    "2YMHW75caWTvjMNeeoBZVKZEHNPJT2EPkSJDnHh4d7h3+hW35/+Sc/9NRvPXn17HVUlvDT6NQDPy"
+    "YeSJNfWbp0sHXpma8crf/9f7W7/8RXD3f0yssjvv+mH2O6vaGrZe7tmXO6X9KfGNiRxGgrBv00ii"
+    "smH7hwJtPJOm+2dJ76WLfi6820w4F+gvGpEW/sUGYZyFFaY6onBs7OzHd18uad4aLeaP7iU98ZPn"
+    "7tG8NzG68MTxx/a7hwcHPYON7RTZ56Hl/P6cHqoA3esX4MHZzwYUsaO6VXsn1rv3C5xb9wKGQs8W"
+    "xUZZBNyMi4VNIpIwVDpmKXUdKBEIyquGEZx0sOMuHTIOY/iMwk+fhAYRxDncuh54Kp7sW6IePswg"
+    "HNWPKQuxA/sZHRUla0oc12Iv5rkaGMGqdJ+leJzseA4EbxEu3ij4DkJ9n3FKlt7XhK67TKis746S"
+    "QWXeWpkwjg5XvkQvdXB/qCpNTPdBMG61Xe60KQJRebOrQu5x8oCG3Cd10VscviOkJJFCHSv/JOi0"
+    "AuJ3x9slvU5FnzxdYIbHnNnzZID1kE+0D9JnbSF/iLT7v90WgsV2vCBCgkJSYaZFor6r5iKW7/Ra"
+    "Aocngu9uBg77K+Wfyz3765fc34R+TwSFyhY/H1G1985ReO5+efW17VDkWLdwYyHbzZcFoV5gZWGw"
+    "cW28t6K6RaodqLFvvalLDQ52UoBDc6N9I0Im82BGRgo/HQiXrDxIaKDQg/LwrFh3plleetjGyaeN"
+    "EImxpLjk4P6jRe9KOHhp2zf20Dk0M3VmL+0IsdzEUoStNVUmXzGyQFRrf5jGWTmo4ENZswNmVti/"
+    "UKju0ZHNQ5XVY6acpJTPlaZvyAlQmxKWXLlSzSDOI2UnzcispEa5OlO1rHxbDKg/5+6Yn9iGgKR1"
+    "DMhpRvxXFCpypIczSTVq58IutQgnd03fXGfb0YRWdWN+wnvXttQw+42x5dGZUArOK2OAJRvJi6Th"
+    "7/9EbZBC67ash/cJBKSBnLqBGOr/CxZUdV0RMJgBM6REWBkBz5YcuRAbSD7Z+qdVliUVO1/rbLOi"
+    "UAvEuBHyQj7QBhlDkaOkalS+BTaSlP5KlU4EZ+5FZ5q9wuO0T6oZPD2OZKQfsQW6GhbcZTL6uGAA"
+    "AgAElEQVRnoqURmtEilEzb7RMHi/KBj27a3jhJle6UaEFTJwNtkLj0lxB7SVMoLdD0PcTZbM3fnk"
+    "vvoS8iJ/1kvOItO5FjuOyfHRx9Z22+9Ms/8cGn/vnTT5z/tkQ9Ug9el7tOo1MP/A0e6J6lF0guXX"
+    "7nsadWPn/v9YPV7Xd+5ezG4Q8/MdvUjKurdL5dkI7OnMTE5XGOPkjfZM6RGovKBgWlnn/g8bg06j"
+    "FcPVc8gnE1Txs7CzCJTsTXOIZsZSIYfbpK5yt7K6KZvTuszm4PV1ZeH+ZLW8PtO/vDdb1o6/r20X"
+    "Bz0BW72iAe6vk9S5BMbuP3+OkpBCizTcYyrUZSJtH5GXLlmbNYE2i4Ei5zX8Y1lVcgnxD1HE2esa"
+    "3mXsY54cexFfYax2HEY+M4VrQCiEo+UUTK8kQbSQK8T4AO6ozKonUlAAsEHQhjzMPe0IO3BSQcTJ"
+    "dUEUFdARv0s3mW0oj3iRcKMMGhJan4YxiTSpAecVIyzvcj9SLR4s0j8CjH6QhzWcpg6KGZ0jdMYA"
+    "c81fNSw4jblyl38u2nUV75u/mR3etYlEJvORU/mLc+cG5DVToUtgITRM4UlmfCG0mcUplVvLGHeA"
+    "E3jXCxrxUk9hoVGSEXHyLxS3RYntWIQEBajxuE8EXiPO0MEW2r07DoD56WEz8Kqj6NiawnWg4ykA"
+    "2H1sNnlPupV39w46WXrz77TcuLSQ/18aHf0FFZr75269of/tn1/2Tr0hOPHfPiC9WOb6VUwt9V86"
+    "aKwZ0zElkU0gCOa/PmMwuSk00O9bmoXjYyHeAh78Yj2TSeXnQax5UqEZMmpHEt8h6kheq4ednomA"
+    "c+CUCG5dh+GmvJELAXrL6CJVv4DIDtEC3PHXQDZ+KgPOK0P2jV+negQaccXMWLP7CFq1gpm8gki4"
+    "9uj5vWMsybCgny84TqIGy8XHbRE2SGYe2b3iSmRCkHC27efLnEpw2k03w6tK+xz+VAmMKKy0UnrC"
+    "uSlFVOYfKf6yU0LLzRRwdmetHHKoY37uzp8wX7w7kz8olu7/Rtq4gTHXz2lOspOnAOqb5FhkEivq"
+    "PdwFc/6PCVFx1YSplSp0oqAIEFpoTIEqbsbmhi0eXfvrNJLAAkxz4s5YGXdMmxUuTxJ1toU4SRDh"
+    "oFjliSGJlKB2Uo9OR56xwhNpJS2YQYbUe+afE9+JKzEDbSgnN7ttbI7H4HrgV48WaAaCpO+4uuth"
+    "sUtoxERUtEW/LGW+mFz1NOzznAu5CVdrncXlVG4fCfPUmaMloRNmhDN9f3DFfWVCO6fZe+wrO3Ch"
+    "yhRad9H0Y9d3N4c2N29IUXrl76vz74zKVviux0M4fDTsOPsQfck/eXl8+9tnbx2c+98+7HnjjYuf"
+    "/YmbW71zRLqU95u6FbFtmIMTIT6O86uUk3JFt9zYBCM1a7t1ZHDx+0PWpJFjTqm7zlP51WCY9ZyF"
+    "eacY++C54xzhs75dXPZ7OD4cLS/rC59n195mB/uHT3aPj+3fvDG/uXhneXztfcq5PCmk341Ao8jC"
+    "Rs1PiTtARt9oTVrxalbM48f7SdKI8ZTpiyUthO0mUlLqmKM1Zn7vPwLCWMdehymYsGzcDQBnfGWI"
+    "haf2Ate7QbEjF67HUSBfxHmv2GDmeDs3z4pgGb8TEB+qSS1TGYhlrYCJ2Qnkg2tYFkHmCbZkNbfj"
+    "khBQ9MQtkJ7zgPKd3lNyU0CtB06HTHDf+b4oWOhRWLVPRCQ2jZeI+SGE7bkD3gjId59DNcE9ubth"
+    "WIoWWF0tQAKyCxMx0jb4Fv+1HZbdEEAcSHJcMgpbvt0EcSRoFhFQ0QesTC75O6a3LFnOyhvNjR0l"
+    "J+I9MuReILDKwdkax/lsWKhtWl42s/eOPGZ+/vPv2lrbXltwV66ENW4Q9xMVQxs3/7+197+dbB7O"
+    "XVtbU0AhZoNHTV8oG+pebvWrkidWZdcK70sAhjg+Bdu6rXac5maKHXmxA2GMAPtGmCzrt9Ce2Glq"
+    "tqajCio0GxueoOSINh0c9ik+6GvjTVvsKWTRWbA2SbDyaammzEDjdUCSZeLNijHxt6M9eNmTiL+1"
+    "Qr4loG9PaJYFkExx7bhQ2ytW+dxAb++mUqvdHCF8ik3OA4+xP52ITZ8Tmw2JeJyreodpfDDmSrzI"
+    "CgkxBvtBGOLmyyTuOl0EEZ0bER5Bty8LEYp27Z8GGXgxKHormpK3Tv3OcsKLfZSp7qYa4Jd1W0c/"
+    "HOdLstm33rFw/8mOJD2yWoyydDffYJEzAa/KgRJkxjYElMvvHAp8Gb+CqzGZATEc7aBrgFm/KSLz"
+    "IQmOB2Ck3zhCL6DBcNueazz8gArF/0IHIxKFqXDjE9hG1L4pYqYSGSwISpHJS0qthYRFFQOChijg"
+    "21yNJJ+zI2/vAcIH19EgEUfqZflhOEE0fZ1HVQzlRE4QnUZ05GkDPUbNFma9wn1V7WNnXHlr7vCF"
+    "6UfJqEtsCVYnNq8Uga2P7+wb2lpaNXnrhw5l9++KVrfymC080cDj4NP+Ye6H63vD/ffPLN1cs/9e"
+    "s7q89/aXfvrPoLnwfQeKy+ycW0cUNFH/YcQT9b9DU70v24YOLl9ku2Sk2pyVMiOaWLXn7Kc1VNt+"
+    "IPh9qAHUon9+bz4LxXjtCLzPqAlyTNGzPdhrmx+fZw/syrwxOXvj48u/mnwzXdgnnl4A09c3d/WF"
+    "nS/SDa9C2vcMcMJ2a5Q4BYJ4D4SQd3nWh2tU3gbY/sY24irdm9fhghWqnnZzryStkksCrrOI6ZEC"
+    "QeEi980OgnIqdbVl9Ryd63bBBZ8DX2NzH8CnazYpsSiI8+QEsohR5r0WnlC47QZB0ALehgUw6zjz"
+    "zKAbAdicz/tz2IF1HYbZHFh8jWPYUb3YU0jSkLHEr725A+iEb29XwIdCrT81/ZP3K0rwQ4wde6JQ"
+    "DN4U0aXuY5wpQHZWMbKP62sesgTD7GGciorIR1ahG3HQtIpUK7QFPuJqL+aEes1UjHLmPJiA57aF"
+    "kpV9aKwigs5JAPuRjgCWvR0LBRiHwLNA10/LJ2J3brFw0aoeUX20RpcmIBvQ5kLciaYb58fHZ77/"
+    "Cnb97Zv2L8I3B46K/QDXsHZz7/5a989vjchadc8dSbNwVUqGsdiDdmVLSSgrII7sFHIKWzsUrjM5"
+    "24vFFTY8mGho1YNTAaGfzIr8DzXMBooNDzbBex9UCmHxsh/rqjeoPkxiWY/qIP2ixaJQ6RCmmgNO"
+    "DIk2Y1cOi9MUKr/n0mQop6s4Q+f68HGWWqZTKBMHkJ7iuYQiIP6yHrM4zuKLIvcJ49yyYTHm4346"
+    "qXr3DYruCw1gtsxXmTZRSzqeMKoPHI0V9sR58MEVmXreNsHLPR9POCYubZQWmITZxhxc96E9kSr5"
+    "OWDMqlJ/CG+wcrukp3f7h3aWm4uqGNPlfx4OSMrOzXNg9Tyi8qobK2jsFB9mAf1dwhLkQB//nDL/"
+    "5PJZnUsGaqOH6MKm5psCwOSjldeiJGMONkpmyCF50mVIRmgjlbhuJiUWJMmQ7ycBSKQk5pKK8Flj"
+    "/C5WPbE5B8Uu0v+ZIqItuoGDmuyxCcPGJHmUYEDxLaFCaFnLWeyoBJPzHESnNaR3jbfwtZPuniQk"
+    "MBX+QRj+0NQ5gg8m+7KVvqycqMnmkjN9fzc3yAnkWX2whtWEZ7U2npwkmO2ucdnT36D889cen/+K"
+    "mPPP2Hc33jHv2n4dQDpx5oD9CLV/bOXn3xL3aP7vzz+7fuXZjv7P7s2saxnnvXOK4ffUkzgxjohx"
+    "qTGJYEK0TgzgrowQMkgbGBfk1MnyTOmO/xCSHIO+LZbc7W162Y6PK+CkVKaxywPg++otFLtHQrj5"
+    "72u6MTh3eG5Ss3h8tnDobXdKXuzXtPDG8eXh1ua4O4xy2Ny5vSD33GI8uTVJumiFmL8h3q4JdQiN"
+    "Z3RjAnKO01gMcmmDI/ioPMGJKjLIAKR+QxCtXRHS8IjkscoVupYgmUTOibjzWEg/yIrWa2zBIEqM"
+    "rYdMgnEMfXgSQdRNOgv7CdiB4EPBCoysU8h+wmKCGjfYK3AmAj3Ukw3E3WsYm7HU34oHUopabXwT"
+    "5UvOAvddBZTvGZVvU8gVm88q0GGeCJc8cPvMIWQdaDtOXmQH9mwgUk5KM9hfAapvnQobTlYA80MJ"
+    "iWtode6rulpu5Nar4UrdHE4VmUzyIFtH1BRp4Roh/bNbxtbQtalMn7NkyED5uIyGh9ELuLVzKgLU"
+    "Oiiw0wcP4g4yAiy6A/C88awHcGSebRweHq/t72S9997eZLH3jMJ2DR9lCHh35D973rb1345lv3f3"
+    "q+cWGD29jpGGwX2FBRkdwa6I0EFe1aVruo010s/sCzmORs3YE+Ks7GrDsSMVfnuBrljucGIqESTJ"
+    "JbsNxxBJjrO2f7e3vi1SZHf3leLJ3INDRKD9xsdNgQqfHZQgZu0ckmNpXI5Q16HbB9+s02WLA3V/"
+    "+kx5urupyMDgX0s0Fz5xJtwOgPnrOJ1idlNHfTC0djp8wYgR+Au5yCj88HSn4PDIvOq6lKhKaVKZ"
+    "Yp/fbfvq5aKh1ZuTqKbJcw5lCk8NDpS77rAJ8o35tjqFzuftsI5dHkgjQvsGUAsvaP94dhfXm4oe"
+    "celnS73P6hHmbHHsnnhdmcDV6WX5fYhCsscWa1/lwIgPjN+mWB/st18Q1qJcO2WKPoBbPNnYdNsB"
+    "RJsiiIhLTP8IcLB4158B8T/KLuQ2DRIg09Ms2nqIQbkDqxirEIkIxtDy3tdMmQ+Q6IWwTsSy58Cz"
+    "qgwHTUT/XSAoJwuRZCFwpMV0JddnMjhvKa2eU/ce8+YIXWgUm+GiuGhX2xxIQ+iEpOdltDsH0Nor"
+    "0b+vBjX3GOVwEFikEkhKYPr+qnl6Eo7atyajN8D5ITMdAAUzNh0Nk+Otj/8yfObv7LT738zL9dW5"
+    "ndkNqFjlJ1Gp164MfZA90lZsP83ceufuzf3xluz/bu7q+s7r/2c0uzQ511k3c0ttMPPV765F3GCR"
+    "bS/LlT0c+VHscC0kKBZYxhjCft8SBQMibgNv9QmtrzvmYYgYTXLZY1SJo8h6Jb0Xyojd+Wnq3bnH"
+    "9zWFm9OVyY3x7mN98e3jx4criz9sRw/3hbWpj/NWYw2Go8z5UFrLVFFnlct2B6jHBBhbVz2EyRyE"
+    "Yvmwc4gTGO6Y85qUwiHsczSKylkEjBjyLgCmZpj3hnsAmWEUNOwYZ4bHMywMCtowAls0GOu0JGku"
+    "ifaC+MqPmHaareQorEESWXna7vQjbN+8VTWfAr/4BJU+Fj2vMStGFx3MhWY9GdaeTfEI/zyYTuQR"
+    "NTP6mGtrX5Ype89546itvMKyb3l2YuXTYVvoa3DPJKBwxVCp6iLazzCdaQiiZ0fZtki+zYdSgSyx"
+    "CwWlYskUjb1zKAhrDFhk5CvPaRbVjhd0EgSz/y6DKmM4L5bqfCKYoG28FCJ34bbRGfX6Sk/uM5Gw"
+    "qtdVeWlh/77hvXP/3pj1773S3O2jzk4aHf0P3xd15/6q2d4w8OW8fDQW285iu8XpidhWC8ql4bKN"
+    "2N70U/A2c3BA+cwGkEWtilEWn5RoM3PGftaRzdeVi0e0NWuugc0LOhYONFo/MGjRao0IMqtniMp2"
+    "FhAw2zGx0GAEenFo3o8jNfELr10bCBi4WfQutsewBn48mGjAx6il+8bD74YwPoD2zbTm4j5ZYQfK"
+    "V/OWcspwxEdhatiSmjz26IGP0YtK8NL4HbIB1rwbuv21xRzcLXV9nKcHihxyfoaz+7AsTMxs1yZd"
+    "uydPEMoJ8vVIzt6M+mCZ+3b63WRfZ0KAQT+qEm7re1mbx+d1/fF6Jb7+v2uXXXga8uatLUvnbYw0"
+    "/Si5/5kwJMs78sWSCUEXlwsN2xnYf5xw2YCHz2p5kQIlnYiUDsT8XExyYzqPSa0FDTk4LHPir/wW"
+    "+W5pPs6FcCPWUlqRCWcgNyyKYRG0K9kD+ltbApl8vhBcYJmyYkStpMK57ABcRc17niUbIS6Ka90y"
+    "7cVi0DalxXsCmDMe9/SA0hXwyUbeJPy3ZeWOShW3aR7hMj2E77N1J9RRd0h80tvd0SOGAk01c4ia"
+    "M+ZIiuEKvO944Pdl+9sLr8q5/9yAf/zfrq7AfCsQc8DaceOPXAxAPdRwU6mi2vv3nusRe/fHfv3a"
+    "d27t7+0Nrq7Wt8J3xZV9GYn48YW9lfae5aYqCms9IPmQeR6c0SCQWPMelwjNHuxgID8UwuPC8802"
+    "le/TS3cqulkEu+/VFEfDDcJ2no7MjTfKB/urF/6GZyAcknFmbbw1ndubm5rgt4x3eG82/fH36oq3"
+    "5vHlwa9vWS7V19B/VQt1suHem7lbpUr9OYMFs3MXeTsN7wM/sSDAW2LbPRw3iV0beI+sE/GIBhed"
+    "YAlIscfL6bRhseXozCec6GCyUclPaA4KQUfCcL4xcQBdHYX0aGZqR1+eGHTLEHQhESk4cfu9BjmC"
+    "INmND2+NvjOvSmKUtiJwJK8SQJj6EtEx4bAZHChCWAybHUNEnbYTtFZpsnsctOPoUJfqrLoqusTi"
+    "/UtyzAYU/Zi+w9EfXVFkTFyTyScVOHtr3NIc8a6MHQ81uzOo8PRe+6EcOoyfWAhJa6QI4osI0mht"
+    "sCIsV2FQgsonwxQH3ShHGmUT4I77JbATVfgbwC5LRjy1UmtR+qhmlFWEzFbSZgVU6lstaOLqjwg+"
+    "MuGDaf0Mkad+nS7Tt7P/fqa+9e+ehz5x/6DV17qZz10EXrf/i1b750sLZ2ZYXFlX5pM9weqc2BF9"
+    "RpNL5yJqQrmMrWj80G36VYXB3I7X1+42VtULoB4JlOu1MhQCFnMrLZ4CoWeaTTuFiUpv0IxoYhGc"
+    "Npdgmikx1sEtOwyWfBCB4edwalkc8VAsMkrxe93QXIT8S6/ClpdIA3jWT1wODOX3oUCc+ViegHRz"
+    "lsttL+7IEUjOUXwmVWjDu8kXVKGQGwmwE+owNRrvQxYY96RYNNbAj9bFzlkRd/xbf9tqb2oX2gAY"
+    "TpXeJix8grbi26b+8fDW9tHwwzfUeMF7xgDxM7r5COPjEyeWow4bwqFCqcn8tjcjQH5rPJpj0xmE"
+    "IPjWKf+RSL/vOzo8glUC8uv+kzTDWOmDLiG5cJH9IADExEnp/FWkOnwxcq+Gqixxb92KSEPMJGX5"
+    "dp7cNS5bYJozyJRWZ1HMWWT51THoLT2Nqh6Np4MFbV8CqHBHXxQmHCGOWyIm/UKSRpIuBoL36XR3"
+    "Dnp3Y0HbSkxUhZaV8twzbAI4CbJpSVN1BZVbeeiZnr7Zba0InfV+nl497QIZ3xRX7YPdzbfXV9Ze"
+    "k3PvLstV+5fH7tO9Iq7tNw6oFTD/z1HtBz7PMnvr9x8ZO/vTt74d/tHly4szxsiIWemnl8iUcGal"
+    "PD6JTBID3Z6fTyqGFcpo/CWz/Gj2MWmfrBHR4dEcFmzgnuzuC5Os15u9p47SvWJxUyOIgQRk74IR"
+    "8+xiS9WXmY72teuTE8/vhrwwvXfjA8v/WN4ZnZt/V5Az1bp2/srUmETxyzsdPbMI+0aTzWj7dhst"
+    "nTtX4NO5xmlk7fIUKaNQBzmuxFtdKcRPMP5Ur7hKrHNOZowZjXyDsNBJj+BWM+rqxoKyDTf8jvMV"
+    "V0/JMXmdj1S8ppygyMOEmITW+E+SKjT5bDTYDHUkVjfsHIW0yJAx4VcAXX/MhwKIbIaCOEmRJWum"
+    "WHMcApWeCLI/TRjx34GC8a6jipFD104bWehZixfA2KjM4R4zMdy5jM22REieCJwNRNeBtMfYYu9L"
+    "YVe+EtodNyIgP/wD+Ft56UJTa1CGhHu5upDcAcCCuPXuoSPfCYPEIXNE0Mr0KLHAkEGXUrMbafKo"
+    "+ZmsCwKEcO6xBfqLB+XFDSRRL/YZ3mch3KZOlijYOerHU4oazn4l/+7g+uf1TPwmfha6UP5yGlej"
+    "htH3Z3h81XvvaNl3TW/JK+SKbKy5KUlxR03fZVMze6ahgsxlho++yfNxdMAgm+ykJGjYDKHhGCdQ"
+    "dqd3lDKDleMEo2Z9y603XD7CsAfnqOBosNDumcaYQNkw52JzIe29DdsTsPrZPGiJwI8ZFcl48Nlj"
+    "cRwvSA4QFKPFydg9EPhVaDbkHQrM6ZhUq/+ekJpY/YPPEtfkInt6zOxYcP/Myc/AEst7JWpxFtX3"
+    "l0+S22BnrpcXkkH3m9+I5fXDxvMH2VlQ04FYtu+Tq2SzanU4GPgcls0HN0S8Orb90e7u8JUWXHby"
+    "tKz/XiFAL1ZX9IvydFGFuW4uiLbI742nVB2j6AXHQ0mJAJkwTyuBJknwpKcPmTjPlVkRWhwPQyJ3"
+    "pKZuxoRiMhlL9skdliNvY1XYpiWdEmRMpkebZTCiiz0ss+S6Y6a/4qBxoaGHNq8EaNhPNHvbXinC"
+    "kTZQwa4aFFk4J9FqlWV0bnBEIbEG0c7fOSZ2+3bESNP8oW2aNuZyMHwuZV1YnEAPN7E6xy0B4YP1"
+    "bWz6hdEVRWmcPV74Mj3cKr2YGr/r6l+/DwjbWlpc9/8rmn/8XLH3zsP4qYlnYaTj1w6oG/hQeOh/"
+    "Wj2ebT3xjOf/L/3hue+dP9ozN7x8erGttrxJmpf2pM8vhad9x4PnSPVf9VP/Vw7fzJMckji/qte7"
+    "7HFjYyjCvMM5mXvGmynfBqbuStLAds7sArBgYPi0Dm5TFoZFjRb66TfGvbw5mL14fnn/ru8JGnvj"
+    "1c2/j6cHFfb8XUI7WrS3ts2zDUhjBlHXmTls0d93Dmdn/0aZMnPYf6Yee4qZNaTkDm9suyhw1fhi"
+    "7Ho42UrczM+M64lTUJpuML+wPe4g9ACIrJoeCMk/Z9yYOfQLbna9KtB0yPp9CVYU6mNpt2oSPSTG"
+    "w6p6QWJa4yFJwIHr0FgWgROVugICbHgtf0MiLIjzoqgTr7ZcrThCD1G/02Skri5LwOMfWWtksaPg"
+    "fD0h7YXNiXFprWGSJ5zDZ12w9zpNoMk53QafrgAi/qsjk+KiNGW/ABukpr0S7qVHDBQBdJCJvf8B"
+    "BYjrFCQgwNgk8wmuCBAwRToi47Posi22dZRad0lx2apmvFWf9O4YXRYMFVbgKScpHgeFhdmV956+"
+    "3bn9nd06trH/KQVe1DWoivfuP7V79/d/vl+cbjetjlQCfOUuEs8cc2ojZBNVLJLBa5ysTiLFfSIE"
+    "vF52FgJohsVMwjHBsx33ePHBqYW4Ii61KGvNJspOjALAy9sREpa1wGcXTlTEIaExaFEccv0pGJDg"
+    "l1xMAde9xhGOyZHBQYqH0FciwoUEoDq47o9RnOkiUb3Pi1Se2zE27bFEH6+ENmypg8or1xqsU6OO"
+    "tEiXAEXNI2Yjf0vtroziP/yYZUhz1t2yyHMiqwEUAvAVmosnhsqh8Q6PwtPcoh2QSuuh1r0qeWMI"
+    "g/cvifcKiPyV7X66bvHcyGSxv6ZpDYOOHLVTrags+8it76KWsNsJEOsbd4imOLfWPJ00Oo0Z1/yi"
+    "U7UEZAjwMykjLG4gPoAUimVAAJbjHINy8EwYTUZcJporVOsyZvWhPHLz3bx6/hH48ShPq+9WG0Hw"
+    "L5iz9g1DUi+VEn6IfTdsjI5CEoH5Th8MZujuAToZMf9eEJEHDJpO+RCV/0wIj94RPO8pUTEc9Ikl"
+    "crdt4PgiOvg3Xq0ItES1HWMtJH6afLumV7dZ3vFtKnuTVKNPo8BoXjlqjcsrt0W1dtv/LSM4/98k"
+    "vPXv6Pkrrdak7jUw+ceuBv9oC748rm9uzsx750cHDnhfu7f3xxa3b80soyl7DqeTYPAdwdobGGE0"
+    "5sshh3uu/SJ6WKo+VxrF1NxhzGCLou2FAwrJDnr8cCFtf098yNMIDTs9hMXrWZtCDZkCt2ijlJuC"
+    "r80bbenHxvuDq7qTHozHB2eXd4Q6d2rusOkTvLW5qH1vUcN/OPNnBcLsBa2eA1B2ORNrDKSY5Grp"
+    "5zytoe6RjVNAzLYsZcZKQ0Kb2znhdzIjn4QHPMmCk4E6Aixtb4BDloARebNMJNcAspLZUqsU/NJ3"
+    "EaIxm//dkkxvk4HIn+UTqCdaDGAA6dqTSWGFeaiJyHO2G0tXDliuJrKsXN2/KUL7MssvngyLNhIs"
+    "y/yjORc0JQ2lJjT9I1tMppucAkFN1Kmd46yJFXXQgz9UfMjrH2qZhOmGPOHLodTECiFfWUAaVRYF"
+    "1Naz9WAdw2pmRNRFzioLH/ALgwUTPqS5GKk0KKzoYU8WhDkSiK3vRbU0/sSRtqEaV7xGMCPSLBtJ"
+    "AWvqC2lxUcsh1sQ2SRd19XHRwf72/e3lv6iddu3H7shWfO3qpVX3gesuNDu6FTJW1+/kuvfPpo8/"
+    "zLusV+5vFXFdrNv28PTDtaVCKNkatH9C5vRKhYiPRPe+DWTDJeYKrJgONHY+lNIA2ETQNn8sfGVD"
+    "D6KHISuHKRvL+5xiRiHHwZmKOPTQV2ZEDlpSi+8sLGgwaJbtF7E2c7JUTEwLq81iccwVdLnAovV+"
+    "aQwcahzwrRyj1BIocJUgYg32+uFC/XO7vsY4HGguGL+JCrFW2rSpdBXbwshLEPGH+9ycUscGz6fK"
+    "VU6ZP+TUWwQaaMFImOi/1sxHn5zKEmJfZ0bNztF2hkO1dIl7Vhp/6QeSCi2zvD8PrdneGpM+v6Rt"
+    "gOD8FCrHmNm120wVc5kO9NQNyqjaJsQ59+7QPiacCeBMH5F74hTQcHsAUrmwa0AawIPjeKyLGvjY"
+    "vu1mNPCG614JVIfaaOowQZtGvxokLtJ/TkgShgELyKFnaB+GsCQiDWj9uTmw9wJqXwtq0Itz+KEM"
+    "3oIwAifcJfqotjPfPYPjabiUTYjGFymZBn2hROOQVkgBAD7mw2ymra0quM8F1+M4hE1ILzsh42bx"
+    "vrejhGPc9nxpWnXTFkHCjm25XQH+/tf/vy2TO//IkPPflHGiveRfNpOPXAqQf+9h6oPnq0unHuxs"
+    "HeB39re+fm1ZX79y4tr25fXVrSC0b0TTheMAJd+qjGdnY1QNQv03vRx9ihPikwPZs/DRQ1CAAXHp"
+    "j+YYqEGhudkzAxe0xiztKbMD3B+KqdOj4MPSixueMWTAzw5kzImdI6sTg72BkeP6YjM5gAACAASU"
+    "RBVK/bhjQHbdw9HjZvHw2vH18b3tXYdKAN6tKRThIhi1md8QZ7MFV5B0xkbtKcZDLp9wk2z1CZ/y"
+    "l+xtyM6dC5vLKfOYyLmrLG5gaHyzK2QoE2FwUNVWb7xQZQbPwAFXF8CJeDcIRj1wF69UO27LcNyv"
+    "e4DM7PKStehNYdOo+jIkRfiS7S0EUboGmq0hROIWVJWjklFrROFt2DFOELPbrdPpQd7WhR5j8pc5"
+    "KLWAswYas5GTcKPScMbgTkJVWy/ir5hltGxEOJ908G8pGAf7s+Riejv1imtgCG64R5LSnihFfCRK"
+    "Fzse25EOQYi5xeHE6aWDnb18ZY8AP+KTvTTqrtwttlkPy2KWVJ2Uj32qjTmGI2eCBT5yOPbE3mkr"
+    "P6/Dd+eOOF558596pIH9rPDT20G7r7+9sXv/AXf/mZ5eWNZ7VZmh1oA6AXUfm7c2wweiNEranedJ"
+    "UtAyIVzUbAMOEY7NyL6UhUrqrW3Fzl0UnC3pgIoSAMmx9tQg61sPOCWbBe1GatTj4dCV43KMmc6T"
+    "558l5top1/dGsiYnN0zBPgCrbAdjDsK0BTsW3FPthUxqlt5hOccncZevPgt0QyODMQ6x9aP5/Aq4"
+    "7Rpf9s9JRUHnt8kUuKXDYUpnDSm8lICA/+3uRCx+wkFTlDiJ8kC5joKCdX19jEedMIUqE3edHJAr"
+    "rrIHZA61tIBSdwta/LZP2Sj0xq2HOPznS6/JKPLID3BbmhV0wfHukD0ZQDv6ka9vd2FVMv4vFzBV"
+    "ahg8piD3U+MTZCjwiC/Vax61FpUA0HZhsMC05Y5SrYNdiof2gBk618k8WfQkl3y65VgXkjEWHhBT"
+    "i1sXncC4Tosi1omk8i7H+XwurL7TbMFoqpyypiybLVbWpiBMNY8SiNvH62N+aOtth48cTG2IGeth"
+    "3Bo+Xud1pksZhCWMRGpbIjTxuPXsOFY9HndiyYbRTCychy99Rmfn1jUyc0aCeMFLLLJx/0tlZ4BV"
+    "7aP/z+5mzlc5956dnfWZ3rtPxpOPXAqQf+X3sgPXMY1maz7aPzH/izve17+pTBrQ/N9u/85+sb97"
+    "Q30YigEz2M27wkBXqPOfR7fkA0xtPFu7sbDNzjifo7JErDzeZj2YRQsXESUuMqcixdAwC6vEmBke"
+    "fquA2T11uyGPAGTkmNB5zy9FtbUM4w6PlVJLoF89zSW7oTiHLpDdl6C+bhvavD0frTw87G6nC0x1"
+    "yvebDmnIyh0isRBM+vsqZL6/EMHZRJP68hZBubVG6RZz7Ln+ZtCwiljFNCGEUU2WO7ZYgoKMPJMN"
+    "Yu3iQp3cJDikZ8gY+8lrH81gZnhMdfyosR8vAwViIEKQoxYszDC6jRJ8d7cMWHjgpo5t/2Gd40JR"
+    "8YoAab1VyyCSG2mMRERmywzIUq07Sc6Cu6cOvYSkhO0srGD9TRSdQDZCOdRcLXCQgnzD3noqX9Nu"
+    "o/qdpWjXJaHnHJi4wpoqSWra2WGGHGcugQctuKLW475QujxGhWlWGswuadxKOPTK1mrHZMnVum6L"
+    "o9QEdolzinA3DLkG7bAIEbu4iF87pUdMEJ5LkbGtoDUkIPXlh1o6Nnvn/z1kf39l/4om7mOt3QyS"
+    "t/l2Hp29/8wVNf+9abHz/z9IubR9ph+6qUBuQVfTCa8dWfBaDOlPEVEG0o2EcwiK/oVjw+UcBmhb"
+    "PwqVTGRqVrs9HPz3EFqAMNiEWe2w5Nj3YhGdnkcMUuuDRObRa0MaKxMDj3Zi4vYIEXWjYoNCYEua"
+    "2Z3q9Gl6xuzEYiRYo9kHuSY9NCSRVouMQs+p2gHDTc/AWpeUhDPktU6Dnkyh1L1ugnZkNkf1hX8l"
+    "DjPOY+OgZX8eDg1kUS0Kfs2BcfNByc/lMf4ukyYTsfCUcAdUfet60iX37jasm4mcPRlAulipGJj3"
+    "1eUHxYCRwYuvyTsX6zmSbPd+7vDre3d4atdfjwgepxX1cW8TvzsmSYqc64YqNVIgjBIrNqJVP/wO"
+    "GrAU10ZZptM/KBQ/OHM0hg+LyqP0paUhG2v6biUl+TuqXS+ccODCfjkLzh5Mve4EQHKWFMho82SU"
+    "jdCQZeP5cSn4Amhtz6TE1mkTc9WYgVyjYvzkRHO6L9u68gS8G+SEHUHug1CvDRFxR7sWWYaGUj9p"
+    "nL9oQfE9L2IVQIiWWbzDzlFwHaPnTThufcaql2dOB2lau8fLjez8yptawcL92aryx/6WPPPPm5a0"
+    "9svRElp8dTD5x64P+rB+iX89nGnc2LL391e+f2Lx3cfuej2gU9p08ZqI/TM5nn6KyKeSMlczLfkm"
+    "Mq49ZM5bnC3yfQpnawmYPVw4plSJ7HAJg1hnrqYDzIj6GPt1/2WKRZxHqXeFGKb70UH9NWze2eQB"
+    "DOMoH7KLmUv6SrdMNNlenesLp8a7h052j4njZy13Ub5u7s7LDNnZxsFC2DAYo5ifHNpyMxwLooN3"
+    "NVzw81lAnH2IfhspLyKc5YCEUHZPCfuIZ086oENtduUPrknAF/NCG6g+cQ9AoAvfWBLyHe1KGL0P"
+    "hKN42ZTTCloQwNNIMOzG0SY3CXiZIIov/YsoDb3pEhcNtofnNZZgkczTGfaZAZbSdtKWRFC1zrhs"
+    "/FHQnjy2TBQRnJI4kTLcs4MiI2bcXkwQGbSkk9G1hw9MOvrIU1DpHhNqTlLtBFH/9AWmY0+YJScr"
+    "2GLoMWYiPf4FKVUkQ0oNEkF7iIBD9h20hF+9KfFEz9SOG8RlOrXeiOedA2veNRhRL690lZNX6Xkk"
+    "6gudyBSB0hvHoxytHe2u7O7KUb9w7OPXth5aG944ah6WEMK7//9W89tbO8ce3MyrJecKnaodJUX4"
+    "ypuV2Os17pFN7kCJmzPsTZRFBwv+pfMQt9FpdZsGeDkatWaSG+ysUmwoOwhl9tarLwdRN0w2DCme"
+    "n5m3xjbuFWNzr0F4g8mV6UQo/+aSNGa+fT6NTYRUOJsJFyEsNncQhXojdF3niVTORYBkppxJr88B"
+    "cN3sylqxfMPCNE2c0nGdCZX5ss9MHDq/7lDXHK32y+fBVDk6x8JMbQlVxoVvTWQD97VPLaGejocl"
+    "IEm6hyxV5OhuJnvVGwygBJbwpcVuZzykFZuRUTXl3J49ZKXlqiCzrDdW3o7u1rcb4mP+jFFqvzdX"
+    "1HSG8e29azD1K4z5VKyqQSxSUMEllGSKCE4wA0o4sylz8NLoSx4CVHtqYdhc9zhZICG5d2hZiU3Z"
+    "OhC4Hc8jvOMCyCkYtvuhWRBcafN+kYaAcqrkAqdADAm0DpigVq6prPDIgX4IG/iEbehid2M4JEdK"
+    "5H6BWw09Yp25szaEhTfzYMOkwJC2wO3R6gMapkurxqu+ABuRROTwR0EryMIzvqUGLajoAjg4UUtz"
+    "nj+/mqXjWutsTnCfwRew0etG+Czu5v642Xf/bSU1d+/RMffuJbAj20Z/JcoNPDqQd+BDzQQ8Dq5p"
+    "l7xxc//nv7+zd+b+fw3uX14fbZ46N7Gh/UN+nJ9FEeBtDGirnHYwxjBHdu6I8R3GOCylQjx3hRbY"
+    "GYDBCiy9gAl34aBD0m9Lijk4EeaPwhcuG9kND4z3iAmGVNPmZV3gOhMsxvzIHa1M1nu8Pjs51BF+"
+    "aG2d27w+a7d4bXD59T5vywv7w27B5y147mbMYfTTMuAXIxhRemCMcs5PFQaZ9cLvMZ9b3I1vwE3i"
+    "VHrQ2SDIWk5QlPWYyZglA2bH5PaGA812NjCog9guvXwTbZ1uarcX5Kgy2FhjSSW0Jkoac3U7bPPq"
+    "Y0ravlW5mZrbvFELv8AXgDr2RT99wbbI7WSbLqe1quKR1SWtekWGOZsAxZHWzxCcKQpoxNlThkKW"
+    "OWYinzlN1lmPjnpIRFbrQ/SxO7PLxmtpHRNJoe/wgY+6Vbfm/dbW8XreEwgXMVob7EL5w9tallFw"
+    "whpl/4FFlZczIvp86w0zpGNhVK/d/2CQFuLG/R+IRvpR3ZYBF2/Vlo8UWA1wYYxMnf3EF9vKK7AJ"
+    "6/8fbtZ5+9cOl1MatzP3zhod3QffFPvn11Y/PsOQYD6o+OrGp3DfBK+iMNrFxloy4hyFUfNkBqUC"
+    "zSjcjGg4HGHVctlVhHy/HmhbT+/WyZeLiSRIOCHTrfT+4BHAALwSz+kNMbGM4u0I6AZQNm5bYb4c"
+    "DZeHijItugQZ8/7u3GGd5DfcMN3WwWHMTXg6TPYCBHPxusqIpYCdlefNw/zB+8saTFwasgHblqZe"
+    "tKnDjET+m4bQXKA238iqN4WKyrAwroq4eK7U8pQR76Z3rlM8+oWYLgvcCHzgOs5PZmVEnzYyRy2U"
+    "DHV1ghGxkF8i9WJjzkCeUD3PKVdN3Rx+beurc3PL2lb9ce6uPxvmc6tq5wtZMFgvSLPYOV04I7z1"
+    "EBpIPoPEPaXEOoE+xCtcsBv2D52UQwIy3pnFyIUOsVFnqCY8kQkfMBYkLTu+WZDn3Q/z/svemTJc"
+    "d15Rm5Z1YVqlCFrQCisBIEFy2ttm7rGbP5i2e+zHxpG2sb9YxRklFSq0lKbJGiSCzEVkABqH3JzJ"
+    "fv5ZzfOfdGRBbAtjbrbqrK7HnmC3e/u1/3uO4eES9e31WDpOliETzhGzPsxZetixIkAFqlWaDLWV"
+    "WmlU2R1+aR5zy0xyJXoiIz/dJiAZO6rd5ggRwVhA28fckCCTSHKBp5ARWmXBVf0AgNN8tMv1iBaS"
+    "MHrsmHjNWVTkBiBBceNnXneKXfUuQ7spSz2ds40dC9fnlv98//7Iev/43kfI32dVp7YO2B/z4PcE"
+    "5WlB1WF658cHTvrf/j/u3fvb25e/Svtk4fHTgEePGtzZxiL5HZvx1KWUjmFkXAxOsyBZlezI+mJQ"
+    "I5XgIjvlSwIxYzdxBEFEEo1BE6qjqwzrAGlbmAzA7M/MrBe5MnHdBz0XdbZT8men84f/DJcG37eH"
+    "hmf3vY/mo1fP7oleHLzSu64bcvcl1YZD7kpS+q+ekCOwNZEsbdQuRzdzAUZGotPlPBSXaz6XVVMm"
+    "YNT5yVZOYsbHMMLTZljr/oFY6YaJpCtzw2jh2vQTkuowt5Si5KAB6tqBp6EDgWnd+aGh5BE1kJRj"
+    "Ikroa25wU3o0TH9m8qaLbQFn+TGZl2o6R1T+1sfW0+DIGNIkp/189imw+olTXZY7lGVQ1+KG1HqX"
+    "K7ivVxKaMfZtLdzqrbFgRUcr0ryl3XISQzuoLFZ6FrXlNxAECuT+NUc2rUWJcg8wlgnMby5GNg/H"
+    "Vi9BTMa1VoBTFPjWE7SCDlPpfLSaOOwo8XxoX3eEWFRPXTO5xS1L0OEo+6YHtzuXrry5v3vr98/c"
+    "rf6xrRfVietvRUbugOj5d7712/fU23Wc7TKx6U6iBvtjIi8rgeneZIrZzOJGOTJ5gf6dPjEd60eR"
+    "AIRsdW4CN4I3elK/XehFnENIgyEDXgHLCI73qEUA/O85tV06YtAaMHcAbgFFgNlxI2E+Car+mlEr"
+    "NtN3eqOjWfmIRnVKqZigrAW0dyprmcUHM8fNDaX8jHBn1IniB9Mrla8oTXH+1DX/QI78k0/gfP4y"
+    "bY27oBoZfkO1blK/C2WwRul+ok37nh7qESoL7zx9VKJm0/Iioc/RQ9kZ/9W+yyjDpbyfgcavb7+o"
+    "G+M6c3juERfoCefpJA/c6q/Kr2+ovosi8bndjAWECPtzQxEdOm9mEkfoTf/lO96NqfyGOMFGkMQg"
+    "aCpMZ0QvrKomSYHrshiBmuuCo8f/gPAbFVvjAx9DDq33zABeMAn2WGdyQ3WrqVm2DG58mcg2CAS4"
+    "x1pf8RHjZy2wAtukQMFnaPsShPmwWr7gmPoFw1RgF6nFS3jc4DtzYb0iRpEzWPJxEgxsnElMaCfK"
+    "VBIAJIcgQrPP/6MO53dvmeJRdlVsOC8aGFGY9eMv60NjvUwurn7373tT8/t7v1nsSwwlqntQfWHv"
+    "jv9ECftswU27tbi80Lb/7N8eFH//vR8v4LF7aOv8tdOUUEfaVNscB3yzhn+/zPCcyGJmd2nd0JIN"
+    "+wrONtTnpOf2nXf8dQYgISJNXy2FDFPo65MGsZQH3xtuZz3ogJE3Z4cyc8AUk/bbC1dTycP9EjmD"
+    "uHw/L4hWFz8WDYXL49fLnz/HCs+HKsjR2PdrIlZS7zk/8Ss6nv3Ts511dEHHKQK6joPO+oQnwi2I"
+    "LX++Fc7vZFgI6PBUdMpc2IalTaXu1l7oMIvP7aP9THsvD4IjM8hJKGzBbYuVHtUwuQrWd1C+pUIr"
+    "qKcrfV+QilzanMN6+GlM0zUtufug0eUVOhetxCZdkog7akjU074QQpura5293+aTi88Fm8ytDNab"
+    "J+UX/jZ7swgtsMmlrNRZRT81OB7nEa6s1vbBveRsBYQoNKv43owllOCcI2PMV/+o8+nbRYpBkonU"
+    "1NZb4Isnrg4/iCl2SDqo8xyPVxlJkEH/anfdF5REgyfFp7eR2n8ogHpvctpA2Q8B4GAsryyu17h9"
+    "8/Wp5eOLe5sd7Q2dP/8w8b//mXv7v2+aPFn+gRjT0ev3BXa0Hm1/TTj7KBDRYd6Lt0GhNesGlDQh"
+    "DkQ+q7D5xp7l7RQ5eBkgFAp4/0KrNhCDUyE1T5HTau2LEBYQPDB93kwHrg+Uyw4thI0WvmGpzYwS"
+    "DsgefNlepO1ptiH7mL1zqLSLZVGgtpOzJthyiW9hlO4Z+Wa9Gqv9408mPKow3odXuKRotcHj/FyW"
+    "O70FVmemMr+nny3T4B7DtoWy9tQ5ciWvsMPk9UgucRWCZE3SXRxtp397BFPvVLadR+vyhFvmfjIB"
+    "LJ08mpGdFFyQC+0FvLvrhzqMcuT4e9Pe7ccpdOiwebwh1D0ekk90YRRpJsxAeuYi92dl8I3f6cw/"
+    "Ah/1MSt+WQ4WcldbjpVLM46CV7TEVP3dA5rvxlfrnY9pVN3bfEyrEzqjRKH+3HktgDX1LGB9PKxG"
+    "+LR3x2YqK3HcnoN5I9JXgkhwXfGyd462k/Wq1ExRehN20YDPAE1ygYRr34LudiOUnyYyutsQ1F33"
+    "7RCJnpou38sRknRiz1ZsuDYXdvX1fLJYDNHFIsTHSr05NHj5YfPnN+/y/efe3Kr4TkWzDrtPbA2g"
+    "P/Az3Aectly/NXnruxGt798eHNL9/dXz18bmdrcXnQb7ptabNEjOcRfN+pc7AjxmQTwhmduJacc3"
+    "iMB8ZQS3yY5w4dxBalREUkJa6NcZv1nib8hBXFEsUNP77I3TrEbmkNgCA9/eG6HqkcX6Sit3Xqsu"
+    "Kwq89Llx/qTt3WcO6efvHg3v3hht6CeXKidm0caL5T/MGCZeYtvlaR+IXI6HEbZYs3tLwEjEWI55"
+    "Tg/U4AmZF2d5sytzl+lo9oRy90ZZxS+UZ+gCu1+BYvOm7TZmMhKM9AT7liPZKaPzJUFz6WgCybME"
+    "BFZwZxoF3JkRMrIErtm0czFl1hax4YjZgzocxJfFZTdXSOOIrAWzYMU7nJqhmRVui2PfziEtF8XW"
+    "NipM2YrdoI6US4/OhMMMt5nLZMblltKSY8hgqJbSsDy/jmGWUI4LvABYhKepp+j+CJJ5qoi8tHRs"
+    "LjF71BhYa+lyQJ6nZ7DBkfCgv5lsPoR3CiNx9FGTjKkAjffS4dFlO6rE9jljagiXUsckiEDtqnYI"
+    "KAwE5O9r/4+su37zx88/lzl3a/gMyIp+jwNN6h2/iLn/36bX1/7ocXdnb4FVJ5PZ1GB3KnRT3uvq"
+    "ADtyi7rr6D1mW9/IDvUGkhR6I/iUd9ApH7ETbBHTCRVjJEZTkJZ+jVd7N4855yNkTQ+REQBdpxI+"
+    "hhoYMVJecRwRpGWGB+04vGdxME9d0m2xdKFb3p8IZnjscmDUw/Tiq4bSDv8Wj9AgCjHRaXBXE/cl"
+    "HA0WZox2AEDzLEFx82NVRCOdCL3u0IzLTcDaU9qFSeEy/40Z9CgutEO5Dnt3AKDA+0TcIGNnX5W/"
+    "278OTO5k906kPMpN3i8AfZC022Hz84HL56tBwu7saOHW3uF/pC/Y6eo9vRzLnwia3xwkmvJBPsa0"
+    "58CXIA8AaFdtA4pFPWp9uC7qkl1EQ12i6Myv0HpViLN/Ka3zrh1We822W9gc2UIGVUajsQ5YR8bE"
+    "x7pNp0pgevOqC2PX2AzwyFYkzwwgfG4uuAq0IvhJGjdPMyficelRkntmmCgydFpI5xiu3ynbugfY"
+    "TXY6zuePo7JJxHJXNuA+dQ+oZFCXZFtvtDEHLGGnfgsWFToUSDyDYudRcAv29xdR6zj5a3dGb/p/"
+    "/le2/8ZHdrQ0uxdVp7YO2B/9EecAyQ0B2dcxcuvv3e8cnX//fJw1t/unV6+G83VnriWT8PAA0hQi"
+    "cwB318dV2ljj2czy0pFCJyWhEnKrhCDbdAhAcniqRUWVewvZwIrJ3qSMgmrmiQ67t0CoorfbVW36"
+    "Eb+g4bDPwQuVB7m/c153wwXNu5NxyovHlH14a2rw2Helrkoa4j6Tkf2aTHvlVivskFM2IYl10rnq"
+    "vtvgjr2JeW5OVuildS5bioVrQXEuFor5GW1fNqvFVzhPEym6AnQbhYb/8TPbJoH/5TlaQ8dJQBio"
+    "fc8dtVHR5LIx5PIq95RGe5tK9g4ANULmpVYbcqIKBNU7CRvAhBF75Lo33AzW+lpTpls5VebIkNU2"
+    "4ZSBaobQlPjoFPspp+ThPl0LRcsPh74jNGdXKSMehM1cc595xuDj/Dgfw4biYlRdutonvafd8SBU"
+    "RpVSPCI8m0ILHb6BkNzoGNY69B7E8Bg0mOPK9zxWs5GBInev1VIiVpSsjJ+EG3zpma62EjIQf4aL"
+    "OhqgIjjYTYECaOu7ozs9zYeP2LOw+vXb20+2vBnroLt0/dhm61WG399T++/8eb2/sv7OzoDphiEe"
+    "FIazy9RThX1h34eJxOHefNFRsE8NXxcLBh6ztSHmiKy73Bo48TSKe+dwCUHsuwMlV6xFDU0CBZD4"
+    "FWZW+WakENHpgJRASYgdebJmiNhqQ2FQkoudvoF4CA06dtc/vcRvEqZwLokwefwI9c7mKxmIYZLe"
+    "PVPsF8MglG6rt98PnkUjuZAPuEAeZELhrLx6eyF33o8oaoyNp+7BW57M6Gt76TVP0hTpgtUps0Pb"
+    "bJ3Tf6LS9SoU1pi4ApYwSOIEOXA1CDYpdPamgke6krnne0d//83uHw+qULg15LOxwfM3vqIZVjvS"
+    "FVdwB5zIWneZifaZ7Fin9e7vaApc32k9pPKnNGPlkhXvo8fyORJ2HXcqBx5mIyZuRKFjAUz5Pqvt"
+    "KJTONDN/ZJ8xXPxB36sf9ncq3alhNixTHD2XYT4E9bRYtKelob8rMwCBpiLs6VuCj+gkmgbsNIHW"
+    "NijUgm/SljG/JYlHGRBQusn4J4R3qIyoL2TdsPBtRKixS3WAK427yl781xQmbZpCiuiwacRyu9QE"
+    "dvvHt4vFj8/NXLl//9269f+q0kPHVB3u1eH9YeeAo8wOnMdLC3s3t3+9Jrf/fw/mf/cXn49Tv7+3"
+    "ee1yzmuOFzX4dTbteJmLnUiXOfDzHHiYqSYm6j/Gg7IP4K3Zs803aUM040EkX4q6pJmD/htxaUEz"
+    "h08dL3F3l6hbt1vtVPqIBTOIRg547i13BveFbMB7uZD/fvbAwfnV7Vo5fnNUeeH06IT3ohC7OqY5"
+    "jXG8hJ3CPeoZunk7zGoCF6ayZxzo+eQmqjbCGU9psdpYmOeQ77cQCkPoo0/ki7rAF5wvdFRRWdPO"
+    "+J2GsN5ix4hYHTcd1l8VVuwRXfS4kycbR5oms+FSMXXoRWmpcBPV63AU3cukxXQhpmvVE8l2F06z"
+    "N6ZlzLdQtVEXHmm8mO1LPemtvSaiMCma0EXsp8SpeyudbHy/FZ+h55k6QzUkaJxmPArM3wRcvE3X"
+    "6YbEXzhB/hAs3LbPozTqCGPrpstwjTPtdGvlA1DnmcmwUtHmA+rbQ+MyYiMNypx8q8WQ3DBE41Uk"
+    "ZyyvjAYOHNJzC2FzS1DS0+T05eev93X7zyo2vPbunC0lM313corFY/+dn1r+8+99Hth3+iK0cXeS"
+    "kHmw0/dkeXeEBkcHlz48CuAOoNUgKQB4sHiLqyOtm5ApODIzLY6MCjwKqqPywi2fCQGAgEM4vp+p"
+    "kaNsBHQM4yEXkEPoSZj7w2BbFPKNspGsigT8nfXWvbzAMeO5XHTtWhFQB7rQvcuKll2ApZIxk+rO"
+    "CRTaeyhe/IkfApAvFL/GXplgsfG2HgnXLiikX+ZrKzfvGiHznlDflXPuaOmu2I/djVP3yOyJbvH4"
+    "YXILKiCbu8MVGVnzzgOwO2VSUGsjdlks2vzFPmQzqVHYeb28Mn+j26bV11pd07gu3QDtFsSw91TP"
+    "WmHvuUqGfDq3rJij/UN7KFl9R0243Gfn2ApYnVfgQpAXexZDmDFqgYIzu0FiRYkTq3LgTzaXkoFL"
+    "/7g7L+m4cKPOMLU0D+ngRPia28aSdpI2sRWvUEtOKWUQb7O6ucA+knmhmb6Ef/jQxlAHWp9rhW2T"
+    "4TD3xe4IiPx6gDh3RqMLD8lVFC+TuuojHOeJmJbquJf7nRL0K95EdvPPVFIZqi0SW7j08XN84d7P"
+    "4//+aPv/u3kvrUvs547KZ1Ye2BJ9QDHXHIda6fbu6+8PXGwQ/+6uHxy79cLM4vuHNF0qnKGa0DZ7"
+    "/mE0M5pxUX+FPu77IRGoQ0jMWnGIuieOBHGxRJ1PzRgRxENiyikT6U5xFCYorqPBfp2UdzqS4cDt"
+    "i4VDzxtWXNp2zsFG8UCPPhe3BaKW7u8fbLT4bvPP/h8N3nPxre2f1Yb8S8ORxs3dVPHRxpftN8pK"
+    "uLbOxO9Xt45GwYV9S5c6i7f8ajm6uQ0Kp8Wva4rBYwtwQu9ZLgdYvWFn7yqOKq5x1aG2cly2JFHA"
+    "ILJUbxS4LLyqQWOKsbrZLMA2qe0JeYHOg4RxVRfI9IZM+TNGGLEi5Hp3kNsVSXzhweV160DW475n"
+    "rc7vJBKRkVRn+ozVuMBbFdLavlRCXjLGJsexnp+aaNqdYGDzA8RTr6IvJHprItVO2f5kGG6ctvEz"
+    "wlpPQH2nlqewMD13jyicvFHEZStJZmsaXUtnk9WE7ALJvmvOW3n7qNDU/O0RZSDQAAIABJREFUGq"
+    "B92LxRjIWhAc+TaST3g+xz7rXoRE1p5BErIQIJWYNzTnMBV+vJxcmFr27eeuNooS+2PoWJaPRUpV"
+    "9+dP3Fh6vhjb3dHT3GTrgiiKlzdGATwCDw0lywbB7UvNqyr7iipYV4n4Dw9FDi7hE/dE3yHS31OA"
+    "GTFyTwHS42I9x98kJTNB4cs9HmsMnjnsZwgsoyDSp+F88bJ9X7ygF2t+4e/MilzCATs8oZcdkksY"
+    "nSBkZ4HXRHgY1XZEAO2APTMmDPoAaOrF5MU+WlMIz/brdJLEMbFDasQsw3etEZmTnBItubNYtXXT"
+    "n+gZkNETxAnWNLtS0LcTNZF+3odgsqUzmpsokm52P92Gs5kZX2wcHJrI9wOKFtpc30J2BoeQ39oU"
+    "bF5/eP9DmMDvmPPmMzp52Zlg+ZAukAQYwjx8+du2anxmv2Z+ml5xo12QeFUmXk0CHQmywxQBsaY1"
+    "RUHUHIVftJ87uoNMriYKOgfJQRDCSVQmB8wRo10YSfumFiaZzbg6RGtNiWbkNMEJOtH7u16arxAG"
+    "/8gd20V+L0N7WWmpJNTduo0+Y+T8axYP7IM4t4MtYw0VJqs4b0Mq5tFB5aHlUyLyXV0c45yhsteV"
+    "kO3wEFzp071e+q/tM/evvNP7/2wgXeatnSLGN9WHtg7YH/eR7Y2Dx/uHPhjX9Y7b3zH48Xz31yun"
+    "leJ+yO40ViCucz530+rAWScvZzsjosCA0d5zW0fRI78hjWEOgm3lBDhfxeZ8yFElP4oLc+3sBBr4"
+    "3diXKuAbPh0gVFi0E7jzFus7E7Hi7s3RpevPT+8NZL7w3vPvvx8Nzp58P+yV39IsJ9kWnNIbm+gy"
+    "i5TAf+SKdmccnMRo6bgzxyCSyzWGzBLtsnE9JC2SNayqkrd/sFIOEsTCcBp131CVliKBs4dOVCoR"
+    "iEdGxtWbN6x/4WaxWaj32xO5piA+rqgxFjPMdQw1sHTC2tBJiAMsTfTNapw7x536QSRGKhIZ3RHx"
+    "DQgoeorZj7cGpvYy3NfBl/qc9EGmfXlfnNSd7j0Vy0oRjbvnJONV0C5jStpBoV8ZLQjWx85fb/KJ"
+    "9C+jt9q+pj7rUYYPVptG2L8d9QRXtoRbdk6nOJUeXbTPNFCKuJhrm/bSOWinHyiQBK6GJQ2X7VvX"
+    "6VZsDtRxPiEheQMxwsT07fvXnz8KpADS7sk59x5j9V6ef/9NEbi+3tF/ktNYz364vVQ35cUBsCOs"
+    "0bL7pCizTu0rCRSKLT6eNMA/nO27SBoM4jfyQ2IX7xhhi8sRCs875DxaDMo5BSInpGigcfl68qeV"
+    "FeoxaZDDCSR4pkU8OeXrQD74Hn78RpYezNnWVLo2T4SqQYGcAerKbJyZD20SZw3e7SKRib1v5eIO"
+    "1BH1i3xXfeuh38AHt84ROj7Gyd5tXOEF84IYTZBv/id7e1UKoDB+YPduAjwb3JkwXA/bIVsbCoRm"
+    "7rGH0jPjbp1H3yym/8CHv6Ax/GJ+ycuW7LXAqQNxUuRHdPb7T8Sj9hwPel6BdehoIZenmaXkYm//"
+    "GyGByCPRhsecoE7D9jqw/ddsmQMeLDb5UkDxI+9pc9XHKKDrjbIBZ0eaNRci0FsfhQyRsP6FX2B5"
+    "2drIeg1YBZXvoncgD6n7FTt50q2J4ZciyW8LY5V97Q0+M9OlssfO6j8hsK+evACnW3Hf2kHmMYQ1"
+    "P4tDzwJJ+3yLJhTRX/NC6UOWI2Y4lxlXMmqxk4ke52a4z7ZwpUYbwRR/zIL2NzcXzj5YsX/v2/ee"
+    "fqb8SgH8Rap7UH1h74Q3gg56jiyLlLXw+XfvAfDjdf/6uHi4t6YTEXV4nVihOK86e8cORUT0ow1X"
+    "HFVLGBuSSxY4wqo8nA2SAlby2FJiAIM8YdVZFgKaCq7oL0+Kq+qL2HA6nFhm+kEZ/8shRt6vSiEz"
+    "ZRvp3lFQvzHjOTPkydu4th7+Dm8OzBe8OrF3+tK9XvDS8M14eLmw90I++BbD0SmR4Bh547gP24uM"
+    "1RO2tTt9LGayVDmLm4g5dctmFzb+xkhy9YCUhT3Vzsx5epSOrYesNGsDBqjOU2c+PGeaHnQLW/vW"
+    "i5JZ8yPP5YnipKgVNO3cAzh9iHW5NEV+XY3YjOm051MzW8640/m8fWOUytcFsQg4y5vWlHU8vCLi"
+    "Zvla4FN4FCbWixMaemTeQTZfsxYs7qCFXR284z1GftcY8wPtqXkw6k6pSwWqCthfUn7QbnR3knlv"
+    "JH8FmPaXQIz4eUTJL073Lnqrn1AmJtmsoJkjWrmc0RCSNe5xYvuyN5vHgM+8SynBGuwcU83mlau4"
+    "WvFLqNLce0tJPCxubuYrl65/1PvvjOiVS2nKclzzN2T4u1euz8nz++8Uf64uLFhd5USDzMJkmxkb"
+    "toCpTdmX03bByU6mh6h2DPKGMQQksnEmAYOCzmKPt37ISDl2Q4dK41HQNMAVWMHvTjQMog5eoVMp"
+    "HHRGM6lVtGwDm5+soNNFAw0Chzl4NBb7xg2NPtSzuwu/VjrwI5A9125ohINpmdkMdmxnwNxEjrxt"
+    "5s8gQoO5pIpxz+wjZ8KBZ0icw+Bde2gLPtkumNdtHjB6E4d81HkXb0BlDbvVp8S4deViJl/vjEEy"
+    "d92hs9V2yjhLTNYskPK6iPxGs+2YAtfB/v3uJk+OLu4XD/8s5wIJ+wGWeq3KN/9Lerx1h4aFonsv"
+    "k3Fck8h2IG+iUrrmJiE1BJKqPHNegKBr1xHOcpfPQlJfuTkhnntClHZ3gok5oPBbaLQlC2r4SZ1v"
+    "RmhyByRoQFFEzZHFuqQkqlyZzHF91SiPpcodxy0MgZ1t9RsYlC2mZmCaUW3W2bxmF0hMqk5X9x0w"
+    "nFi7TmtS/FADZj3srUyvg6vjRriITe4g46iyI2chrDqlRc2Hikxy9/8e9++P2faJzcLa51tvbA2g"
+    "N/AA9w3jNN6MbW4e6l7/z60fHb/9fDhzf/TJucH+mtlzrHFalPFzpd9XIz7NH5y7nLAi5PBwDUPI"
+    "WghIuKAqqPsEJUZgTzhoOSgEw4Xs2OBGbuGnGlEzHNG00A3NXiLhyEfHg5Ct/34yd5NvQsJvFLc5"
+    "KMlYlqx+5q2Bd8Z+tz3dfTi7u+2h7eO9bcs7g6nOxeHhZHi+F4IW2KU0tdlMzCFo2I1xE5svlUG1"
+    "vWHZvYjVrB8zMPPHUg3dLrWJmieboFDscVV2mWfYB02xoquRepHJSQhQj0Rq7zET/hQl/H1tFA8S"
+    "OHZvigcsdxiyp66ymdtoFmT4wt7b+St5LkbXMYaGeV7DtoSAWkNG+j0Wm3yXRgLLQvoJ1S6wXW5W"
+    "BLzEgarHzZthgzlxWLzDdyzWRRtE+Un7EBvplQCZjbiO3zNNrhNmmIShYXCB6nswyI0VnzueVQZU"
+    "2m8TfqMexsW0a1wukfJumhBJ0hAoHsNanmacDWF5oZJew595VzwYf+sM0RJUZSa4ATGg1qFbGTD+"
+    "tRPez90o3bD946Ol79f9t6K/rTlJ6qDd3JYnjud1988Wf6+d9n3Ata9PO4FJ3s2FsdQsdwp43H/9"
+    "hocBfH45yOdidmY8TdKmjd8epINjpcnXdH69gbNmgIlNCbVsLYqJA8BFVnIGSzpSFUAwj6BHkM1G"
+    "DjcUfRgW4+Xn/sxwOB2ZYaQGapMpslTVQdMPxIKJupSsgbbRWL5cPDYFVisU3ZGzJrZgTDpA8+KY"
+    "N7UwYPtuSuRvCtm9ybYQtgHtVdLe760Va1DzzidHTb8QEpJ3dOTLcd5fpHT+eU6SsAsdWsPiAPPt"
+    "/xBIKvlOFN7sbR/6ZQINH4AFIntSi0KtjQHb9DTZJfPFgMJ3qltN6ahhDfwT2WL3d2xKW+Z4NH+5"
+    "jQsDY/wg5ldDqjJv29Ea8GQ2042VjGEuTRTovoeiTRBpJz0UAVmMphMT80VZUPVCrGUXYF1IDxBI"
+    "KoUSriMY8ktNlOqFhgFN5s1Nru0XboijeZbYQO1pblxYr4e4i6VZiAPOuMHF+VtFYhkVv6IKVMXm"
+    "pGvUE9jkO3WSxmWpyE25dtBMTMlofNnDM7fpw6350D5z7Vwunk6Pjzly4+9+M3Xr50HZ3rtPbA2g"
+    "N/WA9wTjN7HFw4uHO6fOdvFief/3i1uPuaXmn1jN8oqakiFyc113MFH/M4z5NxVHma48ezXyc657"
+    "rpx4ggQJeJRRD40JQGFCycszAsYaFLjNGcU/GYS4yKKkz+oplirGHakKaF4t3WBcaNu8PFi0sVxa"
+    "Nv627ffjTceHhneLB5cdg6uDI80COcxN8NvQCFHBVa4aiFPFmCMySO2bBssQ5AwGkTs6VNrwuzVF"
+    "wv36luuWqY6Yw2AVKMc6EOjvtVnuaFyLIpPogAYZRblG0pUJUjJgST3BYAtmyUkJ63Wmd4URP7u3"
+    "42b1niti3lS/OUiSYZjRzZi1x1/NL4s/rst2oLazxS2xe7DDF8frBso2hVZFJtLeSWXbCGQ0OyOb"
+    "Y79TSuEGd8W/jHBRgsAZZRc6TK0ct4DepxtrG90Lq56RfkYJPnfo1Di7WQah+SZ8LiI3jhE0KFwB"
+    "ijkcU5DCLw0I03FUpDN9Vnf8l/vK+8Fm+DrFByXS/bpd8vFhqGZ76+c/+Ht+4trhzs7X7JGvNpSR"
+    "l5T4m1H31045UvHzx4V4tvPbGnTlAHcJeFOMkPRdOZ3mELziNw0PiuljYddK4/gjk91kdZ0CqIsh"
+    "Hs0SHCHhRiD5sKHhglD2BuOUd+Bt6ML2y2zbJqlGIrA5Qc2bkblwHskVwDz1c6aKvqDGJvEtUeeL"
+    "OBDLzL2MIgZQNFkdRtAAEc32RjKf9ow+VHFu2r+Ax68HlGPlctkA8dH3Tbv0VH2RswwcFhOj4Chh"
+    "y+K4ct1oldgs3tgmep77Gh1/YVHl1sGHkBCu22TnOWc1S2XE+eCbYUe9OX5sdWNpurrd3h41sPh5"
+    "uH0qdJM1czdVFAQtgkrRaaYLFZcrkqlb5UYBGs2xX1U3BCh+1WPzphUKXRD/jE8hqTPu8auVskVr"
+    "itWQfK6TtjIXOyCskLrqHQ2uLIqiNY0yEskikoMfIEqXbid0MFjNyMTwuFTh/3cahyNG30Ii0+wv"
+    "Ag8NL4N2s/sqxDBYNHnYJbsg5CjD5r3s5Lqq0yDImRhWqfj7SvFlVpafCxEWLo1OY6t7g7ZymSpw"
+    "vpdzVq/+5//aMf/kSUt4NAwzqtPbD2wB/KA8QCPrxmZOf81Y9PD976P49OLn26PCFW8XorPS6tc7"
+    "hjGOdp5nHwmTMJD8yyXVehUiKT4YJYhicP0SYQmM78OvSfoqBpPccUnEVgYox0olczCI89KrhAng"
+    "/PYvJKbr5XxzOatUhlA2YC/SQDb8Dc2jsennnm+nDt+d8MP7j60fD6ufeGZ48+GfZWd4ft08N8TQ"
+    "C9stHxmHlLdq/8iKfk624gj1/yLRM/gsnjlrJlxVMImkPjC/yD36Ch7axpyOMHIiHz9xh/RU0KPu"
+    "XUQwO8U+YaeUOB2GuREdEFcrWfQC09Y3J9AhkzCoa2P5Qok2b82Exj/luSVYtXOf2aXIwWO5fZet"
+    "L2iJ7jC4Kd1V7a7TlmRtbjE1CDW3LnDW8nZzxOfdB00Yi6gohxLBfSemTTKLOZOhdidK1hyJo0IM"
+    "/tENRNq9ykLVXkmNB04Lpf0Gt4DBnp+ime+AcjQgcnekabbAo2lEYjYhMQ+OnrvhPf9rY9o02jwP"
+    "CgwH/A+WjQc0Hk8XFzujq5cO/+wx99cfvhC92mWPLkH5+qO3Q/+af3v3+yuf8iP+S9Wh57Y7DirX"
+    "TqSXVLrmzRafoc63X0vDuENZuD1mMnux+3E0zbC9PA05MDOJIHju5ckHsjkxGoBT73cXLiErQySB"
+    "JMGEweieJBpeuRZjgTAdIdNDWgrKsGNjL54x+ZrsmW3PkSTPSI9yNilhn5DEg2SyRshZuURXoGP/"
+    "ZD03d3TGdVTAZYgy0K/C0LOSWzYejOJi96+q4heL+p0lcgOU+in5fU2BrNLmlPcLQ5FG4qlupO60"
+    "78jW/xqW/ZywOU9UfuibMmcBbgbp8EgVeFowXyxMsWC3U9OwnMC3zZRH5b8+eHN+8PV7+zr2mOSW"
+    "dLvz+il2KIck8bR+ZbKUeSNwTdP9SBBoNM2kANhsAl3m3oC6TBGGiy+VhABXVfHEAK9gtITk9aD/"
+    "UqN07VUjnRW24bNnJEO4JiZzNCiC+xVYe6iga15RR19Alockai8IwHGDuVnyIxY7MEF9tZ2h57SD"
+    "vzymNWEzHgDN/cNxgSHzEGa7zDJnsCx4o+52KRtatoL6oC1HqghE/9zbl0rFv/JF0yUBs3VsvDk+"
+    "tvPP/ij7/3+qUPzDRrhgnXh7UH1h74g3iAU4+t0YEemT999o1fnDz88C+Ol1+9cjA8uqiz3Se1ox"
+    "OEigve/lHWyT7FYQHq5CcWOvbV3Oy6yB0YiId9wpvIkaNihgUIDY1AhacKxjENBJs1kzA/CSfjfW"
+    "HJsRYCJezU/KTdnT6akHgDJkwYvK1YpDB7Tt+f2968pZejPDOcO319+OxIuK039Xt154bj1b5YmC"
+    "Wklcw/XK6YaisyL3h+r7ZiCD9xwHf+fPXb37VjnmX1w9xsSaLBf7REf5ijWg7JItNQMGMKXflKDM"
+    "jj4CYjaJbAJvYDDK0pMiGWOslSvSWa3c6UUIitIBm29tyYuyvxgnkghcU2II9yY1SwrAgz2DrgkY"
+    "wZneWKzPylDynxR+RZVInGJlIkIwsboy4kwaQ8HduGljvKjGIUugGGU1bi+HvpTfHNQ/vjm5ioiF"
+    "TslSafRKFsPa7F2JmfZtJimr3gtaAGgslF4vFaJ43J8DXrCq0BkB/bkCWs+6OESULGJ0KCDlX4yt"
+    "mASob4+GcdKflet9Ic4VEf8RRSZyQaLBvY5m3t7r76wfUbr/2r717+JfHnaUmEg6cl7f7NL379zm"
+    "Jr7+KgBdi2Bhp3UfrV8dzFoZNIbF74jTriEwtvfkSasUEMpdO8sREvi3U/Liiafotk7iJpAIrQIU"
+    "AyGWR82LRohDjnTZDQWCBKVXDVQTL0xjNQkGXbcperN0A2WDgG3DiQVedxUerYZt3C5ycFECLZag"
+    "i6LFSCTSuaTgRqb/BG2zOgfUKKkSslbmekRIfKfAex7eD3vvhrOzx5yibulNkmyWGB7s2S5PWJgw"
+    "3I5nuI3gR7km0f6JFK/Ib95RTLdx25aYNPPvuLPsvjrd3P0Y0dekRSfoqN0MEfX9KsXL0RVvoN12"
+    "Bg07ba2ht+88XN4d6x7BfPsb6LeXRERRs6vSzlQO3j63vwCMhB5bLXNQPohiTx4Vd/2HCDyL/4ZJ"
+    "PkxYBvynAAkxRrKR32S4mmXBbYBoOlCwWob7sAtQ1ICzx423LG1hJe2YiqwJ1JHlvbLhFap7KGjS"
+    "KaO7QEb9/NLLxqKYnMcmdtbD9FdihzwWKS2SVyPpiBXdRsUioAKsXuVJA5WmD69BF387OIYZzyQp"
+    "QjfUeFR3K5KLRYLB/o5u1P//T7b/xcem5ZcYtf52sPrD3wB/NAn/coZFF1/sKlW8PBa3/x6OjSxy"
+    "dL7WK4K0W86zjjAEXM4YJrYg8xpaOAQ4c5dFCFeABZMhWIgVbalKHTcV4IL4yQKSORaTZUBCGORG"
+    "NvlfKmSFF4JSmb+24d361j90bSkyjZ2Cnf0nx0cDzsnr85XH3u+vDdlz8a3nzmn4dXNnS3bvdQdy"
+    "wfiV7vbWZu9Y/KEQ/5SL9ka5bVHKuL3iov2WAaxgVTHtXkIitzEnrxEvbonwYonnpdoPnY/mk3CO"
+    "n2mSjlzFNFUBdyodHMa6lsghDSIozSoWZI44CBzwdL0pfmeSy2u69E23ainzmfRDnzX2m0QOaCfE"
+    "yELSXT8gHKRCzkj5LXMiMPMLWVtkOXKlwlN3nzGAHOslzog2VYFgr9iT5VztqEEikDSw61latkWO"
+    "EtRQfylmQ89KRZZVYUODXLHTlhCMQlrZPi64aF5/F2tnJ8c0Yh1UrIsc/HtoBIv7EGzFeB0neGM+"
+    "6Uoit9a8e7T0ShfNTXDUN/mwqz4LGfsirUaw0am8sL8PsjO/huqxIe95/k7e9vP/v57Xtv3z8e9o"
+    "x8Sg7ltSff2sOjowu/ufHVG3q5xQFvuNzQJo0FPb/Xss3CmUGjjiMg0eveJDFA1Dl0kv+r4+k+b0"
+    "xodkYIBW800qUEymzgevPBIGEjBpw4Yj0ZEdaFbjYZBDRvbkzHJkP0/VHI8kbDAymbEA8+7BVN24"
+    "lszOIDnAFuusqNw3bVfQUETgFblhtrPAdsRWF0MJzht+kgBe9kG+qE7mAJHv3ZzLJRih7bJbm5U5"
+    "Y2Wg7OkUg2ZWwQy0WG4Uts5HuKaSM00e/NpARgn9R5M4scb7jlD/rTG0Tx0w+0KA0hp5hpFLioNR"
+    "babi3aVcZe9C+0Wv/i0XK4v9jU1+pzl402HR1rUa++29MdO2/okG8lFODHj1N/Wrf4QJyxBXL0m4"
+    "sepRRR7h+VsT9BxqgcJASbPcZMHxkd9LDfUpy7yfalfWEUfgsNZpGiD5+7Zh+2mCIRQjwAWRDwV/"
+    "1fLKMMJJDQ4Ca57VSUSiH6w1fSdbrQJgOtJr6a95X9Z/0WVPrg0Udw9HU7oECW+xJdspX2c07Fdi"
+    "HNETsQAa/xyqlTph/5UNaPhntcYOfJyXJ5vDr55PKzl//y2neu/FrCuIS+TmsPrD3wL+wB4oBeW3"
+    "W4e/7Vvz/eeuVvjxbP6EVFu4oFxGRwOr+dM/86agjInS8lwoLTWFANmk4NV+6NiAIXCcHQOWucQA"
+    "4sySIces0ROpL3xUVXmWOYE5V7Y8d36vTTC6mLw0ajg2CJvbpDpzdbOvToMcytg4d6BPPG8J2rXw"
+    "w8MPDs4T8OF05uDOf2dXlS37tbcadOmzRk81t1bOAU4WQFF07ZXPJBP5tHLkizRoEWGuDoJidR1o"
+    "eES/pTLQNH04E7JrsC8cSXeAsJcojKSYYz74kHvca748JrsSXPU0bLLntYg6AfqRiRP5UL33OCbW"
+    "wayxAl9MwR6IddUpBjWcWPPNYi/CWRiw6dJmxVkdDmjchQm9VSrFOlFmc8aIRFBjVsSz6VDTijNA"
+    "ZwtD3OdUCHiR87zJTO8VOZErY1JDbFT2lnY5CMztTlOZHGGkRMcsI7cZkuhwhEkBJ0zLtd7vZQ77"
+    "Vl1oSR5Z4Sz1hjLVt2I56EjE6UbK8Yun3wdjm8SK0/DX3Tlwzbo/LJydH545PlO7ceLC+17Kch7z"
+    "P5ibf1sy9uXvzs1r2Xt/XyChbmHYt8x0fd7Y6k41jgqe6FruoMHl94Ew9sJA8qn9wZJrzWnMca+/"
+    "E6B2TReaCIhMVfEqOEoMQFtWlT4s2D7zyxUJy+Z4Y6NPAhMfnA3HIZQ9k4acAqmDhoiZrfvvMgk6"
+    "4s8IO3Yvj1yV02DcpxICJfn9p0jANYeilDJw/EDrwlWGcEO1I2B1hNJeGeYuvwb8wJjh5ovTBWhb"
+    "JfDa+cUx88smk4Wp1bPxMCbYtN8FNGPmVO23EDIz5g9IlpEEc7ROMfHVedzR6y228COfF7g8hMq5"
+    "AvGjDKtY8bHq52ho++fjQcajLlGWoe0VzpO3y0mV852ra/RM9ky0eCCDaMLNUwhKN9Tdk1SPkzLn"
+    "gT8XYzYJLTfZJ2W5J5KfUYhQc6tCHRkwz1x+R2n4Q+baRsX0U0VdeRYxMsQ8BUKEwf8VgmApQc7h"
+    "oGQDxe68Db8mH/tiQZ3VZaQuo6Bvk8AGYEB8pq62iXFRc0dPaJ8E3jjaIpSvZoC5LGiijK2Bif80"
+    "xjivOU82yhN58yqk7U/4oVPMf9i3/9w+//7c7mBt+dmwuSrHVae2DtgT+0BziD+bBJ2Tz3wntb59"
+    "74f0+WVz7R79QplrBBgiBzQ+KLTlzHEs8+Ze63n8yBVoyAEj6f9sp99nNILB6jQccps0WX2WRIz0"
+    "UzKeJnbmMzJYaaT7y54u4ZGzLfaWSGUt13u8TNYkUbtmFXbdaPkD+zd2O4dkXfqXvmt8MrW58Oe8"
+    "s72qIdiUy0nr8138mImMbcpxjMi1L04eZfvk/H3TvZUps539WDjrnJOXSRIWMET7zt2Ev7M+/UvC"
+    "SA/YzdtMuzbJ4ugnae4AsvdLQ0OXSQMidgm9RT0UdtJy856U/pg9mp+YFNUBmUeWpOgzjLlFbZyf"
+    "pJkPqQYU3Lg7HxaZ/JARcP9RIXKBUlrztntsxpTKBDSKN7ZnXkCd8wU+jQefOTQ4M/7NMZwrxlLH"
+    "wk8+sY39PLgTTORKNW7AvnyK96t5/cZSEtxRcCmhLeSAPZPKGLVuxrkoybHm9u0cQkOrdPuTd/2K"
+    "C1Jczmd07JNVkfXwhgmOupuG4/jcaBsKeiz+NdZwvDTRjWZl6Lrk4vnC5Pv3v74eFFOJ6WRBR5Gt"
+    "LGP7z38WsPlhsvu7MUwE55bIrvZqlvCGReJCsI+q4QQH3oSG/S1EIGCDR+FFB040s2VOZxTWiRQw"
+    "5tAttKj24G57tcNSjAsan05sPDIHzo7g0JujxECJaMRfGC4y4TZQYVZW9KwGlzEjjdwaOJ4sfmCm"
+    "x9p8rqxJ6NXt1pFA2nTF+t9MlQ+lomOWqtv4WgClOK1j5U2T4TPDzTEDEe6+Tepm0YeZ9Y9jX67K"
+    "O0i40m7YqP07buG9pom0URg2ySiyy6wfnDhhE9lfd3C2kXd2s9mXpyg1V9UvqYjvn5Aa5/cirf0+"
+    "Mov/r6/nD/VL9Hp4U9j4fs7KqskMwEeU7jQe/dif+xSLy02R+VScgxoHL87wsBRRsC/ES/q73FF5"
+    "9WRbwpwYSepmUMIpg+C0X7AGinOa5hZmupYsUuZFkMolQYaUp222oZRnKgNysV38QrOLwNhywGFw"
+    "No+j95Ay2xhMLqNpUW+i7ijCl5gTV/60AOf/ZXt6GI3EcaH5wfqLIdpkm7HSvUt+Scx1yY4UKFuv"
+    "10uTi58cqzl3/67ncuvS80t2zXae2BtQeeAA90LNraPTgcLrzx86OtV/7y8OT8Xd+B4gKeTli2Mb"
+    "nTlXUBMYw45bnnsTjhJn0bbN5WB6TWLMQ8HrjsCCNwxakZacQQcypwLKMNAAAgAElEQVTeip7v7V"
+    "LHJn/Xjrtl3F1bKtdFRm+KmKiYsHIQrYLortYoB4+GiwefD68/9+Hw9sX3hte23x+e2bg57G8/1F"
+    "qB7wBrdpP+003iHn9K0sNdulM9lcJmiY2d7+CxJpl/sKns9Muh5Ev9Jz6rQKyMOGx30U1IqemqZn"
+    "zoIgN8PiOzSMvCgMAL9o3usN7oHtvUSsmFZw6B2XjTIwcj+IS3SMkCBgc6jMqKTnyxq3nlP3yoat"
+    "SUPljbES7XXFRQ02JTixWt5Shv2CTBhljKBIMXASP4TAEO5IGOfZHRcBs84/A8y5q1eYqv6awGda"
+    "Nxk03AzKcJkvUcZbddw5IxGv2UZ+kbdntA22OxWbRFg7hoQw/tIU8ZIi8bIYao1nZUYbdterutzD"
+    "I6tpVsy1KZqtqQpkVpH92Uli06Tj3oOAe0ftg8Wa5eu3P3IT8w/tQkd8tTYO25n/3md3+8t3/+Bf"
+    "Y5bMZ29WERyB0fvnOWTgLHiw408ACog7xhUrE3D74b597NyStKNz8ncjzBwGDjx6LQb89EjkYWtH"
+    "wnyncIOUH0hy5SNlh83ys/Tmx6GeG1PD+IKDI2fAwu2+2BhP2p+3FCBEWcB1UmIoFkDx8PYOU8/h"
+    "j5BYOt8CVWEHTXZko4El9GzhUP1wxLu1w0vQe/eJHnJP+OZUD69CalabG9P/aDadRRalt+1Blfxc"
+    "N+dFNimCT4Q3/u2qUtvO3SG7Oo0jE9iw1uo082/JiNHn3QgQY8tmmL5p/86U0CImJ6+lAMw+d60+"
+    "WNe0d6+kUvR9H48V1PHhHVHRteqLIjGv9sUOlnu8rJwriyPyRQTSisEGOqMYG9gsX68JgPGG2HmW"
+    "Q/I7RpOoc7tPB5zJnW4DMHcLalZY5YhCIPgGg8ZikBGC2L7BkE6jGNMi0kvLAKDsS2oWBu24yn29"
+    "zyMgqozeQZmc2s6ds05CC35PmChTnVgtan/Gx7kFww85UwLWBYMHFnDjmcpyTsYczqTp3eo3Ty2z"
+    "9997s/E/eDFm+i9WHtgbUH/kU9kGihc1s3cbbOP//x6ty1vzxaXvj49GR3tanfZuNM3uRnABykRa"
+    "1z2o9egFHcSwwZpYxtITrkU3e1HJega9qRtAqiFspYGM090RjkKhTMbcwck+zMhNirREzCYDZ23K"
+    "3z45iF48kO5iP9tpw3azvatO4falP31fDKc59qU/ehNnUfDJe37+s37A71k3yHotNcHcusc6k7f0"
+    "vpz11Mvf1SuvxGTOfYhS4+Zae/b8dcoo+gifBqq4IhodRrBzdQWoi7Y5CkLIYxQRSY52Dh5vie/3"
+    "oObJxFi89wi5iEKnK7ZRMkytoOaRvtyXQRG2JHcQnROsfcLU0baSRySnLlZILlf9aOnsmQCU3XkT"
+    "V9GoO+UEDcH3RNdkLbafSthTW0OMXidgscuZNElCMVg1NqwyE2ItpttNoret800BrC62b0fUvKi3"
+    "1KgCTkDdKcbKTwINL2xCFBGRu6kRs6/poOm6XfYhDVnzNFuDMuVUiCrs4vO51qy7Sy0QOmZ94n0W"
+    "bQWYMiVX/4ARjrS8nwWuN09dzd+4dvLvSOFPiehsSD1U9DOv/BJ1/+QHdRLrpPWJiyU6rO4ztZDA"
+    "g2B3zoIn5YmkHnRxmFo8Oy6UpzCTS82ISUDkzn56TL4MpmI/TjUfMEoUXLwAQ4lfruGicGGxgWje"
+    "jy4PKgYwBnASlW275Rj+L1AOQuATa5SdjOn+wGz2aUOwkg3Q5tZqDtO4XIhC9tV4HRSkZehV70s6"
+    "nc2uIZ/gxgzJNQjpbNSd02wQ6KuvUpZ0M2Pxnbp2yywfluhycIK8e0MXWbgOUOKO3EQvpKBVV6wR"
+    "0bcheTtmM/JxmTypYeIyly11cL0ektaPoti1xdYRMqG7Zk74YmS/Su8FccoidcNgbd7R0+uPtg+N"
+    "Hli3oZiq5g8rt0+m4D7eCHxTkx+C6dRDvR4zawfOW+wmiDRah/t6Op0QWMhYXsgr/9Cgn96DyVjB"
+    "fBGm6kDs3TatAHDXBgUWLsyNs8schEOjB2Is/8Ns7CEDjqwSrLjXCVoyfWRtacho01aW43fsY/vy"
+    "9Zov0zpxFUOiNP8PwDsGy3t2FuSOxsNd8Ql1aoz22dZaDN/SabOQ8YJR4TOr90ft442Dv3N2+/+j"
+    "zfnTsyOwzrtPbA2gP/4h7gNOZ01Ix9un/umbtbV9756fKrz/7T6er2G1ubR+dXpw+HJQHbGyCdzw"
+    "oMffpyxV9RxB/DFCyQlzgZqqYljqAJHmvUglGzFUCltiL81mD6giOkZJu8LShZkR0aKdDchGx9PI"
+    "9ofmcDB4/m0b7TqAlEMMF5fJKnS/dOhv3Tr4YX9RM8J6wL9Ft1J4tXh+Xe1eHR6cGgB5cU4/hJHq"
+    "y1QZqXNT+qmDZJnOA2W+3Cpp4vaE8WvWkP9MRXpJA3Xecd88GXwHjIAIDoiSbXLKPgzNESiqyWE2"
+    "bhzRIbcoRHpRhBxan5u960k0480DqwP4YZTz9J3mhqC5nlo5wWXDjMIJHhvzar29H+MZFpEEASR/"
+    "6LrwWjSSsWCWrexpgwzC0hilWzVPwXyZMhphR2Jg9QtKRPztgdSebKQZRhtz1tE+1MW+ftsBVhEz"
+    "htKFEY1okyk7EEGGxB8Z9JECME6zb7nb7S+AOcI1zuzVgrA22XedIm5Ix90GWbxxgDG/2UnPCdEK"
+    "U662frjE+1d7h898Hh9/TKhfP6ppe+s/vkJyLKE59u3Hp0+dOv77yhjRP3x2yvNyjqCiC9CXGX08"
+    "FasJtMGZ3OhzttKrgD6UQ2FCRwbJj6Dp6BOvSGLJskhdS6og/ed4H85szIOTuI4tLe6MDP3atsVD"
+    "hpuRqmYCY4NC2/7ewBxuBLe3KSs/kMLVDODQanqBy5A2O4yxs6chePN1qdHfTI9B1MGGcpgz3tQi"
+    "x0+AqfsCFGDsrMpQMnre20fAKzyWWTNlt1h5Q7bfZt3b2DyHrEQzv8kS+szeo4SAvyhTctloh+ur"
+    "JS3Sok7Y7/YkvLNr35esPNpMXslr5H8Ik+9zUcPrp1f7h5TNuUtKHj5Smn2jwy+Z3TJo9+Jqggu+"
+    "+WYiRbgfFqJTgRjH8QV6KPuOgJqLR43LkMD4jGFR+2xt8IYWOEL5Au0p6QIqDaBKLktBKInaSf8Y"
+    "F1+HrUIUJoq045LACDkycitvVjQ30gbtutpg/lY+MaRi64PwVz+9oW6THaOPRjSeih6w/owpSssp"
+    "NxgAASedkGbaeWgQ98NVIIvf9E5BkX6NN3TD54/dXXf3Kws3nTfHMBLWidrz2w9sC/iAc4HfkwY+"
+    "xxl27/5eurnVd/dnJ6/svTU/2AmzBc0IPG8YX4pfKUiBeJrUTEMWRQ9oeIR4lEXtyOEYDgL5TicC"
+    "Ky6iTDwRdNoC3BeMQkqWDRLFyZ2/Px3TomC+42+tkvWsrGrtg8Fwm2q9/fO9AKc/fm8OqVT4Y3n9"
+    "Wdup3PhvPLr3UBU49f6jt4/KwSsr3GsVmUpYeY64uhrEEE890N7ChddbeOC5BRLHraJj4yErGWsp"
+    "tKGfnU62OAyp1CVzVo7YjMLUDxI7w+VFszt+AX6ABidyFnZWQ7FS59EjofCz/vq4yN4otmV87CGx"
+    "/7rJJDpVGv6mfnOvzRRoU4VdoCsf9dGJtTMpAz5520Rc7jR2hNA18jH9M9IUQgovg6fQbLSD6zK6"
+    "KiPT1NG/kUbFQGfyo+WkZobNis2HTIAGx6Hcgjuwoah8EVM+sdAP1RkWQ5yBqZDTQOmyM3/tTMbj"
+    "i02MGnn5RDeWRlzWxCvOQ1D+vz5cHNO7e/e/fR8nxwT/7xqbhD9+sPr1+9fXj68sYz2+wlPAoYS2"
+    "M/C0iXeAGtBZ5pRMCdHTZTJBbn2ShMHbvUAp7vz9HB4Fj81lA6wwc/MucDxXejFJzYUHJmoFs/d2"
+    "46AmnrhWn8zS3ZwB+DCnltD5s1gUY7/CPbZQkDznfvZB9MPA7ou3UqI4PT2oPWetjkYKVkMZCrMT"
+    "2Y0R0HMv0VUrTohsZ3wpT3CQgJ7XAQV1vbP+YUHfaTvPFDjvwHjM3v2H7BbSdKXBZ3lTn1LAO/M2"
+    "HRBuF6U9N2x1+xL6yTf6nzPUdo0gfqR8Fon2+CkmtTxh0668d/8s1yf2u4KTu/1obu5QP5Xzbwez"
+    "5Mctz/26ZvRemY4rt8sZ+jxKVRorOvJLqkq241bjMbME2vNKsI6DPV5kSqmpexMUMhADI2jg43dm"
+    "Jk21FdLNHQVhPdx6par2X7AOT3pLLH38dHiAzBdgIb1sMONyPNqZQxnsD7IkXhuq86D4MNKF8hN/"
+    "Xmtw4cLXhj4tfA2l/enNq+ULFAM498R//5iqtgbo5Mxdqy2Dlc2xor/t05EaGNzbtuyd7S3dyf/r"
+    "vvXfuVavf0Wae1B9YeeMI8UGe9tx37fJfu0lv/uDz+zYeL01vXdjfubfE4Yf4S/3mM3mFF7ZjHga"
+    "5MkY3YBlFRKf4lOggGAnArnxUjG6Tolc1IBDurk7A1xjRjOQhIrDVtZmQ2WpbD5m5LVx3Z4BHnrA"
+    "CMPtq/bm88HC7oMcvXrjwYDtB9X/PE8fZwf/PScLh5MBzpMRPiLHuzvtsYTYiQDOlBJJs58CsFf1"
+    "8YFzoXheGHgLbBmViPfqxg3mbdQRl883oS84yFbNFBgDqUuY7eyIMiMdsoHyyPUtOYDygwfaroOn"
+    "I12QfEsQismGZCQF/GatrDSrFtaXLL+pZD9YR4oiHKJQO5ZoYJ6aVL5VJpWOCjVaOU5gmR+Olz2Z"
+    "aWTPJGO0dpI4d4RCdloy/bxKJFyhmQKqMnjIgeQxnIj6VvtiPjBXr7w+zwRU5Ks7KKZ2QEJZgoZT"
+    "vrIizkmIusKlVfs14GEVLRI1wpFwOAA6teoVw2hKj5OGdYP2VsNj11yxYxclDlBSO0YbAYcNzZPl"
+    "4cv3bnweFzr146f92IJ/yQFfmTbeT+X/7tL946HHZf2tWbQugPNgvZBGVYpAfSkWxKvAjWYwu94S"
+    "DnzlEnhgCbEAclBcseZLkbkjtqOVESuKBz56uTvSFSnkcrA2dM8GPnHittX8kH6EGDcgXp7P5zco"
+    "x6Rcsoa3u50ug7ctoseqMhfW0POfp4NBBZJNumyIltthV5jHn9uU2pmBbfwN8nQW+eyNkMSoRktO"
+    "8koeSiC9ndfnRSZzNFoo5tLLp5C2XaUppwjJIX/tBU3W2pMviWic/gB9/JbaRFGFgJmtTlE2j7w+"
+    "LerQzcHI0TL23lIugdfRn9/VsPhvva1G1yxxV5THTyAwNNL8XW4iEnNjKE1afGTtmAj/mTIaNOfI"
+    "td2BD/py8w3e0AJ/lj+7qOzBAh0T4gt2zsh9+Y7j2wpii2lFuuLUOeUnvS/jIskPhPBOyCQ2odkN"
+    "iHAse3WVS07MiMjNythF8a9ZnTWDNy9akM1m9J8cecd6THGMue2NrnhmCj/qDHTWgiz9XvTB4tF5"
+    "qFfqJiS/3NWOVO3fJ0+cWLly/91bVXns3dOUSs09oDaw88cR7omKBZ52j/4PJvV5uv/PTk+NwjLs"
+    "Q5hjGHEQO4U0UQ0DlOdMibDUEQk4nPzEe6MCgIWxMnhFN2lXhURcETV4K3XM0h2WgVjVElhzJpJi"
+    "AY5jTmhVx0JGJRdg6chbXjp6zi6Ut/NxCj9KEZtIWfNuDK266+hrB3rDt1Xw0vXfl0eOvZ3w2v77"
+    "w3XNm6qR/OeiSSR5rD+D46ghJbuUtnd/D4Jo9lSt+y7OEnD079tk15ljt3MhhapgWXdaDJni+8S8"
+    "MqbMs8RS1rCREppb1EZWv3EV7WD/jenaT59kwqXYZBZLrKYZmK0oU9rQWOlMnRY9uggQ/bqgQlck"
+    "1T6we3yYj/lgNGtbaUEdjybYUbOMmCKmu1pg8Ov5LgTbnbIFgh57Y1NvIiy/iZWNiaDrmNMo9qya"
+    "P37BGu5lQRH/oTqrbHNcHT3tBHR2Tnia7mqZxMRKN08XvtFnTGjdcfjKGsmWIoNsCacWNyAEo5uh"
+    "jflb+AxLboK/ISV23S+PVar20qw1jfWWHl21oH64mt5+89ePSqzqLHBmt0P2nHJ97I08Vy75fvf/"
+    "od/fzcOTYXWTwSbHRFSYGJju2By0bPr7RXL9KRDBo2PqZQhzMw6H0GKpsKb5aE9d0kGBBGVuVsGk"
+    "PPQDMcKcIj23cMxCKA6+ixCB3ARQ4CIVICrqjI+KEtzsWL7FF+yYIFGCmbKBUEpK3cpQNFAAVnXl"
+    "OaOCXgsMgnIpItGq4EUMFjZ9rBnUbaYl+BlxL80m23UqCwSSJtwl/Y4b+ahFSxjLYZ6pFXJeD8wW"
+    "//lRw/1ghptQe/YXfflaR96IsvabveVMpLTGQPNDDyHUp/d08TdCYM6UAX7ZDePbVxFzkqZ1OmcS"
+    "F/PNTc897Xh8PD0z2/CQyZtPtYj+cu9eP1u+gSMF4RTtq6rKKdYrsoYzQfhKCdDno8CQR9Y1ymYt"
+    "+cJQ7YDEZYD0CJp3XWwqGS/XtGZ/nblGZrLtvZpPBZ2igLnRJKOyBS1ijUOxXO4x8gn6ZXhSIfUu"
+    "txuQ5GiQcLSS2/c/uuhLgVFiJaxnALLl6LNL59Hv9y5be39d5UcwFEnZffncsS7kTjQ9+1PdLvRP"
+    "2XP3737V9I1oOZWESv09oDaw88IR7o+IA5lDe3D25tHLz514fL5361WB4ooLA9I/YQ0wgwyvVhnm"
+    "QTBA8fRx0VKGf3RyGxaCJSVCTkML+RTxSJQYovI8ysHCzRekd5iLZs8ImNBllsYpU3TcYqQPlpEN"
+    "qhD9Mbmyw2q+zoaAdA/bqKvyuoO3gb+0fD/u6N4fmLnw6vX3lveHH4p+Hi6rPhwu6xnj7SxSyRb/"
+    "guHzKIe6xbpJy1k76WQVBkW6vZUWUuzipXm3vz502m2xVbE9izDvOcIw7Ha+WeKdkY2uf4nQu8sS"
+    "EvYxHM7ZYtBGNx4DHHeB1JLotPzO478E4GgVXigA4K1Q/I4gNrpICSRfqAGuXAYxqT2ca2H06S7R"
+    "+JAgsTjPVBDDZYFuOtNBhNP6eefNI+SoNuDlY5spoC5JzgbO1xdpth1qlENXSRFY+V3wrZ9p/VXY"
+    "zQjDYgSR/+PQ7bPuXlY8uYmRw/ghYQ9khIgSOs+oMPq3o97TWggN4cFnWWmYyZiBr7zMyihZ5P0X"
+    "fGujckwWGL/5RP8ObKOn5cDzNGT08vPzo8eku051rmk5xzBj/R6fqtOxc+v//g2u7exb3xEUpFWj"
+    "Zku3t73iAtlvwYZ05eb5QUxBgAvVnwoFFXs6FhLNLxbAw8ohhKDCgOQBh8Sr6bxPCoaOtNjGigg8"
+    "QbCMmg85k0GISUYUGGH0EoWgvUAdusTGVvxkTPxgKBPYiRDb83fuguPuzhNf3WlzNBMmhPtaVExz"
+    "6Crw2JvRZSMESiZG6bynaY4KDY1ICPLpgfS6avoCWHuu1i9GaqeKNGwiptgVd7uSMC1HY2TnDoZZ"
+    "hkCEdJMPzgsuqRh7/jq9gfPDAen7VZPD6Lr8SwqefpMqEwM0YIurHF9OK7/uDh8Mmdw+G5F/aGXU"
+    "2U/AjsFhOoNoEbaps8wVpAttDeyEV27KEdfBhbCRQAgPU46hz1nTLJlG+cxe8sICxXhOQk+wD59k"
+    "URgDBhZKRIOXLQP0mgfDbZVp0gjBGs9lgpEstS2XCJ7H6iniSKNDCbW9kFtWW4XFS2Gcys7mK0gg"
+    "CHvpibNoa6+NKQIhCmhcHTuDMMIbC8Es7YxFCNHOtZ8HuD6kf9iLhyEa1Ovzp/cP7Hf/TOtY8kSr"
+    "9D1wLX+doDaw88iR6oU1un78HDzf2XfrlYvfjXx8fXf7BzbriwsfFIJrMAILZxzisaEFh9YnOJh/"
+    "k6IcVrBPZIjgxk0FJXcq6DlSm+uQgxsY7jLG6apqSgt3gCsQLHK/OgQo9yjfFL9J4PEEpSbGJOD6"
+    "3mSjapil9oVLDSR23zW7OZmZQ0x23uL4bzelHK1YsLrREWw87t3eGDk73hxK/2Yo0kOb4jJyVqCP"
+    "u5U81X28xp+lvpTh6+0jOrVpNLquBI2JocZJfTftBa+4gmtKHrr33gB+jJocdxflmdqeGwYOGRS0"
+    "/FHqTIPGOhIoWSwliy36ZayzK5NYykFhJ99rs7KHVTt6GuyIaRPrJm2htgmxsePfCplWEO3bxcLZ"
+    "j029WlMeUz5GOLJ5njmBGXTRytmRXaBvszcPzqRDZnVNn90vjHiNIv6t3mUz7ZWDIR2PBCRkXsHm"
+    "1GV7NIT/uBsW6bNLTtuzDHtZSLJ+dszj+TSFdkp3WBndWBOflk3JoGkS5kzM5MElwwAQLjjFBaLS"
+    "/cvnv/1cXydHebly494ck2P8E2bn305a3vPNzdv7a1u7vDWe4FmkbAuAHyma/BQ5BUsPOYEsxBUg"
+    "3L4pkWJnCC98bLjVbXCdAwBhT0DBQPNKNV508wulPrfOkSHY/oIRU4ApT8fTxtAjgB0AFuR29ftN"
+    "zaoEQXp5ECqoSNr/WXCDZ5wKMLW9I9brNkelPJCaBk+5R7k6rctNLnjZOUkHszIpkYhOxuA3f4xm"
+    "RxXY9sMQidDR101LAb/U6UcYTkAucTztjrO4HC4UtvnE3HJkobpPJD/IMIvJtkmIrwuY+EI/Vv4+"
+    "B3f38QIEqV+vFOe1Qg+gCZWIRPGBd8P+BUen2G2l58S3+eDndF8483vhoeyU1a6rs/dnf39bt025"
+    "rw9Eip7uzYp2KmH7ttMkDcNLx8QBmtqHbR2LJFcPWb2yoC05g27Yu94QfZeORZp/Q2jeso0H88Fz"
+    "0AyiWwTQlSI7AX2YwHYCGxDNfL58UJHJ+S3KRxzCAHIO228KKwBWDGZJtF41xM5oPHBcgiP30HXb"
+    "GWcVQDspXWGT/AWrqV5xFeaEqAMsuSzcAYq9jKuQYf9ARuXV04WixXH/zorTf+8+7W1qNmLyvW2d"
+    "oDaw88oR5I5NCLHvefu746ePPPD5dXPl3pLY/ElFM2KMyl3sgYIhiLQc0JtMcnvwKA5qPEDKTVx6"
+    "u9lCuaeKE3BadAxziEPFIZRDFxrGRIXu5yodmRTnNB5YhSPIKeaMuHO1kpg9Nc5nmWeXdX85feTr"
+    "2hnB0ZscxtUlmX5Tf1lcLz+zeGl/Xo5RsX3x/e3PtwuDTod+q2HmgOW0iHZjcU0fZqvy4Pq21sev"
+    "mePG+IlljbCyzw5NhEnXWXPGZ7ZZKSik6TP9Q2tckXDSWbJ6Q8l9N24EUPZ8shl1H+G+VFquUX2j"
+    "TQmVayUjbheMCOyRbA4m6h8JqvycuaGFDAx2kAf5uuFkq7QsJYmusv6cZ7rrQoQcUKzyQBxFRPjW"
+    "MkWKarLXGinSCBue20Z9ZOe5a6iTnMuRDc6XFcWwhHtdOkoQuW4+TztJMxnZscpnGfTDa3NgaAx4"
+    "kA4131QqKvHVQach5q7Hrj5XFc57RIJ/9GAC7IB9sod99w2vcaSGsentwpnawLkNi6We/ube9s3X"
+    "3w8KXDw+V+kT3R2ZN+h277Vx99/vpi2H5LD7PuOEirA1jEa0XOMBJYG6NtHiOgoxTk1B10kU8Yel"
+    "IFd5iCSxZ+6VxvhNyx6kQW+9Aq5UiuECaehicoZTBwR4iNCVebSH70Lwqz6So4g+xEdwRiASFRNi"
+    "NTssG1DgYbdW9oFKRh57FCBh5i+U4bjfBAJGeyAiC6U01atMsbpVp0w4MM5DMovQlqGvRabvgR43"
+    "MDXvH4xBCtioL3hIfO2Gi7wVsGmxw+OXnpk96EYjgyoHOQURmjlpLpzSB1UyTPREF7NXGIjkR7/X"
+    "0+ybIlesuJrLQt3nir3C+QyXcKs2nM3VHU5fRM32EzL8rR78zxfUfNXtgybO4OH966N3x+72Q4f5"
+    "HvERzpNdDHw/JYuuW7LdvA/R3p1Ydpza7CEPhxm8zFY/jdAI7A+eiP1Fd/XKFebTRzGIMyowmKM7"
+    "TuFylrPTWqUWAY/nAlUnTseuVdLXg8WSzglJCJnmkMWLhF2d4ZXThiW9tg0Y1ATrURuQnCEgDMts"
+    "ZueMOH3qqIxm9kK1KXS65NaN+VHOQ7iT7+YWEUVT0esX/Bz5tofIGjjSfL0/vq2Z/+yfff/ND8JS"
+    "bC1se1B9YeeFI9oFPYoWN7f+fmzsUXf3r44LmfnSxvfU/nc0UF7m6Jxm91VJyuc55QkWkBCUljOB"
+    "HSscSABIPeCJqv6DuuFbeySVaRJA65gsKeG6Ak8ioeanKwoTKGecIv0MJG89hYqAqg+V/zkBlsm2"
+    "Yjgphe4gWJ79jtiFM/Ku63XV7al8wdxbfd4dPTa8NdvSBF31wRft8LaBUchh0jYSuPnUj21vgUEH"
+    "Nx+QO8nYZa+RWV2ElhnmybAJbJuiAEmeswlCa4VdIvT9CEWncEqaNgpix9ESE5YY9OGEu2pwwppD"
+    "oDu4xM2GxFTPGYAD4KbMYAI9e20WfFNKdvOueNV47y35PmGHMUWzKOoXCpDA4OH1FKrXXYrlEffY"
+    "SEslf89kPZYmwI8JLpRnnNKR6a6r4pvyOjTDF5fMG4xaaM57LKmpo2fR1ZiD8jB0oAUkZGGmXYAI"
+    "0ZwVtHkFAAVO61M1XZUGBwG3VzIeM6grOWQAMpNsduvDCNQWn0ug6ZbC6tSmWvEZCtJe3JYnXlcH"
+    "H6VDxy6fMyjX4ij/uf3rj9llbWV9i4LGUtTvf3u+TxDAo2DPohaO6Y6SpTBgQwlt8ZMAxG361RTp"
+    "nNHEGMhb7r1fQuA/cmAAXFA0kPCMrcNWqcF/7ioU6CF9oEypwEPYgg6U1LP5rgQckw04Bt3eNdKc"
+    "vUwELueLUrqtwu6fIGCbmmsgk+tB1UKKd9sZEy5PCMcFCcD9UO86kcPDj8ER5wSbGtaSwiHdME9n"
+    "dX0IdvslmlD/Kj5PyQuyVLX05J1dTX6mXr7801erov2cSNdw3Fnf4RHzT0B8bqdPUELJ3e9OrqZv"
+    "pF/SOalfTeHnaGj+9qI6fN3abuqOJ7HsljDO0Jv607v5zrHlvaVHpTJxq+ecAfcpA5NTtjE9sdGR"
+    "wdRAmdPr4qJXr7jLxsV+ZyDuqzwkGXVJ4h08cxTsVuD+33B2LJS1YAACAASURBVKQ/+IRzgSoHJY"
+    "tKH6DZsiUItB/zHWUUeQW51ApWlbP6BGxehGEzH6uN7rQ0sL7DjD2Tza1FwEqIGlPLbH+AtC5RJA"
+    "KbNHbV+W/avjun85a4EBOW+g7JJ9defePvLp3b/XLUsS6sPbD2wFPhASK8712df0lvArn6V8fH+9"
+    "e3FMsVYRN69EKQ3JkiFlRs1EXfhI8pxrix2Rkkcioe9pwxj03EL7jmIWmsFbBmQ4OJ/1lYonuknP"
+    "g7dlkmcUl0fPgqhT5ctuX7c8w45ApeytViyloP+U4dy1F/5US5nkbhRSm7e1/pO3WfDW88+97w0u"
+    "mvhnOrz4dzu3oRFKzS6cc4T3kpCpu+Lf12nS5kagOoVZRyrvHzHfl8uIvn79zZBvyKx/E8H+qdaw"
+    "4ZXZr5hTk+F9nxg8jtPWX2FbzFQFblFhFPN22xCjnCBZoSPtMngguMknJ6C50YqvQt0r4hB1IbPP"
+    "IYYlDrLLz0UGrqeTnMszarJU3XbY8/Ry+VPulAroh9YVN+SlsLbZ0lSZl9OoOZFmYlrJ1aLKJK6Y"
+    "fIPaPdbHBgq/5KDvTNYxHUVYh8tyJgOEtNeBjLtCXjoXEQR0L0zOXDHhyMKWvFpTEMhjOd8Qiq7a"
+    "dUdFZQtVamPLanPbFFNJCN7dOYVh2cxvCGfvLs0oOHRxdFwWB/otMTbaDeS3Hu1x989pYWmudw8A"
+    "Z357QB4CUYLLrpGN+9UkfTF759KpgX7u4hOlqJgz70mQcLVTHwgT9yGBwQhIaNQi/AAROcSF6Qs/"
+    "FiYABAn2iBp6qBJVrLl1Iv9mW3N6JaHPtPPNyBK4YyMnojJ4PSvLXhgRYb2Myw+Rlt7k0CkrGJTZ"
+    "DaRZmchBzjBBvrZQt1cIZLNsX4Dx8ZO/LaV2m12wxf3/WMrTWc8Ktw9pFyy1NuH8xst/SoHvvOhq"
+    "AYeutKW5DlxyvxPZsMJTZdfK8QO/xoh3KMBuY7dyWbQIOT2UDzvTpo7GcVF1rgH+qlKL+9fne4yX"
+    "OXjAc1w3fzFnpLmPDbYkclk3ym17TNmxJstXwyyqQolqWyjb7XRyja4z4RXVM2veXT5vpAjW9bfP"
+    "epJdNO/euCrORMktKP8VrktmVpO6SxLFhkmn/UOYNbcWxGndWUKmc+zKWFNzZALwL/61Dyo03Hkm"
+    "39VQ43x7JJ8P4bcej0h0On9AUNw8fI7DEJhS+e1PloDo0BrFYMua/HLX/xr3/wg3+iatz6sPbA2g"
+    "NPjQc6Chycv/hg9+Lrf784vfzRarV7otnA5/iGXgrSd/2hdRwj5+O4k7nFAC8Qic80XzGEbJ4cjx"
+    "J+AEPnz5xG5TMRERrwAMdVOeX5xxQm6lKWjWJiUyc+b/AMFKxfcKLNmF+YYkMFp3FstnRBcmt/qQ"
+    "3czeGlix/p7ZcfD2/ufKrv2H2pOeyhvj7ARlBMknOiF66s/BITngbiLc/6aGPHpUo+RErefjnagX"
+    "yvEZjnwcVfvamjjWMbaCI+02ecx4SNz5qqc9mORLcByVSmnOqU6DPNpwIgmzSXQtl6QXjeKYKiRW"
+    "rTw+lyDwx4KmUeszTLCdhamyS5SEbRgkDBp1OXk5fm0jfCJIDyOHc2s3PN52LzReARPs3x7YMRpR"
+    "ZZlgCmipJIYmGjekDVNmHKC2f1j3wob+llPzyAqx2xAW0QtnSkiqjY4TREjGdtNlXxQVVJYiwp4i"
+    "KrccqhRP+MI1gBgBneB/yLvLJ3/n4KM8GDXVobgNPJAUD6We/ZjGcePDp6Togn/YnGJ9rAja9v37"
+    "vy9aOTt3b3zx9s6Blwrl7x1sHjusrGRoGNHYvzpd5M6N+EU9l3JegMFtLuMTrTfaRaLeZV8qLeeH"
+    "WdOhBiYGyc6Hx4e/CxaRvv+pUsb564M1C84ZEs7KzvciEvfNGBHR6INdjQgXFUWdSfaBNhkCoJlN"
+    "MJwGbOw79UeuCJmIDJ5qFtx9Zug4XZPmvygIXWOmgjBiG17LFPRrjJ6sDmWY+paRPF5glnZbLEX7"
+    "rq6XZOtkZu2urNsNTYo1JkP6FXZV5OQhGcH5VU3b62R6CJ+pbXj9UCxQ73DzRMmBLkF7roxSt4xH"
+    "KYu4Snr3hshAnqRD8izsbNj72or0/0fbn3HzwaPrpzNDy7qztyknNwsD8c6dFLWrovf+p2jlTkcR"
+    "OkO8i2cZ7IUIJVSphSlWw+QeQukduBvQbp4L6BKf0ImGSfEIA7EWecoOj+gg4aBM4TfaM6JnVuUY"
+    "yzBCrsY5wmdQ59W1AoVx+DQV6gXClrKULQn/J1zie0pNxyyaM3AlhYTXZMenDL1ICo83kkfv5ao7"
+    "bu9LQIGIdlmJjdDJFta5FyfHzocYFMD4PcZb1zsL3/D68+d/5DyRq9W4LX2doDaw88wR4gAnR0ZD"
+    "q6cOn13x0/vPbz1cbn398cHjyrS3V5+Ydjo+ZzNiaKER1/iYN9F0wRSbiKWZJ76jdiSoPiumYUKI"
+    "WHntgJHMf4YJqUsUgfYuqI73LRe44qPiSoOMYy84FrOeCjP9yCa9M1+GcItGHlLh1lWFZ6KRwvSj"
+    "Gv4CLbOng0XNg+Hl7ZOBp2WJ8+0OdoezjceXY4VFuPFmqLfJK4zLyoC4ja5HmzhGESvJSOTV019B"
+    "zDHUGZQPz0S8OiWEdoRV08VGkBTcWn3T705EJb1lbwhBWfUoz/7RPPS/QKNgoZAueusuiWPC7ypk"
+    "8QFhvcHsELkBxFwJRZJlDXkZYEX+YsoWw8JMBGCheaDnZS8uK1mkKA0yd+KcJiMoUOtDk0Ng3q4l"
+    "KmZN/KANh6eFC2eTq4raxpQm6Fk72RMIosRekvKqTkOQozY7Zl7fxRQbhyhH5Wb5GCxe6mkhbhWj"
+    "Zyx/WBSFoGawD7HX7rLdnoEH/6pBSWrlbJvG8fIY9CeQTq6G3KQrVM0VpiGdGc+JeyzwU5WUvEy3"
+    "fvP7rMssG/Wyvck5o6Jj6J9m189eDwyqPNzZf2trQsY5GohfpCt+0YFNytyR0ruV4d4gW7WkF/5u"
+    "6QglEFcHe2yiyuvWExnYes63Qe8AmHHAYeEwB3rBI8DKvBQpnB4sEpGHcNgXnwkSuxoeD7a4bDB5"
+    "qFp68CaHSIDn7o2JxCwO9j9Z1GBiZjzXqgjXjL7o0Csrud0LcN87ZQjg3olxDejNXyVPV4Vl4GGk"
+    "ctfO0b2kubsomaNqlsqLmKF93wTLojnPbh7bY/tqMudmBLfCJQ2Uqb2u62fb5JhYc7ldDhV5K/1y"
+    "c70McdUPzm7zfK35BAS1+Ky/MfVvUJcKR37vzqxs3hgSY6+gBf8lIU7TjZLvhnDzQOhx3GAn6WTB"
+    "XtK9oFPW1MriPOoub+Q3/+DDTtaDYsTuYWA7wGVZn222cALTD0MLae+MiGNHLqc0HAM9b4Q3NpqP"
+    "rI0gaPgH40MpwlX1lLCmH1vfyFL2yTG5BzZBQ2FtqKsqtsOtM2m9laXRG3hVdG22MuUxqUVlk6vH"
+    "iAoCYHbEIKd281dher5enHV1944bcXzg/3R7PWhbUH1h54ajzQUYEYvrN//ovN89/5+2F54dapvj"
+    "vmazR1zrtBxAEWv1r8JWYmBoFLlOmISCwTjIMSMYXNk19kwiYqq2lHHDj55BHJ0Ob1/JQbrpwNFe"
+    "otUDwUbBu2UGdOBQk4NnJtymTIMVx1xzJs0IdLUOTYoLtq/j6KlYia1zLvas6p36m7evnT4Y1nfj"
+    "e8tvX+8OzGnWF/41AkC8+Bm9CiSx//VIHeScDjl+wK3S7fxdNaS49javYPXDMgM9poFwXsUMKL41"
+    "xuiMUbnjlIlJhcn7DBayElhXZBo3zWDz3XhVJHjC586GNDMU9KoAmTUT6Uw+Foru7zJjIJyBlv2J"
+    "ojlJ5bBHqc31jpBt4ioO0P9hsOr4j94WBo5qtZ8yzOulISO4Ng4nV5zoBwy8NV6BqtgPSxNFogeD"
+    "GVrLnIyRlF07RIK/E+n2DSx1SCN/VUQA2+cSYwPgqhxwkQ8CyySGSq0w6nzlMJ3LKK3gwgUw87R3"
+    "ZlrFOyJra8ZrHONGMWJzZ0v+Lcfd2hWxzrOeUnPD2xBtK1v/r4+rMnq9OLW7pKpPtzw/aenvnWjw"
+    "LT0bx5kLfW+c6QcHmsjxfXZfEutAc8tCzkHTdFN7/6Ao5NAAMlqQcYAZbAriFGvLMMbSB0tZ8NGm"
+    "OMgMuGI3TZiGUoZCAiD1rs8qN+YkIXf9aHSsnFBhWMY4PhF5gIwqYE2b35me6MidoLc/YaOaGhYX"
+    "zHFgVBl3PnkrYTYB36VdZDih7inpvErmEtbUwiNgMhZR9wEjm+QIdw1E0DLpuntplXIad54SXg0D"
+    "9zPzms4DyRLNVXxkkSfuqfNMAv6OLTfvBmbbQBXNqM+3JnBln4T22RPO7UYQWbPvx0Wi+nob1syd"
+    "Jc3XFUeSH8Yn93+Pjo3nCoCewEu/kduu09PZKZ37jjGwbI5UU46nX2xE7Iid8LAN3oJgpxp2nwTy"
+    "cMxxZl4OyQGXpONo7Rkbax5OG1CJVHeeprUMg2hU8Ae39ibrXfKtfW1SICUfgchsBl+thO2x6EwB"
+    "lRmtaFl3dKh9sv49oeNuSgRpkYXqlLxkNVbaBx/FFPBkX8veqNmyA01b2sMcWJyhjitwW9QDBmY3"
+    "F0fPjJWy9f/Uy/Zbl+3LIdv87XHngKPUC82N3ZOTk5eOk3i3sv/vPq9MurOq8PNraIzokFiYKKjw"
+    "YwGwpCPAHgeT6x03VCDnGHCvMMND7ArKTYqkuQKkCYOBbB6Jo0hQZ6/6cAXvErenMhlIrnJD05Qu"
+    "67Faj2JC026TK84l5CnQi0/vHtOO7UbfBkD4pU9hMo3KZTde9Eezt+p05Ppkj3ye0TvSDlrWG1+8"
+    "rwUD9twBLC6yNCKesIZY7b/k4dF1q5IK32YjBvi5YtK+SbHP/Fl70+MBl2kJRhso6pkI+b0OCgxG"
+    "PzeSCw9I3nC7FZooTbd4h0W+lP8aK0VIQXoQCUwFVCD3D3e8NUzxoMVPOApE8QW7CADB3pgCmFf0"
+    "YnmGnKGGNsY8sXAl2CtXXGlP6UkTy3LXUfTVfCkdBCguRo+chBQ9ubPlI39zrEBLmYHhEtKJzd9J"
+    "hlqywRu1wr0HihWOzoMrZw8LoL5u1HioFIIsnGmr8LYChyer2OXNrS7cHSUiFZrMNZb+CvarMllG"
+    "6Xq222I/pDX/DSiPxO2I4N+t797oOHx88dH+u6kd4t9CSnJ3ZDp18E2/zpz3/5grZx5xYnR3rkzd"
+    "3rl59w9V3ffxn9yuBg4+DEK4tVprNZzPtxPxAMGAXf3lyYVgekEp6ht5yGqV9ZjzJCGANsClgYMn"
+    "gnzeFhQ8GbNpHvxx/Lnh4Q3NXy5kvwBE/pRCiTgXgxne0HNmzV2y1995F2SAhyOAnR3291FOljKS"
+    "e/hyP6/eVl7O47h5KvBiX8ilVCofWr3JVjjk8yFfrOJ7rHpCLwLR4lFS1+JM3tdAPwjzayJMcNy4"
+    "hthhloK6VPQkuHN0qSyQlFn1i3yKYyvgOOz5DEF96xD3jkUcdPPsGFAdt3PpHDP5RMUkwsjBM+PL"
+    "b3UPfT7+kCzH+5cW/4365d1I+RC85sR9+qzOT5cKHN/M62r1PisKV/0EdtEx5dlm9Hqihb+FRLha"
+    "JMg0xZcJiScAXJG52iQYfthRd5wicQAlUt/yVSNFEGlXEqqNRA7AGiBFrtCv1EG1zTiyaONgPa4W"
+    "8drguGfP6ojycGIrAd+7phArVP0JNJVXyTOsCxLaXxOJpNAXPxRQHP2AMcOyrRRl6CYogIT1gAQb"
+    "DauL+/ffD+29eufi7SDNZmWudrD6w98DR64HRz+8InJxvP/2J1vP9net34gR6W8uk+Pq6leOAgpX"
+    "hNzEoQYSGoMnHIQYUCCVoDJ7iqEzSxz7FlJK9YQ51k9qwWprgkzR20kOY5Tbl0ayYTE+XM+w6gxE"
+    "8HUlC2WhRatpk+ME1ATMh6ypSvEiicUXYzdNB6wt+pO/16uHppqQtbQt850EXMg+FYL0BZnOpuJi"
+    "o0qzHdJXERFjsF94btxKEd7bhok7kTuyGoRzGtTvj5Ggq5neDrZtsX4MTkx+VqTUBcd5Ls6Erdsq"
+    "PA8qGxatYC4chR/LZpBpvmYKszIzx85nJnLEGKwrJFRJtsmwBsaMNZBpnRlCol72ZUNfzQtcKRwM"
+    "zfOECWeXHWPvG0/8JAvfC0GyCHNks4hg2wabxRFsj6i5A5vviQYlorB9io0IYsuoC4boGUm776zs"
+    "pRxjlBb8a0ULVcNER2jl1taRof5StLQFwLQC+JdrrYa2VbFdx4FAF01Ee0dGCb6hnjYIFFNys6Q4"
+    "TXOmLnke7QHS5Wexez+hslP2kFIsgTmbT22vrdnQcv6xXzezs7u8OONigspXlUHEf7ypECF3eHPL"
+    "AVjbxhIVgTjGiVDt54UFGH9ibE9DUyfAcoaB1LuEoOaJUD7gCHDItzwLMWP/6ZgcAJkTFDHR4e36"
+    "PMxoLFesvJSRZ65DOMegENzp+ZXdSzeeKxB9Ej3/LShZEX3QI78X0z21sAqZHfdLWPZhavN6lV9s"
+    "9BlF9oJDaB59O+xEbXy4YuowK1js3KXVebSd48uBS7kQGexyLpKyq0RVdZLQQ5hmOwbdXGDBukAT"
+    "4/yKyJhpOdutveuajwsRwkvQQr/ARMtujDnRyuVOrJEraE7PhQppeHbWlDtzv881d3hgfDnubUbX"
+    "1fUL8z/f+z9+5dkhzHlWdUVWY9uqr6CYASxIekEfcc7fw/3/8b7FmNhiOREkUSBECgAXSzn/Wuvb"
+    "97zTyiCq3ZM7PSThJKr8pwd3Oza+bmHv6IiIwUBL84uK8+eKTbcnuyfS1e+16F1i+dHfAZof3LZs"
+    "+OgZgiCt1+zesiNwrmUqe0P7a7jjCIhs4EeMDtPEnSkaP+4PSjL8goK/U6iE1cw+9LG+ALDikFYc"
+    "4md981QIpLnzFgjAku4wDdulxggvGto+0xY2sp26BVQJ6QWIhalFEXB0yh3qlcTYKhQefDhtJ/tV"
+    "oR941+ruCrTz7+0S8/fnb4rXC2G7py5zbaeuBP2AM3q8PTr3eOf/Jfr3aefH47Hem85ikXasQ4VI"
+    "ExgyTjregOHj+SZqwwg5mU5s1TxQvbwLG0yoqfDQ6jpX/7jk0OC38LiGadGQnRZx0k4PcGofiZbB"
+    "Z22Sy4pdePP3rOY+GacVkzm8Y3zQMswPl+3b42Zyu9XZ27YJqndNBHZfpJg/WDs+n06Kvpx09+M/"
+    "3l8a+nT6dfTye7L6YH6/d62kRrJ60VmC/ZsDBvRBp8+dCbPdYf+rDZlF7SVWNvyrLwFg1b9ed/ZZ"
+    "iHHBTPHohp+DJzdViyNsq4jdkEiysNzsASnb15IZtv5FofY3+VLKOmFbzFbK+YPJcsmSsdvUi2tF"
+    "Jlj2NKVNSq70MEH1n8M2PAR25JsQ3MXRQqEDutw8ynDPUrLM918JkRqQTn79G67E5cPNY6KzHLbE"
+    "nssErxwEa92neN1/wdI+V5WIJLaFSClTrcL1EhDFSA88HnRa21ytbWZ//DIl77ToKzpgVz6xfJOq"
+    "2SNQ0XJ0CLFGRsz4UBFQRifXZ1/eTd5RU/dLnRYTPv0Gk0+fb1m9M3l1c/vd3ZP2EDsOIuF99T02"
+    "JVzaBFfRrA35WSi/VqUS36s5mbH3XU5sMNpkGJtlHnuLmiY9D4tIsw1ILhyYaJxuYumgvcBUejev"
+    "PYrcniGhwGPrDy2B+lALO5rHJtOMFMZ6M8oR9TJIc8dtC5Rj0gVoHlxZcacyIHA8zYG17y4LJ2bX"
+    "3RjVXp6NRtWRb9wenNMRtHFs7Y07a3LvihRc45m5n6Q08bZMMj/1CH8iNJfXcJIQ3ImsRsS04oJh"
+    "PfEaNQjGoBf6m9beWun+/2lF9Zh7tO9q0wXD/qqRLxEug3zGvezIkPzdwJ5Gce2NTxW3Q72pzx+K"
+    "6Yp3OVf/n6dvrFly+m//LjE70MBV/yIphbPX45TQe6O8dMciE+vEm/AR9trmVg7A+RrM+bMBSrDB"
+    "sTnHF5+zfWiUe2xEPf7zOBSTsGHUqo3c7d73wF1UApzyZPFtgEHVxGlL8yzBEsVWx7IMa/mZRtaz"
+    "MscHRWWn7UJYKm9Z1pZ3SgfxHcvjLKOm1cA0fnkkRJ94fIxk7bpvYjNA9zQPenXAVWW/FWVD9/vP"
+    "fFX/3403/SY7k05TZsPbD1wA/AA6v1/rvLB89+ef7t6T+tr/b+dp+BXgOC5wHVj9HJGyMTq8IeNj"
+    "J2MOIQGEoyLiEsggen8PhuHkxhhfveh0IV13gUVQ2SMtNYqFoRMfSOMxeD32MdbB7fWymDmwPjMU"
+    "HV1IZsh6uUrEhYvzC+shklcEVTez1ecPLo5vm0eqqf5pHk5Zv19HL1N9PL813dudPcph8u99cmNO"
+    "hST6Zqxlae9mFMB1LLLsXMt2zsSldKYyMmsNgSzfbbD2BAkTCBCBYiD/CkUkae9jLlg3wRpajnTj"
+    "NbbqmTapcvXYdSK3uiSVK2IYaA1TYZb2mk0gtTWl0BqGwARjJVkm6kFmVRp+N9gUV+sAsklglzUR"
+    "4NwYW3n9xpuZZxHkOQNWMk5+Ms0TJzWcRSjwXVNlV9JU5btZXUdZnGmcal7yn4aEBSrTsFNk8HTI"
+    "3O8ESSNajWcTpfki9kQ0TISZTcC+lLWAYfhRzSJ5wSYPOYhTz7C4xQF8w5R3+/2X37/uzxu/MLvW"
+    "zpgDsLWWACuWEhK7ANM4qR9/mr1ydf//HsUzUlo4d+H0x3c7Rhu1Sr+3tNaoH0j3QcHq+kAboRiL"
+    "OIpNFUQS3eeSECgQbLzxXQWWjm+S8MNGLkkeVuCJsCPtzFcoOLER0AWKcYg5tHI0nz4c6SN5pKe2"
+    "OBfn0ai3JsaR7yjWN8cfvKVem3fa47+Ml1ohewTTdOZ9DJBqpPMOjIEwnbelVmvymOPaoeGy1vkH"
+    "K3rkRGnXFBblkHH4sMrYOv2kkAHgclwOWxUpgycONn1UU2eEM5WNlQZpMt5ojriPnml0y3iTSYJT"
+    "jhRYA8FwLwg+ulGYnHNnmEcl8+522WPOrK9+N2tNjfVfmb9cH0q29fTVf8Hg9tXWfIxfm5+R/s6b"
+    "XQ4NAG2EUXsH7ao22SPhekb3Q7FrsscykmWsYJChXM6z5V6RSOI5LocXC10bvAsSwOxzr4Yhf8LR"
+    "d7XATZfEgQ2tbBIxooqU+Xh2i/UlINTGw+FSvB/9hUNQ9FEnA/tD3IljxxMMyltM7+wpkn+bn+9C"
+    "/jygH8tQ5w08/LmvIPm0h9x/J6d3f12599+uR30rLd0MXV2+PWA3/yHrjZ2b2a9Njl7d6T/64f0n"
+    "436dX+uYCpuUC1y2ioBBsGjzmMUBk7UooLoNXHPMpq3NBBLPrwSKPfNAmNwDyQdI8/JZ3iOsIzPo"
+    "xHoufDscwxRfQaz3rwY3xnkA8uYx7pGts0gzFJ7TBf+SsAqil36OD2ckf2XjPMKcOe7fB8OnzwfP"
+    "qzj/4w/dXJr6fTi3+cjna/mw7XXOJkVkNUcd2N42cNdDldOviqBRs7Ydddu9gh/2mOTWXKl9hfdf"
+    "CaJ1W0ScA7IUWuz6IdAOnx32M7HDYoUn1skuePJiq+n5/57sJgjsvmQ+xvgYEpgmmLPkJjuD4Dha"
+    "ZZBDIhWKr8kKqAt1CidPcZg5i3oJZ8RWqNIPijfmn5kkNfB6eE4Xgmq5jMkrCwB+EuuhMvedK28E"
+    "Vf9cQlS4F0DwV2dlIY3c5VR3CgGgmf6C+08LK+pG1hT/8ID0dwu93bl+RZO47QcvjL5zL23G0K8l"
+    "xj6cA1CbL53Oxq2fDo7fnlI+UXwM29OTFn/kaG716/PXl3efOJd+Y4m4Zj4NBjb16s0fD1oQLQlg"
+    "t9aP3IWRpanUQdIwNMmkmQ9Ac1mhZ6XOGqfB6PTCfy3V43K4h0CH0PTQMaE4WvRGEXgirzBkP0tq"
+    "vxkIQDPsp4YQe2utPRS6ss/HASUm5+2x097qzKwxtURcJoWftJGYozmYHDgBvclERn20sJelKmTK"
+    "wlYZ9bXjQ2jGzGIs0xPmexbR9wElk3J6jKo7Li2hC2bbIJ+9BrvvJD7LDqYAqHtuG7UHlDodXaf5"
+    "ZV1vZZXljASW9sBlqZwm7f5Dt0slnMqpXv0PklJ3KTVvu6S3c2ffbibLpUO13qC+D0I15Kw8TOZu"
+    "5AkHua4PqxE76jkc0HfZK7guDGhvYDedsbE10302SDSO6/bV98SD2qtWT/8mKE2BMAcAgSSbBSX6"
+    "dwwAjoL1eEJhY0+IIqjN127S9KRSsky9jaJUFUeAiU0UeoP39g89eh28v5BQZJZwuH8ubF904vyg"
+    "ZtCAYMlmFL1RV7WBz4zrAYdE3nu4cnj37zyUePXtmO7WHrga0HfhAe0ChwvT48eb5/9MnfX10d67"
+    "HLlbYlumTncULjPbEOuXtWYwYjlZNmmkerFHvsYSxzgLGSHjQ7TWGzVHKMehpzGJcoZkTMzIBAhc"
+    "YYAhk3ZWhBKhZPRtRC0Tybi6hstrhwqjm5N1s8eslPNPA7dfleQRR5cNQEp0dNVkcX08nB8+nHTz"
+    "+f/vzo8+mJXpqyp9810EyrsVuGaKq7uuYlZXzvGP2Skx93/ZI/blDw1QX0Vn3YANpzydte26wpU3"
+    "MBFbHlcXTSOvYYX55QFFpmjRwNq4PH9eEjsS7TM4AgpMk+F0Ol0b1kJ+9gYvHdZ7LEUmoWsWX3i5"
+    "THxalpeDud+eteESxtJ3GLQK4yImTbXsc6NK/XwSgtv8JvI2JI/NzCLuSglpJI5kmQyIzCMllC+U"
+    "/eeNUesFokQkN1YWBtw3Wtup1dF+pTQrZDcM67XgaObnigQQIwi5Qobw0qJ7g8yRwRrbIy1tFcqF"
+    "SV2yZlBv+QEw969VHpWu/A+FjfoXusYk6AjQ06+zcz/PHt+ZPVwcGTlX4oc6X7/NwlYiD2RopFOJ"
+    "sUBftcLcrLQli89c48d7poWFpIXOLpH5U2RXlf9dcAT96bG2H60T7J+LtP4GlRT4BHxDympy/yzb"
+    "+fhixW5A6hDYJV+CzC/bZF62LDpy4uINssXbyRET0qyL98PwAAIABJREFUdppNHj1rbFjRiv2iY1"
+    "/qJznZRYCfesLCByu520e90OXOqnQ0xqbUKyc1C12fphikFPg9cPK0ipbCZY98zSbFfPBiY20qTU"
+    "wB5xw29RsH4STYNMXjjooo4OtWmXWil1agLm0D9fWjk8IjjRp8x4ba2qwX+yiwmqpvKwQPfK6ois"
+    "F+VCuJ3y/K0A6OF+1gnOCtgzek8ntzL6fD6Rd/eDV9+uxH+t6cfsdnrclMz6zgj7WYb69X03th8j"
+    "5bWYaXBr6TOuAfXw0SPu3JX8qik/qGknbCjn6jE3Se4RbJPG4T2Uh7GscMlKGbcyJIxheP+bBPZK"
+    "qdR1UDNjBgVsAO9FhRJySHa9g4yfuUOrgP0p9Uhu7UoXQvosCEgO32A5jIMMGTLn4Do0to0O6RS7"
+    "MiKoI8fAaAlmIi9yAljIFOA4nAfyLphm/nj59+9NFnBwcHPGG7DVsPbD3wA/EA48Le+sH57tEnvz"
+    "p79fDz65t3f7u7+16zdcasjH2MIBottAnxXOj5I6MOJR5mahzpxys93niwUQHBG5xKMyZJKAgcMz"
+    "5Zp6g1xXgcyoExLOOUESoTKuA1nxQO49mwG+OYV9CC/Yxm+kOj53zWIBLgJ3Vu+aFwXtSm8dtveG"
+    "bw81pU5fqt1X1t4B7vfTn9pX7C7vZKv7n6bn+61hMp5zsnymszqK9E3JYuHr3clZ+iDY3YoLlVH8"
+    "8TSjHgil0xNUjw+oqk7Pa6BD4FEOagnOsYChj4zptu10V101X1bgtKLS198YPyJjRIxYo8b5YifA"
+    "g/rEu6i9uAZiAeAXxLiRIGI9EWDpTFJkhL7OQjb26ctaz7wBBCKmHEJTJ4rJs62NQFyqIk0MU76J"
+    "h3L+CLOaQ1ZkpSsznK+xxRZDnykSbb9kDBL/EGDFE81N/RCXdK3LeVtEQrpUgE8FIehuBHDsUt09"
+    "D2PaxcUHZ/DxA1pMx4qFaw3eho4ZDNY+Xkq0xLQtZCJ6/evnsmEg91bWzY2A3d759/99Hu7vrU+y"
+    "k5kA3KJd9/qz8Wlzi8G4qYBTyhG8mbjsp7ca9BikVzN7DfBGkYloNpdA88bF7YEAmTP3ek6ijopS"
+    "NZP7F4/B2d6iEzv1LCoHPklvFsFxsy49h+sTAwSt4dVPhASS2i2hBWWXUuuCnHdjY/vpsoPaRbCJ"
+    "uMFUZDUeZO7o4OCrbHpvDyG22qGy5ksES/x18zxSZh8Ift2Esgyt1KT5OzXuzVP99R21W6N2LIsR"
+    "nGB+hjE8fGzV93wB/4nbj0uC2Vb3+zH0hdNT3VBpCNs/2HXNmFbfaxK4G9tbFTOXddwUX/ley4vZ"
+    "aNK+qpCVFl16vD6Vcvz6f//N3F9PNn+pK5fpj6Uu+s5XHNXV3h5ATndxFX+okDvodnl0mfB2Xhew"
+    "Cm+raHAsrwFTpIp36qojJVN3yvixJ2oMijHpYpHuouA/EN//gh/Sj1l5ghRQTYOU/0XIhgMtE/sg"
+    "UJu/XQvyO5GPKaSfYFNLzWbUHB0RjUoULscqWiyx1MLNo84wt/0DXEJIGt6BAx8o2WOPA6th5YFe"
+    "DFWvzEReWQRcVumIXZp4ThZat9tzN9++mPPvpcWrcbOntye9h64IfhAQ8ROv/Xx4++vt59/NvLq6"
+    "+vVittaxgjvEng++wa43mzGt/h9iTH2ORLl54PPbIESMmMW3jHo8oiXwPOGIM8FjEmMRDBLGyxuz"
+    "y86GS8Ymy2As81MDknfjAoy/wAO2OWKAYikQu/HjPNiWz/oZIxlHFWF0uZyDQ/EbzOYS53vRPvHm"
+    "hO2Xs9fSy9B9eHukC5mt69O9BbxPf0W6z6jjmy4EknGsZQL3786aeUMAk9foyJTSRzLDakLrbMlV"
+    "NefPERNgWX2qbOShCYowg4Eb0oJ2tEJ3UINuUqGDxdanoXFtGo7cMwDPaRuFNedpQOtynKFGCjXi"
+    "S8nlrUoO1tzO/lJVfIsQIMmJu4TEppb/LKjMiIh3yHTtuPhQOtZZrPOppZpaO6Kpg3y3A3E2BBAX"
+    "s0zYIjrOGxT4w1M8Sc2ajwqLwC/btvPFDGn3Up9vlqH0t+QLRtAhAtEqyJ0p+AhZa2KSXOj5Imms"
+    "8rVuFkbYkfBGtcYjLC1oFbG/v7qwcv37z9+P3VtD7hJxk3NOSM3zDj+JWTzz7/7hNtlA4xjWbk5H"
+    "BjydEsZN3wGhx7A+B20+IQPhb63VHc8KIxnhWSU+5MyPOnuDdmYcumhXT0cPLS8MIFW5+VXt+PHl"
+    "HV2WWhGODBHr7PR6YfKbTtLG7hFobMUXEW42BQTqfiQ5nr4oRFXN6Ldyj2gyxzRxSf1IpIPRTbDl"
+    "HQDx5lCuhDD6F12V7RXC/xWq/qYj6N4C1LufHQoXpQ3rL4JwMbSvTP9+1UyKTD9x5pB/tJYD0R4W"
+    "tvHpFVW7KZ47FKn0TASJ6/5fcV87il6lSbdhbnKOSlOPD15jCTjeotvb5DqrZt+6TWddrTBoNNJh"
+    "8ut/gkUH33xAvumZ45eakN8y++eTHd6grmoX7/cF9M+3rzJT3JmznFWhowmrgOMkb9ID7DBnyHn7"
+    "yZx7fi7X4Lbwf7Gr/pDynnbSjGgqL2Mo40u86RxEfws6nq9vDjLREZshKuiR68llVMtvDJOE1/aZ"
+    "psiu0pQxdt5Lusoy6y2/XHB9Qgf9GiMtmIzd2uqAefj+BRmzLxLYPrVnxiXvBFHvbmASNgsLWtIc"
+    "HjR2VhEo5eqvR2f736/V98/PArSWVIWCreprce2HrgT94De/uPX+/uf/Sr6+v1S33rncHCwwRDya"
+    "0u7DFkZAxiCNBH4/5KK1ZGaa8UGLMYVPRPnp8/YEXLAjArW6UDonISXGSDXUfGLf4E1hssZPwWTI"
+    "iEWh2PudQ0RCUHry88IyNaUFOmHPNc2Mt26fYFLTEzNvMYJHfitAqRWUrzmOSN5u9mZw651qTGBU"
+    "4tTPeP3k+HT76Z/tPT59PPjj6bTqYvpqP1G93p1PpEcyBzAAt+Lo5l4Q9NmDziyYcrwCrXeyNkaX"
+    "+wQXTXhzqRh4dx3p7VUSaxjoMmefQgM3yIjIowmxj+DuZZElSABvR18ByhjNk46BMe0iVspqRnyS"
+    "B0+yPVsDZJMswrfBJUTkLZ1KzIi8icyBQN/oFhnCoZmGIopW1Xx9Djz1lB8Kt+Jou7jW42kxoF+y"
+    "ngMNOadY5j17/G0fTyQMRETJUkqwRpUKJvRibV/SI2wJtPrxnSN2CENzFyznsdOuN6/SF59ykrs1"
+    "Yx01sQVv6e73K+gRG9QHewOg7I6V898+DN2cXH7874nY/NDRkdNsk+Oe/i9nrn7cX1p+v9/YNeqL"
+    "MZ2PPiVO1CzAKSgZFGonFVB28UtEFiE+HGcr3E50Zh0E3DZiOmwaIWm2488bLwp3GR9YtABO/WJB"
+    "JTBnTpEX4vrm2L8XVlUG9BRB6bfGdNfGyG4GVzAZuK9OHO1Mo4xR45qcE2OqUfxxQzeTZg3iSq3J"
+    "sU5dmqCV5Bd7u0iZo3LeUP8YDjTZ1wMmDKb7KBD/hUirriNz+aCAXM8oMz4gWHNBOGH4MUCz4g3f"
+    "WCB1H7mHqqfWgeym1HT2aW1elhQxBgo8CkOW8msAlf8cZP7E8QQTJsAN1Gtp0JoO0DSvUzM3ff2G"
+    "yLX3XBd9QReYIHCteTtqZ3ZGLBdu4oXopypu8g/OM3L6cvzyWjicsvUJHMtX5wHIsOZC8PnWSyVr"
+    "sJP2aLn3/pdT3IoNO6UZq0+6RzgpAvUy6CcZKPj8LZ5WAGN7w4HWho8VUIaMIeB5tQdsgesPwp2w"
+    "ab6PjAwRF8wVZLu/0pMxJ2KO1zT/YTOyBAqCxJ6+J8JUOohOsUBaYtRIaMeduuYuj6AwMG/avr0z"
+    "HtbXzXSPaJ+fr2+t2T08e/efLowfb7c26I7WHrgR+eBw6OTs+PTn/yz9fTw+/yfTIGDg0AGpM1KC"
+    "jFuMZYl/FDM9A8WI5BSPwMGh6A8FFkkCfke3jI6WPEYFPm+QS+/I94oLUNjVnj12A0hnJW1eMYGe"
+    "ZgNJjTdaAu/r09M2ucY9zzpUY2W0rru3Bs7HTpU7HS5hMI47Xm1h39pMHhwavp6fEX0189/mr6ZP"
+    "V8OrzSr7mc/VGszOmaY1U1pjrHosRzzK/C0zzIpi6bOS78kseJ+WAvKjEb27jo6DFaRLvaB2jVNo"
+    "6kQzioHaEwnHcdUuIxXnnw7wTpmhXfKcGQEIg7DaXTivPVnrBlHgncYDMEh9KdZATuHc16n9a6O1"
+    "7Uyfzkl/Vq25Y0a+/DPQXKgjPrxqduBdFmKvZ36Hp2filNOnhLVNLI44O5DYyuw4x8Fyn45rKUq6"
+    "bDQJDgsDFsEhkJA2Nr8EtL+8fg0KivWP3hQLrWqKWr/QE04vRPtHhvYRwOormPX6+vr26fXeq1+6"
+    "NoAxM6yzcsyKPnZzfHl1c7P1rtr494S+HlxblPMG9KdPWKE50XpKiN8mPBSvnODa3CgEHjaMDyHQ"
+    "uV0XB+2yEDXFW3N040sq9E1YK0hhnJMxCKW4O62lNRNjSoYCPjgZPeUoHuxcaNRTX68mZIPZqnjV"
+    "u/1GOlTUZ3Q3oY9vXr5cGFhqy7FXUQEX46mBfrKuOulzdY4rbdKkcOGddJGygolhUGeBlfhcXGyf"
+    "UUt+gSMZ/x0EWHV9x3FpHlUVXXx7bSuedP11Uk2ceVOzDiE7DApYw4vBmiqZML4C1+173s7scv4c"
+    "PXyIJjVh2UVDpYbBjRC2RoRldabVRtYTpCBMUkmau9GVEuPSr9CUVcw32nu3jPzw+m37y9mP7y5M"
+    "R35fJICRu5W13c1CbbOuQvHuMBUP8Y6e8QCkfdRnWHrIPyzWJ7zYoARW2cs4IoegrnPBhYr2K3kR"
+    "KZPGEkHfmut8WhLeCtC4jiBYv+ba+J6L4CmtKe1MTr/tH8DbfEQFGHtlF5MLttqHxDUN1OEyvr0L"
+    "SWwaezVJ0XxW9e7HU+CPHO3Aehcs7ZfqW1SHjLC1EO1nvvlN2GrQe2HvgBeaDHEV1eu1gff/rZ2a"
+    "tnX9zefPl/6q22Gic0H/mxe40YDBoeODiQ1pihP+Q9vjJwm41x2wwc5nGaQXIoI1E45jJnpawkvE"
+    "o2p0ct8gyEfD+sJoYxJs/gA9sXIUW36pJdjtVeRwiPWbH1MC9lrKVW0io9zEqM7fAYTHVdH1xPD6"
+    "6/mf5cdF6CcnWl79Np3fLy+lhrmn1tD/PkCkKZ00EDQcIGAqx8VQZkLlYhlRJbb5DQ7flQxjcNad"
+    "gSgyw52xoa2Sp2jN/Io9pphPXJvKF0Kl0ylMELJhIKyidUovCGEZ2/w1U+i1Yd3YoNFB2NP1MFif"
+    "Lobb9ba/N2xclXOlZhr1JdDmbJgObHMVWWdBRGLuk+msYBf0oeuJnP0ioMJfBmLvHmFB/nBHd8HZ"
+    "qnY8FXCZH7s+IyN/Aj04zBTs+EpnVce7XA0mYS1zoLsLmtyaYuxK27W8g+V51mlXNbWasO5lHcF6"
+    "L78VYbC6AcxUqaaiOt82/17uzs2duzi+Pp4b45sHrTAvZuXHjz/mL9x/d6vFsnPRsiGo2XntBybO"
+    "owmo2GN110ajWMcr4rRIN5h62FvoYz3Vnh8UiuJqXxvDFyDizJsehXno5O4C4gC1zuQKGPQQf9HX"
+    "qDkU4TDH93TyzQ+LCZ4wfFbTcvzpAOFpbgUQ4csXUUsDumClKuwc6bGBhnXHh8p0kyLlcMP9jkRx"
+    "ANQdtdG1WXLfSzAUbGnRV+fdhIcXpAi/4g3rcNKgM2ulOP6GbDSEj9SDjbkejRiQ7uvPLoKpba1R"
+    "KCHV1gOlQEzRPJIGLrPMngR2wGYOkHb2AxRsH60KkPITpQUJ/ygTfPIl3o7uDZzcH0yy9eTV+80d"
+    "et9MPi4GMl3wHkK3f7qs9aH7oXEyp9h/ahL9JvQLYzLIUwtixiyhXg445myuGID/x4o+yy/82Zg9"
+    "tMUrOf1OeQV4B3GXrTGoxlmfgjIhz8gd7ESQHGxwdDUreQdDQ/OQUJY0vb475R4NhqZjMCGbyuUy"
+    "FU1TuHRNV7UZ/Gb780D9xIekxQCj73F9q6IN0Xpp3vPnr29Hc6wbffn6v22EZbD/wQPbDaP/3mdu"
+    "fZr25vDt7y+GE2PzUWMdgxLunfYy0OYPyyIxQ7HZ55RIIlMvA6uLDSAavhJrQMXTAFJVTGtYjbgE"
+    "6W9kCK08wZ10xDiH/oJhAxlzH3NU0FvkOmvCE8QkpGdNbEWhFphgyG5wskVbC6ng6O9MPjp19PPz"
+    "r5l+mv1r+ZHq2/ng704pT92/rJA5QKJ0tcxlVdKBNNrzXQpi/0Xd6wKTo6cqER+/SxgYqwyQe8Hr"
+    "uZB6pYvBJXPv6hkv2ZU1AIHTttmaJE2AzBAk9lFKMI/WYlhq5PDEsaQPKLEGsRgp9i+sjM4BLhLE"
+    "guHPlihs+hdNoXTSOGPgLSykODbIyBGNLgDUvsjBhFg9vysXsWobR0GA2mlhmShaE8fSgs4irAOx"
+    "L0tci1vzpOvVLWdbYP0ad62XOtsmOwS1/6uZlNAteqJGu85lNM0u2tFOvNTpdpKBx2mtn8pco+jv"
+    "wsWzbu7Ky1xtKG7ly/RdeSSm1Y2Lw7dHLQm7Or/aub26d8/4WF2f56Pb3XAnutN15earM0N06uCr"
+    "F49iNWKqBBWbTnShJpuos+t7xwojqA8jlPKMvGKvzpGeCxcSOwePRgKAHoKDCmOngPGMjyXS5B1e"
+    "ODwfGxTlL08J+suzBWuEOyufLdPcAJYmIhnqtyyiqNnDu/En13EXbb4IRs9d051Vb8wZFWXISwPl"
+    "zo8KOgFMoWi6keu7xtUrIhl48MUThmTr1zgkiHBm5fOQFKPuIEsK/qpAALaZd5E4XCqKUgJ2LqhR"
+    "86mG5f4Rvd2ZNv/GPrshEdzCD2pTCxhXbH/2hLNTV9+y4mzi4bSh98e9qJwQc2dejvO+opX64xqm"
+    "2pl3gwV98j+O3ry+mzV+fTnz04mA7V/3j9/SU/YSAG/XDtdCgh6u35UTS/dMfVKT8OI+Lw6Ja4eX"
+    "RQInVuD7gqmgaz2R5U8SGSu7pJG1HE7AXnelnGilRPFTrJgGy/opI0OcqQU56OUj4sNtsF5+DBAt"
+    "V12BsY16GTo4x+UETsJNhqQ8RPS4bUJZyNsTwnSzpA3cfE7r5ALN9HTlrI65P+aMVV192vTx+e8v"
+    "259wHaHrce2Hrgh+iB9f7J69XBs3+4vTh6cXu7OvaQobHHY4Mq7OGJ8Vo0XnblMZSBL6OUXdIyc8"
+    "ajjVjYyijAXoG8nifRMSnIGY9qMILAWGs6aS6IQoSsOcCp4Hs8Vp7yvtsBA7bKWEoo0DH2Ox+LKF"
+    "GYeTxnMvGzmeOlJcwDzKMe7xnz2YCJvuYi9MV0evOH6c90h+79d4+0Xngwvdr9aHp79VRfg9GPjp"
+    "f9fEUCPZmjlBaen1LRS1es2RVjPM5dFzh9kV2ltgdpGBV6zdB1hgZ2e4Q8FceXFqm0yTr0XEGesM"
+    "QJRccAVlYo5AnCHEU413aLTvpfCy2g2NKK3X7IWq7aBfn/F7yuz31V0Mcdo6WN6I5Wi4y6Fg9lyF"
+    "p+EYfZRx0Aaa4ljXT658wDxUpFIm5Z0WkHRKw7PC0N2WHp02EVIs0vLplClg/dsutkHuil33XyGk"
+    "Yy1kmktXu1lRFzEg/VFLE0bH0U0N/I29aShW55EinBkDJIAEqH9fbk3fvz42k6NecmHuTCzQsvXr"
+    "07vL69PdVTb25gFvR08CvdpesXZTAw0/juAGo1NmBuKDyv//lOjLPiyyOByakB1fh9QiLHnUAB1E"
+    "YwGwU8IygHY2swZTNF2nch4NegxQbPG0rlieFxwBaFYVeI8xE7tSlwPaSJTtUdiztKJe66eOBTOT"
+    "Tq1mUGM10Fo6ywdALYP6KDjJ34zcE0sMTrRX/kbSu2qF58mjn6IsSgTBn15NODdLeHtBgXWdtaKN"
+    "ajMn+/TVDoInTd8CUaINM2yOIHP/Zpm3Qi4mvR+u6bF/3KW4L2qJerYO9ad0kb034obEVlX9rROv"
+    "G86+ufUfWX5LHvjfT+ty+/nV7rzV+7urBweXOp6e9GL7481/x4zTcT/IPk9o8HHGof/6MHu2REUs"
+    "Kjbh1sk/Lo72OXQWx/QmtfoYcPMI4FaN13eIpBXPnDnugmtr/BGX9oSEBPsMWgEHtjdEqWdkWPZa"
+    "pibbPrJsPmP2zWX/E1FvXsMMqjzvWnzFhYBS+RKyxk+rNI7tdK0b/KM+Ztv0DT+PB2d2/19eOTY7"
+    "4/1x1byW3YemDrgR+aB/bW0/nJ6dNfTXvHX2l2Z9Dw0OCLfxomNHQoMB7pUUxfzNQFPY3fDAzMGR"
+    "5JEFGCMSsLwcjMx07BrVC8JdTCKXB5xj+PS3yvzY+whUZxBjgMU5khlTafC7FWCR1lZMbw8DEeZg"
+    "wOn/E5mI4Eaxs2dGzk+EkC5fluHW+f03xmQO6saUN2uP9ueqjv0v3ko99Of33yh+nZ7qtpdfFK3x"
+    "0/y35QtuEnrnd7uOXCrjZsWgXJBuZh1j7E6BKt0mNolnxG7cTzfCARBep4nwY9MiqXY+KhpF2meu"
+    "IDzwtusHhSUAkIOBjdOpriInxVIXNL5xbxzIKRCcQLepIpbBb3uwUMSfOhk4/tFXfHKu/6N1/iAr"
+    "GYDyEgtwjk0lepawUSI9Oe7EJiayhCM7ZQ6RosKbfaYgUxxfFvI1MP/lzm+nVJ4iXJ7oBzod5trY"
+    "L07+iIHviCa3YdoLvGEOoTP5pjlMEHknnNaKg6pCzWBc92sc7QR2vLB2/evj8p1c22UTFn3saFs4"
+    "srvSv+9ni9zp0yHnHzRgpL5U0/4lhWZ3OTDUQaXg3Iv/j0j0A4GaRpCbWQF4AZ0b05AINBfA7Swd"
+    "sT2bDUGxTdYQLoTR8yDtal8bHucIHvSYMuI/7Yp47ijqlhruS8kSqdYBPgyUaO59j5np6ufGnDR0"
+    "XyyGA6N5sW3y20DJKpo69WAKa6ZaMIA8Wyg3pzCcTOgVQnmigdYM1po4QG7dytwmehUw5WNnpMIv"
+    "FZ6hIb2ORwsrjeQms7ydOG2OVNFvZwolSd275s2CjTplUf7HRw+2UTiT2uHwXK+IUu0GjTysODHn"
+    "Aagw0e34PrTTe68YcvDmgewm4GQ/RSwlx0rk3cP7+9nn6l36U796uc9ZilcFYrPYIp/LUw1rrywG"
+    "Ov3V7e4IJjEJnkelIfEYpGrcSBFoXQu6qhURXRIbYLjNkyRTRG5FMfyuNXKQwGmsDiX7Htkjj2sA"
+    "d1XyDRihwXhtLtvyIv8ngs2LPutj6xZYFGbxWFF22pg2MXzjyw2o8kYOuPjadQ7VtXihsbCF+oUb"
+    "sYrlYR2ehNVwer/S+ePlhvvz8nP23D1gM/bA/svN09evi7q9vDX97c7On6sDYePfZ1xT22avzSeO"
+    "8Bpq52Mu9lvNHc4hKNJmx42Kxok7JTH9LeHLFx8UBKHix4iflI1rTQNcNrjGJsZWxW8SiDT3nx35"
+    "kHUA2jecVCobPiy45KWQr5EHpUVUr1ybApXqewCz7FuweK9MFGjZcuFn1HT7CwqTt98Ifpp8e/mT"
+    "45+HJ6fPhmOtHdO2sQIHc0/ef1RPDYuHE35IYNqP2htOcX+ZA52Gn8VKqEhm2pW2rgvOijPvAylk"
+    "sow/5cR1KeTpW46y+kxa9yHwAdYSCnuk1vACkx+x2ZYlrS2gzF0SaeosFG0lnhFblAEkVHAbptxZ"
+    "UKhqHSbmvZFs7mKRsH4qyBVD6lF0E+M4sJQexCkUaIpkYJWTT8X8jQ3PbY5Q/Fs1z4zGFO9HuDmR"
+    "ziDjGpsMsHwWma2GAq3SR7owqdfsOHtZy1k2bd5k4RG6vA60L4Rij5pWO6DjUEoNj1Yu8BDjq0zj"
+    "w6P784VT/nZN7IsJGGvTu7PNEV9UNeFc8o4eGRxlJDXHnDIHo1HM1JQ/adu7ieBsffDARpeHJ0jq"
+    "blzhJlkKErKNMbAEgebESmtPl9R6j4kPX3dkjAReejjE0Yp4DS3uAYXnZqQ2M+24auumsoPkMIw3"
+    "8MYuYRuwft2MIkEFuptfDMFD3N3hMFZXROfnpGqVroyr7q9NlkhI5sNlfxsTdeZYA3SeBIDt3UKT"
+    "a4UpYj32+VZCPMJs68aiNvquouJH6JbOpTC21j2tcYgr3SYb3OugKug7LDx7QPzDxeiW5shkRdh4"
+    "0i4Af6Bny9AaVqrrMO+d6ffIkabcy6buCpwaYrTdRn64fTf/3q7fT8he4QH+pagzSBBfaenMz36N"
+    "j8r+QjWhh89wCXa1OuGH19tOnK2Z4UqDRyTtQhPhSSeVwzyZgTbqftN+dSb3TPgfaGPlPgt0zTAj"
+    "gzVKo3x11AX6LP2ck2SCXCoK2NqcxSj+XAxl4+hNatZPcD032QPHGDIFrygcDn3IHlwoz4dHBxxT"
+    "ZGCPZZ4bS8J4Kb6fz05OHnxw/2zijehq0Hth74IXtA4+766OXe6skvrm723rKO0GCoCjPKZPzOgA"
+    "NF4yQf5l3GF130yzCkeaHLuAelQRC6uT0IGUkHiPrwr49Dx9BV4O+xKeUxSSSNZOFDyHSOLiCxCI"
+    "tyksuxFFxIbYt0saECOTa29R65Syc65AcuQJdc7EdIdM0Xu6vL6eTg5fT08RfTn+mnDJ5Ov59ODt"
+    "/qPp/u5t1wWw9L2ZjyO67o4DkV/fSQ9PMj5Dds6JgJuSvITxyAa09GMrYlTQ34y5AeOynBkd0G8R"
+    "W1yuauilVO7ZsPagXR200qHgF2ukDPgZkHIWIBSPnIYP0HYcahtBiaCFuRXHYnjV2NHXx4oiP0lp"
+    "mNHZTwIf/BgOL6tHDZAnu8iA5l+CyMxJK71kSCY9c+aYQiGlWghmZYDg7FpygczVXF4hv+LhIRUv"
+    "YPaStoKnHaLyqU1nlJYB1FmY+0WfknfLEDvrl+0cGa2Ju9pYzTYpZulyE4Q5Dz2sY6S06W7J+dnz"
+    "86v9L3czY0cCZuXHj97v2xHrNcH2hHlwGQmDFIh3KlF6o8El6NkLtiaQR3LBXQ4MjzoZG9oajamt"
+    "YNBR8DucrcWXTkro87InIqJ3AEm7tl5m26cVgSHC9TAAAgAElEQVTKa8gRDnLdEcq8lGkQRSR40Q"
+    "Ymj5SazpVB4+sLx+7EslsDbNehe1w2OxqZXDdhSq43B8Tu0AIGO3VgKGQDiN3xS28UYQJ/bMI86U"
+    "lOm6+9Mp4BdWzMhJnNm+TUHnywkdC6qIs3n91eheM6VVvIDNeZIt4C6k0kfkVGwbgC8h0zjGROkG"
+    "z8Uv5VvW+4k1kbxdSbExR/wN5tyu+RMRFJrvyZtDZiNp1HRqITVfweHVZQBzz3Vt+d+5e376d/eP"
+    "FuevrwZDrQXbuba715VW9Pu5Ii3nmkh4L1KKbsE1C5w7Z7KBJYVQv4VJyYnBUpiV34UklsJ0Ha35"
+    "lTme1eTsIWTB3hpF39ryg/xYCw7AFHfmRDhn/sX9Fo8zsBZQvS/XL3aVgkN1iV7u9VzPqrfxkc5V"
+    "ZscFQOWWxpG+gwrkHsNJPlIxCdYMkP0BUj6i6BZJ1z7XgV5TGq4oNZ38l9//D45A/6gVCtSrZh64"
+    "GtB37oHrjdXb+/3Xv0z5cXu2e7B3sPGWUYZzwO9mApCnnoDpX0mMOQ4zKKKQ9PxteghVSy4vF33h"
+    "ZwQ3yJfyedxWoNgSi0TquLRWVWQL0eYFAHg/FN8xO5YZsGRcuCA6jYbJ0V6OKbeaXTj17yuCVrDv"
+    "IwMjSKY8Ua53J6sHc5fXR5O73Xa2Uuzp9O79fH09XOsZ5G0tZOmzfvVfX9POZAfpvV36vHEumyaj"
+    "bAnoOxgIvXimQNVkenop4sRXI5RfCVA7zOYzMouueYLp5ZlKoweARgjKJbL/KQo50Sq1iUQaNtIx"
+    "yGFOtY9hgERgX7N0lyI5WErKVpIQsyvGB3qILK9lzo6RJ10NGJL4fupXwJ2tHwVb6ino9d7LLoax"
+    "8OwyxYZdZHyULPSI7EUOT2uq9Ypfc5jd51obzq03Ek4OJT5Uk6b4skg77oLHJF1tcLLOShi9/noj"
+    "upTgrLBpSzoP0DYO8dcs7TQ/THekx/rDhMB3Xndv/yWu/20ENepXrjoo00TBu6E50AaxZqvgOAc9"
+    "VA3GkhTwPkufdu5DSUG7sajl03TctCmE8W59XYbm9k2TBo0U/ji+a7beJNQCZplyrJHTYam4CMhZ"
+    "Q2n8nCtC54892v6I5MwVkeHC/SBUK92NBQHrsLs7ChDXrpX24KexMHJpsROiwDAzJ9m7o3bO68lH"
+    "mzIj2FDb03UVjr+inRG1u3gwzET/YXJ5DKqS/BGwXFuQOYjZlPCMlQL+PBh9+cL78rj/98p8zp2I"
+    "3tLW8fIgQ+YCpJuzEtiAs5/bU/oytt4U1dVNoO5AMR/cHiykAmRqrjK7XCpc748uzqfHq7czT93d"
+    "ffTt94DuwrPrJVFuh9Lb5Tx8CbraFMxH7JM6j0gBHdqQd1cXAWm/LBOaT7IoJ5hCtz+HdZBGnDWY"
+    "40PkOW+tMe8C+DddA/Swdl5gHbicITjssGQOjFpDqVnHBIWR8pgbR+A6hM5ji4CtgFpnEH+CinsK"
+    "02H/hiM0YBWVyF6KHAcVSIG2bsiC3Ykzvkxn317MnD57oY8abYt9HWA1sP/IA9sLO7fzmtTj+/mQ"
+    "7e6HadxoaavxmTmPcZIz2g4ARW3yPjcYQsY0iYKKW8Ai810SW8bABKDlw+8HljUPSWG1kGqbDNiS"
+    "Zgk9JkHZQoXJNtZhXa+BrvIRUsQyPzvud+2eE5mrlIAzd3z/xD49xB82/UkUdAMWXsQoyluUxPpz"
+    "89+Xr6ySdfTZ+e/GZ6ePPVdLTzVlXT5Uvx8PE8pQQ/dyBNokUPM2G+/wc2Mw508MOXmVNFtRDPOC"
+    "5e/aM+6xYlCg8263QZ5UooQFsGNHXwlDFnQ27+jpu54jw6e6+wMQwY+5qDtnJ7SR5a6CUw5AIe20"
+    "LsolJrq03TAQzSPbcZd1HR6GjJ8JK7jwlh5s2c2ZhdYj0FRfWW/nNOxKq2RWa81thaZ6TGcCwBZI"
+    "beRT1Gm5f+YROLMOT84awD4cOhz89uh7RFhCMPjvq0z/W5rUADNetD6NgYHfGDC0WvtYayunmwfv"
+    "Pu/cfvL29y9ybsG3XcyDt0t7t7x7rLomf3eP3E3KDcGSO4eeVoYl4V78ZK87icjjIaQumVBjNvAr"
+    "mSz4K2ysPDkl2NCbYw/bhkjxbE4meTRGv7u1poEG3Xq9rY4A4jMni5OyQ5/2NhOrM3V2yaxCOKPo"
+    "m9AYKJAdA00gyN1bvE3zze5AiDQVFbWnPfWfhLknr6cUHZq3/bHZ3R6rqgAdzi8VsdVafwxWZw2T"
+    "SZB1uc1wTmNLjB8EYMRfr3plH6mXOQp6qmNY549Gyi6d0GDNy0K3HTxKW6SdjyCFm9B3948AOBuo"
+    "KfkAnM+iBIJ/XxJo8TugKmYlfqKl/pbp7bJur8JtB8C5CJR0TqIZm3x/vT797tTf/y3bvp4+PHei"
+    "xFkxp3VpEXg77uqauXkhAvrYMOB+qFvcLhj3oS7H/5HG7nK4VO+MyFDMWSYWNC3Ts4bfNEUwxs98"
+    "MlH/U3mBcYke5y21CypmG/WNiYxsxuE04xlVQdslgRbmHGlwhCU/voE3ajuT5Lu8eFA/jvB0QqgJ"
+    "v2w54UYCfp/uA+fo8RW6DZx7rjSzCv4uJ9+eTh8QuylG3D1gNbD/zAPbCzfr179Oz57e7Db2+mF3"
+    "+thwJ18mvMZtBQ8Bwuiv/Y1GgMcZnHZcaN2T/wtFyGkCrUxs7BkEVjEhD//zg0T8fiNsa/LoV+UD"
+    "1WY5z5OejTtpshPB4PaywGNXJgCIm3muiisyYnihRzKJsNmTlrfXg2Pbv9evrrSb9Jd7Wafn2mbe"
+    "zqU73p+UizXM/FrEk0R2gNk+lG8xxrJ/nB8490+C6TfOUlleRy9yQa5wue2FCBMZ75wfXB4kqSyr"
+    "8ZzSIe4sHUEBU7Mk4w3LCN/QEeg5kfUIXuCNikbM9BFPUc47QOnmvEZV9DHHpJJMBDKHRAkoM++M"
+    "3iw8BSzm06iiQ3sJQuQEeNs8Qs3ojDFTtyrJx4os9nRUEG2GZKpqAtP6eD2vnuq6YKM0/y0O4x03"
+    "5CFxoEDKotMk1Si25J/2hcCsRSLrO009ASsg6kX8feUHvd5ZxVWpuywhO+9wVV27RPrX/RpT/j39"
+    "4cXVxe/uj86uaJBN8GebOOG7mhu7i42teJT5N4IXmrBfEez//Jq7Qz19k8/pYvfQWKBsX5GlHokH"
+    "xY4LIQvvZ+OotDjTCmz+UajNS2vQmiMT0I8TA4OK1DKcvQGaDKEF6EQho6AYx0BmUgxWRgHOBrXt"
+    "sKm2jRKbwrKi3mEjCvzgDKe8PpMmyUd6iy5RXnDpn4wGvFMjILYhj4t4RtywZTnZ/O3J0/gK3CWK"
+    "5Hybne6NSHwJ67B2Nv7ESzncIEhLaKTnzDpi0nJif3HnaqHgIAygGb+uciIHiDQj3Fx6bP2BQgax"
+    "2ygbT+bJvrGPvYaPWjCtd6LAS/oo6q+LcG/XYuZ4Mh27w/ER/9S9+iZ09o3bv6bt2FNglnetzkv/"
+    "3+9fSTxyfTXzw80Pct1Leoghi5l8eP119pWnNXRZE9kPZ0Vak/ZAWZbeW2XWno6Hebw4B+56vMAq"
+    "SrrtUI9mHYDdhtCXvzogMsplxHJYvPmFiJzS+6fQBrOJ1aHsDiP3yRU04kI6OUSlge/1mn8tGRGO"
+    "Hijo3mhzcGxNZwkE6e8gQ24ficAJdtR9Y51UcdDxm/qAj5aedKvfH5o+PD18hsw9YDWw/88D2wo7"
+    "tyO6sHr69uD7670mZkT+N4xi3mbQ0MynjUYBBRYHQyoXKMXQlwMaZkriQdXg8uZDP0OFHjUK9cTf"
+    "vAodhSogwDltXo4LhllpkylCIm1x7vPH4yv2UsN9kwGic1QXk9A7fKLWYF1IAJDkZRa6z2YMrcqr"
+    "m9x/G96Tv9lvLB9H88O5ref6PXh14o1kx3eXssDOYWhBl0yfH7u2yc9f1zga5E29Nc6zlYd9uojV"
+    "Ydcj28ySkhGdKUiUpSB0fRYFo/ZWVfmTvyJWoKQsMPoYgkXTR8uw8B0s3bAMARzFf8lJlfecVeU9"
+    "jP4lM+umZo8xqkDo25oLmuhqeujbHQg2EfCqUX88xRB2zAAvdtbHROFOj6tw4SsBEGPG1AXgQS4J"
+    "N20IwJuWWG8EK8OIc8efH3msIZwwWzZ31baOxQKA1HjoZtxSINk5qr2YpHVjcAysUfo9u35PyYdN"
+    "dFcp00lPcEUFJ/LjpwQiCPh+jfbmflLy+vH59f3hzCsYlhIzd0Gk3WrOBv1DDsrFnAXV/p6QktmO"
+    "NkcbDQ54qPBh/8D92bl+FlGoLBLBsCr87pGR6UcxJRlhdhSIhGZmASzy0vx6jGZRBJY8ICVTF2+f"
+    "twdPo8fuefTTBMdQr1CnNLgPiG71Hq35s+ysi2bZLzFS2dQf0Igu9GYovtFYM1E5ec4rxkRSV198"
+    "Z+oNz1FB3fSA+i2ehqU+VNKML4UnY0g0+E2GhVqiv20aX5jhsn9/JEFII3QuB4UygGD7glR7l9JR"
+    "uwx2lo2IL/OGvsAx1M41XI+Z4bTKKWzZTHp/jEbcCEo0C/cNsAToC1yryhE4nfzKGdXayYvB/XlU"
+    "3Ee2u9+RIfS0ceyCldKlexTmvpdHvppzH8Xbrz6TcvL6aPHz7Q2y73tVXgzhkm6ncSsYe0DKGeGK"
+    "Ss+jBpm7c4pG2L4DrCph6lYwTABTzeU5qsEZN2UqyWg08f/IEL+lxwH4gxVmV55aMB+LZVmGCpDB"
+    "qfzltQmSFTisFq6NyVoz+Fq7md46A2N/8CZ/A2yNBA/ag89sTGShRNxPxTqDYCXhqpS3K2I49U6Z"
+    "r8xfX7/b39Lx+fHGzfcGkPbg9bD/zH8MDtzv77ndXJ81t+9JpH/hgjmOcVPMYxzvS8zwilAdzDlc"
+    "cSxhUYzV6yIqgMJsgpnjMZylTiQsa87wfL+KDS0m2BgIkGXXIWZkytpEmFOMrFCgN5HRBNvSKUMZ"
+    "oxPXR+cmDXRqpcj1lCt3D5hJzzO5qL2ejpKamdw+vpZOeb6XrncvoLvRzljM3xg59PLy4e6CV1ec"
+    "qFudK6yxTm3LwijJmABXHWAQKMva6crLMBGOEKiJq/zrc5NjQs5rTZJWOePogHhBGQ6axi+7Jw4D"
+    "Fv5+GzbyhZBAtFGHvxd89dcFkcWpxZggZbgFRyoWvUtVmHHnjFuMSjrEJ8Bgu+hS02Nf+C1XUPV0"
+    "sjRxp8/tPfkcWMOVDHpljLXLRIWbrxAhj8wl6wWq391rAuRA8JiNhUhWVPyrJWpYO1JcSsbVij1u"
+    "rObWIo25Faz/yqX0GP80X58McPWNEBvfFI7OsbLbpI/Oj84uqwcZt/U+L4YlOsKTt0V23FRs6Lb9"
+    "FoGvLe3PEkphqRRmEDwaIex9NYo3GUoZxFJp3dJ4B4iXtxz0Yscj2o0ZcEUo3ujRoDGiRtVtjUEJ"
+    "ChB7Z8bMtg5Y2CeLDT1sAnWQ9ushl87hqkq4lPHRI7e+EJbjZeqTOymEDFXF8lwfLdRPEi34/itZ"
+    "5sqiJv23PgmE/5AFlwqTKYqTt1gxafIcNg7OAi6qVy8ROwCQ748Af2QzEWtNqAQ/OGt/lRGnDEnS"
+    "YbuWAEh/bNhjm6wpO6po3hzsY/9XFdJOOTvephHQI0ctsgfdw19EYEX3jmFocmnhve5OW2oV210Z"
+    "Nxuu6o36C7mF6rnv/wh5fTyzP5jM2gymnR60s9yqM+4jdeimYP4ToqIlkif6Q/dU1d7Iocht8s4b"
+    "4nToRUbhgXkI9s+NyLYbkTur+4zlXWLMZqQMUtG1JzRU9AjeKktZWs77h6or6j2v2i2yvnCSYHF6"
+    "T0r+pziAoPfjcNnDKobeq+BMGY8PnPbkAwmzlgAjCfV/BqN62+d/ng4Oir4+P987uWbnNbD2w98E"
+    "P2wO764M1q/5TfojtjQ5dxiAGM+cIjd6UViczczZjD2MZFR8Z3/vyvPOPSPJYpA5QLxWU2E0KPmE"
+    "rn8bvHMKQim3GNi34evhAviB6JOzY9SjJos+BuOYl50Yl48xgq9YFmfGYrrSv0tRalsAsM5m7dkS"
+    "P2zEUMvQzhZp2+T3d68I0uZH45/Wz92XR8843uvr3T98d1N053AXf0yBSbOl5cx0aAjaNmWIxyPn"
+    "p0wbPwnfeYHt+42tSlbFbkcZz2SBm4pMOEaW0evMsAvwMJuygyRTVeqie6ymlT4oSRmIkwFGhF7i"
+    "Mt4dggRSnDlkiWN73qcEdYGTOXHtLW2doqD63pYCltsXbEgr3hIXV/hWb/WSgcFkG+MUwOEKosES"
+    "arjtTyCFP4oaKr5ZxPJhzSYW7F7qMwVOh8mwZOTAIbavpkl5vfYKnTbIFSCEIwQPvbhOgtm0p1bE"
+    "LA4Pe8VQpdL+Hpt7BP3r4/51XnGxk28g6d7jjpWQmPCPKx/mgAfa57kJUrr7To9gtANDjREGk7dR"
+    "jyHSRDjqZ0G3pwgR2ZCPmlH8r7u3PwMrIS6y9I8EUGHvcVHUo8WMpXVxU9m4neWLBxIk0HZMPHC1"
+    "BI+yNdvOY/q/8MYOj2hgl+yabuEGNvIjYg/pcsHV0mupLI6kQQrt2nycjyKuuJKvJsSBlIKQBHaf"
+    "GSdR2RB8d2BtNlVQ+Usankh97jS/Szea16epGvQV044Fk3elIF60arN0NspjSRdLMZB9tcofaJDB"
+    "M/gfqwKUYXxhPTL8Bm89Byxe6IyTk+hUfYRsqGjt/7Y4PIROP5UQcmJjZ45rOffdBLwK6ny4P19O"
+    "u359Mvv/jj9Ohv9Cj1jn6fR490HuiRlCvpOZBfmND0jJ82gPg/lruHKA2okYn1wR6Y3IrKw8KxtJ"
+    "sQmgtSKv7c4TSYfVLukiR4sAkBbGLaRr5xoJiKmickp1v3kt4Ciu018KxSB1HIun8p137vPHxOi6"
+    "kh4YFG3aA5bSjyoqs8OMEWy/dxzUcJIXxAdLAf0FF9xDqn3fNHD0+/OjzY3z5y2Y7axlsP/MA9wK"
+    "iyu7d/tbd/8u3V+7Vexsiow+Be400GIQ3CzEGMIrpYrLGDNYHnMuYYj1c4KqMWXLAyiu309+eUY7"
+    "6AJjByZmLj5DHKdGjwuZBDpRNFFvmkXB5mkSSUIpFJ1Mc6AVS+Sc4Ggym9x1vXo+Zla7QdEcMu1V"
+    "rVZ47QeoQg3oELea05f/dienr7XBPb8fT65cPp/eX+dH7wo+ndxd707lxvC5Odu/z+j4LvdNp3bO"
+    "IUNEeC6PmOuVb4zLsi6Pt8CKANHyqWQOYBZRRsqguSh5AsiARyfBJoF8+ogyR/4Az9c4GWQI2xlx"
+    "CKk4FxP4HKx5xuuhQWn+k9X800p1zv1gMFXbMem9BKY0IAlmmL3SWQ83wGvpzkp5GUhp76BKaPqY"
+    "b4LBiq52Tb0wa0ndVnxJvzhPUna7pZ2KdI+WRRm1anGCz4CYltp+jYZztIBcjczdftgmSK07akXa"
+    "Y46YoLnyY0faBRD/6WoW0CSyOABOwHMxVvC8AqplotFU4K+WkqFR6dX149aFuWWjYh3XZvgi3DBt"
+    "2Z21c/0ptw41gGB6e1KM1CvhqETlK9lYZyY3FnhU2CggcFMPRho0Vb9eMW9AIa1WUMKvrrNLKkAf"
+    "QJRHnzOIZDPBoAM2BGt++ciY4u7Ezf4CiaPqFhi54rp1xYvWlDX8vYDnSrHmwC830hTq40Vzow9g"
+    "mUjOuSLGnbbt50bvQYE0MUrEf4BNeLtGCKFDrg9GNF2Ot6Dl3xi+++UMaf4j75QQ5NEKpDTyzo5Q"
+    "ON08gytEvp8EaUCREfl05iG6Fj6o8caR9sIvdo+WHvGJxyZRxiFxtG8ct+quS7fsqjL3fp5FdPYN"
+    "GE18BCM3S8TnpHj1yyhT3fP53+7y9eT394oceA9w/9G3TUcQ/fi39f2Ps6+fmuHvObalxlSrsfzv"
+    "5Ck9XpKid9LVckTTUdP3aIL5KjOljFH83inI1M2vlKLn3ZeD43UFzwNaxFQuSUq1jl+NoYxWytoj"
+    "eWdcWg0qhIedtrn6duFPadYdLWUTjGND5ylJZ88bU9sKQ8tqODssbqdPpZLoro+5DvHj98+O3eSq"
+    "uSbdh6YOuB/yAe0BjOG6T3H7zVg4Ha0PVyh2GAeYkxXmsFYo85mpeUZuAlZh5wXiQkGcczZLK+gD"
+    "djmMcczSURrTKPS5STT5mOTtfKlkKKOoJLf+G3ORQSApw0A6CDypTMRgW+SLf9ro9ZU2YM25T5wp"
+    "CuISCtggRCqm2/9dKFsgkH6PL/Wj/p9/T0y+mnJ7+fPl19Nh1c6z1Tegu0/SVxTW8ZoJXQbKj5rP"
+    "D4PTp/b110mDSnUI4AF1v9ZNHwGTbfD8IBSoEFfj7JuwJVieXGAAGQ7HcSBREY2jeBuNOmKDMskK"
+    "OWacrxLR/TlfA8N2KwQiNeIpteZRRZzhzhB/tDARRC62ONMIxwSXPANKz1pjo6otk60W8ZDnMqtd"
+    "TR4oldxwVeLECm+QaQE4j6XFAiMXxkLOHYGstXbnPXCskE889mxc9z8bAP7vaf8aXHOlOwqFlwfZ"
+    "ReoAZ8J6ioS2KnPWSa8r4oT/9kDa115LR7oJsAx77ov4DelCSn36aFlR55O9i5vn2wx4JbLcAyjD"
+    "dVcneLsYBTsRszi02IYrLT1TjdUKKZT3RvElhge6OTKqfTIQqfxiXe/ETaABrq1WpAIQOOuowbmN"
+    "hKiGyNo7Hz39N77Cny4pUiYfZVAe5qoQOaOwi26cPjpaaLv+3vDWPXFRmAh03wLoLLqUhhuq6Sgb"
+    "8xiJ0vmhe+mnRcJ+DlcxiAIZi/8Jyuxb0nKvNlI0c7gMJ05LthVlIgRhJuB8BblxLdJiFnUiUdet"
+    "oG3dnYshnmpRjgqcxtlLaBh+AYfOouGpu5ocMc+D9XCCkznyrt79Gprdd6lJKXttCKIPuhXmHt7n"
+    "FD+1aPXd5Ov7+4mX7x5Qt9SfZGk5x+VFzla01a/OQBG7mVPKFfq5OsMGQLloksO2hv8lD4VICo0H"
+    "VwmUhuU7jV8avKRROzCPg8co50CL7lVZSNfLBpY7dzyUSy5RJbf5vVDIpJYovlyy7noNmw2D7bD7"
+    "3sLxy3RZ9LJUd/449gFxjbyorWxrhmQ1fXz3L4sfCGfoFhF3dgxfv28aOTl6AadHvYeuBPxAN02G"
+    "2n/f/QWPr1o9vdg7fXN3saCDSP+495Acwau3qIKVoNxSoN9+AzRWIM6B0kAz/jjuOma2RmRtz1Xb"
+    "ykPdIhupS3DuxiDcMHI/i0DtIJGWeLbhalnVWG/zLc4ymD7wgpvw+ZnxjILIdvvImzHbo4alsEwH"
+    "rgWnff+MqJ7N5ZX+si5qvp6ZOvp589+2J6uPeFLmC+mfbXmZdzh4+NXESxgg3cjn6zlQ0d5VyEZ1"
+    "ZlQ5cPc7sZqw6US95EJRaBavnDQlDyqTNpZHAKbdZ1WgiOJDyFIaDk5mNSoIjHfNVH7uRjX/OqyF"
+    "qJE2aZphC7/et4P99z6JKfNLXBjg7N13HTO17yuhJV4D6hdNsQcrjvdBUX0Je7dh0XUFnj4uIJL5"
+    "aGF9v857jlFA/M9q3OiyVN5ty1BTx9yoTonPFGXc0Gn3wFQOmPluIvGPSxlmpbKTX8wg5LDFuiJb"
+    "Bem+5fXV4ff6BrlqL/vRFnwkYFuW9fBvE7lXY0L0LJ8+xZ6JvqttOhGs+dQg3SC/duLJqCTRWL9+"
+    "5k3sCou9F+3ZmUlA5ObhqbXMrR7Y2Ay0QmqNgvNjGmti/mRyZJNjOYZb2idQcD12n4xNMbEmz0VQ"
+    "DFYPltkGxSlAYV/cSxzQkdoGNrBrSxWcEWlGM/E4qy4MwbS3BCcyFAYkdi0CEJAxg2lLnDBCMBv5"
+    "QOxfgbWtdLKnO3SnSKsBHb+mNZYETnhE+Ifb1ZW2nTxEY3Ifr4KQjwlu2oFtWUID5MUGibZx0iqq"
+    "yKYYArtgif2+eRgRZ72R5ZD3cV4Q2EaLIj4r4wcKEfYL06Op3+/tvvps/f602XEuINan5pj/qFvg"
+    "CqzZyqCYZtSD38CKTsoC1bN/YuPxLDTJc7XRXou5ZzhShIITZ3X2g/WFZAVBt9BQpwYJEhZV0kyJ"
+    "lCRqlmgCVtDHbbTjH0YAMbXPNUnQxutBzg71STY3vrDZpzFBAk0m3a+qKKnP6U8afYjYdxCvhMff"
+    "9SuZdPT4+3j1vaK9vDpnuAs6Q/bWvn78ddvo3ve4DRgXGAO3RH73VZWDfqM69kaFGpxuqMh4whvb"
+    "4oHMY60fo3SRsdVP573EM+Yx9xtZsbyYeImY41+sikjE6Uwx++xFAaWVze3EEjRH7wWRykoHm24W"
+    "oqMmyY/EFx4TsODlj5Iy9ezYf5YGFv5hTzIjeLy29MZOjSxc5drdAOV99OPzr9bPr08KvpwfW30+"
+    "7VG2EIVXMfbmX/h1+4Q8e16hteS+4ZlfWRPeHYv1WnfOoROuO91z1aO9g+He1j15mM+FlR6x9c+9"
+    "12os9kMS0CZahQIOmMG6KIg97lZrKI5+Zkk3caJQMpLlKevyDShjN2iSeK2FAUznv8xROMxow4qP"
+    "2ZcSOQftgMkm5dJklqkY/sh2xsJuIPlS+0Nyuc8me71G3nfGoQXTraRyOHkNt1tJ9xuhy86G8Uu9"
+    "w6yy4TysplmooP25oX9UUsUvOYygG6dQ7h2CA6FNbRN9dX67Pz81P69yYGbjlsVOA6kM7/XS/w1T"
+    "Astm/YVTAIsDnTGcvdkx1tNkjjasduJPJK6L9/O86VU0OmQRhQWWRLXoMFcrRf0rqbokU+4VbPew"
+    "NidI1O/p0rUdhoZOOhUqXpuHQSn8gCYlLQ0h4IP9ZnrQIBB528zBcMTO2XfWSzBYeCsHphjl3pf6"
+    "qvNjnw0cGJwYocduSkME0CxIVmntzN4gvekQffm0kxYQNXwbBHQBhgvGyooEsPaAaUHdpYUadsft"
+    "XBtfFk00fAD2DbaAwXHn/2jZFTRHvynTd8By7lIPjR2TECWaGhYi8zlSDBE0/Bh1Y41tc6YYAfX1"
+    "SatnF9FRtJZfiKNHWE179pKGO4G3x5hb9cbHtlsDLUSz5TS/5xXz9l8GY1/fL5q+nT04+nQ10A5s"
+    "Uou3605HY6AEN1fSd1qzhYmuQzfUiMqlXBz3MAACAASURBVIKKjWUnxa6LaahLH/NMhZy3ibQNbP"
+    "SDFu06G8GmmsJhKEOKfCKO7Z+m2Ixhy8zolPThk2hK7Pa1o2asxux4tIME4ScYx8lZh/mVNb94nL"
+    "dMmYyQPkh4UcBIoUzWaelrdpsO+JkX8ehu/9V6dfLi6bMH2zdcyifbsPkecP/efDM33sKMFBo/p/"
+    "X5zS0buowfs+E1lmgOZChibcCY47mJsQa68j18Oo0wDeRGklSNRyGL33TISkhW/wo+WIji5JPqXF"
+    "hKGCLyDsgGB0oshjTPrbCxlvHcj72SjdrmkaQJkh64s67mBSeSKmMAZW7f0e6N9ZCZwjHt7+qq+7"
+    "vpse7O/fT0wfTqrd4RcfVg+uZKbyPfPfQcyFrHj1Yq5sfM7VvZmHrVnIa/pbHXG+T4x7fUM2uZzH"
+    "WeC2Q75scH8cnCMMsNAHw/V9HtMLIkCKgzEaXWbvUUmQVlbsASGHkY5Cl8XbyRLr83CrAEMRVCEu"
+    "jVX75nCMYoHfyub8mGqOPAE7/tAi5tPBc2XzOHJ5249XQZcXwaHUs6FFkpEtWGLzoi0/kyI/UxD7"
+    "yNQ7pD9CxLGjH44rN/i1+F8Sn5zPM2w/0e7WXYEG45C8Y8k6Ix7xyIt0ahAeGHJ3X1mtAioTUEav"
+    "jdSi3H9s4vLk6u9AShcDZuTcEqdcOCluw3t3ucaLt6xPJGi2L/eDMbOP25DbBY/maNzQDFlXgahU"
+    "YzTzdyNRRCDMq5y4GwFsLajMybMzpbBpkMeGgBCXzRtWomDT8nGp++q2NDzEdnYYFdi0xJWFZlzc"
+    "OGyB2m7AtOmqBP4KaBY/MxXgF9LpM9s42UoKcHEmzE0jm0zUxS484iA6tDsJH3JGZd4AlVLPal5N"
+    "hUMOjGI/gkfslmDmY8in3MAsiKc95pDDnKqRdbWvOrxO0CoAI0/i0Pjn1gQ+y3PIIqW8TEht3tiV"
+    "TbL732P1ic+NRT/zYYYAX7QfVBR0LxwKh/XztwWfzAFQ+xY4w/2MSJfXF5MV3uPZj+8Yu30+9enE"
+    "9X+s0j+PD3tTaD2k3oEeHd6UC7OW43KymbYwqWYLv7UIywmcMkaHHy7FNxxC/YmXS8DW8+3S/sRz"
+    "AowHb7Fz8VrMtyQHQZnBejtIwADWzDqMD4IvbFCRjbdvOVrxsAu2NbKEmnT0my2aihcXj8eLSPDW"
+    "oexQOradhGJRPcT6sIPVfa0R0e7n/38OSYwXcWaoFtvPXABnrA55zscvcv+5bpNnnbodsT/1q8ox"
+    "c6HlxM08Hlte44+UIQg5XGaS7lsVhk3IlvaxPh8h7zZq8z7olDsvNcR6nHMyXcFh6fYktwu4XmMS"
+    "rKMtZZqFmCUEcwQKjCgR8qx1gGTuYq89bYzVjt8RoU6kNsDKVZJzE3MqeHaB7uppmVH1d1opUq9h"
+    "22ojNp71/rzueb6cnRZ9PP17+dHu1/qXuhevRy5z3wEudisTzMZk7rHinTZVBNi1XGxLTDmzV9AR"
+    "zfcKGUeQedscMmiJ+Aj0d98IroqSN0yVgufHYZJGRdxCFpsxamy4oe8LQwR/KWagEUtlJklI5eMl"
+    "FlfclKVn/WHRNiytIOdPC/oHVaGMFuQwsUBYBiCjzw69/zsOjEHegL+YO3BLrwezFofO4GU9o8qy"
+    "LDJ7xdjlsI8zw/ahX2FLrcjJUnSrsWJjgkCfZ3kiHSN/THC298IXcohTn8gx3f18eAAfX6FLE2WE"
+    "mXuKFamPL+KCEGFyvJek0+XmkNyA8wbtzNMGow9wByGxD4vpIesdO/3gYpB/q7ZbKLhbI3JPa2CH"
+    "Jwd6B0bOSySKSR3CbVcD2gsRGATiMVgO4waVDx4FY0isGpzZdlq3OAT0fpTQNYLCabDhadLiejdL"
+    "H4Vx2Sx15NIJLvjYo3bcUfvtjQOqGR5tOYM16uJELPJ3fcvGEERqH1ksZGKt+8+ECi/gze7ujiax"
+    "z7UnZ3neElYIcMU0q2YWfVw2UC9t3Osh0aoW1NTnJKIAe26wqPPvYnTMqAnTun6GBTpHbW5t5tLg"
+    "Ly/sMWytx22rzq7aHdL4yptunf7Wu/0B62CVzaVn/2Pe0kPPxjPMpLN9+X41FPvrvHY5Zf6svjv/"
+    "z27XSu2Uov3RBC6qBOpe/UaRmh/K7qxwtTCNSCj088k+IHl4m/bcOWpEEETSYpiQhQjtVvsdEc0K"
+    "xD3lDsch3vpiMH3ggCsA8AIjQeaYFANVYpxa4C92YcA1rvsFksWSZFHgxC180AthFk5RZpyu7Y03"
+    "IGwXMWUEwKIh+lycpB3JXrvs5vJOmC0OUjvRBlvdrjO3TbsPXAn4QH3M9l6bKX/0kYvkFGxoean1"
+    "cHF7urw0s2Lx6/sFFjfMatHkVUwljmsSSSeZKFkZeQUYwFZULypGeZknOrUZIt4zzC3+NlY2SLhA"
+    "Vcf5SkpO1LgQgOKoma6EV0nkyaSTFWhdFDe6nwWIsezatc1K7noZzPBWgu3Joh6yLPVJr9GP/ZjT"
+    "ETXWt/rNeD6Y0o09Hxq+nx499PP11/Pf25HsN8sDrXHK2nVeDUd+ZuZJwfu1Q+m2nh22CtlYi14W"
+    "M2vOXRSewtn6TOGE27ZN1lGibwwUQCaQXqyFrhTuisbCfpuhd/80Hvz8AsObN+gN8SKMQnChxLZN"
+    "BCSJ+ilL9uj7bZwpYXgv+D13RXamSUcEMSk4xG6sTamOD+ch+CPl80JCLWspbi4FDVUTrlsboK70"
+    "RdDqf+5Hf/Cdw2FK/n8cKCFJtpC1tSXPLKrDjOtC9IdlnpE74x0CMMqjWqm4oZs5Pgdrlt6X5UDL"
+    "EnZrDmvxukAX5sRZ8iryum22O9a+NEa/j7AnfF/zflNm6XSdNpga93odB4yqizMrDSODi470CxqK"
+    "cf3GiQgY8FeTevG8edPB0MGDceApX25gtcbybAig53LguIUexsbLpTsAFg47GrL/iaz2hYCq+4xO"
+    "tHHD1Qiqp/+HqBmS/58uifBjrpNYb1GkgnBgMb2vJ4Y290KPWjkYVHnvo0zZshepzkcrJEL3yEbK"
+    "6UsEnwxbdzHQqLExNnElyd5LEJf/k375Y8xgkPcuAh3RsnVVzzRQYbys0DMFXsAF1/nHqpRwrwGW"
+    "xljbC5fqc/6UcPgxh4tE/8Sj9QeX1si3g72Jcqg85jm3xXEXQuGIgsjDxWoi5m+7CFTQlHTxRUQz"
+    "qheFMpxosrPWK5tz/90/PX088fHkw//0Q/NK5HL3kRx/WFyvQ2H32DQ1ctb6dzyfnuH4hlx5i82J"
+    "i1ofYN/kjfg4zNBCHooDQ2OlBn/KQ/b+6oX0oGHv4wScdBJCnGtiMidQxfswLn9J0EJsRGbOtzxL"
+    "51/5WM4RvljoKyUQz8S74tDFfasOsc7cUDnGR0181tiFwukmBkUKg/p4IiiGqf1dmzx4++0TmgFc"
+    "g2bKIH0lZp6U2zr23Drg/35n8fi6ur//uA/0dD3V1daJzWF5+7BXt0YORkXtEYqgGLtQCtnHlK+x"
+    "bmPVPgb5kafKtjMNYw1vW4WwjiFpEysM2rDAmYGy3J8JKuMgs2oOjeRJoXQI96llFOkBT0GAoloc"
+    "XBMg84+sMmIo+7SlN/QlAr1pwiNQqqK/DmKUF8xLxqBs2Fq+vp9Km+djB9Nr2/eTBdnh9Nby6OPc"
+    "ep1PMsc/Wt1r+7qh8o/cEfHqsdo4u5jDmWdOxCv30sKY/1mKNgnydpG2NvEVBAwPahjKQy4BV5yU"
+    "Iae1yvjqEhApn0MhTOTKLfhNc0hEofefseUqVtywK1isLwP3HELmRzx1UJEVgj3/FH4cWGuzUpKy"
+    "0Ymbak6xMNrk7hRKNUWSB4YKf+jc/6IO3d1QyyyptFeAOXhVerRk8ZlnMRHOzhXFIB9SsW0imdxY"
+    "2ZA0iGMhxCMtKyLk9+NgJuhThCcvmD31s7rRnxrdaSBxobuMa/cUFe3LigRy5v9B26tCibAxpSq2"
+    "ov4vu2shfuMh2Xj1ANweKdcjYF3RFSRNMksHkyBvHgc1OLQajV4PAQyENqencsGt9l5qI8GwCLid"
+    "+2qwyc3GkKo3VbtvOqH2/ZVKAMTDYVrZ90lxFTjg7qR31F0WfmYZFNrn1AeUpF/F5AFrx0h0iGKZ"
+    "sl7Ihd6HJ90Y99oCKugK3e+GEP5UWj3l2n5gXQ/I7FaIzoaUBvFEzHNtozfkGXN8klZjtUToDPNs"
+    "oG+wD8ptun8TN1QM/wk/iy8WUzzV1XHpPUOSth/0yRHp280izidgETW/S51ub++e16+u+fv5re3+"
+    "r7BqKxCdzX3To1qN6AuTMdCcd39oTlzaB9k8UCHhec7baPZFPsZZOJr22CN4PQTXCspAipB/6gFD"
+    "8FzwlRePS01wmWR1Z8rr19QG4Oxiv6zC8cnyPRhw5bhS6lbCM+SYEJpF0fCksBnmn6iEEAhGiJgQ"
+    "qHOhfhIRRPY6Ui5AjyqS/04FuWUgrXt+8/enT6Qvbn5IK2DRvlgW7ajTLqA8Ysz5MPFP+bk/DLn4"
+    "pv/s0r/28CmBbTyH6p1zNeZuxkPKo5rC7iWZXHvIyLXnuIh7mB8UaDX8amjCgZctwyGmE0vnrMrI"
+    "ZiJMqQp1jpur5lHsZr81shmSFkigd0aGVLiBzDW9wpFtW1Y3xvnMVYO8s2Y8FQfSfRA1diktjrj+"
+    "pMzAYLZU7zhkp8QSV6uUG55reD/fPp8ek3088efD49W387nRy+00vBdAlTsvlpCKFbjQ7y5e0t74"
+    "BmPUdaMTQYNE/e+k2YSivPesRrEonbVNOgg8MHuiRhJwOXH8kLzS8zK8m4lM271CBjicRKhitAwU"
+    "ahhchaQegwe0KdZSEVgniZecQvmfSmlPo4YCrRtin7Pd6FmJNxwKBGB/XVPGc/KVmlMVf6kSnspX"
+    "iXe761VEvCP6dbPvPyUD0S9Pt8svn2eeA6UZto9FEHY+XQrppxSFE2q/b6KnVkSZUCLriwcY3OZl"
+    "cZdgy0JMjH7rSHIWyHD5FB7p6szWAtJYHUx0BWRhm2aE28Znl5T+VGZDfSKC1kWffK6TkBWWCnEX"
+    "USyWIvXmlHfM0C2m1KLotgGtidQXk/nle8NEGfnLka53bSulutYxywgmf5kqNslAsZW3pzRgN702"
+    "ntOthwGh5l2KOvB4vfV6kU7+pRQHVLGEqX4kp74zPoqUvuwgnI0HPsR0Jrw5E6YRfI8QN2sAgneJ"
+    "OpfHdQ9IUuP3kwSB5/I+4JreuFXGGix98DlF77RyBUk3rGb8FJ+0hOWS+wPQOEB73w4v87Ml6I13"
+    "fsqFeFwWM7mipcb7oWj7uS18ax64gX+FjevPG3N7jCwlI2TIT2pchuZyRTEztDIGo3EeiUakL7wN"
+    "/h21urjrpTp+/S/fPr6+lXn7/WI34H09H+vr5Hru8Y0E/Y1Ele93Qlz08bSIfSu/SFsgNdPWhhD/"
+    "7mx9NTF/p8FhRWHgaOqaB4ocOrf8cUUZfUUkQUGFVp+AlhTrqOZqOo8o47Aw17DWxwM1ov2L1yMV"
+    "shSdb8yCpNve6EUd6a4YNxwQeP/uyLJjc7MR/zU3/Gi/zRv64uL7WIu/nu6Gj9R9mXxr5jwDazKR"
+    "7oJt0Ue7Cju9sm2fQhW/5U7PyQ7f+utHKMXmp2pSnoIkNAETVm0OdY7t34JWg1Vnn80XijMr+VWO"
+    "MdMSOLJb0ri9UZz0QVEGv8jHWgzr25U56HGtMbpYxp3x8TI58hEJ36+Ptr0Z85Af2tB5w5TcndYK"
+    "sXfbktEhdJKYKjv0tnoggMljfaHFFG3UzAbhZRMU4xeRXuXUwPDt9MTz/6Yvrx0RfT6ZV+ymDvje"
+    "Y/PaWCLEGxH6uUjP2qO3aum2zP45aa88d36qgr9bIYoneCfUm73CmgHkVQvZimUsHU1/lak6EfTj"
+    "8CSlycioZXk4gs9AIsDaVAOHB4xkGBlZgQUOTuhwWki5SnD2YtcL+wsNHCf+MPzPC71qW/b3jA3x"
+    "fzYyVC+Exe4lM1CdTstztkMvzX5w4vChyQJU3cNqZs1gu9y+AMb/Nn7VMyZgQRAUNaPwfscCgeaz"
+    "aPuKF1ebHFbvUklc2+K+2idXlblHMra3WtRId+cC1f9khQz1555VuaNifauEcu5Rq5Td8/YhDTaM"
+    "BCccWCtnxGh2WY0bsOsiCnwA0Wp/MoHQ1zrYU0HYU3VLKB8a3SWvAt3c+Gadzt6YaDAVwGG2EJxX"
+    "m+MwUOv43H5NByyhhy7jQpJz9OsMAZDzk2epTPm1V0Sim9rGI2GtmkxZzGJ/adM/HaPvjlk3ESiI"
+    "6O/j4Rg7NlG1vs3vxgt2hs6hrHz9WnB9sFbMjIIsrVuJ64yLstalNk/aOPY08CuLZMJLAxFX3Y53"
+    "oANOobO8CiPDbRG6K/N6IgU0agzq6+DuAPuonhi9/glIzk4lfF4gGzZYiBRTdBr0VTGp69SV/AsL"
+    "x+ac7fhuUHxjmn9Rrb6a2+MfBifTT93Vcvp59/dDgdH+hnEbRIUOuqXC9HkQ/1jjU/KngtaLlRlj"
+    "BwSIlxsQx8fGorVae2BSouSt8T2/BXlYhgomXskaq7TRwLELjhI5TPkslRduifKrncmUoS4RsjwA"
+    "SfMrYZey1o1MhyXKpDXn9eGJRt39sAgiOHtIUSmQNYCi4rXSEIkzIO2KQ/nxcu5JGpm5vVevXm8G"
+    "D9SqV0o23YUA/QttXMG2HhB/vhRlj2YSPa3k3y4Yct/f+Dijfmj8Yn7Sx2L2vo0XAhL3nM0JjjpA"
+    "Y95T3GMQCSplwjxjy2KQ1vj3Wa/3kUkk1BaCp0D4YJOcPEDmXSPoxXFMQHPS8lV/QSpIwk9Sj2sC"
+    "lHvssMPBgkgAy2l5TtN0k0Y6vEbNhSOpRHxFOF5VlvyWYvHAqJzZuH0MJ2IU+xS0AT2t7+i+lw52"
+    "x69mB3+nO9/flyOp2+u3w8XWodt3vDRewEz3kc5Oe9uhtnlSpmyQd6vIUFysNqO0WV/VkJzj7BG/"
+    "EFfExeNJrmZYSNQKyUmMyLggrogbYgLSSaS7H9VlxWpnQL2dfFIp3GdNzyGBItXS+4Qis5VPCHjY"
+    "WHtO0lYX54AQ6Kj4EZ5eEvIqzY6HYCg6C28HqHVAXzVA5RhwYeXIPeJQKOPVgptu5LgSggxNUclL"
+    "FujuXkC25YkXqbgzoiht3gFg/kWa7lFZtYtoBrGcrpF93rQFFenQkc33AQh/1ZOpy2MPURUXx9Iw"
+    "RyB/i0rFhrrUJn27iwcUbhR90Fku/VyPrwe2FsTHL3Sot8PG1vx5csvr0AVyPgd+e1gHauGtubNp"
+    "3szXvnpFEHB8+DgRuONN3BGTe6O5r1prF9hceva0IUe+hX4lcyEGwW4lrL0gnoXPAy0ugja8ybjg"
+    "6C6PqHJ51LWN5MsLFhCxs6ZXyiDoHIOMbuGO9s7o7VBgUZb5LqLkbp6k1S+4S8/SQc62TDZjU9mC"
+    "rrTRx2VJ2kDRnbNE6itk02KYk/snmyaT5QD29ghId+7AWHYB9UfaDgTngJPobNfnVVsKn4e8Nomx"
+    "Cg7hbkJCctvbS7/ocviwcZ6u0NOzbp4/qqXojwPQB+1mLHbSgITWZX693pvTZ0vz27mv7+C/3YuC"
+    "awo4N9/WSPLibILuTXujjBmy7Jo6F6qO3CNtcXGwmqkP1RvjCt6o6T4U+c+tjTIiLT7WgW19SlsC"
+    "9CaBBa1gx3eIodQX3go692IAk7fcptVjxdPqDEhz8JQ7oStlWMLl9gN4ZjykcZgmo/+b7xXSQyFs"
+    "5sEOSLvb3b9d763YOjw3dqb3WQbdhUD3R7boJ91T0/aMr/qOyDAkX8X5W7j7lJfrpv26bmNa9ca/"
+    "2gX8cu742Boi3W2ME4rTGe4U4jXV0wzVjt36LTuE/MZAYLi8PeAdG2jFGBhQ4PcQ85cCC7bD3Gap"
+    "EJFDsjQhHHmAeMmeAjxWiJLrDJKx66kQ9f7JEdhtSh+amn/qAbw+VJmwV6IITFJMtsxXV/7qApz1"
+    "00dgo8wG57qo56ov1g9W46Pfl6+vTo8+nh9dfT/s1r/cIBTyjJrwINO7azwOfiG/NXPuSN6zyzI+"
+    "sJntShXJFTeDUZjpKoHKUJwUQHCkULu7CQrdA0I4hFvKOsee7FwROXHbooHFiomlGYpfn7Hj88Zo"
+    "N7IQw32ItAORTjNF08g6sSUOa5FJVZt9Dm9t0wS4gjXYDko0QJZYw5NLRWxxbFVwWCHky2/0qRoV"
+    "jrISGBLgu94AaGEUVctCtlCBKIUNB5aG2s6RQ1RiXJDpq1ImQcLuS3j7Er0NQnfZg8673UKwtMfO"
+    "v1jXBdF0FpHbTWJwwG35zDxhmFa7VX0nmpRtbnUndAaEMej/MiGIfjP8VesCtONjFO96N0ykLpPt"
+    "EDdhqyG00cNL4wrqWnG5NBjMWrTww2VejSxw0PXbg8Ogk2g543RdhBASR49Rd5LXi1UeG35Aje6M"
+    "Gqj3VIqMSCAxM2OWTDAwdY6DF22YacXwZDmf68abIctmKnrpxJd+qogqIh11dAcqeETo0fZN9yE9"
+    "FmUBf9mQd86pfKl02QNPBroU09qZvZLEWdI4t92Ou6YHPTRTMcJqiO2SAIYegHXxgiFfSciiEwBN"
+    "cbjJmLO5GU0R7YAYLnDqckI376i/0oGgEu+hrtzcaPO2z8Np2SVMYvUgEjxjA5TdPZ6nZ6tTqd/q"
+    "+vX03fXegxTA0e3EX2I6ri1Z5vOtKPsvrxS+0t1sLhEU7/qdzYWFn1mdsSN8x0aVUuAZ9QNxOaGM"
+    "TQXN9irgg2VAx26MrMfR+LFuW2J31eLhj2BhrdEv5/2DsX5siO5DpfAN0NzIMzXHJf3pUsyRH+Af"
+    "7/P8AORzgsa23JclheSVxSfA7njRmgAfh852TWvQ0Od2dIDrdnF9V9b1VlZZ7MyqquunVfrQx2t+"
+    "0FKVj9FgEvZeA6W7zwpy+Exfhtc+MZPn4qhwuCT2tRXAZz0ECg/1Af/d/hpV5a/vzOyUZ/LFwi5r"
+    "jZ3Xjgu3ugutl3B3hLkv59vSXsdxfWA8hW47z+FjQe0tDiccxjJ8NCnSCi2GOYGDSEjDGZ2cPjnO"
+    "IeeTxKGk4pBAMtNzGmMdfUmOmFnIpdLpxmbEiPkFlMZgytgYrBTG+LzBU9/tVNK6iy32OmJwz0ss"
+    "lYa3bk+c2swqCu3plPvJloUg/bVPrsEdWUAzBPbszJjOvCbgxsRwbngAc4kx91ZO211gtSbj2dfn"
+    "H/8+lv7vxu+lBvvby1ea4TmdwxlcWFPSg5eUjieBbbo4vFGGmUoDtX3OrYAHoqZbX2lTidIeJjOy"
+    "HRBhQqdEyy0vA6dFnXJdRv3ad9ShYuK4y+BdXoQ0fzmNoKIxNFZXfb9ArtSyxs6Iq4H1BBwza2ys"
+    "XTx69dhFhMwdLeStnIipv0CMtM+rOVyV+NF0wE8jsIPXK2tbBCiY0D1QnqX5SK+W2ljyNcZfweRk"
+    "iaPZt5ZdP19oVOwBdwuv0qxt6giAc+yxdNBb7qDk8qhJTSnPChUD395gqdffsHdzSBBl65kY8O7n"
+    "kuSoMBPuc2yjQK7cOgy+IgkBVZygM3CPBUQwkKtMiX7GwMA0AQ+ofAgTy06EC4ymWL/0qhSR4002"
+    "HcaQTKYgmbCSwWgk1t6DDi1TeLOTiQVQl10YfgRYhimWl7vchh0A6rMdO5ih/bSGqDxXul0d2L21"
+    "5IekCnbmJEBF70OC5+sO1nFZAGI/XJj9r1kbAXXo0SkNhbfivg2SbUoJtJRd+0ZVmMDmFw22T8lz"
+    "ZpO9rebicxBZfJpUPVqevdshT7NkvzpR3SL0SQXoJ1Sj8tRDtgI1eH8RE6if08gNT56p7bWDdeqg"
+    "ALtucvJ1YNnz49mP7L//1keqEHv1cbvRhF5Zdb1UtvvjySzC1dptN/kvu2S+T40/FuPiqkrPMk7C"
+    "fyZOIm5eK3juHvdMflGflTdbPtRjUf9Xbfdm7e4StC45FumnWrgBes7DCUUTkpgEQFQMpe92r/Tv"
+    "GpakwZNo1KoydyidMG5oOOyuZ1mt+85MVM9YYiWKEXBR/obZhXq9XRi81m9UJFpQWZm3DjgVd74H"
+    "U7yevyoeVNeF9t1S6VPn4T/rAH4nft9cdVGvd0ZpixhUCJNr4ZRJSEVvOzUoz18HrsGaNKaJkfVW"
+    "iZ0IylnWUU90EkXHPIHOc8E5rlUdRpSkiDmdhXAk3B1qI5Vtpyy95QI7/ZZt5QlUeuZQuroB2ZT3"
+    "CeN03JQiti4NV7pbyAZPZCd2OS5cSnXpBy98vp39/+dPqr9UfT7UPd7b59kWfCmWsZoyVmycbhsZ"
+    "i6Gsd9l1nk5URpMQ6vINl+8GgPGKoL13OzeWyZy7qqcz1M9q7EbddMvZYCW6SeX1xaoPiM0lgRnv"
+    "gY/fis7FvwhEQ9oucVHClg38BFSX8sPYvy9MkARm/aseWpZ+o6A8aPZURhGX+wdKJ5VE9w+OAT0t"
+    "7gk1ZVqHWXuebDBjgIfTxeEtWWwi9nNC68LOhbDoSwoEfsPpEgpjbN/OHOFWD91gBRsK7OINu6VG"
+    "J9cBQN/ut16HxfPBHLShj8APYu7N0zdPKSbrlcbXMFBEfr4FdXwy70R87Huo3t5csXPtD15VPc6Q"
+    "bKQfloHJGz2FAxDUWLaqNBOLBO+4lefOFJB3Uv0CDPogCMtLPwzS4eMPw2SgY7lPNNjE3I2Q4OXh"
+    "XAvvDr7blSxJcBK/w5AyUa1RQfiwpuLSUuYX4BPpDuTsXC7EqvXWybrU/MyAk1dISV8YLAqoQdrb"
+    "YNWXh9cC/lqSNOgsoBPzZkcvJwpbQX1mG0vbwUpJ8DzG0TDNboV/21xOlFG74gIGqblchvEV1pJ3"
+    "6c3V7mR0RbyxKH2yKDDihy+ICATouKljMspVNlPXFjPHjBlB8EnHYGK7aK2zgoxVNezMInuRW2aO"
+    "PPxXmtNXj8iKjbgU44nN77yfQPj7+e/tOLq+nkttrEZ1l1NQ5s5OjgmrT8fJ4mZA8+pY9n67gyLU"
+    "b7v9tJBEj60lZuEZOkHfKoj4mcLYUvGfP7eRB0GDsFIy08eN02xBSLD9zIkYdI6ETQB4ZLVGYhZS"
+    "ju9IIc8ELBlgUP7UCI5sQ+Kx2DEG9niAAAIABJREFUJFr1RoaAuDZs5BbMEJTnt0NWm0quNsfHL3"
+    "O7FUI34cYDr/aAu9mri743tbvs9wZ6BcDbxH6FuneQJA/pcpmGXw25auVuaNLchc0thDiRbDnTI6"
+    "LKmTMPddwWMmNqHyQWiCPGcNzC+FQgIhTU8FePr/CZf6HTSe+C23YAlxA0j7cLvpTB1Izhgw7FOZ"
+    "+F7NGzyxWTNFMnkBIJ28sA1V5p7I0O5iof1XBwNiqhNC8Q5m+5mOP4q56L59Pdn3wx/cXBrenxw+"
+    "Ppqe5MOZ8+kE79K6t9rmMY4TLWc5zBTUQS1mgdugpFVyl0xneMRV87ZsQYDM8ijoj2cxjsSjRM19"
+    "PVmFkNRRbYZUg+NocepewjZCtd1P4jY89LOPLmLh6iyFAWtOAj02HuNzDN8u3/JS9o1heDFihBT3"
+    "kjKzfgygJFjRcceGEajCUc+6gn/msZc4lgNJXN+OLh5ANlZvIvRdm5r1mHyrDRwfzqVjlYLL270f"
+    "g9SGYc3zWLTfSuKY5j80zHRuqAsY6SoVK2hf4fPVUvULSYw3QD7tnOP6U9swmP5QjdLrZv7VSc77"
+    "P81R4caHvQVUE3VHeu+YcgCgsGGl3I3P5IcGfi6LqahXw6GGUhd0zfckcTARzOJpFvnXnzo7BUDq"
+    "3p5FloHa14lUaFSvDslQesssULKCooTjpxL/b4BUDuK2T9PCFoY/EIg7bOs0CB5Nv2lOjb92ybBt"
+    "1ePMWNwYc/oankWIiABUYY8C/+7EVUdKKe2zs1OUq8F0j2J37io8pCb9uMLhk+CDXdNopmDLcYnF"
+    "jyzQANPv+JuLDQlzOjoXd9EVaRAzSSXjRjKzbUBhYBHAT4+KxMC6sMaU/s/NCVEpImffEpfaATD8"
+    "/VdR9OJ9NvPno0PdezdIdr9RX5/IoTCbqt90g9e6VJjQWe/pvDGCwOjWVXzL7FFpegxqFsZeLsIN"
+    "t3g5DafsUpDYDpu8yj7kq4NhaQHBLI4htb0YRwVensV0sMO1UMB7KimUwMrvOmhAk+Rnnxoil+T5"
+    "F/A9afPDoycJsTkZjbsetLPZpv0hW6je5+PXoJclBu9jce2PXA2+wYbwubX0B+Bbt16dzb0tv470"
+    "QcJ3gwUFKn2KaXjA3xHYWk6lBDaSie15TQvdoq0ZyqsZoxp8fOGiXFCTeBmK1aQ8lQ2JNOrucYj4"
+    "mwmiy0sFk641loLVfiwWoZbA1sgEq1mcJp/La56VYFr7eFUI6ym60RolpCnDTjbc54Dp/4WboD3X"
+    "3iixTKX2gznHY8WqJbUDarr6cP7v9u+vXJv013zr/QcdPzYGjhh8f1mhr52jOpYoQ5zuC+TU6Cok"
+    "88AvUm3ZwAzW2b1MLKRpvgC/zF3H+9zlVZyRCExsGcQuY1J3d2lIajyAbHCmRyfJCStJDTFtqRgt"
+    "s4sZQcqes8Tdml10zYanbq1HhdOPKGKBwRF9bFdttD/bvu8MK11D2nYwPo4Ys+9ioBBDyza6cvFO"
+    "+twJmxax1Ggl2CRhDv3A6UzgH98LUsJUBH58yX1K7ssnQglCD6Zp3BW9J8/Gi9S2ShlN1QdfyrQz"
+    "532qWqvUgve+heGIQRerbIFyq4YnKohY87AK2p4MZQ0leqlGeh083phnFXEcWNT0ka0A3rRqWr6O"
+    "OD4iwk3FPoOgUEL3I+2CfWFassbLgaVAf5bYvK+XrnGExuIYAu2+vqkTuKdJYKGZ4BzXZVJ/NApo"
+    "J0MMSrU5cQi1l8wivtKbN/8BELERmfBVUvjrKosx2Y5/oqlv32Jy0vGetKBZzGrva3qyM2eLgaxy"
+    "LE/NjLBxsY6AuHP3kHqq8wYo99WX4R+5BZLp708grhUycZBa82YypB1dGTEEeMvOjwscCUhEX7Kp"
+    "s5WXSJx3bWYo12tAw2qz72vyZs8wkB+V7EchUSA7CVvkAMn+VVwDzGVTomHya6c04wiP/Z+vb091"
+    "88nz56stVRBI7Wmy7VJyQ9Has/n2jS24jMS1I2wuTKXDyaZsoiM3p91ZFy6bUxcYT2qZez2IShUI"
+    "s3fQV70R+bzVC7cAcxVzNLvnDRRqCuhPhnYUExWC869eE7NktZULtgwGv7xGS5NgI2HJevJRuXjN"
+    "OmOlO7nMAAwpO/dNvWMgN2usZ6tToX6YWyfeRG0U248cCP4gF+Ej924Dfxx9D7Y9fzD+ur0SEDiH"
+    "7/zktMBMY15mYvZmDwMkNjP3O3/AerOVnUsZBBinEUz7JlXB2ehqQyyvsTtSIzEGljiBsv/wBLIk"
+    "MeccwREf2xi4SCokolCw/6sYXNx5ZLDtjM5MjSlTUAaMo7dNwarLzKbA+4vaGT+VO2c/el5i69eU"
+    "okLeLAoYLwakF3dPJiunvry+mX9z+afs3/0+ktmKuDJyrWSU0qyl1G8irHxfEJC0bwFnOW0tCupM"
+    "fHRiqmHaxr2IRtRXNdKh/qsuBauhniALe5SNel0xlEbb8Q00gVklrkuwEbSPyUdl9oudSBHkWAp5"
+    "FIzXhIZu6P5CgBt3S4HLPCkj40/BPdy7KwIexZ23GXF8QiCt+CMKpvl2hHTLV9slWxJVwYqf49+B"
+    "ii+QuQ34XLoQ8lsw84vuyCcXwovqVPhkGi+3ctoPgE24Lr+n1LJe3vatPZBoNpHKBifLUbuOq97r"
+    "TD4L1JyFv7F7T4ueKFETYOP5Yj3czuAIwl+RHkILsbWMxyPAezKx00e4FT1fNPRzjuQADSSHUQSZ"
+    "aO4wUSMbq52kRAD+yiuXMo74VAVElHbvnrxR/dx7dYwic5dsTdsUwSmbqgD3ovlFBHHlv6TKH7Mz"
+    "RNNO6sgXR+pSt/kjAWsg7CtKwU6aUQKfOiOIsWV7xY0eWzj+Ii7aCYtHNNS4G48LsGXOlIUBxGZZ"
+    "Oez2LFZvjtc+ysH41/HMYqXQKeEaPbqkXERwTb17YpBpfQmK3XupADQBuLS1/VFW9j0S+82JTeXn"
+    "yz8HZ7lCXRZ4jQbYYWbJrpfXUt8PYJL0zxgk2TG/32pRa/X61uT//9nx9MD051C8rmtiYitYWu0p"
+    "2fneEJ/y8dz89lytIVO50Jdl7ywcc3qQeqqZfHFhqhQ/tG+XjtGg8AfL3F1y0KJsGxGPxRpuGX/Q"
+    "E+2iy3ySDU0iVfpNhgZu2w2fvYJhn6tXlKHkwbgP4FZoQHgLNhDR8Y8PdilbKBRdp6MfPgar1eXa"
+    "gv+DggQDf7Gw/MHqiuMhP+BFLzr/NPoDLfvwqa3Dwo0NSayuMdtztJbYwXPTZ5HDGZlOUQ05YQ+R"
+    "YMVkAoJ69lio4rskBUTiPPGKdKtwgqF2+NeV4gjatU2KMyTgT6iJ101kpIeR5Ai4zGKuMYN3wmKm"
+    "865ovHO+skAx8FKSQigAYmdGMzYrZ9Lg9mcEuXseQRMLBVX+MK62CtOW31VP9P9+n015t/nW4dfD"
+    "4dXTybNtOZ55HUjTuddAyjeZMT3qjMopdZkbt95AMOgMR1wKLRR4TYUcH2Vc71k15sqEB1yGazkc"
+    "rluGHwOEGdMR0vFP8CqCGNA11b5p/0hsZK3ZUDRKHnNPNSB1uSMpcrj0bjD32trfgGvesRlMY0da"
+    "EvdqE8/LO2YhKBuo5Q+LEV3ctCuMj3Rl64YJeZiWSTCO7nIpjbSqhdfSqPfOuPDGBQO5R+oqJT49"
+    "gHiTS8YpiBWjh8Kmp+G4NtlpAtkonYwi6rjI75twpG4YBXHyvSobtJQ+v+JHZ7937YJX/zChkOAN"
+    "loNxpBB8TyYh+U+//STOcHQWMsjDeC6BLuTmMs54NnbslseYumAvLw0LZ99AcyOln4oZ+xxXq8S8"
+    "egjE6AjQ4qYwGR/1zTwbkWfKPM9jNYMayEj66CKDL93BdKDGc9DSt+PtLVi6Qs+lJ/c9nY8hcE4w"
+    "rL9qNVAWwtXvzH2Mrat5RThFXYr40BFvWUW28tzFyXwsW/h14462+zoZVt7Q/0NF40YID8K3r7BB"
+    "3wSImCdAkzluKDSlEO1b4uflF6UYePYXHeIsFwUjsmnLaDDmU4yY+YmtdVwtZJTL070DcwgWfo1v"
+    "IFy/2Vespapyo30MS7oYMobEU7u31n+qeXl9NnD7fT6TnnGWMjEzxX9Q7Fcywdejo0izvJocIarV"
+    "sEKlA+UIrMsDk5E72jfjusxdD1sI9Fm+s3y5LqmnaMopYZNNljHey0RZ9KyS5ASKesfiNlN33A+o"
+    "csjAiOyHa4rWgn+XmE4ZzilQ9pWFoazIKp2BbEBv1w1XZdPOBuEjce+D4eGL+J7wPyPWVvOvUfcK"
+    "AbyQMjw9HCXSpgPIHCEm+MLXA1p2dDs2nk1ujNGKlxZpwbYq5i/CEYyDhgZdhi9mAMq3JUKsk8Qh"
+    "yVmh8pJpjY45gmCYYs8CXvebVs9FDGuOchTTzYY5uIC4eo8Erb0On6IVu8Pjm7sAlTXKhyXNGM1D"
+    "TvgeB4RlQWcCxC/TcGMlLq7QY9Mz5dnolBx1Unl9PtO4+ne/f0PN3mq+mDtR5GWJ95Dg2WFnKqIG"
+    "k84YWtcLm9k0WeK98LW/TRCnYuLUGekDhzFemmk+SENhsGi+76eIegQ/uHDCVjLknlzROxtM2Yvy"
+    "xACbYg221nEkA+zjJeYcEx9LmBAEFeCPCbr3koUyhZJ8n2ZxxDSVZVS/3hWgS7YuEPFwl/ScJ4wt"
+    "DThSlgn1TTk4e9N8tjlwkt4Fq1sO2j7v595EdhsfZPYjCDg43xVdAB6rLoJT/zNxe+IMA7Apgj0w"
+    "lb44x9hxx46C2M4dcFDRxtOm+/qERD7kGsX8h+BRymRYLuZlNHV6f1Qbrj3L6HH2kAX3lxq+cH0a"
+    "/FpYwDQRqUM2XJ0yIC9qCQ+rrBUVaBpM8S6eoKIYslFh7Ke/A0Oa1NZwEPXbQrHcZYVuI83JT5bJ"
+    "0KbYeKwXWdJHulWyd7UaKCYMKrLsPC1QsV59KZ6Up9O+Po3KL5EwPGhIFBLFJYSIAVPfiEAQ7j2B"
+    "HwV3zN4IdLwfYZS9dPsn7u0FJeHA5ZdLJCkVyubmE79cYvSulrPy5o2NFt2HWAFVvR0PwsoLHBIa"
+    "DGzNnPskX6wejFsxhQLhFqIrvEJkvMY12FTztjOgFu6udYsrZFGSZebjMFhDICNnFO0Yt7AWAdr6"
+    "eWASpEX9puo5f3nCr9+PDW9LefPZo+f3w+XWrhe7xZ+e8u+IsM2l5/j6S/MRAGOrDH/TMTUOylHq"
+    "4E6h3abjJ5GYjEUuR+j3+7rekX2E7cIf4gF2q3QTwlbgTsQ3iUkUJzEnsRFX2xQ/iIaNd+TiowYA"
+    "eq2yBaoXcgxe889Q22/ShB8w1W6ccGPu5zCOqrDZNdhr4CtpggYFbfHChVfBPdeOA7e6D72HcG+B"
+    "6CdOTegLnp2N/uTMaiuIj5LCnmDwJZj1sUuIyRJcEpj1GSY0yuNKXBnFtgTvUYxKAz48xjWDjBji"
+    "bmTVKJ3ZJiyfiJQS62atRnI4E9yc88QWxmFUfYFUvS01OmRJeOXZidJVlISsWGOR8J5zUve9FlW5"
+    "gFeZuzrqAxXfqFcULywK87V/RXBvfefzT9xf1Pp5+vPtUa79E0nW81t3JiU/rUHqQvWRhKp2dVLR"
+    "SJ9W5SFSitzS+n8bEWbNgmutTY/Ewythj7ml7tL14YzenIxyai7gbmKkkADW+qbxYnVZC2DE4KsL"
+    "Pz4iodXZZ50bmdXUOXRaNs2CWGOV3cC2z3karzMBSwNqUQI3KNCNs3SZYYOpOr/a618Y+LtMPXtS"
+    "nnsjaXPE4kL334yR/P3fG1SuZgm9gFYNhYeAavNDjmU34u7pRoGMI2QGY1SNjOInWdIy1kH4sUBn"
+    "bbrlzgQFnqyFmGoXoJ/kdPY9heBfuP43ounmm/1Y+fWwv5ywIOVHMwp9saVcaBuT2uiANwFhV4HB"
+    "46Gm+jbB4vFDR4gE8jsoghBtsdr7zgMrDYdKCfg+MU+gftZHVI1JVO5Mp224AdvThBhPLESiuBjW"
+    "Mh5U7EwWh44MuVPXlBqKZXUXi0xz4vjlQgxY2PXi/AVH/rYcJQvX1mUAOwZSTHIoj6YFbiYHYdwM"
+    "DnjYte0h5TLZf6UcfGsUL3KOmTX/C2ZSTXOvL8H/ZqwC77wcBW69AeXnspFTAGdnObpNtDxeGJnx"
+    "DORB29B7QbtgrFvlDCLY+fTEU/W36oYNEevViWmMv8LJ3S/Mi10wKsfi62r+qGn0BnzaBivaLVz9"
+    "Jd6AzlC9n727PL6X9/dTo90wtSrvTSFOxn26zWuk1Tz9SJxvN0vs1SOO53Ng4fqA+jS7a6PtDRJZ"
+    "qT1EYJ0vEHtUQOLnaxMcnIgRVZw1qe8nJLCSov2fzWXGoG+mu6u3SSsBAxYtLor3a2qfqcysxqXq"
+    "wKP2eYSRlP9c+vBwB4FPFbtQ3lZxMp0yZBbn1FD37pmLaNNGzBV8KciN+EGw+0B6ondfa14/Te12"
+    "b/QRlH3/5BUf8MwHwPo4eb7GqMoeYeCxeO9XgKl7687OpVwX1Aux5zyTen8azFXMJncEt6B4vxSX"
+    "S2SAuhRqoeuQb/GMGaVzFyZLWLzUkzQYdrMRaaz6wRYSGmFDZTxdSDjLBcRlqbuXuOhIQcpx/ntH"
+    "lMUD39zIBiQtM0wN+5/XL68N5n07+/+2/TvaMHmvP0pnK999J/1K55lbkVQ/rKHPetoIv7tDSLCI"
+    "y4dNtfpQM10tObj6fI8wHPdeGYkbpK3rLwY9wcwkseOnzBNId4PQenZGBQhhxWjVD4KjBAa2FeCj"
+    "b7+ox6AwnHjBR7Ij2oYBdu63PfMXQwG2KWxw64YZIG22cB5SnoTUmlfSynmE8JJm2M8GDCgDFm8t"
+    "hPmQMqlqHq13VsNlhiE4kSsKna6evjD4GOj9LozrEQLPB1vUhCsWDAYCY03ZnWXnGxkLP9TpAeiS"
+    "rIMWZdjPhG0xt6D3bzL2MPjMEEGXS1OtQTs7zIQD/ElQ58L3ntvw6CL/QMEp7kID1Np73o/JD7qo"
+    "/EXRMal6s+/awUea7auAOpEX0FSnJ91cEdQZLEvdiCNw1LQbW8kowTyamrueHjRv63bHQ2M6RToM"
+    "s9wHhWYjt6MQSYOYXFB/oosyaVqqxvQbMPVO/opu4YxGIttUjd5qY1tg6Q0YLneAkHzxhaTlR8NO"
+    "rq+nCiTYs5GxZ7kIWn/dw29EKDvO2RGtuvAcsH21RX+mg/LIip8is5dIE56lK8XuzF922jRBVkv3"
+    "jnYERBpO5RJGWy29UwXTVGhzaqw0aUUHJV566b+c0Avvjdv5AiHz/Y1yK5/vWM4qWu5rrviH4l/2"
+    "21IH56dHv6zZen0z999nJ6dq7FnN56yYP3cpKvsOlUBc+Qey480sStm1eFKVypoqact/RZYsUi7w"
+    "SqhM/7rLM5JOer1+ZEIlKpU/zgdNUpVY+vU9uo6HRi2iiyzrOToH0adtvhNnW+pRurUGhX2oIKQq"
+    "IChJFWXrSWNj6s0mUasmwtZDr+Es2T9wAzn56P5C7mPKpomZvdn7MHul+5u8kR1fveyCWN8UZCb8"
+    "Dc+B236PV802/i1/CAhiqNkYw6CowlIsihDBnxqygaKBjT+BA4AHE59EXosShv5oVpUegsONHksW"
+    "qMV/BVjysZohafx7omwssMUDJKkZblJvmEGEkqouC9dJHiQ4qRsqplWvNFb2uG+opgLKEFuBCZw1"
+    "loiS69OpWrjwL1hYjTvJmqjOg6Dri6PJ1ub55Mf/UzvSRl/Ymu5z3QYwunGreZz6mDhKTIN7oIS1"
+    "RldTum7U+ed1CwBtKMbdyuoTJoccBWzKbe8b3SZm+O6/6MXLdTkLA9/OUCY5lThEYij9yipi5LO5"
+    "a8hVQ1fxo1xJY1v0FUo1ZYckQUuW+Sorx4Wi/kZbpFh6U2BY5woYPjnFhDIXWgDHqoylS7x8tUbO"
+    "iAe4azXEsZO0igAVMxMtHSvKmTWaQ3djgHuBXMOoNksCoqClEZZnx0WM+QiALzVF1CaTHb5+rUCW"
+    "TMLkhzusy7grJ96vFz0xfifkQ8abp3Qc93saTRrdW5EneoqxhXZ7pSp0XIxaX+zFkWc2WNLuKmY9"
+    "CgGeTsLHq6BWhgDQvjAFIsajg6kA96RY+cuploHBjSXgxQ4JpHNAJXadxhlc1Vv8gwypjbmEZzp5"
+    "o7qQDBwMZKBkc2gKlPL1J8hQge7IohaLb+LExJx35iePqHEz79UDVI+g/YGWDBob6MmuK1PtniNz"
+    "2KD1ksxh5jdVxyKEajF2Zdppi8/0etFlfgEkQuu5V2noFZV0lV7DrKhtQm5aThI8an8JAnoKMXKr"
+    "laM/sfPQxKfvmMDtcl6uAfszOqWYxxnSmmrP0Ms0VK0P5xHUQVLrwED3xK4ye/DAWdascI5yogrP"
+    "4LCkTwuQo96dCHZMO5ZB7oD8b/7rOn0y8//Ln6rW6z1ALwcltX/KSXZ/B0U6YWgKk9rZIhV3kSUl"
+    "ImpV4iEVxH8Uar8qSEpaYlY7nEcCuI1u1MnZIODZERrCwUtz28fEQHe/aP0uhUwBZjKk88Sopfxe"
+    "bpemAnAWkjaGeKRRf6ig+m1LcFIt14S1k1BIUWOd9uV7rUf6DzQjfhT9gD9KH0qG9W0v2ryN+W/q"
+    "bUj0/pOlyPsWRZt2Udfnwr30mNOrGjWyT0fvyMXR7N5FN5kgHEg1OPL6ZmTCq/w707to0CO6Pbix"
+    "GHsd/3BKikdZkJEQ2eabuaL83TpWSK4DFPmTCnQB2A8a9JufoEDj0j9hl/MER8Hj67B1XcfJ4sxD"
+    "vyVjTbbnZ2YkC/GG0H86DLmLNVxl1orMhMVAGAPK7Csky3oBwfPJq2umvl392dpq/O3xfXnenR+T"
+    "3dhsVLxuSz/mje7AlMM6zh0El9NZW6iMV07GB6jE/YozJzBLr9lfq0nAxREJE9EWqcIx96ZAdVdJ"
+    "g6H2ZzFs1yUWrrQTR30VAU5IXsKAPaVpcViii7FmJTykCLTPJdA9OMuxDGEOxfWgB8tXc4oy9Wt+"
+    "6qg/mq7mWXOURqjwfj2h7fFJRrT7pgZp3SsfBr2EvIzErra0usb6EDu8Cjbu2v4m1v2wSVWUfp4R"
+    "cy+BcmuQ3FEzY0VlqYrqn92siC0DGeZBAzB1z7FDhc3LfAqZox4jE40hh8WKAwYHL1iMaJV7Mooo"
+    "0J3GZpp8vxvlJUtxaCwgDhxR3M4NJYJN2g6qZktfNiQnFjmgkrqnO4r4foVs2CUSb7Ck2spThXzM"
+    "CNjaYxKkkPNi4XGJQ1fqdzJoVcAvwt039d4BIZimd6YQU+WOhw3Uqe2zh9gC5+30bYcZUT2QbJY3"
+    "vyJgan6u+FoUvlby1I4kecR4hO3h4Ze2QZtsS5wTeXdtitMjR1vYKStsGvtkflStjXwDQP/z/Xde"
+    "4+wQBPpw5m9JKO6bRNCvGDdS9imCynNjK/lPUVN+jUIVjOQbH+XBGjPaP7qPh864i6xaOzq+mTF0"
+    "fTf//dg+mpzk+u1se+5ZLn8Q7VN1jQcdvloc5UYpPl1cmwgb5G33Wtd/THHhVILv1axeHrKEaT+0"
+    "ZwXVxJFSnudpgZF77HgjIhRsWf2IXH+kMePnlFfkmZClEww6p0NyDl2lUJlQ5HS2FrsMFP2r/Bsh"
+    "tu6DGysJRVGx9ut+cb9ZE7YtnHsS4Vvdl/bw90X3kVEGXXy6/3wlfJ/T7a95V/FXbb2PGSp/V13G"
+    "Wv4u2yP++4PaNBgrduXF1x8lpEPNgbqRxq5OBXcyjjC6IWDwbjmwNinXRDkKn5XKnMDi5gHRM1in"
+    "pcMsHFkpFoOLPvk8ShihayhNFRnB7jAOyA7gCN4U+sWfDMkpSB0vuWJqbM+AyoYRJN6RS4CBZvBo"
+    "KJuXix+ZEi3UuCi9kuZNcWDFipq7ajs+n2+nR6/86D6aeXv51W2691kv7FtJIsz4JbpXzGvMEzc9"
+    "78xLpO5nNHi+cqmpHFHzaQFj9qlLD/RO2TwEo6uC4jTQKjLGS5KvL892re4kDZMpReH/uZXr2k+M"
+    "AyXssRs1EPoBSNfrXA7eMdakgYOEp3GThAAORP6WhecIuElDkHN7IWDkLTwydJ+7kMVKHrAERtQZ"
+    "sxzT6yYO/aZLlZlYEGO8o7GEiZKmy9yVIjpYwtnrKfyEnJotW2m21WOHiKZJyWU0xAB8XIp/6iQI"
+    "TmLVLzMaqOrDm43sOgX9rehVOtOy71TJEeR9JzU/yYHXT7Jbc0LhYaboj0zmpYNQCLAA6sWbxInh"
+    "bphqLRHSTTiyV4fHBPQWGZf86KV8NH2UHTNp4bm04gXmiIGwsb9KHNW6dt8kIBPlG1cQtpBoTw+Y"
+    "FMLZCiD9R00mALXF9rQw9+IF+6bIQkoI1nzcQyZFXEgT/gfHzbKmnJswiGD0x0uyJgI+9PgLtDp4"
+    "B69GIuItweC465Vb9O+5ZO7BVWl/WCirz5cJ7CoAunuK3Oi6XCDh0fsHzDZmzf7coeEFTWdHj4oI"
+    "XYoYGUSZvgvnwob99Shu+6n6RfCluYei2+/iy8ZaizMDLLgGCei6Or6eGtO9P/evRy+tcHL/TCFF"
+    "1dlj+u9HIUcTA1+eUox6oC153Vdf0WUlyGxW17zFYNyrcxf95jT7nRtaAOqVd8axzsayYYHKwoeq"
+    "iAQvbirRzeBZ/gvdLBC82YYTZH92u44UMlPKSXwRjFU0gwhmWhz3Il2uklVq7Ml5gii2r2Pzs7u3"
+    "2+vTiGlNKb/bvugdHN3qAiLfNDdILGIl5ub2DOa7EubSWNLuLl9lpAf+5MPkd2dUvjymbHFW7I9q"
+    "zGcE68knWosbROrEHKmOJUjYu0iUEiId6Mg6JpwOyxrUFzVS3yzEFDlUgZW9OyLpOyjG8aMz13Np"
+    "6YrZKdtgZhQca4qTw2IQtHdsFNuolwwUeeAHfqbMtM164YlmOtcb2gCq7/dNxjdvHrTir/wTiwtV"
+    "7mOY+Dzfl0/72vp1/c/XL64OCz6dbRIx2rvFDdpb1OvFMHQ3kNzgJbctqss998iZ1syOnZBO5/00"
+    "TvOVUp875qjuOtpD5DSpsGQczlA2Lstf6ksWO0Z0rhUFClOPmqNoanQ5KxSyU0Ki5VUBobZ2dbBP"
+    "9XInxiaburxMVL3xdBUNTXmgQ7AAAgAElEQVQAMSt4BR+lvVEsTsl8A8uScNZHv4EYk4I+BkLLrG"
+    "m2zvXvLPjFNaqqsqGznNXspZpKl7KSt50iiY4/+HSIDUVp7MZVPOuPf4w9MCTNd2EnuCVeukToil"
+    "IJGhmS0m4bkcSvv6bkPuH9C5y12rugduJV43amf7Q0lH4cOJ6mdYNocXd5rgdr3UKMn/z4cXY6ZF"
+    "4qAreCBEkFE1xJVQPt/IDQCbt+sNZRORqVA0b+R4ybOyNbeMLmBS0c5BOAQJe7oQzqhVMv7o4YlI"
+    "wBt/i1+WqGbZKOIwYL6bOZsadt9S2ZJQReP0uYK0TUSTbJT7ydkYUMi2HqB4o9AaY+lAWLq0qxG9"
+    "jYoYSVhxdB6zcCCxvdbqkFILqZoLywpIxvLfBop/gPhZw9U51MQ0t8j1EM1Kjq+lPqICIPP9n2+k"
+    "FlshWzFSGsFA1u+eXCUjQF9CdhFiWxd+ELeBD2bCI69dFtkDaIMsmbH1+pfdFLXakKyKmfEvY36L"
+    "bMJyd9xUxc3HDiK6H6B/GnTLjnJ9Pf/vbhdE/5v7q/0e2XW91mmecV0cuVur4ijW78y/OOBD8BIo"
+    "iqnWPS8ZEtEq1sVAHqCN1fqSvlWI9rkHMwfvmlaSkxN0nzV8JnUyEQgFDFyRWa06FAA1cl1EtR4E"
+    "VreeTcByIdK0Q0YCMqX8FtQltI3vVR+8PFxlzdwb5T5kj3bm8vzu9st9sTZcvo5rqJ3yUP0LzdgB"
+    "2/rv2LruG+8rpyb8q3tPFNZV+H/03r/TqYf7o83eryGg9kTZe8/WwEt5XzPXJXkcXYaaNc49O1YV"
+    "EljFQu9Ng4QJXoeQP5AQVdn+BEzqXW70KVoQ+CR0yr5ziEvFcuSg0WpU13XGmJR19G0TG+I+8Abp"
+    "h8LFMTGXwZjptPXKqz8WeS8khTh9Q9MhxHZO5DRSyXEIXg23buplKeeVYI68MX01/87NH05PKL6d"
+    "Gjn02Pp+PpTE3jugHCkRxzvo6X0RR8eY+3aJrCnsA8QNspX3XwnIcagmxwfUlihwJyc13JRd7Kwe"
+    "ZYKOCwl5ST39xxjGajC9s2JO22LjvmuU4EGxDgtA9MIipqG0mnbFfljLNjoqQXBgPlCg60VK2gZh"
+    "9DQHeCU5bD4+hHR9p5Bpj5I4XepsUK/A/Vu8ZTbCzHkTSDxSOf3wy2p9z+a1ak1QmqqWMOfJKPCp"
+    "UbS6SqIMeoRXIMlEWqT5pNPNELpzZH6GKhrrbVJ78D+jEBilAkLLmtjgWR2Luwpws63fDO6RQdZO"
+    "ud43rLbV6G4rcu4lR5/0qLlji/HG2yGsPl+D3+dqMhoYbymZyiU07Ds9iorqu0VEonA8q8uMlCQA"
+    "QvYvzmTdnD1UJZ4Qb1QjFWWda8spsBGT3Y4LNs6hupA52RwSSdMYsiDVHw8sEuDlwVSHfsumCv1G"
+    "Yxl3p6sQu/5aIPeddRizoPVAJpzC23rCrY7sL3S1CU7kXSgRaeXhzTh6lnqmq5tsmGQMFE+PTDY4"
+    "GIfYREsZ985MjLM4zUSVJkOezrxSm08BdK2QkduYjGf8MeFyInDTKi7cbX8Pv5N6eF6a98RVwGu4"
+    "0C77ZojNzjz22EoBDUzzRJ+TlCIaf9YwtQ0c+1N2FLH3ekHKgdXq430z89P59++fnp9MGdO9P7az"
+    "3Y9ZI/Gud/7SLoh81pOyjICtAPvhNbd+ztOnbdXYdZefkOP6WfWRgV+vgZD+qNfYVJBD75xnS+GZ"
+    "Rx30AHGI6VpB0rgM23i8xHmQniqzYcsi04YvEYHs2IzdiuhfIuNp3fSXjg5rcDv345tp921cuV9D"
+    "KEyztn5xfcchlQgG/CO+eB643nfvCatUB27kmvKfQd2d7Eru+o4kbsDT2gYwWtGC7qKVq1kDtExu"
+    "v0DMZYgWrnoSVJFYlYYw0qu23nY7mMR925YAWmg9OGgA8dnMwVwceCGZdNN61UFViGyqCxRzdhYU"
+    "4I7IthyJQhSzkQUseIhRfZ6KCcDyEXH2Y68wEjqzHMkKXmOO7xoQe+g0ebv6QJLOhqUaf6H+oPxz"
+    "fHep78/S+nLy4+my5frqeHvnB6Irfk5WxIzVjozvxtrapb3o4pfE+sLMtE4/iH4PqkHnaD2HxchT"
+    "ncyqlyz1NmLj7LgOdvaqq0yebTDlYwlHAS3jqGMZkSbAtT8WI79raUxQExXyAljWrJmrfkwYkmsy"
+    "/S0WDZpYGurHhdYIXGhWWeR6NLhIBalwVgMm0ukZ7yS+RVD+WHaNkZoFHrUBf1cbnyu6HsKGLbt7"
+    "uAikmYYDPKVtK22CcIBNB2t2EqTHsvlAZACEVTg9jfkpmPw1Pz9LRZ1rDKQrFeoxxcqO9Xh9ut2R"
+    "87x6iyd+FotTqXo/WiwCzQ+AFz2x6Bg24agTIvxuTli2ogGsyr62pAGo1FAosMX4ly66Th3DHcoO"
+    "DpsFc8vjWwZNHFbZY0pJtXvIijY6VFH4swPv4RKo0u/wAq7sVSY4PnjgsGOvTN4tHokafMOrQTsv"
+    "kQrOAFlotSRnkwlZf9hSTu1Ad7Ke8rZ1aLaiXgxXYVjlsuXQf7ijcxpmsE05DxNzIisiBrv/p2RP"
+    "QbV7qJxWPbxD8Gfqvjd6Dy9h9wYrZuydinGC454xkr9kIjNB0lnW5b0BsUZCjHDhZIwtPHpci1fm"
+    "NGv/uIeKI9+n3Lr8Vyy6XrZpws/m2nJLrO1k8jcgaRBb3SiPvlMPLR16vN9Juvnk3/7/Pz6VT/s3"
+    "O4ZjoSH/7USQreeLk2HrWg/6c2VIT50qjCZG1J3R3cxvEN7dIfylRNYRRfuBHMRl5ilJpHdNLpM0"
+    "JxO8AkGrjyY4fxdjWrlRz2VaHNqjaE1DC7ViRnHRKMzkZP3G27lGtaDO0+H/2pF7KR0JVqbrm8/+"
+    "z56T0R93KsS01v9m/qgWWf+EOy3S//EN8PVf5D6ANjibNM/1B2/mnj1JiAHy+3R5cX57rdkvGr5w"
+    "H1IL4erGr8qcHQY4wKPWB0+aI13DYec4FbtkyNgdU5zVdOHnqEs/xQ7LEvpklrhOHBVofCa3s76/"
+    "IFG+yYkxlnHo+DU1jFX9FCi1BFjJ1JR7m85jpSWBQLaw5qH3D845OPij1JEct7vcDraQN5PX6w2l"
+    "xM7518Pv3F3c+ne4cPp6PtqdZ8L5kFY79elML6LDYyP3IlEJuyWYf0+Q4fn2QFOPXt+QRLofbeYB"
+    "C6Lq2rqhXecKOXZifu4Dbr+soO9HSbNk+wlZMs7QgmNpowmJLo9g2uOKQwPQ5+dM/aQ8k+ZWZJXa"
+    "gPdiFD2mzaFTskQmLxOU9hMVRc3dy85scCMTdmFj6jWAlr3I0bUtTUJwR7YqFgwWbA0ecWdabA9J"
+    "KzHW2rpagBSNr07WNMKshnJ1zLWgAGYbuOxWybRVvaZ/VxWrSh7uDgXPpyVWRH0R8/s58HOTr6xY"
+    "csxs50BWOtKxuk6VTuRvZy/wDSfN3x3EAS5ooTaQ7Sfdsbki2nmA5gSZPdSmoNBhJRoenTC6h+Ji"
+    "02SFYLvVxhEpfwLyQjYuQljDwbO3dKYmW9COzeYh54Uy//YDCDwXEASKgCOD6oVh57qFPsgUGCVl"
+    "jMFfWCMT9GbMFG7EcRhrARqR5KsogjZuNKYgJlIshefELo58nwHx8HysVnO43RWKFBt95iBgvYtg"
+    "k/UB8CbQa9864bzAq2RXFpdd7+glb+JvY4igBBzOaxfUUCwPnYiU7rs034Iv8ZR3sQejETmyUKUe"
+    "1OHHtDo1f5Vgy52hNU4TH5Xeii83ZzPH16dG/6b//y9fTp80P9N4cYdbJnpfpqGT0d6/mDE725c6"
+    "V7LXVnpp+tyz8lMq2hLzrROzYZhQ07gTrzsaO8Ez8SCvRXCrB/VCg8+ITQPiXtiRu9FKGGBav0+U"
+    "ofDArdnva9lcpe7HIZaYk0trCwzlJlEpDULTZTpiAc7EMMOvnYtRAKp/d0b+zIAQhX6Fbrg9Xqw0"
+    "dPn34ghmsOWgjeJG888AN7oHrwd0Jt2erl9Pyb8J09wLhxsbq6PNMd7XgyY0zD+SKPx6X2dpcw3L"
+    "TnGXPzUcS3djOvU83fYlXccxZZUHpyMuJ13cMMEvBiR4CgkJzhhVDyXWbjyDg09Vqd5YdmIW4u24"
+    "YcCpqBvBkkw0LG+ZJikpX+to8ZyszQ4aVMg7JfaiJJX9HSRHCweTkdnzyafn7yL9PPj7Wou/1Mc5"
+    "6eJ5ddmiGtPxajR/I8c+64cG0Q83Zd8VzYhC22Ubu+M4njFUSoH+U56ak8vkPFIrSs4wU9yVAzJw"
+    "mryiOTuaq0S49qwFZc6O5Ply3h09dAatS5dKZg7Jxzyu2fasxVKd1UtvUP0Vk+GmL3rF8SyJmteF"
+    "0XHc0s8GbrBEw7Q4DPqYrLoC6zjHh6fi6RyLoQgeCBaT+PfIpGgwnUuswOL/2BTCZ6bLVe+8fM1m"
+    "CaSszbFBFpGwTougRXNcmoLAJ9R7x6ebkHk+bYm3gvD3KO1+utDOOwU28E1J0S+h86fpx+Fqsagw"
+    "PtPJ+mqxx1YDoOrGlXNySx20mxGlygluHoUgXmJ63AwXzajAZTQA4DFG95dk46vJASkc4SfHpAdP"
+    "TBKnS/fbGuZsDb2L6Kdu3Au3GwM4ub1js3TRakKqfOHEhjGAKY53pYeAxg0H0QXmzRwWAWuylDOj"
+    "iBMo+IbS8Y7uDsFCgPDuR8xiIC9bINKk8ZEiKlYVj2cptqKMEwlrnUHlUnXw1VA/UiFP7oFGPp5k"
+    "dHtbGd0PqhYXdsR7NkFZEyhn1esvSDwgnHEkf+BYxQUfs+xJApgs0LdApoa9pEGmk1lylWS7mM20"
+    "F826ZGCz7PtX283Ux/988Ppidn+mPxtZ7Xx29aRPNcKBgr5fkDNV3Ak02SV57pC5puJTSPsgroRX"
+    "1idKOD7xxoezj7UyXwIFa+w2nxuRDaDyqGLXBGViZx+x8QXy33L1bMDulvaCRYjfaxb6bEBJVGga"
+    "Lo7nbrhXRAcsUeTE/KdQJgmCoY9MT2tOXmcHXnqwePf6o+v5e3l7teN7u36oHqWm9Vxw8BTt9dBv"
+    "JL2jK95LtJf9MD8VU8qPPDa72ASjc+ZB7aGVMguYOIl1vyFPUomVvTM4L1ngYhbZHajfFndLSMjx"
+    "7DwomYsYcgCx7TEKqNyMQkehwT1Rwe4uu4AlpbynFNDkSRIxReMt/cuw4eaV0TVHoO8IJqyR48L4"
+    "RVSfN1MZXm2MlYHG+kIDaChxX6MOeZSA66HK6LG8da1L1/74vp1+9pQbf9nU5gPtWm/xuGR+8RML"
+    "dW23780RXU8Z90UtKLO7em53akYiviTsNbRnluLPvcJtiuAB09mEexzaRgCUVeodtiHB8MGuwSEG"
+    "ZUgAdgchbWzv1HbFCZN4NHKcqalzTbbmhqSrQ3dsmQrvosZV3PgYWFkguAwJGNPMecOXYQx8BZ6i"
+    "89RUquaQOwZEvPUtws+fWYjBkLPU5e81WJDBTbjr3+CmvEJLQp+Dc5cMsulVE3ONgnhUhkLDhklG"
+    "sxF0Qqvk3bMm7AIpEzgdH99i7497NvVslp+nuSCz0+px8xV9r40XJQTOfTj5Q/baZT8F90LJ7ceS"
+    "XUDUWehRuLg6alYfNjI92v/adtWXClk3HAyZUaFiIzLzhZlImv6OHPQaO7MS3tPiD7qsNgv1+Q4U"
+    "4T+riVEX6FXuwRL69gARYWxcLJJIRN2JBmM70w0JN/e+CHyWIiMbaA3YEynykTwQfksrlj7E9dYF"
+    "K66oos/sQg10d5v3BljOJwJLh9pLPtRTeYuKRt98G4FKQdtqHLsJX/hqD9J9+6nlUP4ajEWPYrk4"
+    "lCtwP1wt6Rp5zJg3pgt/LByyITO+FlgMYe0pFd1sNTRsmr/q6XABU8sKdSuMUbKmlfbtT14kt0Ht"
+    "xYC3sj+sr61Lm1cHt69+70T88upi8ebfVQeGTsD2yW/OpqO23Ed6jYizho4KtUvUH71Gu2uWi2xM"
+    "Vuq9Q5+ZiLD5FNfRUZzWXyQ/ddJJJe+AZBSfcfnTOkRb8Lhv+FDJs2bNJGlrxNJEH/NYNJXQfHZl"
+    "Qxwf5GLDZLQbAka7uFZw3GRQeYFZT2c64X5yePHz36hepSz9A0w01844G364Hqlq+l5Nt48yvJr+"
+    "W1gG6YrnlA89/2bHWhzSMJAx1B40Oeqa8rD3J0t4HHrzANGtkupzV86s6rqMxtjFVuJcYgsFiMMP"
+    "20Oo9Z8BZBkUbSGrMiY5VDzy5vSUWHGaGwyX7NE1iEXsJyGAyRAnOMcuqILSlxseCq5saBP59x2c"
+    "LS0Wo8qfTYbBDwSHCsothTp2LSpiOsq288U6cF3cH6xbS5/Xj6yZ1/nv7dycfTT/TH42vdjgniIe"
+    "+wUSU4criQrJ6uUZ6TmIz7mTs49GDDnWwc4oxbMSWbmqhgEYbvoako88XMY7+N9hGd71xspM6C1X"
+    "j4oEP8oTqXDbZDWUL4czzWsiixtfCbD6wSICUilN6cglYqK7K+FjP2XGBysrOcIIMqoGijPqGiM7"
+    "bMurEJOsc9KUeqBIha2BDhKTRF6J39Bb3z8UP0WadgC3Xw+EJO4YszsGIyRnKDF9t0oFfU3WjUy4"
+    "qwqjbqxMEb+Z26oCQ8SYjHbHqWg7PsexheXfM/sqF69kWnanReR43IooVbGvEzznSDkRYhi6HZr9"
+    "2nkGNxw22XOUuDdDpUL2bAgZ+YBRthbnCwda93P7cnHv+ROfzwqfHRYQDl6eRL3MYijl5F5unbCt"
+    "0rXDqfIUl9UiewIzM6sDT3jwnBRnAMtj7dKRFl+QNXFn8qK4H4IwCpbwrsYZJi9IdYWy9Iu77wgW"
+    "wDxQ8PxnjRqAIW3cD07ZsUtqzrmpHXCNGP74Wp2Q8fsvAypqhAuy0Xi7nWboBq8PChKT6iPbPoE/"
+    "YOBlKaKKSLcvTYNvGkHk64DDkLex+bwIVMXd1Oil197Rybt+vCXxIwJcn3mnB1ioLKuJ7T5mh6pq"
+    "XZZ3oY/Df/9nx68ER9WM/WbUTHLh186KQFP4Gt33LJf9Ud6MFyBhvwwGFRhy3etCPukHrJTnxaPi"
+    "KG7no2o2J81rJdFszmrVJP0kqjXnLAgtn+o5+kIJH3MCoEgXYuf5u62O1gemZWYVrastLt2uLkKn"
+    "G1kjUtdAqpZ+v0b/P40eOnvzg7P7s/GG8S77QHqlu903V4HeOvde/xO/1zqf/r+OgP81zqDpuX68"
+    "vLM93EPo/XfbJp+FIJjxuLMQbsys7jphslLYOsxyHLLlpLecp6FMo4yYzcxyoZ25Bliw7JWw7JKj"
+    "BGwcDHB2ZYlkE0kxj76CXL8uvpks98kFODkW07EAdDewoYe1k5LQJ0yxetajMDcECtRxY0/YhRiz"
+    "M2PRfnB7/xgeA1genYRFfqTr7SbZefTu9dfjkdbp/quIE5hTmgFsQc+1mfSJ71RNdc49s5yffcYF"
+    "DmF+Y9eDGHOSfpGYOSBOowbv9DJkJGipHNlxjfI9NhTlV5Sbb/4xdwZ87rafKUOlY6c/A3+bscKN"
+    "K40Jvb00QVLHTRhPB0bBPBd6J2ywxpJAhzTH/y3A7V+InN5h28zd9UGLGvMaPX2swefurq+qrA2B"
+    "KPTHDwDHUlcPgBXPsUWnxFak7bM/insEssTIGyjl0/pNgKFljk4bO/SyC/Bd5yOX7MLbwXcXr8Xp"
+    "gyG6HG2Mp/l1wVYutGTCNhchzNASsH1tBpd3w+GtILAw7s4eXgnTM84aGz+QpL5V0Gnz4zjtUYj0"
+    "XQvNBwrzJdHFnIuNeo42sBOK6eYRMMCm1X5cYCclmG3QQ/r6d0y8wYrpzoDGJFrTiSVafKUJd8wU"
+    "oz9yImqmCMZ9Nhw0OZqYUDBhUxDwO1gotsI9jZwI7RRKq7fYbfZRe+1ZardsqzMLJcFl4qNW5HKE"
+    "QOvxOnHP9GDlu8IaU0WOhALjVKu4z6ggCQeVXGy3aUB8M6SRfWwCtMy2GP0dEQP+e5SnCBUP8o/o"
+    "6Ro87YxeTDrajcwnMh/q30nh1up2fHt6d/OL2c/u7z59NTvYhNz3tpQlMs/s3R2ovija5a6us0VZ"
+    "QHrAt7YjW6lUYfRAV8ELupcnxCPr4pJvGF5kT9HgBKHY2H7XzwEwWLIG2Wd7uLHuxmED8jcIkwEY"
+    "vB+dhFhlCxWcMMruVUBCX8sJYdomMPdc3V4sKGrv5SiJaz/9VQz8/Pf/bk8fP3gNN2E95xD9CI3c"
+    "77XpXXtdN9vSqzTF+v3+viXZf7M87rSGK7vrra5m8L7Fy8yFjhFYeSEDWy1lEj17tCYwmYZMbA8q"
+    "LFMyeAw7DiPTBO6YShTuDzIjzGKY9hxCXeYyuE3eOQjKlmq+m0F57E+RQIkQE9Yha27Kjx3nbEtD"
+    "C6bkpCq+A6OY9xGUdbhNhDuCrQxzQtbB7mkyQaruwrOicxZZWvguIEH30BilD5XbdW3jl+MX14/6"
+    "vpV1rU3V89mG7pVkweT7rQ//nE5/CjGfuE55oqrTxp55ueibDNFA++YcasOhyqPfRxqAj/k8wmNO"
+    "zTZpOFbjAV2mzl3F5VjhUd2u9pa1sVTZIFK/OYLZnT6MbvUS5t+hg7fI1N7D5TtpIvy2xYPNTU1p"
+    "V8ykCOUNeDbAdjYUMsLnIZpVzaYbcUnIFlZxlgIZvk7F3lDaldscZnlYUWY1tQbM3bKInDUGzWva"
+    "DIKHDHyWz7GDn6Ssqst3Qlyt5mlW1uL8jCWvoeDF2sOD/qt8ItVO9Dctkn98Ee26CfMpczLr0I0I"
+    "+/fwztXFreg4yc7Z+rGo0DSzdkXT3JgXVun4ROu48D/Go0cHwVT1fyCG64ipFJgFkdRLj0L/7jjd"
+    "CNTJoFgp+1QmaxwbNEycIqnSq61M3c4UBp0XQgDO4Xu2CBrwgJO50xg92wEYyS5yC3Jwkf4NZVml"
+    "THPRRVCmARJUaeEF/J7gjYvgbPmZqqk6va9sQfrdc4xq+6iOC3RVKgQJ3tmNIBfvwQvbPu4tdATX"
+    "uDn4P24GKzscJmzJbt2LiS77aHlYWh69RyZY4dgo6miwm9S9uiE72BIE/bI+W0/E3ai1jTsLX9Tr"
+    "tRLlmuIOvWkwcHm+m/fvZs+j+fvpxOdcyx3qx164n+oF08PBvKs3P8Px23WzJf8UydBhOmt+gpaP"
+    "hjkfYYRy3yFd9cJ7WY+Xb8Zu4ZgTLzwaqQ3tW4wca/7ZeBFYjoxwYfEWCpgKrMgLsZawg9yYE3iM"
+    "2CVfgZMG3WQSWbXr62bWJRrFM+J7pt52enp2cs6G7CO+qB6orD+p3uNKjfnqge0z3n2xnfUsl1+7"
+    "+rmq7Hd5X/85GbPX728uXJ5Xar905pXGOscJFGkR6j9OwcH4Yrj2uMVx3E0+McJMt7FIKHsUixx/"
+    "cWyLiYUvgzV1uWXemwESrjr3RiD2jYBp74sBN+C1RM1MxOm9F8FsNW6Np3ylnLBM06iqMUlAz6S7"
+    "VSrpfiSKlgJGBKqVKmm9uLKhZZYc2SjWMlUfAzG5qwhWMpgmQOdBvm/fceTn/z3hfTLw8/mm6tnm"
+    "ve45hKfIhyhFf6eNOl3FVyuptFL0Xx3yuJi09u+QSYNDEQqUO3W6guyE6Ms3nxmq/+oXvYPKSSoD"
+    "r62EDHzSuK9ZohvBCgma4dYkgLO/h4b5an9Bu2QuyAnNKRDRGK4QcmdKjNiw8j07HLAySucM/9GA"
+    "r8LZO8GfGnKxm/mZFqFYvzi53tsnUwxB7iDqRcX07GCtethZAx5zog4zJkA7XjA8tKJv6PfOwsTY"
+    "jZSIQJA03povXvWNlYwsIwNcCeSj2TwKlYshAAao8CR1t7F7aX23N1wUs/i6QFShpG7lSDjI7jX3"
+    "aczEG+W7I8nuaBlwN5cnlmjis+afjEtBA80Fgwsapn0HfjFS0a1Ho6AHeL2obuXFxRk6WSYRuND4"
+    "9xyiAsEJ6vNhau7TBg3N+2utNZBwfwsr/0ZbEUu4Uu/Ax0dkipoRO2vaD66pD0EQRjFzktefQ7lC"
+    "73aZH68rrtEMOSb6vbAL0gkYx1FYR1Kh39DSsb4ZPPsZey1JH2FA/Nwia6A/IqYOHlxVcKtY/huL"
+    "MX1RFI21EvQ0je+OovxNYtPDA7j1znHZcO+xkFtWiMgeaOfu1ZGrAwAyslsrXSrWsYon4EHJycbV"
+    "wp08+/8WYOlms8T6cOM52dHE8Pbn0w/bdPnk6fPrqaXqib+XZV9Tcv3NQv19LNXxn0Wz24BRPd3N"
+    "6KntaLlTbJLpUPVOiFpYi2FR/ZKvwQX9AupBU5NJ18+yhth3/Dw77TnOCAz/LGSDp6IuC08cBEOu"
+    "1iHLAQ7npQziYFnTSfytFptkoDFjzVz6d2GM60qdy2xznT+cX2vYePnr4PKlg34d33AH3ju4al7I"
+    "/RIZb6sPl6/rvW49vk3jb+t+ndL3qPdHoO+fL8tu6L0BAszzCu+GUbGidyhCESAwbWM/94BNFAIQ"
+    "Jfpn2XpXY9/oeogkUH8jhoSQRKiPLBI5rBanQUPUVNRwdl+mhsbwgPfMOIAlsOhqxE4VeIVkZspY"
+    "rVcfGbZHVVrvmJT4+2TsNUPmkIMFI/lBjALOhE1ZxpAvTUwaZjY28WYGWmoFY5Wr2c7t7/bPr1vU"
+    "+m9/SClMPp6XSgq3eaCQWLnG5REfXS7YalwvUbLqkzW2g2C0ORqRBPK6NCXSKwZswlpNbwk4ZFPC"
+    "WKHxwaqunwqIhy5CNZrNZLeWsI3QpINuTASrn1BrQFfn9snzDXF5Ai6mm9Q3UsbOy2ediCOdSDna"
+    "tBpvBae5Wbp/jRyaaiCi1jI+AKvWyjdLTBXGqeYT8GNAziERo8rS8XKPA6NqTdZ0Foymlj2m87XU"
+    "mIVRdAY5poClS/Q3lMrBDxb9DJ+Yqfjtd0fMx/0D0TfnXglt6PGK/sXTg+vnUmw+RDRlN+1lfTer"
+    "X22xK9aFKLybcKcTwdgBSN6AUBr/VXS428FwmS8cFnVZf21LbSa+J5sYoXMsZM9+P5OeQJxNxiB3"
+    "8veKxQZYi0bBaPomkWGM+qlR1gUJ9esPSPpHXs5tNp0Sfl0qG86gAPB+Zdt140ipRQvdM2pVcDYJ"
+    "3Wgy36gJdFk+Ete7hBJSkAACAASURBVH2xZGL9wBu+Y4k79C2QXiyICIZN9l4sxUfW9VM+9Uzb7O"
+    "KFZoyqMza67srDCxz16DaI7wpFEfb0IpYySiyHX8o3QQEMNDaSir3wFIZ0Ghd5+7yvqikPTYAgG1"
+    "s+pu64Giw860WYaDyojvUUEbMxLelBDr3wJOrh4KzjE70U5eOzzfSf//nz6aFOZayON35mk7dZHq"
+    "kv6Z3bkhOG7NQjBtZjbPSw6TPXL7aQp1qum3niu5RSlnLXReXuu4pTR1cI1sWi0NnaSaewqbNjp5"
+    "PHOgcibc51uvMUocssEbY9FqydgC3rYqXkJ1mJ4ODyyYLKypLZD65bcFn06rd458GjJx/aF0P6Jv"
+    "EueWBu9Vh9Pf8mdUH2+8i/rq7fp2P8ZF4XbMGH7O+T/316FzB/2knGANfw4mB79vzO1faFbrnUzZ"
+    "SMoz7qUanSDKiv8mX7kOGm04bzuMRcNbtvmV5Q5ySqQCnGHqsENcBJOu9d2tfsNg59GZtHy8M3AI"
+    "RtvtKD5oCRIKeQeLlfVqzUhrW5Z9hh+2CAB7ASzPhdumRrrnIxTwCizbMfjleaq2/YQwU5rtLrqj"
+    "brr6ef3/t4+nD9xXSsJ8wPr87N6p0WYpc8qyDZLOoi7mfyfIgoXOuBLj5B1+wh/W0T8zAYCW51Vu"
+    "sK48oedosncxPpMsGAMw5mU9JtQky+dbmtXefQ4XaY1RehMMl1su0tDiMIv+OQxYzOHd70ERhth/"
+    "GQ0wfhZW1c1gqDmDok3ftwzHxLleBGfXM1n5Shb2Hb7i+s+VpLxSLbTotrV2zuV8Ly3A+ri1QIfm"
+    "+G6GNPRBHGiAT7Q1mO1ZZ1gI28ORFRCCQFlLlEtPQTX0RR7z3ebJ7rQk6IEdubvYe2vbGmDJEDz+"
+    "RSHdvzQLNeDqEHbPlfNA7O4nEXjvb0bwfZagAagsUTtyw6VGOxEHADateNhQ7orMA5mDco8siMTQ"
+    "s62eA1uWhuYDd4OgMdJrJRZ94kbVN3yjrydwn6LYMayWOHF7DK58eCcuyg36RjNb1tT4dMWTpgNa"
+    "fwYj92UQ6WgtI+06Bk9INPhVy6s7MO/IQNFg02+ehikK2rMyofPJIhN/iks+tP0ag3AuCzmUdS8g"
+    "H5brfOw0fI4in8xkePivgB217qXXxIBDtX/BrD1UWPZ/W0weAVmP2BrDacaAyUaEtUMYoUrFfcXt"
+    "SKhjw+p219Z6fBY7vXI3hGrgSL1zCzANzq4fAn9+5N//D8cvrHf3s0PeNxD51k4KVf/D/dRtsaTF"
+    "2pm6/2kReuaux+naMU24z14OMZ0sTJxz7IlBDM0fkmpih7fEo5ZVUOFhu0Trcf2n9LG2KKbBDEzA"
+    "+c+r2xVSaw9LShJuosBGfsiCGx5ZDLngDKEf2feI5FgwyvB+GDw1uPnjz/+fn5OdSbcOMBe8Bd5C"
+    "37ojtcx6gjvcy/qQnfV/5N9b2T/IwBNlzHAWend6erc60cNJfqrcF6nk6jSW15ukOcDGYcV2Sscd"
+    "aOjrfncQ1QxhfRPchYyWJXg+SgIM9QxECnRLKWRxzyTEvaLLC7jATfsqt1i9X6YWJhqi0qwu9Jxs"
+    "CglVJkCLZd8VC+y9OQkUMvvOTE58wSr9OUMYIzh8IPPfkM0IXDPKVnxWfblT/W3SfHz6d7J59Mv7"
+    "rz6fTh7UfTraMXPvnp4yKOgQRq1Z7xOMWPHvCZBaPnQMdoxlUeZtqSCwCj7VTvtpZyrvIENcjQet"
+    "tpWmVc5IqlXtFjsyREwKLotRInQQ8ocetOX4hO0m3VONYIYKGiQ8eGaEC/bXDGtGYd5UWIXqyKHn"
+    "zkZt+pWGEOyxptjjOvG7382HiyuyuEDttWeM0imNS7awgu7TbLuk5t4wxoOddbvIMHfcI2GumhH9"
+    "zommk7RmCYTbQq0j7WFEScUvoio+KMA0qgKzxWwEWl7Xq1eqb/CebWy70L/Br2LmzWK52emfRiFN"
+    "2apitoLBxYjHDLH72IW9II/u8ypTnzwgG021eN4QWBMlyR84Cg5gKL3zvyffWMq250uG0tTEg7aH"
+    "B0IxqRBlV/oAPA34sBscJD4yPHQmkZbA86EdZmPHjpJJ0vgc57kQEg+vRRlIWkYtLGMF7saZ2WFw"
+    "cLieZpPcT5QQjAnVg+lSOgMdjB3/XuNLoSVKeRcYWtwwtRyfolMNij4NtelbSuxpQIoe1TIgTolX"
+    "RkLAbXBOPDQjtDVLllwVWaNuhb/boO5kGccjaS2uwP5W2DlHmxpXZERxa7dC0V8G188ftKcMnLq1"
+    "40makMdz3Fh5auFjGY9oX6A4sVOV32KO2DCQZmJif1JRVyxe3K/7Goq3R6ScqT1f3pf3x0Ov3jJ4"
+    "+1yDvRlWMWhbRV+Dda+PH/dBvpWensAgs8X/FDb+nOohe9CSI7+HYFpZjEqCd8LKQpZ+7NxFl+s9"
+    "0lp7T9ia3UlX2Vx6f87vQRBnlCihFMOqhFD0uBJ7Kwkramy7Gv8EwyViGRlhF+zqJGsGEDOCpHln"
+    "rhby2aN0+ePv/1+fnFT0rjTfSOeEBN+U4F+mpvbbj7b2d+wPhd880PWPU/CJU5QB663B5ebk/fn6"
+    "5eavbfelzHbxm7Mm7VmgBqhiIv6qKCsSSjDq2ojCLGvx4DISSdMli8adf9oHUFXBIazxnTh74hE5"
+    "2eW5xMz/GdOFYMkfEXAzCkNAx5EoTIOc4guKCZITuPry2suMSIEJtRmgcYZgBCSkctyWqL35X21A"
+    "2h+BQ7hTATI7FvN+EYQ3PZ+nw6vv10un/ni+mD89/qit1TzVGiw6vYuDoM5Aqdn6Xj9ktsEW4Wdu"
+    "gSprS0TWmX6KcMDM/rij23qKiPJZEk2CUBir0igLDcm1EY4IW/y5VnIrYd7FBq7tqVLS5JAcch7l"
+    "8qQscO+xAFEyxtrnNgjYYBtkPSZQz09DkAzFVISYePdOy3b8F+RWhyY4flVbxL7OYKn/Fds+SNVR"
+    "CxE9slUzT7Q+nW3WZZg3f1G6Agap1Qbczacst6zjZIhDayH0uhpdjl2KizLUO7gMzxtv5O7UxX55"
+    "6IwA9470IdDu2XXTroPNPvmKfW/J9dB+uV/3vOfx3AwbxajB/CgW+x0w9CeR/gV49IJ+mDYTUTCw"
+    "NaQO3H4ad/RJKh4dO5ggcPXwYhmpqDQR3/muZDcq4SbvIWQnTyXB2xG5weqa87AcAd6kcG3QuHov"
+    "cBdK4a5pbOLCxYcHK1kNVn8DKgJ81iwEG6ejAAm9C60/1mG9KxZR4+kz07eJKD5ue2CoPO7heysA"
+    "AUDbuwyThKo2dgki+MZR09UCKsYHrrJs+HxnBaO2GIyfWxfcr3VU5s7YUuC7muldtUfOYHCIxFIM"
+    "dmP7eUhPEN9K6DpSRLvmlg2x9gIuOoysEVoW83RQYmL5AW/I1xJPt1NscLLxZfjCWcRtBazVfbbD"
+    "/9U33u5fp4+uhsPf3dx0+mrx6/0OGH6PQ/hWPJcaXuRLcN+cUomgxRl2LpFw/YrhwCBJmGfTnrHL"
+    "vjTzFKOIvwCLkWkCXWJwawjZAovm57oPP7sN9IL/zns8UqBRNEXGR884Xm5vfikl+kuPCBFHX7RA"
+    "hBJNHNPhsJ6mFc377TOjKky5UORNU+my8fPPz1i9OtnqW5CfvuAVqc0HFy78Yem39Mu1+l78fUv6"
+    "+tknlBI8Dl9t7V9vlPjg7PdLMDiwfGko2GEP6Wkis6jDtVCzuThQIH2WlHL7yUiU8ZZxh3i+CxqT"
+    "nBUNqDDjvxmsI4mI/nbmQYqGVHj5lIQmszkig9InoM81kqc1q253BwvFUReusrChYoDOBkQzLwYF"
+    "mWIMCnpEfcelDpYN+RCVYWqZSovj5MkW81rueWRngoamFlzKRVGrdXrnRsdXI23b77xfRzLeo+PH"
+    "qkxdzL+BsWsXshJ4hLbsFkIuIZPcXMfikPH3rIzx6tthDR2kcFJD7SKmnTMLMwnFCeMlhFdsi8Al"
+    "8otPAcSEu757cFtY7d3DcFZvtarGPjkAmh52Art32pwzDbFS3Dy5ZRJ0PIssJ2fxNubC7ibN4QW5"
+    "BEC3YwSC+35oQG3oyJPywjUqgtZ8+4G+xKgBVm2we7QvsqIEVM0c7efKY0T2Kbj6/pqzEE1B3cbs"
+    "MGzHH6zJO66GiHq/mH08vN8eYpd1/tY9hLs9ZHh+c6KPShmm7qs/MZBzyIqXG8uKBRNGi4AqJ1hx"
+    "sDHd5Gpvg92DDImEaEjEedOjikA/YBKgfBjCJZEHSnRpZFBcoE6800MfoKiPhz1U9XCfvqIPyoxc"
+    "aKyXPALwjdUnru+kBjoQo+Zb4qKRqdiS9nB6gb+Om8GBNc8w+78I9sV/CiLI6xDLX+ZsAqA7lCtl"
+    "MyWZDhI8pZwOSqHvmB0ml4RGxZfhCRCi06RREf9FFo5JRK2OWVc1vMaclJthdJ48osPkROYdhEWr"
+    "R5o6zrUYzFbFust+SXIIASTKM+VSPlrdPCScPiK3+2hQJxqz3oTxYXKWmeo2Px5ynIUxHP1vpKnX"
+    "hptSe3Tqbf6h1K/+t3T6fH3CGoDs5tlkeq/0ayJ9qONbAYRzRuVcwffadd8FOuBgpMAVt7sW6Cyv"
+    "W1P1VoEoRexKXMkuXDpP1jI+lJFHml3bVTX3MVXF7/LUrDy2aXl15kl8cnWB6U9nPsTt9LGjDrBE"
+    "iJnBCg/pRoC4Bw8K8ofBX7hInWw/ovul89P7u4h/hNeHc8UF3oBze4uov7zu8D/676wX+b4Tp+1w"
+    "ed39Xmt2nvHwMbn2zPX27OXzz+4Ohwe8w6qu7nUQmLOQ0lGsOYHzwWeoBZeNYDFWUehom8SUqpBR"
+    "9peCHpTBUfAvwOypIOFYpSZESMbkgtRbkCLI1JnrGWvIN4F2kzW9nQKPGFDo/zcxlaXe4FGbgD1m"
+    "lDc8AF3bETkSn9o0JibltcF7Alk03isjszE3gsvuR3XnKiRVnwddcVDWNbjqaT1ZPpw5PPprsXn2"
+    "nK4SpdbMgT6Dou8otNEvt5OiZIXpDiOirtK3fQpEu0VC2x523bR+1Vom9O+JJMPvzlD1RTvzkbvk"
+    "Ue8+ZAvWfupaz5sJHi4mlk22VbKWzEeNPHqAsfD12txvUuTOMLdeDDDZ6VOu55kxJ8BmsgkCPd+s"
+    "1RWLu0lBhgTjoVPuqF9UCB19LEThd9FoZXbVackRFNx3cmDcHgUhvjKGEfV33B67qTJsx5yUoo+f"
+    "RIl9s3Zs2xBOD4wRriE0p97Mmx92r1/PatE70UJTL7tseLexc2R0f+uy55cVqt19MZt1yWB1d6to"
+    "gOkwPQ/CDdAeg4dnI8vdy7eSgXHm3vTqBad+dNf0CeZkzshZNHk7hn8JKNIneFkrBNFNEf0N1X3t"
+    "DZV2+8GGweYcBLR4HXAwuLANEIXkApB75vrcRuTRZ9K2A0uWauDyb1wg5bjQu2tra9Zag//KFjLT"
+    "9sLQNYFJJL4Yg9qBTd3JQr2I/Cwmb/UHCkyppeTMYxjwnalW70xPclTzmExil+Y5dOSPij/QUvde"
+    "wQzLJDRPwXX6A07dI6W3mg05LgWF8BkmYhTRu6HQFRiO+UaFsVw+t+iYx1wSs57b2BoQS+YM/Sy4"
+    "HViOrEf9VtN5vpq1v39d90p9P/1XaqCYrn6I7UNmuxrQV5Iv5jAW1kF8/grZTXUKMPi5nUmfERG7"
+    "DJ+pJJWkpdW9G6rnBhBmxtYWwTp4iphQtD1h46fRe0hPA6zaSONhVlUUUZWT4K2lFuvREOXelQ4U"
+    "HA3HazS+xnyKWbctEIsVN6OdPDgVXRp0lngI+mn3z58NGHZrzZ7bUHaPG06By/DYPTs34/ctvx+7"
+    "m+Wfo62N+Uej3Kt9n0NnW+nmX7w5VxRn/6st3eOX/59KcrvTVRs6wMZHTRPHvA4xtK4zSPMRrHMn"
+    "iaZz5DxIldybVzzdsZFXmMYWzjBG3RHaEHMcoYZ50ypZQmjbZFgw7kkRADuKXXkfUUA7JUwhWBN6"
+    "baFjGHP/Tl3uXcJsHCCqYlhgzK3FSGqW6aHfSpycu8QTNO2QOPtdsWxn9CsKmjZiftmC94hk7HcT"
+    "ZOvuXKB0G3sJxsXkx37zzQn41/OX14+HC6tT6ViKzR/9JxGOhHHoUPVm+eXaFhp9pwzFVMttwWI4"
+    "pp6OOrOHY7a9W+rZN5o/qIuwITorREW3i7lbur2BWuHD4Tr+uE2CwbP8w0510OuuqmtP1tWUqxmT"
+    "KCDU47DqCQzYas5VEJTkLShWBcMFVr0os8x0YSGwE5+0c8XRezd4UHJwkEY+uIgS8efGzoBc12We"
+    "GMj9U+xhTfXIPGAY0tRlJOLnUgMQfTnV1UiPyoYHQakW44wszfdUeJNSm2H4TBxaXzi6snJyfHz+"
+    "ha+xj20iz50KMoHclXpqoR6Qw0bjudFyD4IzoH0pT31alucHhzMK7Fje5zqy5m/hlLQ4Lk3XDuuF"
+    "KswIEoCzsvHtCx7OS0qO1BNosmpLyZT7QFD3jD7lhtXuy0jeLNwiNDxsCxXdIlAgsL6NiTy/nkEs"
+    "hza13roMQ/VnSVnc07y2PTLN92QIlMfjwecJjUKlBG3eDvn8KOb6gTGPBX/SwqAnRKkYWBqPOmmT"
+    "CkzR//Bss4TsLjhG1F1v4mZqPI+/Qh58BWiK2iVB1sY7c/ckp3m1IWX0i25MFon6Ye5WP8bN/Q58"
+    "zlPINV+hftg36U4FumJM05ci3v93CQ/LmYvjy6O/3tR4+nT77iwONYzxTobaz0d7U9L0vZaGbj1s"
+    "vcfsm8VecwhcNtnv22TepqmwSOzenLyrS+SuYMWXjgw2ZFg6192ljtMxgC1T5PHrVQWg3ygnMQeq"
+    "USUdKcxF4kSjmy2B9++p9Ku9+VcfY/nHy9aYfdISnBhHkx3Tpe3fv0y69+Jay7O8pvMnvjge4VHb"
+    "9Nw9Q9RlimB/FbEq/D+zo83wL/ncl/DJ3f2di3LthjxjSdnT67d3H2+MO1X4OvMUSO6jHDQwgLgZ"
+    "ra4kN6nzYKPS5ZJDToBI7izZw8Y5bHKMiMT2bKflypatmKGZ+aFHssFFKpKaAqiD0eKQOtYhK9gR"
+    "fB5kSBx/Kdk1sLPcjKEOPYoJQx/9mQpgkwulLuMq9kiq1Um8cm4A8FyceW8HnRgo1F1NCsNPaTUP"
+    "AC82y6f+vh9B/e+3L66epfp/X6ue7G1KLjQo+6iPfggD/vYRGSq3Q8l4PYFf9J58UiJ/wLEX7PsD"
+    "ZFVNkj/d7gQjU1wwfeigR5EfB5ushC1sJoMkjXIIrLbwWPBrFFB7FD80DfQSEHLmHUxBjdb4NRUo"
+    "pIEUwxXtdnUUh5M5p7IecCZCjIMQLH3X0i37XUbkd8ZJYFcBLq95CMq0FJbyY7kzl+rm7lS67Rrk"
+    "kGh0YvwXhQWdedqI+/xDHaG+58hn6L0CeAmvHcJV2/uYzjprqb7tHx8er5qL7B9mfXf221PxbZkg"
+    "v+IeaCy3QsJrj9kBeScNB5cXnmdjzntkJ+zeLBuX5OSLz+YSpPQ5KmIfqgkLM7DCJpvzRuDu6zYA"
+    "o9iyUJanDWpfxFoM0Z67CJ29iu+jk3I6oT+bZE3Q4nOi9a2Q0SLnt0dO9FA1fcsB1LsJUYe327o+"
+    "g+yEap6A5AcLCO7qbTedsJ0s8CwQfjiuMXFhNwkMN28Gl2aRNeFhouwjzr9w9CemSKbea2vsEbVi"
+    "8sLKACLxokHA2x1osrlXUbEM8M1AduKsQVyCxszANVeX1jW3Mq33zoI+1ADDYytDW+oUA0URCyzy"
+    "inXXJ1D7si5hfkACERro/2ZIas/SB6fA3otWAM1dsjQNktFrerJ0UwaBHRsEVa6FEsuLbYJXupuf"
+    "XquY4zOqfoW9n64r2700fPzqf/+fGz6YPjo+mnJ3ruTjdub890i65eFCQPTLc4o0g9EZMeNLDYI7"
+    "jpFHc90G3fUE5lCRKkjmTBgHsuBLp8KDL+Ast4ktiRsSyiBWzMCPkWj11YFFlVs8sKE9rPox+YL8"
+    "JeZNO7lS13O42o7VTc8ojBx65pavrbn3z51V9uLy7Xa/1ObsL+eSC94Me3y13lNdU277fZCv1tht"
+    "Z/XQf0t637us53IH94cfb0w4OL03tHekbLk7+9pPkQhzHoaRDy+KO0rxjJiT5G8OCkTAbGMY5YDk"
+    "czCDHOkSYIirFxjEcegSmAgQPMxOaBswcxMCyePRIDFBsJxBRrx8djmvVBi84wZa6BWgIipzziBa"
+    "Q5xjogqkJQg5/YVdYcVaM/pQpGwPJhHjSoXZWoCl9Ld4zNPGrQOAe+5RI7wCZmU0ZX1A6Ot9Pt+5"
+    "9Ovzy9Nz1+9sH07OpY9Pvi0z+4ioX5lrswMm/gD0A0t/NcuWD6pL71GR8dqEKO/Rxce02WQGTeob"
+    "RrLn8KEIpg1aKSJS9CzyuUQeg5y4xi5mKDy9iTgGbHwg4hxKYBk0DfMKQ42g57HYCIiTFlSASHvQ"
+    "0r0ozbGIolj5xtEZ95Io6UQmUUkWIfmRQFMyWuZ/OXwRyJEvymaerLhzJ9EypdENCCWcX2S3HaVg"
+    "TbflLlEcM0FmDhExjfyJSO0S6QC8ss2rUZbs/ONdH8QeYvqADWsfnp5nj9xe1bm9OFqcW5H9FyBN"
+    "gPi2TFvbvvnWs84eEy30rGcmSjWy9z1UADgw7aaUMaxs8qleW+tUueZjHhRYzSjj04qWOoYehkfT"
+    "Wv286xWxkg5bTo4UCcztYdLjHS+lGItxcUYNHY7hQ+q5FFGXkP4mCwMrKxUYLTwYCObnc6MPTJwA"
+    "87DNGHbnjQhV5QwIfGh8xsJwOdSNoILGICBVXBkTAUI5+4sLz4CN+gS8T2VVwow7+tB3sInXedIQ"
+    "ioadQNvr7KMuwWj3ELxHWFF3EwlXY5fIMXerpvcNPWXe4zTJKK7eiNFSyY255Lv3YHI0tPkuZFOz"
+    "LREYnWEx3Bbr5yrOvrP5u3FuSzMI0StY36iHm9sKaPaBHK5K8TAIe2Tfn10fRSt6U81VW6f3h0Pv"
+    "39v3w1ff1Msqrvar3ReQxdtRP/EVfpLM+yMH7GU73A51YVTyzyGTrbbmwhbePKn/7bANc39Y6TCp"
+    "Pq02GJKIg7HAHjkvKvmYpTSjqlWFjKwjb7LO0KnM1RTDk+su9L2rbWUQM9hXz4SMsv/n1hK7aXv9"
+    "GjjJ8f5Lc8Xd7+6sHjvxbxxLA3uxsPLDxAH3yTkJ79JhJvl/dN7X+71uwDuj1y7+XjL/9ydfjs7k"
+    "pjIVM144PnAo8nmj9g8zhVLarICztiL3zCn7kAZo1ZoptbV4Q067iy4DoIK0jhLapUSI4Cb2EORs"
+    "azFMA9gCJa456MKlmOJQqoxmQXlFjGzeIFrSqdMVQEZMvY+AE1osWYpLGh61G8Ld/zodmLGwQHq6"
+    "VEoy168l0WWk3M5qSafEe9+tw38zknm/Xyms3m6+lXWtS9v/pSV+ie64DrTJiZL5hCecNxZqfMfM"
+    "yqvp3TOoXpMX8+XnLxrkGqIr6nBK9jfPAxPOZHQ7FANqe53ZHS9lAbCKtgNF7XLwwRd6k1ON/9in"
+    "7k+askw2FBkpZyexXJkY0v62T+MjRv90uKTbPdM+c1MfHEjqCqHgZovzR36Rw1Ep5I8SeJ8merKS"
+    "PsE6XtW+34gN9bsxNDaz7wQCR0MnYVFXzjhQ2eYQtCBHjQZ5zUx1gU8XF55DgWcrDKtChi+r/q7a"
+    "1bt766c7x+EYb92y965P4YpzMrLy/Pr874mwKuznGArP+Qoj2y4HHbsDBT52MQUJ4GyWXiNEYalA"
+    "ND/fg54FPMWzLnhV4WOm5IlcFPQ3KrWmjKAw22XOOFFhngSy9Z9zpHdBb4dBVRNtNJGNTyLF4BqZ"
+    "wAvvUZIDRgoV0PtqWIpG2H2XY7oevLmYQYZTOtQwP6Qo3rjz+pyFhcyFbLW4paFEwlUmV+6LPtFM"
+    "34LoEEaurnjCQjlDLVz23hXO/it2id689E1Itm9IBMPeyP8pPTIqa88MTjhZeyXqQwoWGVZPjwNx"
+    "jxKWCRAS5vrZRf2gSV0Z8geNEOXjtSZbSzJ3YJc0YQjF37qNdct07j+/zpePgxD7uY1XyeQiaAd6"
+    "Y3fD1Xf/14dXv6Lw8Ppv/z6dl0utVJDekFS/9SJ316iFyLPzb6LVPk/Eyd7JZRtHTX09XFUEjlt1"
+    "xJNYEdRbaGXfyKf5N29XVgROC3wVlSJBqXEjbyqRNtJkoboQL0Gkd0/8nvgtfy2rU+FVUALW3RPo"
+    "fHJwakjecmHAAGX4707dhuP/BAvjx59OThXz58cvpegd5Ee+QBWohQLZnMj7BvvR1/X5U/FM73te"
+    "NGXh64PLt19vTT/7g+fHlPj+VrPsiZdhWoo3GCLMcFB1wV0hjCKMOHvxXIUMIcpA1n0rDVuIx9eW"
+    "OmnuXWf9rluKPHLfhgVE9msbIMXslAQ9erQ8YqlfJ1pF2Na0goZ2gZqUTGREguQGV9ELEJsBnCRg"
+    "cLfnjbTjLL0HZif/F47iPrj5htCEImKk+sTXmKrL/K+mqki1WYWclcYpRdnHQm+I4r5U/0XPjxS/"
+    "0v3cfTr259PH1w55He8vxCmPj6XPKZdyxj32RRFz0cE2pu5GNc5kvZJOXx52w6dAKWsGVHQvQUkU"
+    "kQQ+oEG3W8ziA2+2rmT16C7UMVZUEcHhDcBiofMUYY2qVI1BedttLCTjeLcSCXrsYznXk2st23Ym"
+    "awkkYyNvgEqdI2AUgFu9gpZNqGjuGMjREqnOLr+b7xjKWd+5PRGscoOCQbkLNia7duFZfGKm/kmc"
+    "U6d2qAoujpY16k8EdOzpROIKDBWpvvDCp7dfR9vlmtH5ysD59e04rkXgT9evYv/Oz+3fPj4+kFZ1"
+    "xye6F+8zpI8//QVUMx5tBwXqBV2g0pmhtKrUKexukG5viOMt9mVx0u+b5yEl/kh64mo1EV1MRemA"
+    "HGgoRFWl8VCEfh1gEkNiET/SwIdMVQtnRAZwf9UaFtch57+yMe84m1FyizrZQtX2KC/tQzHZZ86k"
+    "SHxY6E2aaYEP+0LVKtEOy2kTjSsdm44skZOPH6bCV+YTFpceu2SuqDWJQFXkzDd8aef9ytH3783H"
+    "y9sLMCgLXRRL6jcQAAIABJREFU/tKOwbVP7LajnA2DxBKakrKVydc/Uk3g7Re3l3Q2HjxcvWP7/+"
+    "y96Zclx3HlGZn5Xm6VtQIFgAQlklrYlNgtTvecI+mcnunTH/tPnb9iPk4fLS2JBEBC3ECAQO2VtV"
+    "flnnN/95pFRBagltgQyUQrPTPC3c3Nrpmbe/gSEe89m68zbQAfkEamrhV8V0vlLml61RkWitgUoo"
+    "8LLk+NRKsyf+ZNGd0K0BytToovj5m4DoaDzc3h/vLq8Pfa0P3jrZfD3hFPq9dlj4T1DakrR/ltOv"
+    "bo/ikET3bYm5sT6LIeoU12xCbswcf4g+D6i9ZVoD4OjsTbGWF33zQoMoAT7EdJilluLJlaeJjW/Z"
+    "L27b6JbDDAGY/ZdYRVnrBn5dYlUUubjgHUiSVDMN13lGQjvbG+fOve7pOL36LDTecwpH+dQ8N+DZ"
+    "Podb/J8JvG/03a/tvExk9HB893jl8+/sO1tYMlb0J472AH0tM09vCFGRyMXTWu9CaMTR08Hho9pt"
+    "X4Z3mKCgNRZY1nGHI6agPhInNU7w5zjU7BGHnMUjQNoP16H9hnQum2HuNVeYnCawp8VRQTKg+N6h"
+    "EsX0ZNBKeSVdm8GGJjmoEMB3zNi0CEwqq62JFaF7GrE7HjbARhF73mISaPFf0U8ZZ+YPz6zr3h2v"
+    "Cpblo+G5YLtYdkacsEdGR20/uWtb2lnfoANpu9tme0fdbmtpQJCyiFXgc4Q79QAvZeE9H2pMc8jD"
+    "AQ6eg6hyCKy2jPlIIYboqqX1lrJC1nLPGZER7KSspshVIkIncLEhLyHNr8haXINseOCJqv+CknBK"
+    "IwlJnqGpnisI5WYV/gE+SbzWh1Eu2LbKIWyLQOV61BW6bihnM9yWB3ESdaCLGkCptHsflsZDLWF6"
+    "Uq9H8NAUFoXPToN+gO9Q2XjzbXV/dHxYV9XqLqwufFnNixvVzVslW3ZORhBgItw90ZeMJGp6Dx/U"
+    "SFQVOLNzZFbAD6lUvLFV/Sutg1QLvTqSX6iQuNQpfojka5F/LF23fe+Jp8Fobd+Y+1kM5PArD+li"
+    "1aePo38sQDhgcvOgd4sotFM1gE7CaYTza2LY0NDsFPgFRzdys6rg4Ccf8GWmilk7qMPP0FK9ypQp"
+    "f7vu1kQ4btwZpk8BMhv3+HVA7OHewD0ee/ERcFcKRdenMAXHQH1xj4psCgYi/8fkqkAtcVHPOkjC"
+    "TVcr1dv2BYFnnKzV8neNBDmftO+bDNUBypxJa3yCSD79m0u78Jlj7Gn9vSzoy3epOGLgfKQC/dpo"
+    "vmvmk6polHbcA0w6aL3uCfJVCeDRm/N7et/rapu4zct+SbLZ/qqeKt9cvDe/cPhgfPj/RNS2zS4g"
+    "c20mva1PFTBvzgeL4cRbiSY1MDPnb4PiUxtsqG2CEMNqm2W4yYVmlkSDtP2sXUE+9JhrugtJ3KoB"
+    "Icg1/BJRYkJbpxkg7vWX2ItvhoH7giFkLSzYQetQ1zMbM5ppMkpF/JUtlIn6ZsuVh549793d9T8S"
+    "UzXZzOjQfoD+4Tr1kEjTbtdn2t+EtnW2/HXwbwi+z/MngXsl/KAysnhy9uHh0//Nb6hp7OaTNAL+"
+    "rxym8OGB56rQ1q7EtHrBFHNEY/ntNN7Tv1logo7zGpOZgtMm6ZbnZOokrAMgxaHrjgpCT5CQZMFb"
+    "zGZ+aJydkwVnIWUVdPAKV3LDImOexJNJYVDdUJSYWt+LsI4jwUFp6LX6bCU39mTrMQGyzzcRK2N3"
+    "jE8LJG4tD6RJ95XOwcDpe1obu58avh5uYTfQhBv8wqYeY0QuYnYslrHvO8pFK3lmiaGnygxyrRJ5"
+    "/w1/JO6BQKcVI952As9nJAA8cbzhL0PFXptHUQsMHBAqTwSfqFVgSVBjucrW+MJRFuZBtEMUm3f2"
+    "TJI4M61qHjE0Drilz8BD9Y1CUJy5E3FQxs5ghP84Vu8uxUeIXZJiINKSgzdtObecK3DtsKrfnHRM"
+    "BAc6HiOTBy4xGfzouDVjzKUNbrbfvN/hLd9YZ7ppes8siggzWc/g+2Njeerq+NdxTMdZ5OfW2cJ5"
+    "v0VbWrx8Px0atjOfKYBZsWZP2bajjfT25kMe3AAjVPPLjY0njTExMNDTxp4YmH2ipPemik/FFpZL"
+    "gQ+pU7FoKENDKLQQYg7OhNUMq5449+DoKfCvhuUGyARpE7rNPSCbPs6I0Amb78xah/Nn+1cVBZPv"
+    "+WTgVebyrBAN2+kBxpX8yhGsccURe9ItAp2ze2G9HSm/rGtgwMIIhBjFm4M2DCnvrZBOUtJ55sFG"
+    "yV0tlQ2rKygbrBa+zyMYDxj+pogzof3eDA482twNqXNgS7YFOgDdsu2hq9DOY2X1xgUwdICDU/WR"
+    "U67zRZ05KwSehXH2g+Y4FXhdnkZTcBvslCBMcH8iKik4stC4kyTu3B5s4v9bDJ09EbsgVtxW/u4G"
+    "9JPtu4Mnx4sDp8cPdoeLIvIG3ylvqRe7B57Uff6yz5Q74QWniSkByxAEQRhnd4pJ01HVv7WoJMno"
+    "MAZ7cJJH/xC04NXK0zillCo18sXHq0cFCJyrQ1nfGoMXxNU2Z2gxa0RFsvvlXOebdZKxe129sAcN"
+    "n4iqutjW69ZqCuVz67c+tP9IVFWy13EZ8/D7i/lVnVk84Y+UW0MwxfIjPX/evApCf/OhIXvL9hD1"
+    "x9/vje9xbrj762uZUvAcugJa2M5xwaWzK+0qN05J/BxaZRBvHMOFVlZhhPan2zRo6xDgz+HEY85V"
+    "TEHBBs8rEhrBSKFrWKwan8lBCBEN7SENJr57Y/ZIA7MKaSntEENMci3fW2FARvyhQ3o8THOo7E0M"
+    "oFoyginpGUyJfP1C1J5ga+nZLlFcO9v7mO9mHOWNW3Ez8f3ljeH9aPd4dVfZZOny7wls1LCLDsZx"
+    "kihdnMNC7GUb+0M+alGcJLWv8lX2UQEYGuuS7YyUOHP3Nq0eZRwEORLV4PRYPB20/GLN1hBlXBUa"
+    "Ungm2YwbikmGMrdpXuYAejkboM+9PmBTHT0Xjmdf19Ekf3TdCgJQ5O56FFW870GsqCQXp0jRhYw4"
+    "42jZJJjPZ1AsGGCpwYvzhk/evWwSGqawvQL5S2EUn7JjYwMXhmT5WLvWVYH3ldrrWZIA62NjZfau"
+    "lfkl9sy++SSm8/d0EO09Bx8orGbM95US1LcS4XOiGL6TQezccxD8jk82JpoN6dg+HNjTtbbaDoBB"
+    "JmULAuK07ng5dNIwyUsfkjptHhh5VO6o0PBkBwmTab9Y16YycShnnd4eiA885Hh2eBnwvJafFlI5"
+    "rOhmy/3kjatlphcF2JsiH+SYfEVnijm81ZdMPqzqvYmwPvhITlAc1VTn3KTuyNXaXP8rCkpYjRwR"
+    "9VRA+48VPosOJr4qRxSniNVD6ApW2DHj+0jCj43Ngoaj1gFTALe6eD0zp5qprBP3X2UxyMDbTjTt"
+    "t+bxBSry6MbuGqzDYoTlsEBBq17YAPvJFXzfsGBDHfXLmqzRbczGiqpeqpTam6m/uryCf6fqAXq0"
+    "fDw+Wl4QfPToYPHx4MT0/48HielvK5uXXh8Lt0m+trw4bSeeqnclVLc6CntVw18c3oN2sUDT/ZB/"
+    "EDdsMDrVzo4rQtheYY/UsO5DFIblWTNZtxWC0noCmGP/gFNYqSmNuHDH2Zdmv5Zm4+MGgrK9PJfa"
+    "5xtDjIE9fTK7u7D//44ODo4gfG24HnNKYvuV98gX3Qz/S1L+D5sqT0p38epfl+0/b8c5b8rvX/c/"
+    "b9tssPjw+vPHz48fdXh5dvLDQmnukxjEMeEbGqW7DHucmTGk41DmXUjP0q4+mWpP1UyEQxiWQpP/"
+    "lyKuMX2MkqZrTrPHNGEDlnmK35IkBQJwanyOuYk7VhMWZzFkuyAiLvTU0LhQEZmWObRl4l5lhOz3"
+    "ka27FKFeNFsgmkbLyz+CcYFigaEf4UzeuM2MEnwj3hYSvrO25QgiXW7Y2XwxV9hu762oPh8nJXHz"
+    "fgbTfNk77BLh5XBG78x0EaHVrr2Mmln3mo2rJExDMPkvQNyLRT5pWaNz0/sy5T2VQdC+MDz0nkBE"
+    "zacX0+s28iuI29ZpzpRKX+LKqTXUIFTArdFSqdZ3RHDaoSjFVpQ0hIAuONbBcFyLY0vO3FZwUEjk"
+    "Ula574FI4QqCNg4W/9WfsiAFLKum6NY3uMXVAq8BpDUvAg1Xn7EUdANFwlFAVPdIrKfvsMbIhigD"
+    "7pbz1lmcqCDzN+Z9014VqTeUREH2U6tJY50Ftbr5Q8t2E+Wp0bI7XQfanHms+18tVFiXtpODYmMd"
+    "EDrS4ObhidqNyNY6/r1ExqCZK8bkUn4ScFWHB7UyMYd0DVnms8aXUCLmhf1IAR0hGQ4UkfAV1ZXK"
+    "YThIgeNkvkJKt/FpTOde9Toe0UTxam1KcqJIExJX7b0wOQYrqmN7LiH+siPhap5BtHGqwTW2IG9l"
+    "edrV/k4ifmz//o0GhCvejB4PHnOsCvv5YDO5LBtkKdKB9DJcHJxUINfEEUtgUQsn54CFgP/ufqVf"
+    "X2RshI4QXfeiXoMuqtAM1P9yptonigpywGxs/xn9PmN7dP7R8yjM/eJBSG9coWb1isF8z4HyyZZk"
+    "tpN2uDAA4npfncnNwueR3C9kc5LK8ndZrfMmkdiZWny3pCfLzn36e7dbwc/sftF8Mv9frly0P5ar"
+    "Gmzdy6f66AnyxYiJffplvgR018HHm1k2mupjopxVPYQh3rErOetL3obhuVxWD3yXDXWbqYfylPb0"
+    "m9dDbR2JZNuenln7A0tnO2pYsjS3kObIIBf9Gf43vSpUAQeHe0g7RkJO0/NLhfna5uPHny+Fu7T5"
+    "6/Be0inF8PdMu6L8jMzrfFr+eb/q8dt/45btOI0+8+b9+c/187/UV1/yLav7berxLe8+fP3r1766"
+    "PvaeTcYtxwB/J4ohbT2AiNtqMgYxjJatkeV5Sdxphwe3xkbIFHB3/eM1mBMKpDZCyajUjVQGx0GM"
+    "4Q8qbQsKQzXmGPy83PCUMVw0e2+E03gbI+qnzkUX4MEF2gs+IkS5fkXWfoFIiDuCeG4k0eXtjgHc"
+    "FH7BApmNUd+zzjMANFNiuNvDkVNfBwKLCzAd9MR8Obl58O39x6OOwMdzWv7QmJ7zCQn/THjXJv1K"
+    "TD34Kp2D4WV94Myfop2MKvzmDzMWbW1qi2b2wlaR1lEvwuNZG0AnBts7Jm4Vz9wjyUt4xBIkH/wX"
+    "b3J6DImzW+jx0usI6UI5s/60C/Dk7wR3+0otZFLVH47reiWW8qJQH6XviRjm+CBj4aWajEBi4mVJ"
+    "aEIldvxCr7wmTenNoJLtApfMa2bcHvSoA+GYVPyMODfbENFhNEy4omtpjuMoqNVCRrk4rpz2xeUy"
+    "g1sgpfndJaqK4SeZNpZW97c4MN3cwAEM5PSOucH3tsyXKxerS+WHvOwpgGowGzkcimgzsvdne7Ve"
+    "W0MXxuQDIK3gRqkwKNVzb9BSQaLChmE9FPvrzBMr8+SO0vwkBvYUkT8ujvTRryeeKGFWUTuoVhXn"
+    "UQ2yL7vVlRQT9d8gan7MPG3DVCR2QFVxjIKiM7edoy1g1GBZXkKP6RJhk2ZvYX/hMXNmUhHK622Q"
+    "YDpICvkXEaW6p38y2jCSZWOf6HZ+JzamZn6+yNFczobR3Uh4AeeCkHz6Fs8muwE1UMpZd6SR4s2h"
+    "R5t0Sl4Wss6OTQB+zcL+hy+1DAEVhnvGmX72NnbCyzjO0nv/DzJ70mIikm6wAOO3woQ1Chsua1fc"
+    "rndWDo1EebdP3COO3tTRg04XN/mc3a6srx8GJjffhs7crwD5++GO48OdE3X+qLUdi0qRwv8GH+JX"
+    "1GdzmXUrIQDQyXa3bCddmolz3o1GG7YlpXxTH9JvVJXcwoDPtTOrtfu56A519IKaMcnzhU3LqK6s"
+    "h8sjMeDT5Z9EizbfATzhKWmjHkOoFZ/76+wZlCbNPND90gWlss377/8MEfqvTi5wsmF53bFC15tj"
+    "V/96a2PR3P++Jv27rfpe7fdl3/pfrULpcePLz/Z3svH/3+9qbGLw2evjHMzTEF37xjnNL46m+7rH"
+    "EndOZAjaQqz76ixmwGthrILOfBpr3PCAWgZE0SLtDWdvbE8JUhrGSKaz4mTmmBOIxCE74U8DcGlF"
+    "lhKXa6SscBmHy2UpoUbIjfAmm2OZ5oZ8WEizp8loTq0Uo7LiBHjNsVlEAqBirD+og/Ez1rqUwG4X"
+    "ReTUFHK9ccv9w+Hq7feDC8s3V72B7uq3y/Nlp1c++U7zgAPth5J4Wb3TlgziZPPMU32S5aW4p6bx"
+    "Rhi32YcSKbPIfI7lRZjJZK7Az59gdC1tklU4xE+JSAzxDo6rUGpO4byNkSlcNTaduGjkAYByDrFd"
+    "Fi4YfHGC3vmD7QYc4fuqshvOgrPhW1DVHV18VYhVhaNlpq1EmufUXcdeGhSCoRMzlX3lHzIa+0G1"
+    "lI6hPm5KSAveCMfg15tBe7WeOz1uo9AADN3/XNWhxhW+W4c2I/UH96vLmxfrGhwym/TtjQV1xuLN"
+    "eenRwdP+dLShZ6CsHGgKcR9As3oBop6RDoJm4gFbLAowFptClUxuxaIGpx1w1K87mzsCEARxcX4O"
+    "jpS4snQKhkoU/aP3ZubnUkLWT9BE1Sjg2itGzoo+1AZ39eLwtUSkqgk4qz0agOL5nubHROFuS+uG"
+    "TLpBc6NqZjOxauv9AFO1Sn0SfwyGYW6l6so1686KS+c7/5DphorYcynqCRx6P2HY4pIftUWVxoLM"
+    "E55ozdsgV1ftql2Bnxw+MJtWIj0oawuP5BIe+2ss2URXOelBkFFvcBTPKGEhsKo/1i/2G3//FP/B"
+    "ZY4cAvHNssJvtL/kWAmtuXLs+peW0PuOjUX/xLqWhhTfuxCaMN0MMcBgs8biv9hIHy6qKK2Yzx2b"
+    "ogMJQ9HzaGX53o5ww+fTrc29PnSxf61ksxL3hiy+ua+obMVW3oFnqsuBAwm0HksV4tIEw3jn+Ila"
+    "/udkvGPNsx+gqL6GPYhG0V7DvlMVlXkfA4p77UGXkDMUFXcMpkUk2nXxUDsdNdRjbtgscJnmwlgH"
+    "7wswl0kUXR7cWAyny9+LqkXVXzwl9fW7v20cefXmzo4rZzex67gyycesTvzlxsmB+vWzK39/Wy30"
+    "S+bflNYH/VMV8dDFc++egX/+H04PnX1/UtU6u6s8WQxKB66nm8xxVarYIYGNGmdmSklVCPN+RqnI"
+    "tEZOEB2idIGao8pjPoGNGboEjFEMMW4WzE0DbOTQY1esZJGwdDZFwnZZocpvBPqJTKipI5czVRPa"
+    "SrMDWZyTupE7GVKWFlhtSpMpYHp6AguzS2JUM6ec6eI9iI6dspx41c15d9N/r4fJ3mNH3r17C1/n"
+    "D42s6dYWf1yXC6r2+ARodY+I6FzMXg8OV3acPo1LzkDZorIPa0aapLn4hfbIsEejNn2QBID4pscV"
+    "GqFMgKqVUykMlHzpniOhs1n1gTjBdQy1PQZaNoysl2cwSnGEx8LV24XceAth7lRjXQ8EdsbyhTle"
+    "l8oTtC1n2mC7E30GOMXorbH6lbUCKPzGtCKX6t/qzXy14EFcBKQD52F0G8aV/ypFkfYVQ+Exfegg"
+    "lvC4pIP+E7A3xTX184Z9v1qpRufD+9lCd0zX3uYmp57gKL5/W1hTZ0fpnajuVLSXjK5qcLr1ns/q"
+    "A27TKal8VybwBpRBbW+SKTdDAazb2OTqmDJWm/lumeo1Ia3JtDLahrb+HGP9sR3KVNZ0OUDRRPjb"
+    "K54psSx0W9DKVzZOPFolp56kJHrc7ZF57rUBVDBp8U6xj3RWIAQITRr5hS1pjQ+8JCp9Pi73oYX9"
+    "LUxHLog086y4TSKR36Dz/cCW1zVSHmqIg2o8z1Vx45C4lmPSVgXUXLZrxnRSzXH3K0hdqRROujzL"
+    "Kly/XBxJgZO6kDSotOjJw3IWKkjmvcyVPMa7VuD+G5L4mXUFFh5Ektem0X5cY065nTaLsxpAs+Gy"
+    "m7RWNTDM2viypm38HTstQRX2FNx7FJ09twuHowPN7eGX60vxz+/rOXw93np/oh8tilmmgTx+fp9F"
+    "k6PZbjN+o2tJtbio4s5asarMYNnuxhQtTlUfaJSaEHPmdmFWzfd9xC1MsbLMWk3S7aSbIhpUY+lX"
+    "MnPxi9bOGKxEbisIPR13QoeCM+sQ7xUd6H+ZEXzToDLyG3hPvhYn3j6p2HD//g8ZMnV7v4Ir7wwL"
+    "/UA3VFjuNErtbunf9SlAu+35QH1D5rv/z4l9+6/ckv/p1GaN3P0lnKThhXNcj1zZ2MI2o3kZtHw8"
+    "Q4PjPSeLSpgYSy0MLvUYpxDjInjeW+6Um6ZCj6XAhQdBqzOEq3xTHKIWMptjbFBldpOmFKMscxch"
+    "KMIptGqZIvunL5gzdG2B8TO5WkMGGGUwSL2V9CGqthkdYhzlEODtGdT3zKkziefBmw7UYG1srrx8"
+    "OdXj8a1jefD29u3BluLu8Mly9pttMXgOHz7KCDj5e8TpMezTxqD+WBRC+YxkUj5W13LIA22SsWuO"
+    "QDjg5ZA0oX6irMeZiTXDQrh+KscGbklnbstlNq0qQMzGcIsIp4BkQMM/tU0alYfO7X1d+QTl0ALZ"
+    "CKshZKea8zEYu8uMGFYCxi0AipncvKlO5Z8UUxKrJWsi0Lf2WJHUhQHx3x64xM0vSiKd3zPhSb5q"
+    "JWYGooKgSPdWivj+OLiZcU60vXCDCZkd6pdlNWCMfL5fqjS0t9FGyqhfHP02l2JZ0fsxZahO5srT"
+    "+W0w+wis7hBpaXSeNob8LUSCxem4cFJd5P47BQzcbAg7iYOm8BymhAXaVTPyJFvyEGRaEKTUpzxw"
+    "Z1ju60icMe7Upjp3j0jXqWIg9UNnNgp+tbFluwXaFtpOOFi6KUceaYng4JUYbZRIQVYnvg4MumgT"
+    "tTraKxgmafUVay2J+NHKjIqCSs9gXaTJsphcbFhSGUua2wy3nZy2Snv9hjUNsNftel7YCWGsV/YN"
+    "mn6KOs9DjGtIyylKCcf8vzZBGb5k+Xcoc19vfAha4VnmzpL09Mo13Z1EPIVD/YBo8uUW0DktKDWZ"
+    "bRwgEf9B9yc5vZKNlIIKvv8TqQBxueGks+A4/sFw83IXjyxmfheHJ8cpwPjD/VU7inqzvD+w+H4e"
+    "9++XzY3V8Mx+ozCz2tW9NuLU/m2MjpFUwBcYNqIT16nidcXtHMq5xcS7zi6Upiq3QSXOc6T/ku7T"
+    "onhnd+7ZkfH3CMWOJVm4AgsoObEtXKk1ax5lT1E0pHhyIROQv5BA0bo8MZnRgTaATrBRRcU3TCFm"
+    "Vk59rR4fE37j989nui5jdClLgI59cDNOv8OA+WpgfGLuzBvqb9tu37Xen9bdfzf6av+8f+yXDpo1"
+    "/e/vcPHj789taWvnJKb/WcMqZq3OP6P2Ug5P1zgsYYy+kUeY08GkQYR0afUhDWMeGhBbrWHh7hIJ"
+    "D1WSfmXc9LUFCqSIcjxiEf6ArNYkrDnUAK2zKvMH9YTxcrtg0zCb9SyshpkNYPPsDSrGonKI8tZc"
+    "+otQk97mKswZwo2ZCm9YHsQ4NlwtLio+yIM0EEEUn8J8NaiII+0M285Drp4wPrh8PV64+Hm9v3h8"
+    "2TW5rHnkpS8xgCKzyx42DmoL5UViXC5amb0+ZUXp3APhHVuuAp3zCH+Q9ffGFouriUhJeQ+b/XDy"
+    "ZAlCXozjm2RaZ1uBT9hWPTLWMxnRLgc0CdMjaPdNnZ5bEGsjU4Rk4qHIodivPQ3bfgl7DXPykJv8"
+    "9fdIomzkZSwnEpQns0UN8cEFrfSITJtpaONrCBJRCcRgufcyU3zvUF0VHo5ABLYF3lvgoAxqgIla"
+    "0WZcj5+lc/YQUW/6gXnpzqJws2H15anD6V9ARa2OclGi/z82JQ23Hl8tauLs89P1XzSi8Dh3+nDa"
+    "eLkWUeDeBNAS6GLl4ajtcCfedBZAYgN3CDw1oH1z785HszBTb8BNIEytDjnxIIyWd0EOh6C32VvD"
+    "tE2ZULlYuFVOGpI3U6ctFvEHDoxHQs/bnzUYB82UM61scyzh5gVcc8FeROYXQ1H3k/tajK9GUCHW"
+    "uSj4w7vanK679t8Cug2CIM26gEPvGGSTi9IQPT+sWXzWsNsmixbGGABb6i/CRE6gtPdGi4Bt82Yi"
+    "HyiS0qel+gpoPNBCA6ARgrJIakg0HVvle6+4ztZQIWC3gwku5AOvVBf+NKHrtEsLyYkoZXAtgpW4"
+    "DzgkJ6kUV/No3BMR6Y0u92UIwFbOV5zdKbLsXrGmGW9GkwJeRDr1Ye69c97q5sDe/pntGPf/V0eK"
+    "TXLw/FzxejsAHk51LA2VB6oW/KhJZNHf0hutDXT9HsM+UJSWNcUVUvPFPVCxM0KowvkBCv/1pGXE"
+    "ygQUDytYAc4mKgZegp4ZIeJQwDJgDwKSKZ9o6uUUICeWU4PBZCEAEkC0ffjra6t3/wtVu373xHtl"
+    "/8fAHuOefBbS4bOz5P5rZN7mbnybB/Y7aU/9devDx9e/fR4z89ePXqjY31lZXFQmMvg5wbinFAY4"
+    "tfOdd7faT509jRf3abBHp0QYxxh8OBgUmh87lZ7FFUeMQq87gz7xFT2mOXNpQrHLKDz+Pxl6BZwH"
+    "YKahLxWFgMTsPfQ5vHXxWGXeeCanFia8BuyogRHvMgs3DNGshMxvCpZOABCbkSHXmiYSyHdTRCZf"
+    "OKzIriRsql1xOAANl8ja9gokhP4ZgV5NZT/dD46ubL4fqlB8Ob63eHK5uv9LuiFHCjM0bZF9In7+"
+    "TwTs2zKWya80VHl45s7DAVvcCkzTFxbjPtNQVk/S+SvCpZ/vKfdWjPTc0FPn+ZBcWr4D4TKOd9kk"
+    "38mRu2sIZX9DGITm7GMhbNuEYaCduJ3MhQ4HNcIbImSn8qdHwzahqFR+ymjLjFn3o0G30Vzj6ajl"
+    "1Bt48sO5U5hXrJxoNTPUY5FdtCEby2UyO7jMYuKcpT8UKRGblmoVNoDhLljegLwQwRX1nbv3Lp0o"
+    "ON9VU65bkNGYHOoXnXr2w/OTrce5HOeDIc+QONR/lQY/UgdxENCLyylsW4KqIWpZhOhKw/BOlWpq"
+    "wbLXxGPhqBAAAgAElEQVSptpnN2xu6xKDTUQzp7tH9n0V5B/T0xmJ+F8Z3e1ig66kJR28EfcFghy"
+    "By8ZQVIrTN6OwwbZQYdUrQvBrnvAER2XrYAM1ecbSJYMIXe8Hn6OANrzDc1Vup4smupClHF3SOfu"
+    "LGhcs/5S3T+L15ysWTizobPER64BLdm5SaCIVNmXEbE//LYHTmPWh8x6Ymdpf2UT91wx7H8kenad"
+    "PeILa9tllY/EyApexe+hI+khX4y+nUL3a5yqM/rEhaGAxxrQ/l2ajwtf25Uxub7RvR4yvqGjp5Dr"
+    "xCrZSxPdl0kWagko1uX/FIF9MU73mf6rfodlcuDT96NAzvfaZN3aFerFxuqlxP9oS4wG+SJWaDx0"
+    "8coGMNOhjoEx6LHLnUNnn2cxlmxB78gL0JSbUfkRrLVeT6SQxN7mP40dLUJTpAsAdwFDYQKpnqxy"
+    "cpKO5qJ+w71dvYXgxJJv60FYERgH3auDQK9VUFl7pDpL+vfXrrzneOT0/elABvol6Ec+YBWryP82"
+    "QaNs1D9dzuafOii/Rv2QMaIRe37z/7/bv3Hn13sTjavLSt3+Zc2dO1r7camGIY4DQO6KTxjsEu45"
+    "LHZdKMEyn1zSUNIs577PI44+x0qrFxIihVC/OMd6/1YOA83omt8KJCfFHlPg9eZUlWEE/+lQe3Q9"
+    "LGaSHiqgtcVUsLpI6Mj23DhGWRwsgYbiDJhdj+QRipXhh7cyQaf+GdMK0UbvmFYiMxb41HsDMMay"
+    "heWYpJL074RRTaC0V6g0bzz0Kv8G9vPhuun3w6bPCg5JifMFDTam53Ld2+mtW0keNLyfk8HW3Ol6"
+    "OM+tzu2cDSKTT1+bAVsM/8Bq3nFiWlyxSoZM8E+1iy8GedAZf4jBfJboc5ZtLUov03ihi/11HOwM"
+    "ZRIe0VHTNyFzue6iN8Gl1hsp5U0RR9vnyOOkkZ5LVTI6GCmqT/wxSfmN36/wkclY0lrZZYxBFrtB"
+    "8l05E6xrvWg1iBWRZs2GnsonNTPM6MfdS9ZWDx+r3lnF95qc/PPdAnqM71hu7cvnL05pXtp9pDPD"
+    "7Sxbqqb/5j8ODOlzc4DM50FC5kOb07bTdsduss0tNkjjUgsHJze9JywnKTKu6NEfJcjJ1vaZHFy/"
+    "KXRq8eYSQQ1Pgl48/4eYPEK27pMOHmTB3SebxJcEFsR77rQEejyHpcN4uyNDY9HVE0BXiQAy8bis"
+    "RsSHhCmZ9aiI2pcvS74oGw/0i67ix6ZT8Sftohn6Ovn6D5NVBPiBHGTsppExbLCNoe6iCaN5p8WM"
+    "uI9p7Sslk6qAx2Q3XdYQOwYlqn/eR6UszGAyZkqbeZUSoSFVTojeexFv95xS+2GEvlk5wziJgWO5"
+    "yF4kT7N5hdFjPJyYSxr7i+ZQMFsRkcJpuZfXrlZ97e6KW9bH2qJl+WDugSP1JdWIC4DvR59QX/0H"
+    "fMHF5qoruztj0cP3w2bKzvDYubm8Ml3b1cR1gHT/f8Wqfs47XM4VDXhie7UtSLDPAgyY5smNO352"
+    "1q33P9WR7e+N0VoE2UD4WzwMAsFtqrxOxzD5pmQB8+KEaLKCcsxBMKtWj4PuATh/sRg3aTzBvfGl"
+    "95wvpyZfPe4yd/tPvwxdffunnlM5EyWLj04nThgX/aA/Sg7l7NlV7VuS8fz/Fe1/Xl0f/3RdBQt3"
+    "X73qPvaMT89ps3FsvrV5+prfZV4WkNxpDoT+pqIPLowrwlhzOeeCxjHFJZ+50xirKeV9p7/qZLxh"
+    "M3FqeSaEEYGVdrzBnLawCEbZJSbi43ygAyC8Ap63HO2KRFcF1mZYiAobJAmclyJjPBMIa/HkaDtN"
+    "rBD6+VMz6jG7pxdQLZNjg1AliyvTiN601pIeYn4WEnpF6h6ctStIARRbs6GozdGTYvDoad7SfDjc"
+    "2Hw6VXj4enRy8ld4nGkWzajVuiyPhz6dwIVftmjhKPn4iWbj6/p6ek3ChFN/A2xLnwQKKi8bds8P"
+    "qD+rPeKX4Jd/3sG+WJ4yUD6CRmnERdSBNcYZhbHj3YTkEF84SEFH5yaIiIm1SsxTBF4/zcelXUMH"
+    "Bhq7w0Cbjc2pSa6OiuZYJNTJufEUumbcMrqi91GnmVaF9hRFh1dp27b0BFdtINxTdvZYD9KmPAnL"
+    "wMBzBZS7FE8hJTEG6TKmsN8LJMIKTNZroE5Vd10R8luo9+eqh76fe2N9YfLNdWuNVwbsMXXdbnwt"
+    "gbV7afb66t3FPT2oE0Fg1Cp+LyZcAhQKc5smCHFj7KaCx/0UlfKGLsjpLdugm6zrjjDwodIS5hQB"
+    "hp7pTRB0/rHNOFyyZKWmUbg0W5FvsYCIh1uAN5UY40WLGTtDXIZsfwGoOcaPP6qoxNAQeYxJYXDx"
+    "cRPugnRuRTHt3g8Jd6ps5gsBntGrLBwL/41DYr9oZafErYZitEk2jjZk55sEOLPHzkLUopbaFgO9"
+    "BRBzwY4E16qkw1TPPgKb4xGA+/pq7E3oCIzkYUHNskeXCpRwZ4FFQbGDx2wE+At/1KHpW5OUBGmH"
+    "z+wjRhwFABM2HuNprorSsbo/ghNNe7+oirJt0OivlDAXRY3B5uA9Gpi+zQPQ7X5VSfqVMLD08kcF"
+    "fffPne7cPhp7deDi/1e3Wnq/pCnrUNDVCe5vRzBnp4J/8s7Q/d8RTEQpMa11O+JAXbMijGpqlf4T"
+    "eb2BWvuOtsq7sObTwXq/vj5JsWp65Oi6Xb2Vjlx8YtLnNDwxcRFCaWYyj/in09AAamweFJ0teSMt"
+    "5EqupHx4e///Gt299W8baOi3DhgX+RB9ytZpxj/5rRvmzydR1fFu/fiPzq4+fD13704Ud/tv/04T"
+    "tv7hysbW2+0BejaUzTmOER8LUBzE9tamXHUMUA59gOUyt43md0RF4BkhuHsTBzjwebolmsGcl4Fe"
+    "xCF42n4unRCbPGoRMxHUhxzOkoH8dFY4jBRsUu29ZgVhvd0C1n4BrHrZM6VD2MJ8baNYzwWFM0Jy"
+    "mYCjFAofyTzHgOG7UsO6oEumkyzK+nCl+e16ESTzniH1+9REh0hI4Z8feGt649G27oh8aXJ/qp4u"
+    "HA6wC/NWRnUVk90fM6g5unbFiYQ2lHZjyt6/zqJbC1zhFv62/39VyNz/0jtDa66qHIX+pCNiTl8a"
+    "tQxN+HSh0QdUhDRIS0U/GPZcLkNu+qQGrWSWJUawkLKDXqKRm3uYVho7QP7Icmnyv2PFprkdSXMv"
+    "RW5cTBDeTGC/msNVWLCFqWubnWwFCj0CZEHo9XPVoPMXw+kEEwwbornzdzpn4MB6K+MU59AMZmX/"
+    "e0ibLCdB+hiCCa2ZILCUYOjQna+0sk60F9k+qxsB7sbG3oNzPO983fmcdnNTsHySs7Gy83To5u6X"
+    "NEB3yWaCEnL3SnZqmOxWV5ypeN0PAVfEGpB+Suv5tz7DAMFOGl2ymo0Wh8Fnkg5LcpdDfBRaKrHH"
+    "7i+QLfmwRJMDgkbTQvsOfdg47EBonQNgaPPE/B2PilQ3Z53xHL5gsThS0bsnGN/d5kiU6ZbeAidA"
+    "fGjvgiT9EQ7Y1c+LEPmzjcsem0Hsiwkn1CLsAJSURB4rvUEn5w25dCxIezi5bmsP0xRXIWSFz2GR"
+    "8M6XfdSwc2WFZKiOGzD2JGpWHWEUOczB1U+UEC8LcctiUTOhnTFKdOVY7ispekMcAfidSRbL++Gx"
+    "6LqGAUxS6FtnmMZUc2x7HR/sMC+8CjhusRWeR1gDM71uVjPhfHdbDUioPPwVE9NmHwMVUxAr3SFw"
+    "B8qo3ce7uHw6cPXg0vmBT123X0Nt9qEI6mOH0mT3cwdWeS9Bq4ilnIcEgi9lbNsN2bKNHxCfoIft"
+    "9eMe2PX9N/MkHYHDvNrAaWmjGQdNsrtp8ESp62HJ2hsu776AwfbUFdTdFHLtqP1ZfER8i1KbaqAx"
+    "ta/tw7JKonzout7c2vvffTn31HGm9IBMCLcOGBX8sDr3eaWRf/tXC+iPl17C/iuaBNHpDvVz/+dP"
+    "fbR3svv3917WTn5nW9Zr52oDHlSEMK4xtji/g9EDG/kOHZBGNHcDyX1bgFnTC2g5gyZ4UXof4bGc"
+    "3cEhUXNoNriiFwlO7Sk0LRzdcY4WUByzEaWjIeQ208fBXOivZQmUIwKC/bM3VHx1RRygtLkUb2mR"
+    "OUrLEXDo+nCBbsGcYCbD8acZTFiBxg2AJsUsJesn7KS3fXXTcyV/WZyHV9y+WNxdPh+uKxfs7glc"
+    "b7LLyNU8aDk7zWE3oad7LC9xuI5p9KSBVTF60m2diJ33XFMlQreI5W34k5aW3Kms/2clLIvARu8h"
+    "0DBpyxtOZRwhzRjWT4kyJNW5PrQGZGKHbPu81ScXMRl1mzRDM3F/nos01llwWtA1+VMovKbvIjic"
+    "R0dH1TW9R6Zz6ZLrUTHpmWLsA2OkWRg9Za0E2Z21D9Qm1qn5oB28w6ntDf9vrhDThec87o7NpkyG"
+    "iz0sYU2PTHekHfcLm69uDapc17Erh4Qjd6+ddIvHH9ypM3Lm/d0U/IHHowlouP9ZsQ/P5bGk/NoJ"
+    "4/f9IEvO/EVKegnAaiX/TCs9u9L6jwi8O8MdBP7Jzk4oqebmh6FTLZeKUjYQ8doO2h49BJrFvyBP"
+    "hjt3idADf2gtd2+SkfBTqggTl+/s446Gxu+BoPLXl6E5s1+GnjaChbE13gU95y5lWmP582Imu0t/"
+    "0w+kAPr5JmAW9thUPt4XIsGnKTidEVm8I1VtYSqQ8lYBNSX+ofa7ypQBehYjbj2UjQHtUXbI/4rJ"
+    "9NDxvvsgcs0ZFpW4jRUUP2SLffVKPJF8jgj5hAPZEKIXUHq0M2juSoG2f5XuW90aBkxm6+2ERBly"
+    "GVw5+f06TFJi5WoTuDka4Kb/RcTzE8X64Pn55sDf9w/2D42e7e8ESbutM1/U6dJjQ/hZNBfKZOz+"
+    "90YySY3CBZE756RuHrOqN+enrHTvC4J1TxpU7Y5aTqV+lQ3BZU2nSKcItiPJZ+QSYy7YNMTujukH"
+    "KclL/ir2J/dlDpvmvYvqcPuwZtE/KNATj+c7+Rt1ZXr35279737jx6/q5K0vEK/yK68MD/igem/v"
+    "u/Iv15mX9tvM9r+N+Dwujw5OVw5f0Pfvr94xcPv7WzfLz21htPvaHzNyBq7NFt1Aw7WhAyJniG9t"
+    "iAD5RnocgAceaoDYVp8Cn02MVgrMB4k9jDnNOwjFjCDVFnkirEXo5JsopEY3PR82cwEIH7bAgJmw"
+    "15tpCcwT8vZ4FRc9lWvLGsZVM2Wqs5IH6zxlHfpKGwjN3pkW0yxwKx23Ud+ak3R8tk0Z4vSsGmGq"
+    "Jlx8b6vp7SPRmurt3Sjc7nWhPWpg3fFgBRjsJlynQfwDYd0sULPr4xKV5uJs6f4ES28GxX+g/mUU"
+    "bouQUf8cc//aFr3+0nxhJIxHnc8DS/WVLH4JcSQBWsCxzzqU6sJ/1HYcpHPZY4ewomwrZ0VmhAb2"
+    "iZPUuB+SamtgXKPD1xBGVeFsqc3ebrZAvIwH5GBFoI3Y7UOwHrskJJ/mw9DFdYDenrKNoEm/5bYL"
+    "Mo44Hrzbpd/UvN7QMmtKtvHC4Wq/cvb68/U7bhKT53oa6Sc2fXcH1r5+jNjeW946PDA56g8aYzr1"
+    "YfyWLuzLM6dWNXH6AfkPfmqFzORUqS2A2uQZiFL8EsnChT1Jsm8ml8FuH57Tr4fUHVIN5P36ATvF"
+    "kTIjx59M9iW0HA3jBKLq9jgsPAgA54YgvGQCP4Qi2bRFRR7HEhjD7QGX77IIUuCz11Cjl+gq9USG"
+    "vpFYPlle06I+M7GqLZZxaKLsSMX1nzkQZbEXU1NH4SLU8+w+wNsMgud7GscHtIRiz4hUJYONk/iE"
+    "Y8bSj+EQKdjMiimM2+Aid5KjvfRLvyKnM86pBk4YMcH1XbiDWbMJdQnRyTSea3RRil0PLJmSJ1tg"
+    "4zDcCGgn4FOf6aNnq5ERCcGKYpCF8iKkPjXvB0hxlXcx1QAQYhfrMHH+i62NWrlr84WAw/fLA3fP"
+    "L4cHihi+ZYFZBmpjS9ZrmmbwjTZ8mEsalN0Iauq6VKvOGTJu/jpNbXijDzLZzowxJswXb8BS1EaX"
+    "YZ52zQpjLfdTYbAjO6MpDHeviaUJtSJeG2CL3ZbhRvvoY6dYksvBTIAvcHpQXgfip67HGxGPVvJ6"
+    "4MB4cHl1WJP/v5Rx//mQTWkboIFx648MBXzwN7R6fDzz979M6HP/v5XxzvP7r69huvhms7T/U2g3"
+    "71iDv1esVu5VS3sPRlG3ybITGv5bHA9x0rDSCkHFi8M7fqP0Mvg0aKPL6TZMUnosc+Jxn9as4FyO"
+    "MycxMD2cSfTOSskc9xGUs8Z0IpLBq8bHYcGNAUMj6GFutJ66jxOEzmtBnRbWqKxJe5qeWqLJApQ1"
+    "fpGyWpknVELqN0CbmySmOr5ZJm7I534ONIMAtlXV5F5clg1LrAeLVkWm4cDJd3Hg9vLHeH7cUL2a"
+    "Pbj9KZjZ1agrmAfNvDfOu0G8dpdFs/dP3rC7JsB5aZDrnqiX0hSl7p+A1OBYvjhbSrdUM3CHaEf8"
+    "SiTIXG7DQU9zkxV/uF3wzm91rWmNAkz7lBSgf0lKZstAWi7Gw5J8kqwIOuEStU2xd4lcHXR1SYK6"
+    "eUkw5PGPKEDPxmRWs0j32m6jpjqhrgBvFKFrt6zd46gjjzuQlVK0XGV5sXh7FyI1cU6KWX5Qb4+B"
+    "bTrNJp+Rc40gqiH2xvbty7vLmmb1g632Ecx86hmSdXl6u72tDteTMgA1kAe4Fbbedxoxoji/fT4e"
+    "goT0TpUJajTegYRMSS5XJIo0Il0KHVuuCq9Vhwe4OhdNo0fL7ozELHSHfxwtabS15cY9hIB7edEm"
+    "ODBy224+7WraQD1hRNyozgAUiF0hHbRGV2ER4bQ1fZs03kxs0ouqmHAnoJIDitxPQUrupNoYLrgi"
+    "7qZJ0qlxJ39HD4jH4CLCRdRwgYpH/7G0zZbyzaSxsGyuZPpxqnN6/gYHeebCldm1UbLzzbXzpsnw"
+    "xA15q+csjeE7/bX7QeoMIXW91SbbRBoaedyZJu3W2n60LdXB/i8o3y8LiP0AbgKuAPD4rKxgaTgy"
+    "0e6kQ9PThZLJt/pNP+8NP63FzAYvyb/l57EMviWuOgWz5DLxsxnrAdHR0Ox4dHw5Fes3ygbwv75d"
+    "PF8OM7R8MnDw/0mToJqu+s6WmdPFoP3+q1S+S1i8ObC17HVMwUyGua3BPTd67YD9hky0hUoK4c8b"
+    "8Y4XVQnZ1pKfynAo+UuE2Z2pDStOYyA6nXgugUjdAUOx/dzooBHLiIDJUC2wc1dGsy2Oba8uYHP3"
+    "r/z/f3j3hKdxEuPHDhga+YB/jyq8OVlfW/ef+97919eO9Pl8Pu9rUrj3WHRt+Cq3FuTRu3Vd3gGs"
+    "cOJfz5J0Yyj0UZb1yuvOch+cBUiAwqLkzS45YXEZELo9ItkEEIwTpIUdjjE/Nh5UeOYBfInBo5zs"
+    "ZXwiFYNqtsQ51NrbkzZpSQ7W1Z4jDHD2WPeHJTVXnZakmUtl6VZ16GEGJ0YAB4isagjGSNUvKFaI"
+    "4M+5FpO8MmHcbGphFMWJqJWEdQpjlP31ExbCxfDF+/+lC/Saevd155pZv8fMRF0gLkjZZsgIKnWd"
+    "R1c9sZH/+hMZi8km//MqdWOfbypg5zcGyrEk3A/skJ9S2Ca2k/oQscsDPbzKuQNUGQ5puKoBrK8j"
+    "Ri7Aytz5GcI0qSxYBCU/HlWAPVBfrcdnJlQRUoLwK22XcuxH8zQVD0P+JUApamtl8pQoPtsEPDNT"
+    "+3tY1nA8TbdSYe06meNQFqv9q4qLaXiz6u16JstNdZ8bSNgAUn7VfgEFVN8SHJtaAb5IWv6OTF5e"
+    "2t+xsbs29XiuC5O89ddt6MO/3ajWuPV9ZWn+Nkv3bJophDHbmdzwXXYdwIqHHY+PC7cH4K5M4tCT"
+    "YNakcGFG8mhMIPf9OGPE1S1oFNSG820tlp72wWYOIJnS90cKUrC3ylZVsmhOrUHiCQYMHLTwqAg5"
+    "Iocp9v4ytOZwsLndB4jkUrARb0XBAul05vGlVGHrt4OtGy6CZg86k+g4j6Hgigx2ZSCeinPFLRgb"
+    "18uYyVig0M9MCDf8/gmUkl8tcCHtlCKNNVqr/ym5+WGINBsnxuVMkggKKyB4z4JnVL/eoClIzzMC"
+    "mkDmgqCJern4gAX8uOefhsZ2wFY+Qxhryo/uE2Z0C38ykAkjZHLjbQF6B3yCaOjZmekvHKsHjhJ0"
+    "YHYaoXNrLRk7+7jQssKnlxSHObePhSFI51x9p0iZ8fIKdVPKlpl/dIm7efPzkdPry/N9x/djTsY5"
+    "u/MZaXF5jO+GmD/m06YYNV+Gzk0AUNM/WvA98p4ep2fSlnowq3QhidpB4lpTqmMHWGSSHFYxJZ+p"
+    "J9X5tzF/ZJbcSf+Tghb9ww2E5swXeKU4ydqim4/Bk/+Y3F6aXHj59+796D3W+2iov4wgMXHvhqeI"
+    "CxQN9WsLz/fP+dew8f/l/XLq+/+fYbR8M7bx74y56GEz4/V+NE3zzSb3dq9NW4odEhA0YqS1YpRr"
+    "2MFcoUT406ZmdM4W5YxjF4YJvWDvDyxoHfOkCnFhxsLD0neTCFBpfoxecNAphg1ym/UxdeL1hsnM"
+    "Y0x+CLlWPEjGiPr/M52ZjIdShhogTZI1XUxQlildlPEMkTLIBQxlcKXFR45kGwgCn13Nh6LCqa/T"
+    "LHaRUZn6Nc5XIrX4SiCVEMwdLDVn2OTuu7jb3h0s7D4bpeu9xafzJsLPRZcR684kc7Kda4Xk4yH9"
+    "RRVfK8ixnMdOMc0XLM0bSRGPivOjlDpWm7qj9Z9wHHtI1nGpWXn6yjeFyPaS0ZbcGHPwHEs8F+PE"
+    "tSzprL3ZGZJEu3ZSZc/DHHSr3wLW6OdFW5cKl8FBM1fkiVa6IYhWS56CgJlVsvpTORgq3CtC8Mli"
+    "2Z1mkxnVoGu5nn53XpNDaUmtiC3bO6gWJfu6JBzHVFOpi+rsCRU3QTfndnZ+v++vJ8f36OVqpVGM"
+    "lzF06/8daNx1uLtce61uTnfKkHO3GewlUzeCOQz4qpgX0XB97UxQ0760Er2tDoUnJje0evVu/Pbd"
+    "FB0pFUTqeauaMh0v4a8Nl8iOinEhTqsMqZkL/qX/Re6BpT5bmAyj6Vm85msgKXBBOAdYlGx4On6+"
+    "u09BsHPAb0Cmwas9nsunRJ9Hat+JbE8Y6GWcoO7GHwLEie/GEH/u06oq9ti+2Rbd+wUeAVPQL6sD"
+    "N1piYC0783l0yCFbxZKr65f2BmkMEcfE5AJ7Z0GxhSZeThQ6sxWq+IyBzp2yBtL1aVfLFXlPZkEE"
+    "eneXEFFROyY9GdtQSaqCcKosPksIuPNoKegRK/2UbKwS0M08WY1wpSV7OweZEt+OZEtjO7YRP9Qz"
+    "tz0fRDq5pU6PL8Jpt+MFvrDCySX5HF5tXl8JhNnX54/If3Xg2fPD0cXmnkWltbakPHX56+8e2XfN"
+    "GKf3RcG0Ge+NGtvDn0lzoJkzshqyxOlNQJW9z/yVMXnewbYTmQ95+rW0wU9gGXJUUpoZ6IBTS2oc"
+    "FgpY1Db6nRnxQjAx4O138+X5cs3w0T4wCjUHzq04dHJ4vDw+HdH77/4/+ogquUXoQLD1x44Px7gB"
+    "HjWNf604OVnb/5wYffv3X77l8+fnr3ytby6bB9+VA3tzQCanBkHD71Sl8jpzcSjA+9ChAIQAQPXk"
+    "mGqDGiaBlZGHU8wjj2Jovxxv+UQS6wGoPAZj7NaKx0j02w6o/s2YAAFEmQ7PGQtOeDqEgZ5TBbID"
+    "ItB+0MePMUe2VHeeog28m7qKsDOwTnJwzzqQD3TG7r8o4lRy1hUD1MnRVZN0WwKaCH+vqwQg3aPJ"
+    "lj8QcTU5D1pU359vgNfYvpG1tPh/WDB8PJ4VOVy34xoS24Spc4+HKhAiCsFTwpSB/1Dj1t1TzY02"
+    "u8pGHLpicyrkMQpTt4SLd25k+njV8yMCikLtTXhaljWR2O18/wfp5Gfdp+1SwBcLBGAdqqSs9E2A"
+    "Qo7cR5HpKz/UWeqyedA47pz0Tzz9Gqr4w4ylf69ah1dOxybITQQmNh+pfn/q4fArCP13h4IhIQs+"
+    "rUctwkoASr8Mf0jei098np2trKk+s723whit7hPt+BXnhew8kffuvr964uh9t61Xz/hE2IVpo4n3"
+    "blVQo1iZ960BTezNFIXviLr+7ww0sjsWCmAYlZCPIEj4O0GMoH6fjwI2f+4jWfqHQU6LkQxKNFJp"
+    "sAy9SinYUnT0vO3CUrPE8wUpfFaHUq6aAutqLs6wupOx0GjpvD2gA2D2UEeKkTHrLtTGj663ywNB"
+    "HqSRH6XQcVQ4en8/gOWi4KFcUyEuWr2miJpzGDIYuoBHAEMoFOdoYTNsnbf9PmwBubwkWWvP0iBL"
+    "eB7WpKdKDC/kcOIentOqTdIjv3OfxdX4ybl9lrwjItiLAIM3qjpc5SRx3sL1nadsgI98Vuo9Zl+7"
+    "BTMvaVHQHIhEF96EM+NFEs1I7YxEDDYR+BjxjeEVDfEUaWg2+BPVK/PNRi5t7a5vDh89XhvTt7w6"
+    "1nJ8PeiV6qpH4SZQDgd+rWpY8N3VLSPPnTz7v6SWA0i09lYgm4IoQ9eOBH8hWcc51EwEAC+ZGpQR"
+    "Q7KTvEh1yuOngDEOmc0YWPrVPp8GTzDTaqjDHqEpoWCNyxpdwbdTjg1R/twVPn7Z3ty//4ycf/ef"
+    "fR068DexEuPHDhgfPvAUaFI71Gfv/p6c0ffPDj//bsxdNvrx3vre3otszmBj/Zot+eW9WNLo1bHj"
+    "QYBxgjNIBkn8RYkPEgY0LqnHmMtPg5w1Pp0DIeeTw3Q8YlM6NA/9p7jAE8Y2JHjT/ZqBXdRmEYuK"
+    "8fiEw0Ugx0/HWIleSSYiQN34xDhNirBAMlQeyVSkbnnscoM1rbDidyOIpjFsZNp9FAnFBHT0gGqi"
+    "Vn9TFB+fYHso0enyOlBuPHxtncidd1ly9X9A2m2xsvhzeuvBhubjwetpcvvdk60ecpHRooubFNsM"
+    "TrMurDhMZGTEd5TdzoJGReCm/ZbjI7S2Yh2Yod/naHScos1p26pNtZa9RZEi5cqTlIc283CZVvsx"
+    "rO6G4AACAASURBVDsOJzZLR5uGP51ursRTP0WqBEqo+ytiUx8PH7c32KgST6HQREJmXtI8xlKm8d"
+    "I21AtiCeInJfuwbIFV1HBRRM6ml7yvV9nCDWVbQWFE8hZdrra+ztoHtgEFVlxxCyqba1JAXS7s/o"
+    "PGAxl/B4SU6E2z3etXtx6DouNcB3rmuQ1v3rzx6sbK6R2tpI/oLHR+rgo+OzVfsLvxqEU1oBtX/G"
+    "OjqVPTockT0xGcdhOm+vSRkV9pdPnpiHijK08Ixt4ET22YsA1ZMODNwj+9jrw7jUttoHgLH8N1uF"
+    "6yJRICIagIHNuLzfDOArbZxhk9FsBUmMCDK+Bmazx0wU+e9Pzph+0pdSy2fbGLD1LkeVJT2gwUnt"
+    "g4sxl+2cmdLyxp+8aNadGajpH2l7hJB1qlVICgGNvcdiqHh4Beb3JU7vrM+Cmn7IxcycReynMZYI"
+    "f51MfsA9nHhZ2aW73xLSfVqMEC7LGc5BvTpulk28tHLlPatrp2WCf5OoIBZnwoMP2nr67qZobnHu"
+    "RVDoa0SZjXi6Vf851+S1wbPp6wsQ3jSag+Tyf79yTzQJ8q+emj0+HHt/aHO0+PdatJNzPYKOrzJY"
+    "Pudq6Kbyl9axrW9c2y3jiOT+2sM3rV0tKd1zOxHRtVPKuNqXZM6k6pgiMsTpuFqLOyocGQstFnUI"
+    "QfMr4QwZOodKbJ3HbmV5HbTDCtw/zIOBG/02bdbhStLlYv6Sndn/7wxz/lKd11HRfhwgMXHvgKeE"
+    "A/GX7l//vBz75/f/fVX+y9Ory5un483Li2GJZ8y5PeJuBCZ7zSBJQhpK59LzbHcUEJjQ8MEXCPjE"
+    "oz9kBjfOkxJW5BuAKDSQV4PNQUDbkemyCZbBUeuRtAMRh9wGet1h06tGJBgTc2oUFOiIz5zexqtX"
+    "iNl9jHAtiVNUDPV1YvbM/VAgWtAzxNtyzVxwxF9gyJWbCJrQO67IEWiVkUALVVI03+ss5SYt21hr"
+    "BZvMbKPLB2OKxvvBjeGnaHndVXsjGfCT/x4p83cjR3e/lVtdGkwX7SN+CFnY0kEwl6Fdekgm7WXv"
+    "4YTkp1TrBXONU8xE8iEISmkytJKmb63GmzpR2T9Ln9bwuFa3xKAhXOkZjsBNIFibuvIWyK7bFlJU"
+    "jUMlMaOa//XJbysQ5kVT71ychBhsfHWO8Yne4Xn1tOaxJooUdmegsq9llSJ6ujkayzFChqTCUrdL"
+    "2QmAWALCud7BcU2KrOQ/sJBP8OoiEKR/K0fftEfeB4uVy7e+3S+os5xnlNp8bn1LqNxdrexurprW"
+    "Hv1Z7ej/JbX7wG6EU2bc7ivjqLL0A+J0Zd1MHc3N1B1MCmq8gdLL0jgxT8YFUnYANCyIDipPF4TR"
+    "BG9I3BjZ+N1byDBl4WeDGOWC4YNit9AXcau/JTDOlE2GHdqoNxZrahF+29eYlNytNxsYWJCzn9tR"
+    "7wKEPOdSQVkuOuN9iE6SLAfm0KZLNlUwyI9RVsqNY5yaI/Mugqnyn2ZAKoyH6SqDR/YHWwvco4rg"
+    "KKqY/95IFd+Y7BoIx2U+xNETqREc+Z9qy2RRcyfeA3h9EObC0bjITJ+ZvziSVZ65Mw/6WbmD4BJB"
+    "vGtjdMkXO7KRn71XdRqoCMxJ1PLPtsu8ptq16PZBOnvrjoQ0Vs9LRHyxM29Qk2eg4aIA/1NGp3ZX"
+    "P42aOT4Wf3DobdPT29040R3kZi+4eN/hweG0RNiLrKvCnMZ+rUXlV/Bgwf1FOJTARRg63eaJZaQV"
+    "UBdQqxYxcAgFBhE6dNwEGLuI1JW6nqonSM/Ahv6AkfHUzQ1iUmYuwyRXnaxa9VSIRN7+pi7es/+N"
+    "E//tfnz/feESxVvggXHrjwwDn3wD29cfe3H3z0F3d3n3/71f6rYWdzbdjR65Zry6N8E7YHCH2OXq"
+    "/1MBKT9RCrRXjSGlfO1LFyYprmbhg8ooy80xMlAAsTLk8jmoMQUch4zvzG2KQjyhUzV3HYCjg/d2"
+    "AZf3yDo9++MI8VmO5NqaQSwH4tzaYPvU1XHLwmlORoW2y0Ltul8mIdn9whAr8PahSfjowWwOaUef"
+    "c0gliYU0ItmlEFDmcOt5OIbeVpzQNghcYaR2sxbQJ5cLe99XK4uvFkuLz6fNjUd1bw1XTclCR4Lk"
+    "HKBmmTX/MNi3j0WCdlYhmbQnTP4dAVek3ljE9dTit3S1Mg/pIpNkecbHfgrDe6x2In3NqpoHHmUD"
+    "HuLH9yEWjebjZs6bUEykt1ASDTiiDJmrm/C6Rl4hdZZ56WS0y7Nd88DWrTravF0CYclwHcaQTIE1"
+    "wZbAopfqEsfkcY+Wk9hcikDQiVlg7SlKV89Ik5qFOK+oa+cpKMHUh4fb06vNq5dOmz7a3FK8rPe5"
+    "j3yPNo6/433337E/2o31Ma0BsZ+ZvOs9RiFPcTOPfrk+5ibmAtqGsBj+y8yekA3bjeWHlsrU0BeG"
+    "KGjoyP6jCWQX/lG98xnVN07KCjcPSjfdtUFoCR8iwqpWLaRFGgAI83q8LzwnSmDw4WpAT8Aa/r0B"
+    "0RXowmVNybnPBNBRSD0ZvRqQRRdCdGGwf8gZz8ZxobSpgV4GORH85uM1FlJ2WEcCYN3e1RWSIW2w"
+    "T7wbiTPjTYXsX4Gj91/bzZFjhyvVkyTsBMn+P2hYx+/pDTfzYppTc1icXTxKZ8SJOc7DFOyaFn/p"
+    "lOy9pPlESYRQM+sd1FbQw48tpu/AEPXoGOCi840KkjG2VNcproVlgoaBHAK5f5xi8mN2sZjvWZuv"
+    "v6+u73nxwOH9zdG+69PNUXpbAx1BcIaRrk2yzXJO9NHBOjN3faNAqBNHHb4Ng7NgnRhqVDLFgkEn"
+    "QynEJLXOUU6rrMpE+d8uSV+psPzPIl6FTadU9h7WuhpM1M7g07coL2/E1fhM0BenBjY6j6vM3O4+"
+    "fP/vwnH3/6f4qyE+rF+cIDFx44rx54qTcr/9+//uiPf/HZ4//w+NXR1UN9Acq17YPhin50en2hL0"
+    "XhvXFvBhhiuJWj4PGKMQAaFG3slB5HNafJM9ZwE05JFgOMMVAlk5SGLqjeZHgkodSsGXpEI4EqdO"
+    "VkDBNdlnIJOsSOWVpyPeKVeOmbeHq+CjB2xj6Pl7Bh9PSOKeYozPRSTt58kiWWbT0fpQCeeYBfjP"
+    "wr7vnKsiGPzMAZnwheR6HSNpZJUaoAHyn8Q4rP19i+sk3pbLRrrtDPT6yv7Q/XLj0bLp0+0Ysmz3"
+    "QzU/Oe/0CIHO3kNQPzjT5Q3TMp+tPGNi82WLcQ8EP1DyzuNhzt4SaB+4YLbZd5kNOBjADGw1OdWV"
+    "1SBYrEaTm0aa6KXugJ7d/OE0Obx85A74Qwm6dJ0dE5YrjTm22RTjZ3AjFzqVIZfxWaaIScwJ9qNn"
+    "G7jSVoX6MD2QKa2zhPWwtsBiSRGzCmj0oKBPVWMunHkCnX/S66Yc36UYJAcCEroD9H+hb9bE13u1"
+    "cWiyfXr135dGN9oXe4z3/Iyvn82nn0R9/4+idHT158ypey03BHej9qXZu5Y30xyrho14VwpAE9my"
+    "k1pRu4G1ANyqJOrcfyuTtOP5VJt+heoo4gArneJLjRq7EzmHAhg8PAkE6AOnBbrzc0BpYt/WRlpt"
+    "ufg/KmRRexcBzQIVpjstGyrQJnI6Zs8rZOEtBRTLIWsqM/sEd/KdTZdcrmio7OHwF7UxfsCL9LoP"
+    "OnTD+BcWnx2EOkzRf92MDRG8Rs6swZ38QMY4LrkEqNG++q5Jg3lutW/hZ/+4QyYBwLMO2aOlBf8j"
+    "lmGz70YTMGlEy3M32EP9p4fgOgJzd00X8QtRbwk0pdDAmXghmU9mCBziZHP2akrcxoAT7P5RsD5G"
+    "BQ6P5kW0OAOrYVHnD76G4l8zavZVIeOjiic8horhd+zuDV+mK4rSd1H+weDR/ceTHcfXEyHCCMTe"
+    "DpYC3Ek791pZeSB5YNn4a3cVNnXstEDybHbBxhuOSrLm4LfKx8+63cYj9ho/PFbxDqPIaUYyEDPA"
+    "d17/aLr2SEgiGUpD+mDwTEbWvtaJKfJE+Kn1HfurT1nb/64fv/RU12M9wX5wsPXHjgvHrgJ3eGqz"
+    "+59+z7yytvfHP98hsrS42f13ZOhk192+Fwuq/rmsGXz9Ap4rUFXeuMSh4PeR2TtA4PFhQpeFTIIO"
+    "R8j8Mu4KR/j14ewyIaitkZ1MUiXeYKf5UYIiMzFBTCG5vMw6DF5FKc2NVPAn1juHDNq1PsyOKzac"
+    "QZXxPP6WfT6IK5qKSxhhU0/959NIPGXfIOJYCtJHV43JbdNt9kThlXc0OxRRFQgBHByppWp2AFMw"
+    "2HLTp4P8TrJAl5fs5PU+GSdX+W7sVwdfXpcGXzmdaGPKVDhhAfBqPXS5Tge3iwow7YFdwEZdzZ9l"
+    "ehK6npiu5TIeJUpmY15jFAsLPSaUc0ikcCTQcC1uhBjnzkjeHyysOs0DzJ+GwZpzBD4QxPSKUj+k"
+    "PCHgUxl+XJV91dVJRwFr8LZJPLdEaZcm03BS4tW5rNMSfo4mnfIo0Pc1JMsI8qCS8ksjBX1DT7E4"
+    "3GVKEZiUjETtbJrc+6xGv/Gs+ZCVt9PWuK9JHj09Vnb167+oneiLp4Qofzv2Q4+r2b1z65tFz5lX"
+    "44+YhvrVqsrw/7hwduoGx01HD8qLIaMA0XjXkaJTqdwws7njJwqSeMGyllaexuRMY0+LqjuGOoQ3"
+    "gz151EF6s3LCXHt0YSkJk6Ti5c49iM9DT00s3GC1Zpy4LtjuesF/euQ3VGRQqcomN6gte2z3R7oR"
+    "pcw9bCVsbZvnz2D6iSEbh9afSiK0IfKG0r9mFHNp5VX3MlbYkYGrkQose+k08oUVWl2fWFpRflrl"
+    "/J05Z9Iaad4Uxg405Arm0j9qbS8OoLqjO6mNjj+dhIe3Rbu4AKKngTxwah2gfdscfFbm/6BrREJR"
+    "iS6d3+jtmc0w7MJq+FsV1FhzdBHvGGHlumycAOF0Nkui4MUNHPOmVNq5Y12csEShenLGuYbND4Qh"
+    "NuZ/gzdXrFcE88d0+Ww4/vHw4/u6vXL1/qm2P1oXN/po6+rxouhKWvFtChz9ThF+3qFto48joLB3"
+    "h8qyb62VS7Fuh3nbBB9VC+7Xf7UG4GahwZapFNZ54oUgJIe3f0qQv6VLJmUhr9Bk45bWl9QsFvtC"
+    "V5FgXYCrjNKDn4N9c31u8/ef7vP7q1+++EstGaLuILD1x44Hx54OB42Py7j+589/buo+8/f/bs3W"
+    "d7h6vrer3g7WvLYX1d49yJbqZrzDtd6Cue9F3jXPAeh6F5LKA+NQiw/BeNYxqRpvpO43fNXWAha5"
+    "H52J6xr5BdPqFkvEkeHEafVisgB2KPSh7LsJM7XbGXsYt8H6S6XDZELKWWk2TFhvapmGDWfGEb6u"
+    "61kcwPTwUnw9tDq22a487YY2/sIk3RWE9DorODUsZpCnq6rOPys7LjxhBcsYLNoUpK7ni4dGlv+M"
+    "a1l8ONk/ua915mL+g6YkEJlJRtsq6s8SjP01rh4Y8xxN6eW3p+8Y3fLPfcTs3ucomnXRR/rj7pXf"
+    "BP6x3RVKH4LnU7g6dM64VuyDLRMpUeecQwphtoFuM75NDfIfwIgg6gtTidslIyK1HSFTSnGyT1ML"
+    "91qJg52Ix9Sm70AvV2kc4kaFvyFbdW8/gyg6JcRaYLA50jpnEAURCfeUiaD2jZVAfV9bexF1Pf+G"
+    "YNVuLD/jH7jGH3ypWt+zM4l5/X09Sy59TCd9658fSdK1c+XZ4uDvi6dVaq7irE8jYe52AZmiZMI/"
+    "NZO184plflxMKTORZ5XxTc0YUFUj/Bm7oleugUkQSDQZafCiDQUeg4vHdr/MpTxuaPcujGo0x/pB"
+    "2XPcibp2SRIWDPPHSn9NMZyZRJ2Qh4kIstFICJfwhsFGhwfwZZMWXIWl5p8n20bircAxB8hhIN08"
+    "KTDVIKxGAeahUs89lXsYGnk/kh9Mmzc5kpnY0CeQK6somduqz93HWgHOMUt3+oL5Ub8xjjCggw5o"
+    "Cc8nhhpDOR+0tpUC6Z+IVJID2N+o2BJDxEPqpsdFjoU417w4kY2CBhv60xFj7nRkF8P/nC/OLOZ8"
+    "BcuVEWGH4UnCdsfJaAVyTZjC0E7G/KVNqTo26AvNJT7jsnG8OHD46Gn+j1y919bepEW13yaTk2bW"
+    "p3b+K0u9HPIixP9tRv+G1BNnW8fsmXr2AXumT7eMxslX7qpP+zbeBmoIAS8auu3vzqenKPxG+uWn"
+    "nMoy9+mtreoLDRpgqtJ4guAELlnIhBbjzRBABafppjdTg6OFjVb1x+4/0P/vFPRN6G4yJceODCA+"
+    "fMAxoi9Kb4lf/+3sff/eWnP/+9k9XDxcr65nBjc2t48xKviR/oKtdn6BggVjQCah3AN+TpHYWqiO"
+    "heuGfc8JigvOeO4kgJGcbkjCjjuCJc/wGvshSnlPmCMOc1QSdK4PV4yXhm7GCMEiXImAUfwx1rDG"
+    "/myPtgDmq9oWm1UhqsxUR4ydkYJ5qXDJiUKW1M5nAI4TF7n1we3siQDl8UIKWAnSYEPzrAL11h8t"
+    "kANixy3HRNiA3U3+ptn1rIZNVZBaf8Lt28ckovlvvD5Uv3hpvLe8P2ylN/x0JevNTMpHqN84Z4R+"
+    "vQ4TlBeChwWla0bpKePCDxF6u9USlzp81+rOcsbTqrzm7AmGq/mVoYvsk7WoLYZKNz/5NT2dT98g"
+    "wnqhXQN+8j0KytZLMODWNbcfaaQELB/HBE3rFooUxEqy3dFLq+5Isx9W8GUBSEY4p4Rj+DTX4m6H"
+    "qK8ewGsYBhhhs5yyjfaswSvrRJrVMlYd9Uv4if4EBQ/cPrvvo+A4lf2tq4e2Nn62m3oZjOdZitkM"
+    "6nnVuLzb239Q7ryeHJq2NfeFqE6d1WL9bdmBq61ThpVNVB7UIjsUgksDFzp1CBn/goJm9+dYRu0O"
+    "TZAHQnQLobGjIdxyQKRnnoBAZELpTG66cCIoTXPDwhYPHKSG2xOonHdQkWRHC6Dozuwc1rZul6sk"
+    "ETiNhUHDCbpzS6s9kJT2ui3BqaX/Zm0xO92NAb3r5TgWzXcTTZ8vFdLoCMcKONKgcL76UO8UHb0R"
+    "uxsX6lo+n2NTQdfhpX9iIPbvvUeXxAQiFtlDpAxB544+/YAK/ploiOMS/osa6lsyDMXSTLtww20g"
+    "69+SNPoO72gYWgQkkIJnbpEDFdiITKfejEfy0QkMVXeRJGgfTxGTmz02dZviCY2AsA0Va1+fKCgM"
+    "WMnsytsME1MJatDUf6OYPbB2vDPzzY12fqXg3397QUYhOpPrqqa20h/n7tckPKlloY8WyUDSKbOJ"
+    "4K+omd6PlZA+nXD/eeWWDILOzsPmozqaornT5k35SfTvy7JPGNxMzHZymYfPE5bGYVamK4cIF7hu"
+    "FDgY/rJfVxa+A395f4E/9TTm3kmZWN1ZUbP/3oJ3/y8vmrt4Vx7sfGrudFfOGBfxMeYIjTfaaf3h"
+    "7e/fDW3T99/vLFzcOT/VXdRx/e0JO5r187Hbb0yt2aXi3Pk3gNFjWGzseKpJmDGZk4gM2hUaUoyn"
+    "uMSpzRxazFORMyuccjjWmAjSH4UaACMAs3LNGc8XsmiBjrHSIOxrczspGYGLjxSpXgrnF+phoQxD"
+    "1viV5FFrcGE9BB2VmGaWQFu2XPItjIQmtdqSaKU6DRVwkyOspJE8rIpHLGe3F53EcWLh2nzD6KgR"
+    "kblHofDZv6/cEb2/eHyyt6QqeP5RzrN4dZL+Izb7TBMyja8V37r7BH2pRn/ojf0Rp+Wymc7huyxD"
+    "UKKrIExWLsHGrb3Dw5xS6x1IEEejw3ibHXFtB7HWksCczL5jagMHgVVx4MAvLw+zDFBMQSHLfFRj"
+    "N91GFwkboixMXeEO43BdcRbCOGiPM08umP1RbU3bNu+ToVMtSIQx0KJ3FhhEuQZZTzMbEkrBt9Pq"
+    "w89bSP7S86lmgeM+Tr1dVXV69c/dXV7YU+svvVCF+FRcvhd37/3V9trq481ACnh3L5QhQamEHbr8"
+    "ipkXldjM1Jd5g8YaN5uXi4P6cnLrrISbsTqX26cbupLDt2QLAlrUUfbZ87WOpC7r0q89MTvjkp+P"
+    "3j5mD2IlKq6MG6UNVRnEFptLWdAPbdsaaB0U8Ibat1+uSLnvuN6I3uYFpv6UYDanyUPtNUHrzIk7"
+    "acZgLrFjlmVkLlSgWIWIHNUdtJ3uUkFEh7QygQeHw0h+3IpYVhXW458VKcxTUU6cE2xfA5hqh0Ju"
+    "q0IRxiM2+/hun6aFTwYl5tFLHIte2NCR7pDu1zlwsjX86CdtpYkY/UofsF+jGQNozF8UHVlCLbp2"
+    "jUBYztNu6kH2Jw8XsrRK6eKgvM3IpTz2i0bsm6v6LQNzGoG09k8R/1x0ZMVX9UZfixck17wzO9kv"
+    "Sr083hB/f0RSm3Xwz3X0BHSrwMbHoCzQaOF5c2NQlvCmNdGzg/9UOnELHFT+ukAIusj8fAnrTTVr"
+    "lWMVxA5knMOQsXAXvClhzORpwNl7DBN5sbIWny1kUWOnymUUK2bGNRVAsAX5f8toPKuCR9Wao4P0"
+    "CsOixO1/cPDr/7w5/+nKd0F69d2pMXpwsPnBMP6Fq9f3C89v/81QfffLL39E+OVlavvdI3niz1RO"
+    "6dxf5wc+elbkQdZPTSZ+r5GvuTQ9348j0mNgPMC4wSHTO+VN00htQeY6xsjzu+IcgQM5YwPp0huM"
+    "Rj1cgDd/HNJI2hE7GPMQF38xOjQifzaWxjfvFqF4GUJQWDUmTE7uqR0ME4zOCXJ3zBKkib72JxOL"
+    "i4EEfg4IShFTCvcJScI5VZsUfk2AIdsg1rewNs0dLnz5cpbbyiWVR49n9taqmPi6mVx/TcjOZVuU"
+    "Gfm+RHxq+t63N0i93h0qY+Y3d86HUXay8/2Ws7bVF8aQ8BKl287RVV4GeObJHuB64NN0n59jD/LI"
+    "ZXYmKLP3pjYH7wwDboWX+N7Vp1dHXkmn7t7/V2af1iTxCwscesK5EmaJpiqATkcsSnI0yV2bMmRo"
+    "Jk84ygVq7yVtzgsxgc/2Gftevc5QUa38wUiD6v10yzmLoOweM3ZbkEwOC6HeUKzv0SvSr7nI/LEN"
+    "94H41q47Q+khB7CWTBVySQ1SeXtrY+2Vyc/x8Ux1yCanDuw8EfvXvzV4uV/ftcwrSXN0jcsaqdNA"
+    "MpIRuCXJBjo8yqN18c9iaKLmM8y6dR6T7w+sLWgEDsxSALVje4273S4gMD08TXB7jjQtsr6dg4la"
+    "fjdK+0vXQk14UOFf7k6aBURB1aZHe8rpd1UpTOiR3IkDMFzOLtGDpp6yzbqB/B9NY9y2O3bbEeIa"
+    "BD6Z7EXA5/67NynwJqpbHAtRv58F7kwICZzZn9rxIGSUJLopeAvWxYPNmakqd5thEWybVN3ugLq+"
+    "sbHjEJKzhVN4mZhwsbvVaF/hwZsCnKBsv4hWETYlowTABQ/KjyhKyay+70rerHsAgjXiCdxcZkR9"
+    "MasPpi+QEqahngaEJ+eoAi59GrCd0/R7DAp+FdavfFlu2QTZ2uoZd61fLT443h7z/bHz68fTg8eq"
+    "VXh/X7dLFVserLa5ZLuWFD18O6JtG1NW0W9UYTWGz2qFOWTLKBvPxHj8IW90bFDrjS/iRyxnEnza"
+    "2MfU1x1TM4hQUdAdlBXyoU8+K39MlWCAb88reVhJ/JE3L8rJScpz2eqrPynb/6u/f+y/7+/rdVTF"
+    "UuwoUHLjxwHjyga/izFyfv/PVHn/yno5WjP9gfjq7tHx8tLutLUN69cjhc5UXpNe3euGmjbZ6Gre"
+    "H0iHlZdF6/ZBTjC6AYMzxoMAKQZUyYxpGeh+DzEeak4feArjJh9BzA+OQnQcgg5sB4XxkxMNZ4AY"
+    "McwgqG5oaTMBmVsQU+QjZwNQTBbrnE5ik+eFEKptdEgS7wlJqj+a0UprkfpJt6cRAck256+JGJ6V"
+    "ESW5UWPxRTUwSKAhiFmVJTTSq/xqzGpVgAFtGJQqcha77nz7QQsxHTDUZ9s+nOtYfDzto9fTzggb"
+    "rAfn0kQDMdmy+vFYXRslZaNtteeb/6Bgrje2yhv1S9nMoJ7dgS48omioQFnEus46wstseExF3KHM"
+    "2mIhA2yOmCMGDWBoCLV/yj70WiH5Y7TY9+eKNhQjTsaDk59FpP1IehzsaBRwysB7yOUR5+l40xOe"
+    "ixy/xOmzr2y1xbsTcIKbfxgCqkLtRnstpFrmPV2wT6L2u3YNgfiJQY/iIZPwUbo5Mf2SIvOtcP/3"
+    "CyJ9A67+W1nZ3bGk6eo+GrENJbz7ml33jryoOd1dXbar4TOhSNuMYClcFSrUlHSydw9gtqU53RT9"
+    "XCe3Sk1zIsJ5nx4qApEzzGujskn86VcuT8SF9P/KTYHSCvgJLV00Beh5vZZQTRCZT7rpGk+rU59y"
+    "jqNdZnZkdtKC1sTZQFyzTpYYMBhQ5pvaJhIwf2xTclozw87rwAVHl3ctuCCuyvA96zGAjCAg6JpC"
+    "1b9Pi0h6jwwEpo3V0L7MQnfNOjqxg2JSf52CfJ8gey7gvG44lLNrK2WZLY216MH2BESgex09iNyt"
+    "SVjWTIKkcYdgXKLVaE1tG4GWiDEYmIwudNhOEor/qIblkxo882cJoF1xeSyWIyRmzpDSpEiuNPMd"
+    "g+aDkYVHnt0k/P9DSO1yO91hEnXYNriBucct3wcrmhb7/cGd6/d6wfH98bHuh36vZ4tVlNgrw+Xa"
+    "c/4QqPpdGG7n4v9YH0NX4TiA2eyijXhkix8LFXlXMVdEpa+RisemM1NiuIaJ/6Oqw8dHi4cUNy9m"
+    "ejpXPsk+hCDBmF0aeioM9lAVF7cLueOqktOFR3WoXaoWi5vn559+nzv/yHD372f4ht08wXpwsPXH"
+    "jgd+6Bo5XTtfc/fvSdT3Yf/uXh8d7XTlaPtzaXx8ObG6fDjTd07W7qAtYr354PGQS4pjWms5fL5a"
+    "8zAx63bqDA0xsYUzKCMBYxtiRknCE9jjfO6MTYUrweczyOgAkdpimQZdy2esqNjw7GVKDMoTxrit"
+    "hHPfgO3gQLiUs0Bi3bT8nnFVk3p5kRbWdIlKEUrT1GYssEx9yKCp9GFUWb4cZGxnUxw89B3qCorg"
+    "AAIABJREFUuWUm31k/cBVcffisIyKVFAf+z5G0SGzIYKgDeeYE1PDE7EQv3i70lO7qpp7QLR8NW+"
+    "sH/mkrz0dyoZ/kFQSYbnfXg3E/eaATuv1BJ1CelO0umm9ZFqH7C/VECttyA3hUGinK6wii0L0ZRq"
+    "cFm+y4cdEfvJgCHZysIxqzRfG7+Bqv4y5W3CTiMZzJnOUZ+7545mykc8ypoilrusmxNY2FN/PXTK"
+    "6j6pIAr3hmPmKeJvjJbJgqbw0jZS7HngB83srr32sefYlEqyPmEK/X8O008npCt3Np8z7sX5UQT5"
+    "1za6/fuPr0nRs7vzg6ODrMnYJ0ZPcBGo07N8pwETkocuMoA53guNMarLgQ3NAqZkGXNs1mDBQ2CM"
+    "DBx+F2njQYE6F0dPcH0yZ+UPI0hYJ5B4XHr/dhc4Dr9TYMzyDVMvAm7UjFDOawMbCDGxvbjiqMza"
+    "oD8LaENHKWRUc2G3lqYSmD4Yfyxug7l0qRL5JiHSMpqCqMJIwChx+At5Guk2gYq0AbYoh1jRcrdR"
+    "JRB76PX8CuwUByqWMEc/EJQbxuefFFJnyekKwh+ekJqk0Y/WArYpbk8aX6hmxKf2le2SQJ2Lp9Cz"
+    "qVEJ1BZ7RPedLxeA+6MImuiJA7bCJJHzTmw/aPGeqETcaWLG4rF1q9+5SkfU2AoSP9Hp85YxQWAT"
+    "xl8+fceG1BCwJeR8J3nuiwQPwny+Vw+3A5/O3Dg+F/3Hk1fPrseHgpoBPd7UaHv9BGBq1KlmMpeT"
+    "aIS8qkiS9j4XfssrHLRtDPvbyJiv/s5PICvQQzTRMuaeqaVx+UE67+HdIeYyZEScQ/FjQ/BS3j/o"
+    "Bz0SOi+x2F+q853JMkHLnMjL9+aX3zj/773/7d//3ixd4fUHYRLjxw4YHfvQceP1+5/jcf3vpzjf"
+    "Tf1RW8faTNzsrRk+HG+sPh7bc0EPGStBb3PGjxaKJrfUUbusxxzJceDDz61EiS8SNkCZNgcKik6R"
+    "mDPNaCx/gBzz8RolcQjGfF1iLTuFYKGbwcNI6ZVydIM7lexMLaN7fC3LLMe5LxgSBYOvxEKmMqKm"
+    "JPxsvOp/LkIo5/sBUUP23sCpijV0lyLqF1Kvk5n7hMJ2IF266TvBdb58JKp3zijZDO9kNAXBPmWO"
+    "pGkZsTY2sdpDluQ5v7ra1Xw9bprsj62FOtP2yxhUBm3ZNYvz5vGyf9KAw+HLKMSPaRws4GsWGWNc"
+    "MXnNjswRWEOYMo/Ftp00XQxgN3t84uiW9llcqsVayOwcYuVWbeTJ2Gx3xjohAN1AitBbApTXKWHf"
+    "W1VMfwdHqSnqXsL/JwibuAqWPXq0sbx26xcvidSP1oK4JpoYfQfUrNrbJuKzlGWsTXwGJunaZTNM"
+    "IUEx1D7cD6ky871FPThzd2Lu1Gz1fjXFfnuTf2+R+/+877JwevHuN6jsOjQzceOf5oPujuEFRHHX"
+    "e+WWGhS94L+xrs+BZBDzJip6wbPOJCA7BCLuaQSGfhn8U6i/z8dEF6yEKvsNF7c7HZKvPPnyL1Ah"
+    "n42KaBCeMVvKFBnjzimOL6cNHTZCFmgIzdXKdtI8XulOrU2dhoweqnT8WLkggoEb9BIu2/siM0k7"
+    "0Y7s2kH71LvvVhTQfS0OHxAhp829xWN2dsIdf1TDyhkX/9cBvFTa5CtxnxsdrYRGGSH+1V2t+sOU"
+    "GbjQ2KdYo/bYM18ULjxmrO2ehJYLIpM0PaT7rBot5MOrGjNhGF2bqI3d/Ea32qD1VCzE1rak7QsM"
+    "1BfsQOgnmFg0DXM/ToxH6ezlkFmzhp8M8XYKMOv+Ih9eB4oaDPnByL/mJDv1O33Bp++Gh1+Gv9pM"
+    "FHj06GJ4cnw6vSvBAguGze+MKUDfQo9mZP9mFhNne6JlTG0z3bYptlvfL0C2KOtpk4/qFOs76hXO"
+    "ocmRZKv578J5E4UdwEXDPvy1BZUHmzjsViQMTo2KI/7DrWK1qry5Nrz/Ze/Oe//sGP/kIM/z97b/"
+    "7kyXVd+WUt36reG2iA3WjspEhKJDXyjJaZGI5GsjWWKFkjKcJh+1/0Dw4HY8I0ZSlkipREgQRIAg"
+    "RBrASIhWjsQHdXd9de5fM5597MLFBjj2ekEYuqV5X53rvv3nPv29/LzG/mWbOdnE5K4KQE/lFL4L"
+    "HnP3jgB9fe+rXF6urFA41Dd3b0WN3BzeHetY3h3k/od1PLPBnFOCzPdz3kaVzLTa4aP5REXzeLx4"
+    "CMAz0WmE4uNRZ4DNEcetTVuMFqEGbGjgw55vdQbbCW11iveYLxhq8raUaWWAlZEL5geTrxXKlxzV"
+    "ecNJrWmO9xS5+WYbS1Qj064TlKfPzx7w0ZRsmImlpsYtuf8TUxm+wVbS18i5Pc8WfTnA/xl4/nVO"
+    "xtfWM5JRX0lAdjM4c12bdYFIta+VZK44+83t2KUZDe0I7QhXnADEM56J/8a/G9tLI3rOltlxe0ob"
+    "u0uD2c03ss9vR5K56kyuP1KAYojrJ2PWCJDB7XNE6GlzkivJMU+rBJpVBEZLtckarMY5r0zvNfWM"
+    "iTBgZ/irgeLVxhYMI+nltf647fGEY0cGyZSVfSEaACG7lmeTAfMuVGnibM/DENvPkhnlxQaGbsxD"
+    "zyq4P+AKUATBtZW7kSsUt/7j+dbludVbVx1jiAiMv6i8kQtLDM6a5fsTUyAeuHvexGnrbk+lO6ZO"
+    "+cWqy/dvdp3e49Ro4Wdxzc7i8+evWF1d29t1lwUTG9IWLgcoVRBV5sJktuJDQec4vHtemarPyKX4"
+    "1D/3WkY+ZlJ3khBunG8UgbMWi4pGnspEFIBwNv2gaNK5MKst6ciYVG2bpgjFThENM/G8PGjxLJce"
+    "VGEfQwqIOJ6zt3hLMZUV4UHnXXJmDcDMAox+YRHaZjkOCcB+OCkHIZ6SFZljRcyiT1QKZ6MATM9g"
+    "lrrrfvjkFDFxsvYwgLExRxvPNOGmFPZvbpuGwkUrc8Gkm62EDgFCDkHKQsHHJSn5pKEoNK6k6p4A"
+    "Qs9LZPdNunZA8cRJAVr/OpeA823qQ4Mdqwj00OVpg35L87DKz4MaEHO8pqKofCBEt/mDE5F0JwnQ"
+    "dnRnrFp+JivKPUkMmhzZguZCx8sDxQu9LBGyv5fhN1s6Mt2TuHq8PzH60MT769N7z8/u6wsbfil6"
+    "XoyoDz1Z9GWNGCiU0bp2UR/UinrpqiFzoHlze4K7hcdOxwW8fKdMw2rrLVNSVGOcqh205yC80Jwh"
+    "UvgHLtK6SwzyMt7Kk3ypA4dcaFDvpVAOXJHpXc6un1s49+59kXv3Rr6+B+g5+cTkrgpAT+0UrgrV"
+    "vDpa9895lfv7ax8dm9rdvndrf11l49Er66f2v45L18i0zjJcOANj35nZz6tOIaOTLGeAxRujp+P5"
+    "XgscM5YhzMWK0BOGNn5TRjCkCMGDWmECCKPvAyGDmSoUgJTmPcYt5mPEKDyOJNUsYiA4iQEQmfVB"
+    "3M9SAam7kBehzLEbaZ3msydiENnw5kcOOCWoRxXCTMn6GkqVRFKJKkEzecgZBXIDsZKIDIAYZeWW"
+    "IbESKIDQrYlS/+6CS98IvDXiX2Y5uGk5LmNa4xeaqk9MQIAUu/DuY7vkm3WNka7h4+Gs7q8xWsna"
+    "CpBQiL+VRR5KPUk2PMcQatgSRnL0zFSZmFGmnaCuVOfijHSoeH/PtIuUBqWQvMTtjDusJ1J7r5yj"
+    "y8UjlKTLqwEXuid9IfjMYzC9IxffLnJCkx/0yZbZ7xANGuzOsoCsdjtEOpXHBNPKzYSz+wk3fERt"
+    "FJcSphBVwWpmGfytK1AwcW6OB/dogYgJmsaUKdoVvOZgAjXtsBPNUVAQPv7y9tXDh7/oULpw43mn"
+    "wc/LTKY2DpA1fvfeviYvUnbEjmB5XlhuKGQGOg0nGie4OkzqfGlXCnpcGwoGfAxe9BKINADwDVOV"
+    "3VCVsG/pYxBhsVropFP4vieeOedHfnwb4M3bGUVkgIarDdCIUNju2rgSgdgaaH7bREHLg6S/8IpB"
+    "Bv3px0a3HNHUnxgIeAuWebDserHNnY2oFbxlHuOJuqU3fQ7pwjH0w2SEzC88bGZZM7JF1f8KQcC6"
+    "vivssFhvI4tx862lvf1NEjD2/T5uVkKGF1nbSd0JNnzEx+4QGnXXCc41Fv0oSS7KVcHXF2PWl7eU"
+    "B+RiDSwP5pfKNHRTBlVdsKwRtm4Ry1pawg3QfxWjw4SB1LJwbIDuA5vHnT6LWsic6PTSqrC91xW8"
+    "j3plXt7FC/L92T3A3hvnRzeXhKryN67T19q25vadjSN+n86Ka+CbmkD/fyGxU2bAu9YGXVjymIRJ"
+    "vy5i328Hs1DkqVuqds0lRlF2VUi4UUgerXpUZ9SaDKIvOn8oq0n6kiJ2TOLC4DygeZHOKzHcgk70"
+    "5X/tAf6OhyEYmHjd1iZS3lNgznN+5s/uqTzzz3G0o6p+PEnZTASQn8I5SAXlR55vEfvPfpp1/+yX"
+    "+3dePDK4f728u3t7c1DuhzBfqQ9CO6O7emt1wu+XWWdRfLPVzzlT+jwkjB3EV/V8+vYaMD6f8ZTR"
+    "ifmCOhZT6tDHvAiITH4YonlYjkPIckwWdheS6R3zK9Rsi8VtiWFgJCXrzWplJxj1Aa19iUZDCHpm"
+    "xZ1AImMAcEALB5WJCSb/bkVSyVx6kswAqvxRW2H0XOOHGcx+6UUAhs7AiJYS5rQ5XWeQgzfMF2vD"
+    "AJ20zmAs1HVgjRgBGwDmho0xxQo7hiqltwdEHx9PrOcF536U4tbw1n9QmL5cNd38EzOAqsr+sKLF"
+    "uXC4bMfUCjQQHCXivBhjYXgACKx+SPnSzbNPGT+8iFaPWVTltDR7tuIx33xeJiSDGUdOm3OTP5lh"
+    "v9Tvu4L4YmYYDXDyUEfUyDZiWViCd+THL5EGWtK3/Ml/jBS/nBGzR8ytJlIZK4oogwQR/wSsZqOL"
+    "cDnaMdOiIXSvHGMOnMOpU0+BCdpGO/5bDHAZ06bCjsX75+z4ULL62vDdeb5Tj43V1/5m29fPfFW/"
+    "fdde5HaytLWlZSUUvDnl4+koalWnCl0YFITDqVxItHaHRs1Hz3g0oXl6/4i07zMZ3OrL8SR9Q6GH"
+    "jz8eFUvc9KNKd830ViAyACMh6oq5m48aLN/ADyP3Vi043RnUD2ADK66PTjFh6As8GBg86Oy1Uswh"
+    "zpSL6DJZsaq+2wARYLTuwR9UjvSNnEjKlMjA4mesTPnzuotdqQ0Emb4wmoB8Umg+XBzGKKVRkoik"
+    "mO23YJdB7wqcv5h9zN6nwjIst8pCTa8t6oKcmu6amnkiMFxTBVHVU2nRfykzKMjoQNJ3pe6MKGvu"
+    "n41lNK3b6gKO72UngjP1BOw4jIBj32wZcFAOWRdgx/8KiJmO/FiAXRE5oQCpvBi0JATo+oyPfGTD"
+    "532+gjvJmSS1WHejbIedDV7g1dFHh5U7+re3dveFbfqvtgb3nYXV2XlO7GKZ07cPxOjo+O+82Wwu"
+    "AFKbqUkD/yhS4hewpmgq9v1fHBXxYpzod44mIvppAf50m+NAkneQ0nfBInozOHHOlg6hSfshDfeI"
+    "jOusFlqTCjgDd/uoixzC1G8e4rP6dXFle+94Mn/2Bna+8hQbJvPXEnJXBSAv81S0BDx1tv3br3f/"
+    "vbp/7tuxs3fnnY2dPduZ1hd0sXlvS9sctrm8Ple3eHU7yqng2dLiod6nFEHntnaPCIYV9hDwy95G"
+    "FUyoiowc9jBdkaxw6FGBkgZCxhnMmRC2yE2yEV12MMww8OGyaX8Qg8Y4IHo9ch0yYOfrRbueUVhg"
+    "+SMsGGKrjFg0A7k4q3aaMfY5Dt8XFMqgDl1bajMHZGn9XbMkKjQAJF6vE4+JI7giEmV0LpxxzkXB"
+    "6F5zLusC0wC0hs4qgz/0jSooSZd7l4p8cw9VTJyrA1XFi/PZw5uC7OW35iBJVtFzsH7uBms4QejK"
+    "g20ZXF7gI68JKlLrJJQDZlknLJnAIKDikLECbidpXNhcvcSDCR7pJRiBxZ0vT5ibkPF52zFJGNh3"
+    "ElShDXviPF5/DsVKymOEyeKh24gkw6eZDrfDuCzclQorNz86W8KS9yGHvTthRz3iEGd1RuPso0aT"
+    "ofcaaXdeiZNrwSsEwL4qtbkS+Uc+DmYUS4AENn6jyahXXmASuga/fde9fr/GzkOLke3X7mbda9gM"
+    "1funzX8+qKH1HEffWdpsiGhwVkOxqTG5TorkOd3NBYtGpT0rIkghVaZAhD9ZU0AKtF9MISPKXqgB"
+    "+s0gVdevd0p6KvwiGOSyOn3SAdPlAk4LhpHY8CmaZFMb97w0gd7twKooP85rt3spVGqz83TsPT0L"
+    "MxhLc7GDocJiDn8knAdjhue5KflJeQhe8NmXyspTigYTt3YnCo9VF0p4vm3InPvtJI9iYQuywYWs"
+    "uDSV5wyW/CI57S/b1B60m9Fbttgs+8EnMZqZxwTfcdTaVNpe7kyb4wh1hycEuty9T1TZuSHuq4cV"
+    "OWxFsUDbSh6Hf7AkTpXFiY7qzGTiuovMPWdUNZgATwXJfbnAci0VXXbHJJD2sGYJR1m40ZwSIc64"
+    "iziODQD4D92AoLGB2aAblLxwZay6ThxmJleGXv1PDE+8PwjD5r8NbG3nBHk+K++HI3TvkQH72NO3"
+    "0L2baqYyFFfKA8Gzzu3LEJhI82If1VF7ZTaa5z58I5mZVn8i+RI45+HAfaVG7N12WWDXVzpt6IoR"
+    "8I6vJAdrp7UgEmKh+LvbN3tnZ+/TvPPv+bYtd79E7cSQmclMB/tRJQh7xxe/v8f3j8pX/xzVdf+Z"
+    "2bw8qV3cXK6V0GJW7b3bo13Hd+dzh/Tm+yW7ot4k7GQfVfujFzzcEBYTq5rseoj0PXpM1JRzxGI4"
+    "+7bOB8MJYwPjGqZNw0ey3QPa7UIKORKSA6w8vhsbjggSDuaG8UzAqvnA3CmghUNGngmU3yARAdja"
+    "WDxIKJQCklfx20YEWKGZua0vpLIcgd/JhPGY1StpvYUbvbrhYFK3IRhXuGAVtAjpoxllMlwldmuS"
+    "QBM0z0jfOpNnUas/VNujvDOf2O7i5t9tf1CObSkh7PdUUwT+iPaU46OLIkg16YnUdHWWfRVnDwMj"
+    "eSHzwKkQujSaNsnFuVPekxV2frpV0l524LCBkj0mq9IoAdKRDbgdvlTipF4zxEtNniz8ULK6R5gl"
+    "WX3QlzQdPYMzS3YcWx2j9DQC86yw//UdyZuIPuQ+JHLIUWjuRJYcSZex0gLWWoJU3SINnlYkfSJ5"
+    "2ph3BYh5LG9bgJSpOPxCiFULlc0JX2IvW6fW//YFPf2X1RN5CO1RsuyVa31s7jz7K/9+kH731pZX"
+    "/3I97Qx0KWDY936bLaTdI1TBZoGFM19gLYjZMOJkdH9SEMKp06nRaU4TGCTr0JoSHC49frG6VOhU"
+    "mMu3n+Ia5o6bx0SOmSHPJgjrpKznpI0b9YlJ4/FurIZGJKK8+VInJHXA1dHcITFriVJ4Csq/HL74"
+    "GPKJhsCse7FCpP7Bqd0pPf2N50216DHBjYDq1lx4Gg8ms5Z0oc/BMGGxnKRfZ7U6A4dQqNPP00jo"
+    "VtM5hs2ODJo6Flq+S6U7Y8vM6H0xhsgx3LkyYY07FLAXnZECsi6dQj4dQhLFO3Ac95sh6zT/mTDH"
+    "/oMp9sIG9z5/orQnjRpD9w9YejjClrnDeHpqc8TKPMbIdZYqeC6HWZip8y7rJe0W01rJKIjti20C"
+    "cMeCR3hd/BcadKafu6OMHnPTTADR+J8MbuqeF77w7D029s67MGw7CtK+H6jog2aboyKjCelFnWDL"
+    "kqW40tnIXw/Ds6FZl6xngXD3zf3UNONuQpm7RBl7OzMpV9ckY8IUqJyBh1fjtt8l03GFOCllDU1S"
+    "DfTiAuh4rCrorSIhHblx795hPf+92bN+98VtTTxXLinZTASQn8A5YA89v+wdLKtQ83r375B8/91q"
+    "2ltc/vL1bu4YLYjsaYQ73w4sLexvCp+04NZ84prt9MMeId8LIQljW++89SMWsFr9o8WKhzawXHOO"
+    "AhAVqNAx4rQCGBwwMBqESZb+VEQ7qdR2n4jKEUkgiXXxDBdKQSOwF2jc3z8buxDVS4oZXeXoGiSD"
+    "htN8qzHggN+pQNgHTYwMn+xINuGxxEnsDER5lEVDQFSO45dtRf/PCZ1wjB6Dio4LZMY0z1BT+6Im"
+    "d2Tpoj+COtncteEcZywloMWvH6+ubwiTMbek7+PY3fm2oNedMpeWoZ2w+a4DhYTzCvk7NooAymo7"
+    "X6sV7mzDIiG0IuHKAbIidbE18Y08rKBiRvYrNucWm2tW5kU+4g/LQbadgV9NKpiMDaxv8XyaNJpQ"
+    "w0gj9VJ8VNOmuHXltx82TUXzxeo2IDmbKjHLueY7nPPhWPws4JNA4KU//+GcaIA1jWW5QkNZScGg"
+    "j2qcwguRxihznACytAzmPnk4ZDUtvAW+99gVxfcTp/5szzl86u6hL28XLTyvQY2P3glXt+sr6380"
+    "Y3Gq68e1OnwZa3mvKYFJVDhZHmClIFE3eH1QKT6kO+N0s0AFoFDSNHmos3K6SJCj+Pd9JpOVj85a"
+    "6IJgw6Mlzi6WPegKBNcfCKt3wSScdGL/YdUaJo5sYGjjBZB7/R4+6Jmco+uNEVlzw63yzkne/SIZ"
+    "xsCuDEtm4CvBSj7vSMtpQNyHjjW2UrPeTbd8HY3JVtIIrDeXFZWEXbxHibARd+Zys5nCY0YblDad"
+    "LGYaedy6dyKwzKqcs6dz2jM3mBucTosOQF+5qYJNvZ5eV08VjfWIaRmORZLMSuQhduHrcExyrIKu"
+    "qxT0Hyq5IqjaJjC3/yrZskytIefnjbBwtgPDY5OMs5GJ3GlL4xLYGsX2Rv7qIKt2wEhsUJ1c4dMz"
+    "ZVuaahjZgGTJ44XFX7XiiwWOij4kBTH2pvO0p7e//U8IzeNfvca7eHt2/pTp3eNHfg39VpmC9sbA"
+    "RrXThs1jSd2icPNEVv8JQrbwIFrzeNu9wwnZKzTp1oC4QdJ7Fc01gIuTwoN+nkAKpd1x1ZINzOdG"
+    "mSaZJRPZVOL4awXYXD2zwPlW+NL+t3tnb/+WNPPsNdursa48Q/KYGTEviHKgH6sR6YO9hd//Onfv"
+    "z5F9+9+S9vDfv3b+9uLba1kbujY3lPL7842Bku6775qu7C6JadjdHlKPfpnOjgzGnMO4wBzC8KQM"
+    "YxttjX2C5ijx6MD7Aw/pgVPtEyhjQXgnIGCCZ6GO88FpHmoBGIAaiTMItkUcgmCHcULYYmoB95zp"
+    "3kKAvr2VwCkzGS3zku7HYGKrTKE/M4Dv6Cl08NTNkztNJhdfm0HdgIrxh8lAxhA5DaoAq3i22JjW"
+    "HzTcwFbZv80xKzBzh3T5VPFLFOaDFNQqu6S3fm9PXh/PIHw9ryzazVXCRiQrxcb0s63omtl3g/mk"
+    "k51zRrdspHX0XmXPUHGXw45VpP+V4LANx2wkPkCAl9IokPtjlrlxHNq+etcBnIaw6Xv/S57MdNf9"
+    "KPnNs2Z3SWUnqdB4G0Thsiu9R0y97k2XrgExnICTbWu3ysI22p1Tl/6ofGF9F9q+un4mwe27nfWQ"
+    "Flq3qQRjZ3LX9Ue3hcC7YNPUHyukc4RLO+z3qXfUJ0xKblpZUP77104Ufnzw/bbcNx8dOTj4m1Vy"
+    "9/4v1L6+vPqHPccgevBT+VwWLcbY4eIedNS9GpcFcgg3k3P6WxgWFzZKckPw6n2oc3TrVPo1C8D+"
+    "iE3QiV1o4gR/gIx6ajfGpmortBMVmgp7BNNDjWzhbwpcC8CjMpzbHhNqahhElHaeySBRseXPvkkc"
+    "HKG0PssFZ3A5mkhbRxowsb+0A+GxXQwJjygQZpN6/D5A0avg5kfYiGOW2LbUaHnDdVlcYGyvLV+d"
+    "HlQwtt6COewSyegc15UX2Kn87K0bJdjlhm/WWT8weE48k36c1PksM201alxMionfKmNmjM4hltLH"
+    "tgQ29jOgyNsimeTosdAe8N4kRrpRRUy2N66a88KYZII0sPoyaLDmhYRz2jG4w89sHbLp0GL3VbPN"
+    "y9Q25fG723hzPDU/o6y/feuK1v1S3p8cuVYU+6ueO7okebvBFjkNRGbyEEbxyFygaO6+dsGlc0K4"
+    "lTd+ZkDzyKw4ctMsa6XZZKIw69D1jahYd81qEEyhVmynIqz5YQnWKARTK+KAGvk3NuPViju5NL59"
+    "bXHv7+s8/+1tvvXP8VsZ18bHwqypPQSQn8A5TAkrZnS4vn39l/5MtPv/KbH2zuf25rf39tV/P19o"
+    "7Gcy1Wl3e3hvtO7QwPXtKj3XohyvKS1l7q2B4P3I11SnfWOMRr7ivuu3N0eGHoD6dRSGeNQi3CeM"
+    "N4wngOg+efhtPoqLTGNmzrETcYOI+1DjGKaKwBqxapsVGM4Ni1YiIBsHyp8ehXvJYV3ZvTUmYUTs"
+    "AUzWNgrC9MJypcjGWrx8jS6Txbj3hcTrEmFkkU5whjbaImAe2pJfnHBGOZZcaI+E+BpazLBEvEdg"
+    "VH0Q7E97fo9PvtgXqVXr/BC4M4hL+yuj+c0+/o7l7X2y5X9ekCPWXCNcmD/dowWYtZo882KU/Ks1"
+    "9dT9koJaaiM3qZDbHfh1OjD5DUC/HMOfxOb15GvlgowpwWOc5yEqVFkg5Wl9OROQy+GGWLrHNGc7"
+    "DSCZt3HjcxdMiUM75UKt864XOqPCQCIc52WaJtlJB4LRPDFXZMZOoVuYpXsNOLHP2C6YvlmOHD0D"
+    "pJfMznx9PAxKEiaiTb5Q8K5sUnPNcNJn99U0Iry+wh1PH0BNNr991z8SfqspMwAMfAHasN3ZlTK9"
+    "evXDr//f2d3dsH1YDYlPAGPQZdHhtb0sIzmxV6+typbrxAFc2NLRU6NhY1CDYTvhNSjYhuTTuBzp"
+    "1AjubPhpFFbB9MGmlA0DpsvxqZiXVyg6o80NTc8GRidzI2IO4Uc36swc5euFc+sNk2Si+43QqR96"
+    "atsOAB1zzV0HsTAkZkyTO5nnUGMOGXPzrF0QNlTAMDmvlmvMU31yuS+cJbFpdN/mZc44gGT/gkQ3"
+    "lXPSBl3eWbR0RoHkBlzVQ/1En0NJ8IMOufsnbMJwYXstCDMERyltw1HxcJMgg43dl8pIhLAAAgAE"
+    "lEQVSNrWIM76wIsKlthWwbXU7h5YpUSrTx4SdcfoQsN8ryWBEcbbsDRKhDcKNHXvJDAKcELxhoC9"
+    "LLd+WYkWm2XXV6hlztjGWOck3TZlGjg4Fvc/VweO/U+eGJG4vhsTd3hxff2x0+0npqR7zL+r0dck"
+    "v6nMGS8LlivSYCj3ECQy75XR3406OY6sMygfHTtmA/tojf+sETv+uNsOg4bO2DeJef04VnfhLkcm"
+    "Weskz5AJJ04nIqg8iTX2mlnWmDKqJ+g3+wUF1/7uvffoI3Xt6to01A8sSdlMBJCfw9lsCeXnbyvZ"
+    "euX/1f/+qHv/X69cPf3FpdOT/s6ZHKfY0hy6eHM4v14V7N9Y98Ynm46+y2fqt7U9o1AOmOHStTxg"
+    "4/osCYoctG3vwopCFOLl1XI1WNm/DMurOCGp7Em4uHluixx0MHAwIwLYOPAP/yzcs8XKMdGyMONh"
+    "T6PR+bR8Th6/mAqGmQ+SuMjOvhIwy+daBHBEwwj9VyIuOMWfjgoEanwkTMUewR1adSDJ+xxnhk52"
+    "XDXJFknYsPGPNE2RjOhWUpnC/DJGN7KGCMqcN6FTYkPJ1WZUcCPLlLhxyux3LFnW9RmJ80J+o7on"
+    "pJjn5Dt3prOKe7t4sFvJ7CvP4JlsREG20g2HoVsi7SS51Zx1MlWDXlHNupT7O4LMODLiCmcgxgcY"
+    "Zf6TYQPsrRvj3HoTV9bo9x4Y/IqAOdlM90gBu8pHQrgoiBXa8TT0LQDWb9bq+JOtk2IUu+o9T8bW"
+    "98WKWnzYmkzz5ZFhMoIfI5JRnf+iLsu6VlUXIQ3p7bg6ezMJi/ccaQjP0yI3Qne31s82g76vN6B8"
+    "Zt/f7/hw984rx+XGKrw3hMzsn1MTEWMz/70JUX9bOcD7tdrepbNDwatayBY0m3wBm8qaC4BPx4pY"
+    "gs7sckMWQxywBL8yBFqFpl6parDrBEm7cwZBSn8U53fBioq0FL3CjzBk5Y6S3XDR8+HoXEJw1bvE"
+    "GQ/WCzmIwNtWGEJ+ClXzZolnBnEgYyLhMxte22P1Sf4YUW/FnVA6wDeBgpj9jZ+YIie8UTDLFXh7"
+    "Ec8sL2IRSCzlPJxA7AQw827MmD6co/ZYDDPozpcoOGfuNIJhsw6iwueIqRh8JwJ28ZSdsela0xzB"
+    "pp02kXlhNN+NDQ54zYRmfIyuDjDxtoTzhjyseOMW8gKI5L6TmYk/DdFvE9GVWZgSyaTvoHu+TB0X"
+    "/njQgXLbADR704mOgRe8yABSrT9IOwIuPn4i1DXoLD48S+o6bbaPCw6VqoLfIY5oEWVft7u8a6rd"
+    "elbKycHl64tTo89oY2dW9tDR9t6U4dhtB2daeOHOTNl3p0UXcAtQbToSWNNoTslXzHTrhgr2hDta"
+    "oDGe7gsbFbcqfWnUNBUiOYyoE74rt4Ukapg/CMTIoq1UelOOI72eqbROiJKcfUIfiuI9W3WJbXFm"
+    "ufeOmNt37jtbc++iUl6R1NJ+6kBE5K4O+7BOiOb944PP/lb//4V7/8+Iv//v3N/c9olbWmH84NfH"
+    "uON/Ce0p2WK2uHwycfXB4uXNjS2KG3GWpMob8v6TX1GqhkFuOFBhI2UawLNKX0my+9uaLbi4Mw42"
+    "jGcPo6IDmgjU/r9NjuNGHV2A6KxxwCjDD6Zz0Qhy87DKcTjnHb5IxnkDyOg1eYnvdMh19js+Uzi1"
+    "gvUIBaDeMVbGRQ/52mvPuRN5FJwCbyA7bFII+8ROQEZCwFyUI2UE6xTJkHnNJGlIQdF03jNukpT8"
+    "kmswFBn/gmySKPWbFBCMFWieXH2EkWHU4qGTBEy8H36O4MF89eHxaHN2XLHU02ungpfpd1owTAVF"
+    "IoKpefZyHA4c6awbLmz0xECnN08BCMwWO+m0T+qSucPNItV7ROst2ya16u4Y0oZ7cz57H5AKz0ok"
+    "/cJHTiaJ6TR5vNIR4pN/doEzaGq3nndlGDHbcIvARkA3Nop6GMsHmQgUHOunT2H+spESxvRlJx8M"
+    "5klDbKBdBclitcE3TyWtj9gXxNbWmsLwOhVH2EAUDOazmR9g4ONu6+cPZHn7jn1LH6XIEzQT46cF"
+    "z8zz58+drFg4PX1lUPK1zB8UJVKy6tFv2jTWUkDYWNEItWskgnpIFQiRwKpm2NA51pnPThcri9qR"
+    "BbOxqmGyq+iYAErhufF9nSN/KaA3VpVGl8afRp5UwYHkYMQTroq6v6BZJnmjIUeuntBuxssOgXPb"
+    "/ni32d99Y1+rLF9pdN7VE+oVeBCNg02WGsKFKYQb7zniJEtzc28ODkZ9LMXVI6kCXE52Sd2gb7pk"
+    "sWObA0i7gzSop/nDet8tFAXpwfpVFS7aBhhz9rwLMV5dBt/YWfttCpwmCmlFOy8cEY7RK8bcEu8f"
+    "hcvQU5Bi7+bLd4pkkcOXE7b8kvYdtuLVaZfBQueHP5WIUMdRMM2rINsbEph7EEsEVH63QZOV+huV"
+    "+UzYAA4W8Skm9s0x/v5F/i23QqA37/Nuzvyte35bjiyWZM8mv6TZ2LQI9T8pu6Q10R35Ds63oD5u"
+    "NvHwzPvHprePuDnWFHCvbYCcr+bFjVPzWx8QbMU6Kdks5VYa7oLWFky/0Uu5Qhx0VDHxs+BeViI3"
+    "b7MA0yeYGD9EqLgGki27nuKMgiINIDOWlocdmBN8rELj9CKprq59T+weGvfOuJ7/y2VpUPC2zUFC"
+    "0n55MSOCmB/9IS2NzcG/7Pbz332a888eIfX/tg99dub+1eGPZ19WdHvVT7tINtjUv6Dd1dy5vDA5"
+    "e29Fsp7srxU5fuuNr06YHNiplO15/6eyzMyAIXg0HE6dAe1xWfj6GRgAYfiVN6RUXSn+nFVwOJZZ"
+    "BT3C9eYoDTGOjxuoBRj3DrJFwmiZVNQ5x/n6dIxvngVRIACbJu4AABVYVrfZAU94WrUQNzVaGYF5"
+    "4qB/NUmrxYNfF2SnQgB5bs0oU422j9GUfBRA+qFEygAbALep/MEP4KkuqDcpYGJ+YuGmElsQPlbZ"
+    "Hs3LkYqG/QrZ+6MZxZendY1526hT6V4ycvyCN/iFFMOKAlfyR/ggMxTgzw2ED5XCTwXdDkt8uPcr"
+    "CTICHk8wgn8OJlfSOllM10AGvwucIAzCwIcM4ub2kwZim3rYJpEyb+sgnCLDilJ4R8r+9k3ceTbS"
+    "P0ziO+8+ByFzt2CD+SrGeqDTQuyWWc8bHF9oyBsh2ELh8HrUeVCkALGattEDFO6dD4A8X6JGK/7a"
+    "NfuszIy7S+Ii96AZxeUT9cu3rl3tfW11byo9zGPiZ+LVGPibUy8/7Ld/3kwvLS08u7B7d4dIs7WV"
+    "4Qa4G5p86y78oSYzWWsWJF4DdzaWjq+rwARI3RGwFvCmsQlCg8qu0G0RXAFBOVTqMnhbCbrzwaBi"
+    "3IC+dqVEpMQzJvYY+22ThjIMtiPhs70YUTbBDkbEd867fN2B19dA4wvOA3f9lPWK47lvMky924RW"
+    "9bwWwavvPWnTRmGgc7zOtY2S/d2DEfpNyVmLzEh238I9vy9p3WSeH0Y6Sa7GJDdFkV+ewyMCHl6j"
+    "I39MSLviNlh24d5CqbpjxGQ70nz8mHy8iyBrSWXgCgZ3zrkrB8V6fK7Kf0SU/KMzaygUQPeWu7nL"
+    "+P5cc2fqwnYjrGW77an0kwj86ljeWmJk9V/7QT/bnoZRc2ZEMrKu3dGzLauTZbVKKLgo0XtsuXLG"
+    "HdRPaG7kBjnZCVqA2eQr4Qa1OWh63lNb8s5fH3d4fvvH5rePW9TX/W4GBtTZOoFmMSO9S7xpf2tE"
+    "HURo7f1S2kk7dhcqvLemQAj2H2o5j+PYNt0Qn7yIvOPqBXOG0y7YZ24nzKd1nQDs1bccm0g45zus"
+    "aRjnOFNuWmXIrId+lYVOnVzct6ycvlV6+99qXX33jnixK91wAnp5MSOCmBv4cS0AJQc/JLr7535U"
+    "//9sk/eOvW7u+srK9f1bih181qDFla0wUefp+rR+j2rw8PX7w1PHR1Wy9e4g6deiwLZaygv7vPM2"
+    "5Ljt8y2TpGNIYSnSHoyJiseBJI1f+04LaY+Huh6zgnj0f4jBvSHQVO7nEev8PBtaCDdTJ/hGLzOA"
+    "hVitDFymgkZxvFZ1wGVPKb8S0MMPFTATHaHtLgsDSJcpUXyQbQRJ/IksU4EbFkyTstYyTj6oRoiX"
+    "BiF9NDDaTtA9VlEe7oDEafJ0TrrihQbNqO3ilsFNUts5TmNTvXRS4gpv4PhrXTW8PFU5vDYu+6bt"
+    "reYqoToPhlJ18ac0ZMAwFcl3iZgF7xaR7NgS3EixURZCKmfMeO1DmgzEVmiuCs1LpOXEaUWx/FE/"
+    "qkr9Ohp0xiOujYhBh0dDpOsFzoFYH3Y0FjQ0NQR0wuw+UFvtsNLPCVj1wrKD/6kZrxKNps0FPKhJ"
+    "onZdBrVetQWmSsrPRScsG2cIUpF6hY3WVUOTDV5dn2iUJ/Tp3y0jjGiOjQuxZ2F2unf/zo/fe8qb"
+    "rjpQLHzlVvOD52X1w/d/DAvXf9YHlv//qhKoN+yd05rr6oZrT4Sl6oo95ouEJF7gU2HHTANI4sAr"
+    "uReYM4a33d4BsDHxqLRzcGWg7KFPfiH18kv31Tvd+NTAtCb0qU1o2nNwzYgt3e0CiZjRYLbuurhg"
+    "ZHFqvoSKNFhg7QOkWVPZ15JFAlXNOUR/lRL1vtsCw88DlfxE3lhK3OlqlwT2WQ5DHdfPAroAP7vc"
+    "Es3GgygNMdVxr2GldnlzM4yj965oc3o2Js+4926pIRBn84p4uZPBsXQ/VPnYy/v8NOzUDJk+RKNz"
+    "J9+Oqoklz2ZaPxJWtjFHEeSkZUO2OapSyy7Qw66Dx6RCADaWwBOvlPvYhD8kc2nRgLGb4kx/6SS6"
+    "LOZUPrhY6M86Ny9l060agr/ZuuZDlmZoR1qIz48yOQSjNZJ3IDDuwHhzvD1trB8IEWXU/dXB6+eW"
+    "1n+OGbm/60wf4afTPfgOLbdofaGOYxTr3MQM2VF6P45Sjqy/wWljSmar6LRw/lZSlcmaZ7Yxt67b"
+    "gSa3touw6GTrriPuSRd87zsqJcTYauQz1JcfR0GaAZUrT5LbFSsro2nNHH1H/pL/72W3+0s7vzBb"
+    "GcPHqpQjhxJyXwX1wCGmfefOvtxZe/+cQ/++GHm793Z9i/vL2/NRxu6Q2WXGDc0RX0nR1dBNoezu"
+    "9+NFy9dGO496LSDu9UV9cAoTsnHEuH66JpVKnfkjFA0P+r02dYo4PbMXiQxpAR3+EiMwcwH9jBBx"
+    "YRxnGPEoT1z8CYoH3P58iZmRNMTpKfTaNjjEVyHpKM6WjsRaxsM47izI+MU23qaMOMBgL5LejRRy"
+    "hwMONSLq2izQN7xIXr43FLIm+EDhCpjBDgwFlYZ/kCChWfUGL4sTW0tjs75eKzkQp795xxOfLM8c"
+    "wYSrOh1JXmdd1gWdNjl+f0Tbq71u4Mp3gTKnOZLhognfkgePxUJzZw10upjjK/EMCjzMFV26qmAN"
+    "3zCAG5ntfdzgyruY4Kl6wvkIoGHIh+KoZM6r/nUFZCNCH9T7gwFwbCuWiBXaxbSMNJYgwrOIYn+l"
+    "iXpFW6+XRqe41fbRiWniPDrjNpOvxNOtSWIz1lqQAssOqUGwbNJTmlOXP2snYlFf6Uk+qE7qK4y8"
+    "QJ1BNM/i9msPqABEPSe5NW3BOfNaAl9Y5t/KxkNMjyQj083Lj77PkXrlw6/ZZSVdDHz82a57Ex/u"
+    "CXH73/5dWlnTd4MQqVxD+DPlf1uXPgQU8V1pXtBmCmpsXvzVDE6ex11YvOJUjLVeNxox0bj9LdIC"
+    "YebzowY8So8pQMsuhgYmCCwKGbVp7G2wtI58Zpo25J9tVHdwpLB6uCthMsv7ETJhmPvJWKiYX73J"
+    "E724mt4nM5ISY5b8QIGIdBRJIc0NoVrcukywK9xhIfV0GQcT4AMFDSW67z2BtveEZ7nG8wCrMg2t"
+    "aYIiJOcj3pku7JVOS2hfzCSem6vKkH5yd54kwcvzfa3swhV3Yj3QMNvNzlQ28swMjCKByDGa/zZB"
+    "ZREJsGtI7bPtEnm6u92E6wqcO0pYSRxKo41wG6xZeNqPjJkFzKmfEJm02pJGuFYEeTjjryymaVgZ"
+    "n2k4sXjuuO1ao2xtxJ4xFN7dBUFrtqT7vDrrY3G2uL4UebK3pZytbw9I9vDG9+qN++rKwNw9q6wM"
+    "mD2rquwiyp/BZqf0oZ1kTnQhmbRr/tUhMWHyDnYKpeoEuGq9XKvvKJs+mTjUmDHoefoymkMZHrTy"
+    "SXZOEgAY20dgmnDPxyAzF4wuW3tcurd7370ca/+upfPPbvxf+IDp5WPXEnJXBSAv/ZJbA/3Nm8tf"
+    "jOi9ce/dMfvfvvPtxe+qQ+THCaBSQXa72h0+/n+KH8QnfkLi99MDx6ZRjOnac/a0yoOZWxm5/P5X"
+    "Xy6rFaD7gvs0h3/+4+DtUDoS32XJVRQXhKY/A7wp8Y4z2HeeCr/MIfxJZjmC1euCTjMdg6GYdFY9"
+    "ABi7nI+koHqcBIfJwLTJjiYSjlH/NiCUTsLCzrTX6TvxnWx+Qdxa45XUDIeS4kW0bn1PPfxOw0eJ"
+    "SGCw5n5IuSKJHRVRbHuCXnRDBHq9o6ET0Pgy0admsO8V1Kxnseu+QD4/p0wbnFtuacfAf1UI/6Iz"
+    "daD1y1Eetwfj3iJ98kO9diZH51OmEbZb1wTHlUU4XHuYke8t71qYC5OzvwieSTfQWRcl0WjpNpZ8"
+    "RhQrcdKZggiRSw42Jo+NG30phpHiSNUra1hGltiHiiAfPgmOe/8iG9ve6d2xA7kdZRnhXXyWsop7"
+    "YGdJBI3nVMS5hIyDDbltjfcZZMyTvR9k5spPX6Dqp/oqP1i0W8gD986/Klu56/eHr19iR1vEKsbY"
+    "6bO/wXv/jI62f2959V7W4taSVIhbCI5016OBpVPyZBG6cRdGMlxCKQ/p9NAKncAWCxpskD/pJPTd"
+    "PIXOVAx1U0E4FINBzR3Kgliy1u2Arj92vzWxwfXnDNJ6VAth46s51xM7DkUT+uzkR5eKMX3pKwLu"
+    "Kk90SBDsdLFmWmaTLxJtPKJdMZNkB4jEx65YUknCexxhvNTb5tm/gtCy9/nvRiF7rRCwe8ufqlCE"
+    "7EDA5JGzNGkjHN5dMUzQZ1Sglv60lfzaBjbG+6sesopvGl3+Xf9rusxFh5hQc5uOKJWxOFH2HUgg"
+    "LnFPFbr/wqPmOQ7z4K0jJdP+BzIEu7MRY6BcJhG0t3TxrNU8wwOXONab+stn0WsFqffEdYwtSR/n"
+    "XIZvRBU57YVPE7umWtllY1UfKBcN9JMw+PLYhXZeByEO+2bmVd2z89fO/9g+GpV64Pr+gRzNvKz6"
+    "5+G+oc8d068uSykKzCq3rZCi9OoVXQ4vn9XB6/JMzGDjp9i40mG7/YSY/H3mQveei25jQluAbEc6"
+    "RfIcA/i0alAVGZ9lVINsbQeS8L+V/1OMO4oTuLw3Df91968b9//oWf/FslnXybToVw4k5K4D+/BL"
+    "ZW33rrvSuPvfjKv3l7Y+lfby+dupxRVBccvXDVApw3Jemi0er2h8Mn77o1/MLDuhB0elu/8tWfF+"
+    "Pq+0v8dm5Hw58OPQkgikzK4QV/Lf5jZ40L4jriGDtNyjiceXfOIzzxzOf+hshGotAkwrgLmKUV9j"
+    "hExGQzlHUQwmkRwhp3PdZLV8Z80diEOA9GtMx4KhLa/NdyqKk/eJ29Spt0OYVUp7NZgK/lYgc8os"
+    "hUj5eK9doh8wviKXFnUHzOJmJ2pGFkGVq0KZ4yCG/O2GCnJAd9CipB8mmDYPSGDm4uymvQ1kSxsr"
+    "Y0nFUbubCyoUOftlCKLwgi7N/5wUsETGYLfB2+Y6d1pQtIVgt/tKXu+iLn/CCiELxdLrZFVHj8J5"
+    "lwixlMHb4IYXzxgQ/MTA9l3/VOEg4bYgdKrdhwTrQNSicFfCVPdoc3fDrDpGNsw06wZOSLsdgSI4"
+    "KOShs9GeR1jglTavKts9IzH09psBJrHotyskLVg+ZemrmWDCJFznk3Q7jT9rpuoqdxzGssG22yQ5"
+    "SL/rCpbbZ9UqEy219ZWbxx193nX5DAZmMdN59WfOzcgw9cuXHP+fXnd7Z377jTuQHrGry/T5YGkE"
+    "ZNw65KVy5dxzpza5YWw50hws1L26GRtQwCvdmYOod4aDEzZ40iIcdmkY7izuIGFDrswUCDcLWYNU"
+    "0n5ByWLfMBmwEiDS758NU8c4aeHJGGnTRVOSJS0Da2b7E6QYO/HdlBL3f4HFa5BI2OIkj9kZ+2kw"
+    "5qvior6DmCSGdxLslouwo3TkoB/BywzSeItg8avP4TL3VGBpnwugyRnWxIvmwrRso1n/NU+fZErb"
+    "R5x4bXOOQYPg5B+K7lzM7xjiICcvCiozuTMUTDEuPYhzMOWGOao2noa46ikXfXCflIYvBiH/XlNg"
+    "GgXErJQecL3i5f6gwHaw4mIFmsfJFivtZl1pSxeYWsFmC+TE2E2dQ1nQ+Sk9+0Cya0fd2V+/BgZf"
+    "j+B7vDt1/7aHjh/b1BwWFHC7MD3kxL3agqs2lTXXK3TQQ2T9nAZSO1onomnjt2PEilsiMfOgxABV"
+    "WbgOhFFf7Ik/xhU/cRyypjmvIFIZvV9tt1Obk0XTbqK9rMZR73d+mGg9XlxdnF2Ue/8o2/+sONO5"
+    "ufk+zZlj/xT0rgpAT+/5XA3vbK+jOvvvm5b73w9pe2h1OfUZdc0wCm/qp+R99kENJ4M+hzBpcOPx"
+    "o+eXV3uHKFOzC6Hac0sYqPn19oZNCY5sUy4507ukYsL/YZHTNCx6f/4+QLo8dJkxhJpyEhfLaB1K"
+    "TVqJJxjDFIDrxgBTmbMmhOLgaFYReRP7KHZUnEVvKik4WglyOB8baxZnTPCdDJp1HjEwc7fxGAVy"
+    "OhI1OeUZp0B1BViiAjAd2jveywjaIwl3scL/HIwCtu40kSHB0tY7KVJWRmsImWDBpDYK4/6kYpqy"
+    "F/BOpQ3WuFYJ2ZF1eGNX2j8PTydV1w3ByW9KIvv3W5pLLGEEbZGJxpdrFNgnb+rW9uCwk6RoMIJo"
+    "J/wKaQjZzrZFZvsPjQSQocBAcnv0KFVKxJVYRUcOVxjFyE57GypHFJc2biW5y4jtbXUMQNDWCFEp"
+    "dtiIgKj9e3ijkNu7VWaXVRJa7Oj5nEqwT+yKVxWgDMTLBOV9TrKfNJhv6N5m6TxHAdN3xI4q02g5"
+    "Hg+38+92fti6wPLNG/9g5anSy9/MA9d1+T5E83vML/WffSs3/Wrfxp+3Y+/+iDb+ze3tAvdqg5ak"
+    "B/WtjR0PitVFwaThoYFDejKU3RLNZpoNqE1MKOcFDFSgAxHW4fNAT9pYNU40QBDad4x8YCLw1dfw"
+    "weNDbCuCwuO4YwKvoPfTTktKt0BIvZFELQ/OidMzfl07i1eA9P9BGe44FBim0GD4J45jJtnTdhlW"
+    "5P5RTUlANWNx2fzQ1lABW/mI2NDrvyCI/ylRfTmk00Nh7YYltFD0RwsZcDZ10zHyvHK50zOkCpl8"
+    "h4cAKODVTlBTxc4zc2NNviBcOE480RuDYSnsLDPoRm+eEiAiY3L9zWM07k04CGrb0hjUzA4Efe6N"
+    "aROKntjFkRwu0sR3sHQ/ngN2KZ3OCh1GyRfX4jyJ1v+omCmlPgUbvkUQVtwthwOXOic1eNjFnX8p"
+    "4etVwdrq+dHp7bXhu+8drm8O2f7Ayv6YMjt3f1gWA2k16g0DdYYsmXLHfi2LT1pg67ssnTZk4i/k"
+    "2d0v27OkwBQ3RXB4VMnsgD9alDSfEVIT7aJz7Yuw5IIo/EXT4A6vAcajGFoekRsD3J7q3sX7y5t/"
+    "erf/aNx39XyXoArFZJCpy4kxI4KYH/tBI43N9Y+s73n7r81z9887evbaz82t7h6pU95hfmYB7N1q"
+    "DjlzZt69ti2zvD3Ycbw6euLuvOi9Zf+/ryJZ2f385llNAczu91PYLId+9XN6/1mYcH9WH56vn+9x"
+    "iALsYNkUKMnBfk6tb+lIEGgvy+KnMb/M1tH1h4PIZDgS8Leh4BBZd0byY99nH5ygpFb93B9IAmY3"
+    "pOAQ1W9CPDewMmBy7y8jmkNxtYwhrLbEeNfRJiuIZu+5SW/MaDO+OfRuHCYgDMDEYqTucEHJsi4h"
+    "Mv8XEMhUO2tn1Jhdih4rdMyD2fgTE5WzbKJX+VSlnAy+REUGWRJ05CX6zs6XHLHbWOTZXnpmzRhQ"
+    "HmDGyQnH3nMeG2Hbvjyg7nLRTyw1rRR5WO2cmrWYSFTTpch+jyEXnOghhVUMJTrHmCNMYQKFOaBs"
+    "GSZi1+ecZORY+sY3liV2tWeFzbjZwkF9ZcoWhQnXf5NkWEEXcuD6eZQ4wkwjmIp9whHHW2Dl3YUP"
+    "n1Gl22+s/2qy9obdwHbKm39E0QvQ5WQuwLHvzGFTY/+eDnWdQPLWd1efnO+dPnnr/vwmID+ePq0g"
+    "uOn/V7v/7Lv/DG2v7em3u7+s6AGggVlQUZA58qzINmd6y0JVpIGmQ1FhqNaNxP4lDt0gJ8WB6aXO"
+    "6EpEHB70YiPlLdz0tuurImurDdeACohkW82qNk82c90PVH47IWMfUiXqLRU5s7R4AkfzgzgFsy2G"
+    "U9had4GvtRH0Nsv7PYvNGfPNYAiYrijT7hsNAt1ea1EWYMb+UnpomT/7IJ1t5Yjnkh17bTGnway0"
+    "6xqdyie1x4Ww77wsPmDTfiK+wX18hPHihnLJ7cWDZgOU1nAdKGmBiohyoi+Qphp2jIkdaDRN+1w1"
+    "bzC+uA7yPCV3it1bbAZ164I2NM465YP/TYWmeV+2ivSP1Sk2xORRBeu7Qf8lSywkV27lzG2KB8kk"
+    "RqfOGIzhxJM6Ncm+4NlxJWtbsyv26drSu85k0h9rLkUD0Ic0+T565im8vregRzMTypT3V++9ru8M"
+    "J7h8OG3lzHho8n2Hls2t++E66+AasNXenTTo7HK73hkwHjXTpNyKsyjOs22ENL7QObGKhtm/OT8s"
+    "f+DPIV77yK7rt6lIMOL8gsr7xQ3rR1Df7e9INKGmCy8fTBzkMvvPLil77xzcf/BxGu6sCME3dSAi"
+    "cl8J9SAlqZv/fGm/f8X4898dtPvrP12ztrlx7c2tEHTzR88KKKfd2R41HuJS1vrDQAACAASURBVM"
+    "ZhjS8XNQ49cGZ3ePTq/nB6wciicYKbdGzg1C/zUhSNCPoA+aBv1dV0IAYls4iv+dVxJTpddBjo50"
+    "cdcxwyjJtsvmATLov/cdOmqMcNfKXr1CiJEgOHNOH4j4hc8XsMVqTnLMYosJTlGnOamXEraKBGTo"
+    "GoGONshNmwQGeYaj4wrT/C1uFZBzr5UqqCdvjAWAZ+4vF0jn2QK8kpYOMsK0H0epg0FSxWWBNKmI"
+    "NimUgGhTIoufYcb6LFGg2iCG1sshIxtaFV/V7u/Nq+PjCu9qINHQ3GtqhdRUlsIAxEl1eMrzQyUi"
+    "occBxa0jkbS3GTynrPg7RRp2MnNlebYm5JirnTcjpPQFsKyXB1nLIFCWNx9jiJXx5y1jElOtQnUN"
+    "Omoz3tLZioMJIC5mshfCfGdpOJczgp/ki3NEgcYvNJmOS5WJM/2lJ4Zjm3famM2OqwkXLyOrmAep"
+    "3cxVGqzOg2zMabMmMtJlW8eE0dKzSESFNn0wuUXnv4ypUXz5851Ntzjq+j+R9Hd/DQg5ffvHLm9A"
+    "uqjc0swugSWazRag48qOnqPqs+Ft5UnOqvmmC3NVdsxj81LiW6sbtEaGjCUUNg4cyA24v2gKCNBj"
+    "rzdfW+B2YgvBmwXhSHF9Q0IoeMiR4eF4W/MWmEbqwl1w1XUQBsdzqDjYY42eeYTslsx0bfchRG2e"
+    "aNkArB4zqdEDpTGPIoVNxBD0KQ+cMKXM4Q3HHAxVmAU+j2xevOqHzCOw4sXTYlCmby2bJZaHdZBz"
+    "zM0FBpe0o32KkH/Q6NmVEOPnQ77zZmkmdQC6kMwDYRKIVKcF2wOYSeQ3qFbUnbgB5JMDhwMJoUAi"
+    "jw9YZCQblgYxMOE5IX6pYNjQlO8wQkWg++QWPSD4bzhA3G5Aw9B5tf+kBjG9eok07atS+CyErXj9"
+    "JdJioH8qKTDsok5UKcsO+SyUzuzLHtzQtNJEvY2ZI8GHq75bZs1YujhxdvLIYn3t4bnnv99vDOrY"
+    "NhSxMrv6vbV/vjd2oCtekr0svbL8FeEQbfrOsiwUbwc4UtIvQcHxSb7P+7juSh8x0ed3oXI3njbq"
+    "AO8kOWqxQJ8UjpQnrX1HZ5iQvfMdbLYlYO9g5/6Vs/fOaPXn7ljd8Q+ykdJ+6kBE5K4P+zBNTvb3"
+    "1w7jtPv/zPv/2jW196c3Px2Z31C+ubuhOnqTDLYP2GeFm36vf1m9s1XRq6pLdefuYBfVT8Eo9h6/"
+    "MF6qf02GXdifMLUNQnvYhmzPLYyPiDITVjeQBhYKpxjCTGJ/HkqPHK4xtjMHztZ7zoMQjfbgxYeR"
+    "atrQ/ffBot5fsoMcZF8H33QXz8c+TpIMZWZCHi2k+MIbLXA6Ek3XcNsdlRMh6b4IGk3Pmv0zPHkH"
+    "eVF7yklogX38Xf+ilFh8UDd1yFpNd3vtCvIs580zzyKy+2oPUh46TCbXxoFYbDG2gCxhCv/L4b6L"
+    "CSWqKXLSYxR6xq3lzTY5dLO8PF1S2N3/pmodqTZjxhRH9kwbSU8iYdChP1/GV62wgRE2ShKsKb4c"
+    "6b65T2BRZl2TiEsyZBh/WCCWROPpNnkyBbZ1KbNdkPJixh6lTxOgnrFUglhK1By87GTiJyYcA2nO"
+    "soQZ+d6vqNfcThwSWfyV8RbHQwxV917DUE/GZq+djq8hAddOtuQ2Z2u/zUbuZ+QU2IlkMIvZrDVT"
+    "/ggdv9hXWh9Sk9trD21pcrd3ZeffS+e14T77H8/lyXBa3vWLrzi7Xrn7p897OnV5Zu5XEJVaQq1B"
+    "WmHFGJVGo3IBaKDJLZ2EHtJglz0rgyKIC0OtH0704L5tToK92DEvyFha/Di2eRcci1rBfGNtFNNn"
+    "a6AarBoafSZLbzgTzIRAkUqxtj20JSuEgHR/k1Y3QT5MUa7dDsCUN8UzlEdrwzAYYVFnThNratFw"
+    "3b7Gyb4vLbrr7aie3QxkO5sX1ipoM1HRzofZBr8IjPMQWleI7w8OKQTEZYlCuNmSSph9YBvr87WH"
+    "jYbjvIK4pwMztDYKMwbTyZVEYZMaCPePxqE6kttzN0exDpPKCrZKxOvOQtmNHY4dE+bBMPeTVv2M"
+    "ZzEInGFocqO8gkTp2TDtQsv06FJjt9pL2DNTnJ+UpmfE/8avfoBRDTbIPuxPEoC2EvUlBNuqEkqz"
+    "/3PXFsaYH22uaaNnX7w3dfuzm8fv1w2NRrp2mlfHrELzZCR12Z51t1efySpZvqpA9hZ/PFhjJHFm"
+    "DkSbrFR15cfArZNvyyTUmx0baxFUz+abv6T9sRizFEcDl5y6hE510yy6tLZ8+cOr+/u/zf/O9f+e"
+    "rv3vhw4xckcGzHVGf35HRSAv/gJaBXl9y+fvrpH7z06a89/ebvv71z4V9tHF64Z3Nb77nt/kkPVm"
+    "f1glA96vTy7nB5eWP4wi8shgvn+c2uHqOjn6sfM671nIPp6p52ojqtaYwKJEGf3DwcLKdZN2kcBS"
+    "jfY74UMF8yro5JcDkODwicIseYEySdlThtoOCLTvIQ9mKeA4cNzjFkXVMsoQy4H9NfNs94RaFoxR"
+    "f7ZknJbeXDZV+JMa/y1HqU1mUJVuaXCKSkuwSgTba3TDib30XjCJwpo0gZFxqp2O1Q8EyrhNRv6z"
+    "Gj2sfusFjZ0R26DV1tu6n12Zbs5DE7ZhPKJsApi8wSIDRup0Mwqwid5penwGCm2MZ6b8LN5mFKnu"
+    "c8gK1XQuxF7YyvEL61zXQ6d9NJ5eFIBFM4E0kATgbImQqycRPM2qCk8YI2x4wd5DFtoONl20yWvF"
+    "TpiL0UpEML1waM3NbQtjdrSrZsEKvoxmysss/9vZDma7wRXAiI+Oh1G4nSF/t0JlFG+GL2wcHts2"
+    "fOPfPw5fMfTBjHM3ScFx+bX/zCp55ZHw5e1bKb1WQGdVXUiuqKxR5/qTgSU6FdTarn1LgqeRqIxu"
+    "Y4bsTmjceI5gcOQPhpOYoTLcdAH3VahHKH0I0nDKYj3RsahTGFhunBQAzobEDszyOGAWcwAg4XnZ"
+    "XHkHTnIndjcldG5SD94IJj+4vP+ZJOwPwtNaksWPPpJAU5XIYzucTFjSHm4ZSg4wBNYMmPOXJKeV"
+    "enEqNtcbnKQvmtjzCOPGN78h2jktZXXo7S4APD5jWG5aPTm2twjR5emPmjgzsBOR9hJC2PNioOMO"
+    "RZHToPplWdK2wuMMQ/5aW0ip58Kg/eAyTvXUd9hRY51790wR8ckMFp7pksZjst9omp7C2bsUfOZV"
+    "phE+pE2UDmoC3RNrAFGxxmw+MjPOSSTZ9yIxm1VeHwgJIfhbSq6IXnUG/J5Ockd/StgrcW68MTH6"
+    "wOf/PqneGZN24PN7ZXh13KUx+nW6wsshlUt+YuIHfH2LQZW2WgklAce9jIYQ99ROnFY1uwh3xiDy"
+    "eZ0XH7OnWdKNVpR3jgF49/X6g+xG9KeG8ev1/ht3T9Q3pdT9CrG/Yvbu/v/Zuvfu3rvyOoh8E7cS"
+    "clcFICf1cJaDN36/rw1JPPPvTVbz/3x89tnP29vXP3f+LOwcHKzR39fIV1tibnpR29dElD8UJ391"
+    "d1rO/cGK6c2xgevf9wOL2up6K4kK5+v8Q3aOngvRqmJxOn8+rwPD8zo8dG+joOtriMe4Q9LlQ6cB"
+    "nuGU8ypojDPD0v92Yy2OhtmYJuLOQ1npVpTvSsgwJ4ypZO73m7UOSNQBPJyogiXABOVbiBTI/saK"
+    "N5oLXi5o8YmXaKIRV2IShSPmXkciLdPCQlb4aen6xGJ/yfco19VG8wSUOgy51g45BQgD3Aw2pXBp"
+    "F/tZHF2tZwVt+iO7u445ekrOgOXeqSPIBHXjsTrU1xSJpX/NtposR9ihZM8cXSREdzEGROCiRzl+"
+    "angos4+mCnvLAhotgEHTXtU1/mMQXMSOqKpymckA9G0lJmMcrFRf6aiD50cFLIF50VLkn5Cs34zR"
+    "ZqYcDJ02RIc3QeFPO/Tr7ZQWpw7VthaHM6fSd1QQ2ALYeN8Os/F5shJo0zeSnOhG1veJKiVMl2nq"
+    "FRWlM8aVhjs5ZXP7xy6a7HL14YroNynJ2q5di6nc9/5v4Xzw07P9az9rynwIut1cXCFbfPzlxZ8w"
+    "UCfA34bgjUtWoxi1O2fdCz4aEkiONYxI4xwihop3jQQ7CeTjYfqU0QCgtVQYCJDXQi9McecWoR3Y"
+    "8GZhAvzeIlztVA0JhAZEgaIRrKJjd+UmbxEVs0DwgYYNcDRGJ8aJtMW0dv/IrXcmLDp4w8FFS2nO"
+    "bOCF6wsNI8isdi0cWPLcYIm8MEoftKJ4t98I0zt5ewOV0ORnV56DMBkjG4zrA0X2hT2VB+6O4NEm"
+    "hti+2NoGm2lbKmHDkgwI8GBc2qoPNuGnxmyaKieeVzRy92cYYgXNHaTfZksCmuTo4OKXQ9NtU2JX"
+    "LEFkWwKQbGPrjchs0YmdZu+4ueMhhFzdj5b0jtp9328MkwrT8TFG2ZvkT5og++8K7qEwX9/UOa2E"
+    "Jp+/o0wd6uXjWuV4rfEdLGYm14/vby8Ndv7AxPvXZH36zb1aOZAljo7upiVXMpq7sqS+U9L02RPl"
+    "mAbbx9kk0dv63DNLg5uMwv0mijbfZEmHyS/5Q/PIQlbQEJuUJVUroqRD4hU0Y8ooNDlr7bv1+kXp"
+    "dXF6dOrZ/55I9+8tYfPf7E978oNl6ScuJOSuCkBD5WArdv3V7+3g9ffvhPn3ztD//y1Zt//PL26q"
+    "fe2ds7d1uPU3LhZl19cV2XSDRY5Le0GjN4jvn8wZ3hoSvbw7336NMFesnFQq+k16BbmznmD/VV5B"
+    "gYcOrCfO+SIZODDu6xVBG/3MQ9G3qcx09oYW6yZSA7nWSAR9e60NOHEhUe8SyMQHgZmUhLenhJtS"
+    "toTEh+ZnzNI7+xGyMbyrarbIKvjha1jS6YzOUjTjFY0rrREXlssc2gdb4SnKRatSjosAprD4sX7Q"
+    "VonVZE2iQ4lmvVXy7iMqq3ixWJTXITxpyG/SjBUN5jpU8XnN7Qq4hvaH7Y0UVF/ebSychEc9gjYy"
+    "QHKX/Wbor4iIcNkSQUV9k2rucWkbGYOdFEzjXNGN8n0oQ1C8Oe9LFEzGMMzPAf85Lsckr4GsJY8P"
+    "mwgLmQC3tzElO4lE9ZDF/XE9xmgdUSk760p+gCLXBwgdHcbHrBkBxApY/ktgnOuZvzoo10ELGpcj"
+    "FnH7FHeDIDPuXN4oO1tiTYC4DG+psLtczquxojlteWX33o6j0vHQE9phFeB3Vs3fkz6x+eX156YX"
+    "9/d2dpdbHOR0hZdnFFhY0CCzI7twbRa0E9NQoGXjZWSvOGIozdGbLRE4LIkQFPoWqUNC8aiNuPaM"
+    "Yh3tympQE1SNoaCoFqTqyMHI3WmwEYdeQOGzoyIcEJFgvpbviwQjMPwPxLN/G5G+PYhUTxsPkdF/"
+    "+i4Zw30vXnjlj6gWxbxjSJ0ElakoJwWlHaw5rRxgqjC5WlFmr9m1t0Nttw4UgDuwf6SoBs+8IFH3"
+    "ba7iKNNpMgB0LbP5Uj5ZoBfKShszKQxzvRFRI8yY/icp238coqjNpQRgB9QmKDKR3wQLENbDb0j/"
+    "zc2X4npTxJ67ICw21WNMRGW+Bvu0bmeduZa0CQ8o0t1mdSxfW4rvsHVwPhs7WtD+vTbvj9G6o4eZ"
+    "qRbdw098tN2GGRphen0Gb9DiPd1jpQ+h59T8Zf2z813Hn3YNjYujl87uZiuP/y6eHMOtgqJ/Gmrs"
+    "SrAL9d26Ps5INBe8B8Jk4vHMi70siL/8wnwSrbedlIxKbBT/sHzk5h/x5FdK7gsmHlb1+K0MPMoC"
+    "TZw3ijcpE92sBeWN3f/5VvfeexP/n0g1evXbp6mat9+sHGiTspgZMSoKepz6xce/2du7/x3ef/9V"
+    "OvvPuHb91ZfPbd1b2zW+pU+7oLd7Crjdry6rC3t6OOp36+pzspCi8ON4cLu9eHRx44GC5e3BsWq/"
+    "rsuF6opBEgh2R8658RiaHBgxF9VIfDjJXUgTs0A4fCdGScfPdpgrZR6eDS4+ts4aT1GJ9UIwa2cO"
+    "BiqLFeQxOJGp0dxJiWj3JS4jIHCAUZy8HL+KUodjFOJTPhgW3G23ixAUwS4wnCUecBIQ7wRCatcg"
+    "iXXGIJ5wxmBlfiZWOSiLbqokDgiEvIACIUHc9GFVPTnVlrMG+zYVF+J9hpiDcmrNSbHCSroLw0jy"
+    "z2dQFgYzinD4yf0pB8XXx88VSXDc081QXxYKRoSJnu8gZWZ2HbFgXH+grR/Gwcup3YDgRxkjO6bS"
+    "vZCrvtIVg4sFeMoJ3j1t2AnSLfOGl7TmWOcsMoPQ1WDaPVzhAUDG7y1JjIw0XZIJX24t2R6IZtMD"
+    "Ga1TrgTgK08IUSHhFJD2Q4FS7RklRcefALjQqjajh66gzS3GEFRZkXIaUcXBYQBcCczdqC4tnd39"
+    "s6e+r0dx6+eu6tOcZxDVNLx9adWqze/uwj9/1Ar05/l77sxSe5Ub0t6RktV2o1Da6qs+DzRkgs3d"
+    "hZMFpELSk0OkU6OkA0sEAQQIf4CLizwAtPjjCGzx2++KF70WxBZBH3ybLY66s68lsaFYTB7rsBsa"
+    "84rB8uHE14cvAhh3O4fBPq5FTxBHPib7kYOZMo21HrzQjmpySymVOCsdquKpOpbIIVngmXdOokfO"
+    "RXuJ5wgxf7ZvzktTLb2PiFLhtSZu2TQnpsnjChYT9/wSkICSQeTF/95Ef32NhayCtyokHEfkX5xz"
+    "qXgze4apTm9AKhylh6jc+mB0AgECxnDNsmunxQcxaSAhwQcocSQoQ7D5ZBDj5Y0YOP3gQcj7WxOJ"
+    "tYJ3qgy+O6XS/Kn5RaWvkAgzrRw4fCREYTZpWNi8MMbABzB9VvXeNH6LrSzoRL10qxpZwOWcCtrg"
+    "8fHq4NT39wMHzzjY3hu298OLyzuTxs6Q7e0vpCd691LU13ZHk5in9bJ53Gonzp97KCXIKrYdqPZ3"
+    "Lnjj7lt2eqgH3xgrL6+AGW8ZJGq+DgLqBeZWyM9E02dmJFRzKuRaW4dByKb0+G6CUpd2/vL3/xK3"
+    "/xZ3+yfef2J8Wtb5CfuJMSOCkBetn7b35w7q+//dS//Jvn3/iTt7dXPnd7ceHcgR693tegsMQ8zI"
+    "UentbwH09h8ArLvWF97/bw6MWN4fO/sKM7LfpNlB7Z5s24A5s6DvfH6pyM1dynr4EyvVmdlgWc+P"
+    "xX/Te1Im10fUXwCTmM7zjwwi7ZMAvPXPGIxc1CqDRRINYHGGNeHS1fkngeVzXGopdNnEdb5Sefih"
+    "GNAc6M8WIodpahJsPDfNe85ZM2C1IuHozx0UF51TgPWr6jRmjCdszLpdDIlucFzs5jYYEplzTy5Y"
+    "hpo60iTsgkdSx+pxpDJMc/nk+zRlcyV20AGz2pVtnoDVen9LjlubWbwzm9JOVA36PjiSjyCCQw+I"
+    "z70UfGgkvaPB/ZVIuII9FOHOJHInYrQWVKOnEuc4I8KzpAx3SHFYVklFG3pET0oTTqB7SUtaLzMr"
+    "Rw7IDVDlo726LIXObjaRUnWxz+jahpAEHBYWHZgd9kp/RJROfBuUHIdovdLqaC0aiTod0+WtLwtM"
+    "1RNoHIsi6o/iJ9qYPYdsSwEo4kfSNy7mMHy+994tLFx++9ePp2rDveZ3rAcXZ7v/zZR58/f7D/Cs"
+    "9FeyOgyvJzt2pp/L6Gfu3KpyFX66Ni3SmUwCBJJ/UjmEws+lMTMQ1JNxI3zhTTiAGNQ5g0qjRAGl"
+    "UXZ9IdxYDmEEOiLJjrTg12MOG0fQ4DHZvjNy4+dGSizOmmMWxMdNJJ82/6FG5+jOywbQFRfEEDwN"
+    "lSIA7e5ofScVEdRtb0CcF4ZBQe/wsD3/bQCfXnjZAEJxsM43KB2LjNQbx54UStaU2Uj23Up+nUC3"
+    "rhNX8zmmQiqfNBgTbkzZ/ofYfIc50HFec4dgnKd1KVKfxYFt9tSvLodltUPSPp3+eRB7eXsqH4iI"
+    "22kg/92dl+hfl3OHnwJgwG2i+2cCLKJkQHAl4IJBEGtXUmmfAZUFxYLPPN3/odk76UrTgk42WSsa"
+    "3SOmwhOyqwKWGwHaf8KXvoShfjgjt08rGMN9cxxUWEreHOsLemTxnocemXd9eGb75zMHzthY+G56"
+    "9tDTe3haHHN/2rB+wQCNnIpwy0nlPYL0WBniVQ6clmLsWnscBPXjA2kFnKQofs4ciVvITJR9P9dk"
+    "0VDptB7I1uKxezKFoQ8PFjHt/AKDUR3UBcuv/9Ozu/9x+++ue/f7i7dYmyPHEnJfBPuwQOh/eufX"
+    "jmb7/11G9899X3/pf3D89+8cO1M1e21K+31R8P6HCsdvX40wGfKmCg2OUXq7rzfbA1XF65rY+J39"
+    "Yjl7eHtQW/n/PQkZNklvhMAZs49dLMo2IQJj3dI02GGvMzBntcUxrpBhN7Oj19WFiStQ2lhyv6PR"
+    "bC76cjeP6ADUFGBgEwQiiNvNiBTqZE9dvWKq5kVgvo8VFyxrVe8qJ0xlJ8Hdx9ZMN1oMfR9Xp1ke"
+    "HBUxoy6LTe2JBE0awH2WASj32MoWAFtzGOXMhuEfTbyR6bxDjO5S7J62Pu3gh6ChCf8MCPZmxHQE"
+    "cvwgopNMbwxrZlSW2aQUBA3v9GiyktJyOV7DJqOdlgbtG9cFdpL+vHmGtrt/1ilDOrm8PpUwgdrV"
+    "NsFNXOOeiykXLwU1ZAk6o/9Ok/9WQLQgNadSd0mBUOppkrmDogksTwjIzAWk8UhM2/1YNRR2OmrG"
+    "2E6Yjhwpb8hZIzuGgx/pgQvf2Tv8mKmND5oywJJw4GeQv3nN6w3vhaX8o1rGl3NkAE21EYyBmt61"
+    "GxbkuNSdmDZjr1oH6QsDgqU+4ThdU2k0RbazuRQe2en0BaevVT9195lgu/Pw8uI8MxzslnHr789q"
+    "VTK9/b29nRWE0jUcXQWFhHEldFUVVUpgcsVSbDbP+Y1TIe3KpxqsHQuNMMZwUjkDQw8CtcjQSuPL"
+    "ZmQZKnwQrlyMIkfhyNqwezNC4NAF4Ap6H5joexY3c6DvZHHgxCNFhoXtxX40aH49FYaZHrBo08Nt"
+    "q5Q6WxO3/opfPyp7Q+nAelNc8kPiKZZBtRZ9zmKn0q+Lxkgt8QMhkgq+MIb2whBZhMMpLrDodNsu"
+    "+oDFEkSkb16U0NeZljK26e8hMOr/mRL5ls8ihfaNSZEoVFeP7iGfMpD2ll6E/5Wc45kBiK5Njc4Y"
+    "iPAzRx46IAHvn6d/krDhWbvCXUJOMNIjidr/LxwKRNREO86AYTJDnjy0asUNj1lYSUmcLY00dEqh"
+    "wDZm4pGnMHGvWjO1TjR8jZ49h2dabeCKlaFM7v6Rb8/o1p72BXV0x39Lijfl+ntE3dsftwOD08e1"
+    "O/rXvl9vCDN7aHd/V5gz0t/rgTpgbkMqJfs5Hz5wPIvPqPErzBI//WTRZ1eKknHvc78Whv6bATxZ"
+    "AXFYBHeUQGeRxxsQuPfFD3kUX3An2iLxThO3yrulug3/4t727vf/aHr7zyR3/5V9/i93R3WVynE3"
+    "dSAv/0SuBgeP+9G4vHfvijL3ztmR//j89/sP/fvru99MAdvc1kV33zYEcbOG7m8zlZHYf6ePihNn"
+    "VcnFFkWDu8M9y9/N7wyYcPh4t3rw2r6+qja7pzz5059T82ETiPu32nyb0/o4DH0RrPzAiv+jD8PD"
+    "3Q87ZMsQONw+sCOj9ji+cb0aNKQ189fYAEgh40hCe/cUiKy1jaYXzYe7EZ+nT23AYKWOiW8wuYHI"
+    "wOJUJMOnSn6eQw+hQsWUOFAWJYEFHYLwSBYrpLSjFAYFD5pyTM23jk0Bcmw2R+8k2ezI6o/5AvrE"
+    "oyi/NFEkhTemRmItivf3CRw7WPvV3vHulbOXCklWPsR4pH85f1uYLzFzaG9cMP9LKdm4rrEqEAmU"
+    "9ZEWZN0eKjphmcaDaGtNSDztYUNaTrnzZpDntHQ2l4nTCmuSQEMlluKKND4xjnadkQDcCUrtEuaO"
+    "QhJUsqSXPnaGGUtDNtPVV2oQtDxNbbOO2n/Xys3iVg6/BHHbG3cWILOa78FqDxnDimjLFm7jZoXz"
+    "rSd2GbZVLi9C1fuFFKy7COZKgIHf7DYWtv+8ZiffHdh+676xooPw+Otcqxdnetndr4wiP3/825w9"
+    "U3feVIqy4W3H4cSp0rDUm+6GPlKsducGpMfilIlQDdADpNyr4bTTUwPJqr2w4NxgTTWCg2HlzEja"
+    "VwGh9UHAtuDR4KNT40YwrPv9EadcJjoY+dSm8lgp9DV6KUX/B7kwF28hwZwui1UxhHHHt5zK6xnB"
+    "fndcoXA56xLFc2WN4wR09Kbj3WSYcr3W0DHcsbkLIDANIyWSbvrcWdURHy5wETOGvM2XTypcMU64"
+    "KfmVu00uG8ita22Tdv12vs7s0dcoi6NgujM3oEo2wnTRIj/qS37K1yjt7oQoZ4b8Ysg64+nN4nuH"
+    "HJt8Ts8MEgik+qaZXXTm97jA1P8Wej2W2lsCSUckj7BAO9eMxZkW3e0GIX/JHxXTRxsgk60MZNz1"
+    "1qA8QbMfmO1MF4124VcF0tS9ulH+ibdUtrw+vbK8Pj1/TClNfvDG99tDvc0jpqR/L8AoK7ankpSo"
+    "YwFmeEaMt8vy5XxaMLy9t+wjjsxzkfOqdskj/ngw2r6gA88gs2F4iWWRxoBcomblWP8qwpcSHdvK"
+    "OBb9Tx4dK19bWVU4tzn//eCy/+yYsvvPhrEj1fquSduJMS+KdTAnc2dtaeePrZR7755PO/++MPtn"
+    "7rw+3h6uHK2uqh7jYt08d2NA/o23MMd+7JPFqtF6Is6/d0fBR6ben2cOXC5vDJR9eGM/r93K76HB"
+    "uc3HSiY0rQd8CYV/nDecSWnzGNGC9UYoT0OICIRhHGyvRtpYsHPhznPM0gXyo8tiYwhcEjTUbLk1"
+    "DWBIwj+i/nlIQhmp4xpscUiHCNnBUAB70o4S9cMMJQCpw+xqIHbtEZt0ZXfB13SkNAHO8gQix7MB"
+    "BXfFgIDCUcaPyMj74wNuOdaTaE4+I1lE7JT/yjZ7Pbfug+WIVzVL58R7DTjCQ0YfaGzLzmx1Y2la"
+    "rnZU0cajer67eGsysf6vHLDY3Vamf89hIs+PFsIOGUoRJDU3ragGcBm1oKvQAAIABJREFU50NNV7"
+    "5LAzY5AOQZA7nKr3FHojkrxWHKIvUMRPEBg3wMMh8n24CeVARcPsymoFJsb2wtPtGcUIZZQ+OST6"
+    "dbshmLs+wiXVyopK2XFgJlIwFHnZS8wSya6xzDosdmSzfz/CQUnAiAI8HGI2pHWTRfKFkvZdyA4j"
+    "yz3quw/bIbYT+15Y0eFvKHzPKH995995P3Xlh5H/6fB0eLPu5u5zd/5XM/fOyld17eHpYeIjPs3O"
+    "kMDPG0DzdGB5w65tcbH/ExdvXz9TQc2gW+uYEgvQk0ThjSoyXLVMDgpkGXCQofvXL2kZcCKG5Ubq"
+    "806vDYQKeyqVLi6IJJtFV3GHtAZ9BmY5S7WAoXZtuKHPbMnWWwvcjw2r65EqU5X6ZhZzq3cY/gdR"
+    "6U0wq27ugkD+lk0VdlRHkgoP/AEe98xGbS2ajhXKaKM2gT9vCgJGSB6XxHp+iqn+CnPuj8yLRt+M"
+    "YRQJntNLBI48/lVol4jstvjNZllpIbZcqu5pE02m0sQ5lz5WKZbDINzYWF31f7IiFCy5bd4Y1NsU"
+    "8oADHZ4DcWcmKGB/tTHhBllw76AfVEW7JDt+g486vc8SEVbNoM9VE2+8oXJoIJVfwto4qzHNXZfL"
+    "m61uWShRU/ozEn7VgLtT295OhdXbXfem93eO/OjeEXL68Nj1w6Ndx9Tj9N0/eF4MEe8iZlZR9G6s"
+    "AWuX3R6aGxHG54RS9K2IIDBnzOk0J2tl008lVtNG1VowuLSdlM2SHKxSHu8qk9Lp09f/YT21u7/+"
+    "7PvvH1vbsunN+6fPXqt4WnHwWduJMS+KdRAntbu6e+/9zzD//lt5/+/R9f3/3j6wern9pbWVtj0b"
+    "Gnfr2iW/Jr6kAHegfKgXZoB6KtqvfxMiUuAB0o4fTSzeGhy9t6IcqpYXFKfVBzJJdudD+8erX6nv"
+    "pc+nH6qR+Pcy+mnEUrTo8ujI3qrL7rValw4TxeiRuXs/gczngWpIwVSSk+MzPORMoDjFEmpE6Cw+"
+    "MHhPybE91zxxAWuytnEAgysHsDogjjpJzHauSRwSdY7PIUT1oTDYGcyDnBpKBP5NXRnAwUQuhwMb"
+    "ZHh5UVe88ZIIUrCSOe9SFnTZ4L2BRSopBCxdzoa9UTvRTZE4/xKCXGfp7D8GBseT+h5XIKMFxr+r"
+    "D4qdXb+gzGTT0RcrcUCkBKjCBeL1XEblhbg+bgo3JuR4ehI5BcyLftIBias8PzU0onMlamU/Iaze"
+    "FFDuBgmdaFBK2SwxuetEz0ls2Im4/0yY5wiyIc2wu/iLlj23yRIb3ra8KgvoLSWLFTsiMBTEWIFy"
+    "RRHNkIHf2Eo8OsEMxQYs4LPKzmu+QUl2PeDSuA0ee1jaK5SA216ZJnnSNO+p/enbGrceTVzzz04M"
+    "u1QgXy2Lufi7x8+sErP7l6eu1bGshvqSZVKTQKKpVwKhWfOI2zD+5AULn+ZEC3NvH1BoEGk00FMg"
+    "YCRjLVEYhYhU60RjnfyaqBlkY1bpZotLKt7/6UacZ1B3R6LT0l58ZdTHgcMbE3gyH2QpwBBQfWKt"
+    "/mKdmm4Se/ZWg1dOij7QTJW9nvNPj4wz5hNmzCxHPHq+OWj4Q2qLlegHw62IQhSeNhDTKuJWXJvs"
+    "4ud5FJMqZZ0jnDL/p8QkNUDohOx9iImep081QmRj4RGQgk6fw5L4p1nrodzWUJI99p2Xw5AyTZDj"
+    "aWYHgjD79TsqGqiCnJ8yQLcW4D5df8sXPWltWm2s6Rb8xuNIrB4p3fiT95CF15t9Uo16G8+UqaIC"
+    "iuHODoL5USmlgpA7/Kn/xanHIEjwNXcWgi0EWTpkWd0phYGa5d50rTcCsdugunu3bb+ibBB+trw3"
+    "Obi+Hrb+wPf/Ojm8NzenHKxs7qsK/PG+i5R7czbOc7dzyq1d+u484funJwR01h7JvZ4DTRxnosG8"
+    "m/6428yjawFupXvFp9VU8AUIb0JxaYOkmr9AOsTR0fSNcdRBXJ7tU7mzu/+3/833/5Jzdu3PykgE"
+    "7cSQn8kygBvXl6eObFZ69+8/Fn/uDarYP/+faw+MXtlbXTeqBST1bqrZY76vN6i+VCfWdVfUzvPt"
+    "GjcNzp1kURFm966+Wa7tRfHG4Nn35odbjnkt5sqTcUaqTRDSX1Yj9eqX7mcP1+jpKtIa8D6pHp8P"
+    "RNjzqJZ3xVnx35YcQxZkH3aFoUexO0ooYLWSINkvEN7CPOQ0jzIKt0/ud8HxOx/CzdC2h4vLA14E"
+    "xFYctr7FhffI1N1BjxGGnJK384o/hkNU2Rr/SyxZ5OiRa+JRMuceDMAx/o1qIAdjFtU77ztVXmFD"
+    "GysUJY5y5WY0IcA0GkpkZ9KhfvyLQesUbhuCaNR4gPjG9rQ6dHL/WW1HV9mN4v4JEx0YdNfTD/RI"
+    "ftgIM4mKajQnZq7F/h8zZSyW+yD7WLzG+zWRdkrsncgw4sFc9osKI41IhpsgIunCguZzHAo3kpf6"
+    "Qor/8R53oRPxjmUoAwsra5MIHEpb2gK3zNnVSZRgYiXQzkgUNRIMGosxXlpHPZaPHIEMSZP7Ah6A"
+    "z/SKpCwu5S6lDK0MGym7DQZDw29Z0/2ybELgu3cxFVhH6Cxi95W1q6vVhe/8Gjl39+HrekNGj9x9"
+    "4t1lZ2v/Dofd8Ytm6/w4sMaAR+Pt6NSo3JC0aR1Ti9saABkGv53rR5EIAAiYWampYY0kAqnmbodB"
+    "pebwbHjYBk/IcOLfRoaNJsHBqbO46VKiXKRVMyLDoIE2BhySYz+tNxwErHg49BhBEkYUnZobtdfu"
+    "wZGy1XCe6Iscq6RgkrF1PZ2TLw44izYcEvkvy2zSx1YpDWJljliZ+7h9IiGMoycSZhMCOCR3kn35"
+    "UnJcIf7dLjjZvKEBEEdcDfdgZJZ2yS57Qqs5EHGddLdIDV+cPPViRIlGXyWhbIgwdaHxhDKhq9UV"
+    "eewbQ+8ZkeuJKpiLiwT0QD0P6MhbAcul2GKpORBwbS0K+/edk3P+k8agwrNJxMtowDikdtMHpjSC"
+    "ayGbWEeQj1ZrTTGtP8AMl1+RGGQj2S8+ipeq26TZ3ARxvRb9+0u/IPkTUpskla8PszTYrekImHj7"
+    "Ee6NGrfS36dnTrbkMbpbcPF8N39du6r+u7dU/qMcyfvL836K2SfhPmir9bR78rx9U4GeU3VTLM0T"
+    "bU8Jb9yGfakgd2t0WVucScLQqNMuk4+YEgWX7ro+Wkeb2EVB5cPs5wTRbFT/Xpm5gra4v1h97+4M"
+    "Yfffmrf/6l7Ts7V9u8E/+kBH6eS+C5V1659LXHnvris9eu/08fbA7/7Obuyl26JK5xXXfneOGt+h"
+    "EXRti48ds53nJJn1nWnfdD9fn1lXVt5paGh8/sD7/4yOpw7lQu1KywkfPLY+mx9GsJeZEtX9ieOj"
+    "PBKt09V8lKqzAhd2f6uRxJCTJuhR+G5kPO0jLONEv9R04tz/hROi1lQZ2K3uO49Y+o4rSMsiFWlr"
+    "fe+Mj3HUfnc6ZXcfODnaw4cT4mG1+YjavAKJMNItgqNDmb6FBHoIQaexWjyHFVdh4qrVt8sodSgz"
+    "fmMN4q5H/RYJGoOAAApWDgEx05yDqq9BWZ9JcIYnGBCJTlELSw/LZBrMJ1o6BENb+saTN3ShcJTu"
+    "tTBozhyLDS8IV4hf8f9t70S6/rOvO7VW8NmEESJAgOIkVSpCaakizJmihZku2W7STtdPeKu+OOk1"
+    "4r/4j/jXzKt/bq9IrTttuxJEsWJWqgRImTJFIDZxIECYIACaBQc1We3/Psfd+3KPendBwLrFN17z"
+    "1nD8/e59wz3ukNLHbZPCogZbpnCb4TCCaq0o1C+Y5O8pIYisFELLKklWoBM2QJPxHX5liloaXMNN"
+    "aI1mp9dP6KCk3m7Bdx2lOBKUIAPXx8JxWKBF1OoUXJaMYqEElDiyi+OG8GaCSOkTFe5WHKrTMrEX"
+    "Li/CDD/6hWiWTE+YnN5L09bEuknRfy4w2swlABQIt+Km/m1jqTu5Pz1x07/sTJ43OvWuAq2XUT/b"
+    "XPzn2/cddTh7Y3ntBCzt+8cv1QC+KdFmoLiwkev5pOZBWvSR8LJCbRXakojHExUlXek1UEqoIgk6"
+    "qiisTiw/RQ4DUWdCZ9XbGQ9YIRfYuzY4sMctCjH56vJImYu1xlV6zt+sQzFTh6VantjyAV2m5piV"
+    "KdAjqWsBBkb8g3XtPc+Mq/UUXasVkDgvD6bp1lyAM6UytOtx97dMUhw/rfg6kE/5k042Zh4SoB/4"
+    "NTOTEA5w69nJO+i2eFGfnSsL47lur97DNG8VZ4U3ww8SDlg5wIzpPjaGC/QmTjS/I25c3K1Oo+WK"
+    "x0EOvsKNo+mC5eFlgpV3wZg3heBDdJvrQ/qdsAJz9g8f6Z/SZebSSqyKVcewFsgsnhZV+uuqyiSd"
+    "12EYzlYiSsgmheFn32xHQWbizueB+NK/W8k8b7aAy2fgSZ86gZIIu7TV0BvTK/ODy7sTw8cGZ7eP"
+    "CZS8NPnrs4nLu8NWzpTt3cJD9xgB8ZzWpBJzxx7bDLRP0CHV9v/ngS/uGuAkO87zBaRb4z6XGbyn"
+    "t+nHefe01Eoc/LLz6Qgu/LOof4v6iC8F29xYW5Q4sLt5x57dy//fJXv/XP1a/cqjqJ6f2wXwJXYw"
+    "nMP/v86RMPPfbUZ3/y/Pk/PnNx+wNru4vHL69vDasb+vkSVf0t3X3XfTmNzbqzvakFndoXF3Lm6q"
+    "78ttr6RB9KOnrpreGem+aG20/pR8bnrqiPoG0uSrZaLt0Kize1x9ypU8NLUkc3Xvc5nqzDYOt+kS"
+    "QUSBzVJ7jfKDo8+jJ4DjP0JnX/OkoxYxegx5+KMw7YJ9tuzYLEJvQKllUcivtRx+iXgttjRdu1rl"
+    "lTDKAyHuF59bz4QLzGRJfXrF3FjRAxSSIOSpDKI5cRcWfJmIZFOp2pDj3uod/zldYJcPxzHsaFtw"
+    "wLLzTZnCl0R/HLDiZPmAPFW8nmsVtwRGBzHUFONNnxELeoPnp5S+/R6dHLeX2MB5vwdR76wpxzrH"
+    "rJCNGbX9hUvZ0TbrtMie1sc+GZcm2bbVc0SJgn4BZuiAY+f32uFY0IAuAnOR7BQBY6IgkezVxelt"
+    "cucuIqblqLhjRN2U6d76J2npy0DfhEpki5jIlE0yLh8y3R1MnwiPffqGG7Uz/tL0wFyqXYlUlhiz"
+    "DO1S0jRMmBi+X2Av2Ws02w6B50hM7PkvEbl8aHJ8PqP9b0yPdP333jjU8tL+jW7VUUrpqJxXtvv+"
+    "ns7SeOPriws/2GG6hOHu+z6BTqBKZ6pRZQlRTE6kVaVwgetXSl0S6dCxWg5dMIWeihu63HwQwj2Z"
+    "74upIiL34qeOzQNtADi0fT0giEQ8VsW0q5AjIQKAQ/fjD5JtgX5JPSUTGJezAStrE0qewJ/Cw2Tq"
+    "Hfd76IB8cQxhqRxesQX5O2PvngrwYjbEQ8Mr1IRp8BhAbVGC4DdKt8Um40UEtbrqI6yBvlRfDyGQ"
+    "m8K49F9GOy0sR+B8dJyqFghjPa96RcvMpf6xpBCtHH5l7M6FNOEtJ/8iF5FmCY67+x3PAr5znY0R"
+    "tRwZesB5E637ZZ+pJ2IN8s5uFR3tj2poMnNQwA7at4xNsGRxUfRNO7TogQOfPshr3nvJlnlaC0jn"
+    "EbWyzKIxLY6FjORcoWX2cWd+jwZTjRxo2MaCRh2PTjlfrZkZ7UqYQlxwdNwJRDBNnExx2V6/biQf"
+    "047PLw0ze2hm8/f3H47i9fH557fX1YkdqcHs/c0cvutB8PVPgBHnf/nAcu3ghXeJQPNvBhmi75vI"
+    "SBYZmWvo78d5p88kPjpKOLrzxCqsWdLhBxE32Bd+rUdhcXF49ec/DIvT974fn/6dHHnvzdufmd/Z"
+    "8zoCj3w1VVAjvb2/MvPHv6hi9/53uf/cGTL/3x6be2f+vSztK1a2plfNFyXV2AfshXj1qqzdF3aU"
+    "KcNsXTGyz21GYn+uiQGs9BPa1/64HV4aP3LA7XXbuptrSuAV0jue+Q5GKUJ5k0Sw8oasvqG/zEg2"
+    "Z07qtp3bRZOhFktIXuhuy4+1bOgtiW08E6IcApHUfHHTKRQ6DwZMeu0M947AIUWHnq8UCi6scznq"
+    "g/UwfVcw8ZSZBeywoFbes7KjtkJbLhkXfnWQJASCJsJ0IJMH015dN6TZ05NnapOY/FdrmJH38RSL"
+    "7ioxIS9p/w4fLboc4nLG0OjowpciYyG4cc6yBC5dUi0jG7ZK3Qu7165N+BcnEcHHXGAp7XuLC0sK"
+    "3F3Kr6fL24WeXpcdJuVRmqWyfpemWUzCCZczhfNtD4CCJrAMf1CjXQZhinfYL0D2TBMj6PUyZ4nm"
+    "ui0oUCqP495ooWvdCAjiP4MqZMQj9lUfiNFzHvI9FlFygrz8gkzXmNDWBmoTpNPYhQCrLru+ngtY"
+    "PJgUDSbrFu11HfYxcVKPEPX1M+qWOjqNh79IwTCmO4yyFGVvRE0BPvv+PU89LNRH4E+fWOXDULOn"
+    "0mYfVT7333o4u7W/raZU6iT78WFIuqMAtUGs6VJuHplFKFkewKgkAm0Tn5ngC6xkqqK6FrM3VQE0"
+    "PxjKkjFawbXlfgVCBJ8I+sZ5DWcMXLAJQ0ZuyRZbg7oS91Kh6z8ZLqOvqK340LtjYaDHwWgO0DWe"
+    "7Q/sweAQGHMrEVEvpnM5YbWxoUE3wPCnAkl8UpfkSBCXcWadBC96LAPWYNKEaFx4KnPKsI9gw1Qw"
+    "bbHZi9CyN3gmKz7ZCyfRGm54byy7lEkzKxP7LTxsG3GyYRa6c6Xzk6j8XCvsu6dPBbUpiItuSagp"
+    "5tjHmMH51RQwpvqow9pUoPJO4sI8eW+pk0lO70kW+ZArAsCyjbQN8+SFdH58dmKCPMpZyNgT1tfd"
+    "FCYoLhKhd+Yif2Z3GQAShtIiVCmqygN9YLpf3IMDzzlQd+QJgyVW/kD43o+sWEO26qN7SB3NVDXs"
+    "osDPXbVLua+PE7Vi9uLw4P6dHLrzz15vDdZ68Mz7+2MaxtbA/bGrx5l00O4bJ0VQ/wg/ceVI99V1"
+    "6A3IlDZEGyfhzTNNnBcQ4lIy81WZNtLdpUdYVLV4K+fHXfgvP657xxAcab7kKoHbOwk79HDizufO"
+    "TbD//gXz7zzMsfl+QRG9jf7ZfAVVACTHbPvPrqNQ/+8JFPPvKLV/74hfNrn784v3xyRS3kihZwuk"
+    "E36IeF9PNy9MdqD9u69KHuhFGZC6+8LztP+/SFmM1hefvN4ZajF4e779wcjvDm3Zwm4DX3yoU0tT"
+    "Emzm6INHAKkX6JyLR/MsNyULm0o/Ff7ZXfviNOl0LY8V0ZX/pRyr2gj8SqN1NMcXxtJcvhQ2Ersq"
+    "07NmCnz45gi/d8wniS8UJD/YR/h48+BZ8E7vmJjcRD54a0smYyRycUkQ7lYKb27u7os8CzZ3Dgg6"
+    "I/d+GkK6A/hopzgF7YPTZA9vhJf7dHLwD0lRkjGGcLVErOP3CJBZeU/YY7FSJ/ubhY/jrDhdX6Yx"
+    "JdoxcFDwkYkwMqDCiMkV5g6303vZ2j9+g2dOFNT33weK/wGXOmZoKBb0bXzo/sdn6VBpX8p1w6oz"
+    "bsHZrR13lQmST0MWcCcFviWFhI4A/B457LObSm2198Rm50OjpW7J14o2loGEOv+X0smvFm/Ojslq"
+    "JUNf7ZJAjkC4CUQUNxRMZHL+gVQ04bbZZyQ9cHjvwjjw8cFYyLvH0JLftqFxYKv9uTSeUweuB24K"
+    "4qoJBgqf5u63y+dPMNNzx+2/XDBZFnpFvr1/f4q7Xx1zcvw0fvvePFwzsbj+9sba+OJ1BnkYmjr+"
+    "nRSKvmcPQiRhWvJ8VUuJ549jHFoZowBkmpo/Aio8mFmQZeNuQANnpztSFdV65c8YRJ59UyVDggZy"
+    "tq1zeaYnS6/k3zMro22swCAVz0fVTc+Oy6DmOvkhw6jHeDRKBsDKM4PnSgDJreecA/bLHogNd81J"
+    "hEJ8QnXc1VsvBwgiiHOo55rbR1xcfP2FZ+rIJN+VhYfSRjHhh1BIvN57TxlO5yb5+x0T43z35Ilk"
+    "AcuhfiwiE+BsWdqqPjyEug5RxvBeS0Gbpwk6HoiBlJmWbCkwVILW5E88Bpt+LTKA+u6hS4mfhY2L"
+    "YMaIOBjl+1CBM9eRW22J5YuG5GVmCljlziXElPHspGnQPbxn5trs/SZn1lmuJUB+LweM/Nd7W02G"
+    "KRxOKK/PZii8cZl5Xm63d6fkKbfqeKK/rC2FpYGlYWDg/PbSwO3z29Pjz43Mrw+Mtrw/m1uWGdK/"
+    "ULekTLHwlSrmSPGU3OFGWfxyJlMuUpOyzOeFSSd3Wge7KkfsOq0k1dp3ypf5JjoJK8/l0vKXPKDn"
+    "lfWOI8kpC83vM7tL22/uE//09f/tfPPnf6U6LuL+pUCPvh17sEWJj94tkXj/31177ziW89/vT/+N"
+    "IbV77w5tbk1BV1LVfUZi7r5bk1/VA473a7OaiN0Qq5I+f2yBdrtXFBZaLjoaV5/c7HleGOW7eGE9"
+    "dq8s0EXH2DWhSNqnRklEZH26X43O+RSL/aJQqP9k4/5T5z5NN6wQQmMfdloUCVFp1UFoBp0cDbmj"
+    "GRAd39pnEyztGnMX0VC3CU3CfEh/KvcBAi6sf50HNfg6L6GB1sr2WNxw6bdVTKHZX7I6Oxi55tFw"
+    "05+WRfxXeOA5G4/YVgdR/tP2njQcqYKo/N6ny3hssvRWo+c2lrcXQe8BtK7OSAT5bSThGxRlzEzC"
+    "x5xBys4FgXDYlAz8qKUuMMR8AXdCFweW5d/bzqIrWQ8YD5Sv2B4sWH7MaPqS3mHdQ/6ObFcYBL1l"
+    "EhJY2M49p7zgB2/elQcjpWAdtSYUKyjT4K03J1HOes5Qu4UogDdUgCO3iRAGvKNrgZe2Tw2ypTSf"
+    "sSj42AL9Rz0DhEvsDLnNmYKJnOj2FERywWVO+npkZquEjJO+S1s5+lC6ftc3R9E5DldE4NXrjM/R"
+    "iXt7Z315cOLv3kA3fe/BPx1wxxFe2uhp8tGE/HdccOnTl5YOn7Zy9v/N78wsItNEwmt75aphPtRx"
+    "k0qOzQKKkNOsFupK4owKSKUENdKUQ3FTlojFw+prJ44YOAa24qHHK+4oiOepFuKNihblGpwLZ9Ou"
+    "HSBQacrtfIsDCCTdy1U/FMFlsqpmFjx5W2JuHg2mfrVs6SnTFBEvasD+Dwxz/O2KMyx8GNBh7BBP"
+    "VxbkRgJT9MxsushIRmOJSIBwwbya2ZoMF2fjsR/2PGnlRZWbd84sow9nNVj3OUMjOcDPvDG0qkHO"
+    "2B7cBPvvFLJNue+marIvLHf4cuq/bfywPJoRn35EPFc95a04gt5CMXGgKdcrMkBG2howMy+HRILC"
+    "Sm55Ufss4HcFJf7QN3g6oOoIo+frQvre9FNwbFQy5R7KRzzWIwdPeNskvds3ykVe66usyACJ3Qxx"
+    "QEbrvTR49zROXxpEoMBgM+VoQ/u7qLbk9laCIZ1Fnw+2t3fCFAkyr7LQwuA/AAMhYpe2wyL9yWzI"
+    "r4v7i0O7y+ujGcu/TmcPfNB4cbj84Ph3l+i5tmc/rUuWT5AIP1gVa5buv9PUVlT5iKkI2+y4/c9E"
+    "oy9ZoSQo8g3/WXuAlxTIQM4Gmv89RJlRXZXVxeuunwZPj8f/rbr8/9qy/9s7nb77rpQWmulvb+Yb"
+    "8Efq1KQHfc5l546eyJr3//sfu+/fizf/raxc0vXNydnFzVhJlvUm6oL9rUTxDky5TV32lc9nRajY"
+    "u2Pq+77vOS0dt1eqeO35/TXbmdt4a775rTj4mvDfOLemjTvxlWs3MGT6628P4SpaX2RQumHdoCmE"
+    "rRV9CYoWfyaQG3bxZE6HqeLwl+p8531wMiTnyjLzCG6PRBHd4eazU84p1c+yV5VPDA8hCnijCM6c"
+    "WZ4vSj2MAn94ttzGDelY7wZ2jtl/VloCSjLXvGAhsKZec+Nn0XwuWt5ae6+GJmcAoV35AhR4whBg"
+    "3BVEcxZAcxLorsOShv8An46jFAAIimhDIOREI05MNEAwL/CjZgscREl42YEUU6pmPbepBEUb1bWN"
+    "RbmBM93q8LghP1+/T9ltb4EVw0OAfxy0aEhzqYwBkVvxIz3byimCzbu7oomHpG7rqU0StBKVXK+S"
+    "S/jWMR7CbCXu6ntjrRik5oh6JoKR+iIhSYrdvfFm7W1JrPxQxml33mdgFPLkpXhiI+owQ8SZv2Lo"
+    "RZEZFxBcTpuYyaSOYl1XlvObjRM0cYNgWQ0aZGTIdL/6CDOY7s7m7t7Jw+fODgQ7ffcuSMFM0C4W"
+    "oJMzXk1z9LByaTjQ+97/ZHlneGJye0VdesXA30lRgqk3JMZXXQ0Y1IDaVpm3yAQYNQFgiSZSKq4M"
+    "5ScU9MTUA3ekjQdzRGOiEmwNMJODxqD0capnHxg02hKx26xCMbeXQQ82Ku5EvCuuzSINWMLRtM1/"
+    "OSgD4G4vp3w1I8k2y4dAPln+jTZ+4RT+PgSPBeTra/0JyvEbd4ksHc1Ja7GtE4O6Bogw8AyQoubx"
+    "GiC1flIpDxypR4XmCI04s5VIkjh6LPVWFCIuwpH6Whl3j0LDXddX7buepm8MxC+Ee+A6+ECGVSfO"
+    "LTlDMzhbasfS1afIn/4E7P2fQcjedKApRFn3cgnLdEYkoyjd9+jN4ogi7noUOXL8c95aR0yqhk4e"
+    "svLxvnvLQdsKb6xDVI1xbfJa9zxIcPeIxTHmZTA6Kpke+Ws3+auPGOXX5wHr+YuuVRpEyckkc+qM"
+    "C5X9OL7+eGg8OP39gdvvWLC8MPnr0wPHN2ZVjVFzK3ZWBHeEwmVVM8iWPA9dmrtkoO2Sgn+1Nx8o"
+    "s/0OQQtVEIOVfOOwUEC74C0wS3f5Fbl7LWI5hah8/dvDQMX/jrr/39v3n1zNmPSXzZSvu7/RL4tS"
+    "iB1PXNre35558/c8Nff+u7n3zoydP/7pXLc597czh0ck0fLlrRS3MrV9aG1dW1YXOd7w7QTnkUUW"
+    "1EKabu+aiXFnJa/OnSlC606M6JJttHdX3jrhOX9bjluh631MSbKy1pkXVUI+P2PNNu3qmjD6PhIa"
+    "Zj+k3SIrh9J0477TED0bRj1PJneegVfHFQnrrNI0O7dztvf1pWoIzJAAAgAElEQVQyR/oHfDD2Xp"
+    "a9N6mZwvGcgSNdpHGlX6HFpmDigR8TjrLDc4fxoIixRG0QH5FtGjG2lFXGjSo3kS1Jn00ol4D0nS"
+    "zz0a5IpCIqfyxuYZF0tCv2mfMPLZC+uK4kGmVCKT0VwYUveuBdLkyKpIBagvBMAxdq5SneKE2dUK"
+    "Bc7Esjy4Zwja/ef3FeCzpdNJjXTxiAwBiATS8KgdWVAA0lZRgMfMdm4iI4mMaiViH+OJZzA1kb59"
+    "hUHacyorRrJZdzWSZRaL5BSI+EwpmmWzyLrzIIsULbtb9jWTU3x39AyybztFW4KoGpW44VvZR9Sv"
+    "DX/zn67M642uc7KmKgFEXUZkJLTkmeq9R5RRYJqyseCAyx0c7pXxif2TifOjJgzy/+/LabTv7g2I"
+    "H5FQledaFawFWTr+3PfPS+Z6/ZXX94srN50YOHzu9E79rk8bCcXHLb7cOVvWoSFcZXQVQDoNP504"
+    "lloZLKM1YYT9mkKB30DMHOJGjpBLLYoMIFK4OEuhYcEM0b/uBUhUxogRZVG/1IOl1VTPxyb4Nw/O"
+    "SYDNE5qZoXGLYIzhPS2KuAHB0AosQdDFNxHezzjA4yvaBqJPtYMvZLDJedbLc92G2i0KdpEfAivo"
+    "Q7i5P8hN54ZFfoxoCDfiQUJ0+Um+k+pDHLCfRHPzoCmIN0CiRooY82kUMH24WFGrKk95QxYpQ9ch"
+    "YqYNvJzhicR2ALgwQDHXc4oVpGNI6kvUDVkUD9oZzMK3jLS5ak6ejZAREqv9B9ZRUQBZd78Vx2sg"
+    "+A9SNiXUTGuoUBEZDPeVCcdIRgOThdGFFRHiyXd9b8GC7+wvQxd1QNI2QPtOJxJCMZeKdx3oeLjI"
+    "7JteW25reHi8uT4cXN+eGRc9vDt56/PHz/l2/pwymbw8WVem9Cjcp5T1GrIIQrO368VQ74YobQYN"
+    "O6ky479temtMP1nIecj9ztQ0TOSVk6XFkFU0d+fFyPlC7OLe6e2t5Z+ezffv0b/935189/QNIHUd"
+    "kP+yXwT78E5vSlymHyyunXTn7rR4/d//BTp//klZXtz69MDtxwWR86ubw5GVbXNvXe3LZ/QHxHA/"
+    "FuDca0IzUGj54s6PhoFpdcdR1GTxusabK9Nlw/uTTcp3fnbr/pLd1NmXkqitk8ONu6464LNHqeWi"
+    "2TBZ3ely3c9P30nTKjjWP1wpJRW6RN+j/H7udGnhVzBhBNCAKQtGMDGJU5wrQPjriloub9COIUSI"
+    "0z4huSnXhxeDyOQAWTfg5q+iL2Yx7oa5I5551oB5uoBHnFhxn2iEFXRXA5JZp0iDDGdGNaVoDOW2"
+    "XfNPwZ5YvhPErW+az8jnZ0sU11wpL0+e42naNI9IJKx/F8j7lASxv2/D+uyCoNhMZW9fNLS3y4So"
+    "/x7l6RuO4Oq/5Rffwuo5RdBeyEiLLVCzlDM05Ihj/Gnx73PQfEvP7sA+UobD6cxRilotAWvZSJCA"
+    "QfGLMjw9GmvRO/MBGDZK7wPCZW2YpsnxnXey7K0y8OKLapsh9Qeyr5WEy1iwX0iquYHchsVzjgeg"
+    "vFdkc3xM95AaDkBFyn2r5z3ssz0cGWJc4zRs2hLKbB2BIbtYxnQumjFlvIsnmc7YpsYypboaqvuX"
+    "z04MGHf+O2k89L7qr6umWXGNXuqgo3Hj5w+b0nj/90fnvjNU2ktP6hQeqsqn17zqYTzmNVbKkAVa"
+    "FVCj25pUJQMSWi49jEpuUkmis8AKpqvhJPBYKulutKK5sMXsGKfAYbYFS58Mn6s7CSK2waPyJeUN"
+    "qT6NFO3YkgR0sQr+UCiU8lAzdJ09yRVHqqQycAVnR6gErDoxnpT8I50jlJUP8uU6HmGH3o5Msy0s"
+    "gRH8ToMBOH3jxwrCsQD/qlQv7htWzLS7MRPWFuvsw6oJMoeJFFRmQH4xg3TcA2wsoeuRlfm9V2rA"
+    "+xZLwIL3AfsAW7FK1XcZywPrr6x9OuJ05LEX/gkM+pG5FHxkEiwQ1h9Mk6Bi5BHSwCVi42uPymwG"
+    "i43O2S61X8Qg9e/MFe9ANc56qtIIsdu+5MxL+2aSzVMwmx5b1KFnG0E1uxMnFvltMFGdKq+JSoF3"
+    "BcsWfAoFFrY3rIB0+4BLerO3/8qLEe3ho29f7cpfkDw0t6v+6hs9vDA8+sDI+9sjW8eGFnWFe92t"
+    "LVfa7w89ESv8NXflGO2HOTlm3eqbNt7HNebAvTStcg6vZKxpXuQJ3gwyx8GAUEAnu332FnUWV645"
+    "tvnv/Sf/zPX/6Ts6+9/l6x9hd1FNJ++CdXAtNarY+b6KbZk794+aa//MYPfudbP3z2f3nt8s6XLm"
+    "3N3bSyNSyt6aMnV9b4MJFaoAZZ2hc/UbDLgMt7qTz2rNzl4ocm73z1Uo9Zcv9kQau6yc7KcNOB88"
+    "MH3zs3XHutFm16JE5XZK1rRb1C67tz3MHRpmethSFs8EFR+7QtpWRM9nU5Ru23mp/S9FFJu+8k7r"
+    "5W8orOCkbOCtZxGgmTwKafmPan3UcaRbypPMAGD636CMoBKn2HJWZ1ZuVF79CjGkfrm5f+2WOlBW"
+    "MbVP5ats8h6fbN4mJ0uouizLdZZxqZyoXT8T665mmuxauOlvGxPAC/kOID+8SmBhJrP8znXLKN2l"
+    "D36o0pJkZjwJo2nX8WhYTgKi05Hrk8oPfoFuf0OK8+tgOm++rEomCbhUMZ6zwHDBp+VFnMlP/Uze"
+    "DhkdmWj++xBb/9pQ5JDlAFjh5rFLFEHbvsRzlFOm7FSBsXenhCAISthBOdauKHsUVqKrRcuIeXeT"
+    "Bj1jhHkWSfJ45jVjDVCdUFD8+Y7kJQnICM7SY5+udXUMrlZlneGaD88b7C6GzSPhv4QtsSPiY9Jx"
+    "NbJexXOPSF3VduvfGGH5y8dsLHUK7KMPmzP/uzqy1jW/qx0vmf/fKVD60eOHiHOnN9EiGV1RNIne"
+    "ktJn7QXPl85l0GDDKZbKkK0MoquFtyMrTcWRCTiuMDzZRk0lQmrjxOrxZOKyINxZNXCbmiI1xx+9"
+    "Q2ReuKj092FSuIl0xH2legIqeuRzoZNFsYM6NmfCWtzfQy7oZRKs6P+LGvvDHDJeAGepSR4uQ+2F"
+    "1u0Ql86cjZbZUJk1tDlD0ntOPqUib4SpSbxsQEjfRtNPxmIISOnwT7Do00xwrxbYRosheQnWg10p"
+    "3vKS9YplMGtku3O4OpxLQcIhK/0aVe5Hwas3yz/7gKUTQmB7g+5qfkehFl+5E2TO8iNs1v0+lT+7"
+    "xYRruClEjqqh+pwHMZTjF2rtpn6lLyCq7zZAORY49LyZ8ZY31pVykX6mIJRijGEhffPO0hkxP8xl"
+    "fji+hJj/zw8MKsQTTaL3WGBVl8wFLyZc3S51ev1jT5u7ilxzH12wZvrWwMG1c2Bv0WuTd+B29bF+"
+    "yYfC6SE+nFvhZj+IFfYNVELAUFNSH1MGWEP+OFG3ysfCBpDdHQ15OX2FkS//Dq1tYtzz7/8uKtJ2"
+    "48feT44bckyrR1P+yXwD+ZEujavnJld/6xnzxzx998++Hf/85jz/3JmYtb91/cGq65tLk1v6b+fV"
+    "2/K7e+kbvg86rjCwvLap+0Kr7arAanNsZNNvc7uoM3z0ut+mqtXrQTf0s/Jn52+PRtK8MXP7UznD"
+    "p1RWu0DeuiN+ywsNPmhRsLQ/WXLOS08b4SE0g/9MBj2TRiNVq3P5qc2q77ki5R2iZxiJZthkjFG/"
+    "vhkYVGo1i7GvUoELvT5DQ2oxbfxBJEoexFhYhP9qsVAzXVjaZFLa5Yz1noY9AVKr1X/tDvNPGEMY"
+    "+Wb2rKoFO/4kZM/0peTS7er2SswXR0HuxVx7FHvOcKCJNvwDiHpNmFn7tT0NBhx/nWFkq0KAs/y4"
+    "pMlSE0jQMbqweGN1avG67o12PW9TPj27v6qRts2z4jDPMX9NHlADYYqUOqdaGLB6396XLufMQ3RB"
+    "jXo4+G5axLygjOfxKyIV7OlI7URQFVDmDYL3a5c6gYPmpne/bHOTAcO3stPcs4jfbbgssIKjgcR4"
+    "tj3I+kIiGWuZ5gBFfkAoWD/WlgPOw/GHu56Eenh9fYb/0gQYvN0I3n8yl9xlx81j+vZvCoJcL0MQ"
+    "T8hqDu6Zsf+417/v1N1yxdtQu62RbkzF8Nu9/6yL2v3HDtgUf0DMeleTr6ClRs/piA9STMddc7Kg"
+    "aNRMKpQ25M3eEZougsTHIFg2pC01Og4VlZFakaYSpu8REp2xZjp80fWuFYWxZhfDI+7/FBD54A5C"
+    "cVtyu3K7EwU3HjePvr3+GSbBao2MYce2CCkTh7PAt/9g6d7ZRf1pEMeZL66G+XVRcaJkDrfMRm7F"
+    "Lmmdg7KwhmoFXDAx+fySuDby8i0U8epj7jscsOSxiMV9P8qYGbDpbxNFkQPn5FHh1s4odw6RgqOA"
+    "2jQ+k5CR17tSGbINoMC1ovwhDxHUfTZs5H+ZbyQzn1xrol63xhv2VHOi6kzJBvufZ99Au3VBa94M"
+    "fvnJdoWRP/iEg2OxEUPCjJNlixBTUTpaalLC2NgmV1iL+8qcYdKulkAMRKyp8zkfKi48UwbaTOBy"
+    "kuuGiDB904Uvdp0hX7tOjw8GlHd+R0md755G6e8cmrNj+hpQ6eB3k25dxbulvw3JXl4eGzO8O3n7"
+    "40/PSlK8Ppt7TAm9M7dloorst/vRukcmKiqQ1fPIIxfZTb1FWO9jlH+6s05ezSI9+K+Eudzl3yK4"
+    "JSGXzgL+qWxMLiwlH9EPk9W2vr/82XH/jWf3/u7Ou3SUi3JgKl437YL4H/n0uAnnMYLl/eWvjR47"
+    "+468//9pt/9N0fP/c/v7yy/ckLu0tHr2givKlF1YZ+LoT3Xam69Le0BbcZ7bvVmKh2yc8U7OqLll"
+    "xtRQ69g0rcfmht+ND7lobrT+jO3Zzeq6Mv5305L+ZASxva9eQbzW6JyAnHE3M3W3HEx3GCovaJhj"
+    "cSiUlA/sB30NH9J0e1Z/c5xbKM9WFGToeoVcTjW8UtClf4YI4TWxj6d78OfxQkDmEmWHZKpE9L4E"
+    "jfmDT56Itz8NGo3oik5fakTcU0Y1LwGwuW/S2zXTxxU/Yg2HxsF5RIOhf2Z0bGzHiDkjE8wXYvHV"
+    "URobs8Kj+VAfOb1P61VbuARPkZpyptpWb0MRp0wwd08UCX+XR+VcfKHxvTjnywFqBM+XO5OS1Tdb"
+    "Ss4SShY8o28Z77+IMNYEvAdcqOKt3utEEdXZ2x7QKinsd+9Jw0JQUFQMosUuw7cA6U9q5UMFg2kR"
+    "vNjxHJq+1gOiQAgmF3Rh3lowB8xCRpdig6PoIkT0rGlZSlcd8mysiKzNuDNYphv5CxQ5V3pzGrSD"
+    "sqES7Cbm/pvNpY7Oou/rmjR448cPeNR8693c7VlL4a79DRQW1dvLI5/+PT5+7ViHGrLgOq/mUyq+"
+    "7Ln0l3HXD9SOOhQnQldSNSHWEh0QsiKiyNtjtlKgGY0JChwnHVvTudboiWUWtFzwuVukNFDaY+9i"
+    "DTeuDiC3eyjCtdL0YQDst6TpgW+06bL4/IS23QR19k0w1DtLYHjzYTeaQTyBc+E6wvGXssku9U6G"
+    "idSCiO4LRMrCMS2KMtysn26OCsCIi36APgTFmnyzolFXn8ciYsGtlCsn/2ySJ0yuoqBAyNhap1JW"
+    "xbpBKZ+ic9g/uInI1EV/Gww4SXfGGDCUsCXDZ4Puc6Wm5Gf7TbOtjRP75yrCKIn9AMDg4KseSJTg"
+    "lKYrRfkD7ARn26iEYyofNGzXUtxozkKWv87byZph0DDiWgU6gIPmSDT8AO7xRYHx4DGf9WyGLH6F"
+    "JgAsGGbDc6UjaiI3bwmY27b7QD/NnROwmxK1F8YCsHukxlEmZ+gw7pqYgTXN/Z0rPXq2Kc1y8dv6"
+    "rnxM6v6vFM3b2jLJYW9I6FHtXkir8e6rKf5E3PduGhBgsKQD7qiJ/YNZ+8anOecE1S8JLPxC1gLD"
+    "TTH/FOHSR9wv3AxubKNS+99sbyu06evHjw8CHu1F2Vz/krX/vh16gEVNsn5y5sHP7uo4//xl8/8P"
+    "C/efyF1/+H17d2P7i+sHx4VTNf3ZRT+9FjznzoSHXfT6dogrjAu238HiT9I22CNqONH2fe0YSLLw"
+    "3yBdidTX2gQo9dXq8fD//YreeHz39sZXjXqZVheUk3qrm7t6MZ+M6Sxh3aXu7y0b/QU/jjGZ40K+"
+    "rHLt2TiEOr8ttROoqGqP74D48TQPvk0U3aswT07wWT4nQtyoLS9MuIRosocuBMAwn1WchUv4AuIa"
+    "ryW5G8/kFEScmBmTh6SJZ8tMSS38iSbWiSoT+xJ9jib9QT332tIJGLeADRLjkI/PA1stDw034pLi"
+    "ombNeKyBUNhnpDkXMOZ/HwMQF/wMjRNDACqqMzbr/NI60AG+Me/xRxns1gBx8BRCJYSesQxzPGg5"
+    "FPjDKzPWwSF8FfStUcbePA8NaVa/TExvFhZXJUF5IPqsyoVyilX1dEoXCt77NhX7HnIHxfbBz5oh"
+    "JXQCJ+iyAn4zPHqUBQamx0gh0+VAiIEzYBjlKNkTHahDY7Klq1qVIaLyq/TWKs+5WnYFJ+qR+Q0Z"
+    "3mhSwKcMwTgFgjUDKUGXkQzScSjyuU2AzFOD1/Rn42b4mjJFzXFcVRJu5/WTNd/QvnQo3VcwXNG2"
+    "gnCFOnGGHFeuo9N9/6v/3GXde8UN5clYeZ2nNV5W/jtz58z5MH19ce1VKdPtkNL799pivuOuFUPD"
+    "pzKgj1zhW7J47WEIs6oeCKBQhx/sRIJYwALGjIZ1MFFGjTbUAypmCMYPkZfRqQNgO0TMQsjvYYxP"
+    "ciYpRLQ8A2IY0y8TQKNUqwCS3kKH6a6jJxTGkvgtwgJE4BKSQ3jsrPMgS9ASJkgSltKme2yp3gMi"
+    "rcxEVsu0VoGykzq+3dSR7T7V/06XhEr/PncySCxEQXg38d2fAREsfEafQV7zxbJvIY9/kRjZDywA"
+    "n/G8t4MGMqESVc9mCjp4Vl2+ToIHkCPJQr6bhnFDAV+lz6KN0+p8ENPnKNnwUllL3BkwKcZVO9cO"
+    "enThg8b6L34DrWBdnjrpUnPBhEF191JCquePiftuU+nZxUFvGAnEUeXdLaxHd+lJgoYXvEVccWuX"
+    "xPGbGJx5nEP79TJz5++4fCJZeFn8RUzRcls+S2jUX5pKv/fAWTI+/rbOmOnr6XMqxrsnheN8Oe0k"
+    "8dPPDS5vDt59aHp14dhnNr+oD64rJ/w25OC66JsBb1Q+f8Pp79x658HDdnUhcM5CdPg/bHWljmsy"
+    "kXHqb54WR+Uy9YPDKmUtOdipT73FF9Av4D58+f/xd/+dVv/Ouzr+pi1DAc1rYf9kvgH7UE3GTZad"
+    "ve3JmcOXvpxN8//Oj9/8dXvve//uiZV//4ja2d963PLx5aV33fVJ1e21wfNjf0w9/qd/n8P++c8t"
+    "uSfvw4Kym1GxZ1O/pICu/W6UvSPFXMI3HzevRZstccWhqu3Tk/fOT2OX0MZUc//gwfH+gD1FjpWj"
+    "gKj4WbF29+d47+FLKEsSGxOeRocZZHT5tbIIAKiEoWFd9NESkLOegtQxtHRjg87oldyRlKu/R1il"
+    "hcPDlB3jvkvdukGhNuJCRvfxlz0B0ZsWFbAKe/LGLAJMvCkSFu7G0F4LGEI1LwdejxzDSle7yxPw"
+    "Kgv6KkyJnfQWZSDILOk63TOcMTnnWSNA4+90Yvm4AAAX9EY1MIVmKRxWKBiYwsdxfbXyTDlqZsZz"
+    "wLyXupBtmSEafMbM/WCgDWjKTd43H3bdUvfVF1Z1V9Mxfqapwx0szOUPgKDPVA//Kn82VJ0olo33"
+    "FiiY9sKEqweXElNjzSKUfKbAapZJFx0NH8TotoXXnXpOAj3dYLUBSf+xJEDhlC4siNKKYhYp4inK"
+    "uuXxRGp6HFPwubnnmpG2vwjYw/yXswhc3gGWVjp/2136iWTenZNv7ZF8PqFCRv7lck64vWEum5DX"
+    "M19OhzdLH0st7VfejuW294PtpX7/6qvEPH6Tq6vLT982fOHHpldf3TqgjHdGZ1snM1jpkYv03n97"
+    "m6LisdGbq4aYVjccDfnqqGLDKqYL35uV2II14wXOmtHQRUx3fFSBQGtgmqk57g7encqMjmNzh2LV"
+    "5qSitPvchjgmi7LQRuYfQRbfvO0QmOwYnPFiim4mW68xvdNPZyxb40H8gO+AN9T+gkx94QUPztsr"
+    "24a33zkbOiqF0sUIrOOeMf2wTnjU5Z5ehih0bax5RvZCwSH/BLGLZjXJLBhUqUwCKkn9fOQigsOh"
+    "fK0jqSs99Wjw/oYsI4I1zkUwZltBDshzT63HIc8ycffrXckl9MEFJuMZTFI9TyxX6SVvC5Un0q/5"
+    "MnzrWCduQVLP9JhlxYBQzxY0e26dcxR55rsyDCyIKnYJzmkxbfg57iSBmvfIm02pC0yD848Y84Ex"
+    "HJ2ydNLBWHt6B2z9FykreunMNzfODhmyu6+n/2yvxw4fLGcPHiuu820D8saLGonxmQzIbKY9G/VW"
+    "ffne1g5nwIyPZU1xVjY9bFkVqWI3tZVLlQBOSrH7nWeYS5tLO9db2+DnjLy6dPL9904tSLR44d0h"
+    "JzP+yXwD9eCaSW6uKHroGcPn3p2Nd+8Oj9//nBH/7pk2fO/86F7bl38ctwG2pHW3otgLty/i3QWg"
+    "RQv7kAQpumvfC5eMbded/1ZtxlgqVFHe+s7mjRpgssul03LK+9OdyzeG74o3+2Nrzn1lVd9NBXxd"
+    "X+3HrczvGqFlZM3nf0VLLa0Y7aLW3Yk2wv5NKvyDpUhfRNQLgd0vCsQPvLuASy2yJ0JfCdPToJtG"
+    "P9CQA5sJFQovhFNzYAUtS/ZVsGLBYcSrvPNrawDAF++QtdRPdjlGmbqAhJe2MZieIJcfgwOZRtr2"
+    "8iIQYBVGlL1r0NTkItXbD8ZzyzzIOdskAPAxgqvYiVFWmTDdsPIxN3k6wXzdbFfvLddAGJaVEf42"
+    "Jz+xgZLORJjfTl6UJFk7PjExzubJFUcEZ03FoeLq8eGd5c18/Xzx0Z1raOqV5iFF+YO+mIKUg6cO"
+    "Eh7+hxURCfc1E2xdBlWCoiWjUFLD0jgCJVZGvci1psxEjisehsNzmlR0pKrVdIsabETLBJdm+3ja"
+    "5ohnAZ2YIs6i9KdbTg1BMly+sZK0TRm5LAcf1qzVkmYoF9WzbsjTVSPsCWX4Xd9dP2Cga4zHn5LV"
+    "xZJT/4qTGXAM35UlzXcZ85ceTw//7bH7njER6is8BVurtqF3Q6X5u7C0sbP33+pY9r6Lhzl56oK1"
+    "g1Nt+idSPO2eVM0ylk8pcv43Tt68oWiHSKaFHZuhJbRpWQoxdXVXcsQwXDhZjy3re1K41t88tHYx"
+    "pbPhUN/9EXlJFDDyIc+qRe1DmNZ2XXSugXlrUUN0bh4krs1iCpNIOPrUbB9p22H2k0NDQ2Q4NV5S"
+    "uiQ9vEVvvTrapg270ouDD26rZNYzVfyva3z2eBphyzqAWFtFkUHP5pc6i0jYvgBUw4jidPkTUG8g"
+    "qJs1pJeYPJxNx38GIJksstdaLsIcef3ZiWPcVH/sCd3cjdmEbHFtm1H4olGooSXb6jqCLxNzzfnZ"
+    "YcNO0sH3+mGtiBDR08jgxivQCGloWkJYNlWeRVLlTEFE/0UQcEcR+wC7HzSxyblE9EEYxtC6Z8kU"
+    "FQoRekzkZIUya6XIixEenryB/1z/mi0w8sRh3laS3q7RV9pe+Cfub77Fvrw4VLq8MOH3gQfUEvuq"
+    "Gv1+t8NZDruvwZWzPftAS+8iYbTqndyC7+gltZZ6RBS0FHnNEEgjufRJV/inii94uuXb28fvL0K2"
+    "cWbzl1w9nDRw5flqBmvvthvwT+MUpgd9jY3Jy8/PKFd331Oz/63b968Pv/7tk3L91/cZg/tTnRrW"
+    "ot0Lios62FGE1sTn0fd6YJtGG643nuajFZV4XWd8lU17UAc32n3rMS490lXSTRbItPyV+/dn74xO"
+    "3nhi994cpwzXWXpMrjlvw8o3AYo3nskrg2Lsn4R5u1mJNlm0mfA5+Q1pjWJ3Wnw1G0/KDppv16YU"
+    "cLzT/qDrTajI9ksvRR589z/hliazTG21nwNeMcyeUHZeWAXseL9KuEqUyNysabVSM+uxnKtkSfMV"
+    "b9zcgeTSqCePpO7AW90wZvPMmlZ5t6QAw2++hOecl/nQ0WSZYrPgWKppIjvVgWK1l6z5B1pF/16r"
+    "Vp0gUCDH/SPJ40rhV9V3d5WFs/NLx55dBwaffocHnjmC7Y9U9f0G9jLL7MezEHgfFD1sdFdmjQM4"
+    "LErvXsK3QcccLlie8E/Ot4uEKosQImKlXspSGCVPfqAE3+s7We2yMAMWV49Po8GngUkthMHGGrSt"
+    "dzNSwyVjYex7eFEbfp5EPnBVyXwIzu1KUqGzspAXxQSFtT0jbJF+VQ+bMTgCGfo+cg4icP0fcdd+"
+    "BcNxhbdy+qb/rab95z9/95+61X9/tzlOHVvKAbTl5zfP1HTzx5/PXtzY/vThYO+b00ZZpJLZWnqg"
+    "flYFoiVJlUonQYSKViORIuhFR6KiNbVTxjOs6iiMfPxPKiSEf98U9wg+ERRMn60RTR3QiElY4X2f"
+    "B8O1o6qHYDKhigFJJqfCp1MGRHtpPGn/jqO5WKWz4A9tMNqtJGxHk4SjjNjrzpr30NR1iiI86CUl"
+    "EE2Y1yYPuqifyxH6BEpHTRVpm6IRbDAHhgR8oV9KbYHbdX0gWDfcosfpX0qAcsxruMkB2v7pUPOa"
+    "0sYiw97oyO7gyjRdyFFa8XPwBMyxV/KJ/4CG+My0JKAF4QOSbn071UFKKXakc87oVViZCMb42y5Q"
+    "V6xam3tl8AHKbpvTg4kgVrZAzf+krEQwPIO6YbyOM/HNlRPBc5REcZHzhq33UJ29ADVojIaaMMzb"
+    "eO1RwDwzjeJWHayAgOwr4IiwiTsZIPJr7Ez11NVnkc87IWbufWd4bTl3eGNy5tDhtrLFSlrMfFeF"
+    "eWBaBypcmsJrZxGGT7yONLBZ/6bLrZ8gGQWIuLyhuPcooKIu/o0ULm5ncOrq1dvOXMa68dOXXd9a"
+    "8fPnbkogT2F3Uup/3d/3clsKufHNg4+NQzr3zw7x760W941iUAACAASURBVB/93Xcf+9MXVzc+qc"
+    "XcNZtzkzld71B71UeG9KgwFycUUW3lh8FTg9lPajHnd7V4N2le779x4UL9Rb7+jK7u0m2tDws6Ht"
+    "hdHd4z/8rw+5/aGD5838qwcFDXL9TGWLx522Fhp02PX+768UfGNPF8R45xRVYVpxUr4o14f+yCNp"
+    "6+UixCN37aGZ3BGNBn40BbTrT3xuyEjp5IkkaQfx2x4zj0MZiZcQBZLnrpYF9J2ucSNj1Ye/o7se"
+    "1Pd2KjeBQw+w8FuNYrZjAl7UmxPdij1vLkFUWjE01MJDpP/0/zbwRL2lb7jY7NME5YX/tyZuqT9O"
+    "x8QMMP1tSxKtSyg4z1UfEKjvOIDQV4Pq+K+9Siq200qHqir1qurS8Pb+ou3aVBX7rcvM4LOnXWEk"
+    "VJMsIjmdUd+swFYkfUgsMmPP+LCh9u+Lt657vvFtrnKof4b+czruEiOmzakUx5cUy+XC7iMYbik1"
+    "2TXC4KKqKAPjuO4LhsFGfsnM5BillWMu9pB5KXTKMSd/4BwyA6gHtHXIkWM10kFRp53iNjzabBKW"
+    "FihWeuE80D3qWbuXlhuhxwgbTPueRRAUDBZ196llNHtb259eKJY8f+/W9/9J4Hl5fUUV3lgV7zqg"
+    "0Hl4bLH7rrpm88/dPn/+32wtwJMup6wcl3hVCFoRIp7skqR7MYeHTlUI98pENSfWZyOiojlToELY"
+    "1NfBaKLFiEb7rRpvXNHbcr3rQLR45HVkA0qv0BPD752WAAoUvCiw816vgikkKuGrnFoZaGoMi4mO"
+    "s8Sq9g6LKM5UbDwKzA4zC9IKMkLGtOFkg0FhpR/zmpFJ08/qTTEFdw3syrxlU+kJ8F/dC7vyKIXO"
+    "GTNzB4Dr7tksY//jqOuN9fQFHuzNKJh8/eOag0ZeHSdf/UNvPoIOUVf30epYcPwVIZVdnAw3cviE"
+    "AXSBYoki8ZG2twcPTn/8oQ+RiDaBZlR1zYBF8CaIwSx5fOm7pmy0138JLyAqp84VygQ30BZoTEF/"
+    "3v8bnAYkeJsosoCQ7+3gDJBhLV+WMvGrqB5uq58lLl3WXk8oNuAByItk2g63YDkEQg6phzr7iTIa"
+    "r65XxBKzlUrKcd3uYyStqsi1WOWVRlgwdcQOHDDCipy7eO7UsYCb6UxxcvdzXw6/6cBv6d4aW13e"
+    "HW8/qxY/021iltx/nFOMkveKCnNWlSC6QxKJPUOSz7XGCFtuOVoHjYljinc060fJ2PibLuXMhZXQ"
+    "0+oMfCbz3/+ht/8Fdf/urwxc/e/x/uvOfOx6ShZ9H2w34J/NcrAbcBtQka3vnX3zr2vZ89+bEHf/"
+    "jMHz3+9AtfPLu6dtfq3NJB7orBT5NT/XVbTn81UUPUx8LFUzsQji+UbXOUjhZm9Jn+2ixfj9W4ur"
+    "PF786prmsxt6xGc40uktx9w8rw3rs2huVlXbPgdl+/O6e26Ebifo82qZaj9uJJoxuQaGrUeKYm53"
+    "bnPlKNqHs+v1tFf1RtMxNOyo/cJCRn6UYyDjQD0I7r6Hi1Xam3XmPRdhHBF+IOSvgPBuXsPMU7I5"
+    "Sg+03jl54Oe3yB3DbpCEf/Ux6tGh2lLFIemgmt7DKfMQLlRq/YtuSpZU3yjr4M4R578q6acMYMwg"
+    "PPQiA5760HCFYjTqFggGMKyCnlB35sW1r8DpFDnrtk0S9eQ1USScYFa4wZmerbdy20FvUO3QH9aP"
+    "2u3qfWk8M6JQVkUdmhvthWewujNg4ST/6T6DJvd1xkOFK4SBH6iBwpygxaL7icrnLtuYebJtK2qU"
+    "gNfL24xheX9cz5ANSnVbTYkt6ekHoRPyl76gEetYccAdZBUVMtY6EZJHlcotYWiFXal9YJjHkFqT"
+    "zPwNgC1uML85bUS+pN5yFlxeIaDPwdHSTm9g1FOmJubW6u6yfKnnj3zSefOHpYa/Z3QLiqF3Scv9"
+    "/+xH0//8ojTz10efHg+/T5gcNUFJ7xd7VTRdHwoskqA1RXFtUyago8VRAamhvrDJ80VxpzdSTVk6"
+    "oINkFsB6l7MKOxUdm8aDSPnTSo0dbBm9hJw7J3HoAAg2YfpMVEHDxsoBo6g14CyHjRizmorW8eSt"
+    "rAQMYgEdI4igQNexZfbpR8kPf6E0wGhNC7EwLD8sbETDDxxYtUy2M4ARxCN2LUxzxbNxLgBCtpWY"
+    "2iDvmdFOzaG59jptpe6ADYssRKLX6G07gjTUKRS5l4gW/7yW9ejAeLDodJeu6GYn822DQ75JyIDi"
+    "cKPRUw+7GuUT6WE9HnaAYskpQTRKXcm0aAsh/zYG75JmGyi0rbtwb5U6Tz4cxqFBgXe5p4JG/Soz"
+    "LPylY+OFBG8Tfl5e42RRSb0kv9x17KCoZ98mzMAMZPtrx3mh15br/RQTG64Vmm8ogz1ONui24ZVp"
+    "Isc6kafZgzbkuOO2ZzjOgg4ov4zLew54Wd0luaXJ7XuX1LT4K9tro53Hh+ezh1dH44cWR+OH5gbj"
+    "i0xKSVzyRzYUZ/YDL6KmQCAj6gzFXxjfeIyFPsIYk4H5JQ5zRs8cvN6qPmFnaXt7e2b7t8+dLv/e"
+    "3Xvr79xSubO+//8D0/lbQ8AW0/7JfA//sSYFza2pw7cObVczc//MTjn/u/Hnj4n79w7oq+NTk5tT"
+    "osLfKTBDx2rHmU2woXPWjFqsrVt6a9UCVdKfU1wYnen5vXB4d2Bt2do+GJkS/ERndei7sFzbG4ZH"
+    "Ji/s3hrtvXh5tuWhnmlljQaSG4ramJPlqUX/AQrj6lyVuxtE8aMv1e+nv5QNvSPkFxonaEXfV97m"
+    "MTb1m3/dKyeMX7MEKMhBkpRbtvbMsxyqIjl2voQygjtOgXxFC7j0e+CGrclAfRHu+IR1elLIz/Yj"
+    "Bvhi9jUwzZcx9EPxMEDvEVp4pY/dTUBhjiFTt0tELA/9igBkzl4JInX7QCm/PkAAde/HCdkRfOl+"
+    "1gzyJ78hot/G0cMPACDuUKRwQrm4GwuTrkiCiJCtjkb35eF+sXNoYlfVV1QT+DwzzO9claCEtRvu"
+    "Ge9Y1BfrN5rqg2Q4qsxscWhoYkdGS6j4eieqGDF2LY4B81IkZxojChwBceFwFJsEOnosTMC6X2xb"
+    "dcC1sy+pKi7GIXIKMRURQ7pJ0z2+5zjVguh9oRy6BiLEe0k748IqVo4bYh9McCBcu5yTgtGZ9G0X"
+    "boKwqj/eCYC9SZq/QpDwJtijJnzsQmH4BQ0AXRt44cOPTIB++86XkldSKu/nDVL+huPnZs9b03Xf"
+    "ONx86t//7uwcW7eKSKRZzOvKpJdQpUYOopNG0EDsyvEqgwik3ruwYyBpUQc1THrJo2XawIu2opR6"
+    "5WWg4M6NJlAl5mPYmEZus6Qh+DiHDcuLEJBn8z+Oi1P+gxKY+doMAjHR8AsGUzLaekF2NqdKR7Qo"
+    "w5/MIePrhICgsvoGVwIj+0mbJRdAxYBgQGOusacmzM8QlJOYE97VjImA4VX0WHhR8dHFeyfYMevi"
+    "StY7CxnNNZSchYbWsWUazOm45jXApj2aFu2OQVMP6wNy6MbAKhdER4nDvBkOJ/aErSASnhbqxsY2"
+    "s2T9Iay2NaJvghRZzRYVq20PgPXU7ZdzDKcUc73eeZtDQBypZMGsflIO60PICaKRNMVb4UBUQb5U"
+    "e8KOLbd5KY0OSmTGQCxHto4jUOmgR0rEc8swlFpKs/l1GB+NqI5b2ctAfo+5y3bXyRvM8lPlA2to"
+    "mizidXUzmtimcA6fosMlkS6rnNyXBpY3c4c3ltuEafVb/pyMJw6prl4Ybj+hHlJSY0sq/bEXO6Cu"
+    "xFGRdy8BYH5ce8B2eDjfmQVaClhyzzWS446e0g9Rl6o25Ji+E711fW/tuvfvOBIxtb6//xvo++/5"
+    "G5OX1BYj/sl8B/hRK48Mb64cee+vHHH3jkp3/06M+e/53XV7bed3luYYFHLLeZpKsvntB01Ea5M8"
+    "dlUILHL0/i1RL1KKR/joDKLNpEizEv5njPjfeW0Kft0cb03KaQNaFeGJbnLgy3HHtzeN9dc8O11+"
+    "qxShZ09IaeldErapM593VqrMDTVL25HxA2jZi+UO2LtubG5L3i8sWBKBFkFfDFHydTsvsXqSto5z"
+    "6FRMV9CABU0+1LsJzGMt2FOyIiola/Ay6QSHtTop8YMcF0OBkvMo5Gx/2hddlpswPxwnGrUf5FEw"
+    "pyJuMTOgTxUzb4oPMQIgxYJRctytxa1qUvi35DgdAhusmvUTk3ZrY/SU11YUIrqRaDTDxkUkrWuX"
+    "NKXotnX0gj93Zdy/WumCMe+WdsCM6CFnVL+pLqwoYurmkcoFvOh7bQzwU3yis1UExFYlLxt0ObI7"
+    "4cTBljJWK+mNFxoO1PnMq5QbZ8E24uftD7FwK00m91pF2vsWcdrEqqLroi51CFhXxj+Bw1v4+Sg9"
+    "+W4n0zm05+ZEwhsko3qIkkpDnSFMmgCVd+xscgmMTUZBraVzWiPT4aj502lGUgfBLCpAxqXpDRU2"
+    "n1BXokfEvn9enbbzr1yA3XLvK6wqw1Ja/OcNUv6Dhtf/ipTz7x3F9844cXjkxu2tjdOkRV2NEVP7"
+    "6KTiXlE8OuLa6hVBd1JeqYeTzEd9HEdb3SkRZEB5AOWZJUVCZtOjruGk29q/pjY6gpQrzIjcdgab"
+    "IwTSNRYvgBjrHEBMNX/6CNUo7UDvn40vgGB08E8yCAxcBDIClmpSLYKXTKEu5jGyDnU6rB0xFlDJ"
+    "ae86o4usQ7H0h0ueAPmN5ZFy5liBByU1k4HSyKjEKwRuNxAYZJsU2cEraejcIvgFK1n7YdOmyXiE"
+    "doyhQVI2A1daOTNmYyrNjWwWXV+AJImXV5tO+o2FIULS8QyRtKjvjclL9ddhKugC95N2WUi7POI+"
+    "eHvLae81V+5xzFZfesss1EgsUER7yyfFlqeZIsAqk/tA9+R822PblKXtx2aBNkRfJk6+3B79JUvj"
+    "yBsbHMBtCZ+iw/yBP+YNO+kcaP1PU2IglFU3a0UYZFzj7TE2IEYkw+nWfKx+dYMqrb3JGbXZRLWE"
+    "He6yjLjm/JT7bV3cXhjZX54VU9jnn96vbwLr32c8vRueG6Q/PDEX1Ahb5FM0blw+o6Uh5pv2kT1J"
+    "GgWgg7Opc8m+ai0CSWR6BZqOsJ5aXd3a3bdnbW/vD7P/z2NecvvPbnn/rUJ79z4MiR1+W0hPBzP+"
+    "yXwD9QAtTh/0L9UBOZvP7ym7d87ZHvfOL//t5jf/zyG6ufXtlZuHFtcnDC7zS6YqnOLiyqjevjQH"
+    "wuTg1nbA/A0k49lKjSeizTQmye357THbpd/bYjg8OivnC5waPEakg0N2r9tsbfbX02/sCBt4Z7Tu"
+    "0Od90xGZYOXvHize/P6XHnQYtBTwpZEGq67W7ALRiWaGor7iecx2polV1IbDW6mkoL7p8WoK9AIJ"
+    "jyCRMOIroBkqAtijFlGhMOeRk7ONLA0X4dzLUMfZbv/hS+P6yhjrEfWU1vRV9AX6Eyd5tHWJ6DSS"
+    "ZslfJNuvsP510ylkNGZW1XUVfcqiaAQcDnlElwYwBcM6JhMSim7dF3lyYpbJXnZT9KtigTlX/MkS"
+    "+MhjWFTaz24itkvECaNFtsjEOv05VH8cmDZV0AkjeAjZYu3GBz4HcMVfKGXpjocd/Jpu4Qc7dOJD"
+    "2Qh4uGUoSy3ZP1gq1SNR+NQpcmuhgBpYLSsV+0Em7siIdITv0occlYD/066SDA4uh42xHRKiLmiT"
+    "HSTSxhdEVqFeyP8RnR2QzvwZB+h+jJGID6dzAeXingM8ex/hE3gV18l0Dbh9DlZjHxer5mGdIAUv"
+    "d1wZO5h5+aI5dc8FTY1iPbjPLgoOOn2OaGtcX5xSfuvu2Unmh557x7/o5Y0H3oPe968fZjC986t7"
+    "766bmlpUNMrvzIlX4MdaLBhiroxy+8uNI7bVQcTRypnL6DQSUSj4rkKlkVh5qLHBXJ8iIwmaVS0Q"
+    "6rahubitd2aLzoZKOTQQFkaqP3kSWNnu06ajkaOSQ3TI3KbvSSjRj2o2eLuAy4BlHTFZ3Fa1n7gu"
+    "9tUzrxJ/LOS8HabqFC6vEg+DgmInQ5ZFcwb3IY7V4fYY4+iRi7kXWZFSD4oxwGyIsO1pC4848aEX"
+    "Xu9tlyikmXAR35OJiYkwaKNOq9YPft+3bS+MkPpParj0D0oIyPzgMGFWbLiwIpcjF1wBU24XqxJP"
+    "32zljScd5HaqvibYX2k2Qri5a6ER9gMOfIYie6XlRQVrKZu6KSwn+1EV8Vl1O9QGtTbgdSZzHXIe"
+    "fAuXbxmy4/PMaSIK4/l4XrbJxkr77feR8VcY08o0ZZVH3X78mIoLtn1DjRuu1JxLJgE+M86F9fpM"
+    "R3oEIHi/c3SU/UASC3rauIsYOqsCtLlBH43JXAL37bSiTJypgWhCzq+I26bU1eL69sD2eubAwnLy"
+    "4M7z62M5w6PhlOHl0aDsrXBdlZ5AeWwcZPCoRNwT/EDijzZGM7W3I858PlhQ/SmyzML+1ubt68tr"
+    "r2uaee/MnSm2+dP/iZj3/8OyffdesZPZa2Ppadkfd3+yVQJUCdS3Wj5qqCmT45e/bS4Z/87Ln3P/"
+    "jDR77w3Z/+7A/ObGx8ZHPp8NFdfVlyg/qnhqMHiS28rd+Oo23QzqrqCpM2QU/Go5AsRtRw1J4mi0"
+    "seU70AE31HWPN8IVbtZHNrTfJg7Q6LsnNgfn14t97Ou/fOpeHUSd2ZM7hwdLHElZ6KLxPctaAt+C"
+    "cKNCl3nyaaH5XDQ+GlFROtzIqcrMZvN/LszACv/qVDvwQQoSMcQYDH0jYy9CGWCbjiCbYLDvrmEV"
+    "cgDxycEsXEShcUPOsrbb+Upq9zvOHAsK6EFDFsnQyTtcvRaHYhlmfoZc8OaRdvJa8yJlvgx2vKk/"
+    "LFL6QLyTKFrzgXqOxLZ0pH60kjE2/00YWOAlgAEon15Bd6S4VuuVnbCLjsxTFEbEHuYHLJNG16bN"
+    "xQuFN8cFGLuTnVu129S7dLH62LEPbNla78LQTKmnIvCc6XTTlP7MgrY4/sSNRjJKpikU6OLeyxye"
+    "cbdlRRtwwqhNQzRaysUtJRItNQ58ZP+IjqcbK4yFGub9OYwZfRuBL7kqeOtwGwkk/yEsecXyuRrr"
+    "MWQ7FWeAY0HTwRiY+e9NmOd+ZUAWDGwl0gs/UGlgfflG9Jejx1+bRfwvBiTs7O786dPXTgwKN33H"
+    "j4AvLvlPCOWNDpfG/d/4kPP/bEVx9+crK8dEo/Na7f99V7A6rEHrI009rUIo4fOGUAoU51J0dFyN"
+    "24ah6zDasrq45MhvnyF4+XMBi6ItPoZmqS30MCG2LGSjekbjwRTaVPg5egG49oOnajyl2EsiEltw"
+    "FlMrYiC1brkCkGwd0aJNLpyOpMXmr9KhQWscgHJ+2UuFBoVCGUq0jbUppsHDHFOXejJL/RQzolQm"
+    "dIAcRjl0f5AoTlUDEeXWwZNcy0k8EQCJYziJUj7fzKGj5LyrjauQyNi19tI0iWZKfgBTrxloVoG0"
+    "SKXPkb/TMDa1LUP6pxSxJkobAhGrrkOXDHiq8dOsQxK7fKrA20yTMLmywApW9BcXQEJSWm/PrElr"
+    "/tj/iUCxiURxZypKkjagDoE8dL/vFXx5b3ER+U/5axf8aPbHuAI867UYXlgdGwxjNZ4K5z7TUKak"
+    "Pa2y7SXoTK3jyLo/a7jp1GHrs+aud30nSU63ibc0paZUIbxXcWWeSfcqRMMhDryJcnVQap80xM89"
+    "EH5MgQ2UDZazGtAq9o+vvy6tbwurYTF+Z1t259uPnoRB9PWRiO6ZmAA4u7+gAEk+SUByXHP4/5MC"
+    "Xe0eKPNPZ3ZNdX8uWPJ60cpWd7m1vXrq9tfOLlF1849verl+/50L33PfD+ez/4k2Hx0HlJ4M5+2C"
+    "+BPSWgKqX6kzq0urJz8Olnz9z25Yd+cP/3nvjpl5576fWPXZjM3Tx3+ODynBZlm5v8KqPqKXVcKB"
+    "5r1CfQZoxB/eefI49P0ib9RUq+/KoF3cKy2taiLpSozXjcEYYunC7oEcxVf/BHv1unvm5hfWs4uq"
+    "mvW965Pdx9x8qwfEivhU4YfHVnjn5VWGn8siGDdGOYVFNwQGT2MXbaN/n0IoO4vY8uemCwedwhY0"
+    "qOiw0pelxATHoWR19G7ErJG9KqtqZk+Cgg4n7Bx9pZGTspe/doFsRCeaiOJDF0gMCXHEOB6P8k7Z"
+    "zw6ug863z5grRpkY3FqKS/fhtmPK59yXVG8FvBfiVjlgumqNAoG8tQpvicsiU3hBrJHJ/xPun2M6"
+    "KiFUG6s36P5VnWC0wHKcZ4kdCTXy649nJGzPDaia+aJHXVZb07N9E7dIta0M3rOOwcFj1e506ZM2"
+    "kzNmXdzt3UE0zGGUdGhnVGVnxiT5lGR+ZSkNbJnJF8hG6ZLh8qPwH5Um4MIxsnIhbTLnWu7dF4Ck"
+    "yyxBoag7Rsp8WzXoO3YNtEGAe18yHRnH8QJOf8eYxXGn0Lhmc9yNCaBEYH5yPn0uOx8Ljo6cABXW"
+    "TcNzCeC6h8Q95js4T0kylb+tmVJ+677bZHDuoXKhr+nXB8ZyzoNNH5xG9+4Bd/8e0nvv3a1uZHVO"
+    "1OUrlYqOmjA7qqWJNH0agwdPpzfmkgFYY603cpuvOicqRBqgKxgFPwOy+qbzQKV2RXUEWpeKrF0F"
+    "sW+UwYmVxSWxGhMscHE1Q50/wKU8Qstqq7tK9phAKziv3DOP+yl/zs5eULf+HP+mO/I2p9AAUjH+"
+    "xV5RcKumZYIJ1k+4qs7OqP//YhOuKUT6QJSZMfdEhTLuaw2xPy+AoCTZYV20BbZCtX3CJQwTNyxR"
+    "u/6BJpf9MhhO/B3udMC62+bWMEduRjTDiNIy6/Ivs8SKhps/JWta9VdxSvKpQyKCy8bs+dz8YWNb"
+    "jJfxY7dNpRMLTqFH9FSmdXTuRu8gx44fZibsQufV+hxpG3BcoN2T6OxmQ0tuF3eeIJ8dQmx7ULlb"
+    "UKCyylUWACyUG7aTkGBw14HDvYvzGvXY+iS3tB3udWR7LhtmyQyFC21B0eq3VdkVwwMZPBdNKPT1"
+    "qPu23yV3EmlblzyA9fatOHIFY1hLxxZWt48fW14fiyHsk8dsDv2d14fHE4pgXeBDusvYTh9zZk33"
+    "7KFL7oRbtkj7hs8GgrZYz3sqdHCibXr1zZ+NTG6bO3n3nlqx989tlf/sUXv/g73zx47UndrWNluB"
+    "/2S2BvCeiHkyevv3LhxEOPPnnv33z3oT944oVXfveNrfn3XV46sDS3tKh5k+7H6W41rZM6yI1q34"
+    "FT/Z/j/VYuO7h+pv1SNT2hQk4K6SP5OJDucmhhmIWX6AtqH7pLx9dbpSFZXRjRHe5Dc5vDrfrx8E"
+    "+/Xxc/btbHKfTVQS5Y8O6c78j5/Rulhe2LGtR/T+DsoW0K0JNRCemPpkIbqUm5YtC8aefWAzY0dh"
+    "yTUkyElkEfHI3FbosAwESpJsWxZq10DwiCiZj+4geEDrR31JFLHzOVM8eC7k8Ug7LHhvNVFPcdSC"
+    "jgks2wYxPdTpPETvoopcbyIm69OnYesW1U40UGQcZcysl24GkRj5wXkFMxm1YylF48OB1fyztROi"
+    "0cE9tgOKBjz1Mm7MrBnCeDZWfFII4QlRHnwyZixwo4r3PvjIOtP659LeiLqof1cZQ5/WzGjh7b4/"
+    "cUWVilCIMf2/iquizIEXWMBJUCcvV1QcVN14OSA02myZHHH8RgjeLmlR6HPczQEU7+4lWgszdOou"
+    "UQ2Fiz5ZShMyYKx7avSM5DoYlnv2Wyj6VWTsB4e1QY6GljHMtYXr6WKBitxhFrbMSbPrbdInhuqn"
+    "i3m2hkzxnscZ8FKVS98uv6Ob8zOXPk4OI3P/rem58X4x11kfOdsqAbDgzDm7/7kfc/8B8effJzW5"
+    "OFz2t40iim5/J1tXBXi7olf0qfZ3SZAFJB6FoSckdLdUWNHZ4nfcVzd8MVFNXYrsjmSzk4DHbVsT"
+    "JWSM+VXzFjuRcIGI0PHn8OOhCbNtbmdWNRGv2SdyfoDh876jjIn4izAy+4tm9QUixEefSMwTb48a"
+    "N8xWFCy7tlTssgSfkg/qwo9JQHTY+Qxg49oaUhkJ+m52gf5TtHBx9SMlNRYpQ72KFaolVKN+cBSc"
+    "k0njTbJjouL5UlV49dDpKDP9p37iLnqJ2KfZChpZ40DWX+vfN58LmCbGzlDQwZwXfXkapHXpjCw9"
+    "fRyZk4JmDXfsyXCLO+U5c5t+BbVsf2TgY1dWFZkf6u8+nFoXHR0R++JiZXci67PO2DfSxn4lA75j"
+    "KB5HoujNEP6ZhuO9MsGs80cRtL6eQpcrEdP9rnLqJuSs6lick3cl1H8ghlJm2YsPuUu3KZO/EQla"
+    "IxQSOuv/bHZU2ayanLluFEQoIwVYBborOwu6LXjs7oi5VLumt3/I3t4RZ9QOXmI5PhhO7YXatHMg"
+    "/rcTOAJ+p7OA07cUZAsohLgqXO9J1b/PCdksnuRPV0srqxccfu1s713/vBo8eeO/3y8h/+3pe+fv"
+    "t73//iRL/7tR/2S6BL4K2Lq/NPv/TqLV//4Y8++40HH/tXL791+eOXFhZv2lw+ONnWxSomdNQrrb"
+    "10Jy0XN9URjhMp2oLrHW2Kybr+s6k1QKIacxSRxVi1Oj/WzFPSvIO3dmVNd8wlo58qmGhxd3Dzwn"
+    "DXiYvDB+6+NFxzZFWdpxZ0vDenNuB3XLWkdH1XLxU8KfPuqxcL5QdtEF88We/c4gz9i7TsKmMvjR"
+    "NBhbAT771oxVUk1vwkgcFLyDJgkkdJVwNFJH1SIXBoGxxVOOGgB8Ek4SROOt7qaHtTOvlPSH+ZmT"
+    "fwGPX/eOy+0PLiWYMjog2DJv7bpuj2IQ5bPtE2CQj/Y/60PnRouPTrdiF1qJFRIlgw1pw1E9tIHS"
+    "2juP7JV3Pprx3a2Ex5hcEeZgsU1WrTPBZ1RpZMqD7w0wWTjeHQwqYevVzTj4tvCEl/nC9BJq85A9"
+    "RAgstR+Dl3or3NNMk6U0jbhtMyqUcAsWoJcMjedDzELqzq9F0YGY8ge+HCecM36eGVswmcZTmm9I"
+    "zjFPptw04bx/KIxwEdhKtFOm0cUvMpQdcp7OGEnItNHAAAIABJREFU0jY6NSwSzOi0DPllycw2K7"
+    "q3XMhLW6q8S5ozE1PeA+w0ODEDNgtuPUMgZ5mzdn5H31yEu4/fe9cdX7/mmD5O/Q4L75gFnc7r1h"
+    "fuv+/Jv/3Ro99b2d39zWFx8To1EM2X9OilFnS+wqg4V2+o4L5Irlo0naSrUilNpU/DUhWlMYjoig"
+    "uTBqQFAYEKzITad/sk17Kpoa6e1kW/5cfqO9ZgDApUPUzk5JfS9iNW3RBxyj4ICDRSGcRIgaH/OK"
+    "7FXT58gU0CuPZTcXznoxjxVYQGRVdhzKsZsWQGPG2z4nQ6UMfFJNmYKQdjGXfaoCtjOSifdtk4MQ"
+    "A+uM6tEi46mbEtG6fBm1DexKvcXZWeJsfo4JPLA1mhsW/vx0l9Uc1SHH/565KejeNB6+eYdPubzl"
+    "J2WCRQBnY8yL1nwuRgOxKjN6448NgLX3sBz45vnvRTd8EffQke59b5jbb3XjwSAyeF7Dg7qht+pt"
+    "7Hbg9w/YhSQ3mxo07dOnTueFk+O68liFc+96TF78GaAY1gFyp7nW/T5Q/5BjOB84YVOv9aILqepJ"
+    "61HOeoywuvlBzzWfMw+1yMtFlkRj3hK3NcleUnTbA+YluO9ZdsatJrDN6zk0eW4wKRnOTxs01/GU"
+    "UfZ1f6kj4CcfbC3PDC5a3hOn3M74bj88PJg/rpA23HDyzpghL5EiofReHcg8Zkm8FLaZ9DlYN+yi"
+    "AXoUzTpHduOLi2sfuRnz/1/KH11b+8+bc++upXPvJbH3vyyLHr9GIIo6pLQHj74R1WAvPb68PSL5"
+    "9+8V1/9/BDH/rh02e/8LMXT//2G2urd24vHTi4Pb+syqE7xCyGVK94Xy4/K6BqpzR/fnxR1ZDfDE"
+    "0/0mMb78upfbhqcY+ZQIsEi7pLSwoubWRLdz92dteFqHfWZXVZX4O9aXt1eN/dm8P1113WXTz9tK"
+    "Ins+gq0J5k14tDmfSn2cHlfVfo+OY9Monx9Cce8J+QiMgSaiI+Q2GDxqZ4t5GRZe/LQuvKvjtCVK"
+    "CVr4WigwP+gcfB7jhiVghFZ8o7mv0VGXKosIcOgSDbNkJMdtq9MMMDWAwf0GgVy6LVpVd+th0d7V"
+    "OBRq5schDfZW+hlp3Bp0xkAz1LWq5S5XP7bkFOGsGHUcvaTY4pBOx8hJ3EUNM4snFOxDQe/TB1WK"
+    "QxyAZijImqT/x0wYHFy8Py9ooWd/o9Opjqt/3+omSoZap0wuEReHWlVS42b94suIGlgxbxuMG4Qb"
+    "00tPSBMFeqjDEeVySTPl86CNgA41tkmUNCNBla4IXTS015CYakMq+JHtjjuAussP2HH6AJCEyJRc"
+    "GH4NRUJb4UbjxQwihhtS9QjSPEftLFZUF+bEtasmN07FVwWYURCiClYsKMLP7CYw7LuMgcw+WnsR"
+    "AWC7z1za2zp44f+ubHPnDqdNt4Jx3fSQu64cjc3MVP3HPH9/7yx7/80tLSiY9p2JjQEHwni0qkdu"
+    "MJn2uU0lQ0Kn0OpqbBZGBzg3FtQZkKTXVN3IRQ4TjmzkXsxgO7G5wn49hC1v/C0pEFJojgwsMGf+"
+    "i5MoMMoCUqqhSTQN7pI7z90Qs3BGGMd4Wi7jsBbixMZmXUnQQRMBrH1lFQaLswq+GmfKKTfCZuee"
+    "/wnUh1viDnH0cjAbzzCSm0MKBjKuWcMoATfyxqP6CE5oWJJNJ55rxZQyfaHaXsGAcU56ePOTedRx"
+    "DxBBvOl1NthSywqAA5PpsTF8Y8ZCEV38Erc9ZBFHz7UEbanxSBuWhJCGtGsM4IMGIyC4qv8CiD7v"
+    "AtK63RFnAQcV5yXmxpABlzBtN5tpTVXV6S5zy4LLq+sJixBLsogkPZU6+8yEtmnE/yl8FK50IyqF"
+    "Qtl3ydF8l0OUXezjDMRlYDM5BsyFlG1j2oUMfEgIb9ckkkCeMh2NhBTGkmrZYpQeSge2HH5KP8Iz"
+    "JXX6NEYl4LN3sjdd7LJc9addk2yLTCHT0OsqEF2jkZu7C+O7x8bmc4qi+tXaeJwjVL+gkE/Z7d4U"
+    "PDcEhyS8uLurDC3VV1UPJBNzWEwvRbm+6+zekRcSbOO6oH+qjLwtzS8vWbq2uHnn7u1ROnX/2rO1"
+    "946Zm/+cynP/vwHe+99zWZ5jvw++EdVAKqgovn39i8/pGf/fxDDzz0gz/4xqM/uf/81sIda5OFI1"
+    "uLhxepSe6vVU0n1FMF7gLTBGlE1OW0ECVJqc6Snlcb8DhlPu1OVNXpCT8e7rtn+uCQ+3XRaQLuUo"
+    "Swq7tyqufb2/yguO5Yr60ONxx6ffjg+9eGo1rQ+bfn5vQMDQ96atzCGNciiHBhkkc4/YVCLeio83"
+    "zQwm0dQXyQLSv5UGkdSkgsCygdfRq82faV/Inl/ibeA0NgQQkz6o0RXvagGDZJoY7uIA4uNBxU3D"
+    "E7Trr7WOzHBmWdgCS4sq8QKxVDX5SWjUZJlA0kofui7h5MCYiRkpUN1ALnojKK0vhsq/AU6pBEU1"
+    "xPJCVR58tgRpjKSTELaEgG1tEKPuxBhj2DEZvTvcvQuimrEa9NUi4+URxjIwuwLilcgKfcl8hkUZ"
+    "8PnuhLq9oWdzedb1UDWclZa+jyXnUT21CpF8jo6EoOS1rCpyycDR2R88/Y0E8rbU+Q4bxKH3cSSj"
+    "duu2k2s88VXtk2MkCDNuqr3hrTZEQrEKmNfCHfPMcDAIlYUsiQD1sgoa2D4hLKk1fRGMdSiRD3GF"
+    "/aBrRKtbeAztgJel8o7jkKZVhN05hkuD3iuSJGWJe7bNqei1Ntm4+gLUx+ceett3z78MGB32p9x4"
+    "V31IJOZ3frdz7z4Sce/PHPH3xrde3uuQOHrvPiQBXCjxxqQPGEVhXKv5fTLcYtgbpBjUzFpfJ6kk"
+    "jron4h674ijdp10oMcFb+CZNMAoAXLutrt7QywgQ4T7BzpDHCDI4GKbBo44ErQizE17KhIV4PjmA"
+    "WIVo0scdu0TPk8YjPBBsdI3lu1weyAdHAyIgZ3g5ZgyN1JxXCrcuwrU8Sn5QEoPnmfPJky3bmMUz"
+    "CWA5lkdEZHRBTDHa+mBTC15QqYGbYZMsZs0BjxK/aSl8oj+jKUyQxwRce+xcu2O8KKA6tolyE6OT"
+    "8mGqPPQSziMrzWQL+xBOZoeHTy5XaO4iUXdLbyE/9Qj5Jwq8NHTwsbL56AcB1iwoSp2BrjAKpdeP"
+    "TXoQNSroMWp6OVIPrYAgMAQuF5ECr+nN9DK75EXI460kFTt+2D2UITVC5KkFuIKXPXS9lI2+PugD"
+    "woXXzwBRD7YQelFzslpDwLD2N4jIiUXVpgkCw85wsZ0WiEfp9IChSJdTSpnLiOkZbVurOmG9yuJ1"
+    "hICH6upe7oPTt5rNfg9FNcw6peuju/qV/r0h2MJS3gjizs6BGgYTioBd3B5YXh8LI+5c6HVITJb3"
+    "bxC5rL2NUXA2Vu2NGjmtueKOtq89HJoZ2N9btWVi4d+973f3zqlVdev/Xe9z35nU987nPPnbjhxj"
+    "eVCVeb9mr/eHWVAPVNVXlu5dyV40+89MK7v/Kdhz/12M+f+9JrK5ufeXNYPr6+vLSot4Xcx7hnd7"
+    "3ngoFStAnVe/5pcx4DqV++COIW4bY5r7t6nqCy+KFl8IEiD1C0CvR0EVEbd9R29XGw3OkQXTLi6C"
+    "LIpu6IbAzXD+eG++68PLznno1hWe+Y6lYJlVl4taCjcbCY0n3DTPZEp63RdoRE89W/A34Q911xHU"
+    "m7XYedRo0Ocu4Xoqxe0HJ2Px1I9IiLxz95MjimZZsnK3AjIRH3HSWEDRS8L7ngm7xXd8yA/KpzAW"
+    "7U2GNbWIqSirj2SiCf4FyZC4Uv8dLXo2dBKwbAkiJP+9gSAwhx7XwgWl7MGB6pzh34cqwXTNHAGO"
+    "dCf2FbB8ycj6kONBsLw+asY+F2B/l4lXINPuDW9zlNzIbKdrr2vfQCsiOgxCFyoisfendzeW5dfb"
+    "kWdNwZ1gnrCwbTMVH10YryR0d1wVUHaTcdn9r0+ZSf1HtfpOBABrUFM2VE7gjJH+NwGUHcnJaTTF"
+    "cE6GbSPiLl/ICPkwWROlLnSLSxzkjMdcRlXzpotmn7GRzWqo2n2Bj6DNj8rB45GdNEqNs++DjqGS"
+    "mCeZKsleLneHGXvoQyA8LxKm8Z8dyF1becwMam+ipdTL144viJv//we25+Rgy98PDOC+pF31nh1u"
+    "PHX/3E++78yoM/O/359SNHr+NxEldC1RXeqeQKIAEa1SU1EoKuDEiWAdAT5q6piLhSeS+9dNBupP"
+    "QuBgeIviIdHjxXbgyUfBZfDDNqqNgWL/INAS7yqcB8pAEHITlUJN6LgrCw6VO6cbsXEssLCx2ZHG"
+    "eCG3GjlW0w05jwFWG46ZDoyEe78ByykPBkgPzZ2WCEjy5llwWEsV02LgmbLhjFW5/cYMml6fyEIp"
+    "r+ad4M1Q6yl/KxoyJFDx6xMJPAYi8q21afN0SJ41rnoRKwFGZ0nXLRmBMvbc3pdqEXcpxjQhZclG"
+    "Fk+dFpBonclZKAjM+gQJj6j28wRcJermQrrRgTKspXLKV68HAiNBWQ88mEzIMNplSCKCAmXDpYX0"
+    "EEQQVsnLCRsF3KrHE4376zFaORLOfjX2zxKCH62OqFses8Z9H1SYzxvOOXrmrqjt/0XMQAHbljzk"
+    "sZwi/ppm6FFmncSboX6/07e/YfDBo9ItqsQ35KJ3WUc0ad5bxLTHIy5a8AEt/So5T8Hs5ELyChj8"
+    "/zWoQFUvcjuEuugqSeUp4U+w43zYyj9+10lfiK7kDMq3zOr+uunO7eLeiVogWtv3gT7oC+wrYoHw"
+    "8I85A+1HRYn4BfWmJRx6ffJ/oxcz2/eXBp2J0cGrbXryxuz8+fWr/01hefevqlO587ffYzT/zimS"
+    "9/5rP3f+sjH/7ws4cOH1FVSx3EP/zdD7/+JbCytj2cu3Dp+MunT9/2+C+f/vwDjz/9e8+eee0DK8"
+    "PCzZtzSwc3VUf4YA/9peuddixOqAseHyC6T9DCSaHbRt6rNmncedHme87UHtXpqseMm7RMD3kC3d"
+    "SFCtoq/QPv5m3qq5Zbm1f0ZunKcM+1l4aP/+amfqpAc64J7QO7VRt9pUJ35PQZeSbDXqTAo+NQSP"
+    "shXjVYBy+0sI6Y/txuLS0p+eXHs8QL3aVga26xwCiAEQvZhwq4uUkqYXynghM/JOZOucDEB4/gvR"
+    "wDJhTFykTs08M2pxhTAXFiB4lgkE/yKG2LR7e52Px/2HuzJ8uu67zz5pxZIwooVAEFFOZ5IgiOoD"
+    "hI6m7Jaocj/OIIR/9N/dRv/eQX+0EeOsKt7mZQpEmZtCVCFEeAFEESAzEWCjVPOd3M9Pf7vrXOuQ"
+    "mSkjuiH5qB3Jn3nL3X8K211x7O3vecey+CnsepU4RiQ3lfe8wf3CgVEV0Hio2pM+SSgJ5YF83Y7T"
+    "06eqFSOEOsDBOUEc9oKqKXuuy/1pQbVsMJvRAdUhcKFzoTs4vi8a/O0u1ghvzCJ5i6X6w5Vm+Y6V"
+    "HLw3pSYkmPBHMHGTv0xtQqNtzHlY2vNqT4ciaZ4ZM3cGZUzcWarRNt4WqUrl31IW5n7RlmrlctXw"
+    "oxiEUBg0x9krrPw4udmuftfAm1fY3LtHViYcAGci1pZ2wnCmjjN15ix7bAYjBWcrUV1aG/xUnrIM"
+    "U1VRqWDqoEZCOb2NTTdRIuWNjzuiJiTE+6/rLBo+o99nSmTX2yz288dPqOr584Mrm4v07l5Mfg9L"
+    "Hb0NG3/unnPvmTH//sl3/14e6JT6qDcPXQOzRi8Hs7fJFIdaKhAzJR0InUy3InT0UBZeJKJ3VHTl"
+    "YMOh0SSjrn7pCyNdH1oIBNx0WBU34oEeOhzE6+SJGQzECWhu2kc9ucVWM373JIMgakmYHYmwqw7O"
+    "PAFxx51HXGtp2KZuhRMp8Le9cRUQ8y6QUTQYt58Z6BGL+8AWDxYN85V5TLtO1HvTAywKPdNRdN8s"
+    "wntof9UhQpenLedVAJWyROjmlNDCHG/rCZslSswQcffeLJxGFLDnZbQnaUx4rf2RaVuuFXMFo+fo"
+    "BEQsabUmwwOalsPd9JElG2MIf9bGZiC8zMp6MNXG+b1Iq/bPAkA075At683wGPD31EVwjlf+y6vv"
+    "azdjOWgTfWeegLqIuMHWgdh7bttYn1y88BI77aD+n3xgwLXHSzeKEUA6i5ntaH1l6GDhqyPfFjMu"
+    "0bWTG8OaM5jSU8fEYHWfqoN5OiEGNfTGAr+SKXIYe0NlYSYFzzT/spTN63y2/qz88dFNNA9FvXVj"
+    "awDTZbcENq48aF1P1BBFp2kbJ+oHlRdzwWhbeqNx59125eX+TETyFoc+czd/C0qVta1UNwO3OrGz"
+    "euPbFxc/Oe6z//1UPvnvvgye//4Hvf/NMvf+Xv73vw7LuHj53Ux0U047nycugg/d5FQPueuVs3dx"
+    "beev29kz/41S+eePmdcy/+6t1zX/z1B5eeuTLdPrWzsLDKJ+PU03U3WJ1MvWmRzsnSSn0v1wF6mP"
+    "qo+oEvTeoKvLFEp/Q3q+rLS/Z445AuQj/1Z9vowOqhdHLuqDlpjCrP55KyMWIc8KaGPnun54X3dG"
+    "dOH9vTZ0XvmNw7f23yyYc2J889rjcjDvN18brm6qcO+Hwcdn2Z9UZOvu/opbt1/iwdfpE8gBg7Hk"
+    "W4pZR8Fu+MZGHRt+143lyhCswZjO1RBzGVWtTy4IU0kFXGguk1ZiiXJdMFGxj5hZ55TYyEj3Bohf"
+    "imkvRypyukzKvUIH+ekGC5PspU/TNXw4hhvMOmUzk+63PmS2aaUK0vOWuA0doFkQ4RL/GpJTg7zd"
+    "hou/G9BXKOHjiNQF3EY67U37gxFa3raFlk4q9jaV6jNR42NFEOPote83G5h4D5rqKdl1V1srQSP1"
+    "Wlpx4mukunzyYv7vBTVur76YSDb4lVajms+coVeGC1jM84xFhz3OCmrnFU8vaj6h8Pq+olV356rS"
+    "RfZtdPXR/iR8/e35tm45KgxLsZXFyLA9ZGgzkgDiCNfznbUeI+xB7pMY155hPR3TfhYwS1WYnk8Q"
+    "p0zrywkRJ88p3IWaJgZYPHX/QG6Y4mP66X5urgdd7u7hW58K1n77/rVbNGoAb8WJw/jhu6yZm77j"
+    "j/1D2n/m/90vg/WVxbfUZLT6/CttVZmGx4NMy/Uac875R4wlXeE1sNBnc3Bqwy7pIMMBUk5gFB72"
+    "EBTg/tiQ5cuqEfz2o5bARkkEPGijqS0B9xWUSyWNZCEXv2Abv7bVFs+/jnDYnOvcgeJh7UuPhiAy"
+    "z/ySg+VdL7uMHHiUqxW4PJdGlKJ1qx17aoDzx0SJ50lW2MgrRuamopu4AKrkQVG8nnXLjgl+XBhg"
+    "RGWerHwgDj0tfC2L4i4H+1i1cyahu1GWTPIsaMz7Gf/L662PnR1m+rU2+i4ZmveGOC1DEC0xO3aF"
+    "2H7k9xA9vxLw5GLh7Rh9JGsV/tLEz+Go+8/0U3rZRn64OANy2ajB0HnETJp49gKWy2Jz7tZnxhgm"
+    "eVUov9ooFWwJzZt0rV+rGRurgdoNrHxA1QLz6NkbGETmTgxg9sQ0u9IkA+ZflJfxe5L5jkcbXrgB"
+    "xXqPjNuLawpbwYJofvMsK3AlJzt6PKfgiUnb/60YLKQOWgMas+xh27Hr/MNcj7HWEZsc91lpZx2Q"
+    "6itydMFhsbahf/XJc2ePO6C7K0zjvNO/ocyN7kiH4S4ZAWx2va6C0c1dfHb948ur1585lL1zfO3H"
+    "zlV5+88MF733n+iUe+rc/XvXr3vWcvT5YP6y1po2HuIP0eRIDhcunS5srr71048dPX33jqpR/8+E"
+    "uv/PrtP7y4vvvU9tLSsenc/Op0YTVjQn2FpQ+fxeIumS48ntZ485INQh7P49pHxenz6nN69ebB/Z"
+    "9NHRs4SdA/Bajxox4rWsbFks5L6u76MXCd93b1YLA+l8cvLvIZ7h39aLPfKN3a0bf3XJmcvf/DyQ"
+    "tPbU1uv/Oa5LWhW9B9aP1mnTeHzDn4zCObfmxTxvQoZi8M7Qe+EIR4pCPjuvwyTRwIevHH2CThOk"
+    "fOoVd9IJd+gFJGzzhcNyqfx65RaDxyUbYdgePrMI+IlxiXZXySuPGMkZxUpJc8aMYMrPPJ6siEUT"
+    "Vouy6ainFlOLjuY5GyWRgfEnLVrmhFIHWWtCPlukTHb1bhqDiBST51NdX04AAmvkVyHmOC3TiBbL"
+    "BsvMjFtFr8Tn8MjjX31QN5eKqL46POEbjBTqzVERleXO81EBZ0h25F37C6ojvF/rZvxGgLd+59mj"
+    "CCjUlg5AfZVKJjBoFEeyYhhcvUN9eUqDjGLSMB81U2vArNb50StUBZNsnyHRPZcJpxtWXBjx9Cdh"
+    "6bvWmO3dK2bYdK3qTZyxvw42DVRQXHPZrY8hjAQKVkq6yTR5Qcab8Gy+A6kdH1TSfe50EOHa6xNJ"
+    "vHpfJ4RF4tP53u7v787Km7vnHXHYsfu2+2rKD59LHc0FHzL7/4wk+/+x/+8zd2V1f006b6WRzRWO"
+    "h5YeZORMdhXScanVAXw0zwaFfnloAHBiSlXmympCOgQz8GhN6YQb2od9SHuyd0TLEyyNAGN52V0p"
+    "AGYzgIEJJchXXWKw4DpDw0+yccRgY0yMLwRgEspdzalww8H5VBfJ99ySJuoeQdC5MY8MVXuYQiXv"
+    "Yx5cEnLjAcPJxr0ux3oDJxiWP7EmNzJZn9vshncPXX9QMf10ieJCjYVx+kr8Fvw6IjOyzWlVfZFy"
+    "srY5solM2Si18AxEr7iQqA8cOrjMpLUqKxGR8iCz2MHTHh7NvsqQyNNNYtfc0xCCP8yif0khkqiO"
+    "/g6NyTHvnCHJqqquN4wUNGiiNO4qBgjfTiuw7tqHT7jlpj2eOEw74YveRHfCpAkpacGt3Hb9lWu9"
+    "snRHRFcT+ATrmO0aEilcREJymYbc8+lSgS0P24qeRzJ89U+0HOKD6kfmDaI2HwzZcpi4bvinNERV"
+    "eGL0zpCxFfJIGfWWxoAeEG4NFt2VUevXEeQA6AoPtiS1H69Bc/0mP56PEoGd/Mpt/dmWxsb02ubv"
+    "B45mRyYmVOE9qKPh+iD/0vHVvd3ZmeuXz96tFLv7ry8Ju//u6nfvjyL3701OOP/+wLX/j8T+9+8O"
+    "x7q6u36WsG9eu6VMu2sX+Q/v8UAZpm49bW6ttvXzjxrVd+/MK3/u6VFz+4tvmpS+vTJ69vz9+5s7"
+    "S8tres53FZfbFIU59k7NKdKLMQUsbtmybOwjdNLooE+zrhxRMk3oD0HIJaZJDjLQxeUP1mH5s4Nn"
+    "N6TNLzli6o/ip0PjcnCD4DuqTH2U7tXZ584dG9yWMP6WFQHrUEsx6t9E7Sj15iE7Pgy382j4i6Xr"
+    "oT2H7A9hgeR3wqCxn/hG0fM1bCi8+pjWcEyXhUxxVKpcYZCTScM6bFREMIAXErazFLggEx1i2Qoi"
+    "gzOsqHPHtEBBm0SalFLlIqUl/+Cgbz8BoJjVQAS+oKLpMnDaBDriTMd52YaMylpHbQv7pOQWK3NQ"
+    "w46HWcsBNbZZF5W9n4Il38t43Sj5gL5pV24ootCbiOM4JImxYMF4rteIiHTUMhFxR1HxFVH1CHp5"
+    "bUt+Z40mFePy6uz9DxRVasDfxGHxAzZqmDXRcNO8axwVGO64mvJYw/ydGFG8Ku2JdQqG+4xAQ0Uu"
+    "KVOIlW+GYV3/U1Khp6DbqNFrK5HGRu8EF4v4mJTFrITrRwYFIf5Umt6xscyFFJbMwkZHhRp6yHG7"
+    "DqJgXefJ7VKzdHGirggKugg0Ob+RvkwTbdIghKZO7y7u78tz/x5CM/FkE99uObPrYbumceffDSo3"
+    "f88C9e2dj5J7oePeFOpUUkFz4ek2LDpZ7nC4s7VPW6dE8GAKkGI7Oee1+foM9MxnR8jW4v0JjkpM"
+    "kGkZ9KcLe1Lh2eztqDO4C82+ELRNm3HQAGnR74nBm8HCTAiUUxF0IlTxoS6A2EIeR37kjl8hyl6K"
+    "LvgSkMD2QwlUQOlksjrovo1ITNu2rEjUWoB3b7JISewPoOYt+lwn8scOblejtaZohnr+2DJSEPct"
+    "GLl4kFzK533Fc8XB+wjVC2Sk5t1I8PotebeGOI53moXUG9fNU1wHG0L8L3JpnZHIlUyvn2hQLtbO"
+    "fNyQGK7VZ/Iu8kDOR78x1I4WNCIiyq1JIul0ZXMALWF5uNB5gADIIUg0VfjEmsVbvHWHSgfkTPUD"
+    "PE6MV8zLiHpx6/5Yh8QPMOnOsUr+tIJZMSDwUbIciyi+9xMW2IJOX9cYdYjuNrBATB3E+duBC3ft"
+    "U7HB2R6BQZf/OkVLva4zn9jn5i/7BT1fMddZH9iCZs7FnI04ywVHKfoWKzacYvybsaMqAfipaQPq"
+    "ukWyp8zfwCP+isuxm31Hc2bs3pMSL91tfCih4lWtBrcbJ4/PjR7Y1rR67dunzm/TdvvPjDN7/7zt"
+    "e+98rPP/HsM3/71JOPf//5xx9+/a4zd13SJ/T0Cb4kh7gLs+ffyZgVOsj/fxWBKze21t55//zpX7"
+    "zx5tMv/fSXf/jS37/xpfNbW09sL62tbeoTmzvLh+lxStXx1D/oT+4h9Cv6IX2dvkifo+/oBN9Nia"
+    "wmMXQy/2VBqk4lIfU/vTshlvoZP9ah/qbrFnMR312y63cudDdOF1Hs87uu3HPe2Z4af44+rd/4Or"
+    "x1afLkbdcnL35ya3LnUX5zTt0MHeEILHmGo3T39GgVn51jT4qv+Ai2AUVLmfpxjU1dPMswplwHaq"
+    "bkMYYJyhrtOuXy1HOGpXKQDNcs8BwTbCPvg46GEKfkcl0uX+IQ5pw4D3OAKUYRLji0ESk+ZN6hLA"
+    "MNEPYgQzGOIwO5YtL+wXZ8HAWkRYhN5JvqKsDC1keS62c6BoRPLOgnFo0mHPAiqywyKpRGEC0avc"
+    "ixtpCEZY1gDINUERtDXAwGSOxQNMkUU5Oz7gzHKik7zs5aSOEi7uBgCJpyNIPyS3pAYWl+yv3kyc"
+    "5UP6+h+TLXWd4EtoZ1c0BJtdFv2MEbWlJ5e+k6YkMcHhflpT/qT09Fh+QNI7ElyTFw+PzcvH2Lr3"
+    "ZV9LQdsmWj8KRoku9eCgNo3ojBHnWFMHaWbimQAAAgAElEQVQ1MVXwG+Hu1/EFHW+uZLeWK9Eznv"
+    "QNJCxs+bY4PmA255xs0fQcqE95gr5FOeAUx9jmPJuQGOrqOEmuKMjZivzMmjH1ZS2nuE73pntvnL"
+    "n9xN8+ec/KBcOg8DFNH9sNndp755//yYuv/OzP//K/7q4eOru3uHCYLsYjUJ6k1Kno7N7M0TlmOr"
+    "k3KpD0l0GKZnVyZJU84NXhmPhhcRHc0WKru/HYgYEuHIgWwLYyNSB6IvAggNwdvWQtJxrXRf9mDw"
+    "6Yh+kMcj8XLnwgYWKTCyZfEmEpJoC2hw5yOgy2GWQqI8Mfm7BsjnBaLC7MldDpqmRTl6mvabaPLG"
+    "RwhxN14OcWmHVIwhG7ROyTsUWwf5YAjYRvwXJRB2SRc71cp46z5EQPn8xoA4Rh02dMFjqZLH3nSP"
+    "lOrR+6GAjKJhjGKSfbZ865G4lo6gYW9E7W1cGTr4iOd+GQRzT1TB4C02cMFoqLOqCvV64dtFpS4j"
+    "FjF1GYtYixlIWJqey4relcJVjnWBiVTJYjuEveugUNZuoZLxwlCVEX+kgcEA+2i4BEB88zkRtURO"
+    "RgYoNOhA/uTDpD49ibNHE97kwEMH7pbH9spnxGF9UAkLOM5wHbMMH81FEOKLFJ67pxFhrWcc/2OA"
+    "/DAwNS9t1T/EcOJv1BL2zxOV34KDWu/fJVV9h618mbUJXT+nqUEwht3PyUgUys63NLN7a3J4v6iN"
+    "KSvmCFb8acWzo+t3hkZWVu49adF29cO/n+u+vPv/re975829+8/Noj95z6r3/wiSf+6vlPPPXzs/"
+    "fd+8HRw4c25/Sthr+ZUufQ7dVvihxQ/rsikP5RorSfstA6qtowLb75xrnT3/rB95976Wfv/NmbH1"
+    "780odXbjxwbW73+HRhaY5vktzTN03ymRL6mxc47rvaUmmh6r5F/xI/C1kodEktSNW9Iqpxg213aO"
+    "zzJp/6H2NSL97wM7YVMx/42uTxBUcvf9vlUr4IZYof/ESBfqpA0HqbYXJo+fDknpUPJk89oC9COX"
+    "FjsqAfcpaa8HUAl76ujH+ewJ/Lo9+LJ6xdLySxg0gi45kMnyGJxihg8+HaqR65bqv+riDIliRDlZ"
+    "xK2jFwLKBq7GW8WdRaWGkdK4JReNiNF8Kfsd/mHNKKY0vCiwvK8J/TQPObvg4O1mTJdXANXS6q6i"
+    "sUKwMYdPxyDBAaDI3U+Gtm+GXVsk0GwdBdbxBpn5KSzcbJ/D7jW+lhOomMiKbrgCYnJaZvd4JkKD"
+    "gZ0zwdWtYcCoXH2VkOpJIlHjLgkInms/tM+L5UuNx9Q71Xc+miPpfsO2v6DPO8+jtPQ+xp/LDJwg"
+    "Jd1b5QAFQv+hiPMKd9YMiG+Qgr0X/1n/aMmuMqOcZMBcBqeZoD2dF3ZKmLE7gkbIZRZdTFdPUim9"
+    "YYx4B90sHYFBKcwKnItRd4NpxeRyiPbI+DtEewU9eY5thtNSuDM340Gj8Blj2vgZW165BgwLPfxb"
+    "BfiXd8lAAQXAMlEnl8RDF0vkV3e7q3vrq2/INPPvnQK1pifyy/2dIBqcPHeUM3eer+uy8+eGTlqz"
+    "+8euPzy8dOPKnNzXwWUtp8qRv50TwFyp1e/WieycC9ki6mzkdnqwtjBmMGTnpf66VjJt7osUGgU6"
+    "rjc+FUzpsqQ+oQVsQjZRnInRBFPzQGAcNYqgyeniAj5EHB/GEBnXyBZgEpgjcNVKDS7MA0ng7xNQ"
+    "JdR+tq49WDvvXjRNXeAzlOtBxW86hh2dbkaXziobj2Zod3yHLnMDUEPxj2SjrBVaZiEA88h0glPi"
+    "MTH4HfXzdiH52uy3iXUAwmcvngb0eTYHAptx/goQ8tvsZnLhQJNrH1JrpkEC+vh5x13Z9AAs4G6l"
+    "SxQVr0rj9tTUp80se4uLjdxTKEZFxfZKEF3UxwZtujzFsGDGQtIxtgkIzVAfMZeqZWNGymbGMtmA"
+    "Q4+m0PrCEKdk0HKXPR0xfvp/0p86e+QbJt5VlUYDp9VuXyBz5W7CuYM/UzQzRffI1G3PqyJZ3qw3"
+    "zRZW8qu+7ts+3LumOsc9cJv+FFr8BNE0c27Be4WkzjYV+YjG8+fmFX8o47GKkX9B3RTFfb0gysa6"
+    "m7/dEbHl5kSZfyvCpgHP3el8KkRbB09EaN+6Tisa4nDvb4wicv/Bf0KObhye7Rlbnt9Zv6HN7GPd"
+    "eubR5/++Lr93/nhz/99Jnbvvp3zz78wM+ffOzRt598/OFzTz352PvHT9ym2yk8kyQvNDaow/COel"
+    "f94Pz/KgL0JCe1bZIXkmrI+cVbW5PlDy9cufvlX73+4F//6Ief/tsfv/ZH5zfnnt2cX7xzW/cUth"
+    "R/2pvFqJ7vlbo+sabVDP2dqRFIXvQjifrOFGczlXFW0xQzVUZpxpD7JnzGloQoI8Nij/bOwpP+yO"
+    "8kLusaya/K6fN64mnvJRUZREE5/0g5C16+9GT9+uTk8rnJC89vTI7frqd7l/lpRC09tBHUwNALb+"
+    "lTsbmnL6fIZtWWxSkZX38lhLio7ouV5WQsMamf2ZAsiwrgEOBVDMzU+BE8dYVOHRHDcqfGwN6QnK"
+    "1y4QrJ+EDZXGcGpWCXE6K2FUdOdmtcoV/24WCfdrWLyJiGbdrKwiiURugm4C9FycV3nVVGJXUy06"
+    "LjAR9Ct13mIdQHAXLwi16yZivfco53iOUDGtFr/2dlh2p0B7aFsgOO6jKaah8sNODHS+kgq6ZIuU"
+    "4yQKy4axaOMARI2y/os3TqcXrzYX6ySV+gFnYusUg8PON6DvY6ULqei7kOyiR1CrAVlfVELF71Yf"
+    "cdfR4VuaosekhT9JpGZ2zjjdEQGFLlOQmrINqqzmKUSHvQtnpD1SJYmG3jeBFD8QV/Ckzk1NNRsR"
+    "2aSEQrzIi5bNvmq1hnrn04PPicouVNVy41loIBc41xyKyHv2oY1gE0H29oAq7F5NbuzrunDh36Lw"
+    "/fd+wdcZgMP9bpY72h0yVw98++8sIPf/bvvvHtuenxeybzy7fRB3lzhQ9Ac6eoO7+vneqI7txaGH"
+    "khp85F//NEkauCCOlP7v7ie6EtEgtCBoLvFqiDZ2GKuIgYrWSsmXxP2C3CIrQHAWKYsy1lWOQbi7"
+    "z8zyQjCywgLRl/Ay+KoEjwwMBW27Efqlzbx6ZtR8Xylc0J04xY/Xvxinzhtm0W09SbFPxRp2k+65"
+    "DHHiglOV72MYvleI05PBYmsPYBeSYAzsHhbNc8G1CKuHWUty/2FQ4VIJbMHPJc+SEGyFCvmbiA2z"
+    "Kpp/qG2iH2US4+0B9J6OJYT57ZCKifGF99r3RbjW+ei434Bd0bDQtipyrNCV381V8m1EaJnDc2kq"
+    "E+njiRs74rbL9EGPnIAgsuF3lhQ0EFDOZsLPrND9Ejgf3Y6xhai4EADio6LmgxWuHWGKFu8du+0a"
+    "dbHlvWiR59nPozJMpQuOiEkLL0iAW+8abBcDY2IokndSO5r7lioKSm5DqeLdfvvtqU9GxDFUk8eD"
+    "NBNHxWhjMSIZLHWBAdO3W3DMemR9SbOuYZ/ZGH68dr0Xac8k6yscXBZt5ICAUZ/fS45gBee/76er"
+    "6yYk5fnrJ7hG8SPCL6zpG96faRna2Ne9/eWP/cez85d/Nbr7x7+ejh77z2+L2nf/Lpp5/94Vc+8/"
+    "QrZ+8/88HqkUMbespvAz/or8TzY5sIwkeT2/mjxN8su4tKFnFdZuZvXNs6fPXa1dtf+/W5+3/4+p"
+    "vP/PiXr3/m3Q+vPHt9a+++K9tzxzfm9QE5fQxAN+X8FIlGTHqkyiyG9JUk6TCcWExqbOQaQN/LeL"
+    "Q15XtByhzLDsbjHkeqPgw3+itjkW+v1NF+eqLgOsbmcdiQ8bEB+hH9suYnVW5Ri+Sd7U22n5Pb5t"
+    "+fPPfAh5NHH9WjbWva4PFxBn6UQ5/z9Jei6G4eX4zCnb4Jmzk9iuknTeizqi0bRvuufOYCOaf6MW"
+    "/hK8n+QubVAzSsOorR9XCNQARffwaCHxpyrrAvAaGbaenkYlx5dEUHy05YUdnyL+N9FqP0JYfrvP"
+    "Joo3PNNCJOtOZYp+jB60SuWgiwkPfB0caQE0dY1HtEhyCqZRo3AB3KUbb4iBsUOVLoKY0YXW4pJL"
+    "Hc5vLGEN4EIX4h04jCauEmzpDAG9JshxiIjWOroUrfm2/J85jjot4U4XcSuXPt0cW4EN1zp+tYbS"
+    "U/8qSIoiFfMq9LVt6mffAeO2XGQmBFhvhHJ/wxtkaIpnDTVpyJE5VOCCQQnyhT6NTwkMq4QwaQY4"
+    "Jg4bSOy1FEdlin5kJu/OIKMjiU/Sq/fK1XPvNHpKly3rykTAJc/z7pYFJ4XYdoiudMYtgVGesvum"
+    "OheY1xqfGlJxM2VlfWvvP8Yw+/dHh5otv+B+ljvaGjW3zp6cfe++ZLP/rWq1d3Prc5v/CcHotcZJ"
+    "Dzzvoiuzj1MhZ4vUhy7xTNA6D6rDurOhjJJB16A2Ii8l48goVQJogWZnE9DArAxCf5mf6WtVro8I"
+    "IPETkODJoaFCKzSO4Bk4uORGQcN22LUWZ10UoPH5FhsvOiEXMRs2wf4qL0GL1Kbd+4MPWPf074No"
+    "BkkrSzRa35A6fkRxakqBKucVMnXtDK9xRsSox+d6uoLWk8oQDtlHorK534Hpsde4u1IWtQKGWdiR"
+    "OymViYyIRjmoUH0bazTz7CkUccHP0RbeS92a3FcTaTFjEwn0vx7w66LtGzPkGSfW9SmOXKHyvhtt"
+    "g2S7tij4BBts9c3KGzEEtP4V11+kB/5qAg3Bj0Cb7ogHhm02ZtogKKXtmsWwe70NSeuWBjVRyVay"
+    "6mZB5YRnLfjB/0HfQYczwuBj5X0GACziZQ/vvt9LYvFNdLUvVlDvRLHtmqasu8O79t52JkJ/xh6/"
+    "R7PLHzmEtcKlYs0Ow7ZTotbit58y5XPB7Fo8+yyeQD3PYHr8V3/HMlqk2Q4lNl6uHWICjG1UE4FC"
+    "nTPraJA+QrFuQdP9lFzf2OmPNHe9M/dJ7qTsmO8vOLS+LoITh9VsSPFfmxII2PBdG0wZsurS3M7x"
+    "47Nr+9fezW9vTuS7c2H3rn1YsvfucXf/nmv/q/vv3K42fPvPzHX3zhF489cOaNh+49feHE7Ueu7y"
+    "2v6RN7+5N9sacyj2eeA0qmhVtov+rvXYlqjCl9lLKahND/1rStttjY2tRr/tjlyzePvfrrd+/5xX"
+    "vvPfP2+YvPvfXeh0+8/eHFJ69Nd07szC+vbu/sLU7n19Qf+BZJ5mUtPgXMpsyP3bmt3TEqzvig/q"
+    "B+QP/wnKqz52Oagk0R/VdJXXT0EYdJ1ZcoasTrj0SPUklqe1xXdIeOJbDfJGDDJxrfaIkA43Vubq"
+    "rfndO3W26v64sEL06eOX5Vn53bnZy+nd/5yqIZdBvHiSl1W1Z9GPPC51HSGNPQwGh88PxF3u5Dd0"
+    "Yw1d/FypjDh+hw7OTxQcGYVTd8liw1pO7Fio2AlH1OgBJTK8SNxrO+Iw8lsuV3i/AYqe8Qid7VAD"
+    "O/l0Zc8IKyAXywzRJOExlUopwVO/nCiCf5aHb8g51AlI6lQho3sdR59LtEdMKJpI6J5eyE8Co27h"
+    "fERCY936cGremKEmnE8c/XFgnn+gtHfyjD04s5m6LjYLcdAfO7LsERk0A5Dq0dMR+tSw4wFcrfci"
+    "j08nW+NnTzeszSPy7OI8SSRyX+gYO9OgsvbUGZhCxeSaQYKVt71LOcxfYfomoa9e7U64Dgi4oLwk"
+    "dmbIuW1hlVfNQZy86bGBnXx3UonPIZruNureBbtxQsBmZDWkE+tK39wYgx0UyWHr0LZ3BvNlGPan"
+    "qTjS/RxJ46pgpZH2OfDq3Ugru7rz9w8vavP3P22FuiMoA+9unjvqGjA2z+L3/0+Zf+13/3tb/e3j"
+    "n8iDrYMRaSfOU4VzweXXJ/ZJFIv6yFM92URSeLMg8ydb5e1I2DCfixY/agpyPTWTNgldG/wat3U8"
+    "QUQh5MKmAjkwUcK0QFP1sBOf2xoDTNEzowJYCoVbUQZLEXE4BHRrzUxR4OeQvWwUg6ECPjBiZc7L"
+    "tceHKi7cV3DeDi46mdtD+ot44FSg+8smNppobwkXfVMZBMyaYIYvxj0dsxKGOaibzorhjYj8ZFxC"
+    "ZKVvmOCXQv/GUz9QEXS5HhTOR8Hhm+iNlHcwoen8sOWHncdKZ28ANk97IBKeyy4e5iOfTzG4nWQV"
+    "Uv6t8w2OhXw2INf9VbwotDhuDQm4UQJJtA2jom3Bo1x6ZUwYhxY7YD8QN+NNmkaHnjcu5oRhcfbZ"
+    "f4VR3M4d173kWVPfwGxRtZFpJKrhtjUxs9/HLDBF5cZYTXj1h6nKouQ/x8gXZtoid18Igff1jLoo"
+    "l+ozLGK3mjpTzydgqdMp/6ARlHUg/xcUc6Xqw6gwJyjFtZI87gtSBjwALiNVk8/GJh7wudGMPCqO"
+    "XFtx5n2yHqwEKtOUB62IWyo/OOvwhDsdbvMu3tHlpVzFc3p1snbm7cevztV3/9le+9e+79E0cOv/"
+    "bYmVMvf/KJsz9+8qF7XrvvnjMX77r9+PUjx46oMbINwFycde+yXUimc0wG0u9dIoZO1EEF2qHrNU"
+    "wpsGgTnYk3vXRTX91/7cqt5bc+OHfsp79879TbH1x+8o23L33y9fPvPffBzfWHt+Z2z0wWlxTE+c"
+    "U53b3y77rpSxryuWj6Hp+HJL4as57bGUM4wBsX8MVRkbnZY8grertombRztTt+6VWDwH5SNBydDM"
+    "fpG/pjnGBuVxs53hDAL9rZ31BZcgvaKE53+QgLvzunH2pe1o82zy9Pzmxcn7zw4PrkE0/ojtzh69"
+    "IhEvVTBQFVmTtvqqdw9/gJA79Ro00eb2oooGj4CyM8YBNpXHSfFi/Rh463gOK6qCIh56Q87eA3LY"
+    "mT/pD3eLMA4wdSA8NTWcW0ooo2yMjReDFPnFHMKBziGwKkWOo8uolm8fBJ2f7cEXgexwKxlyqnqe"
+    "3c6IP48Qdl/8cnYJWwyuYpHJMGvHhkq5Z0vauysRL5BAAEUYXV14O2m7igERnPXy4GBf/Rw4tINF"
+    "3nZHUursq429I2qVLbhuOkU6u6rQxNXaMfoZZBGGlijgHO4OiOMGcpQeHRZW/q5rdF1Ztb6qN+Gs"
+    "m+Sw8M+iIOOuU8xhEiNOEwPrlIuQwd+yTx+ccH4fX1xXNEi5SMxUXDXvdjaMSifeizZTnEJZ/R2Z"
+    "8otwC58kXUtJH4pdPxj3RwcoSjHDFAFoHAQB183Vcv0X0NbB0pkM3chDogSUaf8Zv2ZE3DcERpYC"
+    "nDk0pam1/Wtzd/47lHHnhpaWmOZ7gPkiJwsKFT93z0wbPnn7vn1Ne/c279M0uHVz+tdyt0A0DvOr"
+    "LoU4fiGpPPfunSQ4/03QFu+XKpcX9LhxOPBR6bPDqtOyTyyKjbe6AJj3en0pk1oSBPp/WwcCZykJ"
+    "Q84HQOjFFMtTgCJPV+8zkAgUmd9w168fjDFq/mocIkg79Nw8+elJhESKkFulaOLKxmKIusMURDzJ"
+    "ci20WufDR25IxtuIAYGzUlcCi3Tx8tg59mGGWGWMb44Bt1tHf2qbDVtsHEzrg5tT1meck6BvYfAB"
+    "yFFhDHEljoStazDnLxXcKxgQA8/VmOspL9Mj3y5mMkDg/nYIsbaDRxZFgaxKe0r9uj3B18bX+k2R"
+    "tHMGQVNyqpxIbIAPLT3JFP/3B7QMJFs7RQ7diJPPuOop01Fq7Gd9pHHqh6mpSlb/+o1EyirvyxKL"
+    "U9ysRDYv5GPTLSyfgCC8wkI6kOPPiFg35jgyiV79TdY1Y6QsjFBlu2SLVGLBBdwmevEfFHUECXTf"
+    "zrDV77ShvyF5lqf7tMvjAtAQ5l+UJ/c3INFCIxKssZGxA4xQ66KpuKIjkldIpIWyDrpLPnLTbEzs"
+    "ug5jdw/VXQxhatmh8tfxmFPpvnz0ctzC3oC1eOTrc3j57fnT744dUbX3j1wqXL/+mnL1++89DqW/"
+    "eeOv6T+0+cfuXZxx741fNPPfzug/eeuXji2LGre/o2lj19BRnJjjFPqW72Vrbdh8r1OPr7cawQpz"
+    "8QdP+n3TWI3Ee4UugD+3O3rk/n37948fg7ly7dpjtw9/zytdefef2tc5/65bsXn9rYW7xnc2vv+M"
+    "bc9Nh0RXeo1CY8E8uemizxARVDXKh1+9Rt5G9MZdxJzv1MgnxBADGWtBI92pqJta8P9JeMGyTQS7"
+    "+q2tBERTewxx9tpJcM8Xnied09m+fLdfwTBXKQPqRvVt3WN1ou6g7i1tZUNxJ5rFfn61uT1fWrk0"
+    "fvuTx5/ulbk2N3XJG8FtLcbWRDJ5wMJlWCQeWPMchD5f3oJf7zyKUGx5wW3Pzhc3p91dsex2+OYq"
+    "uO4ClO9C/K1oHL3c1gWA2+IyKOu6fsqEqOksQTlVhzjIGwEUNb1zg64FUpWN/yBsACAuJTRyfO8l"
+    "Gp4Jw3gFj9pkwpSgYpJdcn9Y+7bByy/kA26DnaFCZNzdEQA8XRDGwdY6VsmRYNdziTwRkMxR4Bth"
+    "14+MP5oxhdjm/UHbXUXjzFxi0BTfpDmKBaTocMBCEjmwRqbHEMBvotAKZljOsJ3Ph8DNg+IAhPZZ"
+    "6+8BdNTdgXrIqc9VDGB55qngcaFTsFMnCc8/JTQk2DVPDOqNjlXGMh7E/up4EtXFSIAU4mUbY5Ff"
+    "HJedjOVgywO6ODpt2U0HB5j4rrY4wZf1MntGzNkiONouzMxoALucqjTOfRl5fIA0epdM1RnrZOvV"
+    "0bRCKrM9dnrvfRxWzPXb6uK4y7r52+/eTXHjpziG+2PEgVgYMNnQMxt/FP//gLf/ujf/3Vb+/tLD"
+    "+md6pP+H1Brg2+sGUS8gAfOqg6nxaIPPai/1wD9/HUGavjm08nZfJi8NSM66zy7s4qcGbRiQwXH5"
+    "Ifu2TnwoCA0BsRSjWQMnBkL9cJnLZsFrQoBZtFXvsEHu7hGwbtKln9sZhubDB6IPLte8OGYKgUom"
+    "ihDKa88cxhwqBb7qpenaLTdrHRqfPGEj0+Nzf2kGk5zpHBi8QQh/LImUnms5j0pqNt6Zz6ZPGLR2"
+    "mLDgzxGf2a8UBOgCtes6m3/uyzWGZTOV7I6eT2UN6QZknHBRRkvbEwRFkv80snvsGEHV6fcYQ8yX"
+    "Il43LZiCwUUkulDvAy4QtHf7jiBb9F8bmcw0T54zrRN82jQpLzBK9uSl9zvwWAFIzBToj2wjT6XJ"
+    "kYL+oRiu2Kh0h2QWe3JSLlE/4WhEj7871BRLzrYlnXRTncR6fqCY880Ojio8MrRr/ZAVYSsScHUz"
+    "j4AU5j6VxZi8NPkoxT2g6dlmsJO5DDIJsKtx1GVOG4A8nP3hBCFlBcG+OvnH3zWc3Ho7a8eeUYCW"
+    "5eOwrWPYxjosjXyO8Ic29RwvWc3t7q7omt7a0T5zanD114d/ezL7/91pVv/uy1D09886WfP3Tqzr"
+    "9/9J57Xnv20Xvfevqxe9+669TJq2vLy5u7Cwu8NQ6CdpayQ2XtY8W2avj7cMJt30giQnoCeGdH2w"
+    "F9K+XGzd3li5evHvngwqXbP7hy9fY3P/jwvh+/+osn3jx/8YnNnbmHb21PTl/f2DxxczpZ3l3Swl"
+    "H3QNkkLepLRtxuwmNBSV9m+OQnMvT1IzLo5nUH2fH1AUlpu4GlUW2NoOgl737IuNSfr1UsksDWy3"
+    "1aCPTy9D2UTFCZa14eM+bx5nnunolFflF31Lbq9+P8EwaYY/LQhhPTutc2Wdbvzt2rxy2/+MR08s"
+    "gj+vKdVfj4qM0c21NtBC3sXRQLaPnAO6c8cukJgB0tNmWVsoDxk+S6JEvBFM6y0BEZyHChskDkjF"
+    "rGmBWNC7Y5hRVoHVUuEiBOQSi6wUS2gg4+qywl2mq8QxbfjYW49RAyZE418F1fQ2KpZDhxcZcMoS"
+    "AOqEbCTNtUzolNeDKSEHEW0/niGz+SxqvseHKHU9HyjR62Szpgibwt6hB7yIxetn2oQ6I9q87xFj"
+    "C9DBbU4CpPplOIsau8Y6kS7RucAU0jAt3uFQJwDJGrmoMlH/RVeMLR2kY/Mq7fLlB+uUwm3uCw6c"
+    "t4ATMO2RVnxxpiPfUSI87Zc4+9mONo3mz899XRHlrNpowpAexjOjbCJx8CqGKqrUwrelwNJe5Iph"
+    "I8fB3nAcAla1pL5QwCml0ldO3PjFjzIA1vrg98FLiWdr9wsezTtyUIAIa6H0gWMragY4+kddQFPa"
+    "rw9U89+8zLmkJvmXhwcAQONnTVER64+86Ln3vs3q99+63LL95aXPqi3lfWQNfnA3Sh8sKGyaD6Xc"
+    "+X6WUBoK/1Qi8DL+8opNOrRzLQqsMy5Nw36bD01vRTd2oPMPh0YnVnXxSYlKTAYplFrBdcujjiFx"
+    "dmJ/hgoac8VBZoXuRCnrFDNis2eyKeVSzjR3dYvInYmzf8ZiDybZzDhggbZRO/MudrsBIzxUos43"
+    "JofFZx+NUxYXFgPISL7owO9rcLVXb8lPfjouAqb1UyxApDssARnwoW0oCXeIy6kRntB8OA8dOY4I"
+    "8p0lUeCqM9t52AmwWmfReskZsxCyF55PwnIfvJIknJutLxok1le28stYn7ZcXR6BK0Easas+MWP4"
+    "zouOOG6+sg0L7ZvKfKgNDGkaet+pFF7nKx+EyMJYBJlKzigmXHOo8OGRtM+ozJWSi6vqkZBmcSws"
+    "jWBRUd+aKh6Do4XmCpjD1wOtG3aIW+I97+4qvfqCh79NfcPQS0qqEscrzckjgLNv90dptJfGDxCo"
+    "Y9Ct/0anvXofOwwcNTH9LGZRMqifrYPuaczznc1gez+IpDwaE9xII3h/hDzm9Qiee4QJXj2/qM3a"
+    "J+8iCPvY1zzLwe99On7XRjRbqMa7XBDncxVH/uzO7ps3fMj4I9tLC3fGh9d/fMxas7j/zyygd//L"
+    "WXX790+7eX3rr3jtOv3XvnHa89/cB9bz5+9s53HrrvzAcnblu7enx1eWvl0NJ0d2HeH2aX5+A49b"
+    "mKwwmZTrP5ps2efxfGrMxsvuVn/YBPuV9d3tKTWdvT3RV+rvTmrfWVDy9eP3H+yrVT7124evc75y"
+    "/e9/b58/e/e+HiPdfX1++6ubV976h/J6IAACAASURBVJX1jds2d/fW9EU0K+xmt/VzELv68Xc+08"
+    "hClMcQ3Ybq1XwJCf1onri6kprDZVgzsMYbsafNMj9ISgw8R5C+qI2ex1U89vgTz28KWg4pgxoHIE"
+    "sCSOqTbdAPhKnFrh+Jlk98xo3byTxYyf7Vj0gqCFwXtjb1MwX4M92aLOgzmiemFyfP33F18gef2p"
+    "icuk2/Ozfhi1J7E8eyQy/VR7+l4fHsx0rVr6ijvdSYTN+nfoyDnJV1HdJ/lYc8pKqbyvD57zp5Qw"
+    "TBdWUsEFX0A5AQoI8t6HCJL/07sgMYLKVIkwsGZ/tVxaZa7iMFVwfVToOOMlaQj8aVP+kIluROUX"
+    "WMVE2OZj6CQeoz3iTvsyvkgIuBDjzqRSxaMmVQckFPjWwfh/ERtT53sfVtLl6LpYRgMCpjfUPoME"
+    "pGrmXsqkjd13P3C2kRzYQ32y7SbL8MwgHMJrpTjWWzwFJ99RQCfZx3Y+b39APjmu94OgER4oNNx1"
+    "z9n2Sf1B6MR1xJ7OFhSwmaGPEZnOK5wdFBwP/pZ9bJmM43cKavMTL9BrBxsRdwfMUWXQJf3IZtWt"
+    "j2T1TbFT3WEaCNR5wYL0Uj6qCUvoIF8fLverosfp8h9jXZVpAtuPgKmGS4JjkrqvGEUAMMTmVh6Z"
+    "Un27J+VByQ1zzItOP+SNz35jT97L368Jm7vvqJ+9fOi3OQZiLAzHqQEoHtf/k/f+nl7/9v/+brNy"
+    "ZHn5hbXDpJJ/PCj4sr/VHzgh/x1+Ac3oHwQEWSbpyuTCkK5PTiX53S3IhoEtEFi6s7EurVLESHOx"
+    "oGAIKJweqDbr4co0EYVBJGrnQGNyBHS+Y1EFBBDpp1MlkZXbL9OSZP9BLxJI8cavoDw5vJ3oSJRQ"
+    "w8Xo0d2AxyLsYgow+TlIkxvniEmmoLAum7ZxnMrWOR1FHZvLsTGrBd5+hSR3DxA9S2DZatwCp3RI"
+    "uDodXRehK1j9S5ZRy8xtO51A0nHnK9WXCMFRe/Yw1PfcdyOiQeZILVsfAdIEhKbiHqVri+AMCQzl"
+    "hP4p7HbVCLjQKouuIyZrqf2kcwYCgFHxnRQnC+UfCDeBsEr9jQSQ7SfgxqgZZkAu1St3AuvNLDhh"
+    "EYU8J2W7HVkJ5BxZaQ30RgUQrHgK0p8GSN5LtJRhSdxaap48EXgsId23H03f5aX/26cEEZNn/oVv"
+    "LmdSzaDezFZtdbHpcO9Bl1o1AX10c4iVdk/OikFIwlGT4rhKkBSwywZssGxFc5TrxI5tPvyjDt7j"
+    "py0qTlN06w3FiiE96urwssFtRd3c8kCI8vuciCPja099MbXVqOS1l3pYSYDcgWbYYr8xN+5frw/P"
+    "zyHR9Mpw+ce//C53/w3vn1//Tyq+ePrh26eObE8Qu3H165ePL44YsPnT19/szJYx8cWjt06fChtS"
+    "sn77zj+uEja+urupu3trK4vbQ4N9Weciq8Le0jNx0XquOa6aAkqxycqI9TxaBKw6n7bYmP9GrJJo"
+    "CvJx8PsWHb1uvW+uby5WvXD125fPPo5UvXb/vw4od3XLh27fTVmxt3nrt4/dT5y9dOX1nfvOParf"
+    "U7bmxu3rW9N7eqnxZY3uUZRX015Z4ag0dX+ZyZ8loy0jLxwj83QAxV5lrj60D74/pQPz0vQnuRtR"
+    "5HGk+e+o5bPHfb4nzLVBz4fbck9UG1Mf2c5L4CrjtCYwtSbdnXA//4N4/eVuN6Eyd/57QhQ2aqN3"
+    "cYa1P9PIFKevRyOjmsDnLv0s3JM49uTU7dcUs35bShoz/6c7A604mIBS/7S1WESUtTpk9TWX3jpe"
+    "cgO6sDEIpUhFyEo4xqJHGxU3PkXLZCRMRleY1EXydgZLxAJ+VMOLAjCJ31J8KsXKTgWsCHtAsc/C"
+    "MVXznLO8ZIia41Q/oiZ8otjWRoOgJi+eQlBMZMil/yTRgtXdZykkoZLy2QqAtFaaAkX1wsiVIIXw"
+    "ywI+vCoIZucKCn1vECeVRsSTI2IkLRdR7qYwcSW8fDoopQi8Jv+wY1sLFoQ7Db+8QTxShDJxd++T"
+    "ACA1RJvVBjwp8/VR/WV0gJgjt00pa8Yzy4kXIUuR5Kxv6FMsy9mBOv6xkvJe12xyfGI95x7ZFt5a"
+    "p76Fw2aZfBXwNaPiRkpFV8I3EYUtVX5ZDjCZaHpGyrYAe7tmdcSVlUdIOrLHNGbSXkQdC8kBiRD7"
+    "pP7RsDHALXaPff9kHnfYCImaBM1U82anoQj1hpnpnuXDp5/MhffPbpB7+v95QOPjuXkA/Hgw3dEI"
+    "rJ5MjS0od/+sLjf/FvXnr1D5ZvP/UnUxYp6kReZEqOb8+jzDJUvbOmbsmo13lpKhodz4OA/krZnV"
+    "OFWmzRZUm9COeimEU3nVhcyXNXzu9sUM7Igux8Bp0K+u87XOZh1DLIlW28AY964IKwlMskwoTBJU"
+    "42bKZ1JJ/Fn+R1YbW+JEmUvaljMmWwxSljMmXY/64g6LrYo2M6+FzUHVPqSlWZSPFDyQflCWZjQW"
+    "4bOsdXZCpW6Ck5hgAWpgQIQJgGJl+xmMFBgMdIW9T+4K/+gGiYaCdOoeMs1Fm58ktU4mJ3dBgnJD"
+    "GU2nef1Qb0JurFZ5mID3rwvMnzRcu9zdbsqzASd7xMNW0PuvsSl4e0OWCjvyJbgzMJ7Xx7JnrYbN"
+    "9gkffGy+1CW6YmVcSCUbrMdYC9K6jQjGcJHVKpKmGHekafWoCMPNoZFxBm1FxRZCDrIH8xBLmT7V"
+    "IHEYKFvqgQSC1s1bQVNLWU/vAJXc7oSb71UK04AhNG5Ayq/hqdYNq2AQpn0FUM5bd9AoU846FSbN"
+    "u5wTZYyI/uxCngw+NM9CLhsVQ8b2jhwBJf3VqJO5GETzj591MI2IaAqNuCBXz3Caj62QNv6LUx0H"
+    "el+O4Rd4aneoKSOi1wl0VXEv8guvzxZnt5Sb/pqVtRe0srkjp6Y2f3zusb65Nz527u6fsy9PGf7b"
+    "3F7+/tHV1ZvnR4denW8srK9SOrh64cO7J6+fDK0pVDy6sXj66uXD52ZO3SkcOHLq+trV09fGj12t"
+    "rq2o3VlaVb2gRuHTlyaGt5ST+dThAUkKWlxd3FpQXtmeb98J7iy7Q3tJ9EdJNxb06fh9YNsL357e"
+    "nO/Nbm1uLm1vaiHh9dvrW1vXbj1q1jF65eu+3Clasnb9xaP3Xj5vqp6zdunb52c+P0jfXNkzfX14"
+    "9vbk0Pr2/uHNqezB/Zmu7MrU+nPLCl73Z0WOfm2IUyXmTcjyTq82W+w018FftFxY4tEYsy7sQhqK"
+    "9WhqIvgaQ1NBfw8jhRWwjHNaEyFCTrtna1mT8ys9OMdClaMwdO8HRWO9G6XghahjJt7o5B+FRMT6"
+    "DP5Q0B6erOrD5CKVn8kKw2ZWzq3Je9MFV760fsFxSB3b3NyfyOfqpg/cbk9Oq5yTPP3ZocvuOGPp"
+    "akDRyfneNnCoTnOlBvNok6724L299sCS7XFplzIqOXy2OeO4V4ajJyrrAVfCCOEDNGIoUId5h9Rs"
+    "qDiAxJGhIjBLMpc1SugaGXHPgVrx7PcTK2kMU7jz1XRsAz2PgXyZLnJD6n6HRGZetVbdvBFkKndK"
+    "095MXwPwRzdISgshUgqtxGTadcSeVADYBiJL/PhZbXGW2gmdsRtfQACaELcCIbHxUp82ZjEpmxjW"
+    "d0cUDyvoYYqQ7YdVeGhwH+W48zesjqYAHGXV7IMd6WNO8t+LOckqWrI45ezdPd43AXHv6RGIu+dg"
+    "uXPue2500UCXHXLV9qhGQ84hhNaOBQ91kKesUr8qy94Y1/j+1wuh8Gy14HoI6N7nFe2LEqDZXhW5"
+    "d5QmW3Bgx4xEvxHTf35kq+Ua1sWZtDXGPN85suOI5JieInTZWUPEVjyQ51Q16zgppHfK5DuAFtuq"
+    "OvzZ176cEzZ/7yzKnlg0ctO4wz54MN3Uww6Fd/+qXP/Oq/vPLqv353Y/2x+YXVB7iToHdaq1OmV3"
+    "rwqIMxkHlX1dNCbV56IeQ+Kz6ylh86Jp2d7jti+SILRfTG7k6vLi16OSksCTDGLJuF/UwFxMiFG4"
+    "WakZAni65x5LcnqIAin40EqExOqo8vfOWLaPhF6rplYIfu+nnUW8QHNn3RwfuMc+rbCxTqMCzcpZ"
+    "tF6ahvTGSGisd/ii0LD18rGAiIKQy9qI9VKZtkRct48ZOqRha98pKsF6jcgjCtTi52O7Q84GPe9g"
+    "DIv3ha4PLutf3cXxd/pb3w2/+uLzrgGMtAqQD9LJvsAo8xpFkP2dVggEA16XNZ9BDn3ohbULjdNh"
+    "aWiX1vKIg/a4sQZ3MJPX20bQx9TW6BqZM8qrN8GNo4FQoXOXg6W1J9jSUn79lHO1jcic5mm7oQSy"
+    "4Q6Fa9CsebWQSw0WdjGa7aA1+kS7/Q2Ukq+IsKIewEzUkZ2sexwtYgJYaUfIFRDVqWOpGKUnZTDk"
+    "eLBd/pSP0sjs9c+OTXji5eSAvZPnHuWCobPySBHjwWNaTIJYd+HNC5RRDzCsQgYSOuHD73HNLnbB"
+    "QqJtJl/W0wyTMMWBLjg+cI8XksncfS0mfgISfP6ZieZ8TWJkAfmVKFfFdnjm/S9OJa9ddV+fQt3c"
+    "CZrmtTsHdZeAKf7N2Svr70cbq9qO8WWVpY2NJjfZuLejxzeXHhlvrzTeXXjxxevbW6srKuNtpWgL"
+    "ZXV5bZ4G2r70wlM11cXOCs98fklTZw0+l0Ue/w6jnP3UX9htGiNmOrG5vbaxubW4e2p9PDW1vbR9"
+    "Y3N4/e2to6tDM3t6ZvIV1RNZbV9VZVs5Vd1ZU4ZX5TDAgpMVzW5990dpM4SPzQt8qSXxQR3oI6eM"
+    "aIlBQvESXPHYGEV1s7kegLkZMwInoxOpDxUXug9NYUaX2xBjaNzYsEj17b/UjnZsF2vjD3MbS55J"
+    "udpZf3cKiQtp9s6ryREl0XJ8VPdD5vlH6hvbR+d25jsrqwObljQb879/Dlyf2ParN/SDaWtOH3Z+"
+    "b4MhS99Pk6MOlc+pUgY3O3zo+/sBD2WMBv1UBxtHtUWCbjqnzi5w9wgReB97wwU1eJp3Ylo1PSQI"
+    "0AqiZxACyJsReG6KovHI6ePhpCivg4puT7uC+sFlJ93EkiEcyWRoB8qJx6/NsGYHG0RCQb1ZE+QB"
+    "QPKIBUdCwLnT7rkJkuIjhZNftMvymizp1iv5+mMDTYShwNYZG0gTd25n4ESTLRskYk8Ed/iZc8dY"
+    "xmMEsjlDIIjXgANrhLofRjJPgWgCVBZJFxBgzmMI1PxqTuHGMbER+TsV+oQqXgLMXGgKN5HLYTYl"
+    "VIHMpeKfqaUqJ98ga16g0uc0bmiyA1nm0yBfwDWINbjqtdLjOp71D3kWpbHR9sd+oquawgmFd9cc"
+    "Zd+SOdNGDFoWSliA5rh/Y5dUPcgbJZMwXo6w9QGt69DkVXc7fuD+y8fvbO0//h04+ffbX9Ozjvj8"
+    "DBhm5/PCZri4vX/9mXPvdXf/6XP/jOlaNrd9+a213xBkZXdgbCgjo1jxtliGbyojPy+TB/kxwdm/"
+    "EwMxIY7HRe33kTiw7NhbrTMFiRga8XHdvvxIiWi1pJWQYJJeVJWahmlAe7+WbbHjlPELDwUaoZPM"
+    "I1DIeyIfawmLV48KKfiUbkMUmVwecNCtTSd0VcFkGD0jIs2GSwF+KOpPzBOvH9jSQGXrEpsX1kWs"
+    "xQNVlKsbyv+lrRcIgT+2xcbD5m5EdolnAcCA0TCOdsHmi7yjNpzyYziiAFYk/CT7cfGCr7XSf3H3"
+    "ykTE0jiw4LRGhjCj+b11EOc7xwzhs1Fl4iQOLV9XMJX5BH3Dze/S7/TaSOtKVkXF/kVVedeCyLOp"
+    "DwAX3gfHdHssUxsHlajNK2CKVeWUZaSdJSyWbA8cMAbVabJWzoDxzjym78YqNXluw2UvBKUBn3IR"
+    "VdCc5O8oCLs6XRl0KAdWYhGI5xVMgGr21KEEaC0mhuG36XEpzYj8ftCvQdPgflP4tFjopLoWOZDb"
+    "z6Bsiij+3OG0OKvWObNomI8nY+Ue18LNBPu21qLolzwlK/UIKfceaikeiXsiQC2Okz7u/Ku1ZqZP"
+    "vJY3HKg4QcWO4L1CnwRuDzJsgvaNG+ow+XLeqLU7b1RgZ3dfh9LVoi98n02CDtL11+h03Kk235wg"
+    "LRi0R+bNptLwV9Jk8Ah/hNKGJsB3gcj8/y6SfNd7UREmN3/srmJq3lP7mYKCiKsiMLnm6xIARg9H"
+    "E/iXJ7iY7sAaflm5pD5AUprbjZJb7HF3cQS2IlIgAq5LM0RmODA9tbV/Ox3eMaR/zmFWapo166L+"
+    "h6oEdi4ZjxTV5BgY4tn9N/wbBPOtBuTvYnVQopdFqTsFrObB04K5lmXB30D6b7AVgU/EISJkXFWZ"
+    "st8PkcHTCigKT25MHRbOpgzGkDpv3zZHtjU98nsT45Mrk0eebk9ckffG5ncvKkPu5CvdnMWV8K7B"
+    "J36otRQPKPiDMXgKo/+gwbOjdm6o91fMAhvCBPq4bmyENRGW56t6YwiUcauptbTd8bEpCoNsl6FB"
+    "LQMiBd5gsnBMFnvNEn2otwiaXjWNd0eysZ4KJZZxfabviND4vUY4UyXZWKYpnO7CSG+xOyyNhCWK"
+    "HAKDSfS0/kjEVkhWiyDqo30n7jgDkItlOiaUzLyhcB5DuEC9MVlBxKhKqwCjy49h6eBQoOfelVnQ"
+    "h9eeE6xYmSkWSAiDyRUJJeebAPD1bLkrWMbVSt3MaVR6BQeP+Wz9CxqYu4NP2fc7xLPIxp3fEAYk"
+    "JOnVSwnZzQNUkC8brtm+oYJIfeIC2Ilutz7Bk/iFYIF4SuDSAqG5SohmeB8oC8XcTpYndbpALh48"
+    "2QKjv0t/LP5Rkxy2MeH0RvefxGhR6GWVSoY6+JTZSQ51vN393CroomNs0QVxYWl77x9AP3/vXxw3"
+    "ObBijfBx8PMjwoc5A+GoGvPP/kuR/83Sv/8Ufr0xd3FuYe8VfaqvN50NJZpcAFjx7qRQI0lXXp8n"
+    "jQvJD+5l48oo/9DwW96NU6ZKJS564yPE/aLEAQwrZovnCggm6PRJT03wMSCF+QLaMBpIUYmyFSsB"
+    "rHQ0tUsLCN5gxO2TTegIFfFkNSL3zXUYcegPjil0yO9ap6SM5WhM0jSGWycEDCvmRGRi7wWgR48e"
+    "oL5uhnFsCJjXVgCSDq8ZUJgtiAPgNLKX+sgqyHKroUeOUC5EUbC8TCGTZ7QnQ8JZmaxnf4pBwLs+"
+    "KHv963Yafb1tJqp5lJDLx4N0RVUtSHS3K5SyxkxPVL7eRjYmh9+UvMLL+/4o5p18eLdKl1bXJ2tK"
+    "xL/ZPkEThicc+AfC9kVB0csS/Q3AYqG0tl2Gxq57RQ86ObhiFCvProrA/EiPhISXayyACWd/Gxm7"
+    "iDir7OYg50XziBqfazFDLB88mXFeoDAhgWsp+VdV/AvssRNM3jDB+g2VFJtCsIl6nAqu5qA+pOO/"
+    "G5xyAiJHXGpc7U1f1Mq1CiJZKTbVgA30VS+zq8KrjdkIIgYz3+IVG2gliJgoluL/xgA0Z/8yPblO"
+    "OUMN1i1m88t4Pw/GaB0PxzBpIfqi4s8/T5E31HijEWBej975QFUvkuP9Waikf6CQtsHmmnTtzlI+"
+    "sNn+oW29hikU8dkCM2PoWvgAlpjce6EzW7rTyy/OvQqbKCkK66qvdWEFUAVHXAJm/c8QcJv/j2SW"
+    "33MO1kDd1ldZSIm6jeICArJfq+dTmSoc4mSFMZj41ywj57AanNsHhqDsvP9WdjHTcp+y6e+LLRKZ"
+    "DC1D9xpJ84lCrvYtCyqonKEUpMafsQXYPKI9PYhSVfWOAy3ogXbN5e4blavm1Tt5r1aOXcZEtffq"
+    "JvmdOdud3JyurqZGnn2OShufcnX3xuZ/LcU+oMK/rdOYK9eEhnQATsirLs0IvNnPbmu/qsXB5LY7"
+    "zHV/dF6sGG0HH1rCO9biHFU44RR7/kl/uadSSG307Bk5DrQpzSStSHRIU4YYtMnSkrpbnII+cebD"
+    "FTLBo5wN2myBmr6KUXfRDjh+0IPNbxEVsq+RzdHoMmRlVZZFKDYX4A02atbH7sBcd5xd0lz2noYz"
+    "n28Bf7ToWTYvknv2zRdolblY0CBkoic05GR2hCMbCZCBRfp5rLCbB6r3m6OigfndhHTsk+B3kfBr"
+    "CkhuXMeDApvtsl6PixzxfRKtFvFhmLdEbemqcd8F1VTaRjwm/CSILf/tyfJA+JOHJyLfBDtbFNTK"
+    "tMHCmDP8NLO5oywA5iRkS/1PBoJo9WNFPvBrA9eLY1UDtjDBdQx2lOAt4nHjIWVTXaSMltmmzeJE"
+    "neR8zZn6IN5cEAAiUjmuwZW0bZ73tNqAHKFOi5mLmC8u7udG66+/qxo4e+++TZO84JvTrzjO2DrC"
+    "NwsKH77R1h+8/+6HN//cv/+Dff3lg6evd0Z6oP+rPAcH/UmXcomQAYoKLVoPAiic4P3RfaGivuuN"
+    "Fl0Hjg0FH154u8e3nKdHCKnJLpgSa+7QnfC3VJlg33b+H2Ys3zjfTByiAFsAaMMMDRv1L8pw7ZuE"
+    "RusGO/kJOkFTLgkUfXOMphg8QZHzzQVR4WEGFbBh0WlNKWvEnCqYxOmIlr8KHrws3m2Sn+mU4WeY"
+    "35lMPLBiUX6xIpVZWMDy4Lh8ibqAk9tgpLGuCUok/egNXVAV3qyB8oyhovdwDYQPMokR0z33foSi"
+    "dg1D422w+wOkETN0VikErqrDz/+N7szki6sRonZ2GBh0oHHEZXn7z6YrZNFGBhM/3YBIpUp/5sUv"
+    "rBla4WbcBVcwFQ8HGSY/vWbeU7plLwxN39efBPGsq76DqX//YtfuCX27GxZTP1c2bYzHrhEO9wYv"
+    "DDV2tqXbHx3op6Um/+qJAqDaY3o1zQUh0MWcZF+K4vCqjEfot6TjCJPic+MvxJjngyr+TiFQ2OyJ"
+    "CwjX+8g2w/RWMbgb7votWwyMa9tUpPMvhl31U5ZMDIIjhvqPBIq+98yyi+yZzP2Swm/sx5gvI8lT"
+    "tPICCLH8WT0FQvNqxsTrDJZ+122QyJ3mOJpxvQWxIAdZuygJIcT2NinK/VSERsIcs7YREnugH+8y"
+    "28iHNAmkfioXdizqGMDv91qIqpJP/YlGjNMPKEQd15JbpgQDOK66kR7XqJES+xIT79ppEwB7fL2P"
+    "eXLbgPgx+fsZM6qfXB4FHcOBsn6ENO2FBGdQbH3xKpIvXjlU02Z3nt+Sa47QWqAYiO6fYbv1hBQQ"
+    "+PNsN1P0qJeRX1IUjpS4jPzanx8T9PWup35qDrK975fdYd/U1vbE2O3Lg8eeqZK5NPf2J9snJcn5"
+    "3j8VD/7hyBwJjOAOCr9GzbC3tFAz+IgZ0mJwdEJGeS13DJ4Z5jmYz9RooodmotixQRe+glJjrjDz"
+    "phOGtjplMUCrf6Ctd3TFtfOrbnBpKI2qxGhGDlO1o23l6VrcHH+GEqLqh++IUKPkBX0JSBiS1kDK"
+    "ic5AweO/EDefHtj1FUZuwIF218MjvIpqHSmMJLtYMZnbQTeSOiz8XO9ksVCPy0RGwMmDbVvjS18Q"
+    "HjHyH8pEwNVVccoR5WJa/MkEd+TN3OyLttkUM+CsorR/xMR29WP9h8Oyy/8ahPvipaXMvUGpJvbF"
+    "9vjScc1HmB16nz5tE2YdgfCTYO1LTbjCJ2pBcdAFKePZs40OWddCIfQ40ft4hkbDY9UjniOLquB5"
+    "5hW39JQRjLobpsHWHHRZRm9Papu4DtRrUwZRnOuA3P/qk/+ZrpSuGXDNAPCp+iPq+9rjX333zmyc"
+    "e+d2h17mZZOzj9lggcbOh+S1AgPfHwfZcePvny165f3XlRi4QneCLEt4fV0xjsXvTUYsOTpnp6/j"
+    "S30+kzI6SDSoe/DJ509XRuxMZuj5o7uc8eRtbPxCDiTPLA8EU8WrC4SFsWe1xg+KyKjFpWNBZTLL"
+    "79TuYw3LIgwrdOxlABX3znaGBmQCKXiWlUso6K8V/2sac/GYNof3qj13U3DnbgU6ikopNptaiOTn"
+    "GIf2lYl4WHkuuKMXgN6GIK8Vksx5y4jHnj219D+dDyLki245IKYSJ1bF+MoRhzxiLXPkw1js8QZD"
+    "hxGnlgRx9DwpUc7aUeUusOyqM8PvVCOX6JWZWm7f0nU17sCcu+oFSpsXyhKyY+4x44nNsffGUiD8"
+    "/ssqQ8QCr5KLv0l6TQ0XHd6KtKLEKdBV9lYw5XCYsUNn1PZcFEtdrLxMKUcmIEFsLgVWzBt/Giw8"
+    "8/jLjt8SIiroLA5oM/8fnj33fRjDMs10SOL7iCBvXzAlnlIOVMO5IyxoNrHdsDrx5DtAPxCVOziT"
+    "Ez+CM9Hu6mMVhGk5CPDqAGVrnbgNjl3gqV6T5Gnj+a3XTjsOEbIJQRhuzQXq6lmFgtVyUbPDHdN9"
+    "jIze/prowXwKjIrjZFQjWu37hSnOgu9gkosIXjn8EonudSG6Ed5YMC5nm3Aueo4ShAksBCxBMn6u"
+    "MyjpEQ8ynyLkrfd5pUAIa6uHWl2u7ns2ryQTz+2KDKUR3IKAUuMRXNRfsUPIuof/keY8UwaqCBQv"
+    "z5dktp+oIhqmxRazb4bPSRos14OYmPYbdjkTLnyzU4yOrMcMrmo3xFubKN1e1Hu/jtbkNzvaDP82"
+    "Yl8cQLbWX9baba1LH1lhyPH7PB9FOy0p7f1ecfN69NHph7e/LHz00n996jO3P6rhr/eLjvxGmZ4Z"
+    "0vyw3qpWhTFxxl4ywKPqTX0sug8CIOpMi7XqbDgs85MesQuxolk3zEIkp8pEfdUNXL45a8aI7rMH"
+    "YsiZpS2ZIRfyGLbKIL3V7aEPGCVDQ8F7M0TaeWDmCUlZeMK0XNE4dGdq0MHl+RM1YBmiUvQsO2jQ"
+    "tnPEdUR/5FHrFLT9IwU28LWDYHMMNLZfEDRPBJscP8C+7IIVcwQ64tm1AH6gM9eITBvgQ2sTSl7a"
+    "lQ2URi1ItFsUWi/7pceXQsDxEmFxOrQlBGStbREwbMJXMa6Hv6kh6jOKaoxVeo6TsGiB1hUIrG2A"
+    "5pj+LwZmBUcjaQTecg/I6DLUkWn7o+jR93htJgN9DUo5Qg6NWexRc7z8FpxI42Lg0+QyofG8cepp"
+    "G6sgHiOCvfVOkbQjqxEAZ2KEWCsQAAIABJREFUKbsudEoSw0BZf2befJSZY8zgraSX7z516uvPPX"
+    "rn+5IuJWseHD4SAUXsIP2OCGz/sy9/9gfHtte/qceMrm6pg/GZEPUy9T9dzNRd+WFc//QAA16dL6"
+    "/k6XW868liLu/5MLxE1eCGxuDpx/MyYaCgzk8nrw6OTAZFeVh63AHyYgh54/RnZVLu+uSde+YwTV"
+    "SS3earpV0FGSifGR8sAFumdcHthaEnimboDC+pJnIXdUFm3iqe70DgnwS9gFMsmudFquno47Pcoa"
+    "YFO9hrrJmz/ZJgy/SGpct9Jtadt6+Cd/tghyTM9odFq2WLZW8qPsEYGFb1Ir9hBqfVbCxa8FUvv3"
+    "tOvYwDYvLJGcb2wx/bzX5L2liNLTzBOI7RHI8dt66LOeU7XywCPou21KP07Fd4ODb2W+yaIEHqEB"
+    "l8Skp7BZP6Bhcf/IcdAKveZJ3sfxewV3SdnFcZzNiZYaJXf+1C22mErvds/aDZR9qjEuXQcnaNKg"
+    "587it38mIbOR4D5Pe1kOv6w8UjO81Chs2GaSLxRzz0mo23vxmXShpTC2THlHNs2dfKC8rQnGPV1j"
+    "RmiU1etiR30z9UKj/x2YG3R+inLSF7HFNXqDrwwsf4UmV8N6/0gADLbRBdKAOGeNTBL+hSpr+xRV"
+    "Gv0fVYklKHz2/cYc8EHZ0vW24T4k8MENHZdyxRtkNolfN17jhzveeuoZ7c01nzqfKeo7njxctYog"
+    "lX+wa/2Dv5S65U9jwrzHnt7jDPZ6DxF1xBKq+zytxBjE25pDJ31FxXCTqO6AqMb/7ksSHrSJdHT3"
+    "2HVFgS8UsnOYI94TgmKjJx6sXZc7aKOC0rykiTZoA2IEDoFxtx5S3EubOKGv2z5QRjm/gkEd544f"
+    "Fnvo1zT3fa6CP5ohOuFVzhVAE25HonU98LIz4v3cPgV6DQlw6f+1zQZm55e3Ny587FyafP3tTdOf"
+    "3ozyF91Y2+p0YKclk4PLq6y5ehKC8s7taBb//so6MtHirScTUytoY6K1b80Sf6bAUdCCPSvCGjqI"
+    "aAHBXl5UMX8CF5pD2ucFPCNgsPxX4ZL/Og9cxCv1PZtB6xjf1IBKfHrmOKXNvwGVMzNOIFBjz1gc"
+    "wA4Lg40CMzytqu9UKjTDs6/iij6TqSF51BYXp4yaee1Cip4uNCxdN6SEvGfnNK5IKJ8KjvrOQQjT"
+    "iyeXULRz41jSryvCRnqMJHr+yHIaZZ0ItnPvX+iA+4hYwT59KhrDGtIe3+3DWe4+6y7c/gCNv9zE"
+    "Ybq/g69ThMXUWAxSPDnNQWxhamzIUFXQXMVM9JdUUHCxy7jKuAKAGpweRj8s76EPuAYykyrDdTDy"
+    "GgoBfza95oAxWiamV7VQ4p9SEvGbeVsSwO0U7ZpmVC6mOT2u8+z/K7/RWBAcvzn4Uq1js77x8/fu"
+    "Srf/jZ51/SlwcffLNlB/B3nA/u0P2OwIi8+9gDd7771NkT3zz31oXPLRw++rw67yLv4NIB6cgMNq"
+    "5R1ec9nXrC0YBioHoUkqc3q+xB5otOGUWxeronMIwWy/OSeGGPR8sJy3faZJlFGYMAbPK8201Cjp"
+    "SBmnw/+w027354MFoqjpQrKIufOgLTcj6LAHZwVXlZpn7IkTwB6ZzFcBCzQGDCRg/bra96aCERXy"
+    "PrQS4HofXgbntexEqsJ4KKfGyh7jZhIgy+Y4hNfDQ7PLvqeokIV7rYQo8XtCTO0HIuouTRaZmmBt"
+    "C2HNtCkByIbOKJFoXEjozK4MimY+Ii5fiDOCmm8D3xth6gCAJjVyCQwV94ypuOR8i4ACM6opqDry"
+    "JVhModYagvlXqrqA5SlQupv/LCdKzbNNAyHouoJXbjGxfojnRylK1Ohrx9dxa2CcQ/uJRN9UHoji"
+    "sk4ouM5SpfQva385z9eBljpvoe70QLISLGp/4x5MV2XGvnLWdHEREvjnNOvyPXKW1Wbss/w8o/1N"
+    "oP17vqgh4xIBzxgFpSSAm+20qPN1JX0uy52xkWfZqNh+cHbLoBs3iw2+gGwRk2M53c/jhh6+q74v"
+    "muTTyPmPjYBjbzEb7ZO9HTf6wnjB0+S4Wg+Dw54KSi5YXhzQzjXozWbW9oW0vqNLQLJMFw5yw2hY"
+    "ECMqWYfiouNP4MTlkE6TquUoHBgmqwYZoOvl0nPTZwAyhSmivajtW0IdGZrO0DDj46PGJoRniIQL"
+    "btnuxRqtfgJ4Ki5U5Z8i5LORGWjismMJ1n+wD49Omh/saRvMY0Zlx/TCrpm0TlC20FA4ck42sU8y"
+    "90ndmA8ZIdvvxnQd9W6m/k1COz/O7c2vz25MH5C5PPvjCdHD9yVY2iHxH3XBXf/KGY3nlrk8ojif"
+    "7MnH7sT6AqExBkh1N804YSv6gb7koiSWVTrCN/zYUlqico2tr3LE2Dg4zrWSB+wyFkHcFoRuO1tc"
+    "TRpeGAo/QYvBhjbzfsa2OhixElOif+kji5s7pUarFjnsUiawt+NwI95ix02kfFx1i0mzM+x0wMq/"
+    "WMP8RFEiNEd0Dp+hqn2hiwsUDFg7ykam1EwYDXOTgUmav587snliqGTo6VsUCE4CM5peTpYx2mpg"
+    "0wlsNH7LgwHiDgFIk7zCrHR3uj6qmu6Lh/ZI1kWUii+xrv6wFaeuk/JigHOnKqtXkoNcMiLiMN2e"
+    "OR+pVfQ70CV6oquIxGEl7Le/8FqRR0ymfoE3WbFn5xHRPWRx7bhTWbx422QNxdFxFaH4fcPmJ0n8"
+    "2cgj36UHwa5AGTjqnWaU4MeaoH0WQLOib0Ly4z7pVui/JKgnm6B31QNddsT9f1FMNLTz90//9z+o"
+    "S+bekg/aMRONjQ/cMh2vgX/9Pnv/+j//3ffvPG3pGz+nbtU+p1c2xW+HwIA49hMGUiIKfO25cGBk"
+    "CGAQNRXAvogJDK3pxIB1YxyWiyyAREnkV+j64eLr3J8QYBNjqW0+9CTfWYi2gZDuKUEicvTFuWMn"
+    "b08oKLgSVhXMMhu1SykTPZPhvLgmBokhSBRRaLdtcFXDwQZCN5YpEcuhx7E2f7tg01/hjDUtjURb"
+    "OdgQa2XtQXF2AZW2cSfkD3xDCjF7/AswaS8c0XMXyvC0AcFJ9MAKIh+VIl7t4IwI+Icb1psW+JZf"
+    "uIQ77c4rNQSfEj+QCbSGX28YKhNpIdsaRYCG23ITibRv3bd/J9wZY+dWRBZ1HVudqOuHeKPdq0cc"
+    "quBJAjBmB6YyCaN1GlDN8ycoQ3C7wIly/2pvwnP7QhesRExG5D20djhoYAejKKQmRNiD6s2QQGfm"
+    "YTgwmMjxK25Suy6J2wV3mHjxJhoNBizlOIMLD+EHcULNt3RGzTkvKlIHTSulYLCRQrWc7lxA4yxU"
+    "Hf2OKVjThjJHlBPdN3uSeW1P1HOr6idt/mQk/80MVAIQl3iEdgIyFcuyVByNnsxAJHeLhkr5VRcX"
+    "yJOfhrOyCEz9fhNw/f2SiBgz6Lep54oORNm9VSDh1fxUVYiby6qfV0LCK6ZGHw/xGFVi6MNI7GF7"
+    "f49N++FYJOjrL9oa1J6f/KCwM4oGbjYCEOCrcXYLblg1mutxU1L2izx908UKiBeS4lb2SqgIWqT/"
+    "SBSpzRizKZTt1+lK1oRjbNqq/A+C08AugvnvE8y+fjiB+/O6efl+AzBnokdFd31vhWR/0GlMY1NP"
+    "pS7s7pe0onS7vrk7WbFyeP3P3B5BPPTycrh/W45RJO6zfnhKEKUhl9QykbeuU1D7HY5zHO/ikEl9"
+    "021Cb9yfXKzGnfw0ZHWN7oIZo+PUSXDCTO2NbgYxxYl3ihCjB1hyca39LJBAs9ccYG+sgpIzmKLh"
+    "eJRalpdUSTv/gMJ9ctawIhTqHoLHuUhY1kTKBpB4yjQiUk7IjlghG5CMAngUkKD2ulJj3JmKxz/l"
+    "WmDaLBMb4TuCTHwv1SYsTHAFJW26VO8T3+qK5ScA2Z7CwxE4uiJb7lg05AhhabfcRfx7f8jtO90p"
+    "IidUGfjBM0CPKfE3eRGnvwp5XQ4YVOySoDnlV9Jg5psVADD7/bTNlKUJHKOURFQtg932pWKz5E+h"
+    "1fuqKTK6GyE84o6ZRWCIb9EjTySW0n8W1y5IhbfEcKnk04NuL5ehANo5iJoGidryLKbs+ZellEB9"
+    "qa1rCNcoxSz52cU7fyFR3hyki9qJvyJlasy4e8yaK5QTyeHtB7gG+cOX37nz9x9uRPpcw31hykfy"
+    "QCBxu6fzhAe6duO3ruy8898H9+49Xzz+8uHfkfp+qt/opyXeCzaKVvptOyOfL0x0VLKXQNABbTPO"
+    "tTnZtO7wEnmXEARMNa8BHQePfZw2uUNcsXVnJMqx4dxpRTls6gAjOJctviTOoNUE8jHtiwJAsuKT"
+    "jJux7YKrYXXsoD1/aCSZ2jYxAJ9GRo0+gUvs8SbZ/QGswbWxJSAr9tGBN9BH3KhBVM0eRg8DJhWE"
+    "g0OPCsZptAUMZq8rNnTzzm4B+ZTP7QscVkbTv2T2wWCpUsX343rc9dV2x3vs/IdD2bZtMVC3GrHg"
+    "gG0b7YJ2ubnFik5vG7hZmQq/JRtz1sZfFTckKhDaFDUUkwyqUQOoE0L3Yo2RfotL9OpknP79y6Iq"
+    "K53mwMre5D1xkbPBJCLRFv+6VasQEb5GDlzYSU40npeeEGCJIcSmZUD5XGskzw2hfH36wwUxfJsA"
+    "BU/XIeUJOpOjkOrkPqYsv2mXoFz/h2LTFu96ibfeh5pOqKm0nqee2DeMGBWXEu39ytS5c7dZjNu6"
+    "CNgoraQQuNEpNMfDGanAYDfx2i0QEpllzRvP6TMEX7pgwX//jEul6+sSkSzb8pCAd2Jeo7xKhsOt"
+    "6y4ze2cLDo7hP4Zl2OGocwQ7APsIxZFeu+lmJpuoBfuCV/VXbcjUv9ClDlvCH2mzL77UTH7YE7ii"
+    "14sS1ChGWPPDzw9LlD+W5LkJUh75fneC0A47TldBDP0qb7SQvqngi4Hsi4rDp1vTjzwnTeAFCbq0"
+    "38ZJkbL/2Dh2azQViSPI/2L0mejR0R1t05sbnbsaifUZ/X78mt6RvE7zvy9uQLn70xOXW3MA5rSe"
+    "GAql5zq3qpTADYGOhDd85yg0QbOi9w2ZzhG32DWOUr7hI3VzN1pc4dyx5/yEvBdWWjydxhDOOI7m"
+    "uuzkDQx3XicU8XPSfR7xmwsisd8xkPHsPYQ4fZUnwf8S9ylEMjXoL3Eb7QZIPk/l/4bRNJ27FADq"
+    "HwEx0EVzTXCQAVPjI2vWGxTKFQZxrVDigG5YlxrA+kPLVjyKGHnCppHMaOUscMHV6Q9PJHQCSRPE"
+    "fqn7q7nTtvqvgG08G2KUDjBY2izpBVyF0xiODjh8YEsraPleKJZrLKnA0AXOchkdxwqavHFvqBCH"
+    "+2YF0aGvnGMrJoMLEP2145ZIlUvLIIfOMghrT8hxZN5YtpmqgU1Z6wjV1Hsy0aeR8Ri1Brqxx+tM"
+    "f8SI8oap7TfXYpYFZJfe1a4+vs+DY+ctD0cht1e1j+o7VCTjFxe0tPuulrZMvHj+j788my5foNF4"
+    "G0GzGkGXWNuKJH9f/z8489/N0jaxPdSzlI/z0RONjQ/eNR2vwXf/I//OS1t//9//GLrekjWwvzDz"
+    "GT7PC5A+lyIeCSR8GXDHXQ4e4EixjxGXAscphD1W2zQJGuB8EwsiKLOwwELiM1ftzx+44etjslp6"
+    "P/M3zQsU2EMmJswXoGbO2yk6tXiAxM+emNG/5af0a+bI/4rjaGLAq7VZR1HFxH61EfHEUInh4R9Y"
+    "IFKnTFTzzHrkyKRMiGBDZ4WcBjKxXi7GgpzjYljT7PKlsGApNJMViokUeed7gSZ9oslu0z6LLhup"
+    "SeYyCZgSYQT/0zhtuGlAeH2ueCsf5HaY6/cOJT6mx52wAVHrHCx+QdAxuklkSu/UVJ9XH9wgkXVf"
+    "VLvbpuVhcZf5FxF1Au/oliWXdirLpMeyGbeJgEQhb1ugPhzZlkCAGAtDkzdke3L0Ztw/FEFnid2i"
+    "fbU4FvmA1b0bYrVRJmjxH3Icnpv3wXlhaMrmdhotU4LExalnNS6oUUFttf871ZFR5v1BSK/UNRAv"
+    "Sd+J5FmmMkQvvgecJ68qD6YuovWxjg8USca2zlWZua4kAmnsiC1WM2ElVvNnVcLHEcTF4kkZw1Le"
+    "8W8yUYe3p2HIn20f7IVh6PVH3sj9R1ptsFg7Pq68U+DNoXGfJVFzBj1vFSVjJETX+O49hOqLEIzs"
+    "ZPrhNfyVI/EjrGdSkHUeyLH02EBIjlYPAfXVidTZupaGVzpJIWnpV3WxgPRPlVopzGvoRP6e+zut"
+    "4p2Y8ywgB0kp0ieaNKJ26W+GAQ28RQBC3WqVt8EcOy8qb8AoNvmiTFfq4/7oPETi/uyNFTMqeBYZ"
+    "B8rQ5FdS4+b8jTobv81p+GqHswmzHxsDHPWGaM+dth+LydPiO3sT45vP365EvPXJ585QtLk8Wjet"
+    "SSjRo/Hs5n5QDa1iZFn7/zxo5O7I7MJg8/Y6dDk2pkM0R9/Jk4QUg59TdRB/ebjDHbECntk3q5fW"
+    "lcisMdJpTp4xUri7KzTILeLYzblrWMDqiEaGGNCp1FxGHbKP9KtBQGXsfbbWiEtBQCtmuMbBdop+"
+    "6YY50QEFl1wkeX2hZvGoCicqMmjiVgv6kALyWUJcCJs/HUviMyKCm7XQxGWUn2rUfWMv+NvTf9um"
+    "y7yvtO1Vt1O92LrlBjJIRkroQQiGskQBmIvm+CCcOxP8TD/1i++UPibthJTGuI44HJyIgZJHbiEJ"
+    "oR22AkGgmBuivdruqtyvP7PXPuc6qEBwju9Rdqve/ea6255nxms9bae62zTwPxrNd4wJF/8KqT+s"
+    "jRJ9AZf1Pkylq7w+O4pCHtw7DjHor0+UwatcNnG2deDdoZA84k/OAoUGlTyZ00bTlgM/6xCFumzy"
+    "uCXZsGZEl0mVihq+OoBW+YgIs4kWisFyu5baHDMPwguJnG5NAd8raCsBgIKIRgUsuG97i2hjc2YU"
+    "WtQkMwSlDdht08fLhQrGVKLY29Xl80UTyE1nJkkyK6WnVAUihc75KQ8z6AbcY+1kmLHF+XfO/0/3"
+    "3lW9/8s1/zzqc/qsCj058pAlyZHqU/JQJPXJ1e+G9+5Lt/4cmXPvfTN6/vfZbPg3gzzmDkd6YI4v"
+    "EZC7AyMPlsHUN35wa5F6DMOcvwJTHZdiHamziXuAxy5mYYmYToYrB7VEg59OS/fBZobFoZN5LwhQ"
+    "yLupmxlMmlL34qkkq38TgtD0jFElQMwYJX5t0k4ddh99jnJEY+f0x48voFrjUME+hsXxfjEKVpQk"
+    "6DedahmCdom2yfRSE09JIKk/hOW1/lRUd6IDasfu06buiLS54jUJi7vkCjjnr0Ok6ooJIjyU1Nix"
+    "c6hpDsbHtjc26ZNuCiZKI1uPCmnb8qp3IkirWlGC6aQ9PPucgezBTESP8lNvLG/6M/6Vc2SLDlYM"
+    "NyxEq7oGPM2lJGeNU3hh1mBttYzaaLWMLHhpXyOFh9wIZCUt5aLYlI5Katma1279ilUHjA8HMVzl"
+    "6YE88AioFWbojM4DBSQlf9z5N5iVLDn4bYT80kMGMbGdryunuejhGPI0bcTTnI5IeZMpXJYzSfe4"
+    "FGrNtio0KLhx6Oc2rE3MyF6M1yN4gBOfoQQJ9ahJ9FOMmsaBTlpUosDCwxynGTjSrHiKTA2PIp3O"
+    "R9iyL85aEPlp/5BrY5xGCf5Vs/ePF/ZMPYcgjwwwMu5cVaXmnyRCZy8PmlJ2Mzsh6MCzu9Phqv8V"
+    "Wfp+2SBzqy2MO/5eSmafNJA59BM8ZnH7A61kYnG525/YpRnwB07EkraGWipUoTg1CIYcYHb7P3ei"
+    "vr9H3mDSOSjRzbI+TFTcbPPjBfeTnyOv0K53X6grdbUr5DW97uRO8q7WKLEZ/ND5uHHPlZqMDlhc"
+    "wXXzx94A1/ePrhb7t1euZt8QU1PHH0iOZsDgMYpWnD3/w4PC8cAHU/L4PyRfFRF35O3C0DQLFA8Z"
+    "E4C3q00b/lXz4EynchWv6V9Wa6OCMnEPEvfXu0NkAPagDFRN5yTspVjD5QjsElDs1bvsS9pAU7/Z"
+    "ZRq0xf0IqXzvXSDiwx4Y/8gZuYEbccjCN4672jvPEMrXjorR9ChdMRAplrLXaIDRdYW0eeyBenuu"
+    "FZPyhPbCyhO/XIGOqhHXIGESKFYBx1amOjMj0514oYf0Se2iVT7av4AOpXysaXSsojf5aEtzprLN"
+    "Gbw3FYka7d6r/XX3wDkRMJaCktSwuS98q0EVZY65/Mh+wRW9uLWazyPYA9phYH3BKGrNohrVdDi7"
+    "2HsXT33EvCvBg1P5oxNBX4OdAF5sFHK201TPwqC1OF20a7stUFiNDK99QXCGu9NhUocatOXsXLyP"
+    "y921f3fvZD7//qf/MYF7BH6c8cgUdP6P6MoXr/u976ez/24ef/4U/96n9874v3T993feP+k/m0gQ"
+    "OdBY8vTGZQcpN0EDNxgu2kCoGcRYZDnkkwcwEunjgxMXwlH5ngsEBxQtEGLzlp5JxeoTHxJOfzDe"
+    "pq1Ve3mTC8yj0MtrNg8cmYsthTXHXlatxJnAs7ar0whkMWTijjQjGY1M8G6APy+ZChKr0IRBgpJj"
+    "JyBxaitqCqfugTikffQq8+cm9UoudUsGQKjM4uDC5ItmtXAKHXx/qFbUsjxtyQtIsGE7Yhhw65dZ"
+    "k6fUQuawSXY/sZR/wqXh3BO3SxiEofcEPdPhV55AOmLvRZ1ojaXPU1Y8pFpTJpivhAmzk3KpSbqi"
+    "dKxHR8YB/6SMmRqg0lIdzW5LanPyMzJlxgw19Z4VgjWA/nxFBc0AREb/qLcsZanzg2njZ7AqN6iw"
+    "Vv7WUsEM21pOT1Gbm0YGTSQlk9aEbncL3jovCsQV1wb1xS3e5CfHlTHB31e6CnHfvy1yEZawIZQ3"
+    "ZKYlW7Ji1j6NopLlanqeM/vPF38QtWQGV0vna56cq1iUUyn39qClf/Uw2NsW4p5ciKcdQlKXbw0A"
+    "ZfCH1SQJ/IcowFcCCi0Rt0Niw+xYQcGmPmcKDAcAqiDPjqKLAbYWSSsHZ50KF4m0JPDcIYdNk3I2"
+    "xWL5XU1Ms2P8umfEFXa4EZR5Uela0HCvOggUpHF13k6gjDykiVvxK1s3E8eAoUVvQFL4OlnkNRWJ"
+    "heP+Y6IvecsnkvVm2GGUjm+V7bQHQjobGgoitjK28VdNhn7NzjfScB8gl7ZPki0rvZyF3nx+Ifz7"
+    "Xr9MJLp6+4/tTp+779Dad3PZefhrr3aoNxxdM4LGADmIx7CBMgcmxue7Ahmd6QN3yw5uhbHxV0vN"
+    "RE6kkyYGGKbIaX7EIcL9qmo3od6Wkr8wgAwPVa3aHBVlLKsTF0kWhXD9cYEuccZsxFCggnN7haC2"
+    "MSbWSTp0nfUjXee02mfVg0uUI5Tx/BPdiOg+El81oa+ZYVzIm4QEnMbcATlHMRatpxd9gfsqw5ka"
+    "s79qkXivNi5hx2DU+FrFyc2q+DGAz4I1FgTaGiiZ5AK2L1wNi6zduGhhKSp51+gnScQJUpMKwTii"
+    "GV+MG985sqT4pHPxYzTGEhSpWEKYeyG8tppck2cvhHV/CNLWJLSpvsw3cuo749IHP4K3IIiu1p/U"
+    "4FiV4RiqTu8a+S8WYg2s/VA07vvSJS28Lkjnjphz/LASvqkvd+mxfjUvd9NrbRn+gtJuZaykkrqa"
+    "SNbLUQ1/u+JSBEuHKN0c0b91/Mi4H/5zvf9tZ/8d53Pv2HCgkC36P0p0XgiO+fxvio/XTnx77nm/"
+    "6vdzx+8x9dXV//Tt8GM4sUBmsuIrz1xYGckdnXzxj4/SprBq031eVJQPcJBBOhb8vKyI0sb4mH34"
+    "VcR3lw0dGD6dLJSt4uhJf2y4m1fVYa0MFkIXfBt0+LuFCs7KhUP7zoa86846Imd86kvWBp9IFBC3"
+    "ibVz76S6H1aDs2QFWFtrSNzhTB2UMxRYukeSJFYiqoPTbEwXHhX/baFL6yro7JxcXGYcbP9cHyKH"
+    "pIH+zqDijxYRM3Cg6bjpiNL/DzRyRJ1ZmztgUwfLWxyqCPecOzMqjqgqNYZ0T48WRx1isQ6xexwc"
+    "fywVj+jCX7ufbAbx+5o8n41LZLNOT6B5a+MixRfLCJPHrDNHrV74sXsUV+ZOAlhoxpbl8kgaXRTs"
+    "35k7KxT90Y1YDBSAbftCHXTXRtZVFMOuTlpg+XL30AnnOsmyl4PcK7+pYm2AOn2qm2YDr/jWvNY1"
+    "FNSBdnRaMiiX5hDNTv8X5ZjhxW5HOiNEdLBmkEy3eIWaDJV58TB8cDMINhnfYcxOlyDnUz0HHDWD"
+    "BE5PCPPvqOpQezibRtNsdW6PZ9nviwOGC+mrYt7fSO8tKKUT/LSrlS0cECNBXql4cYIRS+PJTPPN"
+    "D6YlvtKS9lfMOuq/yswdbLc/ZZLJ8krZ/wsjiZY0wlO2KzMcGOEKVzOurEu/y009A8xfh8OY6g+8"
+    "JSMPmmUdr7x7gPbWqOsYhzvW8sUNAIo4Effee+c/OK3xJ8Ipj70nh0h+0mPvJ0DsyXrk9Pv/jR03"
+    "e+/3On7/rIndNTz+ZHxB/PWzCRpdfyLZgumPP5O4UDEOkMiR7Ox/BJw2k2TTqvpym3P8GK9rYRXu"
+    "YCC3XK8fuI3fLYBh4MpPFveEtDFMxpDas1eLApudKxmfo0lptAKIsOpHJA0y6q0z74tHt/hr5zbG"
+    "yqTHRB98UXZHOoExsiuzKrE3X+EQIqtRmZrgOqD6o4a6P19Kf2oYN2wcRoGdltSjmyxIG5vngZOe"
+    "GBr7SycwahuRXLrbcnKFNKTtEm8PNXhrPYcA5T6Z61ZuoCYFwPqcGDHFJb4R8+MgZ94qkMA9BEg4"
+    "3jZ5rhgcQJeEd8atGljwaJ9gfrvV9m2Hvvpz0ckbk8lka+8XJeLuYRjOpGv2nyxsuen34ojubW6A"
+    "f0gf0nJu3Cvh715ag8KAKZP5ixc2xNrSljSv1DqL9pmvrONarHdScV+LjPnu/hvI377t3Q/sObn3"
+    "3257/t+a//9TwD2FenRtmj7E+LALP7UfozRiDf2/XKj3/HX/vFL7v+/E8/dvPGp69zI7rOKL3P0y"
+    "f+MpmZqCwEGNBOglyf/ShIAAAgAElEQVQ8elGPkp24nYHha/iVmYu3i6dg+sqWkyITOHLeiGHPRB"
+    "APXZFhQlgPnW/fJKEXGfJdtK5qdWIbBk7iN7e0P/ybxkRxoMFD6gSVO/qHKxk2cEHlgraTuLbSuH"
+    "IBQAf2UcQGZVKCljKLE+OHLi6ucCmCbUj1XP/Kr6BtbQdrYwA3ZXBWXowJiLZucOByIVoc+BCrfK"
+    "SHD7izSPDD5hMJ+i0NxnwYaicCotm+6PT70i8Khx5k4TUH78DcuBDHjg1sIA0LJeueiEf+Fg/awX"
+    "9R1s/wwuc4BH1gNp6HLQJzgqd9hi0+bUbGBUFjD73pjLdzYmObIGuyY4o4pu95qstTmp0TwOAxtj"
+    "PTlBlkPcRPcMZXaCS1p2jTQRsfY/ulv/JLo9T4PmB/0IwBqNoDcOw5dKNQjQCY3PTg08g6xvEvRx"
+    "dtvQ4MYGSwmwNdQMSTwdx4rYrD9mAhgR1KJGd9j43GMgK1W1LpCxLJ2qjoIS8OqPwLizGDg/3czM"
+    "cvmdB12Fzem/kijPUXdWs/2HidXqBoas8S84NQOrgPH2kB9+xTyyFFvqNEvNShYR/Z+RieEKSRH2"
+    "XG88qc5bpJXTzsT5ubwZSveFqWg9+0y7d3eg1I+45HAsgfsJasUyGwpRq7KEbW/rhYQDtWtMmTuG"
+    "CLb99gb9q4lvPtlCnzdFYv6afMI5KvqifvNXbfPowntOfbLfPZtys+A5dH1Lwt1LdIJjD83efpX7"
+    "4I5fEXP3F6/plPnP6rH3719BVf8ULeYZkndHy7ih3KfSIbuftP53gyJnEEx01bGLhPwIgbOYi5J1"
+    "fjEFLnpO3JLA+NjKQMTjd2dX+CwKZuMTZHxub6ATZMhh5m/bM3jcvGZuec9i0WsvDjBz4tVo0S10"
+    "CkHV8nKJNTb5+QI+vnF8cPaQ3IyFaXOOqkHoicyDyro7XaeVEOh/EDE3Ny4igIfPW5dej0XfL1EQ"
+    "1UkQBjbQudcvXbWAjbU/+T0oorBWIO+4RiGnM0nkClTjJLDV2X2CtXrjmDh0AOeA9+yuNzOzw88A"
+    "JSmcYoL0KE7yovOoDCTOkXwqQGq1TKua4m2xdK2hiZXjDW5JqQF0F8IcQXQwIR2b1eCSks2thhsm"
+    "7CEni4loQ0dXTAr2Vhh0f7wbPlnK+csswFLMXX1Q1msA0RmOKlYHoYt43o1a7oaomNWI6Y3WtZtP"
+    "DCK69O4k4Smn14QAmYHNL2FH4+KtcHEX0h6nTnzufzW3O/9M3v++r/9S1vvv05BUR7dPqzRoBh8y"
+    "h9CRH48Nd+9R9823ve/rOPv/LCrz1248ZdB3ZGHnPHVzi5ITP8M7OYptcZuDy548sc9sLC/DpGfk"
+    "rHDT4NvsVm2p08MwF24lB1zmRW0t6bTyeLqNHDzZ9J7Cu5VaYUNBdB2Bj5LjoyGTszlXHyA2SKH8"
+    "qzONCoTswpNyuPNtWy8IQWTGSgwweOFzOvONWJ/dpI/PK3urx4B6N+ijD2BGeedHTjWFwV1IDhO9"
+    "sbDv/aYDCPeEOrV9WPRjcag0KGD9hlP3PBwqr811Y4BqEZhCQqxDp9RH/kIE12Lhw45ZcJPgvVO+"
+    "go3GZxeAXd/ivzSvh1vwVAfkQu9Ns3aUCMdljwGxu7uSAGUKgPeJgKUUAiSou+MZb0k/FEGUmwAY"
+    "e/MmKm4Ry3NlXXcoVGUgQs3hG+4wJZarQX82ZewEA3tl+OZ1hIa4fjW9DYzd0sLei9TGsvOU3w9R"
+    "j9w74+I4unxk39ZcCyRT50pF0/ic2OCcrQ4T+wWz7kLmMXPv0fLLVvueEwFqs77GdgK9QlTo1KBW"
+    "uFiI3l2Ihd/Fg2Bp5tPfssUCAe2FhFBmRkkWl82kfwizNt1nOSh0qSfRn9fAYPu46/wbKd8oyzZG"
+    "dMAI762eYhX9hTmYOOFuQQH+yjjXEAPVfz2skqJmOEzuCYGJLZP3C7QGWW8HttIBEj5kdfFFuRjK"
+    "y0g1sez0CSIujGx40Q4BLFa18gtMxrd23FEMZxD+zCli7e+akEkWZ8x7JYHF35ApT79/LFJtrMhi"
+    "yfp+NtklHD/OHvydu3Tk/efeX0FadPnr7t+RdO733Xq9nM5a2W+eH4041sAnczcDdCfMn4dfy9n2"
+    "/LJPezc9SxG33k3KeILOTUcTP1RCUszNPOVfhxfP3GXnGQ8T8nCh6RMWZwMXZD5rT60CkrbTkSfD"
+    "5LRlSQ8E9dqcsYHu0gLw5P1OybtTG5uqLX9+aof+Uio08Rf8CfM143UoyNPYpnHJRBFqOLCR17G0"
+    "Nsat9iuzzaVSxiJnniqhyyEpE46zRu8l3YZmDABWfykS1WeQ882ajRqxUzN5bRB8SRqBN/kDoO7R"
+    "Psl6/52lza2gAIsgtY74UOyRpt+Wf8ZxDjdOrYS4HUHGt5FJSPjtJVZUsBszp3ZlNESzBd522/CM"
+    "Fcu0QEI0CjwRjr0/SbbTs/K2g/hV93QmIecL3RgcECDxP0RyulSGSGk2hbqXOdVnxoDLAVSyY8yp"
+    "1PgwNKGKsrrbrjqazjcONTGQDbCzmvvzQhxvU610AcYF0B2Q1dSqzp7t65c333+vr/+ZqvetfPf8"
+    "1XvfGjEXn0dC4x+lITK6ZH6UuIwK2rG9c/8b0f+X//3b//Jz/z26+8+o6bj1+9O0HM5+3zAfXgXP"
+    "NtYBm3XqQywP3sGPgzAY5XtFN3YHvdY3J1sjghZyLNNOlFJhUmi5M8rMOt5U6qyPBlLZ1Qko82J9"
+    "LoZ2ojvTKth8JkLOhMYippRS+v6qSxkpmbTkzgoZTazVs3Mffye1v1s24vbnkjEmg3AeMFSNgtmr"
+    "7n1arRUSvgIJ31UcYHjJZH/6YOLUVjiXLbmq0t5DxNQtZ+CA9IZUdPcWGgbxsvXkVbvMaw/QY/+K"
+    "WtrP2xCmmXZ+xO2Zii95IndbVLKy4ES7TlIBGtLVODY+vkWF+ktkaJ/iqc025UkaQNCN9mYzG8XP"
+    "xJqAttsVOQpAwaWCCOrctDXClz0M8+Rd47JWC5uTT2g4WepLCf8+jns6TQ9kCPOtR3YRN1mTBleA"
+    "plnSJy21cjHhp2tE/FHV+7ASwAMgfmRRxqB8BnffgqXVH8bJy5jXV+hJaBaWjX5rRVpsprY2mlR3"
+    "/iEEoixyM3FmC0m7VMj/hiw5lGSbvzG2uE/jJt1B0lAQJKXVPGXvT5P3OfyupUIs3gN1ZnBbW0bQ"
+    "gUXSh7XmhKw+jCz/k1Oi+4kLqMR2WHD6OTGtcU6CcplFvAJ6nUbT84Qqh/cLI59N0V9MmRcBCx4r"
+    "apMiyOFGdlN2m4Rh9jHt2dQ74rQr7Q6Mu57rAMN6a8PdMFYvFKW+Dwh9A4r77YiwEaiCkpKwRpfa"
+    "jvjoG0SfUFEq7NWTzz1IyncMkTgeCn1/MCyXXGy818Vi7bzz7hfSyjLvA3c02/84UvnG6+8NHTN3"
+    "3t504//AO3T2/88s9ENm+15C2W/ERBNoM8IWTxlq/LxJiYlXo2c27qgs1nzDUmfJqKe1wvwi2hBW"
+    "pNMK394qUempstN065ThhnaEQ0ecYT9yzmmjQnAHLcmNEVu2jLH76DN9TU0Zd/dNgOD1iYwwne5t"
+    "bBvGgXWy4Fpq0S6NI9qdGYOCGt/tjoiwTUlwtm7oPk+DN9TEjUzbUHehJ5S2s1ow/8sVU+MFAX2s"
+    "VFobBIx05iJ5KjU+wH9Ik6mLY2cmUUombCokGxJwAW6aehmWfcH9LjhzgH2IO1cX9ikTZ0kPQlSK"
+    "lLio6StjdCwAl0qGcZEU6cwpyXVSIT3zOGiGDjGnlF8aEYtsUQur3l5sIDl2S8NBZrxncNSzUwtS"
+    "H5ReJaxV/5HRU6UQrUTdgBzHJDD8H/cvnUq1RjT+PxFtqBAVeh4NTCkWXEtDgaLk2uTiWJVWIiji"
+    "cMCBLl0IkiiTh6LRSUWHe+nvUjhuzNP759+/FffP5rn/u3EXuJeyQxfpS+tAg8CtmXFi+5n/2yN3"
+    "7mez78gZ976pXP/+Lj908v9m0TC5RBzuTMgOSD9rwqe76AMsgZ1BnOGcQufBGbieC4njqZrwhDJE"
+    "XERVeqThqmobRpZAI5S0Z/KupFFHtgS6psy+g9NlZgSR59k5W0uspxqR9/jgQGjeMPZWxYO+Brc2"
+    "XkHZljA5EmZfAP/hyLQfkyiVtjquOIlVLqqkz18RkTdQaktnlVFhIsorTtEDdq5QWDOAwi1TFo7Y"
+    "MgTni0oGrF0daIPNynIf0n0+IWq2CLM6rHntotPwuAIz0c/y4MCZM+hW9xOhZT8x9qMeG79J/Fmn"
+    "rQwXpVs+CBUNxFRQ+8LmiTK2feJzahINAjZdoBdEw+sDkCR3Djt3rgv7SvGx9aa4f4Ka/e0ltH7o"
+    "s2buubNmIPsURxEzKbtDVV87CcddcPfFhZpLAlUWpoxhewLjGJhf7QkCR2cuSQ72IrN8TRKy/gSd"
+    "pKPFrtWb4WK4uhtQU80uHS6Ja6p8nlCVax15bKF71+XNou3U6rvuXbvjj007AKZDp7gDiYfBtpfc"
+    "WIjrXVfs7Tlsr5yRlzLXUXF1muBeOmZew/+8BmLqAX/YcKlsLzl2aXeIW3T6wPnaD42TAWgulzv4"
+    "QGm4FNWj8p6wObuYyrLu3TujFyU1f/mFjwOsHAQpY/SKlZzhlR1aSBpsaoL1Aw58ROQ23IGYAR4h"
+    "swkXHZPk/S/DHxcHN/8gtp8tZRV1XE7u7Lp1uf/8TpQ2/8/dNPfO/d01e/J8KPZdMGHm+tZEOYb7"
+    "E83cnBe9Jy3+OtnyhhD8fb6e5Bz6bvfjaAmMKhdcFwXGDpzDmaPOBLO0tEDvh94UwaHPhpj2hLrz"
+    "XlkzccEekJW9NHxMMvVeHFEWiByVVHOqXDBtqkpo1N6+jfdlBp74HO4MHDzz1smXZ9mg3DwX0zkW"
+    "AcYEuR3YTIm/hE/oYbcNYPi8uTQfShi3gQi41L9XMmWqa1P3ljhG0XsmGSEwPkOdsKfqQmFpGBEd"
+    "XqLcba0Qb4Scgg2WSsxA5EHZTnYEit1nLOAY8EclB6OFYoptH+pyhjpR/Ac3DJoLhisQEfFZHwoL"
+    "wiiQ1ox1gM6Lmv16fOOxiZb0CKlHJn1LneRvSWxtk5eUkIrbrLg29r6lDMxstiBa/1xqIMjIXMNS"
+    "abfTc8qYpfg2X9YhswEDmOc7bls/mX7Rfenhn0j0ihs7HpJo7fHt37LW2kC7GX7l3f+JXn3vmun/"
+    "vKZ6/+0DaG2KP0JUfgUdi+5JApcP0D3/Ff/PtvfPdb/6c3nO7/2v37d+/dyWaB+xUX01tZ6N7Oi+"
+    "n+dg+P+jc5UxnouXAwqOdq0Jt3JoiTMfQ0OubBG56FMEc4x7aR74EFlme6LA+Ay1N9Vc/k6wKaEo"
+    "mLBChNY7IVOLRLnpZoWBPBP6jaiJngDXUbky+NfDWfhVkEZFFzvE3CQGCayojO6jr7t+CamlPqOC"
+    "G5bSy4KK3uw278Kou4IOj3MLBIsG8OW4c/+Mj1Ioq6Rg2x6gjFytYBBj1jQ1u6+KpyLTv0ro3l7h"
+    "msPZaubRjBf3KOgwYTNHNObK5q+9nWLY1pY7sySLDgBTtjszYVv5A7BrELSpPjKYQrfkgY20hjB3"
+    "VZC6s/DHusOF78kB+RytZnLlUZEzkvPjeInTPwuilFpmKHPHCbfBoTHjAwxK9GZ0EToarDF3QRp/"
+    "W50vhofy5Y6tiA7WsrmCvXjcHKEvu93AoEmP3RjQf2hE7SkCnXY6wrOc2+Wpynde5FfJpS+7Ftug"
+    "uu3kBRhVFFSJ4kNGMvRwRuko8sm57GoUFkxrD4R+bS9zUVOGK6fUK9ieseTxQ5akPlx9bgrv72wW"
+    "zyta26McS2rGftrtiZD3HVXj6vxuvqoV3lSRl+Uyc2HilncEQzWOmf6VMopQ8Odni0L85+gQNvxl"
+    "Wye8jn0IcYwxhhoX2DxXsYofev1wNEG/cULhLW3PSzI0MchfFAfLAwGZvsCP3LNih+0TdpUBfNLJ"
+    "KGUF4aQzduGEA9h5vaxJCfLGizkbP1Xp6a3UF3vp3StzjPIjo/sxp9PMXLN1xev3J64tVPnd5/9c"
+    "env/09t07f9HWfC/+nURAmPiMXeZ7O5R7o+9bY3OVzdL3PsRnJ2y7jV98el3GpZszkuprmsdN24s"
+    "jBn+ZzAi/yu8An9g1FyOcYyJ+BYD6YgyTNkIw6eBjbN3LxYaNrvEcGXb0GRI8t0c8Ai1DpgFwkwA"
+    "CPUerWuPI3NiOLCLbzFFMZtCKIJUCAPzz4jL/5p41y/ScWs7kMc+dU80VRqFKA5UAmx4xZPtOo3I"
+    "W8bChX2crQd2fZMfJso/L4rFB4Scie/ZJkvU3L2RyPmUfowD9yWsB4MNNehdJmc/VYxm75YZi+TF"
+    "Fq+naHTX0TRL7qyvjJIByE2LAWYFuo0yBdzLFVhSo1Hpgg/9DP9p5V6ecqGr7iXkq2YSmbQ63lY7"
+    "84adX3gh73ICHqSMcXBPokGMQDpabFujSKa8SZh3ITfo+Po3ubDri0yx+bjLmhwgP6mP5FvzA9hc"
+    "a9Ix87/q13vPlN/+j7v+l9v5kGHu0/Sn/OCLSX/pzCf6nFbt586W//6Hf8yhtf+ezPn155+fMMYC"
+    "YKizafwiQ43Ky43XBwYXAyQZ8/yFwNGOxMdt9mSDkLhr5yDDOTS05YvWg4iZ1UXEzb5v0GOA74to"
+    "Hy0Kq/YDR3kY51F9Pei35ISdqU+iEHUIzp5KycjGqInxoKfnjGIERITGta1EvJfyhN69PGSGaktD"
+    "O6wkoZvj3cnEQcFA/056gd6IRewZXBDnXRhi/5gwdsEjQkB0qlbiNo34NiymKmTNoNT3FALZY6Fv"
+    "yCz81quORM+/6hpDIPykO7PDAQ/bWdC+NO5csnT7STetZ8dX2x/bShe2ODPdqxNPwFyfg8lA/NeD"
+    "hewC/iYTM2jA/tHwDRx+IituPLtB868G5owPWVaoxIef6YJ9UkhFQIGxu8WjzKu+nrZou5mkVLJu"
+    "/5ptP4rd4qq4a6eR4rah7llJVhkwnj0vGNRF0nas8Zf9psDgo8SfRrcVI3dLRlLrLITt0vvCA2g8"
+    "ti/0Y2ClxtXKCG3qeGxFbInI5C5IkFdF5BDQ9x3Kcqy16jUwM7nOign7StTIw73Q19N3XwEE8Xg8"
+    "GuS+PPYktM/HmSwdvycPKQO5iiF/xi3czm6UZ+4wxs/hw2YaUeyxILfA1WcsZKN3HQkIcRu/RGmy"
+    "ExbZDl342pPMQaXuj4mzzmsaBu3KkW99LnslcW7PZlBC8SlqJM/KpNj2Ef9qvG+4V9DM0ODh2/5t"
+    "0eyKo3fear3u0ATDV5ZV656MN+no759ke+6ARfHKf4kz0Y9Rx8JjWsOdjwBSWbpRv37pweD/HLXn"
+    "nh9PVv+8zp+7713ukNT+dbLe+/UmUqjf18KcqW6S/e6nudz+Ll93zQ0adsxHLY6D9jmDp/kfUJIh"
+    "wONuBpaaoX8SS2cWvxg0zk4ye8HuiCHGz87dE24oCf8gWHYvth4o9MxqN9i278CR/5bibFWF3aDz"
+    "byizE2h8w2oVjgtt2xqs3YV7tWDxjb3x3HaR+e3Qz381ihEy9tIx4pw5d6Toct2o0PF/bZPrxed/"
+    "WTvoAPjOWnHNLSwTja0HOZsMVoxs+m+kS5ckJNGxn61CkmBDDawvmst2PmuKbCx98xRsp9nMWYe4"
+    "pEuJPa8SlQk9KBkmKxnDW2AY0ffu/BxH+MC309hJVxwXUt5WAe12ubajdI/QsxjGON/O0/YTwZM8"
+    "BWRQMC9KS+oIne/nVsIqdX5CsjpUCXbYeOhXwgH7xBRzH86/PecxDh/okK7Ri9lBuLMXmv6w4BsA"
+    "yB7k3IeFHq408+dfvnvvnrnvulp99wyitFj9JfJAIPz8y/CNZfOtk3P/vMJ3/8Wz/wj5968bP/4u"
+    "mr269c5abLYtWLLwuk/HgPU/igOdmcXonVTnjC5sxw8jiBMlncIHAnbOtMVCYMNI5Onl5QWgeGw2"
+    "tCTp28LNw6+ZQt5ODAG3tDK7n4bEqxGTnfCjkT1kVAVJB2IUPZyY2nuDG8GOINA5vgob3FnrUzWp"
+    "eIDRgyqThjVzCrozyNEXYrBPGLZIGhfTfXGpc6NmrbKD5rhJ4UQk0Cs4tz6me/KKtSdph38w0P8t"
+    "jDYnpl9B0Qmjx101kSNqXkUQ7qgXgg0byJfgET/y7INivb1tSXZ7g2W30D2H6uQjHTXpbYkT+U6E"
+    "t84ika/EBJk1GXq38wwYHvSOOP/YFMEmOc8TXVI97I1rcxOLzdBCpmWw3ABm5CvYzFahk294mYer"
+    "U2besX/KGlrXFOOf/Ytkm3rBft8FUdlzdSYiSUoo1T8Atsy9pT2lFbVV+UixHq5hM6KGpHQFvTF8"
+    "xDiGcbLn3ATrh3PMEVjBAbszNvAiyG3DpfH9v/5at2zuBNH4l1riO/Sc60w2sC5oIfOw56S/pSDf"
+    "Ex38woS8TXUuvpbz/vwmYwhI7G8tC+vB1rskhzTIWh167xb0yjb+rT4CDhf+eYei+iTMR9F8H6hv"
+    "2LlQLkyhit9Ff8Cd1NcfqMNth58le+S/m0oTsHpzxLjI9r3+Rp2mR8RzcxPeZYypoXsPY3YyX6sI"
+    "QcOzKGoPG0zzV5QO/nhYFbPBk8vXp6Ihu3qxc/d/ryvBPqx37sqdOzX5WN3FM5YNapvIhwlS9GuZ"
+    "/P0uHRjkc+N5cfFb/OF6TwRSwNU/Tbjg3dPJ7H4ngD4+URTsIQyfhAKe0aSjnJjNMebT7XUo9/3V"
+    "C1XDQQ7RHz4y2SEbTHfSFhUYgb5crIG8zDF8pH28o05oqlHRu0A0IO/5DLgT76pH2UPhMrkIfOi3"
+    "ZiLgayZ13gOGiUhSd48QHJVHLg1/j7sNzBEz424ytC+aiAkD5zgwN926CvQEprW2iU01u2N4dzec"
+    "k3pWy3D9fRNLy7qSLvQBrBC/6VGZtl1U+AkYvIHhZCU2bn5DSHt59HpJFrC/SWVRr9mnBgSQ2t8x"
+    "Loo6xs20FBZO/dI7WNXAgiR+zpo7nfgQmHp7LW5JzxiabRe8EizUjzIhA8w3d4ccTF5uPF6D9JV/"
+    "urfHatstRHP6XQHLvm+IFd+DDrWOf/lGkr3On6zvUrd+9d/8o73/qWf/rev/qmjw35UfYXiACz8l"
+    "H6C0TgOz/8jf/hg+/+8r/7+Ksv/mq+ufpVRmtu9V7vZtntCOYe1IHfC10qEM5HbHDjh7wYY1R4Uj"
+    "V54y56mLpY3gnn1B+5XlTBiQU5WMCweMaQbozIqxrgykJojYL3a24etM/C/HITd75Yc0FkEoPfXP"
+    "tHd/Vii1qay5sQcdOJrPaq6XzSdhFjQ/h9emkdHuxnQYVOa5qOtVqxMUMUhrVv6FhSa2gMD1jGJw"
+    "L5337YOEiUEw2bsKGyY4a6wNUfFItLH4DfXH9ZSMUW7Qpbb+TgFh/+Np/rtoYIxX5IiTK6KYHnBg"
+    "bGpKXBcPhqMCIDg/TKo0wsOKFjKxgYMfiIaF/q8Ext8pGnDS7kSMMnZik0thTGxZcgb/0YjranAh"
+    "80WVSNIg4yxkHmgtWzr0hYS3vtDYPWVb2YGd+VL8+Dm8vycdZ+lbe8OMVNjflB+/p2Fq3Gw+W1Ja"
+    "zhwQasusRbzHLIJK9czqmzRKOSuc0iJIuBLgS7KKjK+VpotaAbM2sDpp71V8+2oYukLZc2TgyMHf"
+    "TBKvecoSFLFSWTkHG+W28/U6w3420qG5cVRe4IANwrQJ42fFZmcGFmPnVzXj3E6QEYIJF18TRPOK"
+    "jr38xfQE29zm5t8bVrbbERvyFo2MHu2yTpN+gYEVuWk6+wakihIck5Cfv428Wd145xPW3lip1h9Q"
+    "m1uCu9OhZorjUswIPn4cKexV6eZFw9frq69bi68y1zLmbzDV+n21fXpydOL52euvHy6Y3XHz19+9"
+    "d/+vT889nI3f5sjui4nW+19O2W+TEfngyzwOQzX9rCU66Q/MwceqKXDV4s7tPWxgAvbct5k37j+/"
+    "wp1ZvnmX3CdCYEJ7RGJGVsADr58a4XaC72GS/MGdpjF7bBDC/18DB2cIdNJ0/sytf28kTEzU3lz3"
+    "oXjxxIvNh3IHR+unFDp7ppH5nUxXHDi86JG3bbtjLlV05/0n7pz/DrF+Xxr9cGfBjc1UuuLcSEfq"
+    "GPkAvfbL6JzeJUnjq8kdWGVFN/4Bi6ojbTTh+RHuKlrs7kZZNLbgRsw+/Ked2BI21E8JwoS0wWT1"
+    "Q2NPiA0IKUbSMWILBxI/48UE5OPGI4Y6R9W7nqAm/ELbVO0WtCgXvGBnnOJ9WKm/nqICyWdDEe5p"
+    "15zT2OFJn1f+Xb0PPS9p0olwagY/WsTH2EiqXoGo4x/KjLcfaGeaVsTl0vlbM6QhOn/jMGWP/wJX"
+    "G0cLt85e7d0yvX17/99jd/+T/9yPPv+9VbZ+g17VH+54iAQ/zPIfdIZCJw6/btV/7Oj/+X/+rtN+"
+    "78vVvXd3+PJzNcf/hxaX6ygFF/K6OcL0TrBaaTaqZNh314mBxeECLLpPTikZnARNixzibHjcfw7w"
+    "SUN/JO5gEGi4W/CfDB7EUnElywmFlqigZmHTV05o86mzFvf+BE3g2UusfeSmhTcWO3ODXCjcdsCt"
+    "GDffkvD4W5ePRSIJi+jiVdlJ2d1ya5wIhN1ZXYekMaeexOnBDb9t2QNj57kSnwPl2rdO1eOWlhc3"
+    "PZJlAPH3RVTRhU/2wvWMVDdxEQvnUFgEsd+2Ut2x8rvhsF9OwFWjM4Da7jLXHUNwQ1ZfsdNvQGYJ"
+    "UDBj8QHDT1lNqwUVdRCXKn3v7bhjPLASRCMdr37aPaUPlhSZYYZGxoP9griz3Tt+hr1BrbNVO8VJ"
+    "Qnz9/auGXqtthe8O2HSz8Wq1YbEcfd0slJm1Ne+aUdOY2XCd0rjzXWh4Hy8k5sG4SD2qrzJLTBqZ"
+    "0R3PkzgVt/aYfVt7hlUVW2tA7fAYNuVEEH/pinU1clDLWTaO4XfqCgfZRxFhb7aflpm2OfFKFiY5"
+    "bikTY2GDHmpa32yxSje707RCzgA8fatq3Ml537tmJH/tCtoTlrhy/elCLM0idI2j8S3SinMql6i1"
+    "c7imAM5FFjtNNcHWwAACAASURBVPL212zZctHnfgCX/kaIqy6tJtqECGb/t6XNaUTOWEIJD/xoqS"
+    "BjH7/adrwYBRa08DX2vdZD4y2Wvs0zP/zNputmxsmtvJ31+tU8ZUsMr/LK5I27L51Or76cb7X83d"
+    "O3v/3Tp7/x/VenZ5/9o4BmUwcU+nmbJQv/e0+lysHv1/H5rmyE2Mxhu+MqPCmPOTXMRXpYk0vfRp"
+    "3jutEjHOHhkAGtSTkr39iwuekTW1qJDDn3rNaPHHtsA4O5ge45KMOPfu96qVuGzvV0jyB4X4UXHW"
+    "C1jB3SvB+1TXxwOUaOu+oeBy7tofv2Z21EX2nQO1eob0p5bIWvNqFzZMzxoTZhm/atvakrt7bSj6"
+    "E1Hi3XtsFDl7zop+x/8OG95Ae32LuBLudZrvXFS04Qg7/XZ9r5U1698CTpL1m9MYb46dgYmcjNUB"
+    "n+sUU1HUPtMwBpQzvXtpTzmW9jwNMymYZfLgDGDuvIPYwHy/IF1W/BxbdYapl1Sev6N7iVaOQxHh"
+    "5oTB3fDpoJ57dupt4xGRzeDg3TRep1rgRlL9qw9j+dBuhhFvTFHtagm2ThNEFencTCdVKurW7mMC"
+    "5H70MrDw3fco25f3rh9s2rX/rg+97zr970zFXew/0ovRYR6Ih+LZD+EmO87U3P/NGPftsHf+oNL3"
+    "32p67u3/90J0AGuN+qyBOyvE7nxTz3OybITAbWFX3bWeklZ6rnwumNkPHv9G5wveAFiwuah9OeqR"
+    "qg8FJqQrfU8kXGzR1ysaMLrXCmXjrzM/wcoIx9XFFKgZcLDAZpVCZ5liSUaSLLCVkXYCU8cCGAVL"
+    "uRSIqPLj5chFV3FB8ewHuZwIaifZzXxtErb8o1JbbQnn/qq0fEwbU57djbxYOtwnCCjWNjoWWyRG"
+    "ispDRwiHwRv5xjJ/5snZwxstj1Beo5KRaZjQOq65MoMmITNA6eLvmkqoxnOfow7USm8YehZTXWyb"
+    "NiW+d0YZKychEv2nPa9uQupLX3ghy9XYieda8PFdUq54fQngAHvjKUH9xQQ4EWv+07xvCM49CPeE"
+    "UeHZc4yJHkubAdVzgc32knrlqxPEqd/ZqqNmwZzJh0gY1vqc8ffLUtlMzBlqvTza9G1A6lUpdn6e"
+    "BIg2cWIiosLnpMyaa3l4LmNmmQJzFKrdjGUh3yn1tXbzlzRm8OXwxZn5GBPumQxmbakttn8ihkHW"
+    "sv7Vuf6+OidMy1rf5WZmUnV83KDCrVM8nr6sP+IP1Akr+C+Ogf/ZDk+DV32XIxj9OefvGzjMerd4"
+    "sc3/V/QhTyRKWYg8v8XXwbctLn5Lw4yLjkj3+TxYv6kDvyqdQHR3MWvjf4Ah3jz/0lmzkWsay1wn"
+    "YrvzHHuvxGNml37rwS0r3TU/n83Pvuf+z049917/T+r8lG7vFs8mJHv5Qj2d3oztsq+a25U37Dzo"
+    "MvQOHbLvliFD9HF3A3d4z50FiAE8v8m1NwUU5EwjNHZkYNo93Yjyx+gCNNkJTBziZSejdLEX6QJz"
+    "hgg8tGoJrIeYKWIyUC4BMocdikoNugKIdOZMtH3na/GCf0XjWwqXr6lK118WN75cOCbA43otFX+s"
+    "gan+p5EJP2bp7g79tWw7ebKuzbTePYitfaI+aUta/l6gWDI9+76UE5Ypwmpkd/WKex8tqw/j6cwz"
+    "updlSmuIuR3A0zkDMYGQ/4R2a59coBmHoad25o2zENaIMF3RScMRmDu6kgfltOzniOLG8wvpujT2"
+    "SxFlnVmO8JnWFPOhRWDSRsIk/yhRwZ24NOGxsgYkPSRXyEm2ujYnVezJyyD5pY2hjtyb2eFumB64"
+    "ZxiSFCjEXLP+wgtmvZbGK0h9Rl8f5KBeqoTa3x7Bq2gsWmKXVcGzzvc1Yyz/L5XN0Nc1TeuX/3+t"
+    "f/ypue/fkPvPvZ3xY0p0fpLx4BXpJ4lF6DCHzHt3zDf/zoJz//D/75b33ya75w4/SD+dbL2zw54m"
+    "01zIbrjOLjd7WcvR33M+u0gEnCZGQiMG1YBHB93oUQCz/oXlTgZbHOrjCJOXSedEuAO3QWvvAy8+"
+    "CPXbyaXZy9uI09i88FUNaRA1J9wx/bfILkVSM2k4PP1YF8UjdMkU27rLEUO7CXGzOL9SOVoVghwt"
+    "cLhxXL2hzpI1Y0DQALcjc13gRKB7J+JhbB4+1E8EM3Hhfy5UMuHOF1sws2zImbdtdwqKOAAkRFzH"
+    "uqv5UZn6u0+PK3L8VHKGMEvcOm/mMzE2K1LLoCrVwWJxgr59PL6Tf8A5+kXeTp5xGRvragq3Eomb"
+    "gizxLIFyxgKJPyax15dY+eins2vo7Xct/PV+m5CBubYHI8g5vU/ljrGAsMr/YfykPxbRx9K1+ERo"
+    "56F8fF8RxZ+LVP8NSlxcsAGxt05mB0rlZloW/syJOUzYmqdsqDLHU4OkaJxcamoNUHB7y+JY/Fy2"
+    "hk+rC8MCSeqI9NEagZl9aBHiHu90Ou76H6TZBBlk5+tldQThG99B8Sc6vXB/QFOEpZ8vINk5SBq0"
+    "9VCK4pmWPGSjj4RkrGCzqQmX6huV+AAQ4SNX7Q0hYBmZBBuLarRyzaR1OKtQVerifQ1SaPRe2Cr2"
+    "n7+sBYeoK/WGC0nLOCAdGWxgcSB5ocf8zdLEi9XsmPT5tSHhvgx2dtYNylTJTONiHDdipt9JccSA"
+    "Vi4jyei0m7stHJ7DSuGpdbu2JSbWMksnBlsFz7hQXdyNzLD4jz5XK34j9z+4ksvm59/qXTGz7z0d"
+    "MPft/90we+Pm+zfHxeRL/iWy2jwLdXBotHjcjzAh/fapsvQXEzlyq/c+ciL/znjcNEgKxFPMB4/d"
+    "DFVkc2TIyH/PdkYWQYF7SV5jhJ2U2Z9xX0FhdZfgaAGJabFvqoGwdq3RhZqk45wacxKbqMNeNRAg"
+    "05KixFW7ZOnnGxfevlfbD0eQLQ/iuioyZF4sV45vqwNnMtqS0Dgu9iVJayLSjyWleT5DGwodsGF3"
+    "1eHKWIG7SFNDbIw4ccDTlUVVnmdWZ36SuIHmMf8pGIV4ELA8/gyUOZAVOeVYNFPIni6VR/Rw3l8I"
+    "TVfkzZKnQwk8mbQuhWIeVgzZPHzpSatBMO7hU3MvrzO8JsmjIv+lQsOpERRITIk0+Z3Hq1yJtYHH"
+    "3FUz50ZM2GH3ABRpl/+UpMhdmeFLyS0MH9jhxyZaDdZ9MbOqS+NRaJ8smcExS0NlEr6hCqJzrlSJ"
+    "PxRTc3WICRwHaK2OCYmTZtOvPtNRdmX1dI3gcaeZDhlxIBwlv/wUkxHZoXlX7vy5588qe/70Mf+O"
+    "V8TDqvFD1Kr1UEvH68VmB/yXHu/ej3fMuvvuXm9T+5+eqd38rYzRWqCyHG8t1MkN7sGdiMbLJMOy"
+    "a89dK5WTuZaM+8gZd2Dtr8Z+KRmFeTU6bGRf94m5K4ZXDRRtFU+dVz0ACjicmcpF0UR7f6scWLlC"
+    "y1NfyLRb5l5HzSWFbptNVf1KQcrBSGo5kLysHBJH2HBzuk98KJnLqSw1O5CMBrdr7A0p7/hsnW8U"
+    "/G2tKnZnOhSyyN47RXFn0Al9+Ny2CRwWPSnikn00ZzLtwAxBbOI7A+SL8wsnILesaJqChuFtK88f"
+    "GCTCOJm9GkRQCvF1s0FWP7kvoeisVM5chjE3/gry/yQk+hJreNtxrjoQfBMmDFYIO8T9Mql7HPzd"
+    "+byyz58ttXxxOr4FDmN7HY6OBRIYki2KGNn+3fzhEWQfU+DDoxPsCL4qR61L7uk7mOLRv3dCFbEv"
+    "4OMcq3yDwGo3EqJ3GCU/8wNEmbzXOC3zILCl0JCauVSt4Ezh5SVAoNCGI1dotRDSJrJm2DOPbVlB"
+    "CTgLq5N3H5JYuL1GHPYNe/8XP4nSPaROyVqnzaaTvGS+rq89qBMDjoAzz9EN+xW1+J1MTPZpHhLf"
+    "4RyYgKMfrP7aHieNI5dtTRJfk4IQoG1yn+SNo8fIVJJYxtLf/CsPjzSCuLlhnOqqe8i7IzPyYUyT"
+    "GTkcpzAfHHj8Mm7W1fa5hysUNbmq+9bNs2bb/NCAyZayPt2YDlCcy902PZ0OVJGjaHyhzyyWIWi+"
+    "RXr7x6evKFf3f61nf87ukHvv3zp6e/PG+1vMWXnrAZzEbxOp+b44mcv80GzQh27Z9NHHs7NnO+Xd"
+    "UxHZ7ob1+U13joL3ZxD0wUiB9YLv7Cb5hygm8DOLp84qnP5XfbunHBonmy5k8vIBM72pfRp57k2B"
+    "YZ6doZwfXFfHgeKFdGPn1qDB2/fAspNgXLujnxCQ0MddBvgzs22jY8jLL+MSbWHtxfeeZJD2Jwlk"
+    "XH4tLOa/VDk448/NA2b1lbiS9kTgduyo6b8LUzhqk+6MeBBS8AY/eBkbgDS4rfR5kSlZU5bAWjEU"
+    "AEW/jzyqawJZvot2N+ystp22UGSowHfILNVJ7rvAhxnbF9b8Yg+ogM9rkGq5KK5AwkyXlohTnagz"
+    "XIHup8yMa1bn2i3nkaQDDO6OrgtNiakf4w7vTLxHg8PfgxCRzvbjaGskbLVSt2vpmnH1iKFROmWB"
+    "iF3ksZx0Hc1OtPa5YRDP7i0cK1z48d5V0BxOM6n8+d9dWnnnj8iZ95/mve89PvevsTf7yYj/LXJg"
+    "KO29cG6hHKm5689fIPf8v7//c33n3hl564uvkFJlQ+C55rIhey/PUOn6dETMpOsuYtM2Wob84E2A"
+    "U40WViyz+hps5MIncZHRhvzqx+0Rd5wFamF+DWoS1dOPiYlX9iqh4NW1xYwRh+n/SI8SBA2ZaLtp"
+    "bnkqJ94DyQ4k99q62p+JbV5Xrg98qETMtgyEN5mdNu3FRwYa+xq9az+gsc5WslXBOB4qbNOjcoFs"
+    "S0Y3NysQZQvRflQxiBVRo5ig/0xdTFBBceRc72ExMEu4llQcwFuRdW4GmHthjoprxtyIK5OG2oH9"
+    "D6F6nZMKx9IlTQ8bWQ266dA3aVV/qrseeOZTioR39swI4aUl2Inu1sGR18Gx/8y4714C//ykAXHd"
+    "5LrFEDTR7mYio3s4HER6YMcovT8dzYo4OE7m2vLZGFeCTKq3+WU1kk7HyvzMx9nRIQ0AMHG9gEHK"
+    "/Qp0+Zt/7Gc2w+5plqqw/19Jf/+JVECzdY7bmwERu6kYhOX3LaOlJNSoWvvnJtYa3eBYKxlQ3fY2"
+    "XeXoi1liO4v+tXjIvbC4JJvOWPXmNk+E33WZiU6xhxaQVId+wXlqZuuNJJF66EWtAuE+krSGOpdv"
+    "FJsVmUYCMH7ceBDau3anO2UCpnUiKQhYnY2fTUV95KX78XAdscDxGKpRit9IOn0IPKZaMv70Rau1"
+    "dXWlUKHzhgFm/x0aFIzqubvvJaMPeMpft5uRlPRCO/KheZfnbuRjZ19/L2SOaR940suq7u5ItQPv"
+    "cHpw+94fdPf/Mn7p3e/dzLp9tPZDPHynaN4Zsx2dDND5LzO3Pd7PV6yOfn2gtYgU58Qp7rkyDJGp"
+    "v1KYyTEjknIwgjc8SSQBBZZGPDbjZSg1bM2KC/9HfjtD9Nog70sJESIzL8sZC3jm2kyGkrei7trX"
+    "5skI4tOc6fI6NnhzZyKw9+5yOYZ1zMQYZjbSJO+IJt1RP+0amPlNF9yAwfdea8sTzLrA3Gy7if9R"
+    "9tQBx2oZ8YhTh623cjF4xeZR6UaQzhQXZjXCsPPcHsZxLBpn81FqBJyJ/tsy9hC639Tk4a24xF+C"
+    "XCOPqELnbPEfF6eJHjBfMm4/UuY5bx5NgpfvUMNCQTY/qLE2ZwXeUg+eIlZasrMX3WCZ6m8q7Njd"
+    "+D2F5PHiSlxnhpAkEUdaU0kLaPnqWRaz2NOc73smI11vVPDYNFK7bxAp3XGAjRJ8z6kromWK8Cvw"
+    "Ql9S6Rwn/Xz+j+m/e+820/9a0ffMdvBYVXiR6l1zAC3CsfpdcuAve+4xve+zsf/6Pf/x/+5X/4xH"
+    "N3bjzz3S/mx3h42wDJp2S5ZrCEucuFLP+0MLGY3Fe5kblBcOIxZzqjmB5ceJyQ8DpzoPnv5KJcdo"
+    "gjd9CGhYXMYAK55bCJz1TmD3ovNrTEJnSXZZS0rk1whF/O5Cza9/OCvYlXXl0yRcOIi4k+dCQe5c"
+    "GCB21zU5GrgnaxOY4OPcQX4qFtXJypIp3LDzeubSdPsmqrVfHg5+Ar0sHyqcLwygUmtqXCxawX7N"
+    "QKiaqknA5SvEk5rA8kfYMzDYji0+riFgW7to+tYMqbOvwHHO2JhXXz+upbTYdRHHSElzJ/oiC7hk"
+    "1+qXPl8JNUzSPCeMUW22qvNmIJ/zQrxI2xPh660uLTPSzJGCxb+jF/2pj5AAYXfnAuX8SAF7uM36"
+    "X9yrJIioBIOU88amqswV4BZNFA+BWRThk7mvqZMKwCkXmKn/AsR20ZdjPswt763nb5R3efoFVi40"
+    "ntQMQn6ujgP8eQUqWNRUJtcFMTBn8fyRYlz1itzniNbCGhFtiMt/i1H0WPsuxLeDuB2lLUltpQ/T"
+    "WK9olH4symRtt4EcFFUFpVyeMZmrC+Y6H14qclCYYmNNTPtAuAr6HtOAk+f/lssuMD/j4DLh4/DM"
+    "3lrk8rUk47ejWPWh05q6zCcJyTZVnr35lZsFaX6SymXuEYuONT1XHtqX0skuS5kKPo03WZxl+Ia+"
+    "tgOc/BgZ7/bghgvEzBty20mNHPZFXnCEUuY5x7SzZzbm6yIcsWLn2ezfXj/NROnrul/cl81dxj9+"
+    "+e3n71u6fv/OaXTu9/b3737/bdfNdJvuyEz8mxSF9ldlL89LNyjIFsivg8HZ+bC7aHm4e1FSPHj5"
+    "BSaiJ0NFljrIOFGjCg9nph0fjMGIwOBMExPgNC2fE083pxVH3QkOyGBfS9puPSOdXWjWRHM7ZBx0"
+    "AovXaYT10TARlbi3cGrq2FEStxtwPGW/z54gS1GJ4njvJt0wrqRCrYGH9nIozdSEBTMifQEq9k6+"
+    "e2yJOnuX6DKXxhgnufCmZmV34dFoqxvBsuQKMIUUGrVD0WOc21QtlUpSPQPu4VGHoa5IFBpuRTsn"
+    "qmt4oNuUqkYsulrNeV4tNvJDZyvtCRJ85O5dDWJBkELRH6NvY6j3kw2HKU62fGCEYcKTzhbbyXCC"
+    "d0/sE48zuWw8zm0HsyxqkKvqQL9pViVF7er8qI2HKEkiL1xbdnowf9cC1naygZfQOG/abkXIuVIQ"
+    "b2E0/58yAjtvYaXnvY3OVa/bF3vPVN//gjH3zPv87I+sKgPMpewwg82tC9hsEE6ok8pfvx7/zwL3"
+    "/iE//z3/+/P3f9Va88duNrvWFw4U5iLvAB97wglIGfSg6uMW7kMgm8V5Q1i35uIJ09nN3IZLLwxy"
+    "KHa8VeVGiH3npldjHZCw6gfTum99nBtW3KPBbnhrqYlpmwe2XUiF7Yd7Eb0HCEh8mc5FMiS7GHCx"
+    "GYyReTfHkP/xANtm0pHnTwgltZLjfw1TeKm3YDwSP+fWpjG7xjF3UjwOJ7aOASdzZz6qiCUVF/FB"
+    "ocXx0NTiOghgN+uNuWeIkHb2RXH5Km6N+3o9V16L3A2m6VetmPAnYklU48YvssgLav1jZ0UibXbm"
+    "THD1HEqvZxWF7wN+bajl0Qk8zFTRm40Fbv8pRWVWOudsC9SPaXAnKrz6cV6Rso8K0f6o2P+NyY4k"
+    "/L/awYEqlzs0tSdhSvPrD8Gx4Zc9oQGKs1tuCOWfsN2BzoAk+aAPTxLDZhSNtlHIGpHH5bnBPC4D"
+    "Q/Y0genkrsGLrn5yamPYL8gY1sF/nVL2aaaMdf+WAk0YgYMYivLvyzk7M19cyAXB3C8CelgzyYXp"
+    "bA4b/2AI+9XsuIFTISKaClIF5KKlqStrStqoNntdc+JMVlwE1yyYjc1F3sRMi+QTgHbYosH2RoOV"
+    "YOcWkZX2KEdxPXIHlDw8NzS+o1MIMCerjUF3vOTMqg6WF9xc/1O8aJC/7oWNhaFWnGPQLBdayHoT"
+    "JjJfpUIBeTMf2YMvZoS7gFZcHKE278zIaL62T+7vP7UHn0m9+COt2+vnP6wqc/dbp6+TezmfvC6U"
+    "d+6HR641s+E8y8iM7bTK6yoWOBnx925/N2/d05lcc8sPv5NBZyGMUGUlt56yUUbEpO2xE/yyGVof"
+    "xyDCmUGOB9LoWk+rXXYVzzyyLYqOkndWRI5DAk43NRkEgWWtMeYtKW2jV9kYrM278H3uLrDx6Ofw"
+    "CnTxt3uJFP3FRFH7e6LZCFCl0dqQ/zxIn6tIhxbocuL6DiipZychVBzIEPxzUqtpiGF9vGc11l83"
+    "fgUhoMPNHX1s99F7+NVeg47TUK7EEpqHVigbSkZZiWZpHjVSWSWGCGXwLnkdc/iQ+dkE2s9L1SCH"
+    "csUAcPwGJZH3RixhO6+xm/vg3ZDenyrRr0c61NHVz1TJuqEy3ppVUVOld+c3TN+gNbBFymRsknw6"
+    "HvtR9JZIqJSPg3kECkPdnB79pJ2rkHUzUdmGeh0NGLfxDnDCCoqOKPhSoOlmrR+0jsgAqukJn7/u"
+    "bkxgc79RP5e5++uv34L3zLX/v6X3j69ulTgj06veYR2Fn+mgP/ZQZ849PPfO4HPvKh/+VN1y/+1J"
+    "P3b33+Vm4ojHhfzEzBxYNTJeFn0jAxcjBXmRjk/NBrF/3UM2FycCNjAc00so4sAplI5Eyr4kzuzb"
+    "WygCLH/KJMAmNz5MROOxvB1QEvf/KRY2sqUgDjSGU3AbSRKnO2R13wXiRoe2iTumqXdHCGx01xyi"
+    "Ac9gw/tpN2M7laSq8M7Y07paSRubrFK7XVAzh+rRw86DeHaYDJ9jiI09jowHxOYqQK9vpDq/Zqxw"
+    "BDJEFD7yR15cTFeqmlXfDRHrk9ENUWWLwh1I/SBxge9be+KpGD3vHQMorRrS9hdIGJGHrzZ9ucJd"
+    "IAoKAz5uFl0ckNIomeMR7KSUIqtcppAwvrSyjZahM3FeR3c0z5LAPPYF74gm3qxGAXNWPj2IoIYw"
+    "0cypyxRyhp0ybPxfyNnX9S0j5RKnfmAdlXcgwRtabaY9iIgwcLVvq+h7bNhsMPLCmrQ2rC8aJ1IV"
+    "B/4wXxEq89xKKbVF2V4bz9ThvPcR5O8PgXPQMni7TYpbzhoD9GY5QY4kjeCw8vaF3KHjrABJ1s7K"
+    "s/oNdu2oyBTOv3gSAuvnL58/s6shgxdizeeStZ5JXyBCp4nPaoLpqRNJEtP3hihiQ9J9vKehY4k8"
+    "UfIGKCKtZIlIyQulNOnl7rwxXagstc+2L8IWVus2gHpWvi2K5tmTfJ3Wix2cpGzM8JMQYm+Deyme"
+    "OaeDPfZnn16qdPz372t07f+faPn/769798eutXpQMfAzsG3XgieeKWp28OB5/W7RO7PMVLf/oUcD"
+    "83lw0eT/OIEU8B2WwZf33ptSPITdGP63Q1+ZFC9wULHDe2tOJPuRhelojlCrIpSUWe9HUZuH5AI+"
+    "fgNWzsDc35j3DnVRojM+WjrXycTeHxRRQW/jksO6ZWx+KBhUTr4PI2Rjej6lj90C9k5UOW49IWYl"
+    "qvz28/RxYaCYyVWzzISyMe1UUu3X5KOzZKW/rQEiPHJ2MAfP70m7z1Qza27YaqcS1sGO0+bUPPHv"
+    "Qp/QWmPtB2kVKVJWe7nyZZkOnB3DgaD3GInRPkeLBIzWEMTWGUZIzmBYvr/NzG9f3HIsET5oIh2f"
+    "hRCFp80YiHBqsWOl65FzGya7MqENQGMhGLDj90SaVz5lp9mbx2Swj3tD2c2zz9bBvlJMotEeOUhl"
+    "7iRCY8XAPUWuZuykLoWOVpW83kulSMYoHJx1/o46xWa9/qSe47SqjfP72STfO/fu4r3/nfv+/tT3"
+    "5M4x6dXpcIPHpC97qE9XT6xq997uPf9bt//Pf++W9+7H2fvH/zh+7mHS1+y5bvb8oiKbOkrwLPLJ"
+    "qJQI2DDd0mL51cRJjQTJQ0cJO/J0ZqNs1km0l8fTc6bJrJPDJVk8k8izt+WgFcbkx+5gkd+c/leS"
+    "ZpYNRda/aJAu1hq2xKPN3TDk+1ZRfc2sxTMFZYMWAuHy78wDhetUqZS/XDOFw41JWci08jAFToiU"
+    "Nxs4TIxYWLGC7gBO38USVm6CbtBbGgkg46MgMgHxIr68ZoMM6yKgP1AYx9OgqxNrW9Nte2tWNpAg"
+    "y/aiIijzaJlDqv8PFKezH0CejC119uPP6fY4X0kNOUxsFcG2xveEYnFGDG1uTb56ga1kPPYYB6ub"
+    "gPE3m4dxNnLbpp7xiLBsYFXNKnnEUiSfskYYekYreYMRSsbRhaq9XR3j+sq9ssUPLPxgN84zGyxJ"
+    "WELUe5zLWPeSMPfOgoPxpqZuuciT5pefYFB4l7slOY632KcF6gBQ9y7OgYLpq4OeFXX43t58RgxY"
+    "K+JRadCq+W+g0cC7FggoPqzFo/n0dIQJ3MNrjGKxrTnNbIXNLAIhEGXwgCKF2nJAqyefCvbPIJgg"
+    "e5FmKPSjWgPlLvglto24NkMtyIgBdisamc05ikrgdbRhUG5okC46+6ARrAgcF+Y4nitNFsMVVyzt"
+    "uvxMCYXowFOYCVNyGJf8jtWLeFRjZVsYSxCA29XiY5zXWXNaI6aI8OJaKTMmOfMLPQZvOEcF/4KR"
+    "6fF+MzczxZ4+tXGNNem8J3i1/zzZO5x++8cPqyL/z+6QNPf/z0d37oxum5t+cFdMQZQ36rJZuJLB"
+    "Xwj1clKfObc9h8N+UshvNOzbTTG+eXABofnOTALjNreAr1gYQvKI6anipn/EdKrPCZ0DdlN1eU84"
+    "+Z1Tl8IaKNQ/xp5ooGnxsRZByDGRXujJEFrMxmULRx2sqhwl6DQqczjkS9/bR+0arJQnMK5UwQH6"
+    "VY2v5Nc+pSgs0fFPVEttpis1CtnSWGFf4k45Iin2NlzIFB3Gxbu43B4KBmZLHJ8aCtWLN1gIsv9x"
+    "S1Xx2051/lyKktrCnRf3pA3lIGUwVyZrz0OhA/sQ9+srSdlySVrG9nO0YRyipwFPA3eAGRO+ru5k"
+    "tRfNtlNnQ3fPEdW8DFTBQus5KtwxE6dvUFQGCxjFQ7ugaAFqw1DespL6TlbQSLvrnQDVwohHjHun"
+    "qQD2glBZGTE9ZXaypj+0a+7ZUqrWex5hrEZ4Mde6IgAUwQ/VdxbSE2fBAbe7ctOc4C5bU9j/Iz3n"
+    "7tXX/ljejNqAAAIABJREFULX//B7/pvf+mmkF8lF6PCHQ2vx7IjzDv/NhHnv/1r3/L4//tzc/88b"
+    "/NHHmFSePrbMn9MD4bMqYkkyEHN1uPxM7FWviYHy4s04a8G7ncaOFHlAIYtEEi0cbF5PxK+07xtn"
+    "uOLOKdyAKVDE4A/AsO3zBYPvgpNafdmvwQtYLsnKDl8IKH9GV5sGCWngU8uT7kVGx8oVKb5IU/vs"
+    "ELz/rIQhjZxjDxSfk4wLhIyJLIWqoedUEfW7SHWCC/GJsjmGN1rO2LvWzoeTitzQ/Ti3amgrUH+r"
+    "FjN3NwscHEAOi+ig9RnzylOAaSJ9FnJDDcCKVefC4D1SVHxeVdfBCUn7ZGf1iwa/8mtrSEjLLRMf"
+    "ghsqjF5lpTDPhI2MPGR7sghAnfXAinrJyblfLiGqIbJ8ro7VPJjgPGBHKk4tfaEkLjT5DBN67lvz"
+    "RyMZSjeTEzHqlqw47N4BWzOd756q3GieDpbA/V8CL/AIbkQ5dCo9c1/yya2oPDizXo56Y6dtDntS"
+    "dQYcOXtYfP5M1sbm585RLwwJg44UuKSfBUB7l9A4029FJQP9n0aUhK5VQ3FgMe+EFSrIU5s8zTzv"
+    "iErfdwLglpZr6yKxzaYXPGEmMdTn2e2DU4jK00mcaOrQ0dURZt6EOvT0otE9zaUJN3YTcOiNO4sn"
+    "FwQQaN5mFhKURa+XpTgmbmRG4k9eHM64Z9aGBjLt2GP9xV4HSrn8Y+IQst70aAF7uvspG8un/n9M"
+    "QpP09w5/OnN2dD963Pv3r60PN3Tk8+/WKYXhWjxmXzdgtD8Jc7WDaI90J7NfndYOaLVXgrJxs9n1"
+    "hlk6D9sY9+xzr1hojJ9E16JXRSbTXHCdLYuH3qODr4hgG/QkMf+fxHFcJgr+72m/Wha4R+jKqUsY"
+    "gDH/u5WuRCy/gpP1bgI7p40pYyvtHufE1OGzIXT+KgEQPNmjJPpsBSHzr3SFwaAnQDhyw5/PWz8Q"
+    "xt/YTBA5vAwi64az91x18oAxbRsRO9yqBn5JGV1raWNSK8+L8yo8s6NhaTHPHuE1swbqqHhzR55p"
+    "Vjc8nSwZV5OMMjBXoT3p3jdC4bk9GvPTGkvkZOgZzIzShENobeyxM6xi9P6nybs32LDbDmb/gvzb"
+    "RclhoFmrErF2c+rcwLR/0OhVxDeMnFiYFI+3PHLrpUmAI9Z1VelKeGucNhUYaSayN8ZSKjubFd2W"
+    "AeMuWbqrie0HP40LiWk9ZyWz+IucbkbdvMET62gv9uvDE2/9x3r+9c/+Ebv+zJf/pt3/Cef/b0U6"
+    "cXzsoelV6PCDx6Qvd6RHUwn3zqiTt/87s+/Muf/MTP/Hcfu3//bZ8/3XjuOoP8diYAN17mjxsQ+J"
+    "lLO2nCQ7k3NCbizqDSCw99Jln42SRwuWVyQ3VywajoykdfFLNJ64UFHUxE+HZTwKSkCn6fFLI5RA"
+    "5M/qj36+nBTT108QSKUP6h+dRuTKgLWDe2BT//xRx5bc5iWmsvsGSMXAUooCNcMjbz1fTIdKNS+x"
+    "WBO3TiHClq/sehXIiuTnfu5hdo0h/4tbFDj9DIRFa7MFZxOJuWBDOt0JWkfiG78uSkjb36Ev/zE8"
+    "rGcfngXV0uLEbh4sUwWOoSnZZUbAr84zOY3FTQ0yUk/mLvwWttsMb2BDI3IJaGtQle5IhjBM0Zc9"
+    "A3Io1acXbMlL1xVA1GktKADST9abFnhOIb7Y0RmJRGF23oNb8QXEzyKROiSl/wYXGI4K0d+MAfX0"
+    "ykj2FATq4xNJAmWrQmBGJC4nbdfkudhcowH7oHr/FSJKe0Lh1bMsf87a5pRl2HeUra24bqSTk66C"
+    "F7U0XEBKFYGJHqYj7VRpoEynntB6txVGD01PfLMYct6xMoNX2vC1LaDuPYMFQJ6Hsw1VZs03QaMU"
+    "G+WuoOJfbtxgd/FwWOjk5e1Dj3R5UPVzLjQTWH0vRL+pg/yG1PWSPgGN0pcY1mPMgEc1KzPRO76X"
+    "/7u/ZRbAQRDXbqbnT4nNEkeoUNWBe+g1vYuYYhhBxMxdFEOlajFxd3sqDKOOQJHaOB9n4uiLeSpT"
+    "wu3eA75eZdDFm+nm7fe/n0hvsvn5588dOnD77rM6cf+uF8BvxN+a6CJ4KBYYxtvor0Kpu7/X057z"
+    "Kh44qL4djhWy3Jc0z8tBUMwhfWPjlOCfOJKXlbUmhd4vRqFCOVf3o/uUeyh8sTC+i7UTniMzKdIb"
+    "HM+144gRscbUmZP2xv/GifxMDgP0IcVuZaa98q15GoBDw8lU7ep0rI5hAH+STqIXpPgiQ54yExoW"
+    "JWYurUEKBt7o2p7JoAi6cRasrhX5sFYkzSWSRyuMAbWsaXT8rDtX2nmPrWlvIid39/yw2n0AWWB1"
+    "nxQdKGkNzdpQ99EsjYNUWmzk59skMx7aFNDOtX6tKg53/L6hp5bVq/ymcLc1QBNrsqmcb0AU/n2N"
+    "Dl7cS+SJTYOX9Xh8rql0VOC0HZg74LEZn8MbwPppAdLrTDgk8Szjwhx6xEf2JKvbDMgSlDKMTZd6"
+    "4Nc/1RZVjXDjDWD7HASVL/2QEIMlYutvFipnyoW1TKQdS+8MCgLRtrKdWtTOXu37n+wu3bt/7lB9"
+    "79zp9959vfkN8+eZRe7wjMiHm91fzlxX/n29/2mb/+3R/6hS+//9l/cuulV//gZt6IzeS4ma+K5v"
+    "LsjT3hYfLtjdm3PkqD06nUye6EeiiWkeMiwkTtBSHty8c8S5nJ6t/wUkeG5ESmYLW8YaZFm1rinN"
+    "sBFxDzyi+GxJwQ61OjfQvmhU3iYcD5IlEd6FHhOQcQm6OPzc6xGVP2bGP9qunqVqZ4A+niqP4ICb"
+    "KJWIHt5gbmmIVl6Ko1qYypYiM1tssjX1qG2Zim3ZgglwO+TV5Ip24/UaY5uW0DtBuElTtsmAvt0t"
+    "m4ri7kD4xVGf2o0Ia0d1O3fKDkxuNmZIwNpf1QAMspNsYL2pBQW33HmIh92nMEpDrgY3N3TrHFJm"
+    "yp7+U8c6Rh3VbPtuCzbbRTBmliSlnc1O0fXhkNRc3DXxkhgJnUwvY6suo5cNG1vGqwol/bkHYsbs"
+    "w6/jRmMBDfo8LFO2BtDTbx0I/FuIzPxqQ2cMYGcb2pFw0/UFsu9FCRqlJlwkru7/tlDOAGdbnH5i"
+    "6O69P9+5evLMN7wJ7nz2g8NI0B9LG9gA2DjXj1jf2FO+JXS7AmaeUGb/0SSyAWa/ynv8NLjsz+/t"
+    "9GDaPVueAAWY6P5OppnrO8+Hm8wr/+sQBmpycPfNHPPErOiDs3tAjuJjavfulBePtCGvw5+h/ack"
+    "Jqhdw9pXeK7Qf6JbaxkZoNHJ6Hs/b4lCZPy/LE7EbeGnnzJm+3zDcrM0ezobuZufHY1fXp8etXT1"
+    "d3//j0V5/596cf+q47p3d8VXZ8TwX4Kr8zdyvHzWdiyFNcRHJkMcyPiWMXGzWCdhc6L+qEHFptIc"
+    "e+8JjnbDs1fELef7KmozA8CcSOI3xSRs4gEO+J+Y4h9PoWQniPIKKreGysdnxDOzbX7WC5tH3tw1"
+    "J0qPuc61dox1NafeQFCTYKtasbF15aHToYefqz/Y5FtKGvvsE7xzwZqo8TK+SRia0+RUPO63Z11M"
+    "by9onM2IGceMjXlsXFj8rBQ68Qb2ik0tQprbFA1m5ysoC5Nk0ZOZ/S1hZwm8jhoX14Jm7VUS76uy"
+    "ac+XmBoG+BRP6C7xgvs6FA1+jrWFysXhPWVhF2/qIm44KfiHn5TsZP/LtKvJxDGBKIIybqG6Uzn/"
+    "daJiPANE/bjkv9Favz1TlC/MKH+geSBKNQvegP3+qhecv1NRT/wTrjodsXT8aW6gijeFsD7cGE+d"
+    "434aMJnIu4dqyGzMUobzfjxV4M2Bf9eLHYtUb08uL/nbvXd169e+/X3v0Vb/3JD33tV/5GpC5+1R"
+    "0Fj9LrEYFHT+hej6g+hPkt3/D873zmxet/+D/+H7/9FZ+6cfob+VKAZ/hmsXuZHMw7vnrbt+0zSW"
+    "YSOZkuJiUbPy7LTDZZkjPBXXymzNOwXkhWOROyZa/BkWUu9pLRHP69SJBTR4aJ2Z8e6KYHpfuqqo"
+    "jO+GJf2qm6UYpdxR47gqntEYPOpO9Cv3yIrS2LE8l6PJhhWKViaezaQht8Baq94fYikxxM44Ce6M"
+    "af1cnGBk1epEZHY0m8e1FtvThjhJhdrSxfsGnElPz56jrVYELXr6kni37kmuPbJR8SxUCepSJ47S"
+    "Nk8QuaABB0cHLqIRDffcVNZ6WP3sgju0/SponGjpO0aS/34AQOe/p3cNKgD/DpS+r8kTbuVsAKrm"
+    "+dRG8Ssa8PVudUJ/QrvUHNtwXKj/x5vINiP04MsZbxzTxxE8H9Bv+rLpVzgkZvu9DE4k4Q7ds+kT"
+    "txbxCShYc2UvspeohNxlIHFqxtX771z5hgR5sBaGXqGzMWTWB06QQVPr7KggVH/ZcUvdi+dtT+gL"
+    "kg2ZeIUBFa+IyHfRiaAKFRVNuYsy2aVjlCyMKctwxhU0OKHtp5chK6X7ZR/mKnjFwk2DggdMXCCY"
+    "34bfDhyTUGm4wpPgdP0ZQdc5HRdiCKOaav8aPHzBP9AaujFT9YvCW3H6Jn+6cSMDQ5ZmwdhZBTlC"
+    "MA9KfjAjDSmLN4DoFtM1LtOcM09GJVfFq1U4q64AA4x2JRhcxnWpKZ1A1PemT6NBZOO6OaFwqz2P"
+    "fbKHkLZDZ1EfTLC3iLf+479Oe9V146nT7/8dO77v3G6W/94Iun7/xIftLgqbzV0s/IJZDZ+HlT4g"
+    "tQ8hk5N3O2BZOcwYCvcZJvudSWdACWamLa2m+xnEA4YCnSWo6Nn9X40rRtxer4Kw1sxzq8kjjFlm"
+    "Dyx5iDoorUyiRjiQ/IXdC/yKbGU4S04dFwi0mZPucCQLntyzG8NWJsYWDCRyxSyHGWoxwdNKlr+I"
+    "apL/8eAlFJDAYHHuww2SHVx4YJBWikXbZoYYLIT+MhaJn556bYfqI9Ry8y4aQ+yWsMdXqXPDhWoz"
+    "/291ozStVBuf7XGKNQRGK0ZgxUx1yIQgwvbUpUI7Uy4GesA0b+co2o9gw5/GHaF0WXGKE7+S3FV/"
+    "I50Gu+HM35BCYH1zcYJVt0+GgLLOClHeUXNtSW9hHlNI6vQBQPKomWczQo5S9KVq5c5Wi5ygsLLy"
+    "DFVC9dEJKUEKb7Bo+GyECHmXfrJKdnuLe4CYQOm3a0VMTQ4YEUUNZuTbE/OuGnVfEw5eNE9+/fvf"
+    "/xtzzz9E99xzd89f/22K28r1tbR+xR9rpFgP58lF7nCNy6unX3u/7aN/7mh597y08+fnr1N7L7yn"
+    "ekdKpwXaATnCwZ9C7SnKlMFBq4saXViw3VXvxtygxiseJcmcnoE61cuBbnmGwKRBd4kZnpCVVFvd"
+    "FScWqa0+CFC5ZM4k7a2IKxmISdHKPbG9LQLm0aA8sbURIisOacMoDQapVkKWfs9RPB9a24MsbOGc"
+    "pVrIltyTm0xdT30ScxDX0K2OXH2lK+2lRTilDelGvyqDjH85LceJRF+tg+QmbSE4iGjbx99wAP9v"
+    "J/aTcModn75GKkln6iDCCbuUMG9pGXVwVKp4Rv9S9QJlgPyhCBJVm1kv7StlBKnHYqwwxfqtpkK6"
+    "dBjuzSzcXAznKQ88IAm04Omg+LB/eAnIJcbEKQyTfaDaR6uBEdPgBu4m2W6IledMw4wi8XQEHwtp"
+    "f6eBSpMHN3Z+YeOEXzPIzMXFhBEFtMCBK1BRQ4WLh2USy3PEIHwg1JxgX1/awCuLwQwXymbPziXB"
+    "e8YDEfRr+xwyiOTejhbpxjUvuy5sHbPiH2eMI8BY950pVDX7Vn7BO/4HksWnLUYTQMyJNBjJ0uNl"
+    "KDxnbPH1Mf+ZbZSMIPRGOCPv1Fio4En/LwTY2sZOnVe/Zt4huhjr21q2IjitJw9K+xBTN1j8b8kN"
+    "hBFQJxIiFzJkdH5DaBKqc+lL9tlHOkeXXaygaKMZ3xxgsLdJlvqVSIOr4wTno/YJzT3qdxlQP01q"
+    "1usnkV9/G8de7Nn/no6Xue+6PTD3x7nuA9kwWeL++ykeMLT2IEXxHKWy2zKTxdZ2NHzuYui+B71/"
+    "xmF5u96Iwoo0KfUw9Ao4DxPiUqzfiFj1rPKVDTSYq0QEF+ZKRAjET6H7kdD8puXMk9GPcXx8jxFM"
+    "ynZMQFGrGElrOxFZs4x4/Bap+psbKDi0xtWbsSM2wm/mk7bAdr5nUho5N4QENviLjuMGAea1PytQ"
+    "VM6FycmM+AIDe6lJt624pBzMF3gysW9g2G9MCZlwc8foeNvPjr34XO+AKE9lMYXrvOfoZWf7C/KT"
+    "lyFUwOfT47CI9BoVkA60T74KcYS3cuUCsGsGkcVsnDC5ZFicsPZfsaxBwanp/syNstX7r3eH4X+L"
+    "FgEgN406hJKW/MD9COB/yySQkaqScvsDBbTKPtnF1/JR/1SFm79NFyOM7jD8laRn4/1+DyWAkCY4"
+    "94ph8Fhmv6gmKwDrLV1MdWr/4aOg6abRmMkYQUmeMFVu4podHuXOC+CU8uTnnN4TN52eeffdPXvf"
+    "cn3/Ls458UYiBR/yi9fhFghj1K/xki8NQbbr/8t77/23/5Xbdv/OzNL7zw+/mC3Pu3Mps8vOjGiM"
+    "wQJhqfs2OidUIzaXI4eXLjnBkrbWcpEzJy8HP4xGnKCO8mhIuAEzI0ysdFYSfb5uizvXOUicrERV"
+    "YZ1PEXHa334sPCE31LdxMGDsSlgxH8IktsbbG4eSWt/ubIVwd1F48YBStNFThswrY2auURF2ram2"
+    "Zzxc+44oCVRHsXRl7y1LEy4h/M2IG+Jn09yhTCiG8Wq6u2QagcuJTYTKyNIR02br8iQVode3GtfC"
+    "Sjx40MONiEXoAoI6cRFo+TT5iMy0E6CtuP6/clQG0q4G720VO63ox3wFU/JTdm2oOn2Al10qWB6z"
+    "8M3KgybmDGFn+kNGRujsZsMLQmPNjAZs7Ycx5c6JuI+FGHTBsAw7tjHSvFta3NR4zBoB2Z0dvR3h"
+    "7SDoXB3SNtoyOUpCBwMx4GYskUd3OXRQhPStZsn3kgazt8F/MxTOAutlZ7k0cDC0OdVGO1ZunpYo"
+    "tax7j0xdEIKLgWGw/5LkatQ5v5rMf4uCm2gdpIQCzG9hf0/YNP+ORdEON/KjuO2cFgfpIqNn7S0p"
+    "MsLrhuBMR2wGhLTpG1BlYbPzWgkYMk47moVSsOXhD5N7aRqQFHrG0PMZr8K9Ce8QZZxBS0YSBiW/"
+    "tsuWWhcVmTe63DAcaCi27yjAliE49SSJ2FFmS8THsWp2zofNpGANLIc7tbWQjeyheh3Hrx1dPdT3"
+    "3s9Px77p6+50eeOT35bJ7WnV6O3vBeZd7kC1NU59tGYgRYPrAIfsbUvXu3s25jM8cXScxCGU/dvD"
+    "XKRNv4B5nUGLRsp1DEtsvD8bh9GHnHfn1k8+VBLIhb8C/HZYdEbA0kvXEcXDvCS10jIu+LHsQtOM"
+    "YQW6NbmbAZB/iRi0/+TAA8HqFHtqYOTSzizlzFLsrwldfcgILJmCRPAgQs+xd7iqFe9MvuqeUSUg"
+    "YDPRwC5YRN42uIlBuD5lE2ddrAXlu3HdqlP9QBx65tm74GX1vgHz55En8Dc0mPT/qefOZoCOekjl"
+    "TN0Qdi5TdXR+hBTzGame/4i276LZ1fyYNp4oJkx4R+ID+c/nQHsvlJjjvZ0N3hc3T6KpO6QCVW5i"
+    "F33ByaHE57zTXPPPNFw0IgYYlzbRz/8PViQtCOR/TZjukdz2UNR5kittegQpzvFSoRh35cq8nRTf"
+    "I8ZSyhfmFGauFWT1rtj5BEgi/3mzWiboQY/pjDOq8fvVDDC/nc3C8+9463/d0PvvfNvxmAu4F4lP"
+    "4zRYCZ8yj954nA/Tc9+djv/9ff+63/4Jnrl3/+1qv37l5lMvB2S6YWr7wzKXgrZj/cDrWpN34mFf"
+    "XcvDvrnGReKLwQ0w5DZw9lDyg7OdO8mLCxeNy3G4JMI6y+ihT5Lmqhhy8NB46kQdrJOjpYsNMi+S"
+    "gAsRUUU556yojSLr5ttRkM2qCzgDl41IU8KFxu4WzZwp4ESCU5sr3otIwaaPhFWt82l1gmGEeDjN"
+    "5Q0CtxsKm76ahZihc5xZWProtmGrQBNTo6mPorQsn/P3tv+qxrdpb3vfvsM3WfbvWg1ojUaGiB3U"
+    "JikIRALSRhQAxyEI4MxHamqnzyf5JPqUpVkrJNDCaJsYHY2FWJkzIJ2JhUiAElDqYQsoyFsBCi0Y"
+    "Sk7nPOnnL9fte9nvc9B1c+St32Xns/z7PWPVz3ve41PGu9zzvg50rk+VNmfIcHjQQd8cqssgY2Kf"
+    "lpe6+cxEObtHmd/PAOaZEvlc0EIpTJkKcILv6lPFDrbZ9bbDc5tZRvbllc9MardS5YsSeP2Njb9L"
+    "E9BWRJq3+UPL4hNYJ8ZTWijZ3OKao+FRGmWNsTVMkoVQ+Aw/Zv/eP/2KjtykqqwaizMFnYVGc2aU"
+    "NDL73UhUUXpgtJhoVqZ9y62EUeClboCyxUkpYQ+SQWqqxfjO3wVp/y6uILf5GhHSKceaZ5sKMfOi"
+    "8+rVSrRDv8iVv1WWCgQyIma+FisZyRF27DbPxgVRsvmDTRC2JixVvQapEFKovHSLDIoNLIUMfI8z"
+    "kqPS1QdFOqMV2N9OBwbZ2WXco9ogyx7FzItGY+vUQumBzrxqp3hzrabR3WCwPYXmn1BcqibxWgTs"
+    "xhIPdJZTfH1BlZ2iZxvXoza/VstvK5OZ7YUcfj2L+a3xW4en5nd+P8dHft9h/u3v7AJ3Yf/J6z3R"
+    "ufyt3mgXwRyvXgXI2enkfPt1nm9+eC09+gSwTyjZY8mePdtryVk4Pf9TM69pHQo7qS/YgCxPigXI"
+    "oTscmlRH/gb+4dSx6d/gGSJHZOCQwhZeysr92HPSgV8zyyjovpvwjKI249jJ31RiY0wEGLnnMCKo"
+    "QdOljRh8515Sl7L4HOQTxoOw/k0GuZOKz8nr5k5qod7OPj6OZKm1pv7RN7/N3zHbY88QqfuLYPBe"
+    "LADzbGdR05bOBXcSuXsnNieHwOM/L6wRNa7Gobm8vnZX/5Cn3xuJJyXeRc8asELksmdOIWQepY/m"
+    "oDaJVjjDhOAGFHIZo1HR0u+94mOyTbhPlDvXTxZE7Tz5/Pd72e5gWKK8Q6cd9eiB45VenDKLpea5"
+    "by8knMkK0KPqE7/pozbpDDYA5I2upB3nmhdHgHIaEEaakNxr1l53GExs2VNWqBda7E9rJKlnbnom"
+    "+JOz6Q15d1GS+RJzFGk2cu6pfe8e6KyGTdmi+YC/niV1/7iif+i/e+/elfybtYLz8316h9xc68jH"
+    "2ZvoIReMebXvuJD3zbN/34L/3Gx1/7h7vj7843Pl9jELLZOJtFB9OiY49Lx3IH3RpwUWAQ9XfjGF"
+    "BZ2GQgMiC5diJv3pUNtGApx4BmcGZAHvHFLFn5uBCEFgbzlfcSJiVtI8+kCT03CAQY9EmogNzJSJ"
+    "L+rrf6+aq5mPi3dCuHct/CxUIE0/WX/KoLkk5IsYefE4r6HBr2uYmiy48k9z5WWYTXxlT/lOUG14"
+    "W3kxhC0Qd32S8du61fLlu6RwbjHEnIem5Gstkptz4RoXIHyMsWPoG9NpeILFvLCOWNxk1PrL2c7T"
+    "AmFi9F07ixz49ztGuqv6VDPeje6Cdexim0yqQedMz+59abTBI8/Nj3xxCRsY2WbsqsOgKB1kF3Gn"
+    "2Q2te4aSA4Vd3oZuBs4Ww8sFNPkMCXnK1g/dI/y/dJ4XdI4G0Y3Ninz9E+JGQ6tpAd/PGhcal+nd"
+    "D6ltVXMQTJONr359UPdO2gBkHTLhd9IxZgULcKD6VUSFnq1zf5ocPKUXkK+2RUuKevSQY27nHhxp"
+    "0nM1hkrvkTCSFa3oUThcaQFsBW5wy0B/AAwlbiM1rpf41b2226VLAEnzqPfuK1UvtbsGs2C7NkxJ"
+    "8K4AOE+I0WpX7L4CAwz8I48GlhL9tR6XxCxgM4bKK0FOu3uumr+5CTzziA4RgzyHihqKcFsWJLGZ"
+    "sjw5XoaVMZYsrY6jxRL+obGxI2ekd5q+Rpbig8UTrOF5ic3c3TuPzW3HG+AOXo9M7u/OTu7vrtL+"
+    "/edvGJ3X/43tu7Z96STd6tfJM4v0fHTccFXjL8JAFPAwkwX+jhlX6VspXKRi6+7Tex+DYVikjr0M"
+    "hb1+CWNrWa+kQJlNgAq/cB5QxkWpVNRfIWC4ST+c+RZMjST/sbf9CIcw5E8leXkhtX/OmJKPHCCH"
+    "9oAMW13qOPPUorr3tjDNRktU/7IAuh2smlDGF8IF71cgyljCwyqMA2VY5oyBAO7ND9r6Axng00ta"
+    "gYtlLBFNrjqJdRDSGIwbhIG0IboVywRBnc6HJJrEndSFW2VtXqySe2QwVbRWKCbsrWjWCT4ge2zY"
+    "+dFkKJDrEJ3zrqj68SKF1j6IytyIp0QIKiHDFqjr3GvclyTj6tpj8x39DP8tAo/Y23Ct/JW4lv5y"
+    "ndl3PNSx2hc2CNvcj4H7/JGRUwk6Gu2KtfzTs+bJeO0aWFCm4SHkH0mQIScGmDRtHolaWOMogkGV"
+    "7iLh9iBVteWFBDH2L78r4e8OzeIqKDaGj6NEag5t+1nnLBkxScZSxX/6LXF8d2J0fn5x/+mpc//l"
+    "fe841P/d+P3Gp/GjOXl69QBC6j/hUK9IGZOz/4zDt+4xuffPTHrn3pCx89yu94sABmlDG4GGzH2w"
+    "0wQz0Dhx8ZP4vMmio7jBm4JAZZByVlBpx/WWCcH3xRCjQHJRMHN0E+BKz2DFwwLGeAMkjjA52DqW"
+    "Ab7DNJg+PA1lb1ig1idKKbk3kw+UC+mLHLlY0WPiDDwlbfIkc9li03mSBgI4doYJrPrcvF/tgOl7"
+    "jlbCzXhgF1qD13MkLmOG8rwkfkWLS3Lol18lt52cq1PvVK3hjj1/ZXP6grdarF+qNxT3DDGebCgC"
+    "UpeOge0ptXWQPLdsTu8QkJfeGGxcIXLI5QuYJzfypGW9j2ihfgQydVp7qtP1i1y82YNsTzaRl1lj"
+    "I8olCsyNBW9/kgj3pU03PthLJ8llkh8bRYjYUPbCkDFOCQNMd1JerT+EEZr9Ed5YWzXmWvL0v73q"
+    "srazsTAAAgAElEQVS86Io/+lw2Hfy3X0HMQXkdy3YMr98nAn1gcoUuWiT7hyX+9nJKqUSuaSRS7N"
+    "taR1qs8LSvKyM/fMY02OFjR19hueBqnWotwLA5ya88vmqi1PLTD/lxWiaQ5R96mkAuUHptH9oQB2"
+    "GPh8zWv7aYzNwSXV5RP+KbF8elQd3Hj4Wgi8HUMPpgbX/OP5g88Gs88BJMQ4AT+MuB6bHlNTTHya"
+    "KBPvJr0W9bQgtvcxPALe3zq48oGCB0iZlDetM5wGETmSduLFL5EhQ2Kj5RyVshryYufJMy++bzsy"
+    "xg81bLl1zc3b3p9Ld3P/Tu53bveSZvv3z0C9HjvZTZwM2C3kqS53N7eRvaLhtEn8TxpCZfHnGRT3"
+    "/7Gcf4xX2Jt3ZyXzK+Vj46phXp+BRZoz9xaCAp5IhOnyxX3gAKwSaV+kfGRTh+wOjcUgxkarsWCk"
+    "k722/sX9HDn2nMPnWDVtv6kHy88Aw+GyB2uD79wib1Emtw1Y38Ac0YRLd4nIOD6+jS11YyRuBBwy"
+    "Y4tPXSLQ+P2hYHdUHGY2h50Yl7GBjgeU9bMtgH4z5e++PYiw6x4cCdFTdeIOiTyj1GsUIWd1/32k"
+    "YO/4eOL7z4ax3Gh5XH0OZj7NO20TTJwzf80isMzoEehUlkY6NYbFgXDzlkOC1asgykHPUpNmOXeN"
+    "3Nbyk+f/RQ+nCObOrg05Y+xUQ/arbN+KavIXfujp+h84eesUXHWOSCspOeWi1Cuy+JMHXLpigSQd"
+    "N1T0ozN2CldSq9/Qa7+NOYKQcB0Tm2qW7ZHVj91RBjOrWevFVAljLKNi1esb6YzeqAspnLmunk6O"
+    "z8ow/duP633vvWb/jHj9w65ocsL9NXIQI01WX6Ckfg+rWj5374+7/rH7711U/897eOrvz+jYygK7"
+    "k58uXSHJ14MoAyaJgweIGJ4cxgZrJhoLYMKbq5cW+TeWRcGDD4wl4blAu+4YwbJPqR4U8csRis5X"
+    "DlRu08xFsQmHzjE2+5cMMDo6LaLlrOoasD28xcVzlXJ6Dxjw2ZEwoAwzObPAlbJicZ3JiuSpn/oW"
+    "uL0MSmOuhzhNa6d3oGa8NQoIbESbYlYKhHjvhHNdZmRLOcpI1vgJqgrxaqb9Y18uCyKRdfP0dj/E"
+    "9FULANsYsestuBEyRNTL4USFsyDmFjib/767UJmhnNYLuxXjYGsa61Hy09+wtq44KxJUZuXCb2Ck"
+    "dgfBU2p1UnfRpA/AXD2CSv/6NPvvVBVzgNY9obz1wrR1+tU+taO8W4l4YB6CtOVKg3xEUp0r7/2a"
+    "cQS1o8C9DAGV8Zf91IgVcFeHRjeos8boKjAwZ46y2WCyfebZh1FMqKAZlgCA9QGRQNAb6kTRhbW9"
+    "/XvwgkjVtTKEwiPGWuk0+uVsEl1z/YS6q+1y5tWPD2GX6j0rfjTN8AQweFz2mKYLhw5Lql2EL+vk"
+    "RM/SxTYmh8U041m5ZThQ5t+k1ktvrFc/5WGVXjoU9TL2xAlFGXqTmVzq/NkEu+2NBQBRF766/ELl"
+    "K1CJaKkeAFFwvFBG6l1WdENF6spTLvjhWv9jH6WRewviCVfH7Z1MMna7xVkj53kucNfNtPgnSdjW"
+    "8+N/fA539v9953nOze9syXdscvz5rrGnPqAzHJWzR5KsfbK9HJJo8jvvfeg+/EO0/m+L0u6kPl14"
+    "K6BWumDvcw+Emtrxnb1XL0u9GhfqTGaN3DfHoDGrGee6BStktkvSehaYQBi1mwugls+5WvzNzH4M"
+    "dp7wNuOKBjO7r0Cxfno0bZmKOCzBzLx1UGj3yxl3KwbGIRwice5RFHqfgLbeqivSljQ58iy5UyIQ"
+    "eDWoLki6KwZRBnBYxFqJb2vrXf9wlS/cUecq0PccAOJkoHT5nNp0Uf/6PbjXjxtFkAcbWVMn++9d"
+    "S3eS5ZzI3HY68+Y2Pqorl4ULNly81p0SwHx/mCProEcjV/QAhQ/eAFDPzgxYn8Du3Jrd3t8wfzls"
+    "vr+Wx2/evdnTZs3DDI1A1o+3MkdEyScnCbiCl6U1JvXBxa5/oUIrTkRjoX2hgG0b+XS70x236zgI"
+    "sNJrFeyRwBESq8XKER9iF7j9BexrF9DMYksrUVwoJNtdn3Mb+TqR95Y9n57l9nVvq5tzz1xr//yp"
+    "dee3ZhXF6/8hGgB1+mr0IEXnL9+Msf+t53/8zjV85+5srJyWf5nINvU8rgYVjx5WJ+OQrlNaC4Zq"
+    "StYXe4GO6moRMOizkGnT8kHVwGnq/WkmeSCsDB2HUR2EmGCbTy61rZPR3bLuAmZrjEZNDJHd/3Pi"
+    "iyfB95uE4EKbtZ4kqdNoeQAFPkjdcF6sgpgGLlmMjwgYkHbf+Q4XA2Kg1EVa1jbv5MTElsEu71Ic"
+    "QI6wNKSSsOhYQ5/GTG1QpyDg854qRvJcFRdtXfgjJh1IC+w8csT4s2WZSlmvFErUiNY33yRj9PRO"
+    "GuJ05LFowVH31kdWYFcKFSRQUZLw5SGJWJ3F5NH10YIBos/Fl1sEwdsQE+ihgwvzZjEIrNFdlS9j"
+    "RwFm9jxj9xw9OeMsQcjE5to7bpukieamFlUEFCK27Fp+kXKnEaZ0ZN3yGDrdahEeld7NxH1oaxRy"
+    "ZHnziYEUz8ZctCeCRidpA2VjLmY8g4YEHCgbxZ4o+J8r0e4Lm4powuMv6NwGozWeh30VO7im/y99"
+    "gIdUzH/bY/du1hKgcQAX1aBGxig6M8KCRbijgIilSzaw6p0GpPSsXsuYtVqNj3SZaLtcEYzPI579"
+    "O+v1doPb0wDrbLalGrssyO9YVT3dZr6jcSzvmrTlYanP0CvvGZmIfOC2u+xSnQ/kZXNnBnWQKeZb"
+    "PFuy6oXb5VObw8lcvvzLGAu/b83d3jd35v957XfWr3gfd8YffYq/Nk7hoL2yzk+c25i2zqslHrE7"
+    "lEjM9KzRMqn6BQ5otQXGriC2/DXD6lmLoQ+Y6t1C8LRL9MBH+tJ+fgUj/7Dxrok6afhDdRkgadOC"
+    "DngZ76tCi8Qzxo4bPZzx8L927Oonu46QQv7c47FImhb0cDNzpg8+dV2rih/W54tKHd4CCDjrKU0y"
+    "6x5ecW2SiySManhWV/Ax/f4OFz7VWG+teXrRdjKzItwyt/yQdonMTS0g0J+tiof5Wrz5EbnrjJIw"
+    "+vT6VSj7G7v0aSHc3UHZ9s480+9afPxlew8EW8cQV57ORajFzHZjeZ+Ad/ZJSEthL5lukj4pNhd8"
+    "G9xnlhbCgmE4Eeo86mZsUYlNM8cb5z8kB+TvHhjJ/rvrbkigA1Y5Ar2QwiY0W+lFybo+gMED+cDk"
+    "L2HicdLjHh6snL4gMhyoLCwbGFvcP1nQhhr3FHee8NOfoJPkSTezqUVYcUtzVbaND9s83KwwVoaO"
+    "6P5ILHC4TMs2Cf5wO0YiXvvfLi/Ms3rh7/r0+95hU/8863vOaTo57LZfpqRIARdJm+ShF4wysf+b"
+    "3vfOsb/8cHT77wi9evHv3x2ZXchhlZ3Jhz9VXujKmrTI6OMk5hMCC9Ue0HIOSm8rip89ZCEgPRSY"
+    "QBnkOo0B3YU96IB/JLrwM5WpHdf86rBvcyYTMhxBaJ/IYZkhgzKcjHF+SY6Ee0ChTwF26xyJGggX"
+    "s40S37fPMh4vD5u/dpCX4lni7UZ4LiZhA5dbzZYAArxeAcL0pAzgRy0pB922cdDTEcYpkyk9/agC"
+    "7V0g+eSAGDLIeQOROTXA6feskbG7B7I42CSW/MMbnSnstncGkrVN0YRgqsGsgknli4mIQSIbB9Wq"
+    "dMaZtG+JXBgcQg8Wp850Ye4PYlFgXwG4fasgbJxl6w4UnXHjj1L10/dBaZtEtvn10EpEQl8HH+cg"
+    "lOjiJGnoS+YpOzmFP9KY/oVK7clc8Vt0yRdzFGPKjfomMfuXvx4CJyKGe/GLX6WZDGiFogv7+6Vg"
+    "pVGovSsYEEVTftDQwhl/Dk1y3Wsx7HyfACEWWN9bTpGU/Uo9w+sPcF20uHhRLtkmVqdbFn/HAqch"
+    "gfXxFAlS9IXE8jW4/SBYi8NAucABzsodV8QODKwxaF/YXxz4swyG4pNEQ4sIHftNeaK5Y+V9TsTT"
+    "P32O8XGHXimIRcUxes5IlbcVOAnWNNIfKVaW7FmlLr3lhfwQZjUDpcUtotfW5Z71sa0euY6LxwGt"
+    "sswroxOOXtkjn8vFmeOLigTt15OHccG9fvnu4e+fIf7b7j8U/u/rMf3e1e/8aT3bUbd7W23lbnOt"
+    "oneywHgpcndtFM06Ri2cwd5ecJaApc5r6UlwtxwDhIi98NX2mRCs6qBbnEizhFGXkGfVuLwMHgIK"
+    "1rs41U87YDxgNg/AWkDJ97CNjop+3D88tSQl80NnhiYG9s9klgddBrW085F8p+GYh+QU/SBzKVSy"
+    "80X93OGb1ZI4pPxDQbPDZ8bPTEDN0OU11paQTqG+89B+kA98C38Z06+8VGkV6+QHPOTHylrXpil/"
+    "zSRecwH1vGVKgEVNlAkKDJJxaDS/tFjDofxqzjfU+TZ/vQ2gChnyMxoZ5tG/DxpxdsYwcs8tVbbO"
+    "KTNQ19fykgx/uKOaRicJL9gfyiRTYd2bfSxv7ds+u7589u7Z6/eCTdOf09mxU/O2fdIqpP3CdHH9"
+    "9mfsa3bZ7DBNAZGaqMSfM5KQdnY+JSMR0b2MOvoTWOA6oS/Pb7dYXbFGWg8WtRkE3erhoivzNnXy"
+    "RWtCFMaGIysEvq2y6LZx/OPMIf9xGw8RHfbEWuZ2fPXTs7//mnn3z5T3/Xu57+F/ko7sm4cHn5Kk"
+    "WgK/6vkvFLs7vT7/qmpz/8xZM//olf/MjvPnz7/KH33L5ydJNpjCHkIM+juqvXckPNYGLTwiBlXD"
+    "Z1pK2JwKdkMynA7yDM1LcUAstCpMVMP7kpo+OCf8lEC/t4sHBROMRiQHdyZ2FTf9RIns2MC2FmAU"
+    "CS5gLglIcCaBLo+FirIWwKWlXNiYS5SP8rr1OIrzpjcvjWfsoCYMhUTLJUGVWu+EzepzNjRyyMoI"
+    "J8Dlyrr9EJYfmsDwEozooxCq2MG7F58rP5G/Zyon7sZdGTtmS4JvXp0Tg0gXIyT8cg9vo2dpCnTC"
+    "pyrytG9oXh1s1M0pnwmdjvr8fyGTwxo+ATzgnK4qvLTSN0NzbYzz2jNxw24/g03niJ33VR2+WgMz"
+    "IHvtNDohzo5GIfNeLPDbP+pzxqq45W777TFhNkBUG/N6vqt1V9FV9dBLEX4chxU3SzDI/6jdEVA0"
+    "jIr6RIClypusv4XBONIUJf8usaOeQHX8jkx7OBPiwh0ZszzOq5lOy76IAV2ughYhvrT2xbO3yIDZ"
+    "AQxTR1pc+xhDJJTC6y2KAPMQ7WBseNVOgDlSt6LCj9V6656NWKxXyUOEmDiz39IQx4sHIyApSVhw"
+    "Z1/M+VPEcZfcGA/IJYbV8BFo7kcoqf9VlCabBobztoEJbNTYQMGLwQEasaafwKOQrSAUtCZWzZeo"
+    "zb0BwSudrtI4/KVpMI4Cf4jHE4ftV9Nlp52S5PGI53D9y4uXv+zt3dtet8u+VZ3m7JGyjPdi+58v"
+    "ndtzz2O7sPvv+53euezFsqr97183V+cyXOYBjIZKkLzvhNmmxE2OSxd0sI/N27ZLoYjn1U9aT1VT"
+    "1OTu3F1FMcZ7wAnzPjhhTIpCWPDPGDR+tR86b2H0pGK1D4hTwkrsSfuTtYuW44KRsv35KKMGnf3r"
+    "VQnGW3MtgHq9fGu3IaHfpCLGw2a+N1l7tFCkn/uOCvsUm8V7h9ioiTxETAxSk6mMPYzw/I0n8U4b"
+    "SX2dpy7MkirwlG29TaeCVvpwvf9+ElNurpZeuf9pYWupZi2zkLk7YorXhgP9xaCDXYhY8mdTyUI4"
+    "ZioB9M7e8jiKwbXudkJbzXrHi0HsGlvfEMW/YoQUMLiTiRFgk3jF1eVNX37D7yNsvns6k7OXowL5"
+    "5HgH2hmHowfRXkzn/UBzhjTxvkzxpripOZXuC3kfBicQ78GjC56dJz/yHCjU0dtx82Oyhtg/39Yj"
+    "Onb+NBiChNqYDBHSBjU//ndjZepG7xuTXJuQ0YIj87z2aXFL0029nF2fNXzy/+yetf/aq/8e5v/V"
+    "O/fv2I3z25TF/tCFxu6L7KLfDww9ee/+C7v/2Xb9++/egvf+yzj15cf+htWRz5bO34mFeNMoT48H"
+    "lGEQPKgc+gT96zo4xFVSae3OyZANYCC2XKnRSYYPL5uLwVh9srC3YQfaVYXGSTGR0/cwch/+smDC"
+    "//nSfwZ2wzCTg9cAPghgvM+EIeWMDXzVleSEyHnLnA429NaPpCuRnlnGwoY/dAvoTQSNjhkhN481"
+    "8cdHIsf9iQEAclEQ1vmKGVt2heZUZmrkWiXiFBBQv72kh75Hrsz1EILk9h68BmeBBSxuuFbHuBZ3"
+    "jGZwu10Vfq267Y1V749RE90Jo2G/hM6LDJNew1XyNZ29hCTMMbdbUBMtrmGsHqIIs+pdpeGz1tlR"
+    "hu5Ti7JoWeRN6q2Yeow1ok4AfM/OcCOgcOLiS/cRAeTssEC+4UkCd/WIRyiBGeeOp17KBFcR87IG"
+    "oVHt/b3hjlPOOy/GWostqhT2AvgG03/Em0Dv1caoKjCyHXyPHEi+2CWOigjjfJczDmjwmQ4kRswL"
+    "AxWV/xhjMEyY5PcADftzhKxjCYvH3MTa1CkcNu/oAZaP3DdulYb32VTlPyFIERRgLXjTC2N4QwsA"
+    "kIMnPGV18cYDJzkYXFWkXGF0hSdi6BHH/xiwphh1g7v5FXDd/CHgvJmuxb8heFKzb9n7riH3XZy6"
+    "ysdFaC+AIbY/k3htGSuoSXHa6Rax+ILH0fHcmDYynepv4uxTFOLJTJ778R1xzn+eISthPnJ2d5Jw"
+    "c4tsDuar4Q6+yLn909ceM3dj/wPRe7t70zt/qH8/MEZ3kRnc8KXeXWn+v6Uhl31NFnsT9fiMJb8P"
+    "KdK4ljfp4ih7EjvuO7C9Ytvjjmf7SoYFt9umbbJP63ntaUJjOm7W/FR5NNY7eA+ANlUmwZpYwppX"
+    "nyZEoJ3uGTG2NVTESISmUawxRC40AtMZ7GbfTQ2G9w2jujt1TRiWJf1NzbSCugOLwI4ycGkl226k"
+    "NpLsqtE1rILBNjyBhChQFt8hJ6qg/k02/CBr89CHn8yTVOqMkpRdtNCoTWrj52A7fpa1MFYyQGej"
+    "SthWS8olEcENZbStu/Q2FOx50CNJ9iY+wkMay974ibojPe1+8r62fNBoyL+GMjRWMM4ogYh7Tvtg"
+    "nKCyD8Tim/PXcnT6DPMwaIVBtLAGrRkOM4MaV/rL6ozeUViopEErnGsETPnpY09Wob7Xnk6nMy9s"
+    "PN8eBVrnP4yiPXY+kx35HsD7xtc0EkQxa5+rcYjTBTa/2hvo2/urRx5umLzAu45L0DFe1e3EnwPv"
+    "z4Sx/5q8+87c3/OJu5L4VzmV4AEbjc0L0AGuEl16/+8Q++98/873/0+f/5sd/+8sVDd3bHT9/Joj"
+    "FvrtG702zoMto61kNhiDLoHKQdl/IRZrzx2TvmHvKH33TJguBKbnoMeq7iONCryYD3rXjeAArAhg"
+    "d5J6pZnGLbeUcLHeUu1OAHYyXsj6MHkylULFfSyUO51ocs9Vpp8TeaoK0bCGuiKT81GF3pAcEStF"
+    "XGH240WNDzlPs0ilhHdmFSii0l1zUKTOz7TTWT9/iqcOywqZUW3MSNt3lie/Nr7DpBcyMCm4UOdD"
+    "BIyOdCW6C36cLPoWzOFR/7yM0iZhhCrVPY8bu43mgzWfPlCqTSVyyxEWLkNZc+SD2w2lerVQk/9v"
+    "CFg78Kq7f8nUL0Wz9lrBj4rRdvJ0N1S7EFYZHITQ2lFSO6UYDj9UC+OGBTj6JwPsRABtohXZ8rLh"
+    "2Z0kKMsvdyfEYvpIrWT30KZdmgbsj0xQKBOHXMACfOjOmUeWs139a4yWsj2A0FmtoTX+yUYwAcNn"
+    "xi08/IkhJD2hQKbNpp6cKuv/Q9qeHlSjYA8NClDsqWO0iSRjAXRLAV2yuJHTrjBHh8X1ir/wHdt6"
+    "IxVlIXcBRuPZ1FoGFb4eZbv4Oz2ZYrjiYY2GYx3TgNEhe5ZoKrWYIcKj7qqzZDWTEABz5lTKl0T1"
+    "Y4Tq0XvMq2NlWBX3rbbS2KO7ceSIqf0/hHfNlVEU/nqfSTbN3SabKNy/g9PcmPhl/NFzrcvbO7mq"
+    "dzp/HzRtQfuPtHu685+2e7H37H53bveOcDu6sv4WUB3hHFY4h8bs7KMP7BjwL3gyxyL/iyiIhizy"
+    "EU+1SdDQ+/OWcs8Ck0XCURFs5EkHHnFrTElKHBz8kXEaqFbBPXHs7Ltgdl2gVO8hS9QuN+FMKSwx"
+    "eS/QdphPFy8vgRmUUvTkvK1LlgFmf1W+XAFS88bVIEv/MyrM4LyCXpU2hAxR/6+BXmN5kIm5nrFq"
+    "DIll6vkkdOv7kupcp43qDSb0YXJeMyNW//ndigNHhLHFlmCGwWI5w4jl5pSEY/ZV0Yn/RRAvKMe2"
+    "yAg26vILcSNduAzBwhDvyVkIYYnOCRa5oxgZkQtBvJyh7ygqvA0hxsLutYLIGLhr2z05u7/JBH+j"
+    "V9Cpz9/VDVnFZ9aVPy9CSB5wLkdCHNIeXTySnRQdBqf0hfiLBjQhSsNPmiznKY+IKftDeD7GFk8a"
+    "L6ekV7Jv4eM85sY5zbd5JArEgKry8YqUh42Qz68IAXeOIHfYQrMCTqdnx+/omHH771E9/69NO/9N"
+    "hDu/zuyWV6oUSA0XiZvvoRuHjFreM/+ND73vV3/vSt3V+78uXP/ssrRyddP7Ohymfq+Ja1tZFwSD"
+    "LRcuB7ZFgskXciZyz6FwKTtDIZnFk48sqnt+XIO1lsizEmhEiGyM37eCYVaWCFtxZua0LqKMcveO"
+    "hGeQY+V7K+ku5Eg73i40/puTLBMFseJG1xc5hZpD5UQNrYaB6/wyu0QspLLD7E/WI5058bzxC1jT"
+    "43m/oB1ErLlnjLZphscODt354RYvgLd1ol5SohS27Vg/K0FlQ3gcn8iaT9RQUjfi+MkotDR/EVuu"
+    "X82NvHhDp2g6nIxEanAoR3UWm8F0auqx7oIrM+M2DcwmXyZ0/IIs6YpL763GpHY5/MB8cXDHDMhD"
+    "yxHNuhIUccsUfycy4IkKdec6gkUcZWhNQkKEr3HoudqzbCbkxaX8ZYgqWUZu2bxchZr0pHBLkckW"
+    "nvpj2QIiUXQboAVBc9xNFYoZP/8PtlCoxIVBLxgyMDS5mc+DdxrV7L9SFn/JxjxWh7sg50DuoLj8"
+    "9prTG3+hM85OHndI8tcaEAYmyQqx8Kzkk1VYtT+8VCZOVqoz47dzDXmHpd/U6DdXyUiW7+6GfIz4"
+    "lFUnpgCAjj4tR26iFxmUhBDORk9DyFVfVyxNlL6Re0waK84qdCTvWsArVDfm8cdaZKa2K/mbkTAO"
+    "gTC3CR4wW5U972CAabuTxd4O2PbB7O8zYxvuzKt1hez8x+frJ74OhuHsQ9u3v1H//G7gff/sXdB9"
+    "5/tHvkkc/Hhed55SD7uWwGXbfyjZYx4Ldvpf8e5d0gbNiCf8Tn6GKDt6Ft9SOWyMe/+pgytPx3Ok"
+    "0miTpvi1bjD50jupx7kVJ65YmH2IUxPtAIh1c1aGME5mAD5XBdfT/0NQ7QRU6/K1/TYKyjLcQ9EZ"
+    "6bOQcs8RjMYNBfbeuMXbxpJznEDJlkPEon71sJoenH0lMSVOlpwSGMT9hVHnJkxGz2HvzR79jEP/"
+    "yfWFFY/Lk65mILe+sFRGSIUeeCdAriGXvGTYixP21eucZDfPvq1G/hTH1LXfPMyHCJnIlYutnl3p"
+    "sU237JD/4lBsTHP+NRv+ho696r7LKfirdfjZ1Vf9sQbAjh+U9r822tN/OQ6ebuztGNjKnib001Ks"
+    "VsbwnJRD84TOoAnMQ9uJvamAqjrYL5aqG5ZJCv1lz1DUqk3NiuVui1sswCfYFgeWGfVWtRalt8fR"
+    "j8sJHYfKE8B3MwzL2XtZb3c0mnLtyTGRrHp+e//9hDD/zNd7/l6//BU1/78GcqibXL9EKIALPHZX"
+    "qBRODrXv3Ep/7cM2/722994tp/8+Dp3Y/dOLqaEZVpIaMm462bplz5QXEmXp7+nOZzdae548Pn2C"
+    "bk8EkdpBmQTJIcGZVu/li4IpPDQc6mIAPbSZQFU94qyMKP5CKcQT951CxxSsGFW82pv2FGp5vAsQ"
+    "MX+eBy7UYqGINdX8Hkv4D4hDVxkvXVo9CWPlK1PzbcnBUj50ygQXWi7aZD2LEnhhva6IaGLbA4ev"
+    "OCBgsMMiA2GUOy1qMMXx2Dhnwu/RIWqwNVn/G3cW4ZfZI2xgT5FXMXvPgYGpLbphHZ8Qtr2x+0HA"
+    "0fXmDHi7RmqV95QZHfPjG6oGkv0iMmPvkcYIjpjR79tidtxh/JjRFCwaEu1kc9bPcQDF9HBzqpbx"
+    "1WdQxxKW9ZsI6RXVcVc0JsRDG9T1OwryDHH3co8lzUG79Krv4BiDEgNijlxAKYjcSqz/LRvqpI44"
+    "j4gE1NU9YGCwn6bzGW3FanOIbY6pPyR1W3OEWGJRFyy4+lv/xZgdDz6OC/PH3oWFqyxMJ4RGalhT"
+    "dGho9vRsI4dkwfLLgEwUBlFta6aodCXhEAqTbbx6sCrQttyviAXNO6rvHQ8ngzMrmEsOoFcVpu49"
+    "fF6JqptnHdJGoX2/sY1Assklv16DxTjFoijwOAVd85hJJ4ZW+TewSp4WiFyZPPjgWWcReJEwtPvu"
+    "yDxey1bMyY9/090YxlvgTl+tHp7tbR7d1j55/cvet1n9t9z3dc3T3yeHrocb4EJe+SYkGsTznXr5"
+    "Rds2WTl8/jHfE7XHny52savO0S+zPGV+zoa41FfIqza14kzhz4z1yCHWkzxhqtkOHAjgO2DXopr+"
+    "kopRQ8I5TUSLPgLyo06sGBLP1nNiOLPgv90ouHVmb2nMBrqpXBQUdfIpU8UvZG5P2HVhnbLHTGfn"
+    "fH7JDRWMfYicMLgxem1jsw+gJEZRuKtOmqT1CKM36JSf5AxjosW7muMlfrUd3ew+BXX2hPK2ZzBX"
+    "thzOamOtXt/B6MFDlZp+R63cvA82+w5E9cqwwAx2G8Uhw9bTLmo1Ps2VjTh4LZ+YCxVBjnbxBnCB"
+    "cAACAASURBVOq2fAfbfPgGFrlDWnAZPyHzosjzJ9nM5UfFubWTsFm7qFGTXGF4YgT0j8668eBPWu"
+    "saFagDdecwjZHxjzG07rlUaEnhr5a5YmeOfYWCk//Kc6Y82GOJy8JQMlhKjNiS1pWBABBb+AVprT"
+    "Mo6Cvf0HR68clbN27+9Lc+/XU/86Y3PPFpetVlemFF4LJNXljtsfu6r33Vpz/03mf+1p+6efTTD5"
+    "5dfCLzQd40nuk+m7jjq7nhZgJjAuKbi7xBM1gZdNZjBq7lnCLLU501OJmkOjh5JSkaDN6IkQrXid"
+    "1Pn4SHiBNDwb2lLAx0nN4QipSL0lw3XGYCOXCTlOtlj4m/Be8Eis9w85crE550Jm0glmz42hF2UZ"
+    "mk2TikPD5h90pWOsSA5CbDa3HxafGwy8IZtG4aEyM3cci0LtLl1+e1IV1P4nxKiaGIL//QBLNRgm"
+    "ftFbJ+ya207CCzErkVcxdKo4/IEuuNu7GlTqS5KIQvHOds/Fkl6k2FkEa2duhS5oqtDcoRQJBs0s"
+    "IznxhtG7ax04Xr1BN/g4n6Slt90FVn+uNIbRvjzehmOBTqUh+aAXWhl4dlNIzPYimG9krN7bFKH8"
+    "1V1QEJWvpgekJMgpz+xNgaKOJBnUjtr8OhbmNx0YmFh1jh0scOE/GaY20+YUsDC4cpeyaDfAurXd"
+    "YVWfQqjF7s4ZP0hYnynq67moCGOWpdiHXFGrDyKdQlM9Hqny+slLFsLh4KxjkYYt5/F4KYtFzvlh"
+    "WtwUsf5m2qvkhgXaogZjVbZfDn99RGVe464b/2IWgMhYPqSEYCdq8WShByza2rbtR1AmfsEGr9N0"
+    "0zRkDM4PoCF30KGzmc71IbNrv+xmg2c/z+W/odX1hylMUox9XoOSegenZnd/v2F3d3n/3I7i2v/N"
+    "TuL3zoJbtXPZmPtlzlN355XTCbNh6n82IgyXkginm7pp+jCzafnctPBOetaHnbJd9smb7eNsYvjP"
+    "BfH5f/lIgYI7ycyNinqyuAMpzQzt/Uz/rapK17YwxfUe31FIKG4PWbPLtQPhRcYzNXx2bqmQXqiu"
+    "V2FQh7tbktumN0+WXd6qnnGj+w5f0k8rgZvfbL8tHtDIsfyPRvw9hu1pHXzwNcFu/EOed7jxSTDJ"
+    "U5dJcMhLnHTZ3Gs7aINsCkvsSEF6HwGQzBxLUOYG64MOuLcQl9m/voF1GGvsVsc278j7x+gCdvj1"
+    "fDlJNy6RyFf8ju51ltKKS3sU9ksQsxoPnHky0ZW+gwoE9egeTTbqBfSf88Pb2yu33nxu623+A6Y2"
+    "K5hO/kpwzsSqCWgeX8aaJUlIxJJKBQL3E2NuUcA3wAWwWgSUtGZQkQPZYudldac/QqI8vmTCcgTg"
+    "Xu7acwgnmAg13ebr3WP/WfNs6nIE8veBr3D55+/ZP/w+tf98TH0lo0xmV6gUWA0XeZXmAReOrJr/"
+    "n0977r7T/7yit3/t7No6Pfv3p0fOZTJsdfF9AMxC4OHXAuDLs4zhg9HKSpGwPUr8BmjIeJHoPXdJ"
+    "+sC5IsFnivNPm1aMIeEwKDXPyUByEwcCpf0NopFW7LS36V14RieaEEfGF18hqUsYttFzGiHmCHj2"
+    "/bAkuc2l0+eY0+fljP+xj1C2IkUrC8ZMDPn3VHwsqIJH19Hk1yKCzG8ae+lgpeNQDNjcWFAfmRT8"
+    "5NZYygC71X7KWM8XFgTy8mzmpFPTDrv7TkkXfzyk1/VWIJcVV7SUvY5PDbpHl8A2+mDnBZUByqSo"
+    "uGclXVfj2UQHnfDUcZQ+mr1m2LQeylcuIvXMtQD1Njha4wi6UP44ggi9ErJGqwErqWpI8MmzCze+"
+    "LqP9C3WFS8kqOTyPgHsfWKxuZ47ompJ3/LNfEiuzZzS3TZA2fJq7PitFyLQn2CsGJCW40f0MBYwJ"
+    "aDOAR8XAeW9BmFwxQZEu1He5HQFwNcfBiZheUVH6Tv2w5xPKr9AI6tuQA9uJXkbMJPhMdOacPDl/"
+    "yxeFMrPnod2XKLxPJ7vTCDNnZru2f8yjYnNPphaWNF02tDvj1ljch6kYi6Wi985eDPcZNrfGLfo1"
+    "+hg94FcwBcgPHVIFQvPxuQH/3mR73ZlJ2xmcu8cXbKt1WGFP/yCbrdg6df2r3muX+1+75XfWz3H3"
+    "//c7vX/ul8EvtWPjN3wefmoht8f5Jgx+fn6A8s7rNxY4HvJinRyhegsKDDfmDDR8YlsH6GknIY1G"
+    "tRgEWWI8l62jEoSCktOvSUtkS1+znKCOWfKIPrwVOiJOcV/WR+MRqlE0N9aNw0HtpeBhxk8H0wdQ"
+    "bclmkL3+aXC3LYgqf/+gHeVMv2gD/66JoaB6s/vrOJW7Zp64ZGIwGDh2Xs9U//wEPEGHAd+RKLdw"
+    "9ttU/8sZ6RD/aqw77OxZqmKX6k+KuN1qnlqRs+Wt9QqQuyua6nlgbFOsCDva6p68S7m+SJvXUCY2"
+    "SRHxX1KcRefTzgWa+FUX5VD5WnF6IGebHovAwuy6v2XBnHIV/J97/mLZenZw/u7vLFc+nT2wbIjV"
+    "B1C0c0p5VCaHXL7xxd/M595OMT9ku2zJg5qGFoSWJNjHUKQlmcRcpY7xPyaoNLefG5bv1Vak/QiE"
+    "zlG6PVF6mA/o0uNnkBP99a6Ws8SHfNN1hczi/upq6/8KYnX/vj3/QNr/3nN/N77OVenl9oEWCmv0"
+    "wvvAicv+3Nb/jIp77wpf/uzj/76M1PPH/yF3bXrj3KB9aZRJh6s8PLDbjfxMgQd/7glEInAyYpFl"
+    "05cUBlojG/VxgVB7mTQwA6GSADBrqTgDDbs7xmlWXaWuK9SUAuxmgUPa8Oo8vTMxIyldP98HjlmV"
+    "t/tFTcY6AnXU2q07oxCZEoe8QSGMpTb3hYz+RKyVqhi39ZIK1JTkGFI41fSDOJMtHnQjwHLlLFZd"
+    "OGV/qymJFbPnGtT0ChD9ZEiBtXreSyMELSQWwjasHr8nNvprytjO+HCTth9kVz/KwPitR9/Vk2aj"
+    "i1rmncjD61m1igiN7479ot+XX/NF4pgLfquQfbYxnbNJlxG0gX1tFrjDUSVYTqqPSxbz3Ui0WbPt"
+    "focnuqfwimTEUgU5JPMf6FrH/hb1jkWZRgbtTWjR6prT+EWR/rG7DT/VQEPwM05+WT1os7zsAzhl"
+    "dYZODBOIlo0mrnUtl0SM0pFMdG+mKeuLQOwbCPCqlsWqQ6EbftUaevCYSHrbc+hMXPDfTpLa/gJ3"
+    "mKZ6mc3+Sp2Y5J3vLn04fQiIlxrYPxTsWtGSjy7j3riA2wV0qhTRIMxqBBRDIokdUndFI3f1cseu"
+    "pHyZkD36BpOxxiMAlaF2pgZQG9GVZjSekAsstvoYK7PLVu6kMBJDbp9BHEXfyXnqveAIC+GHsz2K"
+    "C9WKI6d4ePvvS0Ff7xCWcsd7z16Vy/Tj1vh8zfLk/ObMzs5K6k37Chy9eg7G6dPLd7yRc+vnvHY3"
+    "+w+8t/8dbudV+XbxC/nu8q4DNzeRulO8NImmLTnyPIopa4sKnht+YuTnFgRaEVa3OgQPyoZXxI8o"
+    "VEQhEKyXiYy4m2IihJ+IwEm15I7aOdKyD4ehZtFqGqkEd3DomgtLyuFGu5GyP7IkTEVjIfvldO9x"
+    "5ts6GNnaVKfU08Dd3091yMt5ll2tb3G6+veDlYFRVkxcd6h4JU61MhbFrOqTgpw8LoVHLDCMW0dO"
+    "CTnzl4sStTK4UBkANY2nh4JYUzbQe9LGkqoJd/9QSjjsxj9O5cUwH6tf0mP+lhljhoBwPhOSCh0R"
+    "L0DyzO/KLI8gkceMVmlMDmtI8B9n0lQmiZ2GDiEytXnNARCLww8sD8ZAG/4xgWZL4YxUzVUtAjLM"
+    "vOmasyEiiTCfacLc9kcz/Hutqh8KUw6FU8hCjY9vhAXDwQQKo2yOONMLAmg2zjjiqyeM1V5VxJq1"
+    "3I0r75W9iJFe2JKnNx2yNymUOuHx//oze+6uX/1TPf/MZffZDvZLpML9gIXG7oXrBNs7v7/W9/82"
+    "/ePT35q3/v//z1m5+/+ugP54nOQw5yBiELRgZhZgM+U3fuTxvwOmcHKuOcQclmg8UnA5gnQmsS5q"
+    "11flbJARx+rk4KTADMj7muQb0mC7HC6fTWyQLoTU+QEA4SGCSvyk4eWg4nkOawiGjxZKbg4qkTWG"
+    "pbnJrGEaTFaIEJixtKJ7N7bCs6+uSTWEAig/9ixaZmdQNrlAnGMljfkTeOcJwRKeMjG6duskMQWy"
+    "jjPjr6jB7lyLCqIa+t0u+JqQD3uJACaYBaSNtWMFDyvILLTTSAcLVnfStje6KHwfsS/Qh+zVCXCF"
+    "hXbrTFg685eZK7aNtCFoY+TF1ZQIaENioNrTnx82sd2gQT0xUqv47UD23mRNvZfniBW/bp6lVGoR"
+    "AGavxd/QIj5jURLJTM469qOS2fqf74DcuAEFvyo7baxP5HP+hThdXWSBGxqrAZyyORqcNS3ZBwQF"
+    "+oI31kbrYSZ9OF6dSZJtZ15HW87aKLkddeCzWj3Kx3ZKI3dvSPpVWH3pGPbMBwqZZzegY3/PBdL+"
+    "l/ClJyiSP2s0XB9ZXHh/gHf4mTcRwe9EO8RwQ945PLDDPVFh22KbDrRYcSiHFtWG1sahsu2ng/Ms"
+    "kbXyjjWzcvIUwCC3+qh1wPMBgDW3+KhGIERpmcNMUpR4p+6Xoqw9OpFHOATpDIsVbKi1n2H76UJF"
+    "p5MsWXHF+/dn139242cTfYmGWRdSNP7k5v7x46vtjdvPPs7g0PfHL3wR/IZu51eYvl1fw8wXk+Mw"
+    "ccuz6+5CQbQBvVgISWt3D6Nkye/N1NPfjNOfzKnIhf+j3LWe8fDQAOJdarXpugdaON6CnGIyJt55"
+    "adR3El9Ss+9VZaTGkB4I+PE/DmODebhC409LDdxDWHRTQYZyRQKqPtyUM7HOeVAQ+V2tz3D3CSqI"
+    "wCxZPGaXT0xVhkv9yKKwIayfrEZ2o5Sl4P+wqih36u6jUW9/arAQRa09UjT1Dpn7UoM2Xp+spIHi"
+    "/GldrRuLp1mTKSKpWuJuV98oWWFHu/C26d3fQ6V428mzn062MmDjTL9Mt3MDj9TQ6yy966rjhE1i"
+    "e3exmQLHGyvajrpL1YCEhyJDmX8qPi19zQ+QNRBCQVoT8KiJspqQHr4A+OvU3mYEIkBcMXO1Jf7r"
+    "vMmBOgNkuFck7cuNn4P203phXZThCxseys3gUptPgNJ1Iptkz/Uprigaa0g/LC9B0G0SEEeLxZiP"
+    "9ZU55cu3Llf3vqVS/7z7/9m7/+1x+66Q9uBuUyvVAjcLmhe6G2TPw6vn588oF3fctvn5zc+Zu/+J"
+    "ufeOwPz4+++/bxxUPcJvjmy6P8jgrpbHsawPcSdVCugc0APcsCgwHL4F0L/20h4kgP82CCWa+oO0"
+    "n0fqAdb+zmmCyYzDMFzMQx5M4iW+Egw6SRIuacKpPRNAAk/JNSqd4KXT460SAFhw2TKYQiLlT8oZ"
+    "6U/2Ra8ZATOfDG8uYXlalcOOAbNDRqA1f7OTnKy+6yyQIsr7HP5g3dxih8pFPmd6Pw0diHxrVPei"
+    "qz/NevyLvImE0nm5VtsRXdlRqDxk6Ppg6tQM6GCx97k8m7OHQdur+Rx+JTUmJCfcmHRIT0n0AgEh"
+    "Z0xBuj5BGOPfsJdP7we9URPMrIDZ0sSRrnJZMsN8Cobly8qdxgbKxsxNkA5CaOLaOHqeUkOejB3j"
+    "CwU/DK03fBC45PDoZXYmiprNobAObAiE4ukLtAIZMEz3R4xe+Jz/Ik+qw9dN+lAVFEDj3A0ZiUTB"
+    "cI8IqFHXIkzzkZf8qBIv40lFcEUq/VXqv+6O6tKR6s2qDee1+QbGq7Z1RiP8dmkzaQpiPjWXQCh3"
+    "n8Zy9R1NqgtGIrDmRk8V0lCGt5Qfxa4xHT0whHBpuayglFe2QJ1ps+z3jjhZu16Ncy1nJEg11Tvj"
+    "3SIhAk/SBuFmJixUSupYrNwm36DuLj1ZZpmwCZuRrANd7oALx9MjSeRNIpkOlTsfwcQXjMF/xEAT"
+    "8ezmfm+IkK3h6F/HE22lfyzqfzL3929/KzT+z+/Ptfsvvmb85G7oE/jhds5mKPH2zGTr4sxbbXB+"
+    "iZh7Kh6+/NEYPYzdO5o0z8tAw/Wm7deUHCtgvGvmbJ199kmiZu8Vh92NizPdXDh9Cwu8q5ki9y8w"
+    "opWqpMNwNTVie+EStMyOs9EN21ydjzkktF8KtjteU6zRnJHODRxxYU+RFCQjEIBqVX6eI2hxiJkv"
+    "WiTxB7kmCxoX4lNnzm5WooVo3GjvoIuHEGj7JYaIIPHec31PCTjw8+hQ3d4aGs3U7RznGYiD6qwS"
+    "we9smB3z6uDPopM8o6T6BLB8G21JhEL2007ly4Bxj8cEj2EzZyykoIhg5YoGrWvU6NT7DaTlwrXx"
+    "995SL+4n3rGT51qmavCx/d9PO7Fzd3z+ep9d1z3oKclLbaYIEPifYCpQnKPsrcX9ZYRBo55KkTHP"
+    "0LEQRwlz9kW1OYyRVWKi7u6w3e6Ol7IRRfOlUQApJwewOFloFfCDCnpMWYZBbG5gZ+9gDo/PT8dj"
+    "5z/3889eQr/uu3v+WpDz/0wHG+JvcyvdAjcLmhe4G30I2rR7c/+B3v/JXnz86v/Pz/+3t3zh689f"
+    "6L46PH+P0h5nBfYckigU1YbvvWhrHq07dcGcC+tXEmBb550YnPcyciNmZ8xm5t9q7wVdbB60KImX"
+    "lwwQgek9aavFyoMDusCUIPpqg82uhnokPdHB7EXkpVw4/iKkB94Dj55JaSlUz9jvayrWYx0QFXS4"
+    "rs/ZMKTl/uru+R1v9grHpQp1V/6xdFYgufTdo5X64AzRMbitzoeg+LDDe9yiLBE1PiST7qY7O3PP"
+    "zncHMQJps0IbWPneqgCOaW0BkZqIc8J2lh9/ZoU26cE5hcWdSqmGsy3MBcsJ1YJzHtG1hEMIfylO"
+    "uH64upK0zZwaKHuKaIGJtasfAdn0eXfGMOXtPhiwqrPrQBdNLSFaWkcemgT0bOeim/vBri4NSP0E"
+    "j4wSVK2OQLHPQdWv7gLZcpUEtu3Au5daOIpEj2A7FUDtlU/FWvBYqa8Y8u6z2+5EI3rV8BOGOzEY"
+    "7m1EPuQV76VB51+NSA/gi5rxLDYaSlHKIb3cGoTvwcS8ZZfSxDzzhM1bmCTj8zHfoAbtj2Z6VS2M"
+    "SiSTFjZQVZCJ1BmL6Tmq4GADy8jZ0c9invaSMTAuOvL47g33iJ4CR4fdGJeISRhQqLHoOTi1qsPK"
+    "c+qLVtyJGIJWx7+EQhZBTHXt9OPfGGPIn4TQMvUtUC2FqDnbZHLhXh6TT2Mtm4ieNbLVmM88PePE"
+    "U4OTnJ95fkmy3Rzlx0/eL53c3n/nD3mtPf2v3Id1zbfed33tjdeDRvtcwva+1Oi5PdHQEqjSdxxz"
+    "zdyxVbHJFjM3fBfE8sw+3bMGl74jKhCtt8LsTKcSwPBoeR6tkA7xWxrnoy9gXbIPghUvc2PfZCYE"
+    "4y1imH0XsL2vBXat4+Hh+lT0yJK3eO8gaTeugBOAdtbcMOjzwyy9lkfZEH8qZ7wNwE4Q8dnfytsY"
+    "otOHz2TAlsiIfO3g94MAYlWVDAIbsUKERMoUoSZupqh0YO8j2pcgCBp374+GcTxQVeJFh0MtXIWb"
+    "v0hmHPfII5bY4k0XPU6ZsnNboZjFUnuOJqR+iUWazY2zAVPSo7qXUeH+gcwMYK9N4XGp+6gHV4iH"
+    "CyUu3z2GZse38dfAXTLnmhhJ8suHv0wO7kPE+vQ9fu2GrwMV09yUFfm1z8IYiYqAi2kmVC4h0NFF"
+    "Ut7uoTtITxGtxoJ1WYWpUHUDmy9LmkcJqgJWaI4bfX0WkosUSMEVinCnD2wFd4g8MdAjp1zJO5O3"
+    "kH2Idf88qX/di3vfWpX3r04etf2mwDd5lesBG43NC9YJtm79jN68df/qF3v/2Xnj/dfeGf/u6nn/"
+    "/s3d0PZTZ5lN9+9MP4ziz5UGvKvQl26nCSY8CHzsKDBVknTGjIRJ9FfYYymz5oyHjlhjqTQkjS8M"
+    "gfKmfRkUXFsa+4Og0EIVf+O5OZ74QRJfUxw80WXEgsJniiRSks/MF2KyENDnjMydRzezong7pGnr"
+    "/o1oswxB+shUm9Uj82WVVFmrq3ztDQwyv9sNhYiR19eIokR8a3iY1Pm196AWZEUi/rIuZMnuSjzs"
+    "F061tlI7w2jr1hUR+i03pFLPnGR7srr5HWhiew3kwiueLJE4nV5mBolApgTwJt2bf80XHsF8BNah"
+    "xa53ivPjQy9DF9Dd6mIm9iioXUQRmNRSexXrLFIYxz0xnd1pS2tvZxdTzNZeniivnwhlvfYAxF38"
+    "GIjP1t6q3IgR+WVQOJutTKWpDICmb7ZCRkd1RsttWZUmGENZ7m/g2nA3/WeFt41Yvf9AHsrRj8m2"
+    "DoY1H8E3WMLnXXHUEazyG0lhObqdSftBPbLmppImzwF6zVJrqGDGgWcDD8yDCksc5HUtis6cLyvw"
+    "4XlEVF0horC3/FQowoGxP0OJDH4BJSfwq5KFshZeKFGvcoHCgfx1nm0QNSsgfgaC9zjLPksb8kmE"
+    "NIKy5wC0YcMhfkKRnjEwXGA33JzwaOFfxjVgKPheapG/xs5vwSlL69krdgXr16w7jyBSi38hMED3"
+    "zhD3Zfe/av8gUoV3fv+87jbOa+EIRs5vLfBogurvFWSjZx+cwcTwT9vNw8nYsnoYWEcSuJ75NK1O"
+    "+erHiZtilKTbbH5KnPKm8SGzZ9grpWCvPMdcqNjC+0BIHYtQIDHJqRpwpu+sLnXoMvgyHy6LUm43"
+    "P4Ji7kLXIlg1avLSOj9MgqXFLoqiz5EbW+uFLgCkVw3BMMSOSmC1dGO+UgtM+pkrICFtTVeMeMpq"
+    "ZeehjePXD0I+/FcMMZKMeYjq2+DHx0Q6tvra/2tIwq+sUpdxg6Mfj4BoA2BzPlxoQ1Bi+IYmMcof"
+    "EPZPGh/Najdta5POZln2DFF9yhhxgSrpaACEPiqjC+08nDw0bG32m+0uNuNnJ38pSOtxrjI2weaJ"
+    "Or17Xh24vRxFeE9Jk2oBDNlPFO33JlvjumDw5dJqIk4xPWZKXhLpTwOnetjSv2wkGYZCyxMy2Dik"
+    "hqGwzg11qi3qEGbvRzol4OeDEpZ+aBn3UcKLy4loDcPT7f/cYrHn/0x9/zTV//D5945MYXlwu4cZ"
+    "le2BG43NC9sNtn8+7RB2/e+YvvffuvXv3lX7v587/2m68+e/jRd++ObzzoGM38ccW3XzJgs1Fgk5"
+    "aByg/O9gnQ2qhlXHe15SBnEPfJF5NKEjMCCxRgIOS6srBJbEI6Ke+HOWUmV9YLpE45TDchwAjIwF"
+    "mQDiGHTw3kJo/90JiAyDI3k5xiIZB3cu7moBTkMzmF74SIHnLZBULbJucQrXt4/VptsIrQc8vFiB"
+    "aLsGVfOaSWneRcOISUxIaOhR1TIpg8pVo+VeLeMzwOF3iDPa4ArFnrEzV9DA3bTMEhCMb5YIskH8"
+    "bCWTbQ8y0WSARHvAgt+6stVpyCYPzgL3NYt/azgcBB9Ba9mNiOFEQS9bBcwj2yFXBhawwQz7GvGe"
+    "oLSOHtpA1krWhkRtHYUOBfWvu8/CGis8VgQyQTX6OzsFugXenXBQQSXaHJa9+ojEFwKhMgaW6oV8"
+    "zK1kbH5LKJaAdJI19Mn1SmDx/61ZiUj6+HN2/8SgcP/iz4qJPegh8dBxO6kwwS+dCiR11XbOpHyP"
+    "zpQMQ0wHUy1BHVKW86YQcJ4OoglkNh6JG3HZCiDpJYfOZJHZudxIt4WL/wt74rvbjCYTzJF6mYZI"
+    "ihPoWOGNhT577IcaCVLP5Sv/o98Y8O9TEO4GuuMkCvOqijbD7p5QtFfXqPSnlWk6I+8DnE82zWwM"
+    "CqWMaBBVX6Wfw/5+23eVJ2zDdZ5jNvx5E/yU7z6vUbtvOVa7GVF87zc8i7a899Zvf43d/e/bn33d"
+    "p97/fE9s3PxFLa/S6/NcctPU8djkO3KxCXVMSNHfnweWulT+iS9TdMiT/zURSyEeg8SeUTi4YmWW"
+    "pDxIgHM53BsY60KU/W2Jgiw8E7LEJODluQ9jz7e8rGIiyk+KtMy8xu8KUrUyxlbevGsmNnYgoSfQ"
+    "cs8sHgvLc9rd5Op0xPe9+UD4I6yuE8CZy5NhOREKycAj0ZsGTtewd0SBTBIMMxMVmkda3gsotK6q"
+    "et6CzbXPPPorySOetvJYRHzz9kG23bJfTGFalqF3mfbxm7qE4n0Ido5so80zgjQBsvi+lD66NWfi"
+    "6Te2G92GzZl2qBM21t/xrz9S1koOX3hIllk82Xzbvx95LmxFIhSo7KYKUc34/zUwW3+YbLPME+84"
+    "UTNOizqVMqXOnGiypDEZN6pN6Wpw6tdvjaS49jvh95SKuqw968JaOcAcYI2PiXf4xBRyJzojgohA"
+    "E6ibPzaB1MGcXqVj6FOifRfkIcZo4Fo+/iQi75zDqZa0+ztfvoq594+G+8661v+rlXvfSBzyF3mV"
+    "48Ebjc0L142mr3yK2bFz/ynm/91aM7d//ar3zsU0d/tLvxbXeOd3ymLg9kOjBnvOeSv5BI3lS5Kg"
+    "KxkwITs0comYdCZmJFkM1gZJwQKFcuOeW3iQTCpINpRxl01AdmkwGc1GnJV4YWaeScspYCzuADMl"
+    "zAZOOUq5OfPgoHqDT8AMN/5JgQUx9pioYGnl4NDnRo4vIWMJyJjoswFtXIwedEQliHNtzKC9yJMj"
+    "pg6uemU02K+CmmvMr51jR5Q8zFt3YiOD5QD3CNBbI8vkzq08bmRVelfu79UFF9dFqd1qmSyY8tw4"
+    "NMGNzk3BRY7xBRiVwvc01pvVjQupWun4O5NniNSflBWqgCL/PSrXOs1ImYHEx05KmCaFJrQO4Qny"
+    "9XwE/8RWJd1V/4SGBj+MqkzCutYMEi7oiBhSTLGXjdyIeQ/ErEgeLm42Lcc0W/hPpb3HWG0zbFfn"
+    "2rL7RFy/fAWdj7UN7Sw73icEXKqCRPj7nw7cSRpUPcB229Q6veHp8yaeFaoJzxtscAbOIeohqjF8"
+    "GMQ9Hbh0Pfx2vs4NKqa0h4vtxrLTAFrg7WLoNb2crXr8FbTh5ewcenBZxrMQFhHlxjx4/HmgAAIA"
+    "BJREFU6lAJFu0Hb81Hyao7vBF3Qwq8Eywy6ZGJs8M2ttnM+XMEbLDg5WkaL85dyRO188idZvPF1L"
+    "47uZNvoryd4zO7l375d3d//l0P7r77/XnC/sDn40IeOfAW/Og7kfuhRYwu30NPls/GMfmtz8zx5e"
+    "P+3hwvAOJ7jkYYg/T96reVOENP8sIJ6VyDaQhXW9EApthLcjMyZfcGwkYTeQ/kwONgq9gxu9kLZc"
+    "n2JRb0kMs1gFhrP0k90E49dX3zp9jjLcLtezqDSv0Fg3oYR7CHnoxucuXf8tR5CBCTwqT/TdayGK"
+    "1JsSu2hSg6qsSupjlvfkQW+tSjcoOFKyjokEJDuNd+0ANAwKGj2w3JVEiaY0msFJ0RMNs6i4Y/3E"
+    "cjQ7lzgbkNpiWQoomjW0xXP0KCdsZ+pVcZ01Ca0J0SruevjYIUB7LBYUcXO1BEi3Peo2K37QwfLn"
+    "XnxZT5dszUI0Np99zptd2dfNPl+Vme0PloDrv8o71SMS2DzxGWNu1/bAAxk/GsLvogIHFvWnqlIg"
+    "weWMvfcKYMikN16xhF7E+dRCjqjAMSlhpPSuDCjDwHFNou7b/k8PcsuL4QFp4RjCPZ3J0m/dYrnn"
+    "jkx97x5tf/7Ctf9vBnQbxML64IXG7oXlzttXvkgeu3/4PvfuYfnVz8k+Nf/K1PX5zduvXtuS897A"
+    "B2LGeiyCu9LAa85TloYXTyWdVlYDPQGdhMApYz7C/87JdTg/T1lrCltz7j1RtsRJxUO3kwawCHL6"
+    "R1LX78Cu8wLT5YsjhVdcTuw1nK2HEqwi6TbIHFS/Ye3LWQQjd6asS/tfmov+jAD/fg5ueTt3EaPZ"
+    "ZbmCLPf63ufYFGic/8gdUnDcSd/Eh7RRCZLpjUWo60UD75JDd1rABxUphisVgElzY65algZH2FkD"
+    "ZBdlJfxW7ZWEd+xQoRn5RwzbEW2bq3h5CLzqq7LP0JFn0mytYzGeuqLICR1N2JQYpihNWkVUNnOy"
+    "obleUjQmBMGvbEE+y2/hK5/2qEQ9SnwbAeQ0N+2ar9+oMofsJLDVPKmKK9kjVG+odryAzGht8M7e"
+    "ITcAQmiacumEng5W9ZgaR0ZPRkydZR2KZVn9qP7NhQZwkFAT5p2K2PPtcnFhVjsDLjlkp61tz/33"
+    "n5gAzqh2X8ugcyxlq/Lu6o+ZpTqr3Otbg2tdu4rLJCK6tkjKy+abnV09Y99kOHNV44R14wRxCnEb"
+    "SNkFoxnxjWo8aSPkA9l19gbnYI9oJLPiNUKBawvt3Stx2Wxq/N8XM0u6P8NEEWibwdjKdzp/nMHD"
+    "/6fZ63Rx7nWcKNfGbugduf3r3+/CO7Dz1zuvvgn72xu/l4XkA/5gtQ0i99Mpe3VeIEb6Vmrsrv1/"
+    "lNln5uLneDfGaO37HzJwryMwXn+VII14z4vt5eYT3oT61AX8xZ0QpzRW74Ncj4JwLldsnecYE/aB"
+    "MvwtzPbTGPEiM4xBHG6EMukHh7B+kvqQMX6qbj0U1JDHjQN1zkBpeqhK4sAMnzx39PZmxPKGJrp/"
+    "QRlEVeOxXMecmAiy6kegSBIol+volKVHDj4XY7yfJzdFUjL4J4S9MQeIou+pMKv6/j+mIU8H0bsP"
+    "1ZKfGor/NHXgBYnxddWAqAnfZeLuKr5oQwN4Tk8QcSNrwW2zYOIS+TwYxYniAvfa7I7o0NLwxlaI"
+    "x+NlupyDL21vqmL0Qz0yvcK/0TRyGTYGVccb1z93h3Oxu63dGtPKGOzHWN6wLdw/BEsGMARepOC3"
+    "C/Tbmk4i8D0ICh7ZPf2jM0N7johm2SlpxChaNPs7EkQiTgmm38+gpQaXzu2nUbMknKRpiYjNLo4z"
+    "UvULOho9faqXO/Tix5YVypnM93JxcnZx99+aMP/7fPvPlNf/s1r3z02UoKf3l6EUXgckP3Imqscf"
+    "XioQdvfO6H3/fOX3ju9J9e/fAn/+ihL54ef/v5teOj07z6xITdocpCKd+Rlhu981pHvePdyYB5I5"
+    "PvmgJ8KpXSmhTY8KxFInahu9CJ3prwUF760GZ+0s3imFUB3n6yqqIuFGzjJSM+vJWwu/DA8OYGIM"
+    "Yn9YaUAtAqU5f6tHQQXViIoI4Mi0ZK2uiKATfk1b3G9XCDVz/X3UKD0ZgUJbDrRnQTS7CJe+Ncv5"
+    "SmHpNqk6k3tlvALbEQsY7wspETPzJs6rpYwkZ4HnCbVn1Xmav1jCAm8GfFlgbU7CbcGOJBEdGJHW"
+    "7u2Bk56re+tEa/fTW33M3nkceWVmJoLYaXXeCwD/LarFISA7gyITXpb2NLGM/9tldwa7uv1DdW2o"
+    "3Q4oG52gJa4ZeRGmLxTUVZ7JbTultzWIhpK5kU+gRySLDUGl/nsuKR27eq3UxE37hUZ6IciX3d7q"
+    "/8YT3AtByMVSddu88mMsaelTVvxw6fLEsNY5DGo07QOS1fadN1+x/I4iimdMqTiANZgcqTQBYGR/"
+    "IZDWNo7Ax9s2lcI0IbmEYATxY2tiAnGeux0XqWzlnNBZNylzfV7dus8OVAYOnMFSPGF3uhgcjCDp"
+    "X20y5/2g7hZoW0Ylrra54I3bc7Bg/Hs8BkccYXlNDHjrKpY86+ci1zdn6OwN+ty7eiPHj63O7BL/"
+    "3+7k1HH9/9pT9zsvvu7znaXX8sb7Pk2ytPsjDWKfCwAx6fn8tmjoYjv2yyaYsIX0pR+8nTGMs96w"
+    "kcdcMfga0xcpSMAJkJF5fKwYntLUbEhHL0xGIhH7WNX7TKN69PWiDeeIEP4GjF6rB414ec8abH0F"
+    "KkTXS7JwwuV/d6oanaU/PQkqyWT3/AKU2Gp7EzsvihfHhIVrfeGS0Imy0BPNlP0IizZe/toLJhTR"
+    "6ljZZMLdCQyaXcrjuaCiY/Ct0sF4HFfZ1E1hnIvopw2xewHLQZ487/XpcPGFxx2ebvMEFkt41eXa"
+    "DdSHLGn7alYyn2j9hAxqXi0Qmxjc5ceWqdvL5kI8i40rdQvaeu6iCeIKyuYnwwSx3og3x+D1zKeb"
+    "H7dt7WdJpxcZ5vuOStzrQqyTNtom58i73G4TBfREQm8GT800RQKJkKO3wvwSuL80jtCeOHPOpDZs"
+    "Wbp8761nUEdONYRxAUr7FFrWV9Ip97cue98NjMqV+to9Oz33ns4Qd/4j1vffrvvPbVDz/bkYrxy/"
+    "Rii8AadS82v/9d9/f8iUce/sxfeu+3/Py3vPrRnzz63LO/la9B8y1iPhVKqzqX5ebHAs+bYgZwF+"
+    "+5f3fGclCvgc/0UbkM9qzyWAyzWPFbC5XfhzxQ6ubkJmXgIDpxrM+vqTGyTrILgkloYSR/OAkxK6"
+    "1JyBmKwn32gVmTG7jke1MoLlMl9EXzyQpKSUt2XaH1FSxy9XLT1ZHSmdzZkOkK/o9PXMSChF10go"
+    "PvxK8EiWMbfhI+M7G2pK/AkrguegmhFFgeTL80IGR8Qpa6cpOr9tJfiKJspyW1/F76+ARtJZ6c+A"
+    "dJOpJg96pP0LHtzbwcdKBtfWvpgz9/iHhMRrvw54B56Msql68b+lSZ3KzmKaFx0Dbs+lGfp4zZ0G"
+    "kb+mlETY6X5NLCSOSf1QJXbqRkkW2dtvqHzliynRFCsxfzwAw8nGKLywIBWU/l4Yj/oyGOp46pyM"
+    "o5NDD5PQ5hr48IS8eTyLn44sqfZRmcJoEOz4u0WgfI/5GbC+I5tCfJguWcNtliVF9s1FYc81Y/+z"
+    "Gq/B3ogU2CTrfedBY0GOGDuepZSmWrKQQEiibqj5LLG66++EB71NNBjewyNBhSwFn0XtFauujQSp"
+    "pTbsouKpk7WETnGh4LybOUr+Qzc0d5gnY1G7C8cL67ei1vAwvotevX8tbLO7sHz/NJn9vP7p48+t"
+    "juR959ZfcD35fN3MN/mIGf35s75ZvE8YPPzKW/UjftsiTj1p7Xa9m8cZDn5wn8zTn6LV9sxRhIDA"
+    "Jh7ZOxPaLZJFUTrW3O4GOmjRLrsRW99qlgEdPwrWcy3cxNy+hbkNdVIyCDi78cjRms1Z6LTjkehl"
+    "EZN4dgbbrMp5QHk7xAI6Ns+W64w+fplS8uKNeFbn2uKl6QJhLJod/67e0EQx/qcWXRWwcIh2noiW"
+    "E3rMMb/4zd6PKbfGmlxjM0NEmrntNtQ2nsDm3ufUYD1KVNDCtJ7LqHow0jgU8w3UwRj2ykjGfllh"
+    "2xhVuYXNHLP0zJ9K0UZAUVtnnaKXjpg7Yn7k3dyZo0gPzqD+gjr3eOkWTVB5IFDz/a1ITNUPm2ow"
+    "veV+x/WOf+HMhzd/NzBRc3sqnLmGhnjTegzJzP1XiBlrgFm0Nvg0s81n1XtUihTd93LZGrMZg6gA"
+    "Ifl7a0CsrO/KPSSEgHB+cLZP3pZ6O7ny8LzFjeUmToOV371GciNEjS/ebus/PfeemjD/7kt73563"
+    "/29V/z8KcuN3NbBF+UmcsndC/KZtPpi1c+8dizP/reb/258+eeu/jIZ0/+8ud2197y/BXfFJ7Pvm"
+    "f6yehlwXk6w5inAdwcOiVmXgh/TZdMXHwbGxMVeeYQJwwnhk5WWp0ymlkNdMIFyMTEB6JcKcvWoj"
+    "lBVbiT1eSxyWyP+c5f+MkEy41mcHVqU6h/FKO63ralrLVCv8l64EASE1wXLeD2Vrm9FUHPIzT26g"
+    "j1KVb9AmX8SY51DbZJ2MO+bk49qA+pPixeo+LGGlvZ2G02IwsaNrmivmK64jCWNn5EtoSsRyjr5t"
+    "J6hDDOTCgg5Njb9xVynOdI8ptPqVvEWkc2NSwcmpZfrfCmFvEo5N8bzIHNtk10x0c/eAAU5tKH4K"
+    "sIAq6Z2v4SiJWMQz5C8ak/dlaVWZRMNeoYNsvdn8Gj/lA4rQyKlll04BNFmfU15fVWQPS78Y0MIh"
+    "V3HBFPvioiDbHI2xU4xVGKDf60wf0amGUXtpQQSRrhEkYO2yALc5Yg5NFtYtERqvJxysWapkZuan"
+    "5gJ8JLWT/3pXKmaoUc2X2bYWPUwRxlzUMeOzBY1Ol3aOTRM0LKtE7LASD5EiOHCLpCQ13morlhSx"
+    "5sxvaUw9cPTkPkktb1fIX2YSBPoss7N6BnRZAjXknL1vCkQR5JpBSxD9KY4Obg6Vgq0ScmeTLHRs"
+    "gnZ9nQ5W2V/ObclTwZQoxec+UsvzGXzdzV08/uXnX6id2Hvv3a7j3f+cXd7lbeZnk1C9esUw3e1S"
+    "j4BSgoxhvs8ZZvgYg1HvHiXK4nPEmPCF9sFTpvf/RbSPGQt6N5nbpOxWinjvhgTmIO4HUJak3sMc"
+    "mcWk2owYPHXJEC8VA7p8aTDKhQ5eS6eGONC0DwN9kQUyTWVTvkJa94r6qqjcVla3Slc0IWjNFNyV"
+    "6ROELZzuF3k1ec0sNfRpQuRkk5mwHbQAVt2SAyNdm+0Ijcq7eXXjjlR3FwtjK+0wbheNYpth7EH3"
+    "mt9ars+CG5GyC6zf5z5ikM5oAWV6gVfyxhYVnttQ2dPNibXerfNlgbriOegNI/0edi+8QXntipO+"
+    "RK5Awx1uShQx5M+myeUpPnBQ065QIIx3poJ7FgUKffn/P7c3ev7+7mBZSjvJjCF8jRx5c4JrSjjW"
+    "775SlRP4IWM9wLQwyJq/EY23xzLvVaL6JV3xZJTXttBCMTZe1Fl97FPbsvqCdP6ELHi7qIsdqEoD"
+    "mu4488jCXxmUF8890l6MDEfealGIqZfAXK6ccfeeTWX3/H17/hp97w+sc+oRiil+lFGwH60GV6EU"
+    "fgNS977Nn/9M++7+8+/cpb/+XRF7/4f109O7rjwi6jNi+AZTJg5GYqzWh1Md6ZYV9jynP4Wa1wmC"
+    "jYbHBdhxPCgW43Q0wMTKL8zxSFzF5pm2OYLA4XXpRJbBpc3CXfiQkcZp7C9NqycvqFb6UhymQKnt"
+    "fx0Ul6RMBYqbZiQ4Xc6lkpkpasuCzSs/FjAQZDmyMUPTdgKdZqrlaGCVbprbzoaoanTy0YX8rGXJ"
+    "thrCsyoAOQf+t6oL/itF5Nt07qjg/J+wRq6qR+nRlkL9ZNkbFrLLRphXoTHCl9pU8hW3bbPlBjZs"
+    "vpd0orTkpEr/UZbHzUbsrEYYHWNbTnD3Z1XDSqQ/sjuByhAE59UTO+Dlc/yB/aAJOm5+qr0lw9Sg"
+    "uRwA+tPNELhHHt4VNfBFFcm4ExJvQeFh45V57zPlgCwCHu1vFADFES+KzPWSMcwtTXURjfD7EXH1"
+    "9QFD9X2g+PSm1dwcaOOmPERYZSPfkK9ZjTkWmHgQdIVPtHVKBje6kYYysBHu3XxRcw8c7g2YqbAn"
+    "JJkQOzuAoL2npNPVoYGaBEmjpjrQdn65h4u+jCrn4XR3P6lnL+ccU66BO0A7nJ6jt9RWmuxDEHPo"
+    "fmlXWzTyOyAOVbLJM/z9OBo/wu3ClhyKLyhM/A0iHD43suH7h4bvfE3T/YPX36/+z+o2/97O7fe/"
+    "/d3SMvyxegXMvvErg4zWuxx3kyh10md5aD/DQBvzWXt266mvfpHG2ejVvWvXzT5i6/aZeZjQKNbt"
+    "9Hl6pxdDPb2liPIN+bqBepbUIefGnWGTQDZt1BIubFRwrefce0XxjiVD4y0DWAvKNpdJGErxd7uB"
+    "JCxAN0Ylds8hRpD6jlSaKk8/fSDmoRvMhsbbywiicUn30KGb+b6AdJFjmlXAHJMIhH5TU+9Vw6XI"
+    "u1zvQlaNVpHpwm7JHPEV+90geXXYWWrIWejNPSHZ8XJlBxDe8as+C56dcTqP4BVAqx3uvU30jFZ3"
+    "qM25Lwp1opF4HzYQK1NDZr6JK4Nr/KbbSUMOr/+LMMCEPco85cI1I+LJbXu7908mCuGSNhbu06lQ"
+    "Vli0hoR1kHaD1B8O2X4Gx49SxA2ulTu0hHlg3Vfo7bvA6NWCRhL0k3bdd6CP3s9NQXXghWpcrbNN"
+    "K2ox5+qPzLXOuZvjhvG+B9eA0H9Y1RHlTePf0XL33JrZ985hue+pk3vO6J3yMal+nFH4HLJ3Qv/j"
+    "bcvezxxz7zw+97x/9y5xc+fPW3PvOlK8+d3fjm06u7m3fycuwxi0U2dI74DvGtygxuE4OeCWsIuV"
+    "B2ocqkwubGq7OGkwyibuYWRKYMv4glIt0M9ge2WSAwEW74QuCHRlxBkGfycwM1duoJZyahudlYh0"
+    "5OA2MBbDK8Cle9lGei19nxcabS8JjT6tNaTK8nd07GTOLxY/2kQwr6z8KFeqegPYHEZoLNTSPMja"
+    "3hfUx7Y0NEiblJsqmxCupaD7CRyVUdTIEqqfVTJFTeMrH/GQlUFA5nQFOWNDYFCQ+bFakvKZm6CV"
+    "wx7IZHfU6Ijh/qZjFolWU0stYtopawUbdTTlxYPIYEmdMmQwGGsmlnfG7R675OSwbhJnLr6SgxW2"
+    "5WB9zYHDAuy5TxTRGfMFz55DfZ+BAwPfbmfWgzVEQFrG7rHXnjjCGgFJh6Ua6tGtG1nLBTeWyhU0"
+    "t7e75iO4iCJV9udfWTeubYbOp7gHk6wEV/qrU2nwOy8bfnWRGz3rniG1WqJk6wuOlYxB48vu4aGn"
+    "44RxhwYoH++JiNBSDQegKLZW5fkdf32Mr/ZmvVK42U9XlxUEcAuZ4qT80hSOeK4ysl66vgIpen/B"
+    "LBx+mbAyAW6lt7Mq8oz8nozKKtMlAZU/1UIhWlH4cYbJ6A8dq7T2OygD7JkZ1cFDJf5skcCf5x3l"
+    "HBi1vXsxC8efLl3a0v/uvdUxcf3/3odzy/e//3ne+u8wUoV7Iz9Nss0cLOspUrm7ng7E5zgBt8f5"
+    "ycTR1f/MAGLvK4xcD1VX/WuWLgw+p70BDKyfkuGpRV5Cqz5WSJSyNCf4BAaeyYQ768Qkw5NMwDwN"
+    "fir42Xunm7n1jUIbG0f+Df+KqaNooFLnqcse/Vc2IxclD1ffhe1IEhl0z1p07FhRj/DAByzPPgki"
+    "KB0KRma78xGISQrMMUFadfGEuYoXCQBKGQTJ00z/ZMGfk5od9WREseFFsxMS0McsNcQpUoWRqnoC"
+    "uXrLro1YfWI/SQuqHBCubmvDZ5mWu2nzeAZaqM80PK9RcGXuaPsc38GjE/T8dnSfPEDR7/nHhBbO"
+    "9L6uXY5hUSBA6OxKp6Yxw5fz4hnsZG+9N5vgzlxu6L+cmCO8c3/QbZblI7D/lCAE8J83es/lgwD2"
+    "6xaRZz3huMeAn64KAa3+YSff0On+rop1bCHxFq4tRAW2TMEht9HptccAPfoNMWfMERc+556plL1k"
+    "+tK0Od+6Kfxw0OtzleLEInEmznPvLYQzd/6pm3fN3fecOTj3+c2UJHLk8v+gismelFX5F/1yvw5C"
+    "tf/ux/8l1v+5++8eUP/vVrX/jUrx2fnNy5kcmWT2iwcO2tjYkgeQc3Q5sFB2815ybFZNB5yWmMMr"
+    "NEaM4Wk2VyZFIhdWJZmBGAE1Yo8jr5VpYzvKZDWwsefXRb1kYmIKwxI/kka/jIkZA5XLy5QGdSgx"
+    "kgy7lqG1o9k97JMqQwwfBoYasXGmxOmVyv5O0ahINKIMtk6VvtktdWmPX9cEg1DuDUi9oaBan6Qa"
+    "y1U3ns4Lt+QyefTSYY0KozV1HIc3PEl2I025uC7a13YfOnTPJbrBatV6QqvvzqDaa01mHbSB34BL"
+    "b/4AebtPx1I0HFpIUqI4WSpJdYUn0sc/M3+qvv9vOC3MQSb+wFQRo2KICfZHFIyyjS1eiVWJnQm8"
+    "z2xMq35IAzGsoknytfmtLDLiptGUba9gAPHW7Q8XX5W2LPyG2yCPOf+GFTP/Spp9anvJWHgwmwGx"
+    "/6iUv2+i1d0OKmTm4qNLTvZ+IEFLukbv4op1BSrimnSMhYHjStxqSUeuZvH1LqjRo4+7FRicGOVv"
+    "l7PNqEmEgHNrF2bUd+4sULEGslogcTM8WXb6sfqlPMfbyjFZOtETaoUz3nWrmQcQv7AMfi9lbm0e"
+    "xYoL11Lfx8Pi1x4HBxFcfPMhfzZO5qNl7H+XbJ63nLF59tO75603n2ajZ0V/m8HL819/ynd6/Mt1"
+    "n++992vvvAB/IJuZewmcu3WZ7mwMn8Gp2fmYtPafAcaU8+8zS/MedmLjZ2J1kg30lPyNsz2Vjyln"
+    "r7mXWOOFBJ1o/aTT2HbNmn6CvIyhIFZNs2fKNv265AxBIJZZqxxEnegBMX+wpO+F+Gm+845GfbqJ"
+    "t9pjaQI8Z9+yNo648N1yT6GYIcbTj9c7UsHTmAkCGtK1nyPfZ4dt6NXn9SXHqqM/eGpFKtL/YhJj"
+    "odHYyDKNJ+uezHEbQFvWUU0wDtF/ZKWsLnHGCIg9oGUp5FT7VL1evqaquqrE21+qoufq/LNu1dG5"
+    "iOF7QRu5FlY9FCd9NqGZ3ahVZ/92sJXtTgv3PExFCNdaLuOJWyUDnd13eUhOa9Mp12G/NkVdqdnl"
+    "7fPbd7ONvGfMPlGRvIJHHgt4aVJN977jSAfDdF1me5snyNvGuj4vXbQokJc23iEB00lLazCIdj+Y"
+    "9u2EpElhjUB1VyqmdEAK+QZ44RkrevRhg6Y5W5iDbxt4hRFJTxkZeb+MKl8/N//vLHHvgr73z6qZ"
+    "966snH/2W84ytxL9O/JRG4fEL3b0lDphoXX/OKl336R97zjr974+zO8x/97MWVZy+O3/mlK/mtyI"
+    "zqo6u59C6KaP9YADniOyGQXWVyXdAwQYTPvEEmCxMnICRZLIUBD3lnlZycaCzLcGmJRKejzNtO9A"
+    "CGFmH1g+V1YLCRbGVqQFtMsfjh0wD4pPBdZOWOMOu31o/JzT9EktdfIFncHDzdGv99woc/1KHI2r"
+    "LsDSGaYXTS5GaVGxK6uW4bFgg5IF+7ds0vlQEK7HgZffQ0qM/EYhn7/9h7829Lruu+r978Xr+e0A"
+    "OGljByEgmQBEGQBMABpEKLtCzZtETblK1EXk6yVv6c2L/Y8coPWk5sSo69EouyZFuSLcWmrDCCCY"
+    "IEJwGcQCxBJAg0Gmh093v33pfv5/vdu241JGdxyfzF6Hveu1Xn7OG799nn1KlzqurW9aLNBsQnDh"
+    "GTPdW6HRIWWePgi4QWelyLibyvdqqNXWvqIT23GQ6o7Me/AMUGZZG7LWKq6i0GZcdM/uUuEdKhta"
+    "xATMsWHXHCNAu6J4ToISnb0z34tg9PnPQvxCRV/i7bua3Aom7IWK10OWmBJ55Y/jK+yohplySeU5"
+    "Uz2RCl/HJEJNJiMcC2iaWvXbdhhcB27RLKfPBBzJiv/mraxB7neyQ4LvXvknxJy6TcMfHcQrjULX"
+    "L4MKolJmJYvvq5udQNx7wwJY/FgFRrG29ZZxftFnI5Zpg8qAQMPmAHXPd/ePKYKotm+64BvZ00qQ"
+    "0AYyofAgagZcMWGHflpAsK0z4f9y2CPdHgEzaWrq4V9gPgsrO2GX6z4iP+46+rGvOtHddKHTvISd"
+    "AxyJ56IQa8rYLjiSGTMV01F6O/Q8bvbfKdOabzfhGK2ps3WOqGXJpex9ja7ECPReolJ4fPDzdf++"
+    "bw19+/PTz60SvD2vGXNCfUnMvPZsqILiz5O3SeKBIVOcAY4rugDPUan/VY55FfgKKLdbo7d9Tfmf"
+    "OxjOfSoj4kxz1xyK+tUCHKdE7izh0A+eu6ufOYLgDpglF71MASfRkvjsmII5t4yEeP9eBHv+/QpV"
+    "WLXvhI5FgmpwQOM//M/oVAXsnyiqPtlyz0zmqfsbdpIuCc+RMhcEjUzc5rb1LRw0TAOW/oBI4FJd"
+    "W+J9uI2C9olqw+gjzlxiimRZqmQpNH7KYZWGso1V1NYrb9fu3cfIJV7ey40ap199592n7Qi4XnO2"
+    "3EOCmmhWN9PKYu9Apo+khwPNJRsqg2lku/ovLBy/HKcZI7ctgQT9holJB2lPhwJ045uWUdxdU41N"
+    "V28Vh5RGPA8i67X6ivHRET5HVBRcfE7OiE7pLvD1cP9ZMdHndRzHnDIG6o0AJWeQZO+ekxI4zXbB"
+    "0ZWcKZpMQItSUNG+1qwlc9uLCbGRm20kW9lKZI1ie24nGOZjAxWh2mjNXIuO0kpO/MPXnq9P7fff"
+    "db7v6/7r7j7AtTrHi82v7XHoEaDf9rr8bK/47AHbedf/Fv/NQH//XbLuz9r5uvvvRFPaUz81V7DX"
+    "BcRPM1MQ5ufXrA8YjBgKEPg0NGkCB67IRucoYAJjdeQPlKGAxhadKYSV70AGLW+QabAAAgAElEQV"
+    "TwQw+6TzwCIwudkYYdAp4sFd0LHzHGwYa8RyWA7LENsKjyRDUQXtB4MQdmKWcSxkBbNssGAK6DHk"
+    "m1PUkw+JHss2yiQ9yWySjxX1z+wGiZaMQWfpL6DaG+k9AnwQJMnSLPRKN9xUD8jY/NS83BhYuf+i"
+    "j+vWjziUZ2oYOFC8bRdloneC5L15NO8ZFNzJSBbwNskrCNV5a3YTDVpNiXSOeXrYNe4ZADX8m47J"
+    "XBDy9Cg2B+BPC9FHCnGnWsg5TJ46/30uxFsf0snuMWoYnlNhOMlres7GAWWuLnWUQUamu/2q4rQy"
+    "xF0LHFHRA7ZZvxDdxCLF+llMqXDYDTx6Id21BJ1M/HGdiOSXzEBCl+Fk98y+tCha8KG1fHqYQ5mn"
+    "yxQHvXQbjIdpjbR8O6XoaXHv7yj3zsOOZVB/ScKHcCl8UGvCY7sPgRAj4wKXfJYqonMZROPqgmdt"
+    "CZ0cnztuD8WHcscTHDsY7JSNaWxaxTlWV7xIJkf8NL3VpaPlIv1OUCvnvMQUUI9lMTKM2d4ilvq2"
+    "QxJZ5jy+QKJt+I03fd1vjod+UOZ7qzLzn2DovktjXpPL52ZTh35bvDffrO3P/wgUvDJ/7iMJw+r5"
+    "egbNR35vhe3PqePoqtJqZZKFDWh7txLOiE5Tdpqq14CQp3CI/0nTnilzsGOubIy0eS7TMRHCmmii"
+    "5+RJSPNFKOG/GDTbzpE3wsLLon3DBpL/oACXk0mWryqZiGaX4Wl8JTXJBziwEjrkeYJoy2RFfb0L"
+    "S8yNDHnv2Z1CROGj9I8DqBrGS/sEtZez5TPecRVLJt7dGxfNB8bHjsKEzkzE+NPZl2TYLhLiVVuE"
+    "m9r5J18SU4tsLGGWiRaxvsOTZzbMHsT8l5VzRhjFBVV/yJN9Q9eVo8/pUefYAP+iXvnTGSs3LVmz"
+    "xUY4zxABt9G1GOOpKmtuin9IFc/PBdZ/oRE5euIzb8yZjQ1tMXgRPFfigvZ7Hmu72yN5tv64Uo+v"
+    "7cxin1Gf3uY7UbGMGpHHXVS7aoRcwpDy5S2vs39LzYzLEjxmgSmz7+u5rF7D4DysgSOHm3nvXs8l"
+    "QAOH8gBiOxxQbHRv7wTHRkhZcLbRNL+i11XcF+7OzJY3/3A/e96TN33372BR7QXqXXXwRWd+hef2"
+    "063Hzu3A9+5v3v/syr88ePfeG5l//OpcPNe9e21nd4wxlXR7litOBLuyzCVK4RY4yEB4kaHTyIMJ"
+    "7WyLJc+DBp0HSLy7oeklBnwpBBBb0MgvDF8YCIRGGZpkFIGJrZe0DEBIlhLmMyg1QRtbNtMUwrO1"
+    "7UGTR2vZVstNhmgAW3saifBcCoetpg4SBbAFl02Af5pMr1AsoyiIlnXw2ZaQ886t/2UlYdVU9iRv"
+    "18N630TUuFURS3/LJiYjbS4cqm69CykgsmvvABgbAim8mPKSkGXzL2XXJEicQeHGNx4qJu+sM2Nk"
+    "lM5LDtRXrZ8YlxPOFGBrR+/CN6Vg8mcRQedynY2459wx6aFTvsS9Z/2id27aedKRw6KGV25Sfm5J"
+    "/7t7ONGXqxjY3cUg8Pljj4RvLFCrESD/EdE7O0QVu+Fq11XC/qOllUIIIFeAWN+TGNsDLb7WgPEP"
+    "YxFGE8drICeeKJrcIX3faZ6OKd7aXvYZD6uC7wyic0Qeo6UkAvKfXr0ug8uOBJeOlvowSvAIwrad"
+    "xxQt5+9eQuaiPf/ksy4sXUDozGyb59Y5JXx6DkEi5HWygdZGnIro4OY6TNYiGWVBexqTZ9PQtqxd"
+    "DfrQG/4+mlifqkpp/c1eARbCtyjCPPR793JX7eSKUyj0VyfPL4tvzc0n5dz0Mem10ejr30zPCW9W"
+    "8N/+3HZsOHPiz6ie/LRz0rqR8Ad0XA8xqJBRrVYUqmvB4bywJP/mhR6UWd3mbJbzLGB+oim5ImVe"
+    "SMQetQc8epeLQkLq+73d0TpESncgsbxzoo0XHQA7/4BmZhx4tCPCbY2chpe32Jcb8p9AXxCRuY/s"
+    "O+ShMZyth3siCSUkJS/X9klI59Lap3LWLc+N71wCr9Ykwla79aT4WOJvQxb758K//xB/7Ud+M62G"
+    "VDfOqLLMnHAjTJeOEjANcfLN85M6AhkS017z0eGwWspVzjQoKK9yiURWGVn6Yjjf3raXYZmo8tS5"
+    "S++oXgbNH9IbxECAwq1/aQKgyw+A3FTh6AJMdxYxsd48TJdTUOWErSz3HORZH4ELq2bhSc4qOi9y"
+    "wK9VMFi+3h4qt65FJ36GYLvRxI5+KF3o7pWEg84yB9PZj5oW/xbVY2lfE8xrEPPu52fe1D3BMmHm"
+    "a87ZrDJw8cMWY0wab7kDIiWWJ5PIlHHwhDY5E1q05LLM8lAOoENnhalOqQuLo+P/rDm07u//L773"
+    "/LZ+649cTqR8M7Tq/DfY6Y12HFbvQq3X7Lzc9/6tEHPn3/hRN/f+vS84+vHR5e2fQgoibXUc5g4h"
+    "GEcUlnFd9pYuDQx9+1UAB74MnQER405qfskc1gS4HEVVNdN/LAI/bkDlcGJWtJTljI8K99yzMhjQ"
+    "vsJYMke+MxbHYK3zy7FT9YbBlPYll4goGsatu+GC5I4vhvgmrX2CBhqTLaflZREkmW02bcT+qFxG"
+    "ttJM7Rxf/gVswaHL3iAQw5d8eUIV5RLwfLZeugp8lUxTTxof4OEhL+WB9cySGvjT+WK91UqFQsR0"
+    "2SiK1jio+1WLFXxpSvegSUkyUJzNZz3rrQoGI/5mWiaGilT+QEZpCSizA41KHx8MF/+GlcI0xkGO"
+    "bEKWPWU1/rOIlpPeu2s9QFhrao1SZ7EULCn/BMiYJptgWC/pMPFtsuZ3FgivsndvApasSgYigRah"
+    "ZJ78oueYwiS15eqF4WdRmWMpDsczBCq3y0ghIogCLviru43EDTx/DGDk7sRwwKE1JssuyhbChtHC"
+    "fTVTeg8Nd8Cs4ubUsu8cBa5S2rkgGRD53vtBIvv4REOOkR7CMbcTNMhF//tmE77QBKsN23wUePa5"
+    "/cgcuCjabJXVn20JV42yQZjkF+JFx3zjb0G3FHouvbcppEzvU7c7seX7f14+Eb86vDsXX9cPjV54"
+    "Y3bP3R8Asf2Rw+/JObw/r+C8Lgd+au4rw+ugvnxZzyPHJJAX/0xr7BLzzB/o7Wf5qkXtG3Zfo7c2"
+    "oUfKQXTT8qiu4IdI1jhhJVkI7veCpvgnxwViXi5IUaMXFQxeNYkgR9AP6I7LEFDCXJOo5GSj+wev"
+    "Egu00dSHCsNdpwCYWS005Z/RXNTTTaKN2SsRKKYBoXbfJBcT2KNJItjw6LzowfIw6q+rh/i+dzqb"
+    "FE875jAFrbIk+KTesrn5gJzxWQHRZBhRX5GrugqX7Y7Cqkz0YKnj8uxiZtQruTDFkixlDeFzZ00c"
+    "H9dfTTDJWCgT/IpT04mul/7KWPVMUmi57UzvZsU3r4ZbTgeczjJR7GLxso02+8YGrt6HmB7bopDi"
+    "JZD3E8sDqeKNv1d7hE47tlSAmXYwA3Z1rQvXqwp9+gO+ljduELyYAaONhgSdUtiE/8uXLBU0GYqj"
+    "97XfmAakeqnpG6Hg806kdiy7BCPZLHP9lQIccQ1GWekimGVE/j5xnkD2OdNM0Ey2gxKw0ycz0hdH"
+    "h1Y7H4g1vPHf9f3nvvW37trtVijtC+rhNnqVV6nUbgx24+98InP/DgZ7SYO/jqi4f/48Vh80H9Tt"
+    "0ug9HaJhMCRhF9dPwzPIjs5N9kEt1X/Cs2fSLxSUQ8DyGSp8xdukyqEQ6IB1jkwGbCzagEq2gepJ"
+    "wHiaTtKFRZl5esDFqcTDKQta0Ww1jblcXKM4DmShl8/PXYK1joLLByJRkNJcJRci6Ud8ZTvr1FFL"
+    "59BxAnGth0e9su+qSP7diXvHV03qmF5kgP7KjXdQV+rJNtp8zialknTjQIxpcsqhKTxvcdUbFxPH"
+    "WhDsEILH73NACoYIGJmu2hXvrE0IwoJ3bOV13J42PdmRzjpxPsdCFmbwyaWGpr2Il5YxuaDf7AdF"
+    "b7Ehzxi56FPWzqgSsgV1LsoffCCT9jtOTFY7Ka/tBK9rR8q/YHGtXaR4KYTmxJ3aWyn3aXAvQSc0"
+    "tEyLKFbkUmjZYW3/MLl+W7Fx2gVDzgF6BjobI4xqBsDOqFitLosxjEonXNbCx4JiwV0GciMl4oAa"
+    "hS51j88GoQTz5GDHkhWcTtjXy1nyjxKceoQvsLCZZT8ZtA3ToeBlXZUAJgpOiaTtyzP2A1zfUOur"
+    "dxJbFABn7uNjOZxTE7lwv55T/jJ9+VmzO26vFKvivHo2P0gQ18UXmL/oa8JpsbWnXN9MPhw6vPDR"
+    "dm3xh+8S+cGB75gL5Dd/ySbOgxS74zhx0escRsNgQ9eeGJqX99X053GzzJRE2LvIVmr5mEy5Yn3M"
+    "SbwFWdlMsFGddGJfbwU1dkGQFs3hGsfmMJo4SJD9jCJeplCPwiE3vEHzZaEYgd+OhZx6JFFyHy+N"
+    "J8MNGAJzn9s/cxIfvUhb5mCXcGsPoDHUTtr+NBQ4ad6ost/pRHLLbCXm5LHhXjwRENMnBk2PMxCI"
+    "zw41+dh0qWcTZjiwj5X0JJs3WTo476M1wt1Bx4SWEGTDDIk5yhFuoyhQqCEwvwGjcCIboEaXcfMQ"
+    "BaVB1P9TAkMUJ5tEGn1MKsfAhA9I9YJHJecLxRMaoyxBc8EMsXdjGgXdFEar5jJLpdsn8Sl7wxXM"
+    "dqV86jlI13PY6PQR2TVw/3hsuzPd333tHPFkjWxxXGXbPyA5jY89dIcEXQPo/4mEs03U/guf5Te4"
+    "ExGWgSsevzpPKpS3Q6fIgyziRFkWJipcgo78ONGHDhmooqn5hJnuMADH0YX460mtMXaH//1vOn/u"
+    "F7733jb124+bjerGR2TKy2r8sIqKuu0us5AnfccuZP/sZHH/rn9926/w82X3npsc3D2RWekvRTBW"
+    "p9Dw0aLTxgMEYwIjhlUGEi4wWZaAw4sPvTctYtHQ90GlwZwKCzqIiW9MaTSBth4Kwu2IYn+9iJb4"
+    "YvvB7GYl/b0sG2vdMekj+ynkGRciFqb58oohFB5QiMTtX6NFTqUYKWbjHJcRJhSDVe6urgYB9Zbe"
+    "D5pA3gn4YZF3TxvXx5rSBWyidqSH0o+7tj2LEPrRtZU5noyH7fLXM98QMQpXz3rAoBHmNhf2xTDO"
+    "KjnRdz1Ee6HVPkxliKYR4b5Rwf7FEqu4l8BcLyqQtsqF5ckRFhXIwBoGT/8UWJhYSRqR99zVQYZU"
+    "tZ6xtXXPuRtnJ9Gqfoy34YO3EhdXC8jS/vbSjWqJMnkyamHjiQ/tP74OFr340yFJvAjEUIwYRUtj"
+    "X5op3oaso62WVLyCZEg2uHPy6ULVhmt29Sqnq36SlmbAfP/dZo0fV0EiXXGRoTaQyLZHJbRmSpg3"
+    "xsShl9268JFCRjFoh2yGB7SQcLG+ggvNyaXrbsC6bge6PjMYo17hTRCJHBb1/gMI0S5bLtyWLRnM"
+    "90OAsjfNJjkyy2NNvzGKefCvDdC7298lAzRe7a5ZFL+S25Gb8zhwFd1d9RXY7pO3MXDp4Z7j96fP"
+    "g7j14ePvwR/fbcGb0AxW+zlK98983fmWOQRlOfdd5ueVwf3bHje3T68KZMR0dfnWQxyWSaH0z2nS"
+    "X54XaSrhEUD2rBVVz2nowrWPZLZbe5MPiBc0LXx1+3p9RE53g3GkXlQyOPlWDBMEd21E+U5aJZ2i"
+    "i6DilG0BFf1p3XJjjiWR59/5Ut5ZFEyhqyE82qT2Ei4UWtRfvgUa2jbP1GBMBRlDv2SBv755IBSn"
+    "6564MR30prhHPwhFm9/Do65oONmupgf2I4WKKTRHdVhM+fxbClDDrEjJtQbd06xCyZVi4fStC8wt"
+    "bO0gLqCGIwbUS8OL5bIVYiH2go2Nd/dBAVkbLHaZeJamguGsYaqUPb00qFnukVloLj/sVe8ukDxC"
+    "ngaNuQvQdQJYgOdmRssRdQ8M3WxZYDvQxl8/hwsKnHlRH1oComKcDO8l1QP7JouhjCdjspO/Yfy2"
+    "sTF0TPMYO/ZhkpG3RY0PdxkzpJteoPxHj+aUCrJgYeD0EVEBiOleLRc7N+koX24qNHAGZasf72nb"
+    "ee/Z8fuf+tv6nF3AsssePNavt6jgBj+yq9ziNw4dzZy3/lkfs/szh64soXn33+l14+2Hp0vr1z6o"
+    "DJi0YAhtK5vlOnWYiuJnPSY2DP0MGJi0mO/jNwMmjoj99oYzxkAGHAYoKdyRG60BiEGUNSToiZeM"
+    "OEigz83CXrQck00T0plqCHMGadDNhWClJ0RZIxX/0Sj9MCxr1wtFPYpj7cJZBl8Sh7gVM+zPXFQv"
+    "zFp2zAk2xNlGEFIwsj8pxA8IsB1Qmz/kO466VszZbzLD3Bko+acC3m+q0d/JK4r7Zhjz+MOQGCbN"
+    "WFPXQ2llGGf31SJ3lDYcQADX7VWSXzRbR6yfEaYyadJDT6TpUxLSm+r0oCFim3CLY4YSLj/6DaBp"
+    "1JLDCCBy9+tD8gLevSsl0H8RrTAUm9sEvR1fQGOfVdiJYrTO1Irg869RdqzNoPOm/h9N0yjgTsYJ"
+    "++5LwU2ScvBjm71DGWLMcIamEX7JLgdmwH2AdASEs/IROzpAKSRKzYpSVPbHuHCf6kF/9KZHRmNI"
+    "XbY3L7ckVHuvmnL4MzERKXODk2amv/xqTEc6chvPifLThO0sG8jjJj81gS8SG1j1kUiR3zfr2ABU"
+    "rGdQYnStZz3xIBJMasTnS3yHk7ugHf40AbCbulJUdsLaTjHUdsVTsQ4yvjAHVJShvbD8maLrVM1J"
+    "CTvh6DnGmBxaKK8kyPQ67rRShEeoufJZD8lh6xPK7fmTv+4jeG+7a/PfzizwzDA+/TXbyTzwtMj1"
+    "he03eLXCkdlz40dYqmrdb0I+L4wp07vjfHI5da9B3pd+eOdFfuSE9bOK70ReqGrDbOU3a1qDF8oG"
+    "ucU76T+4UKm/Kd9iYuHAc9Nic29BNwKjCMA45dsAlqj5HY4r82ZBK32htGAkaSLf3jqaufPg0WAK"
+    "mFW2hqyxyFq1zBj9jMnhiASUo7qkBftHwxahch5GFC1L7xVA6lAdmjIZ+XHcTypek8IQcCkTXOr0"
+    "apUxnjP/FV2wZDgnWc4DTtZT3XPbYwapdUtNkqELOCDh1LUY5NnHKy08oRz1ZJe9IK+GFRj+3RyB"
+    "YqlZC/KBom5X7ENBUlTvgyCqmk86udTT1BSj9jrOXIYA9kXfBAvTBywUHMUBQWei1xRIN+x46NEi"
+    "RSB9xlnWcVyw0dO6/OdodLs/3hFX5/7rLUFGvHGB37R0z67lvFoaANLrz0QmygAiFy3UeBQgUe5u"
+    "OKHUHZBHPkEzKer4iMoNm68GNcaKSxauLq33bUNrn7jgDzKaHQLvp4zraYv7S5vv7rF2458w8+8O"
+    "63ff7syZ3LYzVQWaXXdQRWC7rXdfMuK3fHLecv/eJPvu9f//ofPHbps08+ffnicOIvbm3snWZI4u"
+    "TN+MgYpaXPsMmX9hlkGJg8gARH7AxCGiH4EdweKFgg8XgCEygGSeYffVdoOeFm8M7Agx2SeaJRNp"
+    "YZwmCAEg4LJmWVECDjoR6Ccx7goJuHDP6m7IFReNbSQMmJhUkPi7/2iboZw/iGtTzucTJBlzyLFy"
+    "YpGyzGoMse+NFFBinso8EufPJw9IJyD70AimM59PlRcH4+oZNISZYr68KyHTGnE9nIxnIgWajy3T"
+    "XFVcGLTnxp/PbLZgCoWQN1o71cNzuZenR97LUNLuseVzmdMDEBK1bil/LOVB2odTHGuInFhIcoNy"
+    "/1EKPVDOmIVUwh4IN3kiOTeS+RsE9FMyNOOhv/JC8/HBtRO0ZtL6r0MWyqbtanbt0GqVbIsZeYwi"
+    "9jMpEseszK9C9CHy3WEp7jgCVXIX6B0G0E3eWqiGOEH6kNh6t9HOtCv3fCQvLhpdRsc3ycyBbybG"
+    "Qo81xapBJ0C1TZzqQWZOGN3uBXydLMazpemgCdj3WkEe+0FcGyQNk4igEB130xSqJjML5Bgg+O9V"
+    "WXTBgLrzASX/SoP/IZf9CBRtvaLyZ2TArF4PiKLBLwq2+rPjyGTrW8+CtdkLgvp2/GCR1Zxjct4D"
+    "ROcGFsJuqaxsl1KW7Lfd5muSPDx/Q2y7ed+MbwqQ/vDe95WIxjPA2lL74d6sPAJ339KJ2cUL5/24"
+    "D6c9fPb7hUnjdbzrSQO5AVXZSa21eqwYQv7eSwVcMn1q48bie+1J3YeNxO7FsiHAkmyIpF+BLn33"
+    "Xt9vKYKxrHQPKJJTFOvFESIlVKZI2HjSTlxMe2ICwbOvU0AaJzKcY79+zyq6XQc9sX3Xgo2ZQwWr"
+    "D8KUZswkPQMkvfoHX/CQ5+VWr7AnaWTdkAIZBFKxXXCiZk2od8H6CQTY+w61i0CHKGXqbETZQiAl"
+    "VBV0ZxSgNAtEj45pjmcqmkPQCCqn40GhqlRO9ELONd5FoPm0JQJUaLVmdT8TeuNurfXkCLtcYcIo"
+    "0/1gV9/vAr6NnjW+Iljvq6D0zcwoSxKYCPL0R7XW+33BleOjijV36f1HHJBRGO28iNTWY/0QQEfX"
+    "3wzSXGcOgUak++dPDROtrHZ5id8BMueowTiW1fPMjYLlbhItVoIICNLj+6nv7CHIa5DOd5JMgfzv"
+    "Tykx/s7ex85g23nPmH777vnidO72/xw5WrdANFYLWgu4Ea++zp45c/+eFH/sOZ47tXPvvV5+bPXj"
+    "36+Ksba+cYEDb0GMJMAwoTqblGCQ8iHjTgalBhsPGHOQcDFCOJBhoNTuPdOdH6ZAqNl2N4pshiDx"
+    "DkwfYglCELek+GPXSH2aY0djNoZUAzy7roxBaCRTI+VvBhXCxS5mTBHgDxxoUREx/KhWAZl8A2kO"
+    "tun02gOrGbQTh4rpclpVP7iKfefRERrk5F9l0bimM98GJM9gld1YMJXryv7Sgl3ZwceuKJzbQLda"
+    "YQWbeJCuyR8cY8ytDxirrllFVqroq9ktJIQ1C+O/5uV/HUT9JfMhFHhPqYJgDyTjYOM1z7Ybmq4c"
+    "Qnski1u5FN30OaCZb7Hm3oGRKwsomClLOr7eg88Sym8bWRpP3sstiUUfGJ16EBR2XqbX355QkYe8"
+    "29JTwRE0DoUEHHGcTB5MPGNh0PmPyLcl2fKNnWEd/iBUAEpGYcIDM5SJkFlcVEd39Drgj4YZ9Qqk"
+    "RX6YQcdtoX6FhKRCIFlI95CRJzkvsbdDGnslwsIlbgpZ3kOf0F3TJsDMOUHQzQt4wXtKXPsYeV0T"
+    "MaHSwriOxUciZfx3AfSf0iMz1+sFpVCooD4hrT+azL1I4LIL5fwAtRdBeO333z4496mx4JTL4zR0"
+    "sw+drQC04OdGdu/+q3hneefn742x8/N/zEvbpVcFw/TXCkL78daqy0GW02cFqdWm+pszM82ulHK7"
+    "XnKv6M39Bir28oXtNFIfziOXrtHetqr24bfKDfUpVp5Yisjxl4lS/nLYe4yBnzzAih4+PQ+DiI3N"
+    "jJLUs7g9rjV8YWAN13AB55yIKR+OKojy87IFcKD3n7SdnYkXN/cueKwvV9F1H0hKMN+7Gu1gnWdX"
+    "0nMGjoQ9K+7YWgLWC0Uwhts2MD1Sw2I15kjVVjLnn6k0U4blUeQUfFCYArsQQdbRR0/KpCO2PMuB"
+    "uOtZRd4kYkuP0Y8nWujNL4Kzlht6f4TB3UKX3hgzekmutxKPK4QtxHpa4HdMYDsUqrLOFLxM3zws"
+    "yjbPpG0CQhWjvi+lLgQ9IeZd0pn89ODc9f3R0u6i6dhwpdbcAzvzCFdlQ+OHiRvyCFbpFsLFobW+"
+    "mN69imm6g9LgDu0xR3arlggz0bZEdklnHimIQL23MjjwPS4O4/IZDvfGfWuMbWlaLD2TM7O1u/9r"
+    "bbb/4n73zbXU+c2NlYLeaI4Q2WVgu6G6zB93e3rv7Ug+/+j+vrX7n82499/eXnFmufmG3u3Mb7UW"
+    "YMWBolMjfK4MlJlkcWGbS9SJIIAw4yzG1VyAmawYdYaqDmLZnKFCEML4Sg8Q/bQ1aVKVYaJ8pG04"
+    "SIk4IwmQSQ0M1E3taMkkUWzBLQjgkXxSyIwlLRqSc6PsFAiUOWzyhZcsVi4ATLqWT7BE6UPLCWX2"
+    "anyoa13+IZo0BsVzIsnu0Luvpj4uGc6P39OPhtKw4gUkCcBND1iZP2kH7CYmycpv79yFtm97ZkOw"
+    "g3Ui9UsQENmJgpiQoC2qN9C6GhjPlMHUmcLBFDN3mrwVLGFJ+ZFInCcD3Nh1Y2rY60MpILlTor6q"
+    "74BE919yusjYE7sqN+48W8jZQh+Pa1fFQe3GnsUwn1d0+Qxc2/pMiAE4ieIeJKYu/oWCz+UhZTKj"
+    "52rKiNSPiwpjeRkVxko+TJUQLfbuj8LR+pf9GDmZdtjP1DAtSEjy9YVHVTu+g6ZGwcD+ymLrFsN+"
+    "ODtrYB2uiXaBW3+CvtwkHIYYFhpnYaA/Iafztu8NgvayJHv3webU0NwmPhjh9FL/XeXU+OcdPKD/"
+    "uTjVRS316Uc/zxSSWL52OwSborr7EvMqK5jzGpkk+6SjPTFG2hl5IstJhb08JuXY9AHhzOhu3NHf"
+    "HFlcym7qTt6yy7f/jycOblJ4f3//izw1//2KnhTe+4Oiy2L8onPWap36RjoeZ7zdzGYjD24MrvzI"
+    "lON+HOnL4bp6Wh47HQgo7J6Jzvy6mv+zfw3AfkJzUlvq4vi4VuTcbFtFu3HXv/uS2JAdqVlIUPhT"
+    "AlQuGz9emi0HmLJ33AMo5hcIMUjNhUPcCKg6BExFtQ4Ut3JIMjWifrcqzTJ0SMwebWfmkPbRK+kT"
+    "iXWM0+tj0Y4BEbS7FRolCK6FXWLDZ/ilAC7AQN+zqVZaVEjx+Wi0fX19mK+Jfkuo4F3I2/VRlxMA"
+    "idLNilWw44DuhAN6v4hTnGqfR6PCzASFUnSAzbRgx4K/wuhcvWZ0j7mwbzEsxluCjgE0c6f90GXd"
+    "8sFPGVLy7U0zVIokpltYcbu7gZe+T8sx4SXBzp9+eunBwuH900XFvse9FJ81tSi6XYBIVPsOJRlz"
+    "mv4SE80cgsxafGZUuo4jnOCLpBQK1EjGxcctpP60udKXu8kSp39sljiii1i9EAACAASURBVJgnrz"
+    "KqJjI34kGA+dPH97Y//Y577vin73zbHU/tbqzpVv8q3YgRWC3obsBW39ndXHz4gbd+YWNt/vd+70"
+    "tPPf/M5Rc/Nd89fs+wvr3BXIJxaK6R4lDf19jQgMKEkje1ZfzUgIKMhhkGGAbhTBJy0vX4pREHGX"
+    "gRpcAoyMcM5yjDZxAjWUQUF7VhQs2g7T+ptpyFJ5seBNuCdTwZnwgZPxIZIsOzZQwrAz137Fy0AC"
+    "y0kPPeFSP32kRdpJ9KaKyWjJQcH8WDQdxmRPOAXXU2ioGDmbpWXgrUbeovfPtSvJRbAv/bj/JP+q"
+    "yvwRl9K3vGsZOx1zUyG//aYTGmsW/7LWfrEJW8cME3CkwetQOKREw8GSYPtuuS+qUITUl1QDESEE"
+    "J3O3uhzmle8eTtqsIG3hL2F3mVledCqL+64jJ+IFUK0kCPDyD8WceOiCZRJs/+zobyslYXCaJFnD"
+    "PpNkJ9lQMl2rpaSTKGm+DHoI3KhqxK3TKc5IvMLnp2w2SzjBsaVulTat3iJ9YUsE99qAM4PJpD0i"
+    "GRvkdB7GWfAI2yVaxvvmjo5/ekwrMk9cEXFEjkvdcGDJX9u1nNA8SsyHtBnoiaDnKJqBxZYpO8W8"
+    "baJXzdLnrUj0lX6SJBdoSgn9C+MEheJmongmQ8jilPdVBJ0pMKPGFA0mJtTQuqrK0UcV0p502Sa/"
+    "ppghmLOS3kNpyXD+u6e6Z+t6Wr6Dtqmr21g+HYyz8Yzl/6wvDTb704fPLnTw6nb9VPEuxcGtb5WY"
+    "JZfWcOh91MvLBBisJxJQ5FZDGnvnS0qUUTd+bUnj6OMMTdPPmy7AU4TL2gk2evumvHONAXuKBHRE"
+    "IWFxNpdjJHLFGnLS0Az2WVlHGsUIXNIwjc8cAvtHSMAuILAK1DfBEWK/0TCdHENwjHE7jaGdPWCQ"
+    "jOwCNPP5m2k+iW086K2jtVT0DWNtpS5NlGDEwS+JK04ZFr3ZTYIsPOG2V6r6x4SEBxUsZYDmbpat"
+    "cySPv4lHBxVVbfGSE7s9SIMnQ+vS07psVA4xrZ6tEhPC2WeBpGYuLzj1jJJA7F713ERh9dY4Oi7l"
+    "Y3PBtgekvO5w4bcKn4GOwUDVBoqTijXY2JPna1bkmUJSGffcGOfiZc7oDHseovwNqeyuqbG/MTwy"
+    "uLU/oe3b5+0iPHlTHX+d5eVZpaSCc9krGkKxK6Oy58iaORGEmOApTaMybWqT/xCAMh18eHBisy6N"
+    "pzTFoV+1UPf31FwMaW/+x9DgdRgzhnJS/25rMD/Tz6E+dOHv8nD779jf/nnRfOfHeLJ71X6YaNwG"
+    "pBd4M2/f7u5tHH3nv/UxfO3fS//dYTX7r09edf+ZuX5ltvma9vHGNg4xLPzLf2dZW5BpG5BiAGb4"
+    "8w2iFHYuuxqHkMOIxCHrMiE8HkGcBQzQBqjiChdtLAqbE4d55y8svA2/ySlQ52SUxp7E7jwBMdf8"
+    "lN98g3DZctyK51lddUKT4KJNVkwFWhZUqPOzO+iyiQvqsWEWQFokSZO4ZT/NgHm5MEuvE1sKUYdc"
+    "tU1ljItx42jKUR33UUUK7mcdLAdmMJORWJQwRO/8aKYORN1oaUgJJxkY3RGtOyRZvIjMLOyB+U8F"
+    "P9CK/iRiYwtE6B2n+YfUKMui3GV9eNxRwq9BEmuHUVU3u8HPtUTQa8sCY2MDE1mfilDRw1u4AuYu"
+    "67VvA0yydPL2CoiATsEVjJeT6LbpK5xeOKck1yi4v+0qIwJrG0COo9+1J+jIXtlkXLcJLPhAbL/t"
+    "4a/gjPbtZMIdFq49XP8NV20YwP6U/ED0Li0Dw8ZqLCNCdJe+TcHvHB9MIMRibR6atwwchxKANupz"
+    "iaOhrbbpUN541qn9oyZiG4rWpi5Dup7hXp89GqrZ25Pu+7h9L1XS2OdA8isiD/EccGi6aEUH67L6"
+    "msV51zUYC3SCqSaqZtL5B4FOqQ8Ue0jW1NGI8Ohy1dSTixuz5sX35uuHvt68NH3vGD4ec/cctw8o"
+    "J+lmBDj1rO9EQUUy+/zVJ7V1AbNzinZX30cwTIHHnhppei6GUoRwe6Y6h1Jo/F58KQRPHYMdGRIb"
+    "oX2h4/AZX/fGgbi1FWUnlDtqbhgcbazL0MeSmM/QIVNAkOePy5n1IWRXRULKOtxWCYaA9UUMx0Tk"
+    "GK44nlMlb80dgw9aW8FA+bSCT5oox0bc8kSZSNFBkdlNBRd6Dp4ktiM3G05LSzA96gaIJr6DGy8E"
+    "zFruS6v4iGMuZzsQgMaUJwiiy173JzilDWKEW35TyeuN8tNTwGVSxMtR1h819ixMuPoAoovgbR9a"
+    "5sLOGVfPVCWYx6WiBuSCJCgCRvXfp8jwJF1y72wXIWMGN77JGPtHTiA4d2QCky6NpnGkuVgJOkCy"
+    "hlO9JcyOi1iuQ4n0rQIWCju3B+dNljQvywGckcHmwOlw9O6Knmk7rApzvpHKKjffp4KuuFYXEiUa"
+    "6IbaySs+HyFBxS+PJUPiOWOoUH3/Xq81ApUL2MY5JnrqU4oedmVz06Zsj47CY4fgbGMTyaX9pcLD"
+    "57x83nfuU997/pt289e/x7YneAsLBKN2AEVgu6G7DRu8q6gzF7x5vu/Mb5s6d+9V997onn/9PTL3"
+    "7qpfWNhzRZOMUdEB7B5ATPoKWv42oQZcBlkGIkCkomCgxGSxocs5kRFT0DbxUZ9PiI31eM+yTIwo"
+    "eU79dgj4E7d0eQYRAEk315AsFmfNUOKhiS5c+OMNry71EXYXDjg0sZge2T/Sn/wIgfSBkyGcMFk3"
+    "rZDyaITEpcZ1Ms6xOzcuyRtd+dEZ3Fg+ulfLtnHXAtV3v7GxyAEwswsQVB/9QDt7DVdTSzyhUHnJ"
+    "BYcaxqHTsnavSz53FNtJtX0sEvPDyY4pGH5gkn9VO+U+S05d/6zbcV0bBHKh8JmFJLGUz1BHvdiz"
+    "iASqZjgbZo8SFz5MRScsZHx9nCneijVzhuhxhnWymyKZDHT7yTNQy2PhjMUUQi21pgW5aJh+2gZD"
+    "UkTSIC6fXmwHVcMrWEy3HDMSFUz1hL2lDiljFPqEDFvmi+Mzax6Tt8Yoz1tAfYxA/RjV/+CoOFAt"
+    "CGQMy6lMsAJOWx5YRN/iDk3+SOr+PFVAX5ETSqbFNTzKQtkYkPYBJcKVJnA0wMxEuJS67aIKT4mW"
+    "rRh3w/QCwqB5AibMiUWVv57p34M48RmlQqv76hGeFMeX03hx8nxoncMVZeiz4e09zW9+I2Ln1vuH"
+    "Pjy8NffWg+fORDtwzHz+n7chta0M30nTn5xdV2223bdTz5VqC/M6cI6MVJR/pe3pHeanl0oKnxge"
+    "qkRSDqrv7k+zjAENvmbdg3gkv/ULIdMnicujkuKsFynC3TscQ/2Rv50WNrMb/lhAUxykz2Beq2wA"
+    "B3UkSIoO0ZSULQq0XDt76y+nNPLhko+EcNSK6qS1Bkz6jYoA340PdAiY7tq4yk69D9Rfz4LDnU+c"
+    "Mn8a2vPC5Fs2UhiI4/mMdINFOm6CQ/kGETocrDtBchw7aI7AJt3wyKoAixl4K2kiVqbOMb7UdLmz"
+    "Ly2oaPOeAAJ3kXBPL2T3AgkoSqQuKUssnaRAg5PshhlSd2mA9ATXsqyizWe0wWB0c5hlxrMpD0MY"
+    "51U+A4NVUyfZGA4zttYxjxYzvaQqS5pWZVAsLlgV6cwoKHkOxcu7Y3vKyXoszW9JMfXBTZFFNPd8"
+    "Qj5Mq+PZWyknklYMmqS2LUcQoGYo639n7MXANMDQv2A/Qx2dcuJXauiP0lpopuKfOiJRILPcKX/i"
+    "zB+ex7m0eL33zDHRd++eF33/vYyd3h5XK1gVf7GzQCqwXdDdrwk2rPbztz+tmPv+c9/2Jx8LlvPf"
+    "7s9/72S7Otn17b2j2/owHlqgY7xl4mQT2JYvBgqPHih4LGoDq3eGCDxJ0RD/ReXKFvgHEQHRdKCJ"
+    "uVSSqYfTcrEy9ZQrdSxsNgZ0KbgQ5bWUBIECEw2ShFXSX81B/DcN9Vm46v0OOXHQoO+uhMBDvvCY"
+    "AtUIm249zocttrPjrRT8WXNUs9lnwA0SKRoc4ujJupH4hgq0TdDq43lZYiqq6fBciXKKC2o43zLk"
+    "RHbdE2bLTkRjdiwCegtD8CQXaUpe8TXeH6ZIWOcdoDFY2j2AuEbD+uik3jtIsmpC5jMJAHX4k9Cw"
+    "onAdEfwD7ijazw1KEwTd8ll1LhccYsrGkbgMbEgH2WTSCUDeXQIcWs6FGoKCTiEM23qqx6X3al6z"
+    "IYAJEk7DmGwaFeZ0T+qy6icjGgdVHuOLT/pQWi7fuK7wQKXduM8877LoCIntj6qjH+0meD4RqBga"
+    "KNu4UKCBof9Tl2hesC+s4sN2gCwXHe03MTpIcs8ebNrdyhom426Q2+KFO0IBZDhfhYrSuy3YEdBF"
+    "DLdWQkTb/Td928GAVTNrUsE7x6ivrwXAMgH7+VVneF+c4ck0fuMDE2AralBtvUI5qb2h8brg0nX/"
+    "3WcM/wxeEXPz4fHn7fiWHvposS02LukHcVUGF6oe4q1B0rz1D1G3Z67D0BEbC/L6c7dSzMqQOPwy"
+    "947pMe3BDw7L9rLV7XUgKe5Io+1h1X0159jOWiCm1sIT/ORdZtYyz8CD8SaTNCY0uqr+/yiGkPbC"
+    "yS5uPGhIZMaVrf5bJNK1A3iiyQvQz1HSFNUyYYBkAbGiokLy7BpieZ4G02osMyg7zq4C5asRGJuJ"
+    "BshoycyAVAFJWE3xdI6uCMfVEtgdPJCAsc4uaItEThEL/YCi5qHNF1zEjaONiXHLUJFu4nDz8YNo"
+    "iGCDUq2G7hX2cGf+KR7YoHOwhQlKPgwBS1dlN3W8fQ2AJHcrQXz7eTdxLdWQuSj33LY8bWRc9AJ4"
+    "qkxWxbeBoccgViGvSUkxMyt6w5jngxEAck4zy40OZbwytXdvRNVf2G49qOPnV3XfX0d64Z2xV6EG"
+    "l7L6wxrDwx1k5YbOmPElTWT+LYUdrMEtFX3mOyx0044UlIBWKFFRJ0k7yH3L2LMSfvIIi8TVuN89"
+    "n8YHt941snju/9s7vOn/7Vd739TV/RYm71fTlHcbUhAqsF3aofEIHFbWf3XvzZR971uVOff+LFz3"
+    "/ju1efP1j8zLCzd2Gmb94z4DCwzDXp9aRYr8lm4OLV3Eya5xrA/Ny3gHzyQUEfj0NFy+CWkxa8jU"
+    "1NVDyoakAVNoMdvwlHQpOh1AMuV35NBNP/ZaOxGB4F4JEvOAyXuIAvIUNZ0mD6UTiEanC1wGTjE5"
+    "NXlJKgIFmkSR7owUYXn8SzBfBiyovdLICREt8Q2G35xNITq8Aax/jaABP3wOYqveorEGyN9lO5+G"
+    "CdMo4b4tFGgNBGnjR7gcb5ztG1X6lU/Kd+fEgsvnx3DnshaZ/c2Maiu3ZxDVNojtI+ueEzxlMj89"
+    "BH2H9ipZ1YZDMpiH7bAIMYeTEIBidqaGqT9gdQ/GhcykYJlO0zAcWsGc7Eh5Icd+h2ar9os3xPlI"
+    "p6Jit5wPEn84ax7ioDRhkzvp4RMcvmDkBk2CbZe2dpW5LrAjh5/Xm6Viabhh1PiGTILWrxxKr7ZL"
+    "ds8IJtUNlxBNGpWRj9AkwmL+2HnY4b5lncMngl2Y6luKTlBA1N9Ttto25rhseCdcUnPwYr4BD8l6"
+    "io75fM0j/0l6l9xZUKn5mmq70YR5JX+zHJ8/FMf8OLxJbJ6IK7YFjjbXLQdSFg7u/Lia5+x8sV6A"
+    "ebehEK3+8Rmu+WbWzMh92Fpox6HHJH34m7SY9ZPnD6q8N/93N7w1sf0GRzTz8YrtXY2rwWc+6MOv"
+    "XiC498kvQdPPs1E82/MyffsMPjlvJhDl2T1TyaJSxUHUWWlQlcYs9EVZRqF48bzS9JNImTZdjTwY"
+    "sGLNjUF77tUKYHEl+woOsPWRWiMCkv+3jxtUsXiy5UlKEZX3uwwOQfhifk5Enes1kScidn4oedgd"
+    "9IwqCP46vVRPexq4LwW7IqgRWl1nG2ocwJLBiRWxIlBl5XRIKJfSRGaQdP+vhkYuLn/kqsRWvP3T"
+    "bIOINPLkSmBH2xATJaESgXU1+riNt1j4gtl3xs4ivHFXfcfF5wjFLNHFcdP2zhSz/VNzqS+tg6Mv"
+    "iDXcaQLNGLBNPAPgS7IG2OI/tZ51vraxP7GSPG8Frv+o15dCbOE4mS8ozTa8OVw93h+1f3dGF6R8"
+    "fylsg15cUoN5ftLtEiI2JVCwtGq7YxHyKiFUbqyKFjmxo/ooFQSSOLcMmbT0OAqQqnTbDLT1Foz+"
+    "nPV4jkR/Up7rIz9h8eHF7dOjr64i1nT/7jt7/x9l+7+85bvrOTa0oYWaVVBByB1YJu1RHGCNx87u"
+    "Srn/jQI1+467an/t6///JX/vjL333h5w42j79Zv7+2c01vRrmmH1PSE0Ue/BkIOQFwN83zAQ+ggv"
+    "KAlR3AjGWZTFHQyYHxK8OXRTPhQIYRFhFGNXKS8mDKcMmgyACNsujmW8I8XbnyAImWdccBVEWvZP"
+    "ADjGDlxIWtFhRmzBct9Ay6ZQz9wh/pQOqP+lAvBwJMuwkBHfH4rpecdoggV4z6t/zg5eRl1dEvQ/"
+    "lEJR3slBwQxmCPBzSAT4axZ/t1cuSO5xEvd4Alhu9qIpAzEURKxvNe2fI6ORX8mBs+k/BBO9cbnk"
+    "r4xbQ4bPgqd2yt18iSF711fQZz4EL3YzwS7Ulo9wkgDIPl8ocMf/9/KQvSSGRBVvbtGxP08Nye+A"
+    "zexG/Y8JCjz2DTi2SmIBJ1va2iU6746Vfl04QvSevGWm97oVH9utQs2iLspWrPymcMpx9w3Ilp+z"
+    "Y2iVFh4m8gpojOp9e6BbROaONTYRtOO4qfdsYX2hY5bJOJbtoHaMnKL0UjImgWvCfhyjOFc7NbPV"
+    "e+4wJ1i54AcvwzafKUT9DVYO5bhYlF4tF39RMbKSvZ68Ijj7pf9y2eLx5gVLQFiylW3uazY2Gn40"
+    "ZzV75np18H1/fNNoZDAazrCziHfgslcfDrCfTik2vDcb385PTOxeGmK08PH7zn8vCzP7U53HOf7r"
+    "Z5MaeXn/CzBPwY+LouqDOWOQDaMyh4EsfCTh8eCWNByQ+J607gkV5MRWz9uLuDTPSyTHYIHFwJKL"
+    "Edw1IN0hdDfFdBxzxt4GqLXyKOH5rWLQAmkZ18fOAvBmwEXvj0MPqny/al8hjRBxv0HdBRnaZGgB"
+    "br9FbJ+YQSHPdg4dqslSVDocavvgvcfPcNYZCCST1Tdsydrboy5ttWpL3Fb5KdrTzlppMX0zFpXC"
+    "ipaNmUHvIV42QTJbwyuPDJuVQNQf66dB2hCrZjLYmG5jY2huIkn9y1zKPvuCKBlbg1M3yFJj4t6B"
+    "aSo96LxvGLMOdPV70CHIuim0gVEZrYwL5J6AuPY0Xl1vO+N9ZLD0r8YESeHfl4pmyxoIJL0YtoL4"
+    "aUl3yeAGFxRF6brbXh4Gh/uHjt1HBt85SO+dyFR5dzA36DlGYkj2LthQLPf9X38bFlJGg/7Ivo5j"
+    "gm5Csh7AIZfYSzrrdqLjjepaNBITutcFnk8h1dWiCyjJEmzlSvV3aPht+787bz//h97/yJ3z1zeu"
+    "8FHQWsIFdpFYHrIrBa0F0XjlVhU5d9HrzvzV/VlaBf/p3/+IXvPPnMtb92cT57SE8kndaEZO1Ag9"
+    "a6fniLwdOfDHEefBjwxkFPofT4ptMF+6Z7uIOgT17pHx0mORnMRkUPkgxx/DORZkLmuz4SCZ64Ac"
+    "/AWM0HzR+VGdfBQN7JpsM3hmRhATMm8lbUMG06tjWB1h++8IndpR8M1sYRG1zX07hL21lMIaAPtc"
+    "N2F7VvvwGCblMTx0a+eCTrMhG1QybFL7LogaMPOJ2yyIEnSjFyt4siRLGkuzQbGgTEJ2qWNX0pbF"
+    "qunofNFr+92FmShCU0xWx5pVkhd12sEb8Lt9uuzYCHXdPlEMVxoWobad+e5Mds1U3xkIYrEryeuo"
+    "rmlHhZ2rKhjlxovrggOjAFh5T9ivi4nS4qw5eCdVAGlRhE3NBdKIQRE7ONapklIfFhMow/gHOcXF"
+    "+GFmtkFB9s5187ZboiUbN03IRHkUUE/SmxzYKtAMqVWHaNQKRm2mIme/dqVLBdflIV6pjist9XaK"
+    "zPmscTNNfbJCP2Apo6Y8NWjGWHAXa/yCMGOMICDKn09HQ3xicZMFkLKh5d0wJupomoLmT5Dp2Wc/"
+    "JPL1OQJo9BrunNknyLjfFvV/OqraNrw65+LPy29W8PP/3wwfDRR46Gm2+X8MYP8ogl35nje3dUkg"
+    "UiCXsA8rMDvmVBgbxsScZvs9SCbn6Ir6oHdXf95R+L1KqDlJQHTn/iSxKSy3185NF4cOjrTPLLFX"
+    "yoRNY48JwrGfPFdQMleshZNhVwyS3QLo46zki2DEVpWaY+bmjqrmSxJc3VFdmLCzG9GEfGV8ZKHn"
+    "FlSYFHgFiobGyKUyH4peNJvWwzYSctDVLwX0OMRkQlORwQeyxwUK0mquj5HyGtYzY61KWiorz7Jw"
+    "IkwceC8qNxGNIrziivfpA2HzWsEuRywDroSjs75cZM6OUPdPxyvCUyhqN8hdM9oI+5pV9SsK580d"
+    "6pz6EpedssXEAKzyP9mhzGxYDqk7Hi3It7P7Gi4y6+tB6A+C+jjpsuyvD7c2unh6sbZ4cr830d0/"
+    "zUB0ewko1yTHAxWGWeuyTZwXiEEH/QLCJBNCIHWccSF0ytY2WrZ8yO50jbw5bBmF5Aw1xmTRdujK"
+    "e6YT0eZIFtn4bFNf3g+jePba//5t3nz//z995/7xdOHNt6xfZXm1UE/owIrBZ0f0ZQVqRhcftttz"
+    "7zM+/f+Rf7n3/y+//PU99+5XCx/uHZ4cZ5PyrJmKTHkbhSPNekhskjJ5kMYYmeBzUNWkw9PGyJn6"
+    "GwTjeUS4cFBKd0FZ0ymIHG0Cti4SBw3TlODOyAmEE1e8Z0zrMMmtbxLrLKRqfsU35t8omiKhPc+E"
+    "ANul7odI3sg/B6QeKFqodqPOtEDoeUlPWdQ86wVDbwYVUQ+sRpK1VptBuvTyL2Z6RKWvo+7RQOk8"
+    "7loomYT0GCZiyytoPA0k67bCeNnBzbjtPoizVRXuLCC1/SmkBRbz9OhbbEnKf+MWuE3JkDw055mw"
+    "1y1/tnU6IZa8RoGfUrTpZMfPjzBA7PxRe0abICpC0VdsMQW+hMAmy3jCTmdnW5QdaKRjfdd/PQqS"
+    "B2P7EfovLIXydyFtU+MDgV+xB4u1wxvKfXh2DN0JZwhWUk8WDoSCwDWi4sjZXd6jUqkSQ/xeKHbZ"
+    "VAs137lWNtKUv9U/eYSTzKgxJDG0qomLCOFNLmIpQVcuWubGrSRHCrfSxFXv855pQxBhxMGbnysO"
+    "Bn8mS1wvGLRiS74YGCUyGLNf0UAaMRAxJ9R3e3+Zk4/FtsbfoLK3ohgX6S4FCPWeo35xZXhjNXvj"
+    "Xcd/zp4S8/tDU89PDhsH36siZ6iuhct/g8GOn35PxIFi4J2L8dhwEWkPKVHyPn0Up9Fvr4bpxCzo"
+    "LTizvXSLXy5DH35wRS8aGuqp9T+qkp2nT86Lvum9WHkA7POaMHofuuWxmptIuxHJCY0Zb+QlpKpg"
+    "QlH8qklN2GSMek6e5zYmM1fEnbMVCLNsqjAhZ9sW2w7zrIP2IJydSWIYhTkPDZ0k8yFhUNMVLBGk"
+    "60rqtZje+2QTQxp12TN4IY8R/aa5Pb47XEson4OE6ovpY1rwxLLzTa3xZxEC/sdgrKw2tM6RC66v"
+    "Yq0QdRim/ZJd+0jNWqpBQNg5DH0TieRaVo4CJjdfyFjw73/Rh36TcQ9WmHLBSZ3GgSz3ZUizGukM"
+    "Dg4EOdDZ7Qzrk5RdtRL6jRJx7UTWUdU3PdEX/16v5wZe2MPDlmnr+CKr1lXNFdxo4x23hgktqs8/"
+    "Gz28/+ya9cEELQQj5f+MJzgmHX0TGwxhoPNxK1myIvfBdTkSKIVc+jxfyyxpknbj65/yv33n3hN9"
+    "78pju/va0nL2NjtV1F4M+OwGpB92fHZUXVOHPulpte/PjD9//umbPHn/uDr33zO1976conj9Z272"
+    "RCwqDE4MukhwJlX/nSMKVskkYsxifKDJkZCEWEbhpiHtaiw+gshYxpUcxV+BYWzTbRQ5Tv3fEGKE"
+    "4aGoiB9oAMZhJ2xsUm2EVHIguv4ECG1nzK9ld47H2VG24JhVfypmnjEwN+5KRAnTkx+k6RdKGT4D"
+    "Lha2/YN29pP7Re+KEZbfzKp+DMgJfJLTksoxAN41PuZCPgc3WRgCoB2qnjNOrDh6kNNPHtr4rEgT"
+    "K7JNof+/qLqGOHnD/X8aLUqh2D1LSuwAok2OgHk/bGhv+1o/WdUmn71rbal3FBYKeoRmKT1/2nWz"
+    "UG51U7r52zFJlM+4+akdhiPP3DgiaLT13J1x5fOhYhL+Mz4lgBblFiJARslSOxHpupQvJtD4WOF7"
+    "Vqb+NA4OAz/QQUfqZHowk7kLusoNI/jC6IRDp3PqTZV7WRiFHlkmftbJtVZjLX/oKdeAjXbgQfXd"
+    "qFv6oEpPTrKKvUvsR/CxgkHHNL1m8BlI/uN7JJNDyZUt51AEK0Od/T1e+78XMEC729ckGb6jtrPB"
+    "nF78px14zFlZ671JtVj4ZdTSj3Dl4Z9mYXh/NXvzl8/I0vDn/5I9vD7W+4Nqwd15ss1/meUZ1auS"
+    "NHh+o7c/59OZX5SQLPLvVoJfblE63C9+VY2PlRNSZ61Bc57Zggk+I2reZc2pJst4FjiCRKYgCjnS"
+    "8wqOD4wq6U3oqc6g2OUvyRmto8LQJDfIDIYkt2XEbBRGcqR6zbEjrCQU9c3GHPjUnnqr1gpI4IWl"
+    "g67BWTUZi2wrYsi2W+na4j3XnZFdNjgPbthY2BLD0fy8DoL3VuZyRAmDErRqARhJDkMHMoiGwbxR"
+    "4vTIpV6u5vsV/4sRi817RXbIG5NDQxa5+9UDB6jPRx2nUkuq3uuqmUGIIJxzW3Fx0jOPFYO9XL4x"
+    "8UG5d8A6ZWCC/9Fy+RYSuLuvtkH0al0KOTutlXByjA8X00YjdTYgsmxwS6ahifr3Qke+yBT2OxR4"
+    "Bjgkcu9eITPbJ8sNgbXrhybHj56NRwdbGti89i6+mipQ6V5fft081IuAAAIABJREFUot+eLhdj9O"
+    "5JD9c5wAvZnCCEI3X55rHP9ZELqjdVpy3TErG3UFwy5uY4oAvTXzw2CS930asOs9nFxcHVf3vrza"
+    "f/0aPvuu+3zp87ccVwtrjarCLwn4/AakH3n4/NiqMx58Sp46985IH7//D8udN/vPf4k089+ezF//"
+    "7qbOfts62tbQ34empAV7E1Ls4PNTD6CnJOIB7GNAvyoKVIZvBi4GQQzBCqTAZDU4veJwLGNqZglp"
+    "EAA7ny+meID52B1ZA16GoURZ6Ukz6SSQyYWfxhU3w7iK/gFQyFtl960x0sJqo2CaPlxQCj/Wodsx"
+    "WDnISBHjVbxP4uvQR7IqM6j7GSBhzKRG96InFdi4eJLCKVKXvcpfNjSiL50VHFggDw3cMEAuSkjl"
+    "9iIm+oBPpVV+ik1KXjXjCiOwaWSNv6uwrQOSkredHZ5gqsoF0v26Gm+rcvlpUd+cuP3U9jhZ7joX"
+    "rmPrBNeJM4KeuAxC8Y9ht58KVleHDcdySATwJGjiUAyTGA3BrFtwxydgSkrhDzTyN7sWRfkCnZcC"
+    "ROWGkK2WayglyjjPUUjUkS7QQ6sLSv/eWiQIHB8x0/EyAiGGbzStT6aXekOhbYwY8yImtcMeYOew"
+    "zjv5zVjqo4URYbDLzj4guJuJHlWOFB5e4r0ByLCFnHV9mVQwHtLDpiII90h+6LMhEzXjCRS1sBae"
+    "veKG8nHdzY0XauYCvKiCqx5413xJx7lvq4HcivD5tavM3mh36zJd+d29TducXBgR6x1N25+aVh99"
+    "U/Gt578uLw8Xe9MnzovbPhxB26eM7vy+nOnQKhPH2nbMVNFeUPxx7zTi/4cmeOxSSXw/zdOa0FFy"
+    "wmpetJnzg5voXpuvnBb2EVtnyOmVQccnGkmVz6n9TpY/rLxFhcfCEZOvruF2A0PvJjPnRjuG9VHY"
+    "mb/rDW7qTVgJa09Ms7m+uN+4NdgNtel89goe0+V74hwzHTeCIjE5xMlxvbe8kZzf4X7qgrw+RRlt"
+    "PBDH68hoxdfaxPHvmyABmueLGhpo20sVBLDMTVvyfuEP2xhvJmZG+S6mufRCK1GGrK+9ukcmBccI"
+    "w2WjQWu2SM126kY1jsNG+sFDxxLTAK4rwkaUn2MFsTaeWL3/Xt473hs5de2ykTIDq2Bdfspd7UFl"
+    "TiEx/tJweIEz7oh5XUv3lpy1yLuQ2NjQfXtvVzBSeGV49ODAccV5vqI6KnnYSg9mUczSgHVo13Oi"
+    "+mro3fZpbxhW//y+n23RoVW/j4yzjcv/fnIpe+dU5lbPVpUcQjxvjFQr+Yd/T0/u7Wb5w/f/Kfvv"
+    "+B+75w08kd3qS0SqsI/FARWC3ofqgw3dhCXCB+x913PXvT8RO/cuL3/9MfP/nN5/7W5fn6h65u7Z"
+    "zXzxqs602Y+nod3yphTOKEowEKWg1sPJapsYvhTQMcQ5qLKimxEa+HTiYZPObEAgBRn7wYuEsPDP"
+    "4znFpAV964yhZ8TiY5OTOIoqahVzQPuI2BsBIYgQYQmdGLCFgoNE+CZGUpIxUpuz7SMyS29Md/+2"
+    "tnC611PbFiPlFeR1lC+GCHRgUP+Mi1Z8iQbMe2iCmqZbfAfMVPtOVdOylJLjYNobrne4F2N6Trtt"
+    "St7zZ5UUj9hGk6bUrCNrjsISnoWTzXpL5WwG2D9uREFhzqga6USRSKR67JESLG5T32fCK2guyrry"
+    "SbOFjXAZZq+QkgvsMjqz9bBcs+hR5iaFBSp9jt9jNG6YDp72EUavtodMlsMMmQAu7x6Zgq6zJ7cl"
+    "6kUWHaH46FQcGakneNLr+osIBRsV+qrpZOyqu+1YdiK7K8cCYvke2aC1s0+4nOaKYyqpdnPoTPFc"
+    "g0KH5hFDqOSUzHrMWJr7C8sKN93CglFFGpqIyJ0WTscdy7r1mczUQOcxgwLzEsuJCKRXT8fhH8AB"
+    "Y6dRTRE299N66eOtRdOaSzeFtw10x30Nb0iBbfs+EuHHfjNviusHC4G7Clxyfns8NhXXfmNl96an"
+    "jw1m8Pv/Tf7A4Pvl0TsR19V67vwOEAfd4OuFGqLkWn8vptOb8gxfZZSLKY06lYn5lmntSV7+Y4Tt"
+    "pIQylbcrRZ9/fmoGNJYmTRDgpUCMVXLu2FYIRHFXwmXsRGx5TpbEgOBAVaUHdBtNCi/zjVznWWSK"
+    "SKpVjwl+YDN364nSISm8rrvVvaJuZgoEcin4sJ0hXJ5eapwLFjqn1EWMlY2peCe71nz+YiIJ/ydQ"
+    "EskYzibh4fggmEyqPVyrvurllsGNEwwo2HILYu4mmzwrZ/WWCXeXvQmuiOCUX9M27G75ETn6toXW"
+    "3sWiRt38rlf5jya/RRXJmiaItsDLTcB49jPB5MPJMQ9ZHCqJOM2050Wtttpxwc9xmLtAKq6RPpc4"
+    "kJY4hPHYw/4AvGdluNwui4hHTM6vtmkqFuuhi1uTVcubY7XDrcHq7o8UtgcqNbAMJOP1Te7S0uY6"
+    "AtVEuXPZdsk40+I72lZc++WEjHFnfzpTUGFGxk+dPchqLvLgYOPJ8T54evHh0efuH0yf1P/8Qdt/"
+    "zLt77xzmf2dzdXj1gqTKv0w0dgtaD74WN1w0vefv7sSz/36EO/e/b445f+8Klnv/fspYO/tL63d8"
+    "eGf8GWHx/Xd+o47TDQejBXyBjctGNC6XFP+T7hUc7JQkMdJ34RsqCBgxyTCq5Us60kXJB64eMJLA"
+    "Yk4JOnZFnEeILjE330wOa80LZHODLo20Lb0YkB2WbBxmrZaFkkwOOP8wLJJyztbV97n5jAZoBHTp"
+    "MKrs2BMeq64ujqGqyuIPo7X6ahU3FR1vUWhtD8YZKqonGKYh9tCjnxM1GWgpJbAkgn8d1OOaFEBy"
+    "yVWVQr4wm22w/jWMU2f8q5HCTo9o6gKVlXfE8AZKNULQU/MSodoWHT7QLJ8rKgkx7+xppkBGJ4qj"
+    "w6CxiISr0Hy5bQja1uCxzpGHQ74ZutlH57BWT6n/oCvLLZesaEEaZttVvQCk6K9GFZQG4UQI0JOx"
+    "cukI00ef84LxoVkyyk0WdC5dkHzlin6yIgBV1kBcgmVFziGsjs6QtaqGfMln0R7CNuigE/R5/yto"
+    "tCVaHqQT/l7Y8I5zh0Te3bWF18QZG6MSGkPynPoQk9CzCAEbKY95hwXFxlmFEwXVn2WOvJk2Nnzd"
+    "qUj3580eBasMkYcofaexEl34/8cwHicdVcP9g918JtXftDXSTa4HetFIU9PZa1v34wbB4+O1yYf2"
+    "N4+J7vDb/w0b3hnjfr/QTH9EHOj0cKg4p73OkRAX8SIy/ibK+/M6cI80ZL7h5wLMpnLk5wEcL1AS"
+    "vzQcfKNYNGckjYSEe7UCmb1ARjGkushQ8gLcT4kwL79GOLhQ4NiJrgkvc4wV5KyNM/cjCK6ATetL"
+    "4gLxd8aNia7MPh31eqJv3KRPDBk41UszGtYDXqChM/GCOwEyVwkUe2SNOMyPajxhfXIqKhW8veLf"
+    "HBHjEkrHYNhoi2H3b8Ld+LxM7jp9RiRnzyrmDZaXyjImVmK6S+xpvwJGIfFIOmGlclL9JELBRncl"
+    "FlCe16S3Yqk1gHrTFjVnLqB9CSsGnrSyO2p/MWIPYNefQoED8GJulg0EDaeJyCYAXtndNmKecnOz"
+    "RWxDeLtJClXYOyqVvaovGRvo4nX1DUT4zMZzcNV7dPD4cz0fRj4gu+C8xTKayq8KX8AYa+zSjgJD"
+    "/MFs1+I1p5tx/y+uunXVKT6ASUc1fGzyVV8hp3PDfh+EZAif3RbPbC4trhf7j17P6nP3j/W3/nwi"
+    "03vaBrSb6PH6nVdhWBHy4CqwXdDxenlVQicHT29IlLH3vofZ89f+prz/67J5969jsXr/6tw7Xde6"
+    "/pkaSDQ78DzpJ+ebBGQw2lGbQ0CDJ503rFg6QHPEZSD2w1kEvTRU9qsvjJiVvDpwdUcSd7BlQUoq"
+    "M5Vb2en8HWV6HF8cJPuPD8iJFHaDRkO5qCTDm2RC4eEkk5jfEbNrZRektuncCwJ118pWpUNDv8VL"
+    "4mBNPJT4lZzvWRmvWNpbxcm6NLvfVHws9pDfg9QGTiN/o255MHNDRdd06Q8qHv2uVKvSHjb7z1i2"
+    "7sly3GZmO6XjBJZpVvti9aCVJMHCo2JsR360qOea9cqqIK+qdu0dPDJyzMw66tSi0PBfniKEuIo+"
+    "t6hCE0EZHiQyzkj8rIs/A0CAUlFyVnqvzDD07LNcVW2WLehMfEwNEVmCYv3Y8kwdySYnpEYwug6g"
+    "eHdQCY9gOcOIC2+m/KdPHun+4/YOqDnvfURP98WHg5y0EGyULCqd93LKJ31Mn/KJB6P2ZTf/zIYg"
+    "OGaFZL/FJn0fEHgMLwXXXIY+M2Cyzp4jgXDVBRXiWDpO3JGy1Kmq3CpyoYct+PwoiftgDbrtgNTD"
+    "CD9hVxTdUIAa/DX+gYXuhuGgu5NT32ONeb8NzGvKiENlSjLPTZlCx36o7pIvnuweVh9+J3h7uvfn"
+    "341MMvDT/701qQnXxRsrqAztV2D2zSZwIrPTuLw4bmO3IYl45eFezfmNPryb1w0wtYWNw6AvpxZH"
+    "4fmcUcPiQqAEADirwrpZ241YfhmyzTJMtJbNoeCBiDTklgfFwtbcCtiAdLJcsDiDzY2jmmSIKjfV"
+    "L28a5obizlbY89/7ECrpyPuupgyyGGBp+7k8gsvYCaZGzODWrDADen+OzwjxQ77lfkoXhX8bBXEB"
+    "Rz68jL9kW8joJJKMMEkjZrInvK8CtFMzH1MV0+Rz9+2HfJlzudKxyh0e+9YI080G6jKrY9aByTpF"
+    "jsHN1ZwsXDhfYlj3+iIKaUc9wYSUUEteCwPP2WusGTrP4ZkX280f8gCSPRJoZKtAsHXXcaada/cQ"
+    "xiOQzoA6iMMQ5kPA6mYwzPWhiSDCo2o/bDrvpXIES0TXxCZ2O4OuPnCk4PLx0d1zHHxQU//C3/JY"
+    "vZwk5dg83oSV0NQc5yo1HPKVoPmT6PO65CxP912XHvwg23HzGTn3LUttUmG7V01O+EH2zM5s/qcs"
+    "+v33rzTb/y/nff+/mbz+zxfblVWkXgzxWB1YLuzxW2G1rpaH9/++CD73r7128+c/rv/5vHHn/iy9"
+    "/5/v80X5x8ZH/YPnOgAYv5DZNInkRnobGpE3Su4Gmo4yygkZKTQA+EHkClA4txlsGcv2mC5SRh8i"
+    "O3Mj7JMA/Q2Yk/BmNjaI8dY5IHBBvIYlgDLbtMQi1c4JaMQmEtNOMafcYGf3XS9OAPnJ0sbGTMAM"
+    "AgFkgNyhGMS8562lheojiBSiZu+NjI8JRU9l0rZYk3AJbXfikrGfRg+ISnvf6z2A2GtraNHKcz20"
+    "XISTTqp9SxRARIpD3ZV7yBj0z2IQQLihcnOo+6lhJOTMBpe+xxk5OekujmTIGhVXn0Dpo++MaJvX"
+    "GBIJmnhnbbln0g1lhJyQBXZD2xZkZDjSArGz0VlNqnLGxgmqwNGaYAKOmD+MhDhrp0PWqhJZnMO/"
+    "BZHx0X2LOy9yVvsNjm0TsvghCjvkhjiz1/zhcBWj36B8V3xOwbMbC67bp+AnK74ICY8SM2jQ0Aix"
+    "wx3Co2oY0PUhd8DHFxwHFvfjyUDliuFLnRz17sYQNR7rChj6T3ttdxwLWjYYZzDUUN7Kww69hzfD"
+    "igyzbNmehLVo7w0hPdS9TYsCk8LejWtzXX0hV8TfRYGLDYO1Q9WExt7+74B8C3Vdrb1osMrr087L"
+    "/y9eHtu98cfuHRE8MHf3Jfvy2nRyz9HTmu9itGfnGKQPCBBvGHClW5Hqe0LH4w6ZUfvPjkSBfBjr"
+    "TAo9+nv0ifgux7cUf/dXBEoTKOd5tQWYl7Ik7ERVlKxIjjPE8r4IpsoCse/SYp8fFoLFV0MBGJki"
+    "xRvEGOSSxmKMWStu6EKkMyDhhk8Qdrsl37cFoUBdotbTrKS41YEBXbLKw8+QECOiT0hN72HTjukt"
+    "pB7YVvFyKjrH2XGv8q0GZkSAR9iQs5sSg6ykrUxVvtiMNSP1xR/bfsy6KXroVHnZEYssDiSug+dl"
+    "wvcEnh2illvXCBJHFX085YUJKKi/7GQxVI40sBudfGx2qxT59zO5jmjmjLQGAHk0llwxTpAFvO+L"
+    "xkQjmIDP8JaMlybMgS7adP195tKaw+xq3ofier2LADtCdvhD3QRZfcmYOZqql/6sLMtdnp4YWrJ4"
+    "crMy3osKPFldtX+WXbAEht1c/UF3J0IAdW4VErGUXKpuHaD9FiUHhCIM9NNY5XHbDwfCE2FVcZXH"
+    "pzKrG2mF3RWywfP318739/44/f8i/f8sYf+86p/a2KkERXaRWBP0cEVgu6P0fQViqKgM6bb7nn9o"
+    "unTuz/3v/9+S/+yZPfvfhLz708/KVLG+u3H2jm5JcMaMzmuYE5AyLjGIHLeOZyigyE4SOAXM3TGG"
+    "uToCNlnCZSzgkYXPO1ZZI6KnUuZwEPqj6BlD3Nb+yTB28P+FJA1sMqkxcANMwrwxNVLBbJX+dHuZ"
+    "PBPXhldtx54i5dy4hqHPwEa5RSJgaR0B92OFGS19JDPPKWR45PKi08ThYkfC6iSpYvzLip7bQOqB"
+    "BwPpUa1kVOtM0Sg6yLRQyLei19WeJE13VGEMe1Z0ddKPjOj4nogxMZbV12HZUtVetToGwM4fhE2v"
+    "7opBmfkFnGyxN8yTbN8GxIFbvEKm1u9+C14fI/xViIyeTHRQ06lVzvLmjf7ReSJg8CYKJODMp9s5"
+    "CbynZdwWubsQonYbKfyocSW/DyA7ZLegJYfOMFCVlSfKaPM2lPXyMWsYuv3c8iz9b+dUZ7+gKopt"
+    "fkH7vBSN0o86Gevaj0BR9RiUvHzh6oP4OVCZO1rG2MsoU114TxgL6of1zFF18d1yOU+VFh3ZHT99"
+    "U2jnYkz8RfelqMIcWW42hDV0c29FjWhl6IMlz+3nDm8hPDX7jryvDJR48Pb3jTlWHYvyQ9wPXhSg"
+    "rfh2MY8tsrGe3wQd703TrfueXunOREU6vLRRaXsqcF5eIwfXbhsYz4VuwJvBJ9ln+3h2jELPZlIy"
+    "IeJ0NXPE0jGsKXH8TVFkwykHFzcQRhPGKcVl4+WN268oTxB+nSVcsIEx/r4TTg4CuNcinaT6O74b"
+    "Mwq6Yh7KWXjOkI8/FG9SR+ZnefCbAXBQKI3eusi0a0RDMZZfnquEKCbgPFTjkLo9CjSDSm+MWTTc"
+    "cYp0BrGy0tcvdbPIVt+TZreWtao2Bcx5IurZBiq+VhFYAVDT7SYMG1ZxTKZZGaKloT7WhYaOn4ah"
+    "ViRM0jGsScT0RT7NpGKY876xs+NpKVvOIfSjRZOOFp4gINVyORQumrEx95odZ8sHRsyRC9GZ+O9P"
+    "Ihnx9pF9kxmjZeMs22h1cPTg0/uLqrl6HsqtnNsJ5tUkaDvTBzzMg394/UHwknudQ+QiNPnNAjpZ"
+    "R6QeIizZrGBGri2ojG2IXP2NHPEXDn/wdbi8W/u3D+xKcfuPcNn73t/Knv83VdA642qwj8F0Rgta"
+    "D7LwjeSnUYbj1/5pVPPPr+x27+0jcu/fvHvvLMd155+ecvrW2/dW1n57gGMn1tReOUBl0PucysNb"
+    "jlzogmDLCYTijD4NcnREouM3RaRmUIfJRaTrmSDJYHVPGXulKmzKCvPXx0skcugFzJNqcZLrU8Jx"
+    "Mplm47ASZ0Pj5BGeq1ODVKjwuuALsuyrZ9n/jaxxgSNwseTCd68dUIEC0hXk1STGjdsbLErfyPgB"
+    "TKJzAmOGGXjaK3CvtYxJdlvuuePXAVi1ZQua9MUtfx5wYKbcRCTjp4xp0E/sYJvDGmMS77plsJa5"
+    "XQjB9BpLqpP745uYra0BfHWqn/qA9ENmIWL52mjxDCJHb+a6LUihwzEckFBplq+8j4+1q+1KECtf"
+    "UEg/zER2dTb0zgwxTforYBeBkvBNvCP31AtWJhg2MSXXX0PbaLBcMy1I+IotN3d8ywahYL4w/r2k"
+    "cgmbbFRmSDRR78YE1p3T6ZlKGfuEpWEzXf5+d7Z9LFXWuWo66d+n8/es20ypN4C7Ng04fvxQ3bkl"
+    "FeI89MCynuzDHuzITjl5wrFtsC59UJO4tXh711vcXyha8Ntx9+efgrDx0NH314fzh756FkWczVWy"
+    "z16Ka+mIOT1EwfAgpNe74Ux4Jkgd/6cIeOtR7+b2oxpz1DAusN7hDHb4mCpwTk2Ham0A/4ENnEFq"
+    "uRoX0ciTE+yMAjeQseeeJvWloWGd7GyqOoFVILIpt+Ym0KUJYf8OyP7kbYlliyYJPIImpK9uj3xT"
+    "d4eBv3gq+SBLPgpfL2zuZazgXJZI8u44QvJGEPf+CxIFXZeUMjoxJqNU72cOnzjhnlo7ExYUVjgl"
+    "smVcarFFvDQiI6rqU28iwff0ObCqAkLPuKtx1/ci2N3yoLvNvSFaHySHnfspN9A0TKDOtP6DYyca"
+    "dZ2bPFv9oHeoI2EuI/fki0vIquS6VSfmaX+qVNpOQxuPE4P6SuY32bJTxaVQr64BvHQR1AXFzRMR"
+    "2oTT2tvBhmh3vDS5f3h6vDWR3rutfOoYmP0vOFI+X1LyR8n+CK2l0CvoXYjxlpTOqDLHZ5ysBS3m"
+    "lM0cHNBQmK4Ng8G73Fcmtt7Y9P7Gz+H/fceuqf3X/vG754YnfzVXRXaRWBH0UEcgb5USCtMG7YCG"
+    "zvbB498s43P3Xu2PY/+v0vPfn0l599/hMvz4dHN3b2br90qAmQRrYjXbViLJzrV3o9yWdCoJO4B1"
+    "XRGWhzkmYY7MGWAbaGXin7dKCiKVVGmjJpzKNTA6/pyo88UKzAKaJOmq3bQJYWrgQbxhd6azbQix"
+    "SwSV2H4MYfX5UTz3c7sOM/i0O0FrvlCQKU+IPUeNJLwfXxCb6M2C/Xy9Ydg8YaqwFiVSCxs0FRbY"
+    "CtXTHPpaU/KYrjy4rWGGPR+mkbMDLhNx6eYMYA1WaVD00FZfBrLIvk+JTj0CtrbNRjC0VK0U8OST"
+    "5h5A4tdzk8TbbIa/1zCKXChLDCaTn7VPGCgF7iV0ZlA5onp74IEXrHuHWyZwsGJ33J8VEhE4r0fB"
+    "4F9ESFfjX648xSeVI3sFgUW5bqqexH6lz38k1kR1Zy6574ZMET8/heH/EIEcsoUWKvt8vq2gZk9L"
+    "y3LLbQRDCzpWUMwEsyTQXwl3GMfeJhWsWGHcn+IQ+2bEZPEyTVJ3nw8Ju4okFZi0gRiC0LN37xiV"
+    "ncmhZTC/0kwFzfX+MxrA29+Q5f1rbym1T85Aq4m4uD4eTRtWFvcW3YP3xlOPPKU8N7znx9+OTHdo"
+    "c3vF3j145+W0713eAnCQiaYyEbPLrLojFOaCuH8Invy+mNmV7w6a2ZTI6JymJTk0vkudmgnybgUU"
+    "s/CkY9rQ1DeRVsglpSWZjeIJf4EifHw/ENn7r96dQAAuEfrIArXmRpP8yATFRrYq1cZKEEN6oo0R"
+    "bagwer8NjzZx5X60oPOiWKvjOKFHoBLDnaIiREzdKm11eGUsGxgW9AMmDbCWuNdNEsYtvwk/IdK5"
+    "UNXPTRsMquUNm3CrTWJksh2NGGL6p2bhNELa9NRKvcGNGalsZ+LT/gdtm2XL/CEteWjd+wVWhAy8"
+    "ATPWDiKFOBG0mWpxSc5MizWFLSJipLDrbbWlPZc1GCiy9ou4y+kmW0cZsUo/XLnQhGUtoZt3OBC1"
+    "akXWfmC168iWayynrJiV9cZRssonTMHW4MB7ozd+nqnn6H7oTeWqs323rxjz66qoPbGBADjY7aX6"
+    "iS6XxfWEzd6yKWBp7m+2IKw40rxCPOgnNnUEwUS89rZGdxeHBxczF/7MfOnvr0A2+753fuuO3Us8"
+    "LQgLJKqwj86CKwWtD96GJ5QyNt66mm+95615/ceeHmf/X/fuVrT3/uqae/8dU/+cEnr20cf9uGFn"
+    "MHOlkdaOCfb+mUrnF0Q4NinrXPyT0TFE4KPcwyZDIIa8+4612d8BCq1KcYror5kanX3G2zhqEKy3"
+    "pls4blGtbFQTCDM2a58uYJuP3gmf2pfxbNpgB6EcfYXlCgAchs0/sSLTI+SbQmVRD7ZD5O2GwBoa"
+    "UpslloSYOrgWHVlrrpVOKTDno6Fcn+9CRlQQyLjqzl7bQ4cjAsPNVndFjFiQ54LCZ4TTNkMCyrXa"
+    "fG9ssxJvRuM+yjbBabtlW+UAwvdeiKTmMUCRDBiYYn9l5o4Enqnruw5EXRZomxXCgsaRNnwVWxXE"
+    "098cu0yJHvFIzy18TlRDVy3BuY+Asx/zr943/30/jodgZHLMwYQ84wkeBxQscdOjLaNrLlPfGmD5"
+    "dF+qBkuCdEvGwLNfL6x3fjmdUxSv9gwmZ1W4BnFczYJ/TQzyOU0OiDTLj4XC/jGFm/v7fSLmA4ad"
+    "TRJK2Pu1jUlt+J8qRMstjVna0s+FicaCGr76fNtYCbc2eM+25a5G1qMTfny3J6NFJPOcpPyfF4lH"
+    "w8tnU4HFtcHO5ae264Z/3bw6MP6LflPrA97P04glqAbehNlgf4taMyNPzUh52Pa+15/BIC448XeS"
+    "zcZN9X6uWjXoDiWb++M5eXnzDdUxDy79iRJ276V1IhjeK8SaGMcZakKNcnKI6vM/DSpmkf8OkhhY"
+    "2tsg/JaBDQQTWOjPJgdHJ+YgNZ/vwoJ3KUBaVo4RAbfeiv6Xt+TsN4pYccCFK1denYT8cSQ3zKJb"
+    "W971xBw45w8wgpplJfdOFESdvuL6LhSRKy9BlohW/GqBm3ocUxRDGiXWFbvjdCntghAIl7LBqCjX"
+    "WJQ6wa0rCusXWMWHEzv/wkhg4se/QxWYjWiWK7GRJ+lL+MGq4LWm6cqoeNLOVcx2Ihio34jV2O2y"
+    "Qfd8WFgj+RQ0L1iWKsq+7dN9tvpFF3WIidbbZh8SobXMDwkTokl0cx/Qo28ea6eLM7vHz1+PDq4Y"
+    "nhynzHX5Xwr006fuW1YBx7Ybg30J86rvYlRsdxykUMxtF1TWCSFZ4y7ouezyR+ntfwzm/RND4c6n"
+    "LSMye2Nn/jngu3/OqD73jj5/Z31lnIiblKqwj8aCOwWtD9aON5o6Pph8iPXf7J973r8bsunPv+v/"
+    "3cl/7oie9c+5svHc4efGVncfZoa0vTIa5caRitnsegx0+Et6TIAAAgAElEQVQa9GNTOQForGPsVD"
+    "T9FRTnOrQMwYyF2edE1QOsNISViQfaGmDrJDJdNEHHTk4ukbdPpsOb8JmgMWj3KQwTOgFIoh2Ko5"
+    "wUYtJ714OyiS0qQi8KwbRv6DWWTiui9QTWfE04G8NSLNRyLjeoFyp6gycnkaCw0Cr/JbGhCefUF+"
+    "qGWyTrqJw7SDHT7nbcLBdpb9lYRhtkXJZlcsRkrIrLhE5ehWnZyMunOqPDsi0zUgPawsm6yuNz2b"
+    "KNnkSXGEXOndaWrE+o0IhdYxkQhdggbmlnsG0ifmBzkligBKf8FD93AYlrL1bIL33EX8xSD98ppE"
+    "i8sC6e66687xZM/LCafSkfpeMFu/auMroItWAFG1ysmZeC6/T/sffmz5Yc131nvX3r7td7N9BAA4"
+    "0dBEhKJq0lKMk2Qx6ZQ9mWLUfYPzjC/9pMxEzEjBwaeTxmWLJDsnaZksWdBEESxL6jG+j9rffN5/"
+    "M9mXVvYzw/0lz65nu3KvMs33PyZFZlZlXdunV1uWFlodHsByNK1Ze9m1JihS2LcmKObO6jG6SQ9U"
+    "Gex0VIsdvMQrBfyKi4ZlITsXsk6MO81dFG47jKi1yCWXXIQtBoyVbt4xM9bC+ySLOd/W6rL29xAe"
+    "e5JXl+WJhXMeGXd+e84EAb+hISb5Y1/1ZY3C1yl2w43B2Orr81PLD83eFzl68PX/jMznDl8ZvD0i"
+    "lxmXdZl136kQuyTCQBse6JB7wEg7JdLTF2EVcLOSffuSOnbb8zt8uLEqyz/tig7NNmmrKi1jUbY0"
+    "ybayZlwWfYnhSDo/2wskGLckAanXxEWr8B0Imrros/0w0aeMcKUgrVb6eYmkOTP58hFa9k9VNe+A"
+    "AbZ/+1UUkKn9yVloJMg1Ww6gk5h2xZqRgr2kBavFSrYyi5YAWKTd19KUQYSbOL/zgIlaO4mMFOr6"
+    "AsSsPMzs005XigOFZJVjsGS6rkK77y+ES4MpqqHJU0r2BECrHr2SeKEzb5dARU+BOk/pu+unIKux"
+    "q3zE4xeiuJVx5EoTZQoAWz242lRk+DkC+aCNrqOKXRrVcf6BIJbWShlFLTLB+aJ2M9gpIgtP6evP"
+    "0MSeKcu4ABQrLHnYs79SI0akH/3hu2h/fvnBxuTLY45ld4IRvHa0vy9a1DjHRrGmfKSdslbcC+8p"
+    "7n1TMGftu01dqLNRyHaknRJfe+yInz9uTo8OD26rD4lUunN/7P5688+B8fvXzh9eUFf0F8nuYR+N"
+    "FEYL6g+9HE9f5G5eT42OWH3zyxsfV/n/nbb/7gyy+9/tuv70y+sH904gq/8bRRYzq/B+WE2NMh8t"
+    "61c6LkFcTc0SGXxxU8SXqyVSgnVHPk+a+7Z8lyMvWEL70PKk1HTc/WwS+ZOgUXPQMkYLGrCjj5qB"
+    "cfVEW/J9i5a1JjMlRP3kg0G9krq8kZrMorrUpNJ2TXwNTxy7PUD2bYrT7WNQOKok4oTcroT2w3L0"
+    "f5sGOw0ONQ6bWtKN5YyNhYQsWJ4YYrpRwNr7xy7urjJQ68CCtPGutexdmoyYz/nZi2yjxlajj1Rn"
+    "dc7Omb4FlUlRFtGAerLFfjbpVLKXRlRaOgYBWneoFqC7OWRyEpcR5tdFsBDX7q4WSapC+9XYqp1d"
+    "FcclXGlm0Vp+04bVIN00lKXeWuvAgdQxuW09plEl16qnoRMg7Ie9ykjUrDrO1U9Y/KyI9c768FH3"
+    "ulKa7AJvuWRgtpFj/GYeWmFPtoqJe6EDPjo19o54KDKOWUcNBrIQxZRo7vblexXh9roJ48831Rm5"
+    "WZUXFRB8Qhjvhak0O/L8fvTy3wyOMCiyjfrHiALy6qvIO/DN8lyDpvx1tnsbZw+N5w9vYbw+OH3x"
+    "z+8TO3hy9+/tiw+cDN4WiV23HeRsv3ulzAbWiFvR3W1kjNqJyTResNLS9HYTh1scWjlFZK33ys00"
+    "WKCzpfDjXJo4jVXr3tjIFnwt7y7o16/Vt/gEiJhVLGwzhFquSCBWVMGk/RjMk+h66+aC8HvYtgkz"
+    "JGBpWcQ7sv8ioVXPmStjT+JpWaifLTtpgx3Z1HUFSPbXu0KlUH9vpFuSfP5X6vr6HULna0X3Z1v8"
+    "YFIyWmeNkGN1hgNEqKShkDU8WucqOdeAVO+NiJaJWkmmtGi9fsFQryCMSiFaOwQF/oF2+UMU37c9"
+    "BGOKOvhT6mRbbJp36Kj7HUkPLlRm2NDTRjpzLJfeFSERc+/KX+PU7wE+v0BTV6Mk6o5GKi6LSosQ"
+    "BwROdYD01M86SIZNM9MBpo9GKkAhP8aATTp0z0DQHLfNL8XdF9fHTPceh5xvr4O56qsMlPtnB83z"
+    "48Nry/d3LYW+L35xL/3ubWX38QBiu9XeUgtHlISq2G+qEzYitGysvNOA+kDTGa/ub5JWLicpHIbn"
+    "M44UfCD14+ub74p5+8fP7ffeKph/7q+NYGz23P0zwCP9oIzBd0P9r43tfoZ8+dvvkbv/LZv7l86f"
+    "x7f/m9l773t29/+FvXj7b+7mRYP7vP2fCAq+QZODhH+4PkNTkmZBD7Cbdf4c9kBHoGLE6gudgW5X"
+    "ZCdVLrqZeza51ghVEePDYLTKTqjzNum3DWIKFMDUie1v3POR4dHxX1Lkc9slZNqf0+Y8mkAjKIsV"
+    "Gv5i45cWpwdtRwAIpIDVpQamDFozZBaVrZVbVKgW25k0ePKGjfD9RaSJrNyARdqvQavOouVGrFgg"
+    "IeQfvv3VVygdrvQgmdK4xCxo7wRs7yTJ6ig27ckRcvmx8pF8m7r5ngIxgMB8AarWtymeCBlQkCsv"
+    "wFJRtKyDuJCwcMyYld4ONQ4eoIzECL4qAvdqOPuJAUCnw0a5CXb6o+oz62Ak9swCquAhFStGRikw"
+    "my8gFFsgUmOtIVDo2cThkTaSRtpD+yW0mnTpjHPhZlZLo8t1zTltUvdQdMum+qKmBLkce2E8rksW"
+    "kv1xdfZJIcBeNkycWZ/TX+KKMg0uo6cbFuNe1p8VKXCZ/08q3VE5sa8S11/pD3Ev5q13bsk9uFLI"
+    "ScjCnoYotdgWgUfRdvLMZgSPbVJX7rUKeyMGLvXLPWTiu83MTvyDmUbYDjecBFGHaJ+RHfc7Nuvh"
+    "B8GR+OLR0Mq/yu3OpH7wyn3v/28PcvvzH86y8uDI8+y+/FLfPbcit7PDEJFj9tkHaxvQxQXlgCkP"
+    "s4iw3XfNqyPuD7e1f16AG2DQyPd/pduUkqiC/KSDfIqW/1s2Sh21JuZaYtEA3POBlFVfmjGi1xXO"
+    "BLjgf1DTT7HK/xEZpljwWxCFpaCX2r1NujUAMvNTGOjyrFF+tFVgdcvEa7tPSnzit6Lg8uet1F87"
+    "aVeFKzFQaB+BSNeBVeWYSnr4m99YlQxa8DaxeympUrmb7t59d4qb2OgUZoESw/gx/yKNRgVIy4Ku"
+    "X0LKEfLGF1XOr434GJ2qjb4AlC4oGqbVHvRrTbVTzKaN+qA7DYCZxKDSco9gv04NnexteUi0gW4h"
+    "TK5AvdbcMbKSj0YKivrSQznk85tlofy3kMLI/uMtUUgj91M8zgsNGPnpKV0T7uBGef7wnHEELK8a"
+    "lQ67MfF3UefI5zZNFZ8FFqbtd/dHdluMlduhuTdRZ06zkOPSMEWEF8qHq7lS689HY+kjrabrLN74"
+    "SmYXksexlGX5fs22mTyT7fk/uADv+Xp0+sfekXnn/iLy9fOv3KCr+iEEPzzTwCP+IIzBd0P+IA3+"
+    "/wm8e2Dj/zyWdfuXjhzP915pvffvmrL731z16/dvMLS2vHr6zxaNQOTzJxRWvY55x66OSLgK0wTN"
+    "TA5ClTSp0ws5gyoJw8Pcf6+NLsSTZ56A5ZplHekzifTNKDl1N6ZLIJXhTLrsRM+pmg5DsfhaV+MJ"
+    "DPCbztPbVr0YFDv0wlixwQeaKtMWKZujqGuJNcKk1R5cazciWjEB/K7sUOI/aY/DqPgpeFk7rKke"
+    "pxQXPln36mpP5IM5YtvtBij21aIjitTlEtuw6uQjhZKxsuaMolLZX1mKgBVd8oupVrWyQ54S5KfC"
+    "4ZBavewUw7lFcCF6eVZ0qZQMdGrxkFfVKHjZPK2ALPFATnDwoo2LDkJb5mSjSclk2981ZAqIeZBJ"
+    "RuTWULT0rqQD3NZy7lZNeBP5MKBewvzXLqCy++SEQPg70cFGiyCxtec05eLXfFqziLHX/ZePRYmL"
+    "0LEh7kNIOgHkfimMep0DGkfT+H9aUvkZBTG6tdKOVuDxToi052NBxsJ+bo+IEXPfI+DjmmCDf5Rt"
+    "SjHDyUbTv9U6ymkPjkHTgeq1xcWEfCO3Krw8EBzjOx846dF4i0tbS6MqywuGRqN2zwQ+BLO7zB8s"
+    "ZLw5P7Lw7/9BeH4bd+Y3NYO8/Fc35AfFjkzpwvMQE7jeOBZcCtsv53n9IIytmCyOZiC3kXdCg6Nc"
+    "/CkpddJnRZLdsW1gll44CkKe1s7aBVqr1nvpHU1NSVXv1CYloXNf203CBiR0yWmznGNIlua4O0qz"
+    "LNZGLb+MHudRUOGaELnLqp0/hedssiVf+DBxOepSR2uVAkjVjluE+/KH5/a2fqClY9qqtcd02sqZ"
+    "9hFLJOJDe6RmZKqVyspG/ZLk0AYuqbOihh7ALFPkz46jei2ThUmCXZFSx1urRW82SjmFD11hZX1t"
+    "jWxiUBNXpdt2HDS9xzgaJo4sRadEZrOkFqev1YotztllK3hV65VvVFzbJqaXuwy79i9HO1Jm2nUu"
+    "7mQoTmP/6OtuPltJ5eBBifNJQnNn0nd8H1XQegkWoMw44ihYrJVu+SUIhmO4i9CQ9ZTjj+jNX+3s"
+    "rw4c3jw+2Fs8PO4QbnAI9NfbZO7irGLdKJj974cVN5uKo0Qm+r1E0jaZRaxFZs/B085CeHu/yu3A"
+    "vbm5v/7tLZE//xuace+va5k+s7sHLZJ0LzzTwCP+IIzBd0P+IAz+ETgcml8+ev/vavnvzDpy68+M"
+    "JffIN3prx/8G/uLC7//O3FhZN3DnY4v3utjxcZ+OY4JiG52lijSI0hnGVTzHm/TvA56ULMYzh90P"
+    "Xk3wcAeE4oPFEL4l8GjLjUT/I1IRYjA1ZEPXGbaTKe+rWjXkZD2JSnNPKi67oouYqtDLZ97GNmzp"
+    "DB08mLmE4ElYEInAhaqJQ66IcM+c0+3JKNg5YqVk6YBDflDkjpQUZEayyNY8OiuI5a+CYYSVLig2"
+    "TKqUnliy+2erVzejomfc1AV/Kjlhns+KiZd/2cACamOkKKu+olo2yLI5Il0Sa1Me0mlQmvxyCx06"
+    "98yr3UKbDVRjCpKrUTFFvq5hNC1cNeIK/6jvbLA3XNJo6x0Tlp8cQvOuI2rT4xSs+LDf0Go6Aqb5"
+    "2JTXNp1LXP6JvSLrCiA8E1gbhVB/O0APSUI919VrBi3eMQI5GZbsZ2t26o5G4ughNfFEJZw1VTtu"
+    "UQ/rhQSTgQUE8hbc0mlzPeHVMW3cjANx/dqpMaKUu30OTSDvoRomTuSBI+F3WL3u1jIejjlN7ZW2"
+    "Aht8+dueXF9XxXTpUj79ZxWPkTBB7rvn5ggysqy3v8htytN4fTd18cfpUF3D/7pcXhsz8H6Bb0Je"
+    "ZcBnIfXF6eklQNjlFqlyDDz3FlP/G4dUHHx37DmzSr7Atc7F/c2T/geMPpnF3w2w60gD+plxWnvh"
+    "WPZBPrmCJnPCum0zY1PGPSH5WTxLGnYUOtxFE+RWOrwZAFsH9LDrPKBDctkjoq05NU7Uer/HZSrr"
+    "y4+g/PT+woFyeheEiZb3DBh2wxpwnZ+RQG2aZrRkRteEmJPLYCq5CLG/jBKcsqlAz71pPCd1PnGx"
+    "VJse9G+Sqbn3qgkMh+TNp238vmZ1J4lGWbj1gnNjnw41Mjj2JNZXpc2XbApF3I6GPHLSfCr+Of4A"
+    "aPje0Q8RhHZcZCg5iqE83Ut7Wrok1cs5oULUgFV/jKdLrZXF2BGNtqmPefP9udvVimancK/HuBo3"
+    "j4kWNEYLXsu9GO7XydAVbqEsCANgcDRN4YeDz5HVcv+a5yDljlrZZb/PYcPybOzxXs8CoSr6/Ukz"
+    "k1xuqzSWvNRXLINKqcJPqYbTEuttMn4aTOSnvMiEn2kCcRjia31xcX/uT86a3/5dkrD/3p5YfPvr"
+    "+xPF5tCeR8M4/A/4gIzBd0/yOiPLeRCKytrh595rnn3nzg9Lnf/a/feeNb/+2FN//5O3cPfoNJ01"
+    "P8JtQxLmflLFiPM3j+rMFhmclQLnLnhOzJNkN97g7VIAJ8OxfHUDtL56owJ3Unxhksg2feASHDTc"
+    "7mnuAhcoJup/mmnwkZ+QwyANcEVlMKRLXpcIJnsqN7NaGri3LazGNNmcXUoJ35FXbc+4au5gX5ht"
+    "l8yETQKY30PNJVeX1QssvrRVMNzbwLDB8F8XtDPrLa/Raakhptn2pk48QvVBc+kdCIceYv/rfYQC"
+    "6fK45+SfzICS1yppIqC7HW6uOENnUPoj7KVUecys3WI0AO2kqFYYybhTIV7YqjtSoPgoV8vrvlBN"
+    "BJdddT3UKzZz3adKG0oYtXbrGQ6AM5TRcXHOiDUTCpQwh6aYoh9n3iWROPTOahikEYGhg8AGyr1A"
+    "9eQ0fAvB/xkGMS7V1eU01ooaNbj6nWZKVjRHMGKx51twRALwsds1qUF6daX0uf67ZVsP+wTQCiTg"
+    "Hb9JPQZCpFX3EClP5PObG1/8D3T/c10+9QqtvrmOMTppTQDY1cBeIP9lw8CeAdOH+OgNmaS0dfes"
+    "I7gdKOBzwifUiglvBvA/xVjq817rytH7wzbH3w7eHK0UvDFz67PPzKzy0OFx/34tFNcLmYpBkXaH"
+    "4PzoWRbeTGuvU+kMWbwyWPYuaNTgo1eZsZm8Yyd+cse5cOkVr4wMjxBaqrNpLzYqUs+emLOYCgWj"
+    "a+xDRSPY4UTNqyxuwTp8iKVmcNIBJH3RerMKJZBCFg1OQZLQVMsV31GBW1oDBJa0EzJpEVBJJsjG"
+    "kvHrmPTjIVwsRRYT+lIkb3serjMZ4ahR5BwOv8QymPOohp8Iy/WOVbbcvDkTzaREy5EoqeVir6Es"
+    "unUaA5VZzGbyJWq1kJXMhdfTRgLIxbOoLGSeKQ7OfWm2xDDnkaYxnWOeQmV77mbNUaK/ozdiOOUk"
+    "Wm2wcDmbKHzRi05koVrxuaRmPqmw4W3S15O611UhXcauMUG02F5lQqoBakXhnRIKkbOm04i9HFKr"
+    "4K8REi/Y2DPLYdW/XB85UsZIgpD1IP+7unhp2108PtPe7HQ5/wm49ZVyEXGOwd+RuRJE8lIcYnBb"
+    "DKi5qMTS6CqMAr3BIt8rpgKb9Uol8kHgrfWV1a+M72+trvP/bg6d97/ukr3z6+vsQVonmaR+DHE4"
+    "H5gu7HE/f71qqLrEsPXrz1P20f/+ojp7Y++OrLr7zw/fev/5NrR5Nfurm0fum2t+mcVTOJ3XMyzo"
+    "n20IkNZ2/P3Z5GvfLq7zfBpVgndpnjGx2R8qTc75yo0wcVIbLQCxSlPoqoow0gw6pdaDX5gq+92K"
+    "8TuiLK4yoTtDZQwxI/kuYjNG7MhJdtwYVWg1jZyMAbzamd+j6cCthzsmCm6SceDbXbq4UkIhkEXR"
+    "iZNyZY8sNfJuWNLlxSMFsciGlZbH5Y2QCVt/mOi42S/yYjSCmxkzaNvawsmKC5L+4oLhvfpuXy1V"
+    "lxAfY2LLmpvVkv1QlI0Mi2BaqowtiGVf8y9vEJRbBov/LDejJ5GH0qm7M+pk9YF4mkcpX+Gj9aPy"
+    "hOtpgHTq0oJQbe0VXcdjXBqUSmYjjFD0MB2rVsx8PopL9zbIwIARKTDLscE2RSxzQAeTqbTVj9V0"
+    "zur3U/Wty1EBKb6kPxIr7LyKI5vkqPV9nmTY5lzQpEyfYQNl7gQ9qEiVTpyWv1igQXwPNbbSy+0P"
+    "HnCPg1OL4zx2KJiwi5U0db1SNX0Pjum3cHt5i0nZzcHZYPbw4nd64Nl3e/N/zK428OX/i11eHCkz"
+    "xWyffknKwt8SjmOLNz9eWdNFdW2Mpej3mUMwHqvy2Xu3HIWW9ljTcXXPJdXzAmXLG3PV1adSzhKp"
+    "njQ8DHiwVhRDqxSDGxsp+WK54PEj1VEbBv5W5pPzFBDV8eH1sgEK0ksDre0TX1vtp1AlqMaFAzYq"
+    "psrE39mrFSvmkXaYFCQD56hRw/wtS+MZnBTF4THl8sjGVFojDqWCeGsRkmbPurcqaOpYxSet2SmR"
+    "k/pIY0k6l+PGrIKZmQ2KQ+LhwKN3Cx0iTh91pKKQ8Ko2/LJwH9NMfTFkWSEnNsw52KdGkkKsWLEg"
+    "aqjpvOM8T650VPU2LXZVvbj5VLH1BBQaWbEjm/K1xk8WXycR8R+ih19gJFUxwxEqoRVx1rrsfI6l"
+    "jamFiSxcoMtiQkIyMPcfJVV+noa370oWT0Ke0Hsy56rPCI5fZwdff8cPVgm4UdfT3XWrQZo1FEun"
+    "yOD4VlbbwY6+O/9iQXgs4pcoxBmBBU3bPuflfOPS9k2Tva332fb+/+yUPnTv3uZ557/K8ePHf8Ku"
+    "qcWOZpHoEfXwTmC7ofX+zva8vHt7Ymn/3Ms68/+diD//5rL7363a+//Nqvffe9W7+5cLD66aPF9d"
+    "P5PV7Oxztclc1kwBcLcDJ10PFlJU7ccoKG7ERliVXVeOp2IOCk3VPo0siYl+t528TpuXDaoBEx5a"
+    "KkySaIbEQ8uzcddU3TF7ekmI1qnZ/BEYLSBauBLluDU5WU4Q/ZWohBFahM3uNL0GBlEO6LFmE10s"
+    "DFWeqTzdDhUAnpGUSZZAFQfkmLahnLRF9fup/64SeBSeSVLp+QCUusyMFotAK13HQC7xK0Uk0cCi"
+    "e6KiqTVHnp3W/J+jmKRK6V45sCzU9dHgWtc6ujOor0RU3DqJ5QclEDzwG+VyliFkjZihfBwu06s8"
+    "6VdFQqNpncUEY4UDwyuMgEQsSgqFBAbWcBoobU6Wz2eXkAhDE2EWGTRRP7rhAE0JU1byaOq2C7+P"
+    "hiOJEJ32JobtXVcpHUKHbp9+9JxTvkXAC6LPMV9X0RUZ57rGhSfY9l8vHfxzPRae1Hrw1fc9ybBE"
+    "v/+B1LvhMz4TtzC+1xx30eazzyrhx6Po65un+Y37fcWLkzrN15ZXh2eGf4+a13hs//yt7w3M/zXT"
+    "ufAXARtsye34PLd+XA9T9XZbCTBZ5lK5iFBjTfvuL3cbw7F3nKHjvkbU4vOtVj1kaxf6ijFcR/Y+"
+    "dxWm2oRMEb+zGuosFQI9NqCrrq23/HeNNm6irUQlVKTDrVk5bvDnoc5pygh9V2avr4GeBF41ZD+S"
+    "dgpbEfIWGqbcylrA1p2nEvdpyuXMk0x5RN41op/sU2xnVHRbU6X4tRvakherzFUJUD6sa6S+rGIy"
+    "NdGh+S2SQyESugMEaeAhTie0mzLbB7aA2zmymRsVTGmkwVymbgcTQtpcO2O6nbT13t9JFgbyNT9n"
+    "qCL4L5GPBYtJ/UcQMydjvCiCMUle4uRb6cjq1S0AgSygVDFFNrAYpFYVsBhFAtFDH5+h4jLsygUq"
+    "ynQBpOeJGGhc/wAxp6Y472bVPrXHTDVcJsyVfzacfFFj7GdzswTFQMV9Q59ndZyL23y6OWB6fyZl"
+    "uu5ggWEGGnPsYI6t6p027Z74tGz139jvARx71lL9imt074lu7iwrXVYfL1Y5vLX3rs0qU/+vTzV3"
+    "7A45Xzu3JEcp5+/BGYL+h+/G1wP3sw2T61fePvffZTX3ny8sXvfPlbL/3p1158/7ffu3n7H++sbD"
+    "y6sr62NeEV4zkZc9LO40sMgA6WmfxlkuSEqQakugPBSdrBgJN+JhEtuurUgOFpHJmMRu48qVfqA/"
+    "r4OFlnjHxwtR8TDZ9CDZ7axEeZwdRPsWsAqS3FxrM88qWF0PbNnnUUO5JC9US+dIsQyNiasSaUkw"
+    "XSks+JkCLnhv/Ezy+lFyu0Nk4WCZkohFg6cYWNdexq4oau/Cwx6hIlVywip1BlwtOGdVS1S/dc/A"
+    "1DThkYbUW7aNFDOHvo5QZbCL0f/P/xOq5wheO+SccByuLE3sc2jT/rfaoXscKILsq9b6XuKZdBJz"
+    "xOkoxp/rTV4lFGy3KPYeErr5Gy0cNpqbeNWl2k+hAEBVF0mqJHkWcbCyMI1AKPHwolHtlHLcCpDz"
+    "pOthQf7+ohfYgFUxYx7AMXk72egcjxHHxwZC8zczp0Zst/Fn5mOO59rNLvxtW0it90405dvaYcPX"
+    "QoDSv+WjhKS/vXh5X3Xh6e23ph+BefOho+9/zN4fgDN/iuHBZc0DjisRCs35XTFh/tuEBr9danWu"
+    "x5md+3NqHkIlLfXGzy2KeyR9w2pPbYVY5d3zjxtE7shHLb71Dlka8KeL0BtE3iQ4psxcJsv1DUYy"
+    "wn60jwdDWS8SmKEhJHFwnh4YOL3XERZT25e+n02FBUmrGMfFDdjfwm5g5a76PpS5EvRs57UfJ8bA"
+    "8DhLaTFDg2gcwCB372EI0Tn/QxA2Yuq4Cy5bYu/yCTCzDasx1MgqoTC6GkxCb2Q+lcZVrqOs2Hek"
+    "unmj3pF/8el7GVQgeCRgqGnlSfTjyaeo9FP9I6at/riRiRs9M0grTcoWquGBN9yJ0xeEnabfGqOt"
+    "ZWrKZWYpasX2uL8ik9FJq8Ble7uABDp2DBtMrwbOJW1Rxf8UmJEJGj/ypTel1e8IZDbwu72Skw27"
+    "wwqm82ZyIjHT+9KOFqjU96R+qirbJZPvlYPN+f862Wd88M797cHHb3+f252MRqDIPR64RP5Uudsz"
+    "S3HDHnFpjUEhkepSRE5ZN1S1+dHO7z+OY3Tqws/74vPXnmygPfuHDu1G2G1hbUXsH5fh6BH18E5g"
+    "u6H1/s55anEZg8eP78nX/0ueP/7dFTr7z51e/+8G++/d71f/7WjaV/sL6xeeGQW3I+crXPOO5J1+"
+    "G8FnRkoGcC7L6K2XfomhTVibwYSpk8YTuwNC2KDlLiZnIKfZSENy7yVCO18z05h5tG6DoMomKNE5"
+    "Wwm6KyLY2PUaIXm32eIl/xphIcDfYKwure9YE6/sCX3hdyxat6hQ4/kEKZV8mRTLzaxYTlrivZ6I"
+    "3yMpNEnCbf+Bhw6pCYxhB8TYRRvpkPZhxussKUgdo+5koAACAASURBVBFwFnv0QW7DLQyKwSli6e"
+    "hraQRM+3yqfiVRdIkNL+TmF/lOVq6wGi3xGsECE38yES2ZLi9T3ywHvu0DkSlATWhcEigz9oVSpF"
+    "nUq7rIz10weHYRPMg2dYcXO6FN/bWoXvchsk3GRQisBtQyM+GIWK8mi4MlF1RM3DpG4tkbAh/zfc"
+    "WG7aRb/7SdiLDvppwsyTPS/c/ul4mvL9xgcbLIHTd/79vfj1tcrh8M90q5C7B9hPe4a+YayLsRK/"
+    "i1xHfp1hZ3B76eO2zcfn24eOfF4bNnXh3+xS8Mw7PPIXjqDjfWvFqvZXAmLtC2+FD2gkf6P3tXSi"
+    "4a/R6dTwO4eHAx588X+J05n2fTfx7rzGNZWWQydURW/5OYfGZ9Zd1Rzw4/jVvaWaEWDzJZoFR0Sj"
+    "3fUVLECzDxC7OW+fM/G+liZ4Nd8noamdghT90y8YXKmUhFquubP50AC4Q/AKcd0ncDHjk31c5a6P"
+    "S2b7Jp26pc08G6K0Rs9MVHWa2Wxi1RdYJ9x6xc3JEkq7ORs5q1oNKPwolJxEwRjVBH7MrF00yrao"
+    "s/GCGoXQZHv1Sd8atnx7aZQkcs1UBDfX2rpEH/G3bby5MWuVQgLQfV/ga1qauVNGtrxO+oXSSMQA"
+    "hwbzsJ0PglHtv92K2YTH3M4qnFJVQ3WUxVHNXrvuW8Qccx7KapZW1aT/dBSazrQsRUP4hhl0yUmp"
+    "5YOUbsmKYEuR23ji2eH9IvWizwyzv3/izOwnB6uHH7xLB7dHbYP+DyjtdXlOWCZR17QayNuFQgfw"
+    "0vdZRsXfn4lt4kTmYs5rjpffDa6uLkDy+d3vq9Tz7x0Jcvntu+trHGuWGe5hH4CYvAfEH3E9Yg97"
+    "M7G2sbw6d/7qm3H3n4wn+68uIPvv/lF1/96ivX73zh+rD66YOVle3bzrgcbNpA7thRV9Q4uTsBpF"
+    "yne+dfud6WQT0XweFwrh4H+UgyGNSA5VXlNjw5YNXpvppCnJzf26QNqjgZCHVAHuUJV/UW/Z5NCL"
+    "ULoou7XMXEFrIOQ2Wz1cPBJX40YHY9OTnyBoKLzNKp2mFuWo84B5bY+qX3bUCql7oQF0H0Uz0/uT"
+    "xvDmlWysGDU9+PgFoBK79UUkIhkpj66wI3ZI0yVewTlOBrxQyp6kadaZ/YQTd1yb5kIlvOQ9BWyc"
+    "rNb+IZoyZaO0vWGTqDvbiUZlnJjzFDbkzasVgQOkgBe5KDJ1olczOarTRait3MHeBk6gGIGD2Zy+"
+    "IaIH2ZIithyT5rv9J++SCnY6hhzevxIOlI0k8TjTiMfmmr1gSCRlyKVFZgUdRGErvqI9U3Dolv7q"
+    "bJNgbK8me/Kxz7hu2uAIsCv9cmUIGmDr6ARy0XRtU1YLrAmQqSp0x/iwUrw3++P8gqaJ/+scRvvB"
+    "0d4AuPCedlO0dreWR4DwwfCz2Ez8UdlYZ13oSywVzr2MIub7K8OWxdfXV47PYLw2/9/PXhi7/O2+"
+    "/O0CIrfkeOj78r5605jwtfMGTMdVIHcqyY59jV2T3yfm+uP37pYk77+Hvkb9C5d3HXjhuP50ounc"
+    "yLKYUI2lYtntJDDks6EhDqUS94KVTsnVASKf4QClLRCxtayO2iEfxRSnv85dG0RlVfH4SvG/VIaD"
+    "yS5Wp0ECgfipO2Rke9UPjOoW1ffpMPAx9i3I19sdexeZ4Y+cia7dlxyZAKtuSrj0lTTzu0kbYjqZ"
+    "69vPjuEx36zAI+abXklJkeDUGOc61N0CrdjlNxUITuNKJUBSMa3PiUSiNonYXxo45xVVR6BYpyKE"
+    "0AHytAUJHFUD+2hUgCoyCbnrZGjCYDdtnBdLOZ8arZzBWOEVCdKsiudlRbDOLTzCgTVO1FLiJhF2"
+    "kUpGrmiaO2O1kTLbTyp+b9PloJie9j13kusilGLhvbysTPD2TP+YXzQ1gh2LZgucCDmOOkjc0Zp7"
+    "CxyMrtcG91+ODW4nD1zvpw62Ad/3g8m2Nbbd0Qyk+1lI916zRnE+piv3TcVs7HvBc4V3haSJtxR2"
+    "7hYO8dfkPuKyc2V//9E5fO/PEzjz/w1snja/4UwTzNI/ATGQGOE7v7PM0j8JMVgaP9w6U33nln+y"
+    "+/9d3nvvHyu59/4+7+r394tPb84erGyUxAOAV74d7p/IKTRE/EfBw0fTlKzuKOOE74Hfx79frAIs"
+    "GBaNyrw7HgyZ1sHzh9RMoJRZ/0FJCDswNNTQqi5xVEH/5qiyGPqlwNj4Ey7qQ45t1IZ3DhZ0mTha"
+    "BDEfSiYL/LlsmQ5Uz8dYx/9DOICoEKtWiaQlinmTIky6GBk2EdrDLvAKpdJzUZfss/yn5zKTxtxD"
+    "Z8quyA2PHUq8FcnvrTOpvXz9hBp/tpBZTVrF7Wo2iFoww5N0mLbeF5SPsKlAlUCZUtttofY+GEpa"
+    "Us8NukvfNjtMsjVwtb6uQEvaf4hWfKSYtp8yUzI6nT9DVsNsx+F834NMX47e8lFk7DCB9S+lDUY6"
+    "9cqBYp67absUNPCOwYh7SleYjpY05ftNFTxKoOzlAyTYJvG5vKPWtUZZ9AbJ5BkQYH+Z6Pkkeakz"
+    "NS6CUGrbhu+4WH6ANoG+iWfcmbXvYfrVYNxfI7djxSmb31coIl3WVy1kxO6TjO/e4cfCZrB9ypW+"
+    "e3CE6AtMVibvXm+8OZuy8Nn1p7e/jNTy8Pn/5l7sht8oilx+MScy8vsixucmjyvgK/EwceDc+nap"
+    "y7ch66WURo28Wfiz4Xcu6RI/7WJRNi/aGc+FghqIUHn2D0fgKjVGcDFCx1SMYl5yliRD+wTasti9"
+    "1EEEMQe/GWrDGrAmSx+a/+1jXaPraiAEFtPqrm+3bSjXd9LAmllXCgu89qrZ8rmnyqk/NBxaVAPZ"
+    "8Abj9VN3tjqV0W+HmslbbVXpMxZukL9qnw1e062jffcMmNPDCk14U889ahYTX9qoP6ppIxF3vdhu"
+    "RUkkzagX2C0OXdN3+Y8UcUrJ7r6NZXvbJpvuFG3fpOSU0IgRZpeNV2HdVy6Utp2eyhJhW9OJrSth"
+    "h1brAcIpvyVUmJ4WsXQtongvbFZiV111kB+qdxWz/XtpH2wkzhVP8vG7VY0qr6sW7WMvL9O2slK7"
+    "XovpDEFwl5lqqLdzniyXNQHvF73IxZvs13YdhHYxcoD1aWYZxQlhkf7tw8Obz41tPDy5NPDW/unB"
+    "nuHPDIJc9RHvHl035+z911dPLVA16ENGFO4Jkg3S5nGOqVt196z+/ocOFg/4PVo8m3Tx1f/f2Hzp"
+    "76gyceufDDM2c2bvl45jzNI/CTHAFHr3maR+AnLgILK0uHDz986dpvnT37V598/K2X/ubFV//6m6"
+    "9e/c23bx9+fm956fLB0uGmV+wdKrz0XEMIY4AjKCkDS7JOKDh9O6g4u+yJ7HQi1M7UfTR1gGwYTv"
+    "YdfDL5iW4/q7MvofBy1TCYGfJqKiCeWA6S+Xcg18c2eXNyoU/8y8hYaqHrQHYi2Z7jUpP/8qcGV/"
+    "ElZ8pOlmFRmwFLZOJb1Ky/duAZK1O98MNBvgb6EqhI1pVl5LTvoNt0+uN11smPNmMyC5t4GBqOa7"
+    "ZsOYkryVAyp6NsSmzNNx/0MXjqz7RXSUdFKOKr5QAwcJvTn8ZnF4xWNF9+trZIH5nKl03rEcRoVb"
+    "5iIfCsz1MrWHVRpifoGpta1FmJqVR5OnUu/UF+7BU9i1VIWSiMuvACVW0+618Y8IyyE9q6Ym+p8L"
+    "qNmEmfKZdCH51zWqp86SjbY5g+gZx33tLOo08INX3pymuzfMNP5FIHwiJqJtshloy/vXhEnPJdOe"
+    "5++SPgiY955PI7c7TuIsf2EjOoQyZg3mBbAW+F/rCGzBrfzdq4+/Zw7NarwzNbV4d/8PT+8AvPrg"
+    "ynH+AHwjeYBOZuEsYn3Glb5pN5OS9FaeeG3DGQ6PHnx/7j9+C8A+cijkXGES+roUXZG3sWI6loxc"
+    "LqZDbIFaWKp0GQmGCASZb8NG72u34E2c/gpmx9mUzWzLJhqQsEQrkrUcVAS4u9mEnUFFQ6Um6NeR"
+    "L+lJ3CUsYLCwnFjE7aEF4hFFz1ISgzch22sLsVZfJf7AZSfaFISho6+6fh77yOEMMlUNnUQH/0It"
+    "rZ0hDoGm/rCJbULNBbOb4Watkw3xwKgpiWS6Z2ZcU7orEFhsgl1yWliKQeeWVwolyGkwz8sNnA/3"
+    "gdR6s5ToExpX0KM7ixIt1/6cl2aqPoh2jT1G1JJkTYLh/iV2Q9J5imer0uRfdAbbwZVe3oR/rbaK"
+    "57ZgzQIxVfJD49FilJs7eVjsdSzlbGjr/ywYtExrR7pw7JXQKKVvJlq/xUx3p6vC4N+0sPDu/sXB"
+    "yuLZ7khSj+9hxMjqeyoU3gwPIlarnbRzmYSnCh0IuGHv4uKHna4yN+xfJ7x9eH//TAqWP/5ekrD3"
+    "7jwvkT11aXlpoDgZtv5hH4iY3AfEH3E9s0c8eMwNrG2sEnnrry9kMXLr7z7A9++P2/+db3v/zd96"
+    "7/06v7k1/eW9w4P6ysLPmI1iFnZZ4EyydjALrTwa9O6Bkk2oBSA8Z0QuYg0a+Qq99GjaBk0GFsyN"
+    "AOc3aQG214uzCDuco4AmAWYwwmGYCgZhGCTK7I11iTsav8DXBUnbg4+NUg6NBXg7KLh9gGoxYANS"
+    "w6GKnoIBbNBgWxbOGOfAdOUw3GyEfOR6LUqrIThIjJbMnFnUOki8XEQjp85cTU0wYtIzKlzbYvyh"
+    "CI/UweoFOuq+xq3Js0ne8sZhh1wHfBooySLZ76IgjxlVV3du5F0tfcBUEif+oIlDtNgvPJxAoudH"
+    "FmEaTU6+WLo6XkwFVOnUzIbWM5xFG+M6vCEZ+Jh9wsOmUVJxMxhBMD9A1IJvDKRaTRApiNwolbE8"
+    "j8pnFSL1vfSYt3gnuqu48BjL+dHnsNe/r4rNySTcC1h1915dweUGm6tw1KJgsj871+iNomedOlUS"
+    "EMVnPBx5yYjB1yw2ziBF0Gi6lFXjSyxwSL5RvSLKa4EL/moo7SJr8Vt8WNto31vWF74fqwfev14a"
+    "Hh9eFTV3aGzzx/MFx6eH9Y2d7H3g44xpz+bDu7EjQWmbG5WDOvYzrjR5rfkYNmOYs56sQizuB6Z3"
+    "pCm048sajIrresOrZh6m+fVsQK2p+kpq2qrIH0HGn8mzzmImMBWo5nMVrM+zEqO36XgWmzSC7UiF"
+    "jqNt3XOWRkxTdtaKKcZav/yMa2dmGWT8hF0NqJ21VKW4SIG0vzfKrOKaKrVmHMaEgpAbcjpnaLXv"
+    "6blzk95uvsU2RFCx3jUW2Ycajlm52qi/C2XeeBM5OkimcNqlIyW9nzQ08hzdQAvPKFmpPxcda6+F"
+    "ZoqhmDnuoQB2QazM5ibyA1UKl8ikedBFKnjiQy5WfVE2s5xyA3QjledPnKVJjwkeK9iPJHYZjku5"
+    "AQTT5o4SVHDLRXemYV7P44bkVxxDVWjaQa5wr7jSn9vZ27iibP15vwGCR350YcQpULkRyrh8unhu"
+    "t7Z4abKw+ymDuBFPIcx8aqXNG+/aQQc1FGe/gbX60TH5DurBwdvrm1dPQnl89t/u7jl8/+7cULp6"
+    "6uLi3PdAC9nKd5BH6yIzBf0P1kt8/cu4rA0YntjaNf+MxzP3jqygOvf+N7L/3NN77/w3/44vsf/Z"
+    "Mb+5uf3V/Z2DpYXl++xYk6Y5BjhBMm/nxE0KKvhM4EhkFPeojBrgHIIUA5z/SRYO/3m7y5V98Pku"
+    "XEAJm+SEHDQUKNDOYMKE7UMliw0Rc3DnB5k1qKNUbEJ8ox2gY3i5YzIOKnf6YMmvo1MwlMXWSKn8"
+    "mPuCVfixgnjAxwkMVDNTg12KrYUrdHsbQDyUBXg56TBLJh1l07Cw2LfWOVjIL6OQIpWDLqVBK3BL"
+    "pc4qOg/41oVH0YzwdspEkuW0alYlp4thM5TUtQ1iL7sa7wnFyIaar4eOrjzmPuEDXdcGsTe8FEx4"
+    "LalsVv2NmHB9f+paplJhUsA7Cvp00nCOTjrII9KUFK7Jx+qF/F4gS1sO/RrTiUrt612tFHKwI2vL"
+    "qlH6w0ZDSySTd2kYPVZh7/2t0oqGkDrmDXQlGnSte4mnVCll5nnxfAR3p9/Nk+g11fcsgvCZDzWE"
+    "QGui8R8RHLtA2PQy7z0hEfuNpnkXVI3PaJny9G2UCOSdawzQtNNnl8auvo7rD14cvD88feG371yZ"
+    "3huUfvDicvsirc5hHLJfb4kB9a1zGr7IGbfRvi8KXiwQJOui9H8ftxLijjX+fnQMma0DpY09TSRZ"
+    "56dgIz7Kr2vZgDLdLpAsom/uxJKbqHKT8JjMq2eLb2kU9tcm4pQQj85zjxHNSUq507NvZ1vSHqXT"
+    "1al9zoS7wvo/T9tB5y7ivpXyHW3q06btJmzfnUA1vhyZ9JkdO+3jRbqVoWAvEAEwLCDF9aQ5ql6V"
+    "br84qJFW0Ldt5cuAinWYOeZN31Vx18JKNUdNtesaqrOVKEKwsneOV814xQxLLpx6LYfBLJ2GoYqm"
+    "mx12csQ07dp6zSqPN17rApUsRsq92LUG0wZabnRJiNFXTTAzUVa7kIlFijqJqnWoo1yhkOk32jfD"
+    "GmFccwothMRTatHflyxJ7oY5jQA4BQsIgt5fiNRPFEhOh4m/PozCXCsc9I8xwOHsf2Ai82Olw6M7"
+    "xxe2u4cXhyuMt3X+tiUDmmr3WkRCN19q6e9jyEljlRLR4e7K8cHb29Nhx8+eTG4v/zxENn/uypKx"
+    "fe3dpcnX9PLo083/y0RYBz0T1H8k+b/3N/79MI3Pjww2Nf/da3PvXNl1/94ivv3v78u5PVZ24tHT"
+    "92sLy6nAUYk8JDLpvu83x+vgDtCZ6zud3dMjMChxDHmOwzxDiYwKuBvgYvJ/+1WPM4QQOAGiLUtq"
+    "icAxdAXDUs/bAavw1OqoIfFG00EV25Z2IhXRtMVpwIqxDZtonrEUFGMJLTDyc3wY40k2fkUzcy3V"
+    "/t9OPdff8+nAvXkY6002+qVHUBX1wxaj87CEOXmAQ/kyz19Jsyn1mbelpoTSO6bHqlity20DO4w2"
+    "ZlkNaApIootZDWjPoQZCT1Qq+3MjAiJ6+bqzboV217iwQmCkq2SQH+RU4med0tuIqnPmRBl3rAdy"
+    "ZRQGU7asqSIVUkzTQCeuOdO/qbf2XPWiutQeTLfXZFHdtMXhxiT2rcBq8zJH1ErkTdllz6rRrMss"
+    "Y7GXQcv/PW61kxikr0uyP9ccyUvaWGjrO1oCcI5Lm7tcdLRmjKLNR81NLvjXrXyx8NH5bWh7v85I"
+    "B32Rd9McnqMgu5/WGLO23bq3vD6cnN4cGld4ZnV98ZPnvyw+FTT+8OGxf8nhyLuIGff9KO67JM7l"
+    "3EYd3JdtrCsvU3cOyZ0EXYu+m5S6eidPs/WR+1tC2MlX/SrBPJNqhYIZ52UEcpW8PkytUcH+JXnJ"
+    "TIm4piT74nUfS8ZIpbBN4Ja4yLHz44xFXUkmwxRifnCJWxKYxWymqIyetnnZd6LORVUtrjf2xjCH"
+    "XxqWRTO3F1JH66eK84jfXFi/Qd9jkFGPMm4yQ6MWq6Y3uEDxbxz/kvfOtlDYue7+5CL2z9LV5ksF"
+    "GPSsovvfK1/C4cdSiL7SpC9SRlUvPQuu+ypNY5KxlUmlIYTYBdMIPbdKSR8gQAe/W6igjmkzqxE+"
+    "JW7xUQ01ZduKuUcDDTDtDH9lAnIBLLpjxLkNP2FszTOD1S48UIWcg3DQsqqR1d937Uq8UdQPZEZL"
+    "xIaL8zHXHxJbIpN/1Q5Os5LyfKcaEjUByv0PGlVh479m4IlPeS9067+aOjHQ5tL/lwsQiZyWQ3L0"
+    "eaLJ0abuw9OXzltUeHF68+O9zkccsDxvuFPB3ZfIvfOmkvqHHN7+ItL+wfrR3tvrexNHzt9ObaH5"
+    "0/ufGfn3jk3A/OnVm/WdJRmW/mEfipi0C7fPlT5/fc4fs8AidOnbr19371c3/73BOP/fC7P3jlr7"
+    "/y8nu//sN3d37to721J+8eLWzsTPYYcNaYtzkAcTpnsMiQk8EKEhMCB7K6W+NY06ZLGWwMrt85qS"
+    "uMWfBIcpxKqsFaGQd2x/VMLpikOChpIpMUZDOhcbIlrU3U9EgwZfJJuWjJCii2OuRiNhsHPSjhd1"
+    "4Y2Cws9dVRaToJ6xhtkBZaJ/lvUGQLJzvvuHhnRplCa3ul1MOWNlqaDvQjJZmaGBVur2stjqdyiV"
+    "WzrYwpVp0UOroywXWOQEuEV5tUIJPQih/tkYlIrw9lgEXLHtzyorbWKTyoZZFtZdJOBqXrd6MuBe"
+    "whptz5AD/xiayT6QagTL53NULGqYQSXhDUBUcN+2AagUJkwmi+ayxBUB6GIYiZps0uPkQOyeaD2n"
+    "2SZtuk/8ILW9UkDQLYdIxIWGxiAnqf5HeVaruG0zCcwOYP5/2uqt+Ds4tm7x2wZSLnSoU+VS8/cf"
+    "Fgw7ZHL93zZBM/r56XGx0HZ4OfINg6vD5cPPpo+NT2R8MvnXl3+NSFN4fth7lwvnYLTCaHft/NRa"
+    "R7k/XQcY8x91m84XlsYS+PvrKXHh1p6lDP9oilx6fxyvfmxMtLhNTxw7/yaaTatdbEWAuaPPphuY"
+    "KsCZqRleXLmkq9NGvu3FBy4Ugkomm7CCVQSxRTrTCSh9KIPoJmG5dd8aqjlC1x8J9UcgHuMNn3Cz"
+    "uxYFisJymeAWq9/ZMvZvM4ujEaus40W8lSk8jqi9PpQiglJWXyQcipds4p8bNsBUI8RZQJAZ6iYk"
+    "GImznWGroBmFXMsYO+5sJKjqwRMo8egKrMHofV7+Gl76isRAwHRw897rL4FyNYylXS5zje6KNLkF"
+    "tomyQc/3MxIg6WRsjilmVtx3M3ygoYggL4ZUosm9kUS8hrG4mdRRSza1sppliKkLDT416OqZ9LUp"
+    "AGprje4XVRN3sOMp+7jOKFh7i+6ja0eOBCTprHGp/yUS/sK55LFS5efmy9LxZb3Rd5TPpw+exw9c"
+    "Pjwwe7x4Y7nAYOYs+2BEfA1udjCP0lGmXZF5xN9u6sHe29vL129KWHz5/4gycun//O2ZMb76+teD"
+    "KZp3kEfrojMF/Q/XS3333u/eLu2QcuvfPLp8/+/kOX3v/Wt1/43p9/84dvf/GVm/u/cmth7ZG9PV"
+    "9szdhAL3ey6ZP4vt6jTvJOIxxVanLgAOPgnnHGqDowWWJcylDjgNGSMmL45wDSFynK+d+TE7Ia7E"
+    "pOrGCaaYI1AHY5NYsnjDk/+qJ4XNBELxdXiRmz3QEsJYtugXxsMoGOdWg+ZvKoHINwxcGroTUAi1"
+    "NXnr0qXr6ImcFZ4+oxYBaeBOqj7ThcdqT2WJRCp5eeEIFhX243urYbjhhVp9I17+QrdlHOgot9+R"
+    "GU7kJoo4HYQtD/pq9gmYF4T5JuTcELZLWgjsQveE6mewoNOSl1t6L5AUJ4CmoicGWr6LZFrITZ69"
+    "mciumKaemOWMGBhkShlT0p3dDH6can22yVSv2sf78LpUH977rWui8USqfslTWdsFx7r7cf4OwRb6"
+    "ScsJhzAbfI99n2ATvgbqt35vxB4EUet3RSuL54MGyy31zZG85tToYz+28Ml47eGJ5buz780pN3hk"
+    "ceus3vyfGyk0OO4EXmXSsu2rB1xItOvEzjBM6FXGaG1tuZJDRv3fkTBObTRrYKdwFdYNqm0LKYYI"
+    "/5mrimz4utWk0QW6F21hFmegT86g1OPlEIiygwyx3bB2kZWZTESNRxVZ/4Lzjmr+oblyIklpAUEk"
+    "tqpbqbljNVRBsHGc91cbLvrQN/ddEKOduEP+se1eBrtjBSdJMiPlsnPuNdJ3nhW2uxetmMSlIr23"
+    "lVnpGXDVHoZlaNpl3n5v421dI1trZDWay4eqRXGxaGksapcMpAKOkKlZuNofcF8UG1xF1vY63qN1"
+    "NM/REOFwNjvdEwJXbKt5SYJd/xdMo8cey4lD+Oc69KAY7bMVBFiWyyYlar62AsspGUYxybqd5UIX"
+    "bLFz0wARTH2GMnvcgVqRgJku2vWAw2IxYrnl70TE+wrF5LPReI1jMrVnLQ8G2VLNAKumFgvWPFge"
+    "i5wMMH7HiMOP5MeNzyYOn8sLt3avhoss3j2mDxWHZ5ZJ05RkDydMBZwUtGPMq5S3/efXd7dfHLF7"
+    "c3/o9nHj3355cf2PZnCbg6ZBDmaR6Bn/4IzBd0P/1teN/XYGltbffRxx566eKFk68//fjrf/X177"
+    "36a999491/9drtO59dPlo7d7h0jJ+sWR5ucuJ3splxwsErEwVGLk7nDlCZnjEKjI+PEFknWA5yGX"
+    "gcVFKGgY4DjQsKB60aQB2q1K/xoe8zkAWh7ERKwFFPefVqcHYgrTtOOhYpN9iIVGWgly18anfTfK"
+    "17/Ix0FEtGooNtRnonAZad63BHgkEyxWzwwTLLYCcCZdD6k6ynsdGJUBg+SyhYebsmMg6qSjTHEx"
+    "dLoXVdAMXs8Rn5ZmYT+C4uja9p/M4PYNFlv8yjtfphuzZPI6sp6+lV37qjVtXRcG+r8qLKUYr/yY"
+    "Xlld6ahBSWaNWWlmuiUXZsMGtEgjDWVZpkCKGGoQj1Ck+P/bhVlHzHEStJzep3NmEE2aUtGn7qQz"
+    "660uJU2VRlJFGwnCRY/HLxAcXJfjBKpvvjfpGJlzzbwWPB33oyZ9k7cQJ5hCzwYhPbKC//5i4Y18"
+    "Shufhy1lTfcdljsTOhzVYPql192ckWj0Wv8x25YztvD08fvTd87sK14TNPfTRcciF3mscqefQyzv"
+    "IbdVm4WQuOXf0fsBlHctetz0KxmZedIDO+AAVh785lMac6NVHfQy4BMn4t/jmeigxXa6mhdY9pNq"
+    "qGoXEnphCMUdqCGExTtUvvN6UzlY2cfcb4xo8gg5keEzueY/RBLyqxTxYq7Wg7NGeKnS0CulaKRV"
+    "enl4XAhiYF630o+Yhps+hKmJqozhfP80EYxt0Mfcmg0t6pr0HxEyklI5Q4t2xIdUdGrNYXRR/1Wp"
+    "ugGn8SI22Bl75nrKuiZUmfbScXgcCXgw2v/C0vNE2uFUosFkKznFp6DjBfgSKXwlQPenwd+R1QOr"
+    "KlXGp6hGsTnPII6iAVe+shSf8r2232tzMWXvRGDgAAIABJREFUljLFd5sssOV/I1jpxAms5lfvQd"
+    "nDLogu575oUYObu4bQTJElDl47sa/31HpB4iQ7No2XepRLncUUoN2uVJstUSVji6T+qjiepE2R8S"
+    "5eHZwC0684g3Du8K4p37AdDne2h2t3NofDXb6Hyyz2kC4w4WKPF5I4Qw2rlNd5S+7yZP9o6XDnzv"
+    "Lh3e+fXD/60pMPn/mdxx4+840zJ9ftNfM0j8DPVAQ43ttR+zNVrXll7ucI7O/tbr/y8uuf+NoLL/"
+    "7Gi2++++tvfLT3/I2lY8d21o4v+VMHe/v8po2jJo+DOf3MAMQEfTmTTyLHhCxTVA4NB5zIku/jjY"
+    "sex69+JT4TOcsZjNFw4cefMqYMdvC6nozwavRkvGrHYCv3q/eRbyAZ+pqcrqvRWLGRDfyGFF+k1W"
+    "ShBk1G1tjyxRQuVvJdJuoy9TW1De49OKNd+Zm2BSfkqkiZzxCpBHJNp+qGUP2P/klXMrEzbiIYo6"
+    "YXO1k0MfHH1/q+FnF1shi9iCd/qI4K2YCFgKRZzOQVIcVGF9IG7a4H/e5UYg2We9vOdg+gOwHYev"
+    "fSV17nka0+xxFTLsbNuVdenJ4se/24AYXnJeIuMdUpkdItnK4zYllJdT8WN2mpI6gdr2huTdWOY7"
+    "7h+Fr7lqXOLQ92TZCRtp6ZKOsP33lj8mRN9zmAfKnJInfk+lSVH30a9viBuyMWXJmaieOLT5a4M4"
+    "fesX163/o+PxB+i5tvbw8PT94YfnH75vDLT+0PTzxyc1g8Z1Suc4xSR3+zQMf4KYFhwcUdUzGf9X"
+    "KBZszpE9m7yPOunIu4/FB4l3HPx8UcKU9YGkwXXuz6gt+jHmLqJN3Ul0uJASW6C1jFrDYbW67k8T"
+    "MU/Wp5o1XM5mYrFnG6Va+z3Oc8QMY2lJd+SC6PlBmPSMNp/kCYApQXEGw/MWwrjqUsziMJXVRT7c"
+    "t2y1vwWOPYUNeFgXZ7rOR5cPgXT9h4LKRtgueijvJI0zWwYhMbtN098rGnbdtUtZq8J9xgVH/uOs"
+    "pV3xMjr7C3rJ+xpy1l9EcwdubvqW8clkFCoNnvMbEoParJF2ZRGmYJIaadXiBHVhzNxQ/KacMG1v"
+    "kBb7JVvylG/ECwKAECtPHFESSJgux0zEaKgeInCzklNvpk5II8MuUGdAbX76xBR6bCZl58W8SMxw"
+    "6f2JZXj046niYa8jx5ujADw99+i8/mqUeNr2LVwi0LTx+J5Puzfs/N/TD4fTo+0A+5O7/I8b2w4A"
+    "WcK8Mrdz47fPm1Y8Mbt7aHPc4pE84zB7y19pC28NHmDb9Pd3h3d/Xg7jsn1yZ/fvEEPw7+yIW/eP"
+    "jiibf4mm5qgoF5mkfgZyoC8zt0P1PNOa+MEVhZXbv+5NNPfOXy5Qd++NJLL//XF77/2j/6+hsf/v"
+    "23b926cnvp2PE1RpodX3LMSf+Ak79v1XOwyTDjRH2ZIYlyzd5EdPFjWTJyjlihSnJscDCUV1knI2"
+    "32Fb64Ls6SGB0d5+puExToamegZaOUOIWoxjSnUEpsHNtrYqcMBf8bXcrHU/R8/E3BMgaGk47S7R"
+    "OZOKByKlMoNdmYIrqAckAOToNLLbpOjDUMfdZeKkWevVn+2RPr5ov5DOqaUcBd9Ljqmgk6BCeBxS"
+    "GfTDC6z4lOs+cEJy0a/8KJbK9L1JHVVINqe0oSqJ53ZJyexLcyxxYF/uP3qNmYzW/5sqx37HUD0m"
+    "VZL4QUj48dR98ViFwJj/6K1XRUl+unsKrfqDqbCr/bCvKoM7oKSM/rdPUpDbT4Uf9M0NjKy80nJk"
+    "0uDurneXmU+YAXDzGpSq/g7l1+jiB34JABaoHHoVboe/4Q8Bpt6NXz1d2rw/JH7wyPL18bfs6F3C"
+    "MfDp9+hkXcNt+RW+L35FyTeUvAiyxeftcJcOr5aSf9TOzytRePXRtLAYcz6ewtq+tBYd4+ZAyVbT"
+    "Wy4pZcBNjXqm+qgx2OC+tIQYkiGXj/+UiImPBptdraL9JmMHv75zuM2m280gejpciRz1JSc3w8R4"
+    "jjx16R4zbGy58Iqd+O3+aClDFV3xBHEhv9JnW/Qo4zjaFg6lMyqlS8IEoPEDGJDkDym6qY/lUdNa"
+    "J8dmzIhOeW+qA0vQOkDuyW8nideZTrYpv2OrfvO17Qyo4+pc3SoqjIg5Q7Spz34rtlweQ0/4JNea"
+    "ZO8itGCDXb9obCdG9im3r1PlKoiULXiQPNVtNXM3fXzSRA+BnfymaR0YEWdcXspcHUZiTckApbWc"
+    "mB0U5kejmCtYEeW/FbbWQDUfak1MfY9Ty5GfyMFyrJVrrxdCA6lPPn+cODPwu2CLpJzDJ2NH2ILe"
+    "m3bcc5IC9YMq84aPketb2BnzFZ2uQQvzB8dIMnbvY2OU5W85SGx/6Ecduhe5kncZYPdq5tHNz+60"
+    "snVr/0+OXzf3zp4vYPThxf3bG15mkegZ/VCMwXdD+rLTuv1+7axta7n3j++f/y6OXLL1z+/ht//o"
+    "3vfO8fvvDmtc9/OFl/YnV1Ja9U32GiecQo4I8de0/AHyb1z0En0wUGFCdXXoXN0M2M1muXmbw4QN"
+    "W4A78mEM7b6tFEdGCLVXc71Knk2g7YpHHiYQmMmCIbH9rIXINwxIUMbjIAWe64HVOBvMChVCIRng"
+    "NxM66lmiQq1K3GhcKHVJMf2CpbP/bxRRI6GRyRM99td18k6Jsy0rqf7uUEp+GWsrQmzK4X8kgfQa"
+    "2FnwKVgkkxbUTblLy8ApFvVZ2xqNvllTBpP/XL4qRwGgem0tKiRa4w3ZpNqbVNdohVfaKkVGTcOC"
+    "Gpuwj6o2arZ5PRQiaP7EsJq8GzrPz/NxnvyLT2j5uIjdJklBnp46y7IIXt0Pqduy7R13D1Y+96eK"
+    "Xbfu/FiJqAMzE21AD7WKW/+cRajvwKi7aV4Y5vq+TiiD8O7kpuk6vmi+geW7w9bCG7ssRjlUsfDW"
+    "f23houbrw/PM7i7e88cTQ8eXl/2DjrD4J/hD0esXRWZs/x+2/WyjvL7nGnepQ8fe2LN8gehy7kWF"
+    "hm0Wef6AHwxRnWmfokLi0eLta9sJJFmPixwcI1OfHLZtoYXtpYHraklRz0WJIv3bZpuhAiowK5GX"
+    "JhQw09fnUSOrie7+WiUG0DTXvCdj9iFHpv22ZbvNFPZWYT/pS3EHXMZNt6p1kCfM8JraSxEtNwT2"
+    "Zjs8DVs96m8THxhhXRMKy/bdaQ3aMT+dwxNDZ1l7z8qzr0vLKJqTY0hj9I5FMy4De65kxZBFkBfa"
+    "nOQanatmhu9aP8Kp3CDh+8xLvZbmc7xZq6DPKpPJkmH77kiGGB+KZPyBgDooASM/tki5Zwd/ggRT"
+    "L+VA71VMsaAFvmyVBq/nR4xcqbZJpM0YpX+Wr1yqedhBI9mE031pqNZmCKYS5Kpcc2PEhjXYWBWJ"
+    "CiK2Pb0ev41ILOO3kHKS96AeeQc8mwG4hFfwdlcXO4efv48OGEu3Kcd5ZXuN3GhRs0hlXu6i0fHt"
+    "7dXDx85eKJhd977PzF//DIw2e+vbW1dHvF12TO0zwCP+MRYL7hETdP8wj8TEeAtyMfbFy7+sGl73"
+    "3/+7/xwsvv/suXr9/5xAd7y6fvHm4M+8vrw8Hq6nCb39DaZ4LnG7EceHx00smA97UYLzJAOTdzsl"
+    "BX8xlQoTsxyaBqCCmP329KsQ1sDOwZzBzQlCO14ZhcWzQiIrNf5Vcug2qjZ9KlAYxKqn3Dt0zqE5"
+    "/Kh1SbKKhSmVm5GanUo0xUnSSoU75MJTuOlGDpk3KZjeg3SVuUR13LkmNAXAdxuZVm8060vSNU2s"
+    "XPI5FCutBg36KQfC+J4R2RLKLFEL/+A6KPzY2Uu/Ven1hEp7DlxlA5kFIrizsDlLrHUMVrVLDvOJ"
+    "FsPmdRZx2kx7j+OGkRDkZS96po8eUeN/AyImVLrVldy929Ka8wlRvNUDe7ZS0a4LuwaIsfF6G+SO"
+    "ggV8cVgsf3UH0sc8Ef7Hbhhqw/P7Anj/wuC6pdquJVws093lQJ5DZvsNxa2xnWeLTy5O3Xhp87tz"
+    "P84qOHw6Nnbg6nz7B427yBAnOtZfIeb97d1mlRXNnotsejryP34GPiX7NZ+caNRZ3x881HKaPj4k"
+    "EQ9QFIfa23/QIbiafA5O1T9m7NaKce27OgE3GkxauOATkm+1ViGU3OEZlhq4FOC3Dvz2JrpcGNbR"
+    "cgNrl7rzsjodpXfHWxxMet/rS2N+bGRZKpKlD5TqsS9owD+A2vCbc6lNBYH+qVUxX7WuhqD/COmX"
+    "w9+ljVBLucBMiMtqTxSUyKZnaB/qF6yVSt6hFq75DWgi7wJYzDUSqs1MEFmTTkkzMGUrTZZJPXho"
+    "b6x9jK129pcopXewlgUcfOV8LUaeklsSWOsgakYTXMGVKLl/wKXMU3qsJWUq/HNRm8Kcjg65tt7p"
+    "9NPTKjDdU4NaOl1/pyFsnoQKw+5L71Lvu4+m2jhRTYlbetnN6ojSrHLfNxhH3D6zrieCx5XuvfQS"
+    "/72uUz4lTe+2365I+Gq+N46iOWAz9VsMiCbtFHLvlOnG+5nBzcTv84WlhH+qHh9avPDy/evTx8cO"
+    "csSz1/uxILB8gf7V0/s370V4+d3frfn3rk7B+dPbX2ThlnO0/zCNwHEZgv6O6DRp5XcRqBycHumT"
+    "sfXX/21Zde/uKLr73+6y99cPfpN24Ox24srC/srB5jHrnOPO+AL1dPhl0+eYsXE93Joc/6V3Jfiz"
+    "bGEBaBzjvylKVsZ0MMbm6V6wN0H9BkSJNnqr3Tk2nqtPAzKNdgPCsTHhst1aBMfsRukh9XUAmh7l"
+    "sGe51pirPiDrim3AGAkYlOU8xEIzgQ2IcXaAXuTQUtlpMukzpjDvUqVJxmPSiZTAqi4+RCVeurXO"
+    "kFP9Si1OvbncAo32TgOzk12iOt8TpWK7a2KT8qUuAGpuwWoubHHDpEi06gr70GsR8fkctdgOKrlj"
+    "qYcXLF3jdB9vqL2jHIJtkHP06NNwgGj416labaUqs7aqt6ifLl+4wlsrWQYaJM/gB/fWGQC7rC50"
+    "I5k8cl3krpd6oOnGSJDXjeXLnMXTHmYksrq0y4hmFjcW84waTs1OrBcGZyY3ho+d3hmY1rw9+5sD"
+    "c8duVgWD3Jzw+s8MKTI35PzgnimpMxL6DPTMxdnLWFSALi41g6k5efwPOgy3OZfUEHTR4iCab1NU"
+    "+qia/TSuNtLGVYRyNEvgmmbwBbbdGUBZhJ9eg0/YkDvuP3jHrBaIw6LsTRVywRr76w79QpdKbC8U"
+    "Xp5kT5VsARFdPuUD5O2TILs/czbCHUfYweBbFtNx8LX+KTRV6Xa05lFwPos88cfuyVIthf7RtGT3"
+    "u93azpzPfkaKNxwaVM2lQZ6qART5r0q/4dONtbLFnakFd9oGzCTDm2keh9VrzUM34g0vZa6h/9yB"
+    "06IWx7tnItRb/vqWyq7jFLqlhoS9GSjWIrtwgUPxoxEJHUAYTUJwBiiCl2bcUMhkLKxHiAKOolSR"
+    "1hA6ScxGbZ/KhTtjwflblSEIOjtekpX7oKab0JR4pN23s8yvPfhVo8oVDHT/kGM+DuwYRnL86LU8"
+    "DOsRA8sMJDDjQXfGJaWmSs9VrXIo9ZHh1xl56fG+rfo/OkcnSwR1/xe3j8sMna8WH38PHha699Yn"
+    "jt4MqwMxwfDnKNabLLrw68dHFr8UtPP7D9uxfPbX59o05FsT7fzCNwv0SAEXCe5hG4fyKwuLx69d"
+    "jZ83/+3NmTLz/x2KWvvfbqq7/9w1ff+dy33rtz4fUbd5Zu7q8xSKwN+zzesbSyxqDhVX2GoTbBzR"
+    "yEcDmO+X0CfwbBwc75ZQYwJ56UxyuiSmZ0nU4G1HVgm6Y2qBcSHAdTkqN4sAqi3/lzcVJ3r7ofDo"
+    "bkMwmZwQ1RjE7L8K1HSX3Cme/8NVp26PU5wnQgFwWcQHU8pJuglBrk0cBAl0g+k7ZuYMrPVdluSK"
+    "guIlbP44ux7FUpmZGbNhBCemTQLFnboORSB7N9RiS985hNOMEbF7DNn+g2M8Hu/sSz8qIqmqjE/k"
+    "xVYGHfriDHPPZGbyzLIi5Fd2LFJA+6Ltq2zb3wp5Pc0W21wSicmPmYnhMrf3cs+PKU1W0+fWLrb3"
+    "rY07TngtQ7hU6SfTSReRbu1AtNnHgfuejkR8BzV46r6L6kYAHa4qo/CM51EF41t0Lf32amvoHy6Y"
+    "WPhmc294dPn74zPH/i/eGxU+8NK+d8nJJJ2woOqbSAERaIdSeGociDy8l4JuQuzpwIIktdsnhzwZ"
+    "ZFm/pWBt3cnWMvoAdhqx+EJBdRIoThziAQ516u7wTN0rFlI6jkR9GeKFeRbedJk8jeWIcfQlcqDT"
+    "VrgaVMWqOq1sRyt418LjyITbLqdYxSaIsUbZSRiDQyvQeb/e5vQtb0SwosF3HKQFjku8OetfJdWP"
+    "2GFi/T7yxVMnJi6XFfZhXHybga1mPqZ0qdENDSVMeQZGFg/4qq/Q16zBlzO4QFPmkj/ZWGXKyQbW"
+    "k8H9Bf8p27rA5jOHUMRhlEIwbY611qD6Vo4paWUkXT2ugXzgkT3ezNK1eFOsdHY0qDnzqlf5Z4g6"
+    "DQvKkTA911Jn4ximTfixON8jy6EohN+mwnGKL4XFiVl4Sf+j/WsOSmfbDFQDlSMD3Pmo9uyIXRZc"
+    "AqaeUbv8s2Galxc9xXPdQzxtPWNG8vLMRacHbN0nHgnfhFiFzEWeeJ6pPDzY/Wh2u7Wxz2G8P66u"
+    "KdyeLRa6tLi1+7vL3xH56+tP3HJ04M72IKpXmaR+D+i8B8QXf/tfl9XuM+Eq2+tXbuoT944uTJdy"
+    "89fP7tR1559X9+9bU3Hn/p1ZcX3t5dGN6ZnBr2JueG1eVNrhP6G3a8GdOrz8wJnBb4naJcZXQeyS"
+    "DLjbqaNDH1aXOvzFl5yCjP9+exTPLjgM0A2AfXapBxqEQEufpvQ56DuANiTR6cuPVHvKQ6yNdETw"
+    "llEY6PDKGZ7GhWe1NLZrucxqIvVpIoDr+ZLSQnS4rJrRLJAVpjeecVV7n4XOSyL5FUV+3JOOmBHy"
+    "RBGmQN/Hogu+JkbuovpYh3ifJH9WkqeX/vqN+JiJ+oqJU7LK7USTWN0d9Eb2qTxs4dDCeOaRP4Tb"
+    "/fBajFF75aFYETjxJKUYxUTENQulynUa5oy9AbUqknZsEM0Tj3FkDWZLuz0+9uPxLRF9iPvkfI3h"
+    "tfqtYsYvnulHfb9KB/Jy6/vYb8At9j8570AQuuQy4ULHCRY4+fArAfH7LQ8lXkqxwDa1w53xru8C"
+    "Lx3WF9cnM4xefyykfDY2tXh88c2x+eeeCjYeMci7htPjyemRebcFMtvk3WyLBosx/48cCxIva7BN"
+    "q7bpQTBPK+CMVHK/VZMb/Ql5egwKtKlTpx9ns1mfgnQtWPg6ke6d7+TrmocvhvQsljquvAnV1sV1"
+    "zFKneqHel3wapN56UEI9UCNz0tgviqAQTLp2rTgKKUqgexGWlAaWfy8YF9vaG1Wy6uJTFz3NhHxP"
+    "EExt6wuqBbDl15eSWrTpvaI2uyf3j2a75JQkZ6JfMtFzr5sIofLemNVnGylaVB9GNCZqxXhNEc9Z"
+    "r6jIztFA3U6aEC8BGv51q9ZMHLMUz97eOzNsPDh1ooRRiZXOoIUCjxseGLpl+xVfIKSklCNmw7ZS"
+    "N2qb6vBbwlBZouSsVv7dCUU0f7dJhsIleSzdCI0/GqY1R8OmbikvbXS/AaTvDjcDmbLZuKR+8TdY"
+    "EotpsfFYPyucKjJvGdwaq6qTCtW3yMH16IrIs2Cz5eyRtsj7hYtOCFHuh5GzNtxT08Lq7yUwVHa8"
+    "P1W6c5D50ZlpZXb6yvL379zLGFL105u/WHF06vvsAhz23/eZpH4P6NwHxBd/+2/f1ec0ef6wsrx/"
+    "5288LZ209tDbeuXDr6V88/dfjY+2/dHF68emd45dr7w1t3jw93j07yPbul4S4/d8DL+/IEna9edh"
+    "HXhtUMvYc+UuQgbolJsAPwgSOdE1A+fTLYv8fjvCJg7Ey1YHFqok5NdPvCoSTcOhlBTe9J7pwY+R"
+    "eblB3GkxTSfnbsScqFz4wuA69O+t8mIaFx66YQ8Fsf8+hU4UqPf0x44i82mnXhMVD2xIwkWF7xrc"
+    "fedCT/2fS5RdlSV51oxW0MB6+qEcASyFYsJ2E2CP8124HT0fSSuuauT/lUCH15xXLVt5uqYfsEAz"
+    "+bmewq1HFDr2qiUv5Z59CcaFV2xAgmxMRUoLiUqIOiz+Y1KIQUs2wp112WposzR0xuvD+iVDwPVu"
+    "mVPzqJfLBoN/2BrW/1nTIw7Xv+0YddVE7ouGIuLvu7cTVxPYLno2wWXWDkx3npw3vE11eBrxx4Jw"
+    "491lQrfJ/tBL8dt3HAguDgFi8juD2s7bw5XF76YPi7Dx0Ov/DozvDAifeG1RO8rfI0z2Ku4wuPaw"
+    "4HLuBIxtvfj7Pt/PCfTxpaAWuAr/hRx4cCyPuCBO/IqaOsd6TNA8cKk2KLocFobQoHNAXkOSmVMo"
+    "157kbISxJTdjaN5o52EE9/ggN/RkUd2yJsJHob2M5dTJTIJVObsQ/EKFVAvizXPpgiCCLDjzv2kr"
+    "o9GaHNGNNy768NVKnoWVY09vQ7i98GLq42shWl4UAcJYz52GjIh+FEHrJ6o2MiTfUKV2RimSahX6"
+    "cpobW6d+sVm25xJo4+AeEFBu0kWXd8pDh7l1KnvNCmmzl+yKqROMXR1u+haVuuOMlq1oyxiV8QxG"
+    "KXqvcTFzp1bkM+dmKBAik2puWCbJjaUndqDH0omtGm+xGDTPeFbD8zx9+xRSKtUbVI1R8E0lL6wd"
+    "QVMCp6XVqNuAI9fivb9KJvyfpn348DSzaiH1sLNB0nxRT1CE2SdbKdPYa0Hr8sa48Pxr3sCWGMgX"
+    "Bxyr65eJJT2Znh9t3zw0e7Zzl1bF3dWBr+4vT2yr995vz6n50+ufIm0vO7cgRhnu7vCMwXdPd3+9"
+    "/vtXfYYNa5+a3FreM315ZPblzc2PmXZ88sPvj49cPhg5vLw8uvXR9eeGtneO/u6vDuLqPS1hYT4f"
+    "V8v26HR8v8DhE/gMCH1yYzofSHTRmZGKecUHgnzZHeQcv7I45f8r0yyVDJ+JZxCwoCFChJsMQLBL"
+    "wLFzT2zlWV6VdNLUWFGSr3SygwaCJT8uEWTcwMoHKUY49hyRlMixJfyca8Put/JheCOoFyh1LcF4"
+    "PBeMLkKnS1mGhDLQfcJ0nXJmTwZMZsq6cDvjWUhmDybMw2Whj3YpZwk2n60GJb1ei6yXSCu3OlMF"
+    "pqi+5McmJFzT5taQCapWJ+H8jJp7qFVvg1cSmLotciTBXkdCBB6vWy3ZVCnn9ziqRg3j4QHWmkYJ"
+    "RM8PjttcSpLcDLRsfIEgt9QGxj2iQLXF2TxM5JU35GABv5nTnovoXSuxS8I45XfvO2OCZaLnRST+"
+    "y7gMvjlPSXVX+gm0eetuAvrfudq9vDJo9Nbk2u88bK28OxCXfj1neHpx+6NnzyyuLwyCV+L2qDQ0"
+    "rjK67+XLitWzFw7Avcqcsiuy3MQsOpigw7ZKT1hZvt5TGVcssjnQVh4ggruspkqcC+GCNddP1h01"
+    "REIFnWp6I68c/bPMPxDlZlfNmeskKYAhWaESNhrybnKSDQe3UDUCSCbJrseOe800HSX11fzLEno/"
+    "xVto5/8aNQe7PIq2eXq+PTPoAe9KlP6olhzFXg3BRd8trIRNusIG3PbkypD6XYaDJhtnqLZXKvYT"
+    "HZCVdJmuccYh1axbL8tO3tx6VXDkASIP3avgC3+1YADdb402rKuqDHRiGXekwJ7902bGuhqycfFK"
+    "QsKGxWrJ6wmVLfzIhGPrJY1EUJiS3KnW42WG3LTjOeW71bWP52IWXAaj4IVallhI9EyalbSSoJco"
+    "0tyYBTEY0vYtLGTTK8upAhlm1YAFX3hps6yC9e7Sj3OloHm1NzyPpX0cIz2i3n+zq5oQqNK0W9D2"
+    "uuzjf2dYN3EB1ylcDMy4qIkb9dub7KI5YrF4db1y5w9ti+trm5+AenTq79bw+cO/bXJ08sXAW+gt"
+    "P15/t5BO7TCMwXdPdpw8+rPRuBNb7cc+a7vEnv3y6tXXtqaXnj7NrW/urx3R0mqIvDc2/dHn7w3o"
+    "3he28eDm9cXx6uX+e7REcs7FbY88Y/f6h8h7s9e9x1yPjEhDQTRSfhmPHjxqVBBk2/E5CR0MGshs"
+    "IaU+U78fFNm2Kg78jHPvMSc21io1YNgNpAhv/w2qjtLj/ynEHVdza3RSH6/YUGkMp+qUc/6so4gd"
+    "a3mvkh2PCjZIH/yDhRYIEQN6Md2dlNnySBGkwMhW0ITK1UheCQbbyO25FT164/iklt2OLB7zYP43"
+    "8sy+Ejn7rZGthoUNHRZsw3Y8kbZaFpB3GVl94qLFpofVFXwiFnU36g1A1FufoFAiWuI2UMNFs1tQ"
+    "zT/uR8exSxX1CIvejrkPVVU1/hQ/IOsu3PBe4oe1fOu1y5jM0KZYG+OuGu2YTfePOhUCd8fqdume"
+    "+Oqu/dy1X6DlI8VjkZVnm5ydLenWHr4AY/Cn51eGz7zvDIicPhytmD4cqDk+H8GRaBa7yxcoUFmz"
+    "/+bTUGFoP+lIB316zICi8/OSSfN1iyz91BPdI3FxvIxGGV+8d+aB6n/Dhxp7yQ4yJVKx1YOVaITf"
+    "UFYtI6mPHqE1iPKlOF23YQV2rR7Snm1fGOj82mhNsgQ6/EnnyWEK1tq62RpKxYkTl2cwxah5ZaX/"
+    "I7VCZlx7tL2hEaemngYYlF1k36IZYjJAEF61H9s/Ql91T+3EsffVUo+M2XgJrnE1wFqjJWIyXiWm"
+    "ck4iZLT+OkXmMHOZ9GmCboWczJJ6HknfO6ENHioi1ULDWplqMUqJn9KFXSqR8xjR6y3bIXN/S0Uv"
+    "Hr0elEq9kRVxn2AdC96gVNMXGVpZ0SapitYWLDQJQQMq1t5NsHpSeVDyN+oxOxJjMKQmmeA5G2Sq"
+    "D1y6QcWoH3PEY5chK672KKzL4fK2opIi17scS3YZVvDRwwSMiYel/x2Ev8ikq+xir1xS2fkVEvMc"
+    "SSJxWPEtuXXDzSTlxgs7gLjQU3F0cemNZZAAAgAElEQVT9QaD0Bs7PtQDk/EU/WVg6Pty4tX703o"
+    "1j15aPn/rPF08c+18fePD4n21vDnebi/FovplH4H6PwHxBd7/3gHn9KwJ5luzMt4aFS78zHNw4y4"
+    "jzaZ4zW1882BkuPDUZLlzZGz55c2F4+40bwxtvHw2vvTMZPri1yreHjvPg/upwa399uMtv5Ozye1"
+    "w7vkyCiemEF0UcMro56WPo48OWsoOQkw3nr5BaqgWXb9M84uPQp4xv+MoLWaBkSGRgdPJXQyM770"
+    "A5WDq4BhkaycFTesZy5c0HU0bxHainA2JhSoBcKQ62gVgaOOWDeYvqODHrCqXWtyO5sZ2AzKbwxQ"
+    "nRbRckmyIBapNyCeXJDAL2pRpIFyRqi1mTBicWghRur6m+EvnoTCcwhZlJqCClEndq4WRbxFJjlr"
+    "zx6KlaVfsdQBjtlE9xU4yugpg+OSnKNDb0slFX2mOejRilJHLqQVmKbeubKF0g+eZC+5c0a3iAQN"
+    "WVxTbEJfqiv9W0T0jzg+C8kfKIu3/2T/vZIn1unb62Am3t6BbfieN36PhNOHr0sLXzzvAQ1zweWL"
+    "gxfOLRpeHhs4fDqdOHw+bG3rB5nAXZKv3VRVy+d8SiLT65QPPCRVVPr5LkObm33taL78WM+b74Uz"
+    "QLcQ8QP8gpGzUnj07UvYhgZavdha/YS6KgXfi93T3QIl5osNNLFApF8ZIXSBIUFGJLRUkFmnxton"
+    "UPbvSUVZ/ULwRM2x06fboQFUgvoP36iQBe7OmfdVWeT/OhagTPcrORvhnA6j8z4l1NQ/HevSndqj"
+    "lVnnaOe2Rn8ZCvaNlXzHfZWUz8B6/c6oix1Pxs/Ty6gLuYz4WVkmleoa+c+h2jOKzgodABcKDHR8"
+    "14ck+FyzfbLbk4ZN7UrLhr8NVOzQZEobpcCdkeysNoYsYni7KQuq56JuNQuXvzRdN3TWjXvW3cnR"
+    "G358mklHMVud5/ohN8X/lfraKsTlrqSbn0M4+FMZH3P4tM7ctTr+OUR2l7jzVl0x4CWOcZG8Eo/c"
+    "aNjPn+cq66qyq6FzVKV8yqu7WlDwTf8c6PVvAFoZylbbbFteFwf3O4fvPUjf3Fs3926sSx3zl5fv"
+    "2vXcwt4261V1Tnm3kE7vsIzBd0930XmAdgGoG1m8PilT8eVhdPDYevbg7DrWd5oJLZMt+1ntwaTm"
+    "zz3aGTC8MTjx4MN28cDDduLw9Xb90Y3r1+bHj9g9XhzRv86Okhb+KabA53WNTt8DwmL2gflvmNu0"
+    "OuNO4zKo9X5RnH8x0Phi5HTq9g9rs80jPIOjfIxDZTg6mb5HykpaYCGbprIIwE5QyIhSt8Br02wY"
+    "GVVPsa0oOgmpzGjwcojvLRKiGH28ipGHlxdBaCtGxmZByk4WeiIBtW+aQViw7jDUq+KTLwG0wR3e"
+    "oTxOzdVT6A0VGG1PzIZNdCq4g7lwC1qKv6aV1/5IlWGyBCrKITxPjYbJTHCpOQs4aVYji0lO8hFy"
+    "/+o+N8xTYv++LXxKdZDIZcIeRJz+/A6YtXrmHwM3HtTpKLfx+lLG1vkGSKhKzrpwP2+0zu9tkfcH"
+    "fuiO/ELfmWSt54uLy4PxznsafNg0Puyu0Oy/T35b2PhrOTd4dPntkdnnv4cHji0jCcZSG3vM7jlM"
+    "ss2phgH3nHzd+QA2P8zhs/+Ju3U7pww0c9rzZi4efkzUWbTubNdfYZZaQ5FPHxxSn4CCH/WRw6KW"
+    "3rQF+E0l/cIrYT64oQ4mnAsQSGEEbXCJKEdmOC1HJVHCeuFJWz7fk0zci4+X/Ze7de25Lrvm/utf"
+    "b17HPp03d2s5vd4lWUSFERHBgIlAB+8FveYiAB8pbPkI8SIA8JbMMUDMkIZEuyJNuBBEVx7MggEF"
+    "sGootjiJQpNtn3Ppd93zu/33+MmmudFkWT7u6nnrX3nFU17jWq1qpRs+aaUxUyp8cz9rqNjCovtF"
+    "QwWrKrn6WnuRz5zW1o1IxlWzakPyX0wgRoeWMDoKKuQt2q1/ZJDzZt1F6tzT/WRUbxBqjFDQtbkU"
+    "Z2eGTvNHTIXWDP2iMBJ/+bv1nA6hPgoQGp0JFS5BQDAJqHEFg5NJRe9qq+L73KjNyMEdo5lMoWMa"
+    "3VxTDy/BNSqYhqYSek7IOw6ECXCRuO+pZNK0r+LEszubAGZ1LsVyJ6SUNrXWhrTdjqt4w1/6sv9a"
+    "H6vSBh8mx9lIRZLmzaw7gcVKrNtYrILspY1Cf5SlbzV1YfN8jHxakiGlq0gGN8jugP2eoWzbqgUF"
+    "2kbDAZl+QYMiTEjwqZYUqA2nrblgx/hVa0vkvbrCBbubgrF2Nii+/AlOvudHry7KPTnc/8wdP37/"
+    "79Z1+49c95UfgHfNOBK6kUlrR4YPEAHnAWXdLigcUDwwOr4+9OVy/9xrR6/7PT1fde5Z7Ke5k4fJ"
+    "4D78gxWF3ffTw9dWc9PcWjk1/mRTinDx9Pp++fTG9873z6c2/PfPjM9IPzo+nNK15YvrPP7+omHq"
+    "yyOz3iiSqXPjKcWc3dElNCAiawTKgEJpnwCYTF1lTOLMe8ZYCegAeMPPPkKqXE4RkTnHlNuImNpU"
+    "fnZjIt3YBJ0kEPSB0lmyDd4Em4QYmMNaunXIEG+Pz7cBTsrZkbDmhD3+xmBiDBi7M+5KnbuoGPKO"
+    "BAhiphsU0Yf8UshNZTrTbhFWMDeYfsopS9UgINuMT3rWClN16E+UmdEQSnOuoqs9QmBWhJyQo+do"
+    "nqNkCSQB54uFLXYntPgf5Twx/eYkQxmBLP09ww0ttE5c1tgvZDVcj4PR1lmmMsFL9ZvqRsMFn+oC"
+    "96HDmKLkFe88ATw9EsflhQrbkF8pCxeMAu3Q5PlTtgYXaP38I9zcu9n7l6ML20/2B65Zn3py+/eD"
+    "m99urOdHTPXTh34Pz9G2Vf8s043nEhZ7Dt4i3tdxEHPo52BUYjgpeOMr+HgcCWVT2/6ZIOmLfvir"
+    "OBttkH1rgC8l/ZabRVfJOVKt7sMVeLH9ihjT/lT6LNmFrq0GlSvlkkFax7KnD7KalllUAqzSfuCR"
+    "p6cSzGqt+bventE+GxMbDmjnzhEZi+LpsE4Ik2w/KH5ere2GXWqXj1rfzKbQEh9jsDz0V0K2y+Et"
+    "W0jQpZ8BmpSqvxVl9CrUMLpGydT4pNu1oqhFuCBdpo8oI2LmIozw4p7vwWK5Timol6fYcga8imOC"
+    "RG+JDOuPG6gloyLiPfiql1UGorUB/K0A6YlPpA+llvZOrTIUOfN690+d7kU+cFuS0bq3mOXcU5OP"
+    "3utD0USdkRk4U/dQacD7uf5kp+J8kT/AA2drtavV7q87s9laiLz9W4HbnUWh900qhfSepJllNgAW"
+    "iHiDrU4+Wo5gg8bQrEOY0jskq/3OqteUNy/YGvuDrlHSl+H3j3gE/eXa+fnT44e/aPVnv3/vZzL9"
+    "z/3aNb+2/t7m6e8aysJS0eWDxQHlgWdMtIWDzwpAdYsd3+9nTx8m9OV+/84nT1/b/GLl3Ppk7A7L"
+    "llYnTH4TG3sl1Mx0+tp+O7O9Mzz743vfTZ9fSVt06mb7+9O/3JD/amb7+zN737Hr9V2mXTb/fp6X"
+    "Kfd9zxIgSmLgJi3q0TWQYKxKwJjDWGCbYnbH/YlKBQvNOmE7K7I/w5hfrXmEzKERQR2KpQsfJA5n"
+    "vsSnYyUSRg9Z+Y2UqCQXjUZ9IWU2rIHHXl1z4TGBVIFp0bmWGEysBM7cqXxFqFAGES7D+yS4TQWU"
+    "8w8poklLeKLiQSU7WNgkvGxk5lVSrdluP3ADfYyBbHEWifhuUhb1tEzUdcHeLoLjrx1UJLoSW4LK"
+    "qCu4SJ7DgErRheMSs5hIWr9vnwnTxnUjL4XOv4kAvjRRc8Poxn7QLJxSDjw1sw7S8fv55NL7mh22"
+    "eMHSL8iKdU7u/wdMoLXjVw+s70hdsPpteOz6afunsyvcK74559zo8BL/5eswu3hxJeFp5XDvCb0V"
+    "qkKR04v7nLdUEXXTvQujDLrZbkCUQJ0LIY44pIWJovKy0bqReQMw5vIa4BYgPLn9nVk5Zxr6yMtX"
+    "pgDYzxh/7KuBCnT6xTGD2ghoCiR8+K6Z1aENKrNjLEBCZFmV3yqIRLwkoppS0Fc8zm89p6MoaBKU"
+    "cKF9uliCxR9EBoQ5QW4fBBqakz6LotWB1+JUmvOP1EQUjXwyAad/t5nse7MJn0AAbFn9aUEb/yHS"
+    "NcOaGzUDA5A0pL1FBtFjhKQoWXTaOmvmbdKuW3kOqM3NKmnLJPwoEjj21tuWNNjYFtND/Jp0/87n"
+    "TnuvtbcbIpmnPhzakJ5BSR0RuinOJb+UAqIgIGj9ZaHvDIlcq5ItRNTllC8RnDA+14aJTYLo/dyJ"
+    "IgrfzknsyjsOtCI7v4hZpCrjz+cnFoQOUFmTaHSplSyeHYMsdO6y03O8fdprF4k1a9N1zYqXHNnM"
+    "FYS++4iIucIbv9kcWdCzjqLN7qMpc4qrkQBc7xxvfK3sFz14/OXvz30/Frv/LM/ad/99bx0Ztr4H"
+    "PTw7WcFg8sHhgeWBZ0wxNLvnhg9sAur7556VvT6t1vTjf/7sVp5/1XvWktT43w1jB/K2SQmQWSMy"
+    "Y7Fz5uYu90uv/cbY6T6SXu1Pzyu4+m7333fPrOX6yn77391vQXp89M70z3p8c8vv0R0xKvZoaL39"
+    "vxOHbfCXaRh6U4kRKwM3n6GwOfdmlycl0RCLiYMwh2MnaDZIdJ8KbeAs2CzanUUEIacJmxQ5S6YY"
+    "1wMByZrik54Vb44e5QkTDNJkgNWdEP1iIPTClYEZGRmJN6hVc7LI00AqNt/Sk3X0yLAVWq8+A2f4"
+    "KQGjoMihNolD7jjwSTQAd/5TEqwO1gs+KVxkVeBKgMfstGxAYgg0aMmu2f0i/diHuCjQPsi3icc/"
+    "WL2QiG0jcaFkZk82/RWygjV4ByWaABiv4zxtsOO1fSaY63T/obOB8l4ENOfDKltuYhNYyJA3Brxs"
+    "8evwM9SiB1Oh04TK8eTcdXb06vXL43/fxLu9MX7j2YXrj3aLrPe+Nu3WVRdotF1r7GxmDWayhbjS"
+    "dVajR125iADRpzPxMa6rGmnNsom9aGZzcOnsAlApaFHnnwZMit3w9CVysR2hrvgpIXcE6W1WmF1G"
+    "oaWnX5JIEvr22gLUPC6JXIkh9ExhKCDHxnOAXL1dMSmlpphG/4wgVxjS3kRG9JkqO5niwNUUCllG"
+    "emA2Db3f1LQ5pGb2WHpq1U79glAoUMyfVvSdLMjGGRpGHRrEsGoOVnfNT1WNKB/RM2RUqdpH1isa"
+    "hOBqZjc+ZpjUKExd7QSVrWCK3daEt6277yMwcD49+PIMCcSq6VcVgUKhF5CMDxX/bVWFNu3QmAfS"
+    "LTf9oPG8lPTcm0VosSkY2ORdZDxSlwxm9y6uGg4gWW8qFCg1Bg6Us+Ttrb5aGEaiSmE5Ujmzq1k3"
+    "ZQV+EWeSR4SreJ3rIxlC2r7jTwczkSmhRkH0Sgp61xA7A+C3gGwvqr8qAqncU/8Fqbi5XyKzjfnX"
+    "L4LQUV30vpC+rMeMB5LQvfTdo9Ft6201eq3FzfefODk5f+2a1n7v/27dvHb+z52hV9sKTFA4sHfq"
+    "gH+Kzm0/xDkQtw8cCn2gOXb782Xf7R/zid/ov/frr89t1pzcMw89Qun9TnBOtExcTM74+mS29Jc7"
+    "Zxx0E8cG8xYwF49nA9/eDdaXrz3TvTv//+wfTnb96e3jw9nh7c8PsAfm/3vjQE62fwVkDgS52znC"
+    "Ourc+nQU6mSBZwK3635C12CVHz4rCafNfcCle/42GChG7XHT8tSSAgN8nJ2eDAz70mNszMQMQmSD"
+    "cWdAnDwgjwie8K+IGvkBV6oq4RTCgLYg7lYTnHNQ0rSJCNtyw3mIE0pyK1uxE0Y0aJqd+BwJUor2"
+    "jnc3ipIbKCoALMYNtnG7DHv0iOXSO4UpK88UrkuLDIukN4ghP5Q1Yn5F1lVwqgfjVhW4K6+AtN2m"
+    "qg2y2JCTqaZD/Z2rwDDoQ+jGWKS5/TZmil8Xq2smMPOn24ySVXrA3TVizm9lGfHuclvYeMySNut9"
+    "wl37vmSXIXpzyA8r3pxcMTXjNwMn3thbPp66+tpqd4WuXe4dsIYPy6ZvMZ/TxAJe+Ni4HtJ2FlMl"
+    "DtIKuGSLWpp0J7fcjQ3BAK+sBF3fZv5AajnexVftvJija7T7qSQxWmWugJMPgrQ8pTipYYwtAK1V"
+    "sj6Tto2q9D4DbMrsjYTZ9seFVzxclPnnojUxuRtZFfY1LWjLnQxpAYULQiOdKYDW4E/unXIV9b2/"
+    "S0L4YquVNsbHuBDhrJxm+4lDv8pmeUmO8FqVu9NP3VosVbSZl1+LndWKPM0Q70h8v6+I6p76eidz"
+    "zHa+Gvdm5oo0xZWay2TL+M0kr4Ai+5+SyJs03gy8f9+YJVniwqGfnBC4M2Ov29pTIde0lDV1fNBk"
+    "57u7n5Zo1s8MKwZ/abLNFpQZv4boPXy27SlO2gLGuHQGXFd9JUK+SlxlGwekKtEPDD7w53aZA/L3"
+    "Az75RxNWYjQilVSNZyY8QGL/2ctCMXB4UAjzkojG7qksb25qn7nGlG4bTRhZkeVm7J9rtMPuchch"
+    "Zv0sVLuZWyduTE5wKot3C7wMvht5h96VfEEXdxP/v44vpnfufq8Of+p7tPv/x/rHZ3HucWb6iWtH"
+    "hg8cAP90Bd/v/huAW6eODT7YGd238+rV/+penm1a9Nl2/8YoJeZ77cWsYElDmog4Xd8Yh2XOZkls"
+    "UeBJQP+P3RK7fX08svnfKbJJ6Oye2Yb75xMX33+ye82+7W9B8u7k7vn6+nR+ymXLqAID9nqjxn3r"
+    "NuDHzlpEkE5rvffE9cJknKxiMGGKrMAsAgw1nVxZBmUE9QKh1BhZNwggujOZh8h9OVtibAqOAUNq"
+    "owQNJxiKCerBVuMkiEnoCudAtXvmmLEQFO407/Ju2pyV8uk8GAnCl6pgwNQXoCBQO1mWDwoNdVDd"
+    "WgBKtSXsryix6p9FXN8MJGbcMGXXL4DFMUaamCj4R48X/dolbYeB2FFfhCrg059KehjvU4HlH8no"
+    "3A0ADPpYFxkbsvLvbyhErwe9zOqN+vuB1Sf1necYGTrVjjSp9eCZ5F6JqLBXvs6K57MXnEIPGde7"
+    "w8Y9pfn0/rsw+mW1cn0+2rx9PzvErgM3dPp9d5zcDnX7ieXmExd+dpDeABJ7xXrhZxBND7HAbo7P"
+    "ZRqAa586xTE6E1iKwaZ9sSylbDhUvroMlnw0Wg40hPCCfzCa6OvbzkvMGhoRwy+htf3LjbKCCBI7"
+    "z860PH+BCpD4spjKGNDKqBaIsUsgNIDVhwGTjNQtnbkWNmMULDn4D6h7dlAcMMavAoi3ow5sqg67"
+    "dTLWa2IZSHXcqPbS3jQ2SF1PUu4ktwLRCwRt1lSMrDvhKhRW1/AD3m4NHuyEW3pZQ5px1tVzlCw0"
+    "rOsKN4Ic6QFidNy8uo7jEfeRnlkVHNlFta21qy67NE3TGnuKTyRe1I2U55bDsEfJaizfETmGMEmi"
+    "hQTmnwKYu12yNa2dA7CEzt883OYtsTyeK1rS4aRBe+z+2E1egW1W1Blv2g5F7KUMjAVxBHtcuSKX"
+    "ZWEbTfEWVXZd1G+DZjqNsjzHZqV7QhRN3CEaH+7uFRiZaCF0dJotx9PHrDauFgCYPWelgRKY8Uwv"
+    "zoUspB/zZ9ZhphGQNFJ59fGeFMW8NevmycAyna/FxHJpK4l3x1cHR1fvncv7uYXv7127ef/1frvd"
+    "Vj3b+kxQOLB360B5YF3Y/2z4L9NHtgfcBa5MU/nNav/d1p5ztfZn57flo9ZJ7zVhETE3bFWcCcvJ"
+    "3BGpB5jVnoBlpnNoLsFXtwT987np6+uzt96cVpeveDcxZ3Z9MbD6/4zd0N77ibpu99sDM9OF0T79"
+    "5in4+nY+4esGi6mc7ZIfEphpbn4AQL8kAGxPPfJ9HqdSIGJjn6tcrFVwIlAqKYqiwWDP7myjVDEn"
+    "y2gfMmQSw6E7sTr4EkadA4Gc/KgSZoiG53r8DlkB87YpTMwCkneKc6dhAUKolrTKXWRE+dcqUqGS"
+    "j0f0SJU2SWYuRPtgA9JaxlVDZ2NILbwkQndePGBIbaqa+wyaXdh0UldIVmxx1RAkLxwkJnLm/6AN"
+    "tZlNm4esKpDQXPrpgLP2/B1f4bFkm2LzEMfC4U+GfdxVITHTcc2QO+vpjWl7zImwcI7J0/mvZueE"
+    "ccT2N9aufx9PItfgv37Hp66e7N9Jmnpun5p3cYexi273viWMRxV3HG8R42+244na5G22DZMZRR04"
+    "sy0RnLtopKbj0WaEfZJsGeYjU5KTIa55ixEb1xl2FcTMDxKW0rmKKgU5RykR+Nfq4iX7mMMdEyFJ"
+    "a8i3JLN3cqZXYA4Y78iNjGRZD+lz+jKnlEIKsWeiBjhKgwxJaMe6sm4LV73IQw2I6WWDTQqidmFy"
+    "RyZxEgK+BuHdBERoxTh9LinXAX7UZQdsWkkZ6jKFWIvKFEcvFxxNADZergQspJmk7KG5SCxi2e8m"
+    "yoZLGP8gnEHXJ4kOD3e6sg2gfGegD2MYBtffTWpi0K0D7k+qXg+AqtuvPJUxiHCyl1K7TbrqO1KW"
+    "OyLYU2f+DqE6ZcZNF/aQ3sZR9spvBbYBzms41sCNTiKVLDIKB0lAXW/ZybAwnQSo2TXARKO8pnsw"
+    "jJk7SvSwixiTXeG/iErpmyXAPJdt8oKZoVYootFpovmSdtaXD6cpSLTv/UWBh8bRfViCavixzcX0"
+    "KDtDc8dpltQKa76YFlV47vrvgAvL6FZnd9MF2e3Xm0e/TS7+8ev/x7u4f7729/pWDRkhYPLB74Kz"
+    "ywLOj+Cscs4MUD8cDq8MH5wav/eDr90n+5f3H23xLU7k/7BMMGp6YEDQYlJJ9U0eCa4QSCM0jeJS"
+    "fLI/pWPvp9Nd3ffzjdv3vEb5lW05dObqb3HpxPP3j7mt/bTdNbvPPuge/fuTya3j0/4NZMnpZ5TT"
+    "TMLXZnLOx8BYI7KSt2dQxlErKqRxUJVjJtxrxL4IY1RFVMycPAEHISVoGQrXDS9UljUhmPZ+pm0g"
+    "0XgbcvdL4meBqxgVevEzIBGIsyecQnsAQbGREo0P9Ia91V1nXaAhO85uOrCYRVTpEHzr80TJaRJA"
+    "McW6Kx2irMZJawRv3RpTsaKZ5igpDgooGdy/KnSN2drlYYAtRTgWDLiyyDtaJNgMIYGbdducj23X"
+    "AGpo4J5bnYVc5N9HDTFQsYdbjAMV/RDy4f1+R7EO6woFpdn3AbJQtwbqdccyvlEb+Hu3P+/vQaD+"
+    "Z58ehs+uJLe9Ozvl7j3s50eMSrCA4v2HhjhKwZs/5mxadQ5kmUVMdFCBeZeihj2pyqPsyCiro47b"
+    "pxGWmBlHYI38KHUVgEkCuj8YzS+D1jlJ5gLEaFDiBlpxICg+UaN7bcP/klbb2WpWu4eWE2+Ciyz0"
+    "KnDTAhpvpYaY1T9JYsCaINmLum2XGjLP+G1zJ0EDr2a6wqkyRtslpo2PRhZ8GLt4nabjVKpSz9Vj"
+    "IGpztz48JDdJWFUA0ftC3ozoIqwiMy7R9Vc/2Rza0ut6jKaJD4BN7aHVPSgIiILx2XInQJx+b256"
+    "qX/SEHMC6pyFM2hhG0vlNA/KMg6vkkAMhCMDDK0uYsefvH7zbLjDW9trErIhWs6OTSFJ91lZJKaE"
+    "lFToFqrHWlsggpnvI7/qaaz2d9+kuPMIAFL/rSqW2lFYtKL5Ijq30Yk2JrffSky0iAMbpiycxKrY"
+    "kbXvWCqXm0u+Q2bYDKLdlZFDK2Y1MkDh/o0yEEXhskL0dJUoIlDtvccvW/sGqzFEWdb+KMgcbFZ3"
+    "wPRR7fQdwK7pivb0Co2dlc8w7Xq0u+2a6f/re7e6/89vr4qT9juvOLa0mLBxYP/BgeGFHTj0G6kC"
+    "we+HR6YHf3mTd2bn3171yfnvz06vLq55nNdife3bXZRmKGc2JzLnOyHpPhmJUTOAj3YJEgrb8f8F"
+    "UIPEHw8OqN6eCI7b+n96cvvnownZzs8I67i+nk7NH07skF77o7mr7/Du+8471375zusYPnO+24Pd"
+    "NHO3PrnVMjT3GZLthtiRlst+WF5uDy6GcmSxd9V9Yz83tbp1NvBURe3T43gAXpH6tNmmAAZWzPw/"
+    "WZ8w0qvQieHTUCL4Ndp3hv5zQZqFjOBF+gwNNmjUoCL456IO2vlgBMgAFAUdd5S5gGgSuV+DJpQ6"
+    "8N6q/laKOTwSereiOueLaDsBE0G1iYlJUWSq9eUv2WLRZihj7g9sduSyzXcPpYHQamaKmygSX8Hp"
+    "7K74QzypWW0y4+3mVVq8wVV7F9yff+xQXrfhZzV4w17WLxdpvH6dxbnUxPcxvly7wp8bVnrtmFu5"
+    "ievj9NT7Go2+MiwQ6Lt2t+w+Ztq2t34kYUT3Rkj/out1q89YK1LIstbSV4aOz4GA1dbAU2GkKx/C"
+    "JA/2zhUgcUf5jhK38jR1syEMGnrxTvSh77JPWUPtKBGZ8AKW6F25Ec/2mI9LCZokqfU7DfRJiLd5"
+    "fN0NFyFoyU6omvIZOdNCRVTfsUGjvlfRKdurfAqk9NtchQSvGEr3lclGVxQUsSCGfglfwikYtS61"
+    "N1Jez0O0OZAdS5NLpQksXFJxbMPBIGkaxPit4kabseX1mFQJpZTveBA7jaAjI0vVDz4kPrHD7YKO"
+    "g+iBKMc2yMNqh38KXYALPQa7v/8lW5XRAb7VGXcpKrV1H5HWp8qk3aKw6EKfBQWwlo4GYr8/1cuC"
+    "Zp2hZCptwoBZO+iqRUSgX4gheP55Y4KJNr8zyeN+KbRhl2ZiOARo66lTaEdgNmOxouWS5EtGKz0K"
+    "RgCcLBmzHZapXuRZjscgoruvJv8dUTWVUkThrSkKv/kOtfecG+sya8yvkE8p2Wb2e/y4Df7PDdxL"
+    "yTAUx2xW8Mzs9vvbN7+6V/tr73wr9a7+6e1fdUtC2nxQOLB/4jHlgWdP8RBy3oxQMrrhze7D/3ra"
+    "vzz/3q6vztV6ab8xenNU85cVGX2y6ZjcZuh5NdT3CZ8BJtAXPyywGBOyF77HawwEri1jlRnlxIHR"
+    "9x3HaxtD+9zNx3zjPrH5/sT/qEwAQAACAASURBVA8f708fcJvmu+/vT++dkHP35ynrwkcX/P6OF0"
+    "U/YKfvht9VXWLTFVFQDnScMVnzqyp+j3fFQhC1zPy+u8xFR93CSVl4lkJaQoWgwjucMh2bBwzcf4"
+    "I8QzQjJ3+1JbPNTCRluELdmGQEi2GSHlgUgZGmgkXZ0vqgBLuIlNaHDbQ1lctvgmgUq+5ZbULHYU"
+    "lujhIvUdAFr3JAsMRe6Pz9nPIrgGle60MWDP7Ow9CEZS+0+JAAJY/upl7vUcI/Bvu2Sx8PftpjOO"
+    "dTSg9waC0I0Mhi55Dfza130cPv3o64HWl9wZMoeXrqHXbl7rEjfG/3fHp2/Wh64fY5i7fL6dlnVt"
+    "Pd2zvTU7d5d51PQ+F23hqPDBiehLn2dQMu4HSHu2KOOcaTLbTL6mIESAMqbTJqxs4ks+rwqqePwc"
+    "cHIG2XfIIM/NMm2yqjB6lxtePSoh3vouHVo1EXnzRf68/OWISoEXuVGz3d71FRY6h20SCJPqRqW8"
+    "tJEzRPuxWR4LLr0a/fgo1ZkjouMzaphLVlpYKMGgcxoDmBScupxj0UlmljbHMXrySpigRxs4dOiP"
+    "x8Rl0qDVkuAlU9LjSUTdjW/VXtlkYexxU5suSp3zypSUjB5ltHVUBSrjzFF074bAPIkMBtkA+FqT"
+    "/xKacvYijV6Gu+pm0BQcYG/V4qoBhWYUN0lT3aLFGsatkFso8YN1SKs2x2/Natn0MweM19Iskrvn"
+    "NUOIzUEUeD2bSfz40CyoxNHnkF9HuvkkJKRiCi7QczDv1YyRr1qvQ5LYzeJgYeLugcAY6XTUo/ze"
+    "NWUi1WZuujMqsTDvPgz5gZvAIzODonK72dhwmZ5LLUuGr7w9c2tvAsHLGh/Ne+h8TPmNeCTA5VPV"
+    "/Vkl3fNyBYzN34e1pk5/eh3nVyxry1fu7/OXrqi7+1d3iX+1To8dYXgctp8cDigR/pgWVB9yPdsy"
+    "AXD5QHdvbvPbze/9xvThdv8YCU9/7r6ebBbX8Xl0DZGczgJw9yYAbKZO/s5nSW6JncmXLMhuBMVi"
+    "3mwRLm0vu0TIAsFlmK8UTLEx6qsjfdOVxPz9/htsvnWVxeHk8npzcs8K6nR49vprPLvekDyt/nN3"
+    "jvPl6xg8dLzFnksfabTljoHbDYvNg94jH3vAOPGdLbAi8I8H3Ahhq9sc8bJ8fvunINWdvTDk0kfM"
+    "AkH4e/kyisJnKnapuU23jM+y+TsAw2zixRwgjkBAjDX8qPEwLhVIHBFb6Mqwav6JSbNxVAEkWGBD"
+    "qzzk9QUal648u4BB6DLiD5BZDZnQYjCWoAyKmf5sRCya4aO5fuouguF24u8jTLh0UqTjdYXocGzy"
+    "J7YsftkL7xbQDeTnl9dTYdTw+nW+y8Pcvi7Nblw+nF4+vpRV5e/wy3Td49PGXhdjHdZUfuFsceT6"
+    "O82ffFFoyRfS8qoNzdrz2+zn31RfxiEAzK98YZUsXfMZI6FxO8AOFY8yXh/FMoGq22YdK7ENS/6U"
+    "uFmahbjNOko5KVU6FGBJbfcUquP9Jo5bLw1bHhRT5FgJ0jJzYKq+TFDVMF0o7CWrg0A2L0OzSM5S"
+    "ygpOXPHjNXt7YnYKS+xi8Fj1BOmxQeaBMECw67DdUsPjNZmEViqy9ZtSiDGN6xQNNdteASho0CSI"
+    "H3eBUSS6mrJXaXutBrT41LbUJeVaorY9ywVSZoFaisljHywasPAytTog+OpALRnuhpoAKbduTBg1"
+    "aO9kYm9dGn4pNijAhkxiYZir7wRVZGt57YXcZnEU+b1JHv1K2do9zWmYsTLQOa7LrKOgygrP9q19"
+    "QPnEmCXgQ6zhiH9Zs8UaU3/F2cnZXPkqJtnEftD1otUmEb3w32kM6VLgwmWSRQNmM8KrAhO7lbPE"
+    "PnGD9DpiTxjWJMEeUYUHBdCAjcDzZy5U+X2Bf2CX8lQ179YFb3NeTikwb9paQS/9UhP7Llta6L/V"
+    "wLtx1ckNK3flrF53Ocua0WcDFG09pWH4rjS3zOz4+/e/SZL/2jw6de/eNph6tYP8yMv2TXAlg8sH"
+    "hgeGBZ0A1PLPnigR/hAaar693DZ//o/OILv7x/9v2v8G66b/BjJqacmtgyKxvYCjLgcJLLFW5yZ0"
+    "wPkzOrc19mK3kpGoRbyIQsCuZ8MpkMs1iEjt9B7ezxCPoddllueJLh8c10jwdeXPKTvit2+M7ZNT"
+    "o5u57ef3zJbt4Oiz0Ob8/kTQsP2d177/QxT9Lc5x14HNh1ga0unK7RfX7lLZw+jdJdPa6Spkks8N"
+    "Dtwzpyq2HsjrFbdcMmzKG9TNVOzzn7vjzbucq2HXDbk+Y7uesaTrRVV4UD34geT1ALkBNmwGegAj"
+    "a08kkrl0dlKUVGQoSGd8gDX655N149CT5srzAO+WMTxtVitsz16Z++963ohYU7tivGLpa59hHtsg"
+    "pi3L9bG+wYJHHwyxDqaGAnb4dgZ49XXOxeP57u0Y/P396d9s/fnV5/YX964e403Tl4zKsEVtPRrT"
+    "0W8tfTbZ7Lc+jOnesvb1Fy542xoR/rDkps8qmU48mUtCerxpjKyXpaGC8pJP9pip2m4NAAj5+pq8"
+    "uxiM1RNERETtNZlq86KSpkB+iJq+/VT7UrVj4unDzyyqJN4GiMFP7JLdQ06kOmwWbtLBVeigT4jq"
+    "VIkLIlIMT+SYCpRIyTaqQEyZC2leUCkX7eDPabUB7XlelrYJFCu4XVIquWmY79CryLU/epTriQXC"
+    "yRD8T2bpTXRySdxxZlU9FtWSERqXRaUa54LEvbwKX/gLlI0ID4tajSVeATiIevZMVOZCWXiJTPBA"
+    "D/5CjVdrRlIQUrmUAxITAJ0emnwH5SmjJqXIHSNP9KIHVtjyMDK+35JMJb+ob2elps8fvuzbS77S"
+    "077SEFq89yJa3xQpQ9oZWFhya80qMBG2ILtZKhodJYh0+/Wkldnkqb/h5yIJGmSYYIYeNWyPgDwP"
+    "COVgmrXXwYI2oI0VclOxB8W/1KDXjtAEdi6rmwpmnhgS9M9pg05IrPacgBpij+wjZOsY9+8HU88r"
+    "WcfCPbXwMmvYnPSz7nfl8qS5pBx/dfXuuTn8IhT/18H0pvN9qe1c4p+fp6/+jF3z1+/qu/xXfZe2"
+    "CgU/GSFg8sHvhxPbAs6H5cTy10n2oPOLXwstOznaNX//n5+Q9+nZsfX56u33puWj0CxaSVqMZAgq"
+    "oTqvNeZkLr7TqFJDggz65G00vrItA0JmPpBp9wZTkZ5ncHBPXm++wIcSuemyzeTHeb2++eeZrfyR"
+    "FMX/IEjkt2584vVtMj7st8n5Xdw5OD6Z3He9O7j9bT+yer6TG4h+zkPYbO2zS9LfOK3+Xl9kyCsk"
+    "tscRL3YR4GpF5BdpFnWdP8fZ5mAmXxhhcA5hZOeINnsZAAJG2CsEMLb1fcwAE72dM+F5h1BbmCLD"
+    "ERFD9a6UBN4RwJVMgTpEDjnyhPyeeCgYb0Js7QunDLFe0O3l2UupKpp64VtWFg3pGN/cpmXZUULK"
+    "a4YKWFWbylxSzY1uwmrLhNMsHP9SmvduN9cDyE5JiF2DG7aU8d8Hu3o6vphTvT9NzxNB0fnLKIY5"
+    "G3z8u/2Xk7tCPZ0uPXJIw3XmWwh9L0O/Ds5PrDS8abO3L6Zezuar+GaWP81RU7yJQqnRQe6o65PH"
+    "gGhP2TQMuycOmzqrNQR2AU5wRAGKf0ZfRDG7niHDvVHz5IRzkjmKzPQNNgT3ZKJBHkqZM+N43zvJ"
+    "gRMMjQ48Y4PRegtgQFTewKt3b0GIhvGqe+Ek78KR9/wBqUeu/HbGQ10mC6dkSQbGQauG3RYuVXbl"
+    "U/DIRfEyptz0RHUW6fO4jeBlGu9gtEnrZHSqRHn20sxeW50IeOU/dBRM42lq+sbhZx2trGtyrxtR"
+    "snzqUW1uvn+FoF/u4zn6ioz2dBHI0tG130RktbHDF+WbT/YyRl9bbuFDk5DANDa75PygahUZYBpz"
+    "3IDKUa7Q8dDYkdIoI0hnjkKb/hQVqP/wY9AL+j06Hlz5BgS3JP4OzH6gEHvgLLN2WzVXygcVC5qJ"
+    "PHMef3jNQln7rGSZZUvh31uoV208Zq96CfmeAfZXNlYJ9KtuHb5WEy5Ol/eEZLY3NsAqk4yrlgoH"
+    "1l+CzXZnmPh3ryOZNWtd6KDjJfrfIphwXejU/LZS5RvDjtvFo9/2cHz33j768Onvle/F7dJ9eSFg"
+    "8sHvgxPbAs6H5MRy1kiwecpHYOj96dLj73jx+9/51fON4/+5vT9fle7r9zssoDHjLbVQDlbBomT8"
+    "xQTqaZUAOk3Lmu9WVzVpVjQbrUhcvbQUrgwHzRc1IFFVV2gcHhrpCz7A1XPtl9e4oF2wv3fRomLz"
+    "Bn7XTKTt4Zr0Z4+HjNkzUv2dXj93nnl9MDbt98dL5LeXc6OWfHj4AmCziksvZjnjV8YTePw4ew1H"
+    "4Uu3oYegnOBeAl64za0YMXM40ZbJO5TXPKT2ImHwHhCBazc2Gbm8GbChORILeC2UgrmG5Bga65ND"
+    "KwDl8CR2CK0FVETsAJKLGvyYKLGvsnfVABSGJH7FoB2zUQ4V1pK24TXLPA2r+8zINKs/umXcB3Ue"
+    "Cu3L63F7lrysu5Xbwd8SCSWyzgnto7n+5zi+TxwTW7qTs8cfJmOmZn1dsmXbzt7bBTh1J/S3d9eU"
+    "qBxWCehkoDtC2/gaMRRj0JULVQn3jLZP8ezjbasOFXSptxpZyBgsYOcQcKLxXCvIvqk1h/WDTpbn"
+    "W322cdgxa4mmWwL2VLnVN87wlgFsuWA6SH4M84aD1z4Ck3/zmCk87lg3YWwnOKI0eWza8AFCB8Tw"
+    "aeZZdjIBKwwXKNq5ArqURCEFcHX7L82FWCq+2NpLRNiQI9kDvaVYrCFgpthMSdb5NlrZifkgks9g"
+    "e7Oc07edCPHR51DVrb4V/+lakyISoYaRTN1d9dLto+CL8CSMU35BesdHUZ+vqnT3QUVZZyZvi8P9"
+    "nVuMjToJCFFF3xmbKUgyEU03eBDLxGFs2mHbYJFnd7zHPinM9EUYdFDIT+zeMhCBcPEYDsMZYomr"
+    "ApcoYhsQ3+SJGgPJQ2ttzYoonSRr65CR8oL7DUZpjYsJDnToRggOkTnJRxBsEQa14eHVzaCTBJHa"
+    "bSW74ZA3XYoix3as2FKW3YVvUhL7fRS5gBguTBQy5PdsZVl+8Z8UVb8tTr0fxpSPar5cBmy96pAA"
+    "2HO3M+CEkREXNxNp2e3358Mj33Oy998Wf+JffBnPqdXWlucNeXbPHA4oEf5YERFf4omgW3eGDxwO"
+    "yBnavVrZf+9ermp3/59MF7Xz1cn76eCcgdE+PtzEEEDb1QqEBcIMeYc606Z4UmDFRMo0yeoicJzY"
+    "Uh14WasATmFJNC3MWhpCZQA5w1D93guS7wn06+3S6P1+Qi6QWrtAt+f3dFpHl2fjU95nd5j3h9wv"
+    "nVYW7VfO/xNH3ALZuPeen5Y9Ybj6Rhu+6MBeIF2yIXzMi5bZOGX/F7KxeMV9zC6brhCvuu8t48zf"
+    "KWTG9x1HKCCtqd+IlARmuvDWic3WN6ByuhLbzECbEGSXySOAjRwTQEgkQKLuCiVq/VGgXZK64Ym5"
+    "TmO930jXTusLjL6a1chnsGqbs+pITFrwu1a3babuO2AxZdxxDuXFE/2Jnu8bvG2wcs0nav+J0bO6"
+    "TcHulxxELukN04d9v293e4dZJFjAs3eD2ufSCAu5L8TnK1VwHmCnm129aG279GXFZNlvFinGtRvI"
+    "627BHLY3DBUw9CpI0uOvOBS4Cm06HTb9Eh3tS8oS/IwEsax2FCltAJlutqfHAdaHs1Pnohr90X9c"
+    "iLTvOMf3J05ZYti5SHGYaCVjI2Ihj0yLeaFmEyGTR2inj7OO2wVqnYlbupZxFA3VxdoeZUgaywwS"
+    "2TwSgjKLTyzMjAB2Xl2iTt4GEcQB53BV59P3iUOSsrVShQ/sYng1Yj3X2SJanllYiWM2yLiYN2Ft"
+    "y+KQHV6sGHbISW7wovpGCOHpVLkMsn1N2FKn+loBHg5rjcD/bc11rbMmWyDanLI66zOIpKaFRm0n"
+    "/Vx/WNIC2w7NwJr++L8qo+9wtZuxXsuXIqldKGhqonqYwYriv+EOartxYoEAIqdrVtJ8ZLMAXLWK"
+    "EY6YiOa7CjxlAhSnX7CBrrY4zh1ZZWrYr0+AS7W152iFur+NZMZtusK3D4resS2dRUxZd/ZntZiE"
+    "V3+PRlSNp+2QRom4tlvncii7o7cHDGKxR2+K6Lz/juvZYu8mrXcsVcdOlVjtULf3L/+a/96rRz99"
+    "2+JNfGkS1p8cDigR/bA8uC7sd21UK4eKA8sLveOzvd++zvXK8+9zf2Lh6/vvZlzc5oLurMndESwD"
+    "jLWebIDCdOGIBtmprlpSy4uTCTdCaDZMvNvoGLrMm+gr8myu/yIFZOdHGKHgMHVmfezseDNfZ2WI"
+    "nwCoU7l+DZleM9QDwB85JjZzpn8faY3bxT5uHTM15tAN6FnTt5j2kyD9qsHT9u2zxnYXhKfnbF7h"
+    "63bV7wREN/p+fOnYs5f0eXtSh1A1HvUtMeyzlQbzCRwMEmJVWAlkCX+hzjWQ6eICSFClvSUAXQ4M"
+    "JLZFCfDLDBhzjCBnODCw69tw/dHr9FPKAP97nd8XDvip21FYs14Oyk3b+zmu7wO/07hxy3WBDqOx"
+    "Zqh9wBebTPi73ZMd3nKSe+8y1XvPNAERW7yHJhQ54FP/pUqFG+1y1lKo4LYVmJNp4sQOEm7U2kCZ"
+    "NlmR0XdnDabZkUpygzlYBysi5OXXFTAC1zCy7x4B05gKgIjjJX2es3UCOQrz5wsS6dNW+5S59FRg"
+    "mdF3aqk65NGfqqP0v/HFRHMYRFVGdgQkwVkltooYEVxrN+KrkojC2V17gKABp46x+Sxs8alFHtd6"
+    "c34HyOgTqo0weMraiXV5lUPEexZeEs5mO3FusnfRiypgtD01oWpyehjjM2PGk9+OStr2QWu2a50D"
+    "JtFgfatZ3S0hkQKzmZpzxjim8brq7RToN6TbCt/uVz3v4KDGTsnGEK9ruyXrNiLX7KZyAjp2THx3"
+    "5G0RUfW1SSR+vPwkNZ2uh4KywC+fczIp3fAeQmycBpkX/lo2pftad9FmK4hu3xv3QcnVXfli3Vwp"
+    "Krrkj0BN+mHKHVHxaD0MIukKcrZbPJ3UQd6itIZmToNrSzoHSCcodgcw7rAVW9LUIvbbVd4IPO2b"
+    "I1fUfbdFv6gdzi/B1UdksbGr9nQytNw/xZgNJij36yhmRE+7MAx8316s67Bzuv/+bRc//Zv5h2Du"
+    "heqTyWtHhg8cBP6oFlQfeTemyhXzyAB46PXvju2dVX/t7lg/d/bn39mHfTMUs56SYxIWWGJDcQcX"
+    "6a69tlERVAhKBmxqKd6ZVFxUP8oBmqhvDgEKe+TKBbtCpXVU7CLRME+ZhFJ10XG+wy+dutNYuwNQ"
+    "EEG0/TMYuS+yzMvAJ8zZVUbzCEkAex8HzFi0t29lzI+VqFc47T/F7v4Sk7eCzsTs757R6PoX50xq"
+    "KQheEpu4E+fCU7ek7o2Jjf3DGBG24ZJxgI5poveZqMNm/Hi8GxGTpwOcUPVsCOIM/mYGW9YwwccH"
+    "+bsmaRtEv/eOy5QKOd3jS6zxbCEbBjFrfeFnnLJ0xyHOzxMm5gB/x+bZc+PWRhZ3B4yAIuCzZuha"
+    "zbSrkNE5esVmfg3YLTAPXaOfZ7jMZef/MoyN1RV3Ukty+ky61nIj2EWSSPA8hN6VsdxMFu62bnS2"
+    "JlkIW0x5Ll6JZ24LZoBYZGG8Vb57CcOnlE4c1Rb0TiOcvQh81OU5Z2mKQnias0F4KrgE0CqrbTlK"
+    "xC7gr+JOUPf6betiVQRv586x5wF5V50uVs5xDpSNBO6vhilpu+KSOFzV0km22RK/6mRNVi0ZWMmB"
+    "oq219yYrndE9lle1SHmFPk2B5w7abSo1LVFjBPSx02Ibp+c1U0GzvKrryGQHuHD2OnQbU2caSuAf"
+    "qhZQgc/RRQLC8XBScwIXrylGljyVRSyS0usIrTSaGRulLAowbeCzZi7Y9iaR+n3UK6r+bvwqLflj"
+    "j3lUocm+rtNPyXlg5WcfrSz9vw0WCYeYuYb7e2rPo4ZKD8ZlJLzJfCsRYIoqtDWiLQEHYuFP5xK7"
+    "nlkXIBQMAWrB0ZPwv2u9GUcZ1SkwfJWGl/ltKhewOGs7jsoDHe8UF8CE4xUrg4S5lxFPM9D2QkFO"
+    "3wb/TCE+nm6b/i1Ff1yhZlaSNwd+u8K4Lch0Nl7OX7wjsj9phTbk5391/91sFzX//fp/W9h/VdGO"
+    "nRvpwWDywe+Mk8sCzofjJ/LdSLB+IB573DW89/69EHL/+9m8dvfv7w6MHdiV2bPOrdWdEJzTjNI4"
+    "G+bMCdrMecZYRnsp4AocsDJq28oz7nH4IVBWfle1D0UHwmVirWXUvktkNo5m2ipnFx98RsLoOTcD"
+    "3kY+Xk7aKFtMftiLwqj4SCmq/5DZjBDrdvZgHoLh8LOG/NZOcvu37gL855ODWLu0sWdv7WLrj+Pc"
+    "WVQQUqr1lQ5mXdyL8EVsGNgVa3C61aaruSo9VAzqa6uFrTrpULUxZMPqByRUBjvkf7dlmkZQHGLt"
+    "qK2x33wO2DY4MNPDcAceyyYFpld822Y4SCs/NKPcERRton6VMtGId4yrpNUE76C8DOEYeC4rTGUX"
+    "YxNycZOQx4IsRswAadgikP+UFzSoAHyiRMAvPQCZPGOrzCQzNyKtaHDHIDMq/eJ8yjP+RPGTKJHQ"
+    "rWK0hTNDyQZaE1y9rmUab9hMzojgCEyCSu3CkysqJHb9mv0GSsakbjAZVN5h10l+DIsikOey3zf2"
+    "5bw7JAgd5qs1nisF65NMoZdS9qzC8Slyaitb36Jr8psxycSiVRVpW3dyYFt4hCR1wEolN6CYrVzA"
+    "sS1j9sTzQEjq0SmrbyamGBY0VkQxKaQajc1kke/0NQzSgfKLRoirfI5aeFEJbYaGgDlBI0nIwlxr"
+    "k9p5zN6yxKf0nZ5pUPaHjk0r/DDovQotNen8fTUKYGWMueklyLFgiGCviqkpZS7qqfO0WHtHHzd0"
+    "zRxJ+yq9vP0izTgp/tbnf315AXjjJqi0foSLYFwX4HRiY1xluNKWhslHqVm6SuTZrbG9tsA3ZEFn"
+    "JzwahkSxd/Uq2xiYzwIA+c7atxBJDPlfSBtdr8hlHPa1tgMssLlTLxib+ozmemabLo44KhcgAplp"
+    "LfA9zgfnXnu+vj139j9dSX/jXcm5exbpq2lBYPLB74CTywLOh+AmctpIsHtj1ws7r1/v7x6792ev"
+    "L9v7F3+f7f5NbL/YmXQdfj5Q3uPJzBDOydAZ0olWAw4GwpbBs+8MKgCb1lZCRZ3k7NK0iSoJUtoG"
+    "VFR5SWPos1G0tEAuAiz52fwGWOAFAIdYafbXXRYh34WHiweBLkrp5tz5sc3Mmz7VkMKIudqSz0uI"
+    "6LiGvKLtD8+URdxTY3RFNGBQeJYQxKVIf+gZNkO1VgIpBQhYXYynfEQZRduzTJsu1wXUCgQ9nHcZ"
+    "u72PPK8nw7ZHwgLYfuF+diYrQ/CwttVJ19ah4lVVZJ0oCVXaFRoFepAwLvmFBPAcgtkxQhzVyQVq"
+    "AHyXLqVW1i0AM/4J3Hvi5H7oCbw/MEHoLQdACOnvg9LJaxkf/4XDOkhT8s1stpwLXFo7ilSC2EnM"
+    "DPfap+4SWMQstPSd8jI2NNVdJGiJXIlLctiJjUBk0J46x+5Ohv1beIIcOLBnkdAnkC9UiSsHolga"
+    "oNGEk7OoWvy9UmKkNB25uLEnYvbH5Wkrop+TiFruGNrFsLHctNuI2mHF3qGbwIyu5nyG1PMdTuSv"
+    "VAg8KrjdU7GehKxM92rlRqHYY2iGr6H0w9oAWaqK864JIL/9BTi2Fqqsh3SV/gsBrx4LRDXuv9o7"
+    "u6bdLPps+QNR8JqxyT6nAMxcaiSHv9vvEz7ncPWKtF43i2AQKU5uGYINeuUMXIkis69Gmgla6y05"
+    "QLMw3YysIiT7ff5owd6GqrkABbe1eTYUuPD8e6C7mogbHMtRX8gcvTMOEZFxpimDJUYnPkocg5kn"
+    "OKHOva0N+zKbdNEuGH8miYI6sFxm31fV+LNb8z9Wh2NlEW3yKirEQOjcniz5254NHt0FJ7bIHj5v"
+    "LsevXs/3n4ma//Uy6N8gbVJS0eWDzwUT2wLOg+qgcX/k+xB3jA5a0Xv31z/PovnT5656vHV2//1M"
+    "QTDusWO6Y3P115emUtMjKlZYYG7lyaYKICiThxGxcCpkDpEq10OQCpnR5NDZ+rFmBS1oA52c8piq"
+    "mBFC6NR0gGruGaVgZAM4jEuRiRVhlbcEFDYMo5QcMth+70GZAYnAeMjOQoUXYu3w565Qgna1BsTT"
+    "sEepjIQ2M0BKEBYXxaqCIT14d6XFRpe/wjvzgbij35rZswFqCR23RWKAYWPsrDPulG0r74o4HqCQ"
+    "wCb8e1jRHSeWSqm0LM6Dbro+00B5GSbikMWYSUnplHGg5t9b7WpOabq6NetlQACKztreBdRsO1QV"
+    "uSNnV5pWi8L4AmmK6n5hVt4YfSkasGDQkii2JDLa5h2D8WBTZFTSN4DD10ZZ10bUPTJFgXFGFQpS"
+    "zXXAhutGDwZ9EoGXx1W13JZeQKjE8TdEvTKRRFhssNa0nwD03JtaP+Q1P2oSMioeA/wXg1lKpcpD"
+    "BXceDNtcE2mQ/B845OIMKHFBUbfrODEvmlt8a9eqF06PVFipbYFshrm4R2Grbme0m+gs80AKI5gp"
+    "Uvr7sy+gTifHcUT/mrOOujCK3GqDYfCnW3ggHBntW82PO7tcddty3MaurvV6XfsLoTXSapo/opLc"
+    "OHGbPyCA9RLMVIDVH/qNfnRUFggFa7KES4VL7WJdS2NzapuEaa9FUKMzLKqJABAt1+suJXhjIK5s"
+    "Wlus2xcGkXErIObv2F8RwHkgdRdcGm8b0005SO2GjbJYldLv6wFlAt0sRRRyTba8DgC70t8rbKyl"
+    "POTh39IjMpFzUih/ZfXN/sHn7mj2/d/9l/NO2//GegJVzS4oHFAx/RA8uC7iM6cGH/9HogU9UeT8"
+    "k4+vw/uTh/+689ujj/1AP5OAAAIABJREFUH47Xl/emFY+GJHg3WPAdWT49MbcaMRGOid5JMTNjco"
+    "ic+JwcO3gIbtu1UdY8gUdYUczRAFXlVQRQuPmMAOfbQRt5ECcgBG6uGT0BWyobzcFlUWHgBM9sZ+"
+    "OklVnZ6khbzDWGJL3RmtURfYzdqszlIHLLJ3TaERvJTWYJFAZcIxVEXVyKIaLSOihVaroYNWiAKT"
+    "86zP1dm0a76LTuYhUd7sbZVum0NTRd39YPZrY3dkrPkZ09dZLC34vgBECUk6BTVshaX2MKJqJpAt"
+    "hug37QbnNoEiSDz/gR1HJHO4ezBMeGKG1+MkWR0lUJ+KoScaNdIeDUshOMRnchsigyyJO1GvCE9R"
+    "n7IjuNB1JkJwVFI0AtNNQYI0/gsdmWVl1Dh468dLq5NW1cPtGKMrUsglUQiYKyQXpc8QoK6Sr4Di"
+    "omqDIs0soqgJJ/5e8WlYX68GdYS41FBNcuXlkb10ZOUBAAp+3q/6Epn4fSPewzN9SWaR1GZdCFfu"
+    "dQLyuflJYFW+sVI1s1R8UuQuDyABGRsxzlSVM65NUP+Z2qioD7e9KRskuoKACxJTRiLTDIsssNfU"
+    "SW3Jk7Yxh9Pd6yw+UADFwrHOtKcn/IOrTgUoKsfnMmDbCsDmfJW+0tg2xD8dtemauurqoqV1jJi+"
+    "LorRKopFp0Nkx7gijOopkdgNyye1DbTHfcdDusnbBHQExSP6mqZO582cfYJD7f3fofOdCoNZ9XbY"
+    "5QYX6wVcCZoqy5yBjYoB/qbbsapS9drrXigfSJAkCJh85RaDnrevRxcz22Fyy22W/C8/1nDrO3ZU"
+    "zPv7O69dVf27n/87+P5UyW6otg8iUtHlg88J/qgWVB95/quYXvU+8BpyCPveNnHpxcvvarJ++9/Y"
+    "2965Nf3N87Y+vunM0KJkgehOG07NzG5FXzLLNqrqYzITvxZZLNAgKSeUfFyRDpYfzwZPeheujgVU"
+    "dmbfEeUdplq9abd6BDkil7Duo3fBFYcnjyZWZu+RJIDFEtT9kpdn3oMZ93GA0IxKNvwKjVfA5cGZ"
+    "oSGuliHJkLIOVLI3wrbZEVVB4PBIWU8uCXYLBHlnXxAH3ipOW0jfq4uKw9xiC9G7F5mRiI+BOcaf"
+    "STqoXHH8q1bs6h8lGfywhXtoNAHnUNI+XxNtDAZJSOw2SWqwWp9Uk8xegYIBsAAFmGXEUAUWiK0P"
+    "N2W2rhIpC03UaEJxBWhykD10IMjOgZFUNUg/T4OloknlPReh40Fi3nP7rkMogdv1+LPIDCk7y9Lv"
+    "QGmKS5H4oobpe4kBSKUzl+VLLuls+EnbUoKBolSmeQG/b+/FZXAcHW+ApA7WAoZPBaJlHN4stC91"
+    "3kFXtA5W+WDhhj2b8iV6s21EIt8hSpKP/INayC8MYCq124rtsmhZHyOz7Ht2IdD+alCFkbOqEuis"
+    "U1p6AM09jaQ3UMWZ8YW2lDnd2+BPfY2e3eYKGOcseN+FgREeWLbpMM4pBT1hS9H06/Uwuo76lB64"
+    "5qFoPDMOr+Kf2acWJrXKAN/9YOrLpalOMYOU/Yq+7IFSFaz2iYx6C1XJ8zm7zDZ1Y7QsUpi8IYGK"
+    "sVU80HNnaGcysiGHE2Jn0cwtJTTBEGAUqcN6StwaASK/2Pza3ftrWptEM+SPuimruW+RDAnMWZeu"
+    "eLE+otHbltl0VZ7bwrECHgpNCbXryMEm3JWKDF+kB12gE+7cTm8wtfvvnM/7V/5yv/YJpuvQXjkh"
+    "YPLB74mDywLOg+JkcuYj59HnBqc6lxsMujIu99/g9Pzt79lbOH776ye/nB51f7PPljz4mSiS8T5Z"
+    "jsmCQJODLvORkaxOm6MUErNLOzhcILCUjCzNCB1CnM0FZ01vgAwx6+UBpwtMyaaasqTl5RJid92a"
+    "UxDX20IUTJKngJLqqaP7ghCHIXKgOvLJUEBjBym3YbJnwEKaNNvmxbOXMwSmWWDXy8gDt80BpgGK"
+    "mbbIflwRv5ItCTq/hdziVuadUPbORBD32u8tpmA7hhq3p7YSF5wVtO2gCtMpMsqNuDYq5eWyAJkz"
+    "A5ZW0efAapplGPfmkLXAvCtq/tSjgmPltgzdvdqpgOHxP86fMSLQMH/6l7C2UCTGGOXfGmDXX9Lq"
+    "al6YtOSswnQB7aImawG7iHw3GV/zKs5IeyaC3y28gK6iuUlkEr8p4xCwng4accfQOfutT8ISeyw2"
+    "jZ/hO+aVPteBQuCwNEVxp6waUbNEq6mJ5yPi62ZU4qqtQqN8SAh5uqvUU7dthGG8o29KS1Q5q82k"
+    "ydk2Wa5z9VgPwH1vXaKRFYNGPRWH3pq0Tal5HXYwxefTYWSlStBab8IvVc5RS6Fr4Y0f0ZuMppRV"
+    "i0tFK9s8x92uoLFNgITtIjyfFm+1p3LTKtCi/9ZZnfpxu56a34RrXYoW4XJMAiXfHq5DxLUR+11g"
+    "4ualSNjwaVMOSESu5QRb421WKSGYHBEJoWlp0rSDc2lrwMlzpFkhKrGSVZ+mFR+tHvJOWoWUL9AK"
+    "h4QCgrANsqYdOFo9saETJBWpLIXXBJa5+RJ1X/xSuSe8iDjrRT2pT1h/x1F0MWjda5AHjNa2DyuY"
+    "fUBbXlnb0X/vTg2W98c+/o5f8vC0q7nr8lLR5YPPDRPbAs6D66DxcJn3IPGBrs7x48uLzzM799ff"
+    "ng525O33+JN7cd1yOzma6YCa95TP5O3jvmDMZU6qKjJ8iafWvCdHqznivm5vFtz6aZa8VvOxxgFi"
+    "vCRZgDc/Y1dbYpDzr5Ai1aI1Ub4q5PJnbt3GKO7K36RmALUS5Fj5EkD4unoVck5WGf9Ck34xM8RR"
+    "p7toKq6JDHI/zK4PA06NIGQFnctez4yfYBT9sshJHcInRp53ZZvDzkBiVzUuYW/Yfh1tMul/wm6a"
+    "vPZ5tTUDa40Zbosu4RxsplL8PJtKWP0efgKmSTEJxw+T0s5yo5ZXXGN4xByVjIVqCZMDgWFQ3SwJ"
+    "cZtls6Mco3eBvJurKgVw9HlQHLvJVq8SI8RhUGmsSpgtAhTdDWXARG/PAhzQAQSyFKe5tPXtuVam"
+    "ECcohHBHLHpykI6vl9ktgs3qtvSpyy+K9ml105i632UYAk1LF30zYolIfzajElJfUitfJEGr+REj"
+    "jLkH5mUBY1/SvUHNuTWuYQPWgKKXHJHHjheijcwdXNi/W7UsNyPBS/RiXUUNoOO0F62jXrb7pBqW"
+    "ztqu86Nba3FSG79MrwL+KksY7fpeFPNfx3y7EzYrSqlnLxtwRSp88CmTnEmIQ6xGXP5bIs3oPChh"
+    "oR0ZuLFZv+pBTucFG0PbllMXbI786XOdDYAU3qaBnfwT0G5z6CdtxyW5b1cEOKfqgUISlWaVO3rU"
+    "koshQ/IlPewkAruXjysTNXyHbCFn35Rh+YsncIVgF1pG/iI+uCxdpuDhWYB+Wize8B8CzmVrkgJl"
+    "4Yh3m+c/SvVZ50eXX0wc2tz/76wf2v/v60Oj5RZVmgoiUtHlg88FE9sCzoPqoHF/5PvQec34j9rg"
+    "/v3PnOxdXPfvPy+s1v7Fyd/vXVHiEKDwTJhJjZ2AnWAF4OZ2QPo0ZAzm6kmixTarqAKdf0PeehF8"
+    "ZhcGM+UmbQhkUVp6EzuNYfeugGq+DQYVNg8gHLLG8uQ4gsUByMVd3gxTXMLDIsQB/5W7BB9yFRM5"
+    "2eNQ37Z8FbjENmCPHxxonpmBgwIiCDlfhLmQYe5OoeMU5keAIRFeYebeDwhST23dA98INHofk9Hn"
+    "loQMgbH5T4ssPFinB1aMQWzfzwGYXKT1ZGIdIAz50JYSAMKFOWJIQiCkZ1mBDf9MLUMZdANHIMEn"
+    "sU9q6G7VNSoDzwZEhVtym7XOgKPG0LMXAValXbNOwKV5lU/AZ7tQir96ppZxGb12+zkK8sRbV/Qo"
+    "EO/8o2g9m2fUuH9pXN4vhTF3S18GAYsHOb3445ZJSl/NFI5NdioECxCyNKo8bAoQ0csXMEt+rPWC"
+    "qdowxhW7adpSUA1F1lMzeUxy6+i6lau5Q89TVpBEXqkD3ESQCibLao1SbOY2xEju2BsE0b7Q2x/P"
+    "x5YUl0FjAZnsNWCaRo+emgEJTMaFO+ZJ6HGm3hD97SrZzSVURVt8NrZysSKPf3AOM87QmZJQvSSs"
+    "cx+6dxgWuX/NJsynJlgQLYj08GmTT6L7hIx2XwAHInMTyRoyhqtju2mimf5OdLWISSS+JYlNb/yC"
+    "eXPLjmo5ILeQHCEz3yd5sdv8jYUMvfNign4ijAXyoGUFigoU9FHeFQC+UhJ2U/k+op3frMegllQR"
+    "dh8ksjjiPfpX6f6itpPDhD5oVNx/T59bN/fPdZHoSyvvOGPhrDtuxZzosHFg98VA8sC7qP6sGF/1"
+    "PvgTHB7vJm7tWd+//m5OQLv3T+8I3Xj/ffftEJ2DsCc9cbQV9eSE1gUJN1plJmPCTUDNxlXJrZzg"
+    "m1cOrwwSoGdDO9c+qcnqi0PLlI43KykzITLcpJnpRFJlj9xjyeUqfYgUzqouYUAcUbGPVhv3X5m2"
+    "QuCBspOE8zETyWB9EWLqBtuieEdGUbP5STx4fgZtu6PJPYYCrWRxrlQRO48vswHrQoXrlz3wE0ah"
+    "E262u6ODYMAEj0Y5J0Y3EZoQNe6FmOIgNi1ERM1Ub8OLBzOwZ9kcGZcKzcoR70j6CyGiPIsWbjKG"
+    "/1RYkouLiq6wAr5NGFXQk0K1jftkOlobbN8dfQaFVpLFgiQ1EVrAoPDt4sMkIHTlmRoV6Y0Fko5Z"
+    "gaTqn4gcBTegRW3XzostwGphBbKSl4ViX14BVHKkslUwApHdOiGpbPavNKl50a8oKHqVTLjp2VWl"
+    "4qUYqO7c9sk5FlMUo+ONvTBWh71Ws3SRPJ+iM82EGh/AC2yyGMn0tw4Qcz+RNJjQq3X0CopJNBvo"
+    "B2RaBp48YQ7KrxImhYlQXB4Bv9yygo0ZzhSQPiR8Wie8CKCBjGSGabYsBAlO8LpsFldJ2LIb+rk7"
+    "wNV3asFJ02RXTwJWFeasaO+QE9rGTywBO4FDXaN/zd4mtMQBMdCoxNrWPmLXjQ3nGgLRzxfVb7cv"
+    "GHvzamh5p+UTk4+GqMFVyJGuafPD0Y4i9h1X5pXZiZS1ffA8nDhEfyQCHgyEobpGG8OjbzdWK+up"
+    "yuLo5+sDp45R+u7n7pD7lHXgXI7O87SktaPLB44KN7YFnQfXQfLhIWD8QDznGr9fHD6fi13zg/+w"
+    "//+d7l2d863H145C6dUxevX2PedMJj6mM+G3F9TZ5wO8eZOtChQKWAPe12tQmDnpnCmlNAIjtZHE"
+    "GPlmzEtjwARmQaZaSQZFmrFQZMXJK0XRxZzfPURAy6gdzOGz9IInpbGOWBC5jTNlpc7GuiuU3ApR"
+    "u85jNuIAAGT33kttk0t62qwccf0KaTuoGJopQzZJp7NP4JPwzcyEHmin3rcPFncBZZ0Mw2SI8OQc"
+    "qzHaYsyh03bbM0FkNuoUKzVOEZqEGWfMiK4MEbDiqqwqZZPvAIGY1q3ZJ3CikyV/C56JgXGDNNQs"
+    "6NzdBq2XgYRSlQpYpIZFUqASOMLyi8wyQK4Yl9xaoj5NILVS56sdHavI7oEJI9oVdm2hH7sCddHY"
+    "Utb4wV+UlzcDxsGJ8VeQZtt6t2Z1qf+O00V21T0ZTaIdg2VUo7UgSimrkhAIcc4Riv/eFD2Iyyn1"
+    "qWQ1Ff1GJIaNEN/MwEIN89ZVRzSw1ilqfXi1Mp6kst7ZfO/3ieMd2U2gV+po0tMSMwJYRdvUlKpF"
+    "xqKHadPAutQbdlZ3HqV/R4cQobLLsEy/cwtCVlY4UQX4MwRr2q5bBV9ZoNaOWL7ebii9qLbxlT4P"
+    "1LGZzlSAmZ1IXf0IyvBu0sq5U7N1a5sWEDs/l+5kIfk6BIY2yd1LIPu6jFT4FGbFtUZSre+ptK9G"
+    "CjvPCo2fZmERcFvotOveDclcOvNaqgkwdYLkDIqUgeCra6uji72X/+Xx5/5hv/ZJqOT2HKvyYuaf"
+    "HA4oGPzwPLgu7j8+Ui6VPuAecvJ8qDu5/57vnVT/8vJ++996W987O/vvbJ+Jn4CHqZCCsw8KW5RW"
+    "+QI581YQMhbLND19QJJiokMGgrCeZOsCUlgUsHGahrJeIiseTLMuopc4ryzpu0YC23g42QO1tLP/"
+    "Lg/godMWLIhSbiWmZsbsVmglOVjiNlTokOBtJcus5THqct3CAXtRFc5dgNwRARPSEsnUP2aJf4HI"
+    "Ohc2EEtrMvQj+EDVrlNo0gZRMLlfLq8wrugIBKODb0J9ASiMzh66LAdHk5E0jJUywVSEVqAM1Lpu"
+    "QiIvDqK/tz+0UnhTClCj0bPHCjadTVWXto8myeRBnS9Jc03T740rYn+EPJzzaRYjshiExjSRcLyM"
+    "htakVWQwAyaaBI7jLBkHIEr/okiawCaulNAJAfNQ3JDlHsjFBoBmXJrt/YhS0Yh3HpRl/6PIaqCL"
+    "iaozRdLYPBdiRGR9nlecBqMVWmKUF7hv3i0vXKoX36wb+6yKKQSKGgKeiJDeID0RINaLjkIkaobx"
+    "kcMrODQy2L8QzRshNQVNTTKqFuucL1ddnacsGlLYWkP0K8aX8sN9i3t9Q8vKB/ZM5/cGGdTdAgqO"
+    "d6yQ1hxvambil0Lioiv20LryfHkx+6krfDg3ZsoGO8krZoGXnf0RDbmt4H1phKowv/sl3JNU6rbY"
+    "Mi8C0O3f+ktbG4gBiuNE7+b7jSZ5IUrfn8eQAXnrBRCi2V9ktZJ58yKw+NOnTU4Etvid8c+sTdxa"
+    "Eru2341YVuFsLxmf3pbdg+cRRc/K6P5PNVIMhbcc/K9dnVxdXTf3rw1Nd+dbr1uT8G6CpQs5a0eG"
+    "DxwMfsgWVB9zE7dBH36faA0yKhwuXde1/4v0+u3v875yePP390+YPnjDnrFkYonFT5y28sumxwkW"
+    "TufMek6JRdMy950MCC78BMmEdFWxRITOjZAWnWoAsDjppwT0NfJnfhQTQl9TAKk5bMBYDJQDaATS"
+    "CUtg26YUvkwxO5LUc+ZZURlKOk5UlrsXlEhXbQDLY4spCh4RTxnkbq8swvHFjqFKODPLdI0o78/g"
+    "m5siUg2pYljCPIkbeg4bPZl+JJyggJsg0co1sAOqCVPG4fNlEfwVaJso2kyKhimKSj6tipFMYyOb"
+    "LFt+4mMbiqgFAO+0xE8clYY6yIS25pkGRos1QpwNZecgySa8dj067wVgMHIyB1qm8rWYnbkcW/NN"
+    "cE00r2Nswgw2FlyJewpIQyzhQXDaGzzcrwZG4bm0VoJNaOEXJCU1RWandBjiEDGtVBks+VwyVCyn"
+    "OFFGBSHkcRhF67RgDdFCVZlSbltny9U60QWEjJ5j4MLCeRBe+qMnR5BMKchSvAoEU41gc2QE7Yme"
+    "EunM+3ZqurdmuKOk/e1MjgOMlbimJ32SaMw0yceiO+2u6tpnlSZGj0a9sVDghjvPZFeNWHwEDprR"
+    "47UlTS2rHQVaYLNjElo3uv4IENzsrzeXPwqUfZ+d7S7m5I9Fc55iFjvG/PBYwi05L4QhkCOEp897"
+    "38UEXM1kW46GjasBZv7aw2fKCD55Tb3/Vby6EUsWmyvugUG2Aeadgl/YYBbNNAH0kzn7I8HENiPK"
+    "puObjsdhYuctThwi4LZiC5EiEIvpvDR3v7P/W70/2v/d50ffBonkdAL2nxwOKBj9cDy4Lu4/XnIu"
+    "1T7AHnS6c2893VwfmtO6/91sOHb/0XO6fv/TeHh+8eeYF6h6uWhhHs1XGyBMyLxSwDM3G6YMpCIy"
+    "ixKRgDpOSs7ASaidqy6GAykRpQZW7OwguMAbfM6g4f5DGyeMJrceCUNeODKPHRA51ze/RhdEQ0wi"
+    "wHwDTrQ3Dt8Sp3cK1jblSAxR+hjY989Slri0eQdX2RyH8QQmc7ksR3cQahJ2UQo70Jrlx0kWKPTB"
+    "4QGpjkon7bJ40pkZEyqjoipYRGwz+KgL9uTxrtmxmKNbTAtuXN9sM/kysnYVfRNk2yNrUtgUd5xV"
+    "omRAmi4FePOEloa+Ku1l1BtgqbgNzfbJrSBjHSQiKVaeS5VTMd2/xgogNyiUYIGiZODa4CNf8kNF"
+    "974aAFCzXVoqj1i8SOCsirTfFDkYbXto6U0hAUWWFvdCHim7ahFm3qKLpZtoJG8LvNHf9t9EW1dI"
+    "JyKlurjQgF5mc/rW67FHEFPKLStlYglSyqVlwqKcW4+ABYdtcES8NOySoXEdom5MazGecQQFcSyn"
+    "dhCh/0ymJQpJ+FWfYvPHI5lop7FjQgjnU1hViaiJt1eSGoxrB6Sq7t2Xx8Ryt9wEbpCCQ7ad7Z4F"
+    "jc0h35UHS7ssgKHpqZzFGtzfC6wxQbRNs/WhshnvIXDPAkv0RJ/ibOJqVt6Bo7x0EWBWx+gZfMPH"
+    "1zwM1hLguUR7tjb/W/df9j7rAndduArsalEMLhf/lNEBQ3RcukAaIYuYEJhLeYhFAGJg//2f1t/Z"
+    "ar6fZR80W284gwdJvHOPCa1HS5GKJI2njDE513rneuT66e+beHL3zj13bX99+4vuE35pIvafHA4o"
+    "FPxAPLgu4Tcesi9NPqgc2cSbCy/8xfHN7+6W+evf2DL+9enfzCen3ta6KdQf1n5qtAI+/Tskrgsc"
+    "NiriZOCaDr26kAZtqsW6SYMCPICbYCOuUZbOSq6hwUG86gI5N0BzBIhSVHgi+j+twuIyxC5zw6OB"
+    "W09RtYBeBkT+psyGzBIDLTg4dg0PcuQQtsPepXUOs2T90T5WGTJNpaDS2aRB7yNW+uEA8eQwdlbB"
+    "0WTZEJnbaVI6s85IRGftoQ9tFmEfLMggSQ1D/gpd8+DFyweOp6MpyBiZVP3GAX0VSiChyYQWmZuu"
+    "n7wSppBa7wN5+8FTYKQCbZbHboGW0A3V8bC7VhUczxhH+vtMeAFWnyOwridiGMhc1QY7y3bllN8Q"
+    "E63D0pK4Al8C98LQSl0zhgZNX6rhQZwO5LhUT40FB88kgjejZOS/U5+iNN0vSBnzLFAI1tJXPgIg"
+    "S4yYXXeJBJyKNHTPdjiNuWKAmqT/b3SEWfBRJAf3M4Nxib6ueR9K9KOlWfxNuB1CJnYM2bGn9qrp"
+    "y2gX8WZdwKFx0A24hBI6Gg+Nly4wEVlHp8hlzbHjQdruxQbNH72Prcuhge2yuyCchkSQsix++D8s"
+    "m8YPN7R177P2zqqHJK8vmZJi/94lxgZdRGWl4NY6NKUCnNdx4g4cjOUyqF9feDarVEtTVq6jtXjo"
+    "0cdXH0uA/KkwvDUaFQbtEecVAjdLwWsxaS3qYIwv6Q3r9BDEuNz+GXVqmo0MjiX7g468PyMoVOwu"
+    "STQQV9wysCdnIFUd02mJyj5NoC6cfR/E0z4O64KdfWrWx3ZCMXedUf9I0isKsuFvZinO+Lm6uL6e"
+    "L87vsHz3/9tw6Ov/itm52jk4xpyZe0eGDxwCfigWVB94m4dRG6eMBJ8vBy785n/+D85Iu/cnb27g"
+    "u3Dh+/cjOdM7MnosBFzobudDnBkqje8NSw7NCNIMZFTFJN6xA7bZPq7Bzsom+GNt9m8ix+J2AD68"
+    "EXXZ4MBIqEfBSioGhFj/kfSAUVBkctSmSMEKkVIAb9aFfFHMDL5kSw4bHO0b9PKUZAWRkM2qEIuL"
+    "TyCTJJMsrWh6HJxUvggQGxwRN1QXMaNA38sDzBM6xpc4smcKqiyoUGUIUvd3R/DQIohY8kpSmBUS"
+    "r4TnmWoQtbKOpUTbIPR9oIi9wEdI1r5jQ/5dLdoiGq8aJufytTv4UhsxgFjBRHKWNvl74wRExMCM"
+    "4A2PDSlF+BUrwm5HM58pcTDMp0fOJ6+aSKCvIKCuUC2mMjFLHJUi/SlCFXNXQjAKjyTMr0GPKlT9"
+    "0Fj+OJMRYaT6TqM2HVnoxbEVsCo06YCb5oiy0NAFb8G1w3g+bIsGWNesdBsWRjW2C15K3fKjXPsI"
+    "M8olRJSjfLQ0d11rJoC4SlFktRkHpbmF0TWjDaGe4Ii1gbAL14bas8mADEwVlGAxZYsPirqoEpSD"
+    "LND3jmEyKw7C6CQQglTE1RC9wMxGyPl7DwKrM/w008Fjk6RsnBZuGh9pKbXbXaahfSnzFHlxSOXP"
+    "WYxJIie/BTHzYH1T4K3VZbrJd0hhq8WVBrTRkaO/0MRCx83d7h0lI5fGwOjb7zj/YoWtbyk9TVXk"
+    "iS0jfpT3AttHzT9cCKZ5bR/R/5kRcrKGmo44k6nxvfMaeeHecifev3Hx9oF9b1QWLJZ3tER84pPL"
+    "tnu4cv/P7+01//9ZvV0bv55hgXGcrk5bx4YPHAx+yBZUH3MTt0Ebd4YHgg0+PBrQ+mu1/9jZuH73"
+    "z59Orb/93+7ju33RfxViMfkDJHyiOYyMxpqAGqBUVOJnVn1Xm+HvN2zanIqgWbTBUE1FXbVBMcbC"
+    "S24EzclFtmhyfRWzqbrgOEqg2rqAU+DBpw60VZgWEFJR07lAk18zeRfBVaNQB+YQQVCSAoWo1fLC"
+    "A8esmNwyArheBCY52kDSEfxgDKVXKABvkh8VzBEoXiSS5PCZAigtD5REBLvdpUFFJFamyzzcBjD3"
+    "IiTjoLLTnyRq3yNFvyFqmMcKlLPhRubJDHJGYczdzOTlAINiZJWlI4Sz9XCyxMcBObGVCasohrNA"
+    "RACl404rEP2r9sW9hhSSelMmQ2ZhA8wRvpnmQrVWiwbfYVAE3oZFv0tslzzG8eecsu8tzGXHQlor"
+    "ybJiYALwGlp6XREdnxVh6scksf90aH/VFwEWP3PNwgyrLSaafWrln5YvhBnwlhb13p+c8pyqoamx"
+    "RqgmQE+5ZjlzspLlrTMPSOnfBWrS5t87ZOaZRXQXwLDKuCrZsodNlWmDwPmwOQRBo/uikIbSZKtj"
+    "2+F7wFbxMCse21oFLYoGqh2hTezlMZQPhsR/TWmCgTorW5tpjVA6uS/UqRqoQPP0R4YJakS1Kovr"
+    "PCaf5tmMI6Fa3nppu5a7eqeAuvjNSpbviqXPBGWKkrIE0HIAyeqkeqD3MG9GHdLSc24p+0Q9YICd"
+    "S5oWriHXvUUBM/5QJb8zEuc5ExJrCIc6z5xYus6j8Xc5eR6SnXTm72p5vdz/7Z7lO/8M3V7nN/lJ"
+    "8TiFjS4oHFA59vzAZcAAAgAElEQVSoB5YF3Sfq3kX44oHpev/u0396dvOz/+vVgw++OF2c/OLhyh"
+    "cY1MSYuy6dkP09nYFYBxBj6jV4rBBMTwo1kBllc9OY8IuiYJlzRzE0W/P5FpxiKyvpHSglaAESnJ"
+    "NxYefIaEiI0C3987xtkBHmBMBVIhihrSWqc/lnXXDgg1xnN8Ywjau6EcAJeotR07orsJO0FoYhlY"
+    "p/6UJmKUycgmoF0S1RC22ZBeAsWS+QKJFsQ2FliT2RUXIT4TY+6hLxSi+wIAowsKxEe21T9JZNc3"
+    "gWmvKinB4BSavOIcM8ojmNXJIoQBr6Njs0BRUVPe374cMEacI4KoAdtlUb5J7VIaFM0cZhTEn2PN"
+    "K2xmJQvLzF09kgL0nxlVKLO2Midm3aVXxQQFJl2xrTY2RLLxm5DbFk1e/E5Nmy2aLoBukbW6Wdkd"
+    "91jRxDUgbJB2sEKHPLBqWEgmzcclkC3fcMaRbEFFta+XIshoZfS0rxDAXCkgyWW29wCHbBVotYy1"
+    "t9qHlhLIkxDyHDFuVVyyWM9MLaHzOf9I3f2q0OZwmPORv/6sNqlxILXp5p8siTRuO0JRcJZp2DJx"
+    "9GsMob5UiUgIJ3O5gjJ7cbhpLTZnEltkaVNNTSmc0jxqL8/CeFBpvy0Sx42q586KtdEgsNpli9aJ"
+    "R+UdTAh6xst53RFS2xJbKiAl5JPSHT/8wNYSim8mbjglcP+mOvfCaMFodPNhZIE2S30TY0X+DsXN"
+    "I0x2rGEDK6WyJLHXUbsg5xYUeuGnkx+Pqad85d33/n4uDVf/jU3a/83s10cBY/tMolWzyweOCT88"
+    "CyoPvkfLtI/pR7IPMxPtjf2b1ePfW5f3N68ehvXz188NrVdPHaevd02tl1ol05LToVVyzS5UzEOT"
+    "mF1nTshBm6TN0VJmS2LeJMqkKlUWIFSCn2JF4W1ZwvnrBJ0mFoIeTMX3AzeiZqyKhTTSqdiUIa5S"
+    "LCVNJ60h/KjAdGar0xBjHRq7heDAWgqNhagVQCF+UTbUTLHCBRU0D48UX4cqodH+GNi2XyqWpzst"
+    "Y+aVkFqTN0xS6u5YrptlZ/NCmE1R8GlDGVXO/qewOmwqa/DLoMLsFHvidgMSTMyqy2btRKK40P1C"
+    "FRtN4e6TIQSUhjBzc8DTRYa3QoMmaECBSXvAraV3oAWgApvcuMut1U4u1UQtzl8ld4zZRS9V9ZX7"
+    "IiMLgiQDyyB1Q74y1kVfs3urTRIx0cBk8jycWfAkjRmxx5wNIfoMI/BM3w5itk+GGqHFjIrUd32d"
+    "XYglkJTgtIMylBsvW2exYZkjCIrRTdkAIOnaf8O4r0v2SMG29/SxJKylgqnrqjWRtKdqzJ2KI/w2"
+    "8gbi9Wf24sCLLslL4HXkNRAgwBw4/VqBhRuBTFSym/gOLpSrdLmKJKcuycyWUKMtKKHYpcEWlZfo"
+    "7C2kyxaVw0af4ot+VK59x+rY4v+a5NVr2TJFdYzAatdkScylzMuOwEYLVpUqSqnuL3O1am/g6QVK"
+    "w2pzzajSToqh1iRMaK8h87Y1aDpxC9TTP8VnoivVSrqZWEPvKA5SsU/+jDjANycC683C+Ob7wgYD"
+    "mSsD3f195aXeNMXF7lIAI/OMbWYG+u93gY6Gf/4M7TX/0HN9e3f3DDB38dI7pNadhyWjyweOCT8I"
+    "Af7SUtHlg88Al5YExju9PBye7dL//mze6X/7eri8PHOze7TJYHTLj9EXSyzaEhNdmbAw280NaAjf"
+    "k+KGGhCi5hWaqDF3Cnmts5I8Bg2R/wmxsC+IsS88RJlJ3ss6uDrNrdkQ9BXplmN9F3NRXeXHjJLR"
+    "pgBgAxdNBtYoeiaXGSeaiHvAqBFCbCRZhswbDDejHFfumMKmZ6aTu18DmEiiLswve2oeSSRe2Q3/"
+    "ARjIiLT1pmnmQhq/2nnDZdmhIE3KCyArmwax8BVN06Kdbb4OKo5gcSP0KmXsoGaQmrWneCNoW1XS"
+    "seQKClEUPBNoo2Cde2sZBL1VMICpt+HrK3OLUtcousWLGlgsaSUX7HLbGltMpnKrrBrK8DbqOqIm"
+    "W1s3HaLjCIzkXl9jN40CN9uMnVVdpKTi04ldFChiyp7CftHIe80gEabarPYqRHj6qzUzFrEQBP+l"
+    "Rejsj2bLlT9FMWpLjoaBpw1YJqS3BCWlxy+gOvcpC0N6mFmXG4e6Ka+pwKrO8RSybZtGm+ZRSYY6"
+    "vEDSphId+0t6pzPf0DU8ZXjNXvyldB2ab/0iYQfv/4EI25vy3zF8oiR6cShh/Ahl/FUibrnBq4/G"
+    "lA89XtoqEEFs3ktF9y2FUTGunDt+GVYjzcI9TD8Wkg1ruwnfnabsUoWOlpgzT2j4u64hm4aoHEfb"
+    "T+dKnQ8EkFX9Oos+hLrjRFV/DQCZNe/jHurKcMTHgZOfPajlr4Nj5jShj1Lle/AIv7vGtEvIu2kp"
+    "cy9dV0yYLNWyu1jRx9GQn4X3E1F2DOztPf2T/6wi/vHr/+JzvrfRbIjsvueEpLWjyweOCT88CyQ/"
+    "fJ+XaRvHhg9oBT2uHBwVtnd3/2715fv/W1y5tv/1frm8sDr3SuCFiv86M6AogET0yqcmbyNghzUg"
+    "yEibPyzOWJzroeCvioJtiSPzxOu8645lohAZlzOnlN+JSDzXSechFJWHxetTUo0cwK1mQWLyBkZR"
+    "u2pg1tewwCXfJSCF3Z2PyzXdt15Q+2oUB+DTdJu5X0hc3kr1pR+PGgEskrOIcz/oTXgAfRs6QuJP"
+    "AFPponWKmxOTxABpNELjgSWG3bQxlYh5vRlRhYEnhkjzz7G5lPdqUwCUkQRkqMKaVB5VS8Ny7qtH"
+    "dEjbFlI8Ogvu7+GkJLtHLzrw5t4C8jr8n0dPmgcMXlOVThkb8W9zJpHzKSlW2RGfnBpF1pa+iano"
+    "7zcyBFjQtlDXmtmzbV2G/j4qDyY+wB7K6nqWSkxKn6uOQ1XpT61RHQKBs0i/lQKrbGNIVtEpL+a9"
+    "Q2m43UxuYt20vyRu9gaP2ioR+36jmgI18y5TW+Ct12YB+WF5+PsVAiFYCIMibn+WQ/lR4XvZpcap"
+    "o2fub7B6AixfmZEjtGTPQh2yfqip+/ragMOndpcmsxMGlMuXjRlbynrlQWUl7txabSWz5S13Ctkr"
+    "C45ESTQv0fu0jyqFC7HF+Fl2J8L1T/Vb9n4M7CNay+82Szpo31W0chpjI4Ohz0w4+h1i5JwIKKnX"
+    "rGXTCbJdAUEZxGHng+eRs60TB58e2SvLysTdWm+BFRuQ01clowq7R8FhFevVPwcRFPM4WXbvNeNN"
+    "qT4lK3VzWgFnChZ4FnPsa0vlzv7PP21fXDvVuf+6c7z37596bduw9t9dxOVS9p8cDigU/UA8uC7h"
+    "N17yJ88UAFA/rBR2zv3rv7/56cfv5/vn78/7P3bsG2ZWd931p77cvp0336nL6o1XSrW7JAtLhIgC"
+    "WMgMg4drkqSVWe4ir7IU+uSiUuV9mJ8+J3vyQvKVMEcMAGYqyKSQgEMIoxjlOmRCXmIkCyKwmUjR"
+    "WjGDlI6m6dPufsvdcl/9///31jzn1aVOWp+5w+c+y95hzju/y/y5hrzW+sOddar758bf36B1fbc/"
+    "/2dE7v3MZSX3DQBRkneJ1d4VOwuyaDxiIiZ2K/Q+rPNZjCyZeyIyd+zu/+LSX2NhKsAMI1sk68Kc"
+    "PMhaxmLrZqjCylgXnawYo+NiydfeqMoln86kaKJW06ukEOdnkYHQvOfLAIXmCcR5CCOKnQi0+huS"
+    "qsbn5E2M4LoiLCh/ILzDJjjfSL5qBjM15kHixT+OwKvSjhBickiqqO037afubA+cCOFDxn7FFjw6"
+    "PAE58i1xjfTa55QNzxSL7Ex7jQCkv6vMUuffBm8FG0TdEF0seYGZLNZ2lQLS0M2V5Z1A53PDdgc4"
+    "xBwzmaQOlbZhx/8AtodhRHBqWAGoON8YI7kLFl5DoQjSdR57SsSy9FPZhF046YYkID/9dxoRzBmh"
+    "oDWRmOEYtko6Z9PCiQ0kWHOSbfEqSHXGGw6Gkt+KqhJ1/kVJt3ftCBXQZdaEs/MUJPbmsCrItKqZ"
+    "WuZESzTqHHRrBLSHzJWJdXFQa2XHv6MMGBVLo2VP4g8WbjpY+8FAnW+mzwC0vqYxHseg3EYajQ0f"
+    "TLpBds0NAI3bp+jVS+7QvSZat6Hotn37z4AKOSDlI9+ZwfGT0q2xOKXbVNvpozuSeOeFg7YVYcvq"
+    "JXx6rjJRaOByFaGF9qcW0t0bEJj+NBfb6VlgWdfdCY5u/0oYu4/sI1xzphiGM3JOQ3oIRiAvHq4Y"
+    "MtIM5hXcXLQrSX6kSCBf3Jtt8gQ0VvKB3t9xeX22d+dfP41/3kyfXnPy+n9RKHQR5LWzKwZOCtyM"
+    "CyoHsrsrzYWDJQGThaPbFdX3/vJy+3v/9NJ/v9Xzk5Ojx12OtrnnXey++MUzTpisv4MSNOnJx001"
+    "h4cQ6dGoVETuSmaUBRAN7UNBCdvxQv4eSES7+F2SOboolCygWGxSksIssJfc2lOnvSuvEqRT/v5s"
+    "JGR+8jU4i0tBi+AgbfBkTQPhZTDJkPHLHYhrpGNBGG6WxpeUcei8SHmq2bhxo0q4fivj8n4uINHl"
+    "YaCzbvbMeiVQIaOX2WBYkU0q3VwPN9fIk+KpNPdLHmuWh/m2hRskVHD9m2qouvolUwRtREOz7kaR"
+    "F2d8w1B4PsIIfHPg4gFL6FUeX2qNmxhgitr2hesSO62cJmGtlMeTcBVbvjAlR+Bc5em2emQYdH0d"
+    "HWXtrtSQvR1kaDf89AmbvqX/QAzJcyYF80CXUOshCFBB1BMMln5YiYYkTkthxtcO2AFdW1cS2rrF"
+    "uYSBizxvgrfj8XjMBihOe0nrP+cXHhJRtwJ5xKsggi4or9wV/+8Z+OfBM+rsQsND3U8Np66KtBdt"
+    "wBqNcY5PknBwghV33rOxvWB1Hs4GRVpXGev4hGOTZiJ1ilnB2LCPsnLMCiOHa2bTobgZbvUa4siT"
+    "WZI/aii+i50OLFsWsbGxyN6PAahTKvp+pBVM//GVQIopknNvllp7/ueUTOxWvBxAuWj/yQB1sdr8"
+    "Awh55yIDnfvlnYdkL9brYlWV5b87qV3EPHNd81UfhxlYHMMuDRizWTpaN9bowV299aCQ5MIcrO+B"
+    "kS6eVcAq++zdKvf2WfY44Y1/oilO3Zlw4nL/zcyTPf8Cur9dkFEvwtbcnAkoG3LgPLgu6ty/Vi6R"
+    "HPgE7dPsVdu/H8xe3DB3/6/PU737re3v33jzfHp9wu41svOaHqm8L8RRddYHM+9blRp13f7qJxrd"
+    "h80uYEbZl0vBzQybZP+JKWnngII6gzehfpUURi3ihMEY+8a8U6OadwKXumSVAN9+hRELhvOyZoE5"
+    "73FqdosBvDRxctRaMAcWEGkCXRx5eyIr8oxtsWUjYew+om03EfgwbSFisaOzc9G+jaKTiR9e2v6v"
+    "b9pbYFL2VK4IRZ7pSi+W2rIFFSi/2WS4ZElpBtalMSlnVcxMif9hSmkzFFMQfXRO0pCn0FCfkRjn"
+    "TUN8Fdb8BMA2eyCx3c9gexYaZVpNieTJrpRb+gLVTHQZFsVvRJP33YnpVyBr5b+dJXMnOFRpK1eC"
+    "itAhFdiu2m91okFVDgElnlYzr+uOLh49zxghMP8AlEsJA22SSOorQcjsRZM9oMNJX35FPEosd3DW"
+    "UzrT2uoZEQr3hqsU7s6PqIFW6wJYdTcsJjQXTEIIxZqbgs48V6bFaYkpMtgNVy7EjXNoKSfACCRH"
+    "j00koXxW4F7Ks/5Qa2ZxJxrR1wEuUAGDxsp7satG/gF14BaNwGWGx09DMMMmK8mh9M9GsDeBoHQ1"
+    "1hRUpb9+EXpnzwGow4hDfmj9cp3vwpqDKWHW6IT0gIgJ1p16BoAUNbD+KETvMxrn2PLaJN/id9ZJ"
+    "2zSpLH2pAXPXLlDrszPiDxJv5VgttXH2XIyzbHtRd+1q/P1ZU8r0lccV/r83SX99ZfOX38xZ+7/t"
+    "JHf361ufUa70x26nBpaUsGlgy8NRlYFnRvTZ4XK0sGxvlZX/x1ePLJ9//OvcO9v7V74+6Lx4cvfP"
+    "Sw3x6vj1IAcPVrzQ+M69y73hzrxJs+KaQ4cunGO88sTDh5C9kFm/pwXTz4hExBolFE3EfAGOhZxu"
+    "raSBI5N/C6mw6ndlpu05FdVzZDobilY8EGiExjm8oGsvYtZVLRIDoSFxZNzD5xlq+WA4MrHNIwWI"
+    "pffxbf7uA5PDNtl0LFwkCq2das59RoDuJzcVFHvhbSJe7dtEGo7FhYeRTFubP7GnUivA83ourXED"
+    "zPa43Zxbg7jmX4prgoKfnyAXQa3ho1cJgV6xX3ysdmoWNblSvn2jKRYDtzEXEfW9CTpci1HnVp5D"
+    "0Dlv9qmzE3ZgaD+eEQMxZxdJGLjEA59un0VTbbkdyY5u5LNccq4nN5GDwaT/tZy/Gk8p/a1qASxK"
+    "5krKJ+DgXmGLtsxcEvO2NzQzbPWbHxCwE/Ka2hLgV3kI2tTfDikDXARKZ90Sh2o1dcdhLR87588D"
+    "cZQpNu4rCE/UgPX9QTTHJKNz5iihR5gwyCjLVL1N0PGYmpgVLCSDcWApDdAC25tlOyziOCUuR9FX"
+    "ywGhu/9hjAG1CyIipoLe4sJrnwRBeOUy7JWhobM5Hwcwe5YmdTpZWrYY0g8T4WJOS8xCMhSkbg0E"
+    "aO3QdNmXcfw+rjk8bmCK8PF1MgXmkhJHfqT66kT04GmT4xkicRYfDAvv787Z0zHhwe2dLLt1Zag3"
+    "DMJSdQ6id2evHHc1H/zo/eezw+fe+vb9717Z9Ynbz8OT5Pm7s3ajGMiaUtGVgy8JZkYHnWvSVpXo"
+    "wsGcg5mHMyj6PV8cVjT7zwvx827/sfLi4e+/xhf6E7K7ficaWOMyonaJUefQsc51U1fw7Jz1qdOB"
+    "lD7xM1AqZ+tb2Z3qBjuNp7bMIk8+Ye1qLnolTyFC9+tE2qE/UbKh6y4OC2nPK3QAjx/oYE2F1YGh"
+    "ZMAHGSnYoJ2xcZ+aDiS0TYj29Wsx5yaUaQgMs8V1KTr7GB/cj7G0ClyXi+liioWOYdasXWnmQfif"
+    "YLfdstL+gnFEloReA/+wSjdDXOFVQdDfC8cogvyU8htt4MEwTbRER8N/b8e6dN2QmztqbJRvspkE"
+    "A0TXrVuue9QBODTVii4eEz71zF6GbakIok29YBJf7Hvq9qJWEFEYQJJ3Hdb912G1R7d1WRj6sVEO"
+    "yb5pdjangAMiztKZBtKPOR+SqepdpqdHo0QZGZqfm4taVc8XMBLolcgY2zXez3gZdbe3MLtbGYl4"
+    "jK3MxvMZ03mfMxUgdt/A8N/ywzAES3h6I7Fz1XvDmgPpd44OszUh6jZyfQo0kbu+576J7hUfPzA4"
+    "VItC+Ngf/QjpCzPDoNpv1QaP2aDxsQzbLw9KhFcdRztwOvpbahw48fw86t2fWmmUZE6+Y8ZoQ+ve"
+    "CQXxbb9WBy3IevOfS47GPKeMRUD2Q55riCToPuDv4G+74jRNz2qbrI1ZVV62oc/8BM33szuWJYNj"
+    "Secoq9yHMlrmNyfqxRelI4dq40LvnhD1YdDv6Iqm9p3m/XqzvbG5/f3/ymv3P02Cu/sttd02/O5f"
+    "XQYS6bJQNLBt7SDCxX6N7SdC/Glgx0BnTG3Tz56vH19//c+Z0/+NBqd/vPnWwur634TANXhzY61e"
+    "9yMj/webqczTmTFgB7Chwz6rzLWVxkzt8l1/wMo+siQnKF4FN6DYxZBgqIUfTKiYxld7gyRDCsQb"
+    "tkAUoMkdqe9VR0zEVFQ4WyAmU0kI+f0Q8oxREFAw3ZtPhBLkQVmQUxPxdA7OBGN7LWQ7Aavc4VJH"
+    "Rs0brxxzrqOpfaY2Nc9TGOSiTReBfcn9uRVcqn5J4CK/baT6toM109KQ/xS0LIzVzUG+TJQWhT3r"
+    "Hlzyy6cMYHKc4aI2zHg4BCa7pFm0BaESl+ethSHkUjniuZlyyq9pdcWW7SbqT4JBwBUOsh4XzYVs"
+    "0t+qYLbqyeodA4FtTHmEltmIE9cL66DymixSs15ms+z8aKSOV6sieVaqI56Qjqof8M6ejhhaBYEi"
+    "M+89qt3ouZKHNMG1iq7SXKSATEDOBCYSEvUu1MCzNzUlqATTroOl9wI9F4lgMScjV8S/Yh0O+mXv"
+    "7HcWVeKzMQjqFEsyXbzfMguY5A3LFEg0c+EKGBK0E//9Q3vG3FUNg6gAaM6M3X3uTioZGmRRxXjI"
+    "Q7Vxt62DOHWzaRQ6u1h4ahuEqIFVP9GqTnHoveulMivqMdvSycHJKwmfvCSyDC7HE9s8yHVk9Eun"
+    "7WueN+cioLJoXeXODwvKn0icfP39qHK18QEs0y0vDiDX2b1mKYg5kvcDEafR4SED2xbLSY2662l9"
+    "deO3vqG//u2VMf+fn15qm7ulZn35JHqSxtycCSgbc0A8uC7i1N92JsycA8A2eHzbV3f2514+t++P"
+    "KN1772aPXF796sz1W/6Xd/dFb0G+RDPKdqTqyHrQo6brETj2LFRbPPojlZU6Z0c4FcQ8uL13tjWR"
+    "ABUcNo1WkPNjy1dGVTxexkRT3bj4zP6u5OgCkECsemtJGOYVOhGI+YjSyaeTaqDTrI6bZUPogPbx"
+    "T6WT5VsQGmEMpny4FRNmxzZg9WF3z03bxAmlSgJdZsxYkvpuIYAim05rlvm+0rhVRHBW3khL4eLd"
+    "+pbBnoV3zEDTFNi+KVotskydgXy5oSIx2C9qTB/pRMfPeAcHxNg2/2Y4FQZWYw4623XmADDx4x3N"
+    "fw0beBAetVb+bHYuZJtebD+pLLbb2SQCcbiM6X9ZA3jx2dWMbnghKl6GL541UqvqlYkYSTJXf0fF"
+    "wZOPr4TKMId34atOzMaZ0XQK/g8PwQjecx2SN0z7dxKwfGlVA5Ti7n2PEhPmnLUA2gjOImvkqr2N"
+    "5BEtNYCDti7dScF6tEIRilLDl0+jjtWUfHV71d6BvEWMDadXU8x3JiBj1kbF88Y0ugfY1A+YeiWu"
+    "cwvofG1nNiRVsISFYgcGPX0YlvLCE4rEaCqNmCqG7momcv+lIvXe17YJoBIQYaHiRhda4sLiKHWf"
+    "olW6JZDAUAHSzGM3T4zHRoWUh5WP6zmKLhSFrnAkpHro4l4mlkRy419KJNEuY7DVmk+SpqHedZ2P"
+    "FmwfzzclzZVBMpr/nyd38pwPXts+sv/KOjp7/tb66Pnvr9gxZz09W5eBFvl+2SgSUDb1UGlgXdW5"
+    "Xpxc6Sga+SgfXJtYuTJ772N3ZHux+8uPin7z5b/5uv36zupfjVqfSgt4bXVIM+Y3MNS8UVn6uDQn"
+    "Gif07qFrFUTqac9DmhI8d6h9qHb8/kdptx0kd3du5FdhTXovOuNcoUIG7eU4BU4Sk084RtGMnzTX"
+    "0UsVhzgYqPs9Z+cdkhhbt8xBYaVmMAhnfGqiiqqJMgcvy4Oe8YM5Q9SGaI0IVMEc0pD81rH+La3D"
+    "9iQ5yrXXTItjRLxEUgtrjUhHKrxnj8E99yZqMfHFDnXQ/BKvlmszes8LOgly0+4qNx060j2BEnua"
+    "yPWXauECYEu4Yd+yNwFho2IgJ64hHL4BMXJMnAkgTSGasPPjR/Jsk8jQ2BMEbQVMMmDDduqctB6N"
+    "xAQxwcI0cqVtpW067uQRxxFcsWicE2cQFK/PAXikjJNJFYyJmLvI+f6CFv3+yzaPati2kMwY/Bvi"
+    "oaap5PsUnMsZXYE13/LARM/AfLTmjQt1T7eQm+ZQwSLMuHbgcsgxgyMONX5xqL2CiWc5VoIJqKUs"
+    "UHzQNIjhgcYnGMQRGH50PpkDd81CSQnbxeBCR2O0bMFTi+YpGdsNpXaG7TwWcSC0k02WSuI2c0y5"
+    "ae8OFD17PEwuSRZi944wdRbfyahC6tds5HQYXRzPvwJZ/FfVQNI5Hkyi4blHA7epuQfcfsgR0RwJ"
+    "UZsitXr97FB6vYqcqXA+H5wmJLDfsWUrxzfLsebV4fGXbeO3A8sD5o+lITzyTOe8FO/ljEgRscL0"
+    "YlldiQPtseNs9/enXzIz90dPa+/2t9pN+g8+K64sW/pS0ZWDLwlmdgWdC95SlfDC4ZqAxwXtXZ9v"
+    "jsibuHwwufvNjeft/lvTv/+Wp98cx6da4qhVJMt7fozL3ecQbXCXNDdS99KiwXB+oLAxyKGp+XvU"
+    "cXQcmx/jjSYs7FfIocn6thq1EmoJ9h3p9l5HdsOVGbUUWRZNFN0ZWCaqMxMrjEnh0dDxm3U6JSTP"
+    "B3xGWTkh0Lv1SNhJNiUfLcOinxasQJnobaU6jZaxFiC6Jaf2bFghYrpbANpw1a0aitwI0kHmULRa"
+    "t9Fxsf7QsQjic2GTaGcfV5F66YdrHnoqo+VwJW0xOHMERDj6If3tWWMeYos5xgfKEPFnttR4oKy1"
+    "Rhdf2K4PDJOhMGKMjhg/E6BxmZ3sz21dJxwlIsfuO6iNABU2NupizhcuJFxjwCa2FrTJvhDxKWi4"
+    "7tiDnx6aUhB/9KHmGLznPDWhobQxvHjifSwQSudxt+ow/fExDdgYY9sYd/HjQCaiiik+OIwt1XOT"
+    "Q2DWiJ8PAbCDiBPZ4a6AB1RV9HJTbF897WYxR/297wHSjNDa8feYME2dhrnxn7jZuwxIQCDRQ8CL"
+    "6fa7JrNj7wZoBy4jEBWAe9Po6RDd3MSCQuwRKqAYjPchAUOP466MxY7IlcIFaDqI5jNiHPj7yRVI"
+    "LlU/sQ2fYTx9XvJ4ifAJ3vKxp+DUA0ZrTVwG+u2H5wrN7+ObAa8Kw91Ou1SJYjd3TA0SMLp/aZPZ"
+    "a0rdcDbJtGB12GyCDWhs3DF+iSiKHIYQE9y9us5wj7fr7MMJOBCGZBzy2rPLCpc49en3f6sq7t7u"
+    "nfW9945SeObnzjrxwdPa4vGNXP7GCWzdKWDCwZeNsysCzo3rbUL4Yf9Qz0+W/DD7M+9vxr++3uvz"
+    "t/4/WvX23v/JnTaxdP+ISrwonSZu8rdTpf64R68BUiTuBkMCdRsHRuzpA99DKABHqcpF2uIGiFiL"
+    "NNAYce1/Gy38vOdJJXSUSxxp9x6EcuZYa2OMq70sKwK7YDuiRTUdoHa4qU20Gx7YrhCp6xVYV4UW"
+    "U0PKsAZd2jAWIAACAASURBVN+LU2IIOob1B06KQlcw5oukluKJfey6+DCcvbM2OUDAdmY8HIOGpO"
+    "ckgCmSjG4DEoq+RCE4ZH9wTHRji9oFOaLIBFc9L/qgpZlvuBS4vhLieKpAK19wIgtP6YnvvBmb8U"
+    "QrjkgVH2YkR856liFZh6LQQThwk+cbw8tBS2njqR0CIsBoOy4wkxpT3+SjhS0Q3AZSZngDgjcxiJ"
+    "uE1K4l8BEdxwZP/c4zuUCHHYcFC5CWNxRDNH3MFgqHDkwMgTbr2geo4pOzeT4tLp5bzUcgACjMjh"
+    "t70PTwM9t+ZBQf4c7tX50vz5XEmfO2O6bLqKiL59g5XpEtSNsyKzkVGb6zWDly/CVvG1YVTplrW7"
+    "nqiDfYACHHAz4lh4CkTXE2D9fLGe+qL3Hja0/ULeJj3FBKnvHlLGzirLwSY57/aOKLtn7TCB8l5g"
+    "DQ80g0Axmv722HwyITzwdfPUeGLbOnWCNnqqUsMDYgSFeOIefDjOPGOGDhH5xqniT1K8FZnErf33"
+    "AsuYrT0lYTjzljVd1J8zzgOzahx3aeALFpZ1A0hiKTDPK51ZOrf+hA13lmd2kfD/6BVJ4cvJHwxK"
+    "ubs1d+9vSpD39ytb75ZZ1VVhvHVAe2HVw2SwaWDLwdGVgWdG9H1hebSwZmGfC5Vcuox268+LntnT"
+    "s/cvHlP3jleHvvO9envLOuUzNflMJJ19WnTswuBNCir5Oz95BTaJrNaVknYE7jLgZSuWrQenRzwr"
+    "f9KFXBgRJ3+oGBXQ20s4j7KnoKxudyDTwUjwKjVQziQfxApq9yXSlmBlZKiyxeZjbTlRv6k0GKHM"
+    "dVRmPd1rCA15Edeom6JVCjGSvdryJQQcMv/+jGvgh1NREaCfK79tit4or4bIf4LWKPpU9hVDRrhh"
+    "1Z8C2sTa4DkZEUg8kNttA3uoSHuGHCCyIcoerfmmZJq01rjATfQGo0GOBZHgQU2Kd5vnpcunDKA/"
+    "cieVWPfPUX1IQfu0D5eFWnfcp8zI2UoSJFrucWr8UvJy1SQPmKdnFgN58rHn4jRJJ2sUGxT5/jyr"
+    "tWiaNAqDWLvottF+AGglQY7nk86nNGEqtnaeayTYtO/rCfPMaKyFbStd4cZx5nQ47SojM0wIInLN"
+    "NKrsWHnLj0HauByjawEWr47LWFRTywM2DHUaU/kixmx9v+OaY2bkmUoz51Jn3T2NgIu2QM2zRs9e"
+    "LFtMI2PSL2yb7YSemUcmQA1kPPP2K3v/BZ9Ll5YKXcAkle0OA1VW9xOWFtDQBlAEia4+98hOi7Dq"
+    "SZuQ1OhAsKNcdUeryeuPF2WuYEa/TtiPuR8Fb+VHhFjDRotFxho0ce1XyekIyUeMab5POF+uz5bD"
+    "J0vbZyvtmJdtCXMUVQz+EtC7zj8/3Jy7/42DMf/qGTG3/kX+rWy+TB55aILtslA0sG3r4MLAu6ty"
+    "/3i+UlA/dlYHO4/tR7P31n+8aP37u4eOHa+vZL+9UbumtKJ1wVELzb6z0nfxdSdUqnuPE/45SGJu"
+    "ik71MyJ38XQCUvqusTS1tSmywbcKhO4+p0kVCCMLEj2/6WR8ZqQ75KjC4qwonN8sR27QqK6sQtaW"
+    "ALpyDwIMautUZMMeZiclRTsd6FZDszjQsT7PxjOQ07bbdpyKlNBRH6zZz2xpe+fRYZLauWLHz7aQ"
+    "5EJGJPHY1qTshl2TTd5r2xBjy7CVNt9CNimcmwiAhALczkHeE4lryQ68Rocvc1sLxtTr6C6UUMsP"
+    "orC8MGfmHSDeZsbrgi2fHZNbEtav/evNiLn8mNY2+fgq5RfEw0MTpMywB9Q5e8dxLmKpH98JW6uE"
+    "gs8S1oKJOfiT4DkwjYyR+oEFq/9ComJHNL5BBrcT9tUXWjaFaHh5s72pAoYU1XtsoOeuKxs6g6zg"
+    "eyVhG1fCAGGzVwQU6WTI2OQYJzH79UG0H7CRP8vHlRCwZz8dmOWMfzhxG1mdceQcNV45SORS1uxh"
+    "Vv+rhFb2qF6pgr2nKRHU1HmG1kpK0XMbywiG49bJEDYcVVhOqBfr0uckzrfxJBpppeq/yzD+WHqb"
+    "O5zQKxhZkroWBTjd3wwxSukonIlTe3yuk8G3ZUNmXP1x/lW0KJT+Q0dz9MGDiPxbKqnsZauMXOTB"
+    "4I3vwQIK/x+53e8lnrM3IrfXPL5rlfefyZD//tza1X/oVuKRFNryHjzoIgm7hslgwsGXhbMjBKpr"
+    "fF+mJ0ycCSgXGi5ZS4OX3s7vHN9/zi5enLP3uxO3ttu9M7tnx+TgXC6qBbYPiGMZ1wcwZHQad0Fw"
+    "gkUsUoZ3aJ+5xf59guQjnR03zytzQbhKqYoe+xSGpIB6JleLlIwQu/ccMVIVUFrCgKy5+1KQLy45"
+    "vQ6EsxHsXK3JoNE4oWmtazfBXbxtMmyjZG3JifYvTAkimYLGYdWTa9FDDiR+DgksfyBh7yYV7tF6"
+    "3x8NP2W6fMxBjbeIc/tqFCMDnJgslqGO6GXGM1zXv8FdpMFrHI1j6E0uo5k1XRKcJ42FKZC1TbRl"
+    "5NssYUs011rBCSc75YYRZoCxIrfVjata/NBh8X8xtkoCbnCHccuOAFob0py/iELEzteYRTtDLQvn"
+    "lY9tHxeyHaZybwIb5bTv32z1dSJYcJH8O2CwGdKZ7WD12eIKcHcUWQXZYFyDhu+w1QxnQ4ItgPPO"
+    "nYR8g0jVEmLkvCn43bb8vZCjqosUFP43403wLQsQSzmg3QL9oYA1Rks4qv+QffttJxf8RiWGQBos"
+    "maHWqKYmKhbbbkhmi8Ynh/a07y0RJQWUyziCN/ep3UoiSZFEd+ssSJVPKYEdRw4htCOBN/fSzBlu"
+    "b8AY5fl9n7M2/wORqjB2ZbRC63luMH/unhRSL0gtWOZn8l49shMaE+dtlZV59rY2wafhuAN/1E80"
+    "KQhZoepQfdPMacO9ov2wdHNN409JehcJslnwNGFt56tZXObvXE766vf/2PrZ/60KdWJ/rMt+znOT"
+    "LlScJLWzKwZOBtzMByhe5tTP5iesnAPAM+L6sCOH3imX95WH/LJy5f+8p7NrvLf081me5tOVcBoF"
+    "sNdRLeb3Sy1UKvywYXLpx7RRk0geV0zPlePRhFsAyFHq2F6CKnxyjM4LtwRKhb+oii3Psu3lwjmJ"
+    "WCycWQxm0eFs3vINeHr+Jp6PgDNHjWtYHYLAnRKV6E6BiapzGy7PSXq4j3Y9YYZ9Tie/c7bo2Ln6"
+    "ssKQeLZJ+we/UKjGbAb41hHHmKIy1WXBRiB39ZmAa6PcYyOMNvuph3HODQyGOsexuiBRO+CPjD4t"
+    "DygWsxSJnP2guPWg1h5Oe573iNa574GhAG89oteYs1uy8mbFNCtmgfE/wwNQVm9PCvwHqnPWqRp5"
+    "dYGrNtADpubWWghmTLeSz1gV8Rth9+nhCP7UlwFpTtGwu0YAx/2l9zNGcudCNH7pFjjrtpKJ+KD1"
+    "H6yPQDzoC0LDMsqojzubEqBTiANNtRFACIZGrzCpDYgxa8CFnbG8R9E287AJaE8Ne33zYd8IGdbs"
+    "dkG+ZZCM8lqieAnDdcYxgZe/ZUQulZBmrjo2UQKVhWliJUnpW+uGNumyQ5Mp8Lr8yDdIU7fkAeSO"
+    "CxxXwXbpEBbO+sG588G4ioxRfUkWzOFT/8BAEKpyYDlqkY4VjX9ujJa31hinMqvYKwvuPBKxZnDe"
+    "d9nkP4CDbewKcHDjZ8ADlOMcq2ZawPsuTIEUT6RywOhavjbK+FYnjKqa7M6eu6Vht+A3V7/QvXbr"
+    "7yY9ubH/vpo7NnXrVqvdEm5aUtGVgy8IBkwGXIA+LL4saSgUc7Az4j89m14+3J9Wc/ezj5yA9vd7"
+    "d+fX+x1q8X6ItT1id5J5sTsr5u2qUM52WduL0I8LuvovqEreKKk7Qw96p2KLX06QgXAj63k2nJcV"
+    "LvLuZHkVVXGCxhOYvVRvbsK1d78ijXq9DIlZcgh5M+1oraxYaNDlh1wrdJV2mt2Raw/SalALRISp"
+    "uBxdAqDdV7tNDxmCJpPq5cFCasoaaOfRAPnUOqyYZx3dhrBRddMuJ3vVWJdypzpVKLclVy5NB/cj"
+    "K42XNdRzMvHQKI/eFD5cBXNgoUXj/A6TyN4lN8gCyjDXNh/yFgwpgWipxt1oxJEBx/zb7osaSdzi"
+    "DopaicyADa/7LnL8sZ+ADED/uJWsfQe0PJHqKVH/XsO8gdZzqOpHgVR/tYfpNCPXk8N+CwKMJnvl"
+    "2yfa9IbWS4apuJXYEmX9IDyzGwiCmfwcVMj51PgOoxePiEnOMAkxFiyLprftSagHRk/BlB9dHrBz"
+    "lxLlFCjkf1DaYxOYglbd2vUYT9GoFEvAOlbECRrVxFk51xm13jCQCM9sE9xuEnDnFtLrPXruEQZJ"
+    "YazEmurk0+WMUS6VVgkk7eGlsENcnYD3W9TyS5PVw8VsvQtVAqjvbQ4IHPgwa3Fj+Sb185Uvza6l"
+    "V35DN16cMHh+c6CL4qJjQiDmZ49EPhSppGLNzkQ/5iH+ueMFGHrnroRb+xsMVnitEAJ4vbvKag27"
+    "Hqy49kw1fh+Ayy3xxkgchirvb4jobfneLZe1htz3evnp699ydXT//bnzi7+eKX862dvDkVTyS+tC"
+    "UDSwYekAwsV+gekIlY3Fgy0KdITqon62t3nnz2hV++OPquH9h95R+/tLr81y9RSFE0UCjwbdg68+"
+    "rih/r6Bsuc6tVXVbTmJwpE4TfsXJhIGGxOwtBtR53RN49Tf/hRDtE6o+AJLe9Ep4CkCEuBASpXot"
+    "jLbiodmCokhOsxixMRJIKlmQgjqafQAcKeq5oHzeNW1JhrCfoxB/HKX9Fo+IJ9SpiU2/HFTODpmC"
+    "S+C3mNrcO+/BF953gpWuInWWcxzOoFGr3ESUcAgBYO8B5r65hRqDZ04OkLB/Jbd5Lm3XDJ5SoP1g"
+    "QmP4iDBV+PU3hKGcg2a1HpkJ8ZHZPJL2WZ4rWf0JJj1GkU6faz8UK2suNEV8BXfLct6XVo2tN12i"
+    "TvWcOvZHy2AECKY1WyjjdeBA4b5mgTekUe/2whdpAazXG1PFSyZeMYqbEy6YODGQwGvueYFMHqbQ"
+    "0dEdBNAuMrqMjFyeiqT25ABIvIsUMxbUhvxFYz3/oZRyIENJOD+BYbZa90k//4GLdYSddc1rFiDM"
+    "kHG//9H/8xpYePKWRIRCZYHfxLbrBNRO2Q7RaOaXAlbDjtFWo1juf4Hx0kaAiwcNZ25E5Zsx3hKA"
+    "YfMcbBdn4epPmJIRiGM2xhC4MQNuQbA9IuNPWTGyiOSGzz6qpX5EAUtnh2zT5A4bUl8l67aWA+cq"
+    "iMBoM05igIGT9kE3sVo5wLzduWQk7esfhTN89PlOJZPsPLGDEiwKue8+QaI5HGqzyvQEclW2LPo2"
+    "/B9Ng5QEd+YQ8H9CBGvhl0rQUdvy23vtzefuzxr/ulzbMf+29Xj7/0Oe4K0VdaGv3+TBRx2S0ZWD"
+    "LwNmZgWdC9jclfTC8Z+MMywGlzs77++unN5z55994HXtmd3/5LJ6s7N9davFGMHekEvF9f6jzNiZ"
+    "gFHCdnnWZ591zKfeuMbzVS0TBKDk7eatnqlK4xPBfnLorguASyHH54sYAOuvqnKMAJ87SB7lucIC"
+    "DCXs0o5quvaqGLuhKzD+6jf3QsvmKg0HQBhI4eAqM4Qo6ig3jshvZg+uvTscUYGaGyZ+wmXQPZZ3"
+    "M0Bkd07JYWsq3iWyVVu3jhijHJ8rt5iVMlZ0Gjk0bQPMAglxMqBRcNtgU0NqQxhOWrHRqIyOeufN"
+    "uj9rYlw9jKZ23Qk784CZZ2tkW/xuAi4y8wkYBEqBQBEJ135SGgqB3CdLSzpHLSe6Rg6f0A85kTxK"
+    "NfzN4hoyYL6cy2rYNPUZ7JQNM/Cww6mTWN9SaFP99HoYufOOK9xSBYwx1tYDV+59q8UgNjzRsD2l"
+    "NWEwgLLufZgtr0AYZPNMk61xk5drOQMzvg9lwbX4nhSSkh70rGz8nSQN/zRazEhiwwekSPjro2Dp"
+    "0ngj22TGKMXxbsjUEkz1/N85hzZIBFRvbw13NsH0SreDpW2xSZOWiaIVofgFnzlUKDaqN/DjXmEx"
+    "st6mNXdHGNydsLDBOPGR7z4uCQxTPVOepB5Bu30Vn8IZvbjaHq2PGExx/7UI60P+1YfJCyCHkFxI"
+    "bRICpl+CktkdANz6wrG14bkbMMeih0q5xnODwQVt6A8xtzkvdiDlPY0gNMXgsbC9ttIegIC9X4su"
+    "/PyxUAM+AXWmlIj3xnnhmrLz52vAcVWuWaLt/oedBi7nB5eblfP/8bR098y49snvzQZzw53H7Ji8"
+    "HSlgwsGXggM7As6B7IaVmcepQzkJM2GdAp/fjWl9dPvP9vXO7/3685Onz+z54cvXHDV+Z8uteJ3r"
+    "frcOrn3VNUKCwpqyg09MfZ25WCeDljG5fzvPHNDws5/sIRDaGSM61koQUSpuwIl551q0hE3lwVFy"
+    "wwqDFSROCP/20Jl9xcwIAFTzHgBlcgbTM+IUcPUl/1G4samHClT8kBncKUBW4v+ligdJFN8WsgwO"
+    "KcdVzIwhItxal0ykf7gn/GCdE02fNIeuLax2QkI88FCzcDiW/T2nuxhS5zBTD/7BkjDkHjciBFPn"
+    "zRRWsbWC318KwNSbLKgYhWsdyVDVZokisdvA8uhSbkksEPD738T25CcvGJi+TC+uUvkIhQsOJF+h"
+    "T2ZFbyzE33RSD3WcwpfmFlOSPB8m3yk/zEL/taPk6+oxNp8pS+refpMZjxOUVtyUneC4sMrdspwA"
+    "/6YaXT848d56v88rFnRXkohXSJD/34bjfEs56EZibLbsuV3XougRcIzRXYAuginhzEX3qRQ8ZyIo"
+    "Q24VqkhvYAPAEkLhjtP8+qtNgUR/6M+CXq504slA+Sx9d6PTKC5cCZjjP769ctPECBJsF6HpTTpv"
+    "rKetzyuCSjZ9XoE32w7hMuLaTa9+RLBAXW1v2agH1yYZ3BGTKhs62Fd0m2htWGF60frejQFx1Wk0"
+    "uMoSNQh+cI/byyyRYToLFV7HzG5NkxyW/PhcYBDmgw1Gc+9PCbGshInlui+b259eZUr5/b3f706d"
+    "85OvvQ3zl59ts/tVpfv8jx004KdmlLBpYMPHAZWBZ0D9yULA4tGUgGWGdw9U2fXfh/Lg/f+KPnr9"
+    "15cbW79yeON/vHfOeLFnOclLNgURlxzK2VdTJ3ASAcg3BCN8e1QIoFtjZgnq8yqEdzvaC9CxMKhi"
+    "aYycaaLihgjVuL2qb4qPmdcxccVvGGkimLqdDwaoiUS8i0zZhmXBiSUenR7CJm3AUagBYHeO678b"
+    "Vhr2YZitIMJToZsZ+igwk9vCrVpEBxijQUiiM3EbgiAR4Pw6ljDAuYai68LtSg0tr8+IIT2U4Ow7"
+    "dACw+odOJL7JZ0K8lPCsL2uO0UgHOkKDwkamLFZ6l7Ez9BJqv80TyH7vFD9JVvj1uy1BE3HkVkCU"
+    "geoo9b2bApFiXi9xyw95XGScnKuDTkUKyWeegBQM3RXnL2t1NAAVut7TGEyiNswCMXFzIetsWldT"
+    "7ck3gfg756JX6ewxa1H22v5caxUyLscsyxDxGddGVNNuyVacybODr+shen8pgFAyZzfLJQdr9jB8"
+    "itkMFrg9BH31oiSN62Ss7DchCu8SYsIGiG0RsTvNeUIPC5bUNUv9+4YEiDLagyB3hw4EEvkZgkN/"
+    "yFF+QJ3/SwooicmjEAUCd3FwTFdPF5HvdtyiVtPfrRBQR9RulyLHgEnZgysv/IWhOemrfE1X32qO"
+    "lRkCXD+3RI67VAr/dr3qCRku1gTwrzYxBk9AeuX5vQDx0DPuZ8lTBvrHD/fo5TvbJu3zjs9jd//+"
+    "TWN//U6fPf8/dXm1v63JyePXYqVgW2tCUDSwYewAwsC7oHcFIWl5YMkAGXySoMjvU7QDdvfeDTd1"
+    "bnP7p97eKlzfYPvnm34dZLFWk6yVMW+ESvz2Lpa8k0Cs1Z9AlcchSzyEmaMz4naIqHtJQELgJ87m"
+    "csGelAq+WKRccpXXKtHhp4aKnVyf9o3LMnmoS7YPTVhFa2PBtsCaMLH40RAa/9NOwYh9uYIk9y0j"
+    "S8Np0Jx4uQWvuLQkmGUVzsuMDBn7nxdkhyxmfffHSlF+zmC92CUGfKiMpIF2qodnMOxeMvYK2LxI"
+    "TB1Tr7LgPzHAQncoOu4dzPpuOb7YHsorpMGKR9DyK2QUXH81DutR5ewkSGfsbdYeyIjGIeEgaSDg"
+    "SDQ1LOrSZ50TmivPC1rBjmiV66TbG6NpBbz85GQETcwz8JURNLyPHbQlBxI/anIx6Zecv8RC740z"
+    "Fyf447t60fLJzkf9KzwwhJoOemdXrf2PPbecNrByv37XDt4RKXh15otPxATk7IT+XCso2DfuUq/r"
+    "UcqLMmmcwwtmKDeXADG5r+By1Wm+19IlC39HxsmTNhGgQBZDhw9PBdCj5+24MAsNhBLt5EXtKhNV"
+    "F7q2KnFlslEkX0vWC2gPsE4XkyBscKqPpj7BzjB0dujE+mQkt+xNM/rXYY8rh26heGk0ZffAtPiN"
+    "aHhpL89M5jRHWO0IPXW7R1Q7f8jpyfBBLmDcO9b9s/ro/Z3dgeP/7hf7B55k/97aOjW/9Ky9plMe"
+    "dZWTZLBh78DLjMe/DdXDxcMvDoZcBFQ53t16vTe9dvvPQPN9e+7scvt9d/b7+91DupnLD5rJ3O5b"
+    "wFrndd97utTuo6abMi4aE2PuvCgGKEfTVkI5WawGQKCITEoBBwA1OtZT2A5WID+ZLrvQXYiF5KLi"
+    "zU72/Lg5UCFp+i7+JRCm2HveW1jwvIUYhIA1sDI6biR7BEKVyXQgyrTfzp82bgsUCWCD7yB7b+aG"
+    "zN86g34TGyPyZbMnpW0NhiV/cUicRTab3SB4YM5HM0jAxgBxwzJDXb5B6+NzXFK+DxKFnErupzQY"
+    "c457FOfrY+9scfrvTkGA/U8qWwBAghjNp6EV9yqM8gPOgx+bAJ7bk6iQ+0+R5K8qcefMtEDuVSsd"
+    "6VTcnimqW1t60S4ljPMcDVLFq4nR/G6YdbahFDehazFwH30bDaMo5HMB7LLyOWfiIh9sRiGfG8iK"
+    "09ixAHUWHTn5mfWIAYvAXba46w0GB7fgugcdjzGHL074PxMSIJMIZDHkiQfyn03A0RJMHxRsLIN/"
+    "AV/AziR3IfLNnjyzvESD4NUD5gJTbJUXy3sdCLFw7zEdvDx7JvuqEi03HYF6uAHDsspNSN/Rhl6J"
+    "dfz5PlWfhNftDHNK9M2WugPrffMk6f+NL3DeDOJbYaJ7zcVi1feCkAQAhHXM3TIzi6il7j3M0ROj"
+    "C+I/twrFOHFnYXJ5d3D+/95NG7vvsHTs6e+p39YSP3AY1H6ixtycCSgQc4A8sVugd4chbXlgxMp1"
+    "I+I3fr9WtPfuBn7m5ff3l7996fO9lcPq1TMrWY/tnoDK1FHV+jn1vMoPViJkguEBBzcWD2H5Lk0q"
+    "tbfCghglDiDCB6p6LEAtGJHMVOuMhR/JjuvtW0oWCRDoJisu9b+dwXEb38ox/Z4BY2it0kauFUQV"
+    "cdNk/sshNJsJ05hvEDi8gCax065aN6V1uDQu2+9lIB1cjYgweM2ogXQtEsXX1sOx8Rj271kYc/MN"
+    "QPjU7o7J07cgCWN96WniXYXGmdMvtSnBTLGQRHfcH2Z/8mAHHlWOZsTlUffyExz9p5qQQBech6eK"
+    "tx7KFA5prbewvCkioFabUQJC8GejoQyZEbPBoE/bet/kIUPCgJiSDAIjpyHprJ3AMdbF/OgQCsN2"
+    "wzZugmvueIgVixAxiPOo79hEGANh1fRmq/C9f2kcEHoyVG5sGIEQiUto4F1JgTAbnYCHT8hR2ACP"
+    "aiG6J58LsvAlrRn3FF8NzDVR8OD2SJm2Yq+vLTNJOJh6MBBv/sp3ltDxqBGNDPsSfZfCDW+PCYO/"
+    "7Qc/w4Stzs/BfReGcpLEpW8u5pX2+AQbGcBSwEyJRP0Y1L3s1Gg74WPyyo6IaFAQ3wAzCGxdTqy9"
+    "ESk323RSQsF9PxLDpGN99xNn75Yr3Z52UdQ9vCkt9AQgmr7MsnfqKAuzrO711crN77648//7HvO7"
+    "v+vn920F0h+cyuRJe2ZGDJwEORgWVB91BM0+LkI52BnH91Cj7bHa49/c+Pbr7yo7v9nWcPh8//B4"
+    "fDxbFvpdFJ2qdqFQd8q59rHP18gc/d/KwBBUWqmxQSTqhKAwnmC0aS4ZQdiAqDgiCVxezkDq14Ur"
+    "G8/aNISuurT8GwuHjR8RvIEnOtoX3fEpk6RjKF4WLCxQ6aQo7Z5mpIsQMdBjbQVd//2kCscSllB6"
+    "ua9dWvsmmiGlaC5EutizHjaTyDiA+WEr2DkoB9KX276D75lrWi50tbYmPkuuyhj1/MYyYz+L7Rko"
+    "kGw6p4k36lQkWvpFzciVW8CBOxPYPhBkziEaf8b/8yLvzGKZl4ZwcaynE5vvusgJB4ymYsWyp+EV"
+    "DiYw/q5AuUNNNUf3rmuR9YRWoiwnfoak6YO6WUHaCZb2tLrudBWjFfdoEwkhWdH8lW2AVWfOiNi9"
+    "O1IPCVtPIjU43lZD55S4xsHZMDLmh2gp/mIAS9TWMMu2rzwTN3xBI9W1N+OL7c5MTkP7SZQWIwRV"
+    "qWwzha3ti/0KGIBpmHfUjf9DkpQSc26Joq5KOSaz46SEWsJnl/FsxziiCxqZU5Oj2mA/xYfBkHHa"
+    "7YaecJYaGYuUl0k8vtq2OweZD9NkP0oSknWfQP6eTGDhWtEkoqOArT8KP8Ez9pAF+NXYt5iCxEeV"
+    "hYuj5nGV7JsWJL4nUM2XMcWMs+GcO4XN3j1bRixb4PbM23Py/HN2sy95JwoqSE8OpS/+f6nZwXf/"
+    "vxd/+xHzx55lv+t9Xq2l2M1EwhtLQlA0sGHoIMLAu6h2CSFhcf8Qz4hJ3z73p1fXv6xEu/tVuvvm"
+    "/3+tHzq93nv+dodU8FDifs3LLD78/5Std2m+Le72arPPDZftpTuEISlosExChkvMATZ++KRMWOay"
+    "8xEZaktcTzEJJavzGdgW7hcUERPNzn4RpXnS5gNmUfnBRiZgoXaenwcwwUIxKYikqG4WcxKOcoel"
+    "I9S+PXRwAAIABJREFUgYS4Yq1in3emjRUdVMkDNOKzL/ha+iUlvsspNCUvTBeKlTtRjVl7+nbJGI"
+    "0QTxjFX22tVDZRkXysREquWjp5Qo7lm4hiywU0VLeKRt9jbbzPuL+OH5rjqX3sS9cQFY+FwKp8aY"
+    "z7rAGcE3yrmEfCyix88PtKFz9cbx3xwcBO4kqprPcXBr91yhvTxa6mXg16PuKL2AIFd+QhwdTX1E"
+    "fd+TVdYzvihEoJaymTIxkh5PEzPmsBNBJ75OIYi5B4IGM5DVx4a4uv0VG3ZCDDyPGILBbAYR6lIL"
+    "4XjMhJacQpnm1BRsx4bFBJaW1bGkMEOT3xZ0++nT8PBXRLSC4wEi8dbKHsTc8UPgJug2LFc/yzP6"
+    "J7vRoI+83LAnLJ8rTlzQReQ3jsFSNIBGSs8r39czhGwSE1jM0a5spb45AJH0N2KnloXzt/uu+8Fp"
+    "HCGnB5nSDnzq3QsAU7PyOgfcuWml2RmEOOoNSJswVnvPI5i6jJZ5StP7Tksx3gdc0vrBLurxXCx+"
+    "QRLeRaN36TUwxJBlzJVhpq3HbJODjzRy3oCNI+SQY/dLysjt73ueNnvuNHjp/6+M+sjh67I2Dpl2"
+    "+zWLG8tCUDSwYe3AwsC7oHd24Wz5YMXM2Azr1cuTrSom712PO/vL28/V/s9c2X292//tr10U4snc"
+    "BnhY5LSU7gornscsXCO9ksFDhpw2NcJ3eKBdkIRkm4AOId7BRPOIQYgq5LPKjCyPRsTKZWUAViWA"
+    "lT4MUARuj1GJPgI88iI3SPFW2umLQHveA0ADBqsZGudA2vPf/EJ0YsWsKFm8IyPQVrZB0PXkkHhb"
+    "rgYt8CAg9z2gAYBbEgQiIiCjYKKcUSWC2YKYb1ORY+74aeQSKdeUkmDKvYg6Z9Oh47P8KgWOYKnB"
+    "sx9AJvJgsyriXfSCa3iEBnHGxRisiy17NMYmJROzNLaTb/5Rg+Gc174k5Mk11Fh0HFBPZehXbznG"
+    "PyJV0XuMiVL3axedBspqiIaWySWLFYQu07fhQc/mU2ohFXlb+6ehVU8ABFpuzYY/yrorkw4Sab9P"
+    "hsUvmPvyJFO7YkkNjEADo+0YFDu1+u/CiW5Q2aPM5vdaUYz4Ib4fA3Om55vnH1ii8KSa5nNiRnr3"
+    "vRwLE2u3WxfQRRR0+eJ+r1/HA84xMPNizU3RyP/HE8fRwlL/jofA3ZvA1TogDpD1nSj1AE+zmU4w"
+    "NzkiI2G5RMOrXXWPEme8JniJzxrKBNjgLHMuwkH0i715ilAgYkk5XTq/kRowh+ucBoLaAcsZWD38"
+    "c4OPYLROLxgOdy+4GPZIMtb0i1vAmaT8mhp6EPNu36c7b8nEO/3jhGZGhOS2KPWWwTr7zcrlb3Lp"
+    "/8wtmzH/zE8c2P/PRqffYV3X+ZuK5aD9ayXTKwZOCBzsCyoHugp2dxbsnALAM5k+tUe6zFwa3V2e"
+    "Pv/9T53bv/9fmrr/+nZ2eXL6vgUQ1nIc7dVAW+crfe6BvMRO+rWBQLVRZYaF4AuGgUNQshUMCTvL"
+    "pABx1cIWiQ5ZJhvIndoFvWhOiCQ32KX13kaOTmRSU+ypAXAaJGRsUIQOapw14EFzbQKU5xxEVKug"
+    "CmuKRHERQ6JRIqEHCDWjZNHRdkCJodfA0QSX6sadsQh334JhQUMTrIlidHkqmFJfh82UfHwVLHhb"
+    "LVe1biH8j8uwkTREdAwd4M85mFUBoBYVjtRfbQ6ElWzF7Ie1+StuU+i/7Wjza2SdN87rrvxUWUhe"
+    "0q0jkitrbai7kSMz99QOWZ57Yp0PjPHOAjOW+8xuB4xYQXMUWE4i+EcG6KT+TMgeembJWf1ueYiM"
+    "mGnvlnINFTNPt4aN+cRxyQn04qYiKWSmLOwJEoxngUETjm2gksNAUD0QPD85YhQrNGrKWsxT0qa3"
+    "1Lkn2xYOYCBdsFVn8+WkoNXqBh0pthmhF666AWGelhTwT7F2r5ExlvLWBt84CMf3CrOcYeCNNvWk"
+    "jS9vUcwkZdrbcUqyjHTcwR6kXg4LtTvBC9xWn+yEOOuYpIsRfU8BMFS2KOvgMOjJ0TMW9alDuDNd"
+    "kYfnGM1Jziu215IQo219TY0vBL6LxO2DrYzRFNXYbcUsuzlNmEGzvoMOd1RU69xkjMBCItXcrdXl"
+    "7/0rWbH/6fzp77+E+sTt/9e/odOrmED7xixZ7Vl82SgSUDD0UGlgXdQzFNi5NLBjjF5iRLUcHtiJ"
+    "uTp26f3PzAT+wuX3vmcPnbf36/unhxc7gUL99+yYndp3sVrr1AS3nTSBQBXQCkwIDDiR9TvgpQhU"
+    "Tn3wWQdLiSRuvCDBS8sz72DIBEGtJceYt87yVvfDRlta6aoIG+PUnIYlOkTPiNY/2om084k8uOxH"
+    "TrOm+gVpNg+4+Oay0x/e54AWUBgYEsauFO+MFpFwn5PkqNmQUKsGEZGMfnfJYUlMZgieb4mzdTtR"
+    "irD4Hw55+uAI94LB97U44kSezidZzWvJosW3RszJNHZRxFmn0mZ+pLsMmqaDUUMcYt6gUYYvrDdl"
+    "RUSOLHUOxOrBkXbTpKvN80YAKqsPXCpo4DG8EDsJG3P/htgGKHz8RyLLvgRVYtHlXPNOiJLTnQ8X"
+    "YlJnxNLGhVQOkwF9jAH5qg4tPcTjO0xy0LQVO/fffzVOxKUDxFNrTGdMzQ0NUfblrHzx9ygC+0Qp"
+    "DACJE8dFy2a0FtghbBvHKg3r5kHiNrmsUlgImKHbfx0X4acZoPfIqskHCmYgxichcPagEKrhTy5o"
+    "6tewzVV3dti8MELKhqxkyszLV//Q4aMvnuKMvaF8u3SzY2QQzAxMPakWMRRGtwPJb/eMbzr17xjB"
+    "HUwiQ3dMvHRCJC3U7tRRsuCo97L6KrHNhE2TNU5jRzpwhYzFkPFQTA5PWe135yyIJOctjXn+eFHE"
+    "jnsDtf7Xab18+efP//snruO398dfye/3O132zXfObajmJ3aUsGlgw8bBlYFnQP24wt/j7yGahaQn"
+    "k4Xh1ff/YLJ7e+9cf2d46eOJz/q/9wvfryu/h9M074rjM5R+9SIPDOrK/Acf6vczbFlQsVigOROf"
+    "H3jxBDcQEwk6dusJxk542CZKrTujCRrIShTzUQ5QUtW4qO+5slmq19ikrwKVR6PNMSRIq0KE2IZU"
+    "vkLjKzT1ztM67gIz45txVI0GZ2qjvhz3hRrLDQtFMWuF++4ymjMxDUIp138if/v0qaRCp/nUtloH"
+    "QBtKZ8Kk8Sl+jMDEQ4yJtfDjqHENw6o+BKHrqFYYZmsdkmcSEbbOfgiuOyN/BnikacjdH3ASME7a"
+    "MTxbZxxQezEsT98BWafYLHeJIJZdJUz8bYt1Ph9nEDPfrEOAOkX7rJl/gVe+Rl23wAJBxYKTFEUn"
+    "F6crKYml/xdKxIICe9Kb/pa2sceFk9eJhNkhfXMOrViXBwo8Sw7TYWpvDiJxxweeZxeylk58IMEW"
+    "cxFYqhvIm49W1CsldkEozz4hyMvExSwPNGELeGsuQxR5vMR3yzU8jBbVX7VQPvRpTtmpWHuKj0R9"
+    "wadGh+w8JakR6vodBk1w8nv9EsfAXfrnmRmWtqvOEx8KWWW6mJET/01/aBh2gquywr40N+Yw6B3G"
+    "2AfR71eq9+40Emf/vdpRaCj905ffwDn1o/+6f/xvHjH/g1LS4v+k2FBCOIpS0ZWDLw0GWgTiEPnd"
+    "+Lw0sGHuEM+Azvc7e++fJweuNd//fhsW/6W5ebd//M+cXjt3eXelr7xK93a6kM/Nk6neRNzqLIFY"
+    "OLEAoGlzHOJ1dBCl1jCgsKhGrqd7FBgQBGbmPLy0huL5N+qggroT4V4SopYPJfew8siVIevo1O/F"
+    "iuwhkuxSj0mU92A32rVpE0NK1knckHhviIgllSTd8JNbU3sY29mcmISWXggEUx6tZYGpg+oQ/5kj"
+    "SffqvSLx11GGVMX//k3nv8sVIUOx9oZP4ij73IoTbFbBCAql3xC0hi0VUHtIc7Qxh+YnJeLINkjo"
+    "EWYw+utoN0JYfmD9awc8UXyzAHimI8lAf3J930JjtzTjzAP+nZ78h5PBfEOYja0PVmQHbuUiDbx4"
+    "6rZRwr+snNvDegnVFBs1ithhrP0ZT5IqrvQ8lzMAl1Ltnrzmo/4NpXfECv9iGKJgJ/lhmCaMVph0"
+    "nQdJD10yvz2McN0shbA5+wY5r6drT27JAEx44gKmI1L0DcR5D50BtJ3ktLJNaSIFg3BioMaNg0eq"
+    "FxnCMNFjYCYImyHwjo+scP5IyDXmNFKlvotOg0zb56ILraRO8B8pq/wkYmcUeeMfb483NTAPidq2"
+    "jFA1QP3rDiM3Hg5Yo3r9XOFDC+Wpk3BbAZnu1KfrzZRSJ19a+mIL4Ayc8TaL/VF1ruVi//xvrmR7"
+    "9/ff0Dv7panZ7zRUvc8WEncGRpSwaWDDyUGViu0D2U07Y4vWSADFA0UChc3z5282v+mT5T8f277c"
+    "Uz24uLf+fk9PIxChjujHQJRgHgHyKnYKMY6BO3Sg3qA2NBpgCkoFC/8CkwTIfdfWSQYFy69FqWbj"
+    "fjadBXXaBzc1Ca9t01geIE7+Ife3yLnVLRDhXbrys5kRa9Oi4MBTT0wKwqp2m2Y/mON7E3uO2Wnc"
+    "kytiUvQ+y7pactdpo447tr+/iEQGx2H8cnPbEZIFf+qeeBfY+ZIRLB8AHvOG1DUolDQOCVbTrpeo"
+    "vyaO0HN5J1NPEusvhADzv2RwptxSBXIGtAoMTfPLrdL8sZi1j4eYMAtbpVU3K2XFCo+Qt0jO2BJU"
+    "yXZMfB2M1FcFFtu3IgJkM4pujWM18xmlHRJ15/6Yj94xZcLXpFM2LnIkEEByX71p6UT+RBEmOeeE"
+    "riQOmql2Yf1dXe/rGKmTU+Z9aUVr9y9ch+olDz5W5Ah56G+NHPx74yOHzjEJC+b2206nTcRyax9B"
+    "XlSBt0+EYnoYkOhhc/4GgoXh/5ZnHM0VGbcg2hklQ56tu3E0cpBMC6803jN63nrcdKwLBJl9s8gy"
+    "tN7JVNhODEc3Ri0LJs7IY3BR3pDEoWOcXvQxE0KyNBv0Ak6tvPNYy4CLyWtx8WI0+xNd1iWbPoz+"
+    "XJBkYQOfBtwfJ6u9meXHv/p8+e+fh/ubr1kU+tVtdv73WXR271tCUcWdqSgSUDD2kGlgXdQzpxi9"
+    "tLBmbVgE7Kj62uP/ny//HG9uJ7D/vzs8Pu4k+uNodrVA5rf55C+arbMPmabFcUrqYoT6gcOPNzUs"
+    "9iy7WCNpRRXdyFK4LoLmssRFGLFPQUFFn0MTbVsO4KoEnF0a5Rm4OQipGp0plEbU+Wm4cfKnJ77C"
+    "IJGUM0ntTptm2wQTQttg0LzU00Ck7ZYLFiibZX3nfR2xrsLe/FJfjBZTu8MCkj4LDpxZBk25Y6pq"
+    "NFfgsGdFiFxnzhoramQR+d8CCZD4b8UV2Xd/xhqFlcmC3Dft4YkleOD7Nkkyt2dhysQLT68F9q9l"
+    "t75w5162sjpcQQWvOD33KTEzbl2y0xlozWzNmP5M7gVpKUjxn7pD5ZggudZr4IWXiENujqsHgcGp"
+    "UPYkHex5W4yORzkEqoeFloOrkOoH2ooJGQvkTLkfZn+AJDA9NbDqdocyJ9NePJtxGD6PE5fGOJBp"
+    "RbJXy8+SAGh2gvlOOniPyXjYHoHIhRi0bP17Tsk5hic7KJX9bwpUDwkwYfEX9zredQ+RPBXG0sh1"
+    "30nKj452O1MJxjY/GZsOD28ebjUdQ0eOBIqha+B31mrPPvnxuQiF0OjNXcxYdq8Gns/Pxom9on1+"
+    "YYKD1twbVWNB0XwDIeUz1LyUcvKLEVvdpWbpD21EkZqy2VzwsaeODyah3PlB//3hzyohC7unoLQv"
+    "3danuxP1+dvPzpk6c++v37W9/1jzdH179iI06QX+VxfmlLBpYMPMQZWBZ0D/HkLa4vGZhnYLM5PX"
+    "/86Zf/yfn68H2XF5uT9e5Lf3y9+sqZvzTDlRxneD38bXFUCzzy/my/Q0/xQMngpsIoBQ46FBnNoV"
+    "ART2OKj3rvXCriS07S4VMASsbFMnT0w0RStQjFiIo8DYIoWuu3fGFxK5JVJbvj95soELEvIiHZH0"
+    "soHgTpw+hGF3nrVMEkGvVMF4gtynfH2T9UIGKEnf5cIClnFIgZF51bmnzbUuT5ZCL2gpM8GeYKsO"
+    "heBEKsWKSD6ywZVArLNDlSw1f2GhnV80gc8ZVCOXzJqQMMHXZeiNCv2EGBQZz6VI1lTINsRanKr8"
+    "wXCHqQKGzgB/gs+OwlRXpkiFLc2GlvhcdPXQGRhX9kOO66uDcdUDfpc4uwMG0SG2JNFvCBWInNmb"
+    "DcrvyLIYDypgXk+AWM5ggsHzvqCsdHVYRgQPQDbyoV9sq5K5uJFzL2+Q0xYHU9024zSmMO7eE4Du"
+    "Mv0oBbj1jK2ORn6Zlh6XKtsJuOq1jgCaj5Gv5WJ3mCKRn5gD+Y2knfP7cAJ87HF43pTF5qbjk+IS"
+    "OHoQwtZ8kwPAfhyUq5yfGbvImg4xj7AAGBDfzzCAIxgWV+9ujQYhIs9fgf8ROzENDDKPMogSzEeh"
+    "h79sX2EEFHe3S8jQW86djB4cEfctmGiq/W0IY9eolVR5OBhVLP6168OT5JIerXkNL1Ig38mj+QeU"
+    "byvMyv0xEjirEJHrxY5gtQAEJGv0EAnS9bIT/Y0QurXzf3x+dHZ+/59dOnvvOHT5777l9Yra+/Hj"
+    "8zPxbGxNKWDCwZeKgzsCzoHurpW5xfMnA1A5vN4/dOn3rhf73z6sV2f/s3b6y2dz92vOEb0SgCKD"
+    "goBagQKF04oYvKwoq6zw16FSw1tgaFk8apTcVHzxgUDXAkhYweoIPPV/Wni8XowzSfmkN8F3VVKB"
+    "ofvooWe0DhZSgKFvlqMBT5ZwwdHNEQlLwXJFXQWLB0UuSMIBG1PnrzaCMnJniWiO/qyq/SFz5/Ir"
+    "lloaIuOsRvbD6TYhCI7kIPJdmwXUBENE975yMaBYdsCeE0snYjiz2JxqZkKPaw5XyUjudb8sHI4i"
+    "4+WLPk08e2428v8cc4LZs9t8LRxvyF7K0zg4/6a6yxGMJ9ak50ZQsUz5f3mV8vsewgG/wBy0du5a"
+    "jmQzSac6h9csvxHFzb7qRi15jR8NYEjiJhYwAr9kn7HORDJzCxGxjlXn+oOV5Wcgw8MTzXiB0Y5k"
+    "N7ACRZR7Vp0YQZ3NgwiGC0r4UUwhznNbUeQUOfoI2sLirORchhRzPSfm7oGYucnNtrlX20URxeeM"
+    "RHsHCcPyPLaHz3ARQc7BKcJOowgOJxFi+YrphENZrkicH4FiV/IPgooePRlHdJ85oUhyqfQkJJD/"
+    "sk3sBD3XQ67mpTBL82yI4DFxMlXkvE1r8aW4jZ4+/MUHGYOSJomyVfDmTHgd0xCkVE5N3sC2z4pV"
+    "S9sDh+Eh9u5nNx6AcTnzK/9Zpn0MoPh1jhY9THPXvwRd9fbC9Xxy/96tmt7/jBo6f/2D9YHd38Il"
+    "HkNQtf2h+DLpslA0sGHuIMLAu6h3jyFteXDLw5A/qVus2t88du/pF/dHe/f/zy9q/9tfXFl755dc"
+    "IPj1PE8a57FQu6FcdFSiqnFAOUAiKmWJOsJWSF8/6oaFIEUDZ4bVFOuEjq4sIikXPRCKarEkAEJ5"
+    "suOthD0gOKDUnNBQdVEb75ViLtkNGYb/G0QolT/PJHsWQSjsya340GhyYWGPyxTPDO4pOOTdawMd"
+    "GDVCi1b0xJqUiMSkvBi1fea5iIRa4WHzQwDBiSTJB0Bj24FpKMRhOrxrITIelQ4dmY5LSnFteemY"
+    "TuTEmY0pDp6NvxCl0yAGXkAhQ8O1beqx8JbHZ8QUbXebDvxCMcZPSobqAF4Nv+PG8qTGXRCBbCnG"
+    "yAgZeOR12G9jm86ISWrejSK8+1pyelOhaADq2x8W8mon6ywq191YpvVwyAUNnXOMs6cgC2WdrzjO"
+    "BYhCjZ+sM2NNOhGdRCxUmfbVZv2tv3aNhXa6NbNET1N47ncgRLffujlwCma1N8vlSFC5gCsi4Ybk"
+    "ME/NBYFBxyyRvx0OWM59bHFG6y9IBGfPGNXmVhYKHtFqDIlin7AL54uAfZxwEKotln+spJu2GWSa"
+    "LYrHjqekGNj5JkPH+DA0HewKJlkSQpC0mwFuB9zIiixrYWr+Qd+8hXS+6Riq3Io1GBkRTk9YiL6g"
+    "OjP6PAtjuKsV4foY83JpxZjIHP1Tkaz8n8LEHyIbrw84UqxMOsq+2ODken7/+t0xsf+76jZ7/zk+"
+    "v107cPe13344PVlrAUkktbMrBk4B2QgWVB9w6YxCWEJQNXM7BenRzf2K9ufv0/fOPy8Ozuzj/5y8"
+    "f77TesNsfHeRedz1volK4CgZO/z+0U/S4+hJTKTJ0UISmUXX5Ql1i+C5YuLlNwBCo8+hK2miuY9K"
+    "vAMRkwjSF1y7vSpWuiJWU3+1go6dLDPxzjbwbVkMGXDNyWcR40Ch5UevpTUQWGKYXbQOG0iqQiaF"
+    "02jcF+3jKm0Co75SRjd62rftFBsmk2faVmxoNPDYg/nZapaC3BdgJsFsQFjrzj0JiyLkgx4+xYj4"
+    "2kJDOKasFazzY7XwaAIRwr0o1OOcbYizftXXDC1+Ogn9Jonfgm/dYxlEEjbJ1Y73gLRRwaCspZMz"
+    "FgSuXXo+DFSxM8H0kLciil0A+Xcc+X+qgLP8dh+QK/AC3JQIAcW2YE3HDwuVXTi2gorFpEA5i/9N"
+    "jGBtbdsKmOn5vyL/aLB726uUoeFGz7D3scz7WotXCJoEY3frLzCIp17RUuqvm4cK+V5UelKn61F9"
+    "p7wRO88KxoFN5s4LNdWaQH1ZrkadgXXcf8m37nksUMuTXS5FGj4z/2iLXvGGieF+HWlLbD9KaQRH"
+    "J+KobaRbflmBMo+BlO8iY/xICUWJuJWPqBm+hoh5dnMDjjTQvrSBZx+3T1uPRbRiT+iNdv7S3Dwo"
+    "7jgrzhhxZzWrBeXuwu96uv+ezxzY987+rZ7/qF9fGzt/mZm/hZE4szS1sysGTgHZOBZUH3jpnKJZ"
+    "AlA5UBFwSb1cnp9bs3nv3AJ+99cXdycflb/8nm8MY3b9a39fEZbtdRAcC79FwB4Z4zFna6BcsnfK"
+    "oX/sFREUO91XuTGKr53X864vMO+rwodFFiHsqlxY5HANONESQzpnxUoRIXJKx/EOyvpaaNoeBBKk"
+    "z2fRuZAUvcVxqqn8CqEDON8pXCKgJX4gh4M8oOltVqRyc6nav438Ut/MZ2H48ngv13YUis+E/w2O"
+    "29unGj7eJvtZKDQwwl2VztS2fSkEhy5LkuOguNqWWgGtFwsykqG2XLV89KUbvhVSkUJyD4Ue4Z1g"
+    "tnYrU7Np0cZl5MGIV2FF20qngdx6iEwgGRHGs/nIXz/6NhnxwY4s06QRYblmXTmd7IwP+Oo48Dya"
+    "Jo79h3ky6Ft3lNQ7et2ED8cRyi599xYZmWeUvf8Y6YawYaDhHzOqeF0EBYmtX2ed6gHM+DNoRnds"
+    "WRWLsYBcWhDnmyXmDM8pfrsAgZ9iQxkoDWzIb8IR9vWpRJatDA5oGtsuOdHJqQ4BVTomnTeJJTbx"
+    "q04H370kPuzd2ZbAuwz2IM8cDPePZTHPnn2ys7GNNzHMcMfemxUtN/DkL6eugzc/18yURgSK/BWg"
+    "zrdtp7h+PnfvPs5rf/N6cvfPznV0fPvbZnIa3c5m0cyS5tycCSgXdcBpYF3TtuSpeAHvkMVNGhFd"
+    "p+c3r9C6dPv+9/vPvqbr+985n/7Pjo4oOnnNhVEPC5Om4zy2eIuGmKRRnZSwlCwWEoF0ahUTL1bX"
+    "qUBykyUsx5XMnv0sr6qKrjnQkRGgVXFWLNcoEclbIvXcmwaMzn/QIWt2IJXXxnb3r5bJqZbTMyoy"
+    "AvHuUXxZB9sm7kXX0PfaOb4Tyol6xAT0uoGvdiZGIFW2LRrdy2InQ5m5xQ0MIgZgA0mPHALrZZSB"
+    "qNIpkCvRNhNa7SmIiY2swhocxHlZnkT5LAAWVb1pRdF+KiVHy4l7yBrYawiL5aZiYxNbk69k99i4"
+    "LZcZt0ZUNcsS95/rmdzMettWOnNMr0cBgL1sWeW2FpmDw3HUGkyZNvHpRe+9QoJVs7Cm3DwpZjCR"
+    "VmY3pGjNOk2HQYpVsyhVEcANO1opkay3dBdzYihFz8CxJUCZULyTtzXBil1L6yh+fQ4TGnzAWre3"
+    "e1cRd9LINV4KagZBXE3JC40qwf6I4fcP4sih0pzHlTX4zBRzw+OA/CbTn03aA1s2lfZY+HPMpyUu"
+    "jRQBo8pFqulExJDuuNsZlacLmW5gi9DS04vnorZfTJ98gnfks6EUbWPOjmcVwiw9U4YqcrG+Yjom"
+    "NX67zd5fm9w9F7Pn16849+v74A5e+tjp59HTRutc/xzWhpSwaWDLwTM7As6N6Js7rEtGSADPjMf7"
+    "I/OXv6D1ZPbX7ynu7E3N35rb+6PX/1PccneodXhRsn+lEo8Tt1fFNjVyDsU2e4MOmk9udzrKlqEB"
+    "E2lDDQ7m/Nt5gHLVEDdlJrltcKXbW4comAb9lDTjz73Araj6JUUHAdu/sTE0/n/qUgFF/itmlbhU"
+    "8fVXS0R4hd7PJ2udnxRaJg1MY6kYWGzdg1zGBgFDZFGXI0SXogK4UXq7DoFY7ky72Sb1DpsRLUvO"
+    "b2KxZz8GIj2NHFdrSwmXjKaPkTnXID59JEGD41jXWQWuIQqk2yqVYBgjWjTiMbQXbOTazQhh5sFn"
+    "NZ7eLIrDGYit3OaesmX8ISRh8rnss4a5y+Dbf5Ix640hsLCDOYIztk5sgtTumfMdxs0GWgBp1+xL"
+    "xvGe9b7kpwPRfYLIE4Z8iAl8zQtzEbiicwEjGcxomP0Y1TopiIFP3ECamhe28xRBBVmx8X4GcG2S"
+    "MxvakwrrSVIl45L0Zhk0U1cfFaY6+Jtwz71kuNeTsK0hRfRAatHQOSvDFm59xFahDzJEfSLekVvv"
+    "PdQL1vKfknEkiNE4lJzj1iUCd+ShQfouQYvPzTeHyJjvF4TuqBnJ+fAvAVcXzS6zTxY5xHfcOuPk"
+    "ennyZ46TdPnvjoD6ze/cd/dr159+2DbsPIZ+bIfxk1/rJZMrBk4J2WgToVv9PCWuJZMrBkwBmFXN"
+    "RXAAAgAElEQVTghL86OZyc3vzStZvf9HcP177te3frJ373sD1WWXymekALOER48I7vTrdGuWAWAV"
+    "29QvA7Ri6CjJVCjW+w5OvPqSUoTvz12OYDpNLBhRAQGbugMie8sFNg+IqAeFdkSz9fYDAvRCjvuk"
+    "ikoBPPsuqxkCEQjf3HHp5FwKAAG2VV+hLHxfKyPMSZq11w8oUfoAQXGlcNewyQP68mZTwBhBfYOT"
+    "7F1UE/XM3iwb4ghmvG1FaYKfZERNHNArbTOWpW+8X9VJaOqBZyKFLyao6YV6/wgta68Uta5KhaW7"
+    "Q/XKnxf/g+LCRHdDTi9p5bvQom/pAfO2B+Y2aPoMn2d4oni7FwjKoNgnmA6zYMaVSBZEb7WIhY+0"
+    "FeePD5Na4u2od2SPEVKmD6J/cTpbuDUvai1CBlL7uau/ZaRED0j2qubtbx0pYb0/r4By7zZYVSLB"
+    "g7FDpShignG8bHlDGYAzzPg34flU0DIrYqL3aVHIjMQxsgyBJDe+YcTvIjX+WupWvq8Wks3oxAOE"
+    "ZxXDYTA8bGYlrhOwetA4fsSN+K2rGvNutOWE3U3s+30o8efqgh03Lq9vHY2GUxdmd85BrHMhqzxO"
+    "Q51887+1s5sN94Zns1E3pO+sfCweK56oUbi9k8BOR+FnLN51bLel47BO6b1/F9cXF+vn3iM6sbH/"
+    "qh/XPf83NHpy/cXm2u6dAP/0qQAC9tycCSgXdcBvRGT72wveNCWwJaMrBkgAyk+KCSuFztLm4/c+"
+    "/Lv/1njy4/+xcOuzdeOT66fbLm8y1U6xLh1SCfb1FVRkHvUiYF1lQUZvFAQZOXDwoS/XXFDxA4Ev"
+    "Dri4fcRqgFkIsV9CTvd8VhRj7WwYpVvoovr0+iWURlEYUTRYqKmuCjTRFFGaXfVbOghPU5E65O2T"
+    "829gWbPCiOwJScWO4bQX1Uhci75drqb2r86pP/rMdngoIfTFIo+1wRw0dMSoLSa+Dgg//4rbz47H"
+    "hKBttoWQP/1DNF9PYX/b0WKPYvbPuLHup8JsdkO2DFOII/GlJgIwfbHQ1YYvRtk0NX7J1WhZnpiq"
+    "cwqdeRwyc3/1B9IgObqGnpp2N5U5J7MJpvHA3imTt4FIfbhvb85ZgJWtuATkDeK8i+GoIUrGySn/"
+    "iMJeYXTmOpx21rauQJDj64SC8fGJll7tQ3vmT2UdQwmFxFYU4ZYh2NcQstJkTh36C9N538XSGYOj"
+    "1nPAxN+H4aST52RLYfeVY0L/ZhgUvTXs551H6L6pgFBMl4BCwhz6iIySL6kMHwv46TMmtOuFd/r0"
+    "+Cnhi0dMQJyxmUEXHE0qi+TXNAODGyKFmOW+RouJSrVrHt57EZ5bReh0yzjT4aZRUA4ey9kK+jmA"
+    "mSXJyQT+JzzOfKIKBq5mMVn3Nsm8xGzbGUf0gFzB1U5DvPSx1v2vt4EI14kfMRJwY/0+CXW2xLya"
+    "8PviKHmF5rxu/MYQEgyPirx3Z177C59avXnvzWv3n0/L/799bHX/Olw0E3X8lv33GRjJVDy27JwJ"
+    "KBd2oGllsu36kzu8S1ZKAyMAqe1clqc/rEF09vvfe/v6eflj288Zn/+LA9/8bjo/2JCw4XeyqeXH"
+    "CwfOHdXYqYFB8uxFwAZQyP8qKvOfizeC5UXEvYuosdVzRAIc2DXYqRVI0aC7I4AKpfV1VE7M/s+a"
+    "vLVeRQKMYyBQuVjYS0y4/0Gt2myhXbwg8wiaV/LNluRBz16HiMZAriljEfKWKwT5jEfgDa1rgdUG"
+    "R02Dh/to8qcecddvr+x3+1DiUja0eXeLWIM45jl2XrRIZ3+b0WwZYdYc7U1E/c6gp0p6IRbK6qcA"
+    "WPacFmf/uknQELX+wvPY2180LEQ40raPvpPjTpNKCNAGIXahMiW8ddNnqB5QWlrbEQjxTm0tQTCb"
+    "2gxCf7JgFoY2slbYjdZJfMjgGCEZwXKwFhXeJNk4S6+EXxHv/gIJjngiUVMBKRFUedFOkty150qW"
+    "2U7F5Ih9rbsmXs4JvDZHYxL4J9qPmOTTzoHKDBMRUf3DGegyBkNbTY4qP23kQefhZeswWuiDxHiC"
+    "n7lg2OMcXjPQmykIUIdrDxh7Q4IgXF5txFNxo4j16EknP5ytg+ZIELF55vIazng2cXX8DUnQQ+Tu"
+    "UQ+fDGkPIRXzUPkDfIKgfko0zYNs/L4EkqCbX9+Asm2nruoItIRWs6cbkh0zxZ8DC6dkU8aOQsdz"
+    "Ww0MtxgJ5C0bh+TgaC9dno4bWk9pLnIVR9Zu7evcP6xV87e/LbfmD1rn/rf14fv+s13gjjCc6r2N"
+    "KWDCwZeHQysCzoHp25XiJ91DPgIuVkpc/UfXF18/inzlf7k93tz/xH64vXPrg6uXfsz2ZsNn4nmy"
+    "UHV7lc+aeqoPbROEUKhQeFTJUazix8F/sQq0XHW1FcQplDMcKY2oTihr3HKiTz1ebw+ayICpxUWS"
+    "6KcYKllkkusKSFqOkAgePKx13DimJfJeiCiY1a8yhcw58R513xu1jvYthmkCld9qM1EwK6xcAGch"
+    "Sd5ToCcUSECoOsWMdj6ydbk0AZKGxyhw37UrbaKgsl57Zsw5aaodjm1sjyBwZ8wYNlq/R5iO5jov"
+    "jIGcgd5RuZmqdEEhu2JR4NPPsFmPyZFjksMPFBgiXrfs2jlWvT2Mk3gaAQpXiPW/T0kOMU+ma7H3"
+    "y4VitMdrEHhz7HDwscMJIHr1VhVkBj0Vn2e24bx2JB6JDiRm3jQEWDMA832SbhNEjqth+ht5yoVk"
+    "veEvOkw4Kw1CVnhJhEB1htEmd4GEKuLGs+tPhRHvp2aKmotWx0wbHbbJQH6zYAzEKzzEBGQA92Bs"
+    "iut2hNjjOQoPMRGyPOEkM4b6JUvMyHDM7lOCzH7dhGLPvqp3Gc4JCs2W91EljoFoc/w+34ooaqQ8"
+    "oVWPVF72zmraHkpzPYv4VnRecDPmA8R5iL9PNalueXjzG98h38mTm93bbb3Tk6ft+vndz4yF8/eu"
+    "7jv7DePHtnfzj13MVOBxMry3bJwJKBd3YGlgXdO3t+l+iWDNyXAQqFU32m7skvrJ78hk/cuVyd7y"
+    "5/8y8dXV7yO3WqI+BzdS4FCaOpUfho5I0kVP24lqMQaUH2qeCsxiKgixhuI2qxCRO4iepCzKCiQa"
+    "/Cin7XUCZNKpER37dJWZeS6IqAzVEkuWgtFrsUSeqUzRSCxIm1Qmk/8IHKftaMwRgZtXElzSON7U"
+    "flCR+hl6x1tUmInSV01MqfIOBPSJMUQg0FkixRBOYfDmzIggJxykmwbEW40c2VzuDFtK/HGgWvWX"
+    "zNm0eiNbaXey1iexowTjClWj6IXtYt4KyUbuON8DsOI5RQoXUex9BoicHGbYdjjmMnmXOOrCAPKv"
+    "Y4OkeJHW8l01Z7jO/JB7i0bN2l72KcUemiCI7F8EME9xu59BmqWzt1oEeWvFjaPov8VZqPZVScf3"
+    "bWECGIGcuPJtsJKfgfxbTKVHCiGl8k0tlwFMJvtkHiYUDEADF+D4Mz20Ms7s11y//pdcEOxh+pBU"
+    "1bbMDCr84VsGZxbLYsfHyNJiL4X2YYql/5LZlJXiB+Y4G9cHj+1xsXDWfUSipvBYAEdjRQQhMbdO"
+    "DFtlXkd44HSYuATr+hEMV6Y4E1nW+d0JW3/XZ1cbG9fb5+4ZdPnv6j/9X63X/yF49O36Xw9DtzWo"
+    "iXg9ovbcnAkoFHKQOq3+rV5lGKeol1ycAjmwE933nKu9rYrnbnX7l5/urv/pnD+Wf/8mH32jecnr"
+    "yhVV39xhEyVCZ5g1h9bsFUkz7veLN4ob5pOBcjIkCnaJlfgcGg+Q1QOB4aUFy9FoGVK1j00sZLFA"
+    "BqYLuVfAbaamxeoBLiYKaDKnhYKpQwyhx14RU63OEKnZmAhtibv4beXzRGGcSANFRsTHTM0FLetV"
+    "RoQxd7Foq2uQSjIbt5m6VIPoYTmRJkZ70UjC0zx4i1OXD67aNNg934HAzqM7RkOzUIc3Qk9LBg6P"
+    "jQPmaOK5uNMxdWn7wDnTYDstw07vmhcIYaPfWkPFyzDUaU5K1ractjo20ZxSIlZxCOvfKfwr1YUw"
+    "ctBJM98AbPi5FQshhEebIWjo04P/fPVeITrkWke7+AnWk8fCzn7LCXE3rOhZYMRQZPJ9vB7ygKQW"
+    "yi6sx2dOIiMPcDm4azkzBnfvwhepMRu2F3gQFCm47DiJZtpvgVY5OxPcVj87VBAoS47I6cT1QN0z"
+    "K9jw8+jvCjlZVD3hCzfwaCM9OJpPjg63NxyDZNe27x9d0KfGYOPq0XqpI97LRYO+ykun59e/SuX7"
+    "p28zv++skLf/qXVptntvu9vs3Sr7u5TT7Ky3bJwJKBRykDyxW6R2m2l1iXDLiy6SJDn6k7u/Ha8a"
+    "0Xf+rua4fN+s5n/+L55e6Dp5u7p+v1uaqWllPafD9dCh8qFn+ujc+csKhzVku2qhnKE1oXPeqZUn"
+    "VWih7BMfZn45Cl6NIYWi+UUtgbCaKLMpBcnNkW1gPk2z0Ls9zAbJro9GOfTtOFBE/NHmoAy4UZuE"
+    "2nU4LY7mJyxDkBWgNxq7edwipTsSVngOxYUWm8qOMLviJEnsrtBGE9AOxvacZFCYJVctMcmCwo6X"
+    "hugY0snPjBXssaLc54s7/WaFYEzreUoaJ+bMVOz1Pw8KhayWIpSumlUBUFslp26PEoovalZTrza4"
+    "7jat5UFJOrkiiUaHd+2yvfRqhBuNISnvvaVFpkr5uI2GMnUt9Sxwhy69oG9ksO7eQnb2zEArfbmh"
+    "NMurTxPJP3rY8xW+w9ivDNgDhr0SP2zmczPdYm9uU/scYxi7CIsBloegReNoYjheTnP2QWItDYYN"
+    "EBpU8XVf1xfPXxJ2pJTbKmyUagrHSfX0iYS0e8fIYUt+JbR1RStt3+yLYFy654zJX1hOl5i5dRvp"
+    "JTG7C/9n+G4ytk/tKj4EUSXGDkz//H3ps+a5de5X3PdM55p+5+u1tqzUgItUASEkIgQMIGjJHxAL"
+    "jsOOXYKTt2JXaqXK58SuVfyJdUPiYfEsdjJRhj4pSNDY5izKDCAkOB7WBLQlKjoTV0t3p4xzM858"
+    "n1u6619n7O291YpUggqe/7Pc/e972Ga6177X3Ou9Zz70HAWV0TzeT43+ebXfCc+BKFD5SSQV5++J"
+    "5FAJmv7gmk5W+tLoUX+snd7XO79Tf8wuGD3/k/b1753l9erB7Ut2/iTU+ztMrYjAiMCLwEIzAKup"
+    "fgQR9TfqlHgFREjcxmyT11Dz+9eODgJ46VUZzf/jd/5fRk946Dg9OjpZ4k4ORsqiTqQSlKavZfJ+"
+    "BvnAXlpMYJUJKmylVCt0HsYrPsa7S/GufkWCxSHN/GZGkDS4cButqrzQ/yAA6NNERovc+oCPCkny"
+    "R0xppki29l9ZMcM6vJrHt6LEsweh5gIl9zg+vLSwFGWRsn/GXb9ybFEYcCMcc5wuU7aFYOT0IZSV"
+    "Z2nWyK1sl58/Y9xXI5kG5t50QbrThPb6Jr4kzNx0P8TlJF0swlqR+HHFWIyHsXv6B5LFo7jffQrF"
+    "4dfHcSXEL4EEA6iMZWlPZo4FNpmi8p42EzHTjdb63saytdz4+hjRbdD6O4qKnJS3Yy4JgkTqLr98"
+    "LHnWOjz/PgTMq8mee5hPMAEmyEHsuMocgdX1anjmSh0QIdGz72nrdEyi/PBSHEtQcnLBE08Fce5s"
+    "HQp5qPr8bWl6CPqXjo0xqfPufAjge1NNN7Yt/HnL0FEXezqTgiXsVBnIg1kAgSLLji7jlZlJqF5S"
+    "Y/bVAC1YKxj6sItn/IlDzoPh5CsyWrJP7zBBHip/G096WWonlO0MWVDPHlT6Sx1KfVtEUTVXanc8"
+    "ZyaHCc+EthFPfzR4845+myPpI6H5aLjVj6q3O6eHZ96dF/eenB7/4bq0fe80uL5fU7Oz3oan6S5b"
+    "4HeDHaiMCIwEspAqOgeykd7THXEYF7I0Ci5aLu/meWDzz647e2q1vn21//6+dnx9+uhPXSes2DSf"
+    "JNMUlFLhVSZkNioqzF3yrvJVakOZ0COVvRgJQkIklsSDt6tcVJiwjmsxfPSZD7JFzqVCIFEzlR0h"
+    "BWq10GL7CNfJIvY5ARmsgGbVvRLqspF2jw2mAZx3eeIYdmJ6rxoecJnpSs6BlKVhLK/tpakmnkiX"
+    "/2hseW7bUFjWlSTCKJTY0tEzyzPUYueNAsj1mTo9QY6Lt4SLpvOCSQjsfuymUlnfKv4YNW2yh4Dk"
+    "lYJWXBkmbnSYnsuVchjBk163gy6pcK9KjJC9M4B9RyypnLWRjxHBv8jYdxqHmesTbTauSF4wEorb"
+    "HS6yPEqJtxagAEfu/7C4sYOW6OPzJQZwwJTD4jZ48REh4c60570ZTIx28w+HA+pHH2UX31uQN1Pq"
+    "52MPaRgQeu/cKOmjfoMKCVTlVKTY62uSUSND/ARiBxXzMxUIEGMNsyYI76Pt6935ezQOnbePcrZg"
+    "lmBzWxb9o+zr19yYBku9r7GO3riTkfx7I5YcR2xMXDr36UbMXJRS5kMTknfdmqYQoL+5L1n6+aV2"
+    "IbPv0cEVY9QaDQE019vq841znAUd+enSxOT7fPrQ7f8P7V9ff8j6tHfuDXFptrp/jDyuX8B9LqYz"
+    "MiMCLwEo2AvqiqPz4v0QCMaY8IvNQj4EfGk3zpcqqz0xtXj595/E/sTn7rr+3OPvNdh5vbl1fLU2"
+    "UXJEc8Tpu/FyQ7JJV5PDaFnhsZipIM/0URXh4cAW6SIx4dLsVs+LsDXTsWJUKX+vT3iCRpoe+m1Q"
+    "AseQ/9BD6r+5trBFjpC3xSJL6Br/QVFbX4BQyJF4UoZkmc7JL2zG3na+I0O/TFQL5bElLpSGMNQw"
+    "LtL8kiZS8zJZ5rZ3Ho7wHAR4d42Wh2SFiPierH7zNTpmkfldxxSWpHHz5zLXW7hr4TUzpqxJ1puC"
+    "RUn5UhNIg1OK3r9+ZVLDwd6YYfCebjsezpjYAMio8VD40FPu9w85TxAXXPG7oITjrxR+QqEKdzxq"
+    "IpGq0jW27S02u2ytcGhcdRFpbi0s0rnuiVKduUPnvizWVsAFnE/hCLPPgnxwd8zm57aLmV+ZxB4l"
+    "nH8Iws6x1cQyemnBcbzQ9ar2oabE8jcDk+IDKjHLs4iC4NeuaKjXY+c+C8wG9KBcSRzdmPDnTNT0"
+    "RjBcgyjBl6zuq4j4p62OCcsUcSNI8VOXPDh4htt2mnmMnYrr70MYKdqtgZKSqtyLm433IMiiKWy3"
+    "5hgsAkeKatzy2J2L7J5YClUuzaLDr2W0AOrFA4x4XieEyGjS68+G9TbLChvWOFmyIZlzmKkzhHDg"
+    "6rtPl1xmt8F00dv/NOIxqavp+Yc4qnBGucRh+/RPd5A52Zgime/N+enelUuvTs+vIbfm59/fv/+6"
+    "OXf/evLpbXpEMxh8XIB29sRwRGBF7KERgrdC/loz/mPiKgCPgeD0divdgc3Hdrd/0VP3P7OVVxt8"
+    "/+8snxZ3/gYL29b7U6k1wSFJKd3eJMGyUdvlHfIMpmxCeZoeDSPwqRJB3io0TupCTF6YzkSEfIuc"
+    "gRSerybbP6wPmjrekIQUkDgXTciaGLBWmIbwnk+RQKuPgDbytjDTMlkeJDxGYafX3sVHwJkxmBDV"
+    "J7iKrGRepcNw+YCGbBN3gSO8mHLpm2z57mechPxapJ2MUIRaaNaWc3kG8hEsCanItRzwEBhb2FcX"
+    "Xff/xGrjDswYQdW2swhW0fkJ/46HpozJgIFikmMQHX51bZN4Zo/bAcxnahtsy9G3PhLNrnc6mrsX"
+    "vO+IJDJUUvj7Cnl5Zir/ug6VMq+HevD6w+sUKCnJNzVFHBZvkHCpccOzYGC4u6cauNMfAenfZVuu"
+    "ix8b70Jv/r5PExtBpJPriRZiCy/QVmbkIQYyq0Gr3tEnv10QWqyRBg2Stjxw5jpKMRK9GFr2Pn8w"
+    "w6YJKFrHu99u1b104hxzEMtkfY1T87I0Jzep45ZyxkHjHVATFKnDchinTDCRLHDUDPmXlosP97jL"
+    "ia1Si2/OVTRijm3JGAddAvaXVyroRnE3TNxooFTEifc4chv8T5siJfIllBWHD5+6gdE/Sxl6YNiu"
+    "hvuFTEqtI7OT16cnXl0fevH/4D/9PhA2//d4vlFSPnbyUA9kL70UYERgRe6hEYBd1L/QwY8x8R6A"
+    "iQUGjV7eDgwecu37/552er5Re2N//dc2fHn/qR9cFzD3hlyAmmBTsPWSw3Sl6dmFxMMFxYOVl0ph"
+    "IriFTiUijJSRgooyH5IylKghe9bEsPfZJKsh9nRFE3bDKiSnFiKEksCSEo0NJm/JmGOitH6DgJDY"
+    "QU9nTFrOciGCjaJGP4LsnaoEHrRDV+QFAxKqF1FC0DfsuhFwx8iN15i75/So9xS9EtP3iaCU2Kpm"
+    "WksQmm42/CB/pew1E3RUC+ugDHZhfO4iWWJaYdGi6CpIt6ENmWP14xIbmF5MiqX3MWrU3GJ+ZTRd"
+    "/MkKJWPTXeP5IpFoHq1Re+QJCopeMFPqCb8xOOxiFJNsJ97JgvkSNMNHMtm3k1Eb7v/RQuP9kwr5"
+    "wDIYtRuvB9vk6SRpoNGCM4uJRLLRknfrC7RLBP5SD20nofeWg9N/M7KKbjjeRLJX3mzcztsHVNj7"
+    "K3OiIZ2QFvBOG1tKjtydLdt9/eTYFFoI8/fTWOgc2r7/oGmj698q6uML3VRpwJFBpXDsh/Bw8cxS"
+    "EuikdMtGV6NPr8Q6YM5tzgfIRX0NYvI2LAo+Wrqsi1H2Zp0zGyYB0j+sSS45+VwtjJOauYth1W3J"
+    "DlaZW6LkGvJtDi3NHjh1ff9I+PXvm+v7t64C2/uTi/dGenB6CMe+Yc4bEZERgRuCcCo6C7JyBjOC"
+    "Lwko4AOYyyn0Ot1K3vP/zlO7v1c2fni5uL89/50+fLs5dvWKnTpZnJv0i8lZSckSUlSXLs9pIZZS"
+    "gVTmcuSdyK4kRKxUcKRV6BUAlUshwlTyRdLZw9yRjJWooRp0BmOCkvffqehtjIz5pJrow5AYtmYa"
+    "YQaW+l5iQT5aJ3ltiFRNDEdzHbViphyxAHECssIavvFbQqutqNcsE+ZCWuAFrfw3kuc8LdciSujY"
+    "ZN9eX3RKlxw2SmE7dAEoPGYWUPiRdMztEQphFkJ+mopxrbhRg7DPo8aEb7q3jVMRLMFK/ZJjaQAT"
+    "v+Vkhiv+Zlmv2RDDS30tLQeAzBKH6LmSwOSXcfygmhOt6hoB/8zGWwrOHBqTipT+FrWsiWhU8jrn"
+    "tHxDTT0duToTvPX5xytHWB9hwcMPmiYiXvYYtvJT7h73f62IbWVjWqKsr88r39xnvbRKz9DIC3uN"
+    "HvgZttKwpSYh4X9Mtn8CZfWqCMoJFuYdiKwWJVXfiopen8k/+Ou4nacCBpOh7TirkcMrVYNZJMES"
+    "wv6z0JwTAvuJ4LPeNHPt3QmFZg6lztb32kmC87OP+NpG36mb/scc6IxT1zXhfe3jk/Pjv49NHVN/"
+    "3U8hU/9r+urr71I0I/4UBz8XM5gbejjQiMCIwITBHQ3678cZooozMiMCLwko4AfxNILfjZnd9a3r"
+    "315JvP7nz0vzo/+difP9g9++r18q6TFz/1jjvHyGbOlWyQcOjx2edbLohUU6ICz39hQkhOA0v/+k"
+    "8PBR2yeXJmeAGQoJT9Nwp99RFFgjYlZBmYAg96i3kuKJWufWETCNO92aPNyTTAauJdsBVqtgZU9w"
+    "JeCYgG2SI1WbCneXoyk8SkFApaDR4Wun1sXtwfzb3krIWNsg0a2BXEiR4n92yVS8bJ5K3S9/752N"
+    "3jm21hp+3ZkKl7mz0bJZv5MNOZd1FVHMkCG1fSh0abZSNn4h6WlUyMPNtO2J1YixBsRqxalqHGKD"
+    "v20H0jZJpxSP1gY8Y95Pg0VDs56dshG44I8qWrTsS1bb0SNzi2vPyEv/4tjX3ro3uvUiuDH75jLX"
+    "mO734TKc2+z7z0dN7qy5l7dSYVO4fLs97E87wzunBuioTN52lAMEMd6bZfz5MzpKj5meQg+/yQov"
+    "01zIxjtdJNCMRr2SjPItWzDxLqYw0+l9baP9Ox1Z6qYPMx4gjlvmNJSkB8DPE3s7x1vExm5Z975n"
+    "S/8urljx3c/60/vnvwj/4vh1df/fHF4lCRpzCt94A+P2KgjzYiMCLwEo/AKOhe4ifAmP6IwItGgN"
+    "xDmcjZ9tby+O4Tbzi/+eE/u7vzib+8WT7zTSrqdO2PEhZ9E02OYlESDjKkLd9AK1WpMTxlIxonAU"
+    "ou4xRHuiRG+YYasbTwpgyNoW0YyX1WyYocHk6UGhjN7cTffgkkdFQuJrcGmQDKTpyxzr3pYOYSgb"
+    "bRMv0Qk5ZpesHJFL7KWfb7zbRmweMzTd7jXgHqWF5A0KAgjDrFx6PeBDO8C9oX/Il7JLBI4sle7O"
+    "z3zGs/E4d9/H2bL9Tfo0Vtz4eKmuhxQZ0XkGmEMFFHiA/b7DODpnAGkHBn/EKyuccpdh2nwjQeei"
+    "HuxVrECQ9cmgnVrX47sscylqQSb2lRNEG0DRiBmLZ7djgi2JlE1JnO7/1zK2IzJlrwW1HdnX4HWf"
+    "/puU/2hO8HpmRJPHoTE9t9EaLg6lyBDX6+AIiRsNogXlsqHZPb8+jWQWcw4fqLEAFFvL/cMFBt+r"
+    "rKwp/mGGv7ku6XXaQRfcFmjPjt80bWp8LNSvgXTcdOfX8pILzI6zVxvrcYA3w492DGf94hx5dhxP"
+    "hgtzu7e/LAR1cPvuNvHjzyg//70eVXf3Kx4p455sWnDKk32ojAiMCIwL0RGAXdvREZ4xGBEYFEgP"
+    "zDOYQegXJ+e7W9+4VXH9/4yJ/a3frYX14vn3z7Zr3drNYkQ3m+I8JRYUt6yI6ETz1nPSRjnYjtJy"
+    "fpO89Bx0Ntyj7JIST47jMADz7NzNqboE3posQ/N+2SdN6rGGwg7Z/xWqYBC7OHEvaUJGYLOOcWZ/"
+    "aT2zYPG1kkLrboQEPPyfYkYAPTKPMW7R6QKUaFMSu8SI+4+HLYmgeTmeYQHRcXOn6mTy72PJGZiF"
+    "Zov6e5g9dBQsJT2Zu/1R09x90gRXO/AjfPzQAJQfEQp4FC4wx078JcmCtUVuC4tLdXkKgV+VgAAC"
+    "AASURBVCGFl7jzRQStsdTd86dX9OB7WkiWnYSv9DSg+IhvoaHQ8ygGhkTmjONyOx5VLx2Pe1YW0U"
+    "YY9qPHv9u+7EmBSASp8ZjrPbpi4UF720VLpBAODzSvbO75EW5HK3NpdM9VsrHXks29uG9u/JWl8g"
+    "lTNOi+PFt9n1uKEcAde2T4gof7y5qGbuNYlhmiR0TqKZixVz52YCwDIrGLL7Agm1X32ILp4kzbea"
+    "Uu54/lxLcPPDzKRRzrvzrv4pTA+L3S38bzzWK1Plzsjo/vHp9d/82j6+/8m5df88M/tTh85AkXe1"
+    "6VY278noI42ojAiMCIwAtHYBR0LxyXQR0RGBHoCDjjIv05WZ3deeIVd5577H2Lux/5S4vtk9+zWZ"
+    "9dXvMobnINX3KEnBR4cIlIOyUkXlVyLqKNEhOnSnV5EklKkjADiG9jtmz98sHJFbj6wRZSNYztGm"
+    "eHP2irGS/yWJa2yZVtIWBa+2Hs0rGg2JYQIzyoUEAKImPr1w1YSWaxg6OSLZOohRftxolAMOHQ2h"
+    "/3a2PdAnOMW6Xxkas2xasJ076UyhfgLqjXwPoUfD1p6FZtoxPgJBKBOU6tioFOyMFgVddYxrwXb3"
+    "9Mn89k3EYtUcUP/BwuUUmWbYBVkHa9zkcJEVMk/JTNOleRAy+uIMNYe7YwzGXcDboZrdQMpe0qGB"
+    "lJeIrfxMVQkLEBbO7FVJnIXKQJF0ZstZD2qE44YKOsbXZh+nK+FkI6KMEMPZSWmUfI5IXn8d/aYj"
+    "tastO8OAIX8xKwA7VjCL3sIuM4Nb1d0r5VLWOdCxs0jVVfCQmH8zAjMIMb+/1EXTyn6LEicI4PT9"
+    "+UR34lQPxxzO0jOBJ0U6f905gVNs4R9n2sweH48voOeye+SNKjiGNS/IADl+MJICz4FHXYg6aVUF"
+    "2WHl9Xfiqq3gd5Y7F53QdWD77371y6/j3/dH348LPB7PvlfFZJd7QRgRGBEYEXj8Ao6F48NoMzIj"
+    "AiQASciJCxkLCcrbbbp4+Ob37+nds7H/rvFsef+cPr5e371rzSQA9LcfJknbw9asc30U6gSFi7Jd"
+    "3phwHADi9bzCSBannSIIT2EJRNbTXsu0qcZNlSEi8kOw1qLdTBdeo8YXndxYbwVVaUyMmUV1gY0Y"
+    "LAC8Ubi5oEf9hZCh0SSmd56DBuaZI/6SKPsPYki6x4RD88VEmI/V43OPohHaThGal+ewA0oySd9D"
+    "sC9GO7XYnNrFDgg/na+NjYh/YCRStHxnYlr0Dad1MRMYK2doLpWM320NfIV+hR4HrlBH104r991x"
+    "D5rBKiwxignvE89+6hFwz2aiFMXplkBuchWKEQGaz7oRN0aN6Lgz3JTcdCevGLPQCNEyVHGR3pA9"
+    "HY7FP4ICdd+TZfmidShEVDEbuFaz9zbLHmGAIxYVCoyHfjiVoP+7CPFpYdg0cHjPymtWfiSg46re"
+    "323HJeYs3Mso+zafTqZRHqxW97a9tlWUL5LiNWsJyW30B856muTW9/kYr3xEr9VpuoIuhHVySamb"
+    "8BQbYuznnuBg9jLxpWZjXOMBUn60SULu9idKRkox9G5Fg3Wslb1q9n6GMEqL2Q7+wZdiHHmPMYGf"
+    "Y6H7WNr1xiudHvuGbDH7DF0TPnV77lHy+u/8D/dunqm391fXjp1m6np1z672biFz0DjM2IwIjAiM"
+    "CLRmAUdC8amsEYERgRuBABEhhlJryD7vT02cX27mfedPrcx/7b3d1P/unN6rmXrTYqEbivDhnJJn"
+    "lVwsQ9dUpQnFKR2VjAHXWV4Dg5zJMz6cOhYY6Uh1Y5k3G5bA4550NKmFwcWSvSXABK68KMb+/BdL"
+    "2lHiWfmxOy6krAcjK0dNIcrBaxi9qAwTxwbvJJ8j3XTpCRcvIseHT5kCiqpw8I6sdEKODZCKlg/G"
+    "Nc+bv12WAzSbn64FobzKKb5mFok52sVrScveBySjXwUgSkzwgOXqYU4PhBSORszRvIWY/oQgxydN"
+    "Sp5mk6+OLWnMHL8SGdZr51TCYBlJ1qT76RFlModRHrOHC8CETHRR3s26sEC5b44Os8kGwOQ9kj7p"
+    "aADk34mryPFWMm1D6rO7eZmKhwQZ3EIUvH+1Js/3IsEYgdy2lEsZu54J8I3exoBjkS6EUgbonaBs"
+    "v3eMWcaPk9MU0bFxxmMJigLMmm5exv+y6kvOjeAJaFDwzlS+yYnPg1wfiyrznQzVMo1WFOpe95i2"
+    "QVbSxZ8sjl9zx+UchyaaPjZHMoCIuTiHUz9BgLjePneEknL7K3wp5uxjkX+ugzm7T50le7Wj5rvr"
+    "7cMucfWingpIOibWOfY1TH15eiq+/DhgZ/hw51+bp8xLHd5U+fHXzLP9y8SsXclTf+h8Xy6HS1Pp"
+    "BMP3y8PRLkaCMCIwIjAv+RCPRfjv+I2GCPCIwIvOQj4PyCVGmzONhcX2yuHvz2annwPxyvDp7Ynv"
+    "zOf3p+fvObDtdn+pvCJUZKYCyvbMZ5nRImJV/+5ll5T17c7UxoSpj200P3K5+p3Rx+q1Xi7hzOqa"
+    "D4DLpJSElWvuneR44MyZ9xyaDVJ9Wqt1kZxbCi+YvyPdjpHhjRrI85OsDQV9LX4pp2Nfmn5NLybO"
+    "yXU0LzkXdyKU08dTlVeBRa5IOTAeliyXks/QI1GW2DYaLmLL5NXqgUylf8MHIp2T7wmoPkTU1l0g"
+    "qSl849WMyHZp57LS667cPRLBg63ghpZtLrI4cgxUlW8oIHLTH0DILf/mDPzksWnFaxfeYOkxbdLD"
+    "MWTYrp4VD0s6cSqC8W0Kx55gigUVjuJT5Mqk171Va8dsacYnaxAURmlaNq8RC1LV/Uy9zgYkFKOi"
+    "amMVHccINOB0scl/LQtPKvCj1HxA6iI57jGDs6ZaWbcyG/swBMRjwdF/yoGjtmKWQZ+ren7KCHJr"
+    "/rKWCDM0cJhYqoWJYGVD+OtyaB55x/cGFAz6WSMT4fF2RnL1LcggUt6vCxl/iAR4s95GBjylcB1+"
+    "T4woCWHY4hX3uxjMV8+SBqPfFtFcvIKzaiB0kkfqvPD1UcrxdHm4OT0+WVD50v3/L3r73ufT++Pn"
+    "zN75zvDngfjOT7mgN0RhsRGBEYEfjiIzBW6L74WA3JEYGXeARIWtTYOVNRarO7vT49fuIbbj/7qT"
+    "+xu/Mf/uJ6++y3HRycHm7IkKg69EU032x79UPfTOsJAE7QkrzAV/pWsICSRDmpR1cre6RHFFtTEu"
+    "ckCT3krIFHSbK89zAbCQSaxEoKtNpl8Pwt7CTfYKZZJY5JX6PCnaAkGEux0npoI+5mmb1xk5lEt0"
+    "zIo8lfjZxAeh/3Gbdo8PFJAm0LhEpW6U4JKWTbi2D7Zt+lH2phi2lIE6HFTw+tmLG1zLM0FrCYre"
+    "gcN+uiKFYfRwtZEOuNZUIEte1oTvzyYZonY+OWTc8ZLcZ5NPxOl9QlWJEJL/14Oc8N601j77lCYR"
+    "7msO0kXl018Oxf+2Kq8P0zY8TRaPihHHYB27E4Y+1JTgcoNp4XO7xqu9oDiYrjTSzED0R4syWs0c"
+    "IHoltLEkXbE49LgHupeN+HKS7lhr9kaCDpe/ZStYtckh0PxZk9wU7bjOo+tzQ8KXBSQAKDH5lb5E"
+    "WacMFEk4ISn7CPjeiEkHMy69LTOWFHg4MGDST6vY+vGndBt1/EuUi2sWhJhuJ9qUso+Sum50ctTr"
+    "eLG7vLr/nl88vf/XevvuI9719tHn5ysduomKOQi5V5b5ixGREYERgR+KIiMAq6LypMQ2hEYERgjk"
+    "CSnR7vFser7emzDx/f+NT3b29//K+sTj//nvXy2ft09ZC+WScJ04fsyhmYkhYKOxKdXBvlhAusJH"
+    "fp8bCDFIKsRiErHUHkssVOeTp1k46SsXu9Amkidq5kYjaQWsfJaTJEM5PMzpidvMJsnedDNkV6Fm"
+    "JTiWe6pmOmckdPxMmlrc6bTlbDi8UZveePLySbzUGffhkrT+dZBD/SrYOvJLvheWvnLhBEZpzENt"
+    "4wVM9i4QWn9cQrNxCjNScjtmF4joYoQdsRQT+Z/yzbOsGY5SlgGfUZ4Qsg23AYUTE2KLnELviFo1"
+    "1ew8F4j0bfvgBR9Av7ppUJ70SDzLxoHnIuAJTfiQlCvwsU3V3aoNLzvnhcCmgiWhKiGzqGL3f2z4"
+    "u40mdC9nEtcYuzuBuq7QuMEd6u5SNasTHLMB/TS7PRQMpqaznHvWxqaJZ7Hr/Qpuc+8fj9t5XnK/"
+    "d8HVf7JxsQbahmTfFVrf2Vc/YjM8GnnNuoptW5zjlEYeZ5pihFxJeQGreOm1Z2wTSosbRK6BeF63"
+    "64nZ5ieSbecvPE4f2P/vTioe//2+v73v4ri8XBbX1A06cN9z5ejO2IwIjAiMAXG4FR0H2xkRpyIw"
+    "IjAhcjQAJD/qHd+eJkudvevHJ66/F3nDz32H+9OPnon9wc3L2+XpM4KyX0vXUkiDw2XkmQn3SQ++"
+    "c6eQQLOD8sxZYEzNgJL/mSxiGZup/4zWnQlPpZtzdxM8p2e1YIpsZ45+QU/+bMzj5NPgqQPh/f41"
+    "MGkhAGNLIIMpf2YH8PcZrI1AWDhg69pNPqZWAeSeO+LYitR2qZ1DcAuQQNoGBEj3HzpSu8i63HuZ"
+    "SNVBObCYL6uL7XGKIBzgvO1f5G4R5VaxraDHmHmf1+1CKHFQvgQh9jLMPuvZS9SpIEPuLhEZvMv/"
+    "y0TvG6XzD7GBfwsVyrMBfjhmIrW6M2RWv/pO8A+ni0PHtPWvui+fgQD3yFJ3qxMgfmCclHx3zPbr"
+    "IzI1Is2NcqqCRcmNIXpgsV62luwE12goHuZBPlauWiR0R7Olfd1wYcCRF3CiL+QjBOEzM/ky/FuL"
+    "Dz/NEHx85ih6HOTfusATjgUnSZi0DB4IMdqbF3iau7ho4wntJmVYDrrKljbgHJ8fCUyOnv2q5eS2"
+    "AfiJQw2PAFg1eHNe/t5bPt8oGPHd7/tp9YP/TuH99ce/RDi+WlM/jLJQUdzZrpju2IwIjAiMCXEI"
+    "FR0H0JQRsqIwIjAvdEwAnX+WJ7emNxevdzrz299Ym/en73w39+s7z1+s2Kly3pG2xlOklQlQ4hT1"
+    "GnLDLpkcbOkpIq5d63JDkkak4rSaTIOtGlaVcpVA8guYFiW50MRtg2Wj2WSoHd8wiYasTIWaQwMx"
+    "fRy49OKDv5jDPRB2aSNwOki9ixcHFLnvi8VvagG0XgYLtQxjeXdYlaIjQnu8Rr9rNWHuzbvhUbUE"
+    "7asvEzc3i+XMdtniPyhdHihoifhVZ+IFdHcZprdBs3/GgZzvPNzJL0pw9vgtiPLY65ZR9rzI1jot"
+    "OQ1WPLaA+x+3s6xDcwYOx/LFQb6PutxlK8yGHURwH5cHOuiV6TiE3xMCxa3EofbS90gxTH7Dpo+8"
+    "0sVxhN9QQ1iH0sT+frRMWjHHv4nFGRz++hBmn2K4W/XY7Y7IcuI5x9pqijCVnEWK+JtgYTN6aAwK"
+    "I5GNGJWPltfgwShzzIKCrWqSDGL2wXhiEzo8i55I1dq4Opj32c+xSNvqS0i1P2FMneI48KG/zbqM"
+    "8llvryanlwe7t8za8dPfhtf2d133t+Zn31wc8uFl3MdUHecbADYzMiMCIwIvAlRWAUdF9S2IbSiM"
+    "CIwPMiQP6j5HG3uLO4e+u5lx8/+6EfW9798F/a7L7wzoPN2dXdwVo5ahJpkmg96c3frpMHZXmAPU"
+    "ldcLTVUDIRYOhEEJq/oTddRORp5EX7faRbX7Iyl2/PW5a9bWXvbuVWgQ5YSBeTWXDblm1owJwgNx"
+    "14i7VPZcwyMNVchKXrudElgvutMe0fjMnHxJJ5oWI9T1Lf/Gvs972JlafzoYhq4tl+tS+JcckUMV"
+    "5gQ8jgawNriqnxeqN9+WAbDGjsppgUTSCZIyuKKNUIugN/bxyjF6ma84RfmJhSN65DK7rxNKQRFP"
+    "+EX2GUXgrb1om7CDLv8kXqgYpusCTJcG/1qzGsKyaxSEOwuVaKryZnnPfRSahUrGtnMnP7zu+Pjr"
+    "HJmaxRu6iDgZ8FYbCOG1Tr2WmxagyReSb2kpmU0/EKmJ/wmOMGSmR1boElhemBMKBOAKVvAzxlNf"
+    "N3TQSN+PgLHXxJi4UUf/Y2ELIHLYPG73lyt6QXF3OAIgYux1U8/dWRJfnJHEEREYwtf4OiKDl4cF"
+    "HnuNHQYRWO4s2zFp1x3Z/JqqMaeIj64TI8oVLk7enudLG88vT5pTf/zKVX/cG/e3Tl7R9crI9u+B"
+    "LLJffUxQL6o40IjAiMCHw5IjAKui9HFAfGiMCIgJMah4HEeXG63J7evu/k5ue+a3vj3/yl5fZTP6"
+    "Rc55GD9akymTwFk5zGOZjzImVWSsL80l297yk4gUyaBUUpl7Mnp3pKbJPcdiKGBIlaUi9RZ0VYXt"
+    "Hop9nlcsnWlGDJsrMJ7TtpBZN+9pWKte9WlEXGrPTQSt5dbTo9ZJyGfDAnrp2VvnC6IQM/xMzHHp"
+    "OFOsGNJO8/y+pBLPX82dO4XwyMoCETOlQuHyuvM4cKGrZ5TcC6klbjOAb0hFlyGQhP8k6KkcE9y5"
+    "YdpsV8I+ytBHBMzczySRi6hG32qPjINn75bg4xMIbZwTIBYjFAwxd7JzKuahwbiZdlJe7037Ktm/"
+    "Owj0PuCZPNKgyrjKiVUbAS58n2ZAdvXbpi3scqRYIGMmVfXJXLywvFIXriC8eK1QeD+fBU1vjWs9"
+    "PYBT0u4k3oOVbi+SSxss9V7OYI2StCrMYcsCkMjZGg8Fn7dzrSFkBG/2xDgisKH9GwGM4sxdxz9L"
+    "MFO6391sjQGMSwkC0j63GqBCZFqzMv5PBBa2H620F1plZi+BdchOb5t6l8mdIxQKkU2QvYcsQDI/"
+    "LDD0LxU1ApTo0eniUVb644QHx7eOd8/dBvrS+/9R9cfvUP/ZPVpdf/tqjH+T3NA1Ls59iMCIwIjA"
+    "h8GSPAX5fRRgRGBEYE/v9HIBmQchegDnbrg/ueO7i2/fnzxbd/5uzm1U8tTj/yn52fr19/yH11Th"
+    "DJt5QYkYe5QFGCmNwpCZ1ofINfz0MRjcStWiVzTilJtoIkHCgkZCWHT9VnxyekFmj+XHCQv6X1hD"
+    "SiSmHXyaaFZh3siynzSQStSTJquSR/zAUNzxFPym+vrlSRpotWJcO9NeSgccTzL59sx31b8Hzgu1"
+    "C1h8wxwr2voezxEz1E8ZQnGEJpOna74Wu5YH96OiTZ3TdK6WDVl8SCDK18Bt28JhEj81ugufFpT7"
+    "FciYFcSiquho4ZnnMe8QGiihnmnfm0/56JBLJyyRmybyMFD16C5x9j7nxNI8C0PvMk4GaD7vm9eP"
+    "TqHMm8xXeQCg+2ZbDcmBDU5HcXZpGKBNOKEjLpZl6hr5mv6JmvaBJ2X/S8FiScrIKxsoSMWnXAKg"
+    "kRwWI0N8QoPP3rKXLe/5fYWlL8tU6+lHLx7yJCYwXVBZjtSFaxMfXCiaLjkilZsYs5/JhiV75bAL"
+    "oY+DfFBYaFtWc+QGo8FbPQ+Ge7CEssnkxqPh4+R8KNELOkWuPDDwU6MxC4CjmistIS3enJ5sby6H"
+    "W/uLn+7r91+eXv+ufLg5fflB/6pdZjZfwkS6ONzYjAiMCIwJc9Avp/kT9Ko40IjAiMCHwFIqBcZr"
+    "u7sTi7fevhk1sf/rHdnY/+N8vzW9+22dxZ6g0GlXxVYkQi6tSIjIyP6Eq8kntVysZAZCdTe3+6Sp"
+    "ocrjU9maYzUCo2XRrmP3ti7vNTjCTxtZmYF2aST2RtfNqH4mEB2b76TkY1wEX/jc0kyh5zKl0L4B"
+    "kN+f1iJA70e7EiUx6QWKJROCnoANvzKRLeQu9ZRAdLSoWNk/QUGXzddw3li4jYkJoDGP/MV1Vu36"
+    "1MDJlHGisTHrhCsXKKBMcneD66Kg5YBTHF+Oh3PPDeUto3PvY7doiWRdEm/wIGkFpKk5QgMOJjZF"
+    "HXlwdcTgdM+4aY/F5yPxRd6eRMsohlbVUyjRNcG579wHfHZp8eUwJUqxU85mMRNnakxvNwJuzRSl"
+    "SUUuNoxJNp1c5jBMJhHyspiXpeSNB8DDO5EPC/jkt4ZoaHPGiOm1xoWc95EpEEGBoXPQjxZ44f8s"
+    "RLu0Ba3rJ1DrUsZ0TD5RJLSVlP1NJvFzoi9nHPPudDz8tKOgezUgqdow4VbZ0bfS4XVa8ckKq+KD"
+    "g/356dH356c+mbfvrwkR/6W+sHvvU39KXWyWLHg5/6Dx0O8RltRGBEYETgyx+BUdB9+WM6EEcERg"
+    "SIAMmfEyetO+2OF6d3bl89fvbj79rd+fd/fb34/PcvD3Yv2yx361XdgENCRtrke4Q6C3OiK5pkOn"
+    "kDN6sOmKjEDa66SfQqaZrsi447+vRKVqdVJJ7YdHEjPis/9kECyPeaoO+PcTKpBA/fYFbzMMIX6P"
+    "hifPaW1ZaOZLGRVgSNmV9+5FP7QbIopzU0P1psW79gvGtaMK1DN8il4dmVNEwuWGP2FtS4bGno3F"
+    "WQ4MQ75oMqMiKq31pQvdTqGBU/RG09M2nRsnVPGNEHq5GaJklsWL6KnclaJeBTMVeY7ICRHv/cjF"
+    "HkSZ9LKYvPvmXkgy+FjOKsL0xgfcmckZPkR4AtWPnE+xprN00LibITWfSCy3Y6An78fWT3dQ0vJ4"
+    "AwXR2s0Dzl2jNuTs49uJFgG1tV8IrQNDjozWON7K+OHXHxeRJu20WDIzv9DuGTdYQbJzUOHwT0iK"
+    "FlxI9MPILfPtgrD4WPbb4s0BhIy/kXHeuhhRd9CwJkWfxFkR38lsnvMOc3pWx/qTGxmavlOU/6bx"
+    "JzM2j5zZch4mq5/fxsd2u7fujXVve98ycvv+wP/ZODK9/4KSmeBn3/IigcGW1EYERgROArE4H9vz"
+    "ZfGQsDdURgROClGwElRqR968WlxerKwa31+o0fOL557dmzO489tth+8k8uVzffqIzogMsGnbApSc"
+    "rlYgoZKzai76imuPzNCywkZaR1lZzBd18d90RXV5qOud9lt2ak0gww7qXxv5YuJPHmBLawy6Y1Am"
+    "fbBt7bOPfz2IYFPGNGbPbXMBabAHFErcbq+9Ku9lLk8iY5KSMltEwlrf1mFCLb+IxmaFO8TAqiE2"
+    "rgSiaWNHJRZjO2ja2gYIOGDPs58vNIgIGHpFboyEPnU2DYT1db/fg4s5fIPsaeysyIIpJqDCRVtM"
+    "g3LfExpmSKaq15I2rppoBoi2DOGhd7bTbIwSoQs2S34jjxzC5sTpoEUfOGpli6UJnxIjJbBWeyUL"
+    "FLcbRHR6ghas8uKCH4qFm/BSPQ7ppvlssdwVG84F/AZ79yXnsMS/w+ogx5Dxurwfm9SxHMlA0jY3"
+    "veWNnnnYo3GnJuGEWw9LDlXwTGlulzMeLeis7vPX9TrCilyMZiHFDfP/1VDkODZ9GXp/L6lQSCsF"
+    "GDKRIqLvXQXiOd68Eni8PPLi6/8WfX17/3J6898PYPLg+vPYPVnW4Y7i+D7APE0UYERgRGBL6CER"
+    "grdF/B4A7oEYERAUVgLyHisqWzs5vrO7eeeN3u9kfft7376b9wsHr6ezZrFXWswjmpJSFSoqVrMk"
+    "lyd1unT0qQSCBJj5Rccb+SM1DxQ9RYF0+RvCFTiSA4yPMS8+mhJfcclKSatQpgeQTAVUqmrDCIkO"
+    "KH0kUjNDYGYTnlmzNRIKbWPlqmqRownmCnzp6Auz1BDTTn6GhvWzV/WBfARZDa7EL3HD3Tfekll5"
+    "dhY89241DPEmLzibcvP2PWoblXAy5JdNs/Jia0XfwDSeMJQB2RKErCKd6kF8Fp9Sra3uZM4Dgw/4"
+    "oF4m45Ps0LLVgX+ZiflMQCi8vtypv2i9iIhpe5rA+U+Nz+B7doxpxxS906kZO2fWbflIoNuNV1sS"
+    "a2hzp/2UehjoEInOdeVTSzsArTvzs+LjnmximRnMPgICxsMWNP432ffF8gvwf6moEvVu5prbdfCD"
+    "fNc7O+5sS544kFAB6/ojHGudNGMxGfRvV7Zlbh4Pd0vA2VWRnarhO/ohn13mNS/BiXhPziFrc+bz"
+    "XHxAR/DOhdXAd3rb9f8nerR/mur/3b1eVv+Xu7l33vP79y9U2P6d1yx6v1oWVy1DIXEUYbERgRGB"
+    "H4ikdgFHRf8RAPAyMCIwKOQGWvJExn21vL7fHTV89uf+JdZ7c//tfWiyd/eL081ovISbhI2qShJM"
+    "4PYiDFIplUVpVUjXRJvWRZyQXVR8UFXcmZQE6mosyvSDBmHQv6e82patE6DUsqGDtGn3RI+mhs49"
+    "OFkQHkM+yac5JMpC42RI0luaDBT5/kEbvIUHaxd2yQtBJjEvoaoHpPS/LbxPK1jJ4TFxJY9EWD7K"
+    "3HwlWSm8S69Ws6F4jlC8fCbnD8Sq6c9NyLFyNYQs/ECXy+3BESPPlrWOQR7yPSSbeJkoQuGfyiwH"
+    "EhEGxbumAHenjsgww6I5L79EwoPnbP5Qj/UtC1PhTOnHiAzko+OJ4GynFsG3GD+ASnI559YUvf8q"
+    "0EqMxhhZl5isbWmODArvkx6ljYsvRSt6gASSAtDw6I7V3ba/8spE38rJFtAQhDH/bZ0Jmaj5HnJw"
+    "HJ+bgU915/kQUGHxNbdFRc7s2npmgh38MGFkr2QfHgSx8IKhj7b4UFhBF72efcUh99N/Vsh2NOdO"
+    "vD3x7jwY+I5+DLPg+EeSrJazcWBy//F5tLb/sbR696788tN6+4fX5+IAD9vfKNwRjA0mwNymgjAi"
+    "MCIwJfyQiMgu4rGd2BPSIwIjBHwAkUSQ4ZGduTxfnp04u7Nz77+tM7j/3nu5Pf+XPr5Z1vPtic64"
+    "11EiC583VT51kdcCLXSZL27mbMlsQQE0ZXJmgahtQYkQy7tYyTPpLd1mtGycFwRhmkJMKRNRm8yj"
+    "g9tZpXa+/vQdhvdiVKWQVUn2EskXhiTb6ZiDQrNAhYs+gi19DYbWSfZgaEi/GwIr7vrbp0wm0VAf"
+    "cKXcYNrpF8YkUjqOGC34UMsHYB32kmkDDPGCYVH6p10QMbHTVkaKD4/qX0sGSqZVtYFLpAUpg12Q"
+    "VY49id6Eq0ZJiHGVFuRvtevEnL/kU+sMwLBI3kcIqRlmZfcaHLDZw07dDoV2dw3H2PggAAIABJRE"
+    "FU4rpg9ypW5l+SU3GDFZuY/IKASbwQWmHWVM0LBpRQZ57R7AOCOddE80Gx6qTDyHHW76Hl9uz3MZ"
+    "tkZIBVcHzik7hetI1P7Qd9MFhEdGiYAxi2kS9zLAsdPd8zSS8ytgFP8jwkFv/Ssso6f0FATNGzsP"
+    "cd5eDzGhU1f5HUXkuDS2HlEC8K5/dEvbOT3aWPHt3/1n90ft97//6VB9/0W4vlA8eLcz30xIWcnL"
+    "Ad9qONCIwIjAj83kZgFHS/t/Ee1kYERgScsCmVcjalt2md31yc3X3uZce3Pv59Z7cf+4vLs6e/92"
+    "B5+8HVwXLtPIlEjnyMIqLysozBAITEC36nbSSUHWZkrDqLKUkjbesEkJUq9wEniSvl5ifFC57tx5"
+    "jtJqnkKXY0O1FdtJI22gGPxMIX+6ayw6bki0BZ2fFlomDwIxkKOgqEXIZqJSljQ830zJeMePYRuZ"
+    "JRLyPG4NTYk8jsWi8+JCFNQq1Q+DI/dMt2w3pFA2oTANZHdM+5xKVoVyjKWTlNNNgzM8/Oc9/3Fx"
+    "lfnmfVLmIZUIS0PXWNEkRGtK0vL0wxhwu8qS2+R8/TNkUe9DllzPCJCMVgWmGLlWPRZOFbXBt3EG"
+    "BGsRSpRAaqQ1HyxNUP9+HyQXTKoTw4RPqEsGJrnOInflDiIXKcO7Hojj2XtmJA6R9Wqee49wBeNT"
+    "R9FtgftHvuLdF7GVS8cq7jd1tmfrJWxx7pXPKMAJMRunYgezsrNoC/NOCLG95jZ1+QvuBrdD0r60"
+    "cuEZewDPg7n9azDL9PwbEb0OrDmKPDEL/c572YnA9F8QGHs9WTTZmDPrvt8tnV0SO/srn+rh8/uv"
+    "4HfmZx6ZVPSFz30B1oxyT7o6777EcbERgRGBH4vYvAKOh+72I9LI0IjAjsR8DJF4mQnoK5vaOc/b"
+    "krpzc/9+bt7cd+7Pz4Uz+2O7/1zZuD7dXNRnd7TVmbioZKxryCJ3WeNEdiluwRPKe0TiNJQpNcxj"
+    "CqnYcn72J1BH3JiRmXwEijhw6fGJ55Jaz8Tw9AkGKSTJAAsgKbC/bLNamSmIplgXnjpN9E+aU9vo"
+    "LXfnHpqRNr60a7vLd9KF49w77Z+BK5XlWztT3/OoEmVPEbDBVI2pSm5878iKzF7BB9z9aQHEfING"
+    "Olm63j0wx5LDlkbLt4thXw6EwgzCHAiXF8mJxFWnzHC+8oirTrY2Jci3QPBWT0ATfQ3nE2oJtGZD"
+    "0rbdWTbGZbCpMiXs20xESSyE8xlAS2hJ8ntNLXp9WMjD+yNNmXCA29wkHcbG1c1Ing4kWK4MPvhr"
+    "fw+gjFfvSDA5JKa3b2rbVNEJE9LjVd/qllfqHxuCPuxczrJvaKLRvgi47W5f2KiYlBAiRubHBeYS"
+    "euRMfxE514tJx7IpgX1fDlP0Peq8iE6LOix95Fcs0vsShFHnqic8WF7IQpn/XFgJ/GeS7+me6VWz"
+    "34ifXl1/3j9YPf+Y8O73vbby4PebdcHoyy1O/+3Ap3JozeiMCIwIjA71kERkH3exbqYWhEYETgRS"
+    "NAwrU8W5xvb6zO7t542entz33H2d2P/tnl2Rd+eLm488r15sQPZmAxwcmncz4lbhqTsDlfc/ZGIi"
+    "eis0AwUaBllSi9JHzQTNfOBYYxhYeQeA3RibDJ0yZJJfftbGXDqSuKfOrb/vRBygNXDGgfSSKdSh"
+    "vNKu4xF43wR/86wS1WZMVvXta4IONrJ9vlvwNSmthUaz0PMGovPKqNiJhn4sxLVBc4cOOW5TwF9w"
+    "xi2U6+78Vs2YkPtlq2muHkJ/2ih2kZW7BM2Xqez6Dl+Be0MekHu/UkVoVtjo/obXsSobNX0DVfNh"
+    "P1xHiaI+KKe8Tm44L7aDCb9mmy5YKjTUtHApFFiX4Kdo0y//IhmOjF2RlXHJj4rU74JsQDfhWk03"
+    "pI7jefm/ggmWjtc9Nv//JFQeyHg0bbSsHmYYkYG5/0r88mGYqKdvkt0J2i+v2xjT1eW86erez4B3"
+    "DOSs7+YE3ziyuzCnglzRFxjKrYdyGnPr8TfZByWa8KNL07bqVK7ny3fma3fuTnr9z/9r+/eug9/8"
+    "/i4FVfWKwOzyjm/KXR9LclVtiONiIwIjAi8PsVgVHQ/X5FftgdERgRqAgkSXPOpTJitzxZnJ2cLk"
+    "7vPvmqk1uf+JHzu4/91c3iqbcs1+dXN6sz5V9KxJz8RY9kcE5Yk0STTJKr0Zxqq8/lYEnEQnOpJ9"
+    "JOL/7Vi4EtGyWnlx7nPifJoOqGLXWUBAc+yaXrqbJXgt65OFLP7pZGo+dSypJG1zbaUCXnor8A7N"
+    "58S/8FdtbrjR1gEHx6uTwu8ZrjN0eAiPjeJgn3bNv3xmnOOYmyWs/Xg0Re28RsKkLM7HlqMAV3lp"
+    "s9vchHFRz85Z/l9vTh01omI9myubIZpbDMgC8idBdGe/Il63PIvFIzvc4Z+xJ1fNpvFoMG2fjpx/"
+    "d7Yh+nG2g+xqK7LJrmKRFj7Vna403UEppWqO5R8jEtnPkeRQgpwvAZFVxn62LTk6hZisFTYGn53a"
+    "KXSLlQpUC1smj1hYMLxwKd+kCU//e4aDzfy1bFU+O4FFNx7AehUJj1/NmLHrN1fvC7bftQi0ZJCF"
+    "m4/gIIjsY+j7eL7eni8oeOrr7xH6wfet8/uHT9LR9ZLC6fSFpSfHXDh5a5pz+2IwIjAiMCv78RGA"
+    "Xd72/8h/URgRGBjoCTMiVJrGI4JTtdnNx99ooKu28+vfOZP7PcfvJH17sbb1ovji/pG3TVbPqynO"
+    "Ku9Ssb5PHqPEYfui8Hc3GXJI9xcj+S6XxI8Va5Kck8Lu/shzuQtHXiGT3hOFsUp/S55PPeFlfiWe"
+    "unaEBf8jVNNJF1yl50Y7URBBUL6yBl4B7Hqmmi53LM0NgaLo4wmhnVC6ZdKXwl6LVaAmYKvgh7Jt"
+    "q0zkUw+QNBBhOTcPf1L8pb2C5Zs+aaubXkvr/qx0Aztb+HD2XCQWw/Rnv6noiFEVIDh08f58btPW"
+    "y85AhRwDW98XsMJ1KEvH2RwgUdjyYV5IPoubuobKbQ6prKnY4J91hOpq0T3fmc8gyAT9s77vYFWM"
+    "+9LSLG+YSvxcO+W2bi4laknJuY1/wtGzlvJxV0ykShMIIWA+rZUKTyOpDGprIqJcfaShPJTDkaNM"
+    "1bfa/uCWqiWb1tzFhTge73yokOvj6ZN0Z5kuxGl3wLa7k7W62OHt8dvPrnV1e/9f/YPPA9/+rg8i"
+    "ueXvBQFDe+AvLXQDVup2s4diMCIwIjAr+PERgF3e9j8IfpEYERgReIgBM/kiUytjO94uD28vjOcw"
+    "9v737ye85d2D3x/Yer575hsdJTC5Z5hxQJWmnwNXvlnaKQP/LxSgLJHIkbSVklm3rwBxdY+QXkID"
+    "jZEw+dqZFMBiYkRs9vF3XCxy8/WAEEZ5F7RUGcMTbSSTIbtxwoIiOsTkWPCMyyc3DXwK3qvQUC6g"
+    "BcYGbQoBrtz4iEl38u7qZJIfxiLUDoTDjqOHF+MRV88g+bJOnPn3/HXcjICMsyVsTmfovPjTX7gi"
+    "5yUKRffYOZMeMw7BWgIMNDP7YZ1VlTdDyK70ZBTl8wGNbWxHYztwehWFZdseyrJ6bz0gFEnvNELc"
+    "Dps41J+9S2u6iD7ZU2Y3ik+WbeBWTfMDU1DS6uzk0c2cKHCGdO8DLf+K0vTqw/z6+hHTN/OQCFSd"
+    "YXLxrmyxIhowtkwDRO38WauqwOOzb4EKb2pUH8JNMI7otnP62H7/roHXO+X7VtRR1D4qHN7/6B1u"
+    "QWN1YH1/7N5tqjP7W4/p3/18Hltzy+3hxpVe6SBEHP34z0UR5tRGBEYETgqysCo6D76joew5sRgR"
+    "GB50WARE2vODi7fXh296k3nt399A8uzz7157Znn3/nanFyjcsw9WIDJ4idFCazoyAgaSPJViZHXq"
+    "Ykrgs6m+F5507yxCQRRAyQdCSSftJHBNEHSLiSAZ/LtKbE1iLw1QpjfliHpWH4xzJly6uC6FonIv"
+    "D3XYnd8BCdQKSTsYnTBi+gRy/Jrl2Xz2niWrG0y5h1SqLlpvldoF8c+NI+kSY/BV7IDVPzEVUu2A"
+    "vm69be1nBfc5ofxUTxJz3GwfAxZljYGRe+5eOPISgMzCo+em5VSLlPzDjGPY/IxgX67UzFmQIC2Q"
+    "u+AQRN0nb+HnvlF1gUF8hGDIXIxgfOt/INs2ax4XzUEHHvyyfvRJzwo1Jc6xWIfiVQFMk+sE/DI6"
+    "Y4Qajvy4SL2FGZ5dODjp0Ul5lTXt4NNS185hpa5oYT+Jy5GMTiyFgjfGgdC/oVdx7Mwm8YP8Qs76"
+    "0DU83ffNRx4JJJ3SfngC12J9vFgx9ZX3n1z1699uZ/trj+7l9drB95lgJuxyq/LseeG3MZbURgRG"
+    "BE4KszAqOg++o8LsOrEYERgedFQGXb7vbq7Pj24cmdp96+vfPhv3h+/Mk/tTq/+ZrDjZ4gvtFam5"
+    "NgvplPCggEqV3/c8JH2udEkiRRT+nTt/h+QTGXuE3JLV0ldeSHfJPvrDbaSRHRpTHqvkYlZ1ZtKO"
+    "gsUz6RKNu8xsGCTxLcSTv+XcSyPGL3NOvbJv6iw779lTC2K5lNP3INE38j1rTsUcxqE7j2bc/bi7"
+    "I9IsozVkbFoxapAqX9CGeOADHgp5N8DyxUMjVPSGB7aij4UzsTSx7BPf58bKJrfwozeByZWkkqTH"
+    "Sg2gp98NVC48sAeNCJUH1xUPIlGn7U1M/8snKmkX/YCIvjpn+tZzsuPKHe86WB8UCjedL37M3Qpv"
+    "zzsOUY9KzamsblCzPxDyt00OxDdFoaPvJu7mgAs2nu5P60zKnjil4VpogXiONKv86RjnMMAIxB6W"
+    "mXsgoMjAldesymj6ddEM129Dvs80lEbqWjaF5pvz0jnpsnV1de/YHDh7797y0vve0XN1de/9RicV"
+    "XXcWMOK7FkoxqNNiIwIjAi8NUcgVHQfTUfneHbiMCIwByBZGpKME/1NMzjxfbkuZef3nrij5zf/c"
+    "h/sTt9/Dt0eeb1w82JnpPA8xm5cEtJm5M9FWbOzZypJQEkY3QSLYb63AfHAxacvElsC5uREjvur3"
+    "ORhCf2gQ6N1Df38yhtFK7YQJRM3m+nocaQYdDn6XzoJdHV3r5EiTTVXmhDfdnvp3PSGpAgAYSsdJ"
+    "3OZhiat2yK6Kq0xpCU0TppV99D24pPGE+CLPuEBifUMJ0e/fgOAdfr+YaRKCHjl0Zf0ufVHSfsEr"
+    "L/s1TUgsvVsfiACHb3wmPLIqmhkQ+yCFpb/STw0pctZuWGKA2+9Yg0LRhIeYWsjVoeGXXcZyPNsg"
+    "MO97Z1kYGQ35/n4scKVss5pTMRXD5qRJ85xl8o5aMmyvkK1owAn7ML9fIHXTniefOuQPsinpW0mQ"
+    "KGVvtc8y0fQGW+Pn9Qsc3Yta3yADkDgymaHzZUdhyvkuO3YG4WEIdfOmFq6POYkQZxz0atYv/BsQ"
+    "nFQHu6RCo08fRDP/rECXvw4bVufudbxgfLsSNWq7yn8Pxst9pdOt1tHvit5cHrf+rgkff+xOGVt3"
+    "x8sb6iyyvB5H45rMcDde7phzK2IwIjAiMCX20R0N9S/lKONiIwIjAi8FUegf5Tpb9ZFGs7vdd3e/"
+    "rM4dmdm28/vqX31p18+Ed2ZzcePTo4vm+94d4Zrdopp+SxByTfTtEqKQSKB6ckQ+fyKgj6ceKKkH"
+    "889kodNtv+FCaST2FT9BjXOwOR+O+UtZNv4qmfFikOEC6SKmuVhGh8qslIfChZEtcyjEq6k3RkdV"
+    "kYD0SxdcmAyY8rQiGn8ECnP2LDLxiiSQstIzB4pxccEm7E42spoeAu+HDhQ5KUxp1nT0YsQKFd7d"
+    "45ScdhbEVhE8OUBNLROFbYE9FEDReAcgTRnZr6YsyXE4aBHOdOx9TAk446QMhQiiT5y9iFP3vwyp"
+    "ZF8cgCNaK/j00sUJMeTlpW24pPgiSyZwmXOUm/YcVJt6IADjSDokcTpWNmYSRiKUPNWB2+RAiYES"
+    "yRggspWoqhMhBSbTG33zwXgeZYw0GAsr5MiDPnFaLqHAbDvyuag933XOjnXMk8wIocfjBb+20qfk"
+    "MEWzK+wY5zvv3GOjI57R0jPNKllRRzSB7stsenu0uf2By+7hcW97/zHx5e/7YPbo5e9oXcJ8ellW"
+    "CwD07GGo42IjAiMCLwNRCBUdB9DRyk4eKIwIjAXgTI6Krt9L6o3e7u+uTO8UPndz/x7Wd3P64Vuy"
+    "d+dLN+9htWq9NLayV+S95vpwSUBZUuzuacjWKIDDG8JHEkdtWczZIY6kd2nSgmIxWh5DSOS/Gr3X"
+    "NBJ2AKODhIlwRU9XtEQZlEVwbMw7p1SIYZ0Aqg9RCwKy5ZSVn3/Qi21RDCmkmUtyTBNADYR7ft2B"
+    "dRebG4E2rEmom42pSw2+8wTVN3f242gDE/YMOq2eCMQB2Fwmderk3auypSsW37xDsCkgBUH3ZTA6"
+    "gJvRdTtoztyUKPdgXE40BkHjkyiokDhjz0UCn0PBft4GQO7CFAIZZqZrJLB+25xU58YkvBpkbxbp"
+    "ZkLa54hCDUOi9sQ7IEBBnHVRgumqABIEbzNcrRzTrq7A8eIcuHNhfbDRE628KkN3X3/LYE+u0tvH"
+    "kOqIdTtDKJ+/jq2DiusWTV/bGRmZNQfU4ghwVmVvEGitZmufdtdyhBfrfWenrS+efPFvf9yuVrj/"
+    "6Tg5f/0Z9bHL360ypz74qnOXUxV47h8GgjAiMCIwJfYxEYBd3X2AEb7o4IjAgoAp3YOvkiudOD6s"
+    "5ODs7ufu7+k9uf/q7zk0//J4uzz75vs7v9qvX67GDFjTOsmDkjVUEz5ZZKpuk7h1OaSN5oGRG019"
+    "DpdpLf5pV5MSmNVislhWBMPvURupgYhg0iTTx1MWXbdi9pavihuz7BFRHtc9swITAtP+3bBGzwYV"
+    "ivlDw/aAjMwnBpiFpSm7YfesqKKVlvhWhpay2Pnrdp0GbszaNhHL89OuPw7Gjm0vzMynOgSKdR3H"
+    "frY3HhXX+tU/uWQTOes02BkCMhu5O9CVkkyVshscsDbehnvI+LlufgzSQiybaJDaRo6gR46sLyuQ"
+    "WKOukjWoAq6OhZznv1igeND3PIvaWM4Ytm9fw+4G/7E7pV0JQ7EtQKV+5Hq7ISEjDmIQXdllo9+A"
+    "ipJR7Ft11o+s2Rfv7hH4L8XiInb7TDtsWtGrqPj3WNjGjNJTpQtRYnfenqi5TzxerG4uDBf7s6fP"
+    "QnNw99+/99dPUdurzy/tuLxSkWJNvFHHrlHN3RRgRGBEYEvsYiMAq6r7EDNtwdERgRqAg40at+ZX"
+    "55GuaN5endG6/cHn/mB7Z3H/8L67PP/sHl7ta15YHSOz0RM6sRSd6c+Cn5c3K6B5tkstNUMUgQSW"
+    "D1cdIp2yTBpP+89iBFBUnllGEazSkpep2kumfWvKl5gB99zMx9CxoCi/e2YN9LFVDUWKFwwo3cnP"
+    "++EFIE2oLkKSD2ktzcw7UHYoW9jbPwvfHUbUwR6MaVcMtPMyxWspgv8Z5LFNgik1j7OFFwUOnUKl"
+    "MXBUj6mO3biObsgnj8m2xN/dho2/PxKP+sBT6AoWE3ONnPoK2DR2kX4r/vHwAogjWdA5x7zDe6MV"
+    "l+4wB064WP4ITv4k4CEz849lvE2OAs5lxvv23BuOHHRIopST7P5Dy/oOyZA9VzKd/K1fzmMM3odk"
+    "mOJVu339gS332+OtFYxRxPlV35GuaeVObkSyuR1XrcYrdZLDf3ffLgvm/86eV93/G3D6+97f9dbK"
+    "7f1D1yguFvABbRb4zeizTaiMCIwIjA12AERkH3NXjQhssjAiMCexFwpqcxe++2emjKXX1uHJ3cfu"
+    "rR8zuf/ZO700/86O7s6W9dbY4vH2zOVIFlNSAFS5I7kleyVRcuJIaV43FFph6NEnCMVEZrsyqYIp"
+    "ZtJ6glrF0nzaEU5MSeknQxum9cSfB0zLaK2aa3cuxfGCV5FgkegE7I1Y1djDAgdd/newTFOunUVn"
+    "N1kj6JTJ17xcp/EnLZwRT2DSkdk4gtPu2rgmepySe4DvEUEGRSbsyqVShYN/p9+aEdEantWwQE8G"
+    "x/34/g5MEt2M0KnTHwqKDdMaZWo1xkVAzxNZ7HR1zV2OdS+T9LwgOQljnNfYPH5xYJEzT1OI/o4W"
+    "9pqbBxrEtufxeREix/PP89oTqNhQc+WHuNAera7/Lejdg2MXKzfDzsOeGf/ZzgEo99+SkmCFteOr"
+    "4vrpWYZ18GSjHHTHFGPx0A3PPJpAee8Et6dqK6fnW6W17/3PLoVR/cPPC2n9hd+9ZfPLr8ys+u1v"
+    "fFvenyyrYze9WUsR8RGBEYEfhajMAo6L4Wj9rweURgROD5EVBOR87n5qxSD0bZ3tGlmLceOL3z3H"
+    "ec3f3tHz0//sz3LbbPvXm9vnNtvVbCWPJeqVNymAQRoLklf5zBk0RLkWQSnWJZTn3nmIYInwLRTw"
+    "cU5JTINrzl0KHImJNVxjxl0g1MZ7I4G4X4oCEkWunatocQzKnVx6TEUaiixQINULL4Coh12cx8ek"
+    "25OA9RVRRAs/Ss0qAzzAxQaBEBufGhBIKkHoVujMXbFzSrCTCZW+SM6bkEI1gz3mRD8vUj3Z4/cv"
+    "pESH2OT/zh8sXG6vOFcY5h6UnD+hNAzw9AfRRndoEPHppMsI8hQxr3YnopuBi2ZUaKsMyYM6IADS"
+    "TsKgBRJm60HFsNhJUVVz+GRZqgtDewdfJZCTk4FFcByZwNUTIglwHv1WdInFRo2W2gW8S2ehybnD"
+    "0R0N6yjCnk8EvNRSeM/kDjF4QV6LWeTXl6vF0cPHG+esWvX7766PvXD373+5dHr/3wYnMox7kEs1"
+    "fRpTK12J6GozMiMCIwIvA1HIFR0H0NH7zh+ojAiMCLRMDJY5JE7q3abk8Ptic3Hjy59cl3n9395B"
+    "/ZnX7uDy12t950sD69vFqTXCfhdrLqhFK4le+JpaTRgMk5xVjyQnI157xKuFcUNBok595LFFFz8g"
+    "x+0lb02gSwYDsZh1GNhJqnTNKcUKsb7CIYQX2boiAoTDuELLbKJopFFwkAC5Pwe3VmoiGXxN6+uj"
+    "iqqtJ0dC+2zEMAYNiXi/xp1PZnQnqT4xoGrHDAtGNi9B6VPSP4RKLvgodjyFD5u8XZNCB6Ghtvpq"
+    "WHHDz/SEMdGJO8uhq7/nK8iE/adDw8BCctBXzi36jBgy+wwmeHVopDyByxONLYHEdeedDoXWjlkM"
+    "4FnQVMxIak1V/jtxzvwi0c7leTJWGCzWdb4LFv51BEPHaFAW+lc77P8fhcipYFD4XMweez4uXzyL"
+    "bskgHjU3Q5dKjHNkUjDZ/Lj9rlCwOxRF+qfDvnxeDnyHMJ5uZzq6OHf/Xg6qM/u7rvB3/p8L7Xfm"
+    "yxPNDllRw1zl9eRUBrsIzGdkRgRGBE4OspAqOg+3o6mmMuIwIjAnMEnGg6h1SySQLJg1NuHpzefe"
+    "bBkzvPvP389JN/4vzkiR9Z725903p1W1dVbnNvDrIkmWSoxnBamuS2kkIoTrZFVarrVbp+5xjJaO"
+    "ejSVXz6gQc6+SdPhisQfRFm+Vu7IrvK91wm1b77GrrbBgmierMYRQKCTUpL+/S60KkgMTwqgUSjk"
+    "0g4JICszLiRJtLSlXYpSiQqGKyPweJagzGvk0N8Ec/hBD76DNfE1GyvwjQB1N89UnszdKm72u0Hy"
+    "KDRGC9Qtb+AbAPi17dS1fI7CyT+NqgpbSRKkdAtAo+9l3owrRhdhwh2XYc7IgAE1tDW112m2VzIC"
+    "EjZscPfsyjphYFSHN06KVF3BFRBHM8XFDBlpDdY+8+WpxLtPhCPD2SoPtsbDJ2efIrjTODdS7/ju"
+    "xPAiYi6On8mX8fYATDe7ER8zki/TodIIQOk+ZTMK83YMhcfC+cJ0pxRsSCQ+G65JUDCHpLYcsrCB"
+    "SP881irf52t/nC5sqDv7q58oaf3F199y8fXn7jx5YH9x9LnhNFekQjEQElXqY3tiMCIwIjAl9vER"
+    "gF3dfbER3zGREYEagIJB2srLDyQr7RP1ucnd3WLTdP33dy+/PftTv+xH+5OPv895+f33lksz5drz"
+    "cqJUjCnWaTEiYjJaEl0SQRTeqJGSWMzqiT986h7/IFHae7ZklVaBobMrx+hxyY0UI0BYF9t34hS3"
+    "+SEwamuX0IKrrG98qISaV0zy5OiEiym4LBNR0+waNpn6cQ4nDlx+JHpGQ8wj7zCI+cHUSjoio6BZ"
+    "3nkY3hY5UuhYJsMYnGL7m5yBHLbFcE0ol9Fzc4hKJIUBs3fV1ya0bJI6cP9vQfX3jecoQ1Zh4Ugx"
+    "hTH4kq5YoudcendW1ZRBq0+JFxtnYPnmoMS4SwJxLfxCy7zUJa1vvcoUahYV8Y0DtmGoiMjcTdPM"
+    "MWNmqg1bnLiJZjpVJR2Kzm+VgJo1fw7C/GdPjy7kSA0I0+9vo7hcQvPL/QXby17NGQw2lkrE/8Gf"
+    "keOR5QgiclW/L7rxLQWqPukZPq9oSVcL1N476bi6OHfuPgyuv/z921t/zTg2vf+tHV+n6dQZwxBx"
+    "NWY2J7tBGBEYERga/3CIyC7uv9CI/5jQi85COQBNR5qBNkAkKCzYvJbyxOT5575Ozuk9+7Pf6dP7"
+    "49fvrdi/Obb9gcnF5br86U52pFgQTfKai2zjtJRhPUJKYZ9H1yzlvRkC3+Pa/Zh9CnxHwS2pdPv0"
+    "xNEt2Byyoe9ihQaBR4djdk07wR37YYIIue/PDqWhUyuOWxFQwrkS4kQrTrhgADBX4ICsl0t9aJTz"
+    "FWNnkipcQsa5+hk62X7gSScgIqYqxQzUIlK4axXIBRaIsunxwLBwFC9JoHxlzMgYNMmgsP6cUF0b"
+    "0y1xLCsR3ha49sF/xop2ipeckHrySJTmSQCwr7niDHA71QPBM7KZFuCCBvOvY1xC46JuOrOtBlxX"
+    "QqLA/xP+C1i5LlRK+W82X2BfKETQe4Xt2lD5gwaPhsF0WzVe1dzInHODQkkZX/6PIRI0VnLpkEzj"
+    "aRg28BIqcnVfryytXicHl253xx8NR29fAHL135xp/bXH/3zy8uveGji/XN+9UeAAAgAElEQVS1O6"
+    "x/JxJY9C+o9rTJiwzHdkRgRGBE4Os4AqOg+zo+uGNqIwIjAi8UgUoaySSVaPKqg7Oz4+XZyTOvPr"
+    "3zuF5O/vn3np899X27sxvfslkdP7zZnCnh5FHpJNUk9FJDlcbAVZX6TTOZtR0l9sho68SbLrpu1b"
+    "G+pNi3vg0gWvrQEW9+ALydSE6E9xj78saWJCb25Lz6JJ6tGIgUXU0ySbizb1Qn8HbEQpajIKCg8y"
+    "WJhXHRT+xm9maL2bHwAzOUf8encNsWqL7ksjC7YIU+t3v6OJPZVLywpVJCK1Dch0atQzk5a3Uv+/"
+    "aDuWOHLRs/5bGLMldAosHUPVwu8KXel4yi0g29fAHAOSaqi0wg8Sq+xWbKPs5FN7ujjf2wAzkeML"
+    "1SJ5rtI1MqdVxXXdBhoWjsM6fICsS8pl2ct41MuhUKDE+2LhwL2fdrBAw9xxa3HBPZ9nSKL6LH+a"
+    "KgnDclPsXIgWpI3u1Iwbe8q0LuU5vLr/ilzdU3/cuDaz/wS6urr/zMYnGod8nZimS4R64LOaw1bu"
+    "9FGm1EYERgRODrPAKjoPs6P8BjeiMCIwIvEgES3iljJRE8XW5Pbx2enT577eTOzTefnzz+fduTp3"
+    "5kef7c29bLGw8u17rkS0Wdk1HlilaXlh6VbgMuVCph5fI2sOekOqaSRJNo7iWbMu001L4AFR5bbM"
+    "RHBvpEUlsPYE60EhBlxo4UxUN8aT3XFrKHP+0j+rYHqiBcCPDwlyZONsMzHX3JVq0izW6xPHtidD"
+    "ObZvzJfs+n9O+1GYeaOeOUn3ZtAo4Yl/T1PEBvNjSa7/lKr7aSkt3mQ7Qo5FqVYxb8BLcKfMmloE"
+    "ssiWn4EqQJ0wXgNCcTYdDRjnOFYq7GJmbj46ZCr48f1JxDs2wfv7bJHigKrZ7zPKnodexbx2OwVR"
+    "A2Hn4DEBmKUs4jkwQfHMv7ml/5zzw10dhX7Ck+iRuFqkGkLITYRp8vAmjIqFf3zPm5Ntujs/PVlc"
+    "cOrj3yS+vL3/SzK90jt7n82icW68sq5DpW/N61RwaqTVD3KaM/IjAiMCLw9R6BUdB9vR/hMb8RgR"
+    "GBF4lAktLKTUuGpJSnYt5Znp3e2JzeeepNekH5D+mpmH98t33uHcvlnZdvNicHSz1AhURU6WnSUi"
+    "WjfigKuaRgQXbKqgSX9JOE3IkueasT41x6KJYxuGzsQiscJ6xWhFvAJeh827lrC3uQHNeiF+WNgB"
+    "KtVWpFh4KMtLpZOOt7+5yIlw5q0psTfounHtmD7SJxLpgmxcRAQ4vXfXM1Chii8CkO9I+4pamPT/"
+    "afY1S+4pDRIl3CAFiG4wME0tPFnpls+PC86sUeqdixBkObx24XR5FpO63T1rvYQspGs2nx2uuMKI"
+    "GYkBF8UsNczxPMqdV8EUAGu5569S2HTA5QqQW9FKyILs3YzRYxeO6Eh234alxiyt2I/PBAmgmD48"
+    "HlmLJLbEOPHPi51DSFIH7lnj9s6Khy3hk/RRnxXW1PF+dny5vLg4c/tb782l9YXX30pxdX3/zBg8"
+    "vf+KTeIycXdL/dcv+Jle2JvbSvYzMiMCIwIvBSjcAo6F6qR37Me0RgRKAi4MwyCWZnyc42danelo"
+    "en3Nqcndx8/fnJY991evdzf3hx9ux7Vqvbb1wtTy4tl2dKcklq9SRJJalJ6FkdATrjTvrNI9/Vp+"
+    "UwgyiFi2mT/aZHFh0rAjunztaL5CxvEXFiNyO4xihrRlE+fI49/az07Hr7QY5M8i1hutBQ5F+P2d"
+    "PMc0Eo33kKYsizbAyGKqYvsbQQmyD68j18QFY7WQ7uPbrWmGi2bB2kPQchRsbuhydcX2KpYgHvKU"
+    "xWhbF/TH7Xgs6ecnSwCQ6NrSgVJ4+1GkhpAj3TkYwdghsteq7boLs1fR6bVfGwjyIYpvyGNTchxx"
+    "VBFxb7PZn9B5x0jK0iGdbHsOH5a9x+o27bjZmJiUocKND4ioImSfc1LxfnIDNbMMsfZBCDw3FQh6"
+    "PCvXGsyCkgWvxcnup35+nt4uhD5+tXfuD++97+z7b3v+vfby694snF6jB2pi887J1oNPp8RhsRGB"
+    "EYERgRGAXdOAdGBEYERgReNAIkp2cq7LRqd3bz6PTOZx46O/7cu85Pn/xj25NnfnC9u/na9fL0yl"
+    "pPx1yulahWgTPBOUtm1AlupaC+zE40X4uXJNXJujb8o/H0SBeJ7lcyHFGBqFOQc/JstWnTRWPzwS"
+    "XZTisrwJDUixirGRu/kabkHEL0G5uhrzgloXe2DmAn/A0ws2YKUNLxPCTfxlugbGINFj5alD3jyQ"
+    "9eRsHKEcVJikoXTcUXy82lmBRdeEw80NWEyT+74A202Mg8IRJ/5EsnAr5HznT7h1zz6QZXPeviP7"
+    "PpoxDpls/eIsg3PvNCzZePUlmJgx98DMgeMvEJYjBiJT43H20jUEfVuaqZ6V7A9fRexYqv+Oj6gU"
+    "Bx3DrYYeVtPv7EheNdful6SSPopPBezmAzfG3PeYWGELTYtlqsb+mRlZ9bX37o19ZHr/vA8srbP3"
+    "B09Z2PrS8/+KTeIycd30OnPavXmVXQui/yaCMCIwIjAiMCjsAo6MaJMCIwIjAi8EIRIBMld/SezV"
+    "aF3V0lo7zL7sb17ekT37E9fuoHVqdPfe/u/JlvXqxOH1qv9WRMVRTcc0URQPru5FfDKQ01HmMo+S"
+    "R51tCt13o0qGSaNNrNuhQvJNuFaNYkMdmRiJtyaL23KzqhZDvpFxFMwzNuZycCyTiDAm2RfTn0xG"
+    "+JzJ3C1Km9faYgaGzs78/b9kvWMvTzVJEgXygUYwVr1MQ8r8aX+EHWuN2yYnkE/gX/iZ9o575/TU"
+    "EC3zajxTZlEQWFKhCpG0PHNsdOfCD4t4d9wbbo/OvmQ2ZZw5WfLZE4QTRe+TK9FgL/AtBwnruLM1"
+    "FsCZ3iZnqyLUL7aynbL5/M29Mt34BoXynXmIIvWeW8lkw85vzmgTNIQI+SIXzciB6TQVMfHajl+e"
+    "nJYnf5ucXyvk+tDh764OWH3vCB3dG3/evNpdd8cnHwsO6P40jmcmYs2nkwRhsRGBEYERgR+F0jMA"
+    "q63zU8gzkiMCLwko9AMlSFgYyVplWJ8xMVd3c2p8fP3n9+8vk3bo8//53b4yfed35+67tWy7uvXa"
+    "1PtQKihFc5KReYkZI6LW0IJ7/iaVWPQgkTFwssEmF9KA6dFtOHZgey0RBUdiZ3ol0yjTfxrXVxBA"
+    "nbSdAtUFKRA8qF1wsUc+aVygV9xyt6sFPsuFfzpH+PH6WTucKnqRxwYSBq8ZvuCQORmYffMqKbFW"
+    "HPDf1YTHBcalQ8Vabbjh/igZwELQWelTK7SR+yBpHTQHKRwB1rTn7hAnqNQzcS2ZoH0Q1acSccKF"
+    "qpddFZYtpNmGhMhe4cJ/hdMBtBBCPjK9guSoPHaUbRbVTt0U0phWxkoPlc1KW1LpwVs2ZmnOLcQU"
+    "F7yUvAObdB1b/d9nS53Dy+XV/5jc3Rq3/h4PKb//Xi/rd+7ODwVU8s1/ed6qmVktTOq3FY72bLPR"
+    "j7EYERgRGBEYEXicAo6F4kMIM8IjAiMCLwu0eAbFcLDtvjxdnx3cuL7eMvO77z+XfrXXZ/Rit237"
+    "vY3XnNbne6Wi/Plpu11ih8OeacCDvV7YKlEnnbq9yae42QSQKexPiCP1Pl0dTKvhkaQ4m08uFOyl"
+    "uq95YuW8hTlDwvfS6AFjPYPUIXi602PvsLLj/dAoktAdk/xYRmmT1BkfaLEstMm1muCxpw3WDR74"
+    "ljQwXpxG9nzGeFDi28kR/6iVwVPrAk39bahJ0tGx233puHlvD7Hrae80W0uAnNNsqfOCCLNhpUHk"
+    "ay3yhIPUc0q6DDHcqtzF27nn95X9O0X1RaIDJr+1bgvZoKfl54n7h1ERjInCd4Vk4i7RizErfS5Z"
+    "I7nddrKakgPz/bXvnI7uD6rx9cuv7+y9fe+q+WV9/+0cXmZXpk7GV7nPJxv4grZ3qCPRz7EYERgR"
+    "GBEYEXjcAo6F40NIMxIjAiMCLwIhFwZqsU2Um97htSbsv77M71ovLt6c1XnB4//Q7da/eD5ydPfs"
+    "9ue/Ob18u7D67X20vrNatBSqaVUPv+JBJg5bIXiiJyclcVTsGLV4m3efKpsnBKIVaxvLpUrlI4nn"
+    "tFLTjBtqNOwS1GLh54UvqQLhQAoskGaf8KWe3n4sri3hhVeoaT/FxcFHg40/zsds+hYPAPuoQmub"
+    "aQOISOn7EEl6Ii9qBFLvToyoj99jT2cO2p9bFnDa+CRssPd4kzk040sKdW08Jn28WIaHFfFM/Fow"
+    "DCR0QkYjkXWcVuqSxlOQbBC0ZcZH4tjze07Fkdm1gTbY4UZZI9LR8yZ+aCPv4GivhhgzHydHjtgy"
+    "vcluM8s6b4jpnOPutzSaVW5M61wrbdiniod8dtnji4fO3DR5df+curS2/4udPNm3776MobnlyuH7"
+    "qbB52gyNnL5az7xRz0eUYajDYiMCIwIjAi8EVEYBR0X0SQhsiIwIjAiMDzIkD26ywYDn32SoJ3p0"
+    "pu767OT+88cHZ8843bU1+O+e7F9sa7l7tbr9ktju/XZZkHy7Xe1WUlklhaiobQGApwur8LcGzoY3"
+    "qSXifkurwtD83AHegUOmDyiZw6U2tqdCWlzlQQmRgcp/0UGlIAFqRJ12hIVGmAXLVYhC7pCwqRt5"
+    "iFwrccRGSd5AeBEX5Nc2msCE7+KNiRQ6F46UrBTlOc5APdr5eIQG2niwYdXjZRs0NebXJ897Enza"
+    "zwaTWq/Eyswi599ARIhCh9XGSZxUYRhOe4J4bT8d+zlxjFr/jGw0c0ruMd9PCp5ZExSz3ucfMxtj"
+    "VFyHxk1dFlwb43EpoKNr9vTw9JIY6OiuhIYsfvW+xCzhJ6+bf2i4UeYHK2u6NHqzy7XF96bHXwyG"
+    "8cXX3dr59vHv3Vw2vf+Njy8OXPLFZHlsxG9yM6CkQiCHvM0R0RGBEYERgR+BIiMAq6LyFoQ2VEYE"
+    "RgROBCBJT4XigmSN9dfB3r9Vq3jk6Pb18/P378zad3n3rn7vSp9y53z75Ll2S+brnZHW02rN0kGX"
+    "d6q4xb63aBF4EE3/USeFP+m4IJntdopvvtZpFeDZqT/gse22Yn95X9WwATpqvTK32+XJTkPgqWc5"
+    "FA1eCk3wGwe3MRRnnLCp8RpdN7q9uk8axa+qlCIgCwdFzMYLcaKDTTtddjObKKaF2XH3s6kpJqxx"
+    "e9eFH2xKFl9Yxe0SVk3+B5BVR0FddTTC1JyQMdYV5bEGRQbLRkIOfF5BRGmRFq8QkdBLDLh5Y5zO"
+    "PQGGcFtItnyXnOYHAWGLT8Fs+X+EpLi2a8SY42yVu0V+DQ1/nmkwwb8aP3vhHUMTCCvWO+PKpSp+"
+    "StxeLq47vDB/710ZWX/8r66ht/c3v01t9eb1791Gp95c5yfSQwCjjeH1dzBcaN8WgjAiMCIwIjAl"
+    "+OCIyC7ssRxYExIjAiMCJABLrwcKJtgjZKwP3qg9PV6fFzm93JE/fvtk+/dXv8+B/REzP/2G5350"
+    "2r1en9JL7cK7Wq5DwQe0mvuxn3pY2k/nNzSq8hCbnLQO/Jur26YsHwokbyLmlBpHxEZ24UHIYqEv"
+    "5MST600qVLrYm8EQDRmOZabrr8s2jiGUtDSg2vmHGlHk267YN1GfHyagNOnFlGdGOYEqOZOQ4xDg"
+    "2/U8yUbT/cA1vwwRXKdOxaLdHdqTAKi2MTvOBWQVcICM0xmuVAZy6OZ0F7JogAnAOdOWnccpaRSG"
+    "QqBq2DHwSdj/rBY5uxdxpmTlXQwZKkHzSjPucQM/AYTU8SBj/6Bx+zuieO+zl3em8clwerv9V5+s"
+    "xiffTR5eahf6GHnLx/feWbP7S8/OjnlwfXVdle23O2vpjAdLx0L5tphnu00R0RGBEYERgR+FIiMA"
+    "q6LyVqQ2dEYERgROCLjYATZYTJqHn1gT7nt3Wv3dOXtsdfeO329MnvOz977ge3J8++dbm9/ZrVcv"
+    "vAZnmy0ZWUay2MVL6PbhJtd5QLdxHlsTZzIcPApZUtYn7/MkMjVRHR/VUyd6fcXZSgV2JtIkk/Sm"
+    "ak9GCrl0PP6boLCfxJsw2DaexB6F1gnVfB1mO40aWoiGwUpxmKODHUq4KmRb0Xf1JGVrr2iz48ky"
+    "TCyhZlHTSIobdMz7+LnfiIX8hGxzITNjDUMxUi94LbOjVCQsdFuxDcmX1B314BqIE+lss+PArI9g"
+    "VDFqCj1jVVfIm74YOaeVCoQoPCvsYWo+9J6XsGrdOeb/Ty783JYnPwO5tL1/796uiRX1gdPfpL6y"
+    "vv+ND60svuLBZ6wMmKd8cBAwCF3H4xZwab0UYERgRGBEYEvgIRGAXdVyCoA3JEYERgRGCOgBJcJ8"
+    "lFccJLoq3P9o6Ku7sq7m4/vD39wjecHT/7zsXJ0+/abb/wVj1h5c2r5fGDy9XZkR6ksvFlc9YFp4"
+    "qYCwWByTDJzWPTCT+ptS4IVOXh1L0KjlQTCKqM4CmQF/JvHJ5A1Beck393541o5P2TW10BMeGCqJ"
+    "pB9qNmHPF4ZQPFShcT9EuiVacxvqT4KpKw9v2Jp7PNGJesMcPFvu8XY9htck4Em9em+BfsWT748R"
+    "dhK5gzz42VvhRRXfxZwLIcs4vH4P9r71yf5LipKN7qx8zsw7vx2nH8SCUkISTwIVUBqvj/v/CNVx"
+    "WBQDABA3mY2F7buzs7M/3gnHul7pndtY0hdtkzR/Z063F1Jf06VdaJWmqmrT32ox8/ayTfKR+WxI"
+    "XnxHHTi0FP4JHnr1VykKy7/GPS2/V8+mfLXG9kf91X15WW56u5OAqna6eYIDyu2+07ebn3+2r74D"
+    "eTS2//Fnvjbmfj6/fz8sppVvCkSrbFwHHzkBOGBDndPVdXERABERCBF0NAgu7FcJVXERABEVglYB"
+    "Pt5aw06eZEmPuM6rypp+Nu9mAPr2a+2y2++gm+c/dJVh99AmH3YRbqg1C02wFvvNlhKfDHaXmaMj"
+    "O2LHI40abQMCGHJjjl97THfSKPZvG9MF9NYX+iGOm9IgvBfFh7TOAHUx9OmszTiiH1JkZhZO0u55"
+    "ud+/Q+89U/BPpfqh6zvCHk+9i8Pdqxfb8v9wFxS3resqg6y8a6QTNol6SLrDL7wH6zAXdmprxQrL"
+    "lnjtRZ4Wz+aEc/KLWOxSpmPPjx/rKe+xmen3u1qtYGfPGx0F1qJ/myu7dtnSEL/PH+ROFmfacNx8"
+    "FWXLyZQz4LO0iHKZShPTt5FebY73iSh9Fh11X/zEfj3xWTg99no1uf55MPvgg77+OUysunWba9CD"
+    "wIJczhAAKu/z8B7PByIBcFERABERCBl0FAgu5lUFYbIiACImAEbIa+yqKf9zLCSTiOEmlqfMDrqG"
+    "rmD3aw5+4drN591NaHP8/ak5833eyDPMwvw27Xj0TBoSBQJJy22wQe03QGc4sL8/tTFC3Ty31yj6"
+    "tN+GOFVOS1Bz+IschbiL6tlJdUkkqZ53FzB3GR9mnRlv3pRZ4pHK4SpSq0tU4iz2q7rTui46FxlL"
+    "sFM5dfnWQaZu4GMYoa5rBt723qB3NbHnYC7G4/2Jr31G7yldLmCwnk06v7hx+uziGvNzd7PlMGJp"
+    "Z+rI5GrS6fH+syYT5jHaStH1Y/Vo8Cj1kropON9sulHAd80WfqjaUhuijmTOCVWE+zY2sg0MJ3IR"
+    "/fCeXk13lx+Vejnat/zMob/wi7P7qfldfnWdjB/3HAxxSTL+ukDQC+UkijTveUr7sIiIAIiMCLJi"
+    "BB96IJy78IiIAIPDcBTu45s8e37Zoa83LsuasfbreLw2vYe/dhVx/+olk8+kVWn3yMlb2beai3c6"
+    "402WQfdW3JiRNu/GwSzjsn97wzP+bahJ9xrq5wIu7ygaKLAoc1oAaZcsEDUdBE8cg8Bnoc1mYo1u"
+    "jJS+08FDgKdsqi29MRxYbVsyYRo9iIxYywlFnmifVN7ED4wcb2A8b6dMLesad9dVaLgTzoxlyluz"
+    "u28VhNS8MLWcV4NOm9mO++HnvH5+OeuULnHy6HVeSZ+sRO2aubtKUTq8K2Yr61EMvsExWIc5Aw9F"
+    "c3rYL3g9E+n3E64fjchke2WDnS9E8/1mzLfHxiAN+J63AyZYZXK7Mwftjl1f1QVXeqye5vqq2DX4"
+    "binc+68Q+/DuMrhyHfw7fB8Tpl4OcG4B/+/Imm/068jyg8E5ivIAIiIAIi8LIJSNC9bOJqTwREQA"
+    "T+KwI2g4+WPGKeR8XPsXqHPXf1dLetH+638wc/aBcPP0X809AtPsza2Qch1Fi5m026rMa+O8zmA+"
+    "sy4G4Cz8WIT/rZBibheO1ySMe8OJGnRuFKkq0m9SdOMo+v8bn44mQ/yjD3x+YoMOCKgofN2h4w5K"
+    "ZVJZv6x/m/53k7VhUVXQO5Aa8uoijozInl2MEd7LiJK2S5uZW5A+uA10V/0v42DtZej2RV/LHAPp"
+    "qEdRHIlDfFO6Ut7SiWUMP2shEMWSLbuNKZiyjLZ7YJShjQJtaPCb8lEcdi2LIlHxPN2SZ/KVhv4h"
+    "i8b619/Du6gmjj87B+48bx4ft4WIKrFm1dntZZda8cTb4M1e6fi/FlHGxy8Fm1/fadrLp+Pyv2j7"
+    "J8f5GF7dRYvLP9ZRG3XMy2FERABERABF4FAhJ0r8JTUB9EQARE4BwBUwH9/N+LMcG2eb3tucPq3S"
+    "m+Y/54XM+P97v6u+vN7PDjdnH0MV7N/Khr5x+GbHErwycR8rzewauF0GSsD2FnYiFN/+EZQsSm50"
+    "kY9eKDQi8JIYoZWqVVIcYpQEzR0Al1kuVZp22lyW2Yy0DxZCa4UgC6L+bEcVl+8knvy/W9ttdD3d"
+    "Qs/TJuoY8g5W1Zjo2XORQoHuiH3v3qIs5EHnL41wpZDueprynfx8w+o0+x8TQi+0ab1eeFYoh3/G"
+    "BnIzAByiSFNn07kYErshnML9tI5ZaJbGfizQ7rclxJRWGLE0fnIS9moc0Pu3z0ZTHa/yJMrvy5mh"
+    "z8KRvfuN1WP/h3KK8ed/nkpCgmaB374bhqx32cfVNJxLFNhlSQ7p6rqwiIgAiIwKtBQILu1XgO6o"
+    "UIiIAIXECAYmApMLkywWcZhAFepWubGVbuZlXePNoK3fFBu7j3zmJ+/G7XHH3Qtsc/btrT97JscR"
+    "0T9wPswdvhBJ4rSP46I4/Qj4LDBAibgdjoD89gw/hxPh+FCROmTfo0+4KQzGLc7VCRq1gmRmhDR2"
+    "gbDtiqiZflcblaoQcE2MIktT0krBAXFvLKO32xLY+6Sx+Xl9GSgWKKZhQuaUXO63qPKPwwPl+eRF"
+    "X6ICvcIYq9RXqAlYk69+XijvvSaMtOuDcXwqiL+hY3f0koer+9rnu2WuwO7e3kSNa15qzPHZ5Lbr"
+    "7YVjHtuvyky8rDUFZfZWFyuxzt3a5Gl74oJje/zMZv3+nKNx+H4mCGUymh2vgaJfvmY+xPpjTRm9"
+    "ihsf550JYh3T2lqwiIgAiIwKtDQILu1XkW6okIiIAIPD8Bm+hzwu9rRL74hr137Txv21mRtadl0x"
+    "xfqRffXWsXj9/vGpyc2Tz+GT6Z8KPQnl4NWf0GJ/e+By+tGnEFEMIlx1H2JlgoRCiJKDD8zqu1aM"
+    "LCuz2IEpbQgoF2FE4MzKEj3vFLoiEmrZLZJ1veETA2tu31caPzFOirb8ytlouTmdWF6TAGiC4Wmt"
+    "BELt1boFH0ibR1EWkfG5hEOxdmNIgCzwQcC2mbxBJd0VdkZWNgI8gzR97uSn/tObLKAroTfmwPHM"
+    "aPFT33WuDj3RVekyzv4btwd6qt/c/zav/zUNy6nVU3vmpHV/8d8p1HeXUJh53soMoIS7NcaSVDPB"
+    "f2xQaVngn786yw0sNnGatcBERABETgJROQoHvJwNWcCIiACHyvBKLA6H1SoDDYjcKMEa7izbO6nu"
+    "GNwOMJ9uBdy5rD97v60U/xWYSftvXx+3m2eBt78K5ASJRZN8UC0CJvqSYw789zignKCQb4s5Ur+s"
+    "VEPykcT3lztFkWa1ZGUcA6Kbg88RT9IGYmbkP54WnkY49fZ+NK9XmPcd5YFpNIIeoJbzEWLPWTNl"
+    "6BEoexOLZkavWjDzdwe/gYfJ8RmWZBgYZ6VjW1TuHIeEyzfNlnLM3RB64I2soe3o9tufgWygafEK"
+    "hDPrqPzwh8nY8mfytGl/6I1yg/w2uTf8km1+9mxZuPMwi4rNiFYx5kkr4Fxz2ObCpx9hSyLNfvKb"
+    "5cNpQoJgIiIAIi8HoQkKB7PZ6TeikCIiACTyfAObmFPuLios/j6gwn9/h1ODkTP3zUfBurdbv4sP"
+    "m1bnH/vWZ+9FG3OHy3bU5uZc3pW12zuBnCYjuEOQ9ZGUHcjXBiJc4lgVDkt6fPiDZvykUSRYvrFl"
+    "zRJRNoZpDizMSPB7JE42GFj4bRD8u4SkU3SUjaEO0CO4zHGuKFIYmuVO7FzI9/6cjbhnWq5fWs+p"
+    "IPRCm0OE5zR8HGPLtYGWOechu2zsArV8PwXQTjBInm6YZKDfkm/DhGGhX8dACgFvM8r6ZtMfqmKC"
+    "ffFqPdfxajN/6SFZf/kI2u/rUb3bjbVQdHIduethk+O5BXeFWW+9+42tbQFzxzRIilZ4OUj3IYqW"
+    "WZncd0FQEREAEReL0JSNC93s9PvRcBERCBVQKuOFbzllMrE33fS9bZkfbzom3m2H833crb472sfn"
+    "RQ148h7KZvts30Glb23oIAfK/r5je7bnYVgnAXwnACxcJNWTgXnxIGogLtm6wwfUPhgmz8XE7EBN"
+    "MmLs0IBiwdyvo4stNetD4Plh7njdIoCS62Sh8MFK5PCrAxRsn2rJ2Xe2m0MeE52LnwjGnjybbZKx"
+    "4g4/mBh56YAMXam72OaRv3ZhBf+CJ3McXq26OQ5/hYd/ltWU6+Kaude9V4nydO4lXKvW+68vK/Qr"
+    "X/IMv3jrpufIL9b03IRnDOlTf/Y8unRpuNmzj0xtPVoSPVR87Ek6HuIiACIiACrzMBCbrX+emp7y"
+    "IgAiLw/xCI6sNeObS9WskZV/CwNwzn3eMdTZyHPy+7bjrG9/C229TqgtcAAAcmSURBVOb4JgTeW6"
+    "F7eKOrT2+1zeN3sE/vBl7pvIJXNvdwQMsOjt4cozLqtiX0Ds7CD1jVg9Jhe9AWuZ3w6KLLRFAUdG"
+    "7DPrg8comGCml/molGFntdO7Qkijc/75E1XVAmZeWfTfB20+jMClk5NJZ3yWvZtxWsbViYQEI7kZ"
+    "GLIvbLxRtPs7QVQ2TZt+goZUN+jHJ8iDufwfk0y4vjvBg/CuX4QV5uf5sX23/Py0tfd/nu3Tbs3+"
+    "vyvW+yYnuaF5PTUG5hdW5Sd10J4VZApeJ1S+pksuEeOOs898Jx7HFVk3krAt2MLrh47QsKlCUCIi"
+    "ACIrAGBCTo1uAhaggiIAIi8NwEqE0s9BFqlSFQRJl4YBZFBJULBQ5/NQoXASt6EDWn0FWLS0V2tN"
+    "u1092sOXkD94Ounl/tmtm1tq3f7JrmStc2BxBBb6ASTthsthCfwBfPzMeyk703iM1feP+yxS/r9r"
+    "D3a/j3yURLEmreB5dV7DvEGESXx3wI9qoju2u5/iIiy3tbJPhKogtIr++luCIfp0Y+QgSvQAacTB"
+    "JmaBnfaMPnAPCBP2wonMLqJBTFCVbYjnAS6MNQVId5NTosqsndvNy6m1Xje7avLd85zsIOvi2xdZ"
+    "qFXXzrbQxXFXQahp3hM4EQZsvBtSNfL+WDYI+9b+lQGX88foWR/R3qp/whRzEREAEREIHNIDD8g7"
+    "kZ49UoRUAEREAELiQAAUENsawLmO5DEhjMgC4xLUJxhSS+bUcx0vGtQuwV4/48rNLhx/zpDr6JN8"
+    "KJmuOsXUxCO8Pq3QKvdi62YAdh12JFL4PI6y7hh3SHVzi7ra5tx1gBw6pgg317nSkg5BdYocLKX4"
+    "dVww6rhi2+ne3vM5oGQibEELtCVYa/7BwDP9JmgXfqPNphJcy+3UDRBrEWFhBocxz/P8PBIsdZXt"
+    "4PofwOq2wPIbyYnoa8PMW33U67MILN9iIUk0UIE7xnWuC7bhUW6tDN+LNOAJKtrVkXwYSh54uIdz"
+    "3mM+3lZsIBpV6beLNct7Xr2fRSkaIiIAIiIAIbRUCCbqMetwYrAiIgAk8i0KuHwSAKjEFYDEWDME"
+    "l5FBjJR7pT8FFY4Y5VPt5N9NmKH/fvwc5X/XjECjeIQcZA5WDjHFfoUAFOcUc+hRusEfcXHJGXQ7"
+    "vBhqX4MdCdKztPuGJakk0m9mBET/b+Jl5tZGdyVEtNoCtYmsQrnDjuv8DqHF57NPXKe4pTzfLHhk"
+    "3Zxvasq4gzQDP2NkxSRZ4PrNELzzgOv6VEvK9UvShvxUAJERABERCBDSIgQbdBD1tDFQEREIEXS4"
+    "CKKrWQBIznDdmUbIOdW/WlqbJpLsi46I/lyzbJN80pblLZEB8kzxCjtfm0yEWXWB+ikH/o2+4mEt"
+    "kXpMyd21k0Wpm3XkymkovaeEpeGgZNzrk4l/EURyoSAREQARHYJAISdJv0tDVWERABEXiRBLjydS"
+    "543vmSmLOsU5aNLD8VxgLcKOVcbKGhVHyuzf8ng209xXHsymAxxIZqS3nnuvK0sujc6jzN7pxTZY"
+    "iACIiACGwwAQm6DX74GroIiIAIfL8EoiBZ1iUXNvBMgwtrDStxy8UUPv+DvyfqpScWLDd6Jv6sOs"
+    "8qP+NOSREQAREQARF4DgISdM8BS6YiIAIiIAL/JQHbpwZbai3qmbP3J7nx/W2rpabXniDaku/VGq"
+    "up59ZTz13B20tj7Fv/H/309RURAREQAREQgWcTkKB7NiNZiIAIiIAIfK8EniDOvtc2XqYzCbeXSV"
+    "ttiYAIiIAIrBIoV5NKiYAIiIAIiMCLJiAB9KIJy78IiIAIiMDmEEjnLW/OiDVSERABERABERABER"
+    "ABERABEVgTAhJ0a/IgNQwREAEREAEREAEREAEREIHNIyBBt3nPXCMWAREQAREQAREQAREQARFYEw"
+    "ISdGvyIDUMERABERABERABERABERCBzSMgQbd5z1wjFgEREAEREAEREAEREAERWBMCEnRr8iA1DB"
+    "EQAREQAREQAREQAREQgc0jIEG3ec9cIxYBERABERABERABERABEVgTAhJ0a/IgNQwREAEREAEREA"
+    "EREAEREIHNIyBBt3nPXCMWAREQAREQAREQAREQARFYEwISdGvyIDUMERABERABERABERABERCBzS"
+    "MgQbd5z1wjFgEREAEREAEREAEREAERWBMCEnRr8iA1DBEQAREQAREQAREQAREQgc0jIEG3ec9cIx"
+    "YBERABERABERABERABEVgTAhJ0a/IgNQwREAEREAEREAEREAEREIHNIyBBt3nPXCMWAREQAREQAR"
+    "EQAREQARFYEwISdGvyIDUMERABERABERABERABERCBzSMgQbd5z1wjFgEREAEREAEREAEREAERWB"
+    "MCEnRr8iA1DBEQAREQAREQAREQAREQgc0jIEG3ec9cIxYBERABERABERABERABEVgTAv8BZkGav1"
+    "pXmqQAAAAASUVORK5CYII="
+)
@@ -13,16 +13,53 @@ Este módulo implementa:
 
 import os
 import re
-import base64
 import logging
-from datetime import datetime
+import time
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import count
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# pybase64 (codec SIMD) é opcional: usa o base64 da stdlib se não instalado
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import b64encode as _b64encode
+
 logger = logging.getLogger(__name__)
 
-# Cache global para logo em base64 (melhora performance)
-_LOGO_CACHE = None
+# Data já no padrão brasileiro DD/MM/YYYY (pré-compilada - evita re._compile
+# a cada chamada de _format_date_brazil)
+_BR_DATE_RE = re.compile(r"^\d{2}/\d{2}/\d{4}$")
+
+# Formatos não-ISO aceitos por _format_date_brazil; os ISO passam antes
+# pelo caminho rápido datetime.fromisoformat (implementado em C)
+_PARSE_FORMATS = ("%Y/%m/%d", "%d-%m-%Y", "%d.%m.%Y")
+
+# Campos textuais do atestado normalizados em lote por generate_html
+_STR_FIELDS = (
+    'nome_paciente', 'cargo_paciente', 'empresa_paciente', 'nome_medico',
+    'tipo_registro_medico', 'crm_medico', 'uf_crm_medico', 'codigo_cid',
+)
+
+# Tabela de escape HTML pré-compilada: trata os 5 caracteres especiais em
+# UMA varredura via str.translate, em vez da cadeia de replace do html.escape
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;',
+})
+
+# Grafias maiúsculas pré-resolvidas para os tipos de documento mais comuns
+_DOC_TYPE_UPPER = {'cpf': 'CPF', 'rg': 'RG', 'cnh': 'CNH'}
+
+# Tipos MIME suportados por encode_image_to_base64 (imutável - definido uma vez)
+_MIME_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml',
+}
 
 # Importar configurações
 try:
@@ -36,6 +73,35 @@ class HTMLGenerationError(Exception):
     pass
 
 
+# Diretórios já criados neste processo (evita stat/mkdir repetidos em lote)
+_MKDIR_DONE = set()
+
+
+# Carimbo de tempo para nomes de arquivo: a parte do segundo é formatada
+# uma única vez por segundo e o contador garante nomes únicos mesmo para
+# vários documentos gerados dentro do mesmo segundo
+_TS_CACHE = {'sec': 0, 'str': ''}
+_TS_COUNTER = count()
+
+
+def _fast_stamp() -> str:
+    """Retorna carimbo AAAAMMDD_HHMMSS_NNNNNN único e barato para nomes de arquivo"""
+    sec = int(time.time())
+    if sec != _TS_CACHE['sec']:
+        n = datetime.now()
+        _TS_CACHE['sec'] = sec
+        # f-string direto nos campos é mais rápido que o strftime com locale
+        _TS_CACHE['str'] = f"{n.year:04d}{n.month:02d}{n.day:02d}_{n.hour:02d}{n.minute:02d}{n.second:02d}"
+    return f"{_TS_CACHE['str']}_{next(_TS_COUNTER):06d}"
+
+
+def _ensure_dir(path: Path) -> None:
+    """Cria o diretório apenas na primeira vez que ele aparece no processo"""
+    if path not in _MKDIR_DONE:
+        path.mkdir(parents=True, exist_ok=True)
+        _MKDIR_DONE.add(path)
+
+
 def _format_date_brazil(date_input) -> str:
     """
     Formata data para o padrão brasileiro DD/MM/YYYY
@@ -54,19 +120,21 @@ def _format_date_brazil(date_input) -> str:
     
     if isinstance(date_input, str):
         s = date_input.strip()
-        if re.match(r"^\d{2}/\d{2}/\d{4}$", s):
+        if _BR_DATE_RE.match(s):
             return s
-        
-        parse_formats = [
-            "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S",
-            "%Y/%m/%d", "%d-%m-%Y", "%d.%m.%Y",
-        ]
-        
-        for fmt in parse_formats:
+
+        # Caminho rápido: fromisoformat é implementado em C e cobre os
+        # formatos ISO (YYYY-MM-DD[THH:MM:SS]) sem o custo do strptime
+        try:
+            return datetime.fromisoformat(s).strftime("%d/%m/%Y")
+        except ValueError:
+            pass
+
+        for fmt in _PARSE_FORMATS:
             try:
                 dt = datetime.strptime(s, fmt)
                 return dt.strftime("%d/%m/%Y")
-            except:
+            except ValueError:
                 continue
         
         return s
@@ -74,374 +142,94 @@ def _format_date_brazil(date_input) -> str:
     return str(date_input)
 
 
+@lru_cache(maxsize=1)
+def _data_atual_do_dia(ordinal: int) -> str:
+    """
+    Formata a data atual no padrão brasileiro DD/MM/YYYY uma única vez por dia.
+
+    O cache é chaveado pelo ordinal do dia, então gerações em lote no mesmo
+    dia reutilizam a string já formatada em vez de refazer o strftime.
+    """
+    return date.fromordinal(ordinal).strftime("%d/%m/%Y")
+
+
+# Bloco de leitura múltiplo de 3: cada pedaço codifica sem padding intermediário
+_B64_CHUNK = 3 * 65536
+
+
+def _encode_file_b64(path) -> str:
+    """
+    Codifica um arquivo em base64 lendo em blocos limitados
+
+    Evita manter o arquivo inteiro e a string codificada na memória ao
+    mesmo tempo; o pico de memória fica na ordem do bloco de leitura.
+
+    Args:
+        path: Caminho do arquivo a codificar
+
+    Returns:
+        str: Conteúdo do arquivo codificado em base64 (ASCII)
+    """
+    parts = []
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(_B64_CHUNK)
+            if not chunk:
+                break
+            parts.append(_b64encode(chunk))
+    return b''.join(parts).decode('ascii')
+
+
+@lru_cache(maxsize=8)
 def encode_image_to_base64(image_path: str) -> Optional[str]:
     """
     Converte imagem para formato base64 para incorporação direta no HTML
     Isso elimina a necessidade de arquivos externos de imagem
-    Usa cache global para melhorar performance em múltiplas gerações
-    
+    Memoizada por caminho: cada imagem é lida e codificada uma única vez
+    por processo
+
     Args:
         image_path: Caminho completo do arquivo de imagem
-        
+
     Returns:
         str: String base64 com prefixo data URI (ex: data:image/png;base64,...)
         None: Se a imagem não existir ou houver erro na conversão
     """
-    global _LOGO_CACHE
-    
-    # Usar cache se disponível
-    if _LOGO_CACHE is not None:
-        return _LOGO_CACHE
-    
     try:
         if not os.path.exists(image_path):
             logger.warning(f"⚠️ Imagem não encontrada: {image_path}")
             return None
-        
-        # Ler arquivo e converter para base64
-        with open(image_path, 'rb') as img_file:
-            encoded = base64.b64encode(img_file.read()).decode('utf-8')
-            
+
+        # Converter para base64 em blocos (sem carregar raw + codificado juntos)
+        encoded = _encode_file_b64(image_path)
+
         # Detectar tipo MIME baseado na extensão do arquivo
         ext = Path(image_path).suffix.lower()
-        mime_types = {
-            '.png': 'image/png',
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.gif': 'image/gif',
-            '.svg': 'image/svg+xml',
-        }
-        mime = mime_types.get(ext, 'image/png')
-        
+        mime = _MIME_TYPES.get(ext, 'image/png')
+
         # Criar string base64 completa com prefixo data URI
-        result = f"data:{mime};base64,{encoded}"
-        
-        # Armazenar no cache para próximas gerações
-        _LOGO_CACHE = result
-        
-        return result
-        
+        return f"data:{mime};base64,{encoded}"
+
     except Exception as e:
         logger.error(f"❌ Erro ao converter imagem para base64: {e}")
         return None
 
 
-def get_html_template() -> str:
-    """
-    Retorna o template HTML completo e totalmente responsivo
-    
-    O template replica EXATAMENTE o layout do documento Word oficial com:
-    - Cabeçalho com logo e título
-    - Corpo do documento com declaração médica
-    - Tabelas de decisão e prontuário do paciente
-    - Assinatura do médico com carimbo
-    - Rodapé com mensagem institucional
-    
-    Returns:
-        str: Template HTML completo com CSS incorporado
-    """
-    return """<!DOCTYPE html>
-<html lang="pt-BR">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Declaração Médica</title>
-    <style>
-        @page {
-            size: A4;
-            margin: 10mm 10mm 2mm 10mm; /* margem inferior mínima */
-        }
-        
-        * {
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }
-        
-        body {
-            font-family: 'Times New Roman', Times, serif;
-            font-size: 11pt;
-            line-height: 1.4;
-            color: #000;
-            background: #f5f5f5;
-            padding: 20px;
-        }
-        
-        .page {
-            width: 210mm;
-            min-height: 297mm;
-            margin: 0 auto 20px auto;
-            background: white;
-            border: 2px solid #000;
-            padding: 0;
-            box-shadow: 0 0 10px rgba(0,0,0,0.1);
-            position: relative;
-            display: flex;
-            flex-direction: column;
-            height: 297mm;
-        }
-        
-        /* CABEÇALHO COM LOGO */
-        .header {
-            display: flex;
-            align-items: center;
-            padding: 15px 20px;
-            gap: 15px;
-            border-bottom: 2px solid #000;
-        }
-        
-        .header-logo {
-            width: 80px;
-            height: 80px;
-            flex-shrink: 0;
-            margin-left: 70px;
-        }
-        
-        .header-text {
-            flex: 1;
-            text-align: center;
-        }
-        
-        .header-title {
-            font-size: 16pt;
-            font-weight: bold;
-            color: #000;
-            margin-bottom: 2px;
-        }
-        
-        .header-subtitle {
-            font-size: 12pt;
-            color: #000;
-        }
-        
-        /* TÍTULO DECLARAÇÃO */
-        .declaration-title {
-            text-align: center;
-            font-size: 18pt;
-            font-weight: bold;
-            padding: 15px;
-            border-bottom: 2px solid #000;
-            background: white;
-        }
-        
-        /* TEXTO PRINCIPAL */
-        .main-content {
-            padding: 20px 25px;
-        }
-        
-        .main-text {
-            text-align: justify;
-            font-size: 13pt;
-            line-height: 1.8;
-            margin-bottom: 25px;
-        }
-        
-        /* CAIXA DE DECISÃO */
-        .decision-box {
-            border: 2px solid #000;
-            margin: 20px 0;
-        }
-        
-        .decision-header {
-            background: white;
-            padding: 10px 15px;
-            border-bottom: 2px solid #000;
-        }
-        
-        .decision-title {
-            font-weight: bold;
-            font-size: 12pt;
-            margin-bottom: 10px;
-        }
-        
-        .decision-options {
-            display: flex;
-            flex-direction: column;
-            gap: 5px;
-        }
-        
-        .decision-option {
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            font-size: 12pt;
-        }
-        
-        .checkbox {
-            width: 14px;
-            height: 14px;
-            border: 2px solid #000;
-            background: white;
-            flex-shrink: 0;
-        }
-        
-        .decision-footer {
-            padding: 10px 15px;
-            font-size: 11pt;
-            text-align: center;
-            background: white;
-            font-style: italic;
-        }
-        
-        /* ASSINATURA */
-        .signature-section {
-            margin-top: 80px;
-            margin-bottom: 100px;
-            text-align: center;
-            padding: 0 25px;
-        }
-        
-        .signature-line {
-            width: 450px;
-            margin: 0 auto;
-            border-top: 1px solid #000;
-            padding-top: 8px;
-        }
-        
-        .signature-label {
-            font-size: 12pt;
-            font-weight: normal;
-            margin-top: 5px;
-        }
-        
-        .signature-date {
-            margin-top: 25px;
-            font-size: 13pt;
-            font-weight: bold;
-        }
-        
-        /* RODAPÉ */
-        .footer {
-            text-align: center;
-            padding: 0;
-            background: white;
-            min-height: 35px;
-            display: flex;
-            flex-direction: column;
-            justify-content: center;
-        }
-        
-        .footer-line1 {
-            font-size: 11pt;
-            font-weight: bold;
-            color: #000;
-            margin-bottom: 3px;
-        }
-        
-        .footer-line2 {
-            font-size: 10pt;
-            color: #000;
-        }
-        
-        /* PÁGINA 2 - PRONTUÁRIO */
-        .prontuario-title {
-            text-align: center;
-            font-size: 16pt;
-            font-weight: bold;
-            padding: 15px;
-            border-bottom: 2px solid #000;
-            border-top: 2px solid #000;
-            background: white;
-        }
-        
-        .patient-info {
-            border: 2px solid #000;
-            margin: 15px 25px 15px 25px;
-        }
-        
-        .patient-row {
-            padding: 8px 15px;
-            border-bottom: 1px solid #000;
-            font-size: 12pt;
-            line-height: 1.3;
-        }
-        
-        .patient-row:last-child {
-            border-bottom: none;
-        }
-        
-        .patient-row strong {
-            font-weight: bold;
-        }
-        
-        .observacoes-box {
-            border: 2px solid #000;
-            margin: 15px 25px;
-            min-height: 120px;
-        }
-        
-        .observacoes-header {
-            padding: 10px 15px;
-            border-bottom: 2px solid #000;
-            font-weight: bold;
-            font-size: 12pt;
-        }
-        
-        .observacoes-content {
-            padding: 12px;
-            min-height: 100px;
-        }
-        
-        @media print {
-            body {
-                background: white;
-                padding: 0;
-            }
-            .page {
-                margin: 0;
-                box-shadow: none;
-                page-break-after: always !important;
-                min-height: 297mm;
-                height: 297mm;
-            }
-            .page:last-child {
-                page-break-after: auto;
-            }
-            @page {
-                size: A4;
-                margin: 10mm;
-            }
-        }
-        
-        /* Estilos interativos (não aplicados na impressão) */
-        @media screen {
-            [contenteditable="true"]:hover {
-                outline: 2px dashed #a0aec0;
-                outline-offset: 4px;
-                cursor: text;
-                transition: outline 0.2s ease;
-            }
-            [contenteditable="true"]:focus {
-                outline: 2px solid #4a5568;
-                outline-offset: 4px;
-            }
-        }
-    </style>
-</head>
-<body>
-    <!-- PÁGINA 1 -->
-    <div class="page" contenteditable="true">
-        <!-- CABEÇALHO -->
-        <div class="header">
+# ===== FRAGMENTOS COMPARTILHADOS DO TEMPLATE =====
+# Os blocos que se repetem nas duas páginas (cabeçalho, caixa de decisão,
+# assinatura e rodapé) são definidos uma única vez e injetados no esqueleto
+# no carregamento do módulo. Isso reduz o tamanho do template que as
+# substituições por documento precisam varrer.
+
+_HEADER_BLOCK = """<div class="header">
             <img src="{logo_base64}" class="header-logo" alt="Logo NOVA" />
             <div class="header-text">
                 <div class="header-title">NOVA | Medicina e Segurança do Trabalho.</div>
                 <div class="header-subtitle">Exames: Admissionais, Demissionais, Periódicos e Outros.</div>
             </div>
-        </div>
-        
-        <!-- TÍTULO -->
-        <div class="declaration-title">{titulo_documento}</div>
-        
-        <!-- CONTEÚDO PRINCIPAL -->
-        <div class="main-content" style="flex: 1 0 auto;">
-            <div class="main-text">
-                {texto_principal}
-            </div>
-            
-            <!-- CAIXA DE DECISÃO -->
-            <div class="decision-box">
-                <div class="decision-header">
+        </div>"""
+
+_DECISION_HEADER_BLOCK = """<div class="decision-header">
                     <div class="decision-title">APÓS AVALIAÇÃO CLÍNICA, FOI DECIDIDO:</div>
                     <div class="decision-options">
                         <div class="decision-option">
@@ -457,129 +245,111 @@ def get_html_template() -> str:
                             <span>Negada licença médica por motivo de doença:</span>
                         </div>
                     </div>
-                </div>
-                <div class="decision-footer">
-                    Caso o paciente não se sinta apto para retornar ao trabalho, deverá retornar ao médico assistente para uma nova avaliação.
-                </div>
-            </div>
-            
-            <!-- ASSINATURA -->
-            <div class="signature-section">
+                </div>"""
+
+_SIGNATURE_BLOCK = """<div class="signature-section">
                 <div class="signature-line">
                     <div class="signature-label">Médico do trabalho / Examinador</div>
                 </div>
                 <div class="signature-date">Brasília, {data_atual}</div>
-            </div>
-        </div>
-        
-        <!-- RODAPÉ -->
-        <div class="footer">
-            <div class="footer-line1">NOVA MEDICINA E SEGURANÇA DO TRABALHO LTDA.</div>
-            <div class="footer-line2">SDS, Bloco D, Ed. Eldorado, Entrada B, 1.º Subsolo - Sala 01 CEP 70.392.901 Brasília–DF.</div>
-        </div>
-    </div>
-    
-    <!-- PÁGINA 2 - PRONTUÁRIO -->
-    <div class="page" contenteditable="true">
-        <!-- CABEÇALHO (repetido) -->
-        <div class="header">
-            <img src="{logo_base64}" class="header-logo" alt="Logo NOVA" />
-            <div class="header-text">
-                <div class="header-title">NOVA | Medicina e Segurança do Trabalho.</div>
-                <div class="header-subtitle">Exames: Admissionais, Demissionais, Periódicos e Outros.</div>
-            </div>
-        </div>
-        
-        <!-- TÍTULO PRONTUÁRIO -->
-        <div class="prontuario-title">PRONTUÁRIO DE PERÍCIA MÉDICA</div>
-        
-        <!-- INFORMAÇÕES DO PACIENTE -->
-        <div class="patient-info">
-            <div class="patient-row">
-                <strong>NOME:</strong> {nome_paciente}
-            </div>
-            <div class="patient-row">
-                <strong>EMPRESA:</strong> {empresa_paciente}
-            </div>
-            <div class="patient-row">
-                <strong>CARGO:</strong> {cargo_paciente}
-            </div>
-            <div class="patient-row">
-                <strong>CID10:</strong> {codigo_cid}
-            </div>
-            <div class="patient-row">
-                <strong>DATA DO ATESTADO:</strong> {data_atestado} | <strong>Nº DE DIAS DE AFASTAMENTO:</strong> {qtd_dias_atestado}
-            </div>
-            <div class="patient-row">
-                <strong>IDENTIFICAÇÃO DO PROFISSIONAL DE SAÚDE QUE FORNECEU O ATESTADO:</strong><br>
-                Dr. (a) {nome_medico} {crm_medico}-{uf_crm_medico}
-            </div>
-        </div>
-        
-        <!-- OBSERVAÇÕES MÉDICAS -->
-        <div class="observacoes-box">
-            <div class="observacoes-header">
-                OBSERVAÇÕES / ANOTAÇÕES DO MÉDICO EXAMINADOR:
-            </div>
-            <div class="observacoes-content">
-                <!-- Espaço para anotações -->
-            </div>
-        </div>
-        
-        <!-- CAIXA DE DECISÃO (repetida) -->
-        <div class="decision-box" style="margin: 20px 25px;">
-            <div class="decision-header">
-                <div class="decision-title">APÓS AVALIAÇÃO CLÍNICA, FOI DECIDIDO:</div>
-                <div class="decision-options">
-                    <div class="decision-option">
-                        <div class="checkbox"></div>
-                        <span>Afastamento Total:</span>
-                    </div>
-                    <div class="decision-option">
-                        <div class="checkbox"></div>
-                        <span>Afastamento parcial pelo período de:</span>
-                    </div>
-                    <div class="decision-option">
-                        <div class="checkbox"></div>
-                        <span>Negada licença médica por motivo de doença:</span>
-                    </div>
-                </div>
-            </div>
-        </div>
-        
-        <!-- ASSINATURA -->
-        <div class="signature-section">
-            <div class="signature-line">
-                <div class="signature-label">Médico do trabalho / Examinador</div>
-            </div>
-            <div class="signature-date">Brasília, {data_atual}</div>
-        </div>
-        
-        <!-- RODAPÉ -->
-        <div class="footer">
+            </div>"""
+
+_FOOTER_BLOCK = """<div class="footer">
             <div class="footer-line1">NOVA MEDICINA E SEGURANÇA DO TRABALHO LTDA.</div>
             <div class="footer-line2">SDS, Bloco D, Ed. Eldorado, Entrada B, 1.º Subsolo - Sala 01 CEP 70.392.901 Brasília–DF.</div>
-        </div>
-    </div>
-</body>
-</html>"""
+        </div>"""
+
 
+# Esqueleto do template mantido em arquivo .html próprio: lido uma única
+# vez no import (o SO serve o conteúdo do page cache) e fora do bytecode
+# do módulo, que fica menor e mais rápido de compilar
+_TEMPLATE_PATH = Path(__file__).parent / 'templates' / 'declaracao.html'
+_TEMPLATE_SKELETON = _TEMPLATE_PATH.read_text(encoding='utf-8')
 
+# Template final montado uma única vez no carregamento do módulo
+_HTML_TEMPLATE = (
+    _TEMPLATE_SKELETON
+    .replace('{header_block}', _HEADER_BLOCK)
+    .replace('{decision_header_block}', _DECISION_HEADER_BLOCK)
+    .replace('{signature_block}', _SIGNATURE_BLOCK)
+    .replace('{footer_block}', _FOOTER_BLOCK)
+)
+
+# Regex pré-compilada que casa qualquer placeholder do template; permite
+# substituir todos os campos em UMA varredura linear, em vez de um
+# str.replace (duas varreduras completas) por placeholder
+_PLACEHOLDER_RE = re.compile(r'\{[a-z_0-9]+\}|___/___/____')
+
+
+def get_html_template() -> str:
+    """
+    Retorna o template HTML completo e totalmente responsivo
+
+    O template replica EXATAMENTE o layout do documento Word oficial com:
+    - Cabeçalho com logo e título
+    - Corpo do documento com declaração médica
+    - Tabelas de decisão e prontuário do paciente
+    - Assinatura do médico com carimbo
+    - Rodapé com mensagem institucional
+
+    Returns:
+        str: Template HTML completo com CSS incorporado
+    """
+    return _HTML_TEMPLATE
+
+
+@lru_cache(maxsize=128)
+def _render_html(replacement_items: tuple) -> str:
+    """
+    Aplica as substituições no template e memoiza o resultado
+
+    Recebe os pares (placeholder, valor) como tupla hashável; assim,
+    regerações do mesmo atestado (preview + salvar, reimpressões) reutilizam
+    o HTML já renderizado em vez de varrer o template novamente.
+
+    O logo NÃO entra aqui: o {logo_base64} (data URI de ~800 KB, presente
+    duas vezes no template) é emendado pelo chamador depois da renderização,
+    para que cada entrada do cache fique na casa dos KB e não dos MB.
+
+    Args:
+        replacement_items: Tupla de pares (placeholder, valor)
+
+    Returns:
+        str: HTML com todos os placeholders substituídos
+    """
+    ctx = dict(replacement_items)
+
+    # O texto principal carrega placeholders próprios ({nome_paciente} etc.);
+    # resolvê-los primeiro para que a passada única sobre o template baste
+    texto_principal = ctx.get('{texto_principal}')
+    if texto_principal:
+        ctx['{texto_principal}'] = _PLACEHOLDER_RE.sub(
+            lambda m: ctx.get(m.group(), m.group()), texto_principal
+        )
+
+    return _PLACEHOLDER_RE.sub(lambda m: ctx.get(m.group(), m.group()), get_html_template())
+
+
+@lru_cache(maxsize=1)
 def get_logo_base64() -> str:
-    """Retorna logo em base64 do arquivo extraído"""
+    """Retorna logo em base64: constante pré-gerada ou, na falta, o arquivo extraído"""
+    # Constante gerada por build_logo_constant.py: zero I/O e zero encode
+    # em tempo de execução quando presente
+    try:
+        from core._logo_const import LOGO_DATA_URI
+        return LOGO_DATA_URI
+    except ImportError:
+        pass
     try:
         logo_path = Path(__file__).parent.parent / 'assets' / 'extracted_images' / 'image1.png'
         if logo_path.exists():
-            with open(logo_path, 'rb') as f:
-                img_data = base64.b64encode(f.read()).decode('utf-8')
-            return f'data:image/png;base64,{img_data}'
+            return f'data:image/png;base64,{_encode_file_b64(logo_path)}'
     except Exception as e:
         logger.warning(f"⚠️ Erro ao carregar logo: {e}")
     return ''
 
 
-def generate_html(data: Dict[str, Any], logo_left: Optional[str] = None, 
-                  logo_right: Optional[str] = None) -> str:
+def generate_html(data: Dict[str, Any]) -> str:
     """
     Gera documento HTML completo a partir dos dados fornecidos
     
@@ -595,50 +365,56 @@ def generate_html(data: Dict[str, Any], logo_left: Optional[str] = None,
     try:
         logger.info("📄 Iniciando geração de documento HTML...")
         
-        # Obter template HTML base
-        html_template = get_html_template()
-        
         # Converter logo para base64 (incorporado no HTML)
         logo_base64 = get_logo_base64()
         
-        # Preparar dados do médico para formatação
-        nome_medico_completo = str(data.get('nome_medico', '')).strip()
-        tipo_registro = str(data.get('tipo_registro_medico', '')).strip()
-        crm_numero = str(data.get('crm_medico', '')).strip()
-        uf_crm = str(data.get('uf_crm_medico', '')).strip()
-        
+        # Normalizar e escapar os campos textuais em uma única passada
+        s = {
+            k: str(data.get(k, '') or '').strip().translate(_HTML_ESCAPE_TABLE)
+            for k in _STR_FIELDS
+        }
+
         # Formatar registro profissional: "CRM 12345" ou apenas número se tipo não informado
-        crm_formatado = f"{tipo_registro} {crm_numero}" if tipo_registro else crm_numero
+        tipo_registro = s['tipo_registro_medico']
+        crm_formatado = f"{tipo_registro} {s['crm_medico']}" if tipo_registro else s['crm_medico']
         
         # Definir título e texto principal com o modelo de Homologação
         titulo_documento = 'DECLARAÇÃO'
         texto_principal = "Declaro que o Sr. (A) <strong>{nome_paciente}</strong> de <strong>{documento_paciente_formatado}</strong>. Compareceu a esta clínica com objetivo de submeter-se a avaliação médica administrativa em virtude do atestado médico data do <strong>{data_atestado}</strong> em que foi sugerido afastamento pelo período de <strong>{qtd_dias_atestado} dia(s)</strong> com CID: <strong>{codigo_cid}</strong> emitido (a) pelo (a) Dr. (a) <strong>{nome_medico} {crm_medico}-{uf_crm_medico}</strong>."
 
+        # Formatar documento do paciente sem repetir upper() para tipos conhecidos
+        tipo_doc_raw = str(data.get('tipo_doc_paciente', '') or '')
+        tipo_doc = _DOC_TYPE_UPPER.get(tipo_doc_raw.lower(), tipo_doc_raw.upper())
+        numero_doc = str(data.get('numero_doc_paciente', '') or '')
+        documento_formatado = ''.join(
+            (tipo_doc, ' nº: ', numero_doc)
+        ).translate(_HTML_ESCAPE_TABLE)
+
         # SEMPRE usa a data atual do sistema para assinatura
-        data_atual_sistema = datetime.now()
+        data_atual_formatada = _data_atual_do_dia(date.today().toordinal())
         replacements = {
-            '{logo_base64}': logo_base64,
             '{titulo_documento}': titulo_documento,
             '{texto_principal}': texto_principal,
-            '{nome_paciente}': str(data.get('nome_paciente', '')).strip(),
-            '{documento_paciente_formatado}': f"{data.get('tipo_doc_paciente', '').upper()} nº: {data.get('numero_doc_paciente', '')}",
-            '{data_atestado}': _format_date_brazil(data.get('data_atestado', '')),
-            '{data_atual}': _format_date_brazil(data_atual_sistema),
-            '___/___/____': _format_date_brazil(data_atual_sistema),
-            '{qtd_dias_atestado}': str(data.get('qtd_dias_atestado', '')),
-            '{codigo_cid}': str(data.get('codigo_cid', '')).strip(),
-            '{cargo_paciente}': str(data.get('cargo_paciente', '')).strip(),
-            '{empresa_paciente}': str(data.get('empresa_paciente', '')).strip(),
-            '{nome_medico}': nome_medico_completo,
+            '{nome_paciente}': s['nome_paciente'],
+            '{documento_paciente_formatado}': documento_formatado,
+            '{data_atestado}': _format_date_brazil(data.get('data_atestado', '')).translate(_HTML_ESCAPE_TABLE),
+            '{data_atual}': data_atual_formatada,
+            '___/___/____': data_atual_formatada,
+            '{qtd_dias_atestado}': str(data.get('qtd_dias_atestado', '')).translate(_HTML_ESCAPE_TABLE),
+            '{codigo_cid}': s['codigo_cid'],
+            '{cargo_paciente}': s['cargo_paciente'],
+            '{empresa_paciente}': s['empresa_paciente'],
+            '{nome_medico}': s['nome_medico'],
             '{crm_medico}': crm_formatado,
-            '{uf_crm_medico}': uf_crm,
+            '{uf_crm_medico}': s['uf_crm_medico'],
         }
         
-        # Substituir todos os placeholders no template
-        html_content = html_template
-        for key, value in replacements.items():
-            html_content = html_content.replace(key, value)
-        
+        # Substituir todos os placeholders no template (memoizado por
+        # conteúdo) e só então emendar o logo: o HTML em cache mantém o
+        # placeholder {logo_base64}, evitando reter o data URI por entrada
+        html_content = _render_html(tuple(replacements.items()))
+        html_content = html_content.replace('{logo_base64}', logo_base64)
+
         logger.info("✅ HTML gerado com sucesso!")
         return html_content
         
@@ -647,6 +423,26 @@ def generate_html(data: Dict[str, Any], logo_left: Optional[str] = None,
         raise HTMLGenerationError(f"Erro ao gerar HTML: {e}")
 
 
+def generate_many(data_list) -> list:
+    """
+    Gera vários documentos HTML em lote
+
+    O template montado, a regex de placeholders e a logo em base64 já são
+    cacheados no módulo, então o custo de preparação é pago uma única vez
+    e cada item da lista paga apenas a substituição dos próprios campos.
+
+    Args:
+        data_list: Sequência de dicionários com dados de atestados
+
+    Returns:
+        list: HTMLs completos, na mesma ordem da entrada
+
+    Raises:
+        HTMLGenerationError: Se houver erro na geração de algum documento
+    """
+    return [generate_html(data) for data in data_list]
+
+
 def save_html(html_content: str, output_path: Optional[str] = None) -> str:
     """
     Salva conteúdo HTML em arquivo no disco
@@ -662,46 +458,61 @@ def save_html(html_content: str, output_path: Optional[str] = None) -> str:
         Exception: Se houver erro ao escrever o arquivo
     """
     try:
-        if not output_path:
-            # Gerar nome de arquivo automático com timestamp
-            GENERATED_DOCS_DIR.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = GENERATED_DOCS_DIR / f"Declaracao_{timestamp}.html"
-        
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Escrever HTML no arquivo com encoding UTF-8
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        logger.info(f"✅ HTML salvo em: {output_path}")
-        return str(output_path)
+        # Um único objeto Path reutilizado do início ao fim da função
+        if output_path:
+            out = Path(output_path)
+        else:
+            # Nome automático com timestamp único (ver _fast_stamp)
+            out = GENERATED_DOCS_DIR / f"Declaracao_{_fast_stamp()}.html"
+
+        _ensure_dir(out.parent)
+
+        # Escrever HTML no arquivo com encoding UTF-8 (encode único + write único,
+        # sem a camada incremental do TextIOWrapper)
+        out.write_bytes(html_content.encode('utf-8'))
+
+        logger.info(f"✅ HTML salvo em: {out}")
+        return str(out)
         
     except Exception as e:
         logger.error(f"❌ Erro ao salvar HTML: {e}")
         raise HTMLGenerationError(f"Erro ao salvar HTML: {e}")
 
 
-def generate_and_save_html(data: Dict[str, Any], logo_left: Optional[str] = None,
-                           logo_right: Optional[str] = None, 
-                           output_path: Optional[str] = None) -> str:
+def generate_and_save_html(data: Dict[str, Any], output_path: Optional[str] = None) -> str:
     """
     Função de conveniência que gera E salva o documento HTML em uma única chamada
-    
+
     Args:
         data: Dicionário com dados do atestado médico
-        logo_left: Caminho do logo esquerdo (não usado)
-        logo_right: Caminho do logo direito (não usado)
         output_path: Onde salvar o arquivo (opcional - gera automaticamente)
-        
+
     Returns:
         str: Caminho completo do arquivo HTML salvo
     """
-    html_content = generate_html(data, logo_left, logo_right)
+    html_content = generate_html(data)
     return save_html(html_content, output_path)
 
 
+async def generate_and_save_html_async(data: Dict[str, Any], output_path: Optional[str] = None) -> str:
+    """
+    Versão assíncrona de generate_and_save_html
+
+    Despacha a renderização e a escrita em disco para uma thread via
+    asyncio.to_thread, então handlers async (FastAPI) continuam atendendo
+    outras requisições enquanto o documento é gerado e salvo.
+
+    Args:
+        data: Dicionário com dados do atestado médico
+        output_path: Onde salvar o arquivo (opcional - gera automaticamente)
+
+    Returns:
+        str: Caminho completo do arquivo HTML salvo
+    """
+    import asyncio
+    return await asyncio.to_thread(generate_and_save_html, data, output_path)
+
+
 if __name__ == '__main__':
     # Teste de geração de HTML
     print("🧪 Testando geração de HTML...")
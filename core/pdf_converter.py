@@ -12,9 +12,15 @@ Este módulo implementa:
 """
 
 import os
+import hashlib
+import importlib.util
 import logging
+import shutil
 import subprocess
 import platform
+import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -25,6 +31,104 @@ class PDFConversionError(Exception):
     pass
 
 
+# Disponibilidade dos backends sondada uma única vez no import (find_spec
+# só consulta o path, sem importar); a cadeia de fallback pula direto os
+# conversores ausentes em vez de pagar um ImportError por chamada
+_HAS_DOCX2PDF = importlib.util.find_spec('docx2pdf') is not None
+
+# Backend docx2pdf importado uma única vez por processo; o lock evita que
+# chamadas concorrentes na primeira conversão dupliquem o import
+_docx2pdf_convert = None
+_backend_lock = threading.Lock()
+
+
+def _get_docx2pdf():
+    """Retorna a função convert do docx2pdf, importada na primeira chamada"""
+    global _docx2pdf_convert
+    if _docx2pdf_convert is None:
+        with _backend_lock:
+            if _docx2pdf_convert is None:
+                try:
+                    from docx2pdf import convert
+                except ImportError:
+                    raise PDFConversionError(
+                        "Biblioteca docx2pdf não instalada. Instale com: pip install docx2pdf"
+                    )
+                _docx2pdf_convert = convert
+    return _docx2pdf_convert
+
+
+@lru_cache(maxsize=1)
+def _find_libreoffice() -> str:
+    """
+    Localiza o binário do LibreOffice uma única vez por processo.
+
+    A variável de ambiente LIBREOFFICE_BIN, quando definida, curto-circuita
+    toda a detecção (útil em containers com caminho fixo). Fora isso, usa
+    apenas consultas ao PATH e ao filesystem (shutil.which/isfile), nunca
+    executa o binário para testá-lo. O resultado é cacheado, então as
+    conversões seguintes não repetem a busca.
+
+    Returns:
+        str: Caminho (ou nome) do executável do LibreOffice
+    """
+    env_bin = os.environ.get('LIBREOFFICE_BIN')
+    if env_bin:
+        return env_bin
+
+    found = shutil.which("libreoffice") or shutil.which("soffice")
+    if found:
+        return found
+
+    if platform.system() == "Windows":
+        possible_paths = [
+            r"C:\Program Files\LibreOffice\program\soffice.exe",
+            r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
+            os.path.expandvars(r"%ProgramFiles%\LibreOffice\program\soffice.exe"),
+        ]
+        for path in possible_paths:
+            if os.path.isfile(path):
+                return path
+        # Última tentativa: comando global (falha vira FileNotFoundError no run)
+        return "soffice"
+
+    return "libreoffice"
+
+
+def _libreoffice_convert_cmd(docx_path: Path, tmp_dir: str) -> list:
+    """
+    Monta o comando de conversão headless com perfil de usuário isolado.
+
+    O LibreOffice trava o perfil de usuário padrão (tdf#37531): uma segunda
+    instância iniciada enquanto outra segura o lock sai sem converter nada.
+    O -env:UserInstallation aponta cada conversão para um perfil descartável
+    dentro do próprio diretório temporário, então conversões concorrentes
+    (batch paralelo, variante async, requisições simultâneas da API) nunca
+    disputam o mesmo perfil. --norestore/--nologo/--nodefault pulam
+    recuperação de sessão, splash e documento inicial, cortando parte do
+    custo de inicialização pago a cada conversão.
+
+    Args:
+        docx_path: Caminho do arquivo DOCX de entrada
+        tmp_dir: Diretório temporário da conversão (saída e perfil)
+
+    Returns:
+        list: Argumentos prontos para subprocess
+    """
+    profile_uri = (Path(tmp_dir) / 'lo_profile').absolute().as_uri()
+    return [
+        _find_libreoffice(),
+        "--headless",
+        "--norestore",
+        "--nologo",
+        "--nodefault",
+        f"-env:UserInstallation={profile_uri}",
+        "--convert-to", "pdf",
+        "--outdir", tmp_dir,
+        str(docx_path),
+    ]
+
+
 def convert_docx_to_pdf_libreoffice(docx_path: str, output_dir: Optional[str] = None) -> str:
     """
     Converte DOCX para PDF usando LibreOffice headless.
@@ -53,56 +157,35 @@ def convert_docx_to_pdf_libreoffice(docx_path: str, output_dir: Optional[str] =
     pdf_path = output_dir / f"{docx_path.stem}.pdf"
     
     try:
-        # Detectar comando do LibreOffice baseado no sistema operacional
-        if platform.system() == "Windows":
-            # Windows: procurar em locais comuns
-            possible_paths = [
-                r"C:\Program Files\LibreOffice\program\soffice.exe",
-                r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
-                os.path.expandvars(r"%ProgramFiles%\LibreOffice\program\soffice.exe"),
-            ]
-            libreoffice_cmd = None
-            for path in possible_paths:
-                if os.path.exists(path):
-                    libreoffice_cmd = path
-                    break
-            
-            if not libreoffice_cmd:
-                # Tentar usar comando global
-                libreoffice_cmd = "soffice"
-        else:
-            # Linux/Mac: usar comando padrão
-            libreoffice_cmd = "libreoffice"
-        
-        # Comando para conversão headless
-        cmd = [
-            libreoffice_cmd,
-            "--headless",
-            "--convert-to", "pdf",
-            "--outdir", str(output_dir),
-            str(docx_path)
-        ]
-        
-        logger.info(f"Executando conversão PDF: {' '.join(cmd)}")
-        
-        # Executar conversão
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30,  # Timeout de 30 segundos
-            check=True
-        )
-        
-        logger.debug(f"Saída do LibreOffice: {result.stdout}")
-        
-        # Verificar se o PDF foi gerado
-        if not pdf_path.exists():
-            raise PDFConversionError(f"PDF não foi gerado em: {pdf_path}")
-        
+        # Converter para um subdiretório temporário e promover o resultado
+        # com os.replace (atômico): workers concorrentes nunca enxergam um
+        # PDF parcialmente escrito no caminho final. O mesmo diretório
+        # hospeda o perfil isolado do LibreOffice (ver _libreoffice_convert_cmd)
+        with tempfile.TemporaryDirectory(prefix='.pdf_partial_', dir=output_dir) as tmp_dir:
+            cmd = _libreoffice_convert_cmd(docx_path, tmp_dir)
+
+            logger.info(f"Executando conversão PDF: {' '.join(cmd)}")
+
+            # Executar conversão
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=30,  # Timeout de 30 segundos
+                check=True
+            )
+
+            logger.debug(f"Saída do LibreOffice: {result.stdout}")
+
+            # Verificar se o PDF foi gerado e promovê-lo ao caminho final
+            tmp_pdf = Path(tmp_dir) / pdf_path.name
+            if not tmp_pdf.exists() or tmp_pdf.stat().st_size == 0:
+                raise PDFConversionError(f"PDF não foi gerado em: {pdf_path}")
+            os.replace(tmp_pdf, pdf_path)
+
         logger.info(f"PDF gerado com sucesso: {pdf_path}")
         return str(pdf_path)
-        
+
     except subprocess.TimeoutExpired:
         raise PDFConversionError("Timeout na conversão para PDF (>30s)")
     except subprocess.CalledProcessError as e:
@@ -118,6 +201,79 @@ def convert_docx_to_pdf_libreoffice(docx_path: str, output_dir: Optional[str] =
         raise PDFConversionError(f"Erro inesperado: {e}")
 
 
+async def convert_docx_to_pdf_libreoffice_async(docx_path: str,
+                                                output_dir: Optional[str] = None) -> str:
+    """
+    Versão assíncrona da conversão via LibreOffice headless.
+
+    Usa asyncio.create_subprocess_exec, então o event loop continua
+    atendendo outras requisições enquanto o LibreOffice converte — sem
+    isso, cada conversão bloquearia o worker pelo tempo todo do processo.
+
+    Args:
+        docx_path: Caminho do arquivo DOCX de entrada
+        output_dir: Diretório de saída (padrão: mesmo do arquivo de entrada)
+
+    Returns:
+        str: Caminho do arquivo PDF gerado
+
+    Raises:
+        PDFConversionError: Se houver erro na conversão
+    """
+    import asyncio
+
+    docx_path = Path(docx_path)
+    if not docx_path.exists():
+        raise PDFConversionError(f"Arquivo DOCX não encontrado: {docx_path}")
+
+    if output_dir is None:
+        output_dir = docx_path.parent
+    else:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    pdf_path = output_dir / f"{docx_path.stem}.pdf"
+
+    try:
+        # Mesmo padrão atômico da versão síncrona: converte em subdiretório
+        # temporário e promove com os.replace; o perfil isolado do helper é
+        # essencial aqui, já que conversões async sobrepostas são o caso de uso
+        with tempfile.TemporaryDirectory(prefix='.pdf_partial_', dir=output_dir) as tmp_dir:
+            cmd = _libreoffice_convert_cmd(docx_path, tmp_dir)
+
+            logger.info(f"Executando conversão PDF (async): {' '.join(cmd)}")
+
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=30)
+            except asyncio.TimeoutError:
+                proc.kill()
+                raise PDFConversionError("Timeout na conversão para PDF (>30s)")
+
+            if proc.returncode != 0:
+                stderr_text = stderr.decode(errors='replace')
+                logger.error(f"Erro ao executar LibreOffice: {stderr_text}")
+                raise PDFConversionError(f"Erro na conversão: {stderr_text}")
+
+            tmp_pdf = Path(tmp_dir) / pdf_path.name
+            if not tmp_pdf.exists() or tmp_pdf.stat().st_size == 0:
+                raise PDFConversionError(f"PDF não foi gerado em: {pdf_path}")
+            os.replace(tmp_pdf, pdf_path)
+
+        logger.info(f"PDF gerado com sucesso: {pdf_path}")
+        return str(pdf_path)
+
+    except FileNotFoundError:
+        raise PDFConversionError(
+            "LibreOffice não encontrado. Instale com: apt-get install libreoffice (Linux) "
+            "ou baixe de https://www.libreoffice.org/download/download/"
+        )
+
+
 def convert_docx_to_pdf_docx2pdf(docx_path: str, output_dir: Optional[str] = None) -> str:
     """
     Converte DOCX para PDF usando biblioteca docx2pdf (somente Windows).
@@ -132,13 +288,8 @@ def convert_docx_to_pdf_docx2pdf(docx_path: str, output_dir: Optional[str] = Non
     Raises:
         PDFConversionError: Se houver erro na conversão
     """
-    try:
-        from docx2pdf import convert
-    except ImportError:
-        raise PDFConversionError(
-            "Biblioteca docx2pdf não instalada. Instale com: pip install docx2pdf"
-        )
-    
+    convert = _get_docx2pdf()
+
     docx_path = Path(docx_path)
     if not docx_path.exists():
         raise PDFConversionError(f"Arquivo DOCX não encontrado: {docx_path}")
@@ -190,8 +341,8 @@ def convert_docx_to_pdf(docx_path: str, output_dir: Optional[str] = None) -> str
         logger.warning(f"LibreOffice falhou: {e}")
         errors.append(f"LibreOffice: {e}")
     
-    # Estratégia 2: docx2pdf (somente Windows)
-    if platform.system() == "Windows":
+    # Estratégia 2: docx2pdf (somente Windows e somente se instalado)
+    if platform.system() == "Windows" and _HAS_DOCX2PDF:
         try:
             return convert_docx_to_pdf_docx2pdf(docx_path, output_dir)
         except PDFConversionError as e:
@@ -203,6 +354,146 @@ def convert_docx_to_pdf(docx_path: str, output_dir: Optional[str] = None) -> str
     raise PDFConversionError(error_msg)
 
 
+# tmpfs quando disponível: mantém o PDF intermediário em RAM, sem tocar disco
+_TMPFS_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+def convert_docx_to_pdf_bytes(docx_path: str) -> bytes:
+    """
+    Converte DOCX para PDF e retorna os bytes, sem arquivo de saída persistente.
+
+    Para quem vai servir o PDF direto por HTTP, evita o ciclo
+    escrever-no-disco + reler: a conversão acontece em um diretório
+    temporário (tmpfs quando disponível) descartado ao final.
+
+    Args:
+        docx_path: Caminho do arquivo DOCX de entrada
+
+    Returns:
+        bytes: Conteúdo do PDF gerado
+
+    Raises:
+        PDFConversionError: Se houver erro na conversão
+    """
+    with tempfile.TemporaryDirectory(prefix='pdf_conv_', dir=_TMPFS_DIR) as tmp_dir:
+        pdf_path = convert_docx_to_pdf(docx_path, tmp_dir)
+        return Path(pdf_path).read_bytes()
+
+
+# Cache de PDFs convertidos, chaveado pelo hash do conteúdo do DOCX
+_PDF_CACHE_DIR = Path(tempfile.gettempdir()) / 'atestado_pdf_cache'
+_PDF_CACHE_MAX_ENTRIES = 500
+
+
+def _hash_file_blake2b(path: Path) -> str:
+    """Hash blake2b do conteúdo do arquivo (rápido; chave de cache, não criptografia)"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _evict_pdf_cache() -> None:
+    """Remove as entradas mais antigas quando o cache passa do limite"""
+    try:
+        entries = sorted(_PDF_CACHE_DIR.glob('*.pdf'), key=lambda p: p.stat().st_mtime)
+        for stale in entries[:-_PDF_CACHE_MAX_ENTRIES]:
+            stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def convert_docx_to_pdf_cached(docx_path: str, output_dir: Optional[str] = None) -> str:
+    """
+    Converte DOCX para PDF reutilizando conversões anteriores do mesmo conteúdo.
+
+    O DOCX é hasheado com blake2b e o PDF resultante fica guardado em um
+    diretório de cache no tempdir; reconversões do mesmo documento (preview
+    repetido, reimpressão) viram uma cópia de arquivo em vez de um novo
+    subprocess do LibreOffice.
+
+    Args:
+        docx_path: Caminho do arquivo DOCX de entrada
+        output_dir: Diretório de saída (padrão: mesmo do arquivo de entrada)
+
+    Returns:
+        str: Caminho do arquivo PDF gerado
+
+    Raises:
+        PDFConversionError: Se houver erro na conversão
+    """
+    src = Path(docx_path)
+    if not src.exists():
+        raise PDFConversionError(f"Arquivo DOCX não encontrado: {src}")
+
+    out_dir = Path(output_dir) if output_dir else src.parent
+    out_dir.mkdir(parents=True, exist_ok=True)
+    pdf_path = out_dir / f"{src.stem}.pdf"
+
+    try:
+        key = _hash_file_blake2b(src)
+        cached = _PDF_CACHE_DIR / f"{key}.pdf"
+        if cached.exists():
+            logger.info(f"PDF reutilizado do cache: {cached}")
+            shutil.copyfile(cached, pdf_path)
+            return str(pdf_path)
+    except OSError as e:
+        logger.warning(f"Cache de PDF indisponível, convertendo direto: {e}")
+        return convert_docx_to_pdf(docx_path, output_dir)
+
+    result = convert_docx_to_pdf(docx_path, output_dir)
+
+    try:
+        _PDF_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(result, cached)
+        _evict_pdf_cache()
+    except OSError as e:
+        logger.warning(f"Falha ao popular cache de PDF: {e}")
+
+    return result
+
+
+def convert_many_docx_to_pdf(docx_paths, output_dir: Optional[str] = None,
+                             max_workers: Optional[int] = None) -> list:
+    """
+    Converte vários DOCX para PDF em paralelo.
+
+    Cada conversão é um subprocess do LibreOffice (ou docx2pdf), então o
+    trabalho pesado acontece fora do interpretador e threads bastam para
+    rodar várias conversões simultâneas. O limite de paralelismo pode ser
+    ajustado pela variável de ambiente PDF_MAX_PARALLELISM.
+
+    Args:
+        docx_paths: Sequência de caminhos de arquivos DOCX
+        output_dir: Diretório de saída (padrão: mesmo de cada arquivo)
+        max_workers: Número máximo de conversões simultâneas
+            (padrão: PDF_MAX_PARALLELISM ou os.cpu_count())
+
+    Returns:
+        list: Caminhos dos PDFs gerados, na mesma ordem da entrada
+
+    Raises:
+        PDFConversionError: Se qualquer conversão falhar
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    docx_paths = list(docx_paths)
+    if not docx_paths:
+        return []
+
+    if max_workers is None:
+        max_workers = int(os.environ.get('PDF_MAX_PARALLELISM') or (os.cpu_count() or 1))
+    max_workers = max(1, min(max_workers, len(docx_paths)))
+
+    logger.info(f"Convertendo {len(docx_paths)} DOCX para PDF com {max_workers} worker(s)")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(convert_docx_to_pdf, path, output_dir)
+                   for path in docx_paths]
+        return [future.result() for future in futures]
+
+
 if __name__ == '__main__':
     # Teste rápido
     import sys
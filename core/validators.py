@@ -13,10 +13,33 @@ Este módulo fornece funções de validação para:
 
 import re
 import logging
+from datetime import date
+from functools import lru_cache
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Padrões pré-compilados uma única vez no import: os validadores rodam por
+# campo a cada submissão e não precisam repetir o lookup do cache do re
+_DATE_RE = re.compile(r'^\d{2}/\d{2}/\d{4}$')
+_CID_RE = re.compile(r'^[A-Z]\d{2}(\.\d+)?$')
+
+# Pesos dos dois dígitos verificadores do CPF (imutáveis - definidos uma vez)
+_CPF_W1 = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+_CPF_W2 = (11, 10, 9, 8, 7, 6, 5, 4, 3, 2)
+
+
+class _TabelaSoDigitos(dict):
+    """Tabela para str.translate que mantém dígitos e descarta o resto"""
+    def __missing__(self, codepoint):
+        return None  # qualquer caractere não mapeado é removido
+
+
+# str.translate com esta tabela roda um laço em C, mais rápido que o
+# re.sub(r'\D', ...) para strings curtas como CPF/RG
+_SO_DIGITOS = _TabelaSoDigitos((ord(d), d) for d in '0123456789')
+
+@lru_cache(maxsize=4096)
 def validar_cpf(cpf: str) -> bool:
     """
     Valida um CPF brasileiro (apenas dígitos).
@@ -28,36 +51,35 @@ def validar_cpf(cpf: str) -> bool:
         bool: True se o CPF é válido, False caso contrário
     """
     # Remove caracteres não numéricos
-    cpf_numeros = re.sub(r'\D', '', cpf)
+    cpf_numeros = cpf.translate(_SO_DIGITOS)
     
     # Verifica se tem 11 dígitos
     if len(cpf_numeros) != 11:
         return False
     
-    # Verifica se todos os dígitos são iguais (CPF inválido)
-    if cpf_numeros == cpf_numeros[0] * 11:
+    # Verifica se todos os dígitos são iguais (CPF inválido) sem alocar
+    # a string repetida do comparativo
+    if len(set(cpf_numeros)) == 1:
         return False
     
-    # Calcula o primeiro dígito verificador
-    soma = sum(int(cpf_numeros[i]) * (10 - i) for i in range(9))
-    resto = soma % 11
+    # Decodifica os 11 dígitos de uma vez (ord - 48), em vez de 19 int()
+    digitos = [c - 48 for c in cpf_numeros.encode('ascii')]
+
+    # Calcula e verifica o primeiro dígito verificador
+    resto = sum(d * w for d, w in zip(digitos, _CPF_W1)) % 11
     digito1 = 0 if resto < 2 else 11 - resto
-    
-    # Verifica o primeiro dígito
-    if int(cpf_numeros[9]) != digito1:
+    if digitos[9] != digito1:
         return False
-    
-    # Calcula o segundo dígito verificador
-    soma = sum(int(cpf_numeros[i]) * (11 - i) for i in range(10))
-    resto = soma % 11
+
+    # Calcula e verifica o segundo dígito verificador
+    resto = sum(d * w for d, w in zip(digitos, _CPF_W2)) % 11
     digito2 = 0 if resto < 2 else 11 - resto
-    
-    # Verifica o segundo dígito
-    if int(cpf_numeros[10]) != digito2:
+    if digitos[10] != digito2:
         return False
-    
+
     return True
 
+@lru_cache(maxsize=4096)
 def validar_rg(rg: str, min_length: int = 5, max_length: int = 15) -> bool:
     """
     Valida um RG brasileiro.
@@ -72,15 +94,15 @@ def validar_rg(rg: str, min_length: int = 5, max_length: int = 15) -> bool:
         bool: True se o RG é válido, False caso contrário
     """
     # Remove caracteres não numéricos
-    rg_numeros = re.sub(r'\D', '', rg)
+    rg_numeros = rg.translate(_SO_DIGITOS)
     
     # Verifica tamanho
     if len(rg_numeros) < min_length or len(rg_numeros) > max_length:
         logger.debug(f"RG '{rg}' com tamanho inválido: {len(rg_numeros)} dígitos")
         return False
     
-    # Verifica se não são todos os dígitos iguais
-    if rg_numeros == rg_numeros[0] * len(rg_numeros):
+    # Verifica se não são todos os dígitos iguais (sem string repetida)
+    if len(set(rg_numeros)) == 1:
         logger.debug(f"RG '{rg}' com todos os dígitos iguais")
         return False
     
@@ -97,7 +119,7 @@ def formatar_cpf(cpf: str) -> str:
         str: CPF formatado ou string original se inválido
     """
     # Remove caracteres não numéricos
-    cpf_numeros = re.sub(r'\D', '', cpf)
+    cpf_numeros = cpf.translate(_SO_DIGITOS)
     
     if len(cpf_numeros) != 11:
         return cpf
@@ -114,7 +136,7 @@ def limpar_documento(documento: str) -> str:
     Returns:
         str: Documento contendo apenas dígitos
     """
-    return re.sub(r'\D', '', documento)
+    return documento.translate(_SO_DIGITOS)
 
 def validar_nome(nome: str, min_length: int = 3, max_length: int = 200) -> bool:
     """
@@ -142,13 +164,15 @@ def validar_nome(nome: str, min_length: int = 3, max_length: int = 200) -> bool:
         logger.debug(f"Nome '{nome}' não contém sobrenome")
         return False
     
-    # Verifica se contém apenas letras e espaços
-    if not re.match(r'^[A-Za-zÀ-ÿ\s]+$', nome_limpo):
+    # Verifica se contém apenas letras e espaços; isalpha roda em C e cobre
+    # letras Unicode (incluindo acentuadas) sem precisar de classe de regex
+    if not nome_limpo.replace(' ', '').isalpha():
         logger.debug(f"Nome '{nome}' contém caracteres inválidos")
         return False
     
     return True
 
+@lru_cache(maxsize=4096)
 def validar_data_brasileira(data: str) -> bool:
     """
     Valida uma data no formato brasileiro DD/MM/AAAA
@@ -159,37 +183,16 @@ def validar_data_brasileira(data: str) -> bool:
     Returns:
         bool: True se a data é válida, False caso contrário
     """
-    padrao = r'^\d{2}/\d{2}/\d{4}$'
-    
-    if not re.match(padrao, data):
+    if not _DATE_RE.match(data):
         return False
-    
+
     try:
         dia, mes, ano = map(int, data.split('/'))
-        
-        # Validações básicas
-        if mes < 1 or mes > 12:
-            return False
-        
-        if dia < 1 or dia > 31:
-            return False
-        
-        if ano < 1900 or ano > 2100:
-            return False
-        
-        # Validar dias por mês
-        dias_por_mes = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-        
-        # Verificar ano bissexto
-        if ano % 4 == 0 and (ano % 100 != 0 or ano % 400 == 0):
-            dias_por_mes[1] = 29
-        
-        if dia > dias_por_mes[mes - 1]:
-            return False
-        
-        return True
-        
-    except (ValueError, IndexError):
+        # O construtor de date (em C) já valida dia/mês/bissexto
+        date(ano, mes, dia)
+        return 1900 <= ano <= 2100
+
+    except ValueError:
         return False
 
 def validar_numero_inteiro(valor: str, min_val: Optional[int] = None, max_val: Optional[int] = None) -> bool:
@@ -218,6 +221,7 @@ def validar_numero_inteiro(valor: str, min_val: Optional[int] = None, max_val: O
     except (ValueError, TypeError):
         return False
 
+@lru_cache(maxsize=4096)
 def validar_codigo_cid(cid: str) -> bool:
     """
     Valida um código CID (Classificação Internacional de Doenças)
@@ -236,9 +240,7 @@ def validar_codigo_cid(cid: str) -> bool:
     cid_limpo = cid.strip().upper()
     
     # Padrão: Letra + 2 dígitos + opcionalmente (ponto + 1 ou mais dígitos)
-    padrao = r'^[A-Z]\d{2}(\.\d+)?$'
-    
-    return bool(re.match(padrao, cid_limpo))
+    return bool(_CID_RE.match(cid_limpo))
 
 def normalizar_nome(nome: str) -> str:
     """
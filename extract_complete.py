@@ -4,191 +4,232 @@ Extrai: cabeçalhos, rodapés, logos, formas, imagens, cores, bordas
 """
 
 import os
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from docx import Document
 from docx.oxml.ns import qn
 from docx.oxml import parse_xml
 import zipfile
 import xml.etree.ElementTree as ET
-import base64
+
+# pybase64 (codec SIMD) é opcional: usa o base64 da stdlib se não instalado
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
 
 TEMPLATE_PATH = Path('models') / 'modelo homologação.docx'
 
+# Caminho XPath resolvido uma vez: detecta qualquer texto (w:t) descendente
+_W_T_PATH = './/' + qn('w:t')
+
+# MIME por extensão (constante - alocado uma única vez no import)
+_MIME_TYPES = {
+    'png': 'image/png',
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'gif': 'image/gif',
+    'bmp': 'image/bmp',
+    'emf': 'image/x-emf',
+    'wmf': 'image/x-wmf',
+}
+
 
-def extract_header_footer(doc_path):
-    """Extrai cabeçalhos e rodapés do documento"""
+def extract_header_footer(doc):
+    """Extrai cabeçalhos e rodapés de um Document já aberto
+
+    Recebe o Document em vez do caminho: abrir um .docx custa um parse
+    completo de ZIP + XML, então o chamador abre uma vez e compartilha
+    entre as etapas que precisam da árvore do python-docx.
+    """
     print("\n" + "="*70)
     print("📋 EXTRAINDO CABEÇALHOS E RODAPÉS")
     print("="*70 + "\n")
-    
-    doc = Document(doc_path)
-    
+
     # Cabeçalhos
     for i, section in enumerate(doc.sections, 1):
         print(f"SEÇÃO {i}:")
         print("-"*70)
         
         # Cabeçalho
-        if section.header:
+        hdr = section.header
+        # Pular cabeçalhos herdados da seção anterior ou sem conteúdo:
+        # a sondagem por w:t no XML cru evita construir os wrappers
+        # Paragraph/Cell do python-docx à toa
+        if not hdr.is_linked_to_previous and (
+                hdr._element.find(_W_T_PATH) is not None or hdr.tables):
             print(f"\n📄 CABEÇALHO:")
-            for para in section.header.paragraphs:
+            for para in hdr.paragraphs:
                 if para.text.strip():
                     print(f"  Texto: {para.text}")
                     print(f"  Alinhamento: {para.alignment}")
-            
+
             # Tabelas no cabeçalho
-            for j, table in enumerate(section.header.tables, 1):
+            for j, table in enumerate(hdr.tables, 1):
                 print(f"\n  📊 Tabela {j} no cabeçalho:")
                 print(f"    Linhas: {len(table.rows)}, Colunas: {len(table.columns)}")
                 for row_idx, row in enumerate(table.rows):
                     print(f"    Linha {row_idx}:")
                     for col_idx, cell in enumerate(row.cells):
+                        # Sondar o w:t direto no XML antes de cell.text,
+                        # que concatena todos os descendentes
+                        if cell._tc.find(_W_T_PATH) is None:
+                            continue
                         if cell.text.strip():
                             print(f"      [{row_idx},{col_idx}]: {cell.text[:50]}")
-        
+
         # Rodapé
-        if section.footer:
+        ftr = section.footer
+        if not ftr.is_linked_to_previous and (
+                ftr._element.find(_W_T_PATH) is not None or ftr.tables):
             print(f"\n📄 RODAPÉ:")
-            for para in section.footer.paragraphs:
+            for para in ftr.paragraphs:
                 if para.text.strip():
                     print(f"  Texto: {para.text}")
                     print(f"  Alinhamento: {para.alignment}")
-            
+
             # Tabelas no rodapé
-            for j, table in enumerate(section.footer.tables, 1):
+            for j, table in enumerate(ftr.tables, 1):
                 print(f"\n  📊 Tabela {j} no rodapé:")
                 print(f"    Linhas: {len(table.rows)}, Colunas: {len(table.columns)}")
                 for row_idx, row in enumerate(table.rows):
                     print(f"    Linha {row_idx}:")
                     for col_idx, cell in enumerate(row.cells):
+                        if cell._tc.find(_W_T_PATH) is None:
+                            continue
                         if cell.text.strip():
                             print(f"      [{row_idx},{col_idx}]: {cell.text[:50]}")
-        
+
         print()
 
 
-def extract_images_advanced(doc_path):
-    """Extrai TODAS as imagens incluindo as em cabeçalhos/rodapés/formas"""
+def extract_images_advanced(zip_ref):
+    """Lista TODAS as imagens incluindo as em cabeçalhos/rodapés/formas
+
+    Coleta apenas os metadados: os bytes são copiados em streaming por
+    save_images_to_assets e codificados em base64 direto para o arquivo
+    por generate_python_code_with_images, sem nunca materializar a imagem
+    inteira (nem seu base64) em memória.
+    """
     print("\n" + "="*70)
     print("🖼️ EXTRAINDO TODAS AS IMAGENS")
     print("="*70 + "\n")
-    
+
     images = []
-    
-    # Abrir DOCX como ZIP
-    with zipfile.ZipFile(doc_path, 'r') as zip_ref:
-        # Listar todos os arquivos
-        for file_info in zip_ref.filelist:
-            if 'media/' in file_info.filename:
-                print(f"✅ Imagem encontrada: {file_info.filename}")
-                
-                # Ler imagem
-                img_data = zip_ref.read(file_info.filename)
-                
-                # Converter para base64
-                base64_img = base64.b64encode(img_data).decode('utf-8')
-                
-                # Detectar MIME
-                ext = file_info.filename.split('.')[-1].lower()
-                mime_types = {
-                    'png': 'image/png',
-                    'jpg': 'image/jpeg',
-                    'jpeg': 'image/jpeg',
-                    'gif': 'image/gif',
-                    'bmp': 'image/bmp',
-                    'emf': 'image/x-emf',
-                    'wmf': 'image/x-wmf',
-                }
-                mime = mime_types.get(ext, 'image/png')
-                
-                images.append({
-                    'filename': file_info.filename,
-                    'name': Path(file_info.filename).name,
-                    'mime': mime,
-                    'base64': f"data:{mime};base64,{base64_img}",
-                    'size': file_info.file_size
-                })
-                
-                print(f"  Tipo: {mime}")
-                print(f"  Tamanho: {file_info.file_size:,} bytes")
-                print()
-    
+
+    # Listar todos os arquivos do ZIP já aberto pelo chamador
+    for file_info in zip_ref.filelist:
+        # Prefixo canônico das mídias no pacote DOCX: checagem de prefixo
+        # é mais barata que substring e não captura falsos positivos
+        if file_info.filename.startswith('word/media/'):
+            print(f"✅ Imagem encontrada: {file_info.filename}")
+
+            # Detectar MIME
+            ext = file_info.filename.split('.')[-1].lower()
+            mime = _MIME_TYPES.get(ext, 'image/png')
+
+            images.append({
+                'filename': file_info.filename,
+                'name': Path(file_info.filename).name,
+                'mime': mime,
+                'size': file_info.file_size
+            })
+
+            print(f"  Tipo: {mime}")
+            print(f"  Tamanho: {file_info.file_size:,} bytes")
+            print()
+
     return images
 
 
-def extract_shapes_and_drawing(doc_path):
+def extract_shapes_and_drawing(zip_ref):
     """Extrai informações sobre formas e desenhos"""
     print("\n" + "="*70)
     print("🎨 EXTRAINDO FORMAS E DESENHOS")
     print("="*70 + "\n")
-    
-    # Abrir como ZIP e ler XML
-    with zipfile.ZipFile(doc_path, 'r') as zip_ref:
-        # Ler document.xml
-        doc_xml = zip_ref.read('word/document.xml')
-        root = ET.fromstring(doc_xml)
-        
-        # Namespace
-        namespaces = {
-            'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main',
-            'wp': 'http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing',
-            'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
-            'pic': 'http://schemas.openxmlformats.org/drawingml/2006/picture',
-            'v': 'urn:schemas-microsoft-com:vml',
-        }
-        
-        # Procurar por desenhos
-        drawings = root.findall('.//w:drawing', namespaces)
-        print(f"📐 Total de desenhos encontrados: {len(drawings)}")
-        
-        for i, drawing in enumerate(drawings, 1):
-            print(f"\nDesenho {i}:")
-            # Tentar extrair dimensões
-            extents = drawing.findall('.//wp:extent', namespaces)
-            for extent in extents:
-                cx = extent.get('cx', 'N/A')
-                cy = extent.get('cy', 'N/A')
-                print(f"  Dimensões: {cx} x {cy} EMUs")
-        
-        # Procurar por formas VML (Word legado)
-        vml_shapes = root.findall('.//v:shape', namespaces)
-        print(f"\n🔷 Total de formas VML encontradas: {len(vml_shapes)}")
-        
-        for i, shape in enumerate(vml_shapes, 1):
-            print(f"\nForma VML {i}:")
-            style = shape.get('style', 'N/A')
-            print(f"  Estilo: {style[:100]}")
-            shape_type = shape.get('type', 'N/A')
-            print(f"  Tipo: {shape_type}")
 
+    # Tags totalmente qualificadas procuradas durante a varredura
+    drawing_tag = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}drawing'
+    extent_tag = '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}extent'
+    vml_shape_tag = '{urn:schemas-microsoft-com:vml}shape'
+
+    # Varredura em streaming com iterparse: uma única passada sobre o XML
+    # sem montar a árvore inteira em memória (documentos pesados chegam a
+    # dezenas de MB); os findall descendentes do fromstring faziam duas
+    drawings = []
+    vml_shapes = []
+    with zip_ref.open('word/document.xml') as doc_xml:
+        for _event, elem in ET.iterparse(doc_xml, events=('end',)):
+            tag = elem.tag
+            if tag == drawing_tag:
+                drawings.append([
+                    (extent.get('cx', 'N/A'), extent.get('cy', 'N/A'))
+                    for extent in elem.iter(extent_tag)
+                ])
+                elem.clear()
+            elif tag == vml_shape_tag:
+                vml_shapes.append((elem.get('style', 'N/A'), elem.get('type', 'N/A')))
+                elem.clear()
+
+    print(f"📐 Total de desenhos encontrados: {len(drawings)}")
+
+    for i, extents in enumerate(drawings, 1):
+        print(f"\nDesenho {i}:")
+        for cx, cy in extents:
+            print(f"  Dimensões: {cx} x {cy} EMUs")
+
+    print(f"\n🔷 Total de formas VML encontradas: {len(vml_shapes)}")
+
+    for i, (style, shape_type) in enumerate(vml_shapes, 1):
+        print(f"\nForma VML {i}:")
+        print(f"  Estilo: {style[:100]}")
+        print(f"  Tipo: {shape_type}")
+
+
+def _save_one_image(img, zip_path, assets_dir):
+    """Copia uma imagem do ZIP para assets em streaming (worker de thread)
 
-def save_images_to_assets(images):
-    """Salva imagens na pasta assets"""
+    Abre um handle de ZipFile próprio: ZipFile não é thread-safe para
+    leituras concorrentes no mesmo handle.
+    """
+    filepath = assets_dir / img['name']
+
+    # Copiar do ZIP para o arquivo com buffer limitado (64 KiB),
+    # sem passar pelo par base64 encode/decode
+    with zipfile.ZipFile(zip_path, 'r') as zf:
+        with zf.open(img['filename']) as src, open(filepath, 'wb') as dst:
+            shutil.copyfileobj(src, dst, 65536)
+
+    return {
+        **img,
+        'saved_path': str(filepath)
+    }
+
+
+def save_images_to_assets(images, zip_path):
+    """Salva imagens na pasta assets em paralelo (uma thread por imagem)
+
+    As imagens são independentes entre si — leitura/descompressão/escrita
+    escalam com os núcleos até saturar o disco.
+    """
     assets_dir = Path('assets') / 'extracted_images'
     assets_dir.mkdir(parents=True, exist_ok=True)
-    
+
     print(f"\n💾 Salvando imagens em: {assets_dir}\n")
-    
-    saved_images = []
-    for img in images:
-        filepath = assets_dir / img['name']
-        
-        # Decodificar base64
-        import re
-        base64_data = re.sub('^data:image/.+;base64,', '', img['base64'])
-        image_data = base64.b64decode(base64_data)
-        
-        # Salvar
-        with open(filepath, 'wb') as f:
-            f.write(image_data)
-        
+
+    max_workers = min(8, os.cpu_count() or 1, len(images))
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        saved_images = list(ex.map(
+            partial(_save_one_image, zip_path=zip_path, assets_dir=assets_dir),
+            images,
+        ))
+
+    for img in saved_images:
         print(f"✅ {img['name']} salvo")
-        saved_images.append({
-            **img,
-            'saved_path': str(filepath)
-        })
-    
+
     return saved_images
 
 
@@ -198,22 +239,48 @@ def generate_python_code_with_images(images):
     print("📝 GERANDO CÓDIGO PYTHON")
     print("="*70 + "\n")
     
+    # Múltiplo de 3 bytes: cada bloco codifica para base64 sem padding
+    # intermediário, então os pedaços podem ser concatenados direto
+    chunk_size = 3 * 65536
+
+    # Acumular pedaços e escrever em lotes de ~1 MiB: um f.write por lote
+    # em vez de um por linha/bloco, limitando a memória ao tamanho do lote
+    flush_size = 1024 * 1024
+
     with open('extracted_images_data.py', 'w', encoding='utf-8') as f:
-        f.write('"""\n')
-        f.write('Imagens extraídas do documento Word\n')
-        f.write('Use estas strings base64 no HTML\n')
-        f.write('"""\n\n')
-        
-        f.write('DOCUMENT_IMAGES = {\n')
+        parts = [
+            '"""\n',
+            'Imagens extraídas do documento Word\n',
+            'Use estas strings base64 no HTML\n',
+            '"""\n\n',
+            'DOCUMENT_IMAGES = {\n',
+        ]
+        buffered = sum(map(len, parts))
+
         for i, img in enumerate(images, 1):
             var_name = img['name'].replace('.', '_').replace('-', '_')
-            f.write(f'    # {img["filename"]} ({img["size"]:,} bytes)\n')
-            f.write(f'    "{var_name}": "{img["base64"]}",\n\n')
-        f.write('}\n\n')
-        
-        f.write('# Exemplo de uso no HTML:\n')
-        f.write('# <img src="{DOCUMENT_IMAGES[\'image1_png\']}" alt="Logo" />\n')
-    
+            parts.append(f'    # {img["filename"]} ({img["size"]:,} bytes)\n')
+            parts.append(f'    "{var_name}": "data:{img["mime"]};base64,')
+
+            # Codificar em streaming a partir do arquivo já salvo: o base64
+            # completo da imagem nunca existe em memória de uma só vez
+            with open(img['saved_path'], 'rb') as src:
+                while chunk := src.read(chunk_size):
+                    encoded = b64encode(chunk).decode('ascii')
+                    parts.append(encoded)
+                    buffered += len(encoded)
+                    if buffered >= flush_size:
+                        f.write(''.join(parts))
+                        parts.clear()
+                        buffered = 0
+
+            parts.append('",\n\n')
+
+        parts.append('}\n\n')
+        parts.append('# Exemplo de uso no HTML:\n')
+        parts.append('# <img src="{DOCUMENT_IMAGES[\'image1_png\']}" alt="Logo" />\n')
+        f.write(''.join(parts))
+
     print("✅ Arquivo criado: extracted_images_data.py")
 
 
@@ -229,20 +296,28 @@ def main():
         return
     
     print(f"\n📂 Analisando: {TEMPLATE_PATH}\n")
-    
+
+    # Document aberto uma única vez e compartilhado pelas etapas que
+    # precisam da árvore do python-docx
+    doc = Document(TEMPLATE_PATH)
+
     # 1. Cabeçalhos e rodapés
-    extract_header_footer(TEMPLATE_PATH)
-    
-    # 2. Imagens (todas)
-    images = extract_images_advanced(TEMPLATE_PATH)
-    print(f"\n✅ Total de imagens extraídas: {len(images)}")
-    
-    # 3. Formas e desenhos
-    extract_shapes_and_drawing(TEMPLATE_PATH)
-    
-    # 4. Salvar imagens
+    extract_header_footer(doc)
+
+    # ZIP aberto uma única vez e compartilhado pelas etapas seguintes
+    with zipfile.ZipFile(TEMPLATE_PATH, 'r') as zip_ref:
+        # 2. Imagens (todas)
+        images = extract_images_advanced(zip_ref)
+        print(f"\n✅ Total de imagens extraídas: {len(images)}")
+
+        # 3. Formas e desenhos
+        extract_shapes_and_drawing(zip_ref)
+
+    # 4. Salvar imagens (paralelo, cada thread abre seu próprio handle)
+    if images:
+        images = save_images_to_assets(images, TEMPLATE_PATH)
+
     if images:
-        images = save_images_to_assets(images)
         generate_python_code_with_images(images)
     
     print("\n" + "="*70)
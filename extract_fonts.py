@@ -7,8 +7,54 @@ Analisa todas as fontes e tamanhos usados no template Word
 """
 
 from docx import Document
+from docx.oxml.ns import qn
 from docx.shared import Pt
 
+# Tags/atributos qualificados resolvidos uma única vez
+_W_R = qn('w:r')
+_W_T = qn('w:t')
+_W_RPR = qn('w:rPr')
+_W_RFONTS = qn('w:rFonts')
+_W_SZ = qn('w:sz')
+_W_ASCII = qn('w:ascii')
+_W_VAL = qn('w:val')
+
+
+def _accumulate(body, fonts_data):
+    """Acumula amostras de texto por (fonte, tamanho) em uma passada pelo XML
+
+    Itera os elementos w:r crus em vez de construir os wrappers
+    Paragraph/Cell/Run do python-docx — uma única travessia cobre corpo,
+    tabelas e estruturas aninhadas (tabelas dentro de tabelas, caixas de
+    texto) que os laços por parágrafo/tabela não alcançavam.
+    """
+    for r in body.iter(_W_R):
+        # Filtrar texto vazio ANTES de ler a formatação
+        text_sample = ''.join(t.text or '' for t in r.iter(_W_T)).strip()[:50]
+        if not text_sample:
+            continue
+
+        font_name = 'Calibri'
+        font_size = 11
+        rpr = r.find(_W_RPR)
+        if rpr is not None:
+            rfonts = rpr.find(_W_RFONTS)
+            if rfonts is not None:
+                font_name = rfonts.get(_W_ASCII) or font_name
+            sz = rpr.find(_W_SZ)
+            if sz is not None:
+                val = sz.get(_W_VAL)
+                if val:
+                    # w:sz é expresso em meios-pontos
+                    font_size = int(val) / 2
+
+        # O relatório só mostra dois exemplos por combinação: limitar a
+        # lista a 2 mantém a memória em O(combinações) e não O(runs)
+        amostras = fonts_data.setdefault((font_name, font_size), [])
+        if len(amostras) < 2:
+            amostras.append(text_sample)
+
+
 def extract_fonts():
     """Extrai fontes e tamanhos do Word"""
     doc = Document('models/modelo homologação.docx')
@@ -20,36 +66,8 @@ def extract_fonts():
     print("="*60)
     print()
     
-    # Analisar parágrafos
-    for para in doc.paragraphs:
-        if para.runs:
-            for run in para.runs:
-                font_name = run.font.name or 'Calibri'
-                font_size = run.font.size.pt if run.font.size else 11
-                text_sample = run.text.strip()[:50]
-                
-                if text_sample:
-                    key = (font_name, font_size)
-                    if key not in fonts_data:
-                        fonts_data[key] = []
-                    fonts_data[key].append(text_sample)
-    
-    # Analisar tabelas
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for para in cell.paragraphs:
-                    if para.runs:
-                        for run in para.runs:
-                            font_name = run.font.name or 'Calibri'
-                            font_size = run.font.size.pt if run.font.size else 11
-                            text_sample = run.text.strip()[:50]
-                            
-                            if text_sample:
-                                key = (font_name, font_size)
-                                if key not in fonts_data:
-                                    fonts_data[key] = []
-                                fonts_data[key].append(text_sample)
+    # Analisar parágrafos e tabelas em uma única travessia do corpo
+    _accumulate(doc.element.body, fonts_data)
     
     # Mostrar resultados
     print("📝 FONTES ENCONTRADAS:\n")
@@ -16,6 +16,9 @@ import os
 import sys
 import shutil
 import subprocess
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Cores para terminal (Windows)
@@ -30,27 +33,48 @@ class Colors:
     BOLD = '\033[1m'
     UNDERLINE = '\033[4m'
 
+# Detectar o terminal uma vez: sem TTY (saída redirecionada, logs de CI)
+# os escapes ANSI viram lixo no arquivo, então caem os templates sem cor.
+# Templates % pré-montados evitam reinterpolar Colors.* a cada chamada.
+_USE_COLOR = sys.stdout.isatty()
+
+if _USE_COLOR:
+    _HEADER_FMT = f"{Colors.HEADER}{Colors.BOLD}%s{Colors.ENDC}"
+    _STEP_FMT = f"{Colors.OKCYAN}[%d/%d]{Colors.ENDC} %s"
+    _SUCCESS_FMT = f"{Colors.OKGREEN}[OK] %s{Colors.ENDC}"
+    _ERROR_FMT = f"{Colors.FAIL}[X] %s{Colors.ENDC}"
+    _WARNING_FMT = f"{Colors.WARNING}[!] %s{Colors.ENDC}"
+else:
+    _HEADER_FMT = "%s"
+    _STEP_FMT = "[%d/%d] %s"
+    _SUCCESS_FMT = "[OK] %s"
+    _ERROR_FMT = "[X] %s"
+    _WARNING_FMT = "[!] %s"
+
+# Barra do cabeçalho é sempre a mesma string
+_HEADER_BAR = _HEADER_FMT % ('=' * 70)
+
 def print_header(text):
     """Imprime cabeçalho estilizado"""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*70}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{text.center(70)}{Colors.ENDC}")
-    print(f"{Colors.HEADER}{Colors.BOLD}{'='*70}{Colors.ENDC}\n")
+    print(f"\n{_HEADER_BAR}")
+    print(_HEADER_FMT % text.center(70))
+    print(f"{_HEADER_BAR}\n")
 
 def print_step(step_num, total_steps, text):
     """Imprime passo da execução"""
-    print(f"{Colors.OKCYAN}[{step_num}/{total_steps}]{Colors.ENDC} {text}")
+    print(_STEP_FMT % (step_num, total_steps, text))
 
 def print_success(text):
     """Imprime mensagem de sucesso"""
-    print(f"{Colors.OKGREEN}[OK] {text}{Colors.ENDC}")
+    print(_SUCCESS_FMT % text)
 
 def print_error(text):
     """Imprime mensagem de erro"""
-    print(f"{Colors.FAIL}[X] {text}{Colors.ENDC}")
+    print(_ERROR_FMT % text)
 
 def print_warning(text):
     """Imprime mensagem de aviso"""
-    print(f"{Colors.WARNING}[!] {text}{Colors.ENDC}")
+    print(_WARNING_FMT % text)
 
 def verificar_pyinstaller():
     """Verifica se PyInstaller está instalado"""
@@ -70,21 +94,43 @@ def verificar_pyinstaller():
             print_error("Falha ao instalar PyInstaller")
             return False
 
+def _remover_arvore(caminho):
+    """Remove uma árvore de diretórios ignorando erros (worker de thread)"""
+    shutil.rmtree(caminho, ignore_errors=True)
+
 def limpar_builds_anteriores():
-    """Remove builds e distribuições anteriores"""
-    diretorios_para_limpar = ['build', 'dist']
-    arquivos_para_limpar = ['*.spec.bak']
-    
-    for diretorio in diretorios_para_limpar:
-        if Path(diretorio).exists():
+    """Remove builds e distribuições anteriores em paralelo
+
+    O build/ do PyInstaller costuma ter dezenas de milhares de arquivos
+    pequenos; os unlinks são limitados por syscall, então remover os
+    subdiretórios de primeiro nível em threads paralelas acelera bastante
+    em SSDs multi-núcleo.
+    """
+    diretorios_para_limpar = [d for d in ('build', 'dist') if Path(d).exists()]
+
+    if diretorios_para_limpar:
+        # Subdiretórios primeiro (em paralelo), depois os pais já esvaziados
+        subdiretorios = [
+            sub for d in diretorios_para_limpar
+            for sub in Path(d).iterdir() if sub.is_dir()
+        ]
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            list(ex.map(_remover_arvore, subdiretorios))
+        for diretorio in diretorios_para_limpar:
             print(f"Removendo diretório: {diretorio}")
             shutil.rmtree(diretorio, ignore_errors=True)
             print_success(f"Diretório {diretorio} removido")
-    
+
     print_success("Limpeza concluída")
 
 def verificar_arquivos_necessarios():
-    """Verifica se todos os arquivos necessários existem"""
+    """Verifica se todos os arquivos necessários existem
+
+    Returns:
+        tuple: (tudo_ok, presentes) onde presentes mapeia cada caminho
+        sondado para True/False — reutilizado por criar_arquivo_spec para
+        não repetir os mesmos stats na análise do PyInstaller
+    """
     arquivos_obrigatorios = {
         'main.py': 'Arquivo principal',
         'requirements.txt': 'Dependências',
@@ -106,36 +152,91 @@ def verificar_arquivos_necessarios():
         'assets/app_icon.ico': 'Ícone do aplicativo',
     }
     
+    # Agrupar por diretório pai e listar cada pai com um único scandir:
+    # um stat por entrada vira K scandir (K = diretórios distintos)
+    por_pai = defaultdict(list)
+    for caminho in (
+        list(arquivos_obrigatorios)
+        + list(pastas_obrigatorias)
+        + list(arquivos_importantes)
+    ):
+        p = Path(caminho)
+        # Carregar o caminho original junto: as consultas usam a string
+        # com '/' dos dicts de configuração, e reconstruir via Path usaria
+        # o separador do SO ('\\' no Windows), quebrando o lookup
+        por_pai[p.parent].append((caminho, p.name))
+
+    presentes = {}
+    for pai, entradas_esperadas in por_pai.items():
+        try:
+            entradas = {e.name for e in os.scandir(pai)}
+        except FileNotFoundError:
+            entradas = set()
+        for caminho, nome in entradas_esperadas:
+            presentes[caminho] = nome in entradas
+
     tudo_ok = True
-    
+
     # Verificar arquivos obrigatórios
     for arquivo, descricao in arquivos_obrigatorios.items():
-        if not Path(arquivo).exists():
+        if not presentes[arquivo]:
             print_error(f"Arquivo não encontrado: {arquivo} ({descricao})")
             tudo_ok = False
         else:
             print_success(f"Encontrado: {arquivo}")
-    
+
     # Verificar pastas obrigatórias
     for pasta, descricao in pastas_obrigatorias.items():
-        if not Path(pasta).exists():
+        if not presentes[pasta]:
             print_error(f"Pasta não encontrada: {pasta} ({descricao})")
             tudo_ok = False
         else:
             print_success(f"Encontrado: {pasta}")
-    
+
     # Verificar arquivos importantes (avisos, não erros)
     for arquivo, descricao in arquivos_importantes.items():
-        if not Path(arquivo).exists():
+        if not presentes[arquivo]:
             print_warning(f"Arquivo recomendado não encontrado: {arquivo} ({descricao})")
         else:
             print_success(f"Encontrado: {arquivo}")
-    
-    return tudo_ok
 
-def criar_arquivo_spec():
-    """Cria ou atualiza o arquivo .spec para PyInstaller"""
-    spec_content = """# -*- mode: python ; coding: utf-8 -*-
+    return tudo_ok, presentes
+
+def criar_arquivo_spec(presentes):
+    """Cria ou atualiza o arquivo .spec para PyInstaller
+
+    Os resultados das sondagens de verificar_arquivos_necessarios são
+    gravados como literais no spec: a análise do PyInstaller não repete
+    os os.path.exists e o spec fica reproduzível.
+
+    Args:
+        presentes: dict caminho -> bool retornado por
+            verificar_arquivos_necessarios
+    """
+    # Entradas de datas resolvidas agora, sem guardas em tempo de análise
+    datas_entries = []
+    if presentes.get('assets'):
+        # IMPORTANTE: inclui ícones e imagens
+        datas_entries.append("    ('assets', 'assets'),")
+    if presentes.get('models'):
+        # Templates de documentos
+        datas_entries.append("    ('models', 'models'),")
+    if presentes.get('core'):
+        # Módulos principais; core/*.py não desce em subpastas, então o
+        # esqueleto HTML de core/templates/ entra como item próprio —
+        # sem ele o import de core.html_generator quebra no executável
+        datas_entries.append("    ('core/*.py', 'core'),")
+        datas_entries.append("    ('core/templates', 'core/templates'),")
+    datas_block = '\n'.join(datas_entries)
+
+    icon_literal = (
+        "'assets/app_icon.ico'" if presentes.get('assets/app_icon.ico') else 'None'
+    )
+    version_literal = (
+        "'file_version_info.txt'" if presentes.get('file_version_info.txt') else 'None'
+    )
+
+    spec_content = f"""# -*- mode: python ; coding: utf-8 -*-
 \"\"\"
 Arquivo de especificação PyInstaller
 Sistema de Homologação de Atestados Médicos
@@ -143,26 +244,15 @@ Gerado automaticamente por gerar_executavel.py
 \"\"\"
 
 from PyInstaller.utils.hooks import collect_data_files, collect_submodules
-import os
 
 # Coletar todos os submódulos
 hidden_imports = collect_submodules('PyQt5')
 hidden_imports += collect_submodules('docx')
 
-# Dados adicionais
-datas = []
-
-# Adicionar assets (IMPORTANTE: inclui ícones e imagens)
-if os.path.exists('assets'):
-    datas.append(('assets', 'assets'))
-
-# Adicionar models (templates de documentos)
-if os.path.exists('models'):
-    datas.append(('models', 'models'))
-
-# Adicionar core (módulos principais)
-if os.path.exists('core'):
-    datas.append(('core/*.py', 'core'))
+# Dados adicionais (caminhos já verificados na geração deste arquivo)
+datas = [
+{datas_block}
+]
 
 # Análise
 a = Analysis(
@@ -172,7 +262,7 @@ a = Analysis(
     datas=datas,
     hiddenimports=hidden_imports,
     hookspath=[],
-    hooksconfig={},
+    hooksconfig={{}},
     runtime_hooks=[],
     excludes=[],
     noarchive=False,
@@ -203,9 +293,9 @@ exe = EXE(
     codesign_identity=None,
     entitlements_file=None,
     # ÍCONE DO EXECUTÁVEL (aparece no .exe e na barra de tarefas)
-    icon='assets/app_icon.ico' if os.path.exists('assets/app_icon.ico') else None,
+    icon={icon_literal},
     # ARQUIVO DE VERSÃO (metadados do Windows)
-    version='file_version_info.txt' if os.path.exists('file_version_info.txt') else None,
+    version={version_literal},
 )
 """
     
@@ -229,13 +319,20 @@ def gerar_executavel(spec_file):
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True
+            bufsize=0
         )
-        
-        # Mostrar saída em tempo real
-        for linha in processo.stdout:
-            print(linha, end='')
-        
+
+        # Mostrar saída em tempo real repassando blocos binários crus:
+        # o PyInstaller emite dezenas de milhares de linhas e o iterador
+        # de linhas decodificaria cada uma em Python
+        fd = processo.stdout.fileno()
+        while True:
+            bloco = os.read(fd, 65536)
+            if not bloco:
+                break
+            sys.stdout.buffer.write(bloco)
+            sys.stdout.buffer.flush()
+
         processo.wait()
         
         if processo.returncode == 0:
@@ -250,27 +347,36 @@ def gerar_executavel(spec_file):
         return False
 
 def criar_estrutura_distribuicao():
-    """Cria estrutura de pastas para distribuição"""
+    """Cria estrutura de pastas para distribuição
+
+    Monta a nova release em release.new/ e troca por os.replace no final:
+    a release anterior nunca é destruída no lugar (evita sharing violation
+    no Windows com shells abertos na pasta) e a remoção da árvore antiga
+    acontece em segundo plano enquanto o script continua.
+    """
     dist_dir = Path('dist')
-    
+
     if not dist_dir.exists():
         print_error("Pasta dist não encontrada. Compilação falhou?")
         return False
-    
-    # Criar pasta de distribuição final
-    release_dir = Path('release')
+
+    # Montar a nova estrutura fora do lugar
+    final_dir = Path('release')
+    release_dir = Path('release.new')
     if release_dir.exists():
-        shutil.rmtree(release_dir)
+        shutil.rmtree(release_dir, ignore_errors=True)
     release_dir.mkdir()
-    
-    print(f"\nCriando estrutura de distribuição em: {release_dir}")
+
+    print(f"\nCriando estrutura de distribuição em: {final_dir}")
     
     # Copiar executável
     exe_name = 'SistemaHomologacao.exe'
     exe_source = dist_dir / exe_name
     
     if exe_source.exists():
-        shutil.copy2(exe_source, release_dir / exe_name)
+        # copyfile em vez de copy2: artefato recém-gerado não precisa
+        # preservar timestamps/permissões (stat/utime/chmod extras)
+        shutil.copyfile(exe_source, release_dir / exe_name)
         print_success(f"Executável copiado: {exe_name}")
     else:
         print_error(f"Executável não encontrado: {exe_source}")
@@ -325,9 +431,24 @@ Versão: 2.0.0
     
     # Copiar licença se existir
     if Path('LICENSE.md').exists():
-        shutil.copy2('LICENSE.md', release_dir / 'LICENSE.txt')
+        shutil.copyfile('LICENSE.md', release_dir / 'LICENSE.txt')
         print_success("Licença copiada")
-    
+
+    # Troca atômica: a antiga vira release.old e é removida em background
+    old_dir = Path('release.old')
+    if old_dir.exists():
+        shutil.rmtree(old_dir, ignore_errors=True)
+    if final_dir.exists():
+        os.replace(final_dir, old_dir)
+    os.replace(release_dir, final_dir)
+    if old_dir.exists():
+        threading.Thread(
+            target=shutil.rmtree,
+            args=(old_dir,),
+            kwargs={'ignore_errors': True},
+            daemon=True,
+        ).start()
+
     return True
 
 def criar_instalador_bat():
@@ -455,17 +576,18 @@ def main():
     
     # Passo 2: Verificar arquivos necessários
     print_step(2, total_steps, "Verificando arquivos necessários")
-    if not verificar_arquivos_necessarios():
+    tudo_ok, presentes = verificar_arquivos_necessarios()
+    if not tudo_ok:
         print_error("Alguns arquivos necessários estão faltando")
         return False
-    
+
     # Passo 3: Limpar builds anteriores
     print_step(3, total_steps, "Limpando builds anteriores")
     limpar_builds_anteriores()
-    
-    # Passo 4: Criar arquivo .spec
+
+    # Passo 4: Criar arquivo .spec (reutiliza as sondagens do passo 2)
     print_step(4, total_steps, "Criando arquivo de especificação")
-    spec_file = criar_arquivo_spec()
+    spec_file = criar_arquivo_spec(presentes)
     
     # Passo 5: Gerar executável
     print_step(5, total_steps, "Gerando executável")
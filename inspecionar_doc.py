@@ -1,11 +1,15 @@
 from docx import Document
 p='data/generated_documents/Declaracao_TESTE_JOÃO_SILVA_20251030_080448.docx'
 d=Document(p)
-# find paragraph that contains 'IDENTIFICAÇÃO' or 'Dr.'
+# localizar as celulas com 'IDENTIFICAÇÃO' ou 'Dr.' direto no XML (XPath em C),
+# sem concatenar .text de cada celula em Python; o xpath() do python-docx
+# ja resolve o prefixo w: pelo nsmap embutido
+matched=set(d.element.body.xpath(
+    './/w:tc[.//w:t[contains(text(),"IDENTIFICAÇÃO") or contains(text(),"Dr.")]]'))
 for i,table in enumerate(d.tables):
     for r,row in enumerate(table.rows):
         for c,cell in enumerate(row.cells):
-            if 'IDENTIFICAÇÃO' in cell.text or 'Dr.' in cell.text:
+            if cell._tc in matched:
                 print('Table',i,'Row',r,'Cell',c)
                 for pi,para in enumerate(cell.paragraphs):
                     print(' PAR',pi,repr(para.text))